@@ -1,8 +1,25 @@
 """Welcome to Reflex! This file outlines the steps to create a basic app."""
 
+import functools
+import hmac
+import os
+
 import reflex as rx
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse
+from starlette.routing import Route
 
 from rxconfig import config
+from database_connections import attendance_ingest, cache, login_audit, tenants
+
+# Importing the templates only defines their state classes and page
+# functions; it opens no database connection. Reflex needs every state class
+# before the first event arrives, so the modules are imported here, but page
+# components are only built when the frontend is compiled (`reflex export`,
+# dev server), never in a production backend worker. The connection pool,
+# query cache and attendance writer are created on first use in each worker
+# (see database_connections.pool, .cache, .attendance_ingest);
+# benchmarks/bench_startup.py checks that this stays true.
 from templates import admin_attendance_dashboard, admin_payroll_dashboard, employee_dashboard, employee_leave_dashboard, employee_payrole_dashboard, home, login, registeration, admin_dashboard, admin_employees_management_dashboard
 
 
@@ -16,7 +33,53 @@ def index() -> rx.Component:
     return home.landing_page()
 
 
-app = rx.App()
+# The /api/*-stats endpoints expose per-process operational counters (login
+# failures among them), so they are only served to monitoring that presents
+# HRMS_STATS_TOKEN as a bearer token, and not at all while it is unset.
+STATS_TOKEN = os.environ.get("HRMS_STATS_TOKEN", "")
+
+
+def internal_endpoint(endpoint):
+    """Require ``Authorization: Bearer $HRMS_STATS_TOKEN``; 404 while the token is unset."""
+
+    @functools.wraps(endpoint)
+    async def guarded(request):
+        if not STATS_TOKEN:
+            return JSONResponse({"detail": "Not Found"}, status_code=404)
+        scheme, _, token = request.headers.get("authorization", "").partition(" ")
+        if scheme.lower() != "bearer" or not hmac.compare_digest(token.strip().encode(), STATS_TOKEN.encode()):
+            return JSONResponse({"detail": "Unauthorized"}, status_code=401, headers={"WWW-Authenticate": "Bearer"})
+        return await endpoint(request)
+
+    return guarded
+
+
+@internal_endpoint
+async def cache_stats(request):
+    """Hit/miss counters of this worker's query cache."""
+    return JSONResponse(cache.stats())
+
+
+@internal_endpoint
+async def ingest_stats(request):
+    """Queue depth and throughput counters of the attendance writer."""
+    return JSONResponse(attendance_ingest.stats())
+
+
+@internal_endpoint
+async def login_stats(request):
+    """Buffered / flushed counters of the login bookkeeping writer."""
+    return JSONResponse(login_audit.stats())
+
+
+app = rx.App(api_transformer=Starlette(routes=[
+    Route("/api/cache-stats", cache_stats),
+    Route("/api/ingest-stats", ingest_stats),
+    Route("/api/login-stats", login_stats),
+]))
+# Load the tenant directory when a backend worker starts, so the first
+# logins resolve their company without a query.
+app.register_lifespan_task(tenants.warm)
 app.add_page(index, route="/")
 app.add_page(login.login_page, route="/login")
 app.add_page(registeration.register_page, route="/register")
@@ -1,26 +0,0 @@
-import{a as e}from"./rolldown-runtime-D_juG1Xi.js";import{t}from"./react-BcXKmAwN.js";var n=e(t(),1),r=e=>{throw TypeError(e)},i=(e,t,n)=>t.has(e)||r(`Cannot `+n),a=(e,t,n)=>(i(e,t,`read from private field`),n?n.call(e):t.get(e)),o=(e,t,n)=>t.has(e)?r(`Cannot add the same private member more than once`):t instanceof WeakSet?t.add(e):t.set(e,n),s=(e=>(e.Pop=`POP`,e.Push=`PUSH`,e.Replace=`REPLACE`,e))(s||{}),c=`popstate`;function l(e={}){function t(e,t){let{pathname:n,search:r,hash:i}=e.location;return m(``,{pathname:n,search:r,hash:i},t.state&&t.state.usr||null,t.state&&t.state.key||`default`)}function n(e,t){return typeof t==`string`?t:h(t)}return _(t,n,null,e)}function u(e,t){if(e===!1||e==null)throw Error(t)}function d(e,t){if(!e){typeof console<`u`&&console.warn(t);try{throw Error(t)}catch{}}}function f(){return Math.random().toString(36).substring(2,10)}function p(e,t){return{usr:e.state,key:e.key,idx:t}}function m(e,t,n=null,r){return{pathname:typeof e==`string`?e:e.pathname,search:``,hash:``,...typeof t==`string`?g(t):t,state:n,key:t&&t.key||r||f()}}function h({pathname:e=`/`,search:t=``,hash:n=``}){return t&&t!==`?`&&(e+=t.charAt(0)===`?`?t:`?`+t),n&&n!==`#`&&(e+=n.charAt(0)===`#`?n:`#`+n),e}function g(e){let t={};if(e){let n=e.indexOf(`#`);n>=0&&(t.hash=e.substring(n),e=e.substring(0,n));let r=e.indexOf(`?`);r>=0&&(t.search=e.substring(r),e=e.substring(0,r)),e&&(t.pathname=e)}return t}function _(e,t,n,r={}){let{window:i=document.defaultView,v5Compat:a=!1}=r,o=i.history,s=`POP`,l=null,u=d();u??(u=0,o.replaceState({...o.state,idx:u},``));function d(){return(o.state||{idx:null}).idx}function f(){s=`POP`;let e=d(),t=e==null?null:e-u;u=e,l&&l({action:s,location:y.location,delta:t})}function h(e,t){s=`PUSH`;let r=m(y.location,e,t);n&&n(r,e),u=d()+1;let c=p(r,u),f=y.createHref(r);try{o.pushState(c,``,f)}catch(e){if(e instanceof DOMException&&e.name===`DataCloneError`)throw e;i.location.assign(f)}a&&l&&l({action:s,location:y.location,delta:1})}function g(e,t){s=`REPLACE`;let r=m(y.location,e,t);n&&n(r,e),u=d();let i=p(r,u),c=y.createHref(r);o.replaceState(i,``,c),a&&l&&l({action:s,location:y.location,delta:0})}function _(e){return v(e)}let y={get action(){return s},get location(){return e(i,o)},listen(e){if(l)throw Error(`A history only accepts one active listener`);return i.addEventListener(c,f),l=e,()=>{i.removeEventListener(c,f),l=null}},createHref(e){return t(i,e)},createURL:_,encodeLocation(e){let t=_(e);return{pathname:t.pathname,search:t.search,hash:t.hash}},push:h,replace:g,go(e){return o.go(e)}};return y}function v(e,t=!1){let n=`http://localhost`;typeof window<`u`&&(n=window.location.origin===`null`?window.location.href:window.location.origin),u(n,`No window.location.(origin|href) available to create URL`);let r=typeof e==`string`?e:h(e);return r=r.replace(/ $/,`%20`),!t&&r.startsWith(`//`)&&(r=n+r),new URL(r,n)}function y(e){return{defaultValue:e}}var b,x=class{constructor(e){if(o(this,b,new Map),e)for(let[t,n]of e)this.set(t,n)}get(e){if(a(this,b).has(e))return a(this,b).get(e);if(e.defaultValue!==void 0)return e.defaultValue;throw Error(`No value found for context`)}set(e,t){a(this,b).set(e,t)}};b=new WeakMap;var S=new Set([`lazy`,`caseSensitive`,`path`,`id`,`index`,`children`]);function C(e){return S.has(e)}var w=new Set([`lazy`,`caseSensitive`,`path`,`id`,`index`,`middleware`,`children`]);function T(e){return w.has(e)}function E(e){return e.index===!0}function D(e,t,n=[],r={},i=!1){return e.map((e,a)=>{let o=[...n,String(a)],s=typeof e.id==`string`?e.id:o.join(`-`);if(u(e.index!==!0||!e.children,`Cannot specify children on an index route`),u(i||!r[s],`Found a route id collision on id "${s}".  Route id's must be globally unique within Data Router usages`),E(e)){let n={...e,...t(e),id:s};return r[s]=n,n}else{let n={...e,...t(e),id:s,children:void 0};return r[s]=n,e.children&&(n.children=D(e.children,t,o,r,i)),n}})}function O(e,t,n=`/`){return k(e,t,n,!1)}function k(e,t,n,r){let i=typeof t==`string`?g(t):t,a=R(i.pathname||`/`,n);if(a==null)return null;let o=A(e);te(o);let s=null;for(let e=0;s==null&&e<o.length;++e){let t=ce(a);s=se(o[e],t,r)}return s}function ee(e,t){let{route:n,pathname:r,params:i}=e;return{id:n.id,pathname:r,params:i,data:t[n.id],loaderData:t[n.id],handle:n.handle}}function A(e,t=[],n=[],r=``,i=!1){let a=(e,a,o=i,s)=>{let c={relativePath:s===void 0?e.path||``:s,caseSensitive:e.caseSensitive===!0,childrenIndex:a,route:e};if(c.relativePath.startsWith(`/`)){if(!c.relativePath.startsWith(r)&&o)return;u(c.relativePath.startsWith(r),`Absolute route path "${c.relativePath}" nested under path "${r}" is not valid. An absolute child route path must start with the combined path of all its parent routes.`),c.relativePath=c.relativePath.slice(r.length)}let l=V([r,c.relativePath]),d=n.concat(c);e.children&&e.children.length>0&&(u(e.index!==!0,`Index routes must not have child routes. Please remove all child routes from route path "${l}".`),A(e.children,t,d,l,o)),e.path==null&&!e.index||t.push({path:l,score:F(l,e.index),routesMeta:d})};return e.forEach((e,t)=>{if(e.path===``||!e.path?.includes(`?`))a(e,t);else for(let n of j(e.path))a(e,t,!0,n)}),t}function j(e){let t=e.split(`/`);if(t.length===0)return[];let[n,...r]=t,i=n.endsWith(`?`),a=n.replace(/\?$/,``);if(r.length===0)return i?[a,``]:[a];let o=j(r.join(`/`)),s=[];return s.push(...o.map(e=>e===``?a:[a,e].join(`/`))),i&&s.push(...o),s.map(t=>e.startsWith(`/`)&&t===``?`/`:t)}function te(e){e.sort((e,t)=>e.score===t.score?oe(e.routesMeta.map(e=>e.childrenIndex),t.routesMeta.map(e=>e.childrenIndex)):t.score-e.score)}var M=/^:[\w-]+$/,N=3,P=2,ne=1,re=10,ie=-2,ae=e=>e===`*`;function F(e,t){let n=e.split(`/`),r=n.length;return n.some(ae)&&(r+=ie),t&&(r+=P),n.filter(e=>!ae(e)).reduce((e,t)=>e+(M.test(t)?N:t===``?ne:re),r)}function oe(e,t){return e.length===t.length&&e.slice(0,-1).every((e,n)=>e===t[n])?e[e.length-1]-t[t.length-1]:0}function se(e,t,n=!1){let{routesMeta:r}=e,i={},a=`/`,o=[];for(let e=0;e<r.length;++e){let s=r[e],c=e===r.length-1,l=a===`/`?t:t.slice(a.length)||`/`,u=I({path:s.relativePath,caseSensitive:s.caseSensitive,end:c},l),d=s.route;if(!u&&c&&n&&!r[r.length-1].route.index&&(u=I({path:s.relativePath,caseSensitive:s.caseSensitive,end:!1},l)),!u)return null;Object.assign(i,u.params),o.push({params:i,pathname:V([a,u.pathname]),pathnameBase:H(V([a,u.pathnameBase])),route:d}),u.pathnameBase!==`/`&&(a=V([a,u.pathnameBase]))}return o}function I(e,t){typeof e==`string`&&(e={path:e,caseSensitive:!1,end:!0});let[n,r]=L(e.path,e.caseSensitive,e.end),i=t.match(n);if(!i)return null;let a=i[0],o=a.replace(/(.)\/+$/,`$1`),s=i.slice(1);return{params:r.reduce((e,{paramName:t,isOptional:n},r)=>{if(t===`*`){let e=s[r]||``;o=a.slice(0,a.length-e.length).replace(/(.)\/+$/,`$1`)}let i=s[r];return n&&!i?e[t]=void 0:e[t]=(i||``).replace(/%2F/g,`/`),e},{}),pathname:a,pathnameBase:o,pattern:e}}function L(e,t=!1,n=!0){d(e===`*`||!e.endsWith(`*`)||e.endsWith(`/*`),`Route path "${e}" will be treated as if it were "${e.replace(/\*$/,`/*`)}" because the \`*\` character must always follow a \`/\` in the pattern. To get rid of this warning, please change the route path to "${e.replace(/\*$/,`/*`)}".`);let r=[],i=`^`+e.replace(/\/*\*?$/,``).replace(/^\/*/,`/`).replace(/[\\.*+^${}|()[\]]/g,`\\$&`).replace(/\/:([\w-]+)(\?)?/g,(e,t,n)=>(r.push({paramName:t,isOptional:n!=null}),n?`/?([^\\/]+)?`:`/([^\\/]+)`)).replace(/\/([\w-]+)\?(\/|$)/g,`(/$1)?$2`);return e.endsWith(`*`)?(r.push({paramName:`*`}),i+=e===`*`||e===`/*`?`(.*)$`:`(?:\\/(.+)|\\/*)$`):n?i+=`\\/*$`:e!==``&&e!==`/`&&(i+=`(?:(?=\\/|$))`),[new RegExp(i,t?void 0:`i`),r]}function ce(e){try{return e.split(`/`).map(e=>decodeURIComponent(e).replace(/\//g,`%2F`)).join(`/`)}catch(t){return d(!1,`The URL path "${e}" could not be decoded because it is a malformed URL segment. This is probably due to a bad percent encoding (${t}).`),e}}function R(e,t){if(t===`/`)return e;if(!e.toLowerCase().startsWith(t.toLowerCase()))return null;let n=t.endsWith(`/`)?t.length-1:t.length,r=e.charAt(n);return r&&r!==`/`?null:e.slice(n)||`/`}function le({basename:e,pathname:t}){return t===`/`?e:V([e,t])}function z(e,t=`/`){let{pathname:n,search:r=``,hash:i=``}=typeof e==`string`?g(e):e;return{pathname:n?n.startsWith(`/`)?n:B(n,t):t,search:me(r),hash:he(i)}}function B(e,t){let n=t.replace(/\/+$/,``).split(`/`);return e.split(`/`).forEach(e=>{e===`..`?n.length>1&&n.pop():e!==`.`&&n.push(e)}),n.length>1?n.join(`/`):`/`}function ue(e,t,n,r){return`Cannot include a '${e}' character in a manually specified \`to.${t}\` field [${JSON.stringify(r)}].  Please separate it out to the \`to.${n}\` field. Alternatively you may provide the full path as a string in <Link to="..."> and the router will parse it for you.`}function de(e){return e.filter((e,t)=>t===0||e.route.path&&e.route.path.length>0)}function fe(e){let t=de(e);return t.map((e,n)=>n===t.length-1?e.pathname:e.pathnameBase)}function pe(e,t,n,r=!1){let i;typeof e==`string`?i=g(e):(i={...e},u(!i.pathname||!i.pathname.includes(`?`),ue(`?`,`pathname`,`search`,i)),u(!i.pathname||!i.pathname.includes(`#`),ue(`#`,`pathname`,`hash`,i)),u(!i.search||!i.search.includes(`#`),ue(`#`,`search`,`hash`,i)));let a=e===``||i.pathname===``,o=a?`/`:i.pathname,s;if(o==null)s=n;else{let e=t.length-1;if(!r&&o.startsWith(`..`)){let t=o.split(`/`);for(;t[0]===`..`;)t.shift(),--e;i.pathname=t.join(`/`)}s=e>=0?t[e]:`/`}let c=z(i,s),l=o&&o!==`/`&&o.endsWith(`/`),d=(a||o===`.`)&&n.endsWith(`/`);return!c.pathname.endsWith(`/`)&&(l||d)&&(c.pathname+=`/`),c}var V=e=>e.join(`/`).replace(/\/\/+/g,`/`),H=e=>e.replace(/\/+$/,``).replace(/^\/*/,`/`),me=e=>!e||e===`?`?``:e.startsWith(`?`)?e:`?`+e,he=e=>!e||e===`#`?``:e.startsWith(`#`)?e:`#`+e,ge=class{constructor(e,t){this.type=`DataWithResponseInit`,this.data=e,this.init=t||null}};function _e(e,t){return new ge(e,typeof t==`number`?{status:t}:t)}var ve=(e,t=302)=>{let n=t;typeof n==`number`?n={status:n}:n.status===void 0&&(n.status=302);let r=new Headers(n.headers);return r.set(`Location`,e),new Response(null,{...n,headers:r})},U=class{constructor(e,t,n,r=!1){this.status=e,this.statusText=t||``,this.internal=r,n instanceof Error?(this.data=n.toString(),this.error=n):this.data=n}};function ye(e){return e!=null&&typeof e.status==`number`&&typeof e.statusText==`string`&&typeof e.internal==`boolean`&&`data`in e}var be=[`POST`,`PUT`,`PATCH`,`DELETE`],xe=new Set(be),Se=[`GET`,...be],Ce=new Set(Se),we=new Set([301,302,303,307,308]),Te=new Set([307,308]),Ee={state:`idle`,location:void 0,formMethod:void 0,formAction:void 0,formEncType:void 0,formData:void 0,json:void 0,text:void 0},De={state:`idle`,data:void 0,formMethod:void 0,formAction:void 0,formEncType:void 0,formData:void 0,json:void 0,text:void 0},Oe={state:`unblocked`,proceed:void 0,reset:void 0,location:void 0},ke=/^(?:[a-z][a-z0-9+.-]*:|\/\/)/i,Ae=e=>ke.test(e),je=e=>({hasErrorBoundary:!!e.hasErrorBoundary}),Me=`remix-router-transitions`,Ne=Symbol(`ResetLoaderData`);function Pe(e){let t=e.window?e.window:typeof window<`u`?window:void 0,n=t!==void 0&&t.document!==void 0&&t.document.createElement!==void 0;u(e.routes.length>0,`You must provide a non-empty routes array to createRouter`);let r=e.hydrationRouteProperties||[],i=e.mapRouteProperties||je,a={},o=D(e.routes,i,void 0,a),s,c=e.basename||`/`;c.startsWith(`/`)||(c=`/${c}`);let l=e.dataStrategy||Je,f={...e.future},p=null,h=new Set,g=null,_=null,y=null,b=e.hydrationData!=null,S=O(o,e.history.location,c),C=!1,w=null,T;if(S==null&&!e.patchRoutesOnNavigation){let t=q(404,{pathname:e.history.location.pathname}),{matches:n,route:r}=ht(o);T=!0,S=n,w={[r.id]:t}}else if(S&&!e.hydrationData&&ut(S,o,e.history.location.pathname).active&&(S=null),S)if(S.some(e=>e.route.lazy))T=!1;else if(!S.some(e=>Re(e.route)))T=!0;else{let t=e.hydrationData?e.hydrationData.loaderData:null,n=e.hydrationData?e.hydrationData.errors:null;if(n){let e=S.findIndex(e=>n[e.route.id]!==void 0);T=S.slice(0,e+1).every(e=>!ze(e.route,t,n))}else T=S.every(e=>!ze(e.route,t,n))}else{T=!1,S=[];let t=ut(null,o,e.history.location.pathname);t.active&&t.matches&&(C=!0,S=t.matches)}let E,A={historyAction:e.history.action,location:e.history.location,matches:S,initialized:T,navigation:Ee,restoreScrollPosition:e.hydrationData==null?null:!1,preventScrollReset:!1,revalidation:`idle`,loaderData:e.hydrationData&&e.hydrationData.loaderData||{},actionData:e.hydrationData&&e.hydrationData.actionData||null,errors:e.hydrationData&&e.hydrationData.errors||w,fetchers:new Map,blockers:new Map},j=`POP`,te=!1,M,N=!1,P=new Map,ne=null,re=!1,ie=!1,ae=new Set,F=new Map,oe=0,se=-1,I=new Map,L=new Set,ce=new Map,le=new Map,z=new Set,B=new Map,ue,de=null;function fe(){if(p=e.history.listen(({action:t,location:n,delta:r})=>{if(ue){ue(),ue=void 0;return}d(B.size===0||r!=null,"You are trying to use a blocker on a POP navigation to a location that was not created by @remix-run/router. This will fail silently in production. This can happen if you are navigating outside the router via `window.history.pushState`/`window.location.hash` instead of using router navigation APIs.  This can also happen if you are using createHashRouter and the user manually changes the URL.");let i=Qe({currentLocation:A.location,nextLocation:n,historyAction:t});if(i&&r!=null){let t=new Promise(e=>{ue=e});e.history.go(r*-1),Ze(i,{state:`blocked`,location:n,proceed(){Ze(i,{state:`proceeding`,proceed:void 0,reset:void 0,location:n}),t.then(()=>e.history.go(r))},reset(){let e=new Map(A.blockers);e.set(i,Oe),H({blockers:e})}});return}return _e(t,n)}),n){Pt(t,P);let e=()=>Ft(t,P);t.addEventListener(`pagehide`,e),ne=()=>t.removeEventListener(`pagehide`,e)}return A.initialized||_e(`POP`,A.location,{initialHydration:!0}),E}function pe(){p&&p(),ne&&ne(),h.clear(),M&&M.abort(),A.fetchers.forEach((e,t)=>Ue(t)),A.blockers.forEach((e,t)=>Xe(t))}function V(e){return h.add(e),()=>h.delete(e)}function H(e,t={}){e.matches&&=e.matches.map(e=>{let t=a[e.route.id],n=e.route;return n.element!==t.element||n.errorElement!==t.errorElement||n.hydrateFallbackElement!==t.hydrateFallbackElement?{...e,route:t}:e}),A={...A,...e};let n=[],r=[];A.fetchers.forEach((e,t)=>{e.state===`idle`&&(z.has(t)?n.push(t):r.push(t))}),z.forEach(e=>{!A.fetchers.has(e)&&!F.has(e)&&n.push(e)}),[...h].forEach(e=>e(A,{deletedFetchers:n,viewTransitionOpts:t.viewTransitionOpts,flushSync:t.flushSync===!0})),n.forEach(e=>Ue(e)),r.forEach(e=>A.fetchers.delete(e))}function me(t,n,{flushSync:r}={}){let i=A.actionData!=null&&A.navigation.formMethod!=null&&Y(A.navigation.formMethod)&&A.navigation.state===`loading`&&t.state?._isRedirect!==!0,a;a=n.actionData?Object.keys(n.actionData).length>0?n.actionData:null:i?A.actionData:null;let c=n.loaderData?ft(A.loaderData,n.loaderData,n.matches||[],n.errors):A.loaderData,l=A.blockers;l.size>0&&(l=new Map(l),l.forEach((e,t)=>l.set(t,Oe)));let u=re?!1:lt(t,n.matches||A.matches),d=te===!0||A.navigation.formMethod!=null&&Y(A.navigation.formMethod)&&t.state?._isRedirect!==!0;s&&=(o=s,void 0),re||j===`POP`||(j===`PUSH`?e.history.push(t,t.state):j===`REPLACE`&&e.history.replace(t,t.state));let f;if(j===`POP`){let e=P.get(A.location.pathname);e&&e.has(t.pathname)?f={currentLocation:A.location,nextLocation:t}:P.has(t.pathname)&&(f={currentLocation:t,nextLocation:A.location})}else if(N){let e=P.get(A.location.pathname);e?e.add(t.pathname):(e=new Set([t.pathname]),P.set(A.location.pathname,e)),f={currentLocation:A.location,nextLocation:t}}H({...n,actionData:a,loaderData:c,historyAction:j,location:t,initialized:!0,navigation:Ee,revalidation:`idle`,restoreScrollPosition:u,preventScrollReset:d,blockers:l},{viewTransitionOpts:f,flushSync:r===!0}),j=`POP`,te=!1,N=!1,re=!1,ie=!1,de?.resolve(),de=null}async function he(t,n){if(typeof t==`number`){e.history.go(t);return}let r=Fe(A.location,A.matches,c,t,n?.fromRouteId,n?.relative),{path:i,submission:a,error:o}=Ie(!1,r,n),s=A.location,l=m(A.location,i,n&&n.state);l={...l,...e.history.encodeLocation(l)};let u=n&&n.replace!=null?n.replace:void 0,d=`PUSH`;u===!0?d=`REPLACE`:u===!1||a!=null&&Y(a.formMethod)&&a.formAction===A.location.pathname+A.location.search&&(d=`REPLACE`);let f=n&&`preventScrollReset`in n?n.preventScrollReset===!0:void 0,p=(n&&n.flushSync)===!0,h=Qe({currentLocation:s,nextLocation:l,historyAction:d});if(h){Ze(h,{state:`blocked`,location:l,proceed(){Ze(h,{state:`proceeding`,proceed:void 0,reset:void 0,location:l}),he(t,n)},reset(){let e=new Map(A.blockers);e.set(h,Oe),H({blockers:e})}});return}await _e(d,l,{submission:a,pendingError:o,preventScrollReset:f,replace:n&&n.replace,enableViewTransition:n&&n.viewTransition,flushSync:p})}function ge(){de||=It(),Pe(),H({revalidation:`loading`});let e=de.promise;return A.navigation.state===`submitting`?e:A.navigation.state===`idle`?(_e(A.historyAction,A.location,{startUninterruptedRevalidation:!0}),e):(_e(j||A.historyAction,A.navigation.location,{overrideNavigation:A.navigation,enableViewTransition:N===!0}),e)}async function _e(t,n,r){M&&M.abort(),M=null,j=t,re=(r&&r.startUninterruptedRevalidation)===!0,ct(A.location,A.matches),te=(r&&r.preventScrollReset)===!0,N=(r&&r.enableViewTransition)===!0;let i=s||o,a=r&&r.overrideNavigation,l=r?.initialHydration&&A.matches&&A.matches.length>0&&!C?A.matches:O(i,n,c),u=(r&&r.flushSync)===!0;if(l&&A.initialized&&!ie&&vt(A.location,n)&&!(r&&r.submission&&Y(r.submission.formMethod))){me(n,{matches:l},{flushSync:u});return}let d=ut(l,i,n.pathname);if(d.active&&d.matches&&(l=d.matches),!l){let{error:e,notFoundMatches:t,route:r}=$e(n.pathname);me(n,{matches:t,loaderData:{},errors:{[r.id]:e}},{flushSync:u});return}M=new AbortController;let f=st(e.history,n,M.signal,r&&r.submission),p=e.getContext?await e.getContext():new x,m;if(r&&r.pendingError)m=[mt(l).route.id,{type:`error`,error:r.pendingError}];else if(r&&r.submission&&Y(r.submission.formMethod)){let t=await ve(f,n,r.submission,l,p,d.active,r&&r.initialHydration===!0,{replace:r.replace,flushSync:u});if(t.shortCircuited)return;if(t.pendingActionResult){let[e,r]=t.pendingActionResult;if(J(r)&&ye(r.error)&&r.error.status===404){M=null,me(n,{matches:t.matches,loaderData:{},errors:{[e]:r.error}});return}}l=t.matches||l,m=t.pendingActionResult,a=kt(n,r.submission),u=!1,d.active=!1,f=st(e.history,f.url,f.signal)}let{shortCircuited:h,matches:g,loaderData:_,errors:v}=await U(f,n,l,p,d.active,a,r&&r.submission,r&&r.fetcherSubmission,r&&r.replace,r&&r.initialHydration===!0,u,m);h||(M=null,me(n,{matches:g||l,...pt(m),loaderData:_,errors:v}))}async function ve(e,t,n,s,l,u,d,f={}){Pe();let p=At(t,n);if(H({navigation:p},{flushSync:f.flushSync===!0}),u){let n=await _t(s,t.pathname,e.signal);if(n.type===`aborted`)return{shortCircuited:!0};if(n.type===`error`){if(n.partialMatches.length===0){let{matches:e,route:t}=ht(o);return{matches:e,pendingActionResult:[t.id,{type:`error`,error:n.error}]}}let e=mt(n.partialMatches).route.id;return{matches:n.partialMatches,pendingActionResult:[e,{type:`error`,error:n.error}]}}else if(n.matches)s=n.matches;else{let{notFoundMatches:e,error:n,route:r}=$e(t.pathname);return{matches:e,pendingActionResult:[r.id,{type:`error`,error:n}]}}}let m,h=Dt(s,t);if(!h.route.action&&!h.route.lazy)m={type:`error`,error:q(405,{method:e.method,pathname:t.pathname,routeId:h.route.id})};else{let t=et(i,a,e,s,h,d?[]:r,l),n=await Me(e,t,l,null);if(m=n[h.route.id],!m){for(let e of s)if(n[e.route.id]){m=n[e.route.id];break}}if(e.signal.aborted)return{shortCircuited:!0}}if(St(m)){let t;return t=f&&f.replace!=null?f.replace:ot(m.response.headers.get(`Location`),new URL(e.url),c)===A.location.pathname+A.location.search,await ke(e,m,!0,{submission:n,replace:t}),{shortCircuited:!0}}if(J(m)){let e=mt(s,h.route.id);return(f&&f.replace)!==!0&&(j=`PUSH`),{matches:s,pendingActionResult:[e.route.id,m,h.route.id]}}return{matches:s,pendingActionResult:[h.route.id,m]}}async function U(t,n,l,u,d,f,p,m,h,g,_,v){let y=f||kt(n,p),b=p||m||Ot(y),x=!re&&!g;if(d){if(x){let e=be(v);H({navigation:y,...e===void 0?{}:{actionData:e}},{flushSync:_})}let e=await _t(l,n.pathname,t.signal);if(e.type===`aborted`)return{shortCircuited:!0};if(e.type===`error`){if(e.partialMatches.length===0){let{matches:t,route:n}=ht(o);return{matches:t,loaderData:{},errors:{[n.id]:e.error}}}let t=mt(e.partialMatches).route.id;return{matches:e.partialMatches,loaderData:{},errors:{[t]:e.error}}}else if(e.matches)l=e.matches;else{let{error:e,notFoundMatches:t,route:r}=$e(n.pathname);return{matches:t,loaderData:{},errors:{[r.id]:e}}}}let S=s||o,{dsMatches:C,revalidatingFetchers:w}=Le(t,u,i,a,e.history,A,l,b,n,g?[]:r,g===!0,ie,ae,z,ce,L,S,c,e.patchRoutesOnNavigation!=null,v);if(se=++oe,!e.dataStrategy&&!C.some(e=>e.shouldLoad)&&!C.some(e=>e.route.middleware&&e.route.middleware.length>0)&&w.length===0){let e=Ke();return me(n,{matches:l,loaderData:{},errors:v&&J(v[1])?{[v[0]]:v[1].error}:null,...pt(v),...e?{fetchers:new Map(A.fetchers)}:{}},{flushSync:_}),{shortCircuited:!0}}if(x){let e={};if(!d){e.navigation=y;let t=be(v);t!==void 0&&(e.actionData=t)}w.length>0&&(e.fetchers=xe(w)),H(e,{flushSync:_})}w.forEach(e=>{K(e.key),e.controller&&F.set(e.key,e.controller)});let T=()=>w.forEach(e=>K(e.key));M&&M.signal.addEventListener(`abort`,T);let{loaderResults:E,fetcherResults:D}=await Ne(C,w,t,u);if(t.signal.aborted)return{shortCircuited:!0};M&&M.signal.removeEventListener(`abort`,T),w.forEach(e=>F.delete(e.key));let O=gt(E);if(O)return await ke(t,O.result,!0,{replace:h}),{shortCircuited:!0};if(O=gt(D),O)return L.add(O.key),await ke(t,O.result,!0,{replace:h}),{shortCircuited:!0};let{loaderData:k,errors:ee}=dt(A,l,E,v,w,D);g&&A.errors&&(ee={...A.errors,...ee});let j=Ke(),te=qe(se),N=j||te||w.length>0;return{matches:l,loaderData:k,errors:ee,...N?{fetchers:new Map(A.fetchers)}:{}}}function be(e){if(e&&!J(e[1]))return{[e[0]]:e[1].data};if(A.actionData)return Object.keys(A.actionData).length===0?null:A.actionData}function xe(e){return e.forEach(e=>{let t=A.fetchers.get(e.key),n=jt(void 0,t?t.data:void 0);A.fetchers.set(e.key,n)}),new Map(A.fetchers)}async function Se(t,n,r,i){K(t);let a=(i&&i.flushSync)===!0,l=s||o,u=Fe(A.location,A.matches,c,r,n,i?.relative),d=O(l,u,c),f=ut(d,l,u);if(f.active&&f.matches&&(d=f.matches),!d){G(t,n,q(404,{pathname:u}),{flushSync:a});return}let{path:p,submission:m,error:h}=Ie(!0,u,i);if(h){G(t,n,h,{flushSync:a});return}let g=e.getContext?await e.getContext():new x,_=(i&&i.preventScrollReset)===!0;if(m&&Y(m.formMethod)){await Ce(t,n,p,d,g,f.active,a,_,m);return}ce.set(t,{routeId:n,path:p}),await we(t,n,p,d,g,f.active,a,_,m)}async function Ce(t,n,l,d,f,p,m,h,g){Pe(),ce.delete(t);let _=A.fetchers.get(t);W(t,Mt(g,_),{flushSync:m});let v=new AbortController,y=st(e.history,l,v.signal,g);if(p){let e=await _t(d,new URL(y.url).pathname,y.signal,t);if(e.type===`aborted`)return;if(e.type===`error`){G(t,n,e.error,{flushSync:m});return}else if(e.matches)d=e.matches;else{G(t,n,q(404,{pathname:l}),{flushSync:m});return}}let b=Dt(d,l);if(!b.route.action&&!b.route.lazy){let e=q(405,{method:g.formMethod,pathname:l,routeId:n});G(t,n,e,{flushSync:m});return}F.set(t,v);let x=oe,S=et(i,a,y,d,b,r,f),C=(await Me(y,S,f,t))[b.route.id];if(y.signal.aborted){F.get(t)===v&&F.delete(t);return}if(z.has(t)){if(St(C)||J(C)){W(t,Nt(void 0));return}}else{if(St(C))if(F.delete(t),se>x){W(t,Nt(void 0));return}else return L.add(t),W(t,jt(g)),ke(y,C,!1,{fetcherSubmission:g,preventScrollReset:h});if(J(C)){G(t,n,C.error);return}}let w=A.navigation.location||A.location,T=st(e.history,w,v.signal),E=s||o,D=A.navigation.state===`idle`?A.matches:O(E,A.navigation.location,c);u(D,`Didn't find any matches after fetcher action`);let k=++oe;I.set(t,k);let ee=jt(g,C.data);A.fetchers.set(t,ee);let{dsMatches:te,revalidatingFetchers:N}=Le(T,f,i,a,e.history,A,D,g,w,r,!1,ie,ae,z,ce,L,E,c,e.patchRoutesOnNavigation!=null,[b.route.id,C]);N.filter(e=>e.key!==t).forEach(e=>{let t=e.key,n=A.fetchers.get(t),r=jt(void 0,n?n.data:void 0);A.fetchers.set(t,r),K(t),e.controller&&F.set(t,e.controller)}),H({fetchers:new Map(A.fetchers)});let P=()=>N.forEach(e=>K(e.key));v.signal.addEventListener(`abort`,P);let{loaderResults:ne,fetcherResults:re}=await Ne(te,N,T,f);if(v.signal.aborted)return;if(v.signal.removeEventListener(`abort`,P),I.delete(t),F.delete(t),N.forEach(e=>F.delete(e.key)),A.fetchers.has(t)){let e=Nt(C.data);A.fetchers.set(t,e)}let R=gt(ne);if(R)return ke(T,R.result,!1,{preventScrollReset:h});if(R=gt(re),R)return L.add(R.key),ke(T,R.result,!1,{preventScrollReset:h});let{loaderData:le,errors:B}=dt(A,D,ne,void 0,N,re);qe(k),A.navigation.state===`loading`&&k>se?(u(j,`Expected pending action`),M&&M.abort(),me(A.navigation.location,{matches:D,loaderData:le,errors:B,fetchers:new Map(A.fetchers)})):(H({errors:B,loaderData:ft(A.loaderData,le,D,B),fetchers:new Map(A.fetchers)}),ie=!1)}async function we(t,n,o,s,c,l,u,d,f){let p=A.fetchers.get(t);W(t,jt(f,p?p.data:void 0),{flushSync:u});let m=new AbortController,h=st(e.history,o,m.signal);if(l){let e=await _t(s,new URL(h.url).pathname,h.signal,t);if(e.type===`aborted`)return;if(e.type===`error`){G(t,n,e.error,{flushSync:u});return}else if(e.matches)s=e.matches;else{G(t,n,q(404,{pathname:o}),{flushSync:u});return}}let g=Dt(s,o);F.set(t,m);let _=oe,v=et(i,a,h,s,g,r,c),y=(await Me(h,v,c,t))[g.route.id];if(F.get(t)===m&&F.delete(t),!h.signal.aborted){if(z.has(t)){W(t,Nt(void 0));return}if(St(y))if(se>_){W(t,Nt(void 0));return}else{L.add(t),await ke(h,y,!1,{preventScrollReset:d});return}if(J(y)){G(t,n,y.error);return}W(t,Nt(y.data))}}async function ke(e,r,i,{submission:a,fetcherSubmission:o,preventScrollReset:s,replace:l}={}){r.response.headers.has(`X-Remix-Revalidate`)&&(ie=!0);let d=r.response.headers.get(`Location`);u(d,`Expected a Location header on the redirect Response`),d=ot(d,new URL(e.url),c);let f=m(A.location,d,{_isRedirect:!0});if(n){let e=!1;if(r.response.headers.has(`X-Remix-Reload-Document`))e=!0;else if(Ae(d)){let n=v(d,!0);e=n.origin!==t.location.origin||R(n.pathname,c)==null}if(e){l?t.location.replace(d):t.location.assign(d);return}}M=null;let p=l===!0||r.response.headers.has(`X-Remix-Replace`)?`REPLACE`:`PUSH`,{formMethod:h,formAction:g,formEncType:_}=A.navigation;!a&&!o&&h&&g&&_&&(a=Ot(A.navigation));let y=a||o;if(Te.has(r.response.status)&&y&&Y(y.formMethod))await _e(p,f,{submission:{...y,formAction:d},preventScrollReset:s||te,enableViewTransition:i?N:void 0});else{let e=kt(f,a);await _e(p,f,{overrideNavigation:e,fetcherSubmission:o,preventScrollReset:s||te,enableViewTransition:i?N:void 0})}}async function Me(e,t,n,r){let i,a={};try{i=await tt(l,e,t,r,n,!1)}catch(e){return t.filter(e=>e.shouldLoad).forEach(t=>{a[t.route.id]={type:`error`,error:e}}),a}if(e.signal.aborted)return a;for(let[n,r]of Object.entries(i))if(xt(r)){let i=r.result;a[n]={type:`redirect`,response:at(i,e,n,t,c)}}else a[n]=await it(r);return a}async function Ne(e,t,n,r){let i=Me(n,e,r,null),a=Promise.all(t.map(async e=>{if(e.matches&&e.match&&e.request&&e.controller){let t=(await Me(e.request,e.matches,r,e.key))[e.match.route.id];return{[e.key]:t}}else return Promise.resolve({[e.key]:{type:`error`,error:q(404,{pathname:e.path})}})})),o=await i,s=(await a).reduce((e,t)=>Object.assign(e,t),{});return{loaderResults:o,fetcherResults:s}}function Pe(){ie=!0,ce.forEach((e,t)=>{F.has(t)&&ae.add(t),K(t)})}function W(e,t,n={}){A.fetchers.set(e,t),H({fetchers:new Map(A.fetchers)},{flushSync:(n&&n.flushSync)===!0})}function G(e,t,n,r={}){let i=mt(A.matches,t);Ue(e),H({errors:{[i.route.id]:n},fetchers:new Map(A.fetchers)},{flushSync:(r&&r.flushSync)===!0})}function Be(e){return le.set(e,(le.get(e)||0)+1),z.has(e)&&z.delete(e),A.fetchers.get(e)||De}function Ve(e,t){K(e,t?.reason),W(e,Nt(null))}function Ue(e){let t=A.fetchers.get(e);F.has(e)&&!(t&&t.state===`loading`&&I.has(e))&&K(e),ce.delete(e),I.delete(e),L.delete(e),z.delete(e),ae.delete(e),A.fetchers.delete(e)}function We(e){let t=(le.get(e)||0)-1;t<=0?(le.delete(e),z.add(e)):le.set(e,t),H({fetchers:new Map(A.fetchers)})}function K(e,t){let n=F.get(e);n&&(n.abort(t),F.delete(e))}function Ge(e){for(let t of e){let e=Be(t),n=Nt(e.data);A.fetchers.set(t,n)}}function Ke(){let e=[],t=!1;for(let n of L){let r=A.fetchers.get(n);u(r,`Expected fetcher: ${n}`),r.state===`loading`&&(L.delete(n),e.push(n),t=!0)}return Ge(e),t}function qe(e){let t=[];for(let[n,r]of I)if(r<e){let e=A.fetchers.get(n);u(e,`Expected fetcher: ${n}`),e.state===`loading`&&(K(n),I.delete(n),t.push(n))}return Ge(t),t.length>0}function Ye(e,t){let n=A.blockers.get(e)||Oe;return B.get(e)!==t&&B.set(e,t),n}function Xe(e){A.blockers.delete(e),B.delete(e)}function Ze(e,t){let n=A.blockers.get(e)||Oe;u(n.state===`unblocked`&&t.state===`blocked`||n.state===`blocked`&&t.state===`blocked`||n.state===`blocked`&&t.state===`proceeding`||n.state===`blocked`&&t.state===`unblocked`||n.state===`proceeding`&&t.state===`unblocked`,`Invalid blocker state transition: ${n.state} -> ${t.state}`);let r=new Map(A.blockers);r.set(e,t),H({blockers:r})}function Qe({currentLocation:e,nextLocation:t,historyAction:n}){if(B.size===0)return;B.size>1&&d(!1,`A router only supports one blocker at a time`);let r=Array.from(B.entries()),[i,a]=r[r.length-1],o=A.blockers.get(i);if(!(o&&o.state===`proceeding`)&&a({currentLocation:e,nextLocation:t,historyAction:n}))return i}function $e(e){let t=q(404,{pathname:e}),{matches:n,route:r}=ht(s||o);return{notFoundMatches:n,route:r,error:t}}function nt(e,t,n){if(g=e,y=t,_=n||null,!b&&A.navigation===Ee){b=!0;let e=lt(A.location,A.matches);e!=null&&H({restoreScrollPosition:e})}return()=>{g=null,y=null,_=null}}function rt(e,t){return _&&_(e,t.map(e=>ee(e,A.loaderData)))||e.key}function ct(e,t){if(g&&y){let n=rt(e,t);g[n]=y()}}function lt(e,t){if(g){let n=rt(e,t),r=g[n];if(typeof r==`number`)return r}return null}function ut(t,n,r){if(e.patchRoutesOnNavigation){if(!t)return{active:!0,matches:k(n,r,c,!0)||[]};if(Object.keys(t[0].params).length>0)return{active:!0,matches:k(n,r,c,!0)}}return{active:!1,matches:null}}async function _t(t,n,r,l){if(!e.patchRoutesOnNavigation)return{type:`success`,matches:t};let u=t;for(;;){let t=s==null,d=s||o,f=a;try{await e.patchRoutesOnNavigation({signal:r,path:n,matches:u,fetcherKey:l,patch:(e,t)=>{r.aborted||He(e,t,d,f,i,!1)}})}catch(e){return{type:`error`,error:e,partialMatches:u}}finally{t&&!r.aborted&&(o=[...o])}if(r.aborted)return{type:`aborted`};let p=O(d,n,c);if(p)return{type:`success`,matches:p};let m=k(d,n,c,!0);if(!m||u.length===m.length&&u.every((e,t)=>e.route.id===m[t].route.id))return{type:`success`,matches:null};u=m}}function yt(e){a={},s=D(e,i,void 0,a)}function bt(e,t,n=!1){let r=s==null;He(e,t,s||o,a,i,n),r&&(o=[...o],H({}))}return E={get basename(){return c},get future(){return f},get state(){return A},get routes(){return o},get window(){return t},initialize:fe,subscribe:V,enableScrollRestoration:nt,navigate:he,fetch:Se,revalidate:ge,createHref:t=>e.history.createHref(t),encodeLocation:t=>e.history.encodeLocation(t),getFetcher:Be,resetFetcher:Ve,deleteFetcher:We,dispose:pe,getBlocker:Ye,deleteBlocker:Xe,patchRoutes:bt,_internalFetchControllers:F,_internalSetRoutes:yt,_internalSetStateDoNotUseOrYouWillBreakYourApp(e){H(e)}},E}function W(e){return e!=null&&(`formData`in e&&e.formData!=null||`body`in e&&e.body!==void 0)}function Fe(e,t,n,r,i,a){let o,s;if(i){o=[];for(let e of t)if(o.push(e),e.route.id===i){s=e;break}}else o=t,s=t[t.length-1];let c=pe(r||`.`,fe(o),R(e.pathname,n)||e.pathname,a===`path`);if(r??(c.search=e.search,c.hash=e.hash),(r==null||r===``||r===`.`)&&s){let e=Et(c.search);if(s.route.index&&!e)c.search=c.search?c.search.replace(/^\?/,`?index&`):`?index`;else if(!s.route.index&&e){let e=new URLSearchParams(c.search),t=e.getAll(`index`);e.delete(`index`),t.filter(e=>e).forEach(t=>e.append(`index`,t));let n=e.toString();c.search=n?`?${n}`:``}}return n!==`/`&&(c.pathname=le({basename:n,pathname:c.pathname})),h(c)}function Ie(e,t,n){if(!n||!W(n))return{path:t};if(n.formMethod&&!Tt(n.formMethod))return{path:t,error:q(405,{method:n.formMethod})};let r=()=>({path:t,error:q(400,{type:`invalid-body`})}),i=(n.formMethod||`get`).toUpperCase(),a=_t(t);if(n.body!==void 0){if(n.formEncType===`text/plain`){if(!Y(i))return r();let e=typeof n.body==`string`?n.body:n.body instanceof FormData||n.body instanceof URLSearchParams?Array.from(n.body.entries()).reduce((e,[t,n])=>`${e}${t}=${n}
-`,``):String(n.body);return{path:t,submission:{formMethod:i,formAction:a,formEncType:n.formEncType,formData:void 0,json:void 0,text:e}}}else if(n.formEncType===`application/json`){if(!Y(i))return r();try{let e=typeof n.body==`string`?JSON.parse(n.body):n.body;return{path:t,submission:{formMethod:i,formAction:a,formEncType:n.formEncType,formData:void 0,json:e,text:void 0}}}catch{return r()}}}u(typeof FormData==`function`,`FormData is not available in this environment`);let o,s;if(n.formData)o=ct(n.formData),s=n.formData;else if(n.body instanceof FormData)o=ct(n.body),s=n.body;else if(n.body instanceof URLSearchParams)o=n.body,s=lt(o);else if(n.body==null)o=new URLSearchParams,s=new FormData;else try{o=new URLSearchParams(n.body),s=lt(o)}catch{return r()}let c={formMethod:i,formAction:a,formEncType:n&&n.formEncType||`application/x-www-form-urlencoded`,formData:s,json:void 0,text:void 0};if(Y(c.formMethod))return{path:t,submission:c};let l=g(t);return e&&l.search&&Et(l.search)&&o.append(`index`,``),l.search=`?${o}`,{path:h(l),submission:c}}function Le(e,t,n,r,i,a,o,s,c,l,u,d,f,p,m,h,g,_,v,y){let b=y?J(y[1])?y[1].error:y[1].data:void 0,x=i.createURL(a.location),S=i.createURL(c),C;if(u&&a.errors){let e=Object.keys(a.errors)[0];C=o.findIndex(t=>t.route.id===e)}else if(y&&J(y[1])){let e=y[0];C=o.findIndex(t=>t.route.id===e)-1}let w=y?y[1].statusCode:void 0,T=w&&w>=400,E={currentUrl:x,currentParams:a.matches[0]?.params||{},nextUrl:S,nextParams:o[0].params,...s,actionResult:b,actionStatus:w},D=o.map((i,o)=>{let{route:s}=i,c=null;if(C!=null&&o>C?c=!1:s.lazy?c=!0:Re(s)?u?c=ze(s,a.loaderData,a.errors):G(a.loaderData,a.matches[o],i)&&(c=!0):c=!1,c!==null)return $e(n,r,e,i,l,t,c);let f=T?!1:d||x.pathname+x.search===S.pathname+S.search||x.search!==S.search||Be(a.matches[o],i),p={...E,defaultShouldRevalidate:f},m=Ve(i,p);return $e(n,r,e,i,l,t,m,p)}),k=[];return m.forEach((e,s)=>{if(u||!o.some(t=>t.route.id===e.routeId)||p.has(s))return;let c=a.fetchers.get(s),m=c&&c.state!==`idle`&&c.data===void 0,y=O(g,e.path,_);if(!y){if(v&&m)return;k.push({key:s,routeId:e.routeId,path:e.path,matches:null,match:null,request:null,controller:null});return}if(h.has(s))return;let b=Dt(y,e.path),x=new AbortController,S=st(i,e.path,x.signal),C=null;if(f.has(s))f.delete(s),C=et(n,r,S,y,b,l,t);else if(m)d&&(C=et(n,r,S,y,b,l,t));else{let e={...E,defaultShouldRevalidate:T?!1:d};Ve(b,e)&&(C=et(n,r,S,y,b,l,t,e))}C&&k.push({key:s,routeId:e.routeId,path:e.path,matches:C,match:b,request:S,controller:x})}),{dsMatches:D,revalidatingFetchers:k}}function Re(e){return e.loader!=null||e.middleware!=null&&e.middleware.length>0}function ze(e,t,n){if(e.lazy)return!0;if(!Re(e))return!1;let r=t!=null&&e.id in t,i=n!=null&&n[e.id]!==void 0;return!r&&i?!1:typeof e.loader==`function`&&e.loader.hydrate===!0?!0:!r&&!i}function G(e,t,n){let r=!t||n.route.id!==t.route.id,i=!e.hasOwnProperty(n.route.id);return r||i}function Be(e,t){let n=e.route.path;return e.pathname!==t.pathname||n!=null&&n.endsWith(`*`)&&e.params[`*`]!==t.params[`*`]}function Ve(e,t){if(e.route.shouldRevalidate){let n=e.route.shouldRevalidate(t);if(typeof n==`boolean`)return n}return t.defaultShouldRevalidate}function He(e,t,n,r,i,a){let o;if(e){let t=r[e];u(t,`No route found to patch children into: routeId = ${e}`),!t.children&&(t.children=[]),o=t.children}else o=n;let s=[],c=[];if(t.forEach(e=>{let t=o.find(t=>Ue(e,t));t?c.push({existingRoute:t,newRoute:e}):s.push(e)}),s.length>0){let t=D(s,i,[e||`_`,`patch`,String(o?.length||`0`)],r);o.push(...t)}if(a&&c.length>0)for(let e=0;e<c.length;e++){let{existingRoute:t,newRoute:n}=c[e],r=t,[a]=D([n],i,[],{},!0);Object.assign(r,{element:a.element?a.element:r.element,errorElement:a.errorElement?a.errorElement:r.errorElement,hydrateFallbackElement:a.hydrateFallbackElement?a.hydrateFallbackElement:r.hydrateFallbackElement})}}function Ue(e,t){return`id`in e&&`id`in t&&e.id===t.id?!0:e.index===t.index&&e.path===t.path&&e.caseSensitive===t.caseSensitive?(!e.children||e.children.length===0)&&(!t.children||t.children.length===0)?!0:e.children.every((e,n)=>t.children?.some(t=>Ue(e,t))):!1}var We=new WeakMap,K=({key:e,route:t,manifest:n,mapRouteProperties:r})=>{let i=n[t.id];if(u(i,`No route found in manifest`),!i.lazy||typeof i.lazy!=`object`)return;let a=i.lazy[e];if(!a)return;let o=We.get(i);o||(o={},We.set(i,o));let s=o[e];if(s)return s;let c=(async()=>{let t=C(e),n=i[e]!==void 0&&e!==`hasErrorBoundary`;if(t)d(!t,`Route property `+e+` is not a supported lazy route property. This property will be ignored.`),o[e]=Promise.resolve();else if(n)d(!1,`Route "${i.id}" has a static property "${e}" defined. The lazy property will be ignored.`);else{let t=await a();t!=null&&(Object.assign(i,{[e]:t}),Object.assign(i,r(i)))}typeof i.lazy==`object`&&(i.lazy[e]=void 0,Object.values(i.lazy).every(e=>e===void 0)&&(i.lazy=void 0))})();return o[e]=c,c},Ge=new WeakMap;function Ke(e,t,n,r,i){let a=n[e.id];if(u(a,`No route found in manifest`),!e.lazy)return{lazyRoutePromise:void 0,lazyHandlerPromise:void 0};if(typeof e.lazy==`function`){let t=Ge.get(a);if(t)return{lazyRoutePromise:t,lazyHandlerPromise:t};let n=(async()=>{u(typeof e.lazy==`function`,`No lazy route function found`);let t=await e.lazy(),n={};for(let e in t){let r=t[e];if(r===void 0)continue;let i=T(e),o=a[e]!==void 0&&e!==`hasErrorBoundary`;i?d(!i,`Route property `+e+` is not a supported property to be returned from a lazy route function. This property will be ignored.`):o?d(!o,`Route "${a.id}" has a static property "${e}" defined but its lazy function is also returning a value for this property. The lazy route property "${e}" will be ignored.`):n[e]=r}Object.assign(a,n),Object.assign(a,{...r(a),lazy:void 0})})();return Ge.set(a,n),n.catch(()=>{}),{lazyRoutePromise:n,lazyHandlerPromise:n}}let o=Object.keys(e.lazy),s=[],c;for(let a of o){if(i&&i.includes(a))continue;let o=K({key:a,route:e,manifest:n,mapRouteProperties:r});o&&(s.push(o),a===t&&(c=o))}let l=s.length>0?Promise.all(s).then(()=>{}):void 0;return l?.catch(()=>{}),c?.catch(()=>{}),{lazyRoutePromise:l,lazyHandlerPromise:c}}async function qe(e){let t=e.matches.filter(e=>e.shouldLoad),n={};return(await Promise.all(t.map(e=>e.resolve()))).forEach((e,r)=>{n[t[r].route.id]=e}),n}async function Je(e){return e.matches.some(e=>e.route.middleware)?Ye(e,()=>qe(e)):qe(e)}function Ye(e,t){return Xe(e,t,e=>e,yt,n);function n(t,n,r){if(r)return Promise.resolve(Object.assign(r.value,{[n]:{type:`error`,result:t}}));{let{matches:r}=e,i=Math.min(Math.max(r.findIndex(e=>e.route.id===n),0),Math.max(r.findIndex(e=>e.unstable_shouldCallHandler()),0)),a=mt(r,r[i].route.id).route.id;return Promise.resolve({[a]:{type:`error`,result:t}})}}}async function Xe(e,t,n,r,i){let{matches:a,request:o,params:s,context:c}=e,l=a.flatMap(e=>e.route.middleware?e.route.middleware.map(t=>[e.route.id,t]):[]);return await Ze({request:o,params:s,context:c},l,t,n,r,i)}async function Ze(e,t,n,r,i,a,o=0){let{request:s}=e;if(s.signal.aborted)throw s.signal.reason??Error(`Request aborted: ${s.method} ${s.url}`);let c=t[o];if(!c)return await n();let[l,u]=c,d,f=async()=>{if(d)throw Error("You may only call `next()` once per middleware");try{return d={value:await Ze(e,t,n,r,i,a,o+1)},d.value}catch(e){return d={value:await a(e,l,d)},d.value}};try{let t=await u(e,f),n=t==null?void 0:r(t);return i(n)?n:d?n??d.value:(d={value:await f()},d.value)}catch(e){return await a(e,l,d)}}function Qe(e,t,n,r,i){let a=K({key:`middleware`,route:r.route,manifest:t,mapRouteProperties:e}),o=Ke(r.route,Y(n.method)?`action`:`loader`,t,e,i);return{middleware:a,route:o.lazyRoutePromise,handler:o.lazyHandlerPromise}}function $e(e,t,n,r,i,a,o,s=null){let c=!1,l=Qe(e,t,n,r,i);return{...r,_lazyPromises:l,shouldLoad:o,unstable_shouldRevalidateArgs:s,unstable_shouldCallHandler(e){return c=!0,s?typeof e==`boolean`?Ve(r,{...s,defaultShouldRevalidate:e}):Ve(r,s):o},resolve(e){let{lazy:t,loader:i,middleware:s}=r.route,u=c||o||e&&!Y(n.method)&&(t||i),d=s&&s.length>0&&!i&&!t;return u&&!d?nt({request:n,match:r,lazyHandlerPromise:l?.handler,lazyRoutePromise:l?.route,handlerOverride:e,scopedContext:a}):Promise.resolve({type:`data`,result:void 0})}}}function et(e,t,n,r,i,a,o,s=null){return r.map(r=>r.route.id===i.route.id?$e(e,t,n,r,a,o,!0,s):{...r,shouldLoad:!1,unstable_shouldRevalidateArgs:s,unstable_shouldCallHandler:()=>!1,_lazyPromises:Qe(e,t,n,r,a),resolve:()=>Promise.resolve({type:`data`,result:void 0})})}async function tt(e,t,n,r,i,a){n.some(e=>e._lazyPromises?.middleware)&&await Promise.all(n.map(e=>e._lazyPromises?.middleware));let o={request:t,params:n[0].params,context:i,matches:n},s=a?()=>{throw Error("You cannot call `runClientMiddleware()` from a static handler `dataStrategy`. Middleware is run outside of `dataStrategy` during SSR in order to bubble up the Response.  You can enable middleware via the `respond` API in `query`/`queryRoute`")}:e=>{let t=o;return Ye(t,()=>e({...t,fetcherKey:r,runClientMiddleware:()=>{throw Error("Cannot call `runClientMiddleware()` from within an `runClientMiddleware` handler")}}))},c=await e({...o,fetcherKey:r,runClientMiddleware:s});try{await Promise.all(n.flatMap(e=>[e._lazyPromises?.handler,e._lazyPromises?.route]))}catch{}return c}async function nt({request:e,match:t,lazyHandlerPromise:n,lazyRoutePromise:r,handlerOverride:i,scopedContext:a}){let o,s,c=Y(e.method),l=c?`action`:`loader`,u=n=>{let r,o=new Promise((e,t)=>r=t);s=()=>r(),e.signal.addEventListener(`abort`,s);let c=r=>typeof n==`function`?n({request:e,params:t.params,context:a},...r===void 0?[]:[r]):Promise.reject(Error(`You cannot call the handler for a route which defines a boolean "${l}" [routeId: ${t.route.id}]`)),u=(async()=>{try{return{type:`data`,result:await(i?i(e=>c(e)):c())}}catch(e){return{type:`error`,result:e}}})();return Promise.race([u,o])};try{let i=c?t.route.action:t.route.loader;if(n||r)if(i){let e,[t]=await Promise.all([u(i).catch(t=>{e=t}),n,r]);if(e!==void 0)throw e;o=t}else{await n;let i=c?t.route.action:t.route.loader;if(i)[o]=await Promise.all([u(i),r]);else if(l===`action`){let n=new URL(e.url),r=n.pathname+n.search;throw q(405,{method:e.method,pathname:r,routeId:t.route.id})}else return{type:`data`,result:void 0}}else if(i)o=await u(i);else{let t=new URL(e.url),n=t.pathname+t.search;throw q(404,{pathname:n})}}catch(e){return{type:`error`,result:e}}finally{s&&e.signal.removeEventListener(`abort`,s)}return o}async function rt(e){let t=e.headers.get(`Content-Type`);return t&&/\bapplication\/json\b/.test(t)?e.body==null?null:e.json():e.text()}async function it(e){let{result:t,type:n}=e;if(wt(t)){let e;try{e=await rt(t)}catch(e){return{type:`error`,error:e}}return n===`error`?{type:`error`,error:new U(t.status,t.statusText,e),statusCode:t.status,headers:t.headers}:{type:`data`,data:e,statusCode:t.status,headers:t.headers}}return n===`error`?Ct(t)?t.data instanceof Error?{type:`error`,error:t.data,statusCode:t.init?.status,headers:t.init?.headers?new Headers(t.init.headers):void 0}:{type:`error`,error:new U(t.init?.status||500,void 0,t.data),statusCode:ye(t)?t.status:void 0,headers:t.init?.headers?new Headers(t.init.headers):void 0}:{type:`error`,error:t,statusCode:ye(t)?t.status:void 0}:Ct(t)?{type:`data`,data:t.data,statusCode:t.init?.status,headers:t.init?.headers?new Headers(t.init.headers):void 0}:{type:`data`,data:t}}function at(e,t,n,r,i){let a=e.headers.get(`Location`);if(u(a,`Redirects returned/thrown from loaders/actions must have a Location header`),!Ae(a)){let o=r.slice(0,r.findIndex(e=>e.route.id===n)+1);a=Fe(new URL(t.url),o,i,a),e.headers.set(`Location`,a)}return e}function ot(e,t,n){if(Ae(e)){let r=e,i=r.startsWith(`//`)?new URL(t.protocol+r):new URL(r),a=R(i.pathname,n)!=null;if(i.origin===t.origin&&a)return i.pathname+i.search+i.hash}return e}function st(e,t,n,r){let i=e.createURL(_t(t)).toString(),a={signal:n};if(r&&Y(r.formMethod)){let{formMethod:e,formEncType:t}=r;a.method=e.toUpperCase(),t===`application/json`?(a.headers=new Headers({"Content-Type":t}),a.body=JSON.stringify(r.json)):t===`text/plain`?a.body=r.text:t===`application/x-www-form-urlencoded`&&r.formData?a.body=ct(r.formData):a.body=r.formData}return new Request(i,a)}function ct(e){let t=new URLSearchParams;for(let[n,r]of e.entries())t.append(n,typeof r==`string`?r:r.name);return t}function lt(e){let t=new FormData;for(let[n,r]of e.entries())t.append(n,r);return t}function ut(e,t,n,r=!1,i=!1){let a={},o=null,s,c=!1,l={},d=n&&J(n[1])?n[1].error:void 0;return e.forEach(n=>{if(!(n.route.id in t))return;let f=n.route.id,p=t[f];if(u(!St(p),`Cannot handle redirect results in processLoaderData`),J(p)){let t=p.error;if(d!==void 0&&(t=d,d=void 0),o||={},i)o[f]=t;else{let n=mt(e,f);o[n.route.id]??(o[n.route.id]=t)}r||(a[f]=Ne),c||(c=!0,s=ye(p.error)?p.error.status:500),p.headers&&(l[f]=p.headers)}else a[f]=p.data,p.statusCode&&p.statusCode!==200&&!c&&(s=p.statusCode),p.headers&&(l[f]=p.headers)}),d!==void 0&&n&&(o={[n[0]]:d},n[2]&&(a[n[2]]=void 0)),{loaderData:a,errors:o,statusCode:s||200,loaderHeaders:l}}function dt(e,t,n,r,i,a){let{loaderData:o,errors:s}=ut(t,n,r);return i.filter(e=>!e.matches||e.matches.some(e=>e.shouldLoad)).forEach(t=>{let{key:n,match:r,controller:i}=t;if(i&&i.signal.aborted)return;let o=a[n];if(u(o,`Did not find corresponding fetcher result`),J(o)){let t=mt(e.matches,r?.route.id);s&&s[t.route.id]||(s={...s,[t.route.id]:o.error}),e.fetchers.delete(n)}else if(St(o))u(!1,`Unhandled fetcher revalidation redirect`);else{let t=Nt(o.data);e.fetchers.set(n,t)}}),{loaderData:o,errors:s}}function ft(e,t,n,r){let i=Object.entries(t).filter(([,e])=>e!==Ne).reduce((e,[t,n])=>(e[t]=n,e),{});for(let a of n){let n=a.route.id;if(!t.hasOwnProperty(n)&&e.hasOwnProperty(n)&&a.route.loader&&(i[n]=e[n]),r&&r.hasOwnProperty(n))break}return i}function pt(e){return e?J(e[1])?{actionData:{}}:{actionData:{[e[0]]:e[1].data}}:{}}function mt(e,t){return(t?e.slice(0,e.findIndex(e=>e.route.id===t)+1):[...e]).reverse().find(e=>e.route.hasErrorBoundary===!0)||e[0]}function ht(e){let t=e.length===1?e[0]:e.find(e=>e.index||!e.path||e.path===`/`)||{id:`__shim-error-route__`};return{matches:[{params:{},pathname:``,pathnameBase:``,route:t}],route:t}}function q(e,{pathname:t,routeId:n,method:r,type:i,message:a}={}){let o=`Unknown Server Error`,s=`Unknown @remix-run/router error`;return e===400?(o=`Bad Request`,r&&t&&n?s=`You made a ${r} request to "${t}" but did not provide a \`loader\` for route "${n}", so there is no way to handle the request.`:i===`invalid-body`&&(s=`Unable to encode submission body`)):e===403?(o=`Forbidden`,s=`Route "${n}" does not match URL "${t}"`):e===404?(o=`Not Found`,s=`No route matches URL "${t}"`):e===405&&(o=`Method Not Allowed`,r&&t&&n?s=`You made a ${r.toUpperCase()} request to "${t}" but did not provide an \`action\` for route "${n}", so there is no way to handle the request.`:r&&(s=`Invalid request method "${r.toUpperCase()}"`)),new U(e||500,o,Error(s),!0)}function gt(e){let t=Object.entries(e);for(let e=t.length-1;e>=0;e--){let[n,r]=t[e];if(St(r))return{key:n,result:r}}}function _t(e){let t=typeof e==`string`?g(e):e;return h({...t,hash:``})}function vt(e,t){return e.pathname!==t.pathname||e.search!==t.search?!1:e.hash===``?t.hash!==``:e.hash===t.hash?!0:t.hash!==``}function yt(e){return typeof e==`object`&&!!e&&Object.entries(e).every(([e,t])=>typeof e==`string`&&bt(t))}function bt(e){return typeof e==`object`&&!!e&&`type`in e&&`result`in e&&(e.type===`data`||e.type===`error`)}function xt(e){return wt(e.result)&&we.has(e.result.status)}function J(e){return e.type===`error`}function St(e){return(e&&e.type)===`redirect`}function Ct(e){return typeof e==`object`&&!!e&&`type`in e&&`data`in e&&`init`in e&&e.type===`DataWithResponseInit`}function wt(e){return e!=null&&typeof e.status==`number`&&typeof e.statusText==`string`&&typeof e.headers==`object`&&e.body!==void 0}function Tt(e){return Ce.has(e.toUpperCase())}function Y(e){return xe.has(e.toUpperCase())}function Et(e){return new URLSearchParams(e).getAll(`index`).some(e=>e===``)}function Dt(e,t){let n=typeof t==`string`?g(t).search:t.search;if(e[e.length-1].route.index&&Et(n||``))return e[e.length-1];let r=de(e);return r[r.length-1]}function Ot(e){let{formMethod:t,formAction:n,formEncType:r,text:i,formData:a,json:o}=e;if(!(!t||!n||!r)){if(i!=null)return{formMethod:t,formAction:n,formEncType:r,formData:void 0,json:void 0,text:i};if(a!=null)return{formMethod:t,formAction:n,formEncType:r,formData:a,json:void 0,text:void 0};if(o!==void 0)return{formMethod:t,formAction:n,formEncType:r,formData:void 0,json:o,text:void 0}}}function kt(e,t){return t?{state:`loading`,location:e,formMethod:t.formMethod,formAction:t.formAction,formEncType:t.formEncType,formData:t.formData,json:t.json,text:t.text}:{state:`loading`,location:e,formMethod:void 0,formAction:void 0,formEncType:void 0,formData:void 0,json:void 0,text:void 0}}function At(e,t){return{state:`submitting`,location:e,formMethod:t.formMethod,formAction:t.formAction,formEncType:t.formEncType,formData:t.formData,json:t.json,text:t.text}}function jt(e,t){return e?{state:`loading`,formMethod:e.formMethod,formAction:e.formAction,formEncType:e.formEncType,formData:e.formData,json:e.json,text:e.text,data:t}:{state:`loading`,formMethod:void 0,formAction:void 0,formEncType:void 0,formData:void 0,json:void 0,text:void 0,data:t}}function Mt(e,t){return{state:`submitting`,formMethod:e.formMethod,formAction:e.formAction,formEncType:e.formEncType,formData:e.formData,json:e.json,text:e.text,data:t?t.data:void 0}}function Nt(e){return{state:`idle`,formMethod:void 0,formAction:void 0,formEncType:void 0,formData:void 0,json:void 0,text:void 0,data:e}}function Pt(e,t){try{let n=e.sessionStorage.getItem(Me);if(n){let e=JSON.parse(n);for(let[n,r]of Object.entries(e||{}))r&&Array.isArray(r)&&t.set(n,new Set(r||[]))}}catch{}}function Ft(e,t){if(t.size>0){let n={};for(let[e,r]of t)n[e]=[...r];try{e.sessionStorage.setItem(Me,JSON.stringify(n))}catch(e){d(!1,`Failed to save applied view transitions in sessionStorage (${e}).`)}}}function It(){let e,t,n=new Promise((r,i)=>{e=async e=>{r(e);try{await n}catch{}},t=async e=>{i(e);try{await n}catch{}}});return{promise:n,resolve:e,reject:t}}var Lt=n.createContext(null);Lt.displayName=`DataRouter`;var Rt=n.createContext(null);Rt.displayName=`DataRouterState`;var zt=n.createContext(!1);function Bt(){return n.useContext(zt)}var Vt=n.createContext({isTransitioning:!1});Vt.displayName=`ViewTransition`;var Ht=n.createContext(new Map);Ht.displayName=`Fetchers`;var Ut=n.createContext(null);Ut.displayName=`Await`;var X=n.createContext(null);X.displayName=`Navigation`;var Wt=n.createContext(null);Wt.displayName=`Location`;var Z=n.createContext({outlet:null,matches:[],isDataRoute:!1});Z.displayName=`Route`;var Gt=n.createContext(null);Gt.displayName=`RouteError`;function Kt(e,{relative:t}={}){u(qt(),`useHref() may be used only in the context of a <Router> component.`);let{basename:r,navigator:i}=n.useContext(X),{hash:a,pathname:o,search:s}=tn(e,{relative:t}),c=o;return r!==`/`&&(c=o===`/`?r:V([r,o])),i.createHref({pathname:c,search:s,hash:a})}function qt(){return n.useContext(Wt)!=null}function Q(){return u(qt(),`useLocation() may be used only in the context of a <Router> component.`),n.useContext(Wt).location}var Jt=`You should call navigate() in a React.useEffect(), not when your component is first rendered.`;function Yt(e){n.useContext(X).static||n.useLayoutEffect(e)}function Xt(){let{isDataRoute:e}=n.useContext(Z);return e?bn():Zt()}function Zt(){u(qt(),`useNavigate() may be used only in the context of a <Router> component.`);let e=n.useContext(Lt),{basename:t,navigator:r}=n.useContext(X),{matches:i}=n.useContext(Z),{pathname:a}=Q(),o=JSON.stringify(fe(i)),s=n.useRef(!1);return Yt(()=>{s.current=!0}),n.useCallback((n,i={})=>{if(d(s.current,Jt),!s.current)return;if(typeof n==`number`){r.go(n);return}let c=pe(n,JSON.parse(o),a,i.relative===`path`);e==null&&t!==`/`&&(c.pathname=c.pathname===`/`?t:V([t,c.pathname])),(i.replace?r.replace:r.push)(c,i.state,i)},[t,r,o,a,e])}var Qt=n.createContext(null);function $t(e){let t=n.useContext(Z).outlet;return n.useMemo(()=>t&&n.createElement(Qt.Provider,{value:e},t),[t,e])}function en(){let{matches:e}=n.useContext(Z),t=e[e.length-1];return t?t.params:{}}function tn(e,{relative:t}={}){let{matches:r}=n.useContext(Z),{pathname:i}=Q(),a=JSON.stringify(fe(r));return n.useMemo(()=>pe(e,JSON.parse(a),i,t===`path`),[e,a,i,t])}function nn(e,t,r,i,a){u(qt(),`useRoutes() may be used only in the context of a <Router> component.`);let{navigator:o}=n.useContext(X),{matches:s}=n.useContext(Z),c=s[s.length-1],l=c?c.params:{},f=c?c.pathname:`/`,p=c?c.pathnameBase:`/`,m=c&&c.route;{let e=m&&m.path||``;Sn(f,!m||e.endsWith(`*`)||e.endsWith(`*?`),`You rendered descendant <Routes> (or called \`useRoutes()\`) at "${f}" (under <Route path="${e}">) but the parent route path has no trailing "*". This means if you navigate deeper, the parent won't match anymore and therefore the child routes will never render.
-
-Please change the parent <Route path="${e}"> to <Route path="${e===`/`?`*`:`${e}/*`}">.`)}let h=Q(),_;if(t){let e=typeof t==`string`?g(t):t;u(p===`/`||e.pathname?.startsWith(p),`When overriding the location using \`<Routes location>\` or \`useRoutes(routes, location)\`, the location pathname must begin with the portion of the URL pathname that was matched by all parent routes. The current pathname base is "${p}" but pathname "${e.pathname}" was given in the \`location\` prop.`),_=e}else _=h;let v=_.pathname||`/`,y=v;if(p!==`/`){let e=p.replace(/^\//,``).split(`/`);y=`/`+v.replace(/^\//,``).split(`/`).slice(e.length).join(`/`)}let b=O(e,{pathname:y});d(m||b!=null,`No routes matched location "${_.pathname}${_.search}${_.hash}" `),d(b==null||b[b.length-1].route.element!==void 0||b[b.length-1].route.Component!==void 0||b[b.length-1].route.lazy!==void 0,`Matched leaf route at location "${_.pathname}${_.search}${_.hash}" does not have an element or Component. This means it will render an <Outlet /> with a null value by default resulting in an "empty" page.`);let x=cn(b&&b.map(e=>Object.assign({},e,{params:Object.assign({},l,e.params),pathname:V([p,o.encodeLocation?o.encodeLocation(e.pathname.replace(/\?/g,`%3F`).replace(/#/g,`%23`)).pathname:e.pathname]),pathnameBase:e.pathnameBase===`/`?p:V([p,o.encodeLocation?o.encodeLocation(e.pathnameBase.replace(/\?/g,`%3F`).replace(/#/g,`%23`)).pathname:e.pathnameBase])})),s,r,i,a);return t&&x?n.createElement(Wt.Provider,{value:{location:{pathname:`/`,search:``,hash:``,state:null,key:`default`,..._},navigationType:`POP`}},x):x}function rn(){let e=yn(),t=ye(e)?`${e.status} ${e.statusText}`:e instanceof Error?e.message:JSON.stringify(e),r=e instanceof Error?e.stack:null,i=`rgba(200,200,200, 0.5)`,a={padding:`0.5rem`,backgroundColor:i},o={padding:`2px 4px`,backgroundColor:i},s=null;return console.error(`Error handled by React Router default ErrorBoundary:`,e),s=n.createElement(n.Fragment,null,n.createElement(`p`,null,`💿 Hey developer 👋`),n.createElement(`p`,null,`You can provide a way better UX than this when your app throws errors by providing your own `,n.createElement(`code`,{style:o},`ErrorBoundary`),` or`,` `,n.createElement(`code`,{style:o},`errorElement`),` prop on your route.`)),n.createElement(n.Fragment,null,n.createElement(`h2`,null,`Unexpected Application Error!`),n.createElement(`h3`,{style:{fontStyle:`italic`}},t),r?n.createElement(`pre`,{style:a},r):null,s)}var an=n.createElement(rn,null),on=class extends n.Component{constructor(e){super(e),this.state={location:e.location,revalidation:e.revalidation,error:e.error}}static getDerivedStateFromError(e){return{error:e}}static getDerivedStateFromProps(e,t){return t.location!==e.location||t.revalidation!==`idle`&&e.revalidation===`idle`?{error:e.error,location:e.location,revalidation:e.revalidation}:{error:e.error===void 0?t.error:e.error,location:t.location,revalidation:e.revalidation||t.revalidation}}componentDidCatch(e,t){this.props.unstable_onError?this.props.unstable_onError(e,t):console.error(`React Router caught the following error during render`,e)}render(){return this.state.error===void 0?this.props.children:n.createElement(Z.Provider,{value:this.props.routeContext},n.createElement(Gt.Provider,{value:this.state.error,children:this.props.component}))}};function sn({routeContext:e,match:t,children:r}){let i=n.useContext(Lt);return i&&i.static&&i.staticContext&&(t.route.errorElement||t.route.ErrorBoundary)&&(i.staticContext._deepestRenderedBoundaryId=t.route.id),n.createElement(Z.Provider,{value:e},r)}function cn(e,t=[],r=null,i=null,a=null){if(e==null){if(!r)return null;if(r.errors)e=r.matches;else if(t.length===0&&!r.initialized&&r.matches.length>0)e=r.matches;else return null}let o=e,s=r?.errors;if(s!=null){let e=o.findIndex(e=>e.route.id&&s?.[e.route.id]!==void 0);u(e>=0,`Could not find a matching route for errors on route IDs: ${Object.keys(s).join(`,`)}`),o=o.slice(0,Math.min(o.length,e+1))}let c=!1,l=-1;if(r)for(let e=0;e<o.length;e++){let t=o[e];if((t.route.HydrateFallback||t.route.hydrateFallbackElement)&&(l=e),t.route.id){let{loaderData:e,errors:n}=r,i=t.route.loader&&!e.hasOwnProperty(t.route.id)&&(!n||n[t.route.id]===void 0);if(t.route.lazy||i){c=!0,o=l>=0?o.slice(0,l+1):[o[0]];break}}}return o.reduceRight((e,a,u)=>{let d,f=!1,p=null,m=null;r&&(d=s&&a.route.id?s[a.route.id]:void 0,p=a.route.errorElement||an,c&&(l<0&&u===0?(Sn(`route-fallback`,!1,"No `HydrateFallback` element provided to render during initial hydration"),f=!0,m=null):l===u&&(f=!0,m=a.route.hydrateFallbackElement||null)));let h=t.concat(o.slice(0,u+1)),g=()=>{let t;return t=d?p:f?m:a.route.Component?n.createElement(a.route.Component,null):a.route.element?a.route.element:e,n.createElement(sn,{match:a,routeContext:{outlet:e,matches:h,isDataRoute:r!=null},children:t})};return r&&(a.route.ErrorBoundary||a.route.errorElement||u===0)?n.createElement(on,{location:r.location,revalidation:r.revalidation,component:p,error:d,children:g(),routeContext:{outlet:null,matches:h,isDataRoute:!0},unstable_onError:i}):g()},null)}function ln(e){return`${e} must be used within a data router.  See https://reactrouter.com/en/main/routers/picking-a-router.`}function un(e){let t=n.useContext(Lt);return u(t,ln(e)),t}function dn(e){let t=n.useContext(Rt);return u(t,ln(e)),t}function fn(e){let t=n.useContext(Z);return u(t,ln(e)),t}function pn(e){let t=fn(e),n=t.matches[t.matches.length-1];return u(n.route.id,`${e} can only be used on routes that contain a unique "id"`),n.route.id}function mn(){return pn(`useRouteId`)}function hn(){return dn(`useNavigation`).navigation}function gn(){let{matches:e,loaderData:t}=dn(`useMatches`);return n.useMemo(()=>e.map(e=>ee(e,t)),[e,t])}function _n(){let e=dn(`useLoaderData`),t=pn(`useLoaderData`);return e.loaderData[t]}function vn(){let e=dn(`useActionData`),t=pn(`useLoaderData`);return e.actionData?e.actionData[t]:void 0}function yn(){let e=n.useContext(Gt),t=dn(`useRouteError`),r=pn(`useRouteError`);return e===void 0?t.errors?.[r]:e}function bn(){let{router:e}=un(`useNavigate`),t=pn(`useNavigate`),r=n.useRef(!1);return Yt(()=>{r.current=!0}),n.useCallback(async(n,i={})=>{d(r.current,Jt),r.current&&(typeof n==`number`?e.navigate(n):await e.navigate(n,{fromRouteId:t,...i}))},[e,t])}var xn={};function Sn(e,t,n){!t&&!xn[e]&&(xn[e]=!0,d(!1,n))}var Cn={};function wn(e,t){!e&&!Cn[t]&&(Cn[t]=!0,console.warn(t))}function Tn(e){let t={hasErrorBoundary:e.hasErrorBoundary||e.ErrorBoundary!=null||e.errorElement!=null};return e.Component&&(e.element&&d(!1,"You should not include both `Component` and `element` on your route - `Component` will be used."),Object.assign(t,{element:n.createElement(e.Component),Component:void 0})),e.HydrateFallback&&(e.hydrateFallbackElement&&d(!1,"You should not include both `HydrateFallback` and `hydrateFallbackElement` on your route - `HydrateFallback` will be used."),Object.assign(t,{hydrateFallbackElement:n.createElement(e.HydrateFallback),HydrateFallback:void 0})),e.ErrorBoundary&&(e.errorElement&&d(!1,"You should not include both `ErrorBoundary` and `errorElement` on your route - `ErrorBoundary` will be used."),Object.assign(t,{errorElement:n.createElement(e.ErrorBoundary),ErrorBoundary:void 0})),t}var En=[`HydrateFallback`,`hydrateFallbackElement`],Dn=class{constructor(){this.status=`pending`,this.promise=new Promise((e,t)=>{this.resolve=t=>{this.status===`pending`&&(this.status=`resolved`,e(t))},this.reject=e=>{this.status===`pending`&&(this.status=`rejected`,t(e))}})}};function On({router:e,flushSync:t,unstable_onError:r}){let[i,a]=n.useState(e.state),[o,s]=n.useState(),[c,l]=n.useState({isTransitioning:!1}),[u,d]=n.useState(),[f,p]=n.useState(),[m,h]=n.useState(),g=n.useRef(new Map),_=n.useCallback(e=>{a(t=>(e.errors&&r&&Object.entries(e.errors).forEach(([e,n])=>{t.errors?.[e]!==n&&r(n)}),e))},[r]),v=n.useCallback((r,{deletedFetchers:i,flushSync:a,viewTransitionOpts:o})=>{r.fetchers.forEach((e,t)=>{e.data!==void 0&&g.current.set(t,e.data)}),i.forEach(e=>g.current.delete(e)),wn(a===!1||t!=null,'You provided the `flushSync` option to a router update, but you are not using the `<RouterProvider>` from `react-router/dom` so `ReactDOM.flushSync()` is unavailable.  Please update your app to `import { RouterProvider } from "react-router/dom"` and ensure you have `react-dom` installed as a dependency to use the `flushSync` option.');let c=e.window!=null&&e.window.document!=null&&typeof e.window.document.startViewTransition==`function`;if(wn(o==null||c,"You provided the `viewTransition` option to a router update, but you do not appear to be running in a DOM environment as `window.startViewTransition` is not available."),!o||!c){t&&a?t(()=>_(r)):n.startTransition(()=>_(r));return}if(t&&a){t(()=>{f&&(u&&u.resolve(),f.skipTransition()),l({isTransitioning:!0,flushSync:!0,currentLocation:o.currentLocation,nextLocation:o.nextLocation})});let n=e.window.document.startViewTransition(()=>{t(()=>_(r))});n.finished.finally(()=>{t(()=>{d(void 0),p(void 0),s(void 0),l({isTransitioning:!1})})}),t(()=>p(n));return}f?(u&&u.resolve(),f.skipTransition(),h({state:r,currentLocation:o.currentLocation,nextLocation:o.nextLocation})):(s(r),l({isTransitioning:!0,flushSync:!1,currentLocation:o.currentLocation,nextLocation:o.nextLocation}))},[e.window,t,f,u,_]);n.useLayoutEffect(()=>e.subscribe(v),[e,v]),n.useEffect(()=>{c.isTransitioning&&!c.flushSync&&d(new Dn)},[c]),n.useEffect(()=>{if(u&&o&&e.window){let t=o,r=u.promise,i=e.window.document.startViewTransition(async()=>{n.startTransition(()=>_(t)),await r});i.finished.finally(()=>{d(void 0),p(void 0),s(void 0),l({isTransitioning:!1})}),p(i)}},[o,u,e.window,_]),n.useEffect(()=>{u&&o&&i.location.key===o.location.key&&u.resolve()},[u,f,i.location,o]),n.useEffect(()=>{!c.isTransitioning&&m&&(s(m.state),l({isTransitioning:!0,flushSync:!1,currentLocation:m.currentLocation,nextLocation:m.nextLocation}),h(void 0))},[c.isTransitioning,m]);let y=n.useMemo(()=>({createHref:e.createHref,encodeLocation:e.encodeLocation,go:t=>e.navigate(t),push:(t,n,r)=>e.navigate(t,{state:n,preventScrollReset:r?.preventScrollReset}),replace:(t,n,r)=>e.navigate(t,{replace:!0,state:n,preventScrollReset:r?.preventScrollReset})}),[e]),b=e.basename||`/`,x=n.useMemo(()=>({router:e,navigator:y,static:!1,basename:b,unstable_onError:r}),[e,y,b,r]);return n.createElement(n.Fragment,null,n.createElement(Lt.Provider,{value:x},n.createElement(Rt.Provider,{value:i},n.createElement(Ht.Provider,{value:g.current},n.createElement(Vt.Provider,{value:c},n.createElement(Mn,{basename:b,location:i.location,navigationType:i.historyAction,navigator:y},n.createElement(kn,{routes:e.routes,future:e.future,state:i,unstable_onError:r})))))),null)}var kn=n.memo(An);function An({routes:e,future:t,state:n,unstable_onError:r}){return nn(e,void 0,n,r,t)}function jn(e){return $t(e.context)}function Mn({basename:e=`/`,children:t=null,location:r,navigationType:i=`POP`,navigator:a,static:o=!1}){u(!qt(),`You cannot render a <Router> inside another <Router>. You should never have more than one in your app.`);let s=e.replace(/^\/*/,`/`),c=n.useMemo(()=>({basename:s,navigator:a,static:o,future:{}}),[s,a,o]);typeof r==`string`&&(r=g(r));let{pathname:l=`/`,search:f=``,hash:p=``,state:m=null,key:h=`default`}=r,_=n.useMemo(()=>{let e=R(l,s);return e==null?null:{location:{pathname:e,search:f,hash:p,state:m,key:h},navigationType:i}},[s,l,f,p,m,h,i]);return d(_!=null,`<Router basename="${s}"> is not able to match the URL "${l}${f}${p}" because it does not start with the basename, so the <Router> won't render anything.`),_==null?null:n.createElement(X.Provider,{value:c},n.createElement(Wt.Provider,{children:t,value:_}))}function Nn(){return{params:en(),loaderData:_n(),actionData:vn(),matches:gn()}}function Pn(e){return function(){let t=Nn();return n.createElement(e,t)}}var Fn=`get`,In=`application/x-www-form-urlencoded`;function Ln(e){return e!=null&&typeof e.tagName==`string`}function Rn(e){return Ln(e)&&e.tagName.toLowerCase()===`button`}function zn(e){return Ln(e)&&e.tagName.toLowerCase()===`form`}function Bn(e){return Ln(e)&&e.tagName.toLowerCase()===`input`}function Vn(e){return!!(e.metaKey||e.altKey||e.ctrlKey||e.shiftKey)}function Hn(e,t){return e.button===0&&(!t||t===`_self`)&&!Vn(e)}function Un(e=``){return new URLSearchParams(typeof e==`string`||Array.isArray(e)||e instanceof URLSearchParams?e:Object.keys(e).reduce((t,n)=>{let r=e[n];return t.concat(Array.isArray(r)?r.map(e=>[n,e]):[[n,r]])},[]))}function Wn(e,t){let n=Un(e);return t&&t.forEach((e,r)=>{n.has(r)||t.getAll(r).forEach(e=>{n.append(r,e)})}),n}var Gn=null;function Kn(){if(Gn===null)try{new FormData(document.createElement(`form`),0),Gn=!1}catch{Gn=!0}return Gn}var qn=new Set([`application/x-www-form-urlencoded`,`multipart/form-data`,`text/plain`]);function Jn(e){return e!=null&&!qn.has(e)?(d(!1,`"${e}" is not a valid \`encType\` for \`<Form>\`/\`<fetcher.Form>\` and will default to "${In}"`),null):e}function Yn(e,t){let n,r,i,a,o;if(zn(e)){let o=e.getAttribute(`action`);r=o?R(o,t):null,n=e.getAttribute(`method`)||Fn,i=Jn(e.getAttribute(`enctype`))||In,a=new FormData(e)}else if(Rn(e)||Bn(e)&&(e.type===`submit`||e.type===`image`)){let o=e.form;if(o==null)throw Error(`Cannot submit a <button> or <input type="submit"> without a <form>`);let s=e.getAttribute(`formaction`)||o.getAttribute(`action`);if(r=s?R(s,t):null,n=e.getAttribute(`formmethod`)||o.getAttribute(`method`)||Fn,i=Jn(e.getAttribute(`formenctype`))||Jn(o.getAttribute(`enctype`))||In,a=new FormData(o,e),!Kn()){let{name:t,type:n,value:r}=e;if(n===`image`){let e=t?`${t}.`:``;a.append(`${e}x`,`0`),a.append(`${e}y`,`0`)}else t&&a.append(t,r)}}else if(Ln(e))throw Error(`Cannot submit element that is not <form>, <button>, or <input type="submit|image">`);else n=Fn,r=null,i=In,o=e;return a&&i===`text/plain`&&(o=a,a=void 0),{action:r,method:n.toLowerCase(),encType:i,formData:a,body:o}}var Xn=-1,Zn=-2,Qn=-3,$n=-4,er=-5,tr=-6,nr=-7,rr=`B`,ir=`D`,ar=`E`,or=`M`,sr=`N`,cr=`P`,lr=`R`,ur=`S`,dr=`Y`,fr=`U`,pr=`Z`,mr=class{constructor(){this.promise=new Promise((e,t)=>{this.resolve=e,this.reject=t})}};function hr(){let e=new TextDecoder,t=``;return new TransformStream({transform(n,r){let i=e.decode(n,{stream:!0}),a=(t+i).split(`
-`);t=a.pop()||``;for(let e of a)r.enqueue(e)},flush(e){t&&e.enqueue(t)}})}Object.getOwnPropertyNames(Object.prototype).sort().join(`\0`);var gr=typeof window<`u`?window:typeof globalThis<`u`?globalThis:void 0;function _r(e){let{hydrated:t,values:n}=this;if(typeof e==`number`)return vr.call(this,e);if(!Array.isArray(e)||!e.length)throw SyntaxError();let r=n.length;for(let t of e)n.push(t);return t.length=n.length,vr.call(this,r)}function vr(e){let{hydrated:t,values:n,deferred:r,plugins:i}=this,a,o=[[e,e=>{a=e}]],s=[];for(;o.length>0;){let[e,a]=o.pop();switch(e){case nr:a(void 0);continue;case er:a(null);continue;case Zn:a(NaN);continue;case tr:a(1/0);continue;case Qn:a(-1/0);continue;case $n:a(-0);continue}if(t[e]){a(t[e]);continue}let c=n[e];if(!c||typeof c!=`object`){t[e]=c,a(c);continue}if(Array.isArray(c))if(typeof c[0]==`string`){let[n,l,u]=c;switch(n){case ir:a(t[e]=new Date(l));continue;case fr:a(t[e]=new URL(l));continue;case rr:a(t[e]=BigInt(l));continue;case lr:a(t[e]=new RegExp(l,u));continue;case dr:a(t[e]=Symbol.for(l));continue;case ur:let n=new Set;t[e]=n;for(let e=c.length-1;e>0;e--)o.push([c[e],e=>{n.add(e)}]);a(n);continue;case or:let d=new Map;t[e]=d;for(let e=c.length-2;e>0;e-=2){let t=[];o.push([c[e+1],e=>{t[1]=e}]),o.push([c[e],e=>{t[0]=e}]),s.push(()=>{d.set(t[0],t[1])})}a(d);continue;case sr:let f=Object.create(null);t[e]=f;for(let e of Object.keys(l).reverse()){let t=[];o.push([l[e],e=>{t[1]=e}]),o.push([Number(e.slice(1)),e=>{t[0]=e}]),s.push(()=>{f[t[0]]=t[1]})}a(f);continue;case cr:if(t[l])a(t[e]=t[l]);else{let n=new mr;r[l]=n,a(t[e]=n.promise)}continue;case ar:let[,p,m]=c,h=m&&gr&&gr[m]?new gr[m](p):Error(p);t[e]=h,a(h);continue;case pr:a(t[e]=t[l]);continue;default:if(Array.isArray(i)){let n=[],r=c.slice(1);for(let e=0;e<r.length;e++){let t=r[e];o.push([t,t=>{n[e]=t}])}s.push(()=>{for(let r of i){let i=r(c[0],...n);if(i){a(t[e]=i.value);return}}throw SyntaxError()});continue}throw SyntaxError()}}else{let n=[];t[e]=n;for(let e=0;e<c.length;e++){let t=c[e];t!==Xn&&o.push([t,t=>{n[e]=t}])}a(n);continue}else{let n={};t[e]=n;for(let e of Object.keys(c).reverse()){let t=[];o.push([c[e],e=>{t[1]=e}]),o.push([Number(e.slice(1)),e=>{t[0]=e}]),s.push(()=>{n[t[0]]=t[1]})}a(n);continue}}for(;s.length>0;)s.pop()();return a}async function yr(e,t){let{plugins:n}=t??{},r=new mr,i=e.pipeThrough(hr()).getReader(),a={values:[],hydrated:[],deferred:{},plugins:n},o=await br.call(a,i),s=r.promise;return o.done?r.resolve():s=xr.call(a,i).then(r.resolve).catch(e=>{for(let t of Object.values(a.deferred))t.reject(e);r.reject(e)}),{done:s.then(()=>i.closed),value:o.value}}async function br(e){let t=await e.read();if(!t.value)throw SyntaxError();let n;try{n=JSON.parse(t.value)}catch{throw SyntaxError()}return{done:t.done,value:_r.call(this,n)}}async function xr(e){let t=await e.read();for(;!t.done;){if(!t.value)continue;let n=t.value;switch(n[0]){case cr:{let e=n.indexOf(`:`),t=Number(n.slice(1,e)),r=this.deferred[t];if(!r)throw Error(`Deferred ID ${t} not found in stream`);let i=n.slice(e+1),a;try{a=JSON.parse(i)}catch{throw SyntaxError()}let o=_r.call(this,a);r.resolve(o);break}case ar:{let e=n.indexOf(`:`),t=Number(n.slice(1,e)),r=this.deferred[t];if(!r)throw Error(`Deferred ID ${t} not found in stream`);let i=n.slice(e+1),a;try{a=JSON.parse(i)}catch{throw SyntaxError()}let o=_r.call(this,a);r.reject(o);break}default:throw SyntaxError()}t=await e.read()}}async function Sr(e){let t={signal:e.signal};if(e.method!==`GET`){t.method=e.method;let n=e.headers.get(`Content-Type`);n&&/\bapplication\/json\b/.test(n)?(t.headers={"Content-Type":n},t.body=JSON.stringify(await e.json())):n&&/\btext\/plain\b/.test(n)?(t.headers={"Content-Type":n},t.body=await e.text()):n&&/\bapplication\/x-www-form-urlencoded\b/.test(n)?t.body=new URLSearchParams(await e.text()):t.body=await e.formData()}return t}var Cr={"&":`\\u0026`,">":`\\u003e`,"<":`\\u003c`,"\u2028":`\\u2028`,"\u2029":`\\u2029`},wr=/[&><\u2028\u2029]/g;function Tr(e){return e.replace(wr,e=>Cr[e])}function $(e,t){if(e===!1||e==null)throw Error(t)}var Er=Symbol(`SingleFetchRedirect`),Dr=class extends Error{},Or=new Set([100,101,204,205]);function kr(e,t,n,r,i){let a=Ar(e,e=>{let r=t.routes[e.route.id];$(r,`Route not found in manifest`);let i=n[e.route.id];return{hasLoader:r.hasLoader,hasClientLoader:r.hasClientLoader,hasShouldRevalidate:!!i?.shouldRevalidate}},Rr,r,i);return async e=>e.runClientMiddleware(a)}function Ar(e,t,n,r,i,a=()=>!0){return async o=>{let{request:s,matches:c,fetcherKey:l}=o,u=e();if(s.method!==`GET`)return jr(o,n,i);let d=c.some(e=>{let{hasLoader:n,hasClientLoader:r}=t(e);return e.unstable_shouldCallHandler()&&n&&!r});return!r&&!d?Mr(o,t,n,i):l?Fr(o,n,i):Nr(o,u,t,n,r,i,a)}}async function jr(e,t,n){let r=e.matches.find(e=>e.unstable_shouldCallHandler());$(r,`No action match found`);let i,a=await r.resolve(async a=>await a(async()=>{let{data:a,status:o}=await t(e,n,[r.route.id]);return i=o,Br(a,r.route.id)}));return wt(a.result)||ye(a.result)||Ct(a.result)?{[r.route.id]:a}:{[r.route.id]:{type:a.type,result:_e(a.result,i)}}}async function Mr(e,t,n,r){let i=e.matches.filter(e=>e.unstable_shouldCallHandler()),a={};return await Promise.all(i.map(i=>i.resolve(async o=>{try{let{hasClientLoader:s}=t(i),c=i.route.id,l=s?await o(async()=>{let{data:t}=await n(e,r,[c]);return Br(t,c)}):await o();a[i.route.id]={type:`data`,result:l}}catch(e){a[i.route.id]={type:`error`,result:e}}}))),a}async function Nr(e,t,n,r,i,a,o=()=>!0){let s=new Set,c=!1,l=e.matches.map(()=>Vr()),u=Vr(),d={},f=Promise.all(e.matches.map(async(t,i)=>t.resolve(async f=>{l[i].resolve();let p=t.route.id,{hasLoader:m,hasClientLoader:h,hasShouldRevalidate:g}=n(t),_=!t.unstable_shouldRevalidateArgs||t.unstable_shouldRevalidateArgs.actionStatus==null||t.unstable_shouldRevalidateArgs.actionStatus<400;if(!t.unstable_shouldCallHandler(_)){c||=t.unstable_shouldRevalidateArgs!=null&&m&&g===!0;return}if(o(t)&&h){m&&(c=!0);try{d[p]={type:`data`,result:await f(async()=>{let{data:t}=await r(e,a,[p]);return Br(t,p)})}}catch(e){d[p]={type:`error`,result:e}}return}m&&s.add(p);try{d[p]={type:`data`,result:await f(async()=>{let e=await u.promise;return Br(e,p)})}}catch(e){d[p]={type:`error`,result:e}}})));if(await Promise.all(l.map(e=>e.promise)),(!t.state.initialized&&t.state.navigation.state===`idle`||s.size===0)&&!window.__reactRouterHdrActive)u.resolve({routes:{}});else{let t=i&&c&&s.size>0?[...s.keys()]:void 0;try{let n=await r(e,a,t);u.resolve(n.data)}catch(e){u.reject(e)}}return await f,await Pr(u.promise,e.matches,s,d),d}async function Pr(e,t,n,r){try{let i,a=await e;if(`routes`in a){for(let e of t)if(e.route.id in a.routes){let t=a.routes[e.route.id];if(`error`in t){i=t.error,r[e.route.id]?.result??(r[e.route.id]={type:`error`,result:i});break}}}i!==void 0&&Array.from(n.values()).forEach(e=>{r[e].result instanceof Dr&&(r[e].result=i)})}catch{}}async function Fr(e,t,n){let r=e.matches.find(e=>e.unstable_shouldCallHandler());$(r,`No fetcher match found`);let i=r.route.id,a=await r.resolve(async r=>r(async()=>{let{data:r}=await t(e,n,[i]);return Br(r,i)}));return{[r.route.id]:a}}function Ir(e){let t=e.searchParams.getAll(`index`);e.searchParams.delete(`index`);let n=[];for(let e of t)e&&n.push(e);for(let t of n)e.searchParams.append(`index`,t);return e}function Lr(e,t,n){let r=typeof e==`string`?new URL(e,typeof window>`u`?`server://singlefetch/`:window.location.origin):e;return r.pathname===`/`?r.pathname=`_root.${n}`:t&&R(r.pathname,t)===`/`?r.pathname=`${t.replace(/\/$/,``)}/_root.${n}`:r.pathname=`${r.pathname.replace(/\/$/,``)}.${n}`,r}async function Rr(e,t,n){let{request:r}=e,i=Lr(r.url,t,`data`);r.method===`GET`&&(i=Ir(i),n&&i.searchParams.set(`_routes`,n.join(`,`)));let a=await fetch(i,await Sr(r));if(a.status>=400&&!a.headers.has(`X-Remix-Response`))throw new U(a.status,a.statusText,await a.text());if(a.status===204&&a.headers.has(`X-Remix-Redirect`))return{status:202,data:{redirect:{redirect:a.headers.get(`X-Remix-Redirect`),status:Number(a.headers.get(`X-Remix-Status`)||`302`),revalidate:a.headers.get(`X-Remix-Revalidate`)===`true`,reload:a.headers.get(`X-Remix-Reload-Document`)===`true`,replace:a.headers.get(`X-Remix-Replace`)===`true`}}};if(Or.has(a.status)){let e={};return n&&r.method!==`GET`&&(e[n[0]]={data:void 0}),{status:a.status,data:{routes:e}}}$(a.body,`No response body to decode`);try{let e=await zr(a.body,window),t;if(r.method===`GET`){let n=e.value;t=Er in n?{redirect:n[Er]}:{routes:n}}else{let r=e.value,i=n?.[0];$(i,`No routeId found for single fetch call decoding`),t=`redirect`in r?{redirect:r}:{routes:{[i]:r}}}return{status:a.status,data:t}}catch{throw Error(`Unable to decode turbo-stream response`)}}function zr(e,t){return yr(e,{plugins:[(e,...n)=>{if(e===`SanitizedError`){let[e,r,i]=n,a=Error;e&&e in t&&typeof t[e]==`function`&&(a=t[e]);let o=new a(r);return o.stack=i,{value:o}}if(e===`ErrorResponse`){let[e,t,r]=n;return{value:new U(t,r,e)}}if(e===`SingleFetchRedirect`)return{value:{[Er]:n[0]}};if(e===`SingleFetchClassInstance`)return{value:n[0]};if(e===`SingleFetchFallback`)return{value:void 0}}]})}function Br(e,t){if(`redirect`in e){let{redirect:t,revalidate:n,reload:r,replace:i,status:a}=e.redirect;throw ve(t,{status:a,headers:{...n?{"X-Remix-Revalidate":`yes`}:null,...r?{"X-Remix-Reload-Document":`yes`}:null,...i?{"X-Remix-Replace":`yes`}:null}})}let n=e.routes[t];if(n==null)throw new Dr(`No result found for routeId "${t}"`);if(`error`in n)throw n.error;if(`data`in n)return n.data;throw Error(`Invalid response found for routeId "${t}"`)}function Vr(){let e,t,n=new Promise((r,i)=>{e=async e=>{r(e);try{await n}catch{}},t=async e=>{i(e);try{await n}catch{}}});return{promise:n,resolve:e,reject:t}}async function Hr(e,t){if(e.id in t)return t[e.id];try{let n=await import(e.module);return t[e.id]=n,n}catch(t){return console.error(`Error loading route module \`${e.module}\`, reloading page...`),console.error(t),window.__reactRouterContext&&window.__reactRouterContext.isSpaMode,window.location.reload(),new Promise(()=>{})}}function Ur(e,t,n){let r=e.map(e=>{let r=t[e.route.id],i=n.routes[e.route.id];return[i&&i.css?i.css.map(e=>({rel:`stylesheet`,href:e})):[],r?.links?.()||[]]}).flat(2),i=Qr(e,n);return ti(r,i)}function Wr(e){return e.css?e.css.map(e=>({rel:`stylesheet`,href:e})):[]}async function Gr(e){if(!e.css)return;let t=Wr(e);await Promise.all(t.map(qr))}async function Kr(e,t){if(!e.css&&!t.links||!ri())return;let n=[];if(e.css&&n.push(...Wr(e)),t.links&&n.push(...t.links()),n.length===0)return;let r=[];for(let e of n)!Jr(e)&&e.rel===`stylesheet`&&r.push({...e,rel:`preload`,as:`style`});await Promise.all(r.map(qr))}async function qr(e){return new Promise(t=>{if(e.media&&!window.matchMedia(e.media).matches||document.querySelector(`link[rel="stylesheet"][href="${e.href}"]`))return t();let n=document.createElement(`link`);Object.assign(n,e);function r(){document.head.contains(n)&&document.head.removeChild(n)}n.onload=()=>{r(),t()},n.onerror=()=>{r(),t()},document.head.appendChild(n)})}function Jr(e){return e!=null&&typeof e.page==`string`}function Yr(e){return e==null?!1:e.href==null?e.rel===`preload`&&typeof e.imageSrcSet==`string`&&typeof e.imageSizes==`string`:typeof e.rel==`string`&&typeof e.href==`string`}async function Xr(e,t,n){let r=await Promise.all(e.map(async e=>{let r=t.routes[e.route.id];if(r){let e=await Hr(r,n);return e.links?e.links():[]}return[]}));return ti(r.flat(1).filter(Yr).filter(e=>e.rel===`stylesheet`||e.rel===`preload`).map(e=>e.rel===`stylesheet`?{...e,rel:`prefetch`,as:`style`}:{...e,rel:`prefetch`}))}function Zr(e,t,n,r,i,a){let o=(e,t)=>n[t]?e.route.id!==n[t].route.id:!0,s=(e,t)=>n[t].pathname!==e.pathname||n[t].route.path?.endsWith(`*`)&&n[t].params[`*`]!==e.params[`*`];return a===`assets`?t.filter((e,t)=>o(e,t)||s(e,t)):a===`data`?t.filter((t,a)=>{let c=r.routes[t.route.id];if(!c||!c.hasLoader)return!1;if(o(t,a)||s(t,a))return!0;if(t.route.shouldRevalidate){let r=t.route.shouldRevalidate({currentUrl:new URL(i.pathname+i.search+i.hash,window.origin),currentParams:n[0]?.params||{},nextUrl:new URL(e,window.origin),nextParams:t.params,defaultShouldRevalidate:!0});if(typeof r==`boolean`)return r}return!0}):[]}function Qr(e,t,{includeHydrateFallback:n}={}){return $r(e.map(e=>{let r=t.routes[e.route.id];if(!r)return[];let i=[r.module];return r.clientActionModule&&(i=i.concat(r.clientActionModule)),r.clientLoaderModule&&(i=i.concat(r.clientLoaderModule)),n&&r.hydrateFallbackModule&&(i=i.concat(r.hydrateFallbackModule)),r.imports&&(i=i.concat(r.imports)),i}).flat(1))}function $r(e){return[...new Set(e)]}function ei(e){let t={},n=Object.keys(e).sort();for(let r of n)t[r]=e[r];return t}function ti(e,t){let n=new Set,r=new Set(t);return e.reduce((e,i)=>{if(t&&!Jr(i)&&i.as===`script`&&i.href&&r.has(i.href))return e;let a=JSON.stringify(ei(i));return n.has(a)||(n.add(a),e.push({key:a,link:i})),e},[])}var ni;function ri(){if(ni!==void 0)return ni;let e=document.createElement(`link`);return ni=e.relList.supports(`preload`),e=null,ni}function ii(){return n.createElement(Xi,{title:`Loading...`,renderScripts:!0},n.createElement(`script`,{dangerouslySetInnerHTML:{__html:`
-              console.log(
-                "💿 Hey developer 👋. You can provide a way better UX than this " +
-                "when your app is loading JS modules and/or running \`clientLoader\` " +
-                "functions. Check out https://reactrouter.com/start/framework/route-module#hydratefallback " +
-                "for more information."
-              );
-            `}}))}function ai(e){let t={};return Object.values(e).forEach(e=>{if(e){let n=e.parentId||``;t[n]||(t[n]=[]),t[n].push(e)}}),t}function oi(e,t,r){let i=mi(t),a=t.HydrateFallback&&(!r||e.id===`root`)?t.HydrateFallback:e.id===`root`?ii:void 0,o=t.ErrorBoundary?t.ErrorBoundary:e.id===`root`?()=>n.createElement(Yi,{error:yn()}):void 0;return e.id===`root`&&t.Layout?{...i?{element:n.createElement(t.Layout,null,n.createElement(i,null))}:{Component:i},...o?{errorElement:n.createElement(t.Layout,null,n.createElement(o,null))}:{ErrorBoundary:o},...a?{hydrateFallbackElement:n.createElement(t.Layout,null,n.createElement(a,null))}:{HydrateFallback:a}}:{Component:i,ErrorBoundary:o,HydrateFallback:a}}function si(e,t,n,r,i,a){return ui(t,n,r,i,a,``,ai(t),e)}function ci(e,t){if(e===`loader`&&!t.hasLoader||e===`action`&&!t.hasAction){let n=`You are trying to call ${e===`action`?`serverAction()`:`serverLoader()`} on a route that does not have a server ${e} (routeId: "${t.id}")`;throw console.error(n),new U(400,`Bad Request`,Error(n),!0)}}function li(e,t){let n=e===`clientAction`?`a`:`an`,r=`Route "${t}" does not have ${n} ${e}, but you are trying to submit to it. To fix this, please add ${n} \`${e}\` function to the route`;throw console.error(r),new U(405,`Method Not Allowed`,Error(r),!0)}function ui(e,t,n,r,i,a=``,o=ai(e),s){return(o[a]||[]).map(a=>{let c=t[a.id];function l(e){return $(typeof e==`function`,`No single fetch function available for route handler`),e()}function u(e){return a.hasLoader?l(e):Promise.resolve(null)}function d(e){if(!a.hasAction)throw li(`action`,a.id);return l(e)}function f(e){import(e)}function p(e){e.clientActionModule&&f(e.clientActionModule),e.clientLoaderModule&&f(e.clientLoaderModule)}async function m(e){let n=t[a.id],r=n?Kr(a,n):Promise.resolve();try{return e()}finally{await r}}let h={id:a.id,index:a.index,path:a.path};if(c){Object.assign(h,{...h,...oi(a,c,i),middleware:c.clientMiddleware,handle:c.handle,shouldRevalidate:di(h.path,c,a,r,s)});let e=n&&n.loaderData&&a.id in n.loaderData,t=e?n?.loaderData?.[a.id]:void 0,o=n&&n.errors&&a.id in n.errors,l=o?n?.errors?.[a.id]:void 0,f=s==null&&(c.clientLoader?.hydrate===!0||!a.hasLoader);h.loader=async({request:n,params:r,context:i},s)=>{try{return await m(async()=>($(c,"No `routeModule` available for critical-route loader"),c.clientLoader?c.clientLoader({request:n,params:r,context:i,async serverLoader(){if(ci(`loader`,a),f){if(e)return t;if(o)throw l}return u(s)}}):u(s)))}finally{f=!1}},h.loader.hydrate=hi(a.id,c.clientLoader,a.hasLoader,i),h.action=({request:e,params:t,context:n},r)=>m(async()=>{if($(c,"No `routeModule` available for critical-route action"),!c.clientAction){if(i)throw li(`clientAction`,a.id);return d(r)}return c.clientAction({request:e,params:t,context:n,async serverAction(){return ci(`action`,a),d(r)}})})}else{a.hasClientLoader||(h.loader=(e,t)=>m(()=>u(t))),a.hasClientAction||(h.action=(e,t)=>m(()=>{if(i)throw li(`clientAction`,a.id);return d(t)}));let e;async function n(){return e||=(async()=>{(a.clientLoaderModule||a.clientActionModule)&&await new Promise(e=>setTimeout(e,0));let e=pi(a,t);return p(a),await e})(),await e}h.lazy={loader:a.hasClientLoader?async()=>{let{clientLoader:e}=a.clientLoaderModule?await import(a.clientLoaderModule):await n();return $(e,"No `clientLoader` export found"),(t,n)=>e({...t,async serverLoader(){return ci(`loader`,a),u(n)}})}:void 0,action:a.hasClientAction?async()=>{let e=a.clientActionModule?import(a.clientActionModule):n();p(a);let{clientAction:t}=await e;return $(t,"No `clientAction` export found"),(e,n)=>t({...e,async serverAction(){return ci(`action`,a),d(n)}})}:void 0,middleware:a.hasClientMiddleware?async()=>{let{clientMiddleware:e}=a.clientMiddlewareModule?await import(a.clientMiddlewareModule):await n();return $(e,"No `clientMiddleware` export found"),e}:void 0,shouldRevalidate:async()=>{let e=await n();return di(h.path,e,a,r,s)},handle:async()=>(await n()).handle,Component:async()=>(await n()).Component,ErrorBoundary:a.hasErrorBoundary?async()=>(await n()).ErrorBoundary:void 0}}let g=ui(e,t,n,r,i,a.id,o,s);return g.length>0&&(h.children=g),h})}function di(e,t,n,r,i){if(i)return fi(n.id,t.shouldRevalidate,i);if(!r&&n.hasLoader&&!n.hasClientLoader){let n=e?L(e)[1].map(e=>e.paramName):[],r=e=>n.some(t=>e.currentParams[t]!==e.nextParams[t]);if(t.shouldRevalidate){let e=t.shouldRevalidate;return t=>e({...t,defaultShouldRevalidate:r(t)})}else return e=>r(e)}if(r&&t.shouldRevalidate){let e=t.shouldRevalidate;return t=>e({...t,defaultShouldRevalidate:!0})}return t.shouldRevalidate}function fi(e,t,n){let r=!1;return i=>r?t?t(i):i.defaultShouldRevalidate:(r=!0,n.has(e))}async function pi(e,t){let n=Hr(e,t),r=Gr(e),i=await n;return await Promise.all([r,Kr(e,i)]),{Component:mi(i),ErrorBoundary:i.ErrorBoundary,clientMiddleware:i.clientMiddleware,clientAction:i.clientAction,clientLoader:i.clientLoader,handle:i.handle,links:i.links,meta:i.meta,shouldRevalidate:i.shouldRevalidate}}function mi(e){if(e.default!=null&&!(typeof e.default==`object`&&Object.keys(e.default).length===0))return e.default}function hi(e,t,n,r){return r&&e!==`root`||t!=null&&(t.hydrate===!0||n!==!0)}var gi=new Set,_i=1e3,vi=new Set,yi=7680;function bi(e,t){return e.mode===`lazy`&&t===!0}function xi({sri:e,...t},n){let r=new Set(n.state.matches.map(e=>e.route.id)),i=n.state.location.pathname.split(`/`).filter(Boolean),a=[`/`];for(i.pop();i.length>0;)a.push(`/${i.join(`/`)}`),i.pop();a.forEach(e=>{let t=O(n.routes,e,n.basename);t&&t.forEach(e=>r.add(e.route.id))});let o=[...r].reduce((e,n)=>Object.assign(e,{[n]:t.routes[n]}),{});return{...t,routes:o,sri:e?!0:void 0}}function Si(e,t,n,r,i,a){if(bi(r,n))return async({path:o,patch:s,signal:c,fetcherKey:l})=>{vi.has(o)||await Ei([o],l?window.location.href:o,e,t,n,i,a,r.manifestPath,s,c)}}function Ci(e,t,r,i,a,o){n.useEffect(()=>{if(!bi(a,i)||window.navigator?.connection?.saveData===!0)return;function n(e){let t=e.tagName===`FORM`?e.getAttribute(`action`):e.getAttribute(`href`);if(!t)return;let n=e.tagName===`A`?e.pathname:new URL(t,window.location.origin).pathname;vi.has(n)||gi.add(n)}async function s(){document.querySelectorAll(`a[data-discover], form[data-discover]`).forEach(n);let s=Array.from(gi.keys()).filter(e=>vi.has(e)?(gi.delete(e),!1):!0);if(s.length!==0)try{await Ei(s,null,t,r,i,o,e.basename,a.manifestPath,e.patchRoutes)}catch(e){console.error(`Failed to fetch manifest patches`,e)}}let c=Oi(s,100);s();let l=new MutationObserver(()=>c());return l.observe(document.documentElement,{subtree:!0,childList:!0,attributes:!0,attributeFilter:[`data-discover`,`href`,`action`]}),()=>l.disconnect()},[i,o,t,r,e,a])}function wi(e,t){let n=e||`/__manifest`;return t==null?n:`${t}${n}`.replace(/\/+/g,`/`)}var Ti=`react-router-manifest-version`;async function Ei(e,t,n,r,i,a,o,s,c,l){let u=new URLSearchParams;u.set(`paths`,e.sort().join(`,`)),u.set(`version`,n.version);let d=new URL(wi(s,o),window.location.origin);if(d.search=u.toString(),d.toString().length>yi){gi.clear();return}let f;try{let e=await fetch(d,{signal:l});if(!e.ok)throw Error(`${e.status} ${e.statusText}`);if(e.status===204&&e.headers.has(`X-Remix-Reload-Document`)){if(!t){console.warn(`Detected a manifest version mismatch during eager route discovery. The next navigation/fetch to an undiscovered route will result in a new document navigation to sync up with the latest manifest.`);return}try{if(sessionStorage.getItem(Ti)===n.version){console.error(`Unable to discover routes due to manifest version mismatch.`);return}sessionStorage.setItem(Ti,n.version)}catch{}window.location.href=t,console.warn(`Detected manifest version mismatch, reloading...`),await new Promise(()=>{})}else if(e.status>=400)throw Error(await e.text());try{sessionStorage.removeItem(Ti)}catch{}f=await e.json()}catch(e){if(l?.aborted)return;throw e}let p=new Set(Object.keys(n.routes)),m=Object.values(f).reduce((e,t)=>(t&&!p.has(t.id)&&(e[t.id]=t),e),{});Object.assign(n.routes,m),e.forEach(e=>Di(e,vi));let h=new Set;Object.values(m).forEach(e=>{e&&(!e.parentId||!m[e.parentId])&&h.add(e.parentId)}),h.forEach(e=>c(e||null,ui(m,r,null,i,a,e)))}function Di(e,t){if(t.size>=_i){let e=t.values().next().value;t.delete(e)}t.add(e)}function Oi(e,t){let n;return(...r)=>{window.clearTimeout(n),n=window.setTimeout(()=>e(...r),t)}}function ki(){let e=n.useContext(Lt);return $(e,`You must render this element inside a <DataRouterContext.Provider> element`),e}function Ai(){let e=n.useContext(Rt);return $(e,`You must render this element inside a <DataRouterStateContext.Provider> element`),e}var ji=n.createContext(void 0);ji.displayName=`FrameworkContext`;function Mi(){let e=n.useContext(ji);return $(e,`You must render this element inside a <HydratedRouter> element`),e}function Ni(e,t){let r=n.useContext(ji),[i,a]=n.useState(!1),[o,s]=n.useState(!1),{onFocus:c,onBlur:l,onMouseEnter:u,onMouseLeave:d,onTouchStart:f}=t,p=n.useRef(null);n.useEffect(()=>{if(e===`render`&&s(!0),e===`viewport`){let e=new IntersectionObserver(e=>{e.forEach(e=>{s(e.isIntersecting)})},{threshold:.5});return p.current&&e.observe(p.current),()=>{e.disconnect()}}},[e]),n.useEffect(()=>{if(i){let e=setTimeout(()=>{s(!0)},100);return()=>{clearTimeout(e)}}},[i]);let m=()=>{a(!0)},h=()=>{a(!1),s(!1)};return r?e===`intent`?[o,p,{onFocus:Pi(c,m),onBlur:Pi(l,h),onMouseEnter:Pi(u,m),onMouseLeave:Pi(d,h),onTouchStart:Pi(f,m)}]:[o,p,{}]:[!1,p,{}]}function Pi(e,t){return n=>{e&&e(n),!n.defaultPrevented&&t(n)}}function Fi(e,t,n){if(n&&!Ui)return[e[0]];if(t){let n=e.findIndex(e=>t[e.route.id]!==void 0);return e.slice(0,n+1)}return e}var Ii=`data-react-router-critical-css`;function Li({nonce:e}){let{isSpaMode:t,manifest:r,routeModules:i,criticalCss:a}=Mi(),{errors:o,matches:s}=Ai(),c=Fi(s,o,t),l=n.useMemo(()=>Ur(c,i,r),[c,i,r]);return n.createElement(n.Fragment,null,typeof a==`string`?n.createElement(`style`,{[Ii]:``,dangerouslySetInnerHTML:{__html:a}}):null,typeof a==`object`?n.createElement(`link`,{[Ii]:``,rel:`stylesheet`,href:a.href,nonce:e}):null,l.map(({key:t,link:r})=>Jr(r)?n.createElement(Ri,{key:t,nonce:e,...r}):n.createElement(`link`,{key:t,nonce:e,...r})))}function Ri({page:e,...t}){let{router:r}=ki(),i=n.useMemo(()=>O(r.routes,e,r.basename),[r.routes,e,r.basename]);return i?n.createElement(Bi,{page:e,matches:i,...t}):null}function zi(e){let{manifest:t,routeModules:r}=Mi(),[i,a]=n.useState([]);return n.useEffect(()=>{let n=!1;return Xr(e,t,r).then(e=>{n||a(e)}),()=>{n=!0}},[e,t,r]),i}function Bi({page:e,matches:t,...r}){let i=Q(),{manifest:a,routeModules:o}=Mi(),{basename:s}=ki(),{loaderData:c,matches:l}=Ai(),u=n.useMemo(()=>Zr(e,t,l,a,i,`data`),[e,t,l,a,i]),d=n.useMemo(()=>Zr(e,t,l,a,i,`assets`),[e,t,l,a,i]),f=n.useMemo(()=>{if(e===i.pathname+i.search+i.hash)return[];let n=new Set,r=!1;if(t.forEach(e=>{let t=a.routes[e.route.id];!t||!t.hasLoader||(!u.some(t=>t.route.id===e.route.id)&&e.route.id in c&&o[e.route.id]?.shouldRevalidate||t.hasClientLoader?r=!0:n.add(e.route.id))}),n.size===0)return[];let l=Lr(e,s,`data`);return r&&n.size>0&&l.searchParams.set(`_routes`,t.filter(e=>n.has(e.route.id)).map(e=>e.route.id).join(`,`)),[l.pathname+l.search]},[s,c,i,a,u,t,e,o]),p=n.useMemo(()=>Qr(d,a),[d,a]),m=zi(d);return n.createElement(n.Fragment,null,f.map(e=>n.createElement(`link`,{key:e,rel:`prefetch`,as:`fetch`,href:e,...r})),p.map(e=>n.createElement(`link`,{key:e,rel:`modulepreload`,href:e,...r})),m.map(({key:e,link:t})=>n.createElement(`link`,{key:e,nonce:r.nonce,...t})))}function Vi(){let{isSpaMode:e,routeModules:t}=Mi(),{errors:r,matches:i,loaderData:a}=Ai(),o=Q(),s=Fi(i,r,e),c=null;r&&(c=r[s[s.length-1].route.id]);let l=[],u=null,d=[];for(let e=0;e<s.length;e++){let n=s[e],r=n.route.id,i=a[r],f=n.params,p=t[r],m=[],h={id:r,data:i,loaderData:i,meta:[],params:n.params,pathname:n.pathname,handle:n.route.handle,error:c};if(d[e]=h,p?.meta?m=typeof p.meta==`function`?p.meta({data:i,loaderData:i,params:f,location:o,matches:d,error:c}):Array.isArray(p.meta)?[...p.meta]:p.meta:u&&(m=[...u]),m||=[],!Array.isArray(m))throw Error(`The route at `+n.route.path+` returns an invalid value. All route meta functions must return an array of meta objects.
-
-To reference the meta function API, see https://remix.run/route/meta`);h.meta=m,d[e]=h,l=[...m],u=l}return n.createElement(n.Fragment,null,l.flat().map(e=>{if(!e)return null;if(`tagName`in e){let{tagName:t,...r}=e;if(!Hi(t))return console.warn(`A meta object uses an invalid tagName: ${t}. Expected either 'link' or 'meta'`),null;let i=t;return n.createElement(i,{key:JSON.stringify(r),...r})}if(`title`in e)return n.createElement(`title`,{key:`title`},String(e.title));if(`charset`in e&&(e.charSet??=e.charset,delete e.charset),`charSet`in e&&e.charSet!=null)return typeof e.charSet==`string`?n.createElement(`meta`,{key:`charSet`,charSet:e.charSet}):null;if(`script:ld+json`in e)try{let t=JSON.stringify(e[`script:ld+json`]);return n.createElement(`script`,{key:`script:ld+json:${t}`,type:`application/ld+json`,dangerouslySetInnerHTML:{__html:Tr(t)}})}catch{return null}return n.createElement(`meta`,{key:JSON.stringify(e),...e})}))}function Hi(e){return typeof e==`string`&&/^(meta|link)$/.test(e)}var Ui=!1;function Wi(){Ui=!0}function Gi(e){let{manifest:t,serverHandoffString:r,isSpaMode:i,renderMeta:a,routeDiscovery:o,ssr:s}=Mi(),{router:c,static:l,staticContext:u}=ki(),{matches:d}=Ai(),f=Bt(),p=bi(o,s);a&&(a.didRenderScripts=!0);let m=Fi(d,null,i);n.useEffect(()=>{Wi()},[]);let h=n.useMemo(()=>{if(f)return null;let i=u?`window.__reactRouterContext = ${r};window.__reactRouterContext.stream = new ReadableStream({start(controller){window.__reactRouterContext.streamController = controller;}}).pipeThrough(new TextEncoderStream());`:` `,a=l?`${t.hmr?.runtime?`import ${JSON.stringify(t.hmr.runtime)};`:``}${p?``:`import ${JSON.stringify(t.url)}`};
-${m.map((e,n)=>{let r=`route${n}`,i=t.routes[e.route.id];$(i,`Route ${e.route.id} not found in manifest`);let{clientActionModule:a,clientLoaderModule:o,clientMiddlewareModule:s,hydrateFallbackModule:c,module:l}=i,u=[...a?[{module:a,varName:`${r}_clientAction`}]:[],...o?[{module:o,varName:`${r}_clientLoader`}]:[],...s?[{module:s,varName:`${r}_clientMiddleware`}]:[],...c?[{module:c,varName:`${r}_HydrateFallback`}]:[],{module:l,varName:`${r}_main`}];if(u.length===1)return`import * as ${r} from ${JSON.stringify(l)};`;let d=u.map(e=>`import * as ${e.varName} from "${e.module}";`).join(`
-`),f=`const ${r} = {${u.map(e=>`...${e.varName}`).join(`,`)}};`;return[d,f].join(`
-`)}).join(`
-`)}
-  ${p?`window.__reactRouterManifest = ${JSON.stringify(xi(t,c),null,2)};`:``}
-  window.__reactRouterRouteModules = {${m.map((e,t)=>`${JSON.stringify(e.route.id)}:route${t}`).join(`,`)}};
-
-import(${JSON.stringify(t.entry.module)});`:` `;return n.createElement(n.Fragment,null,n.createElement(`script`,{...e,suppressHydrationWarning:!0,dangerouslySetInnerHTML:{__html:i},type:void 0}),n.createElement(`script`,{...e,suppressHydrationWarning:!0,dangerouslySetInnerHTML:{__html:a},type:`module`,async:!0}))},[]),g=Ui||f?[]:Ki(t.entry.imports.concat(Qr(m,t,{includeHydrateFallback:!0}))),_=typeof t.sri==`object`?t.sri:{};return wn(!f,`The <Scripts /> element is a no-op when using RSC and can be safely removed.`),Ui||f?null:n.createElement(n.Fragment,null,typeof t.sri==`object`?n.createElement(`script`,{"rr-importmap":``,type:`importmap`,suppressHydrationWarning:!0,dangerouslySetInnerHTML:{__html:JSON.stringify({integrity:_})}}):null,p?null:n.createElement(`link`,{rel:`modulepreload`,href:t.url,crossOrigin:e.crossOrigin,integrity:_[t.url],suppressHydrationWarning:!0}),n.createElement(`link`,{rel:`modulepreload`,href:t.entry.module,crossOrigin:e.crossOrigin,integrity:_[t.entry.module],suppressHydrationWarning:!0}),g.map(t=>n.createElement(`link`,{key:t,rel:`modulepreload`,href:t,crossOrigin:e.crossOrigin,integrity:_[t],suppressHydrationWarning:!0})),h)}function Ki(e){return[...new Set(e)]}function qi(...e){return t=>{e.forEach(e=>{typeof e==`function`?e(t):e!=null&&(e.current=t)})}}var Ji=class extends n.Component{constructor(e){super(e),this.state={error:e.error||null,location:e.location}}static getDerivedStateFromError(e){return{error:e}}static getDerivedStateFromProps(e,t){return t.location===e.location?{error:e.error||t.error,location:t.location}:{error:e.error||null,location:e.location}}render(){return this.state.error?n.createElement(Yi,{error:this.state.error,isOutsideRemixApp:!0}):this.props.children}};function Yi({error:e,isOutsideRemixApp:t}){console.error(e);let r=n.createElement(`script`,{dangerouslySetInnerHTML:{__html:`
-        console.log(
-          "💿 Hey developer 👋. You can provide a way better UX than this when your app throws errors. Check out https://reactrouter.com/how-to/error-boundary for more information."
-        );
-      `}});if(ye(e))return n.createElement(Xi,{title:`Unhandled Thrown Response!`},n.createElement(`h1`,{style:{fontSize:`24px`}},e.status,` `,e.statusText),r);let i;if(e instanceof Error)i=e;else{let t=e==null?`Unknown Error`:typeof e==`object`&&`toString`in e?e.toString():JSON.stringify(e);i=Error(t)}return n.createElement(Xi,{title:`Application Error!`,isOutsideRemixApp:t},n.createElement(`h1`,{style:{fontSize:`24px`}},`Application Error`),n.createElement(`pre`,{style:{padding:`2rem`,background:`hsla(10, 50%, 50%, 0.1)`,color:`red`,overflow:`auto`}},i.stack),r)}function Xi({title:e,renderScripts:t,isOutsideRemixApp:r,children:i}){let{routeModules:a}=Mi();return a.root?.Layout&&!r?i:n.createElement(`html`,{lang:`en`},n.createElement(`head`,null,n.createElement(`meta`,{charSet:`utf-8`}),n.createElement(`meta`,{name:`viewport`,content:`width=device-width,initial-scale=1,viewport-fit=cover`}),n.createElement(`title`,null,e)),n.createElement(`body`,null,n.createElement(`main`,{style:{fontFamily:`system-ui, sans-serif`,padding:`2rem`}},i,t?n.createElement(Gi,null):null)))}var Zi=typeof window<`u`&&window.document!==void 0&&window.document.createElement!==void 0;try{Zi&&(window.__reactRouterVersion=`7.9.3`)}catch{}function Qi({basename:e,children:t,history:r}){let[i,a]=n.useState({action:r.action,location:r.location}),o=n.useCallback(e=>{n.startTransition(()=>a(e))},[a]);return n.useLayoutEffect(()=>r.listen(o),[r,o]),n.createElement(Mn,{basename:e,children:t,location:i.location,navigationType:i.action,navigator:r})}Qi.displayName=`unstable_HistoryRouter`;var $i=/^(?:[a-z][a-z0-9+.-]*:|\/\/)/i,ea=n.forwardRef(function({onClick:e,discover:t=`render`,prefetch:r=`none`,relative:i,reloadDocument:a,replace:o,state:s,target:c,to:l,preventScrollReset:u,viewTransition:f,...p},m){let{basename:h}=n.useContext(X),g=typeof l==`string`&&$i.test(l),_,v=!1;if(typeof l==`string`&&g&&(_=l,Zi))try{let e=new URL(window.location.href),t=l.startsWith(`//`)?new URL(e.protocol+l):new URL(l),n=R(t.pathname,h);t.origin===e.origin&&n!=null?l=n+t.search+t.hash:v=!0}catch{d(!1,`<Link to="${l}"> contains an invalid URL which will probably break when clicked - please update to a valid URL path.`)}let y=Kt(l,{relative:i}),[b,x,S]=Ni(r,p),C=sa(l,{replace:o,state:s,target:c,preventScrollReset:u,relative:i,viewTransition:f});function w(t){e&&e(t),t.defaultPrevented||C(t)}let T=n.createElement(`a`,{...p,...S,href:_||y,onClick:v||a?e:w,ref:qi(m,x),target:c,"data-discover":!g&&t===`render`?`true`:void 0});return b&&!g?n.createElement(n.Fragment,null,T,n.createElement(Ri,{page:y})):T});ea.displayName=`Link`;var ta=n.forwardRef(function({"aria-current":e=`page`,caseSensitive:t=!1,className:r=``,end:i=!1,style:a,to:o,viewTransition:s,children:c,...l},u){let d=tn(o,{relative:l.relative}),f=Q(),p=n.useContext(Rt),{navigator:m,basename:h}=n.useContext(X),g=p!=null&&va(d)&&s===!0,_=m.encodeLocation?m.encodeLocation(d).pathname:d.pathname,v=f.pathname,y=p&&p.navigation&&p.navigation.location?p.navigation.location.pathname:null;t||(v=v.toLowerCase(),y=y?y.toLowerCase():null,_=_.toLowerCase()),y&&h&&(y=R(y,h)||y);let b=_!==`/`&&_.endsWith(`/`)?_.length-1:_.length,x=v===_||!i&&v.startsWith(_)&&v.charAt(b)===`/`,S=y!=null&&(y===_||!i&&y.startsWith(_)&&y.charAt(_.length)===`/`),C={isActive:x,isPending:S,isTransitioning:g},w=x?e:void 0,T;T=typeof r==`function`?r(C):[r,x?`active`:null,S?`pending`:null,g?`transitioning`:null].filter(Boolean).join(` `);let E=typeof a==`function`?a(C):a;return n.createElement(ea,{...l,"aria-current":w,className:T,ref:u,style:E,to:o,viewTransition:s},typeof c==`function`?c(C):c)});ta.displayName=`NavLink`;var na=n.forwardRef(({discover:e=`render`,fetcherKey:t,navigate:r,reloadDocument:i,replace:a,state:o,method:s=Fn,action:c,onSubmit:l,relative:u,preventScrollReset:d,viewTransition:f,...p},m)=>{let h=da(),g=fa(c,{relative:u}),_=s.toLowerCase()===`get`?`get`:`post`,v=typeof c==`string`&&$i.test(c);return n.createElement(`form`,{ref:m,method:_,action:g,onSubmit:i?l:e=>{if(l&&l(e),e.defaultPrevented)return;e.preventDefault();let n=e.nativeEvent.submitter,i=n?.getAttribute(`formmethod`)||s;h(n||e.currentTarget,{fetcherKey:t,method:i,navigate:r,replace:a,state:o,relative:u,preventScrollReset:d,viewTransition:f})},...p,"data-discover":!v&&e===`render`?`true`:void 0})});na.displayName=`Form`;function ra({getKey:e,storageKey:t,...r}){let i=n.useContext(ji),{basename:a}=n.useContext(X),o=Q(),s=gn();ga({getKey:e,storageKey:t});let c=n.useMemo(()=>{if(!i||!e)return null;let t=ha(o,s,a,e);return t===o.key?null:t},[]);if(!i||i.isSpaMode)return null;let l=((e,t)=>{if(!window.history.state||!window.history.state.key){let e=Math.random().toString(32).slice(2);window.history.replaceState({key:e},``)}try{let n=JSON.parse(sessionStorage.getItem(e)||`{}`)[t||window.history.state.key];typeof n==`number`&&window.scrollTo(0,n)}catch(t){console.error(t),sessionStorage.removeItem(e)}}).toString();return n.createElement(`script`,{...r,suppressHydrationWarning:!0,dangerouslySetInnerHTML:{__html:`(${l})(${JSON.stringify(t||pa)}, ${JSON.stringify(c)})`}})}ra.displayName=`ScrollRestoration`;function ia(e){return`${e} must be used within a data router.  See https://reactrouter.com/en/main/routers/picking-a-router.`}function aa(e){let t=n.useContext(Lt);return u(t,ia(e)),t}function oa(e){let t=n.useContext(Rt);return u(t,ia(e)),t}function sa(e,{target:t,replace:r,state:i,preventScrollReset:a,relative:o,viewTransition:s}={}){let c=Xt(),l=Q(),u=tn(e,{relative:o});return n.useCallback(n=>{if(Hn(n,t)){n.preventDefault();let t=r===void 0?h(l)===h(u):r;c(e,{replace:t,state:i,preventScrollReset:a,relative:o,viewTransition:s})}},[l,c,u,r,i,t,e,a,o,s])}function ca(e){d(typeof URLSearchParams<`u`,"You cannot use the `useSearchParams` hook in a browser that does not support the URLSearchParams API. If you need to support Internet Explorer 11, we recommend you load a polyfill such as https://github.com/ungap/url-search-params.");let t=n.useRef(Un(e)),r=n.useRef(!1),i=Q(),a=n.useMemo(()=>Wn(i.search,r.current?null:t.current),[i.search]),o=Xt(),s=n.useCallback((e,t)=>{let n=Un(typeof e==`function`?e(new URLSearchParams(a)):e);r.current=!0,o(`?`+n,t)},[o,a]);return[a,s]}var la=0,ua=()=>`__${String(++la)}__`;function da(){let{router:e}=aa(`useSubmit`),{basename:t}=n.useContext(X),r=mn();return n.useCallback(async(n,i={})=>{let{action:a,method:o,encType:s,formData:c,body:l}=Yn(n,t);if(i.navigate===!1){let t=i.fetcherKey||ua();await e.fetch(t,r,i.action||a,{preventScrollReset:i.preventScrollReset,formData:c,body:l,formMethod:i.method||o,formEncType:i.encType||s,flushSync:i.flushSync})}else await e.navigate(i.action||a,{preventScrollReset:i.preventScrollReset,formData:c,body:l,formMethod:i.method||o,formEncType:i.encType||s,replace:i.replace,state:i.state,fromRouteId:r,flushSync:i.flushSync,viewTransition:i.viewTransition})},[e,t,r])}function fa(e,{relative:t}={}){let{basename:r}=n.useContext(X),i=n.useContext(Z);u(i,`useFormAction must be used inside a RouteContext`);let[a]=i.matches.slice(-1),o={...tn(e||`.`,{relative:t})},s=Q();if(e==null){o.search=s.search;let e=new URLSearchParams(o.search),t=e.getAll(`index`);if(t.some(e=>e===``)){e.delete(`index`),t.filter(e=>e).forEach(t=>e.append(`index`,t));let n=e.toString();o.search=n?`?${n}`:``}}return(!e||e===`.`)&&a.route.index&&(o.search=o.search?o.search.replace(/^\?/,`?index&`):`?index`),r!==`/`&&(o.pathname=o.pathname===`/`?r:V([r,o.pathname])),h(o)}var pa=`react-router-scroll-positions`,ma={};function ha(e,t,n,r){let i=null;return r&&(i=r(n===`/`?e:{...e,pathname:R(e.pathname,n)||e.pathname},t)),i??=e.key,i}function ga({getKey:e,storageKey:t}={}){let{router:r}=aa(`useScrollRestoration`),{restoreScrollPosition:i,preventScrollReset:a}=oa(`useScrollRestoration`),{basename:o}=n.useContext(X),s=Q(),c=gn(),l=hn();n.useEffect(()=>(window.history.scrollRestoration=`manual`,()=>{window.history.scrollRestoration=`auto`}),[]),_a(n.useCallback(()=>{if(l.state===`idle`){let t=ha(s,c,o,e);ma[t]=window.scrollY}try{sessionStorage.setItem(t||pa,JSON.stringify(ma))}catch(e){d(!1,`Failed to save scroll positions in sessionStorage, <ScrollRestoration /> will not work properly (${e}).`)}window.history.scrollRestoration=`auto`},[l.state,e,o,s,c,t])),typeof document<`u`&&(n.useLayoutEffect(()=>{try{let e=sessionStorage.getItem(t||pa);e&&(ma=JSON.parse(e))}catch{}},[t]),n.useLayoutEffect(()=>{let t=r?.enableScrollRestoration(ma,()=>window.scrollY,e?(t,n)=>ha(t,n,o,e):void 0);return()=>t&&t()},[r,o,e]),n.useLayoutEffect(()=>{if(i!==!1){if(typeof i==`number`){window.scrollTo(0,i);return}try{if(s.hash){let e=document.getElementById(decodeURIComponent(s.hash.slice(1)));if(e){e.scrollIntoView();return}}}catch{d(!1,`"${s.hash.slice(1)}" is not a decodable element ID. The view will not scroll to it.`)}a!==!0&&window.scrollTo(0,0)}},[s,i,a]))}function _a(e,t){let{capture:r}=t||{};n.useEffect(()=>{let t=r==null?void 0:{capture:r};return window.addEventListener(`pagehide`,e,t),()=>{window.removeEventListener(`pagehide`,e,t)}},[e,r])}function va(e,{relative:t}={}){let r=n.useContext(Vt);u(r!=null,"`useViewTransitionState` must be used within `react-router-dom`'s `RouterProvider`.  Did you accidentally import `RouterProvider` from `react-router`?");let{basename:i}=aa(`useViewTransitionState`),a=tn(e,{relative:t});if(!r.isTransitioning)return!1;let o=R(r.currentLocation.pathname,i)||r.currentLocation.pathname,s=R(r.nextLocation.pathname,i)||r.nextLocation.pathname;return I(a.pathname,s)!=null||I(a.pathname,o)!=null}export{Pn as A,O as C,Xt as D,Q as E,en as O,Tn as S,Ci as T,zr as _,Vi as a,En as b,Ji as c,ra as d,l as f,Pe as g,y as h,Li as i,ca as k,On as l,si as m,ji as n,Or as o,ui as p,ea as r,jn as s,U as t,Gi as u,Si as v,hi as w,u as x,kr as y};
\ No newline at end of file
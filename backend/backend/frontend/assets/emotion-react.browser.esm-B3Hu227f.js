@@ -1 +0,0 @@
-import{a as e,r as t,t as n}from"./rolldown-runtime-D_juG1Xi.js";import{t as r}from"./react-BcXKmAwN.js";import{t as i}from"./react-is-BiweJ67z.js";var a=!1;function o(e){if(e.sheet)return e.sheet;for(var t=0;t<document.styleSheets.length;t++)if(document.styleSheets[t].ownerNode===e)return document.styleSheets[t]}function s(e){var t=document.createElement(`style`);return t.setAttribute(`data-emotion`,e.key),e.nonce!==void 0&&t.setAttribute(`nonce`,e.nonce),t.appendChild(document.createTextNode(``)),t.setAttribute(`data-s`,``),t}var c=function(){function e(e){var t=this;this._insertTag=function(e){var n=t.tags.length===0?t.insertionPoint?t.insertionPoint.nextSibling:t.prepend?t.container.firstChild:t.before:t.tags[t.tags.length-1].nextSibling;t.container.insertBefore(e,n),t.tags.push(e)},this.isSpeedy=e.speedy===void 0?!a:e.speedy,this.tags=[],this.ctr=0,this.nonce=e.nonce,this.key=e.key,this.container=e.container,this.prepend=e.prepend,this.insertionPoint=e.insertionPoint,this.before=null}var t=e.prototype;return t.hydrate=function(e){e.forEach(this._insertTag)},t.insert=function(e){this.ctr%(this.isSpeedy?65e3:1)==0&&this._insertTag(s(this));var t=this.tags[this.tags.length-1];if(this.isSpeedy){var n=o(t);try{n.insertRule(e,n.cssRules.length)}catch{}}else t.appendChild(document.createTextNode(e));this.ctr++},t.flush=function(){this.tags.forEach(function(e){return e.parentNode?.removeChild(e)}),this.tags=[],this.ctr=0},e}(),l=`-ms-`,u=`-moz-`,d=`-webkit-`,f=`comm`,p=`rule`,m=`decl`,h=`@import`,g=`@keyframes`,_=`@layer`,v=Math.abs,y=String.fromCharCode,b=Object.assign;function x(e,t){return T(e,0)^45?(((t<<2^T(e,0))<<2^T(e,1))<<2^T(e,2))<<2^T(e,3):0}function S(e){return e.trim()}function C(e,t){return(e=t.exec(e))?e[0]:e}function w(e,t,n){return e.replace(t,n)}function ee(e,t){return e.indexOf(t)}function T(e,t){return e.charCodeAt(t)|0}function E(e,t,n){return e.slice(t,n)}function D(e){return e.length}function te(e){return e.length}function O(e,t){return t.push(e),e}function ne(e,t){return e.map(t).join(``)}var k=1,A=1,re=0,j=0,M=0,N=``;function P(e,t,n,r,i,a,o){return{value:e,root:t,parent:n,type:r,props:i,children:a,line:k,column:A,length:o,return:``}}function F(e,t){return b(P(``,null,null,``,null,null,0),e,{length:-e.length},t)}function ie(){return M}function ae(){return M=j>0?T(N,--j):0,A--,M===10&&(A=1,k--),M}function I(){return M=j<re?T(N,j++):0,A++,M===10&&(A=1,k++),M}function L(){return T(N,j)}function R(){return j}function z(e,t){return E(N,e,t)}function B(e){switch(e){case 0:case 9:case 10:case 13:case 32:return 5;case 33:case 43:case 44:case 47:case 62:case 64:case 126:case 59:case 123:case 125:return 4;case 58:return 3;case 34:case 39:case 40:case 91:return 2;case 41:case 93:return 1}return 0}function oe(e){return k=A=1,re=D(N=e),j=0,[]}function se(e){return N=``,e}function V(e){return S(z(j-1,ue(e===91?e+2:e===40?e+1:e)))}function ce(e){for(;(M=L())&&M<33;)I();return B(e)>2||B(M)>3?``:` `}function le(e,t){for(;--t&&I()&&!(M<48||M>102||M>57&&M<65||M>70&&M<97););return z(e,R()+(t<6&&L()==32&&I()==32))}function ue(e){for(;I();)switch(M){case e:return j;case 34:case 39:e!==34&&e!==39&&ue(M);break;case 40:e===41&&ue(e);break;case 92:I();break}return j}function de(e,t){for(;I()&&e+M!==57&&!(e+M===84&&L()===47););return`/*`+z(t,j-1)+`*`+y(e===47?e:I())}function fe(e){for(;!B(L());)I();return z(e,j)}function pe(e){return se(H(``,null,null,null,[``],e=oe(e),0,[0],e))}function H(e,t,n,r,i,a,o,s,c){for(var l=0,u=0,d=o,f=0,p=0,m=0,h=1,g=1,_=1,v=0,b=``,x=i,S=a,C=r,E=b;g;)switch(m=v,v=I()){case 40:if(m!=108&&T(E,d-1)==58){ee(E+=w(V(v),`&`,`&\f`),`&\f`)!=-1&&(_=-1);break}case 34:case 39:case 91:E+=V(v);break;case 9:case 10:case 13:case 32:E+=ce(m);break;case 92:E+=le(R()-1,7);continue;case 47:switch(L()){case 42:case 47:O(he(de(I(),R()),t,n),c);break;default:E+=`/`}break;case 123*h:s[l++]=D(E)*_;case 125*h:case 59:case 0:switch(v){case 0:case 125:g=0;case 59+u:_==-1&&(E=w(E,/\f/g,``)),p>0&&D(E)-d&&O(p>32?ge(E+`;`,r,n,d-1):ge(w(E,` `,``)+`;`,r,n,d-2),c);break;case 59:E+=`;`;default:if(O(C=me(E,t,n,l,u,i,s,b,x=[],S=[],d),a),v===123)if(u===0)H(E,t,C,C,x,a,d,s,S);else switch(f===99&&T(E,3)===110?100:f){case 100:case 108:case 109:case 115:H(e,C,C,r&&O(me(e,C,C,0,0,i,s,b,i,x=[],d),S),i,S,d,s,r?x:S);break;default:H(E,C,C,C,[``],S,0,s,S)}}l=u=p=0,h=_=1,b=E=``,d=o;break;case 58:d=1+D(E),p=m;default:if(h<1){if(v==123)--h;else if(v==125&&h++==0&&ae()==125)continue}switch(E+=y(v),v*h){case 38:_=u>0?1:(E+=`\f`,-1);break;case 44:s[l++]=(D(E)-1)*_,_=1;break;case 64:L()===45&&(E+=V(I())),f=L(),u=d=D(b=E+=fe(R())),v++;break;case 45:m===45&&D(E)==2&&(h=0)}}return a}function me(e,t,n,r,i,a,o,s,c,l,u){for(var d=i-1,f=i===0?a:[``],m=te(f),h=0,g=0,_=0;h<r;++h)for(var y=0,b=E(e,d+1,d=v(g=o[h])),x=e;y<m;++y)(x=S(g>0?f[y]+` `+b:w(b,/&\f/g,f[y])))&&(c[_++]=x);return P(e,t,n,i===0?p:s,c,l,u)}function he(e,t,n){return P(e,t,n,f,y(ie()),E(e,2,-2),0)}function ge(e,t,n,r){return P(e,t,n,m,E(e,0,r),E(e,r+1,-1),r)}function U(e,t){for(var n=``,r=te(e),i=0;i<r;i++)n+=t(e[i],i,e,t)||``;return n}function _e(e,t,n,r){switch(e.type){case _:if(e.children.length)break;case h:case m:return e.return=e.return||e.value;case f:return``;case g:return e.return=e.value+`{`+U(e.children,r)+`}`;case p:e.value=e.props.join(`,`)}return D(n=U(e.children,r))?e.return=e.value+`{`+n+`}`:``}function ve(e){var t=te(e);return function(n,r,i,a){for(var o=``,s=0;s<t;s++)o+=e[s](n,r,i,a)||``;return o}}function ye(e){return function(t){t.root||(t=t.return)&&e(t)}}var be=function(e){var t=new WeakMap;return function(n){if(t.has(n))return t.get(n);var r=e(n);return t.set(n,r),r}};function xe(e){var t=Object.create(null);return function(n){return t[n]===void 0&&(t[n]=e(n)),t[n]}}var Se=function(e,t,n){for(var r=0,i=0;r=i,i=L(),r===38&&i===12&&(t[n]=1),!B(i);)I();return z(e,j)},Ce=function(e,t){var n=-1,r=44;do switch(B(r)){case 0:r===38&&L()===12&&(t[n]=1),e[n]+=Se(j-1,t,n);break;case 2:e[n]+=V(r);break;case 4:if(r===44){e[++n]=L()===58?`&\f`:``,t[n]=e[n].length;break}default:e[n]+=y(r)}while(r=I());return e},we=function(e,t){return se(Ce(oe(e),t))},Te=new WeakMap,Ee=function(e){if(!(e.type!==`rule`||!e.parent||e.length<1)){for(var t=e.value,n=e.parent,r=e.column===n.column&&e.line===n.line;n.type!==`rule`;)if(n=n.parent,!n)return;if(!(e.props.length===1&&t.charCodeAt(0)!==58&&!Te.get(n))&&!r){Te.set(e,!0);for(var i=[],a=we(t,i),o=n.props,s=0,c=0;s<a.length;s++)for(var l=0;l<o.length;l++,c++)e.props[c]=i[s]?a[s].replace(/&\f/g,o[l]):o[l]+` `+a[s]}}},De=function(e){if(e.type===`decl`){var t=e.value;t.charCodeAt(0)===108&&t.charCodeAt(2)===98&&(e.return=``,e.value=``)}};function Oe(e,t){switch(x(e,t)){case 5103:return d+`print-`+e+e;case 5737:case 4201:case 3177:case 3433:case 1641:case 4457:case 2921:case 5572:case 6356:case 5844:case 3191:case 6645:case 3005:case 6391:case 5879:case 5623:case 6135:case 4599:case 4855:case 4215:case 6389:case 5109:case 5365:case 5621:case 3829:return d+e+e;case 5349:case 4246:case 4810:case 6968:case 2756:return d+e+u+e+l+e+e;case 6828:case 4268:return d+e+l+e+e;case 6165:return d+e+l+`flex-`+e+e;case 5187:return d+e+w(e,/(\w+).+(:[^]+)/,d+`box-$1$2`+l+`flex-$1$2`)+e;case 5443:return d+e+l+`flex-item-`+w(e,/flex-|-self/,``)+e;case 4675:return d+e+l+`flex-line-pack`+w(e,/align-content|flex-|-self/,``)+e;case 5548:return d+e+l+w(e,`shrink`,`negative`)+e;case 5292:return d+e+l+w(e,`basis`,`preferred-size`)+e;case 6060:return d+`box-`+w(e,`-grow`,``)+d+e+l+w(e,`grow`,`positive`)+e;case 4554:return d+w(e,/([^-])(transform)/g,`$1`+d+`$2`)+e;case 6187:return w(w(w(e,/(zoom-|grab)/,d+`$1`),/(image-set)/,d+`$1`),e,``)+e;case 5495:case 3959:return w(e,/(image-set\([^]*)/,d+"$1$`$1");case 4968:return w(w(e,/(.+:)(flex-)?(.*)/,d+`box-pack:$3`+l+`flex-pack:$3`),/s.+-b[^;]+/,`justify`)+d+e+e;case 4095:case 3583:case 4068:case 2532:return w(e,/(.+)-inline(.+)/,d+`$1$2`)+e;case 8116:case 7059:case 5753:case 5535:case 5445:case 5701:case 4933:case 4677:case 5533:case 5789:case 5021:case 4765:if(D(e)-1-t>6)switch(T(e,t+1)){case 109:if(T(e,t+4)!==45)break;case 102:return w(e,/(.+:)(.+)-([^]+)/,`$1`+d+`$2-$3$1`+u+(T(e,t+3)==108?`$3`:`$2-$3`))+e;case 115:return~ee(e,`stretch`)?Oe(w(e,`stretch`,`fill-available`),t)+e:e}break;case 4949:if(T(e,t+1)!==115)break;case 6444:switch(T(e,D(e)-3-(~ee(e,`!important`)&&10))){case 107:return w(e,`:`,`:`+d)+e;case 101:return w(e,/(.+:)([^;!]+)(;|!.+)?/,`$1`+d+(T(e,14)===45?`inline-`:``)+`box$3$1`+d+`$2$3$1`+l+`$2box$3`)+e}break;case 5936:switch(T(e,t+11)){case 114:return d+e+l+w(e,/[svh]\w+-[tblr]{2}/,`tb`)+e;case 108:return d+e+l+w(e,/[svh]\w+-[tblr]{2}/,`tb-rl`)+e;case 45:return d+e+l+w(e,/[svh]\w+-[tblr]{2}/,`lr`)+e}return d+e+l+e+e}return e}var ke=[function(e,t,n,r){if(e.length>-1&&!e.return)switch(e.type){case m:e.return=Oe(e.value,e.length);break;case g:return U([F(e,{value:w(e.value,`@`,`@`+d)})],r);case p:if(e.length)return ne(e.props,function(t){switch(C(t,/(::plac\w+|:read-\w+)/)){case`:read-only`:case`:read-write`:return U([F(e,{props:[w(t,/:(read-\w+)/,`:`+u+`$1`)]})],r);case`::placeholder`:return U([F(e,{props:[w(t,/:(plac\w+)/,`:`+d+`input-$1`)]}),F(e,{props:[w(t,/:(plac\w+)/,`:`+u+`$1`)]}),F(e,{props:[w(t,/:(plac\w+)/,l+`input-$1`)]})],r)}return``})}}],Ae=function(e){var t=e.key;if(t===`css`){var n=document.querySelectorAll(`style[data-emotion]:not([data-s])`);Array.prototype.forEach.call(n,function(e){e.getAttribute(`data-emotion`).indexOf(` `)!==-1&&(document.head.appendChild(e),e.setAttribute(`data-s`,``))})}var r=e.stylisPlugins||ke,i={},a,o=[];a=e.container||document.head,Array.prototype.forEach.call(document.querySelectorAll(`style[data-emotion^="`+t+` "]`),function(e){for(var t=e.getAttribute(`data-emotion`).split(` `),n=1;n<t.length;n++)i[t[n]]=!0;o.push(e)});var s,l=[Ee,De],u,d=[_e,ye(function(e){u.insert(e)})],f=ve(l.concat(r,d)),p=function(e){return U(pe(e),f)};s=function(e,t,n,r){u=n,p(e?e+`{`+t.styles+`}`:t.styles),r&&(m.inserted[t.name]=!0)};var m={key:t,sheet:new c({key:t,container:a,nonce:e.nonce,speedy:e.speedy,prepend:e.prepend,insertionPoint:e.insertionPoint}),nonce:e.nonce,inserted:i,registered:{},insert:s};return m.sheet.hydrate(o),m};function W(){return W=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},W.apply(null,arguments)}var je=n(((exports,t)=>{var n=i(),r={childContextTypes:!0,contextType:!0,contextTypes:!0,defaultProps:!0,displayName:!0,getDefaultProps:!0,getDerivedStateFromError:!0,getDerivedStateFromProps:!0,mixins:!0,propTypes:!0,type:!0},a={name:!0,length:!0,prototype:!0,caller:!0,callee:!0,arguments:!0,arity:!0},o={$$typeof:!0,render:!0,defaultProps:!0,displayName:!0,propTypes:!0},s={$$typeof:!0,compare:!0,defaultProps:!0,displayName:!0,propTypes:!0,type:!0},c={};c[n.ForwardRef]=o,c[n.Memo]=s;function l(e){return n.isMemo(e)?s:c[e.$$typeof]||r}var u=Object.defineProperty,d=Object.getOwnPropertyNames,f=Object.getOwnPropertySymbols,p=Object.getOwnPropertyDescriptor,m=Object.getPrototypeOf,h=Object.prototype;function g(e,t,n){if(typeof t!=`string`){if(h){var r=m(t);r&&r!==h&&g(e,r,n)}var i=d(t);f&&(i=i.concat(f(t)));for(var o=l(e),s=l(t),c=0;c<i.length;++c){var _=i[c];if(!a[_]&&!(n&&n[_])&&!(s&&s[_])&&!(o&&o[_])){var v=p(t,_);try{u(e,_,v)}catch{}}}}return e}t.exports=g})),Me=e(je()),Ne=(function(e,t){return(0,Me.default)(e,t)}),Pe=!0;function Fe(e,t,n){var r=``;return n.split(` `).forEach(function(n){e[n]===void 0?n&&(r+=n+` `):t.push(e[n]+`;`)}),r}var G=function(e,t,n){var r=e.key+`-`+t.name;(n===!1||Pe===!1)&&e.registered[r]===void 0&&(e.registered[r]=t.styles)},K=function(e,t,n){G(e,t,n);var r=e.key+`-`+t.name;if(e.inserted[t.name]===void 0){var i=t;do e.insert(t===i?`.`+r:``,i,e.sheet,!0),i=i.next;while(i!==void 0)}};function Ie(e){for(var t=0,n,r=0,i=e.length;i>=4;++r,i-=4)n=e.charCodeAt(r)&255|(e.charCodeAt(++r)&255)<<8|(e.charCodeAt(++r)&255)<<16|(e.charCodeAt(++r)&255)<<24,n=(n&65535)*1540483477+((n>>>16)*59797<<16),n^=n>>>24,t=(n&65535)*1540483477+((n>>>16)*59797<<16)^(t&65535)*1540483477+((t>>>16)*59797<<16);switch(i){case 3:t^=(e.charCodeAt(r+2)&255)<<16;case 2:t^=(e.charCodeAt(r+1)&255)<<8;case 1:t^=e.charCodeAt(r)&255,t=(t&65535)*1540483477+((t>>>16)*59797<<16)}return t^=t>>>13,t=(t&65535)*1540483477+((t>>>16)*59797<<16),((t^t>>>15)>>>0).toString(36)}var Le={animationIterationCount:1,aspectRatio:1,borderImageOutset:1,borderImageSlice:1,borderImageWidth:1,boxFlex:1,boxFlexGroup:1,boxOrdinalGroup:1,columnCount:1,columns:1,flex:1,flexGrow:1,flexPositive:1,flexShrink:1,flexNegative:1,flexOrder:1,gridRow:1,gridRowEnd:1,gridRowSpan:1,gridRowStart:1,gridColumn:1,gridColumnEnd:1,gridColumnSpan:1,gridColumnStart:1,msGridRow:1,msGridRowSpan:1,msGridColumn:1,msGridColumnSpan:1,fontWeight:1,lineHeight:1,opacity:1,order:1,orphans:1,scale:1,tabSize:1,widows:1,zIndex:1,zoom:1,WebkitLineClamp:1,fillOpacity:1,floodOpacity:1,stopOpacity:1,strokeDasharray:1,strokeDashoffset:1,strokeMiterlimit:1,strokeOpacity:1,strokeWidth:1},Re=!1,ze=/[A-Z]|^ms/g,Be=/_EMO_([^_]+?)_([^]*?)_EMO_/g,Ve=function(e){return e.charCodeAt(1)===45},He=function(e){return e!=null&&typeof e!=`boolean`},Ue=xe(function(e){return Ve(e)?e:e.replace(ze,`-$&`).toLowerCase()}),We=function(e,t){switch(e){case`animation`:case`animationName`:if(typeof t==`string`)return t.replace(Be,function(e,t,n){return J={name:t,styles:n,next:J},t})}return Le[e]!==1&&!Ve(e)&&typeof t==`number`&&t!==0?t+`px`:t},Ge=`Component selectors can only be used in conjunction with @emotion/babel-plugin, the swc Emotion plugin, or another Emotion-aware compiler transform.`;function q(e,t,n){if(n==null)return``;var r=n;if(r.__emotion_styles!==void 0)return r;switch(typeof n){case`boolean`:return``;case`object`:var i=n;if(i.anim===1)return J={name:i.name,styles:i.styles,next:J},i.name;var a=n;if(a.styles!==void 0){var o=a.next;if(o!==void 0)for(;o!==void 0;)J={name:o.name,styles:o.styles,next:J},o=o.next;return a.styles+`;`}return Ke(e,t,n);case`function`:if(e!==void 0){var s=J,c=n(e);return J=s,q(e,t,c)}break}var l=n;if(t==null)return l;var u=t[l];return u===void 0?l:u}function Ke(e,t,n){var r=``;if(Array.isArray(n))for(var i=0;i<n.length;i++)r+=q(e,t,n[i])+`;`;else for(var a in n){var o=n[a];if(typeof o!=`object`){var s=o;t!=null&&t[s]!==void 0?r+=a+`{`+t[s]+`}`:He(s)&&(r+=Ue(a)+`:`+We(a,s)+`;`)}else{if(a===`NO_COMPONENT_SELECTOR`&&Re)throw Error(Ge);if(Array.isArray(o)&&typeof o[0]==`string`&&(t==null||t[o[0]]===void 0))for(var c=0;c<o.length;c++)He(o[c])&&(r+=Ue(a)+`:`+We(a,o[c])+`;`);else{var l=q(e,t,o);switch(a){case`animation`:case`animationName`:r+=Ue(a)+`:`+l+`;`;break;default:r+=a+`{`+l+`}`}}}}return r}var qe=/label:\s*([^\s;{]+)\s*(;|$)/g,J;function Y(e,t,n){if(e.length===1&&typeof e[0]==`object`&&e[0]!==null&&e[0].styles!==void 0)return e[0];var r=!0,i=``;J=void 0;var a=e[0];a==null||a.raw===void 0?(r=!1,i+=q(n,t,a)):i+=a[0];for(var o=1;o<e.length;o++)i+=q(n,t,e[o]),r&&(i+=a[o]);qe.lastIndex=0;for(var s=``,c;(c=qe.exec(i))!==null;)s+=`-`+c[1];return{name:Ie(i)+s,styles:i,next:J}}var X=e(r()),Je=function(e){return e()},Ye=X.useInsertionEffect?X.useInsertionEffect:!1,Xe=Ye||Je,Ze=Ye||X.useLayoutEffect,Qe=X.createContext(typeof HTMLElement<`u`?Ae({key:`css`}):null),$e=Qe.Provider,et=function(){return(0,X.useContext)(Qe)},Z=function(e){return(0,X.forwardRef)(function(t,n){var r=(0,X.useContext)(Qe);return e(t,r,n)})},Q=X.createContext({}),tt=function(){return X.useContext(Q)},nt=function(e,t){return typeof t==`function`?t(e):W({},e,t)},rt=be(function(e){return be(function(t){return nt(e,t)})}),it=function(e){var t=X.useContext(Q);return e.theme!==t&&(t=rt(t)(e.theme)),X.createElement(Q.Provider,{value:t},e.children)};function at(e){var t=e.displayName||e.name||`Component`,n=X.forwardRef(function(t,n){var r=X.useContext(Q);return X.createElement(e,W({theme:r,ref:n},t))});return n.displayName=`WithTheme(`+t+`)`,Ne(n,e)}var ot={}.hasOwnProperty,st=`__EMOTION_TYPE_PLEASE_DO_NOT_USE__`,ct=function(e,t){var n={};for(var r in t)ot.call(t,r)&&(n[r]=t[r]);return n[st]=e,n},lt=function(e){var t=e.cache,n=e.serialized,r=e.isStringTag;return G(t,n,r),Xe(function(){return K(t,n,r)}),null},ut=Z(function(e,t,n){var r=e.css;typeof r==`string`&&t.registered[r]!==void 0&&(r=t.registered[r]);var i=e[st],a=[r],o=``;typeof e.className==`string`?o=Fe(t.registered,a,e.className):e.className!=null&&(o=e.className+` `);var s=Y(a,void 0,X.useContext(Q));o+=t.key+`-`+s.name;var c={};for(var l in e)ot.call(e,l)&&l!==`css`&&l!==st&&(c[l]=e[l]);return c.className=o,n&&(c.ref=n),X.createElement(X.Fragment,null,X.createElement(lt,{cache:t,serialized:s,isStringTag:typeof i==`string`}),X.createElement(i,c))}),dt=t({CacheProvider:()=>$e,ClassNames:()=>vt,Global:()=>ft,ThemeContext:()=>Q,ThemeProvider:()=>it,__unsafe_useEmotionCache:()=>et,createElement:()=>$,css:()=>pt,jsx:()=>$,keyframes:()=>mt,useTheme:()=>tt,withEmotionCache:()=>Z,withTheme:()=>at});je();var $=function(e,t){var n=arguments;if(t==null||!ot.call(t,`css`))return X.createElement.apply(void 0,n);var r=n.length,i=Array(r);i[0]=ut,i[1]=ct(e,t);for(var a=2;a<r;a++)i[a]=n[a];return X.createElement.apply(null,i)};(function(e){var t;(function(e){})(t||=e.JSX||={})})($||={});var ft=Z(function(e,t){var n=e.styles,r=Y([n],void 0,X.useContext(Q)),i=X.useRef();return Ze(function(){var e=t.key+`-global`,n=new t.sheet.constructor({key:e,nonce:t.sheet.nonce,container:t.sheet.container,speedy:t.sheet.isSpeedy}),a=!1,o=document.querySelector(`style[data-emotion="`+e+` `+r.name+`"]`);return t.sheet.tags.length&&(n.before=t.sheet.tags[0]),o!==null&&(a=!0,o.setAttribute(`data-emotion`,e),n.hydrate([o])),i.current=[n,a],function(){n.flush()}},[t]),Ze(function(){var e=i.current,n=e[0];if(e[1]){e[1]=!1;return}r.next!==void 0&&K(t,r.next,!0),n.tags.length&&(n.before=n.tags[n.tags.length-1].nextElementSibling,n.flush()),t.insert(``,r,n,!1)},[t,r.name]),null});function pt(){return Y([...arguments])}function mt(){var e=pt.apply(void 0,arguments),t=`animation-`+e.name;return{name:t,styles:`@keyframes `+t+`{`+e.styles+`}`,anim:1,toString:function(){return`_EMO_`+this.name+`_`+this.styles+`_EMO_`}}}var ht=function e(t){for(var n=t.length,r=0,i=``;r<n;r++){var a=t[r];if(a!=null){var o=void 0;switch(typeof a){case`boolean`:break;case`object`:if(Array.isArray(a))o=e(a);else for(var s in o=``,a)a[s]&&s&&(o&&(o+=` `),o+=s);break;default:o=a}o&&(i&&(i+=` `),i+=o)}}return i};function gt(e,t,n){var r=[],i=Fe(e,r,n);return r.length<2?n:i+t(r)}var _t=function(e){var t=e.cache,n=e.serializedArr;return Xe(function(){for(var e=0;e<n.length;e++)K(t,n[e],!1)}),null},vt=Z(function(e,t){var n=[],r=function(){var e=[...arguments],r=Y(e,t.registered);return n.push(r),G(t,r,!1),t.key+`-`+r.name},i={css:r,cx:function(){var e=[...arguments];return gt(t.registered,r,ht(e))},theme:X.useContext(Q)},a=e.children(i);return X.createElement(X.Fragment,null,X.createElement(_t,{cache:t,serializedArr:n}),a)});export{$ as n,mt as r,dt as t};
\ No newline at end of file
@@ -1,40 +0,0 @@
-import{a as e,r as t,t as n}from"./rolldown-runtime-D_juG1Xi.js";import{t as r}from"./react-BcXKmAwN.js";import{t as i}from"./react-dom-Dr_efIFp.js";import{t as a}from"./react-is-BiweJ67z.js";import{t as o}from"./shim-DLiwten_.js";function s(e){var t,n,r=``;if(typeof e==`string`||typeof e==`number`)r+=e;else if(typeof e==`object`)if(Array.isArray(e)){var i=e.length;for(t=0;t<i;t++)e[t]&&(n=s(e[t]))&&(r&&(r+=` `),r+=n)}else for(n in e)e[n]&&(r&&(r+=` `),r+=n);return r}function c(){for(var e,t,n=0,r=``,i=arguments.length;n<i;n++)(e=arguments[n])&&(t=s(e))&&(r&&(r+=` `),r+=t);return r}var l=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});function t(e){return e===`__proto__`}exports.isUnsafeProperty=t})),u=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});function t(e){switch(typeof e){case`number`:case`symbol`:return!1;case`string`:return e.includes(`.`)||e.includes(`[`)||e.includes(`]`)}}exports.isDeepKey=t})),d=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});function t(e){return typeof e==`string`||typeof e==`symbol`?e:Object.is(e?.valueOf?.(),-0)?`-0`:String(e)}exports.toKey=t})),f=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});function t(e){if(e==null)return``;if(typeof e==`string`)return e;if(Array.isArray(e))return e.map(t).join(`,`);let n=String(e);return n===`0`&&Object.is(Number(e),-0)?`-0`:n}exports.toString=t})),p=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=f(),n=d();function r(e){if(Array.isArray(e))return e.map(n.toKey);if(typeof e==`symbol`)return[e];e=t.toString(e);let r=[],i=e.length;if(i===0)return r;let a=0,o=``,s=``,c=!1;for(e.charCodeAt(0)===46&&(r.push(``),a++);a<i;){let t=e[a];s?t===`\\`&&a+1<i?(a++,o+=e[a]):t===s?s=``:o+=t:c?t===`"`||t===`'`?s=t:t===`]`?(c=!1,r.push(o),o=``):o+=t:t===`[`?(c=!0,o&&=(r.push(o),``)):t===`.`?o&&=(r.push(o),``):o+=t,a++}return o&&r.push(o),r}exports.toPath=r})),m=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=l(),n=u(),r=d(),i=p();function a(e,s,c){if(e==null)return c;switch(typeof s){case`string`:{if(t.isUnsafeProperty(s))return c;let r=e[s];return r===void 0?n.isDeepKey(s)?a(e,i.toPath(s),c):c:r}case`number`:case`symbol`:{typeof s==`number`&&(s=r.toKey(s));let t=e[s];return t===void 0?c:t}default:{if(Array.isArray(s))return o(e,s,c);if(s=Object.is(s?.valueOf(),-0)?`-0`:String(s),t.isUnsafeProperty(s))return c;let n=e[s];return n===void 0?c:n}}}function o(e,n,r){if(n.length===0)return r;let i=e;for(let e=0;e<n.length;e++){if(i==null||t.isUnsafeProperty(n[e]))return r;i=i[n[e]]}return i===void 0?r:i}exports.get=a})),h=n(((exports,t)=>{t.exports=m().get})),g=e(h()),_=e=>e===0?0:e>0?1:-1,v=e=>typeof e==`number`&&e!=+e,y=e=>typeof e==`string`&&e.indexOf(`%`)===e.length-1,b=e=>(typeof e==`number`||e instanceof Number)&&!v(e),x=e=>b(e)||typeof e==`string`,S=0,C=e=>{var t=++S;return`${e||``}${t}`},w=function(e,t){var n=arguments.length>2&&arguments[2]!==void 0?arguments[2]:0,r=arguments.length>3&&arguments[3]!==void 0?arguments[3]:!1;if(!b(e)&&typeof e!=`string`)return n;var i;if(y(e)){if(t==null)return n;var a=e.indexOf(`%`);i=t*parseFloat(e.slice(0,a))/100}else i=+e;return v(i)&&(i=n),r&&t!=null&&i>t&&(i=t),i},T=e=>{if(!Array.isArray(e))return!1;for(var t=e.length,n={},r=0;r<t;r++)if(!n[e[r]])n[e[r]]=!0;else return!0;return!1},E=(e,t)=>b(e)&&b(t)?n=>e+n*(t-e):()=>t;function D(e,t,n){return b(e)&&b(t)?e+n*(t-e):t}function O(e,t,n){if(!(!e||!e.length))return e.find(e=>e&&(typeof t==`function`?t(e):(0,g.default)(e,t))===n)}var ee=e=>{if(!e||!e.length)return null;for(var t=e.length,n=0,r=0,i=0,a=0,o=1/0,s=-1/0,c=0,l=0,u=0;u<t;u++)c=e[u].cx||0,l=e[u].cy||0,n+=c,r+=l,i+=c*l,a+=c*c,o=Math.min(o,c),s=Math.max(s,c);var d=t*a===n*n?0:(t*i-n*r)/(t*a-n*n);return{xmin:o,xmax:s,a:d,b:(r-d*n)/t}},k=e=>e==null,te=e=>k(e)?e:`${e.charAt(0).toUpperCase()}${e.slice(1)}`,ne=`dangerouslySetInnerHTML.onCopy.onCopyCapture.onCut.onCutCapture.onPaste.onPasteCapture.onCompositionEnd.onCompositionEndCapture.onCompositionStart.onCompositionStartCapture.onCompositionUpdate.onCompositionUpdateCapture.onFocus.onFocusCapture.onBlur.onBlurCapture.onChange.onChangeCapture.onBeforeInput.onBeforeInputCapture.onInput.onInputCapture.onReset.onResetCapture.onSubmit.onSubmitCapture.onInvalid.onInvalidCapture.onLoad.onLoadCapture.onError.onErrorCapture.onKeyDown.onKeyDownCapture.onKeyPress.onKeyPressCapture.onKeyUp.onKeyUpCapture.onAbort.onAbortCapture.onCanPlay.onCanPlayCapture.onCanPlayThrough.onCanPlayThroughCapture.onDurationChange.onDurationChangeCapture.onEmptied.onEmptiedCapture.onEncrypted.onEncryptedCapture.onEnded.onEndedCapture.onLoadedData.onLoadedDataCapture.onLoadedMetadata.onLoadedMetadataCapture.onLoadStart.onLoadStartCapture.onPause.onPauseCapture.onPlay.onPlayCapture.onPlaying.onPlayingCapture.onProgress.onProgressCapture.onRateChange.onRateChangeCapture.onSeeked.onSeekedCapture.onSeeking.onSeekingCapture.onStalled.onStalledCapture.onSuspend.onSuspendCapture.onTimeUpdate.onTimeUpdateCapture.onVolumeChange.onVolumeChangeCapture.onWaiting.onWaitingCapture.onAuxClick.onAuxClickCapture.onClick.onClickCapture.onContextMenu.onContextMenuCapture.onDoubleClick.onDoubleClickCapture.onDrag.onDragCapture.onDragEnd.onDragEndCapture.onDragEnter.onDragEnterCapture.onDragExit.onDragExitCapture.onDragLeave.onDragLeaveCapture.onDragOver.onDragOverCapture.onDragStart.onDragStartCapture.onDrop.onDropCapture.onMouseDown.onMouseDownCapture.onMouseEnter.onMouseLeave.onMouseMove.onMouseMoveCapture.onMouseOut.onMouseOutCapture.onMouseOver.onMouseOverCapture.onMouseUp.onMouseUpCapture.onSelect.onSelectCapture.onTouchCancel.onTouchCancelCapture.onTouchEnd.onTouchEndCapture.onTouchMove.onTouchMoveCapture.onTouchStart.onTouchStartCapture.onPointerDown.onPointerDownCapture.onPointerMove.onPointerMoveCapture.onPointerUp.onPointerUpCapture.onPointerCancel.onPointerCancelCapture.onPointerEnter.onPointerEnterCapture.onPointerLeave.onPointerLeaveCapture.onPointerOver.onPointerOverCapture.onPointerOut.onPointerOutCapture.onGotPointerCapture.onGotPointerCaptureCapture.onLostPointerCapture.onLostPointerCaptureCapture.onScroll.onScrollCapture.onWheel.onWheelCapture.onAnimationStart.onAnimationStartCapture.onAnimationEnd.onAnimationEndCapture.onAnimationIteration.onAnimationIterationCapture.onTransitionEnd.onTransitionEndCapture`.split(`.`);function re(e){return typeof e==`string`?ne.includes(e):!1}var A=e(r()),ie=[`viewBox`,`children`],ae=[`points`,`pathLength`],oe={svg:ie,polygon:ae,polyline:ae},se=(e,t)=>{if(!e||typeof e==`function`||typeof e==`boolean`)return null;var n=e;if((0,A.isValidElement)(e)&&(n=e.props),typeof n!=`object`&&typeof n!=`function`)return null;var r={};return Object.keys(n).forEach(e=>{re(e)&&(r[e]=t||(t=>n[e](n,t)))}),r},ce=(e,t,n)=>r=>(e(t,n,r),null),le=(e,t,n)=>{if(e===null||typeof e!=`object`&&typeof e!=`function`)return null;var r=null;return Object.keys(e).forEach(i=>{var a=e[i];re(i)&&typeof a==`function`&&(r||={},r[i]=ce(a,t,n))}),r},ue=`aria-activedescendant.aria-atomic.aria-autocomplete.aria-busy.aria-checked.aria-colcount.aria-colindex.aria-colspan.aria-controls.aria-current.aria-describedby.aria-details.aria-disabled.aria-errormessage.aria-expanded.aria-flowto.aria-haspopup.aria-hidden.aria-invalid.aria-keyshortcuts.aria-label.aria-labelledby.aria-level.aria-live.aria-modal.aria-multiline.aria-multiselectable.aria-orientation.aria-owns.aria-placeholder.aria-posinset.aria-pressed.aria-readonly.aria-relevant.aria-required.aria-roledescription.aria-rowcount.aria-rowindex.aria-rowspan.aria-selected.aria-setsize.aria-sort.aria-valuemax.aria-valuemin.aria-valuenow.aria-valuetext.className.color.height.id.lang.max.media.method.min.name.style.target.width.role.tabIndex.accentHeight.accumulate.additive.alignmentBaseline.allowReorder.alphabetic.amplitude.arabicForm.ascent.attributeName.attributeType.autoReverse.azimuth.baseFrequency.baselineShift.baseProfile.bbox.begin.bias.by.calcMode.capHeight.clip.clipPath.clipPathUnits.clipRule.colorInterpolation.colorInterpolationFilters.colorProfile.colorRendering.contentScriptType.contentStyleType.cursor.cx.cy.d.decelerate.descent.diffuseConstant.direction.display.divisor.dominantBaseline.dur.dx.dy.edgeMode.elevation.enableBackground.end.exponent.externalResourcesRequired.fill.fillOpacity.fillRule.filter.filterRes.filterUnits.floodColor.floodOpacity.focusable.fontFamily.fontSize.fontSizeAdjust.fontStretch.fontStyle.fontVariant.fontWeight.format.from.fx.fy.g1.g2.glyphName.glyphOrientationHorizontal.glyphOrientationVertical.glyphRef.gradientTransform.gradientUnits.hanging.horizAdvX.horizOriginX.href.ideographic.imageRendering.in2.in.intercept.k1.k2.k3.k4.k.kernelMatrix.kernelUnitLength.kerning.keyPoints.keySplines.keyTimes.lengthAdjust.letterSpacing.lightingColor.limitingConeAngle.local.markerEnd.markerHeight.markerMid.markerStart.markerUnits.markerWidth.mask.maskContentUnits.maskUnits.mathematical.mode.numOctaves.offset.opacity.operator.order.orient.orientation.origin.overflow.overlinePosition.overlineThickness.paintOrder.panose1.pathLength.patternContentUnits.patternTransform.patternUnits.pointerEvents.pointsAtX.pointsAtY.pointsAtZ.preserveAlpha.preserveAspectRatio.primitiveUnits.r.radius.refX.refY.renderingIntent.repeatCount.repeatDur.requiredExtensions.requiredFeatures.restart.result.rotate.rx.ry.seed.shapeRendering.slope.spacing.specularConstant.specularExponent.speed.spreadMethod.startOffset.stdDeviation.stemh.stemv.stitchTiles.stopColor.stopOpacity.strikethroughPosition.strikethroughThickness.string.stroke.strokeDasharray.strokeDashoffset.strokeLinecap.strokeLinejoin.strokeMiterlimit.strokeOpacity.strokeWidth.surfaceScale.systemLanguage.tableValues.targetX.targetY.textAnchor.textDecoration.textLength.textRendering.to.transform.u1.u2.underlinePosition.underlineThickness.unicode.unicodeBidi.unicodeRange.unitsPerEm.vAlphabetic.values.vectorEffect.version.vertAdvY.vertOriginX.vertOriginY.vHanging.vIdeographic.viewTarget.visibility.vMathematical.widths.wordSpacing.writingMode.x1.x2.x.xChannelSelector.xHeight.xlinkActuate.xlinkArcrole.xlinkHref.xlinkRole.xlinkShow.xlinkTitle.xlinkType.xmlBase.xmlLang.xmlns.xmlnsXlink.xmlSpace.y1.y2.y.yChannelSelector.z.zoomAndPan.ref.key.angle`.split(`.`);function de(e){return typeof e==`string`?ue.includes(e):!1}function j(e){var t=Object.entries(e).filter(e=>{var[t]=e;return de(t)});return Object.fromEntries(t)}var fe=e(h()),pe=e(a()),me=e=>typeof e==`string`?e:e?e.displayName||e.name||`Component`:``,he=null,ge=null,_e=e=>{if(e===he&&Array.isArray(ge))return ge;var t=[];return A.Children.forEach(e,e=>{k(e)||((0,pe.isFragment)(e)?t=t.concat(_e(e.props.children)):t.push(e))}),ge=t,he=e,t};function ve(e,t){var n=[],r=[];return r=Array.isArray(t)?t.map(e=>me(e)):[me(t)],_e(e).forEach(e=>{var t=(0,fe.default)(e,`type.displayName`)||(0,fe.default)(e,`type.name`);r.indexOf(t)!==-1&&n.push(e)}),n}var ye=e=>e&&typeof e==`object`&&`clipDot`in e?!!e.clipDot:!0,be=(e,t,n,r)=>{if(typeof t==`symbol`||typeof t==`number`)return!0;var i=(r&&oe?.[r])??[],a=t.startsWith(`data-`),o=typeof e!=`function`&&(!!r&&i.includes(t)||de(t)),s=!!n&&re(t);return a||o||s},M=(e,t,n)=>{if(!e||typeof e==`function`||typeof e==`boolean`)return null;var r=e;if((0,A.isValidElement)(e)&&(r=e.props),typeof r!=`object`&&typeof r!=`function`)return null;var i={};return Object.keys(r).forEach(e=>{be(r?.[e],e,t,n)&&(i[e]=r[e])}),i},xe=[`children`,`width`,`height`,`viewBox`,`className`,`style`,`title`,`desc`];function Se(){return Se=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Se.apply(null,arguments)}function Ce(e,t){if(e==null)return{};var n,r,i=we(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function we(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}var Te=(0,A.forwardRef)((e,t)=>{var{children:n,width:r,height:i,viewBox:a,className:o,style:s,title:l,desc:u}=e,d=Ce(e,xe),f=a||{width:r,height:i,x:0,y:0},p=c(`recharts-surface`,o);return A.createElement(`svg`,Se({},M(d,!0,`svg`),{className:p,width:r,height:i,style:s,viewBox:`${f.x} ${f.y} ${f.width} ${f.height}`,ref:t}),A.createElement(`title`,null,l),A.createElement(`desc`,null,u),n)}),Ee=[`children`,`className`];function De(){return De=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},De.apply(null,arguments)}function Oe(e,t){if(e==null)return{};var n,r,i=ke(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function ke(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}var N=A.forwardRef((e,t)=>{var{children:n,className:r}=e,i=Oe(e,Ee),a=c(`recharts-layer`,r);return A.createElement(`g`,De({className:a},M(i,!0),{ref:t}),n)}),Ae=(0,A.createContext)(null),je=()=>(0,A.useContext)(Ae);function P(e){return function(){return e}}const Me=Math.cos,Ne=Math.sin,Pe=Math.sqrt,Fe=Math.PI;Fe/2;const Ie=2*Fe;var Le=Math.PI,Re=2*Le,ze=1e-6,Be=Re-ze;function Ve(e){this._+=e[0];for(let t=1,n=e.length;t<n;++t)this._+=arguments[t]+e[t]}function He(e){let t=Math.floor(e);if(!(t>=0))throw Error(`invalid digits: ${e}`);if(t>15)return Ve;let n=10**t;return function(e){this._+=e[0];for(let t=1,r=e.length;t<r;++t)this._+=Math.round(arguments[t]*n)/n+e[t]}}var Ue=class{constructor(e){this._x0=this._y0=this._x1=this._y1=null,this._=``,this._append=e==null?Ve:He(e)}moveTo(e,t){this._append`M${this._x0=this._x1=+e},${this._y0=this._y1=+t}`}closePath(){this._x1!==null&&(this._x1=this._x0,this._y1=this._y0,this._append`Z`)}lineTo(e,t){this._append`L${this._x1=+e},${this._y1=+t}`}quadraticCurveTo(e,t,n,r){this._append`Q${+e},${+t},${this._x1=+n},${this._y1=+r}`}bezierCurveTo(e,t,n,r,i,a){this._append`C${+e},${+t},${+n},${+r},${this._x1=+i},${this._y1=+a}`}arcTo(e,t,n,r,i){if(e=+e,t=+t,n=+n,r=+r,i=+i,i<0)throw Error(`negative radius: ${i}`);let a=this._x1,o=this._y1,s=n-e,c=r-t,l=a-e,u=o-t,d=l*l+u*u;if(this._x1===null)this._append`M${this._x1=e},${this._y1=t}`;else if(d>ze)if(!(Math.abs(u*s-c*l)>ze)||!i)this._append`L${this._x1=e},${this._y1=t}`;else{let f=n-a,p=r-o,m=s*s+c*c,h=f*f+p*p,g=Math.sqrt(m),_=Math.sqrt(d),v=i*Math.tan((Le-Math.acos((m+d-h)/(2*g*_)))/2),y=v/_,b=v/g;Math.abs(y-1)>ze&&this._append`L${e+y*l},${t+y*u}`,this._append`A${i},${i},0,0,${+(u*f>l*p)},${this._x1=e+b*s},${this._y1=t+b*c}`}}arc(e,t,n,r,i,a){if(e=+e,t=+t,n=+n,a=!!a,n<0)throw Error(`negative radius: ${n}`);let o=n*Math.cos(r),s=n*Math.sin(r),c=e+o,l=t+s,u=1^a,d=a?r-i:i-r;this._x1===null?this._append`M${c},${l}`:(Math.abs(this._x1-c)>ze||Math.abs(this._y1-l)>ze)&&this._append`L${c},${l}`,n&&(d<0&&(d=d%Re+Re),d>Be?this._append`A${n},${n},0,1,${u},${e-o},${t-s}A${n},${n},0,1,${u},${this._x1=c},${this._y1=l}`:d>ze&&this._append`A${n},${n},0,${+(d>=Le)},${u},${this._x1=e+n*Math.cos(i)},${this._y1=t+n*Math.sin(i)}`)}rect(e,t,n,r){this._append`M${this._x0=this._x1=+e},${this._y0=this._y1=+t}h${n=+n}v${+r}h${-n}Z`}toString(){return this._}};function We(){return new Ue}We.prototype=Ue.prototype;function Ge(e){let t=3;return e.digits=function(n){if(!arguments.length)return t;if(n==null)t=null;else{let e=Math.floor(n);if(!(e>=0))throw RangeError(`invalid digits: ${n}`);t=e}return e},()=>new Ue(t)}Array.prototype.slice;function Ke(e){return typeof e==`object`&&`length`in e?e:Array.from(e)}function qe(e){this._context=e}qe.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._point=0},lineEnd:function(){(this._line||this._line!==0&&this._point===1)&&this._context.closePath(),this._line=1-this._line},point:function(e,t){switch(e=+e,t=+t,this._point){case 0:this._point=1,this._line?this._context.lineTo(e,t):this._context.moveTo(e,t);break;case 1:this._point=2;default:this._context.lineTo(e,t);break}}};function Je(e){return new qe(e)}function Ye(e){return e[0]}function Xe(e){return e[1]}function Ze(e,t){var n=P(!0),r=null,i=Je,a=null,o=Ge(s);e=typeof e==`function`?e:e===void 0?Ye:P(e),t=typeof t==`function`?t:t===void 0?Xe:P(t);function s(s){var c,l=(s=Ke(s)).length,u,d=!1,f;for(r??(a=i(f=o())),c=0;c<=l;++c)!(c<l&&n(u=s[c],c,s))===d&&((d=!d)?a.lineStart():a.lineEnd()),d&&a.point(+e(u,c,s),+t(u,c,s));if(f)return a=null,f+``||null}return s.x=function(t){return arguments.length?(e=typeof t==`function`?t:P(+t),s):e},s.y=function(e){return arguments.length?(t=typeof e==`function`?e:P(+e),s):t},s.defined=function(e){return arguments.length?(n=typeof e==`function`?e:P(!!e),s):n},s.curve=function(e){return arguments.length?(i=e,r!=null&&(a=i(r)),s):i},s.context=function(e){return arguments.length?(e==null?r=a=null:a=i(r=e),s):r},s}function Qe(e,t,n){var r=null,i=P(!0),a=null,o=Je,s=null,c=Ge(l);e=typeof e==`function`?e:e===void 0?Ye:P(+e),t=typeof t==`function`?t:P(t===void 0?0:+t),n=typeof n==`function`?n:n===void 0?Xe:P(+n);function l(l){var u,d,f,p=(l=Ke(l)).length,m,h=!1,g,_=Array(p),v=Array(p);for(a??(s=o(g=c())),u=0;u<=p;++u){if(!(u<p&&i(m=l[u],u,l))===h)if(h=!h)d=u,s.areaStart(),s.lineStart();else{for(s.lineEnd(),s.lineStart(),f=u-1;f>=d;--f)s.point(_[f],v[f]);s.lineEnd(),s.areaEnd()}h&&(_[u]=+e(m,u,l),v[u]=+t(m,u,l),s.point(r?+r(m,u,l):_[u],n?+n(m,u,l):v[u]))}if(g)return s=null,g+``||null}function u(){return Ze().defined(i).curve(o).context(a)}return l.x=function(t){return arguments.length?(e=typeof t==`function`?t:P(+t),r=null,l):e},l.x0=function(t){return arguments.length?(e=typeof t==`function`?t:P(+t),l):e},l.x1=function(e){return arguments.length?(r=e==null?null:typeof e==`function`?e:P(+e),l):r},l.y=function(e){return arguments.length?(t=typeof e==`function`?e:P(+e),n=null,l):t},l.y0=function(e){return arguments.length?(t=typeof e==`function`?e:P(+e),l):t},l.y1=function(e){return arguments.length?(n=e==null?null:typeof e==`function`?e:P(+e),l):n},l.lineX0=l.lineY0=function(){return u().x(e).y(t)},l.lineY1=function(){return u().x(e).y(n)},l.lineX1=function(){return u().x(r).y(t)},l.defined=function(e){return arguments.length?(i=typeof e==`function`?e:P(!!e),l):i},l.curve=function(e){return arguments.length?(o=e,a!=null&&(s=o(a)),l):o},l.context=function(e){return arguments.length?(e==null?a=s=null:s=o(a=e),l):a},l}var $e=class{constructor(e,t){this._context=e,this._x=t}areaStart(){this._line=0}areaEnd(){this._line=NaN}lineStart(){this._point=0}lineEnd(){(this._line||this._line!==0&&this._point===1)&&this._context.closePath(),this._line=1-this._line}point(e,t){switch(e=+e,t=+t,this._point){case 0:this._point=1,this._line?this._context.lineTo(e,t):this._context.moveTo(e,t);break;case 1:this._point=2;default:this._x?this._context.bezierCurveTo(this._x0=(this._x0+e)/2,this._y0,this._x0,t,e,t):this._context.bezierCurveTo(this._x0,this._y0=(this._y0+t)/2,e,this._y0,e,t);break}this._x0=e,this._y0=t}};function et(e){return new $e(e,!0)}function tt(e){return new $e(e,!1)}var nt={draw(e,t){let n=Pe(t/Fe);e.moveTo(n,0),e.arc(0,0,n,0,Ie)}},rt={draw(e,t){let n=Pe(t/5)/2;e.moveTo(-3*n,-n),e.lineTo(-n,-n),e.lineTo(-n,-3*n),e.lineTo(n,-3*n),e.lineTo(n,-n),e.lineTo(3*n,-n),e.lineTo(3*n,n),e.lineTo(n,n),e.lineTo(n,3*n),e.lineTo(-n,3*n),e.lineTo(-n,n),e.lineTo(-3*n,n),e.closePath()}},it=Pe(1/3),at=it*2,ot={draw(e,t){let n=Pe(t/at),r=n*it;e.moveTo(0,-n),e.lineTo(r,0),e.lineTo(0,n),e.lineTo(-r,0),e.closePath()}},st={draw(e,t){let n=Pe(t),r=-n/2;e.rect(r,r,n,n)}},ct=.8908130915292852,lt=Ne(Fe/10)/Ne(7*Fe/10),ut=Ne(Ie/10)*lt,dt=-Me(Ie/10)*lt,ft={draw(e,t){let n=Pe(t*ct),r=ut*n,i=dt*n;e.moveTo(0,-n),e.lineTo(r,i);for(let t=1;t<5;++t){let a=Ie*t/5,o=Me(a),s=Ne(a);e.lineTo(s*n,-o*n),e.lineTo(o*r-s*i,s*r+o*i)}e.closePath()}},pt=Pe(3),mt={draw(e,t){let n=-Pe(t/(pt*3));e.moveTo(0,n*2),e.lineTo(-pt*n,-n),e.lineTo(pt*n,-n),e.closePath()}},ht=-.5,gt=Pe(3)/2,_t=1/Pe(12),vt=(_t/2+1)*3,yt={draw(e,t){let n=Pe(t/vt),r=n/2,i=n*_t,a=r,o=n*_t+n,s=-a,c=o;e.moveTo(r,i),e.lineTo(a,o),e.lineTo(s,c),e.lineTo(ht*r-gt*i,gt*r+ht*i),e.lineTo(ht*a-gt*o,gt*a+ht*o),e.lineTo(ht*s-gt*c,gt*s+ht*c),e.lineTo(ht*r+gt*i,ht*i-gt*r),e.lineTo(ht*a+gt*o,ht*o-gt*a),e.lineTo(ht*s+gt*c,ht*c-gt*s),e.closePath()}};function bt(e,t){let n=null,r=Ge(i);e=typeof e==`function`?e:P(e||nt),t=typeof t==`function`?t:P(t===void 0?64:+t);function i(){let i;if(n||=i=r(),e.apply(this,arguments).draw(n,+t.apply(this,arguments)),i)return n=null,i+``||null}return i.type=function(t){return arguments.length?(e=typeof t==`function`?t:P(t),i):e},i.size=function(e){return arguments.length?(t=typeof e==`function`?e:P(+e),i):t},i.context=function(e){return arguments.length?(n=e??null,i):n},i}function xt(){}function St(e,t,n){e._context.bezierCurveTo((2*e._x0+e._x1)/3,(2*e._y0+e._y1)/3,(e._x0+2*e._x1)/3,(e._y0+2*e._y1)/3,(e._x0+4*e._x1+t)/6,(e._y0+4*e._y1+n)/6)}function Ct(e){this._context=e}Ct.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x0=this._x1=this._y0=this._y1=NaN,this._point=0},lineEnd:function(){switch(this._point){case 3:St(this,this._x1,this._y1);case 2:this._context.lineTo(this._x1,this._y1);break}(this._line||this._line!==0&&this._point===1)&&this._context.closePath(),this._line=1-this._line},point:function(e,t){switch(e=+e,t=+t,this._point){case 0:this._point=1,this._line?this._context.lineTo(e,t):this._context.moveTo(e,t);break;case 1:this._point=2;break;case 2:this._point=3,this._context.lineTo((5*this._x0+this._x1)/6,(5*this._y0+this._y1)/6);default:St(this,e,t);break}this._x0=this._x1,this._x1=e,this._y0=this._y1,this._y1=t}};function wt(e){return new Ct(e)}function Tt(e){this._context=e}Tt.prototype={areaStart:xt,areaEnd:xt,lineStart:function(){this._x0=this._x1=this._x2=this._x3=this._x4=this._y0=this._y1=this._y2=this._y3=this._y4=NaN,this._point=0},lineEnd:function(){switch(this._point){case 1:this._context.moveTo(this._x2,this._y2),this._context.closePath();break;case 2:this._context.moveTo((this._x2+2*this._x3)/3,(this._y2+2*this._y3)/3),this._context.lineTo((this._x3+2*this._x2)/3,(this._y3+2*this._y2)/3),this._context.closePath();break;case 3:this.point(this._x2,this._y2),this.point(this._x3,this._y3),this.point(this._x4,this._y4);break}},point:function(e,t){switch(e=+e,t=+t,this._point){case 0:this._point=1,this._x2=e,this._y2=t;break;case 1:this._point=2,this._x3=e,this._y3=t;break;case 2:this._point=3,this._x4=e,this._y4=t,this._context.moveTo((this._x0+4*this._x1+e)/6,(this._y0+4*this._y1+t)/6);break;default:St(this,e,t);break}this._x0=this._x1,this._x1=e,this._y0=this._y1,this._y1=t}};function Et(e){return new Tt(e)}function Dt(e){this._context=e}Dt.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x0=this._x1=this._y0=this._y1=NaN,this._point=0},lineEnd:function(){(this._line||this._line!==0&&this._point===3)&&this._context.closePath(),this._line=1-this._line},point:function(e,t){switch(e=+e,t=+t,this._point){case 0:this._point=1;break;case 1:this._point=2;break;case 2:this._point=3;var n=(this._x0+4*this._x1+e)/6,r=(this._y0+4*this._y1+t)/6;this._line?this._context.lineTo(n,r):this._context.moveTo(n,r);break;case 3:this._point=4;default:St(this,e,t);break}this._x0=this._x1,this._x1=e,this._y0=this._y1,this._y1=t}};function Ot(e){return new Dt(e)}function kt(e){this._context=e}kt.prototype={areaStart:xt,areaEnd:xt,lineStart:function(){this._point=0},lineEnd:function(){this._point&&this._context.closePath()},point:function(e,t){e=+e,t=+t,this._point?this._context.lineTo(e,t):(this._point=1,this._context.moveTo(e,t))}};function At(e){return new kt(e)}function jt(e){return e<0?-1:1}function Mt(e,t,n){var r=e._x1-e._x0,i=t-e._x1,a=(e._y1-e._y0)/(r||i<0&&-0),o=(n-e._y1)/(i||r<0&&-0),s=(a*i+o*r)/(r+i);return(jt(a)+jt(o))*Math.min(Math.abs(a),Math.abs(o),.5*Math.abs(s))||0}function Nt(e,t){var n=e._x1-e._x0;return n?(3*(e._y1-e._y0)/n-t)/2:t}function Pt(e,t,n){var r=e._x0,i=e._y0,a=e._x1,o=e._y1,s=(a-r)/3;e._context.bezierCurveTo(r+s,i+s*t,a-s,o-s*n,a,o)}function Ft(e){this._context=e}Ft.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x0=this._x1=this._y0=this._y1=this._t0=NaN,this._point=0},lineEnd:function(){switch(this._point){case 2:this._context.lineTo(this._x1,this._y1);break;case 3:Pt(this,this._t0,Nt(this,this._t0));break}(this._line||this._line!==0&&this._point===1)&&this._context.closePath(),this._line=1-this._line},point:function(e,t){var n=NaN;if(e=+e,t=+t,!(e===this._x1&&t===this._y1)){switch(this._point){case 0:this._point=1,this._line?this._context.lineTo(e,t):this._context.moveTo(e,t);break;case 1:this._point=2;break;case 2:this._point=3,Pt(this,Nt(this,n=Mt(this,e,t)),n);break;default:Pt(this,this._t0,n=Mt(this,e,t));break}this._x0=this._x1,this._x1=e,this._y0=this._y1,this._y1=t,this._t0=n}}};function It(e){this._context=new Lt(e)}(It.prototype=Object.create(Ft.prototype)).point=function(e,t){Ft.prototype.point.call(this,t,e)};function Lt(e){this._context=e}Lt.prototype={moveTo:function(e,t){this._context.moveTo(t,e)},closePath:function(){this._context.closePath()},lineTo:function(e,t){this._context.lineTo(t,e)},bezierCurveTo:function(e,t,n,r,i,a){this._context.bezierCurveTo(t,e,r,n,a,i)}};function Rt(e){return new Ft(e)}function zt(e){return new It(e)}function Bt(e){this._context=e}Bt.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x=[],this._y=[]},lineEnd:function(){var e=this._x,t=this._y,n=e.length;if(n)if(this._line?this._context.lineTo(e[0],t[0]):this._context.moveTo(e[0],t[0]),n===2)this._context.lineTo(e[1],t[1]);else for(var r=Vt(e),i=Vt(t),a=0,o=1;o<n;++a,++o)this._context.bezierCurveTo(r[0][a],i[0][a],r[1][a],i[1][a],e[o],t[o]);(this._line||this._line!==0&&n===1)&&this._context.closePath(),this._line=1-this._line,this._x=this._y=null},point:function(e,t){this._x.push(+e),this._y.push(+t)}};function Vt(e){var t,n=e.length-1,r,i=Array(n),a=Array(n),o=Array(n);for(i[0]=0,a[0]=2,o[0]=e[0]+2*e[1],t=1;t<n-1;++t)i[t]=1,a[t]=4,o[t]=4*e[t]+2*e[t+1];for(i[n-1]=2,a[n-1]=7,o[n-1]=8*e[n-1]+e[n],t=1;t<n;++t)r=i[t]/a[t-1],a[t]-=r,o[t]-=r*o[t-1];for(i[n-1]=o[n-1]/a[n-1],t=n-2;t>=0;--t)i[t]=(o[t]-i[t+1])/a[t];for(a[n-1]=(e[n]+i[n-1])/2,t=0;t<n-1;++t)a[t]=2*e[t+1]-i[t+1];return[i,a]}function Ht(e){return new Bt(e)}function Ut(e,t){this._context=e,this._t=t}Ut.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x=this._y=NaN,this._point=0},lineEnd:function(){0<this._t&&this._t<1&&this._point===2&&this._context.lineTo(this._x,this._y),(this._line||this._line!==0&&this._point===1)&&this._context.closePath(),this._line>=0&&(this._t=1-this._t,this._line=1-this._line)},point:function(e,t){switch(e=+e,t=+t,this._point){case 0:this._point=1,this._line?this._context.lineTo(e,t):this._context.moveTo(e,t);break;case 1:this._point=2;default:if(this._t<=0)this._context.lineTo(this._x,t),this._context.lineTo(e,t);else{var n=this._x*(1-this._t)+e*this._t;this._context.lineTo(n,this._y),this._context.lineTo(n,t)}break}this._x=e,this._y=t}};function Wt(e){return new Ut(e,.5)}function Gt(e){return new Ut(e,0)}function Kt(e){return new Ut(e,1)}function qt(e,t){if((o=e.length)>1)for(var n=1,r,i,a=e[t[0]],o,s=a.length;n<o;++n)for(i=a,a=e[t[n]],r=0;r<s;++r)a[r][1]+=a[r][0]=isNaN(i[r][1])?i[r][0]:i[r][1]}function Jt(e){for(var t=e.length,n=Array(t);--t>=0;)n[t]=t;return n}function Yt(e,t){return e[t]}function Xt(e){let t=[];return t.key=e,t}function Zt(){var e=P([]),t=Jt,n=qt,r=Yt;function i(i){var a=Array.from(e.apply(this,arguments),Xt),o,s=a.length,c=-1,l;for(let e of i)for(o=0,++c;o<s;++o)(a[o][c]=[0,+r(e,a[o].key,c,i)]).data=e;for(o=0,l=Ke(t(a));o<s;++o)a[l[o]].index=o;return n(a,l),a}return i.keys=function(t){return arguments.length?(e=typeof t==`function`?t:P(Array.from(t)),i):e},i.value=function(e){return arguments.length?(r=typeof e==`function`?e:P(+e),i):r},i.order=function(e){return arguments.length?(t=e==null?Jt:typeof e==`function`?e:P(Array.from(e)),i):t},i.offset=function(e){return arguments.length?(n=e??qt,i):n},i}function Qt(e,t){if((r=e.length)>0){for(var n,r,i=0,a=e[0].length,o;i<a;++i){for(o=n=0;n<r;++n)o+=e[n][i][1]||0;if(o)for(n=0;n<r;++n)e[n][i][1]/=o}qt(e,t)}}function $t(e,t){if((i=e.length)>0){for(var n=0,r=e[t[0]],i,a=r.length;n<a;++n){for(var o=0,s=0;o<i;++o)s+=e[o][n][1]||0;r[n][1]+=r[n][0]=-s/2}qt(e,t)}}function en(e,t){if(!(!((o=e.length)>0)||!((a=(i=e[t[0]]).length)>0))){for(var n=0,r=1,i,a,o;r<a;++r){for(var s=0,c=0,l=0;s<o;++s){for(var u=e[t[s]],d=u[r][1]||0,f=u[r-1][1]||0,p=(d-f)/2,m=0;m<s;++m){var h=e[t[m]],g=h[r][1]||0,_=h[r-1][1]||0;p+=g-_}c+=d,l+=p*d}i[r-1][1]+=i[r-1][0]=n,c&&(n-=l/c)}i[r-1][1]+=i[r-1][0]=n,qt(e,t)}}var tn=[`type`,`size`,`sizeType`];function nn(){return nn=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},nn.apply(null,arguments)}function rn(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function an(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?rn(Object(n),!0).forEach(function(t){on(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):rn(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function on(e,t,n){return(t=sn(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function sn(e){var t=cn(e,`string`);return typeof t==`symbol`?t:t+``}function cn(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function ln(e,t){if(e==null)return{};var n,r,i=un(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function un(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}var dn={symbolCircle:nt,symbolCross:rt,symbolDiamond:ot,symbolSquare:st,symbolStar:ft,symbolTriangle:mt,symbolWye:yt},fn=Math.PI/180,pn=e=>{var t=`symbol${te(e)}`;return dn[t]||nt},mn=(e,t,n)=>{if(t===`area`)return e;switch(n){case`cross`:return 5*e*e/9;case`diamond`:return .5*e*e/Math.sqrt(3);case`square`:return e*e;case`star`:var r=18*fn;return 1.25*e*e*(Math.tan(r)-Math.tan(r*2)*Math.tan(r)**2);case`triangle`:return Math.sqrt(3)*e*e/4;case`wye`:return(21-10*Math.sqrt(3))*e*e/8;default:return Math.PI*e*e/4}},hn=(e,t)=>{dn[`symbol${te(e)}`]=t},gn=e=>{var{type:t=`circle`,size:n=64,sizeType:r=`area`}=e,i=ln(e,tn),a=an(an({},i),{},{type:t,size:n,sizeType:r}),o=`circle`;typeof t==`string`&&(o=t);var s=()=>{var e=pn(o);return bt().type(e).size(mn(n,r,o))()},{className:l,cx:u,cy:d}=a,f=M(a,!0);return u===+u&&d===+d&&n===+n?A.createElement(`path`,nn({},f,{className:c(`recharts-symbols`,l),transform:`translate(${u}, ${d})`,d:s()})):null};gn.registerSymbol=hn;function _n(){return _n=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},_n.apply(null,arguments)}function vn(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function yn(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?vn(Object(n),!0).forEach(function(t){bn(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):vn(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function bn(e,t,n){return(t=xn(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function xn(e){var t=Sn(e,`string`);return typeof t==`symbol`?t:t+``}function Sn(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}var Cn=32,wn=class extends A.PureComponent{renderIcon(e,t){var{inactiveColor:n}=this.props,r=Cn/2,i=Cn/6,a=Cn/3,o=e.inactive?n:e.color,s=t??e.type;if(s===`none`)return null;if(s===`plainline`)return A.createElement(`line`,{strokeWidth:4,fill:`none`,stroke:o,strokeDasharray:e.payload.strokeDasharray,x1:0,y1:r,x2:Cn,y2:r,className:`recharts-legend-icon`});if(s===`line`)return A.createElement(`path`,{strokeWidth:4,fill:`none`,stroke:o,d:`M0,${r}h${a}
-            A${i},${i},0,1,1,${2*a},${r}
-            H${Cn}M${2*a},${r}
-            A${i},${i},0,1,1,${a},${r}`,className:`recharts-legend-icon`});if(s===`rect`)return A.createElement(`path`,{stroke:`none`,fill:o,d:`M0,${Cn/8}h${Cn}v${Cn*3/4}h${-Cn}z`,className:`recharts-legend-icon`});if(A.isValidElement(e.legendIcon)){var c=yn({},e);return delete c.legendIcon,A.cloneElement(e.legendIcon,c)}return A.createElement(gn,{fill:o,cx:r,cy:r,size:Cn,sizeType:`diameter`,type:s})}renderItems(){var{payload:e,iconSize:t,layout:n,formatter:r,inactiveColor:i,iconType:a}=this.props,o={x:0,y:0,width:Cn,height:Cn},s={display:n===`horizontal`?`inline-block`:`block`,marginRight:10},l={display:`inline-block`,verticalAlign:`middle`,marginRight:4};return e.map((e,n)=>{var u=e.formatter||r,d=c({"recharts-legend-item":!0,[`legend-item-${n}`]:!0,inactive:e.inactive});if(e.type===`none`)return null;var f=e.inactive?i:e.color,p=u?u(e.value,e,n):e.value;return A.createElement(`li`,_n({className:d,style:s,key:`legend-item-${n}`},le(this.props,e,n)),A.createElement(Te,{width:t,height:t,viewBox:o,style:l,"aria-label":`${p} legend icon`},this.renderIcon(e,a)),A.createElement(`span`,{className:`recharts-legend-item-text`,style:{color:f}},p))})}render(){var{payload:e,layout:t,align:n}=this.props;if(!e||!e.length)return null;var r={padding:0,margin:0,textAlign:t===`horizontal`?n:`left`};return A.createElement(`ul`,{className:`recharts-default-legend`,style:r},this.renderItems())}};bn(wn,`displayName`,`Legend`),bn(wn,`defaultProps`,{align:`center`,iconSize:14,inactiveColor:`#ccc`,layout:`horizontal`,verticalAlign:`middle`});var Tn=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});function t(e,t){let n=new Map;for(let r=0;r<e.length;r++){let i=e[r],a=t(i);n.has(a)||n.set(a,i)}return Array.from(n.values())}exports.uniqBy=t})),En=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});function t(e){return e}exports.identity=t})),Dn=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});function t(e){return Number.isSafeInteger(e)&&e>=0}exports.isLength=t})),On=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=Dn();function n(e){return e!=null&&typeof e!=`function`&&t.isLength(e.length)}exports.isArrayLike=n})),kn=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});function t(e){return typeof e==`object`&&!!e}exports.isObjectLike=t})),An=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=On(),n=kn();function r(e){return n.isObjectLike(e)&&t.isArrayLike(e)}exports.isArrayLikeObject=r})),jn=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=m();function n(e){return function(n){return t.get(n,e)}}exports.property=n})),Mn=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});function t(e){return e!==null&&(typeof e==`object`||typeof e==`function`)}exports.isObject=t})),Nn=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});function t(e){return e==null||typeof e!=`object`&&typeof e!=`function`}exports.isPrimitive=t})),Pn=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});function t(e,t){return e===t||Number.isNaN(e)&&Number.isNaN(t)}exports.eq=t})),Fn=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=In(),n=Mn(),r=Nn(),i=Pn();function a(e,n,r){return typeof r==`function`?o(e,n,function e(t,n,i,a,s,c){let l=r(t,n,i,a,s,c);return l===void 0?o(t,n,e,c):!!l},new Map):t.isMatch(e,n)}function o(e,t,r,a){if(t===e)return!0;switch(typeof t){case`object`:return s(e,t,r,a);case`function`:return Object.keys(t).length>0?o(e,{...t},r,a):i.eq(e,t);default:return n.isObject(e)?typeof t==`string`?t===``:!0:i.eq(e,t)}}function s(e,t,n,i){if(t==null)return!0;if(Array.isArray(t))return l(e,t,n,i);if(t instanceof Map)return c(e,t,n,i);if(t instanceof Set)return u(e,t,n,i);let a=Object.keys(t);if(e==null)return a.length===0;if(a.length===0)return!0;if(i&&i.has(t))return i.get(t)===e;i&&i.set(t,e);try{for(let o=0;o<a.length;o++){let s=a[o];if(!r.isPrimitive(e)&&!(s in e)||t[s]===void 0&&e[s]!==void 0||t[s]===null&&e[s]!==null||!n(e[s],t[s],s,e,t,i))return!1}return!0}finally{i&&i.delete(t)}}function c(e,t,n,r){if(t.size===0)return!0;if(!(e instanceof Map))return!1;for(let[i,a]of t.entries()){let o=e.get(i);if(n(o,a,i,e,t,r)===!1)return!1}return!0}function l(e,t,n,r){if(t.length===0)return!0;if(!Array.isArray(e))return!1;let i=new Set;for(let a=0;a<t.length;a++){let o=t[a],s=!1;for(let c=0;c<e.length;c++){if(i.has(c))continue;let l=e[c],u=!1;if(n(l,o,a,e,t,r)&&(u=!0),u){i.add(c),s=!0;break}}if(!s)return!1}return!0}function u(e,t,n,r){return t.size===0?!0:e instanceof Set?l([...e],[...t],n,r):!1}exports.isMatchWith=a,exports.isSetMatch=u})),In=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=Fn();function n(e,n){return t.isMatchWith(e,n,()=>void 0)}exports.isMatch=n})),Ln=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});function t(e){return Object.getOwnPropertySymbols(e).filter(t=>Object.prototype.propertyIsEnumerable.call(e,t))}exports.getSymbols=t})),Rn=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});function t(e){return e==null?e===void 0?`[object Undefined]`:`[object Null]`:Object.prototype.toString.call(e)}exports.getTag=t})),zn=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`}),exports.argumentsTag=`[object Arguments]`,exports.arrayBufferTag=`[object ArrayBuffer]`,exports.arrayTag=`[object Array]`,exports.bigInt64ArrayTag=`[object BigInt64Array]`,exports.bigUint64ArrayTag=`[object BigUint64Array]`,exports.booleanTag=`[object Boolean]`,exports.dataViewTag=`[object DataView]`,exports.dateTag=`[object Date]`,exports.errorTag=`[object Error]`,exports.float32ArrayTag=`[object Float32Array]`,exports.float64ArrayTag=`[object Float64Array]`,exports.functionTag=`[object Function]`,exports.int16ArrayTag=`[object Int16Array]`,exports.int32ArrayTag=`[object Int32Array]`,exports.int8ArrayTag=`[object Int8Array]`,exports.mapTag=`[object Map]`,exports.numberTag=`[object Number]`,exports.objectTag=`[object Object]`,exports.regexpTag=`[object RegExp]`,exports.setTag=`[object Set]`,exports.stringTag=`[object String]`,exports.symbolTag=`[object Symbol]`,exports.uint16ArrayTag=`[object Uint16Array]`,exports.uint32ArrayTag=`[object Uint32Array]`,exports.uint8ArrayTag=`[object Uint8Array]`,exports.uint8ClampedArrayTag=`[object Uint8ClampedArray]`})),Bn=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});function t(e){return ArrayBuffer.isView(e)&&!(e instanceof DataView)}exports.isTypedArray=t})),Vn=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=Ln(),n=Rn(),r=zn(),i=Nn(),a=Bn();function o(e,t){return s(e,void 0,e,new Map,t)}function s(e,t,n,r=new Map,o=void 0){let u=o?.(e,t,n,r);if(u!==void 0)return u;if(i.isPrimitive(e))return e;if(r.has(e))return r.get(e);if(Array.isArray(e)){let t=Array(e.length);r.set(e,t);for(let i=0;i<e.length;i++)t[i]=s(e[i],i,n,r,o);return Object.hasOwn(e,`index`)&&(t.index=e.index),Object.hasOwn(e,`input`)&&(t.input=e.input),t}if(e instanceof Date)return new Date(e.getTime());if(e instanceof RegExp){let t=new RegExp(e.source,e.flags);return t.lastIndex=e.lastIndex,t}if(e instanceof Map){let t=new Map;r.set(e,t);for(let[i,a]of e)t.set(i,s(a,i,n,r,o));return t}if(e instanceof Set){let t=new Set;r.set(e,t);for(let i of e)t.add(s(i,void 0,n,r,o));return t}if(typeof Buffer<`u`&&Buffer.isBuffer(e))return e.subarray();if(a.isTypedArray(e)){let t=new(Object.getPrototypeOf(e)).constructor(e.length);r.set(e,t);for(let i=0;i<e.length;i++)t[i]=s(e[i],i,n,r,o);return t}if(e instanceof ArrayBuffer||typeof SharedArrayBuffer<`u`&&e instanceof SharedArrayBuffer)return e.slice(0);if(e instanceof DataView){let t=new DataView(e.buffer.slice(0),e.byteOffset,e.byteLength);return r.set(e,t),c(t,e,n,r,o),t}if(typeof File<`u`&&e instanceof File){let t=new File([e],e.name,{type:e.type});return r.set(e,t),c(t,e,n,r,o),t}if(typeof Blob<`u`&&e instanceof Blob){let t=new Blob([e],{type:e.type});return r.set(e,t),c(t,e,n,r,o),t}if(e instanceof Error){let t=new e.constructor;return r.set(e,t),t.message=e.message,t.name=e.name,t.stack=e.stack,t.cause=e.cause,c(t,e,n,r,o),t}if(e instanceof Boolean){let t=new Boolean(e.valueOf());return r.set(e,t),c(t,e,n,r,o),t}if(e instanceof Number){let t=new Number(e.valueOf());return r.set(e,t),c(t,e,n,r,o),t}if(e instanceof String){let t=new String(e.valueOf());return r.set(e,t),c(t,e,n,r,o),t}if(typeof e==`object`&&l(e)){let t=Object.create(Object.getPrototypeOf(e));return r.set(e,t),c(t,e,n,r,o),t}return e}function c(e,n,r=e,i,a){let o=[...Object.keys(n),...t.getSymbols(n)];for(let t=0;t<o.length;t++){let c=o[t],l=Object.getOwnPropertyDescriptor(e,c);(l==null||l.writable)&&(e[c]=s(n[c],c,r,i,a))}}function l(e){switch(n.getTag(e)){case r.argumentsTag:case r.arrayTag:case r.arrayBufferTag:case r.dataViewTag:case r.booleanTag:case r.dateTag:case r.float32ArrayTag:case r.float64ArrayTag:case r.int8ArrayTag:case r.int16ArrayTag:case r.int32ArrayTag:case r.mapTag:case r.numberTag:case r.objectTag:case r.regexpTag:case r.setTag:case r.stringTag:case r.symbolTag:case r.uint8ArrayTag:case r.uint8ClampedArrayTag:case r.uint16ArrayTag:case r.uint32ArrayTag:return!0;default:return!1}}exports.cloneDeepWith=o,exports.cloneDeepWithImpl=s,exports.copyProperties=c})),Hn=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=Vn();function n(e){return t.cloneDeepWithImpl(e,void 0,e,new Map,void 0)}exports.cloneDeep=n})),Un=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=In(),n=Hn();function r(e){return e=n.cloneDeep(e),n=>t.isMatch(n,e)}exports.matches=r})),Wn=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=Vn(),n=zn();function r(e,r){return t.cloneDeepWith(e,(i,a,o,s)=>{let c=r?.(i,a,o,s);if(c!==void 0)return c;if(typeof e==`object`)switch(Object.prototype.toString.call(e)){case n.numberTag:case n.stringTag:case n.booleanTag:{let n=new e.constructor(e?.valueOf());return t.copyProperties(n,e),n}case n.argumentsTag:{let n={};return t.copyProperties(n,e),n.length=e.length,n[Symbol.iterator]=e[Symbol.iterator],n}default:return}})}exports.cloneDeepWith=r})),Gn=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=Wn();function n(e){return t.cloneDeepWith(e)}exports.cloneDeep=n})),Kn=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=/^(?:0|[1-9]\d*)$/;function n(e,n=2**53-1){switch(typeof e){case`number`:return Number.isInteger(e)&&e>=0&&e<n;case`symbol`:return!1;case`string`:return t.test(e)}}exports.isIndex=n})),qn=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=Rn();function n(e){return typeof e==`object`&&!!e&&t.getTag(e)===`[object Arguments]`}exports.isArguments=n})),Jn=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=u(),n=Kn(),r=qn(),i=p();function a(e,a){let o;if(o=Array.isArray(a)?a:typeof a==`string`&&t.isDeepKey(a)&&e?.[a]==null?i.toPath(a):[a],o.length===0)return!1;let s=e;for(let e=0;e<o.length;e++){let t=o[e];if((s==null||!Object.hasOwn(s,t))&&!((Array.isArray(s)||r.isArguments(s))&&n.isIndex(t)&&t<s.length))return!1;s=s[t]}return!0}exports.has=a})),Yn=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=In(),n=d(),r=Gn(),i=m(),a=Jn();function o(e,o){switch(typeof e){case`object`:Object.is(e?.valueOf(),-0)&&(e=`-0`);break;case`number`:e=n.toKey(e);break}return o=r.cloneDeep(o),function(n){let r=i.get(n,e);return r===void 0?a.has(n,e):o===void 0?r===void 0:t.isMatch(r,o)}}exports.matchesProperty=o})),Xn=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=En(),n=jn(),r=Un(),i=Yn();function a(e){if(e==null)return t.identity;switch(typeof e){case`function`:return e;case`object`:return Array.isArray(e)&&e.length===2?i.matchesProperty(e[0],e[1]):r.matches(e);case`string`:case`symbol`:case`number`:return n.property(e)}}exports.iteratee=a})),Zn=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=Tn(),n=En(),r=An(),i=Xn();function a(e,a=n.identity){return r.isArrayLikeObject(e)?t.uniqBy(Array.from(e),i.iteratee(a)):[]}exports.uniqBy=a})),Qn=e(n(((exports,t)=>{t.exports=Zn().uniqBy}))());function $n(e,t,n){return t===!0?(0,Qn.default)(e,n):typeof t==`function`?(0,Qn.default)(e,t):e}var er=n((exports=>{var t=r(),n=o();function i(e,t){return e===t&&(e!==0||1/e==1/t)||e!==e&&t!==t}var a=typeof Object.is==`function`?Object.is:i,s=n.useSyncExternalStore,c=t.useRef,l=t.useEffect,u=t.useMemo,d=t.useDebugValue;exports.useSyncExternalStoreWithSelector=function(e,t,n,r,i){var o=c(null);if(o.current===null){var f={hasValue:!1,value:null};o.current=f}else f=o.current;o=u(function(){function e(e){if(!o){if(o=!0,s=e,e=r(e),i!==void 0&&f.hasValue){var t=f.value;if(i(t,e))return c=t}return c=e}if(t=c,a(s,e))return t;var n=r(e);return i!==void 0&&i(t,n)?(s=e,t):(s=e,c=n)}var o=!1,s,c,l=n===void 0?null:n;return[function(){return e(t())},l===null?void 0:function(){return e(l())}]},[t,n,r,i]);var p=s(e,o[0],o[1]);return l(function(){f.hasValue=!0,f.value=p},[p]),d(p),p}})),tr=n(((exports,t)=>{t.exports=er()})),nr=(0,A.createContext)(null),rr=e(tr()),ir=e=>e,F=()=>{var e=(0,A.useContext)(nr);return e?e.store.dispatch:ir},ar=()=>{},or=()=>ar,sr=(e,t)=>e===t;function I(e){var t=(0,A.useContext)(nr);return(0,rr.useSyncExternalStoreWithSelector)(t?t.subscription.addNestedSub:or,t?t.store.getState:ar,t?t.store.getState:ar,t?e:ar,sr)}function cr(e,t=`expected a function, instead received ${typeof e}`){if(typeof e!=`function`)throw TypeError(t)}function lr(e,t=`expected an object, instead received ${typeof e}`){if(typeof e!=`object`)throw TypeError(t)}function ur(e,t=`expected all items to be functions, instead received the following types: `){if(!e.every(e=>typeof e==`function`)){let n=e.map(e=>typeof e==`function`?`function ${e.name||`unnamed`}()`:typeof e).join(`, `);throw TypeError(`${t}[${n}]`)}}var dr=e=>Array.isArray(e)?e:[e];function fr(e){let t=Array.isArray(e[0])?e[0]:e;return ur(t,`createSelector expects all input-selectors to be functions, but received the following types: `),t}function pr(e,t){let n=[],{length:r}=e;for(let i=0;i<r;i++)n.push(e[i].apply(null,t));return n}var mr=0,hr=null,gr=class{revision=mr;_value;_lastValue;_isEqual=_r;constructor(e,t=_r){this._value=this._lastValue=e,this._isEqual=t}get value(){return hr?.add(this),this._value}set value(e){this.value!==e&&(this._value=e,this.revision=++mr)}};function _r(e,t){return e===t}function vr(e){return e instanceof gr||console.warn(`Not a valid cell! `,e),e.value}function yr(e,t=_r){return new gr(e,t)}var br=(e,t)=>!1;function xr(){return yr(null,br)}var Sr=e=>{let t=e.collectionTag;t===null&&(t=e.collectionTag=xr()),vr(t)},Cr=0,wr=Object.getPrototypeOf({}),Tr=class{constructor(e){this.value=e,this.value=e,this.tag.value=e}proxy=new Proxy(this,Er);tag=xr();tags={};children={};collectionTag=null;id=Cr++},Er={get(e,t){function n(){let{value:n}=e,r=Reflect.get(n,t);if(typeof t==`symbol`||t in wr)return r;if(typeof r==`object`&&r){let n=e.children[t];return n===void 0&&(n=e.children[t]=kr(r)),n.tag&&vr(n.tag),n.proxy}else{let n=e.tags[t];return n===void 0&&(n=e.tags[t]=xr(),n.value=r),vr(n),r}}return n()},ownKeys(e){return Sr(e),Reflect.ownKeys(e.value)},getOwnPropertyDescriptor(e,t){return Reflect.getOwnPropertyDescriptor(e.value,t)},has(e,t){return Reflect.has(e.value,t)}},Dr=class{constructor(e){this.value=e,this.value=e,this.tag.value=e}proxy=new Proxy([this],Or);tag=xr();tags={};children={};collectionTag=null;id=Cr++},Or={get([e],t){return t===`length`&&Sr(e),Er.get(e,t)},ownKeys([e]){return Er.ownKeys(e)},getOwnPropertyDescriptor([e],t){return Er.getOwnPropertyDescriptor(e,t)},has([e],t){return Er.has(e,t)}};function kr(e){return Array.isArray(e)?new Dr(e):new Tr(e)}var Ar=class{constructor(e){this.value=e}deref(){return this.value}},jr=typeof WeakRef<`u`?WeakRef:Ar,Mr=0,Nr=1;function Pr(){return{s:Mr,v:void 0,o:null,p:null}}function Fr(e,t={}){let n=Pr(),{resultEqualityCheck:r}=t,i,a=0;function o(){let t=n,{length:o}=arguments;for(let e=0,n=o;e<n;e++){let n=arguments[e];if(typeof n==`function`||typeof n==`object`&&n){let e=t.o;e===null&&(t.o=e=new WeakMap);let r=e.get(n);r===void 0?(t=Pr(),e.set(n,t)):t=r}else{let e=t.p;e===null&&(t.p=e=new Map);let r=e.get(n);r===void 0?(t=Pr(),e.set(n,t)):t=r}}let s=t,c;if(t.s===Nr)c=t.v;else if(c=e.apply(null,arguments),a++,r){let e=i?.deref?.()??i;e!=null&&r(e,c)&&(c=e,a!==0&&a--),i=typeof c==`object`&&c||typeof c==`function`?new jr(c):c}return s.s=Nr,s.v=c,c}return o.clearCache=()=>{n=Pr(),o.resetResultsCount()},o.resultsCount=()=>a,o.resetResultsCount=()=>{a=0},o}function Ir(e,...t){let n=typeof e==`function`?{memoize:e,memoizeOptions:t}:e,r=(...e)=>{let t=0,r=0,i,a={},o=e.pop();typeof o==`object`&&(a=o,o=e.pop()),cr(o,`createSelector expects an output function after the inputs, but received: [${typeof o}]`);let{memoize:s,memoizeOptions:c=[],argsMemoize:l=Fr,argsMemoizeOptions:u=[],devModeChecks:d={}}={...n,...a},f=dr(c),p=dr(u),m=fr(e),h=s(function(){return t++,o.apply(null,arguments)},...f),g=l(function(){r++;let e=pr(m,arguments);return i=h.apply(null,e),i},...p);return Object.assign(g,{resultFunc:o,memoizedResultFunc:h,dependencies:m,dependencyRecomputations:()=>r,resetDependencyRecomputations:()=>{r=0},lastResult:()=>i,recomputations:()=>t,resetRecomputations:()=>{t=0},memoize:s,argsMemoize:l})};return Object.assign(r,{withTypes:()=>r}),r}var L=Ir(Fr),Lr=Object.assign((e,t=L)=>{lr(e,`createStructuredSelector expects first argument to be an object where each property is a selector, instead received a ${typeof e}`);let n=Object.keys(e),r=n.map(t=>e[t]);return t(r,(...e)=>e.reduce((e,t,r)=>(e[n[r]]=t,e),{}))},{withTypes:()=>Lr}),Rr=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});function t(e){return typeof e==`symbol`?1:e===null?2:e===void 0?3:e===e?0:4}exports.compareValues=(e,n,r)=>{if(e!==n){let i=t(e),a=t(n);if(i===a&&i===0){if(e<n)return r===`desc`?1:-1;if(e>n)return r===`desc`?-1:1}return r===`desc`?a-i:i-a}return 0}})),zr=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});function t(e){return typeof e==`symbol`||e instanceof Symbol}exports.isSymbol=t})),Br=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=zr(),n=/\.|\[(?:[^[\]]*|(["'])(?:(?!\1)[^\\]|\\.)*?\1)\]/,r=/^\w*$/;function i(e,i){return Array.isArray(e)?!1:typeof e==`number`||typeof e==`boolean`||e==null||t.isSymbol(e)?!0:typeof e==`string`&&(r.test(e)||!n.test(e))||i!=null&&Object.hasOwn(i,e)}exports.isKey=i})),Vr=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=Rr(),n=Br(),r=p();function i(e,i,a,o){if(e==null)return[];a=o?void 0:a,Array.isArray(e)||(e=Object.values(e)),Array.isArray(i)||(i=i==null?[null]:[i]),i.length===0&&(i=[null]),Array.isArray(a)||(a=a==null?[]:[a]),a=a.map(e=>String(e));let s=(e,t)=>{let n=e;for(let e=0;e<t.length&&n!=null;++e)n=n[t[e]];return n},c=(e,t)=>t==null||e==null?t:typeof e==`object`&&`key`in e?Object.hasOwn(t,e.key)?t[e.key]:s(t,e.path):typeof e==`function`?e(t):Array.isArray(e)?s(t,e):typeof t==`object`?t[e]:t,l=i.map(e=>(Array.isArray(e)&&e.length===1&&(e=e[0]),e==null||typeof e==`function`||Array.isArray(e)||n.isKey(e)?e:{key:e,path:r.toPath(e)}));return e.map(e=>({original:e,criteria:l.map(t=>c(t,e))})).slice().sort((e,n)=>{for(let r=0;r<l.length;r++){let i=t.compareValues(e.criteria[r],n.criteria[r],a[r]);if(i!==0)return i}return 0}).map(e=>e.original)}exports.orderBy=i})),Hr=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});function t(e,t=1){let n=[],r=Math.floor(t),i=(e,t)=>{for(let a=0;a<e.length;a++){let o=e[a];Array.isArray(o)&&t<r?i(o,t+1):n.push(o)}};return i(e,0),n}exports.flatten=t})),Ur=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=Kn(),n=On(),r=Mn(),i=Pn();function a(e,a,o){return r.isObject(o)&&(typeof a==`number`&&n.isArrayLike(o)&&t.isIndex(a)&&a<o.length||typeof a==`string`&&a in o)?i.eq(o[a],e):!1}exports.isIterateeCall=a})),Wr=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=Vr(),n=Hr(),r=Ur();function i(e,...i){let a=i.length;return a>1&&r.isIterateeCall(e,i[0],i[1])?i=[]:a>2&&r.isIterateeCall(i[0],i[1],i[2])&&(i=[i[0]]),t.orderBy(e,n.flatten(i),[`asc`])}exports.sortBy=i})),Gr=n(((exports,t)=>{t.exports=Wr().sortBy})),Kr=e(Gr()),qr=e=>e.legend.settings,Jr=e=>e.legend.size,Yr=L([e=>e.legend.payload,qr],(e,t)=>{var{itemSorter:n}=t,r=e.flat(1);return n?(0,Kr.default)(r,n):r});function Xr(){return I(Yr)}var Zr=1;function Qr(){var e=arguments.length>0&&arguments[0]!==void 0?arguments[0]:[],[t,n]=(0,A.useState)({height:0,left:0,top:0,width:0}),r=(0,A.useCallback)(e=>{if(e!=null){var r=e.getBoundingClientRect(),i={height:r.height,left:r.left,top:r.top,width:r.width};(Math.abs(i.height-t.height)>Zr||Math.abs(i.left-t.left)>Zr||Math.abs(i.top-t.top)>Zr||Math.abs(i.width-t.width)>Zr)&&n({height:i.height,left:i.left,top:i.top,width:i.width})}},[t.width,t.height,t.top,t.left,...e]);return[t,r]}function $r(e){return`Minified Redux error #${e}; visit https://redux.js.org/Errors?code=${e} for the full message or use the non-minified dev environment for full errors. `}var ei=(()=>typeof Symbol==`function`&&Symbol.observable||`@@observable`)(),ti=()=>Math.random().toString(36).substring(7).split(``).join(`.`),ni={INIT:`@@redux/INIT${ti()}`,REPLACE:`@@redux/REPLACE${ti()}`,PROBE_UNKNOWN_ACTION:()=>`@@redux/PROBE_UNKNOWN_ACTION${ti()}`};function ri(e){if(typeof e!=`object`||!e)return!1;let t=e;for(;Object.getPrototypeOf(t)!==null;)t=Object.getPrototypeOf(t);return Object.getPrototypeOf(e)===t||Object.getPrototypeOf(e)===null}function ii(e,t,n){if(typeof e!=`function`)throw Error($r(2));if(typeof t==`function`&&typeof n==`function`||typeof n==`function`&&typeof arguments[3]==`function`)throw Error($r(0));if(typeof t==`function`&&n===void 0&&(n=t,t=void 0),n!==void 0){if(typeof n!=`function`)throw Error($r(1));return n(ii)(e,t)}let r=e,i=t,a=new Map,o=a,s=0,c=!1;function l(){o===a&&(o=new Map,a.forEach((e,t)=>{o.set(t,e)}))}function u(){if(c)throw Error($r(3));return i}function d(e){if(typeof e!=`function`)throw Error($r(4));if(c)throw Error($r(5));let t=!0;l();let n=s++;return o.set(n,e),function(){if(t){if(c)throw Error($r(6));t=!1,l(),o.delete(n),a=null}}}function f(e){if(!ri(e))throw Error($r(7));if(e.type===void 0)throw Error($r(8));if(typeof e.type!=`string`)throw Error($r(17));if(c)throw Error($r(9));try{c=!0,i=r(i,e)}finally{c=!1}return(a=o).forEach(e=>{e()}),e}function p(e){if(typeof e!=`function`)throw Error($r(10));r=e,f({type:ni.REPLACE})}function m(){let e=d;return{subscribe(t){if(typeof t!=`object`||!t)throw Error($r(11));function n(){let e=t;e.next&&e.next(u())}return n(),{unsubscribe:e(n)}},[ei](){return this}}}return f({type:ni.INIT}),{dispatch:f,subscribe:d,getState:u,replaceReducer:p,[ei]:m}}function ai(e){Object.keys(e).forEach(t=>{let n=e[t];if(n(void 0,{type:ni.INIT})===void 0)throw Error($r(12));if(n(void 0,{type:ni.PROBE_UNKNOWN_ACTION()})===void 0)throw Error($r(13))})}function oi(e){let t=Object.keys(e),n={};for(let r=0;r<t.length;r++){let i=t[r];typeof e[i]==`function`&&(n[i]=e[i])}let r=Object.keys(n),i;try{ai(n)}catch(e){i=e}return function(e={},t){if(i)throw i;let a=!1,o={};for(let i=0;i<r.length;i++){let s=r[i],c=n[s],l=e[s],u=c(l,t);if(u===void 0)throw t&&t.type,Error($r(14));o[s]=u,a||=u!==l}return a||=r.length!==Object.keys(e).length,a?o:e}}function si(...e){return e.length===0?e=>e:e.length===1?e[0]:e.reduce((e,t)=>(...n)=>e(t(...n)))}function ci(...e){return t=>(n,r)=>{let i=t(n,r),a=()=>{throw Error($r(15))},o={getState:i.getState,dispatch:(e,...t)=>a(e,...t)},s=e.map(e=>e(o));return a=si(...s)(i.dispatch),{...i,dispatch:a}}}function li(e){return ri(e)&&`type`in e&&typeof e.type==`string`}var ui=Symbol.for(`immer-nothing`),di=Symbol.for(`immer-draftable`),fi=Symbol.for(`immer-state`);function pi(e,...t){throw Error(`[Immer] minified error nr: ${e}. Full error at: https://bit.ly/3cXEKWf`)}var mi=Object.getPrototypeOf;function hi(e){return!!e&&!!e[fi]}function gi(e){return e?vi(e)||Array.isArray(e)||!!e[di]||!!e.constructor?.[di]||wi(e)||Ti(e):!1}var _i=Object.prototype.constructor.toString();function vi(e){if(!e||typeof e!=`object`)return!1;let t=mi(e);if(t===null)return!0;let n=Object.hasOwnProperty.call(t,`constructor`)&&t.constructor;return n===Object?!0:typeof n==`function`&&Function.toString.call(n)===_i}function yi(e,t){bi(e)===0?Reflect.ownKeys(e).forEach(n=>{t(n,e[n],e)}):e.forEach((n,r)=>t(r,n,e))}function bi(e){let t=e[fi];return t?t.type_:Array.isArray(e)?1:wi(e)?2:Ti(e)?3:0}function xi(e,t){return bi(e)===2?e.has(t):Object.prototype.hasOwnProperty.call(e,t)}function Si(e,t,n){let r=bi(e);r===2?e.set(t,n):r===3?e.add(n):e[t]=n}function Ci(e,t){return e===t?e!==0||1/e==1/t:e!==e&&t!==t}function wi(e){return e instanceof Map}function Ti(e){return e instanceof Set}function Ei(e){return e.copy_||e.base_}function Di(e,t){if(wi(e))return new Map(e);if(Ti(e))return new Set(e);if(Array.isArray(e))return Array.prototype.slice.call(e);let n=vi(e);if(t===!0||t===`class_only`&&!n){let t=Object.getOwnPropertyDescriptors(e);delete t[fi];let n=Reflect.ownKeys(t);for(let r=0;r<n.length;r++){let i=n[r],a=t[i];a.writable===!1&&(a.writable=!0,a.configurable=!0),(a.get||a.set)&&(t[i]={configurable:!0,writable:!0,enumerable:a.enumerable,value:e[i]})}return Object.create(mi(e),t)}else{let t=mi(e);if(t!==null&&n)return{...e};let r=Object.create(t);return Object.assign(r,e)}}function Oi(e,t=!1){return Ai(e)||hi(e)||!gi(e)?e:(bi(e)>1&&Object.defineProperties(e,{set:{value:ki},add:{value:ki},clear:{value:ki},delete:{value:ki}}),Object.freeze(e),t&&Object.values(e).forEach(e=>Oi(e,!0)),e)}function ki(){pi(2)}function Ai(e){return Object.isFrozen(e)}var ji={};function Mi(e){let t=ji[e];return t||pi(0,e),t}var Ni;function Pi(){return Ni}function Fi(e,t){return{drafts_:[],parent_:e,immer_:t,canAutoFreeze_:!0,unfinalizedDrafts_:0}}function Ii(e,t){t&&(Mi(`Patches`),e.patches_=[],e.inversePatches_=[],e.patchListener_=t)}function Li(e){Ri(e),e.drafts_.forEach(Bi),e.drafts_=null}function Ri(e){e===Ni&&(Ni=e.parent_)}function zi(e){return Ni=Fi(Ni,e)}function Bi(e){let t=e[fi];t.type_===0||t.type_===1?t.revoke_():t.revoked_=!0}function Vi(e,t){t.unfinalizedDrafts_=t.drafts_.length;let n=t.drafts_[0];return e!==void 0&&e!==n?(n[fi].modified_&&(Li(t),pi(4)),gi(e)&&(e=Hi(t,e),!t.parent_&&Wi(t,e)),t.patches_&&Mi(`Patches`).generateReplacementPatches_(n[fi].base_,e,t.patches_,t.inversePatches_)):e=Hi(t,n,[]),Li(t),t.patches_&&t.patchListener_(t.patches_,t.inversePatches_),e===ui?void 0:e}function Hi(e,t,n){if(Ai(t))return t;let r=t[fi];if(!r)return yi(t,(i,a)=>Ui(e,r,t,i,a,n)),t;if(r.scope_!==e)return t;if(!r.modified_)return Wi(e,r.base_,!0),r.base_;if(!r.finalized_){r.finalized_=!0,r.scope_.unfinalizedDrafts_--;let t=r.copy_,i=t,a=!1;r.type_===3&&(i=new Set(t),t.clear(),a=!0),yi(i,(i,o)=>Ui(e,r,t,i,o,n,a)),Wi(e,t,!1),n&&e.patches_&&Mi(`Patches`).generatePatches_(r,n,e.patches_,e.inversePatches_)}return r.copy_}function Ui(e,t,n,r,i,a,o){if(hi(i)){let o=a&&t&&t.type_!==3&&!xi(t.assigned_,r)?a.concat(r):void 0,s=Hi(e,i,o);if(Si(n,r,s),hi(s))e.canAutoFreeze_=!1;else return}else o&&n.add(i);if(gi(i)&&!Ai(i)){if(!e.immer_.autoFreeze_&&e.unfinalizedDrafts_<1)return;Hi(e,i),(!t||!t.scope_.parent_)&&typeof r!=`symbol`&&(wi(n)?n.has(r):Object.prototype.propertyIsEnumerable.call(n,r))&&Wi(e,i)}}function Wi(e,t,n=!1){!e.parent_&&e.immer_.autoFreeze_&&e.canAutoFreeze_&&Oi(t,n)}function Gi(e,t){let n=Array.isArray(e),r={type_:n?1:0,scope_:t?t.scope_:Pi(),modified_:!1,finalized_:!1,assigned_:{},parent_:t,base_:e,draft_:null,copy_:null,revoke_:null,isManual_:!1},i=r,a=Ki;n&&(i=[r],a=qi);let{revoke:o,proxy:s}=Proxy.revocable(i,a);return r.draft_=s,r.revoke_=o,s}var Ki={get(e,t){if(t===fi)return e;let n=Ei(e);if(!xi(n,t))return Yi(e,n,t);let r=n[t];return e.finalized_||!gi(r)?r:r===Ji(e.base_,t)?(Qi(e),e.copy_[t]=ea(r,e)):r},has(e,t){return t in Ei(e)},ownKeys(e){return Reflect.ownKeys(Ei(e))},set(e,t,n){let r=Xi(Ei(e),t);if(r?.set)return r.set.call(e.draft_,n),!0;if(!e.modified_){let r=Ji(Ei(e),t),i=r?.[fi];if(i&&i.base_===n)return e.copy_[t]=n,e.assigned_[t]=!1,!0;if(Ci(n,r)&&(n!==void 0||xi(e.base_,t)))return!0;Qi(e),Zi(e)}return e.copy_[t]===n&&(n!==void 0||t in e.copy_)||Number.isNaN(n)&&Number.isNaN(e.copy_[t])?!0:(e.copy_[t]=n,e.assigned_[t]=!0,!0)},deleteProperty(e,t){return Ji(e.base_,t)!==void 0||t in e.base_?(e.assigned_[t]=!1,Qi(e),Zi(e)):delete e.assigned_[t],e.copy_&&delete e.copy_[t],!0},getOwnPropertyDescriptor(e,t){let n=Ei(e),r=Reflect.getOwnPropertyDescriptor(n,t);return r&&{writable:!0,configurable:e.type_!==1||t!==`length`,enumerable:r.enumerable,value:n[t]}},defineProperty(){pi(11)},getPrototypeOf(e){return mi(e.base_)},setPrototypeOf(){pi(12)}},qi={};yi(Ki,(e,t)=>{qi[e]=function(){return arguments[0]=arguments[0][0],t.apply(this,arguments)}}),qi.deleteProperty=function(e,t){return qi.set.call(this,e,t,void 0)},qi.set=function(e,t,n){return Ki.set.call(this,e[0],t,n,e[0])};function Ji(e,t){let n=e[fi];return(n?Ei(n):e)[t]}function Yi(e,t,n){let r=Xi(t,n);return r?`value`in r?r.value:r.get?.call(e.draft_):void 0}function Xi(e,t){if(!(t in e))return;let n=mi(e);for(;n;){let e=Object.getOwnPropertyDescriptor(n,t);if(e)return e;n=mi(n)}}function Zi(e){e.modified_||(e.modified_=!0,e.parent_&&Zi(e.parent_))}function Qi(e){e.copy_||=Di(e.base_,e.scope_.immer_.useStrictShallowCopy_)}var $i=class{constructor(e){this.autoFreeze_=!0,this.useStrictShallowCopy_=!1,this.produce=(e,t,n)=>{if(typeof e==`function`&&typeof t!=`function`){let n=t;t=e;let r=this;return function(e=n,...i){return r.produce(e,e=>t.call(this,e,...i))}}typeof t!=`function`&&pi(6),n!==void 0&&typeof n!=`function`&&pi(7);let r;if(gi(e)){let i=zi(this),a=ea(e,void 0),o=!0;try{r=t(a),o=!1}finally{o?Li(i):Ri(i)}return Ii(i,n),Vi(r,i)}else if(!e||typeof e!=`object`){if(r=t(e),r===void 0&&(r=e),r===ui&&(r=void 0),this.autoFreeze_&&Oi(r,!0),n){let t=[],i=[];Mi(`Patches`).generateReplacementPatches_(e,r,t,i),n(t,i)}return r}else pi(1,e)},this.produceWithPatches=(e,t)=>{if(typeof e==`function`)return(t,...n)=>this.produceWithPatches(t,t=>e(t,...n));let n,r;return[this.produce(e,t,(e,t)=>{n=e,r=t}),n,r]},typeof e?.autoFreeze==`boolean`&&this.setAutoFreeze(e.autoFreeze),typeof e?.useStrictShallowCopy==`boolean`&&this.setUseStrictShallowCopy(e.useStrictShallowCopy)}createDraft(e){gi(e)||pi(8),hi(e)&&(e=ta(e));let t=zi(this),n=ea(e,void 0);return n[fi].isManual_=!0,Ri(t),n}finishDraft(e,t){let n=e&&e[fi];(!n||!n.isManual_)&&pi(9);let{scope_:r}=n;return Ii(r,t),Vi(void 0,r)}setAutoFreeze(e){this.autoFreeze_=e}setUseStrictShallowCopy(e){this.useStrictShallowCopy_=e}applyPatches(e,t){let n;for(n=t.length-1;n>=0;n--){let r=t[n];if(r.path.length===0&&r.op===`replace`){e=r.value;break}}n>-1&&(t=t.slice(n+1));let r=Mi(`Patches`).applyPatches_;return hi(e)?r(e,t):this.produce(e,e=>r(e,t))}};function ea(e,t){let n=wi(e)?Mi(`MapSet`).proxyMap_(e,t):Ti(e)?Mi(`MapSet`).proxySet_(e,t):Gi(e,t);return(t?t.scope_:Pi()).drafts_.push(n),n}function ta(e){return hi(e)||pi(10,e),na(e)}function na(e){if(!gi(e)||Ai(e))return e;let t=e[fi],n;if(t){if(!t.modified_)return t.base_;t.finalized_=!0,n=Di(e,t.scope_.immer_.useStrictShallowCopy_)}else n=Di(e,!0);return yi(n,(e,t)=>{Si(n,e,na(t))}),t&&(t.finalized_=!1),n}var ra=new $i,ia=ra.produce;function aa(e){return e}function oa(e){return({dispatch:t,getState:n})=>r=>i=>typeof i==`function`?i(t,n,e):r(i)}var sa=oa(),ca=oa,la=typeof window<`u`&&window.__REDUX_DEVTOOLS_EXTENSION_COMPOSE__?window.__REDUX_DEVTOOLS_EXTENSION_COMPOSE__:function(){return arguments.length===0?void 0:typeof arguments[0]==`object`?si:si.apply(null,arguments)};typeof window<`u`&&window.__REDUX_DEVTOOLS_EXTENSION__&&window.__REDUX_DEVTOOLS_EXTENSION__;function ua(e,t){function n(...n){if(t){let r=t(...n);if(!r)throw Error(yo(0));return{type:e,payload:r.payload,...`meta`in r&&{meta:r.meta},...`error`in r&&{error:r.error}}}return{type:e,payload:n[0]}}return n.toString=()=>`${e}`,n.type=e,n.match=t=>li(t)&&t.type===e,n}var da=class e extends Array{constructor(...t){super(...t),Object.setPrototypeOf(this,e.prototype)}static get[Symbol.species](){return e}concat(...e){return super.concat.apply(this,e)}prepend(...t){return t.length===1&&Array.isArray(t[0])?new e(...t[0].concat(this)):new e(...t.concat(this))}};function fa(e){return gi(e)?ia(e,()=>{}):e}function pa(e,t,n){return e.has(t)?e.get(t):e.set(t,n(t)).get(t)}function ma(e){return typeof e==`boolean`}var ha=()=>function(e){let{thunk:t=!0,immutableCheck:n=!0,serializableCheck:r=!0,actionCreatorCheck:i=!0}=e??{},a=new da;return t&&(ma(t)?a.push(sa):a.push(ca(t.extraArgument))),a},ga=e=>t=>{setTimeout(t,e)},_a=(e={type:`raf`})=>t=>(...n)=>{let r=t(...n),i=!0,a=!1,o=!1,s=new Set,c=e.type===`tick`?queueMicrotask:e.type===`raf`?typeof window<`u`&&window.requestAnimationFrame?window.requestAnimationFrame:ga(10):e.type===`callback`?e.queueNotification:ga(e.timeout),l=()=>{o=!1,a&&(a=!1,s.forEach(e=>e()))};return Object.assign({},r,{subscribe(e){let t=r.subscribe(()=>i&&e());return s.add(e),()=>{t(),s.delete(e)}},dispatch(e){try{return i=!e?.meta?.RTK_autoBatch,a=!i,a&&(o||(o=!0,c(l))),r.dispatch(e)}finally{i=!0}}})},va=e=>function(t){let{autoBatch:n=!0}=t??{},r=new da(e);return n&&r.push(_a(typeof n==`object`?n:void 0)),r};function ya(e){let t=ha(),{reducer:n=void 0,middleware:r,devTools:i=!0,duplicateMiddlewareCheck:a=!0,preloadedState:o=void 0,enhancers:s=void 0}=e||{},c;if(typeof n==`function`)c=n;else if(ri(n))c=oi(n);else throw Error(yo(1));let l;l=typeof r==`function`?r(t):t();let u=si;i&&(u=la({trace:!1,...typeof i==`object`&&i}));let d=ci(...l),f=va(d),p=typeof s==`function`?s(f):f(),m=u(...p);return ii(c,o,m)}function ba(e){let t={},n=[],r,i={addCase(e,n){let r=typeof e==`string`?e:e.type;if(!r)throw Error(yo(28));if(r in t)throw Error(yo(29));return t[r]=n,i},addAsyncThunk(e,r){return r.pending&&(t[e.pending.type]=r.pending),r.rejected&&(t[e.rejected.type]=r.rejected),r.fulfilled&&(t[e.fulfilled.type]=r.fulfilled),r.settled&&n.push({matcher:e.settled,reducer:r.settled}),i},addMatcher(e,t){return n.push({matcher:e,reducer:t}),i},addDefaultCase(e){return r=e,i}};return e(i),[t,n,r]}function xa(e){return typeof e==`function`}function Sa(e,t){let[n,r,i]=ba(t),a;if(xa(e))a=()=>fa(e());else{let t=fa(e);a=()=>t}function o(e=a(),t){let o=[n[t.type],...r.filter(({matcher:e})=>e(t)).map(({reducer:e})=>e)];return o.filter(e=>!!e).length===0&&(o=[i]),o.reduce((e,n)=>{if(n)if(hi(e)){let r=n(e,t);return r===void 0?e:r}else if(gi(e))return ia(e,e=>n(e,t));else{let r=n(e,t);if(r===void 0){if(e===null)return e;throw Error(`A case reducer on a non-draftable value must not return undefined`)}return r}return e},e)}return o.getInitialState=a,o}var Ca=`ModuleSymbhasOwnPr-0123456789ABCDEFGHNRVfgctiUvz_KqYTJkLxpZXIjQW`,wa=(e=21)=>{let t=``,n=e;for(;n--;)t+=Ca[Math.random()*64|0];return t},Ta=Symbol.for(`rtk-slice-createasyncthunk`),Ea=(e=>(e.reducer=`reducer`,e.reducerWithPrepare=`reducerWithPrepare`,e.asyncThunk=`asyncThunk`,e))(Ea||{});function Da(e,t){return`${e}/${t}`}function Oa({creators:e}={}){let t=e?.asyncThunk?.[Ta];return function(e){let{name:n,reducerPath:r=n}=e;if(!n)throw Error(yo(11));let i=(typeof e.reducers==`function`?e.reducers(ja()):e.reducers)||{},a=Object.keys(i),o={sliceCaseReducersByName:{},sliceCaseReducersByType:{},actionCreators:{},sliceMatchers:[]},s={addCase(e,t){let n=typeof e==`string`?e:e.type;if(!n)throw Error(yo(12));if(n in o.sliceCaseReducersByType)throw Error(yo(13));return o.sliceCaseReducersByType[n]=t,s},addMatcher(e,t){return o.sliceMatchers.push({matcher:e,reducer:t}),s},exposeAction(e,t){return o.actionCreators[e]=t,s},exposeCaseReducer(e,t){return o.sliceCaseReducersByName[e]=t,s}};a.forEach(r=>{let a=i[r],o={reducerName:r,type:Da(n,r),createNotation:typeof e.reducers==`function`};Na(a)?Fa(o,a,s,t):Ma(o,a,s)});function c(){let[t={},n=[],r=void 0]=typeof e.extraReducers==`function`?ba(e.extraReducers):[e.extraReducers],i={...t,...o.sliceCaseReducersByType};return Sa(e.initialState,e=>{for(let t in i)e.addCase(t,i[t]);for(let t of o.sliceMatchers)e.addMatcher(t.matcher,t.reducer);for(let t of n)e.addMatcher(t.matcher,t.reducer);r&&e.addDefaultCase(r)})}let l=e=>e,u=new Map,d=new WeakMap,f;function p(e,t){return f||=c(),f(e,t)}function m(){return f||=c(),f.getInitialState()}function h(t,n=!1){function r(e){let i=e[t];return i===void 0&&n&&(i=pa(d,r,m)),i}function i(t=l){let r=pa(u,n,()=>new WeakMap);return pa(r,t,()=>{let r={};for(let[i,a]of Object.entries(e.selectors??{}))r[i]=ka(a,t,()=>pa(d,t,m),n);return r})}return{reducerPath:t,getSelectors:i,get selectors(){return i(r)},selectSlice:r}}let g={name:n,reducer:p,actions:o.actionCreators,caseReducers:o.sliceCaseReducersByName,getInitialState:m,...h(r),injectInto(e,{reducerPath:t,...n}={}){let i=t??r;return e.inject({reducerPath:i,reducer:p},n),{...g,...h(i,!0)}}};return g}}function ka(e,t,n,r){function i(i,...a){let o=t(i);return o===void 0&&r&&(o=n()),e(o,...a)}return i.unwrapped=e,i}var Aa=Oa();function ja(){function e(e,t){return{_reducerDefinitionType:`asyncThunk`,payloadCreator:e,...t}}return e.withTypes=()=>e,{reducer(e){return Object.assign({[e.name](...t){return e(...t)}}[e.name],{_reducerDefinitionType:`reducer`})},preparedReducer(e,t){return{_reducerDefinitionType:`reducerWithPrepare`,prepare:e,reducer:t}},asyncThunk:e}}function Ma({type:e,reducerName:t,createNotation:n},r,i){let a,o;if(`reducer`in r){if(n&&!Pa(r))throw Error(yo(17));a=r.reducer,o=r.prepare}else a=r;i.addCase(e,a).exposeCaseReducer(t,a).exposeAction(t,o?ua(e,o):ua(e))}function Na(e){return e._reducerDefinitionType===`asyncThunk`}function Pa(e){return e._reducerDefinitionType===`reducerWithPrepare`}function Fa({type:e,reducerName:t},n,r,i){if(!i)throw Error(yo(18));let{payloadCreator:a,fulfilled:o,pending:s,rejected:c,settled:l,options:u}=n,d=i(e,a,u);r.exposeAction(t,d),o&&r.addCase(d.fulfilled,o),s&&r.addCase(d.pending,s),c&&r.addCase(d.rejected,c),l&&r.addMatcher(d.settled,l),r.exposeCaseReducer(t,{fulfilled:o||Ia,pending:s||Ia,rejected:c||Ia,settled:l||Ia})}function Ia(){}var La=`task`,Ra=`listener`,za=`completed`,Ba=`cancelled`,Va=`task-${Ba}`,Ha=`task-${za}`,Ua=`${Ra}-${Ba}`,Wa=`${Ra}-${za}`,Ga=class{constructor(e){this.code=e,this.message=`${La} ${Ba} (reason: ${e})`}name=`TaskAbortError`;message},Ka=(e,t)=>{if(typeof e!=`function`)throw TypeError(yo(32))},qa=()=>{},Ja=(e,t=qa)=>(e.catch(t),e),Ya=(e,t)=>(e.addEventListener(`abort`,t,{once:!0}),()=>e.removeEventListener(`abort`,t)),Xa=(e,t)=>{let n=e.signal;n.aborted||(`reason`in n||Object.defineProperty(n,`reason`,{enumerable:!0,value:t,configurable:!0,writable:!0}),e.abort(t))},Za=e=>{if(e.aborted){let{reason:t}=e;throw new Ga(t)}};function Qa(e,t){let n=qa;return new Promise((r,i)=>{let a=()=>i(new Ga(e.reason));if(e.aborted){a();return}n=Ya(e,a),t.finally(()=>n()).then(r,i)}).finally(()=>{n=qa})}var $a=async(e,t)=>{try{return await Promise.resolve(),{status:`ok`,value:await e()}}catch(e){return{status:e instanceof Ga?`cancelled`:`rejected`,error:e}}finally{t?.()}},eo=e=>t=>Ja(Qa(e,t).then(t=>(Za(e),t))),to=e=>{let t=eo(e);return e=>t(new Promise(t=>setTimeout(t,e)))},{assign:no}=Object,ro={},io=`listenerMiddleware`,ao=(e,t)=>{let n=t=>Ya(e,()=>Xa(t,e.reason));return(r,i)=>{Ka(r,`taskExecutor`);let a=new AbortController;n(a);let o=$a(async()=>{Za(e),Za(a.signal);let t=await r({pause:eo(a.signal),delay:to(a.signal),signal:a.signal});return Za(a.signal),t},()=>Xa(a,Ha));return i?.autoJoin&&t.push(o.catch(qa)),{result:eo(e)(o),cancel(){Xa(a,Va)}}}},oo=(e,t)=>{let n=async(n,r)=>{Za(t);let i=()=>{},a=[new Promise((t,r)=>{let a=e({predicate:n,effect:(e,n)=>{n.unsubscribe(),t([e,n.getState(),n.getOriginalState()])}});i=()=>{a(),r()}})];r!=null&&a.push(new Promise(e=>setTimeout(e,r,null)));try{let e=await Qa(t,Promise.race(a));return Za(t),e}finally{i()}};return(e,t)=>Ja(n(e,t))},so=e=>{let{type:t,actionCreator:n,matcher:r,predicate:i,effect:a}=e;if(t)i=ua(t).match;else if(n)t=n.type,i=n.match;else if(r)i=r;else if(!i)throw Error(yo(21));return Ka(a,`options.listener`),{predicate:i,type:t,effect:a}},co=no(e=>{let{type:t,predicate:n,effect:r}=so(e);return{id:wa(),effect:r,type:t,predicate:n,pending:new Set,unsubscribe:()=>{throw Error(yo(22))}}},{withTypes:()=>co}),lo=(e,t)=>{let{type:n,effect:r,predicate:i}=so(t);return Array.from(e.values()).find(e=>(typeof n==`string`?e.type===n:e.predicate===i)&&e.effect===r)},uo=e=>{e.pending.forEach(e=>{Xa(e,Ua)})},fo=(e,t)=>()=>{for(let e of t.keys())uo(e);e.clear()},po=(e,t,n)=>{try{e(t,n)}catch(e){setTimeout(()=>{throw e},0)}},mo=no(ua(`${io}/add`),{withTypes:()=>mo}),ho=ua(`${io}/removeAll`),go=no(ua(`${io}/remove`),{withTypes:()=>go}),_o=(...e)=>{console.error(`${io}/error`,...e)},vo=(e={})=>{let t=new Map,n=new Map,r=e=>{let t=n.get(e)??0;n.set(e,t+1)},i=e=>{let t=n.get(e)??1;t===1?n.delete(e):n.set(e,t-1)},{extra:a,onError:o=_o}=e;Ka(o,`onError`);let s=e=>(e.unsubscribe=()=>t.delete(e.id),t.set(e.id,e),t=>{e.unsubscribe(),t?.cancelActive&&uo(e)}),c=e=>{let n=lo(t,e)??co(e);return s(n)};no(c,{withTypes:()=>c});let l=e=>{let n=lo(t,e);return n&&(n.unsubscribe(),e.cancelActive&&uo(n)),!!n};no(l,{withTypes:()=>l});let u=async(e,n,s,l)=>{let u=new AbortController,d=oo(c,u.signal),f=[];try{e.pending.add(u),r(e),await Promise.resolve(e.effect(n,no({},s,{getOriginalState:l,condition:(e,t)=>d(e,t).then(Boolean),take:d,delay:to(u.signal),pause:eo(u.signal),extra:a,signal:u.signal,fork:ao(u.signal,f),unsubscribe:e.unsubscribe,subscribe:()=>{t.set(e.id,e)},cancelActiveListeners:()=>{e.pending.forEach((e,t,n)=>{e!==u&&(Xa(e,Ua),n.delete(e))})},cancel:()=>{Xa(u,Ua),e.pending.delete(u)},throwIfCancelled:()=>{Za(u.signal)}})))}catch(e){e instanceof Ga||po(o,e,{raisedBy:`effect`})}finally{await Promise.all(f),Xa(u,Wa),i(e),e.pending.delete(u)}},d=fo(t,n);return{middleware:e=>n=>r=>{if(!li(r))return n(r);if(mo.match(r))return c(r.payload);if(ho.match(r)){d();return}if(go.match(r))return l(r.payload);let i=e.getState(),a=()=>{if(i===ro)throw Error(yo(23));return i},s;try{if(s=n(r),t.size>0){let n=e.getState(),s=Array.from(t.values());for(let t of s){let s=!1;try{s=t.predicate(r,n,i)}catch(e){s=!1,po(o,e,{raisedBy:`predicate`})}if(!s)continue;u(t,r,e,a)}}}finally{i=ro}return s},startListening:c,stopListening:l,clearListeners:d}};function yo(e){return`Minified Redux Toolkit error #${e}; visit https://redux-toolkit.js.org/Errors?code=${e} for the full message or use the non-minified dev environment for full errors. `}var bo=Aa({name:`chartLayout`,initialState:{layoutType:`horizontal`,width:0,height:0,margin:{top:5,right:5,bottom:5,left:5},scale:1},reducers:{setLayout(e,t){e.layoutType=t.payload},setChartSize(e,t){e.width=t.payload.width,e.height=t.payload.height},setMargin(e,t){e.margin.top=t.payload.top??0,e.margin.right=t.payload.right??0,e.margin.bottom=t.payload.bottom??0,e.margin.left=t.payload.left??0},setScale(e,t){e.scale=t.payload}}}),{setMargin:xo,setLayout:So,setChartSize:Co,setScale:wo}=bo.actions,To=bo.reducer;function Eo(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function Do(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?Eo(Object(n),!0).forEach(function(t){Oo(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Eo(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function Oo(e,t,n){return(t=ko(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function ko(e){var t=Ao(e,`string`);return typeof t==`symbol`?t:t+``}function Ao(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}var jo=Math.PI/180,Mo=e=>e*Math.PI/180,No=e=>e*180/Math.PI,R=(e,t,n,r)=>({x:e+Math.cos(-jo*r)*n,y:t+Math.sin(-jo*r)*n}),Po=function(e,t){var n=arguments.length>2&&arguments[2]!==void 0?arguments[2]:{top:0,right:0,bottom:0,left:0,width:0,height:0,brushBottom:0};return Math.min(Math.abs(e-(n.left||0)-(n.right||0)),Math.abs(t-(n.top||0)-(n.bottom||0)))/2},Fo=(e,t)=>{var{x:n,y:r}=e,{x:i,y:a}=t;return Math.sqrt((n-i)**2+(r-a)**2)},Io=(e,t)=>{var{x:n,y:r}=e,{cx:i,cy:a}=t,o=Fo({x:n,y:r},{x:i,y:a});if(o<=0)return{radius:o,angle:0};var s=(n-i)/o,c=Math.acos(s);return r>a&&(c=2*Math.PI-c),{radius:o,angle:No(c),angleInRadian:c}},Lo=e=>{var{startAngle:t,endAngle:n}=e,r=Math.floor(t/360),i=Math.floor(n/360),a=Math.min(r,i);return{startAngle:t-a*360,endAngle:n-a*360}},Ro=(e,t)=>{var{startAngle:n,endAngle:r}=t,i=Math.floor(n/360),a=Math.floor(r/360);return e+Math.min(i,a)*360},zo=(e,t)=>{var{x:n,y:r}=e,{radius:i,angle:a}=Io({x:n,y:r},t),{innerRadius:o,outerRadius:s}=t;if(i<o||i>s||i===0)return null;var{startAngle:c,endAngle:l}=Lo(t),u=a,d;if(c<=l){for(;u>l;)u-=360;for(;u<c;)u+=360;d=u>=c&&u<=l}else{for(;u>c;)u-=360;for(;u<l;)u+=360;d=u>=l&&u<=c}return d?Do(Do({},t),{},{radius:i,angle:Ro(u,t)}):null},Bo=e=>!(0,A.isValidElement)(e)&&typeof e!=`function`&&typeof e!=`boolean`&&e!=null?e.className:``;function Vo(e,t,n){return Array.isArray(e)&&e&&t+n!==0?e.slice(t,n+1):e}var Ho=e(Gr()),Uo=e(h());function Wo(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function Go(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?Wo(Object(n),!0).forEach(function(t){Ko(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Wo(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function Ko(e,t,n){return(t=qo(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function qo(e){var t=Jo(e,`string`);return typeof t==`symbol`?t:t+``}function Jo(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function z(e,t,n){return k(e)||k(t)?n:x(t)?(0,Uo.default)(e,t,n):typeof t==`function`?t(e):n}var Yo=(e,t,n,r,i)=>{var a=-1,o=t?.length??0;if(o<=1||e==null)return 0;if(r===`angleAxis`&&i!=null&&Math.abs(Math.abs(i[1]-i[0])-360)<=1e-6)for(var s=0;s<o;s++){var c=s>0?n[s-1].coordinate:n[o-1].coordinate,l=n[s].coordinate,u=s>=o-1?n[0].coordinate:n[s+1].coordinate,d=void 0;if(_(l-c)!==_(u-l)){var f=[];if(_(u-l)===_(i[1]-i[0])){d=u;var p=l+i[1]-i[0];f[0]=Math.min(p,(p+c)/2),f[1]=Math.max(p,(p+c)/2)}else{d=c;var m=u+i[1]-i[0];f[0]=Math.min(l,(m+l)/2),f[1]=Math.max(l,(m+l)/2)}var h=[Math.min(l,(d+l)/2),Math.max(l,(d+l)/2)];if(e>h[0]&&e<=h[1]||e>=f[0]&&e<=f[1]){({index:a}=n[s]);break}}else{var g=Math.min(c,u),v=Math.max(c,u);if(e>(g+l)/2&&e<=(v+l)/2){({index:a}=n[s]);break}}}else if(t){for(var y=0;y<o;y++)if(y===0&&e<=(t[y].coordinate+t[y+1].coordinate)/2||y>0&&y<o-1&&e>(t[y].coordinate+t[y-1].coordinate)/2&&e<=(t[y].coordinate+t[y+1].coordinate)/2||y===o-1&&e>(t[y].coordinate+t[y-1].coordinate)/2){({index:a}=t[y]);break}}return a},Xo=(e,t,n)=>{if(t&&n){var{width:r,height:i}=n,{align:a,verticalAlign:o,layout:s}=t;if((s===`vertical`||s===`horizontal`&&o===`middle`)&&a!==`center`&&b(e[a]))return Go(Go({},e),{},{[a]:e[a]+(r||0)});if((s===`horizontal`||s===`vertical`&&a===`center`)&&o!==`middle`&&b(e[o]))return Go(Go({},e),{},{[o]:e[o]+(i||0)})}return e},Zo=(e,t)=>e===`horizontal`&&t===`xAxis`||e===`vertical`&&t===`yAxis`||e===`centric`&&t===`angleAxis`||e===`radial`&&t===`radiusAxis`,Qo=(e,t,n,r)=>{if(r)return e.map(e=>e.coordinate);var i,a,o=e.map(e=>(e.coordinate===t&&(i=!0),e.coordinate===n&&(a=!0),e.coordinate));return i||o.push(t),a||o.push(n),o},$o=(e,t,n)=>{if(!e)return null;var{duplicateDomain:r,type:i,range:a,scale:o,realScaleType:s,isCategorical:c,categoricalDomain:l,tickCount:u,ticks:d,niceTicks:f,axisType:p}=e;if(!o)return null;var m=s===`scaleBand`&&o.bandwidth?o.bandwidth()/2:2,h=(t||n)&&i===`category`&&o.bandwidth?o.bandwidth()/m:0;return h=p===`angleAxis`&&a&&a.length>=2?_(a[0]-a[1])*2*h:h,t&&(d||f)?(d||f||[]).map((e,t)=>{var n=r?r.indexOf(e):e;return{coordinate:o(n)+h,value:e,offset:h,index:t}}).filter(e=>!v(e.coordinate)):c&&l?l.map((e,t)=>({coordinate:o(e)+h,value:e,index:t,offset:h})):o.ticks&&!n&&u!=null?o.ticks(u).map((e,t)=>({coordinate:o(e)+h,value:e,offset:h,index:t})):o.domain().map((e,t)=>({coordinate:o(e)+h,value:r?r[e]:e,index:t,offset:h}))},es=1e-4,ts=e=>{var t=e.domain();if(!(!t||t.length<=2)){var n=t.length,r=e.range(),i=Math.min(r[0],r[1])-es,a=Math.max(r[0],r[1])+es,o=e(t[0]),s=e(t[n-1]);(o<i||o>a||s<i||s>a)&&e.domain([t[0],t[n-1]])}},ns=(e,t)=>{if(!t||t.length!==2||!b(t[0])||!b(t[1]))return e;var n=Math.min(t[0],t[1]),r=Math.max(t[0],t[1]),i=[e[0],e[1]];return(!b(e[0])||e[0]<n)&&(i[0]=n),(!b(e[1])||e[1]>r)&&(i[1]=r),i[0]>r&&(i[0]=r),i[1]<n&&(i[1]=n),i},rs={sign:e=>{var t=e.length;if(!(t<=0))for(var n=0,r=e[0].length;n<r;++n)for(var i=0,a=0,o=0;o<t;++o){var s=v(e[o][n][1])?e[o][n][0]:e[o][n][1];s>=0?(e[o][n][0]=i,e[o][n][1]=i+s,i=e[o][n][1]):(e[o][n][0]=a,e[o][n][1]=a+s,a=e[o][n][1])}},expand:Qt,none:qt,silhouette:$t,wiggle:en,positive:e=>{var t=e.length;if(!(t<=0))for(var n=0,r=e[0].length;n<r;++n)for(var i=0,a=0;a<t;++a){var o=v(e[a][n][1])?e[a][n][0]:e[a][n][1];o>=0?(e[a][n][0]=i,e[a][n][1]=i+o,i=e[a][n][1]):(e[a][n][0]=0,e[a][n][1]=0)}}},os=(e,t,n)=>{var r=rs[n];return Zt().keys(t).value((e,t)=>+z(e,t,0)).order(Jt).offset(r)(e)};function ss(e){return e==null?void 0:String(e)}function cs(e){var{axis:t,ticks:n,bandSize:r,entry:i,index:a,dataKey:o}=e;if(t.type===`category`){if(!t.allowDuplicatedCategory&&t.dataKey&&!k(i[t.dataKey])){var s=O(n,`value`,i[t.dataKey]);if(s)return s.coordinate+r/2}return n[a]?n[a].coordinate+r/2:null}var c=z(i,k(o)?t.dataKey:o);return k(c)?null:t.scale(c)}var ls=e=>{var{axis:t,ticks:n,offset:r,bandSize:i,entry:a,index:o}=e;if(t.type===`category`)return n[o]?n[o].coordinate+r:null;var s=z(a,t.dataKey,t.scale.domain()[o]);return k(s)?null:t.scale(s)-i/2+r},us=e=>{var{numericAxis:t}=e,n=t.scale.domain();if(t.type===`number`){var r=Math.min(n[0],n[1]),i=Math.max(n[0],n[1]);return r<=0&&i>=0?0:i<0?i:r}return n[0]},ds=e=>{var t=e.flat(2).filter(b);return[Math.min(...t),Math.max(...t)]},fs=e=>[e[0]===1/0?0:e[0],e[1]===-1/0?0:e[1]],ps=(e,t,n)=>{if(e!=null)return fs(Object.keys(e).reduce((r,i)=>{var{stackedData:a}=e[i],o=a.reduce((e,r)=>{var i=Vo(r,t,n),a=ds(i);return[Math.min(e[0],a[0]),Math.max(e[1],a[1])]},[1/0,-1/0]);return[Math.min(o[0],r[0]),Math.max(o[1],r[1])]},[1/0,-1/0]))},ms=/^dataMin[\s]*-[\s]*([0-9]+([.]{1}[0-9]+){0,1})$/,hs=/^dataMax[\s]*\+[\s]*([0-9]+([.]{1}[0-9]+){0,1})$/,gs=(e,t,n)=>{if(e&&e.scale&&e.scale.bandwidth){var r=e.scale.bandwidth();if(!n||r>0)return r}if(e&&t&&t.length>=2){for(var i=(0,Ho.default)(t,e=>e.coordinate),a=1/0,o=1,s=i.length;o<s;o++){var c=i[o],l=i[o-1];a=Math.min((c.coordinate||0)-(l.coordinate||0),a)}return a===1/0?0:a}return n?void 0:0};function _s(e){var{tooltipEntrySettings:t,dataKey:n,payload:r,value:i,name:a}=e;return Go(Go({},t),{},{dataKey:n,payload:r,value:i,name:a})}function vs(e,t){if(e)return String(e);if(typeof t==`string`)return t}function ys(e,t,n,r,i){return n===`horizontal`||n===`vertical`?e>=i.left&&e<=i.left+i.width&&t>=i.top&&t<=i.top+i.height?{x:e,y:t}:null:r?zo({x:e,y:t},r):null}var bs=(e,t,n,r)=>{var i=t.find(e=>e&&e.index===n);if(i){if(e===`horizontal`)return{x:i.coordinate,y:r.y};if(e===`vertical`)return{x:r.x,y:i.coordinate};if(e===`centric`){var a=i.coordinate,{radius:o}=r;return Go(Go(Go({},r),R(r.cx,r.cy,o,a)),{},{angle:a,radius:o})}var s=i.coordinate,{angle:c}=r;return Go(Go(Go({},r),R(r.cx,r.cy,s,c)),{},{angle:c,radius:s})}return{x:0,y:0}},xs=(e,t)=>t===`horizontal`?e.x:t===`vertical`?e.y:t===`centric`?e.angle:e.radius,Ss=e=>e.layout.width,Cs=e=>e.layout.height,ws=e=>e.layout.scale,Ts=e=>e.layout.margin,Es=L(e=>e.cartesianAxis.xAxis,e=>Object.values(e)),Ds=L(e=>e.cartesianAxis.yAxis,e=>Object.values(e)),Os=[`#1890FF`,`#66B5FF`,`#41D9C7`,`#2FC25B`,`#6EDB8F`,`#9AE65C`,`#FACC14`,`#E6965C`,`#57AD71`,`#223273`,`#738AE6`,`#7564CC`,`#8543E0`,`#A877ED`,`#5C8EE6`,`#13C2C2`,`#70E0E0`,`#5CA3E6`,`#3436C7`,`#8082FF`,`#DD81E6`,`#F04864`,`#FA7D92`,`#D598D9`],ks=`data-recharts-item-index`,As=`data-recharts-item-data-key`;function js(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function Ms(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?js(Object(n),!0).forEach(function(t){Ns(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):js(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function Ns(e,t,n){return(t=Ps(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Ps(e){var t=Fs(e,`string`);return typeof t==`symbol`?t:t+``}function Fs(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}var Is=e=>e.brush.height;function Ls(e){return Ds(e).reduce((e,t)=>{if(t.orientation===`left`&&!t.mirror&&!t.hide){var n=typeof t.width==`number`?t.width:60;return e+n}return e},0)}function Rs(e){return Ds(e).reduce((e,t)=>{if(t.orientation===`right`&&!t.mirror&&!t.hide){var n=typeof t.width==`number`?t.width:60;return e+n}return e},0)}function zs(e){return Es(e).reduce((e,t)=>t.orientation===`top`&&!t.mirror&&!t.hide?e+t.height:e,0)}function Bs(e){return Es(e).reduce((e,t)=>t.orientation===`bottom`&&!t.mirror&&!t.hide?e+t.height:e,0)}var Vs=L([Ss,Cs,Ts,Is,Ls,Rs,zs,Bs,qr,Jr],(e,t,n,r,i,a,o,s,c,l)=>{var u={left:(n.left||0)+i,right:(n.right||0)+a},d={top:(n.top||0)+o,bottom:(n.bottom||0)+s},f=Ms(Ms({},d),u),p=f.bottom;f.bottom+=r,f=Xo(f,c,l);var m=e-f.left-f.right,h=t-f.top-f.bottom;return Ms(Ms({brushBottom:p},f),{},{width:Math.max(m,0),height:Math.max(h,0)})}),Hs=L(Vs,e=>({x:e.left,y:e.top,width:e.width,height:e.height})),Us=L(Ss,Cs,(e,t)=>({x:0,y:0,width:e,height:t})),Ws=(0,A.createContext)(null),B=()=>(0,A.useContext)(Ws)!=null,Gs=e=>{var{children:t}=e;return A.createElement(Ws.Provider,{value:!0},t)},Ks=e=>e.brush,qs=L([Ks,Vs,Ts],(e,t,n)=>({height:e.height,x:b(e.x)?e.x:t.left,y:b(e.y)?e.y:t.top+t.height+t.brushBottom-(n?.bottom||0),width:b(e.width)?e.width:t.width})),Js=()=>{var e=B(),t=I(Hs),n=I(qs),r=I(Ks)?.padding;return!e||!n||!r?t:{width:n.width-r.left-r.right,height:n.height-r.top-r.bottom,x:r.left,y:r.top}},Ys={top:0,bottom:0,left:0,right:0,width:0,height:0,brushBottom:0},Xs=()=>I(Vs)??Ys,Zs=()=>I(Ss),Qs=()=>I(Cs),$s=()=>I(e=>e.layout.margin),V=e=>e.layout.layoutType,ec=()=>I(V),tc=e=>{var t=F();return(0,A.useEffect)(()=>{t(Co(e))},[t,e]),null},nc=e=>{var{margin:t}=e,n=F();return(0,A.useEffect)(()=>{n(xo(t))},[n,t]),null},rc=Aa({name:`legend`,initialState:{settings:{layout:`horizontal`,align:`center`,verticalAlign:`middle`,itemSorter:`value`},size:{width:0,height:0},payload:[]},reducers:{setLegendSize(e,t){e.size.width=t.payload.width,e.size.height=t.payload.height},setLegendSettings(e,t){e.settings.align=t.payload.align,e.settings.layout=t.payload.layout,e.settings.verticalAlign=t.payload.verticalAlign,e.settings.itemSorter=t.payload.itemSorter},addLegendPayload(e,t){e.payload.push(aa(t.payload))},removeLegendPayload(e,t){var n=ta(e).payload.indexOf(aa(t.payload));n>-1&&e.payload.splice(n,1)}}}),{setLegendSize:ic,setLegendSettings:ac,addLegendPayload:oc,removeLegendPayload:sc}=rc.actions,cc=rc.reducer,lc=e(i()),uc=[`contextPayload`];function dc(){return dc=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},dc.apply(null,arguments)}function fc(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function pc(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?fc(Object(n),!0).forEach(function(t){mc(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):fc(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function mc(e,t,n){return(t=hc(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function hc(e){var t=gc(e,`string`);return typeof t==`symbol`?t:t+``}function gc(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function _c(e,t){if(e==null)return{};var n,r,i=vc(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function vc(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}function yc(e){return e.value}function bc(e){var{contextPayload:t}=e,n=_c(e,uc),r=$n(t,e.payloadUniqBy,yc),i=pc(pc({},n),{},{payload:r});return A.isValidElement(e.content)?A.cloneElement(e.content,i):typeof e.content==`function`?A.createElement(e.content,i):A.createElement(wn,i)}function xc(e,t,n,r,i,a){var{layout:o,align:s,verticalAlign:c}=t,l,u;return(!e||(e.left===void 0||e.left===null)&&(e.right===void 0||e.right===null))&&(l=s===`center`&&o===`vertical`?{left:((r||0)-a.width)/2}:s===`right`?{right:n&&n.right||0}:{left:n&&n.left||0}),(!e||(e.top===void 0||e.top===null)&&(e.bottom===void 0||e.bottom===null))&&(u=c===`middle`?{top:((i||0)-a.height)/2}:c===`bottom`?{bottom:n&&n.bottom||0}:{top:n&&n.top||0}),pc(pc({},l),u)}function Sc(e){var t=F();return(0,A.useEffect)(()=>{t(ac(e))},[t,e]),null}function Cc(e){var t=F();return(0,A.useEffect)(()=>(t(ic(e)),()=>{t(ic({width:0,height:0}))}),[t,e]),null}function wc(e){var t=Xr(),n=je(),r=$s(),{width:i,height:a,wrapperStyle:o,portal:s}=e,[c,l]=Qr([t]),u=Zs(),d=Qs();if(u==null||d==null)return null;var f=u-(r.left||0)-(r.right||0),p=Tc.getWidthOrHeight(e.layout,a,i,f),m=s?o:pc(pc({position:`absolute`,width:p?.width||i||`auto`,height:p?.height||a||`auto`},xc(o,e,r,u,d,c)),o),h=s??n;if(h==null)return null;var g=A.createElement(`div`,{className:`recharts-legend-wrapper`,style:m,ref:l},A.createElement(Sc,{layout:e.layout,align:e.align,verticalAlign:e.verticalAlign,itemSorter:e.itemSorter}),A.createElement(Cc,{width:c.width,height:c.height}),A.createElement(bc,dc({},e,p,{margin:r,chartWidth:u,chartHeight:d,contextPayload:t})));return(0,lc.createPortal)(g,h)}var Tc=class extends A.PureComponent{static getWidthOrHeight(e,t,n,r){return e===`vertical`&&b(t)?{height:t}:e===`horizontal`?{width:n||r}:null}render(){return A.createElement(wc,this.props)}};mc(Tc,`displayName`,`Legend`),mc(Tc,`defaultProps`,{align:`center`,iconSize:14,itemSorter:`value`,layout:`horizontal`,verticalAlign:`bottom`});var Ec=e(Gr());function Dc(){return Dc=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Dc.apply(null,arguments)}function Oc(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function kc(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?Oc(Object(n),!0).forEach(function(t){Ac(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Oc(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function Ac(e,t,n){return(t=jc(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function jc(e){var t=Mc(e,`string`);return typeof t==`symbol`?t:t+``}function Mc(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function Nc(e){return Array.isArray(e)&&x(e[0])&&x(e[1])?e.join(` ~ `):e}var Pc=e=>{var{separator:t=` : `,contentStyle:n={},itemStyle:r={},labelStyle:i={},payload:a,formatter:o,itemSorter:s,wrapperClassName:l,labelClassName:u,label:d,labelFormatter:f,accessibilityLayer:p=!1}=e,m=()=>{if(a&&a.length){var e={padding:0,margin:0},n=(s?(0,Ec.default)(a,s):a).map((e,n)=>{if(e.type===`none`)return null;var i=e.formatter||o||Nc,{value:s,name:c}=e,l=s,u=c;if(i){var d=i(s,c,e,n,a);if(Array.isArray(d))[l,u]=d;else if(d!=null)l=d;else return null}var f=kc({display:`block`,paddingTop:4,paddingBottom:4,color:e.color||`#000`},r);return A.createElement(`li`,{className:`recharts-tooltip-item`,key:`tooltip-item-${n}`,style:f},x(u)?A.createElement(`span`,{className:`recharts-tooltip-item-name`},u):null,x(u)?A.createElement(`span`,{className:`recharts-tooltip-item-separator`},t):null,A.createElement(`span`,{className:`recharts-tooltip-item-value`},l),A.createElement(`span`,{className:`recharts-tooltip-item-unit`},e.unit||``))});return A.createElement(`ul`,{className:`recharts-tooltip-item-list`,style:e},n)}return null},h=kc({margin:0,padding:10,backgroundColor:`#fff`,border:`1px solid #ccc`,whiteSpace:`nowrap`},n),g=kc({margin:0},i),_=!k(d),v=_?d:``,y=c(`recharts-default-tooltip`,l),b=c(`recharts-tooltip-label`,u);_&&f&&a!=null&&(v=f(d,a));var S=p?{role:`status`,"aria-live":`assertive`}:{};return A.createElement(`div`,Dc({className:y,style:h},S),A.createElement(`p`,{className:b,style:g},A.isValidElement(v)?v:`${v}`),m())},Fc=`recharts-tooltip-wrapper`,Ic={visibility:`hidden`};function Lc(e){var{coordinate:t,translateX:n,translateY:r}=e;return c(Fc,{[`${Fc}-right`]:b(n)&&t&&b(t.x)&&n>=t.x,[`${Fc}-left`]:b(n)&&t&&b(t.x)&&n<t.x,[`${Fc}-bottom`]:b(r)&&t&&b(t.y)&&r>=t.y,[`${Fc}-top`]:b(r)&&t&&b(t.y)&&r<t.y})}function Rc(e){var{allowEscapeViewBox:t,coordinate:n,key:r,offsetTopLeft:i,position:a,reverseDirection:o,tooltipDimension:s,viewBox:c,viewBoxDimension:l}=e;if(a&&b(a[r]))return a[r];var u=n[r]-s-(i>0?i:0),d=n[r]+i;if(t[r])return o[r]?u:d;var f=c[r];if(f==null)return 0;if(o[r])return u<f?Math.max(d,f):Math.max(u,f);if(l==null)return 0;var p=d+s,m=f+l;return p>m?Math.max(u,f):Math.max(d,f)}function zc(e){var{translateX:t,translateY:n,useTranslate3d:r}=e;return{transform:r?`translate3d(${t}px, ${n}px, 0)`:`translate(${t}px, ${n}px)`}}function Bc(e){var{allowEscapeViewBox:t,coordinate:n,offsetTopLeft:r,position:i,reverseDirection:a,tooltipBox:o,useTranslate3d:s,viewBox:c}=e,l,u,d;return o.height>0&&o.width>0&&n?(u=Rc({allowEscapeViewBox:t,coordinate:n,key:`x`,offsetTopLeft:r,position:i,reverseDirection:a,tooltipDimension:o.width,viewBox:c,viewBoxDimension:c.width}),d=Rc({allowEscapeViewBox:t,coordinate:n,key:`y`,offsetTopLeft:r,position:i,reverseDirection:a,tooltipDimension:o.height,viewBox:c,viewBoxDimension:c.height}),l=zc({translateX:u,translateY:d,useTranslate3d:s})):l=Ic,{cssProperties:l,cssClasses:Lc({translateX:u,translateY:d,coordinate:n})}}function Vc(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function Hc(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?Vc(Object(n),!0).forEach(function(t){Uc(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Vc(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function Uc(e,t,n){return(t=Wc(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Wc(e){var t=Gc(e,`string`);return typeof t==`symbol`?t:t+``}function Gc(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}var Kc=class extends A.PureComponent{constructor(){super(...arguments),Uc(this,`state`,{dismissed:!1,dismissedAtCoordinate:{x:0,y:0}}),Uc(this,`handleKeyDown`,e=>{e.key===`Escape`&&this.setState({dismissed:!0,dismissedAtCoordinate:{x:this.props.coordinate?.x??0,y:this.props.coordinate?.y??0}})})}componentDidMount(){document.addEventListener(`keydown`,this.handleKeyDown)}componentWillUnmount(){document.removeEventListener(`keydown`,this.handleKeyDown)}componentDidUpdate(){this.state.dismissed&&(this.props.coordinate?.x!==this.state.dismissedAtCoordinate.x||this.props.coordinate?.y!==this.state.dismissedAtCoordinate.y)&&(this.state.dismissed=!1)}render(){var{active:e,allowEscapeViewBox:t,animationDuration:n,animationEasing:r,children:i,coordinate:a,hasPayload:o,isAnimationActive:s,offset:c,position:l,reverseDirection:u,useTranslate3d:d,viewBox:f,wrapperStyle:p,lastBoundingBox:m,innerRef:h,hasPortalFromProps:g}=this.props,{cssClasses:_,cssProperties:v}=Bc({allowEscapeViewBox:t,coordinate:a,offsetTopLeft:c,position:l,reverseDirection:u,tooltipBox:{height:m.height,width:m.width},useTranslate3d:d,viewBox:f}),y=g?{}:Hc(Hc({transition:s&&e?`transform ${n}ms ${r}`:void 0},v),{},{pointerEvents:`none`,visibility:!this.state.dismissed&&e&&o?`visible`:`hidden`,position:`absolute`,top:0,left:0}),b=Hc(Hc({},y),{},{visibility:!this.state.dismissed&&e&&o?`visible`:`hidden`},p);return A.createElement(`div`,{xmlns:`http://www.w3.org/1999/xhtml`,tabIndex:-1,className:_,style:b,ref:h},i)}},qc={devToolsEnabled:!1,isSsr:(()=>!(typeof window<`u`&&window.document&&window.document.createElement&&window.setTimeout))()},Jc=()=>I(e=>e.rootProps.accessibilityLayer);function Yc(e){return Number.isFinite(e)}function Xc(e){return typeof e==`number`&&e>0&&Number.isFinite(e)}function Zc(){return Zc=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Zc.apply(null,arguments)}function Qc(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function $c(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?Qc(Object(n),!0).forEach(function(t){el(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Qc(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function el(e,t,n){return(t=tl(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function tl(e){var t=nl(e,`string`);return typeof t==`symbol`?t:t+``}function nl(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}var rl={curveBasisClosed:Et,curveBasisOpen:Ot,curveBasis:wt,curveBumpX:et,curveBumpY:tt,curveLinearClosed:At,curveLinear:Je,curveMonotoneX:Rt,curveMonotoneY:zt,curveNatural:Ht,curveStep:Wt,curveStepAfter:Kt,curveStepBefore:Gt},il=e=>Yc(e.x)&&Yc(e.y),al=e=>e.x,ol=e=>e.y,sl=(e,t)=>{if(typeof e==`function`)return e;var n=`curve${te(e)}`;return(n===`curveMonotone`||n===`curveBump`)&&t?rl[`${n}${t===`vertical`?`Y`:`X`}`]:rl[n]||Je},cl=e=>{var{type:t=`linear`,points:n=[],baseLine:r,layout:i,connectNulls:a=!1}=e,o=sl(t,i),s=a?n.filter(il):n,c;if(Array.isArray(r)){var l=a?r.filter(e=>il(e)):r,u=s.map((e,t)=>$c($c({},e),{},{base:l[t]}));return c=i===`vertical`?Qe().y(ol).x1(al).x0(e=>e.base.x):Qe().x(al).y1(ol).y0(e=>e.base.y),c.defined(il).curve(o),c(u)}return c=i===`vertical`&&b(r)?Qe().y(ol).x1(al).x0(r):b(r)?Qe().x(al).y1(ol).y0(r):Ze().x(al).y(ol),c.defined(il).curve(o),c(s)},ll=e=>{var{className:t,points:n,path:r,pathRef:i}=e;if((!n||!n.length)&&!r)return null;var a=n&&n.length?cl(e):r;return A.createElement(`path`,Zc({},j(e),se(e),{className:c(`recharts-curve`,t),d:a===null?void 0:a,ref:i}))},ul=[`x`,`y`,`top`,`left`,`width`,`height`,`className`];function dl(){return dl=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},dl.apply(null,arguments)}function fl(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function pl(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?fl(Object(n),!0).forEach(function(t){ml(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):fl(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function ml(e,t,n){return(t=hl(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function hl(e){var t=gl(e,`string`);return typeof t==`symbol`?t:t+``}function gl(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function _l(e,t){if(e==null)return{};var n,r,i=vl(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function vl(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}var yl=(e,t,n,r,i,a)=>`M${e},${i}v${r}M${a},${t}h${n}`,bl=e=>{var{x:t=0,y:n=0,top:r=0,left:i=0,width:a=0,height:o=0,className:s}=e,l=_l(e,ul),u=pl({x:t,y:n,top:r,left:i,width:a,height:o},l);return!b(t)||!b(n)||!b(a)||!b(o)||!b(r)||!b(i)?null:A.createElement(`path`,dl({},M(u,!0),{className:c(`recharts-cross`,s),d:yl(t,n,a,o,r,i)}))};function xl(e,t,n,r){var i=r/2;return{stroke:`none`,fill:`#ccc`,x:e===`horizontal`?t.x-i:n.left+.5,y:e===`horizontal`?n.top+.5:t.y-i,width:e===`horizontal`?r:n.width-1,height:e===`horizontal`?n.height-1:r}}function Sl(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function Cl(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?Sl(Object(n),!0).forEach(function(t){wl(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Sl(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function wl(e,t,n){return(t=Tl(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Tl(e){var t=El(e,`string`);return typeof t==`symbol`?t:t+``}function El(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function H(e,t){var n=Cl({},e),r=t;return Object.keys(t).reduce((e,t)=>(e[t]===void 0&&r[t]!==void 0&&(e[t]=r[t]),e),n)}function Dl(){}function Ol(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function kl(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?Ol(Object(n),!0).forEach(function(t){Al(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Ol(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function Al(e,t,n){return(t=jl(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function jl(e){var t=Ml(e,`string`);return typeof t==`symbol`?t:t+``}function Ml(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}var Nl=e=>e.replace(/([A-Z])/g,e=>`-${e.toLowerCase()}`),Pl=(e,t,n)=>e.map(e=>`${Nl(e)} ${t}ms ${n}`).join(`,`),Fl=(e,t)=>[Object.keys(e),Object.keys(t)].reduce((e,t)=>e.filter(e=>t.includes(e))),Il=(e,t)=>Object.keys(t).reduce((n,r)=>kl(kl({},n),{},{[r]:e(r,t[r])}),{});function Ll(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function Rl(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?Ll(Object(n),!0).forEach(function(t){zl(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Ll(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function zl(e,t,n){return(t=Bl(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Bl(e){var t=Vl(e,`string`);return typeof t==`symbol`?t:t+``}function Vl(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}var Hl=(e,t,n)=>e+(t-e)*n,Ul=e=>{var{from:t,to:n}=e;return t!==n},Wl=(e,t,n)=>{var r=Il((t,n)=>{if(Ul(n)){var[r,i]=e(n.from,n.to,n.velocity);return Rl(Rl({},n),{},{from:r,velocity:i})}return n},t);return n<1?Il((e,t)=>Ul(t)?Rl(Rl({},t),{},{velocity:Hl(t.velocity,r[e].velocity,n),from:Hl(t.from,r[e].from,n)}):t,t):Wl(e,r,n-1)};function Gl(e,t,n,r,i,a){var o,s=r.reduce((n,r)=>Rl(Rl({},n),{},{[r]:{from:e[r],velocity:0,to:t[r]}}),{}),c=()=>Il((e,t)=>t.from,s),l=()=>!Object.values(s).filter(Ul).length,u=null,d=r=>{o||=r;var f=(r-o)/n.dt;s=Wl(n,s,f),i(Rl(Rl(Rl({},e),t),c())),o=r,l()||(u=a.setTimeout(d))};return()=>(u=a.setTimeout(d),()=>{u()})}function Kl(e,t,n,r,i,a,o){var s=null,c=i.reduce((n,r)=>Rl(Rl({},n),{},{[r]:[e[r],t[r]]}),{}),l,u=i=>{l||=i;var d=(i-l)/r,f=Il((e,t)=>Hl(...t,n(d)),c);if(a(Rl(Rl(Rl({},e),t),f)),d<1)s=o.setTimeout(u);else{var p=Il((e,t)=>Hl(...t,n(1)),c);a(Rl(Rl(Rl({},e),t),p))}};return()=>(s=o.setTimeout(u),()=>{s()})}var ql=(e,t,n,r,i,a)=>{var o=Fl(e,t);return n.isStepper===!0?Gl(e,t,n,o,i,a):Kl(e,t,n,r,o,i,a)},Jl=(e,t)=>[0,3*e,3*t-6*e,3*e-3*t+1],Yl=(e,t)=>e.map((e,n)=>e*t**n).reduce((e,t)=>e+t),Xl=(e,t)=>n=>{var r=Jl(e,t);return Yl(r,n)},Zl=(e,t)=>n=>{var r=[...Jl(e,t).map((e,t)=>e*t).slice(1),0];return Yl(r,n)},Ql=function(){var e,t,n,r,i=[...arguments];if(i.length===1)switch(i[0]){case`linear`:[e,n,t,r]=[0,0,1,1];break;case`ease`:[e,n,t,r]=[.25,.1,.25,1];break;case`ease-in`:[e,n,t,r]=[.42,0,1,1];break;case`ease-out`:[e,n,t,r]=[.42,0,.58,1];break;case`ease-in-out`:[e,n,t,r]=[0,0,.58,1];break;default:var a=i[0].split(`(`);a[0]===`cubic-bezier`&&a[1].split(`)`)[0].split(`,`).length===4&&([e,n,t,r]=a[1].split(`)`)[0].split(`,`).map(e=>parseFloat(e)))}else i.length===4&&([e,n,t,r]=i);var o=Xl(e,t),s=Xl(n,r),c=Zl(e,t),l=e=>e>1?1:e<0?0:e,u=e=>{for(var t=e>1?1:e,n=t,r=0;r<8;++r){var i=o(n)-t,a=c(n);if(Math.abs(i-t)<1e-4||a<1e-4)return s(n);n=l(n-i/a)}return s(n)};return u.isStepper=!1,u},$l=function(){var{stiff:e=100,damping:t=8,dt:n=17}=arguments.length>0&&arguments[0]!==void 0?arguments[0]:{},r=(r,i,a)=>{var o=-(r-i)*e,s=a*t,c=a+(o-s)*n/1e3,l=a*n/1e3+r;return Math.abs(l-i)<1e-4&&Math.abs(c)<1e-4?[i,0]:[l,c]};return r.isStepper=!0,r.dt=n,r},eu=e=>{if(typeof e==`string`)switch(e){case`ease`:case`ease-in-out`:case`ease-out`:case`ease-in`:case`linear`:return Ql(e);case`spring`:return $l();default:if(e.split(`(`)[0]===`cubic-bezier`)return Ql(e)}return typeof e==`function`?e:null};function tu(e){var t,n=()=>null,r=!1,i=null,a=o=>{if(!r){if(Array.isArray(o)){if(!o.length)return;var[s,...c]=o;if(typeof s==`number`){i=e.setTimeout(a.bind(null,c),s);return}a(s),i=e.setTimeout(a.bind(null,c));return}typeof o==`string`&&(t=o,n(t)),typeof o==`object`&&(t=o,n(t)),typeof o==`function`&&o()}};return{stop:()=>{r=!0},start:e=>{r=!1,i&&=(i(),null),a(e)},subscribe:e=>(n=e,()=>{n=()=>null}),getTimeoutController:()=>e}}var nu=class{setTimeout(e){var t=arguments.length>1&&arguments[1]!==void 0?arguments[1]:0,n=performance.now(),r=null,i=a=>{a-n>=t?e(a):typeof requestAnimationFrame==`function`&&(r=requestAnimationFrame(i))};return r=requestAnimationFrame(i),()=>{cancelAnimationFrame(r)}}};function ru(){return tu(new nu)}var iu=(0,A.createContext)(ru);function au(e,t){var n=(0,A.useContext)(iu);return(0,A.useMemo)(()=>t??n(e),[e,t,n])}var ou={begin:0,duration:1e3,easing:`ease`,isActive:!0,canBegin:!0,onAnimationEnd:()=>{},onAnimationStart:()=>{}},su={t:0},cu={t:1};function lu(e){var t=H(e,ou),{isActive:n,canBegin:r,duration:i,easing:a,begin:o,onAnimationEnd:s,onAnimationStart:c,children:l}=t,u=au(t.animationId,t.animationManager),[d,f]=(0,A.useState)(n?su:cu),p=(0,A.useRef)(null);return(0,A.useEffect)(()=>{n||f(cu)},[n]),(0,A.useEffect)(()=>{if(!n||!r)return Dl;var e=ql(su,cu,eu(a),i,f,u.getTimeoutController());return u.start([c,o,()=>{p.current=e()},i,s]),()=>{u.stop(),p.current&&p.current(),s()}},[n,r,i,a,o,c,s,u]),l(d.t)}function uu(e){var t=arguments.length>1&&arguments[1]!==void 0?arguments[1]:`animation-`,n=(0,A.useRef)(C(t)),r=(0,A.useRef)(e);return r.current!==e&&(n.current=C(t),r.current=e),n.current}function du(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function fu(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?du(Object(n),!0).forEach(function(t){pu(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):du(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function pu(e,t,n){return(t=mu(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function mu(e){var t=hu(e,`string`);return typeof t==`symbol`?t:t+``}function hu(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function gu(){return gu=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},gu.apply(null,arguments)}var _u=(e,t,n,r,i)=>{var a=Math.min(Math.abs(n)/2,Math.abs(r)/2),o=r>=0?1:-1,s=n>=0?1:-1,c=r>=0&&n>=0||r<0&&n<0?1:0,l;if(a>0&&i instanceof Array){for(var u=[0,0,0,0],d=0,f=4;d<f;d++)u[d]=i[d]>a?a:i[d];l=`M${e},${t+o*u[0]}`,u[0]>0&&(l+=`A ${u[0]},${u[0]},0,0,${c},${e+s*u[0]},${t}`),l+=`L ${e+n-s*u[1]},${t}`,u[1]>0&&(l+=`A ${u[1]},${u[1]},0,0,${c},
-        ${e+n},${t+o*u[1]}`),l+=`L ${e+n},${t+r-o*u[2]}`,u[2]>0&&(l+=`A ${u[2]},${u[2]},0,0,${c},
-        ${e+n-s*u[2]},${t+r}`),l+=`L ${e+s*u[3]},${t+r}`,u[3]>0&&(l+=`A ${u[3]},${u[3]},0,0,${c},
-        ${e},${t+r-o*u[3]}`),l+=`Z`}else if(a>0&&i===+i&&i>0){var p=Math.min(a,i);l=`M ${e},${t+o*p}
-            A ${p},${p},0,0,${c},${e+s*p},${t}
-            L ${e+n-s*p},${t}
-            A ${p},${p},0,0,${c},${e+n},${t+o*p}
-            L ${e+n},${t+r-o*p}
-            A ${p},${p},0,0,${c},${e+n-s*p},${t+r}
-            L ${e+s*p},${t+r}
-            A ${p},${p},0,0,${c},${e},${t+r-o*p} Z`}else l=`M ${e},${t} h ${n} v ${r} h ${-n} Z`;return l},vu={x:0,y:0,width:0,height:0,radius:0,isAnimationActive:!1,isUpdateAnimationActive:!1,animationBegin:0,animationDuration:1500,animationEasing:`ease`},yu=e=>{var t=H(e,vu),n=(0,A.useRef)(null),[r,i]=(0,A.useState)(-1);(0,A.useEffect)(()=>{if(n.current&&n.current.getTotalLength)try{var e=n.current.getTotalLength();e&&i(e)}catch{}},[]);var{x:a,y:o,width:s,height:l,radius:u,className:d}=t,{animationEasing:f,animationDuration:p,animationBegin:m,isAnimationActive:h,isUpdateAnimationActive:g}=t,_=(0,A.useRef)(s),v=(0,A.useRef)(l),y=(0,A.useRef)(a),b=(0,A.useRef)(o),x=(0,A.useMemo)(()=>({x:a,y:o,width:s,height:l,radius:u}),[a,o,s,l,u]),S=uu(x,`rectangle-`);if(a!==+a||o!==+o||s!==+s||l!==+l||s===0||l===0)return null;var C=c(`recharts-rectangle`,d);if(!g)return A.createElement(`path`,gu({},M(t,!0),{className:C,d:_u(a,o,s,l,u)}));var w=_.current,T=v.current,E=y.current,O=b.current,ee=`0px ${r===-1?1:r}px`,k=`${r}px 0px`,te=Pl([`strokeDasharray`],p,typeof f==`string`?f:void 0);return A.createElement(lu,{animationId:S,key:S,canBegin:r>0,duration:p,easing:f,isActive:g,begin:m},e=>{var r=D(w,s,e),i=D(T,l,e),c=D(E,a,e),d=D(O,o,e);n.current&&(_.current=r,v.current=i,y.current=c,b.current=d);var f=h?e>0?{transition:te,strokeDasharray:k}:{strokeDasharray:ee}:{strokeDasharray:k};return A.createElement(`path`,gu({},M(t,!0),{className:C,d:_u(c,d,r,i,u),ref:n,style:fu(fu({},f),t.style)}))})};function bu(e){var{cx:t,cy:n,radius:r,startAngle:i,endAngle:a}=e,o=R(t,n,r,i),s=R(t,n,r,a);return{points:[o,s],cx:t,cy:n,radius:r,startAngle:i,endAngle:a}}function xu(){return xu=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},xu.apply(null,arguments)}var Su=(e,t)=>{var n=_(t-e),r=Math.min(Math.abs(t-e),359.999);return n*r},Cu=e=>{var{cx:t,cy:n,radius:r,angle:i,sign:a,isExternal:o,cornerRadius:s,cornerIsExternal:c}=e,l=s*(o?1:-1)+r,u=Math.asin(s/l)/jo,d=c?i:i+a*u,f=R(t,n,l,d),p=R(t,n,r,d),m=c?i-a*u:i,h=R(t,n,l*Math.cos(u*jo),m);return{center:f,circleTangency:p,lineTangency:h,theta:u}},wu=e=>{var{cx:t,cy:n,innerRadius:r,outerRadius:i,startAngle:a,endAngle:o}=e,s=Su(a,o),c=a+s,l=R(t,n,i,a),u=R(t,n,i,c),d=`M ${l.x},${l.y}
-    A ${i},${i},0,
-    ${+(Math.abs(s)>180)},${+(a>c)},
-    ${u.x},${u.y}
-  `;if(r>0){var f=R(t,n,r,a),p=R(t,n,r,c);d+=`L ${p.x},${p.y}
-            A ${r},${r},0,
-            ${+(Math.abs(s)>180)},${+(a<=c)},
-            ${f.x},${f.y} Z`}else d+=`L ${t},${n} Z`;return d},Tu=e=>{var{cx:t,cy:n,innerRadius:r,outerRadius:i,cornerRadius:a,forceCornerRadius:o,cornerIsExternal:s,startAngle:c,endAngle:l}=e,u=_(l-c),{circleTangency:d,lineTangency:f,theta:p}=Cu({cx:t,cy:n,radius:i,angle:c,sign:u,cornerRadius:a,cornerIsExternal:s}),{circleTangency:m,lineTangency:h,theta:g}=Cu({cx:t,cy:n,radius:i,angle:l,sign:-u,cornerRadius:a,cornerIsExternal:s}),v=s?Math.abs(c-l):Math.abs(c-l)-p-g;if(v<0)return o?`M ${f.x},${f.y}
-        a${a},${a},0,0,1,${a*2},0
-        a${a},${a},0,0,1,${-a*2},0
-      `:wu({cx:t,cy:n,innerRadius:r,outerRadius:i,startAngle:c,endAngle:l});var y=`M ${f.x},${f.y}
-    A${a},${a},0,0,${+(u<0)},${d.x},${d.y}
-    A${i},${i},0,${+(v>180)},${+(u<0)},${m.x},${m.y}
-    A${a},${a},0,0,${+(u<0)},${h.x},${h.y}
-  `;if(r>0){var{circleTangency:b,lineTangency:x,theta:S}=Cu({cx:t,cy:n,radius:r,angle:c,sign:u,isExternal:!0,cornerRadius:a,cornerIsExternal:s}),{circleTangency:C,lineTangency:w,theta:T}=Cu({cx:t,cy:n,radius:r,angle:l,sign:-u,isExternal:!0,cornerRadius:a,cornerIsExternal:s}),E=s?Math.abs(c-l):Math.abs(c-l)-S-T;if(E<0&&a===0)return`${y}L${t},${n}Z`;y+=`L${w.x},${w.y}
-      A${a},${a},0,0,${+(u<0)},${C.x},${C.y}
-      A${r},${r},0,${+(E>180)},${+(u>0)},${b.x},${b.y}
-      A${a},${a},0,0,${+(u<0)},${x.x},${x.y}Z`}else y+=`L${t},${n}Z`;return y},Eu={cx:0,cy:0,innerRadius:0,outerRadius:0,startAngle:0,endAngle:0,cornerRadius:0,forceCornerRadius:!1,cornerIsExternal:!1},Du=e=>{var t=H(e,Eu),{cx:n,cy:r,innerRadius:i,outerRadius:a,cornerRadius:o,forceCornerRadius:s,cornerIsExternal:l,startAngle:u,endAngle:d,className:f}=t;if(a<i||u===d)return null;var p=c(`recharts-sector`,f),m=a-i,h=w(o,m,0,!0),g=h>0&&Math.abs(u-d)<360?Tu({cx:n,cy:r,innerRadius:i,outerRadius:a,cornerRadius:Math.min(h,m/2),forceCornerRadius:s,cornerIsExternal:l,startAngle:u,endAngle:d}):wu({cx:n,cy:r,innerRadius:i,outerRadius:a,startAngle:u,endAngle:d});return A.createElement(`path`,xu({},M(t,!0),{className:p,d:g}))};function Ou(e,t,n){var r,i,a,o;if(e===`horizontal`)r=t.x,a=r,i=n.top,o=n.top+n.height;else if(e===`vertical`)i=t.y,o=i,r=n.left,a=n.left+n.width;else if(t.cx!=null&&t.cy!=null)if(e===`centric`){var{cx:s,cy:c,innerRadius:l,outerRadius:u,angle:d}=t,f=R(s,c,l,d),p=R(s,c,u,d);r=f.x,i=f.y,a=p.x,o=p.y}else return bu(t);return[{x:r,y:i},{x:a,y:o}]}var ku=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=zr();function n(e){return t.isSymbol(e)?NaN:Number(e)}exports.toNumber=n})),Au=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=ku();function n(e){return e?(e=t.toNumber(e),e===1/0||e===-1/0?(e<0?-1:1)*Number.MAX_VALUE:e===e?e:0):e===0?e:0}exports.toFinite=n})),ju=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=Ur(),n=Au();function r(e,r,i){i&&typeof i!=`number`&&t.isIterateeCall(e,r,i)&&(r=i=void 0),e=n.toFinite(e),r===void 0?(r=e,e=0):r=n.toFinite(r),i=i===void 0?e<r?1:-1:n.toFinite(i);let a=Math.max(Math.ceil((r-e)/(i||1)),0),o=Array(a);for(let t=0;t<a;t++)o[t]=e,e+=i;return o}exports.range=r})),Mu=n(((exports,t)=>{t.exports=ju().range}));function Nu(e,t){return e==null||t==null?NaN:e<t?-1:e>t?1:e>=t?0:NaN}function Pu(e,t){return e==null||t==null?NaN:t<e?-1:t>e?1:t>=e?0:NaN}function Fu(e){let t,n,r;e.length===2?(t=e===Nu||e===Pu?e:Iu,n=e,r=e):(t=Nu,n=(t,n)=>Nu(e(t),n),r=(t,n)=>e(t)-n);function i(e,r,i=0,a=e.length){if(i<a){if(t(r,r)!==0)return a;do{let t=i+a>>>1;n(e[t],r)<0?i=t+1:a=t}while(i<a)}return i}function a(e,r,i=0,a=e.length){if(i<a){if(t(r,r)!==0)return a;do{let t=i+a>>>1;n(e[t],r)<=0?i=t+1:a=t}while(i<a)}return i}function o(e,t,n=0,a=e.length){let o=i(e,t,n,a-1);return o>n&&r(e[o-1],t)>-r(e[o],t)?o-1:o}return{left:i,center:o,right:a}}function Iu(){return 0}function Lu(e){return e===null?NaN:+e}function*Ru(e,t){if(t===void 0)for(let t of e)t!=null&&(t=+t)>=t&&(yield t);else{let n=-1;for(let r of e)(r=t(r,++n,e))!=null&&(r=+r)>=r&&(yield r)}}var zu=Fu(Nu);const Bu=zu.right;zu.left,Fu(Lu).center;var Vu=Bu,Hu=class extends Map{constructor(e,t=Ku){if(super(),Object.defineProperties(this,{_intern:{value:new Map},_key:{value:t}}),e!=null)for(let[t,n]of e)this.set(t,n)}get(e){return super.get(Uu(this,e))}has(e){return super.has(Uu(this,e))}set(e,t){return super.set(Wu(this,e),t)}delete(e){return super.delete(Gu(this,e))}};function Uu({_intern:e,_key:t},n){let r=t(n);return e.has(r)?e.get(r):n}function Wu({_intern:e,_key:t},n){let r=t(n);return e.has(r)?e.get(r):(e.set(r,n),n)}function Gu({_intern:e,_key:t},n){let r=t(n);return e.has(r)&&(n=e.get(r),e.delete(r)),n}function Ku(e){return typeof e==`object`&&e?e.valueOf():e}function qu(e=Nu){if(e===Nu)return Ju;if(typeof e!=`function`)throw TypeError(`compare is not a function`);return(t,n)=>{let r=e(t,n);return r||r===0?r:(e(n,n)===0)-(e(t,t)===0)}}function Ju(e,t){return(e==null||!(e>=e))-(t==null||!(t>=t))||(e<t?-1:e>t?1:0)}var Yu=Math.sqrt(50),Xu=Math.sqrt(10),Zu=Math.sqrt(2);function Qu(e,t,n){let r=(t-e)/Math.max(0,n),i=Math.floor(Math.log10(r)),a=r/10**i,o=a>=Yu?10:a>=Xu?5:a>=Zu?2:1,s,c,l;return i<0?(l=10**-i/o,s=Math.round(e*l),c=Math.round(t*l),s/l<e&&++s,c/l>t&&--c,l=-l):(l=10**i*o,s=Math.round(e/l),c=Math.round(t/l),s*l<e&&++s,c*l>t&&--c),c<s&&.5<=n&&n<2?Qu(e,t,n*2):[s,c,l]}function $u(e,t,n){if(t=+t,e=+e,n=+n,!(n>0))return[];if(e===t)return[e];let r=t<e,[i,a,o]=r?Qu(t,e,n):Qu(e,t,n);if(!(a>=i))return[];let s=a-i+1,c=Array(s);if(r)if(o<0)for(let e=0;e<s;++e)c[e]=(a-e)/-o;else for(let e=0;e<s;++e)c[e]=(a-e)*o;else if(o<0)for(let e=0;e<s;++e)c[e]=(i+e)/-o;else for(let e=0;e<s;++e)c[e]=(i+e)*o;return c}function ed(e,t,n){return t=+t,e=+e,n=+n,Qu(e,t,n)[2]}function td(e,t,n){t=+t,e=+e,n=+n;let r=t<e,i=r?ed(t,e,n):ed(e,t,n);return(r?-1:1)*(i<0?1/-i:i)}function nd(e,t){let n;if(t===void 0)for(let t of e)t!=null&&(n<t||n===void 0&&t>=t)&&(n=t);else{let r=-1;for(let i of e)(i=t(i,++r,e))!=null&&(n<i||n===void 0&&i>=i)&&(n=i)}return n}function rd(e,t){let n;if(t===void 0)for(let t of e)t!=null&&(n>t||n===void 0&&t>=t)&&(n=t);else{let r=-1;for(let i of e)(i=t(i,++r,e))!=null&&(n>i||n===void 0&&i>=i)&&(n=i)}return n}function id(e,t,n=0,r=1/0,i){if(t=Math.floor(t),n=Math.floor(Math.max(0,n)),r=Math.floor(Math.min(e.length-1,r)),!(n<=t&&t<=r))return e;for(i=i===void 0?Ju:qu(i);r>n;){if(r-n>600){let a=r-n+1,o=t-n+1,s=Math.log(a),c=.5*Math.exp(2*s/3),l=.5*Math.sqrt(s*c*(a-c)/a)*(o-a/2<0?-1:1),u=Math.max(n,Math.floor(t-o*c/a+l)),d=Math.min(r,Math.floor(t+(a-o)*c/a+l));id(e,t,u,d,i)}let a=e[t],o=n,s=r;for(ad(e,n,t),i(e[r],a)>0&&ad(e,n,r);o<s;){for(ad(e,o,s),++o,--s;i(e[o],a)<0;)++o;for(;i(e[s],a)>0;)--s}i(e[n],a)===0?ad(e,n,s):(++s,ad(e,s,r)),s<=t&&(n=s+1),t<=s&&(r=s-1)}return e}function ad(e,t,n){let r=e[t];e[t]=e[n],e[n]=r}function od(e,t,n){if(e=Float64Array.from(Ru(e,n)),!(!(r=e.length)||isNaN(t=+t))){if(t<=0||r<2)return rd(e);if(t>=1)return nd(e);var r,i=(r-1)*t,a=Math.floor(i),o=nd(id(e,a).subarray(0,a+1)),s=rd(e.subarray(a+1));return o+(s-o)*(i-a)}}function sd(e,t,n=Lu){if(!(!(r=e.length)||isNaN(t=+t))){if(t<=0||r<2)return+n(e[0],0,e);if(t>=1)return+n(e[r-1],r-1,e);var r,i=(r-1)*t,a=Math.floor(i),o=+n(e[a],a,e),s=+n(e[a+1],a+1,e);return o+(s-o)*(i-a)}}function cd(e,t,n){e=+e,t=+t,n=(i=arguments.length)<2?(t=e,e=0,1):i<3?1:+n;for(var r=-1,i=Math.max(0,Math.ceil((t-e)/n))|0,a=Array(i);++r<i;)a[r]=e+r*n;return a}function ld(e,t){switch(arguments.length){case 0:break;case 1:this.range(e);break;default:this.range(t).domain(e);break}return this}function ud(e,t){switch(arguments.length){case 0:break;case 1:typeof e==`function`?this.interpolator(e):this.range(e);break;default:this.domain(e),typeof t==`function`?this.interpolator(t):this.range(t);break}return this}const dd=Symbol(`implicit`);function fd(){var e=new Hu,t=[],n=[],r=dd;function i(i){let a=e.get(i);if(a===void 0){if(r!==dd)return r;e.set(i,a=t.push(i)-1)}return n[a%n.length]}return i.domain=function(n){if(!arguments.length)return t.slice();t=[],e=new Hu;for(let r of n){if(e.has(r))continue;e.set(r,t.push(r)-1)}return i},i.range=function(e){return arguments.length?(n=Array.from(e),i):n.slice()},i.unknown=function(e){return arguments.length?(r=e,i):r},i.copy=function(){return fd(t,n).unknown(r)},ld.apply(i,arguments),i}function pd(){var e=fd().unknown(void 0),t=e.domain,n=e.range,r=0,i=1,a,o,s=!1,c=0,l=0,u=.5;delete e.unknown;function d(){var e=t().length,d=i<r,f=d?i:r,p=d?r:i;a=(p-f)/Math.max(1,e-c+l*2),s&&(a=Math.floor(a)),f+=(p-f-a*(e-c))*u,o=a*(1-c),s&&(f=Math.round(f),o=Math.round(o));var m=cd(e).map(function(e){return f+a*e});return n(d?m.reverse():m)}return e.domain=function(e){return arguments.length?(t(e),d()):t()},e.range=function(e){return arguments.length?([r,i]=e,r=+r,i=+i,d()):[r,i]},e.rangeRound=function(e){return[r,i]=e,r=+r,i=+i,s=!0,d()},e.bandwidth=function(){return o},e.step=function(){return a},e.round=function(e){return arguments.length?(s=!!e,d()):s},e.padding=function(e){return arguments.length?(c=Math.min(1,l=+e),d()):c},e.paddingInner=function(e){return arguments.length?(c=Math.min(1,e),d()):c},e.paddingOuter=function(e){return arguments.length?(l=+e,d()):l},e.align=function(e){return arguments.length?(u=Math.max(0,Math.min(1,e)),d()):u},e.copy=function(){return pd(t(),[r,i]).round(s).paddingInner(c).paddingOuter(l).align(u)},ld.apply(d(),arguments)}function md(e){var t=e.copy;return e.padding=e.paddingOuter,delete e.paddingInner,delete e.paddingOuter,e.copy=function(){return md(t())},e}function hd(){return md(pd.apply(null,arguments).paddingInner(1))}function gd(e,t,n){e.prototype=t.prototype=n,n.constructor=e}function _d(e,t){var n=Object.create(e.prototype);for(var r in t)n[r]=t[r];return n}function vd(){}var yd=.7,bd=1/yd,xd=`\\s*([+-]?\\d+)\\s*`,Sd=`\\s*([+-]?(?:\\d*\\.)?\\d+(?:[eE][+-]?\\d+)?)\\s*`,Cd=`\\s*([+-]?(?:\\d*\\.)?\\d+(?:[eE][+-]?\\d+)?)%\\s*`,wd=/^#([0-9a-f]{3,8})$/,Td=RegExp(`^rgb\\(${xd},${xd},${xd}\\)$`),Ed=RegExp(`^rgb\\(${Cd},${Cd},${Cd}\\)$`),Dd=RegExp(`^rgba\\(${xd},${xd},${xd},${Sd}\\)$`),Od=RegExp(`^rgba\\(${Cd},${Cd},${Cd},${Sd}\\)$`),kd=RegExp(`^hsl\\(${Sd},${Cd},${Cd}\\)$`),Ad=RegExp(`^hsla\\(${Sd},${Cd},${Cd},${Sd}\\)$`),jd={aliceblue:15792383,antiquewhite:16444375,aqua:65535,aquamarine:8388564,azure:15794175,beige:16119260,bisque:16770244,black:0,blanchedalmond:16772045,blue:255,blueviolet:9055202,brown:10824234,burlywood:14596231,cadetblue:6266528,chartreuse:8388352,chocolate:13789470,coral:16744272,cornflowerblue:6591981,cornsilk:16775388,crimson:14423100,cyan:65535,darkblue:139,darkcyan:35723,darkgoldenrod:12092939,darkgray:11119017,darkgreen:25600,darkgrey:11119017,darkkhaki:12433259,darkmagenta:9109643,darkolivegreen:5597999,darkorange:16747520,darkorchid:10040012,darkred:9109504,darksalmon:15308410,darkseagreen:9419919,darkslateblue:4734347,darkslategray:3100495,darkslategrey:3100495,darkturquoise:52945,darkviolet:9699539,deeppink:16716947,deepskyblue:49151,dimgray:6908265,dimgrey:6908265,dodgerblue:2003199,firebrick:11674146,floralwhite:16775920,forestgreen:2263842,fuchsia:16711935,gainsboro:14474460,ghostwhite:16316671,gold:16766720,goldenrod:14329120,gray:8421504,green:32768,greenyellow:11403055,grey:8421504,honeydew:15794160,hotpink:16738740,indianred:13458524,indigo:4915330,ivory:16777200,khaki:15787660,lavender:15132410,lavenderblush:16773365,lawngreen:8190976,lemonchiffon:16775885,lightblue:11393254,lightcoral:15761536,lightcyan:14745599,lightgoldenrodyellow:16448210,lightgray:13882323,lightgreen:9498256,lightgrey:13882323,lightpink:16758465,lightsalmon:16752762,lightseagreen:2142890,lightskyblue:8900346,lightslategray:7833753,lightslategrey:7833753,lightsteelblue:11584734,lightyellow:16777184,lime:65280,limegreen:3329330,linen:16445670,magenta:16711935,maroon:8388608,mediumaquamarine:6737322,mediumblue:205,mediumorchid:12211667,mediumpurple:9662683,mediumseagreen:3978097,mediumslateblue:8087790,mediumspringgreen:64154,mediumturquoise:4772300,mediumvioletred:13047173,midnightblue:1644912,mintcream:16121850,mistyrose:16770273,moccasin:16770229,navajowhite:16768685,navy:128,oldlace:16643558,olive:8421376,olivedrab:7048739,orange:16753920,orangered:16729344,orchid:14315734,palegoldenrod:15657130,palegreen:10025880,paleturquoise:11529966,palevioletred:14381203,papayawhip:16773077,peachpuff:16767673,peru:13468991,pink:16761035,plum:14524637,powderblue:11591910,purple:8388736,rebeccapurple:6697881,red:16711680,rosybrown:12357519,royalblue:4286945,saddlebrown:9127187,salmon:16416882,sandybrown:16032864,seagreen:3050327,seashell:16774638,sienna:10506797,silver:12632256,skyblue:8900331,slateblue:6970061,slategray:7372944,slategrey:7372944,snow:16775930,springgreen:65407,steelblue:4620980,tan:13808780,teal:32896,thistle:14204888,tomato:16737095,turquoise:4251856,violet:15631086,wheat:16113331,white:16777215,whitesmoke:16119285,yellow:16776960,yellowgreen:10145074};gd(vd,Id,{copy(e){return Object.assign(new this.constructor,this,e)},displayable(){return this.rgb().displayable()},hex:Md,formatHex:Md,formatHex8:Nd,formatHsl:Pd,formatRgb:Fd,toString:Fd});function Md(){return this.rgb().formatHex()}function Nd(){return this.rgb().formatHex8()}function Pd(){return Yd(this).formatHsl()}function Fd(){return this.rgb().formatRgb()}function Id(e){var t,n;return e=(e+``).trim().toLowerCase(),(t=wd.exec(e))?(n=t[1].length,t=parseInt(t[1],16),n===6?Ld(t):n===3?new Vd(t>>8&15|t>>4&240,t>>4&15|t&240,(t&15)<<4|t&15,1):n===8?Rd(t>>24&255,t>>16&255,t>>8&255,(t&255)/255):n===4?Rd(t>>12&15|t>>8&240,t>>8&15|t>>4&240,t>>4&15|t&240,((t&15)<<4|t&15)/255):null):(t=Td.exec(e))?new Vd(t[1],t[2],t[3],1):(t=Ed.exec(e))?new Vd(t[1]*255/100,t[2]*255/100,t[3]*255/100,1):(t=Dd.exec(e))?Rd(t[1],t[2],t[3],t[4]):(t=Od.exec(e))?Rd(t[1]*255/100,t[2]*255/100,t[3]*255/100,t[4]):(t=kd.exec(e))?Jd(t[1],t[2]/100,t[3]/100,1):(t=Ad.exec(e))?Jd(t[1],t[2]/100,t[3]/100,t[4]):jd.hasOwnProperty(e)?Ld(jd[e]):e===`transparent`?new Vd(NaN,NaN,NaN,0):null}function Ld(e){return new Vd(e>>16&255,e>>8&255,e&255,1)}function Rd(e,t,n,r){return r<=0&&(e=t=n=NaN),new Vd(e,t,n,r)}function zd(e){return e instanceof vd||(e=Id(e)),e?(e=e.rgb(),new Vd(e.r,e.g,e.b,e.opacity)):new Vd}function Bd(e,t,n,r){return arguments.length===1?zd(e):new Vd(e,t,n,r??1)}function Vd(e,t,n,r){this.r=+e,this.g=+t,this.b=+n,this.opacity=+r}gd(Vd,Bd,_d(vd,{brighter(e){return e=e==null?bd:bd**+e,new Vd(this.r*e,this.g*e,this.b*e,this.opacity)},darker(e){return e=e==null?yd:yd**+e,new Vd(this.r*e,this.g*e,this.b*e,this.opacity)},rgb(){return this},clamp(){return new Vd(Kd(this.r),Kd(this.g),Kd(this.b),Gd(this.opacity))},displayable(){return-.5<=this.r&&this.r<255.5&&-.5<=this.g&&this.g<255.5&&-.5<=this.b&&this.b<255.5&&0<=this.opacity&&this.opacity<=1},hex:Hd,formatHex:Hd,formatHex8:Ud,formatRgb:Wd,toString:Wd}));function Hd(){return`#${qd(this.r)}${qd(this.g)}${qd(this.b)}`}function Ud(){return`#${qd(this.r)}${qd(this.g)}${qd(this.b)}${qd((isNaN(this.opacity)?1:this.opacity)*255)}`}function Wd(){let e=Gd(this.opacity);return`${e===1?`rgb(`:`rgba(`}${Kd(this.r)}, ${Kd(this.g)}, ${Kd(this.b)}${e===1?`)`:`, ${e})`}`}function Gd(e){return isNaN(e)?1:Math.max(0,Math.min(1,e))}function Kd(e){return Math.max(0,Math.min(255,Math.round(e)||0))}function qd(e){return e=Kd(e),(e<16?`0`:``)+e.toString(16)}function Jd(e,t,n,r){return r<=0?e=t=n=NaN:n<=0||n>=1?e=t=NaN:t<=0&&(e=NaN),new Zd(e,t,n,r)}function Yd(e){if(e instanceof Zd)return new Zd(e.h,e.s,e.l,e.opacity);if(e instanceof vd||(e=Id(e)),!e)return new Zd;if(e instanceof Zd)return e;e=e.rgb();var t=e.r/255,n=e.g/255,r=e.b/255,i=Math.min(t,n,r),a=Math.max(t,n,r),o=NaN,s=a-i,c=(a+i)/2;return s?(o=t===a?(n-r)/s+(n<r)*6:n===a?(r-t)/s+2:(t-n)/s+4,s/=c<.5?a+i:2-a-i,o*=60):s=c>0&&c<1?0:o,new Zd(o,s,c,e.opacity)}function Xd(e,t,n,r){return arguments.length===1?Yd(e):new Zd(e,t,n,r??1)}function Zd(e,t,n,r){this.h=+e,this.s=+t,this.l=+n,this.opacity=+r}gd(Zd,Xd,_d(vd,{brighter(e){return e=e==null?bd:bd**+e,new Zd(this.h,this.s,this.l*e,this.opacity)},darker(e){return e=e==null?yd:yd**+e,new Zd(this.h,this.s,this.l*e,this.opacity)},rgb(){var e=this.h%360+(this.h<0)*360,t=isNaN(e)||isNaN(this.s)?0:this.s,n=this.l,r=n+(n<.5?n:1-n)*t,i=2*n-r;return new Vd(ef(e>=240?e-240:e+120,i,r),ef(e,i,r),ef(e<120?e+240:e-120,i,r),this.opacity)},clamp(){return new Zd(Qd(this.h),$d(this.s),$d(this.l),Gd(this.opacity))},displayable(){return(0<=this.s&&this.s<=1||isNaN(this.s))&&0<=this.l&&this.l<=1&&0<=this.opacity&&this.opacity<=1},formatHsl(){let e=Gd(this.opacity);return`${e===1?`hsl(`:`hsla(`}${Qd(this.h)}, ${$d(this.s)*100}%, ${$d(this.l)*100}%${e===1?`)`:`, ${e})`}`}}));function Qd(e){return e=(e||0)%360,e<0?e+360:e}function $d(e){return Math.max(0,Math.min(1,e||0))}function ef(e,t,n){return(e<60?t+(n-t)*e/60:e<180?n:e<240?t+(n-t)*(240-e)/60:t)*255}var tf=e=>()=>e;function nf(e,t){return function(n){return e+n*t}}function rf(e,t,n){return e**=+n,t=t**+n-e,n=1/n,function(r){return(e+r*t)**+n}}function af(e){return(e=+e)==1?sf:function(t,n){return n-t?rf(t,n,e):tf(isNaN(t)?n:t)}}function sf(e,t){var n=t-e;return n?nf(e,n):tf(isNaN(e)?t:e)}var cf=(function e(t){var n=af(t);function r(e,t){var r=n((e=Bd(e)).r,(t=Bd(t)).r),i=n(e.g,t.g),a=n(e.b,t.b),o=sf(e.opacity,t.opacity);return function(t){return e.r=r(t),e.g=i(t),e.b=a(t),e.opacity=o(t),e+``}}return r.gamma=e,r})(1);function lf(e,t){t||=[];var n=e?Math.min(t.length,e.length):0,r=t.slice(),i;return function(a){for(i=0;i<n;++i)r[i]=e[i]*(1-a)+t[i]*a;return r}}function uf(e){return ArrayBuffer.isView(e)&&!(e instanceof DataView)}function df(e,t){var n=t?t.length:0,r=e?Math.min(n,e.length):0,i=Array(r),a=Array(n),o;for(o=0;o<r;++o)i[o]=bf(e[o],t[o]);for(;o<n;++o)a[o]=t[o];return function(e){for(o=0;o<r;++o)a[o]=i[o](e);return a}}function ff(e,t){var n=new Date;return e=+e,t=+t,function(r){return n.setTime(e*(1-r)+t*r),n}}function pf(e,t){return e=+e,t=+t,function(n){return e*(1-n)+t*n}}function mf(e,t){var n={},r={},i;for(i in(typeof e!=`object`||!e)&&(e={}),(typeof t!=`object`||!t)&&(t={}),t)i in e?n[i]=bf(e[i],t[i]):r[i]=t[i];return function(e){for(i in n)r[i]=n[i](e);return r}}var hf=/[-+]?(?:\d+\.?\d*|\.?\d+)(?:[eE][-+]?\d+)?/g,gf=new RegExp(hf.source,`g`);function _f(e){return function(){return e}}function vf(e){return function(t){return e(t)+``}}function yf(e,t){var n=hf.lastIndex=gf.lastIndex=0,r,i,a,o=-1,s=[],c=[];for(e+=``,t+=``;(r=hf.exec(e))&&(i=gf.exec(t));)(a=i.index)>n&&(a=t.slice(n,a),s[o]?s[o]+=a:s[++o]=a),(r=r[0])===(i=i[0])?s[o]?s[o]+=i:s[++o]=i:(s[++o]=null,c.push({i:o,x:pf(r,i)})),n=gf.lastIndex;return n<t.length&&(a=t.slice(n),s[o]?s[o]+=a:s[++o]=a),s.length<2?c[0]?vf(c[0].x):_f(t):(t=c.length,function(e){for(var n=0,r;n<t;++n)s[(r=c[n]).i]=r.x(e);return s.join(``)})}function bf(e,t){var n=typeof t,r;return t==null||n===`boolean`?tf(t):(n===`number`?pf:n===`string`?(r=Id(t))?(t=r,cf):yf:t instanceof Id?cf:t instanceof Date?ff:uf(t)?lf:Array.isArray(t)?df:typeof t.valueOf!=`function`&&typeof t.toString!=`function`||isNaN(t)?mf:pf)(e,t)}function xf(e,t){return e=+e,t=+t,function(n){return Math.round(e*(1-n)+t*n)}}function Sf(e,t){t===void 0&&(t=e,e=bf);for(var n=0,r=t.length-1,i=t[0],a=Array(r<0?0:r);n<r;)a[n]=e(i,i=t[++n]);return function(e){var t=Math.max(0,Math.min(r-1,Math.floor(e*=r)));return a[t](e-t)}}function Cf(e){return function(){return e}}function wf(e){return+e}var Tf=[0,1];function Ef(e){return e}function Df(e,t){return(t-=e=+e)?function(n){return(n-e)/t}:Cf(isNaN(t)?NaN:.5)}function Of(e,t){var n;return e>t&&(n=e,e=t,t=n),function(n){return Math.max(e,Math.min(t,n))}}function kf(e,t,n){var r=e[0],i=e[1],a=t[0],o=t[1];return i<r?(r=Df(i,r),a=n(o,a)):(r=Df(r,i),a=n(a,o)),function(e){return a(r(e))}}function Af(e,t,n){var r=Math.min(e.length,t.length)-1,i=Array(r),a=Array(r),o=-1;for(e[r]<e[0]&&(e=e.slice().reverse(),t=t.slice().reverse());++o<r;)i[o]=Df(e[o],e[o+1]),a[o]=n(t[o],t[o+1]);return function(t){var n=Vu(e,t,1,r)-1;return a[n](i[n](t))}}function jf(e,t){return t.domain(e.domain()).range(e.range()).interpolate(e.interpolate()).clamp(e.clamp()).unknown(e.unknown())}function Mf(){var e=Tf,t=Tf,n=bf,r,i,a,o=Ef,s,c,l;function u(){var n=Math.min(e.length,t.length);return o!==Ef&&(o=Of(e[0],e[n-1])),s=n>2?Af:kf,c=l=null,d}function d(i){return i==null||isNaN(i=+i)?a:(c||=s(e.map(r),t,n))(r(o(i)))}return d.invert=function(n){return o(i((l||=s(t,e.map(r),pf))(n)))},d.domain=function(t){return arguments.length?(e=Array.from(t,wf),u()):e.slice()},d.range=function(e){return arguments.length?(t=Array.from(e),u()):t.slice()},d.rangeRound=function(e){return t=Array.from(e),n=xf,u()},d.clamp=function(e){return arguments.length?(o=e?!0:Ef,u()):o!==Ef},d.interpolate=function(e){return arguments.length?(n=e,u()):n},d.unknown=function(e){return arguments.length?(a=e,d):a},function(e,t){return r=e,i=t,u()}}function Nf(){return Mf()(Ef,Ef)}function Pf(e){return Math.abs(e=Math.round(e))>=1e21?e.toLocaleString(`en`).replace(/,/g,``):e.toString(10)}function Ff(e,t){if((n=(e=t?e.toExponential(t-1):e.toExponential()).indexOf(`e`))<0)return null;var n,r=e.slice(0,n);return[r.length>1?r[0]+r.slice(2):r,+e.slice(n+1)]}function If(e){return e=Ff(Math.abs(e)),e?e[1]:NaN}function Lf(e,t){return function(n,r){for(var i=n.length,a=[],o=0,s=e[0],c=0;i>0&&s>0&&(c+s+1>r&&(s=Math.max(1,r-c)),a.push(n.substring(i-=s,i+s)),!((c+=s+1)>r));)s=e[o=(o+1)%e.length];return a.reverse().join(t)}}function Rf(e){return function(t){return t.replace(/[0-9]/g,function(t){return e[+t]})}}var zf=/^(?:(.)?([<>=^]))?([+\-( ])?([$#])?(0)?(\d+)?(,)?(\.\d+)?(~)?([a-z%])?$/i;function Bf(e){if(!(t=zf.exec(e)))throw Error(`invalid format: `+e);var t;return new Vf({fill:t[1],align:t[2],sign:t[3],symbol:t[4],zero:t[5],width:t[6],comma:t[7],precision:t[8]&&t[8].slice(1),trim:t[9],type:t[10]})}Bf.prototype=Vf.prototype;function Vf(e){this.fill=e.fill===void 0?` `:e.fill+``,this.align=e.align===void 0?`>`:e.align+``,this.sign=e.sign===void 0?`-`:e.sign+``,this.symbol=e.symbol===void 0?``:e.symbol+``,this.zero=!!e.zero,this.width=e.width===void 0?void 0:+e.width,this.comma=!!e.comma,this.precision=e.precision===void 0?void 0:+e.precision,this.trim=!!e.trim,this.type=e.type===void 0?``:e.type+``}Vf.prototype.toString=function(){return this.fill+this.align+this.sign+this.symbol+(this.zero?`0`:``)+(this.width===void 0?``:Math.max(1,this.width|0))+(this.comma?`,`:``)+(this.precision===void 0?``:`.`+Math.max(0,this.precision|0))+(this.trim?`~`:``)+this.type};function Hf(e){out:for(var t=e.length,n=1,r=-1,i;n<t;++n)switch(e[n]){case`.`:r=i=n;break;case`0`:r===0&&(r=n),i=n;break;default:if(!+e[n])break out;r>0&&(r=0);break}return r>0?e.slice(0,r)+e.slice(i+1):e}var Uf;function Wf(e,t){var n=Ff(e,t);if(!n)return e+``;var r=n[0],i=n[1],a=i-(Uf=Math.max(-8,Math.min(8,Math.floor(i/3)))*3)+1,o=r.length;return a===o?r:a>o?r+Array(a-o+1).join(`0`):a>0?r.slice(0,a)+`.`+r.slice(a):`0.`+Array(1-a).join(`0`)+Ff(e,Math.max(0,t+a-1))[0]}function Gf(e,t){var n=Ff(e,t);if(!n)return e+``;var r=n[0],i=n[1];return i<0?`0.`+Array(-i).join(`0`)+r:r.length>i+1?r.slice(0,i+1)+`.`+r.slice(i+1):r+Array(i-r.length+2).join(`0`)}var Kf={"%":(e,t)=>(e*100).toFixed(t),b:e=>Math.round(e).toString(2),c:e=>e+``,d:Pf,e:(e,t)=>e.toExponential(t),f:(e,t)=>e.toFixed(t),g:(e,t)=>e.toPrecision(t),o:e=>Math.round(e).toString(8),p:(e,t)=>Gf(e*100,t),r:Gf,s:Wf,X:e=>Math.round(e).toString(16).toUpperCase(),x:e=>Math.round(e).toString(16)};function qf(e){return e}var Jf=Array.prototype.map,Yf=[`y`,`z`,`a`,`f`,`p`,`n`,`µ`,`m`,``,`k`,`M`,`G`,`T`,`P`,`E`,`Z`,`Y`];function Xf(e){var t=e.grouping===void 0||e.thousands===void 0?qf:Lf(Jf.call(e.grouping,Number),e.thousands+``),n=e.currency===void 0?``:e.currency[0]+``,r=e.currency===void 0?``:e.currency[1]+``,i=e.decimal===void 0?`.`:e.decimal+``,a=e.numerals===void 0?qf:Rf(Jf.call(e.numerals,String)),o=e.percent===void 0?`%`:e.percent+``,s=e.minus===void 0?`−`:e.minus+``,c=e.nan===void 0?`NaN`:e.nan+``;function l(e){e=Bf(e);var l=e.fill,u=e.align,d=e.sign,f=e.symbol,p=e.zero,m=e.width,h=e.comma,g=e.precision,_=e.trim,v=e.type;v===`n`?(h=!0,v=`g`):Kf[v]||(g===void 0&&(g=12),_=!0,v=`g`),(p||l===`0`&&u===`=`)&&(p=!0,l=`0`,u=`=`);var y=f===`$`?n:f===`#`&&/[boxX]/.test(v)?`0`+v.toLowerCase():``,b=f===`$`?r:/[%p]/.test(v)?o:``,x=Kf[v],S=/[defgprs%]/.test(v);g=g===void 0?6:/[gprs]/.test(v)?Math.max(1,Math.min(21,g)):Math.max(0,Math.min(20,g));function C(e){var n=y,r=b,o,f,C;if(v===`c`)r=x(e)+r,e=``;else{e=+e;var w=e<0||1/e<0;if(e=isNaN(e)?c:x(Math.abs(e),g),_&&(e=Hf(e)),w&&+e==0&&d!==`+`&&(w=!1),n=(w?d===`(`?d:s:d===`-`||d===`(`?``:d)+n,r=(v===`s`?Yf[8+Uf/3]:``)+r+(w&&d===`(`?`)`:``),S){for(o=-1,f=e.length;++o<f;)if(C=e.charCodeAt(o),48>C||C>57){r=(C===46?i+e.slice(o+1):e.slice(o))+r,e=e.slice(0,o);break}}}h&&!p&&(e=t(e,1/0));var T=n.length+e.length+r.length,E=T<m?Array(m-T+1).join(l):``;switch(h&&p&&(e=t(E+e,E.length?m-r.length:1/0),E=``),u){case`<`:e=n+e+r+E;break;case`=`:e=n+E+e+r;break;case`^`:e=E.slice(0,T=E.length>>1)+n+e+r+E.slice(T);break;default:e=E+n+e+r;break}return a(e)}return C.toString=function(){return e+``},C}function u(e,t){var n=l((e=Bf(e),e.type=`f`,e)),r=Math.max(-8,Math.min(8,Math.floor(If(t)/3)))*3,i=10**-r,a=Yf[8+r/3];return function(e){return n(i*e)+a}}return{format:l,formatPrefix:u}}var Zf,Qf,$f;ep({thousands:`,`,grouping:[3],currency:[`$`,``]});function ep(e){return Zf=Xf(e),Qf=Zf.format,$f=Zf.formatPrefix,Zf}function tp(e){return Math.max(0,-If(Math.abs(e)))}function np(e,t){return Math.max(0,Math.max(-8,Math.min(8,Math.floor(If(t)/3)))*3-If(Math.abs(e)))}function rp(e,t){return e=Math.abs(e),t=Math.abs(t)-e,Math.max(0,If(t)-If(e))+1}function ip(e,t,n,r){var i=td(e,t,n),a;switch(r=Bf(r??`,f`),r.type){case`s`:var o=Math.max(Math.abs(e),Math.abs(t));return r.precision==null&&!isNaN(a=np(i,o))&&(r.precision=a),$f(r,o);case``:case`e`:case`g`:case`p`:case`r`:r.precision==null&&!isNaN(a=rp(i,Math.max(Math.abs(e),Math.abs(t))))&&(r.precision=a-(r.type===`e`));break;case`f`:case`%`:r.precision==null&&!isNaN(a=tp(i))&&(r.precision=a-(r.type===`%`)*2);break}return Qf(r)}function ap(e){var t=e.domain;return e.ticks=function(e){var n=t();return $u(n[0],n[n.length-1],e??10)},e.tickFormat=function(e,n){var r=t();return ip(r[0],r[r.length-1],e??10,n)},e.nice=function(n){n??=10;var r=t(),i=0,a=r.length-1,o=r[i],s=r[a],c,l,u=10;for(s<o&&(l=o,o=s,s=l,l=i,i=a,a=l);u-- >0;){if(l=ed(o,s,n),l===c)return r[i]=o,r[a]=s,t(r);if(l>0)o=Math.floor(o/l)*l,s=Math.ceil(s/l)*l;else if(l<0)o=Math.ceil(o*l)/l,s=Math.floor(s*l)/l;else break;c=l}return e},e}function op(){var e=Nf();return e.copy=function(){return jf(e,op())},ld.apply(e,arguments),ap(e)}function sp(e){var t;function n(e){return e==null||isNaN(e=+e)?t:e}return n.invert=n,n.domain=n.range=function(t){return arguments.length?(e=Array.from(t,wf),n):e.slice()},n.unknown=function(e){return arguments.length?(t=e,n):t},n.copy=function(){return sp(e).unknown(t)},e=arguments.length?Array.from(e,wf):[0,1],ap(n)}function cp(e,t){e=e.slice();var n=0,r=e.length-1,i=e[n],a=e[r],o;return a<i&&(o=n,n=r,r=o,o=i,i=a,a=o),e[n]=t.floor(i),e[r]=t.ceil(a),e}function lp(e){return Math.log(e)}function up(e){return Math.exp(e)}function dp(e){return-Math.log(-e)}function fp(e){return-Math.exp(-e)}function pp(e){return isFinite(e)?+(`1e`+e):e<0?0:e}function mp(e){return e===10?pp:e===Math.E?Math.exp:t=>e**+t}function hp(e){return e===Math.E?Math.log:e===10&&Math.log10||e===2&&Math.log2||(e=Math.log(e),t=>Math.log(t)/e)}function gp(e){return(t,n)=>-e(-t,n)}function _p(e){let t=e(lp,up),n=t.domain,r=10,i,a;function o(){return i=hp(r),a=mp(r),n()[0]<0?(i=gp(i),a=gp(a),e(dp,fp)):e(lp,up),t}return t.base=function(e){return arguments.length?(r=+e,o()):r},t.domain=function(e){return arguments.length?(n(e),o()):n()},t.ticks=e=>{let t=n(),o=t[0],s=t[t.length-1],c=s<o;c&&([o,s]=[s,o]);let l=i(o),u=i(s),d,f,p=e==null?10:+e,m=[];if(!(r%1)&&u-l<p){if(l=Math.floor(l),u=Math.ceil(u),o>0){for(;l<=u;++l)for(d=1;d<r;++d)if(f=l<0?d/a(-l):d*a(l),!(f<o)){if(f>s)break;m.push(f)}}else for(;l<=u;++l)for(d=r-1;d>=1;--d)if(f=l>0?d/a(-l):d*a(l),!(f<o)){if(f>s)break;m.push(f)}m.length*2<p&&(m=$u(o,s,p))}else m=$u(l,u,Math.min(u-l,p)).map(a);return c?m.reverse():m},t.tickFormat=(e,n)=>{if(e??=10,n??=r===10?`s`:`,`,typeof n!=`function`&&(!(r%1)&&(n=Bf(n)).precision==null&&(n.trim=!0),n=Qf(n)),e===1/0)return n;let o=Math.max(1,r*e/t.ticks().length);return e=>{let t=e/a(Math.round(i(e)));return t*r<r-.5&&(t*=r),t<=o?n(e):``}},t.nice=()=>n(cp(n(),{floor:e=>a(Math.floor(i(e))),ceil:e=>a(Math.ceil(i(e)))})),t}function vp(){let e=_p(Mf()).domain([1,10]);return e.copy=()=>jf(e,vp()).base(e.base()),ld.apply(e,arguments),e}function yp(e){return function(t){return Math.sign(t)*Math.log1p(Math.abs(t/e))}}function bp(e){return function(t){return Math.sign(t)*Math.expm1(Math.abs(t))*e}}function xp(e){var t=1,n=e(yp(t),bp(t));return n.constant=function(n){return arguments.length?e(yp(t=+n),bp(t)):t},ap(n)}function Sp(){var e=xp(Mf());return e.copy=function(){return jf(e,Sp()).constant(e.constant())},ld.apply(e,arguments)}function Cp(e){return function(t){return t<0?-((-t)**+e):t**+e}}function wp(e){return e<0?-Math.sqrt(-e):Math.sqrt(e)}function Tp(e){return e<0?-e*e:e*e}function Ep(e){var t=e(Ef,Ef),n=1;function r(){return n===1?e(Ef,Ef):n===.5?e(wp,Tp):e(Cp(n),Cp(1/n))}return t.exponent=function(e){return arguments.length?(n=+e,r()):n},ap(t)}function Dp(){var e=Ep(Mf());return e.copy=function(){return jf(e,Dp()).exponent(e.exponent())},ld.apply(e,arguments),e}function Op(){return Dp.apply(null,arguments).exponent(.5)}function kp(e){return Math.sign(e)*e*e}function Ap(e){return Math.sign(e)*Math.sqrt(Math.abs(e))}function jp(){var e=Nf(),t=[0,1],n=!1,r;function i(t){var i=Ap(e(t));return isNaN(i)?r:n?Math.round(i):i}return i.invert=function(t){return e.invert(kp(t))},i.domain=function(t){return arguments.length?(e.domain(t),i):e.domain()},i.range=function(n){return arguments.length?(e.range((t=Array.from(n,wf)).map(kp)),i):t.slice()},i.rangeRound=function(e){return i.range(e).round(!0)},i.round=function(e){return arguments.length?(n=!!e,i):n},i.clamp=function(t){return arguments.length?(e.clamp(t),i):e.clamp()},i.unknown=function(e){return arguments.length?(r=e,i):r},i.copy=function(){return jp(e.domain(),t).round(n).clamp(e.clamp()).unknown(r)},ld.apply(i,arguments),ap(i)}function Mp(){var e=[],t=[],n=[],r;function i(){var r=0,i=Math.max(1,t.length);for(n=Array(i-1);++r<i;)n[r-1]=sd(e,r/i);return a}function a(e){return e==null||isNaN(e=+e)?r:t[Vu(n,e)]}return a.invertExtent=function(r){var i=t.indexOf(r);return i<0?[NaN,NaN]:[i>0?n[i-1]:e[0],i<n.length?n[i]:e[e.length-1]]},a.domain=function(t){if(!arguments.length)return e.slice();e=[];for(let n of t)n!=null&&!isNaN(n=+n)&&e.push(n);return e.sort(Nu),i()},a.range=function(e){return arguments.length?(t=Array.from(e),i()):t.slice()},a.unknown=function(e){return arguments.length?(r=e,a):r},a.quantiles=function(){return n.slice()},a.copy=function(){return Mp().domain(e).range(t).unknown(r)},ld.apply(a,arguments)}function Np(){var e=0,t=1,n=1,r=[.5],i=[0,1],a;function o(e){return e!=null&&e<=e?i[Vu(r,e,0,n)]:a}function s(){var i=-1;for(r=Array(n);++i<n;)r[i]=((i+1)*t-(i-n)*e)/(n+1);return o}return o.domain=function(n){return arguments.length?([e,t]=n,e=+e,t=+t,s()):[e,t]},o.range=function(e){return arguments.length?(n=(i=Array.from(e)).length-1,s()):i.slice()},o.invertExtent=function(a){var o=i.indexOf(a);return o<0?[NaN,NaN]:o<1?[e,r[0]]:o>=n?[r[n-1],t]:[r[o-1],r[o]]},o.unknown=function(e){return arguments.length&&(a=e),o},o.thresholds=function(){return r.slice()},o.copy=function(){return Np().domain([e,t]).range(i).unknown(a)},ld.apply(ap(o),arguments)}function Pp(){var e=[.5],t=[0,1],n,r=1;function i(i){return i!=null&&i<=i?t[Vu(e,i,0,r)]:n}return i.domain=function(n){return arguments.length?(e=Array.from(n),r=Math.min(e.length,t.length-1),i):e.slice()},i.range=function(n){return arguments.length?(t=Array.from(n),r=Math.min(e.length,t.length-1),i):t.slice()},i.invertExtent=function(n){var r=t.indexOf(n);return[e[r-1],e[r]]},i.unknown=function(e){return arguments.length?(n=e,i):n},i.copy=function(){return Pp().domain(e).range(t).unknown(n)},ld.apply(i,arguments)}var Fp=new Date,Ip=new Date;function Lp(e,t,n,r){function i(t){return e(t=arguments.length===0?new Date:new Date(+t)),t}return i.floor=t=>(e(t=new Date(+t)),t),i.ceil=n=>(e(n=new Date(n-1)),t(n,1),e(n),n),i.round=e=>{let t=i(e),n=i.ceil(e);return e-t<n-e?t:n},i.offset=(e,n)=>(t(e=new Date(+e),n==null?1:Math.floor(n)),e),i.range=(n,r,a)=>{let o=[];if(n=i.ceil(n),a=a==null?1:Math.floor(a),!(n<r)||!(a>0))return o;let s;do o.push(s=new Date(+n)),t(n,a),e(n);while(s<n&&n<r);return o},i.filter=n=>Lp(t=>{if(t>=t)for(;e(t),!n(t);)t.setTime(t-1)},(e,r)=>{if(e>=e)if(r<0)for(;++r<=0;)for(;t(e,-1),!n(e););else for(;--r>=0;)for(;t(e,1),!n(e););}),n&&(i.count=(t,r)=>(Fp.setTime(+t),Ip.setTime(+r),e(Fp),e(Ip),Math.floor(n(Fp,Ip))),i.every=e=>(e=Math.floor(e),!isFinite(e)||!(e>0)?null:e>1?i.filter(r?t=>r(t)%e===0:t=>i.count(0,t)%e===0):i)),i}const Rp=Lp(()=>{},(e,t)=>{e.setTime(+e+t)},(e,t)=>t-e);Rp.every=e=>(e=Math.floor(e),!isFinite(e)||!(e>0)?null:e>1?Lp(t=>{t.setTime(Math.floor(t/e)*e)},(t,n)=>{t.setTime(+t+n*e)},(t,n)=>(n-t)/e):Rp),Rp.range;const zp=1e3,Bp=zp*60,Vp=Bp*60,Hp=Vp*24,Up=Hp*7,Wp=Hp*30,Gp=Hp*365,Kp=Lp(e=>{e.setTime(e-e.getMilliseconds())},(e,t)=>{e.setTime(+e+t*zp)},(e,t)=>(t-e)/zp,e=>e.getUTCSeconds());Kp.range;const qp=Lp(e=>{e.setTime(e-e.getMilliseconds()-e.getSeconds()*zp)},(e,t)=>{e.setTime(+e+t*Bp)},(e,t)=>(t-e)/Bp,e=>e.getMinutes());qp.range;const Jp=Lp(e=>{e.setUTCSeconds(0,0)},(e,t)=>{e.setTime(+e+t*Bp)},(e,t)=>(t-e)/Bp,e=>e.getUTCMinutes());Jp.range;const Yp=Lp(e=>{e.setTime(e-e.getMilliseconds()-e.getSeconds()*zp-e.getMinutes()*Bp)},(e,t)=>{e.setTime(+e+t*Vp)},(e,t)=>(t-e)/Vp,e=>e.getHours());Yp.range;const Xp=Lp(e=>{e.setUTCMinutes(0,0,0)},(e,t)=>{e.setTime(+e+t*Vp)},(e,t)=>(t-e)/Vp,e=>e.getUTCHours());Xp.range;const Zp=Lp(e=>e.setHours(0,0,0,0),(e,t)=>e.setDate(e.getDate()+t),(e,t)=>(t-e-(t.getTimezoneOffset()-e.getTimezoneOffset())*Bp)/Hp,e=>e.getDate()-1);Zp.range;const Qp=Lp(e=>{e.setUTCHours(0,0,0,0)},(e,t)=>{e.setUTCDate(e.getUTCDate()+t)},(e,t)=>(t-e)/Hp,e=>e.getUTCDate()-1);Qp.range;const $p=Lp(e=>{e.setUTCHours(0,0,0,0)},(e,t)=>{e.setUTCDate(e.getUTCDate()+t)},(e,t)=>(t-e)/Hp,e=>Math.floor(e/Hp));$p.range;function em(e){return Lp(t=>{t.setDate(t.getDate()-(t.getDay()+7-e)%7),t.setHours(0,0,0,0)},(e,t)=>{e.setDate(e.getDate()+t*7)},(e,t)=>(t-e-(t.getTimezoneOffset()-e.getTimezoneOffset())*Bp)/Up)}const tm=em(0),nm=em(1),rm=em(2),im=em(3),am=em(4),om=em(5),sm=em(6);tm.range,nm.range,rm.range,im.range,am.range,om.range,sm.range;function cm(e){return Lp(t=>{t.setUTCDate(t.getUTCDate()-(t.getUTCDay()+7-e)%7),t.setUTCHours(0,0,0,0)},(e,t)=>{e.setUTCDate(e.getUTCDate()+t*7)},(e,t)=>(t-e)/Up)}const lm=cm(0),um=cm(1),dm=cm(2),fm=cm(3),pm=cm(4),mm=cm(5),hm=cm(6);lm.range,um.range,dm.range,fm.range,pm.range,mm.range,hm.range;const gm=Lp(e=>{e.setDate(1),e.setHours(0,0,0,0)},(e,t)=>{e.setMonth(e.getMonth()+t)},(e,t)=>t.getMonth()-e.getMonth()+(t.getFullYear()-e.getFullYear())*12,e=>e.getMonth());gm.range;const _m=Lp(e=>{e.setUTCDate(1),e.setUTCHours(0,0,0,0)},(e,t)=>{e.setUTCMonth(e.getUTCMonth()+t)},(e,t)=>t.getUTCMonth()-e.getUTCMonth()+(t.getUTCFullYear()-e.getUTCFullYear())*12,e=>e.getUTCMonth());_m.range;const vm=Lp(e=>{e.setMonth(0,1),e.setHours(0,0,0,0)},(e,t)=>{e.setFullYear(e.getFullYear()+t)},(e,t)=>t.getFullYear()-e.getFullYear(),e=>e.getFullYear());vm.every=e=>!isFinite(e=Math.floor(e))||!(e>0)?null:Lp(t=>{t.setFullYear(Math.floor(t.getFullYear()/e)*e),t.setMonth(0,1),t.setHours(0,0,0,0)},(t,n)=>{t.setFullYear(t.getFullYear()+n*e)}),vm.range;const ym=Lp(e=>{e.setUTCMonth(0,1),e.setUTCHours(0,0,0,0)},(e,t)=>{e.setUTCFullYear(e.getUTCFullYear()+t)},(e,t)=>t.getUTCFullYear()-e.getUTCFullYear(),e=>e.getUTCFullYear());ym.every=e=>!isFinite(e=Math.floor(e))||!(e>0)?null:Lp(t=>{t.setUTCFullYear(Math.floor(t.getUTCFullYear()/e)*e),t.setUTCMonth(0,1),t.setUTCHours(0,0,0,0)},(t,n)=>{t.setUTCFullYear(t.getUTCFullYear()+n*e)}),ym.range;function bm(e,t,n,r,i,a){let o=[[Kp,1,zp],[Kp,5,5*zp],[Kp,15,15*zp],[Kp,30,30*zp],[a,1,Bp],[a,5,5*Bp],[a,15,15*Bp],[a,30,30*Bp],[i,1,Vp],[i,3,3*Vp],[i,6,6*Vp],[i,12,12*Vp],[r,1,Hp],[r,2,2*Hp],[n,1,Up],[t,1,Wp],[t,3,3*Wp],[e,1,Gp]];function s(e,t,n){let r=t<e;r&&([e,t]=[t,e]);let i=n&&typeof n.range==`function`?n:c(e,t,n),a=i?i.range(e,+t+1):[];return r?a.reverse():a}function c(t,n,r){let i=Math.abs(n-t)/r,a=Fu(([,,e])=>e).right(o,i);if(a===o.length)return e.every(td(t/Gp,n/Gp,r));if(a===0)return Rp.every(Math.max(td(t,n,r),1));let[s,c]=o[i/o[a-1][2]<o[a][2]/i?a-1:a];return s.every(c)}return[s,c]}var[xm,Sm]=bm(ym,_m,lm,$p,Xp,Jp),[Cm,wm]=bm(vm,gm,tm,Zp,Yp,qp);function Tm(e){if(0<=e.y&&e.y<100){var t=new Date(-1,e.m,e.d,e.H,e.M,e.S,e.L);return t.setFullYear(e.y),t}return new Date(e.y,e.m,e.d,e.H,e.M,e.S,e.L)}function Em(e){if(0<=e.y&&e.y<100){var t=new Date(Date.UTC(-1,e.m,e.d,e.H,e.M,e.S,e.L));return t.setUTCFullYear(e.y),t}return new Date(Date.UTC(e.y,e.m,e.d,e.H,e.M,e.S,e.L))}function Dm(e,t,n){return{y:e,m:t,d:n,H:0,M:0,S:0,L:0}}function Om(e){var t=e.dateTime,n=e.date,r=e.time,i=e.periods,a=e.days,o=e.shortDays,s=e.months,c=e.shortMonths,l=Pm(i),u=Fm(i),d=Pm(a),f=Fm(a),p=Pm(o),m=Fm(o),h=Pm(s),g=Fm(s),_=Pm(c),v=Fm(c),y={a:re,A,b:ie,B:ae,c:null,d:nh,e:nh,f:sh,g:vh,G:bh,H:rh,I:ih,j:ah,L:oh,m:ch,M:lh,p:oe,q:se,Q:Uh,s:Wh,S:uh,u:dh,U:fh,V:mh,w:hh,W:gh,x:null,X:null,y:_h,Y:yh,Z:xh,"%":Hh},b={a:ce,A:le,b:ue,B:de,c:null,d:Sh,e:Sh,f:Dh,g:Rh,G:Bh,H:Ch,I:wh,j:Th,L:Eh,m:Oh,M:kh,p:j,q:fe,Q:Uh,s:Wh,S:Ah,u:jh,U:Mh,V:Ph,w:Fh,W:Ih,x:null,X:null,y:Lh,Y:zh,Z:Vh,"%":Hh},x={a:E,A:D,b:O,B:ee,c:k,d:Km,e:Km,f:Qm,g:Hm,G:Vm,H:Jm,I:Jm,j:qm,L:Zm,m:Gm,M:Ym,p:T,q:Wm,Q:eh,s:th,S:Xm,u:Lm,U:Rm,V:zm,w:Im,W:Bm,x:te,X:ne,y:Hm,Y:Vm,Z:Um,"%":$m};y.x=S(n,y),y.X=S(r,y),y.c=S(t,y),b.x=S(n,b),b.X=S(r,b),b.c=S(t,b);function S(e,t){return function(n){var r=[],i=-1,a=0,o=e.length,s,c,l;for(n instanceof Date||(n=new Date(+n));++i<o;)e.charCodeAt(i)===37&&(r.push(e.slice(a,i)),(c=km[s=e.charAt(++i)])==null?c=s===`e`?` `:`0`:s=e.charAt(++i),(l=t[s])&&(s=l(n,c)),r.push(s),a=i+1);return r.push(e.slice(a,i)),r.join(``)}}function C(e,t){return function(n){var r=Dm(1900,void 0,1),i=w(r,e,n+=``,0),a,o;if(i!=n.length)return null;if(`Q`in r)return new Date(r.Q);if(`s`in r)return new Date(r.s*1e3+(`L`in r?r.L:0));if(t&&!(`Z`in r)&&(r.Z=0),`p`in r&&(r.H=r.H%12+r.p*12),r.m===void 0&&(r.m=`q`in r?r.q:0),`V`in r){if(r.V<1||r.V>53)return null;`w`in r||(r.w=1),`Z`in r?(a=Em(Dm(r.y,0,1)),o=a.getUTCDay(),a=o>4||o===0?um.ceil(a):um(a),a=Qp.offset(a,(r.V-1)*7),r.y=a.getUTCFullYear(),r.m=a.getUTCMonth(),r.d=a.getUTCDate()+(r.w+6)%7):(a=Tm(Dm(r.y,0,1)),o=a.getDay(),a=o>4||o===0?nm.ceil(a):nm(a),a=Zp.offset(a,(r.V-1)*7),r.y=a.getFullYear(),r.m=a.getMonth(),r.d=a.getDate()+(r.w+6)%7)}else (`W`in r||`U`in r)&&(`w`in r||(r.w=`u`in r?r.u%7:`W`in r?1:0),o=`Z`in r?Em(Dm(r.y,0,1)).getUTCDay():Tm(Dm(r.y,0,1)).getDay(),r.m=0,r.d=`W`in r?(r.w+6)%7+r.W*7-(o+5)%7:r.w+r.U*7-(o+6)%7);return`Z`in r?(r.H+=r.Z/100|0,r.M+=r.Z%100,Em(r)):Tm(r)}}function w(e,t,n,r){for(var i=0,a=t.length,o=n.length,s,c;i<a;){if(r>=o)return-1;if(s=t.charCodeAt(i++),s===37){if(s=t.charAt(i++),c=x[s in km?t.charAt(i++):s],!c||(r=c(e,n,r))<0)return-1}else if(s!=n.charCodeAt(r++))return-1}return r}function T(e,t,n){var r=l.exec(t.slice(n));return r?(e.p=u.get(r[0].toLowerCase()),n+r[0].length):-1}function E(e,t,n){var r=p.exec(t.slice(n));return r?(e.w=m.get(r[0].toLowerCase()),n+r[0].length):-1}function D(e,t,n){var r=d.exec(t.slice(n));return r?(e.w=f.get(r[0].toLowerCase()),n+r[0].length):-1}function O(e,t,n){var r=_.exec(t.slice(n));return r?(e.m=v.get(r[0].toLowerCase()),n+r[0].length):-1}function ee(e,t,n){var r=h.exec(t.slice(n));return r?(e.m=g.get(r[0].toLowerCase()),n+r[0].length):-1}function k(e,n,r){return w(e,t,n,r)}function te(e,t,r){return w(e,n,t,r)}function ne(e,t,n){return w(e,r,t,n)}function re(e){return o[e.getDay()]}function A(e){return a[e.getDay()]}function ie(e){return c[e.getMonth()]}function ae(e){return s[e.getMonth()]}function oe(e){return i[+(e.getHours()>=12)]}function se(e){return 1+~~(e.getMonth()/3)}function ce(e){return o[e.getUTCDay()]}function le(e){return a[e.getUTCDay()]}function ue(e){return c[e.getUTCMonth()]}function de(e){return s[e.getUTCMonth()]}function j(e){return i[+(e.getUTCHours()>=12)]}function fe(e){return 1+~~(e.getUTCMonth()/3)}return{format:function(e){var t=S(e+=``,y);return t.toString=function(){return e},t},parse:function(e){var t=C(e+=``,!1);return t.toString=function(){return e},t},utcFormat:function(e){var t=S(e+=``,b);return t.toString=function(){return e},t},utcParse:function(e){var t=C(e+=``,!0);return t.toString=function(){return e},t}}}var km={"-":``,_:` `,0:`0`},Am=/^\s*\d+/,jm=/^%/,Mm=/[\\^$*+?|[\]().{}]/g;function U(e,t,n){var r=e<0?`-`:``,i=(r?-e:e)+``,a=i.length;return r+(a<n?Array(n-a+1).join(t)+i:i)}function Nm(e){return e.replace(Mm,`\\$&`)}function Pm(e){return RegExp(`^(?:`+e.map(Nm).join(`|`)+`)`,`i`)}function Fm(e){return new Map(e.map((e,t)=>[e.toLowerCase(),t]))}function Im(e,t,n){var r=Am.exec(t.slice(n,n+1));return r?(e.w=+r[0],n+r[0].length):-1}function Lm(e,t,n){var r=Am.exec(t.slice(n,n+1));return r?(e.u=+r[0],n+r[0].length):-1}function Rm(e,t,n){var r=Am.exec(t.slice(n,n+2));return r?(e.U=+r[0],n+r[0].length):-1}function zm(e,t,n){var r=Am.exec(t.slice(n,n+2));return r?(e.V=+r[0],n+r[0].length):-1}function Bm(e,t,n){var r=Am.exec(t.slice(n,n+2));return r?(e.W=+r[0],n+r[0].length):-1}function Vm(e,t,n){var r=Am.exec(t.slice(n,n+4));return r?(e.y=+r[0],n+r[0].length):-1}function Hm(e,t,n){var r=Am.exec(t.slice(n,n+2));return r?(e.y=+r[0]+(+r[0]>68?1900:2e3),n+r[0].length):-1}function Um(e,t,n){var r=/^(Z)|([+-]\d\d)(?::?(\d\d))?/.exec(t.slice(n,n+6));return r?(e.Z=r[1]?0:-(r[2]+(r[3]||`00`)),n+r[0].length):-1}function Wm(e,t,n){var r=Am.exec(t.slice(n,n+1));return r?(e.q=r[0]*3-3,n+r[0].length):-1}function Gm(e,t,n){var r=Am.exec(t.slice(n,n+2));return r?(e.m=r[0]-1,n+r[0].length):-1}function Km(e,t,n){var r=Am.exec(t.slice(n,n+2));return r?(e.d=+r[0],n+r[0].length):-1}function qm(e,t,n){var r=Am.exec(t.slice(n,n+3));return r?(e.m=0,e.d=+r[0],n+r[0].length):-1}function Jm(e,t,n){var r=Am.exec(t.slice(n,n+2));return r?(e.H=+r[0],n+r[0].length):-1}function Ym(e,t,n){var r=Am.exec(t.slice(n,n+2));return r?(e.M=+r[0],n+r[0].length):-1}function Xm(e,t,n){var r=Am.exec(t.slice(n,n+2));return r?(e.S=+r[0],n+r[0].length):-1}function Zm(e,t,n){var r=Am.exec(t.slice(n,n+3));return r?(e.L=+r[0],n+r[0].length):-1}function Qm(e,t,n){var r=Am.exec(t.slice(n,n+6));return r?(e.L=Math.floor(r[0]/1e3),n+r[0].length):-1}function $m(e,t,n){var r=jm.exec(t.slice(n,n+1));return r?n+r[0].length:-1}function eh(e,t,n){var r=Am.exec(t.slice(n));return r?(e.Q=+r[0],n+r[0].length):-1}function th(e,t,n){var r=Am.exec(t.slice(n));return r?(e.s=+r[0],n+r[0].length):-1}function nh(e,t){return U(e.getDate(),t,2)}function rh(e,t){return U(e.getHours(),t,2)}function ih(e,t){return U(e.getHours()%12||12,t,2)}function ah(e,t){return U(1+Zp.count(vm(e),e),t,3)}function oh(e,t){return U(e.getMilliseconds(),t,3)}function sh(e,t){return oh(e,t)+`000`}function ch(e,t){return U(e.getMonth()+1,t,2)}function lh(e,t){return U(e.getMinutes(),t,2)}function uh(e,t){return U(e.getSeconds(),t,2)}function dh(e){var t=e.getDay();return t===0?7:t}function fh(e,t){return U(tm.count(vm(e)-1,e),t,2)}function ph(e){var t=e.getDay();return t>=4||t===0?am(e):am.ceil(e)}function mh(e,t){return e=ph(e),U(am.count(vm(e),e)+(vm(e).getDay()===4),t,2)}function hh(e){return e.getDay()}function gh(e,t){return U(nm.count(vm(e)-1,e),t,2)}function _h(e,t){return U(e.getFullYear()%100,t,2)}function vh(e,t){return e=ph(e),U(e.getFullYear()%100,t,2)}function yh(e,t){return U(e.getFullYear()%1e4,t,4)}function bh(e,t){var n=e.getDay();return e=n>=4||n===0?am(e):am.ceil(e),U(e.getFullYear()%1e4,t,4)}function xh(e){var t=e.getTimezoneOffset();return(t>0?`-`:(t*=-1,`+`))+U(t/60|0,`0`,2)+U(t%60,`0`,2)}function Sh(e,t){return U(e.getUTCDate(),t,2)}function Ch(e,t){return U(e.getUTCHours(),t,2)}function wh(e,t){return U(e.getUTCHours()%12||12,t,2)}function Th(e,t){return U(1+Qp.count(ym(e),e),t,3)}function Eh(e,t){return U(e.getUTCMilliseconds(),t,3)}function Dh(e,t){return Eh(e,t)+`000`}function Oh(e,t){return U(e.getUTCMonth()+1,t,2)}function kh(e,t){return U(e.getUTCMinutes(),t,2)}function Ah(e,t){return U(e.getUTCSeconds(),t,2)}function jh(e){var t=e.getUTCDay();return t===0?7:t}function Mh(e,t){return U(lm.count(ym(e)-1,e),t,2)}function Nh(e){var t=e.getUTCDay();return t>=4||t===0?pm(e):pm.ceil(e)}function Ph(e,t){return e=Nh(e),U(pm.count(ym(e),e)+(ym(e).getUTCDay()===4),t,2)}function Fh(e){return e.getUTCDay()}function Ih(e,t){return U(um.count(ym(e)-1,e),t,2)}function Lh(e,t){return U(e.getUTCFullYear()%100,t,2)}function Rh(e,t){return e=Nh(e),U(e.getUTCFullYear()%100,t,2)}function zh(e,t){return U(e.getUTCFullYear()%1e4,t,4)}function Bh(e,t){var n=e.getUTCDay();return e=n>=4||n===0?pm(e):pm.ceil(e),U(e.getUTCFullYear()%1e4,t,4)}function Vh(){return`+0000`}function Hh(){return`%`}function Uh(e){return+e}function Wh(e){return Math.floor(e/1e3)}var Gh,Kh,qh;Jh({dateTime:`%x, %X`,date:`%-m/%-d/%Y`,time:`%-I:%M:%S %p`,periods:[`AM`,`PM`],days:[`Sunday`,`Monday`,`Tuesday`,`Wednesday`,`Thursday`,`Friday`,`Saturday`],shortDays:[`Sun`,`Mon`,`Tue`,`Wed`,`Thu`,`Fri`,`Sat`],months:[`January`,`February`,`March`,`April`,`May`,`June`,`July`,`August`,`September`,`October`,`November`,`December`],shortMonths:[`Jan`,`Feb`,`Mar`,`Apr`,`May`,`Jun`,`Jul`,`Aug`,`Sep`,`Oct`,`Nov`,`Dec`]});function Jh(e){return Gh=Om(e),Kh=Gh.format,Gh.parse,qh=Gh.utcFormat,Gh.utcParse,Gh}function Yh(e){return new Date(e)}function Xh(e){return e instanceof Date?+e:+new Date(+e)}function Zh(e,t,n,r,i,a,o,s,c,l){var u=Nf(),d=u.invert,f=u.domain,p=l(`.%L`),m=l(`:%S`),h=l(`%I:%M`),g=l(`%I %p`),_=l(`%a %d`),v=l(`%b %d`),y=l(`%B`),b=l(`%Y`);function x(e){return(c(e)<e?p:s(e)<e?m:o(e)<e?h:a(e)<e?g:r(e)<e?i(e)<e?_:v:n(e)<e?y:b)(e)}return u.invert=function(e){return new Date(d(e))},u.domain=function(e){return arguments.length?f(Array.from(e,Xh)):f().map(Yh)},u.ticks=function(t){var n=f();return e(n[0],n[n.length-1],t??10)},u.tickFormat=function(e,t){return t==null?x:l(t)},u.nice=function(e){var n=f();return(!e||typeof e.range!=`function`)&&(e=t(n[0],n[n.length-1],e??10)),e?f(cp(n,e)):u},u.copy=function(){return jf(u,Zh(e,t,n,r,i,a,o,s,c,l))},u}function Qh(){return ld.apply(Zh(Cm,wm,vm,gm,tm,Zp,Yp,qp,Kp,Kh).domain([new Date(2e3,0,1),new Date(2e3,0,2)]),arguments)}function $h(){return ld.apply(Zh(xm,Sm,ym,_m,lm,Qp,Xp,Jp,Kp,qh).domain([Date.UTC(2e3,0,1),Date.UTC(2e3,0,2)]),arguments)}function eg(){var e=0,t=1,n,r,i,a,o=Ef,s=!1,c;function l(e){return e==null||isNaN(e=+e)?c:o(i===0?.5:(e=(a(e)-n)*i,s?Math.max(0,Math.min(1,e)):e))}l.domain=function(o){return arguments.length?([e,t]=o,n=a(e=+e),r=a(t=+t),i=n===r?0:1/(r-n),l):[e,t]},l.clamp=function(e){return arguments.length?(s=!!e,l):s},l.interpolator=function(e){return arguments.length?(o=e,l):o};function u(e){return function(t){var n,r;return arguments.length?([n,r]=t,o=e(n,r),l):[o(0),o(1)]}}return l.range=u(bf),l.rangeRound=u(xf),l.unknown=function(e){return arguments.length?(c=e,l):c},function(o){return a=o,n=o(e),r=o(t),i=n===r?0:1/(r-n),l}}function tg(e,t){return t.domain(e.domain()).interpolator(e.interpolator()).clamp(e.clamp()).unknown(e.unknown())}function ng(){var e=ap(eg()(Ef));return e.copy=function(){return tg(e,ng())},ud.apply(e,arguments)}function rg(){var e=_p(eg()).domain([1,10]);return e.copy=function(){return tg(e,rg()).base(e.base())},ud.apply(e,arguments)}function ig(){var e=xp(eg());return e.copy=function(){return tg(e,ig()).constant(e.constant())},ud.apply(e,arguments)}function ag(){var e=Ep(eg());return e.copy=function(){return tg(e,ag()).exponent(e.exponent())},ud.apply(e,arguments)}function og(){return ag.apply(null,arguments).exponent(.5)}function sg(){var e=[],t=Ef;function n(n){if(n!=null&&!isNaN(n=+n))return t((Vu(e,n,1)-1)/(e.length-1))}return n.domain=function(t){if(!arguments.length)return e.slice();e=[];for(let n of t)n!=null&&!isNaN(n=+n)&&e.push(n);return e.sort(Nu),n},n.interpolator=function(e){return arguments.length?(t=e,n):t},n.range=function(){return e.map((n,r)=>t(r/(e.length-1)))},n.quantiles=function(t){return Array.from({length:t+1},(n,r)=>od(e,r/t))},n.copy=function(){return sg(t).domain(e)},ud.apply(n,arguments)}function cg(){var e=0,t=.5,n=1,r=1,i,a,o,s,c,l=Ef,u,d=!1,f;function p(e){return isNaN(e=+e)?f:(e=.5+((e=+u(e))-a)*(r*e<r*a?s:c),l(d?Math.max(0,Math.min(1,e)):e))}p.domain=function(l){return arguments.length?([e,t,n]=l,i=u(e=+e),a=u(t=+t),o=u(n=+n),s=i===a?0:.5/(a-i),c=a===o?0:.5/(o-a),r=a<i?-1:1,p):[e,t,n]},p.clamp=function(e){return arguments.length?(d=!!e,p):d},p.interpolator=function(e){return arguments.length?(l=e,p):l};function m(e){return function(t){var n,r,i;return arguments.length?([n,r,i]=t,l=Sf(e,[n,r,i]),p):[l(0),l(.5),l(1)]}}return p.range=m(bf),p.rangeRound=m(xf),p.unknown=function(e){return arguments.length?(f=e,p):f},function(l){return u=l,i=l(e),a=l(t),o=l(n),s=i===a?0:.5/(a-i),c=a===o?0:.5/(o-a),r=a<i?-1:1,p}}function lg(){var e=ap(cg()(Ef));return e.copy=function(){return tg(e,lg())},ud.apply(e,arguments)}function ug(){var e=_p(cg()).domain([.1,1,10]);return e.copy=function(){return tg(e,ug()).base(e.base())},ud.apply(e,arguments)}function dg(){var e=xp(cg());return e.copy=function(){return tg(e,dg()).constant(e.constant())},ud.apply(e,arguments)}function fg(){var e=Ep(cg());return e.copy=function(){return tg(e,fg()).exponent(e.exponent())},ud.apply(e,arguments)}function pg(){return fg.apply(null,arguments).exponent(.5)}var mg=t({scaleBand:()=>pd,scaleDiverging:()=>lg,scaleDivergingLog:()=>ug,scaleDivergingPow:()=>fg,scaleDivergingSqrt:()=>pg,scaleDivergingSymlog:()=>dg,scaleIdentity:()=>sp,scaleImplicit:()=>dd,scaleLinear:()=>op,scaleLog:()=>vp,scaleOrdinal:()=>fd,scalePoint:()=>hd,scalePow:()=>Dp,scaleQuantile:()=>Mp,scaleQuantize:()=>Np,scaleRadial:()=>jp,scaleSequential:()=>ng,scaleSequentialLog:()=>rg,scaleSequentialPow:()=>ag,scaleSequentialQuantile:()=>sg,scaleSequentialSqrt:()=>og,scaleSequentialSymlog:()=>ig,scaleSqrt:()=>Op,scaleSymlog:()=>Sp,scaleThreshold:()=>Pp,scaleTime:()=>Qh,scaleUtc:()=>$h,tickFormat:()=>ip}),hg=e=>e.chartData,gg=L([hg],e=>{var t=e.chartData==null?0:e.chartData.length-1;return{chartData:e.chartData,computedData:e.computedData,dataEndIndex:t,dataStartIndex:0}}),_g=(e,t,n,r)=>r?gg(e):hg(e);function vg(e){if(Array.isArray(e)&&e.length===2){var[t,n]=e;if(Yc(t)&&Yc(n))return!0}return!1}function yg(e,t,n){return n?e:[Math.min(e[0],t[0]),Math.max(e[1],t[1])]}function bg(e,t){if(t&&typeof e!=`function`&&Array.isArray(e)&&e.length===2){var[n,r]=e,i,a;if(Yc(n))i=n;else if(typeof n==`function`)return;if(Yc(r))a=r;else if(typeof r==`function`)return;var o=[i,a];if(vg(o))return o}}function xg(e,t,n){if(!(!n&&t==null)){if(typeof e==`function`&&t!=null)try{var r=e(t,n);if(vg(r))return yg(r,t,n)}catch{}if(Array.isArray(e)&&e.length===2){var[i,a]=e,o,s;if(i===`auto`)t!=null&&(o=Math.min(...t));else if(b(i))o=i;else if(typeof i==`function`)try{t!=null&&(o=i(t?.[0]))}catch{}else if(typeof i==`string`&&ms.test(i)){var c=ms.exec(i);if(c==null||t==null)o=void 0;else{var l=+c[1];o=t[0]-l}}else o=t?.[0];if(a===`auto`)t!=null&&(s=Math.max(...t));else if(b(a))s=a;else if(typeof a==`function`)try{t!=null&&(s=a(t?.[1]))}catch{}else if(typeof a==`string`&&hs.test(a)){var u=hs.exec(a);if(u==null||t==null)s=void 0;else{var d=+u[1];s=t[1]+d}}else s=t?.[1];var f=[o,s];if(vg(f))return t==null?f:yg(f,t,n)}}}var Sg=1e9,Cg={precision:20,rounding:4,toExpNeg:-7,toExpPos:21,LN10:`2.302585092994045684017991454684364207601101488628772976033327900967572609677352480235997205089598298341967784042286`},wg,W=!0,Tg=`[DecimalError] `,Eg=Tg+`Invalid argument: `,Dg=Tg+`Exponent out of range: `,Og=Math.floor,kg=Math.pow,Ag=/^(\d+(\.\d*)?|\.\d+)(e[+-]?\d+)?$/i,jg,Mg=1e7,G=7,Ng=9007199254740991,Pg=Og(Ng/G),K={};K.absoluteValue=K.abs=function(){var e=new this.constructor(this);return e.s&&=1,e},K.comparedTo=K.cmp=function(e){var t,n,r,i,a=this;if(e=new a.constructor(e),a.s!==e.s)return a.s||-e.s;if(a.e!==e.e)return a.e>e.e^a.s<0?1:-1;for(r=a.d.length,i=e.d.length,t=0,n=r<i?r:i;t<n;++t)if(a.d[t]!==e.d[t])return a.d[t]>e.d[t]^a.s<0?1:-1;return r===i?0:r>i^a.s<0?1:-1},K.decimalPlaces=K.dp=function(){var e=this,t=e.d.length-1,n=(t-e.e)*G;if(t=e.d[t],t)for(;t%10==0;t/=10)n--;return n<0?0:n},K.dividedBy=K.div=function(e){return Rg(this,new this.constructor(e))},K.dividedToIntegerBy=K.idiv=function(e){var t=this,n=t.constructor;return q(Rg(t,new n(e),0,1),n.precision)},K.equals=K.eq=function(e){return!this.cmp(e)},K.exponent=function(){return Bg(this)},K.greaterThan=K.gt=function(e){return this.cmp(e)>0},K.greaterThanOrEqualTo=K.gte=function(e){return this.cmp(e)>=0},K.isInteger=K.isint=function(){return this.e>this.d.length-2},K.isNegative=K.isneg=function(){return this.s<0},K.isPositive=K.ispos=function(){return this.s>0},K.isZero=function(){return this.s===0},K.lessThan=K.lt=function(e){return this.cmp(e)<0},K.lessThanOrEqualTo=K.lte=function(e){return this.cmp(e)<1},K.logarithm=K.log=function(e){var t,n=this,r=n.constructor,i=r.precision,a=i+5;if(e===void 0)e=new r(10);else if(e=new r(e),e.s<1||e.eq(jg))throw Error(Tg+`NaN`);if(n.s<1)throw Error(Tg+(n.s?`NaN`:`-Infinity`));return n.eq(jg)?new r(0):(W=!1,t=Rg(Ug(n,a),Ug(e,a),a),W=!0,q(t,i))},K.minus=K.sub=function(e){var t=this;return e=new t.constructor(e),t.s==e.s?Gg(t,e):Fg(t,(e.s=-e.s,e))},K.modulo=K.mod=function(e){var t,n=this,r=n.constructor,i=r.precision;if(e=new r(e),!e.s)throw Error(Tg+`NaN`);return n.s?(W=!1,t=Rg(n,e,0,1).times(e),W=!0,n.minus(t)):q(new r(n),i)},K.naturalExponential=K.exp=function(){return zg(this)},K.naturalLogarithm=K.ln=function(){return Ug(this)},K.negated=K.neg=function(){var e=new this.constructor(this);return e.s=-e.s||0,e},K.plus=K.add=function(e){var t=this;return e=new t.constructor(e),t.s==e.s?Fg(t,e):Gg(t,(e.s=-e.s,e))},K.precision=K.sd=function(e){var t,n,r,i=this;if(e!==void 0&&e!==!!e&&e!==1&&e!==0)throw Error(Eg+e);if(t=Bg(i)+1,r=i.d.length-1,n=r*G+1,r=i.d[r],r){for(;r%10==0;r/=10)n--;for(r=i.d[0];r>=10;r/=10)n++}return e&&t>n?t:n},K.squareRoot=K.sqrt=function(){var e,t,n,r,i,a,o,s=this,c=s.constructor;if(s.s<1){if(!s.s)return new c(0);throw Error(Tg+`NaN`)}for(e=Bg(s),W=!1,i=Math.sqrt(+s),i==0||i==1/0?(t=Lg(s.d),(t.length+e)%2==0&&(t+=`0`),i=Math.sqrt(t),e=Og((e+1)/2)-(e<0||e%2),i==1/0?t=`5e`+e:(t=i.toExponential(),t=t.slice(0,t.indexOf(`e`)+1)+e),r=new c(t)):r=new c(i.toString()),n=c.precision,i=o=n+3;;)if(a=r,r=a.plus(Rg(s,a,o+2)).times(.5),Lg(a.d).slice(0,o)===(t=Lg(r.d)).slice(0,o)){if(t=t.slice(o-3,o+1),i==o&&t==`4999`){if(q(a,n+1,0),a.times(a).eq(s)){r=a;break}}else if(t!=`9999`)break;o+=4}return W=!0,q(r,n)},K.times=K.mul=function(e){var t,n,r,i,a,o,s,c,l,u=this,d=u.constructor,f=u.d,p=(e=new d(e)).d;if(!u.s||!e.s)return new d(0);for(e.s*=u.s,n=u.e+e.e,c=f.length,l=p.length,c<l&&(a=f,f=p,p=a,o=c,c=l,l=o),a=[],o=c+l,r=o;r--;)a.push(0);for(r=l;--r>=0;){for(t=0,i=c+r;i>r;)s=a[i]+p[r]*f[i-r-1]+t,a[i--]=s%Mg|0,t=s/Mg|0;a[i]=(a[i]+t)%Mg|0}for(;!a[--o];)a.pop();return t?++n:a.shift(),e.d=a,e.e=n,W?q(e,d.precision):e},K.toDecimalPlaces=K.todp=function(e,t){var n=this,r=n.constructor;return n=new r(n),e===void 0?n:(Ig(e,0,Sg),t===void 0?t=r.rounding:Ig(t,0,8),q(n,e+Bg(n)+1,t))},K.toExponential=function(e,t){var n,r=this,i=r.constructor;return e===void 0?n=Kg(r,!0):(Ig(e,0,Sg),t===void 0?t=i.rounding:Ig(t,0,8),r=q(new i(r),e+1,t),n=Kg(r,!0,e+1)),n},K.toFixed=function(e,t){var n,r,i=this,a=i.constructor;return e===void 0?Kg(i):(Ig(e,0,Sg),t===void 0?t=a.rounding:Ig(t,0,8),r=q(new a(i),e+Bg(i)+1,t),n=Kg(r.abs(),!1,e+Bg(r)+1),i.isneg()&&!i.isZero()?`-`+n:n)},K.toInteger=K.toint=function(){var e=this,t=e.constructor;return q(new t(e),Bg(e)+1,t.rounding)},K.toNumber=function(){return+this},K.toPower=K.pow=function(e){var t,n,r,i,a,o,s=this,c=s.constructor,l=12,u=+(e=new c(e));if(!e.s)return new c(jg);if(s=new c(s),!s.s){if(e.s<1)throw Error(Tg+`Infinity`);return s}if(s.eq(jg))return s;if(r=c.precision,e.eq(jg))return q(s,r);if(t=e.e,n=e.d.length-1,o=t>=n,a=s.s,o){if((n=u<0?-u:u)<=Ng){for(i=new c(jg),t=Math.ceil(r/G+4),W=!1;n%2&&(i=i.times(s),qg(i.d,t)),n=Og(n/2),n!==0;)s=s.times(s),qg(s.d,t);return W=!0,e.s<0?new c(jg).div(i):q(i,r)}}else if(a<0)throw Error(Tg+`NaN`);return a=a<0&&e.d[Math.max(t,n)]&1?-1:1,s.s=1,W=!1,i=e.times(Ug(s,r+l)),W=!0,i=zg(i),i.s=a,i},K.toPrecision=function(e,t){var n,r,i=this,a=i.constructor;return e===void 0?(n=Bg(i),r=Kg(i,n<=a.toExpNeg||n>=a.toExpPos)):(Ig(e,1,Sg),t===void 0?t=a.rounding:Ig(t,0,8),i=q(new a(i),e,t),n=Bg(i),r=Kg(i,e<=n||n<=a.toExpNeg,e)),r},K.toSignificantDigits=K.tosd=function(e,t){var n=this,r=n.constructor;return e===void 0?(e=r.precision,t=r.rounding):(Ig(e,1,Sg),t===void 0?t=r.rounding:Ig(t,0,8)),q(new r(n),e,t)},K.toString=K.valueOf=K.val=K.toJSON=K[Symbol.for(`nodejs.util.inspect.custom`)]=function(){var e=this,t=Bg(e),n=e.constructor;return Kg(e,t<=n.toExpNeg||t>=n.toExpPos)};function Fg(e,t){var n,r,i,a,o,s,c,l,u=e.constructor,d=u.precision;if(!e.s||!t.s)return t.s||(t=new u(e)),W?q(t,d):t;if(c=e.d,l=t.d,o=e.e,i=t.e,c=c.slice(),a=o-i,a){for(a<0?(r=c,a=-a,s=l.length):(r=l,i=o,s=c.length),o=Math.ceil(d/G),s=o>s?o+1:s+1,a>s&&(a=s,r.length=1),r.reverse();a--;)r.push(0);r.reverse()}for(s=c.length,a=l.length,s-a<0&&(a=s,r=l,l=c,c=r),n=0;a;)n=(c[--a]=c[a]+l[a]+n)/Mg|0,c[a]%=Mg;for(n&&(c.unshift(n),++i),s=c.length;c[--s]==0;)c.pop();return t.d=c,t.e=i,W?q(t,d):t}function Ig(e,t,n){if(e!==~~e||e<t||e>n)throw Error(Eg+e)}function Lg(e){var t,n,r,i=e.length-1,a=``,o=e[0];if(i>0){for(a+=o,t=1;t<i;t++)r=e[t]+``,n=G-r.length,n&&(a+=Hg(n)),a+=r;o=e[t],r=o+``,n=G-r.length,n&&(a+=Hg(n))}else if(o===0)return`0`;for(;o%10==0;)o/=10;return a+o}var Rg=(function(){function e(e,t){var n,r=0,i=e.length;for(e=e.slice();i--;)n=e[i]*t+r,e[i]=n%Mg|0,r=n/Mg|0;return r&&e.unshift(r),e}function t(e,t,n,r){var i,a;if(n!=r)a=n>r?1:-1;else for(i=a=0;i<n;i++)if(e[i]!=t[i]){a=e[i]>t[i]?1:-1;break}return a}function n(e,t,n){for(var r=0;n--;)e[n]-=r,r=e[n]<t[n]?1:0,e[n]=r*Mg+e[n]-t[n];for(;!e[0]&&e.length>1;)e.shift()}return function(r,i,a,o){var s,c,l,u,d,f,p,m,h,g,_,v,y,b,x,S,C,w,T=r.constructor,E=r.s==i.s?1:-1,D=r.d,O=i.d;if(!r.s)return new T(r);if(!i.s)throw Error(Tg+`Division by zero`);for(c=r.e-i.e,C=O.length,x=D.length,p=new T(E),m=p.d=[],l=0;O[l]==(D[l]||0);)++l;if(O[l]>(D[l]||0)&&--c,v=a==null?a=T.precision:o?a+(Bg(r)-Bg(i))+1:a,v<0)return new T(0);if(v=v/G+2|0,l=0,C==1)for(u=0,O=O[0],v++;(l<x||u)&&v--;l++)y=u*Mg+(D[l]||0),m[l]=y/O|0,u=y%O|0;else{for(u=Mg/(O[0]+1)|0,u>1&&(O=e(O,u),D=e(D,u),C=O.length,x=D.length),b=C,h=D.slice(0,C),g=h.length;g<C;)h[g++]=0;w=O.slice(),w.unshift(0),S=O[0],O[1]>=Mg/2&&++S;do u=0,s=t(O,h,C,g),s<0?(_=h[0],C!=g&&(_=_*Mg+(h[1]||0)),u=_/S|0,u>1?(u>=Mg&&(u=Mg-1),d=e(O,u),f=d.length,g=h.length,s=t(d,h,f,g),s==1&&(u--,n(d,C<f?w:O,f))):(u==0&&(s=u=1),d=O.slice()),f=d.length,f<g&&d.unshift(0),n(h,d,g),s==-1&&(g=h.length,s=t(O,h,C,g),s<1&&(u++,n(h,C<g?w:O,g))),g=h.length):s===0&&(u++,h=[0]),m[l++]=u,s&&h[0]?h[g++]=D[b]||0:(h=[D[b]],g=1);while((b++<x||h[0]!==void 0)&&v--)}return m[0]||m.shift(),p.e=c,q(p,o?a+Bg(p)+1:a)}})();function zg(e,t){var n,r,i,a,o,s,c=0,l=0,u=e.constructor,d=u.precision;if(Bg(e)>16)throw Error(Dg+Bg(e));if(!e.s)return new u(jg);for(t==null?(W=!1,s=d):s=t,o=new u(.03125);e.abs().gte(.1);)e=e.times(o),l+=5;for(r=Math.log(kg(2,l))/Math.LN10*2+5|0,s+=r,n=i=a=new u(jg),u.precision=s;;){if(i=q(i.times(e),s),n=n.times(++c),o=a.plus(Rg(i,n,s)),Lg(o.d).slice(0,s)===Lg(a.d).slice(0,s)){for(;l--;)a=q(a.times(a),s);return u.precision=d,t==null?(W=!0,q(a,d)):a}a=o}}function Bg(e){for(var t=e.e*G,n=e.d[0];n>=10;n/=10)t++;return t}function Vg(e,t,n){if(t>e.LN10.sd())throw W=!0,n&&(e.precision=n),Error(Tg+`LN10 precision limit exceeded`);return q(new e(e.LN10),t)}function Hg(e){for(var t=``;e--;)t+=`0`;return t}function Ug(e,t){var n,r,i,a,o,s,c,l,u,d=1,f=10,p=e,m=p.d,h=p.constructor,g=h.precision;if(p.s<1)throw Error(Tg+(p.s?`NaN`:`-Infinity`));if(p.eq(jg))return new h(0);if(t==null?(W=!1,l=g):l=t,p.eq(10))return t??(W=!0),Vg(h,l);if(l+=f,h.precision=l,n=Lg(m),r=n.charAt(0),a=Bg(p),Math.abs(a)<0x5543df729c000){for(;r<7&&r!=1||r==1&&n.charAt(1)>3;)p=p.times(e),n=Lg(p.d),r=n.charAt(0),d++;a=Bg(p),r>1?(p=new h(`0.`+n),a++):p=new h(r+`.`+n.slice(1))}else return c=Vg(h,l+2,g).times(a+``),p=Ug(new h(r+`.`+n.slice(1)),l-f).plus(c),h.precision=g,t==null?(W=!0,q(p,g)):p;for(s=o=p=Rg(p.minus(jg),p.plus(jg),l),u=q(p.times(p),l),i=3;;){if(o=q(o.times(u),l),c=s.plus(Rg(o,new h(i),l)),Lg(c.d).slice(0,l)===Lg(s.d).slice(0,l))return s=s.times(2),a!==0&&(s=s.plus(Vg(h,l+2,g).times(a+``))),s=Rg(s,new h(d),l),h.precision=g,t==null?(W=!0,q(s,g)):s;s=c,i+=2}}function Wg(e,t){var n,r,i;for((n=t.indexOf(`.`))>-1&&(t=t.replace(`.`,``)),(r=t.search(/e/i))>0?(n<0&&(n=r),n+=+t.slice(r+1),t=t.substring(0,r)):n<0&&(n=t.length),r=0;t.charCodeAt(r)===48;)++r;for(i=t.length;t.charCodeAt(i-1)===48;)--i;if(t=t.slice(r,i),t){if(i-=r,n=n-r-1,e.e=Og(n/G),e.d=[],r=(n+1)%G,n<0&&(r+=G),r<i){for(r&&e.d.push(+t.slice(0,r)),i-=G;r<i;)e.d.push(+t.slice(r,r+=G));t=t.slice(r),r=G-t.length}else r-=i;for(;r--;)t+=`0`;if(e.d.push(+t),W&&(e.e>Pg||e.e<-Pg))throw Error(Dg+n)}else e.s=0,e.e=0,e.d=[0];return e}function q(e,t,n){var r,i,a,o,s,c,l,u,d=e.d;for(o=1,a=d[0];a>=10;a/=10)o++;if(r=t-o,r<0)r+=G,i=t,l=d[u=0];else{if(u=Math.ceil((r+1)/G),a=d.length,u>=a)return e;for(l=a=d[u],o=1;a>=10;a/=10)o++;r%=G,i=r-G+o}if(n!==void 0&&(a=kg(10,o-i-1),s=l/a%10|0,c=t<0||d[u+1]!==void 0||l%a,c=n<4?(s||c)&&(n==0||n==(e.s<0?3:2)):s>5||s==5&&(n==4||c||n==6&&(r>0?i>0?l/kg(10,o-i):0:d[u-1])%10&1||n==(e.s<0?8:7))),t<1||!d[0])return c?(a=Bg(e),d.length=1,t=t-a-1,d[0]=kg(10,(G-t%G)%G),e.e=Og(-t/G)||0):(d.length=1,d[0]=e.e=e.s=0),e;if(r==0?(d.length=u,a=1,u--):(d.length=u+1,a=kg(10,G-r),d[u]=i>0?(l/kg(10,o-i)%kg(10,i)|0)*a:0),c)for(;;)if(u==0){(d[0]+=a)==Mg&&(d[0]=1,++e.e);break}else{if(d[u]+=a,d[u]!=Mg)break;d[u--]=0,a=1}for(r=d.length;d[--r]===0;)d.pop();if(W&&(e.e>Pg||e.e<-Pg))throw Error(Dg+Bg(e));return e}function Gg(e,t){var n,r,i,a,o,s,c,l,u,d,f=e.constructor,p=f.precision;if(!e.s||!t.s)return t.s?t.s=-t.s:t=new f(e),W?q(t,p):t;if(c=e.d,d=t.d,r=t.e,l=e.e,c=c.slice(),o=l-r,o){for(u=o<0,u?(n=c,o=-o,s=d.length):(n=d,r=l,s=c.length),i=Math.max(Math.ceil(p/G),s)+2,o>i&&(o=i,n.length=1),n.reverse(),i=o;i--;)n.push(0);n.reverse()}else{for(i=c.length,s=d.length,u=i<s,u&&(s=i),i=0;i<s;i++)if(c[i]!=d[i]){u=c[i]<d[i];break}o=0}for(u&&(n=c,c=d,d=n,t.s=-t.s),s=c.length,i=d.length-s;i>0;--i)c[s++]=0;for(i=d.length;i>o;){if(c[--i]<d[i]){for(a=i;a&&c[--a]===0;)c[a]=Mg-1;--c[a],c[i]+=Mg}c[i]-=d[i]}for(;c[--s]===0;)c.pop();for(;c[0]===0;c.shift())--r;return c[0]?(t.d=c,t.e=r,W?q(t,p):t):new f(0)}function Kg(e,t,n){var r,i=Bg(e),a=Lg(e.d),o=a.length;return t?(n&&(r=n-o)>0?a=a.charAt(0)+`.`+a.slice(1)+Hg(r):o>1&&(a=a.charAt(0)+`.`+a.slice(1)),a=a+(i<0?`e`:`e+`)+i):i<0?(a=`0.`+Hg(-i-1)+a,n&&(r=n-o)>0&&(a+=Hg(r))):i>=o?(a+=Hg(i+1-o),n&&(r=n-i-1)>0&&(a=a+`.`+Hg(r))):((r=i+1)<o&&(a=a.slice(0,r)+`.`+a.slice(r)),n&&(r=n-o)>0&&(i+1===o&&(a+=`.`),a+=Hg(r))),e.s<0?`-`+a:a}function qg(e,t){if(e.length>t)return e.length=t,!0}function Jg(e){var t,n,r;function i(e){var t=this;if(!(t instanceof i))return new i(e);if(t.constructor=i,e instanceof i){t.s=e.s,t.e=e.e,t.d=(e=e.d)?e.slice():e;return}if(typeof e==`number`){if(e*0!=0)throw Error(Eg+e);if(e>0)t.s=1;else if(e<0)e=-e,t.s=-1;else{t.s=0,t.e=0,t.d=[0];return}if(e===~~e&&e<1e7){t.e=0,t.d=[e];return}return Wg(t,e.toString())}else if(typeof e!=`string`)throw Error(Eg+e);if(e.charCodeAt(0)===45?(e=e.slice(1),t.s=-1):t.s=1,Ag.test(e))Wg(t,e);else throw Error(Eg+e)}if(i.prototype=K,i.ROUND_UP=0,i.ROUND_DOWN=1,i.ROUND_CEIL=2,i.ROUND_FLOOR=3,i.ROUND_HALF_UP=4,i.ROUND_HALF_DOWN=5,i.ROUND_HALF_EVEN=6,i.ROUND_HALF_CEIL=7,i.ROUND_HALF_FLOOR=8,i.clone=Jg,i.config=i.set=Yg,e===void 0&&(e={}),e)for(r=[`precision`,`rounding`,`toExpNeg`,`toExpPos`,`LN10`],t=0;t<r.length;)e.hasOwnProperty(n=r[t++])||(e[n]=this[n]);return i.config(e),i}function Yg(e){if(!e||typeof e!=`object`)throw Error(Tg+`Object expected`);var t,n,r,i=[`precision`,1,Sg,`rounding`,0,8,`toExpNeg`,-1/0,0,`toExpPos`,0,1/0];for(t=0;t<i.length;t+=3)if((r=e[n=i[t]])!==void 0)if(Og(r)===r&&r>=i[t+1]&&r<=i[t+2])this[n]=r;else throw Error(Eg+n+`: `+r);if((r=e[n=`LN10`])!==void 0)if(r==Math.LN10)this[n]=new this(r);else throw Error(Eg+n+`: `+r);return this}var wg=Jg(Cg);jg=new wg(1);var J=wg,Xg=e=>e,Zg={"@@functional/placeholder":!0},Qg=e=>e===Zg,$g=e=>function t(){return arguments.length===0||arguments.length===1&&Qg(arguments.length<=0?void 0:arguments[0])?t:e(...arguments)},e_=(e,t)=>e===1?t:$g(function(){var n=[...arguments],r=n.filter(e=>e!==Zg).length;return r>=e?t(...n):e_(e-r,$g(function(){var e=[...arguments],r=n.map(t=>Qg(t)?e.shift():t);return t(...r,...e)}))}),t_=e=>e_(e.length,e),n_=(e,t)=>{for(var n=[],r=e;r<t;++r)n[r-e]=r;return n},r_=t_((e,t)=>Array.isArray(t)?t.map(e):Object.keys(t).map(e=>t[e]).map(e)),i_=function(){var e=[...arguments];if(!e.length)return Xg;var t=e.reverse(),n=t[0],r=t.slice(1);return function(){return r.reduce((e,t)=>t(e),n(...arguments))}},a_=e=>Array.isArray(e)?e.reverse():e.split(``).reverse().join(``),o_=e=>{var t=null,n=null;return function(){var r=[...arguments];return t&&r.every((e,n)=>e===t?.[n])?n:(t=r,n=e(...r),n)}};function s_(e){return e===0?1:Math.floor(new J(e).abs().log(10).toNumber())+1}function c_(e,t,n){for(var r=new J(e),i=0,a=[];r.lt(t)&&i<1e5;)a.push(r.toNumber()),r=r.add(n),i++;return a}t_((e,t,n)=>{var r=+e,i=+t;return r+n*(i-r)}),t_((e,t,n)=>{var r=t-+e;return r||=1/0,(n-e)/r}),t_((e,t,n)=>{var r=t-+e;return r||=1/0,Math.max(0,Math.min(1,(n-e)/r))});var l_=e=>{var[t,n]=e,[r,i]=[t,n];return t>n&&([r,i]=[n,t]),[r,i]},u_=(e,t,n)=>{if(e.lte(0))return new J(0);var r=s_(e.toNumber()),i=new J(10).pow(r),a=e.div(i),o=r===1?.1:.05,s=new J(Math.ceil(a.div(o).toNumber())).add(n).mul(o).mul(i);return t?new J(s.toNumber()):new J(Math.ceil(s.toNumber()))},d_=(e,t,n)=>{var r=new J(1),i=new J(e);if(!i.isint()&&n){var a=Math.abs(e);a<1?(r=new J(10).pow(s_(e)-1),i=new J(Math.floor(i.div(r).toNumber())).mul(r)):a>1&&(i=new J(Math.floor(e)))}else e===0?i=new J(Math.floor((t-1)/2)):n||(i=new J(Math.floor(e)));var o=Math.floor((t-1)/2);return i_(r_(e=>i.add(new J(e-o).mul(r)).toNumber()),n_)(0,t)},f_=function(e,t,n,r){var i=arguments.length>4&&arguments[4]!==void 0?arguments[4]:0;if(!Number.isFinite((t-e)/(n-1)))return{step:new J(0),tickMin:new J(0),tickMax:new J(0)};var a=u_(new J(t).sub(e).div(n-1),r,i),o;e<=0&&t>=0?o=new J(0):(o=new J(e).add(t).div(2),o=o.sub(new J(o).mod(a)));var s=Math.ceil(o.sub(e).div(a).toNumber()),c=Math.ceil(new J(t).sub(o).div(a).toNumber()),l=s+c+1;return l>n?f_(e,t,n,r,i+1):(l<n&&(c=t>0?c+(n-l):c,s=t>0?s:s+(n-l)),{step:a,tickMin:o.sub(new J(s).mul(a)),tickMax:o.add(new J(c).mul(a))})};function p_(e){var[t,n]=e,r=arguments.length>1&&arguments[1]!==void 0?arguments[1]:6,i=arguments.length>2&&arguments[2]!==void 0?arguments[2]:!0,a=Math.max(r,2),[o,s]=l_([t,n]);if(o===-1/0||s===1/0){var c=s===1/0?[o,...n_(0,r-1).map(()=>1/0)]:[...n_(0,r-1).map(()=>-1/0),s];return t>n?a_(c):c}if(o===s)return d_(o,r,i);var{step:l,tickMin:u,tickMax:d}=f_(o,s,a,i,0),f=c_(u,d.add(new J(.1).mul(l)),l);return t>n?a_(f):f}function m_(e,t){var[n,r]=e,i=arguments.length>2&&arguments[2]!==void 0?arguments[2]:!0,[a,o]=l_([n,r]);if(a===-1/0||o===1/0)return[n,r];if(a===o)return[a];var s=Math.max(t,2),c=u_(new J(o).sub(a).div(s-1),i,0),l=[...c_(new J(a),new J(o),c),o];return i===!1&&(l=l.map(e=>Math.round(e))),n>r?a_(l):l}var h_=o_(p_),g_=o_(m_),__=e=>e.rootProps.maxBarSize,v_=e=>e.rootProps.barGap,y_=e=>e.rootProps.barCategoryGap,b_=e=>e.rootProps.barSize,x_=e=>e.rootProps.stackOffset,S_=e=>e.options.chartName,C_=e=>e.rootProps.syncId,w_=e=>e.rootProps.syncMethod,T_=e=>e.options.eventEmitter,E_={allowDuplicatedCategory:!0,angleAxisId:0,axisLine:!0,cx:0,cy:0,orientation:`outer`,reversed:!1,scale:`auto`,tick:!0,tickLine:!0,tickSize:8,type:`category`},D_={allowDataOverflow:!1,allowDuplicatedCategory:!0,angle:0,axisLine:!0,cx:0,cy:0,orientation:`right`,radiusAxisId:0,scale:`auto`,stroke:`#ccc`,tick:!0,tickCount:5,type:`number`},O_=(e,t)=>{if(!(!e||!t))return e!=null&&e.reversed?[t[1],t[0]]:t},k_={allowDataOverflow:!1,allowDecimals:!1,allowDuplicatedCategory:!1,dataKey:void 0,domain:void 0,id:E_.angleAxisId,includeHidden:!1,name:void 0,reversed:E_.reversed,scale:E_.scale,tick:E_.tick,tickCount:void 0,ticks:void 0,type:E_.type,unit:void 0},A_={allowDataOverflow:D_.allowDataOverflow,allowDecimals:!1,allowDuplicatedCategory:D_.allowDuplicatedCategory,dataKey:void 0,domain:void 0,id:D_.radiusAxisId,includeHidden:!1,name:void 0,reversed:!1,scale:D_.scale,tick:D_.tick,tickCount:D_.tickCount,ticks:void 0,type:D_.type,unit:void 0},j_={allowDataOverflow:!1,allowDecimals:!1,allowDuplicatedCategory:E_.allowDuplicatedCategory,dataKey:void 0,domain:void 0,id:E_.angleAxisId,includeHidden:!1,name:void 0,reversed:!1,scale:E_.scale,tick:E_.tick,tickCount:void 0,ticks:void 0,type:`number`,unit:void 0},M_={allowDataOverflow:D_.allowDataOverflow,allowDecimals:!1,allowDuplicatedCategory:D_.allowDuplicatedCategory,dataKey:void 0,domain:void 0,id:D_.radiusAxisId,includeHidden:!1,name:void 0,reversed:!1,scale:D_.scale,tick:D_.tick,tickCount:D_.tickCount,ticks:void 0,type:`category`,unit:void 0},N_=(e,t)=>e.polarAxis.angleAxis[t]==null?e.layout.layoutType===`radial`?j_:k_:e.polarAxis.angleAxis[t],P_=(e,t)=>e.polarAxis.radiusAxis[t]==null?e.layout.layoutType===`radial`?M_:A_:e.polarAxis.radiusAxis[t],F_=e=>e.polarOptions,I_=L([Ss,Cs,Vs],Po),L_=L([F_,I_],(e,t)=>{if(e!=null)return w(e.innerRadius,t,0)}),R_=L([F_,I_],(e,t)=>{if(e!=null)return w(e.outerRadius,t,t*.8)}),z_=L([F_],e=>{if(e==null)return[0,0];var{startAngle:t,endAngle:n}=e;return[t,n]}),B_=L([N_,z_],O_),V_=L([I_,L_,R_],(e,t,n)=>{if(!(e==null||t==null||n==null))return[t,n]}),H_=L([P_,V_],O_),U_=L([V,F_,L_,R_,Ss,Cs],(e,t,n,r,i,a)=>{if(!(e!==`centric`&&e!==`radial`||t==null||n==null||r==null)){var{cx:o,cy:s,startAngle:c,endAngle:l}=t;return{cx:w(o,i,i/2),cy:w(s,a,a/2),innerRadius:n,outerRadius:r,startAngle:c,endAngle:l,clockWise:!1}}}),Y=(e,t)=>t,W_=(e,t,n)=>n;function G_(e){return e?.id}var K_=e=>{var t=V(e);return t===`horizontal`?`xAxis`:t===`vertical`?`yAxis`:t===`centric`?`angleAxis`:`radiusAxis`},q_=e=>e.tooltip.settings.axisId,J_=e=>{var t=K_(e),n=q_(e);return mv(e,t,n)},Y_=L([J_],e=>e?.dataKey);function X_(e,t,n){var{chartData:r=[]}=t,{allowDuplicatedCategory:i,dataKey:a}=n,o=new Map;return e.forEach(e=>{var t=e.data??r;if(!(t==null||t.length===0)){var n=G_(e);t.forEach((t,r)=>{var s=a==null||i?r:String(z(t,a,null)),c=z(t,e.dataKey,0),l=o.has(s)?o.get(s):{};Object.assign(l,{[n]:c}),o.set(s,l)})}}),Array.from(o.values())}function Z_(e){return e.stackId!=null&&e.dataKey!=null}var Q_=e(Mu());function $_(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function ev(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?$_(Object(n),!0).forEach(function(t){tv(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):$_(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function tv(e,t,n){return(t=nv(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function nv(e){var t=rv(e,`string`);return typeof t==`symbol`?t:t+``}function rv(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}var iv=[0,`auto`],av={allowDataOverflow:!1,allowDecimals:!0,allowDuplicatedCategory:!0,angle:0,dataKey:void 0,domain:void 0,height:30,hide:!0,id:0,includeHidden:!1,interval:`preserveEnd`,minTickGap:5,mirror:!1,name:void 0,orientation:`bottom`,padding:{left:0,right:0},reversed:!1,scale:`auto`,tick:!0,tickCount:5,tickFormatter:void 0,ticks:void 0,type:`category`,unit:void 0},ov=(e,t)=>e.cartesianAxis.xAxis[t],sv=(e,t)=>ov(e,t)??av,cv={allowDataOverflow:!1,allowDecimals:!0,allowDuplicatedCategory:!0,angle:0,dataKey:void 0,domain:iv,hide:!0,id:0,includeHidden:!1,interval:`preserveEnd`,minTickGap:5,mirror:!1,name:void 0,orientation:`left`,padding:{top:0,bottom:0},reversed:!1,scale:`auto`,tick:!0,tickCount:5,tickFormatter:void 0,ticks:void 0,type:`number`,unit:void 0,width:60},lv=(e,t)=>e.cartesianAxis.yAxis[t],uv=(e,t)=>lv(e,t)??cv,dv={domain:[0,`auto`],includeHidden:!1,reversed:!1,allowDataOverflow:!1,allowDuplicatedCategory:!1,dataKey:void 0,id:0,name:``,range:[64,64],scale:`auto`,type:`number`,unit:``},fv=(e,t)=>e.cartesianAxis.zAxis[t]??dv,X=(e,t,n)=>{switch(t){case`xAxis`:return sv(e,n);case`yAxis`:return uv(e,n);case`zAxis`:return fv(e,n);case`angleAxis`:return N_(e,n);case`radiusAxis`:return P_(e,n);default:throw Error(`Unexpected axis type: ${t}`)}},pv=(e,t,n)=>{switch(t){case`xAxis`:return sv(e,n);case`yAxis`:return uv(e,n);default:throw Error(`Unexpected axis type: ${t}`)}},mv=(e,t,n)=>{switch(t){case`xAxis`:return sv(e,n);case`yAxis`:return uv(e,n);case`angleAxis`:return N_(e,n);case`radiusAxis`:return P_(e,n);default:throw Error(`Unexpected axis type: ${t}`)}},hv=e=>e.graphicalItems.cartesianItems.some(e=>e.type===`bar`)||e.graphicalItems.polarItems.some(e=>e.type===`radialBar`);function gv(e,t){return n=>{switch(e){case`xAxis`:return`xAxisId`in n&&n.xAxisId===t;case`yAxis`:return`yAxisId`in n&&n.yAxisId===t;case`zAxis`:return`zAxisId`in n&&n.zAxisId===t;case`angleAxis`:return`angleAxisId`in n&&n.angleAxisId===t;case`radiusAxis`:return`radiusAxisId`in n&&n.radiusAxisId===t;default:return!1}}}var _v=e=>e.graphicalItems.cartesianItems,vv=L([Y,W_],gv),yv=(e,t,n)=>e.filter(n).filter(e=>t?.includeHidden===!0?!0:!e.hide),bv=L([_v,X,vv],yv),xv=L([bv],e=>e.filter(e=>e.type===`area`||e.type===`bar`).filter(Z_)),Sv=e=>e.filter(e=>!(`stackId`in e)||e.stackId===void 0),Cv=L([bv],Sv),wv=e=>e.map(e=>e.data).filter(Boolean).flat(1),Tv=L([bv],wv),Ev=(e,t)=>{var{chartData:n=[],dataStartIndex:r,dataEndIndex:i}=t;return e.length>0?e:n.slice(r,i+1)},Dv=L([Tv,_g],Ev),Ov=(e,t,n)=>t?.dataKey==null?n.length>0?n.map(e=>e.dataKey).flatMap(t=>e.map(e=>({value:z(e,t)}))):e.map(e=>({value:e})):e.map(e=>({value:z(e,t.dataKey)})),kv=L([Dv,X,bv],Ov);function Av(e,t){switch(e){case`xAxis`:return t.direction===`x`;case`yAxis`:return t.direction===`y`;default:return!1}}function jv(e){return e.filter(e=>x(e)||e instanceof Date).map(Number).filter(e=>v(e)===!1)}function Mv(e,t,n){return!n||typeof t!=`number`||v(t)||!n.length?[]:jv(n.flatMap(n=>{var r=z(e,n.dataKey),i,a;if(Array.isArray(r)?[i,a]=r:i=a=r,!(!Yc(i)||!Yc(a)))return[t-i,t+a]}))}var Nv=L([xv,_g,J_],X_),Pv=(e,t,n)=>{var r=t.reduce((e,t)=>t.stackId==null?e:(e[t.stackId]??(e[t.stackId]=[]),e[t.stackId].push(t),e),{});return Object.fromEntries(Object.entries(r).map(t=>{var[r,i]=t,a=i.map(G_);return[r,{stackedData:os(e,a,n),graphicalItems:i}]}))},Fv=L([Nv,xv,x_],Pv),Iv=(e,t,n)=>{var{dataStartIndex:r,dataEndIndex:i}=t;if(n!==`zAxis`){var a=ps(e,r,i);if(!(a!=null&&a[0]===0&&a[1]===0))return a}},Lv=L([Fv,hg,Y],Iv),Rv=(e,t,n,r,i)=>n.length>0?e.flatMap(e=>n.flatMap(n=>{var a=r[n.id]?.filter(e=>Av(i,e)),o=z(e,t.dataKey??n.dataKey);return{value:o,errorDomain:Mv(e,o,a)}})).filter(Boolean):t?.dataKey==null?e.map(e=>({value:e,errorDomain:[]})):e.map(e=>({value:z(e,t.dataKey),errorDomain:[]})),zv=e=>e.errorBars,Bv=(e,t,n)=>e.flatMap(e=>t[e.id]).filter(Boolean).filter(e=>Av(n,e));L([Cv,zv,Y],Bv);var Vv=L([Dv,X,Cv,zv,Y],Rv);function Hv(e){var{value:t}=e;if(x(t)||t instanceof Date)return t}var Uv=e=>{var t=e.flatMap(e=>[e.value,e.errorDomain]).flat(1),n=jv(t);if(n.length!==0)return[Math.min(...n),Math.max(...n)]},Wv=(e,t,n)=>{var r=e.map(Hv).filter(e=>e!=null);return n&&(t.dataKey==null||t.allowDuplicatedCategory&&T(r))?(0,Q_.default)(0,e.length):t.allowDuplicatedCategory?r:Array.from(new Set(r))},Gv=e=>{if(e==null||!(`domain`in e))return iv;if(e.domain!=null)return e.domain;if(e.ticks!=null){if(e.type===`number`){var t=jv(e.ticks);return[Math.min(...t),Math.max(...t)]}if(e.type===`category`)return e.ticks.map(String)}return e?.domain??iv},Kv=function(){var e=[...arguments],t=e.filter(Boolean);if(t.length!==0){var n=t.flat(),r=Math.min(...n),i=Math.max(...n);return[r,i]}},qv=e=>e.referenceElements.dots,Jv=(e,t,n)=>e.filter(e=>e.ifOverflow===`extendDomain`).filter(e=>t===`xAxis`?e.xAxisId===n:e.yAxisId===n),Yv=L([qv,Y,W_],Jv),Xv=e=>e.referenceElements.areas,Zv=L([Xv,Y,W_],Jv),Qv=e=>e.referenceElements.lines,$v=L([Qv,Y,W_],Jv),ey=(e,t)=>{var n=jv(e.map(e=>t===`xAxis`?e.x:e.y));if(n.length!==0)return[Math.min(...n),Math.max(...n)]},ty=L(Yv,Y,ey),ny=(e,t)=>{var n=jv(e.flatMap(e=>[t===`xAxis`?e.x1:e.y1,t===`xAxis`?e.x2:e.y2]));if(n.length!==0)return[Math.min(...n),Math.max(...n)]},ry=L([Zv,Y],ny),iy=(e,t)=>{var n=jv(e.map(e=>t===`xAxis`?e.x:e.y));if(n.length!==0)return[Math.min(...n),Math.max(...n)]},ay=L($v,Y,iy),oy=L(ty,ay,ry,(e,t,n)=>Kv(e,n,t)),sy=L([X],Gv),cy=(e,t,n,r,i,a,o)=>{var s=bg(t,e.allowDataOverflow);if(s!=null)return s;var c=a===`vertical`&&o===`xAxis`||a===`horizontal`&&o===`yAxis`?Kv(n,i,Uv(r)):Kv(i,Uv(r));return xg(t,c,e.allowDataOverflow)},ly=L([X,sy,Lv,Vv,oy,V,Y],cy),uy=[0,1],dy=(e,t,n,r,i,a,o)=>{if(!((e==null||n==null||n.length===0)&&o===void 0)){var{dataKey:s,type:c}=e,l=Zo(t,a);return l&&s==null?(0,Q_.default)(0,n.length):c===`category`?Wv(r,e,l):i===`expand`?uy:o}},fy=L([X,V,Dv,kv,x_,Y,ly],dy),py=(e,t,n,r,i)=>{if(e!=null){var{scale:a,type:o}=e;if(a===`auto`)return t===`radial`&&i===`radiusAxis`?`band`:t===`radial`&&i===`angleAxis`?`linear`:o===`category`&&r&&(r.indexOf(`LineChart`)>=0||r.indexOf(`AreaChart`)>=0||r.indexOf(`ComposedChart`)>=0&&!n)?`point`:o===`category`?`band`:`linear`;if(typeof a==`string`){var s=`scale${te(a)}`;return s in mg?s:`point`}}},my=L([X,V,hv,S_,Y],py);function hy(e){if(e!=null){if(e in mg)return mg[e]();var t=`scale${te(e)}`;if(t in mg)return mg[t]()}}function gy(e,t,n,r){if(!(n==null||r==null)){if(typeof e.scale==`function`)return e.scale.copy().domain(n).range(r);var i=hy(t);if(i!=null){var a=i.domain(n).range(r);return ts(a),a}}}var _y=(e,t,n)=>{var r=Gv(t);if(!(n!==`auto`&&n!==`linear`)){if(t!=null&&t.tickCount&&Array.isArray(r)&&(r[0]===`auto`||r[1]===`auto`)&&vg(e))return h_(e,t.tickCount,t.allowDecimals);if(t!=null&&t.tickCount&&t.type===`number`&&vg(e))return g_(e,t.tickCount,t.allowDecimals)}},vy=L([fy,mv,my],_y),yy=(e,t,n,r)=>{if(r!==`angleAxis`&&e?.type===`number`&&vg(t)&&Array.isArray(n)&&n.length>0){var i=t[0],a=n[0],o=t[1],s=n[n.length-1];return[Math.min(i,a),Math.max(o,s)]}return t},by=L([X,fy,vy,Y],yy),xy=L(kv,X,(e,t)=>{if(!(!t||t.type!==`number`)){var n=1/0,r=Array.from(jv(e.map(e=>e.value))).sort((e,t)=>e-t);if(r.length<2)return 1/0;var i=r[r.length-1]-r[0];if(i===0)return 1/0;for(var a=0;a<r.length-1;a++){var o=r[a+1]-r[a];n=Math.min(n,o)}return n/i}}),Sy=L(xy,V,y_,Vs,(e,t,n,r)=>r,(e,t,n,r,i)=>{if(!Yc(e))return 0;var a=t===`vertical`?r.height:r.width;if(i===`gap`)return e*a/2;if(i===`no-gap`){var o=w(n,e*a),s=e*a/2;return s-o-(s-o)/a*o}return 0}),Cy=(e,t)=>{var n=sv(e,t);return n==null||typeof n.padding!=`string`?0:Sy(e,`xAxis`,t,n.padding)},wy=(e,t)=>{var n=uv(e,t);return n==null||typeof n.padding!=`string`?0:Sy(e,`yAxis`,t,n.padding)},Ty=L(sv,Cy,(e,t)=>{if(e==null)return{left:0,right:0};var{padding:n}=e;return typeof n==`string`?{left:t,right:t}:{left:(n.left??0)+t,right:(n.right??0)+t}}),Ey=L(uv,wy,(e,t)=>{if(e==null)return{top:0,bottom:0};var{padding:n}=e;return typeof n==`string`?{top:t,bottom:t}:{top:(n.top??0)+t,bottom:(n.bottom??0)+t}}),Dy=L([Vs,Ty,qs,Ks,(e,t,n)=>n],(e,t,n,r,i)=>{var{padding:a}=r;return i?[a.left,n.width-a.right]:[e.left+t.left,e.left+e.width-t.right]}),Oy=L([Vs,V,Ey,qs,Ks,(e,t,n)=>n],(e,t,n,r,i,a)=>{var{padding:o}=i;return a?[r.height-o.bottom,o.top]:t===`horizontal`?[e.top+e.height-n.bottom,e.top+n.top]:[e.top+n.top,e.top+e.height-n.bottom]}),ky=(e,t,n,r)=>{switch(t){case`xAxis`:return Dy(e,n,r);case`yAxis`:return Oy(e,n,r);case`zAxis`:return fv(e,n)?.range;case`angleAxis`:return z_(e);case`radiusAxis`:return V_(e,n);default:return}},Ay=L([X,ky],O_),jy=L([X,my,by,Ay],gy);L([bv,zv,Y],Bv);function My(e,t){return e.id<t.id?-1:e.id>t.id?1:0}var Ny=(e,t)=>t,Py=(e,t,n)=>n,Fy=L(Es,Ny,Py,(e,t,n)=>e.filter(e=>e.orientation===t).filter(e=>e.mirror===n).sort(My)),Iy=L(Ds,Ny,Py,(e,t,n)=>e.filter(e=>e.orientation===t).filter(e=>e.mirror===n).sort(My)),Ly=(e,t)=>({width:e.width,height:t.height}),Ry=(e,t)=>({width:typeof t.width==`number`?t.width:60,height:e.height}),zy=L(Vs,sv,Ly),By=(e,t,n)=>{switch(t){case`top`:return e.top;case`bottom`:return n-e.bottom;default:return 0}},Vy=(e,t,n)=>{switch(t){case`left`:return e.left;case`right`:return n-e.right;default:return 0}},Hy=L(Cs,Vs,Fy,Ny,Py,(e,t,n,r,i)=>{var a={},o;return n.forEach(n=>{var s=Ly(t,n);o??=By(t,r,e);var c=r===`top`&&!i||r===`bottom`&&i;a[n.id]=o-Number(c)*s.height,o+=(c?-1:1)*s.height}),a}),Uy=L(Ss,Vs,Iy,Ny,Py,(e,t,n,r,i)=>{var a={},o;return n.forEach(n=>{var s=Ry(t,n);o??=Vy(t,r,e);var c=r===`left`&&!i||r===`right`&&i;a[n.id]=o-Number(c)*s.width,o+=(c?-1:1)*s.width}),a}),Wy=L([Vs,sv,(e,t)=>{var n=sv(e,t);if(n!=null)return Hy(e,n.orientation,n.mirror)},(e,t)=>t],(e,t,n,r)=>{if(t!=null){var i=n?.[r];return i==null?{x:e.left,y:0}:{x:e.left,y:i}}}),Gy=L([Vs,uv,(e,t)=>{var n=uv(e,t);if(n!=null)return Uy(e,n.orientation,n.mirror)},(e,t)=>t],(e,t,n,r)=>{if(t!=null){var i=n?.[r];return i==null?{x:0,y:e.top}:{x:i,y:e.top}}}),Ky=L(Vs,uv,(e,t)=>({width:typeof t.width==`number`?t.width:60,height:e.height})),qy=(e,t,n)=>{switch(t){case`xAxis`:return zy(e,n).width;case`yAxis`:return Ky(e,n).height;default:return}},Jy=(e,t,n,r)=>{if(n!=null){var{allowDuplicatedCategory:i,type:a,dataKey:o}=n,s=Zo(e,r),c=t.map(e=>e.value);if(o&&s&&a===`category`&&i&&T(c))return c}},Yy=L([V,kv,X,Y],Jy),Xy=(e,t,n,r)=>{if(!(n==null||n.dataKey==null)){var{type:i,scale:a}=n;if(Zo(e,r)&&(i===`number`||a!==`auto`))return t.map(e=>e.value)}},Zy=L([V,kv,mv,Y],Xy),Qy=L([V,pv,my,jy,Yy,Zy,ky,vy,Y],(e,t,n,r,i,a,o,s,c)=>{if(t==null)return null;var l=Zo(e,c);return{angle:t.angle,interval:t.interval,minTickGap:t.minTickGap,orientation:t.orientation,tick:t.tick,tickCount:t.tickCount,tickFormatter:t.tickFormatter,ticks:t.ticks,type:t.type,unit:t.unit,axisType:c,categoricalDomain:a,duplicateDomain:i,isCategorical:l,niceTicks:s,range:o,realScaleType:n,scale:r}}),$y=(e,t,n,r,i,a,o,s,c)=>{if(!(t==null||r==null)){var l=Zo(e,c),{type:u,ticks:d,tickCount:f}=t,p=n===`scaleBand`&&typeof r.bandwidth==`function`?r.bandwidth()/2:2,m=u===`category`&&r.bandwidth?r.bandwidth()/p:0;m=c===`angleAxis`&&a!=null&&a.length>=2?_(a[0]-a[1])*2*m:m;var h=d||i;return h?h.map((e,t)=>{var n=o?o.indexOf(e):e;return{index:t,coordinate:r(n)+m,value:e,offset:m}}).filter(e=>!v(e.coordinate)):l&&s?s.map((e,t)=>({coordinate:r(e)+m,value:e,index:t,offset:m})):r.ticks?r.ticks(f).map(e=>({coordinate:r(e)+m,value:e,offset:m})):r.domain().map((e,t)=>({coordinate:r(e)+m,value:o?o[e]:e,index:t,offset:m}))}},eb=L([V,mv,my,jy,vy,ky,Yy,Zy,Y],$y),tb=(e,t,n,r,i,a,o)=>{if(!(t==null||n==null||r==null||r[0]===r[1])){var s=Zo(e,o),{tickCount:c}=t,l=0;return l=o===`angleAxis`&&r?.length>=2?_(r[0]-r[1])*2*l:l,s&&a?a.map((e,t)=>({coordinate:n(e)+l,value:e,index:t,offset:l})):n.ticks?n.ticks(c).map(e=>({coordinate:n(e)+l,value:e,offset:l})):n.domain().map((e,t)=>({coordinate:n(e)+l,value:i?i[e]:e,index:t,offset:l}))}},nb=L([V,mv,jy,ky,Yy,Zy,Y],tb),rb=L(X,jy,(e,t)=>{if(!(e==null||t==null))return ev(ev({},e),{},{scale:t})}),ib=L([X,my,fy,Ay],gy),ab=L((e,t,n)=>fv(e,n),ib,(e,t)=>{if(!(e==null||t==null))return ev(ev({},e),{},{scale:t})}),ob=L([V,Es,Ds],(e,t,n)=>{switch(e){case`horizontal`:return t.some(e=>e.reversed)?`right-to-left`:`left-to-right`;case`vertical`:return n.some(e=>e.reversed)?`bottom-to-top`:`top-to-bottom`;case`centric`:case`radial`:return`left-to-right`;default:return}}),sb=e=>e.options.defaultTooltipEventType,cb=e=>e.options.validateTooltipEventTypes;function lb(e,t,n){if(e==null)return t;var r=e?`axis`:`item`;return n==null?t:n.includes(r)?r:t}function ub(e,t){var n=sb(e),r=cb(e);return lb(t,n,r)}function db(e){return I(t=>ub(t,e))}var fb=(e,t)=>{var n,r=Number(t);if(!(v(r)||t==null))return r>=0?e==null||(n=e[r])==null?void 0:n.value:void 0},pb=e=>e.tooltip.settings,mb={active:!1,index:null,dataKey:void 0,coordinate:void 0},hb=Aa({name:`tooltip`,initialState:{itemInteraction:{click:mb,hover:mb},axisInteraction:{click:mb,hover:mb},keyboardInteraction:mb,syncInteraction:{active:!1,index:null,dataKey:void 0,label:void 0,coordinate:void 0},tooltipItemPayloads:[],settings:{shared:void 0,trigger:`hover`,axisId:0,active:!1,defaultIndex:void 0}},reducers:{addTooltipEntrySettings(e,t){e.tooltipItemPayloads.push(aa(t.payload))},removeTooltipEntrySettings(e,t){var n=ta(e).tooltipItemPayloads.indexOf(aa(t.payload));n>-1&&e.tooltipItemPayloads.splice(n,1)},setTooltipSettingsState(e,t){e.settings=t.payload},setActiveMouseOverItemIndex(e,t){e.syncInteraction.active=!1,e.keyboardInteraction.active=!1,e.itemInteraction.hover.active=!0,e.itemInteraction.hover.index=t.payload.activeIndex,e.itemInteraction.hover.dataKey=t.payload.activeDataKey,e.itemInteraction.hover.coordinate=t.payload.activeCoordinate},mouseLeaveChart(e){e.itemInteraction.hover.active=!1,e.axisInteraction.hover.active=!1},mouseLeaveItem(e){e.itemInteraction.hover.active=!1},setActiveClickItemIndex(e,t){e.syncInteraction.active=!1,e.itemInteraction.click.active=!0,e.keyboardInteraction.active=!1,e.itemInteraction.click.index=t.payload.activeIndex,e.itemInteraction.click.dataKey=t.payload.activeDataKey,e.itemInteraction.click.coordinate=t.payload.activeCoordinate},setMouseOverAxisIndex(e,t){e.syncInteraction.active=!1,e.axisInteraction.hover.active=!0,e.keyboardInteraction.active=!1,e.axisInteraction.hover.index=t.payload.activeIndex,e.axisInteraction.hover.dataKey=t.payload.activeDataKey,e.axisInteraction.hover.coordinate=t.payload.activeCoordinate},setMouseClickAxisIndex(e,t){e.syncInteraction.active=!1,e.keyboardInteraction.active=!1,e.axisInteraction.click.active=!0,e.axisInteraction.click.index=t.payload.activeIndex,e.axisInteraction.click.dataKey=t.payload.activeDataKey,e.axisInteraction.click.coordinate=t.payload.activeCoordinate},setSyncInteraction(e,t){e.syncInteraction=t.payload},setKeyboardInteraction(e,t){e.keyboardInteraction.active=t.payload.active,e.keyboardInteraction.index=t.payload.activeIndex,e.keyboardInteraction.coordinate=t.payload.activeCoordinate,e.keyboardInteraction.dataKey=t.payload.activeDataKey}}}),{addTooltipEntrySettings:gb,removeTooltipEntrySettings:_b,setTooltipSettingsState:vb,setActiveMouseOverItemIndex:yb,mouseLeaveItem:bb,mouseLeaveChart:xb,setActiveClickItemIndex:Sb,setMouseOverAxisIndex:Cb,setMouseClickAxisIndex:wb,setSyncInteraction:Tb,setKeyboardInteraction:Eb}=hb.actions,Db=hb.reducer;function Ob(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function kb(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?Ob(Object(n),!0).forEach(function(t){Ab(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Ob(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function Ab(e,t,n){return(t=jb(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function jb(e){var t=Mb(e,`string`);return typeof t==`symbol`?t:t+``}function Mb(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function Nb(e,t,n){return t===`axis`?n===`click`?e.axisInteraction.click:e.axisInteraction.hover:n===`click`?e.itemInteraction.click:e.itemInteraction.hover}function Pb(e){return e.index!=null}var Fb=(e,t,n,r)=>{if(t==null)return mb;var i=Nb(e,t,n);if(i==null)return mb;if(i.active)return i;if(e.keyboardInteraction.active)return e.keyboardInteraction;if(e.syncInteraction.active&&e.syncInteraction.index!=null)return e.syncInteraction;var a=e.settings.active===!0;if(Pb(i)){if(a)return kb(kb({},i),{},{active:!0})}else if(r!=null)return{active:!0,coordinate:void 0,dataKey:void 0,index:r};return kb(kb({},mb),{},{coordinate:i.coordinate})},Ib=(e,t)=>{var n=e?.index;if(n==null)return null;var r=Number(n);if(!Yc(r))return n;var i=0,a=1/0;return t.length>0&&(a=t.length-1),String(Math.max(i,Math.min(r,a)))},Lb=(e,t,n,r,i,a,o,s)=>{if(!(a==null||s==null)){var c=o[0],l=c==null?void 0:s(c.positions,a);if(l!=null)return l;var u=i?.[Number(a)];if(u)switch(n){case`horizontal`:return{x:u.coordinate,y:(r.top+t)/2};default:return{x:(r.left+e)/2,y:u.coordinate}}}},Rb=(e,t,n,r)=>{if(t===`axis`)return e.tooltipItemPayloads;if(e.tooltipItemPayloads.length===0)return[];var i=n===`hover`?e.itemInteraction.hover.dataKey:e.itemInteraction.click.dataKey;return i==null&&r!=null?[e.tooltipItemPayloads[0]]:e.tooltipItemPayloads.filter(e=>e.settings?.dataKey===i)},zb=e=>e.options.tooltipPayloadSearcher,Bb=e=>e.tooltip;function Vb(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function Hb(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?Vb(Object(n),!0).forEach(function(t){Ub(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Vb(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function Ub(e,t,n){return(t=Wb(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Wb(e){var t=Gb(e,`string`);return typeof t==`symbol`?t:t+``}function Gb(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function Kb(e,t){return e??t}var qb=(e,t,n,r,i,a,o)=>{if(!(t==null||a==null)){var{chartData:s,computedData:c,dataStartIndex:l,dataEndIndex:u}=n;return e.reduce((e,n)=>{var{dataDefinedOnItem:d,settings:f}=n,p=Kb(d,s),m=Array.isArray(p)?Vo(p,l,u):p,h=f?.dataKey??r,g=f?.nameKey,_=r&&Array.isArray(m)&&!Array.isArray(m[0])&&o===`axis`?O(m,r,i):a(m,t,c,g);return Array.isArray(_)?_.forEach(t=>{var n=Hb(Hb({},f),{},{name:t.name,unit:t.unit,color:void 0,fill:void 0});e.push(_s({tooltipEntrySettings:n,dataKey:t.dataKey,payload:t.payload,value:z(t.payload,t.dataKey),name:t.name}))}):e.push(_s({tooltipEntrySettings:f,dataKey:h,payload:_,value:z(_,h),name:z(_,g)??f?.name})),e},[])}},Jb=L([J_,V,hv,S_,K_],py),Yb=L([e=>e.graphicalItems.cartesianItems,e=>e.graphicalItems.polarItems],(e,t)=>[...e,...t]),Xb=L([K_,q_],gv),Zb=L([Yb,J_,Xb],yv),Qb=L([Zb],e=>e.filter(Z_)),$b=L([Zb],wv),ex=L([$b,hg],Ev),tx=L([Qb,hg,J_],X_),nx=L([ex,J_,Zb],Ov),rx=L([J_],Gv),ix=L([Zb],e=>e.filter(Z_)),ax=L([tx,ix,x_],Pv),ox=L([ax,hg,K_],Iv),sx=L([Zb],Sv),cx=L([ex,J_,sx,zv,K_],Rv),lx=L([qv,K_,q_],Jv),ux=L([lx,K_],ey),dx=L([Xv,K_,q_],Jv),fx=L([dx,K_],ny),px=L([Qv,K_,q_],Jv),mx=L([px,K_],iy),hx=L([ux,mx,fx],Kv),gx=L([J_,rx,ox,cx,hx,V,K_],cy),_x=L([J_,V,ex,nx,x_,K_,gx],dy),vx=L([_x,J_,Jb],_y),yx=L([J_,_x,vx,K_],yy),bx=e=>{var t=K_(e),n=q_(e);return ky(e,t,n,!1)},xx=L([J_,bx],O_),Sx=L([J_,Jb,yx,xx],gy),Cx=L([V,nx,J_,K_],Jy),wx=L([V,nx,J_,K_],Xy),Tx=L([V,J_,Jb,Sx,bx,Cx,wx,K_],(e,t,n,r,i,a,o,s)=>{if(t){var{type:c}=t,l=Zo(e,s);if(r){var u=n===`scaleBand`&&r.bandwidth?r.bandwidth()/2:2,d=c===`category`&&r.bandwidth?r.bandwidth()/u:0;return d=s===`angleAxis`&&i!=null&&i?.length>=2?_(i[0]-i[1])*2*d:d,l&&o?o.map((e,t)=>({coordinate:r(e)+d,value:e,index:t,offset:d})):r.domain().map((e,t)=>({coordinate:r(e)+d,value:a?a[e]:e,index:t,offset:d}))}}}),Ex=L([sb,cb,pb],(e,t,n)=>lb(n.shared,e,t)),Dx=e=>e.tooltip.settings.trigger,Ox=e=>e.tooltip.settings.defaultIndex,kx=L([Bb,Ex,Dx,Ox],Fb),Ax=L([kx,ex],Ib),jx=L([Tx,Ax],fb),Mx=L([kx],e=>{if(e)return e.dataKey}),Nx=L([Bb,Ex,Dx,Ox],Rb),Px=L([Ss,Cs,V,Vs,Tx,Ox,Nx,zb],Lb),Fx=L([kx,Px],(e,t)=>e!=null&&e.coordinate?e.coordinate:t),Ix=L([kx],e=>e.active),Lx=L([Nx,Ax,hg,Y_,jx,zb,Ex],qb),Rx=L([Lx],e=>{if(e!=null){var t=e.map(e=>e.payload).filter(e=>e!=null);return Array.from(new Set(t))}});function zx(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function Bx(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?zx(Object(n),!0).forEach(function(t){Vx(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):zx(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function Vx(e,t,n){return(t=Hx(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Hx(e){var t=Ux(e,`string`);return typeof t==`symbol`?t:t+``}function Ux(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}var Wx=()=>I(J_),Gx=()=>{var e=Wx(),t=I(Tx),n=I(Sx);return gs(Bx(Bx({},e),{},{scale:n}),t)},Kx=e(Gr()),qx=()=>I(S_),Jx=(e,t)=>t,Yx=(e,t,n)=>n,Xx=(e,t,n,r)=>r,Zx=L(Tx,e=>(0,Kx.default)(e,e=>e.coordinate)),Qx=L([Bb,Jx,Yx,Xx],Fb),$x=L([Qx,ex],Ib),eS=(e,t,n)=>{if(t!=null){var r=Bb(e);return t===`axis`?n===`hover`?r.axisInteraction.hover.dataKey:r.axisInteraction.click.dataKey:n===`hover`?r.itemInteraction.hover.dataKey:r.itemInteraction.click.dataKey}},tS=L([Bb,Jx,Yx,Xx],Rb),nS=L([Ss,Cs,V,Vs,Tx,Xx,tS,zb],Lb),rS=L([Qx,nS],(e,t)=>e.coordinate??t),iS=L(Tx,$x,fb),aS=L([tS,$x,hg,Y_,iS,zb,Jx],qb),oS=L([Qx],e=>({isActive:e.active,activeIndex:e.index})),sS=(e,t,n,r,i,a,o,s)=>{if(!(!e||!t||!r||!i||!a)){var c=ys(e.chartX,e.chartY,t,n,s);if(c){var l=xs(c,t),u=Yo(l,o,a,r,i),d=bs(t,a,u,c);return{activeIndex:String(u),activeCoordinate:d}}}};function cS(){return cS=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},cS.apply(null,arguments)}function lS(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function uS(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?lS(Object(n),!0).forEach(function(t){dS(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):lS(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function dS(e,t,n){return(t=fS(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function fS(e){var t=pS(e,`string`);return typeof t==`symbol`?t:t+``}function pS(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function mS(e){var{coordinate:t,payload:n,index:r,offset:i,tooltipAxisBandSize:a,layout:o,cursor:s,tooltipEventType:l,chartName:u}=e,d=t,f=n,p=r;if(!s||!d||u!==`ScatterChart`&&l!==`axis`)return null;var m,h;if(u===`ScatterChart`)m=d,h=bl;else if(u===`BarChart`)m=xl(o,d,i,a),h=yu;else if(o===`radial`){var{cx:g,cy:_,radius:v,startAngle:y,endAngle:b}=bu(d);m={cx:g,cy:_,startAngle:y,endAngle:b,innerRadius:v,outerRadius:v},h=Du}else m={points:Ou(o,d,i)},h=ll;var x=typeof s==`object`&&`className`in s?s.className:void 0,S=uS(uS(uS(uS({stroke:`#ccc`,pointerEvents:`none`},i),m),M(s,!1)),{},{payload:f,payloadIndex:p,className:c(`recharts-tooltip-cursor`,x)});return(0,A.isValidElement)(s)?(0,A.cloneElement)(s,S):(0,A.createElement)(h,S)}function hS(e){var t=Gx(),n=Xs(),r=ec(),i=qx();return A.createElement(mS,cS({},e,{coordinate:e.coordinate,index:e.index,payload:e.payload,offset:n,layout:r,tooltipAxisBandSize:t,chartName:i}))}var gS=(0,A.createContext)(null),_S=()=>(0,A.useContext)(gS),vS=e(n(((exports,t)=>{var n=Object.prototype.hasOwnProperty,r=`~`;function i(){}Object.create&&(i.prototype=Object.create(null),new i().__proto__||(r=!1));function a(e,t,n){this.fn=e,this.context=t,this.once=n||!1}function o(e,t,n,i,o){if(typeof n!=`function`)throw TypeError(`The listener must be a function`);var s=new a(n,i||e,o),c=r?r+t:t;return e._events[c]?e._events[c].fn?e._events[c]=[e._events[c],s]:e._events[c].push(s):(e._events[c]=s,e._eventsCount++),e}function s(e,t){--e._eventsCount===0?e._events=new i:delete e._events[t]}function c(){this._events=new i,this._eventsCount=0}c.prototype.eventNames=function(){var e=[],t,i;if(this._eventsCount===0)return e;for(i in t=this._events)n.call(t,i)&&e.push(r?i.slice(1):i);return Object.getOwnPropertySymbols?e.concat(Object.getOwnPropertySymbols(t)):e},c.prototype.listeners=function(e){var t=r?r+e:e,n=this._events[t];if(!n)return[];if(n.fn)return[n.fn];for(var i=0,a=n.length,o=Array(a);i<a;i++)o[i]=n[i].fn;return o},c.prototype.listenerCount=function(e){var t=r?r+e:e,n=this._events[t];return n?n.fn?1:n.length:0},c.prototype.emit=function(e,t,n,i,a,o){var s=r?r+e:e;if(!this._events[s])return!1;var c=this._events[s],l=arguments.length,u,d;if(c.fn){switch(c.once&&this.removeListener(e,c.fn,void 0,!0),l){case 1:return c.fn.call(c.context),!0;case 2:return c.fn.call(c.context,t),!0;case 3:return c.fn.call(c.context,t,n),!0;case 4:return c.fn.call(c.context,t,n,i),!0;case 5:return c.fn.call(c.context,t,n,i,a),!0;case 6:return c.fn.call(c.context,t,n,i,a,o),!0}for(d=1,u=Array(l-1);d<l;d++)u[d-1]=arguments[d];c.fn.apply(c.context,u)}else{var f=c.length,p;for(d=0;d<f;d++)switch(c[d].once&&this.removeListener(e,c[d].fn,void 0,!0),l){case 1:c[d].fn.call(c[d].context);break;case 2:c[d].fn.call(c[d].context,t);break;case 3:c[d].fn.call(c[d].context,t,n);break;case 4:c[d].fn.call(c[d].context,t,n,i);break;default:if(!u)for(p=1,u=Array(l-1);p<l;p++)u[p-1]=arguments[p];c[d].fn.apply(c[d].context,u)}}return!0},c.prototype.on=function(e,t,n){return o(this,e,t,n,!1)},c.prototype.once=function(e,t,n){return o(this,e,t,n,!0)},c.prototype.removeListener=function(e,t,n,i){var a=r?r+e:e;if(!this._events[a])return this;if(!t)return s(this,a),this;var o=this._events[a];if(o.fn)o.fn===t&&(!i||o.once)&&(!n||o.context===n)&&s(this,a);else{for(var c=0,l=[],u=o.length;c<u;c++)(o[c].fn!==t||i&&!o[c].once||n&&o[c].context!==n)&&l.push(o[c]);l.length?this._events[a]=l.length===1?l[0]:l:s(this,a)}return this},c.prototype.removeAllListeners=function(e){var t;return e?(t=r?r+e:e,this._events[t]&&s(this,t)):(this._events=new i,this._eventsCount=0),this},c.prototype.off=c.prototype.removeListener,c.prototype.addListener=c.prototype.on,c.prefixed=r,c.EventEmitter=c,t!==void 0&&(t.exports=c)}))(),1).default,yS=new vS,bS=`recharts.syncEvent.tooltip`,xS=`recharts.syncEvent.brush`;function SS(e,t){if(t){var n=Number.parseInt(t,10);if(!v(n))return e?.[n]}}var CS=Aa({name:`options`,initialState:{chartName:``,tooltipPayloadSearcher:void 0,eventEmitter:void 0,defaultTooltipEventType:`axis`},reducers:{createEventEmitter:e=>{e.eventEmitter??=Symbol(`rechartsEventEmitter`)}}}),wS=CS.reducer,{createEventEmitter:TS}=CS.actions;function ES(e){return e.tooltip.syncInteraction}var DS=Aa({name:`chartData`,initialState:{chartData:void 0,computedData:void 0,dataStartIndex:0,dataEndIndex:0},reducers:{setChartData(e,t){if(e.chartData=t.payload,t.payload==null){e.dataStartIndex=0,e.dataEndIndex=0;return}t.payload.length>0&&e.dataEndIndex!==t.payload.length-1&&(e.dataEndIndex=t.payload.length-1)},setComputedData(e,t){e.computedData=t.payload},setDataStartEndIndexes(e,t){var{startIndex:n,endIndex:r}=t.payload;n!=null&&(e.dataStartIndex=n),r!=null&&(e.dataEndIndex=r)}}}),{setChartData:OS,setDataStartEndIndexes:kS,setComputedData:AS}=DS.actions,jS=DS.reducer,MS=[`x`,`y`];function NS(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function PS(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?NS(Object(n),!0).forEach(function(t){FS(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):NS(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function FS(e,t,n){return(t=IS(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function IS(e){var t=LS(e,`string`);return typeof t==`symbol`?t:t+``}function LS(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function RS(e,t){if(e==null)return{};var n,r,i=zS(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function zS(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}var BS=()=>{};function VS(){var e=I(C_),t=I(T_),n=F(),r=I(w_),i=I(Tx),a=ec(),o=Js(),s=I(e=>e.rootProps.className);(0,A.useEffect)(()=>{if(e==null)return BS;var s=(s,c,l)=>{if(t!==l&&e===s){if(r===`index`){var u;if(o&&c!=null&&(u=c.payload)!=null&&u.coordinate){var d=c.payload.coordinate,{x:f,y:p}=d,m=RS(d,MS),h=PS(PS(PS({},m),typeof f==`number`&&{x:Math.max(o.x,Math.min(f,o.x+o.width))}),typeof p==`number`&&{y:Math.max(o.y,Math.min(p,o.y+o.height))}),g=PS(PS({},c),{},{payload:PS(PS({},c.payload),{},{coordinate:h})});n(g)}else n(c);return}if(i!=null){var _;if(typeof r==`function`){var v={activeTooltipIndex:c.payload.index==null?void 0:Number(c.payload.index),isTooltipActive:c.payload.active,activeIndex:c.payload.index==null?void 0:Number(c.payload.index),activeLabel:c.payload.label,activeDataKey:c.payload.dataKey,activeCoordinate:c.payload.coordinate},y=r(i,v);_=i[y]}else r===`value`&&(_=i.find(e=>String(e.value)===c.payload.label));var{coordinate:b}=c.payload;if(_==null||c.payload.active===!1||b==null||o==null){n(Tb({active:!1,coordinate:void 0,dataKey:void 0,index:null,label:void 0}));return}var{x,y:S}=b,C=Math.min(x,o.x+o.width),w=Math.min(S,o.y+o.height),T={x:a===`horizontal`?_.coordinate:C,y:a===`horizontal`?w:_.coordinate},E=Tb({active:c.payload.active,coordinate:T,dataKey:c.payload.dataKey,index:String(_.index),label:c.payload.label});n(E)}}};return yS.on(bS,s),()=>{yS.off(bS,s)}},[s,n,t,e,r,i,a,o])}function HS(){var e=I(C_),t=I(T_),n=F();(0,A.useEffect)(()=>{if(e==null)return BS;var r=(r,i,a)=>{t!==a&&e===r&&n(kS(i))};return yS.on(xS,r),()=>{yS.off(xS,r)}},[n,t,e])}function US(){var e=F();(0,A.useEffect)(()=>{e(TS())},[e]),VS(),HS()}function WS(e,t,n,r,i,a){var o=I(n=>eS(n,e,t)),s=I(T_),c=I(C_),l=I(w_),u=I(ES),d=u?.active;(0,A.useEffect)(()=>{if(!d&&c!=null&&s!=null){var e=Tb({active:a,coordinate:n,dataKey:o,index:i,label:typeof r==`number`?String(r):r});yS.emit(bS,c,e,s)}},[d,n,o,i,r,s,c,l,a])}function GS(){var e=I(C_),t=I(T_),n=I(e=>e.chartData.dataStartIndex),r=I(e=>e.chartData.dataEndIndex);(0,A.useEffect)(()=>{if(!(e==null||n==null||r==null||t==null)){var i={startIndex:n,endIndex:r};yS.emit(xS,e,i,t)}},[r,n,t,e])}var KS=e(i());function qS(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function JS(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?qS(Object(n),!0).forEach(function(t){YS(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):qS(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function YS(e,t,n){return(t=XS(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function XS(e){var t=ZS(e,`string`);return typeof t==`symbol`?t:t+``}function ZS(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function QS(e){return e.dataKey}function $S(e,t){return A.isValidElement(e)?A.cloneElement(e,t):typeof e==`function`?A.createElement(e,t):A.createElement(Pc,t)}var eC=[],tC={allowEscapeViewBox:{x:!1,y:!1},animationDuration:400,animationEasing:`ease`,axisId:0,contentStyle:{},cursor:!0,filterNull:!0,isAnimationActive:!qc.isSsr,itemSorter:`name`,itemStyle:{},labelStyle:{},offset:10,reverseDirection:{x:!1,y:!1},separator:` : `,trigger:`hover`,useTranslate3d:!1,wrapperStyle:{}};function nC(e){var t=H(e,tC),{active:n,allowEscapeViewBox:r,animationDuration:i,animationEasing:a,content:o,filterNull:s,isAnimationActive:c,offset:l,payloadUniqBy:u,position:d,reverseDirection:f,useTranslate3d:p,wrapperStyle:m,cursor:h,shared:g,trigger:_,defaultIndex:v,portal:y,axisId:b}=t,x=F(),S=typeof v==`number`?String(v):v;(0,A.useEffect)(()=>{x(vb({shared:g,trigger:_,axisId:b,active:n,defaultIndex:S}))},[x,g,_,b,n,S]);var C=Js(),w=Jc(),T=db(g),{activeIndex:E,isActive:D}=I(e=>oS(e,T,_,S)),O=I(e=>aS(e,T,_,S)),ee=I(e=>iS(e,T,_,S)),k=I(e=>rS(e,T,_,S)),te=O,ne=_S(),re=n??D,[ie,ae]=Qr([te,re]),oe=T===`axis`?ee:void 0;WS(T,_,k,oe,E,re);var se=y??ne;if(se==null)return null;var ce=te??eC;re||(ce=eC),s&&ce.length&&(ce=$n(te.filter(e=>e.value!=null&&(e.hide!==!0||t.includeHidden)),u,QS));var le=ce.length>0,ue=A.createElement(Kc,{allowEscapeViewBox:r,animationDuration:i,animationEasing:a,isAnimationActive:c,active:re,coordinate:k,hasPayload:le,offset:l,position:d,reverseDirection:f,useTranslate3d:p,viewBox:C,wrapperStyle:m,lastBoundingBox:ie,innerRef:ae,hasPortalFromProps:!!y},$S(o,JS(JS({},t),{},{payload:ce,label:oe,active:re,coordinate:k,accessibilityLayer:w})));return A.createElement(A.Fragment,null,(0,KS.createPortal)(ue,se),re&&A.createElement(hS,{cursor:h,tooltipEventType:T,coordinate:k,payload:te,index:E}))}var rC=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});function t(e,t,{signal:n,edges:r}={}){let i,a=null,o=r!=null&&r.includes(`leading`),s=r==null||r.includes(`trailing`),c=()=>{a!==null&&(e.apply(i,a),i=void 0,a=null)},l=()=>{s&&c(),p()},u=null,d=()=>{u!=null&&clearTimeout(u),u=setTimeout(()=>{u=null,l()},t)},f=()=>{u!==null&&(clearTimeout(u),u=null)},p=()=>{f(),i=void 0,a=null},m=()=>{c()},h=function(...e){if(n?.aborted)return;i=this,a=e;let t=u==null;d(),o&&t&&c()};return h.schedule=d,h.cancel=p,h.flush=m,n?.addEventListener(`abort`,p,{once:!0}),h}exports.debounce=t})),iC=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=rC();function n(e,n=0,r={}){typeof r!=`object`&&(r={});let{leading:i=!1,trailing:a=!0,maxWait:o}=r,s=[,,];i&&(s[0]=`leading`),a&&(s[1]=`trailing`);let c,l=null,u=t.debounce(function(...t){c=e.apply(this,t),l=null},n,{edges:s}),d=function(...t){return o!=null&&(l===null&&(l=Date.now()),Date.now()-l>=o)?(c=e.apply(this,t),l=Date.now(),u.cancel(),u.schedule(),c):(u.apply(this,t),c)};return d.cancel=u.cancel,d.flush=()=>(u.flush(),c),d}exports.debounce=n})),aC=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=iC();function n(e,n=0,r={}){let{leading:i=!0,trailing:a=!0}=r;return t.debounce(e,n,{leading:i,maxWait:n,trailing:a})}exports.throttle=n})),oC=n(((exports,t)=>{t.exports=aC().throttle})),sC=!1,cC=function(e,t){var n=[...arguments].slice(2);if(sC&&typeof console<`u`&&console.warn&&(t===void 0&&console.warn(`LogUtils requires an error message argument`),!e))if(t===void 0)console.warn(`Minified exception occurred; use the non-minified dev environment for the full error message and additional helpful warnings.`);else{var r=0;console.warn(t.replace(/%s/g,()=>n[r++]))}},lC=e(oC());function uC(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function dC(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?uC(Object(n),!0).forEach(function(t){fC(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):uC(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function fC(e,t,n){return(t=pC(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function pC(e){var t=mC(e,`string`);return typeof t==`symbol`?t:t+``}function mC(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}var hC=(0,A.forwardRef)((e,t)=>{var{aspect:n,initialDimension:r={width:-1,height:-1},width:i=`100%`,height:a=`100%`,minWidth:o=0,minHeight:s,maxHeight:l,children:u,debounce:d=0,id:f,className:p,onResize:m,style:h={}}=e,g=(0,A.useRef)(null),_=(0,A.useRef)();_.current=m,(0,A.useImperativeHandle)(t,()=>g.current);var[v,b]=(0,A.useState)({containerWidth:r.width,containerHeight:r.height}),x=(0,A.useCallback)((e,t)=>{b(n=>{var r=Math.round(e),i=Math.round(t);return n.containerWidth===r&&n.containerHeight===i?n:{containerWidth:r,containerHeight:i}})},[]);(0,A.useEffect)(()=>{var e=e=>{var t,{width:n,height:r}=e[0].contentRect;x(n,r),(t=_.current)==null||t.call(_,n,r)};d>0&&(e=(0,lC.default)(e,d,{trailing:!0,leading:!1}));var t=new ResizeObserver(e),{width:n,height:r}=g.current.getBoundingClientRect();return x(n,r),t.observe(g.current),()=>{t.disconnect()}},[x,d]);var S=(0,A.useMemo)(()=>{var{containerWidth:e,containerHeight:t}=v;if(e<0||t<0)return null;cC(y(i)||y(a),`The width(%s) and height(%s) are both fixed numbers,
-       maybe you don't need to use a ResponsiveContainer.`,i,a),cC(!n||n>0,`The aspect(%s) must be greater than zero.`,n);var r=y(i)?e:i,c=y(a)?t:a;return n&&n>0&&(r?c=r/n:c&&(r=c*n),l&&c>l&&(c=l)),cC(r>0||c>0,`The width(%s) and height(%s) of chart should be greater than 0,
-       please check the style of container, or the props width(%s) and height(%s),
-       or add a minWidth(%s) or minHeight(%s) or use aspect(%s) to control the
-       height and width.`,r,c,i,a,o,s,n),A.Children.map(u,e=>(0,A.cloneElement)(e,{width:r,height:c,style:dC({width:r,height:c},e.props.style)}))},[n,u,a,l,s,o,v,i]);return A.createElement(`div`,{id:f?`${f}`:void 0,className:c(`recharts-responsive-container`,p),style:dC(dC({},h),{},{width:i,height:a,minWidth:o,minHeight:s,maxHeight:l}),ref:g},A.createElement(`div`,{style:{width:0,height:0,overflow:`visible`}},S))}),gC=e=>null;gC.displayName=`Cell`;function _C(e,t,n){return(t=vC(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function vC(e){var t=yC(e,`string`);return typeof t==`symbol`?t:t+``}function yC(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}var bC=class{constructor(e){_C(this,`cache`,new Map),this.maxSize=e}get(e){var t=this.cache.get(e);return t!==void 0&&(this.cache.delete(e),this.cache.set(e,t)),t}set(e,t){if(this.cache.has(e))this.cache.delete(e);else if(this.cache.size>=this.maxSize){var n=this.cache.keys().next().value;this.cache.delete(n)}this.cache.set(e,t)}clear(){this.cache.clear()}size(){return this.cache.size}};function xC(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function SC(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?xC(Object(n),!0).forEach(function(t){CC(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):xC(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function CC(e,t,n){return(t=wC(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function wC(e){var t=TC(e,`string`);return typeof t==`symbol`?t:t+``}function TC(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}var EC=SC({},{cacheSize:2e3,enableCache:!0}),DC=new bC(EC.cacheSize),OC={position:`absolute`,top:`-20000px`,left:0,padding:0,margin:0,border:`none`,whiteSpace:`pre`},kC=`recharts_measurement_span`;function AC(e,t){var n=t.fontSize||``,r=t.fontFamily||``,i=t.fontWeight||``,a=t.fontStyle||``,o=t.letterSpacing||``,s=t.textTransform||``;return`${e}|${n}|${r}|${i}|${a}|${o}|${s}`}var jC=(e,t)=>{try{var n=document.getElementById(kC);n||(n=document.createElement(`span`),n.setAttribute(`id`,kC),n.setAttribute(`aria-hidden`,`true`),document.body.appendChild(n)),Object.assign(n.style,OC,t),n.textContent=`${e}`;var r=n.getBoundingClientRect();return{width:r.width,height:r.height}}catch{return{width:0,height:0}}},MC=function(e){var t=arguments.length>1&&arguments[1]!==void 0?arguments[1]:{};if(e==null||qc.isSsr)return{width:0,height:0};if(!EC.enableCache)return jC(e,t);var n=AC(e,t),r=DC.get(n);if(r)return r;var i=jC(e,t);return DC.set(n,i),i},NC=/(-?\d+(?:\.\d+)?[a-zA-Z%]*)([*/])(-?\d+(?:\.\d+)?[a-zA-Z%]*)/,PC=/(-?\d+(?:\.\d+)?[a-zA-Z%]*)([+-])(-?\d+(?:\.\d+)?[a-zA-Z%]*)/,FC=/^px|cm|vh|vw|em|rem|%|mm|in|pt|pc|ex|ch|vmin|vmax|Q$/,IC=/(-?\d+(?:\.\d+)?)([a-zA-Z%]+)?/,LC={cm:96/2.54,mm:96/25.4,pt:96/72,pc:96/6,in:96,Q:96/(2.54*40),px:1},RC=Object.keys(LC),zC=`NaN`;function BC(e,t){return e*LC[t]}var VC=class e{static parse(t){var[,n,r]=IC.exec(t)??[];return new e(parseFloat(n),r??``)}constructor(e,t){this.num=e,this.unit=t,this.num=e,this.unit=t,v(e)&&(this.unit=``),t!==``&&!FC.test(t)&&(this.num=NaN,this.unit=``),RC.includes(t)&&(this.num=BC(e,t),this.unit=`px`)}add(t){return this.unit===t.unit?new e(this.num+t.num,this.unit):new e(NaN,``)}subtract(t){return this.unit===t.unit?new e(this.num-t.num,this.unit):new e(NaN,``)}multiply(t){return this.unit!==``&&t.unit!==``&&this.unit!==t.unit?new e(NaN,``):new e(this.num*t.num,this.unit||t.unit)}divide(t){return this.unit!==``&&t.unit!==``&&this.unit!==t.unit?new e(NaN,``):new e(this.num/t.num,this.unit||t.unit)}toString(){return`${this.num}${this.unit}`}isNaN(){return v(this.num)}};function HC(e){if(e.includes(zC))return zC;for(var t=e;t.includes(`*`)||t.includes(`/`);){var[,n,r,i]=NC.exec(t)??[],a=VC.parse(n??``),o=VC.parse(i??``),s=r===`*`?a.multiply(o):a.divide(o);if(s.isNaN())return zC;t=t.replace(NC,s.toString())}for(;t.includes(`+`)||/.-\d+(?:\.\d+)?/.test(t);){var[,c,l,u]=PC.exec(t)??[],d=VC.parse(c??``),f=VC.parse(u??``),p=l===`+`?d.add(f):d.subtract(f);if(p.isNaN())return zC;t=t.replace(PC,p.toString())}return t}var UC=/\(([^()]*)\)/;function WC(e){for(var t=e,n;(n=UC.exec(t))!=null;){var[,r]=n;t=t.replace(UC,HC(r))}return t}function GC(e){var t=e.replace(/\s+/g,``);return t=WC(t),t=HC(t),t}function KC(e){try{return GC(e)}catch{return zC}}function qC(e){var t=KC(e.slice(5,-1));return t===zC?``:t}var JC=[`x`,`y`,`lineHeight`,`capHeight`,`scaleToFit`,`textAnchor`,`verticalAnchor`,`fill`],YC=[`dx`,`dy`,`angle`,`className`,`breakAll`];function XC(){return XC=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},XC.apply(null,arguments)}function ZC(e,t){if(e==null)return{};var n,r,i=QC(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function QC(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}var $C=/[ \f\n\r\t\v\u2028\u2029]+/,ew=e=>{var{children:t,breakAll:n,style:r}=e;try{var i=[];k(t)||(i=n?t.toString().split(``):t.toString().split($C));var a=i.map(e=>({word:e,width:MC(e,r).width})),o=n?0:MC(`\xA0`,r).width;return{wordsWithComputedWidth:a,spaceWidth:o}}catch{return null}},tw=(e,t,n,r,i)=>{var{maxLines:a,children:o,style:s,breakAll:c}=e,l=b(a),u=o,d=function(){return(arguments.length>0&&arguments[0]!==void 0?arguments[0]:[]).reduce((e,t)=>{var{word:a,width:o}=t,s=e[e.length-1];if(s&&(r==null||i||s.width+o+n<Number(r)))s.words.push(a),s.width+=o+n;else{var c={words:[a],width:o};e.push(c)}return e},[])},f=d(t),p=e=>e.reduce((e,t)=>e.width>t.width?e:t);if(!l||i||!(f.length>a||p(f).width>Number(r)))return f;for(var m=`…`,h=e=>{var t=u.slice(0,e),n=ew({breakAll:c,style:s,children:t+m}).wordsWithComputedWidth,i=d(n);return[i.length>a||p(i).width>Number(r),i]},g=0,_=u.length-1,v=0,y;g<=_&&v<=u.length-1;){var x=Math.floor((g+_)/2),S=x-1,[C,w]=h(S),[T]=h(x);if(!C&&!T&&(g=x+1),C&&T&&(_=x-1),!C&&T){y=w;break}v++}return y||f},nw=e=>[{words:k(e)?[]:e.toString().split($C)}],rw=e=>{var{width:t,scaleToFit:n,children:r,style:i,breakAll:a,maxLines:o}=e;if((t||n)&&!qc.isSsr){var s,c,l=ew({breakAll:a,children:r,style:i});if(l){var{wordsWithComputedWidth:u,spaceWidth:d}=l;s=u,c=d}else return nw(r);return tw({breakAll:a,children:r,maxLines:o,style:i},s,c,t,n)}return nw(r)},iw=`#808080`,aw=(0,A.forwardRef)((e,t)=>{var{x:n=0,y:r=0,lineHeight:i=`1em`,capHeight:a=`0.71em`,scaleToFit:o=!1,textAnchor:s=`start`,verticalAnchor:l=`end`,fill:u=iw}=e,d=ZC(e,JC),f=(0,A.useMemo)(()=>rw({breakAll:d.breakAll,children:d.children,maxLines:d.maxLines,scaleToFit:o,style:d.style,width:d.width}),[d.breakAll,d.children,d.maxLines,o,d.style,d.width]),{dx:p,dy:m,angle:h,className:g,breakAll:_}=d,v=ZC(d,YC);if(!x(n)||!x(r)||f.length===0)return null;var y=n+(b(p)?p:0),S=r+(b(m)?m:0),C;switch(l){case`start`:C=qC(`calc(${a})`);break;case`middle`:C=qC(`calc(${(f.length-1)/2} * -${i} + (${a} / 2))`);break;default:C=qC(`calc(${f.length-1} * -${i})`);break}var w=[];if(o){var T=f[0].width,{width:E}=d;w.push(`scale(${b(E)?E/T:1})`)}return h&&w.push(`rotate(${h}, ${y}, ${S})`),w.length&&(v.transform=w.join(` `)),A.createElement(`text`,XC({},M(v,!0),{ref:t,x:y,y:S,className:c(`recharts-text`,g),textAnchor:s,fill:u.includes(`url`)?iw:u}),f.map((e,t)=>{var n=e.words.join(_?``:` `);return A.createElement(`tspan`,{x:y,dy:t===0?C:i,key:`${n}-${t}`},n)}))});aw.displayName=`Text`;var ow=[`labelRef`];function sw(e,t){if(e==null)return{};var n,r,i=cw(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function cw(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}function lw(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function Z(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?lw(Object(n),!0).forEach(function(t){uw(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):lw(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function uw(e,t,n){return(t=dw(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function dw(e){var t=fw(e,`string`);return typeof t==`symbol`?t:t+``}function fw(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function pw(){return pw=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},pw.apply(null,arguments)}var mw=(0,A.createContext)(null),hw=e=>{var{x:t,y:n,width:r,height:i,children:a}=e,o=(0,A.useMemo)(()=>({x:t,y:n,width:r,height:i}),[t,n,r,i]);return A.createElement(mw.Provider,{value:o},a)},gw=()=>{var e=(0,A.useContext)(mw),t=Js();return e||t},_w=(0,A.createContext)(null),vw=e=>{var{cx:t,cy:n,innerRadius:r,outerRadius:i,startAngle:a,endAngle:o,clockWise:s,children:c}=e,l=(0,A.useMemo)(()=>({cx:t,cy:n,innerRadius:r,outerRadius:i,startAngle:a,endAngle:o,clockWise:s}),[t,n,r,i,a,o,s]);return A.createElement(_w.Provider,{value:l},c)},yw=()=>{var e=(0,A.useContext)(_w),t=I(U_);return e||t},bw=e=>{var{value:t,formatter:n}=e,r=k(e.children)?t:e.children;return typeof n==`function`?n(r):r},xw=e=>e!=null&&typeof e==`function`,Sw=(e,t)=>{var n=_(t-e),r=Math.min(Math.abs(t-e),360);return n*r},Cw=(e,t,n,r,i)=>{var{offset:a,className:o}=e,{cx:s,cy:l,innerRadius:u,outerRadius:d,startAngle:f,endAngle:p,clockWise:m}=i,h=(u+d)/2,g=Sw(f,p),_=g>=0?1:-1,v,y;switch(t){case`insideStart`:v=f+_*a,y=m;break;case`insideEnd`:v=p-_*a,y=!m;break;case`end`:v=p+_*a,y=m;break;default:throw Error(`Unsupported position ${t}`)}y=g<=0?y:!y;var b=R(s,l,h,v),x=R(s,l,h,v+(y?1:-1)*359),S=`M${b.x},${b.y}
-    A${h},${h},0,1,${y?0:1},
-    ${x.x},${x.y}`,w=k(e.id)?C(`recharts-radial-line-`):e.id;return A.createElement(`text`,pw({},r,{dominantBaseline:`central`,className:c(`recharts-radial-bar-label`,o)}),A.createElement(`defs`,null,A.createElement(`path`,{id:w,d:S})),A.createElement(`textPath`,{xlinkHref:`#${w}`},n))},ww=(e,t,n)=>{var{cx:r,cy:i,innerRadius:a,outerRadius:o,startAngle:s,endAngle:c}=e,l=(s+c)/2;if(n===`outside`){var{x:u,y:d}=R(r,i,o+t,l);return{x:u,y:d,textAnchor:u>=r?`start`:`end`,verticalAnchor:`middle`}}if(n===`center`)return{x:r,y:i,textAnchor:`middle`,verticalAnchor:`middle`};if(n===`centerTop`)return{x:r,y:i,textAnchor:`middle`,verticalAnchor:`start`};if(n===`centerBottom`)return{x:r,y:i,textAnchor:`middle`,verticalAnchor:`end`};var f=(a+o)/2,{x:p,y:m}=R(r,i,f,l);return{x:p,y:m,textAnchor:`middle`,verticalAnchor:`middle`}},Tw=e=>`cx`in e&&b(e.cx),Ew=(e,t)=>{var{parentViewBox:n,offset:r,position:i}=e,a;n!=null&&!Tw(n)&&(a=n);var{x:o,y:s,width:c,height:l}=t,u=l>=0?1:-1,d=u*r,f=u>0?`end`:`start`,p=u>0?`start`:`end`,m=c>=0?1:-1,h=m*r,g=m>0?`end`:`start`,_=m>0?`start`:`end`;if(i===`top`){var v={x:o+c/2,y:s-u*r,textAnchor:`middle`,verticalAnchor:f};return Z(Z({},v),a?{height:Math.max(s-a.y,0),width:c}:{})}if(i===`bottom`){var x={x:o+c/2,y:s+l+d,textAnchor:`middle`,verticalAnchor:p};return Z(Z({},x),a?{height:Math.max(a.y+a.height-(s+l),0),width:c}:{})}if(i===`left`){var S={x:o-h,y:s+l/2,textAnchor:g,verticalAnchor:`middle`};return Z(Z({},S),a?{width:Math.max(S.x-a.x,0),height:l}:{})}if(i===`right`){var C={x:o+c+h,y:s+l/2,textAnchor:_,verticalAnchor:`middle`};return Z(Z({},C),a?{width:Math.max(a.x+a.width-C.x,0),height:l}:{})}var T=a?{width:c,height:l}:{};return i===`insideLeft`?Z({x:o+h,y:s+l/2,textAnchor:_,verticalAnchor:`middle`},T):i===`insideRight`?Z({x:o+c-h,y:s+l/2,textAnchor:g,verticalAnchor:`middle`},T):i===`insideTop`?Z({x:o+c/2,y:s+d,textAnchor:`middle`,verticalAnchor:p},T):i===`insideBottom`?Z({x:o+c/2,y:s+l-d,textAnchor:`middle`,verticalAnchor:f},T):i===`insideTopLeft`?Z({x:o+h,y:s+d,textAnchor:_,verticalAnchor:p},T):i===`insideTopRight`?Z({x:o+c-h,y:s+d,textAnchor:g,verticalAnchor:p},T):i===`insideBottomLeft`?Z({x:o+h,y:s+l-d,textAnchor:_,verticalAnchor:f},T):i===`insideBottomRight`?Z({x:o+c-h,y:s+l-d,textAnchor:g,verticalAnchor:f},T):i&&typeof i==`object`&&(b(i.x)||y(i.x))&&(b(i.y)||y(i.y))?Z({x:o+w(i.x,c),y:s+w(i.y,l),textAnchor:`end`,verticalAnchor:`end`},T):Z({x:o+c/2,y:s+l/2,textAnchor:`middle`,verticalAnchor:`middle`},T)},Dw={offset:5};function Ow(e){var t=H(e,Dw),{viewBox:n,position:r,value:i,children:a,content:o,className:s=``,textBreakAll:l,labelRef:u}=t,d=yw(),f=gw(),p=n||(r===`center`?f:d??f);if(!p||k(i)&&k(a)&&!(0,A.isValidElement)(o)&&typeof o!=`function`)return null;var m=Z(Z({},t),{},{viewBox:p});if((0,A.isValidElement)(o)){var{labelRef:h}=m,g=sw(m,ow);return(0,A.cloneElement)(o,g)}var _;if(typeof o==`function`){if(_=(0,A.createElement)(o,m),(0,A.isValidElement)(_))return _}else _=bw(t);var v=Tw(p),y=M(t,!0);if(v&&(r===`insideStart`||r===`insideEnd`||r===`end`))return Cw(t,r,_,y,p);var b=v?ww(p,t.offset,t.position):Ew(t,p);return A.createElement(aw,pw({ref:u,className:c(`recharts-label`,s)},y,b,{breakAll:l}),_)}Ow.displayName=`Label`;var kw=(e,t,n)=>{if(!e)return null;var r={viewBox:t,labelRef:n};return e===!0?A.createElement(Ow,pw({key:`label-implicit`},r)):x(e)?A.createElement(Ow,pw({key:`label-implicit`,value:e},r)):(0,A.isValidElement)(e)?e.type===Ow?(0,A.cloneElement)(e,Z({key:`label-implicit`},r)):A.createElement(Ow,pw({key:`label-implicit`,content:e},r)):xw(e)?A.createElement(Ow,pw({key:`label-implicit`,content:e},r)):e&&typeof e==`object`?A.createElement(Ow,pw({},e,{key:`label-implicit`},r)):null};function Aw(e){var{label:t}=e,n=gw();return kw(t,n)||null}function jw(e){var{label:t}=e,n=yw();return kw(t,n)||null}var Mw=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});function t(e){return e[e.length-1]}exports.last=t})),Nw=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});function t(e){return Array.isArray(e)?e:Array.from(e)}exports.toArray=t})),Pw=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=Mw(),n=Nw(),r=On();function i(e){if(r.isArrayLike(e))return t.last(n.toArray(e))}exports.last=i})),Fw=n(((exports,t)=>{t.exports=Pw().last})),Iw=e(Fw()),Lw=[`valueAccessor`],Rw=[`dataKey`,`clockWise`,`id`,`textBreakAll`];function zw(){return zw=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},zw.apply(null,arguments)}function Bw(e,t){if(e==null)return{};var n,r,i=Vw(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function Vw(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}var Hw=e=>Array.isArray(e.value)?(0,Iw.default)(e.value):e.value,Uw=(0,A.createContext)(void 0),Ww=Uw.Provider,Gw=(0,A.createContext)(void 0),Kw=Gw.Provider;function qw(){return(0,A.useContext)(Uw)}function Jw(){return(0,A.useContext)(Gw)}function Yw(e){var{valueAccessor:t=Hw}=e,n=Bw(e,Lw),{dataKey:r,clockWise:i,id:a,textBreakAll:o}=n,s=Bw(n,Rw),c=qw(),l=Jw(),u=c||l;return!u||!u.length?null:A.createElement(N,{className:`recharts-label-list`},u.map((e,i)=>{var c=k(r)?t(e,i):z(e&&e.payload,r),l=k(a)?{}:{id:`${a}-${i}`};return A.createElement(Ow,zw({},M(e,!0),s,l,{fill:n.fill??e.fill,parentViewBox:e.parentViewBox,value:c,textBreakAll:o,viewBox:e.viewBox,key:`label-${i}`,index:i}))}))}Yw.displayName=`LabelList`;function Xw(e){var{label:t}=e;return t?t===!0?A.createElement(Yw,{key:`labelList-implicit`}):A.isValidElement(t)||xw(t)?A.createElement(Yw,{key:`labelList-implicit`,content:t}):typeof t==`object`?A.createElement(Yw,zw({key:`labelList-implicit`},t,{type:String(t.type)})):null:null}var Zw=[`component`];function Qw(e,t){if(e==null)return{};var n,r,i=$w(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function $w(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}function eT(e){var{component:t}=e,n=Qw(e,Zw),r;return(0,A.isValidElement)(t)?r=(0,A.cloneElement)(t,n):typeof t==`function`?r=(0,A.createElement)(t,n):cC(!1,"Customized's props `component` must be React.element or Function, but got %s.",typeof t),A.createElement(N,{className:`recharts-customized-wrapper`},r)}eT.displayName=`Customized`;var tT=[`points`,`className`,`baseLinePoints`,`connectNulls`];function nT(){return nT=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},nT.apply(null,arguments)}function rT(e,t){if(e==null)return{};var n,r,i=iT(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function iT(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}var aT=e=>e&&e.x===+e.x&&e.y===+e.y,oT=function(){var e=arguments.length>0&&arguments[0]!==void 0?arguments[0]:[],t=[[]];return e.forEach(e=>{aT(e)?t[t.length-1].push(e):t[t.length-1].length>0&&t.push([])}),aT(e[0])&&t[t.length-1].push(e[0]),t[t.length-1].length<=0&&(t=t.slice(0,-1)),t},sT=(e,t)=>{var n=oT(e);t&&(n=[n.reduce((e,t)=>[...e,...t],[])]);var r=n.map(e=>e.reduce((e,t,n)=>`${e}${n===0?`M`:`L`}${t.x},${t.y}`,``)).join(``);return n.length===1?`${r}Z`:r},cT=(e,t,n)=>{var r=sT(e,n);return`${r.slice(-1)===`Z`?r.slice(0,-1):r}L${sT(Array.from(t).reverse(),n).slice(1)}`},lT=e=>{var{points:t,className:n,baseLinePoints:r,connectNulls:i}=e,a=rT(e,tT);if(!t||!t.length)return null;var o=c(`recharts-polygon`,n);if(r&&r.length){var s=a.stroke&&a.stroke!==`none`,l=cT(t,r,i);return A.createElement(`g`,{className:o},A.createElement(`path`,nT({},M(a,!0),{fill:l.slice(-1)===`Z`?a.fill:`none`,stroke:`none`,d:l})),s?A.createElement(`path`,nT({},M(a,!0),{fill:`none`,d:sT(t,i)})):null,s?A.createElement(`path`,nT({},M(a,!0),{fill:`none`,d:sT(r,i)})):null)}var u=sT(t,i);return A.createElement(`path`,nT({},M(a,!0),{fill:u.slice(-1)===`Z`?a.fill:`none`,className:o,d:u}))};function uT(){return uT=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},uT.apply(null,arguments)}var dT=e=>{var{cx:t,cy:n,r,className:i}=e,a=c(`recharts-dot`,i);return t===+t&&n===+n&&r===+r?A.createElement(`circle`,uT({},j(e),se(e),{className:a,cx:t,cy:n,r})):null},fT=e=>e.graphicalItems.polarItems,pT=L([Y,W_],gv),mT=L([fT,X,pT],yv),hT=L([mT],wv),gT=L([hT,gg],Ev),_T=L([gT,X,mT],Ov),vT=L([gT,X,mT],(e,t,n)=>n.length>0?e.flatMap(e=>n.flatMap(n=>({value:z(e,t.dataKey??n.dataKey),errorDomain:[]}))).filter(Boolean):t?.dataKey==null?e.map(e=>({value:e,errorDomain:[]})):e.map(e=>({value:z(e,t.dataKey),errorDomain:[]}))),yT=()=>void 0,bT=L([X,sy,yT,vT,yT,V,Y],cy),xT=L([X,V,gT,_T,x_,Y,bT],dy),ST=L([xT,X,my],_y),CT=L([X,xT,ST,Y],yy),wT=(e,t,n)=>{switch(t){case`angleAxis`:return N_(e,n);case`radiusAxis`:return P_(e,n);default:throw Error(`Unexpected axis type: ${t}`)}},TT=(e,t,n)=>{switch(t){case`angleAxis`:return B_(e,n);case`radiusAxis`:return H_(e,n);default:throw Error(`Unexpected axis type: ${t}`)}},ET=L([wT,my,CT,TT],gy),DT=L([V,_T,mv,Y],Xy),OT=L([V,wT,my,ET,ST,TT,Yy,DT,Y],$y),kT=L([V,wT,ET,TT,Yy,DT,Y],tb),AT=L([(e,t)=>OT(e,`angleAxis`,t,!1)],e=>{if(e)return e.map(e=>e.coordinate)}),jT=L([(e,t)=>OT(e,`radiusAxis`,t,!1)],e=>{if(e)return e.map(e=>e.coordinate)}),MT=[`gridType`,`radialLines`,`angleAxisId`,`radiusAxisId`,`cx`,`cy`,`innerRadius`,`outerRadius`];function NT(e,t){if(e==null)return{};var n,r,i=PT(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function PT(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}function FT(){return FT=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},FT.apply(null,arguments)}function IT(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function LT(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?IT(Object(n),!0).forEach(function(t){RT(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):IT(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function RT(e,t,n){return(t=zT(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function zT(e){var t=BT(e,`string`);return typeof t==`symbol`?t:t+``}function BT(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}var VT=(e,t,n,r)=>{var i=``;return r.forEach((r,a)=>{var o=R(t,n,e,r);a?i+=`L ${o.x},${o.y}`:i+=`M ${o.x},${o.y}`}),i+=`Z`,i},HT=e=>{var{cx:t,cy:n,innerRadius:r,outerRadius:i,polarAngles:a,radialLines:o}=e;if(!a||!a.length||!o)return null;var s=LT({stroke:`#ccc`},j(e));return A.createElement(`g`,{className:`recharts-polar-grid-angle`},a.map(e=>{var a=R(t,n,r,e),o=R(t,n,i,e);return A.createElement(`line`,FT({},s,{key:`line-${e}`,x1:a.x,y1:a.y,x2:o.x,y2:o.y}))}))},UT=e=>{var{cx:t,cy:n,radius:r}=e,i=LT({stroke:`#ccc`,fill:`none`},j(e));return A.createElement(`circle`,FT({},i,{className:c(`recharts-polar-grid-concentric-circle`,e.className),cx:t,cy:n,r}))},WT=e=>{var{radius:t}=e,n=LT({stroke:`#ccc`,fill:`none`},j(e));return A.createElement(`path`,FT({},n,{className:c(`recharts-polar-grid-concentric-polygon`,e.className),d:VT(t,e.cx,e.cy,e.polarAngles)}))},GT=e=>{var{polarRadius:t,gridType:n}=e;if(!t||!t.length)return null;var r=Math.max(...t),i=e.fill&&e.fill!==`none`;return A.createElement(`g`,{className:`recharts-polar-grid-concentric`},i&&n===`circle`&&A.createElement(UT,FT({},e,{radius:r})),i&&n!==`circle`&&A.createElement(WT,FT({},e,{radius:r})),t.map((t,r)=>{var i=r;return n===`circle`?A.createElement(UT,FT({key:i},e,{fill:`none`,radius:t})):A.createElement(WT,FT({key:i},e,{fill:`none`,radius:t}))}))},KT=e=>{var{gridType:t=`polygon`,radialLines:n=!0,angleAxisId:r=0,radiusAxisId:i=0,cx:a,cy:o,innerRadius:s,outerRadius:c}=e,l=NT(e,MT),u=I(U_),d=LT({cx:u?.cx??a??0,cy:u?.cy??o??0,innerRadius:u?.innerRadius??s??0,outerRadius:u?.outerRadius??c??0},l),{polarAngles:f,polarRadius:p,outerRadius:m}=d,h=I(e=>AT(e,r)),g=I(e=>jT(e,i)),_=Array.isArray(f)?f:h,v=Array.isArray(p)?p:g;return m<=0||_==null||v==null?null:A.createElement(`g`,{className:`recharts-polar-grid`},A.createElement(GT,FT({gridType:t,radialLines:n},d,{polarAngles:_,polarRadius:v})),A.createElement(HT,FT({gridType:t,radialLines:n},d,{polarAngles:_,polarRadius:v})))};KT.displayName=`PolarGrid`;var qT=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});function t(e,t){if(e.length===0)return;let n=e[0],r=t(n);for(let i=1;i<e.length;i++){let a=e[i],o=t(a);o>r&&(r=o,n=a)}return n}exports.maxBy=t})),JT=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=qT(),n=En(),r=Xn();function i(e,i){if(e!=null)return t.maxBy(Array.from(e),r.iteratee(i??n.identity))}exports.maxBy=i})),YT=n(((exports,t)=>{t.exports=JT().maxBy})),XT=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});function t(e,t){if(e.length===0)return;let n=e[0],r=t(n);for(let i=1;i<e.length;i++){let a=e[i],o=t(a);o<r&&(r=o,n=a)}return n}exports.minBy=t})),ZT=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=XT(),n=En(),r=Xn();function i(e,i){if(e!=null)return t.minBy(Array.from(e),r.iteratee(i??n.identity))}exports.minBy=i})),QT=n(((exports,t)=>{t.exports=ZT().minBy})),$T=Aa({name:`polarAxis`,initialState:{radiusAxis:{},angleAxis:{}},reducers:{addRadiusAxis(e,t){e.radiusAxis[t.payload.id]=aa(t.payload)},removeRadiusAxis(e,t){delete e.radiusAxis[t.payload.id]},addAngleAxis(e,t){e.angleAxis[t.payload.id]=aa(t.payload)},removeAngleAxis(e,t){delete e.angleAxis[t.payload.id]}}}),{addRadiusAxis:eE,removeRadiusAxis:tE,addAngleAxis:nE,removeAngleAxis:rE}=$T.actions,iE=$T.reducer,aE=e(YT()),oE=e(QT()),sE=[`cx`,`cy`,`angle`,`axisLine`],cE=[`angle`,`tickFormatter`,`stroke`,`tick`];function lE(){return lE=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},lE.apply(null,arguments)}function uE(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function dE(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?uE(Object(n),!0).forEach(function(t){fE(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):uE(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function fE(e,t,n){return(t=pE(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function pE(e){var t=mE(e,`string`);return typeof t==`symbol`?t:t+``}function mE(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function hE(e,t){if(e==null)return{};var n,r,i=gE(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function gE(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}var _E=`radiusAxis`;function vE(e){var t=F();return(0,A.useEffect)(()=>(t(eE(e)),()=>{t(tE(e))})),null}var yE=(e,t,n,r)=>{var{coordinate:i}=e;return R(n,r,i,t)},bE=e=>{var t;switch(e){case`left`:t=`end`;break;case`right`:t=`start`;break;default:t=`middle`;break}return t},xE=(e,t,n,r)=>{var i=(0,aE.default)(r,e=>e.coordinate||0),a=(0,oE.default)(r,e=>e.coordinate||0);return{cx:t,cy:n,startAngle:e,endAngle:e,innerRadius:a.coordinate||0,outerRadius:i.coordinate||0,clockWise:!1}},SE=(e,t)=>{var{cx:n,cy:r,angle:i,axisLine:a}=e,o=hE(e,sE),s=t.reduce((e,t)=>[Math.min(e[0],t.coordinate),Math.max(e[1],t.coordinate)],[1/0,-1/0]),c=R(n,r,s[0],i),l=R(n,r,s[1],i),u=dE(dE(dE({},j(o)),{},{fill:`none`},M(a,!1)),{},{x1:c.x,y1:c.y,x2:l.x,y2:l.y});return A.createElement(`line`,lE({className:`recharts-polar-radius-axis-line`},u))},CE=(e,t,n)=>A.isValidElement(e)?A.cloneElement(e,t):typeof e==`function`?e(t):A.createElement(aw,lE({},t,{className:`recharts-polar-radius-axis-tick-value`}),n),wE=(e,t)=>{var{angle:n,tickFormatter:r,stroke:i,tick:a}=e,o=hE(e,cE),s=bE(e.orientation),l=j(o),u=M(a,!1),d=t.map((t,o)=>{var d=yE(t,e.angle,e.cx,e.cy),f=dE(dE(dE(dE({textAnchor:s,transform:`rotate(${90-n}, ${d.x}, ${d.y})`},l),{},{stroke:`none`,fill:i},u),{},{index:o},d),{},{payload:t});return A.createElement(N,lE({className:c(`recharts-polar-radius-axis-tick`,Bo(a)),key:`tick-${t.coordinate}`},le(e,t,o)),CE(a,f,r?r(t.value,o):t.value))});return A.createElement(N,{className:`recharts-polar-radius-axis-ticks`},d)},TE=e=>{var{radiusAxisId:t}=e,n=I(U_),r=I(e=>ET(e,`radiusAxis`,t)),i=I(e=>OT(e,`radiusAxis`,t,!1));if(n==null||!i||!i.length)return null;var a=dE(dE(dE({},e),{},{scale:r},n),{},{radius:n.outerRadius}),{tick:o,axisLine:s}=a;return A.createElement(N,{className:c(`recharts-polar-radius-axis`,_E,a.className)},s&&SE(a,i),o&&wE(a,i),A.createElement(vw,xE(a.angle,a.cx,a.cy,i),A.createElement(jw,{label:a.label}),a.children))},EE=class extends A.PureComponent{render(){return A.createElement(A.Fragment,null,A.createElement(vE,{domain:this.props.domain,id:this.props.radiusAxisId,scale:this.props.scale,type:this.props.type,dataKey:this.props.dataKey,unit:void 0,name:this.props.name,allowDuplicatedCategory:this.props.allowDuplicatedCategory,allowDataOverflow:this.props.allowDataOverflow,reversed:this.props.reversed,includeHidden:this.props.includeHidden,allowDecimals:this.props.allowDecimals,tickCount:this.props.tickCount,ticks:this.props.ticks,tick:this.props.tick}),A.createElement(TE,this.props))}};fE(EE,`displayName`,`PolarRadiusAxis`),fE(EE,`axisType`,_E),fE(EE,`defaultProps`,D_);var DE=[`children`];function OE(){return OE=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},OE.apply(null,arguments)}function kE(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function AE(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?kE(Object(n),!0).forEach(function(t){jE(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):kE(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function jE(e,t,n){return(t=ME(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function ME(e){var t=NE(e,`string`);return typeof t==`symbol`?t:t+``}function NE(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function PE(e,t){if(e==null)return{};var n,r,i=FE(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function FE(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}var IE=1e-5,LE=Math.cos(Mo(45)),RE=`angleAxis`;function zE(e){var t=F(),n=(0,A.useMemo)(()=>{var{children:t}=e;return PE(e,DE)},[e]),r=I(e=>N_(e,n.id)),i=n===r;return(0,A.useEffect)(()=>(t(nE(n)),()=>{t(rE(n))}),[t,n]),i?e.children:null}var BE=(e,t)=>{var{cx:n,cy:r,radius:i,orientation:a,tickSize:o}=t,s=o||8,c=R(n,r,i,e.coordinate),l=R(n,r,i+(a===`inner`?-1:1)*s,e.coordinate);return{x1:c.x,y1:c.y,x2:l.x,y2:l.y}},VE=(e,t)=>{var n=Math.cos(Mo(-e.coordinate));return n>IE?t===`outer`?`start`:`end`:n<-IE?t===`outer`?`end`:`start`:`middle`},HE=e=>{var t=Math.cos(Mo(-e.coordinate)),n=Math.sin(Mo(-e.coordinate));return Math.abs(t)<=LE?n>0?`start`:`end`:`middle`},UE=e=>{var{cx:t,cy:n,radius:r,axisLineType:i,axisLine:a,ticks:o}=e;if(!a)return null;var s=AE(AE({},j(e)),{},{fill:`none`},M(a,!1));if(i===`circle`)return A.createElement(dT,OE({className:`recharts-polar-angle-axis-line`},s,{cx:t,cy:n,r}));var c=o.map(e=>R(t,n,r,e.coordinate));return A.createElement(lT,OE({className:`recharts-polar-angle-axis-line`},s,{points:c}))},WE=e=>{var{tick:t,tickProps:n,value:r}=e;return t?A.isValidElement(t)?A.cloneElement(t,n):typeof t==`function`?t(n):A.createElement(aw,OE({},n,{className:`recharts-polar-angle-axis-tick-value`}),r):null},GE=e=>{var{tick:t,tickLine:n,tickFormatter:r,stroke:i,ticks:a}=e,o=j(e),s=M(t,!1),l=AE(AE({},o),{},{fill:`none`},M(n,!1)),u=a.map((a,u)=>{var d=BE(a,e),f=VE(a,e.orientation),p=HE(a),m=AE(AE(AE({},o),{},{textAnchor:f,verticalAnchor:p,stroke:`none`,fill:i},s),{},{index:u,payload:a,x:d.x2,y:d.y2});return A.createElement(N,OE({className:c(`recharts-polar-angle-axis-tick`,Bo(t)),key:`tick-${a.coordinate}`},le(e,a,u)),n&&A.createElement(`line`,OE({className:`recharts-polar-angle-axis-tick-line`},l,d)),A.createElement(WE,{tick:t,tickProps:m,value:r?r(a.value,u):a.value}))});return A.createElement(N,{className:`recharts-polar-angle-axis-ticks`},u)},KE=e=>{var{angleAxisId:t}=e,n=I(U_),r=I(e=>ET(e,`angleAxis`,t)),i=B(),a=I(e=>OT(e,`angleAxis`,t,i));if(n==null||!a||!a.length)return null;var o=AE(AE(AE({},e),{},{scale:r},n),{},{radius:n.outerRadius});return A.createElement(N,{className:c(`recharts-polar-angle-axis`,RE,o.className)},A.createElement(UE,OE({},o,{ticks:a})),A.createElement(GE,OE({},o,{ticks:a})))},qE=class extends A.PureComponent{render(){return this.props.radius<=0?null:A.createElement(zE,{id:this.props.angleAxisId,scale:this.props.scale,type:this.props.type,dataKey:this.props.dataKey,unit:void 0,name:this.props.name,allowDuplicatedCategory:!1,allowDataOverflow:!1,reversed:this.props.reversed,includeHidden:!1,allowDecimals:this.props.allowDecimals,tickCount:this.props.tickCount,ticks:this.props.ticks,tick:this.props.tick,domain:this.props.domain},A.createElement(KE,this.props))}};jE(qE,`displayName`,`PolarAngleAxis`),jE(qE,`axisType`,RE),jE(qE,`defaultProps`,E_);function JE(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function YE(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?JE(Object(n),!0).forEach(function(t){XE(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):JE(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function XE(e,t,n){return(t=ZE(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function ZE(e){var t=QE(e,`string`);return typeof t==`symbol`?t:t+``}function QE(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}var $E=L([fT,(e,t)=>t],(e,t)=>e.filter(e=>e.type===`pie`).find(e=>e.id===t)),eD=[],tD=(e,t,n)=>n?.length===0?eD:n,nD=L([gg,$E,tD],(e,t,n)=>{var{chartData:r}=e;if(t!=null){var i=t?.data!=null&&t.data.length>0?t.data:r;if((!i||!i.length)&&n!=null&&(i=n.map(e=>YE(YE({},t.presentationProps),e.props))),i!=null)return i}}),rD=L([nD,$E,tD],(e,t,n)=>{if(!(e==null||t==null))return e.map((e,r)=>{var i,a=z(e,t.nameKey,t.name),o=n!=null&&(i=n[r])!=null&&(i=i.props)!=null&&i.fill?n[r].props.fill:typeof e==`object`&&e&&`fill`in e?e.fill:t.fill;return{value:vs(a,t.dataKey),color:o,payload:e,type:t.legendType}})}),iD=L([nD,$E,tD,Vs],(e,t,n,r)=>{if(!(t==null||e==null))return bO({offset:r,pieSettings:t,displayedData:e,cells:n})}),aD=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});function t(e){if(typeof e!=`object`||!e)return!1;if(Object.getPrototypeOf(e)===null)return!0;if(Object.prototype.toString.call(e)!==`[object Object]`){let t=e[Symbol.toStringTag];return t==null||!Object.getOwnPropertyDescriptor(e,Symbol.toStringTag)?.writable?!1:e.toString()===`[object ${t}]`}let t=e;for(;Object.getPrototypeOf(t)!==null;)t=Object.getPrototypeOf(t);return Object.getPrototypeOf(e)===t}exports.isPlainObject=t})),oD=n(((exports,t)=>{t.exports=aD().isPlainObject}));function sD(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function cD(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?sD(Object(n),!0).forEach(function(t){lD(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):sD(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function lD(e,t,n){return(t=uD(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function uD(e){var t=dD(e,`string`);return typeof t==`symbol`?t:t+``}function dD(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function fD(){return fD=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},fD.apply(null,arguments)}var pD=(e,t,n,r,i)=>{var a=n-r,o=`M ${e},${t}`;return o+=`L ${e+n},${t}`,o+=`L ${e+n-a/2},${t+i}`,o+=`L ${e+n-a/2-r},${t+i}`,o+=`L ${e},${t} Z`,o},mD={x:0,y:0,upperWidth:0,lowerWidth:0,height:0,isUpdateAnimationActive:!1,animationBegin:0,animationDuration:1500,animationEasing:`ease`},hD=e=>{var t=H(e,mD),{x:n,y:r,upperWidth:i,lowerWidth:a,height:o,className:s}=t,{animationEasing:l,animationDuration:u,animationBegin:d,isUpdateAnimationActive:f}=t,p=(0,A.useRef)(),[m,h]=(0,A.useState)(-1),g=(0,A.useRef)(i),_=(0,A.useRef)(a),v=(0,A.useRef)(o),y=(0,A.useRef)(n),b=(0,A.useRef)(r),x=uu(e,`trapezoid-`);if((0,A.useEffect)(()=>{if(p.current&&p.current.getTotalLength)try{var e=p.current.getTotalLength();e&&h(e)}catch{}},[]),n!==+n||r!==+r||i!==+i||a!==+a||o!==+o||i===0&&a===0||o===0)return null;var S=c(`recharts-trapezoid`,s);if(!f)return A.createElement(`g`,null,A.createElement(`path`,fD({},M(t,!0),{className:S,d:pD(n,r,i,a,o)})));var C=g.current,w=_.current,T=v.current,E=y.current,O=b.current,ee=`0px ${m===-1?1:m}px`,k=`${m}px 0px`,te=Pl([`strokeDasharray`],u,l);return A.createElement(lu,{animationId:x,key:x,canBegin:m>0,duration:u,easing:l,isActive:f,begin:d},e=>{var s=D(C,i,e),c=D(w,a,e),l=D(T,o,e),u=D(E,n,e),d=D(O,r,e);p.current&&(g.current=s,_.current=c,v.current=l,y.current=u,b.current=d);var f=e>0?{transition:te,strokeDasharray:k}:{strokeDasharray:ee};return A.createElement(`path`,fD({},M(t,!0),{className:S,d:pD(u,d,s,c,l),ref:p,style:cD(cD({},f),t.style)}))})},gD=e(oD()),_D=[`option`,`shapeType`,`propTransformer`,`activeClassName`,`isActive`];function vD(e,t){if(e==null)return{};var n,r,i=yD(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function yD(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}function bD(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function xD(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?bD(Object(n),!0).forEach(function(t){SD(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):bD(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function SD(e,t,n){return(t=CD(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function CD(e){var t=wD(e,`string`);return typeof t==`symbol`?t:t+``}function wD(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function TD(e,t){return xD(xD({},t),e)}function ED(e,t){return e===`symbols`}function DD(e){var{shapeType:t,elementProps:n}=e;switch(t){case`rectangle`:return A.createElement(yu,n);case`trapezoid`:return A.createElement(hD,n);case`sector`:return A.createElement(Du,n);case`symbols`:if(ED(t,n))return A.createElement(gn,n);break;default:return null}}function OD(e){return(0,A.isValidElement)(e)?e.props:e}function kD(e){var{option:t,shapeType:n,propTransformer:r=TD,activeClassName:i=`recharts-active-shape`,isActive:a}=e,o=vD(e,_D),s;if((0,A.isValidElement)(t))s=(0,A.cloneElement)(t,xD(xD({},o),OD(t)));else if(typeof t==`function`)s=t(o);else if((0,gD.default)(t)&&typeof t!=`boolean`){var c=r(t,o);s=A.createElement(DD,{shapeType:n,elementProps:c})}else{var l=o;s=A.createElement(DD,{shapeType:n,elementProps:l})}return a?A.createElement(N,{className:i},s):s}var AD=(e,t)=>{var n=F();return(r,i)=>a=>{e?.(r,i,a),n(yb({activeIndex:String(i),activeDataKey:t,activeCoordinate:r.tooltipPosition}))}},jD=e=>{var t=F();return(n,r)=>i=>{e?.(n,r,i),t(bb())}},MD=(e,t)=>{var n=F();return(r,i)=>a=>{e?.(r,i,a),n(Sb({activeIndex:String(i),activeDataKey:t,activeCoordinate:r.tooltipPosition}))}};function ND(e){var{fn:t,args:n}=e,r=F(),i=B();return(0,A.useEffect)(()=>{if(!i){var e=t(n);return r(gb(e)),()=>{r(_b(e))}}},[t,n,r,i]),null}var PD=()=>{};function FD(e){var{legendPayload:t}=e,n=F(),r=B();return(0,A.useEffect)(()=>r?PD:(n(oc(t)),()=>{n(sc(t))}),[n,r,t]),null}function ID(e){var{legendPayload:t}=e,n=F(),r=I(V);return(0,A.useEffect)(()=>r!==`centric`&&r!==`radial`?PD:(n(oc(t)),()=>{n(sc(t))}),[n,r,t]),null}var LD=A.useId??(()=>{var[e]=A.useState(()=>C(`uid-`));return e});function RD(e,t){var n=LD();return t||(e?`${e}-${n}`:n)}var zD=(0,A.createContext)(void 0),BD=e=>{var{id:t,type:n,children:r}=e,i=RD(`recharts-${n}`,t);return A.createElement(zD.Provider,{value:i},r(i))};function VD(){return(0,A.useContext)(zD)}var HD=Aa({name:`graphicalItems`,initialState:{cartesianItems:[],polarItems:[]},reducers:{addCartesianGraphicalItem(e,t){e.cartesianItems.push(aa(t.payload))},replaceCartesianGraphicalItem(e,t){var{prev:n,next:r}=t.payload,i=ta(e).cartesianItems.indexOf(aa(n));i>-1&&(e.cartesianItems[i]=aa(r))},removeCartesianGraphicalItem(e,t){var n=ta(e).cartesianItems.indexOf(aa(t.payload));n>-1&&e.cartesianItems.splice(n,1)},addPolarGraphicalItem(e,t){e.polarItems.push(aa(t.payload))},removePolarGraphicalItem(e,t){var n=ta(e).polarItems.indexOf(aa(t.payload));n>-1&&e.polarItems.splice(n,1)}}}),{addCartesianGraphicalItem:UD,replaceCartesianGraphicalItem:WD,removeCartesianGraphicalItem:GD,addPolarGraphicalItem:KD,removePolarGraphicalItem:qD}=HD.actions,JD=HD.reducer;function YD(e){var t=F(),n=(0,A.useRef)(null);return(0,A.useEffect)(()=>{n.current===null?t(UD(e)):n.current!==e&&t(WD({prev:n.current,next:e})),n.current=e},[t,e]),(0,A.useEffect)(()=>()=>{n.current&&=(t(GD(n.current)),null)},[t]),null}function XD(e){var t=F();return(0,A.useEffect)(()=>(t(KD(e)),()=>{t(qD(e))}),[t,e]),null}var ZD=e(h()),QD=[`onMouseEnter`,`onClick`,`onMouseLeave`],$D=[`id`],eO=[`id`];function tO(e,t){if(e==null)return{};var n,r,i=nO(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function nO(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}function rO(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function Q(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?rO(Object(n),!0).forEach(function(t){iO(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):rO(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function iO(e,t,n){return(t=aO(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function aO(e){var t=oO(e,`string`);return typeof t==`symbol`?t:t+``}function oO(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function sO(){return sO=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},sO.apply(null,arguments)}function cO(e){var t=(0,A.useMemo)(()=>ve(e.children,gC),[e.children]),n=I(n=>rD(n,e.id,t));return n==null?null:A.createElement(ID,{legendPayload:n})}function lO(e){var{dataKey:t,nameKey:n,sectors:r,stroke:i,strokeWidth:a,fill:o,name:s,hide:c,tooltipType:l}=e;return{dataDefinedOnItem:r.map(e=>e.tooltipPayload),positions:r.map(e=>e.tooltipPosition),settings:{stroke:i,strokeWidth:a,fill:o,dataKey:t,nameKey:n,name:vs(s,t),hide:c,type:l,color:o,unit:``}}}var uO=(e,t)=>e>t?`start`:e<t?`end`:`middle`,dO=(e,t,n)=>w(typeof t==`function`?t(e):t,n,n*.8),fO=(e,t,n)=>{var{top:r,left:i,width:a,height:o}=t,s=Po(a,o),c=i+w(e.cx,a,a/2),l=r+w(e.cy,o,o/2),u=w(e.innerRadius,s,0),d=dO(n,e.outerRadius,s),f=e.maxRadius||Math.sqrt(a*a+o*o)/2;return{cx:c,cy:l,innerRadius:u,outerRadius:d,maxRadius:f}},pO=(e,t)=>{var n=_(t-e),r=Math.min(Math.abs(t-e),360);return n*r};function mO(e){return e&&typeof e==`object`&&`className`in e&&typeof e.className==`string`?e.className:``}var hO=(e,t)=>{if(A.isValidElement(e))return A.cloneElement(e,t);if(typeof e==`function`)return e(t);var n=c(`recharts-pie-label-line`,typeof e==`boolean`?``:e.className);return A.createElement(ll,sO({},t,{type:`linear`,className:n}))},gO=(e,t,n)=>{if(A.isValidElement(e))return A.cloneElement(e,t);var r=n;if(typeof e==`function`&&(r=e(t),A.isValidElement(r)))return r;var i=c(`recharts-pie-label-text`,mO(e));return A.createElement(aw,sO({},t,{alignmentBaseline:`middle`,className:i}),r)};function _O(e){var{sectors:t,props:n,showLabels:r}=e,{label:i,labelLine:a,dataKey:o}=n;if(!r||!i||!t)return null;var s=j(n),c=M(i,!1),l=M(a,!1),u=typeof i==`object`&&`offsetRadius`in i&&typeof i.offsetRadius==`number`&&i.offsetRadius||20,d=t.map((e,t)=>{var n=(e.startAngle+e.endAngle)/2,r=R(e.cx,e.cy,e.outerRadius+u,n),d=Q(Q(Q(Q({},s),e),{},{stroke:`none`},c),{},{index:t,textAnchor:uO(r.x,e.cx)},r),f=Q(Q(Q(Q({},s),e),{},{fill:`none`,stroke:e.fill},l),{},{index:t,points:[R(e.cx,e.cy,e.outerRadius,n),r],key:`line`});return A.createElement(N,{key:`label-${e.startAngle}-${e.endAngle}-${e.midAngle}-${t}`},a&&hO(a,f),gO(i,d,z(e,o)))});return A.createElement(N,{className:`recharts-pie-labels`},d)}function vO(e){var{sectors:t,props:n,showLabels:r}=e,{label:i}=n;return typeof i==`object`&&i&&`position`in i?A.createElement(Xw,{label:i}):A.createElement(_O,{sectors:t,props:n,showLabels:r})}function yO(e){var{sectors:t,activeShape:n,inactiveShape:r,allOtherPieProps:i}=e,a=I(Ax),{onMouseEnter:o,onClick:s,onMouseLeave:c}=i,l=tO(i,QD),u=AD(o,i.dataKey),d=jD(c),f=MD(s,i.dataKey);return t==null||t.length===0?null:A.createElement(A.Fragment,null,t.map((e,o)=>{if(e?.startAngle===0&&e?.endAngle===0&&t.length!==1)return null;var s=n&&String(o)===a,c=s?n:a?r:null,p=Q(Q({},e),{},{stroke:e.stroke,tabIndex:-1,[ks]:o,[As]:i.dataKey});return A.createElement(N,sO({tabIndex:-1,className:`recharts-pie-sector`},le(l,e,o),{onMouseEnter:u(e,o),onMouseLeave:d(e,o),onClick:f(e,o),key:`sector-${e?.startAngle}-${e?.endAngle}-${e.midAngle}-${o}`}),A.createElement(kD,sO({option:c,isActive:s,shapeType:`sector`},p)))}))}function bO(e){var{pieSettings:t,displayedData:n,cells:r,offset:i}=e,{cornerRadius:a,startAngle:o,endAngle:s,dataKey:c,nameKey:l,tooltipType:u}=t,d=Math.abs(t.minAngle),f=pO(o,s),p=Math.abs(f),m=n.length<=1?0:t.paddingAngle??0,h=n.filter(e=>z(e,c,0)!==0).length,g=(p>=360?h:h-1)*m,v=p-h*d-g,y=n.reduce((e,t)=>{var n=z(t,c,0);return e+(b(n)?n:0)},0),x;if(y>0){var S;x=n.map((e,n)=>{var s=z(e,c,0),p=z(e,l,n),h=fO(t,i,e),g=(b(s)?s:0)/y,x,C=Q(Q({},e),r&&r[n]&&r[n].props);x=n?S.endAngle+_(f)*m*(s===0?0:1):o;var w=x+_(f)*((s===0?0:d)+g*v),T=(x+w)/2,E=(h.innerRadius+h.outerRadius)/2,D=[{name:p,value:s,payload:C,dataKey:c,type:u}],O=R(h.cx,h.cy,E,T);return S=Q(Q(Q(Q({},t.presentationProps),{},{percent:g,cornerRadius:a,name:p,tooltipPayload:D,midAngle:T,middleRadius:E,tooltipPosition:O},C),h),{},{value:s,startAngle:x,endAngle:w,payload:C,paddingAngle:_(f)*m}),S})}return x}function xO(e){var{showLabels:t,sectors:n,children:r}=e,i=(0,A.useMemo)(()=>!t||!n?[]:n.map(e=>({value:e.value,payload:e.payload,clockWise:!1,parentViewBox:void 0,viewBox:{cx:e.cx,cy:e.cy,innerRadius:e.innerRadius,outerRadius:e.outerRadius,startAngle:e.startAngle,endAngle:e.endAngle,clockWise:!1},fill:e.fill})),[n,t]);return A.createElement(Kw,{value:t?i:void 0},r)}function SO(e){var{props:t,previousSectorsRef:n}=e,{sectors:r,isAnimationActive:i,animationBegin:a,animationDuration:o,animationEasing:s,activeShape:c,inactiveShape:l,onAnimationStart:u,onAnimationEnd:d}=t,f=uu(t,`recharts-pie-`),p=n.current,[m,h]=(0,A.useState)(!1),g=(0,A.useCallback)(()=>{typeof d==`function`&&d(),h(!1)},[d]),_=(0,A.useCallback)(()=>{typeof u==`function`&&u(),h(!0)},[u]);return A.createElement(xO,{showLabels:!m,sectors:r},A.createElement(lu,{animationId:f,begin:a,duration:o,isActive:i,easing:s,onAnimationStart:_,onAnimationEnd:g,key:f},e=>{var i=[],a=r&&r[0],o=a?.startAngle;return r?.forEach((t,n)=>{var r=p&&p[n],a=n>0?(0,ZD.default)(t,`paddingAngle`,0):0;if(r){var s=D(r.endAngle-r.startAngle,t.endAngle-t.startAngle,e),c=Q(Q({},t),{},{startAngle:o+a,endAngle:o+s+a});i.push(c),o=c.endAngle}else{var{endAngle:l,startAngle:u}=t,d=D(0,l-u,e),f=Q(Q({},t),{},{startAngle:o+a,endAngle:o+d+a});i.push(f),o=f.endAngle}}),n.current=i,A.createElement(N,null,A.createElement(yO,{sectors:i,activeShape:c,inactiveShape:l,allOtherPieProps:t}))}),A.createElement(vO,{showLabels:!m,sectors:r,props:t}),t.children)}var CO={animationBegin:400,animationDuration:1500,animationEasing:`ease`,cx:`50%`,cy:`50%`,dataKey:`value`,endAngle:360,fill:`#808080`,hide:!1,innerRadius:0,isAnimationActive:!qc.isSsr,labelLine:!0,legendType:`rect`,minAngle:0,nameKey:`name`,outerRadius:`80%`,paddingAngle:0,rootTabIndex:0,startAngle:0,stroke:`#fff`};function wO(e){var{id:t}=e,n=tO(e,$D),{hide:r,className:i,rootTabIndex:a}=e,o=(0,A.useMemo)(()=>ve(e.children,gC),[e.children]),s=I(e=>iD(e,t,o)),l=(0,A.useRef)(null),u=c(`recharts-pie`,i);return r||s==null?(l.current=null,A.createElement(N,{tabIndex:a,className:u})):A.createElement(A.Fragment,null,A.createElement(ND,{fn:lO,args:Q(Q({},e),{},{sectors:s})}),A.createElement(N,{tabIndex:a,className:u},A.createElement(SO,{props:Q(Q({},n),{},{sectors:s}),previousSectorsRef:l})))}function TO(e){var t=H(e,CO),{id:n}=t,r=tO(t,eO),i=j(r);return A.createElement(BD,{id:n,type:`pie`},e=>A.createElement(A.Fragment,null,A.createElement(XD,{type:`pie`,id:e,data:r.data,dataKey:r.dataKey,hide:r.hide,angleAxisId:0,radiusAxisId:0,name:r.name,nameKey:r.nameKey,tooltipType:r.tooltipType,legendType:r.legendType,fill:r.fill,cx:r.cx,cy:r.cy,startAngle:r.startAngle,endAngle:r.endAngle,paddingAngle:r.paddingAngle,minAngle:r.minAngle,innerRadius:r.innerRadius,outerRadius:r.outerRadius,cornerRadius:r.cornerRadius,presentationProps:i,maxRadius:t.maxRadius}),A.createElement(cO,sO({},r,{id:e})),A.createElement(wO,sO({},r,{id:e}))))}TO.displayName=`Pie`;function EO(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function DO(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?EO(Object(n),!0).forEach(function(t){OO(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):EO(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function OO(e,t,n){return(t=kO(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function kO(e){var t=AO(e,`string`);return typeof t==`symbol`?t:t+``}function AO(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}var jO=Aa({name:`cartesianAxis`,initialState:{xAxis:{},yAxis:{},zAxis:{}},reducers:{addXAxis(e,t){e.xAxis[t.payload.id]=aa(t.payload)},removeXAxis(e,t){delete e.xAxis[t.payload.id]},addYAxis(e,t){e.yAxis[t.payload.id]=aa(t.payload)},removeYAxis(e,t){delete e.yAxis[t.payload.id]},addZAxis(e,t){e.zAxis[t.payload.id]=aa(t.payload)},removeZAxis(e,t){delete e.zAxis[t.payload.id]},updateYAxisWidth(e,t){var{id:n,width:r}=t.payload;e.yAxis[n]&&(e.yAxis[n]=DO(DO({},e.yAxis[n]),{},{width:r}))}}}),{addXAxis:MO,removeXAxis:NO,addYAxis:PO,removeYAxis:FO,addZAxis:IO,removeZAxis:LO,updateYAxisWidth:RO}=jO.actions,zO=jO.reducer,BO=L([Vs],e=>{if(e)return{top:e.top,bottom:e.bottom,left:e.left,right:e.right}}),VO=L([BO,Ss,Cs],(e,t,n)=>{if(!(!e||t==null||n==null))return{x:e.left,y:e.top,width:Math.max(0,t-e.left-e.right),height:Math.max(0,n-e.top-e.bottom)}}),HO=e=>{var t=B();return I(n=>rb(n,`xAxis`,e,t))},UO=e=>{var t=B();return I(n=>rb(n,`yAxis`,e,t))},WO=()=>I(jx),GO=()=>I(BO),KO=()=>I(VO),qO=()=>I(Rx),JO=function(){var e=arguments.length>0&&arguments[0]!==void 0?arguments[0]:0,t=B();return I(n=>fy(n,`xAxis`,e,t))},YO=function(){var e=arguments.length>0&&arguments[0]!==void 0?arguments[0]:0,t=B();return I(n=>fy(n,`yAxis`,e,t))};function XO(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function ZO(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?XO(Object(n),!0).forEach(function(t){QO(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):XO(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function QO(e,t,n){return(t=$O(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function $O(e){var t=ek(e,`string`);return typeof t==`symbol`?t:t+``}function ek(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}var tk=e=>{var{point:t,childIndex:n,mainColor:r,activeDot:i,dataKey:a}=e;if(i===!1||t.x==null||t.y==null)return null;var o=ZO(ZO({index:n,dataKey:a,cx:t.x,cy:t.y,r:4,fill:r??`none`,strokeWidth:2,stroke:`#fff`,payload:t.payload,value:t.value},M(i,!1)),se(i)),s=(0,A.isValidElement)(i)?(0,A.cloneElement)(i,o):typeof i==`function`?i(o):A.createElement(dT,o);return A.createElement(N,{className:`recharts-active-dot`},s)};function nk(e){var{points:t,mainColor:n,activeDot:r,itemDataKey:i}=e,a=I(Ax),o=qO();if(t==null||o==null)return null;var s=t.find(e=>o.includes(e.payload));return k(s)?null:tk({point:s,childIndex:Number(a),mainColor:n,dataKey:i,activeDot:r})}function rk(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function ik(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?rk(Object(n),!0).forEach(function(t){ak(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):rk(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function ak(e,t,n){return(t=ok(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function ok(e){var t=sk(e,`string`);return typeof t==`symbol`?t:t+``}function sk(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}var ck=(e,t)=>ET(e,`radiusAxis`,t),lk=L([ck],e=>{if(e!=null)return{scale:e}}),uk=L([P_,ck],(e,t)=>{if(!(e==null||t==null))return ik(ik({},e),{},{scale:t})}),dk=(e,t,n,r)=>OT(e,`radiusAxis`,t,r),fk=(e,t,n)=>N_(e,n),pk=(e,t,n)=>ET(e,`angleAxis`,n),mk=L([fk,pk],(e,t)=>{if(!(e==null||t==null))return ik(ik({},e),{},{scale:t})}),hk=(e,t,n,r)=>OT(e,`angleAxis`,n,r),gk=L([fk,pk,U_],(e,t,n)=>{if(!(n==null||t==null))return{scale:t,type:e.type,dataKey:e.dataKey,cx:n.cx,cy:n.cy}}),_k=(e,t,n,r,i)=>i,vk=L([V,uk,dk,mk,hk],(e,t,n,r,i)=>Zo(e,`radiusAxis`)?gs(t,n,!1):gs(r,i,!1)),yk=L([fT,_k],(e,t)=>{if(e!=null)return e.find(e=>e.type===`radar`&&t===e.id)?.dataKey}),bk=L([lk,gk,gg,yk,vk],(e,t,n,r,i)=>{var{chartData:a,dataStartIndex:o,dataEndIndex:s}=n;if(!(e==null||t==null||a==null||i==null||r==null)){var c=a.slice(o,s+1);return Fk({radiusAxis:e,angleAxis:t,displayedData:c,dataKey:r,bandSize:i})}}),xk=e(Fw()),Sk=[`id`];function Ck(e,t){if(e==null)return{};var n,r,i=wk(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function wk(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}function Tk(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function Ek(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?Tk(Object(n),!0).forEach(function(t){Dk(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Tk(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function Dk(e,t,n){return(t=Ok(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Ok(e){var t=kk(e,`string`);return typeof t==`symbol`?t:t+``}function kk(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function Ak(){return Ak=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Ak.apply(null,arguments)}function jk(e,t){return e&&e!==`none`?e:t}var Mk=e=>{var{dataKey:t,name:n,stroke:r,fill:i,legendType:a,hide:o}=e;return[{inactive:o,dataKey:t,type:a,color:jk(r,i),value:vs(n,t),payload:e}]};function Nk(e){var{dataKey:t,stroke:n,strokeWidth:r,fill:i,name:a,hide:o,tooltipType:s}=e;return{dataDefinedOnItem:void 0,positions:void 0,settings:{stroke:n,strokeWidth:r,fill:i,nameKey:void 0,dataKey:t,name:vs(a,t),hide:o,type:s,color:jk(n,i),unit:``}}}function Pk(e,t){return A.isValidElement(e)?A.cloneElement(e,t):typeof e==`function`?e(t):A.createElement(dT,Ak({},t,{className:c(`recharts-radar-dot`,typeof e==`boolean`?``:e.className)}))}function Fk(e){var{radiusAxis:t,angleAxis:n,displayedData:r,dataKey:i,bandSize:a}=e,{cx:o,cy:s}=n,c=!1,l=[],u=n.type===`number`?0:a??0;r.forEach((e,r)=>{var a=z(e,n.dataKey,r),d=z(e,i),f=n.scale(a)+u,p=Array.isArray(d)?(0,xk.default)(d):d,m=k(p)?void 0:t.scale(p);Array.isArray(d)&&d.length>=2&&(c=!0),l.push(Ek(Ek({},R(o,s,m,f)),{},{name:a,value:d,cx:o,cy:s,radius:m,angle:f,payload:e}))});var d=[];return c&&l.forEach(e=>{if(Array.isArray(e.value)){var n=e.value[0],r=k(n)?void 0:t.scale(n);d.push(Ek(Ek({},e),{},{radius:r},R(o,s,r,e.angle)))}else d.push(e)}),{points:l,isRange:c,baseLinePoints:d}}function Ik(e){var{points:t,props:n}=e,{dot:r,dataKey:i}=n;if(!r)return null;var{id:a}=n,o=Ck(n,Sk),s=j(o),c=M(r,!0),l=t.map((e,t)=>{var n=Ek(Ek(Ek({key:`dot-${t}`,r:3},s),c),{},{dataKey:i,cx:e.x,cy:e.y,index:t,payload:e});return Pk(r,n)});return A.createElement(N,{className:`recharts-radar-dots`},l)}function Lk(e){var{showLabels:t,points:n,children:r}=e,i=n.map(e=>{var t={x:e.x,y:e.y,width:0,height:0};return Ek(Ek({},t),{},{value:e.value,payload:e.payload,parentViewBox:void 0,viewBox:t,fill:void 0})});return A.createElement(Ww,{value:t?i:null},r)}function Rk(e){var{points:t,baseLinePoints:n,props:r}=e;if(t==null)return null;var{shape:i,isRange:a,connectNulls:o}=r,s=e=>{var{onMouseEnter:t}=r;t&&t(r,e)},c=e=>{var{onMouseLeave:t}=r;t&&t(r,e)},l=A.isValidElement(i)?A.cloneElement(i,Ek(Ek({},r),{},{points:t})):typeof i==`function`?i(Ek(Ek({},r),{},{points:t})):A.createElement(lT,Ak({},M(r,!0),{onMouseEnter:s,onMouseLeave:c,points:t,baseLinePoints:a?n:null,connectNulls:o}));return A.createElement(N,{className:`recharts-radar-polygon`},l,A.createElement(Ik,{props:r,points:t}))}var zk=(e,t,n)=>(r,i)=>{var a=e&&e[Math.floor(i*t)];return a?Ek(Ek({},r),{},{x:D(a.x,r.x,n),y:D(a.y,r.y,n)}):Ek(Ek({},r),{},{x:D(r.cx,r.x,n),y:D(r.cy,r.y,n)})};function Bk(e){var{props:t,previousPointsRef:n,previousBaseLinePointsRef:r}=e,{points:i,baseLinePoints:a,isAnimationActive:o,animationBegin:s,animationDuration:c,animationEasing:l,onAnimationEnd:u,onAnimationStart:d}=t,f=n.current,p=r.current,m=f&&f.length/i.length,h=p&&p.length/a.length,g=uu(t,`recharts-radar-`),[_,v]=(0,A.useState)(!1),y=!_,b=(0,A.useCallback)(()=>{typeof u==`function`&&u(),v(!1)},[u]),x=(0,A.useCallback)(()=>{typeof d==`function`&&d(),v(!0)},[d]);return A.createElement(Lk,{showLabels:y,points:i},A.createElement(lu,{animationId:g,begin:s,duration:c,isActive:o,easing:l,key:`radar-${g}`,onAnimationEnd:b,onAnimationStart:x},e=>{var o=e===1?i:i.map(zk(f,m,e)),s=e===1?a:a?.map(zk(p,h,e));return e>0&&(n.current=o,r.current=s),A.createElement(Rk,{points:o,baseLinePoints:s,props:t})}),A.createElement(Xw,{label:t.label}),t.children)}function Vk(e){var t=(0,A.useRef)(void 0),n=(0,A.useRef)(void 0);return A.createElement(Bk,{props:e,previousPointsRef:t,previousBaseLinePointsRef:n})}var Hk={angleAxisId:0,radiusAxisId:0,hide:!1,activeDot:!0,dot:!1,legendType:`rect`,isAnimationActive:!qc.isSsr,animationBegin:0,animationDuration:1500,animationEasing:`ease`},Uk=class extends A.PureComponent{render(){var{hide:e,className:t,points:n}=this.props;if(e||n==null)return null;var r=c(`recharts-radar`,t);return A.createElement(A.Fragment,null,A.createElement(N,{className:r},A.createElement(Vk,this.props)),A.createElement(nk,{points:n,mainColor:jk(this.props.stroke,this.props.fill),itemDataKey:this.props.dataKey,activeDot:this.props.activeDot}))}};function Wk(e){var t=B(),n=I(n=>bk(n,e.radiusAxisId,e.angleAxisId,t,e.id));return A.createElement(Uk,Ak({},e,{points:n?.points,baseLinePoints:n?.baseLinePoints,isRange:n?.isRange}))}var Gk=class extends A.PureComponent{render(){return A.createElement(BD,{id:this.props.id,type:`radar`},e=>A.createElement(A.Fragment,null,A.createElement(XD,{type:`radar`,id:e,data:void 0,dataKey:this.props.dataKey,hide:this.props.hide,angleAxisId:this.props.angleAxisId,radiusAxisId:this.props.radiusAxisId}),A.createElement(ID,{legendPayload:Mk(this.props)}),A.createElement(ND,{fn:Nk,args:this.props}),A.createElement(Wk,Ak({},this.props,{id:e}))))}};Dk(Gk,`displayName`,`Radar`),Dk(Gk,`defaultProps`,Hk);function Kk(){return Kk=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Kk.apply(null,arguments)}function qk(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function Jk(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?qk(Object(n),!0).forEach(function(t){Yk(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):qk(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function Yk(e,t,n){return(t=Xk(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Xk(e){var t=Zk(e,`string`);return typeof t==`symbol`?t:t+``}function Zk(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function Qk(e){return typeof e==`string`?parseInt(e,10):e}function $k(e,t){var n=`${t.cx||e.cx}`,r=Number(n),i=`${t.cy||e.cy}`,a=Number(i);return Jk(Jk(Jk({},t),e),{},{cx:r,cy:a})}function eA(e){return A.createElement(kD,Kk({shapeType:`sector`,propTransformer:$k},e))}var tA=!0,nA=`Invariant failed`;function rA(e,t){if(!e){if(tA)throw Error(nA);var n=typeof t==`function`?t():t,r=n?`${nA}: ${n}`:nA;throw Error(r)}}var iA=[`x`,`y`];function aA(){return aA=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},aA.apply(null,arguments)}function oA(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function sA(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?oA(Object(n),!0).forEach(function(t){cA(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):oA(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function cA(e,t,n){return(t=lA(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function lA(e){var t=uA(e,`string`);return typeof t==`symbol`?t:t+``}function uA(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function dA(e,t){if(e==null)return{};var n,r,i=fA(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function fA(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}function pA(e,t){var{x:n,y:r}=e,i=dA(e,iA),a=`${n}`,o=parseInt(a,10),s=`${r}`,c=parseInt(s,10),l=`${t.height||i.height}`,u=parseInt(l,10),d=`${t.width||i.width}`,f=parseInt(d,10);return sA(sA(sA(sA(sA({},t),i),o?{x:o}:{}),c?{y:c}:{}),{},{height:u,width:f,name:t.name,radius:t.radius})}function mA(e){return A.createElement(kD,aA({shapeType:`rectangle`,propTransformer:pA,activeClassName:`recharts-active-bar`},e))}var hA=function(e){var t=arguments.length>1&&arguments[1]!==void 0?arguments[1]:0;return(n,r)=>{if(b(e))return e;var i=b(n)||k(n);return i?e(n,r):(!i&&rA(!1),t)}},gA=Aa({name:`errorBars`,initialState:{},reducers:{addErrorBar:(e,t)=>{var{itemId:n,errorBar:r}=t.payload;e[n]||(e[n]=[]),e[n].push(r)},replaceErrorBar:(e,t)=>{var{itemId:n,prev:r,next:i}=t.payload;e[n]&&(e[n]=e[n].map(e=>e.dataKey===r.dataKey&&e.direction===r.direction?i:e))},removeErrorBar:(e,t)=>{var{itemId:n,errorBar:r}=t.payload;e[n]&&(e[n]=e[n].filter(e=>e.dataKey!==r.dataKey||e.direction!==r.direction))}}}),{addErrorBar:_A,replaceErrorBar:vA,removeErrorBar:yA}=gA.actions,bA=gA.reducer,xA=[`children`];function SA(e,t){if(e==null)return{};var n,r,i=CA(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function CA(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}var wA=(0,A.createContext)({data:[],xAxisId:`xAxis-0`,yAxisId:`yAxis-0`,dataPointFormatter:()=>({x:0,y:0,value:0}),errorBarOffset:0});function TA(e){var{children:t}=e,n=SA(e,xA);return A.createElement(wA.Provider,{value:n},t)}var EA=()=>(0,A.useContext)(wA);function DA(e){var t=F(),n=VD(),r=(0,A.useRef)(null);return(0,A.useEffect)(()=>{n!=null&&(r.current===null?t(_A({itemId:n,errorBar:e})):r.current!==e&&t(vA({itemId:n,prev:r.current,next:e})),r.current=e)},[t,n,e]),(0,A.useEffect)(()=>()=>{r.current!=null&&(t(yA({itemId:n,errorBar:r.current})),r.current=null)},[t,n]),null}function OA(e,t){var n=I(t=>sv(t,e)),r=I(e=>uv(e,t)),i=n?.allowDataOverflow??av.allowDataOverflow,a=r?.allowDataOverflow??cv.allowDataOverflow;return{needClip:i||a,needClipX:i,needClipY:a}}function kA(e){var{xAxisId:t,yAxisId:n,clipPathId:r}=e,i=KO(),{needClipX:a,needClipY:o,needClip:s}=OA(t,n);if(!s)return null;var{x:c,y:l,width:u,height:d}=i;return A.createElement(`clipPath`,{id:`clipPath-${r}`},A.createElement(`rect`,{x:a?c:c-u/2,y:o?l:l-d/2,width:a?u:u*2,height:o?d:d*2}))}var AA=[`onMouseEnter`,`onMouseLeave`,`onClick`],jA=[`value`,`background`,`tooltipPosition`],MA=[`id`],NA=[`onMouseEnter`,`onClick`,`onMouseLeave`];function PA(){return PA=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},PA.apply(null,arguments)}function FA(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function IA(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?FA(Object(n),!0).forEach(function(t){LA(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):FA(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function LA(e,t,n){return(t=RA(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function RA(e){var t=zA(e,`string`);return typeof t==`symbol`?t:t+``}function zA(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function BA(e,t){if(e==null)return{};var n,r,i=VA(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function VA(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}var HA=e=>{var{dataKey:t,name:n,fill:r,legendType:i,hide:a}=e;return[{inactive:a,dataKey:t,type:i,color:r,value:vs(n,t),payload:e}]};function UA(e){var{dataKey:t,stroke:n,strokeWidth:r,fill:i,name:a,hide:o,unit:s}=e;return{dataDefinedOnItem:void 0,positions:void 0,settings:{stroke:n,strokeWidth:r,fill:i,dataKey:t,nameKey:void 0,name:vs(a,t),hide:o,type:e.tooltipType,color:e.fill,unit:s}}}function WA(e){var t=I(Ax),{data:n,dataKey:r,background:i,allOtherBarProps:a}=e,{onMouseEnter:o,onMouseLeave:s,onClick:c}=a,l=BA(a,AA),u=AD(o,r),d=jD(s),f=MD(c,r);if(!i||n==null)return null;var p=M(i,!1);return A.createElement(A.Fragment,null,n.map((e,n)=>{var{value:a,background:o,tooltipPosition:s}=e,c=BA(e,jA);if(!o)return null;var m=u(e,n),h=d(e,n),g=f(e,n),_=IA(IA(IA(IA(IA({option:i,isActive:String(n)===t},c),{},{fill:`#eee`},o),p),le(l,e,n)),{},{onMouseEnter:m,onMouseLeave:h,onClick:g,dataKey:r,index:n,className:`recharts-bar-background-rectangle`});return A.createElement(mA,PA({key:`background-bar-${_.index}`},_))}))}function GA(e){var{showLabels:t,children:n,rects:r}=e,i=r?.map(e=>{var t={x:e.x,y:e.y,width:e.width,height:e.height};return IA(IA({},t),{},{value:e.value,payload:e.payload,parentViewBox:e.parentViewBox,viewBox:t,fill:e.fill})});return A.createElement(Ww,{value:t?i:void 0},n)}function KA(e){var{shape:t,activeBar:n,baseProps:r,entry:i,index:a,dataKey:o}=e,s=I(Ax),c=I(Mx),l=n&&String(a)===s&&(c==null||o===c),u=l?n:t;return A.createElement(mA,PA({},r,i,{isActive:l,option:u,index:a,dataKey:o}))}function qA(e){var{shape:t,baseProps:n,entry:r,index:i,dataKey:a}=e;return A.createElement(mA,PA({},n,r,{isActive:!1,option:t,index:i,dataKey:a}))}function JA(e){var{data:t,props:n}=e,r=j(n),{id:i}=r,a=BA(r,MA),{shape:o,dataKey:s,activeBar:c}=n,{onMouseEnter:l,onClick:u,onMouseLeave:d}=n,f=BA(n,NA),p=AD(l,s),m=jD(d),h=MD(u,s);return t?A.createElement(A.Fragment,null,t.map((e,t)=>A.createElement(N,PA({className:`recharts-bar-rectangle`},le(f,e,t),{onMouseEnter:p(e,t),onMouseLeave:m(e,t),onClick:h(e,t),key:`rectangle-${e?.x}-${e?.y}-${e?.value}-${t}`}),c?A.createElement(KA,{shape:o,activeBar:c,baseProps:a,entry:e,index:t,dataKey:s}):A.createElement(qA,{shape:o,baseProps:a,entry:e,index:t,dataKey:s})))):null}function YA(e){var{props:t,previousRectanglesRef:n}=e,{data:r,layout:i,isAnimationActive:a,animationBegin:o,animationDuration:s,animationEasing:c,onAnimationEnd:l,onAnimationStart:u}=t,d=n.current,f=uu(t,`recharts-bar-`),[p,m]=(0,A.useState)(!1),h=!p,g=(0,A.useCallback)(()=>{typeof l==`function`&&l(),m(!1)},[l]),_=(0,A.useCallback)(()=>{typeof u==`function`&&u(),m(!0)},[u]);return A.createElement(GA,{showLabels:h,rects:r},A.createElement(lu,{animationId:f,begin:o,duration:s,isActive:a,easing:c,onAnimationEnd:g,onAnimationStart:_,key:f},e=>{var a=e===1?r:r?.map((t,n)=>{var r=d&&d[n];if(r)return IA(IA({},t),{},{x:D(r.x,t.x,e),y:D(r.y,t.y,e),width:D(r.width,t.width,e),height:D(r.height,t.height,e)});if(i===`horizontal`){var a=D(0,t.height,e);return IA(IA({},t),{},{y:t.y+t.height-a,height:a})}var o=D(0,t.width,e);return IA(IA({},t),{},{width:o})});return e>0&&(n.current=a??null),a==null?null:A.createElement(N,null,A.createElement(JA,{props:t,data:a}))}),A.createElement(Xw,{label:t.label}),t.children)}function XA(e){var t=(0,A.useRef)(null);return A.createElement(YA,{previousRectanglesRef:t,props:e})}var ZA=0,QA=(e,t)=>{var n=Array.isArray(e.value)?e.value[1]:e.value;return{x:e.x,y:e.y,value:n,errorVal:z(e,t)}},$A=class extends A.PureComponent{render(){var{hide:e,data:t,dataKey:n,className:r,xAxisId:i,yAxisId:a,needClip:o,background:s,id:l}=this.props;if(e||t==null)return null;var u=c(`recharts-bar`,r),d=l;return A.createElement(N,{className:u,id:l},o&&A.createElement(`defs`,null,A.createElement(kA,{clipPathId:d,xAxisId:i,yAxisId:a})),A.createElement(N,{className:`recharts-bar-rectangles`,clipPath:o?`url(#clipPath-${d})`:void 0},A.createElement(WA,{data:t,dataKey:n,background:s,allOtherBarProps:this.props}),A.createElement(XA,this.props)))}},ej={activeBar:!1,animationBegin:0,animationDuration:400,animationEasing:`ease`,hide:!1,isAnimationActive:!qc.isSsr,legendType:`rect`,minPointSize:ZA,xAxisId:0,yAxisId:0};function tj(e){var{xAxisId:t,yAxisId:n,hide:r,legendType:i,minPointSize:a,activeBar:o,animationBegin:s,animationDuration:c,animationEasing:l,isAnimationActive:u}=e,{needClip:d}=OA(t,n),f=ec(),p=B(),m=ve(e.children,gC),h=I(r=>Pj(r,t,n,p,e.id,m));if(f!==`vertical`&&f!==`horizontal`)return null;var g,_=h?.[0];return g=_==null||_.height==null||_.width==null?0:f===`vertical`?_.height/2:_.width/2,A.createElement(TA,{xAxisId:t,yAxisId:n,data:h,dataPointFormatter:QA,errorBarOffset:g},A.createElement($A,PA({},e,{layout:f,needClip:d,data:h,xAxisId:t,yAxisId:n,hide:r,legendType:i,minPointSize:a,activeBar:o,animationBegin:s,animationDuration:c,animationEasing:l,isAnimationActive:u})))}function nj(e){var{layout:t,barSettings:{dataKey:n,minPointSize:r},pos:i,bandSize:a,xAxis:o,yAxis:s,xAxisTicks:c,yAxisTicks:l,stackedData:u,displayedData:d,offset:f,cells:p,parentViewBox:m}=e,h=t===`horizontal`?s:o,g=u?h.scale.domain():null,y=us({numericAxis:h});return d.map((e,d)=>{var h,b,x,S,C,w;u?h=ns(u[d],g):(h=z(e,n),Array.isArray(h)||(h=[y,h]));var T=hA(r,ZA)(h[1],d);if(t===`horizontal`){var[E,D]=[s.scale(h[0]),s.scale(h[1])];b=ls({axis:o,ticks:c,bandSize:a,offset:i.offset,entry:e,index:d}),x=D??E??void 0,S=i.size;var O=E-D;if(C=v(O)?0:O,w={x:b,y:f.top,width:S,height:f.height},Math.abs(T)>0&&Math.abs(C)<Math.abs(T)){var ee=_(C||T)*(Math.abs(T)-Math.abs(C));x-=ee,C+=ee}}else{var[k,te]=[o.scale(h[0]),o.scale(h[1])];if(b=k,x=ls({axis:s,ticks:l,bandSize:a,offset:i.offset,entry:e,index:d}),S=te-k,C=i.size,w={x:f.left,y:x,width:f.width,height:C},Math.abs(T)>0&&Math.abs(S)<Math.abs(T)){var ne=_(S||T)*(Math.abs(T)-Math.abs(S));S+=ne}}return b==null||x==null||S==null||C==null?null:IA(IA({},e),{},{x:b,y:x,width:S,height:C,value:u?h:h[1],payload:e,background:w,tooltipPosition:{x:b+S/2,y:x+C/2},parentViewBox:m},p&&p[d]&&p[d].props)}).filter(Boolean)}function rj(e){var t=H(e,ej),n=B();return A.createElement(BD,{id:t.id,type:`bar`},e=>A.createElement(A.Fragment,null,A.createElement(FD,{legendPayload:HA(t)}),A.createElement(ND,{fn:UA,args:t}),A.createElement(YD,{type:`bar`,id:e,data:void 0,xAxisId:t.xAxisId,yAxisId:t.yAxisId,zAxisId:0,dataKey:t.dataKey,stackId:ss(t.stackId),hide:t.hide,barSize:t.barSize,minPointSize:t.minPointSize,maxBarSize:t.maxBarSize,isPanorama:n}),A.createElement(tj,PA({},t,{id:e}))))}var ij=A.memo(rj);ij.displayName=`Bar`;function aj(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function oj(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?aj(Object(n),!0).forEach(function(t){sj(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):aj(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function sj(e,t,n){return(t=cj(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function cj(e){var t=lj(e,`string`);return typeof t==`symbol`?t:t+``}function lj(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}var uj=(e,t)=>t,dj=(e,t,n)=>n,fj=(e,t,n,r)=>r,pj=L([_v,(e,t,n,r,i)=>i],(e,t)=>e.filter(e=>e.type===`bar`).find(e=>e.id===t)),mj=L([pj],e=>e?.maxBarSize),hj=(e,t,n,r,i,a)=>a,gj=(e,t,n)=>{var r=n??e;if(!k(r))return w(r,t,0)},_j=L([V,_v,uj,dj,fj],(e,t,n,r,i)=>t.filter(t=>e===`horizontal`?t.xAxisId===n:t.yAxisId===r).filter(e=>e.isPanorama===i).filter(e=>e.hide===!1).filter(e=>e.type===`bar`)),vj=(e,t,n,r)=>V(e)===`horizontal`?Fv(e,`yAxis`,n,r):Fv(e,`xAxis`,t,r),yj=(e,t,n)=>V(e)===`horizontal`?qy(e,`xAxis`,t):qy(e,`yAxis`,n),bj=(e,t,n)=>{var r={},i=e.filter(Z_),a=e.filter(e=>e.stackId==null),o=i.reduce((e,t)=>(e[t.stackId]||(e[t.stackId]=[]),e[t.stackId].push(t),e),r),s=Object.entries(o).map(e=>{var[r,i]=e,a=i.map(e=>e.dataKey),o=gj(t,n,i[0].barSize);return{stackId:r,dataKeys:a,barSize:o}}),c=a.map(e=>{var r=[e.dataKey].filter(e=>e!=null),i=gj(t,n,e.barSize);return{stackId:void 0,dataKeys:r,barSize:i}});return[...s,...c]},xj=L([_j,b_,yj],bj),Sj=(e,t,n,r,i)=>{var a=pj(e,t,n,r,i);if(a!=null){var o=V(e),s=__(e),{maxBarSize:c}=a,l=k(c)?s:c,u,d;return o===`horizontal`?(u=rb(e,`xAxis`,t,r),d=nb(e,`xAxis`,t,r)):(u=rb(e,`yAxis`,n,r),d=nb(e,`yAxis`,n,r)),gs(u,d,!0)??l??0}},Cj=(e,t,n,r)=>{var i=V(e),a,o;return i===`horizontal`?(a=rb(e,`xAxis`,t,r),o=nb(e,`xAxis`,t,r)):(a=rb(e,`yAxis`,n,r),o=nb(e,`yAxis`,n,r)),gs(a,o)};function wj(e,t,n,r,i){var a=r.length;if(!(a<1)){var o=w(e,n,0,!0),s,c=[];if(Yc(r[0].barSize)){var l=!1,u=n/a,d=r.reduce((e,t)=>e+(t.barSize||0),0);d+=(a-1)*o,d>=n&&(d-=(a-1)*o,o=0),d>=n&&u>0&&(l=!0,u*=.9,d=a*u);var f={offset:((n-d)/2>>0)-o,size:0};s=r.reduce((e,t)=>{var n={stackId:t.stackId,dataKeys:t.dataKeys,position:{offset:f.offset+f.size+o,size:l?u:t.barSize??0}},r=[...e,n];return f=r[r.length-1].position,r},c)}else{var p=w(t,n,0,!0);n-2*p-(a-1)*o<=0&&(o=0);var m=(n-2*p-(a-1)*o)/a;m>1&&(m>>=0);var h=Yc(i)?Math.min(m,i):m;s=r.reduce((e,t,n)=>[...e,{stackId:t.stackId,dataKeys:t.dataKeys,position:{offset:p+(m+o)*n+(m-h)/2,size:h}}],c)}return s}}var Tj=(e,t,n,r,i,a,o)=>{var s=k(o)?t:o,c=wj(n,r,i===a?a:i,e,s);return i!==a&&c!=null&&(c=c.map(e=>oj(oj({},e),{},{position:oj(oj({},e.position),{},{offset:e.position.offset-i/2})}))),c},Ej=L([xj,__,v_,y_,Sj,Cj,mj],Tj),Dj=(e,t,n,r)=>rb(e,`xAxis`,t,r),Oj=(e,t,n,r)=>rb(e,`yAxis`,n,r),kj=(e,t,n,r)=>nb(e,`xAxis`,t,r),Aj=(e,t,n,r)=>nb(e,`yAxis`,n,r),jj=L([Ej,pj],(e,t)=>{if(!(e==null||t==null)){var n=e.find(e=>e.stackId===t.stackId&&t.dataKey!=null&&e.dataKeys.includes(t.dataKey));if(n!=null)return n.position}}),Mj=(e,t)=>{var n=G_(t);if(!(!e||n==null||t==null)){var{stackId:r}=t;if(r!=null){var i=e[r];if(i){var{stackedData:a}=i;if(a)return a.find(e=>e.key===n)}}}},Nj=L([vj,pj],Mj),Pj=L([Vs,Us,Dj,Oj,kj,Aj,jj,V,_g,Cj,Nj,pj,hj],(e,t,n,r,i,a,o,s,c,l,u,d,f)=>{var{chartData:p,dataStartIndex:m,dataEndIndex:h}=c;if(!(d==null||o==null||t==null||s!==`horizontal`&&s!==`vertical`||n==null||r==null||i==null||a==null||l==null)){var{data:g}=d,_=g!=null&&g.length>0?g:p?.slice(m,h+1);if(_!=null)return nj({layout:s,barSettings:d,pos:o,parentViewBox:t,bandSize:l,xAxis:n,yAxis:r,xAxisTicks:i,yAxisTicks:a,stackedData:u,displayedData:_,offset:e,cells:f})}});function Fj(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function Ij(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?Fj(Object(n),!0).forEach(function(t){Lj(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Fj(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function Lj(e,t,n){return(t=Rj(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Rj(e){var t=zj(e,`string`);return typeof t==`symbol`?t:t+``}function zj(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}var Bj=L([(e,t)=>P_(e,t),(e,t)=>ET(e,`radiusAxis`,t)],(e,t)=>{if(!(e==null||t==null))return Ij(Ij({},e),{},{scale:t})}),Vj=(e,t,n,r)=>kT(e,`radiusAxis`,t,r),Hj=L([(e,t,n)=>N_(e,n),(e,t,n)=>ET(e,`angleAxis`,n)],(e,t)=>{if(!(e==null||t==null))return Ij(Ij({},e),{},{scale:t})}),Uj=(e,t,n,r)=>OT(e,`angleAxis`,n,r),Wj=L([fT,(e,t,n,r)=>r],(e,t)=>{if(e.some(e=>e.type===`radialBar`&&t.dataKey===e.dataKey&&t.stackId===e.stackId))return t}),Gj=L([V,Bj,Vj,Hj,Uj],(e,t,n,r,i)=>Zo(e,`radiusAxis`)?gs(t,n,!1):gs(r,i,!1)),Kj=L([Hj,Bj,V],(e,t,n)=>{var r=n===`radial`?e:t;if(!(r==null||r.scale==null))return us({numericAxis:r})}),qj=(e,t,n,r,i)=>i,Jj=(e,t,n,r,i)=>n,Yj=(e,t,n,r,i)=>t,Xj=(e,t,n,r,i)=>r.maxBarSize,Zj=L([V,fT,Jj,Yj],(e,t,n,r)=>t.filter(t=>e===`centric`?t.angleAxisId===n:t.radiusAxisId===r).filter(e=>e.hide===!1).filter(e=>e.type===`radialBar`)),Qj=L([Zj,b_,()=>void 0],bj),$j=L([V,__,Hj,Uj,Bj,Vj,Xj],(e,t,n,r,i,a,o)=>{var s=k(o)?t:o;return e===`centric`?gs(n,r,!0)??s??0:gs(i,a,!0)??s??0}),eM=L([Qj,__,v_,y_,$j,Gj,Xj],Tj),tM=L([eM,Wj],(e,t)=>{if(!(e==null||t==null)){var n=e.find(e=>e.stackId===t.stackId&&t.dataKey!=null&&e.dataKeys.includes(t.dataKey));if(n!=null)return n.position}}),nM=L([mT],e=>e.filter(e=>e.type===`radialBar`).filter(Z_)),rM=L([nM,gg,J_],X_),iM=L([rM,nM,x_],Pv),aM=L([(e,t,n)=>V(e)===`centric`?iM(e,`radiusAxis`,t):iM(e,`angleAxis`,n),Wj],Mj),oM=L([Hj,Uj,Bj,Vj,hg,Wj,Gj,V,Kj,U_,qj,tM,aM],(e,t,n,r,i,a,o,s,c,l,u,d,f)=>{var{chartData:p,dataStartIndex:m,dataEndIndex:h}=i;if(a==null||n==null||e==null||p==null||o==null||d==null||s!==`centric`&&s!==`radial`||r==null)return[];var{dataKey:g,minPointSize:_}=a,{cx:v,cy:y,startAngle:b,endAngle:x}=l,S=p.slice(m,h+1),C=f?(s===`centric`?n:e).scale.domain():null;return kM({angleAxis:e,angleAxisTicks:t,bandSize:o,baseValue:c,cells:u,cx:v,cy:y,dataKey:g,dataStartIndex:m,displayedData:S,endAngle:x,layout:s,minPointSize:_,pos:d,radiusAxis:n,radiusAxisTicks:r,stackedData:f,stackedDomain:C,startAngle:b})}),sM=L([gg,(e,t)=>t],(e,t)=>{var{chartData:n,dataStartIndex:r,dataEndIndex:i}=e;if(n==null)return[];var a=n.slice(r,i+1);return a.length===0?[]:a.map(e=>({type:t,value:e.name,color:e.fill,payload:e}))}),cM=[`shape`,`activeShape`,`cornerRadius`,`id`],lM=[`onMouseEnter`,`onClick`,`onMouseLeave`],uM=[`value`,`background`];function dM(){return dM=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},dM.apply(null,arguments)}function fM(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function pM(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?fM(Object(n),!0).forEach(function(t){mM(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):fM(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function mM(e,t,n){return(t=hM(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function hM(e){var t=gM(e,`string`);return typeof t==`symbol`?t:t+``}function gM(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function _M(e,t){if(e==null)return{};var n,r,i=vM(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function vM(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}var yM=[];function bM(e){var{showLabels:t,sectors:n,children:r}=e,i=n.map(e=>({value:e.value,payload:e.payload,parentViewBox:void 0,clockWise:!1,viewBox:{cx:e.cx,cy:e.cy,innerRadius:e.innerRadius,outerRadius:e.outerRadius,startAngle:e.startAngle,endAngle:e.endAngle,clockWise:!1},fill:e.fill}));return A.createElement(Kw,{value:t?i:null},r)}function xM(e){var{sectors:t,allOtherRadialBarProps:n,showLabels:r}=e,{shape:i,activeShape:a,cornerRadius:o,id:s}=n,c=_M(n,cM),l=j(c),u=I(Ax),{onMouseEnter:d,onClick:f,onMouseLeave:p}=n,m=_M(n,lM),h=AD(d,n.dataKey),g=jD(p),_=MD(f,n.dataKey);return t==null?null:A.createElement(bM,{showLabels:r,sectors:t},t.map((e,t)=>{var n=a&&u===String(t),r=h(e,t),s=g(e,t),d=_(e,t),f=pM(pM(pM(pM({},l),{},{cornerRadius:Qk(o)},e),le(m,e,t)),{},{onMouseEnter:r,onMouseLeave:s,onClick:d,key:`sector-${t}`,className:`recharts-radial-bar-sector ${e.className}`,forceCornerRadius:c.forceCornerRadius,cornerIsExternal:c.cornerIsExternal,isActive:n,option:n?a:i});return A.createElement(eA,f)}),A.createElement(Xw,{label:n.label}),n.children)}function SM(e){var{props:t,previousSectorsRef:n}=e,{data:r,isAnimationActive:i,animationBegin:a,animationDuration:o,animationEasing:s,onAnimationEnd:c,onAnimationStart:l}=t,u=uu(t,`recharts-radialbar-`),d=n.current,[f,p]=(0,A.useState)(!1),m=(0,A.useCallback)(()=>{typeof c==`function`&&c(),p(!1)},[c]),h=(0,A.useCallback)(()=>{typeof l==`function`&&l(),p(!0)},[l]);return A.createElement(lu,{animationId:u,begin:a,duration:o,isActive:i,easing:s,onAnimationStart:h,onAnimationEnd:m,key:u},e=>{var i=e===1?r:(r??yM).map((t,n)=>{var r=d&&d[n];if(r){var i=E(r.startAngle,t.startAngle),a=E(r.endAngle,t.endAngle);return pM(pM({},t),{},{startAngle:i(e),endAngle:a(e)})}var{endAngle:o,startAngle:s}=t,c=E(s,o);return pM(pM({},t),{},{endAngle:c(e)})});return e>0&&(n.current=i??null),A.createElement(N,null,A.createElement(xM,{sectors:i??yM,allOtherRadialBarProps:t,showLabels:!f}))})}function CM(e){var t=(0,A.useRef)(null);return A.createElement(SM,{props:e,previousSectorsRef:t})}function wM(e){var t=I(t=>sM(t,e.legendType));return A.createElement(ID,{legendPayload:t??[]})}function TM(e){var{dataKey:t,data:n,stroke:r,strokeWidth:i,name:a,hide:o,fill:s,tooltipType:c}=e;return{dataDefinedOnItem:n,positions:void 0,settings:{stroke:r,strokeWidth:i,fill:s,nameKey:void 0,dataKey:t,name:vs(a,t),hide:o,type:c,color:s,unit:``}}}var EM=class extends A.PureComponent{renderBackground(e){if(e==null)return null;var{cornerRadius:t}=this.props,n=M(this.props.background,!1);return e.map((e,r)=>{var{value:i,background:a}=e,o=_M(e,uM);if(!a)return null;var s=pM(pM(pM(pM(pM({cornerRadius:Qk(t)},o),{},{fill:`#eee`},a),n),le(this.props,e,r)),{},{index:r,key:`sector-${r}`,className:c(`recharts-radial-bar-background-sector`,n?.className),option:a,isActive:!1});return A.createElement(eA,s)})}render(){var{hide:e,data:t,className:n,background:r}=this.props;if(e)return null;var i=c(`recharts-area`,n);return A.createElement(N,{className:i},r&&A.createElement(N,{className:`recharts-radial-bar-background`},this.renderBackground(t)),A.createElement(N,{className:`recharts-radial-bar-sectors`},A.createElement(CM,this.props)))}};function DM(e){var t=ve(e.children,gC),n={data:void 0,hide:!1,id:e.id,dataKey:e.dataKey,minPointSize:e.minPointSize,stackId:ss(e.stackId),maxBarSize:e.maxBarSize,barSize:e.barSize,type:`radialBar`,angleAxisId:e.angleAxisId,radiusAxisId:e.radiusAxisId},r=I(r=>oM(r,e.radiusAxisId,e.angleAxisId,n,t))??yM;return A.createElement(A.Fragment,null,A.createElement(ND,{fn:TM,args:pM(pM({},e),{},{data:r})}),A.createElement(EM,dM({},e,{data:r})))}var OM={angleAxisId:0,radiusAxisId:0,minPointSize:0,hide:!1,legendType:`rect`,data:[],isAnimationActive:!qc.isSsr,animationBegin:0,animationDuration:1500,animationEasing:`ease`,forceCornerRadius:!1,cornerIsExternal:!1};function kM(e){var{displayedData:t,stackedData:n,dataStartIndex:r,stackedDomain:i,dataKey:a,baseValue:o,layout:s,radiusAxis:c,radiusAxisTicks:l,bandSize:u,pos:d,angleAxis:f,minPointSize:p,cx:m,cy:h,angleAxisTicks:g,cells:v,startAngle:y,endAngle:b}=e;return(t??[]).map((e,t)=>{var x,S,C,w,T,E;if(n?x=ns(n[r+t],i):(x=z(e,a),Array.isArray(x)||(x=[o,x])),s===`radial`){S=ls({axis:c,ticks:l,bandSize:u,offset:d.offset,entry:e,index:t}),T=f.scale(x[1]),w=f.scale(x[0]),C=(S??0)+d.size;var D=T-w;if(Math.abs(p)>0&&Math.abs(D)<Math.abs(p)){var O=_(D||p)*(Math.abs(p)-Math.abs(D));T+=O}E={background:{cx:m,cy:h,innerRadius:S,outerRadius:C,startAngle:y,endAngle:b}}}else{S=c.scale(x[0]),C=c.scale(x[1]),w=ls({axis:f,ticks:g,bandSize:u,offset:d.offset,entry:e,index:t}),T=(w??0)+d.size;var ee=C-S;if(Math.abs(p)>0&&Math.abs(ee)<Math.abs(p)){var k=_(ee||p)*(Math.abs(p)-Math.abs(ee));C+=k}}return pM(pM(pM({},e),E),{},{payload:e,value:n?x:x[1],cx:m,cy:h,innerRadius:S,outerRadius:C,startAngle:w,endAngle:T},v&&v[t]&&v[t].props)})}var AM=class extends A.PureComponent{render(){return A.createElement(BD,{id:this.props.id,type:`radialBar`},e=>A.createElement(A.Fragment,null,A.createElement(XD,{type:`radialBar`,id:e,data:void 0,dataKey:this.props.dataKey,hide:this.props.hide??OM.hide,angleAxisId:this.props.angleAxisId??OM.angleAxisId,radiusAxisId:this.props.radiusAxisId??OM.radiusAxisId,stackId:ss(this.props.stackId),barSize:this.props.barSize,minPointSize:this.props.minPointSize,maxBarSize:this.props.maxBarSize}),A.createElement(wM,this.props),A.createElement(DM,dM({},this.props,{id:e}))))}};mM(AM,`displayName`,`RadialBar`),mM(AM,`defaultProps`,OM);function jM(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function MM(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?jM(Object(n),!0).forEach(function(t){NM(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):jM(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function NM(e,t,n){return(t=PM(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function PM(e){var t=FM(e,`string`);return typeof t==`symbol`?t:t+``}function FM(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}var IM=[`Webkit`,`Moz`,`O`,`ms`],LM=(e,t)=>{if(e){var n=e.replace(/(\w)/,e=>e.toUpperCase()),r=IM.reduce((e,r)=>MM(MM({},e),{},{[r+n]:t}),{});return r[e]=t,r}},RM=e=>{var{chartData:t}=e,n=F(),r=B();return(0,A.useEffect)(()=>r?()=>{}:(n(OS(t)),()=>{n(OS(void 0))}),[t,n,r]),null},zM=e=>{var{computedData:t}=e,n=F();return(0,A.useEffect)(()=>(n(AS(t)),()=>{n(OS(void 0))}),[t,n]),null},BM=e=>e.chartData.chartData,VM=()=>I(BM),HM=e=>{var{dataStartIndex:t,dataEndIndex:n}=e.chartData;return{startIndex:t,endIndex:n}},UM=()=>I(HM),WM=(0,A.createContext)(()=>{}),GM={x:0,y:0,width:0,height:0,padding:{top:0,right:0,bottom:0,left:0}},KM=Aa({name:`brush`,initialState:GM,reducers:{setBrushSettings(e,t){return t.payload==null?GM:t.payload}}}),{setBrushSettings:qM}=KM.actions,JM=KM.reducer,YM=e(Mu());function XM(){return XM=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},XM.apply(null,arguments)}function ZM(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function QM(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?ZM(Object(n),!0).forEach(function(t){$M(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):ZM(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function $M(e,t,n){return(t=eN(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function eN(e){var t=tN(e,`string`);return typeof t==`symbol`?t:t+``}function tN(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function nN(e){var{x:t,y:n,width:r,height:i,stroke:a}=e,o=Math.floor(n+i/2)-1;return A.createElement(A.Fragment,null,A.createElement(`rect`,{x:t,y:n,width:r,height:i,fill:a,stroke:`none`}),A.createElement(`line`,{x1:t+1,y1:o,x2:t+r-1,y2:o,fill:`none`,stroke:`#fff`}),A.createElement(`line`,{x1:t+1,y1:o+2,x2:t+r-1,y2:o+2,fill:`none`,stroke:`#fff`}))}function rN(e){var{travellerProps:t,travellerType:n}=e;return A.isValidElement(n)?A.cloneElement(n,t):typeof n==`function`?n(t):A.createElement(nN,t)}function iN(e){var{otherProps:t,travellerX:n,id:r,onMouseEnter:i,onMouseLeave:a,onMouseDown:o,onTouchStart:s,onTravellerMoveKeyboard:c,onFocus:l,onBlur:u}=e,{y:d,x:f,travellerWidth:p,height:m,traveller:h,ariaLabel:g,data:_,startIndex:v,endIndex:y}=t,b=Math.max(n,f),x=QM(QM({},j(t)),{},{x:b,y:d,width:p,height:m}),S=g||`Min value: ${_[v]?.name}, Max value: ${_[y]?.name}`;return A.createElement(N,{tabIndex:0,role:`slider`,"aria-label":S,"aria-valuenow":n,className:`recharts-brush-traveller`,onMouseEnter:i,onMouseLeave:a,onMouseDown:o,onTouchStart:s,onKeyDown:e=>{[`ArrowLeft`,`ArrowRight`].includes(e.key)&&(e.preventDefault(),e.stopPropagation(),c(e.key===`ArrowRight`?1:-1,r))},onFocus:l,onBlur:u,style:{cursor:`col-resize`}},A.createElement(rN,{travellerType:h,travellerProps:x}))}function aN(e){var{index:t,data:n,tickFormatter:r,dataKey:i}=e,a=z(n[t],i,t);return typeof r==`function`?r(a,t):a}function oN(e,t){for(var n=e.length,r=0,i=n-1;i-r>1;){var a=Math.floor((r+i)/2);e[a]>t?i=a:r=a}return t>=e[i]?i:r}function sN(e){var{startX:t,endX:n,scaleValues:r,gap:i,data:a}=e,o=a.length-1,s=Math.min(t,n),c=Math.max(t,n),l=oN(r,s),u=oN(r,c);return{startIndex:l-l%i,endIndex:u===o?o:u-u%i}}function cN(e){var{x:t,y:n,width:r,height:i,fill:a,stroke:o}=e;return A.createElement(`rect`,{stroke:o,fill:a,x:t,y:n,width:r,height:i})}function lN(e){var{startIndex:t,endIndex:n,y:r,height:i,travellerWidth:a,stroke:o,tickFormatter:s,dataKey:c,data:l,startX:u,endX:d}=e,f=5,p={pointerEvents:`none`,fill:o};return A.createElement(N,{className:`recharts-brush-texts`},A.createElement(aw,XM({textAnchor:`end`,verticalAnchor:`middle`,x:Math.min(u,d)-f,y:r+i/2},p),aN({index:t,tickFormatter:s,dataKey:c,data:l})),A.createElement(aw,XM({textAnchor:`start`,verticalAnchor:`middle`,x:Math.max(u,d)+a+f,y:r+i/2},p),aN({index:n,tickFormatter:s,dataKey:c,data:l})))}function uN(e){var{y:t,height:n,stroke:r,travellerWidth:i,startX:a,endX:o,onMouseEnter:s,onMouseLeave:c,onMouseDown:l,onTouchStart:u}=e,d=Math.min(a,o)+i,f=Math.max(Math.abs(o-a)-i,0);return A.createElement(`rect`,{className:`recharts-brush-slide`,onMouseEnter:s,onMouseLeave:c,onMouseDown:l,onTouchStart:u,style:{cursor:`move`},stroke:`none`,fill:r,fillOpacity:.2,x:d,y:t,width:f,height:n})}function dN(e){var{x:t,y:n,width:r,height:i,data:a,children:o,padding:s}=e;if(A.Children.count(o)!==1)return null;var c=A.Children.only(o);return c?A.cloneElement(c,{x:t,y:n,width:r,height:i,margin:s,compact:!0,data:a}):null}var fN=e=>{var{data:t,startIndex:n,endIndex:r,x:i,width:a,travellerWidth:o}=e;if(!t||!t.length)return{};var s=t.length,c=hd().domain((0,YM.default)(0,s)).range([i,i+a-o]),l=c.domain().map(e=>c(e));return{isTextActive:!1,isSlideMoving:!1,isTravellerMoving:!1,isTravellerFocused:!1,startX:c(n),endX:c(r),scale:c,scaleValues:l}},pN=e=>e.changedTouches&&!!e.changedTouches.length,mN=class extends A.PureComponent{constructor(e){super(e),$M(this,`handleDrag`,e=>{this.leaveTimer&&=(clearTimeout(this.leaveTimer),null),this.state.isTravellerMoving?this.handleTravellerMove(e):this.state.isSlideMoving&&this.handleSlideDrag(e)}),$M(this,`handleTouchMove`,e=>{e.changedTouches!=null&&e.changedTouches.length>0&&this.handleDrag(e.changedTouches[0])}),$M(this,`handleDragEnd`,()=>{this.setState({isTravellerMoving:!1,isSlideMoving:!1},()=>{var{endIndex:e,onDragEnd:t,startIndex:n}=this.props;t?.({endIndex:e,startIndex:n})}),this.detachDragEndListener()}),$M(this,`handleLeaveWrapper`,()=>{(this.state.isTravellerMoving||this.state.isSlideMoving)&&(this.leaveTimer=window.setTimeout(this.handleDragEnd,this.props.leaveTimeOut))}),$M(this,`handleEnterSlideOrTraveller`,()=>{this.setState({isTextActive:!0})}),$M(this,`handleLeaveSlideOrTraveller`,()=>{this.setState({isTextActive:!1})}),$M(this,`handleSlideDragStart`,e=>{var t=pN(e)?e.changedTouches[0]:e;this.setState({isTravellerMoving:!1,isSlideMoving:!0,slideMoveStartX:t.pageX}),this.attachDragEndListener()}),$M(this,`handleTravellerMoveKeyboard`,(e,t)=>{var{data:n,gap:r,startIndex:i,endIndex:a}=this.props,{scaleValues:o,startX:s,endX:c}=this.state;if(o!=null){var l=-1;if(t===`startX`?l=i:t===`endX`&&(l=a),!(l<0||l>=n.length)){var u=l+e;if(!(u===-1||u>=o.length)){var d=o[u];t===`startX`&&d>=c||t===`endX`&&d<=s||this.setState({[t]:d},()=>{this.props.onChange(sN({startX:this.state.startX,endX:this.state.endX,data:n,gap:r,scaleValues:o}))})}}}}),this.travellerDragStartHandlers={startX:this.handleTravellerDragStart.bind(this,`startX`),endX:this.handleTravellerDragStart.bind(this,`endX`)},this.state={brushMoveStartX:0,movingTravellerId:void 0,endX:0,startX:0,slideMoveStartX:0}}static getDerivedStateFromProps(e,t){var{data:n,width:r,x:i,travellerWidth:a,startIndex:o,endIndex:s,startIndexControlledFromProps:c,endIndexControlledFromProps:l}=e;if(n!==t.prevData)return QM({prevData:n,prevTravellerWidth:a,prevX:i,prevWidth:r},n&&n.length?fN({data:n,width:r,x:i,travellerWidth:a,startIndex:o,endIndex:s}):{scale:void 0,scaleValues:void 0});var u=t.scale;if(u&&(r!==t.prevWidth||i!==t.prevX||a!==t.prevTravellerWidth)){u.range([i,i+r-a]);var d=u.domain().map(e=>u(e)).filter(e=>e!=null);return{prevData:n,prevTravellerWidth:a,prevX:i,prevWidth:r,startX:u(e.startIndex),endX:u(e.endIndex),scaleValues:d}}if(t.scale&&!t.isSlideMoving&&!t.isTravellerMoving&&!t.isTravellerFocused&&!t.isTextActive){if(c!=null&&t.prevStartIndexControlledFromProps!==c)return{startX:t.scale(c),prevStartIndexControlledFromProps:c};if(l!=null&&t.prevEndIndexControlledFromProps!==l)return{endX:t.scale(l),prevEndIndexControlledFromProps:l}}return null}componentWillUnmount(){this.leaveTimer&&=(clearTimeout(this.leaveTimer),null),this.detachDragEndListener()}attachDragEndListener(){window.addEventListener(`mouseup`,this.handleDragEnd,!0),window.addEventListener(`touchend`,this.handleDragEnd,!0),window.addEventListener(`mousemove`,this.handleDrag,!0)}detachDragEndListener(){window.removeEventListener(`mouseup`,this.handleDragEnd,!0),window.removeEventListener(`touchend`,this.handleDragEnd,!0),window.removeEventListener(`mousemove`,this.handleDrag,!0)}handleSlideDrag(e){var{slideMoveStartX:t,startX:n,endX:r,scaleValues:i}=this.state;if(i!=null){var{x:a,width:o,travellerWidth:s,startIndex:c,endIndex:l,onChange:u,data:d,gap:f}=this.props,p=e.pageX-t;p>0?p=Math.min(p,a+o-s-r,a+o-s-n):p<0&&(p=Math.max(p,a-n,a-r));var m=sN({startX:n+p,endX:r+p,data:d,gap:f,scaleValues:i});(m.startIndex!==c||m.endIndex!==l)&&u&&u(m),this.setState({startX:n+p,endX:r+p,slideMoveStartX:e.pageX})}}handleTravellerDragStart(e,t){var n=pN(t)?t.changedTouches[0]:t;this.setState({isSlideMoving:!1,isTravellerMoving:!0,movingTravellerId:e,brushMoveStartX:n.pageX}),this.attachDragEndListener()}handleTravellerMove(e){var{brushMoveStartX:t,movingTravellerId:n,endX:r,startX:i,scaleValues:a}=this.state;if(n!=null){var o=this.state[n],{x:s,width:c,travellerWidth:l,onChange:u,gap:d,data:f}=this.props,p={startX:this.state.startX,endX:this.state.endX,data:f,gap:d,scaleValues:a},m=e.pageX-t;m>0?m=Math.min(m,s+c-l-o):m<0&&(m=Math.max(m,s-o)),p[n]=o+m;var h=sN(p),{startIndex:g,endIndex:_}=h,v=()=>{var e=f.length-1;return n===`startX`&&(r>i?g%d===0:_%d===0)||r<i&&_===e||n===`endX`&&(r>i?_%d===0:g%d===0)||r>i&&_===e};this.setState({[n]:o+m,brushMoveStartX:e.pageX},()=>{u&&v()&&u(h)})}}render(){var{data:e,className:t,children:n,x:r,y:i,dy:a,width:o,height:s,alwaysShowText:l,fill:u,stroke:d,startIndex:f,endIndex:p,travellerWidth:m,tickFormatter:h,dataKey:g,padding:_}=this.props,{startX:v,endX:y,isTextActive:x,isSlideMoving:S,isTravellerMoving:C,isTravellerFocused:w}=this.state;if(!e||!e.length||!b(r)||!b(i)||!b(o)||!b(s)||o<=0||s<=0)return null;var T=c(`recharts-brush`,t),E=LM(`userSelect`,`none`),D=i+(a??0);return A.createElement(N,{className:T,onMouseLeave:this.handleLeaveWrapper,onTouchMove:this.handleTouchMove,style:E},A.createElement(cN,{x:r,y:D,width:o,height:s,fill:u,stroke:d}),A.createElement(Gs,null,A.createElement(dN,{x:r,y:D,width:o,height:s,data:e,padding:_},n)),A.createElement(uN,{y:D,height:s,stroke:d,travellerWidth:m,startX:v,endX:y,onMouseEnter:this.handleEnterSlideOrTraveller,onMouseLeave:this.handleLeaveSlideOrTraveller,onMouseDown:this.handleSlideDragStart,onTouchStart:this.handleSlideDragStart}),A.createElement(iN,{travellerX:v,id:`startX`,otherProps:QM(QM({},this.props),{},{y:D}),onMouseEnter:this.handleEnterSlideOrTraveller,onMouseLeave:this.handleLeaveSlideOrTraveller,onMouseDown:this.travellerDragStartHandlers.startX,onTouchStart:this.travellerDragStartHandlers.startX,onTravellerMoveKeyboard:this.handleTravellerMoveKeyboard,onFocus:()=>{this.setState({isTravellerFocused:!0})},onBlur:()=>{this.setState({isTravellerFocused:!1})}}),A.createElement(iN,{travellerX:y,id:`endX`,otherProps:QM(QM({},this.props),{},{y:D}),onMouseEnter:this.handleEnterSlideOrTraveller,onMouseLeave:this.handleLeaveSlideOrTraveller,onMouseDown:this.travellerDragStartHandlers.endX,onTouchStart:this.travellerDragStartHandlers.endX,onTravellerMoveKeyboard:this.handleTravellerMoveKeyboard,onFocus:()=>{this.setState({isTravellerFocused:!0})},onBlur:()=>{this.setState({isTravellerFocused:!1})}}),(x||S||C||w||l)&&A.createElement(lN,{startIndex:f,endIndex:p,y:D,height:s,travellerWidth:m,stroke:d,tickFormatter:h,dataKey:g,data:e,startX:v,endX:y}))}};function hN(e){var t=F(),n=VM(),r=UM(),i=(0,A.useContext)(WM),a=e.onChange,{startIndex:o,endIndex:s}=e;(0,A.useEffect)(()=>{t(kS({startIndex:o,endIndex:s}))},[t,s,o]),GS();var c=(0,A.useCallback)(e=>{if(r!=null){var{startIndex:n,endIndex:o}=r;(e.startIndex!==n||e.endIndex!==o)&&(i?.(e),a?.(e),t(kS(e)))}},[a,i,t,r]),l=I(qs);if(l==null||r==null||n==null||!n.length)return null;var{startIndex:u,endIndex:d}=r,{x:f,y:p,width:m}=l,h={data:n,x:f,y:p,width:m,startIndex:u,endIndex:d,onChange:c};return A.createElement(mN,XM({},e,h,{startIndexControlledFromProps:o??void 0,endIndexControlledFromProps:s??void 0}))}function gN(e){var t=F();return(0,A.useEffect)(()=>(t(qM(e)),()=>{t(qM(null))}),[t,e]),null}var _N={height:40,travellerWidth:5,gap:1,fill:`#fff`,stroke:`#666`,padding:{top:1,right:1,bottom:1,left:1},leaveTimeOut:1e3,alwaysShowText:!1};function vN(e){var t=H(e,_N);return A.createElement(A.Fragment,null,A.createElement(gN,{height:t.height,x:t.x,y:t.y,width:t.width,padding:t.padding}),A.createElement(hN,t))}vN.displayName=`Brush`;function yN(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function bN(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?yN(Object(n),!0).forEach(function(t){xN(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):yN(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function xN(e,t,n){return(t=SN(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function SN(e){var t=CN(e,`string`);return typeof t==`symbol`?t:t+``}function CN(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}var wN=(e,t)=>{var{x:n,y:r}=e,{x:i,y:a}=t;return{x:Math.min(n,i),y:Math.min(r,a),width:Math.abs(i-n),height:Math.abs(a-r)}},TN=e=>{var{x1:t,y1:n,x2:r,y2:i}=e;return wN({x:t,y:n},{x:r,y:i})},EN=class e{static create(t){return new e(t)}constructor(e){this.scale=e}get domain(){return this.scale.domain}get range(){return this.scale.range}get rangeMin(){return this.range()[0]}get rangeMax(){return this.range()[1]}get bandwidth(){return this.scale.bandwidth}apply(e){var{bandAware:t,position:n}=arguments.length>1&&arguments[1]!==void 0?arguments[1]:{};if(e!==void 0){if(n)switch(n){case`start`:return this.scale(e);case`middle`:var r=this.bandwidth?this.bandwidth()/2:0;return this.scale(e)+r;case`end`:var i=this.bandwidth?this.bandwidth():0;return this.scale(e)+i;default:return this.scale(e)}if(t){var a=this.bandwidth?this.bandwidth()/2:0;return this.scale(e)+a}return this.scale(e)}}isInRange(e){var t=this.range(),n=t[0],r=t[t.length-1];return n<=r?e>=n&&e<=r:e>=r&&e<=n}};xN(EN,`EPS`,1e-4);var DN=e=>{var t=Object.keys(e).reduce((t,n)=>bN(bN({},t),{},{[n]:EN.create(e[n])}),{});return bN(bN({},t),{},{apply(e){var{bandAware:n,position:r}=arguments.length>1&&arguments[1]!==void 0?arguments[1]:{};return Object.fromEntries(Object.entries(e).map(e=>{var[i,a]=e;return[i,t[i].apply(a,{bandAware:n,position:r})]}))},isInRange(e){return Object.keys(e).every(n=>t[n].isInRange(e[n]))}})};function ON(e){return(e%180+180)%180}var kN=function(e){var{width:t,height:n}=e,r=arguments.length>1&&arguments[1]!==void 0?arguments[1]:0,i=ON(r)*Math.PI/180,a=Math.atan(n/t),o=i>a&&i<Math.PI-a?n/Math.sin(i):t/Math.cos(i);return Math.abs(o)},AN=Aa({name:`referenceElements`,initialState:{dots:[],areas:[],lines:[]},reducers:{addDot:(e,t)=>{e.dots.push(t.payload)},removeDot:(e,t)=>{var n=ta(e).dots.findIndex(e=>e===t.payload);n!==-1&&e.dots.splice(n,1)},addArea:(e,t)=>{e.areas.push(t.payload)},removeArea:(e,t)=>{var n=ta(e).areas.findIndex(e=>e===t.payload);n!==-1&&e.areas.splice(n,1)},addLine:(e,t)=>{e.lines.push(t.payload)},removeLine:(e,t)=>{var n=ta(e).lines.findIndex(e=>e===t.payload);n!==-1&&e.lines.splice(n,1)}}}),{addDot:jN,removeDot:MN,addArea:NN,removeArea:PN,addLine:FN,removeLine:IN}=AN.actions,LN=AN.reducer,RN=(0,A.createContext)(void 0),zN=e=>{var{children:t}=e,[n]=(0,A.useState)(`${C(`recharts`)}-clip`),r=KO();if(r==null)return null;var{x:i,y:a,width:o,height:s}=r;return A.createElement(RN.Provider,{value:n},A.createElement(`defs`,null,A.createElement(`clipPath`,{id:n},A.createElement(`rect`,{x:i,y:a,height:s,width:o}))),t)},BN=()=>(0,A.useContext)(RN);function VN(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function HN(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?VN(Object(n),!0).forEach(function(t){UN(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):VN(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function UN(e,t,n){return(t=WN(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function WN(e){var t=GN(e,`string`);return typeof t==`symbol`?t:t+``}function GN(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function KN(){return KN=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},KN.apply(null,arguments)}var qN=(e,t)=>A.isValidElement(e)?A.cloneElement(e,t):typeof e==`function`?e(t):A.createElement(`line`,KN({},t,{className:`recharts-reference-line-line`})),JN=(e,t,n,r,i,a,o,s,c)=>{var{x:l,y:u,width:d,height:f}=i;if(n){var{y:p}=c,m=e.y.apply(p,{position:a});if(v(m)||c.ifOverflow===`discard`&&!e.y.isInRange(m))return null;var h=[{x:l+d,y:m},{x:l,y:m}];return s===`left`?h.reverse():h}if(t){var{x:g}=c,_=e.x.apply(g,{position:a});if(v(_)||c.ifOverflow===`discard`&&!e.x.isInRange(_))return null;var y=[{x:_,y:u+f},{x:_,y:u}];return o===`top`?y.reverse():y}if(r){var{segment:b}=c,x=b.map(t=>e.apply(t,{position:a}));return c.ifOverflow===`discard`&&x.some(t=>!e.isInRange(t))?null:x}return null};function YN(e){var t=F();return(0,A.useEffect)(()=>(t(FN(e)),()=>{t(IN(e))})),null}function XN(e){var{x:t,y:n,segment:r,xAxisId:i,yAxisId:a,shape:o,className:s,ifOverflow:l}=e,u=B(),d=BN(),f=I(e=>sv(e,i)),p=I(e=>uv(e,a)),m=I(e=>jy(e,`xAxis`,i,u)),h=I(e=>jy(e,`yAxis`,a,u)),g=Js(),_=x(t),v=x(n);if(!d||!g||f==null||p==null||m==null||h==null)return null;var y=DN({x:m,y:h}),b=r&&r.length===2,S=JN(y,_,v,b,g,e.position,f.orientation,p.orientation,e);if(!S)return null;var[{x:C,y:w},{x:T,y:E}]=S,D=l===`hidden`?`url(#${d})`:void 0,O=HN(HN({clipPath:D},M(e,!0)),{},{x1:C,y1:w,x2:T,y2:E});return A.createElement(N,{className:c(`recharts-reference-line`,s)},qN(o,O),A.createElement(hw,TN({x1:C,y1:w,x2:T,y2:E}),A.createElement(Aw,{label:e.label}),e.children))}function ZN(e){return A.createElement(A.Fragment,null,A.createElement(YN,{yAxisId:e.yAxisId,xAxisId:e.xAxisId,ifOverflow:e.ifOverflow,x:e.x,y:e.y}),A.createElement(XN,e))}var QN=class extends A.Component{render(){return A.createElement(ZN,this.props)}};UN(QN,`displayName`,`ReferenceLine`),UN(QN,`defaultProps`,{ifOverflow:`discard`,xAxisId:0,yAxisId:0,fill:`none`,stroke:`#ccc`,fillOpacity:1,strokeWidth:1,position:`middle`});function $N(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function eP(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?$N(Object(n),!0).forEach(function(t){tP(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):$N(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function tP(e,t,n){return(t=nP(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function nP(e){var t=rP(e,`string`);return typeof t==`symbol`?t:t+``}function rP(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function iP(){return iP=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},iP.apply(null,arguments)}var aP=(e,t,n,r,i)=>{var a=x(e),o=x(t),s=B(),c=I(e=>jy(e,`xAxis`,n,s)),l=I(e=>jy(e,`yAxis`,r,s));if(!a||!o||c==null||l==null)return null;var u=DN({x:c,y:l}),d=u.apply({x:e,y:t},{bandAware:!0});return i===`discard`&&!u.isInRange(d)?null:d};function oP(e){var t=F();return(0,A.useEffect)(()=>(t(jN(e)),()=>{t(MN(e))})),null}var sP=(e,t)=>A.isValidElement(e)?A.cloneElement(e,t):typeof e==`function`?e(t):A.createElement(dT,iP({},t,{cx:t.cx,cy:t.cy,className:`recharts-reference-dot-dot`}));function cP(e){var{x:t,y:n,r}=e,i=BN(),a=aP(t,n,e.xAxisId,e.yAxisId,e.ifOverflow);if(!a)return null;var{x:o,y:s}=a,{shape:l,className:u,ifOverflow:d}=e,f=d===`hidden`?`url(#${i})`:void 0,p=eP(eP({clipPath:f},M(e,!0)),{},{cx:o,cy:s});return A.createElement(N,{className:c(`recharts-reference-dot`,u)},sP(l,p),A.createElement(hw,{x:o-r,y:s-r,width:2*r,height:2*r},A.createElement(Aw,{label:e.label}),e.children))}function lP(e){var{x:t,y:n,r,ifOverflow:i,yAxisId:a,xAxisId:o}=e;return A.createElement(A.Fragment,null,A.createElement(oP,{y:n,x:t,r,yAxisId:a,xAxisId:o,ifOverflow:i}),A.createElement(cP,e))}var uP=class extends A.Component{render(){return A.createElement(lP,this.props)}};tP(uP,`displayName`,`ReferenceDot`),tP(uP,`defaultProps`,{ifOverflow:`discard`,xAxisId:0,yAxisId:0,r:10,fill:`#fff`,stroke:`#ccc`,fillOpacity:1,strokeWidth:1});function dP(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function fP(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?dP(Object(n),!0).forEach(function(t){pP(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):dP(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function pP(e,t,n){return(t=mP(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function mP(e){var t=hP(e,`string`);return typeof t==`symbol`?t:t+``}function hP(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function gP(){return gP=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},gP.apply(null,arguments)}var _P=(e,t,n,r,i,a,o)=>{var{x1:s,x2:c,y1:l,y2:u}=o;if(i==null||a==null)return null;var d=DN({x:i,y:a}),f={x:e?d.x.apply(s,{position:`start`}):d.x.rangeMin,y:n?d.y.apply(l,{position:`start`}):d.y.rangeMin},p={x:t?d.x.apply(c,{position:`end`}):d.x.rangeMax,y:r?d.y.apply(u,{position:`end`}):d.y.rangeMax};return o.ifOverflow===`discard`&&(!d.isInRange(f)||!d.isInRange(p))?null:wN(f,p)},vP=(e,t)=>A.isValidElement(e)?A.cloneElement(e,t):typeof e==`function`?e(t):A.createElement(yu,gP({},t,{className:`recharts-reference-area-rect`}));function yP(e){var t=F();return(0,A.useEffect)(()=>(t(NN(e)),()=>{t(PN(e))})),null}function bP(e){var{x1:t,x2:n,y1:r,y2:i,className:a,shape:o,xAxisId:s,yAxisId:l}=e,u=BN(),d=B(),f=I(e=>jy(e,`xAxis`,s,d)),p=I(e=>jy(e,`yAxis`,l,d));if(f==null||!p==null)return null;var m=x(t),h=x(n),g=x(r),_=x(i);if(!m&&!h&&!g&&!_&&!o)return null;var v=_P(m,h,g,_,f,p,e);if(!v&&!o)return null;var y=e.ifOverflow===`hidden`?`url(#${u})`:void 0;return A.createElement(N,{className:c(`recharts-reference-area`,a)},vP(o,fP(fP({clipPath:y},M(e,!0)),v)),A.createElement(hw,v,A.createElement(Aw,{label:e.label}),e.children))}function xP(e){return A.createElement(A.Fragment,null,A.createElement(yP,{yAxisId:e.yAxisId,xAxisId:e.xAxisId,ifOverflow:e.ifOverflow,x1:e.x1,x2:e.x2,y1:e.y1,y2:e.y2}),A.createElement(bP,e))}var SP=class extends A.Component{render(){return A.createElement(xP,this.props)}};pP(SP,`displayName`,`ReferenceArea`),pP(SP,`defaultProps`,{ifOverflow:`discard`,xAxisId:0,yAxisId:0,r:10,fill:`#ccc`,fillOpacity:.5,stroke:`none`,strokeWidth:1});function CP(e,t){for(var n in e)if({}.hasOwnProperty.call(e,n)&&(!{}.hasOwnProperty.call(t,n)||e[n]!==t[n]))return!1;for(var r in t)if({}.hasOwnProperty.call(t,r)&&!{}.hasOwnProperty.call(e,r))return!1;return!0}function wP(e,t,n){if(t<1)return[];if(t===1&&n===void 0)return e;for(var r=[],i=0;i<e.length;i+=t)if(n===void 0||n(e[i])===!0)r.push(e[i]);else return;return r}function TP(e,t,n){var r={width:e.width+t.width,height:e.height+t.height};return kN(r,n)}function EP(e,t,n){var r=n===`width`,{x:i,y:a,width:o,height:s}=e;return t===1?{start:r?i:a,end:r?i+o:a+s}:{start:r?i+o:a+s,end:r?i:a}}function DP(e,t,n,r,i){if(e*t<e*r||e*t>e*i)return!1;var a=n();return e*(t-e*a/2-r)>=0&&e*(t+e*a/2-i)<=0}function OP(e,t){return wP(e,t+1)}function kP(e,t,n,r,i){for(var a=(r||[]).slice(),{start:o,end:s}=t,c=0,l=1,u=o,d=function(){var t=r?.[c];if(t===void 0)return{v:wP(r,l)};var a=c,d,f=()=>(d===void 0&&(d=n(t,a)),d),p=t.coordinate,m=c===0||DP(e,p,f,u,s);m||(c=0,u=o,l+=1),m&&(u=p+e*(f()/2+i),c+=l)},f;l<=a.length;)if(f=d(),f)return f.v;return[]}function AP(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function jP(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?AP(Object(n),!0).forEach(function(t){MP(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):AP(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function MP(e,t,n){return(t=NP(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function NP(e){var t=PP(e,`string`);return typeof t==`symbol`?t:t+``}function PP(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function FP(e,t,n,r,i){for(var a=(r||[]).slice(),o=a.length,{start:s}=t,{end:c}=t,l=function(t){var r=a[t],l,u=()=>(l===void 0&&(l=n(r,t)),l);if(t===o-1){var d=e*(r.coordinate+e*u()/2-c);a[t]=r=jP(jP({},r),{},{tickCoord:d>0?r.coordinate-d*e:r.coordinate})}else a[t]=r=jP(jP({},r),{},{tickCoord:r.coordinate});DP(e,r.tickCoord,u,s,c)&&(c=r.tickCoord-e*(u()/2+i),a[t]=jP(jP({},r),{},{isShow:!0}))},u=o-1;u>=0;u--)l(u);return a}function IP(e,t,n,r,i,a){var o=(r||[]).slice(),s=o.length,{start:c,end:l}=t;if(a){var u=r[s-1],d=n(u,s-1),f=e*(u.coordinate+e*d/2-l);o[s-1]=u=jP(jP({},u),{},{tickCoord:f>0?u.coordinate-f*e:u.coordinate}),DP(e,u.tickCoord,()=>d,c,l)&&(l=u.tickCoord-e*(d/2+i),o[s-1]=jP(jP({},u),{},{isShow:!0}))}for(var p=a?s-1:s,m=function(t){var r=o[t],a,s=()=>(a===void 0&&(a=n(r,t)),a);if(t===0){var u=e*(r.coordinate-e*s()/2-c);o[t]=r=jP(jP({},r),{},{tickCoord:u<0?r.coordinate-u*e:r.coordinate})}else o[t]=r=jP(jP({},r),{},{tickCoord:r.coordinate});DP(e,r.tickCoord,s,c,l)&&(c=r.tickCoord+e*(s()/2+i),o[t]=jP(jP({},r),{},{isShow:!0}))},h=0;h<p;h++)m(h);return o}function LP(e,t,n){var{tick:r,ticks:i,viewBox:a,minTickGap:o,orientation:s,interval:c,tickFormatter:l,unit:u,angle:d}=e;if(!i||!i.length||!r)return[];if(b(c)||qc.isSsr)return OP(i,b(c)?c:0)??[];var f=[],p=s===`top`||s===`bottom`?`width`:`height`,m=u&&p===`width`?MC(u,{fontSize:t,letterSpacing:n}):{width:0,height:0},h=(e,r)=>{var i=typeof l==`function`?l(e.value,r):e.value;return p===`width`?TP(MC(i,{fontSize:t,letterSpacing:n}),m,d):MC(i,{fontSize:t,letterSpacing:n})[p]},g=i.length>=2?_(i[1].coordinate-i[0].coordinate):1,v=EP(a,g,p);return c===`equidistantPreserveStart`?kP(g,v,h,i,o):(f=c===`preserveStart`||c===`preserveStartEnd`?IP(g,v,h,i,o,c===`preserveStartEnd`):FP(g,v,h,i,o),f.filter(e=>e.isShow))}var RP=e=>{var{ticks:t,label:n,labelGapWithTick:r=5,tickSize:i=0,tickMargin:a=0}=e,o=0;if(t){t.forEach(e=>{if(e){var t=e.getBoundingClientRect();t.width>o&&(o=t.width)}});var s=n?n.getBoundingClientRect().width:0,c=i+a,l=o+c+s+(n?r:0);return Math.round(l)}return 0},zP=e(h()),BP=[`axisLine`,`width`,`height`,`className`,`hide`,`ticks`],VP=[`viewBox`],HP=[`viewBox`];function UP(e,t){if(e==null)return{};var n,r,i=WP(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function WP(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}function GP(){return GP=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},GP.apply(null,arguments)}function KP(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function qP(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?KP(Object(n),!0).forEach(function(t){JP(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):KP(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function JP(e,t,n){return(t=YP(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function YP(e){var t=XP(e,`string`);return typeof t==`symbol`?t:t+``}function XP(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}var ZP={x:0,y:0,width:0,height:0,viewBox:{x:0,y:0,width:0,height:0},orientation:`bottom`,ticks:[],stroke:`#666`,tickLine:!0,axisLine:!0,tick:!0,mirror:!1,minTickGap:5,tickSize:6,tickMargin:2,interval:`preserveEnd`};function QP(e){var{x:t,y:n,width:r,height:i,orientation:a,mirror:o,axisLine:s,otherSvgProps:l}=e;if(!s)return null;var u=qP(qP(qP({},l),M(s,!1)),{},{fill:`none`});if(a===`top`||a===`bottom`){var d=+(a===`top`&&!o||a===`bottom`&&o);u=qP(qP({},u),{},{x1:t,y1:n+d*i,x2:t+r,y2:n+d*i})}else{var f=+(a===`left`&&!o||a===`right`&&o);u=qP(qP({},u),{},{x1:t+f*r,y1:n,x2:t+f*r,y2:n+i})}return A.createElement(`line`,GP({},u,{className:c(`recharts-cartesian-axis-line`,(0,zP.default)(s,`className`))}))}function $P(e,t,n,r,i,a,o,s,c){var l,u,d,f,p,m,h=s?-1:1,g=e.tickSize||o,_=b(e.tickCoord)?e.tickCoord:e.coordinate;switch(a){case`top`:l=u=e.coordinate,f=n+ +!s*i,d=f-h*g,m=d-h*c,p=_;break;case`left`:d=f=e.coordinate,u=t+ +!s*r,l=u-h*g,p=l-h*c,m=_;break;case`right`:d=f=e.coordinate,u=t+ +s*r,l=u+h*g,p=l+h*c,m=_;break;default:l=u=e.coordinate,f=n+ +s*i,d=f+h*g,m=d+h*c,p=_;break}return{line:{x1:l,y1:d,x2:u,y2:f},tick:{x:p,y:m}}}function eF(e,t){switch(e){case`left`:return t?`start`:`end`;case`right`:return t?`end`:`start`;default:return`middle`}}function tF(e,t){switch(e){case`left`:case`right`:return`middle`;case`top`:return t?`start`:`end`;default:return t?`end`:`start`}}function nF(e){var{option:t,tickProps:n,value:r}=e,i,a=c(n.className,`recharts-cartesian-axis-tick-value`);if(A.isValidElement(t))i=A.cloneElement(t,qP(qP({},n),{},{className:a}));else if(typeof t==`function`)i=t(qP(qP({},n),{},{className:a}));else{var o=`recharts-cartesian-axis-tick-value`;typeof t!=`boolean`&&(o=c(o,t?.className)),i=A.createElement(aw,GP({},n,{className:o}),r)}return i}function rF(e){var{ticks:t=[],tick:n,tickLine:r,stroke:i,tickFormatter:a,unit:o,padding:s,tickTextProps:l,orientation:u,mirror:d,x:f,y:p,width:m,height:h,tickSize:g,tickMargin:_,fontSize:v,letterSpacing:y,getTicksConfig:b,events:x}=e,S=LP(qP(qP({},b),{},{ticks:t}),v,y),C=eF(u,d),w=tF(u,d),T=j(b),E=M(n,!1),D=qP(qP({},T),{},{fill:`none`},M(r,!1)),O=S.map((e,t)=>{var{line:v,tick:y}=$P(e,f,p,m,h,u,g,d,_),b=qP(qP(qP(qP({textAnchor:C,verticalAnchor:w},T),{},{stroke:`none`,fill:i},E),y),{},{index:t,payload:e,visibleTicksCount:S.length,tickFormatter:a,padding:s},l);return A.createElement(N,GP({className:`recharts-cartesian-axis-tick`,key:`tick-${e.value}-${e.coordinate}-${e.tickCoord}`},le(x,e,t)),r&&A.createElement(`line`,GP({},D,v,{className:c(`recharts-cartesian-axis-tick-line`,(0,zP.default)(r,`className`))})),n&&A.createElement(nF,{option:n,tickProps:b,value:`${typeof a==`function`?a(e.value,t):e.value}${o||``}`}))});return O.length>0?A.createElement(`g`,{className:`recharts-cartesian-axis-ticks`},O):null}var iF=(0,A.forwardRef)((e,t)=>{var{axisLine:n,width:r,height:i,className:a,hide:o,ticks:s}=e,l=UP(e,BP),[u,d]=(0,A.useState)(``),[f,p]=(0,A.useState)(``),m=(0,A.useRef)([]);(0,A.useImperativeHandle)(t,()=>({getCalculatedWidth:()=>RP({ticks:m.current,label:e.labelRef?.current,labelGapWithTick:5,tickSize:e.tickSize,tickMargin:e.tickMargin})}));var h=(0,A.useCallback)(e=>{if(e){var t=e.getElementsByClassName(`recharts-cartesian-axis-tick-value`);m.current=Array.from(t);var n=t[0];if(n){var r=window.getComputedStyle(n),i=r.fontSize,a=r.letterSpacing;(i!==u||a!==f)&&(d(i),p(a))}}},[u,f]);return o||r!=null&&r<=0||i!=null&&i<=0?null:A.createElement(N,{className:c(`recharts-cartesian-axis`,a),ref:h},A.createElement(QP,{x:e.x,y:e.y,width:r,height:i,orientation:e.orientation,mirror:e.mirror,axisLine:n,otherSvgProps:j(e)}),A.createElement(rF,{ticks:s,tick:e.tick,tickLine:e.tickLine,stroke:e.stroke,tickFormatter:e.tickFormatter,unit:e.unit,padding:e.padding,tickTextProps:e.tickTextProps,orientation:e.orientation,mirror:e.mirror,x:e.x,y:e.y,width:e.width,height:e.height,tickSize:e.tickSize,tickMargin:e.tickMargin,fontSize:u,letterSpacing:f,getTicksConfig:e,events:l}),A.createElement(hw,{x:e.x,y:e.y,width:e.width,height:e.height},A.createElement(Aw,{label:e.label}),e.children))}),aF=A.memo(iF,(e,t)=>{var{viewBox:n}=e,r=UP(e,VP),{viewBox:i}=t,a=UP(t,HP);return CP(n,i)&&CP(r,a)}),oF=A.forwardRef((e,t)=>{var n=H(e,ZP);return A.createElement(aF,GP({},n,{ref:t}))});oF.displayName=`CartesianAxis`;var sF=[`x1`,`y1`,`x2`,`y2`,`key`],cF=[`offset`],lF=[`xAxisId`,`yAxisId`],uF=[`xAxisId`,`yAxisId`];function dF(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function fF(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?dF(Object(n),!0).forEach(function(t){pF(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):dF(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function pF(e,t,n){return(t=mF(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function mF(e){var t=hF(e,`string`);return typeof t==`symbol`?t:t+``}function hF(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function gF(){return gF=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},gF.apply(null,arguments)}function _F(e,t){if(e==null)return{};var n,r,i=vF(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function vF(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}var yF=e=>{var{fill:t}=e;if(!t||t===`none`)return null;var{fillOpacity:n,x:r,y:i,width:a,height:o,ry:s}=e;return A.createElement(`rect`,{x:r,y:i,ry:s,width:a,height:o,stroke:`none`,fill:t,fillOpacity:n,className:`recharts-cartesian-grid-bg`})};function bF(e,t){var n;if(A.isValidElement(e))n=A.cloneElement(e,t);else if(typeof e==`function`)n=e(t);else{var{x1:r,y1:i,x2:a,y2:o,key:s}=t,c=_F(t,sF),l=j(c),{offset:u}=l,d=_F(l,cF);n=A.createElement(`line`,gF({},d,{x1:r,y1:i,x2:a,y2:o,fill:`none`,key:s}))}return n}function xF(e){var{x:t,width:n,horizontal:r=!0,horizontalPoints:i}=e;if(!r||!i||!i.length)return null;var{xAxisId:a,yAxisId:o}=e,s=_F(e,lF),c=i.map((e,i)=>{var a=fF(fF({},s),{},{x1:t,y1:e,x2:t+n,y2:e,key:`line-${i}`,index:i});return bF(r,a)});return A.createElement(`g`,{className:`recharts-cartesian-grid-horizontal`},c)}function SF(e){var{y:t,height:n,vertical:r=!0,verticalPoints:i}=e;if(!r||!i||!i.length)return null;var{xAxisId:a,yAxisId:o}=e,s=_F(e,uF),c=i.map((e,i)=>{var a=fF(fF({},s),{},{x1:e,y1:t,x2:e,y2:t+n,key:`line-${i}`,index:i});return bF(r,a)});return A.createElement(`g`,{className:`recharts-cartesian-grid-vertical`},c)}function CF(e){var{horizontalFill:t,fillOpacity:n,x:r,y:i,width:a,height:o,horizontalPoints:s,horizontal:c=!0}=e;if(!c||!t||!t.length)return null;var l=s.map(e=>Math.round(e+i-i)).sort((e,t)=>e-t);i!==l[0]&&l.unshift(0);var u=l.map((e,s)=>{var c=l[s+1]?l[s+1]-e:i+o-e;if(c<=0)return null;var u=s%t.length;return A.createElement(`rect`,{key:`react-${s}`,y:e,x:r,height:c,width:a,stroke:`none`,fill:t[u],fillOpacity:n,className:`recharts-cartesian-grid-bg`})});return A.createElement(`g`,{className:`recharts-cartesian-gridstripes-horizontal`},u)}function wF(e){var{vertical:t=!0,verticalFill:n,fillOpacity:r,x:i,y:a,width:o,height:s,verticalPoints:c}=e;if(!t||!n||!n.length)return null;var l=c.map(e=>Math.round(e+i-i)).sort((e,t)=>e-t);i!==l[0]&&l.unshift(0);var u=l.map((e,t)=>{var c=l[t+1]?l[t+1]-e:i+o-e;if(c<=0)return null;var u=t%n.length;return A.createElement(`rect`,{key:`react-${t}`,x:e,y:a,width:c,height:s,stroke:`none`,fill:n[u],fillOpacity:r,className:`recharts-cartesian-grid-bg`})});return A.createElement(`g`,{className:`recharts-cartesian-gridstripes-vertical`},u)}var TF=(e,t)=>{var{xAxis:n,width:r,height:i,offset:a}=e;return Qo(LP(fF(fF(fF({},ZP),n),{},{ticks:$o(n,!0),viewBox:{x:0,y:0,width:r,height:i}})),a.left,a.left+a.width,t)},EF=(e,t)=>{var{yAxis:n,width:r,height:i,offset:a}=e;return Qo(LP(fF(fF(fF({},ZP),n),{},{ticks:$o(n,!0),viewBox:{x:0,y:0,width:r,height:i}})),a.top,a.top+a.height,t)},DF={horizontal:!0,vertical:!0,horizontalPoints:[],verticalPoints:[],stroke:`#ccc`,fill:`none`,verticalFill:[],horizontalFill:[],xAxisId:0,yAxisId:0};function OF(e){var t=Zs(),n=Qs(),r=Xs(),i=fF(fF({},H(e,DF)),{},{x:b(e.x)?e.x:r.left,y:b(e.y)?e.y:r.top,width:b(e.width)?e.width:r.width,height:b(e.height)?e.height:r.height}),{xAxisId:a,yAxisId:o,x:s,y:c,width:l,height:u,syncWithTicks:d,horizontalValues:f,verticalValues:p}=i,m=B(),h=I(e=>Qy(e,`xAxis`,a,m)),g=I(e=>Qy(e,`yAxis`,o,m));if(!b(l)||l<=0||!b(u)||u<=0||!b(s)||s!==+s||!b(c)||c!==+c)return null;var _=i.verticalCoordinatesGenerator||TF,v=i.horizontalCoordinatesGenerator||EF,{horizontalPoints:y,verticalPoints:x}=i;if((!y||!y.length)&&typeof v==`function`){var S=f&&f.length,C=v({yAxis:g?fF(fF({},g),{},{ticks:S?f:g.ticks}):void 0,width:t,height:n,offset:r},S?!0:d);cC(Array.isArray(C),`horizontalCoordinatesGenerator should return Array but instead it returned [${typeof C}]`),Array.isArray(C)&&(y=C)}if((!x||!x.length)&&typeof _==`function`){var w=p&&p.length,T=_({xAxis:h?fF(fF({},h),{},{ticks:w?p:h.ticks}):void 0,width:t,height:n,offset:r},w?!0:d);cC(Array.isArray(T),`verticalCoordinatesGenerator should return Array but instead it returned [${typeof T}]`),Array.isArray(T)&&(x=T)}return A.createElement(`g`,{className:`recharts-cartesian-grid`},A.createElement(yF,{fill:i.fill,fillOpacity:i.fillOpacity,x:i.x,y:i.y,width:i.width,height:i.height,ry:i.ry}),A.createElement(CF,gF({},i,{horizontalPoints:y})),A.createElement(wF,gF({},i,{verticalPoints:x})),A.createElement(xF,gF({},i,{offset:r,horizontalPoints:y,xAxis:h,yAxis:g})),A.createElement(SF,gF({},i,{offset:r,verticalPoints:x,xAxis:h,yAxis:g})))}OF.displayName=`CartesianGrid`;var kF=(e,t,n,r)=>rb(e,`xAxis`,t,r),AF=(e,t,n,r)=>nb(e,`xAxis`,t,r),jF=(e,t,n,r)=>rb(e,`yAxis`,n,r),MF=(e,t,n,r)=>nb(e,`yAxis`,n,r),NF=L([V,kF,jF,AF,MF],(e,t,n,r,i)=>Zo(e,`xAxis`)?gs(t,r,!1):gs(n,i,!1)),PF=(e,t,n,r,i)=>i;function FF(e){return e.type===`line`}var IF=L([_v,PF],(e,t)=>e.filter(FF).find(e=>e.id===t)),LF=L([V,kF,jF,AF,MF,IF,NF,_g],(e,t,n,r,i,a,o,s)=>{var{chartData:c,dataStartIndex:l,dataEndIndex:u}=s;if(!(a==null||t==null||n==null||r==null||i==null||r.length===0||i.length===0||o==null)){var{dataKey:d,data:f}=a,p=f!=null&&f.length>0?f:c?.slice(l,u+1);if(p!=null)return fI({layout:e,xAxis:t,yAxis:n,xAxisTicks:r,yAxisTicks:i,dataKey:d,bandSize:o,displayedData:p})}}),RF=[`id`],zF=[`type`,`layout`,`connectNulls`,`needClip`],BF=[`activeDot`,`animateNewValues`,`animationBegin`,`animationDuration`,`animationEasing`,`connectNulls`,`dot`,`hide`,`isAnimationActive`,`label`,`legendType`,`xAxisId`,`yAxisId`,`id`];function VF(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function HF(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?VF(Object(n),!0).forEach(function(t){UF(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):VF(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function UF(e,t,n){return(t=WF(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function WF(e){var t=GF(e,`string`);return typeof t==`symbol`?t:t+``}function GF(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function KF(e,t){if(e==null)return{};var n,r,i=qF(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function qF(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}function JF(){return JF=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},JF.apply(null,arguments)}var YF=e=>{var{dataKey:t,name:n,stroke:r,legendType:i,hide:a}=e;return[{inactive:a,dataKey:t,type:i,color:r,value:vs(n,t),payload:e}]};function XF(e){var{dataKey:t,data:n,stroke:r,strokeWidth:i,fill:a,name:o,hide:s,unit:c}=e;return{dataDefinedOnItem:n,positions:void 0,settings:{stroke:r,strokeWidth:i,fill:a,dataKey:t,nameKey:void 0,name:vs(o,t),hide:s,type:e.tooltipType,color:e.stroke,unit:c}}}var ZF=(e,t)=>`${t}px ${e-t}px`;function QF(e,t){for(var n=e.length%2==0?e:[...e,0],r=[],i=0;i<t;++i)r=[...r,...n];return r}var $F=(e,t,n)=>{var r=n.reduce((e,t)=>e+t);if(!r)return ZF(t,e);for(var i=Math.floor(e/r),a=e%r,o=t-e,s=[],c=0,l=0;c<n.length;l+=n[c],++c)if(l+n[c]>a){s=[...n.slice(0,c),a-l];break}var u=s.length%2==0?[0,o]:[o];return[...QF(n,i),...s,...u].map(e=>`${e}px`).join(`, `)};function eI(e,t){var n;if(A.isValidElement(e))n=A.cloneElement(e,t);else if(typeof e==`function`)n=e(t);else{var r=c(`recharts-line-dot`,typeof e==`boolean`?``:e.className);n=A.createElement(dT,JF({},t,{className:r}))}return n}function tI(e,t){return e==null?!1:t?!0:e.length===1}function nI(e){var{clipPathId:t,points:n,props:r}=e,{dot:i,dataKey:a,needClip:o}=r;if(!tI(n,i))return null;var{id:s}=r,c=KF(r,RF),l=ye(i),u=j(c),d=M(i,!0),f=n.map((e,t)=>{var r=HF(HF(HF({key:`dot-${t}`,r:3},u),d),{},{index:t,cx:e.x,cy:e.y,dataKey:a,value:e.value,payload:e.payload,points:n});return eI(i,r)}),p={clipPath:o?`url(#clipPath-${l?``:`dots-`}${t})`:void 0};return A.createElement(N,JF({className:`recharts-line-dots`,key:`dots`},p),f)}function rI(e){var{showLabels:t,children:n,points:r}=e,i=(0,A.useMemo)(()=>r?.map(e=>{var t={x:e.x,y:e.y,width:0,height:0};return HF(HF({},t),{},{value:e.value,payload:e.payload,viewBox:t,parentViewBox:void 0,fill:void 0})}),[r]);return A.createElement(Ww,{value:t?i:null},n)}function iI(e){var{clipPathId:t,pathRef:n,points:r,strokeDasharray:i,props:a}=e,{type:o,layout:s,connectNulls:c,needClip:l}=a,u=KF(a,zF),d=HF(HF({},M(u,!0)),{},{fill:`none`,className:`recharts-line-curve`,clipPath:l?`url(#clipPath-${t})`:void 0,points:r,type:o,layout:s,connectNulls:c,strokeDasharray:i??a.strokeDasharray});return A.createElement(A.Fragment,null,r?.length>1&&A.createElement(ll,JF({},d,{pathRef:n})),A.createElement(nI,{points:r,clipPathId:t,props:a}))}function aI(e){try{return e&&e.getTotalLength&&e.getTotalLength()||0}catch{return 0}}function oI(e){var{clipPathId:t,props:n,pathRef:r,previousPointsRef:i,longestAnimatedLengthRef:a}=e,{points:o,strokeDasharray:s,isAnimationActive:c,animationBegin:l,animationDuration:u,animationEasing:d,animateNewValues:f,width:p,height:m,onAnimationEnd:h,onAnimationStart:g}=n,_=i.current,v=uu(n,`recharts-line-`),[y,b]=(0,A.useState)(!1),x=!y,S=(0,A.useCallback)(()=>{typeof h==`function`&&h(),b(!1)},[h]),C=(0,A.useCallback)(()=>{typeof g==`function`&&g(),b(!0)},[g]),w=aI(r.current),T=a.current;return A.createElement(rI,{points:o,showLabels:x},n.children,A.createElement(lu,{animationId:v,begin:l,duration:u,isActive:c,easing:d,onAnimationEnd:S,onAnimationStart:C,key:v},e=>{var l=D(T,w+T,e),u=Math.min(l,w),d;if(c)if(s){var h=`${s}`.split(/[,\s]+/gim).map(e=>parseFloat(e));d=$F(u,w,h)}else d=ZF(w,u);else d=s==null?void 0:String(s);if(_){var g=_.length/o.length,v=e===1?o:o.map((t,n)=>{var r=Math.floor(n*g);if(_[r]){var i=_[r];return HF(HF({},t),{},{x:D(i.x,t.x,e),y:D(i.y,t.y,e)})}return f?HF(HF({},t),{},{x:D(p*2,t.x,e),y:D(m/2,t.y,e)}):HF(HF({},t),{},{x:t.x,y:t.y})});return i.current=v,A.createElement(iI,{props:n,points:v,clipPathId:t,pathRef:r,strokeDasharray:d})}return e>0&&w>0&&(i.current=o,a.current=u),A.createElement(iI,{props:n,points:o,clipPathId:t,pathRef:r,strokeDasharray:d})}),A.createElement(Xw,{label:n.label}))}function sI(e){var{clipPathId:t,props:n}=e,r=(0,A.useRef)(null),i=(0,A.useRef)(0),a=(0,A.useRef)(null);return A.createElement(oI,{props:n,clipPathId:t,previousPointsRef:r,longestAnimatedLengthRef:i,pathRef:a})}var cI=(e,t)=>({x:e.x,y:e.y,value:e.value,errorVal:z(e.payload,t)}),lI=class extends A.Component{render(){var{hide:e,dot:t,points:n,className:r,xAxisId:i,yAxisId:a,top:o,left:s,width:l,height:u,id:d,needClip:f}=this.props;if(e)return null;var p=c(`recharts-line`,r),m=d,{r:h=3,strokeWidth:g=2}=M(t,!1)??{r:3,strokeWidth:2},_=ye(t),v=h*2+g;return A.createElement(A.Fragment,null,A.createElement(N,{className:p},f&&A.createElement(`defs`,null,A.createElement(kA,{clipPathId:m,xAxisId:i,yAxisId:a}),!_&&A.createElement(`clipPath`,{id:`clipPath-dots-${m}`},A.createElement(`rect`,{x:s-v/2,y:o-v/2,width:l+v,height:u+v}))),A.createElement(TA,{xAxisId:i,yAxisId:a,data:n,dataPointFormatter:cI,errorBarOffset:0},A.createElement(sI,{props:this.props,clipPathId:m}))),A.createElement(nk,{activeDot:this.props.activeDot,points:n,mainColor:this.props.stroke,itemDataKey:this.props.dataKey}))}},uI={activeDot:!0,animateNewValues:!0,animationBegin:0,animationDuration:1500,animationEasing:`ease`,connectNulls:!1,dot:!0,fill:`#fff`,hide:!1,isAnimationActive:!qc.isSsr,label:!1,legendType:`line`,stroke:`#3182bd`,strokeWidth:1,xAxisId:0,yAxisId:0};function dI(e){var t=H(e,uI),{activeDot:n,animateNewValues:r,animationBegin:i,animationDuration:a,animationEasing:o,connectNulls:s,dot:c,hide:l,isAnimationActive:u,label:d,legendType:f,xAxisId:p,yAxisId:m,id:h}=t,g=KF(t,BF),{needClip:_}=OA(p,m),v=KO(),y=ec(),b=B(),x=I(e=>LF(e,p,m,b,h));if(y!==`horizontal`&&y!==`vertical`||x==null||v==null)return null;var{height:S,width:C,x:w,y:T}=v;return A.createElement(lI,JF({},g,{id:h,connectNulls:s,dot:c,activeDot:n,animateNewValues:r,animationBegin:i,animationDuration:a,animationEasing:o,isAnimationActive:u,hide:l,label:d,legendType:f,xAxisId:p,yAxisId:m,points:x,layout:y,height:S,width:C,left:w,top:T,needClip:_}))}function fI(e){var{layout:t,xAxis:n,yAxis:r,xAxisTicks:i,yAxisTicks:a,dataKey:o,bandSize:s,displayedData:c}=e;return c.map((e,c)=>{var l=z(e,o);if(t===`horizontal`){var u=cs({axis:n,ticks:i,bandSize:s,entry:e,index:c}),d=k(l)?null:r.scale(l);return{x:u,y:d,value:l,payload:e}}var f=k(l)?null:n.scale(l),p=cs({axis:r,ticks:a,bandSize:s,entry:e,index:c});return f==null||p==null?null:{x:f,y:p,value:l,payload:e}}).filter(Boolean)}function pI(e){var t=H(e,uI),n=B();return A.createElement(BD,{id:t.id,type:`line`},e=>A.createElement(A.Fragment,null,A.createElement(FD,{legendPayload:YF(t)}),A.createElement(ND,{fn:XF,args:t}),A.createElement(YD,{type:`line`,id:e,data:t.data,xAxisId:t.xAxisId,yAxisId:t.yAxisId,zAxisId:0,dataKey:t.dataKey,hide:t.hide,isPanorama:n}),A.createElement(dI,JF({},t,{id:e}))))}var mI=A.memo(pI);mI.displayName=`Line`;var hI=(e,t,n,r)=>rb(e,`xAxis`,t,r),gI=(e,t,n,r)=>nb(e,`xAxis`,t,r),_I=(e,t,n,r)=>rb(e,`yAxis`,n,r),vI=(e,t,n,r)=>nb(e,`yAxis`,n,r),yI=L([V,hI,_I,gI,vI],(e,t,n,r,i)=>Zo(e,`xAxis`)?gs(t,r,!1):gs(n,i,!1)),bI=L([_v,(e,t,n,r,i)=>i],(e,t)=>e.filter(e=>e.type===`area`).find(e=>e.id===t)),xI=L([V,hI,_I,gI,vI,(e,t,n,r,i)=>{var a=bI(e,t,n,r,i);if(a!=null){var o=V(e),s=Zo(o,`xAxis`),c=s?Fv(e,`yAxis`,n,r):Fv(e,`xAxis`,t,r);if(c!=null){var{stackId:l}=a,u=G_(a);if(!(l==null||u==null))return(c[l]?.stackedData)?.find(e=>e.key===u)}}},_g,yI,bI],(e,t,n,r,i,a,o,s,c)=>{var{chartData:l,dataStartIndex:u,dataEndIndex:d}=o;if(!(c==null||e!==`horizontal`&&e!==`vertical`||t==null||n==null||r==null||i==null||r.length===0||i.length===0||s==null)){var{data:f}=c,p=f&&f.length>0?f:l?.slice(u,d+1);if(p!=null)return YI({layout:e,xAxis:t,yAxis:n,xAxisTicks:r,yAxisTicks:i,dataStartIndex:u,areaSettings:c,stackedData:a,displayedData:p,chartBaseValue:void 0,bandSize:s})}}),SI=[`id`],CI=[`activeDot`,`animationBegin`,`animationDuration`,`animationEasing`,`connectNulls`,`dot`,`fill`,`fillOpacity`,`hide`,`isAnimationActive`,`legendType`,`stroke`,`xAxisId`,`yAxisId`];function wI(e,t){if(e==null)return{};var n,r,i=TI(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function TI(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}function EI(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function DI(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?EI(Object(n),!0).forEach(function(t){OI(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):EI(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function OI(e,t,n){return(t=kI(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function kI(e){var t=AI(e,`string`);return typeof t==`symbol`?t:t+``}function AI(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function jI(){return jI=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},jI.apply(null,arguments)}function MI(e,t){return e&&e!==`none`?e:t}var NI=e=>{var{dataKey:t,name:n,stroke:r,fill:i,legendType:a,hide:o}=e;return[{inactive:o,dataKey:t,type:a,color:MI(r,i),value:vs(n,t),payload:e}]};function PI(e){var{dataKey:t,data:n,stroke:r,strokeWidth:i,fill:a,name:o,hide:s,unit:c}=e;return{dataDefinedOnItem:n,positions:void 0,settings:{stroke:r,strokeWidth:i,fill:a,dataKey:t,nameKey:void 0,name:vs(o,t),hide:s,type:e.tooltipType,color:MI(r,a),unit:c}}}var FI=(e,t)=>{var n;if(A.isValidElement(e))n=A.cloneElement(e,t);else if(typeof e==`function`)n=e(t);else{var r=c(`recharts-area-dot`,typeof e==`boolean`?``:e.className);n=A.createElement(dT,jI({},t,{className:r}))}return n};function II(e,t){return e==null?!1:t?!0:e.length===1}function LI(e){var{clipPathId:t,points:n,props:r}=e,{needClip:i,dot:a,dataKey:o}=r;if(!II(n,a))return null;var s=ye(a),c=j(r),l=M(a,!0),u=n.map((e,t)=>{var r=DI(DI(DI({key:`dot-${t}`,r:3},c),l),{},{index:t,cx:e.x,cy:e.y,dataKey:o,value:e.value,payload:e.payload,points:n});return FI(a,r)}),d={clipPath:i?`url(#clipPath-${s?``:`dots-`}${t})`:void 0};return A.createElement(N,jI({className:`recharts-area-dots`},d),u)}function RI(e){var{showLabels:t,children:n,points:r}=e,i=r.map(e=>{var t={x:e.x,y:e.y,width:0,height:0};return DI(DI({},t),{},{value:e.value,payload:e.payload,parentViewBox:void 0,viewBox:t,fill:void 0})});return A.createElement(Ww,{value:t?i:null},n)}function zI(e){var{points:t,baseLine:n,needClip:r,clipPathId:i,props:a}=e,{layout:o,type:s,stroke:c,connectNulls:l,isRange:u}=a,{id:d}=a,f=wI(a,SI),p=j(f);return A.createElement(A.Fragment,null,t?.length>1&&A.createElement(N,{clipPath:r?`url(#clipPath-${i})`:void 0},A.createElement(ll,jI({},p,{id:d,points:t,connectNulls:l,type:s,baseLine:n,layout:o,stroke:`none`,className:`recharts-area-area`})),c!==`none`&&A.createElement(ll,jI({},p,{className:`recharts-area-curve`,layout:o,type:s,connectNulls:l,fill:`none`,points:t})),c!==`none`&&u&&A.createElement(ll,jI({},p,{className:`recharts-area-curve`,layout:o,type:s,connectNulls:l,fill:`none`,points:n}))),A.createElement(LI,{points:t,props:f,clipPathId:i}))}function BI(e){var{alpha:t,baseLine:n,points:r,strokeWidth:i}=e,a=r[0].y,o=r[r.length-1].y;if(!Yc(a)||!Yc(o))return null;var s=t*Math.abs(a-o),c=Math.max(...r.map(e=>e.x||0));return b(n)?c=Math.max(n,c):n&&Array.isArray(n)&&n.length&&(c=Math.max(...n.map(e=>e.x||0),c)),b(c)?A.createElement(`rect`,{x:0,y:a<o?a:a-s,width:c+(i?parseInt(`${i}`,10):1),height:Math.floor(s)}):null}function VI(e){var{alpha:t,baseLine:n,points:r,strokeWidth:i}=e,a=r[0].x,o=r[r.length-1].x;if(!Yc(a)||!Yc(o))return null;var s=t*Math.abs(a-o),c=Math.max(...r.map(e=>e.y||0));return b(n)?c=Math.max(n,c):n&&Array.isArray(n)&&n.length&&(c=Math.max(...n.map(e=>e.y||0),c)),b(c)?A.createElement(`rect`,{x:a<o?a:a-s,y:0,width:s,height:Math.floor(c+(i?parseInt(`${i}`,10):1))}):null}function HI(e){var{alpha:t,layout:n,points:r,baseLine:i,strokeWidth:a}=e;return n===`vertical`?A.createElement(BI,{alpha:t,points:r,baseLine:i,strokeWidth:a}):A.createElement(VI,{alpha:t,points:r,baseLine:i,strokeWidth:a})}function UI(e){var{needClip:t,clipPathId:n,props:r,previousPointsRef:i,previousBaselineRef:a}=e,{points:o,baseLine:s,isAnimationActive:c,animationBegin:l,animationDuration:u,animationEasing:d,onAnimationStart:f,onAnimationEnd:p}=r,m=uu(r,`recharts-area-`),[h,g]=(0,A.useState)(!1),_=!h,y=(0,A.useCallback)(()=>{typeof p==`function`&&p(),g(!1)},[p]),x=(0,A.useCallback)(()=>{typeof f==`function`&&f(),g(!0)},[f]),S=i.current,C=a.current;return A.createElement(RI,{showLabels:_,points:o},r.children,A.createElement(lu,{animationId:m,begin:l,duration:u,isActive:c,easing:d,onAnimationEnd:y,onAnimationStart:x,key:m},e=>{if(S){var l=S.length/o.length,u=e===1?o:o.map((t,n)=>{var r=Math.floor(n*l);if(S[r]){var i=S[r];return DI(DI({},t),{},{x:D(i.x,t.x,e),y:D(i.y,t.y,e)})}return t}),d=b(s)?D(C,s,e):k(s)||v(s)?D(C,0,e):s.map((t,n)=>{var r=Math.floor(n*l);if(Array.isArray(C)&&C[r]){var i=C[r];return DI(DI({},t),{},{x:D(i.x,t.x,e),y:D(i.y,t.y,e)})}return t});return e>0&&(i.current=u,a.current=d),A.createElement(zI,{points:u,baseLine:d,needClip:t,clipPathId:n,props:r})}return e>0&&(i.current=o,a.current=s),A.createElement(N,null,c&&A.createElement(`defs`,null,A.createElement(`clipPath`,{id:`animationClipPath-${n}`},A.createElement(HI,{alpha:e,points:o,baseLine:s,layout:r.layout,strokeWidth:r.strokeWidth}))),A.createElement(N,{clipPath:`url(#animationClipPath-${n})`},A.createElement(zI,{points:o,baseLine:s,needClip:t,clipPathId:n,props:r})))}),A.createElement(Xw,{label:r.label}))}function WI(e){var{needClip:t,clipPathId:n,props:r}=e,i=(0,A.useRef)(null),a=(0,A.useRef)();return A.createElement(UI,{needClip:t,clipPathId:n,props:r,previousPointsRef:i,previousBaselineRef:a})}var GI=class extends A.PureComponent{render(){var{hide:e,dot:t,points:n,className:r,top:i,left:a,needClip:o,xAxisId:s,yAxisId:l,width:u,height:d,id:f,baseLine:p}=this.props;if(e)return null;var m=c(`recharts-area`,r),h=f,{r:g=3,strokeWidth:_=2}=M(t,!1)??{r:3,strokeWidth:2},v=ye(t),y=g*2+_;return A.createElement(A.Fragment,null,A.createElement(N,{className:m},o&&A.createElement(`defs`,null,A.createElement(kA,{clipPathId:h,xAxisId:s,yAxisId:l}),!v&&A.createElement(`clipPath`,{id:`clipPath-dots-${h}`},A.createElement(`rect`,{x:a-y/2,y:i-y/2,width:u+y,height:d+y}))),A.createElement(WI,{needClip:o,clipPathId:h,props:this.props})),A.createElement(nk,{points:n,mainColor:MI(this.props.stroke,this.props.fill),itemDataKey:this.props.dataKey,activeDot:this.props.activeDot}),this.props.isRange&&Array.isArray(p)&&A.createElement(nk,{points:p,mainColor:MI(this.props.stroke,this.props.fill),itemDataKey:this.props.dataKey,activeDot:this.props.activeDot}))}},KI={activeDot:!0,animationBegin:0,animationDuration:1500,animationEasing:`ease`,connectNulls:!1,dot:!1,fill:`#3182bd`,fillOpacity:.6,hide:!1,isAnimationActive:!qc.isSsr,legendType:`line`,stroke:`#3182bd`,xAxisId:0,yAxisId:0};function qI(e){var t=H(e,KI),{activeDot:n,animationBegin:r,animationDuration:i,animationEasing:a,connectNulls:o,dot:s,fill:c,fillOpacity:l,hide:u,isAnimationActive:d,legendType:f,stroke:p,xAxisId:m,yAxisId:h}=t,g=wI(t,CI),_=ec(),v=qx(),{needClip:y}=OA(m,h),b=B(),{points:x,isRange:S,baseLine:C}=I(t=>xI(t,m,h,b,e.id))??{},w=KO();if(_!==`horizontal`&&_!==`vertical`||w==null||v!==`AreaChart`&&v!==`ComposedChart`)return null;var{height:T,width:E,x:D,y:O}=w;return!x||!x.length?null:A.createElement(GI,jI({},g,{activeDot:n,animationBegin:r,animationDuration:i,animationEasing:a,baseLine:C,connectNulls:o,dot:s,fill:c,fillOpacity:l,height:T,hide:u,layout:_,isAnimationActive:d,isRange:S,legendType:f,needClip:y,points:x,stroke:p,width:E,left:D,top:O,xAxisId:m,yAxisId:h}))}var JI=(e,t,n,r,i)=>{var a=n??t;if(b(a))return a;var o=e===`horizontal`?i:r,s=o.scale.domain();if(o.type===`number`){var c=Math.max(s[0],s[1]),l=Math.min(s[0],s[1]);return a===`dataMin`?l:a===`dataMax`||c<0?c:Math.max(Math.min(s[0],s[1]),0)}return a===`dataMin`?s[0]:a===`dataMax`?s[1]:s[0]};function YI(e){var{areaSettings:{connectNulls:t,baseValue:n,dataKey:r},stackedData:i,layout:a,chartBaseValue:o,xAxis:s,yAxis:c,displayedData:l,dataStartIndex:u,xAxisTicks:d,yAxisTicks:f,bandSize:p}=e,m=i&&i.length,h=JI(a,o,n,s,c),g=a===`horizontal`,_=!1,v=l.map((e,n)=>{var a;m?a=i[u+n]:(a=z(e,r),Array.isArray(a)?_=!0:a=[h,a]);var o=a[1]==null||m&&!t&&z(e,r)==null;return g?{x:cs({axis:s,ticks:d,bandSize:p,entry:e,index:n}),y:o?null:c.scale(a[1]),value:a,payload:e}:{x:o?null:s.scale(a[1]),y:cs({axis:c,ticks:f,bandSize:p,entry:e,index:n}),value:a,payload:e}}),y=m||_?v.map(e=>{var t=Array.isArray(e.value)?e.value[0]:null;return g?{x:e.x,y:t!=null&&e.y!=null?c.scale(t):null,payload:e.payload}:{x:t==null?null:s.scale(t),y:e.y,payload:e.payload}}):g?c.scale(h):s.scale(h);return{points:v,baseLine:y,isRange:_}}function XI(e){var t=H(e,KI),n=B();return A.createElement(BD,{id:t.id,type:`area`},e=>A.createElement(A.Fragment,null,A.createElement(FD,{legendPayload:NI(t)}),A.createElement(ND,{fn:PI,args:t}),A.createElement(YD,{type:`area`,id:e,data:t.data,dataKey:t.dataKey,xAxisId:t.xAxisId,yAxisId:t.yAxisId,zAxisId:0,stackId:ss(t.stackId),hide:t.hide,barSize:void 0,baseValue:t.baseValue,isPanorama:n,connectNulls:t.connectNulls}),A.createElement(qI,jI({},t,{id:e}))))}var ZI=A.memo(XI);ZI.displayName=`Area`;function QI(e,t,n){return(t=$I(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function $I(e){var t=eL(e,`string`);return typeof t==`symbol`?t:t+``}function eL(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function tL(e){var t=F();return(0,A.useEffect)(()=>(t(IO(e)),()=>{t(LO(e))}),[e,t]),null}var nL=class extends A.Component{render(){return A.createElement(tL,{domain:this.props.domain,id:this.props.zAxisId,dataKey:this.props.dataKey,name:this.props.name,unit:this.props.unit,range:this.props.range,scale:this.props.scale,type:this.props.type,allowDuplicatedCategory:dv.allowDuplicatedCategory,allowDataOverflow:dv.allowDataOverflow,reversed:dv.reversed,includeHidden:dv.includeHidden})}};QI(nL,`displayName`,`ZAxis`),QI(nL,`defaultProps`,{zAxisId:0,range:dv.range,scale:dv.scale,type:dv.type});var rL=[`option`,`isActive`];function iL(){return iL=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},iL.apply(null,arguments)}function aL(e,t){if(e==null)return{};var n,r,i=oL(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function oL(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}function sL(e){var{option:t,isActive:n}=e,r=aL(e,rL);return typeof t==`string`?A.createElement(kD,iL({option:A.createElement(gn,iL({type:t},r)),isActive:n,shapeType:`symbols`},r)):A.createElement(kD,iL({option:t,isActive:n,shapeType:`symbols`},r))}var cL=(e,t,n,r,i,a,o)=>rb(e,`xAxis`,t,o),lL=(e,t,n,r,i,a,o)=>nb(e,`xAxis`,t,o),uL=(e,t,n,r,i,a,o)=>rb(e,`yAxis`,n,o),dL=(e,t,n,r,i,a,o)=>nb(e,`yAxis`,n,o),fL=(e,t,n,r)=>ab(e,`zAxis`,r,!1),pL=(e,t,n,r,i)=>i,mL=(e,t,n,r,i,a)=>a,hL=(e,t,n,r,i,a,o)=>_g(e,t,n,o),gL=L([_v,pL],(e,t)=>e.filter(e=>e.type===`scatter`).find(e=>e.id===t)),_L=L([hL,cL,lL,uL,dL,fL,gL,mL],(e,t,n,r,i,a,o,s)=>{var{chartData:c,dataStartIndex:l,dataEndIndex:u}=e;if(o!=null){var d=o?.data!=null&&o.data.length>0?o.data:c?.slice(l,u+1);if(!(d==null||t==null||r==null||n==null||i==null||n?.length===0||i?.length===0))return FL({displayedData:d,xAxis:t,yAxis:r,zAxis:a,scatterSettings:o,xAxisTicks:n,yAxisTicks:i,cells:s})}}),vL=[`onMouseEnter`,`onClick`,`onMouseLeave`],yL=[`id`],bL=[`animationBegin`,`animationDuration`,`animationEasing`,`hide`,`isAnimationActive`,`legendType`,`lineJointType`,`lineType`,`shape`,`xAxisId`,`yAxisId`,`zAxisId`];function xL(e,t){if(e==null)return{};var n,r,i=SL(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function SL(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}function CL(){return CL=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},CL.apply(null,arguments)}function wL(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function TL(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?wL(Object(n),!0).forEach(function(t){EL(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):wL(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function EL(e,t,n){return(t=DL(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function DL(e){var t=OL(e,`string`);return typeof t==`symbol`?t:t+``}function OL(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}var kL=e=>{var{dataKey:t,name:n,fill:r,legendType:i,hide:a}=e;return[{inactive:a,dataKey:t,type:i,color:r,value:vs(n,t),payload:e}]};function AL(e){var{points:t,props:n}=e,{line:r,lineType:i,lineJointType:a}=n;if(!r)return null;var o=j(n),s=M(r,!1),c,l;if(i===`joint`)c=t.map(e=>({x:e.cx,y:e.cy}));else if(i===`fitting`){var{xmin:u,xmax:d,a:f,b:p}=ee(t),m=e=>f*e+p;c=[{x:u,y:m(u)},{x:d,y:m(d)}]}var h=TL(TL(TL({},o),{},{fill:`none`,stroke:o&&o.fill},s),{},{points:c});return l=A.isValidElement(r)?A.cloneElement(r,h):typeof r==`function`?r(h):A.createElement(ll,CL({},h,{type:a})),A.createElement(N,{className:`recharts-scatter-line`,key:`recharts-scatter-line`},l)}function jL(e){var{showLabels:t,points:n,children:r}=e,i=Js(),a=(0,A.useMemo)(()=>n?.map(e=>{var t={x:e.x,y:e.y,width:e.width,height:e.height};return TL(TL({},t),{},{value:void 0,payload:e.payload,viewBox:t,parentViewBox:i,fill:void 0})}),[i,n]);return A.createElement(Ww,{value:t?a:null},r)}function ML(e){var{points:t,allOtherScatterProps:n}=e,{shape:r,activeShape:i,dataKey:a}=n,o=I(Ax),{onMouseEnter:s,onClick:c,onMouseLeave:l}=n,u=xL(n,vL),d=AD(s,n.dataKey),f=jD(l),p=MD(c,n.dataKey);if(t==null)return null;var{id:m}=n,h=xL(n,yL),g=j(h);return A.createElement(A.Fragment,null,A.createElement(AL,{points:t,props:h}),t.map((e,t)=>{var n=i&&o===String(t),s=n?i:r,c=TL(TL(TL({key:`symbol-${t}`},g),e),{},{[ks]:t,[As]:String(a)});return A.createElement(N,CL({className:`recharts-scatter-symbol`},le(u,e,t),{onMouseEnter:d(e,t),onMouseLeave:f(e,t),onClick:p(e,t),key:`symbol-${e?.cx}-${e?.cy}-${e?.size}-${t}`}),A.createElement(sL,CL({option:s,isActive:n},c)))}))}function NL(e){var{previousPointsRef:t,props:n}=e,{points:r,isAnimationActive:i,animationBegin:a,animationDuration:o,animationEasing:s}=n,c=t.current,l=uu(n,`recharts-scatter-`),[u,d]=(0,A.useState)(!1),f=(0,A.useCallback)(()=>{d(!1)},[]),p=(0,A.useCallback)(()=>{d(!0)},[]),m=!u;return A.createElement(jL,{showLabels:m,points:r},n.children,A.createElement(lu,{animationId:l,begin:a,duration:o,isActive:i,easing:s,onAnimationEnd:f,onAnimationStart:p,key:l},e=>{var i=e===1?r:r?.map((t,n)=>{var r=c&&c[n];if(r){var i=E(r.cx,t.cx),a=E(r.cy,t.cy),o=E(r.size,t.size);return TL(TL({},t),{},{cx:i(e),cy:a(e),size:o(e)})}var s=E(0,t.size);return TL(TL({},t),{},{size:s(e)})});return e>0&&(t.current=i),A.createElement(N,null,A.createElement(ML,{points:i,allOtherScatterProps:n,showLabels:m}))}),A.createElement(Xw,{label:n.label}))}function PL(e){var{dataKey:t,points:n,stroke:r,strokeWidth:i,fill:a,name:o,hide:s,tooltipType:c}=e;return{dataDefinedOnItem:n?.map(e=>e.tooltipPayload),positions:n?.map(e=>e.tooltipPosition),settings:{stroke:r,strokeWidth:i,fill:a,nameKey:void 0,dataKey:t,name:vs(o,t),hide:s,type:c,color:a,unit:``}}}function FL(e){var{displayedData:t,xAxis:n,yAxis:r,zAxis:i,scatterSettings:a,xAxisTicks:o,yAxisTicks:s,cells:c}=e,l=k(n.dataKey)?a.dataKey:n.dataKey,u=k(r.dataKey)?a.dataKey:r.dataKey,d=i&&i.dataKey,f=i?i.range:nL.defaultProps.range,p=f&&f[0],m=n.scale.bandwidth?n.scale.bandwidth():0,h=r.scale.bandwidth?r.scale.bandwidth():0;return t.map((e,t)=>{var f=z(e,l),g=z(e,u),_=!k(d)&&z(e,d)||`-`,v=[{name:k(n.dataKey)?a.name:n.name||n.dataKey,unit:n.unit||``,value:f,payload:e,dataKey:l,type:a.tooltipType},{name:k(r.dataKey)?a.name:r.name||r.dataKey,unit:r.unit||``,value:g,payload:e,dataKey:u,type:a.tooltipType}];_!==`-`&&v.push({name:i.name||i.dataKey,unit:i.unit||``,value:_,payload:e,dataKey:d,type:a.tooltipType});var y=cs({axis:n,ticks:o,bandSize:m,entry:e,index:t,dataKey:l}),b=cs({axis:r,ticks:s,bandSize:h,entry:e,index:t,dataKey:u}),x=_===`-`?p:i.scale(_),S=Math.sqrt(Math.max(x,0)/Math.PI);return TL(TL({},e),{},{cx:y,cy:b,x:y-S,y:b-S,width:2*S,height:2*S,size:x,node:{x:f,y:g,z:_},tooltipPayload:v,tooltipPosition:{x:y,y:b},payload:e},c&&c[t]&&c[t].props)})}var IL=(e,t,n)=>({x:e.cx,y:e.cy,value:n===`x`?+e.node.x:+e.node.y,errorVal:z(e,t)});function LL(e){var{hide:t,points:n,className:r,needClip:i,xAxisId:a,yAxisId:o,id:s}=e,l=(0,A.useRef)(null);if(t)return null;var u=c(`recharts-scatter`,r),d=s;return A.createElement(N,{className:u,clipPath:i?`url(#clipPath-${d})`:null,id:s},i&&A.createElement(`defs`,null,A.createElement(kA,{clipPathId:d,xAxisId:a,yAxisId:o})),A.createElement(TA,{xAxisId:a,yAxisId:o,data:n,dataPointFormatter:IL,errorBarOffset:0},A.createElement(N,{key:`recharts-scatter-symbols`},A.createElement(NL,{props:e,previousPointsRef:l}))))}var RL={xAxisId:0,yAxisId:0,zAxisId:0,legendType:`circle`,lineType:`joint`,lineJointType:`linear`,data:[],shape:`circle`,hide:!1,isAnimationActive:!qc.isSsr,animationBegin:0,animationDuration:400,animationEasing:`linear`};function zL(e){var t=H(e,RL),{animationBegin:n,animationDuration:r,animationEasing:i,hide:a,isAnimationActive:o,legendType:s,lineJointType:c,lineType:l,shape:u,xAxisId:d,yAxisId:f,zAxisId:p}=t,m=xL(t,bL),{needClip:h}=OA(d,f),g=(0,A.useMemo)(()=>ve(e.children,gC),[e.children]),_=B(),v=I(t=>_L(t,d,f,p,e.id,g,_));return h==null||v==null?null:A.createElement(A.Fragment,null,A.createElement(ND,{fn:PL,args:TL(TL({},e),{},{points:v})}),A.createElement(LL,CL({},m,{xAxisId:d,yAxisId:f,zAxisId:p,lineType:l,lineJointType:c,legendType:s,shape:u,hide:a,isAnimationActive:o,animationBegin:n,animationDuration:r,animationEasing:i,points:v,needClip:h})))}function BL(e){var t=H(e,RL),n=B();return A.createElement(BD,{id:t.id,type:`scatter`},e=>A.createElement(A.Fragment,null,A.createElement(FD,{legendPayload:kL(t)}),A.createElement(YD,{type:`scatter`,id:e,data:t.data,xAxisId:t.xAxisId,yAxisId:t.yAxisId,zAxisId:t.zAxisId,dataKey:t.dataKey,hide:t.hide,name:t.name,tooltipType:t.tooltipType,isPanorama:n}),A.createElement(zL,CL({},t,{id:e}))))}var VL=A.memo(BL);VL.displayName=`Scatter`;var HL=[`dangerouslySetInnerHTML`,`ticks`],UL=[`id`],WL=[`domain`],GL=[`domain`];function KL(){return KL=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},KL.apply(null,arguments)}function qL(e,t){if(e==null)return{};var n,r,i=JL(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function JL(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}function YL(e){var t=F();return(0,A.useEffect)(()=>(t(MO(e)),()=>{t(NO(e))}),[e,t]),null}var XL=e=>{var{xAxisId:t,className:n}=e,r=I(Us),i=B(),a=`xAxis`,o=I(e=>jy(e,a,t,i)),s=I(e=>eb(e,a,t,i)),l=I(e=>zy(e,t)),u=I(e=>Wy(e,t)),d=I(e=>ov(e,t));if(l==null||u==null||d==null)return null;var{dangerouslySetInnerHTML:f,ticks:p}=e,m=qL(e,HL),{id:h}=d,g=qL(d,UL);return A.createElement(oF,KL({},m,g,{scale:o,x:u.x,y:u.y,width:l.width,height:l.height,className:c(`recharts-${a} ${a}`,n),viewBox:r,ticks:s}))},ZL={allowDataOverflow:av.allowDataOverflow,allowDecimals:av.allowDecimals,allowDuplicatedCategory:av.allowDuplicatedCategory,height:av.height,hide:!1,mirror:av.mirror,orientation:av.orientation,padding:av.padding,reversed:av.reversed,scale:av.scale,tickCount:av.tickCount,type:av.type,xAxisId:0},QL=A.memo(e=>{var t=H(e,ZL);return A.createElement(A.Fragment,null,A.createElement(YL,{interval:t.interval??`preserveEnd`,id:t.xAxisId,scale:t.scale,type:t.type,padding:t.padding,allowDataOverflow:t.allowDataOverflow,domain:t.domain,dataKey:t.dataKey,allowDuplicatedCategory:t.allowDuplicatedCategory,allowDecimals:t.allowDecimals,tickCount:t.tickCount,includeHidden:t.includeHidden??!1,reversed:t.reversed,ticks:t.ticks,height:t.height,orientation:t.orientation,mirror:t.mirror,hide:t.hide,unit:t.unit,name:t.name,angle:t.angle??0,minTickGap:t.minTickGap??5,tick:t.tick??!0,tickFormatter:t.tickFormatter}),A.createElement(XL,t))},(e,t)=>{var{domain:n}=e,r=qL(e,WL),{domain:i}=t,a=qL(t,GL);return CP(r,a)?Array.isArray(n)&&n.length===2&&Array.isArray(i)&&i.length===2?n[0]===i[0]&&n[1]===i[1]:CP({domain:n},{domain:i}):!1});QL.displayName=`XAxis`;var $L=[`dangerouslySetInnerHTML`,`ticks`],eR=[`id`],tR=[`domain`],nR=[`domain`];function rR(){return rR=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},rR.apply(null,arguments)}function iR(e,t){if(e==null)return{};var n,r,i=aR(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function aR(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}function oR(e){var t=F();return(0,A.useEffect)(()=>(t(PO(e)),()=>{t(FO(e))}),[e,t]),null}var sR=e=>{var{yAxisId:t,className:n,width:r,label:i}=e,a=(0,A.useRef)(null),o=(0,A.useRef)(null),s=I(Us),l=B(),u=F(),d=`yAxis`,f=I(e=>jy(e,d,t,l)),p=I(e=>Ky(e,t)),m=I(e=>Gy(e,t)),h=I(e=>eb(e,d,t,l)),g=I(e=>lv(e,t));if((0,A.useLayoutEffect)(()=>{if(!(r!==`auto`||!p||xw(i)||(0,A.isValidElement)(i)||g==null)){var e=a.current;if(e){var n=e.getCalculatedWidth();Math.round(p.width)!==Math.round(n)&&u(RO({id:t,width:n}))}}},[h,p,u,i,t,r,g]),p==null||m==null||g==null)return null;var{dangerouslySetInnerHTML:_,ticks:v}=e,y=iR(e,$L),{id:b}=g,x=iR(g,eR);return A.createElement(oF,rR({},y,x,{ref:a,labelRef:o,scale:f,x:m.x,y:m.y,tickTextProps:r===`auto`?{width:void 0}:{width:r},width:p.width,height:p.height,className:c(`recharts-${d} ${d}`,n),viewBox:s,ticks:h}))},cR={allowDataOverflow:cv.allowDataOverflow,allowDecimals:cv.allowDecimals,allowDuplicatedCategory:cv.allowDuplicatedCategory,hide:!1,mirror:cv.mirror,orientation:cv.orientation,padding:cv.padding,reversed:cv.reversed,scale:cv.scale,tickCount:cv.tickCount,type:cv.type,width:cv.width,yAxisId:0},lR=A.memo(e=>{var t=H(e,cR);return A.createElement(A.Fragment,null,A.createElement(oR,{interval:t.interval??`preserveEnd`,id:t.yAxisId,scale:t.scale,type:t.type,domain:t.domain,allowDataOverflow:t.allowDataOverflow,dataKey:t.dataKey,allowDuplicatedCategory:t.allowDuplicatedCategory,allowDecimals:t.allowDecimals,tickCount:t.tickCount,padding:t.padding,includeHidden:t.includeHidden??!1,reversed:t.reversed,ticks:t.ticks,width:t.width,orientation:t.orientation,mirror:t.mirror,hide:t.hide,unit:t.unit,name:t.name,angle:t.angle??0,minTickGap:t.minTickGap??5,tick:t.tick??!0,tickFormatter:t.tickFormatter}),A.createElement(sR,t))},(e,t)=>{var{domain:n}=e,r=iR(e,tR),{domain:i}=t,a=iR(t,nR);return CP(r,a)?Array.isArray(n)&&n.length===2&&Array.isArray(i)&&i.length===2?n[0]===i[0]&&n[1]===i[1]:CP({domain:n},{domain:i}):!1});lR.displayName=`YAxis`;var uR={begin:0,duration:1e3,easing:`ease`,isActive:!0,canBegin:!0,onAnimationEnd:()=>{},onAnimationStart:()=>{}};function dR(e){var t=H(e,uR),{animationId:n,from:r,to:i,attributeName:a,isActive:o,canBegin:s,duration:c,easing:l,begin:u,onAnimationEnd:d,onAnimationStart:f,children:p}=t,m=au(n+a,t.animationManager),[h,g]=(0,A.useState)(()=>o?r:i),_=(0,A.useRef)(!1),v=(0,A.useCallback)(()=>{g(r),f()},[r,f]);if((0,A.useEffect)(()=>{if(!o||!s)return Dl;_.current=!0;var e=m.subscribe(g);return m.start([v,u,i,c,d]),()=>{m.stop(),e&&e(),d()}},[o,s,c,l,u,v,d,m,i,r]),!o)return p({[a]:i});if(!s)return p({[a]:r});if(_.current){var y=Pl([a],c,l);return p({transition:y,[a]:h})}return p({[a]:r})}var fR=[`direction`,`width`,`dataKey`,`isAnimationActive`,`animationBegin`,`animationDuration`,`animationEasing`];function pR(){return pR=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},pR.apply(null,arguments)}function mR(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function hR(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?mR(Object(n),!0).forEach(function(t){gR(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):mR(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function gR(e,t,n){return(t=_R(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function _R(e){var t=vR(e,`string`);return typeof t==`symbol`?t:t+``}function vR(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function yR(e,t){if(e==null)return{};var n,r,i=bR(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function bR(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}function xR(e){var{direction:t,width:n,dataKey:r,isAnimationActive:i,animationBegin:a,animationDuration:o,animationEasing:s}=e,c=yR(e,fR),l=j(c),{data:u,dataPointFormatter:d,xAxisId:f,yAxisId:p,errorBarOffset:m}=EA(),h=HO(f),g=UO(p);if(h?.scale==null||g?.scale==null||u==null||t===`x`&&h.type!==`number`)return null;var _=u.map(e=>{var{x:c,y:u,value:f,errorVal:p}=d(e,r,t);if(!p||c==null||u==null)return null;var _=[],v,y;if(Array.isArray(p)?[v,y]=p:v=y=p,t===`x`){var{scale:b}=h,x=u+m,S=x+n,C=x-n,w=b(f-v),T=b(f+y);_.push({x1:T,y1:S,x2:T,y2:C}),_.push({x1:w,y1:x,x2:T,y2:x}),_.push({x1:w,y1:S,x2:w,y2:C})}else if(t===`y`){var{scale:E}=g,D=c+m,O=D-n,ee=D+n,k=E(f-v),te=E(f+y);_.push({x1:O,y1:te,x2:ee,y2:te}),_.push({x1:D,y1:k,x2:D,y2:te}),_.push({x1:O,y1:k,x2:ee,y2:k})}var ne=t===`x`?`scaleX`:`scaleY`,re=`${c+m}px ${u+m}px`;return A.createElement(N,pR({className:`recharts-errorBar`,key:`bar-${_.map(e=>`${e.x1}-${e.x2}-${e.y1}-${e.y2}`)}`},l),_.map(e=>{var n=i?{transformOrigin:re}:void 0;return A.createElement(dR,{animationId:`error-bar-${t}`,from:`${ne}(0)`,to:`${ne}(1)`,attributeName:`transform`,begin:a,easing:s,isActive:i,duration:o,key:`errorbar-${e.x1}-${e.x2}-${e.y1}-${e.y2}`},t=>A.createElement(`line`,pR({},e,{style:hR(hR({},n),t)})))}))});return A.createElement(N,{className:`recharts-errorBars`},_)}function SR(e){var t=ec();return e??(t==null?`x`:t===`horizontal`?`y`:`x`)}var CR={stroke:`black`,strokeWidth:1.5,width:5,offset:0,isAnimationActive:!0,animationBegin:0,animationDuration:400,animationEasing:`ease-in-out`};function wR(e){var t=SR(e.direction),{width:n,isAnimationActive:r,animationBegin:i,animationDuration:a,animationEasing:o}=H(e,CR);return A.createElement(A.Fragment,null,A.createElement(DA,{dataKey:e.dataKey,direction:t}),A.createElement(xR,pR({},e,{direction:t,width:n,isAnimationActive:r,animationBegin:i,animationDuration:a,animationEasing:o})))}var TR=class extends A.Component{render(){return A.createElement(wR,this.props)}};gR(TR,`defaultProps`,CR),gR(TR,`displayName`,`ErrorBar`);var ER=n((exports=>{var t=r();typeof Object.is==`function`&&Object.is,t.useSyncExternalStore,t.useRef,t.useEffect,t.useMemo,t.useDebugValue}));n(((exports,t)=>{t.exports=ER()}))();function DR(e){e()}function OR(){let e=null,t=null;return{clear(){e=null,t=null},notify(){DR(()=>{let t=e;for(;t;)t.callback(),t=t.next})},get(){let t=[],n=e;for(;n;)t.push(n),n=n.next;return t},subscribe(n){let r=!0,i=t={callback:n,next:null,prev:t};return i.prev?i.prev.next=i:e=i,function(){!r||e===null||(r=!1,i.next?i.next.prev=i.prev:t=i.prev,i.prev?i.prev.next=i.next:e=i.next)}}}}var kR={notify(){},get:()=>[]};function AR(e,t){let n,r=kR,i=0,a=!1;function o(e){u();let t=r.subscribe(e),n=!1;return()=>{n||(n=!0,t(),d())}}function s(){r.notify()}function c(){m.onStateChange&&m.onStateChange()}function l(){return a}function u(){i++,!n&&(n=t?t.addNestedSub(c):e.subscribe(c),r=OR())}function d(){i--,n&&i===0&&(n(),n=void 0,r.clear(),r=kR)}function f(){a||(a=!0,u())}function p(){a&&(a=!1,d())}let m={addNestedSub:o,notifyNestedSubs:s,handleChangeWrapper:c,isSubscribed:l,trySubscribe:f,tryUnsubscribe:p,getListeners:()=>r};return m}var jR=(()=>typeof window<`u`&&window.document!==void 0&&window.document.createElement!==void 0)(),MR=(()=>typeof navigator<`u`&&navigator.product===`ReactNative`)(),NR=(()=>jR||MR?A.useLayoutEffect:A.useEffect)();Object.defineProperty,Object.getOwnPropertyNames,Object.getOwnPropertySymbols,Object.getOwnPropertyDescriptor,Object.getPrototypeOf,Object.prototype;var PR=Symbol.for(`react-redux-context`),FR=typeof globalThis<`u`?globalThis:{};function IR(){if(!A.createContext)return{};let e=FR[PR]??=new Map,t=e.get(A.createContext);return t||(t=A.createContext(null),e.set(A.createContext,t)),t}var LR=IR();function RR(e){let{children:t,context:n,serverState:r,store:i}=e,a=A.useMemo(()=>{let e=AR(i);return{store:i,subscription:e,getServerState:r?()=>r:void 0}},[i,r]),o=A.useMemo(()=>i.getState(),[i]);NR(()=>{let{subscription:e}=a;return e.onStateChange=e.notifyNestedSubs,e.trySubscribe(),o!==i.getState()&&e.notifyNestedSubs(),()=>{e.tryUnsubscribe(),e.onStateChange=void 0}},[a,o]);let s=n||LR;return A.createElement(s.Provider,{value:a},t)}var zR=RR,BR=L([(e,t)=>t,V,U_,K_,xx,Tx,Zx,Vs],sS),VR=e=>{var t=e.currentTarget.getBoundingClientRect(),n=t.width/e.currentTarget.offsetWidth,r=t.height/e.currentTarget.offsetHeight;return{chartX:Math.round((e.clientX-t.left)/n),chartY:Math.round((e.clientY-t.top)/r)}},HR=ua(`mouseClick`),UR=vo();UR.startListening({actionCreator:HR,effect:(e,t)=>{var n=e.payload,r=BR(t.getState(),VR(n));r?.activeIndex!=null&&t.dispatch(wb({activeIndex:r.activeIndex,activeDataKey:void 0,activeCoordinate:r.activeCoordinate}))}});var WR=ua(`mouseMove`),GR=vo();GR.startListening({actionCreator:WR,effect:(e,t)=>{var n=e.payload,r=t.getState(),i=ub(r,r.tooltip.settings.shared),a=BR(r,VR(n));i===`axis`&&(a?.activeIndex==null?t.dispatch(xb()):t.dispatch(Cb({activeIndex:a.activeIndex,activeDataKey:void 0,activeCoordinate:a.activeCoordinate})))}});function KR(e,t){return t instanceof HTMLElement?`HTMLElement <${t.tagName} class="${t.className}">`:t===window?`global.window`:t}var qR={accessibilityLayer:!0,barCategoryGap:`10%`,barGap:4,barSize:void 0,className:void 0,maxBarSize:void 0,stackOffset:`none`,syncId:void 0,syncMethod:`index`},JR=Aa({name:`rootProps`,initialState:qR,reducers:{updateOptions:(e,t)=>{e.accessibilityLayer=t.payload.accessibilityLayer,e.barCategoryGap=t.payload.barCategoryGap,e.barGap=t.payload.barGap??qR.barGap,e.barSize=t.payload.barSize,e.maxBarSize=t.payload.maxBarSize,e.stackOffset=t.payload.stackOffset,e.syncId=t.payload.syncId,e.syncMethod=t.payload.syncMethod,e.className=t.payload.className}}}),YR=JR.reducer,{updateOptions:XR}=JR.actions,ZR=Aa({name:`polarOptions`,initialState:null,reducers:{updatePolarOptions:(e,t)=>t.payload}}),{updatePolarOptions:QR}=ZR.actions,$R=ZR.reducer,ez=ua(`keyDown`),tz=ua(`focus`),nz=vo();nz.startListening({actionCreator:ez,effect:(e,t)=>{var n=t.getState();if(n.rootProps.accessibilityLayer!==!1){var{keyboardInteraction:r}=n.tooltip,i=e.payload;if(!(i!==`ArrowRight`&&i!==`ArrowLeft`&&i!==`Enter`)){var a=Number(Ib(r,ex(n))),o=Tx(n);if(i===`Enter`){var s=nS(n,`axis`,`hover`,String(r.index));t.dispatch(Eb({active:!r.active,activeIndex:r.index,activeDataKey:r.dataKey,activeCoordinate:s}));return}var c=ob(n)===`left-to-right`?1:-1,l=a+(i===`ArrowRight`?1:-1)*c;if(!(o==null||l>=o.length||l<0)){var u=nS(n,`axis`,`hover`,String(l));t.dispatch(Eb({active:!0,activeIndex:l.toString(),activeDataKey:void 0,activeCoordinate:u}))}}}}}),nz.startListening({actionCreator:tz,effect:(e,t)=>{var n=t.getState();if(n.rootProps.accessibilityLayer!==!1){var{keyboardInteraction:r}=n.tooltip;if(!r.active&&r.index==null){var i=`0`,a=nS(n,`axis`,`hover`,String(i));t.dispatch(Eb({activeDataKey:void 0,active:!0,activeIndex:i,activeCoordinate:a}))}}}});var rz=ua(`externalEvent`),iz=vo();iz.startListening({actionCreator:rz,effect:(e,t)=>{if(e.payload.handler!=null){var n=t.getState(),r={activeCoordinate:Fx(n),activeDataKey:Mx(n),activeIndex:Ax(n),activeLabel:jx(n),activeTooltipIndex:Ax(n),isTooltipActive:Ix(n)};e.payload.handler(r,e.payload.reactEvent)}}});var az=L([Bb],e=>e.tooltipItemPayloads),oz=L([az,zb,(e,t,n)=>t,(e,t,n)=>n],(e,t,n,r)=>{var i=e.find(e=>e.settings.dataKey===r);if(i!=null){var{positions:a}=i;if(a!=null)return t(a,n)}}),sz=ua(`touchMove`),cz=vo();cz.startListening({actionCreator:sz,effect:(e,t)=>{var n=e.payload,r=t.getState(),i=ub(r,r.tooltip.settings.shared);if(i===`axis`){var a=BR(r,VR({clientX:n.touches[0].clientX,clientY:n.touches[0].clientY,currentTarget:n.currentTarget}));a?.activeIndex!=null&&t.dispatch(Cb({activeIndex:a.activeIndex,activeDataKey:void 0,activeCoordinate:a.activeCoordinate}))}else if(i===`item`){var o=n.touches[0],s=document.elementFromPoint(o.clientX,o.clientY);if(!s||!s.getAttribute)return;var c=s.getAttribute(ks),l=s.getAttribute(`data-recharts-item-data-key`)??void 0,u=oz(t.getState(),c,l);t.dispatch(yb({activeDataKey:l,activeIndex:c,activeCoordinate:u}))}}});var lz=oi({brush:JM,cartesianAxis:zO,chartData:jS,errorBars:bA,graphicalItems:JD,layout:To,legend:cc,options:wS,polarAxis:iE,polarOptions:$R,referenceElements:LN,rootProps:YR,tooltip:Db}),uz=function(e){var t=arguments.length>1&&arguments[1]!==void 0?arguments[1]:`Chart`;return ya({reducer:lz,preloadedState:e,middleware:e=>e({serializableCheck:!1}).concat([UR.middleware,GR.middleware,nz.middleware,iz.middleware,cz.middleware]),devTools:qc.devToolsEnabled&&{serialize:{replacer:KR},name:`recharts-${t}`}})};function dz(e){var{preloadedState:t,children:n,reduxStoreName:r}=e,i=B(),a=(0,A.useRef)(null);if(i)return n;a.current??=uz(t,r);var o=nr;return A.createElement(zR,{context:o,store:a.current},n)}function fz(e){var{layout:t,width:n,height:r,margin:i}=e,a=F(),o=B();return(0,A.useEffect)(()=>{o||(a(So(t)),a(Co({width:n,height:r})),a(xo(i)))},[a,o,t,n,r,i]),null}function pz(e){var t=F();return(0,A.useEffect)(()=>{t(XR(e))},[t,e]),null}var mz=[`children`];function hz(e,t){if(e==null)return{};var n,r,i=gz(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function gz(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}function _z(){return _z=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},_z.apply(null,arguments)}var vz={width:`100%`,height:`100%`},yz=(0,A.forwardRef)((e,t)=>{var n=Zs(),r=Qs(),i=Jc();if(!Xc(n)||!Xc(r))return null;var{children:a,otherAttributes:o,title:s,desc:c}=e,l=typeof o.tabIndex==`number`?o.tabIndex:i?0:void 0,u=typeof o.role==`string`?o.role:i?`application`:void 0;return A.createElement(Te,_z({},o,{title:s,desc:c,role:u,tabIndex:l,width:n,height:r,style:vz,ref:t}),a)}),bz=e=>{var{children:t}=e,n=I(qs);if(!n)return null;var{width:r,height:i,y:a,x:o}=n;return A.createElement(Te,{width:r,height:i,x:o,y:a},t)},xz=(0,A.forwardRef)((e,t)=>{var{children:n}=e,r=hz(e,mz);return B()?A.createElement(bz,null,n):A.createElement(yz,_z({ref:t},r),n)});function Sz(){var e=F(),[t,n]=(0,A.useState)(null),r=I(ws);return(0,A.useEffect)(()=>{if(t!=null){var n=t.getBoundingClientRect().width/t.offsetWidth;Yc(n)&&n!==r&&e(wo(n))}},[t,e,r]),n}function Cz(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function wz(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?Cz(Object(n),!0).forEach(function(t){Tz(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Cz(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function Tz(e,t,n){return(t=Ez(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Ez(e){var t=Dz(e,`string`);return typeof t==`symbol`?t:t+``}function Dz(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}var Oz=(0,A.forwardRef)((e,t)=>{var{children:n,className:r,height:i,onClick:a,onContextMenu:o,onDoubleClick:s,onMouseDown:l,onMouseEnter:u,onMouseLeave:d,onMouseMove:f,onMouseUp:p,onTouchEnd:m,onTouchMove:h,onTouchStart:g,style:_,width:v}=e,y=F(),[b,x]=(0,A.useState)(null),[S,C]=(0,A.useState)(null);US();var w=Sz(),T=(0,A.useCallback)(e=>{w(e),typeof t==`function`&&t(e),x(e),C(e)},[w,t,x,C]),E=(0,A.useCallback)(e=>{y(HR(e)),y(rz({handler:a,reactEvent:e}))},[y,a]),D=(0,A.useCallback)(e=>{y(WR(e)),y(rz({handler:u,reactEvent:e}))},[y,u]),O=(0,A.useCallback)(e=>{y(xb()),y(rz({handler:d,reactEvent:e}))},[y,d]),ee=(0,A.useCallback)(e=>{y(WR(e)),y(rz({handler:f,reactEvent:e}))},[y,f]),k=(0,A.useCallback)(()=>{y(tz())},[y]),te=(0,A.useCallback)(e=>{y(ez(e.key))},[y]),ne=(0,A.useCallback)(e=>{y(rz({handler:o,reactEvent:e}))},[y,o]),re=(0,A.useCallback)(e=>{y(rz({handler:s,reactEvent:e}))},[y,s]),ie=(0,A.useCallback)(e=>{y(rz({handler:l,reactEvent:e}))},[y,l]),ae=(0,A.useCallback)(e=>{y(rz({handler:p,reactEvent:e}))},[y,p]),oe=(0,A.useCallback)(e=>{y(rz({handler:g,reactEvent:e}))},[y,g]),se=(0,A.useCallback)(e=>{y(sz(e)),y(rz({handler:h,reactEvent:e}))},[y,h]),ce=(0,A.useCallback)(e=>{y(rz({handler:m,reactEvent:e}))},[y,m]);return A.createElement(gS.Provider,{value:b},A.createElement(Ae.Provider,{value:S},A.createElement(`div`,{className:c(`recharts-wrapper`,r),style:wz({position:`relative`,cursor:`default`,width:v,height:i},_),onClick:E,onContextMenu:ne,onDoubleClick:re,onFocus:k,onKeyDown:te,onMouseDown:ie,onMouseEnter:D,onMouseLeave:O,onMouseMove:ee,onMouseUp:ae,onTouchEnd:ce,onTouchMove:se,onTouchStart:oe,ref:T},n)))}),kz=[`children`,`className`,`width`,`height`,`style`,`compact`,`title`,`desc`];function Az(e,t){if(e==null)return{};var n,r,i=jz(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function jz(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}var Mz=(0,A.forwardRef)((e,t)=>{var{children:n,className:r,width:i,height:a,style:o,compact:s,title:c,desc:l}=e,u=Az(e,kz),d=j(u);return s?A.createElement(xz,{otherAttributes:d,title:c,desc:l},n):A.createElement(Oz,{className:r,style:o,width:i,height:a,onClick:e.onClick,onMouseLeave:e.onMouseLeave,onMouseEnter:e.onMouseEnter,onMouseMove:e.onMouseMove,onMouseDown:e.onMouseDown,onMouseUp:e.onMouseUp,onContextMenu:e.onContextMenu,onDoubleClick:e.onDoubleClick,onTouchStart:e.onTouchStart,onTouchMove:e.onTouchMove,onTouchEnd:e.onTouchEnd},A.createElement(xz,{otherAttributes:d,title:c,desc:l,ref:t},A.createElement(zN,null,n)))}),Nz=[`width`,`height`];function Pz(){return Pz=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Pz.apply(null,arguments)}function Fz(e,t){if(e==null)return{};var n,r,i=Iz(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function Iz(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}var Lz={accessibilityLayer:!0,layout:`horizontal`,stackOffset:`none`,barCategoryGap:`10%`,barGap:4,margin:{top:5,right:5,bottom:5,left:5},reverseStackOrder:!1,syncMethod:`index`},Rz=(0,A.forwardRef)(function(e,t){var n=H(e.categoricalChartProps,Lz),{width:r,height:i}=n,a=Fz(n,Nz);if(!Xc(r)||!Xc(i))return null;var{chartName:o,defaultTooltipEventType:s,validateTooltipEventTypes:c,tooltipPayloadSearcher:l,categoricalChartProps:u}=e,d={chartName:o,defaultTooltipEventType:s,validateTooltipEventTypes:c,tooltipPayloadSearcher:l,eventEmitter:void 0};return A.createElement(dz,{preloadedState:{options:d},reduxStoreName:u.id??o},A.createElement(RM,{chartData:u.data}),A.createElement(fz,{width:r,height:i,layout:n.layout,margin:n.margin}),A.createElement(pz,{accessibilityLayer:n.accessibilityLayer,barCategoryGap:n.barCategoryGap,maxBarSize:n.maxBarSize,stackOffset:n.stackOffset,barGap:n.barGap,barSize:n.barSize,syncId:n.syncId,syncMethod:n.syncMethod,className:n.className}),A.createElement(Mz,Pz({},a,{width:r,height:i,ref:t})))}),zz=[`axis`],Bz=(0,A.forwardRef)((e,t)=>A.createElement(Rz,{chartName:`LineChart`,defaultTooltipEventType:`axis`,validateTooltipEventTypes:zz,tooltipPayloadSearcher:SS,categoricalChartProps:e,ref:t})),Vz=[`axis`,`item`],Hz=(0,A.forwardRef)((e,t)=>A.createElement(Rz,{chartName:`BarChart`,defaultTooltipEventType:`axis`,validateTooltipEventTypes:Vz,tooltipPayloadSearcher:SS,categoricalChartProps:e,ref:t}));function Uz(e){var t=F();return(0,A.useEffect)(()=>{t(QR(e))},[t,e]),null}var Wz=[`width`,`height`,`layout`];function Gz(){return Gz=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Gz.apply(null,arguments)}function Kz(e,t){if(e==null)return{};var n,r,i=qz(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function qz(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}var Jz={accessibilityLayer:!0,stackOffset:`none`,barCategoryGap:`10%`,barGap:4,margin:{top:5,right:5,bottom:5,left:5},reverseStackOrder:!1,syncMethod:`index`,layout:`radial`},Yz=(0,A.forwardRef)(function(e,t){var n=H(e.categoricalChartProps,Jz),{width:r,height:i,layout:a}=n,o=Kz(n,Wz);if(!Xc(r)||!Xc(i))return null;var{chartName:s,defaultTooltipEventType:c,validateTooltipEventTypes:l,tooltipPayloadSearcher:u}=e,d={chartName:s,defaultTooltipEventType:c,validateTooltipEventTypes:l,tooltipPayloadSearcher:u,eventEmitter:void 0};return A.createElement(dz,{preloadedState:{options:d},reduxStoreName:n.id??s},A.createElement(RM,{chartData:n.data}),A.createElement(fz,{width:r,height:i,layout:a,margin:n.margin}),A.createElement(pz,{accessibilityLayer:n.accessibilityLayer,barCategoryGap:n.barCategoryGap,maxBarSize:n.maxBarSize,stackOffset:n.stackOffset,barGap:n.barGap,barSize:n.barSize,syncId:n.syncId,syncMethod:n.syncMethod,className:n.className}),A.createElement(Uz,{cx:n.cx,cy:n.cy,startAngle:n.startAngle,endAngle:n.endAngle,innerRadius:n.innerRadius,outerRadius:n.outerRadius}),A.createElement(Mz,Gz({width:r,height:i},o,{ref:t})))}),Xz=[`item`],Zz={layout:`centric`,startAngle:0,endAngle:360,cx:`50%`,cy:`50%`,innerRadius:0,outerRadius:`80%`},Qz=(0,A.forwardRef)((e,t)=>{var n=H(e,Zz);return A.createElement(Yz,{chartName:`PieChart`,defaultTooltipEventType:`item`,validateTooltipEventTypes:Xz,tooltipPayloadSearcher:SS,categoricalChartProps:n,ref:t})}),$z=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});function t(e){return typeof Buffer<`u`&&Buffer.isBuffer(e)}exports.isBuffer=t})),eB=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});function t(e){let t=e?.constructor,n=typeof t==`function`?t.prototype:Object.prototype;return e===n}exports.isPrototype=t})),tB=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=Bn();function n(e){return t.isTypedArray(e)}exports.isTypedArray=n})),nB=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=Au();function n(e){let n=t.toFinite(e),r=n%1;return r?n-r:n}exports.toInteger=n})),rB=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=nB();function n(e,n){if(e=t.toInteger(e),e<1||!Number.isSafeInteger(e))return[];let r=Array(e);for(let t=0;t<e;t++)r[t]=typeof n==`function`?n(t):t;return r}exports.times=n})),iB=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=$z(),n=eB(),r=On(),i=tB(),a=rB();function o(e){if(e==null)return[];switch(typeof e){case`object`:case`function`:return r.isArrayLike(e)?l(e):n.isPrototype(e)?c(e):s(e);default:return s(Object(e))}}function s(e){let t=[];for(let n in e)t.push(n);return t}function c(e){return s(e).filter(e=>e!==`constructor`)}function l(e){let n=a.times(e.length,e=>`${e}`),r=new Set(n);return t.isBuffer(e)&&(r.add(`offset`),r.add(`parent`)),i.isTypedArray(e)&&(r.add(`buffer`),r.add(`byteLength`),r.add(`byteOffset`)),[...n,...s(e).filter(e=>!r.has(e))]}exports.keysIn=o})),aB=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=m(),n=l(),r=u(),i=d(),a=p();function o(e,t){if(e==null)return!0;switch(typeof t){case`symbol`:case`number`:case`object`:if(Array.isArray(t))return s(e,t);if(typeof t==`number`?t=i.toKey(t):typeof t==`object`&&(t=Object.is(t?.valueOf(),-0)?`-0`:String(t)),n.isUnsafeProperty(t))return!1;if(e?.[t]===void 0)return!0;try{return delete e[t],!0}catch{return!1}case`string`:if(e?.[t]===void 0&&r.isDeepKey(t))return s(e,a.toPath(t));if(n.isUnsafeProperty(t))return!1;try{return delete e[t],!0}catch{return!1}}}function s(e,r){let i=r.length===1?e:t.get(e,r.slice(0,-1)),a=r[r.length-1];if(i?.[a]===void 0)return!0;if(n.isUnsafeProperty(a))return!1;try{return delete i[a],!0}catch{return!1}}exports.unset=o})),oB=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=Ln();function n(e){let n=[];for(;e;)n.push(...t.getSymbols(e)),e=Object.getPrototypeOf(e);return n}exports.getSymbolsIn=n})),sB=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=On();function n(e,n=1){let r=[],i=Math.floor(n);if(!t.isArrayLike(e))return r;let a=(e,t)=>{for(let n=0;n<e.length;n++){let o=e[n];t<i&&(Array.isArray(o)||o?.[Symbol.isConcatSpreadable]||typeof o==`object`&&o&&Object.prototype.toString.call(o)===`[object Arguments]`)?a(Array.isArray(o)?o:Array.from(o),t+1):r.push(o)}};return a(Array.from(e),0),r}exports.flatten=n})),cB=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=Wn(),n=iB(),r=aB(),i=oB(),a=u(),o=sB(),s=aD();function c(e,...t){if(e==null)return{};t=o.flatten(t);let n=l(e,t);for(let e=0;e<t.length;e++){let i=t[e];switch(typeof i){case`object`:Array.isArray(i)||(i=Array.from(i));for(let e=0;e<i.length;e++){let t=i[e];r.unset(n,t)}break;case`string`:case`symbol`:case`number`:r.unset(n,i);break}}return n}function l(e,t){return t.some(e=>Array.isArray(e)||a.isDeepKey(e))?f(e):d(e)}function d(e){let t={},r=[...n.keysIn(e),...i.getSymbolsIn(e)];for(let n=0;n<r.length;n++){let i=r[n];t[i]=e[i]}return t}function f(e){let r={},a=[...n.keysIn(e),...i.getSymbolsIn(e)];for(let n=0;n<a.length;n++){let i=a[n];r[i]=t.cloneDeepWith(e[i],e=>{if(!s.isPlainObject(e))return e})}return r}exports.omit=c})),lB=n(((exports,t)=>{t.exports=cB().omit})),uB=e(lB()),dB=e(h()),fB=[`width`,`height`,`className`,`style`,`children`,`type`];function pB(e,t){if(e==null)return{};var n,r,i=mB(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function mB(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}function hB(){return hB=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},hB.apply(null,arguments)}function gB(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function $(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?gB(Object(n),!0).forEach(function(t){_B(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):gB(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function _B(e,t,n){return(t=vB(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function vB(e){var t=yB(e,`string`);return typeof t==`symbol`?t:t+``}function yB(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}var bB=`value`,xB=(e,t)=>(0,dB.default)(e,t),SB=function(e){return`${arguments.length>1&&arguments[1]!==void 0?arguments[1]:``}children[${e}]`},CB={chartName:`Treemap`,defaultTooltipEventType:`item`,validateTooltipEventTypes:[`item`],tooltipPayloadSearcher:xB,eventEmitter:void 0},wB=e=>{var{depth:t,node:n,index:r,dataKey:i,nameKey:a,nestedActiveTooltipIndex:o}=e,s=t===0?``:SB(r,o),{children:c}=n,l=t+1,u=c&&c.length?c.map((e,t)=>wB({depth:l,node:e,index:t,dataKey:i,nameKey:a,nestedActiveTooltipIndex:s})):null,d=c&&c.length?u.reduce((e,t)=>e+t[bB],0):v(n[i])||n[i]<=0?0:n[i];return $($({},n),{},{children:u,name:z(n,a,``),[bB]:d,depth:t,index:r,tooltipIndex:s})},TB=e=>({x:e.x,y:e.y,width:e.width,height:e.height}),EB=(e,t)=>{var n=t<0?0:t;return e.map(e=>{var t=e[bB]*n;return $($({},e),{},{area:v(t)||t<=0?0:t})})},DB=(e,t,n)=>{var r=t*t,i=e.area*e.area,{min:a,max:o}=e.reduce((e,t)=>({min:Math.min(e.min,t.area),max:Math.max(e.max,t.area)}),{min:1/0,max:0});return i?Math.max(r*o*n/i,i/(r*a*n)):1/0},OB=(e,t,n,r)=>{var i=t?Math.round(e.area/t):0;(r||i>n.height)&&(i=n.height);for(var a=n.x,o,s=0,c=e.length;s<c;s++)o=e[s],o.x=a,o.y=n.y,o.height=i,o.width=Math.min(i?Math.round(o.area/i):0,n.x+n.width-a),a+=o.width;return o.width+=n.x+n.width-a,$($({},n),{},{y:n.y+i,height:n.height-i})},kB=(e,t,n,r)=>{var i=t?Math.round(e.area/t):0;(r||i>n.width)&&(i=n.width);for(var a=n.y,o,s=0,c=e.length;s<c;s++)o=e[s],o.x=n.x,o.y=a,o.width=i,o.height=Math.min(i?Math.round(o.area/i):0,n.y+n.height-a),a+=o.height;return o&&(o.height+=n.y+n.height-a),$($({},n),{},{x:n.x+i,width:n.width-i})},AB=(e,t,n,r)=>t===n.width?OB(e,t,n,r):kB(e,t,n,r),jB=(e,t)=>{var{children:n}=e;if(n&&n.length){var r=TB(e),i=[],a=1/0,o,s,c=Math.min(r.width,r.height),l=EB(n,r.width*r.height/e[bB]),u=l.slice();for(i.area=0;u.length>0;)i.push(o=u[0]),i.area+=o.area,s=DB(i,c,t),s<=a?(u.shift(),a=s):(i.area-=i.pop().area,r=AB(i,c,r,!1),c=Math.min(r.width,r.height),i.length=i.area=0,a=1/0);return i.length&&=(r=AB(i,c,r,!0),i.area=0),$($({},e),{},{children:l.map(e=>jB(e,t))})}return e},MB={isAnimationFinished:!1,formatRoot:null,currentRoot:null,nestIndex:[]};function NB(e){var{content:t,nodeProps:n,type:r,colorPanel:i,onMouseEnter:a,onMouseLeave:o,onClick:s}=e;if(A.isValidElement(t))return A.createElement(N,{onMouseEnter:a,onMouseLeave:o,onClick:s},A.cloneElement(t,n));if(typeof t==`function`)return A.createElement(N,{onMouseEnter:a,onMouseLeave:o,onClick:s},t(n));var{x:c,y:l,width:u,height:d,index:f}=n,p=null;u>10&&d>10&&n.children&&r===`nest`&&(p=A.createElement(lT,{points:[{x:c+2,y:l+d/2},{x:c+6,y:l+d/2+3},{x:c+2,y:l+d/2+6}]}));var m=null,h=MC(n.name);u>20&&d>20&&h.width<u&&h.height<d&&(m=A.createElement(`text`,{x:c+8,y:l+d/2+7,fontSize:14},n.name));var g=i||Os;return A.createElement(`g`,null,A.createElement(yu,hB({fill:n.depth<2?g[f%g.length]:`rgba(255,255,255,0)`,stroke:`#fff`},(0,uB.default)(n,[`children`]),{onMouseEnter:a,onMouseLeave:o,onClick:s,"data-recharts-item-index":n.tooltipIndex})),p,m)}function PB(e){var t=F(),n=e.nodeProps?{x:e.nodeProps.x+e.nodeProps.width/2,y:e.nodeProps.y+e.nodeProps.height/2}:null;return A.createElement(NB,hB({},e,{onMouseEnter:()=>{t(yb({activeIndex:e.nodeProps.tooltipIndex,activeDataKey:e.dataKey,activeCoordinate:n}))},onMouseLeave:()=>{},onClick:()=>{t(Sb({activeIndex:e.nodeProps.tooltipIndex,activeDataKey:e.dataKey,activeCoordinate:n}))}}))}function FB(e){var{props:t,currentRoot:n}=e,{dataKey:r,nameKey:i,stroke:a,fill:o}=t;return{dataDefinedOnItem:n,positions:void 0,settings:{stroke:a,strokeWidth:void 0,fill:o,dataKey:r,nameKey:i,name:void 0,hide:!1,type:void 0,color:o,unit:``}}}var IB={top:0,right:0,bottom:0,left:0},LB=class extends A.PureComponent{constructor(){super(...arguments),_B(this,`state`,$({},MB)),_B(this,`handleAnimationEnd`,()=>{var{onAnimationEnd:e}=this.props;this.setState({isAnimationFinished:!0}),typeof e==`function`&&e()}),_B(this,`handleAnimationStart`,()=>{var{onAnimationStart:e}=this.props;this.setState({isAnimationFinished:!1}),typeof e==`function`&&e()}),_B(this,`handleTouchMove`,(e,t)=>{var n=t.touches[0],r=document.elementFromPoint(n.clientX,n.clientY);if(!(!r||!r.getAttribute)){var i=r.getAttribute(`data-recharts-item-index`),a=xB(this.state.formatRoot,i);if(a){var{dataKey:o,dispatch:s}=this.props,c={x:a.x+a.width/2,y:a.y+a.height/2};s(yb({activeIndex:i,activeDataKey:o,activeCoordinate:c}))}}})}static getDerivedStateFromProps(e,t){if(e.data!==t.prevData||e.type!==t.prevType||e.width!==t.prevWidth||e.height!==t.prevHeight||e.dataKey!==t.prevDataKey||e.aspectRatio!==t.prevAspectRatio){var n=wB({depth:0,node:{children:e.data,x:0,y:0,width:e.width,height:e.height},index:0,dataKey:e.dataKey,nameKey:e.nameKey}),r=jB(n,e.aspectRatio);return $($({},t),{},{formatRoot:r,currentRoot:n,nestIndex:[n],prevAspectRatio:e.aspectRatio,prevData:e.data,prevWidth:e.width,prevHeight:e.height,prevDataKey:e.dataKey,prevType:e.type})}return null}handleMouseEnter(e,t){t.persist();var{onMouseEnter:n}=this.props;n&&n(e,t)}handleMouseLeave(e,t){t.persist();var{onMouseLeave:n}=this.props;n&&n(e,t)}handleClick(e){var{onClick:t,type:n}=this.props;if(n===`nest`&&e.children){var{width:r,height:i,dataKey:a,nameKey:o,aspectRatio:s}=this.props,c=wB({depth:0,node:$($({},e),{},{x:0,y:0,width:r,height:i}),index:0,dataKey:a,nameKey:o,nestedActiveTooltipIndex:e.tooltipIndex}),l=jB(c,s),{nestIndex:u}=this.state;u.push(e),this.setState({formatRoot:l,currentRoot:c,nestIndex:u})}t&&t(e)}handleNestIndex(e,t){var{nestIndex:n}=this.state,{width:r,height:i,dataKey:a,nameKey:o,aspectRatio:s}=this.props,c=wB({depth:0,node:$($({},e),{},{x:0,y:0,width:r,height:i}),index:0,dataKey:a,nameKey:o,nestedActiveTooltipIndex:e.tooltipIndex}),l=jB(c,s);n=n.slice(0,t+1),this.setState({formatRoot:l,currentRoot:e,nestIndex:n})}renderItem(e,t,n){var{isAnimationActive:r,animationBegin:i,animationDuration:a,animationEasing:o,isUpdateAnimationActive:s,type:c,colorPanel:l,dataKey:u}=this.props,{isAnimationFinished:d}=this.state,{width:f,height:p,x:m,y:h,depth:g}=t,_=parseInt(`${(Math.random()*2-1)*f}`,10),v={};return(n||c===`nest`)&&(v={onMouseEnter:this.handleMouseEnter.bind(this,t),onMouseLeave:this.handleMouseLeave.bind(this,t),onClick:this.handleClick.bind(this,t)}),r?A.createElement(dR,{animationId:`treemap-${t.tooltipIndex}`,from:`translate(${_}px, ${_}px)`,to:`translate(0, 0)`,attributeName:`transform`,begin:i,easing:o,isActive:r,duration:a,onAnimationStart:this.handleAnimationStart,onAnimationEnd:this.handleAnimationEnd},n=>A.createElement(N,hB({},v,{style:n}),g>2&&!d?null:A.createElement(PB,{content:e,dataKey:u,nodeProps:$($({},t),{},{isAnimationActive:r,isUpdateAnimationActive:!s,width:f,height:p,x:m,y:h}),type:c,colorPanel:l}))):A.createElement(N,v,A.createElement(PB,{content:e,dataKey:u,nodeProps:$($({},t),{},{isAnimationActive:!1,isUpdateAnimationActive:!1,width:f,height:p,x:m,y:h}),type:c,colorPanel:l}))}renderNode(e,t){var{content:n,type:r}=this.props,i=$($($({},j(this.props)),t),{},{root:e}),a=!t.children||!t.children.length,{currentRoot:o}=this.state;return!(o.children||[]).filter(e=>e.depth===t.depth&&e.name===t.name).length&&e.depth&&r===`nest`?null:A.createElement(N,{key:`recharts-treemap-node-${i.x}-${i.y}-${i.name}`,className:`recharts-treemap-depth-${t.depth}`},this.renderItem(n,i,a),t.children&&t.children.length?t.children.map(e=>this.renderNode(t,e)):null)}renderAllNodes(){var{formatRoot:e}=this.state;return e?this.renderNode(e,e):null}renderNestIndex(){var{nameKey:e,nestIndexContent:t}=this.props,{nestIndex:n}=this.state;return A.createElement(`div`,{className:`recharts-treemap-nest-index-wrapper`,style:{marginTop:`8px`,textAlign:`center`}},n.map((n,r)=>{var i=(0,dB.default)(n,e,`root`),a=null;return A.isValidElement(t)&&(a=A.cloneElement(t,n,r)),a=typeof t==`function`?t(n,r):i,A.createElement(`div`,{onClick:this.handleNestIndex.bind(this,n,r),key:`nest-index-${C()}`,className:`recharts-treemap-nest-index-box`,style:{cursor:`pointer`,display:`inline-block`,padding:`0 7px`,background:`#000`,color:`#fff`,marginRight:`3px`}},a)}))}render(){var e=this.props,{width:t,height:n,className:r,style:i,children:a,type:o}=e,s=pB(e,fB),c=j(s);return A.createElement(gS.Provider,{value:this.state.tooltipPortal},A.createElement(ND,{fn:FB,args:{props:this.props,currentRoot:this.state.currentRoot}}),A.createElement(Oz,{className:r,style:i,width:t,height:n,ref:e=>{this.state.tooltipPortal??this.setState({tooltipPortal:e})},onMouseEnter:void 0,onMouseLeave:void 0,onClick:void 0,onMouseMove:void 0,onMouseDown:void 0,onMouseUp:void 0,onContextMenu:void 0,onDoubleClick:void 0,onTouchStart:void 0,onTouchMove:this.handleTouchMove,onTouchEnd:void 0},A.createElement(Te,hB({},c,{width:t,height:o===`nest`?n-30:n}),this.renderAllNodes(),a),o===`nest`&&this.renderNestIndex()))}};_B(LB,`displayName`,`Treemap`),_B(LB,`defaultProps`,{aspectRatio:.5*(1+Math.sqrt(5)),dataKey:`value`,nameKey:`name`,type:`flat`,isAnimationActive:!qc.isSsr,isUpdateAnimationActive:!qc.isSsr,animationBegin:0,animationDuration:1500,animationEasing:`linear`});function RB(e){var t=F();return A.createElement(LB,hB({},e,{dispatch:t}))}function zB(e){var{width:t,height:n}=e;return!Xc(t)||!Xc(n)?null:A.createElement(dz,{preloadedState:{options:CB},reduxStoreName:e.className??`Treemap`},A.createElement(tc,{width:t,height:n}),A.createElement(nc,{margin:IB}),A.createElement(RB,e))}var BB=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=Xn();function n(e,n){if(!e||!e.length)return 0;n!=null&&(n=t.iteratee(n));let r;for(let t=0;t<e.length;t++){let i=n?n(e[t]):e[t];i!==void 0&&(r===void 0?r=i:r+=i)}return r}exports.sumBy=n})),VB=n(((exports,t)=>{t.exports=BB().sumBy})),HB=e(YT()),UB=e(VB()),WB=e(h()),GB=[`sourceX`,`sourceY`,`sourceControlX`,`targetX`,`targetY`,`targetControlX`,`linkWidth`],KB=[`width`,`height`,`className`,`style`,`children`];function qB(){return qB=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},qB.apply(null,arguments)}function JB(e,t){if(e==null)return{};var n,r,i=YB(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function YB(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}function XB(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function ZB(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?XB(Object(n),!0).forEach(function(t){QB(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):XB(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function QB(e,t,n){return(t=$B(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function $B(e){var t=eV(e,`string`);return typeof t==`symbol`?t:t+``}function eV(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}var tV=(e,t)=>{var n=+e,r=t-n;return e=>n+r*e},nV=e=>e.y+e.dy/2,rV=e=>e&&e.value||0,iV=(e,t)=>t.reduce((t,n)=>t+rV(e[n]),0),aV=(e,t,n)=>n.reduce((n,r)=>{var i=t[r],a=e[i.source];return n+nV(a)*rV(t[r])},0),oV=(e,t,n)=>n.reduce((n,r)=>{var i=t[r],a=e[i.target];return n+nV(a)*rV(t[r])},0),sV=(e,t)=>e.y-t.y,cV=(e,t)=>{for(var n=[],r=[],i=[],a=[],o=0,s=e.length;o<s;o++){var c=e[o];c.source===t&&(i.push(c.target),a.push(o)),c.target===t&&(n.push(c.source),r.push(o))}return{sourceNodes:n,sourceLinks:r,targetLinks:a,targetNodes:i}},lV=(e,t)=>{for(var{targetNodes:n}=t,r=0,i=n.length;r<i;r++){var a=e[n[r]];a&&(a.depth=Math.max(t.depth+1,a.depth),lV(e,a))}},uV=(e,t,n)=>{for(var{nodes:r,links:i}=e,a=r.map((e,t)=>{var n=cV(i,t);return ZB(ZB(ZB({},e),n),{},{value:Math.max(iV(i,n.sourceLinks),iV(i,n.targetLinks)),depth:0})}),o=0,s=a.length;o<s;o++){var c=a[o];c.sourceNodes.length||lV(a,c)}var l=(0,HB.default)(a,e=>e.depth).depth;if(l>=1)for(var u=(t-n)/l,d=0,f=a.length;d<f;d++){var p=a[d];p.targetNodes.length||(p.depth=l),p.x=p.depth*u,p.dx=n}return{tree:a,maxDepth:l}},dV=e=>{for(var t=[],n=0,r=e.length;n<r;n++){var i=e[n];t[i.depth]||(t[i.depth]=[]),t[i.depth].push(i)}return t},fV=(e,t,n,r)=>{for(var i=Math.min(...e.map(e=>(t-(e.length-1)*n)/(0,UB.default)(e,rV))),a=0,o=e.length;a<o;a++)for(var s=0,c=e[a].length;s<c;s++){var l=e[a][s];l.y=s,l.dy=l.value*i}return r.map(e=>ZB(ZB({},e),{},{dy:rV(e)*i}))},pV=function(e,t,n){for(var r=arguments.length>3&&arguments[3]!==void 0?arguments[3]:!0,i=0,a=e.length;i<a;i++){var o=e[i],s=o.length;r&&o.sort(sV);for(var c=0,l=0;l<s;l++){var u=o[l],d=c-u.y;d>0&&(u.y+=d),c=u.y+u.dy+n}c=t+n;for(var f=s-1;f>=0;f--){var p=o[f],m=p.y+p.dy+n-c;if(m>0)p.y-=m,c=p.y;else break}}},mV=(e,t,n,r)=>{for(var i=0,a=t.length;i<a;i++)for(var o=t[i],s=0,c=o.length;s<c;s++){var l=o[s];if(l.sourceLinks.length){var u=iV(n,l.sourceLinks),d=aV(e,n,l.sourceLinks)/u;l.y+=(d-nV(l))*r}}},hV=(e,t,n,r)=>{for(var i=t.length-1;i>=0;i--)for(var a=t[i],o=0,s=a.length;o<s;o++){var c=a[o];if(c.targetLinks.length){var l=iV(n,c.targetLinks),u=oV(e,n,c.targetLinks)/l;c.y+=(u-nV(c))*r}}},gV=(e,t)=>{for(var n=0,r=e.length;n<r;n++){var i=e[n],a=0,o=0;i.targetLinks.sort((n,r)=>e[t[n].target].y-e[t[r].target].y),i.sourceLinks.sort((n,r)=>e[t[n].source].y-e[t[r].source].y);for(var s=0,c=i.targetLinks.length;s<c;s++){var l=t[i.targetLinks[s]];l&&(l.sy=a,a+=l.dy)}for(var u=0,d=i.sourceLinks.length;u<d;u++){var f=t[i.sourceLinks[u]];f&&(f.ty=o,o+=f.dy)}}},_V=e=>{var{data:t,width:n,height:r,iterations:i,nodeWidth:a,nodePadding:o,sort:s}=e,{links:c}=t,{tree:l}=uV(t,n,a),u=dV(l),d=fV(u,r,o,c);pV(u,r,o,s);for(var f=1,p=1;p<=i;p++)hV(l,u,d,f*=.99),pV(u,r,o,s),mV(l,u,d,f),pV(u,r,o,s);return gV(l,d),{nodes:l,links:d}},vV=(e,t)=>t===`node`?{x:+e.x+e.width/2,y:+e.y+e.height/2}:`sourceX`in e&&{x:(e.sourceX+e.targetX)/2,y:(e.sourceY+e.targetY)/2},yV=(e,t,n)=>{var{payload:r}=e;if(t===`node`)return{payload:r,name:z(r,n,``),value:z(r,`value`)};if(`source`in r&&r.source&&r.target){var i=z(r.source,n,``),a=z(r.target,n,``);return{payload:r,name:`${i} - ${a}`,value:z(r,`value`)}}return null},bV={chartName:`Sankey`,defaultTooltipEventType:`item`,validateTooltipEventTypes:[`item`],tooltipPayloadSearcher:(e,t,n,r)=>{if(!(t==null||typeof t!=`string`)){var[i,a]=t.split(`-`),o=(0,WB.default)(n,`${i}s[${a}]`);if(o)return yV(o,i,r)}},eventEmitter:void 0};function xV(e){var{dataKey:t,nameKey:n,stroke:r,strokeWidth:i,fill:a,name:o,data:s}=e;return{dataDefinedOnItem:s,positions:void 0,settings:{stroke:r,strokeWidth:i,fill:a,dataKey:t,name:o,nameKey:n,color:a,unit:``}}}var SV={top:0,right:0,bottom:0,left:0};function CV(e,t){if(A.isValidElement(e))return A.cloneElement(e,t);if(typeof e==`function`)return e(t);var{sourceX:n,sourceY:r,sourceControlX:i,targetX:a,targetY:o,targetControlX:s,linkWidth:c}=t,l=JB(t,GB);return A.createElement(`path`,qB({className:`recharts-sankey-link`,d:`
-          M${n},${r}
-          C${i},${r} ${s},${o} ${a},${o}
-        `,fill:`none`,stroke:`#333`,strokeWidth:c,strokeOpacity:`0.2`},j(l)))}var wV=e=>{var{link:t,nodes:n,left:r,top:i,i:a,linkContent:o,linkCurvature:s}=e,{sy:c,ty:l,dy:u}=t,d=n[t.source],f=n[t.target],p=d.x+d.dx+r,m=f.x+r,h=tV(p,m),g=h(s),_=h(1-s),v=d.y+c+u/2+i,y=f.y+l+u/2+i;return ZB({sourceX:p,targetX:m,sourceY:v,targetY:y,sourceControlX:g,targetControlX:_,sourceRelativeY:c,targetRelativeY:l,linkWidth:u,index:a,payload:ZB(ZB({},t),{},{source:d,target:f})},M(o,!1))};function TV(e){var{props:t,i:n,linkContent:r,onMouseEnter:i,onMouseLeave:a,onClick:o,dataKey:s}=e,c=vV(t,`link`),l=`link-${n}`,u=F();return A.createElement(N,{onMouseEnter:e=>{u(yb({activeIndex:l,activeDataKey:s,activeCoordinate:c})),i(t,e)},onMouseLeave:e=>{u(bb()),a(t,e)},onClick:e=>{u(Sb({activeIndex:l,activeDataKey:s,activeCoordinate:c})),o(t,e)}},CV(r,t))}function EV(e){var{modifiedLinks:t,links:n,linkContent:r,onMouseEnter:i,onMouseLeave:a,onClick:o,dataKey:s}=e;return A.createElement(N,{className:`recharts-sankey-links`,key:`recharts-sankey-links`},n.map((e,n)=>{var c=t[n];return A.createElement(TV,{key:`link-${e.source}-${e.target}-${e.value}`,props:c,linkContent:r,i:n,onMouseEnter:i,onMouseLeave:a,onClick:o,dataKey:s})}))}function DV(e,t){return A.isValidElement(e)?A.cloneElement(e,t):typeof e==`function`?e(t):A.createElement(yu,qB({className:`recharts-sankey-node`,fill:`#0088fe`,fillOpacity:`0.8`},j(t)))}var OV=e=>{var{node:t,nodeContent:n,top:r,left:i,i:a}=e,{x:o,y:s,dx:c,dy:l}=t;return ZB(ZB({},M(n,!1)),{},{x:o+i,y:s+r,width:c,height:l,index:a,payload:t})};function kV(e){var{props:t,nodeContent:n,i:r,onMouseEnter:i,onMouseLeave:a,onClick:o,dataKey:s}=e,c=F(),l=vV(t,`node`),u=`node-${r}`;return A.createElement(N,{onMouseEnter:e=>{c(yb({activeIndex:u,activeDataKey:s,activeCoordinate:l})),i(t,e)},onMouseLeave:e=>{c(bb()),a(t,e)},onClick:e=>{c(Sb({activeIndex:u,activeDataKey:s,activeCoordinate:l})),o(t,e)}},DV(n,t))}function AV(e){var{modifiedNodes:t,nodeContent:n,onMouseEnter:r,onMouseLeave:i,onClick:a,dataKey:o}=e;return A.createElement(N,{className:`recharts-sankey-nodes`,key:`recharts-sankey-nodes`},t.map((e,t)=>A.createElement(kV,{props:e,nodeContent:n,i:t,onMouseEnter:r,onMouseLeave:i,onClick:a,dataKey:o})))}var jV=class extends A.PureComponent{constructor(){super(...arguments),QB(this,`state`,{nodes:[],links:[],modifiedLinks:[],modifiedNodes:[]})}static getDerivedStateFromProps(e,t){var{data:n,width:r,height:i,margin:a,iterations:o,nodeWidth:s,nodePadding:c,sort:l,linkCurvature:u}=e;if(n!==t.prevData||r!==t.prevWidth||i!==t.prevHeight||!CP(a,t.prevMargin)||o!==t.prevIterations||s!==t.prevNodeWidth||c!==t.prevNodePadding||l!==t.sort){var d=r-(a&&a.left||0)-(a&&a.right||0),f=i-(a&&a.top||0)-(a&&a.bottom||0),{links:p,nodes:m}=_V({data:n,width:d,height:f,iterations:o,nodeWidth:s,nodePadding:c,sort:l}),h=(0,WB.default)(a,`top`)||0,g=(0,WB.default)(a,`left`)||0,_=p.map((t,n)=>wV({link:t,nodes:m,i:n,top:h,left:g,linkContent:e.link,linkCurvature:u})),v=m.map((t,n)=>OV({node:t,nodeContent:e.node,i:n,top:h,left:g}));return ZB(ZB({},t),{},{nodes:m,links:p,modifiedLinks:_,modifiedNodes:v,prevData:n,prevWidth:o,prevHeight:i,prevMargin:a,prevNodePadding:c,prevNodeWidth:s,prevIterations:o,prevSort:l})}return null}handleMouseEnter(e,t,n){var{onMouseEnter:r}=this.props;r&&r(e,t,n)}handleMouseLeave(e,t,n){var{onMouseLeave:r}=this.props;r&&r(e,t,n)}handleClick(e,t,n){var{onClick:r}=this.props;r&&r(e,t,n)}render(){var e=this.props,{width:t,height:n,className:r,style:i,children:a}=e,o=JB(e,KB);if(!Xc(t)||!Xc(n))return null;var{links:s,modifiedNodes:c,modifiedLinks:l}=this.state,u=j(o);return A.createElement(dz,{preloadedState:{options:bV},reduxStoreName:r??`Sankey`},A.createElement(ND,{fn:xV,args:this.props}),A.createElement(zM,{computedData:{links:l,nodes:c}}),A.createElement(tc,{width:t,height:n}),A.createElement(nc,{margin:SV}),A.createElement(gS.Provider,{value:this.state.tooltipPortal},A.createElement(Oz,{className:r,style:i,width:t,height:n,ref:e=>{this.state.tooltipPortal??this.setState({tooltipPortal:e})},onMouseEnter:void 0,onMouseLeave:void 0,onClick:void 0,onMouseMove:void 0,onMouseDown:void 0,onMouseUp:void 0,onContextMenu:void 0,onDoubleClick:void 0,onTouchStart:void 0,onTouchMove:void 0,onTouchEnd:void 0},A.createElement(Te,qB({},u,{width:t,height:n}),a,A.createElement(EV,{links:s,modifiedLinks:l,linkContent:this.props.link,dataKey:this.props.dataKey,onMouseEnter:(e,t)=>this.handleMouseEnter(e,`link`,t),onMouseLeave:(e,t)=>this.handleMouseLeave(e,`link`,t),onClick:(e,t)=>this.handleClick(e,`link`,t)}),A.createElement(AV,{modifiedNodes:c,nodeContent:this.props.node,dataKey:this.props.dataKey,onMouseEnter:(e,t)=>this.handleMouseEnter(e,`node`,t),onMouseLeave:(e,t)=>this.handleMouseLeave(e,`node`,t),onClick:(e,t)=>this.handleClick(e,`node`,t)})))))}};QB(jV,`displayName`,`Sankey`),QB(jV,`defaultProps`,{nameKey:`name`,dataKey:`value`,nodePadding:10,nodeWidth:10,linkCurvature:.5,iterations:32,margin:{top:5,right:5,bottom:5,left:5},sort:!0});var MV=[`axis`],NV={layout:`centric`,startAngle:90,endAngle:-270,cx:`50%`,cy:`50%`,innerRadius:0,outerRadius:`80%`},PV=(0,A.forwardRef)((e,t)=>{var n=H(e,NV);return A.createElement(Yz,{chartName:`RadarChart`,defaultTooltipEventType:`axis`,validateTooltipEventTypes:MV,tooltipPayloadSearcher:SS,categoricalChartProps:n,ref:t})}),FV=[`item`],IV=(0,A.forwardRef)((e,t)=>A.createElement(Rz,{chartName:`ScatterChart`,defaultTooltipEventType:`item`,validateTooltipEventTypes:FV,tooltipPayloadSearcher:SS,categoricalChartProps:e,ref:t})),LV=[`axis`],RV=(0,A.forwardRef)((e,t)=>A.createElement(Rz,{chartName:`AreaChart`,defaultTooltipEventType:`axis`,validateTooltipEventTypes:LV,tooltipPayloadSearcher:SS,categoricalChartProps:e,ref:t})),zV=[`axis`,`item`],BV={layout:`radial`,startAngle:0,endAngle:360,cx:`50%`,cy:`50%`,innerRadius:0,outerRadius:`80%`},VV=(0,A.forwardRef)((e,t)=>{var n=H(e,BV);return A.createElement(Yz,{chartName:`RadialBarChart`,defaultTooltipEventType:`axis`,validateTooltipEventTypes:zV,tooltipPayloadSearcher:SS,categoricalChartProps:n,ref:t})}),HV=[`axis`],UV=(0,A.forwardRef)((e,t)=>A.createElement(Rz,{chartName:`ComposedChart`,defaultTooltipEventType:`axis`,validateTooltipEventTypes:HV,tooltipPayloadSearcher:SS,categoricalChartProps:e,ref:t})),WV=e(h());function GV(){return GV=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},GV.apply(null,arguments)}function KV(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function qV(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?KV(Object(n),!0).forEach(function(t){JV(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):KV(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function JV(e,t,n){return(t=YV(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function YV(e){var t=XV(e,`string`);return typeof t==`symbol`?t:t+``}function XV(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}var ZV={fontWeight:`bold`,paintOrder:`stroke fill`,fontSize:`.75rem`,stroke:`#FFF`,fill:`black`,pointerEvents:`none`};function QV(e){if(!e.children||e.children.length===0)return 1;var t=e.children.map(e=>QV(e));return 1+Math.max(...t)}function $V(e){var t={};return e.forEach((e,n)=>{t[n]=e}),t}function eH(e){var{dataKey:t,nameKey:n,data:r,stroke:i,fill:a,positions:o}=e;return{dataDefinedOnItem:r.children,positions:$V(o),settings:{stroke:i,strokeWidth:void 0,fill:a,nameKey:n,dataKey:t,name:n?void 0:t,hide:!1,type:void 0,color:a,unit:``}}}var tH={top:0,right:0,bottom:0,left:0},nH=(e,t)=>(0,WV.default)(e,t),rH=function(e){return`${arguments.length>1&&arguments[1]!==void 0?arguments[1]:``}children[${e}]`},iH={options:{validateTooltipEventTypes:[`item`],defaultTooltipEventType:`item`,chartName:`Sunburst`,tooltipPayloadSearcher:nH,eventEmitter:void 0}},aH=e=>{var{className:t,data:n,children:r,width:i,height:a,padding:o=2,dataKey:s=`value`,nameKey:l=`name`,ringPadding:u=2,innerRadius:d=50,fill:f=`#333`,stroke:p=`#FFF`,textOptions:m=ZV,outerRadius:h=Math.min(i,a)/2,cx:g=i/2,cy:_=a/2,startAngle:v=0,endAngle:y=360,onClick:b,onMouseEnter:x,onMouseLeave:S}=e,C=F(),w=op([0,n[s]],[0,y]),T=QV(n),E=(h-d)/T,D=[],O=new Map([]),[ee,k]=(0,A.useState)(null);function te(e,t){x&&x(e,t),C(yb({activeIndex:e.tooltipIndex,activeDataKey:s,activeCoordinate:O.get(e.name)}))}function ne(e,t){S&&S(e,t),C(bb())}function re(e){b&&b(e),C(Sb({activeIndex:e.tooltipIndex,activeDataKey:s,activeCoordinate:O.get(e.name)}))}function ie(e,t){var n=arguments.length>2&&arguments[2]!==void 0?arguments[2]:1,{radius:r,innerR:i,initialAngle:a,childColor:c,nestedActiveTooltipIndex:l}=t,d=a;e&&e.forEach((e,t)=>{var a=n===1?`[${t}]`:rH(t,l),h=qV(qV({},e),{},{tooltipIndex:a}),v=w(e[s]),y=d,b=e?.fill??c??f,{x,y:S}=R(0,0,i+r/2,-(y+v-v/2));d+=v,D.push(A.createElement(`g`,{key:`sunburst-sector-${e.name}-${t}`},A.createElement(Du,{onClick:()=>re(h),onMouseEnter:e=>te(h,e),onMouseLeave:e=>ne(h,e),fill:b,stroke:p,strokeWidth:o,startAngle:y,endAngle:y+v,innerRadius:i,outerRadius:i+r,cx:g,cy:_}),A.createElement(aw,GV({},m,{alignmentBaseline:`middle`,textAnchor:`middle`,x:x+g,y:_-S}),e[s])));var{x:C,y:T}=R(g,_,i+r/2,y);return O.set(e.name,{x:C,y:T}),ie(e.children,{radius:r,innerR:i+r+u,initialAngle:y,childColor:b,nestedActiveTooltipIndex:a},n+1)})}ie(n.children,{radius:E,innerR:d,initialAngle:v});var ae=c(`recharts-sunburst`,t);return A.createElement(gS.Provider,{value:ee},A.createElement(Oz,{className:t,width:i,height:a,ref:e=>{ee==null&&e!=null&&k(e)},onMouseEnter:void 0,onMouseLeave:void 0,onClick:void 0,onMouseMove:void 0,onMouseDown:void 0,onMouseUp:void 0,onContextMenu:void 0,onDoubleClick:void 0,onTouchStart:void 0,onTouchMove:void 0,onTouchEnd:void 0},A.createElement(Te,{width:i,height:a},A.createElement(N,{className:ae},D),A.createElement(ND,{fn:eH,args:{dataKey:s,data:n,stroke:p,fill:f,nameKey:l,positions:O}}),r)))},oH=e=>A.createElement(dz,{preloadedState:iH,reduxStoreName:e.className??`SunburstChart`},A.createElement(tc,{width:e.width,height:e.height}),A.createElement(nc,{margin:tH}),A.createElement(aH,e));function sH(){return sH=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},sH.apply(null,arguments)}function cH(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function lH(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?cH(Object(n),!0).forEach(function(t){uH(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):cH(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function uH(e,t,n){return(t=dH(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function dH(e){var t=fH(e,`string`);return typeof t==`symbol`?t:t+``}function fH(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function pH(e,t){var n=`${t.x||e.x}`,r=parseInt(n,10),i=`${t.y||e.y}`,a=parseInt(i,10),o=`${t?.height||e?.height}`,s=parseInt(o,10);return lH(lH(lH({},t),OD(e)),{},{height:s,x:r,y:a})}function mH(e){return A.createElement(kD,sH({shapeType:`trapezoid`,propTransformer:pH},e))}function hH(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function gH(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?hH(Object(n),!0).forEach(function(t){_H(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):hH(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function _H(e,t,n){return(t=vH(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function vH(e){var t=yH(e,`string`);return typeof t==`symbol`?t:t+``}function yH(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}var bH=L([Vs,(e,t)=>t,gg],(e,t,n)=>{var{data:r,dataKey:i,nameKey:a,tooltipType:o,lastShapeType:s,reversed:c,customWidth:l,cells:u,presentationProps:d}=t,{chartData:f}=n,p;if(r!=null&&r.length>0?p=r:f!=null&&f.length>0&&(p=f),p&&p.length)p=p.map((e,t)=>gH(gH(gH({payload:e},d),e),u&&u[t]&&u[t].props));else if(u&&u.length)p=u.map(e=>gH(gH({},d),e.props));else return[];return VH({dataKey:i,nameKey:a,displayedData:p,tooltipType:o,lastShapeType:s,reversed:c,offset:e,customWidth:l})}),xH=e(lB()),SH=[`onMouseEnter`,`onClick`,`onMouseLeave`,`shape`,`activeShape`],CH=[`stroke`,`fill`,`legendType`,`hide`,`isAnimationActive`,`animationBegin`,`animationDuration`,`animationEasing`,`nameKey`,`lastShapeType`];function wH(){return wH=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},wH.apply(null,arguments)}function TH(e,t){if(e==null)return{};var n,r,i=EH(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function EH(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}function DH(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function OH(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?DH(Object(n),!0).forEach(function(t){kH(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):DH(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function kH(e,t,n){return(t=AH(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function AH(e){var t=jH(e,`string`);return typeof t==`symbol`?t:t+``}function jH(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function MH(e){var{dataKey:t,nameKey:n,stroke:r,strokeWidth:i,fill:a,name:o,hide:s,tooltipType:c,data:l}=e;return{dataDefinedOnItem:l,positions:e.trapezoids.map(e=>{var{tooltipPosition:t}=e;return t}),settings:{stroke:r,strokeWidth:i,fill:a,dataKey:t,name:o,nameKey:n,hide:s,type:c,color:a,unit:``}}}function NH(e){var{showLabels:t,trapezoids:n,children:r}=e,i=(0,A.useMemo)(()=>{if(t)return n?.map(e=>{var t={x:e.x,y:e.y,width:e.upperWidth,height:e.height};return OH(OH({},t),{},{value:e.name,payload:e.payload,parentViewBox:void 0,viewBox:t,fill:e.fill})})},[t,n]);return A.createElement(Ww,{value:i},r)}function PH(e){var{trapezoids:t,allOtherFunnelProps:n}=e,r=I(e=>$x(e,`item`,e.tooltip.settings.trigger,void 0)),{onMouseEnter:i,onClick:a,onMouseLeave:o,shape:s,activeShape:c}=n,l=TH(n,SH),u=AD(i,n.dataKey),d=jD(o),f=MD(a,n.dataKey);return A.createElement(A.Fragment,null,t.map((e,t)=>{var n=!!c&&r===String(t),i=n?c:s,a=OH(OH({},e),{},{option:i,isActive:n,stroke:e.stroke});return A.createElement(N,wH({className:`recharts-funnel-trapezoid`},le(l,e,t),{onMouseEnter:u(e,t),onMouseLeave:d(e,t),onClick:f(e,t),key:`trapezoid-${e?.x}-${e?.y}-${e?.name}-${e?.value}`}),A.createElement(mH,a))}))}function FH(e){var{previousTrapezoidsRef:t,props:n}=e,{trapezoids:r,isAnimationActive:i,animationBegin:a,animationDuration:o,animationEasing:s,onAnimationEnd:c,onAnimationStart:l}=n,u=t.current,[d,f]=(0,A.useState)(!1),p=!d,m=uu(r,`recharts-funnel-`),h=(0,A.useCallback)(()=>{typeof c==`function`&&c(),f(!1)},[c]),g=(0,A.useCallback)(()=>{typeof l==`function`&&l(),f(!0)},[l]);return A.createElement(NH,{showLabels:p,trapezoids:r},A.createElement(lu,{animationId:m,begin:a,duration:o,isActive:i,easing:s,key:m,onAnimationStart:g,onAnimationEnd:h},e=>{var i=e===1?r:r.map((t,n)=>{var r=u&&u[n];return r?OH(OH({},t),{},{x:D(r.x,t.x,e),y:D(r.y,t.y,e),upperWidth:D(r.upperWidth,t.upperWidth,e),lowerWidth:D(r.lowerWidth,t.lowerWidth,e),height:D(r.height,t.height,e)}):OH(OH({},t),{},{x:D(t.x+t.upperWidth/2,t.x,e),y:D(t.y+t.height/2,t.y,e),upperWidth:D(0,t.upperWidth,e),lowerWidth:D(0,t.lowerWidth,e),height:D(0,t.height,e)})});return e>0&&(t.current=i),A.createElement(N,null,A.createElement(PH,{trapezoids:i,allOtherFunnelProps:n}))}),A.createElement(Xw,{label:n.label}),n.children)}function IH(e){var t=(0,A.useRef)(void 0);return A.createElement(FH,{props:e,previousTrapezoidsRef:t})}var LH=(e,t)=>{var{width:n,height:r,left:i,right:a,top:o,bottom:s}=t,c=r,l=n;return b(e)?l=e:typeof e==`string`&&(l=l*parseFloat(e)/100),{realWidth:l-i-a-50,realHeight:c-s-o,offsetX:(n-l)/2,offsetY:(r-c)/2}},RH=class extends A.PureComponent{render(){var{className:e}=this.props,t=c(`recharts-trapezoids`,e);return A.createElement(N,{className:t},A.createElement(IH,this.props))}},zH={stroke:`#fff`,fill:`#808080`,legendType:`rect`,hide:!1,isAnimationActive:!qc.isSsr,animationBegin:400,animationDuration:1500,animationEasing:`ease`,nameKey:`name`,lastShapeType:`triangle`};function BH(e){var t=KO(),n=H(e,zH),{stroke:r,fill:i,legendType:a,hide:o,isAnimationActive:s,animationBegin:c,animationDuration:l,animationEasing:u,nameKey:d,lastShapeType:f}=n,p=TH(n,CH),m=j(e),h=ve(e.children,gC),g=(0,A.useMemo)(()=>({dataKey:e.dataKey,nameKey:d,data:e.data,tooltipType:e.tooltipType,lastShapeType:f,reversed:e.reversed,customWidth:e.width,cells:h,presentationProps:m}),[e.dataKey,d,e.data,e.tooltipType,f,e.reversed,e.width,h,m]),_=I(e=>bH(e,g));if(o||!_||!_.length||!t)return null;var{height:v,width:y}=t;return A.createElement(A.Fragment,null,A.createElement(ND,{fn:MH,args:OH(OH({},e),{},{trapezoids:_})}),A.createElement(RH,wH({},p,{stroke:r,fill:i,nameKey:d,lastShapeType:f,animationBegin:c,animationDuration:l,animationEasing:u,isAnimationActive:s,hide:o,legendType:a,height:v,width:y,trapezoids:_})))}function VH(e){var{dataKey:t,nameKey:n,displayedData:r,tooltipType:i,lastShapeType:a,reversed:o,offset:s,customWidth:c}=e,{left:l,top:u}=s,{realHeight:d,realWidth:f,offsetX:p,offsetY:m}=LH(c,s),h=Math.max.apply(null,r.map(e=>z(e,t,0))),g=r.length,_=d/g,v={x:s.left,y:s.top,width:s.width,height:s.height},y=r.map((e,o)=>{var s=z(e,t,0),c=z(e,n,o),d=s,y;o===g-1?s instanceof Array&&s.length===2?[d,y]=s:y=a===`rectangle`?d:0:(y=z(r[o+1],t,0),y instanceof Array&&([y]=y));var b=(h-d)*f/(2*h)+u+25+p,x=_*o+l+m,S=d/h*f,C=y/h*f,w=[{name:c,value:d,payload:e,dataKey:t,type:i}],T={x:b+S/2,y:x+_/2};return OH(OH({x:b,y:x,width:Math.max(S,C),upperWidth:S,lowerWidth:C,height:_,name:c,val:d,tooltipPayload:w,tooltipPosition:T},(0,xH.default)(e,[`width`])),{},{payload:e,parentViewBox:v,labelViewBox:{x:b+(S-C)/4,y:x,width:Math.abs(S-C)/2+Math.min(S,C),height:_}})});return o&&(y=y.map((e,t)=>{var n=e.y-t*_+(g-1-t)*_;return OH(OH({},e),{},{upperWidth:e.lowerWidth,lowerWidth:e.upperWidth,x:e.x-(e.lowerWidth-e.upperWidth)/2,y:e.y-t*_+(g-1-t)*_,tooltipPosition:OH(OH({},e.tooltipPosition),{},{y:n+_/2}),labelViewBox:OH(OH({},e.labelViewBox),{},{y:n})})})),y}var HH=class extends A.PureComponent{render(){return A.createElement(BH,this.props)}};kH(HH,`displayName`,`Funnel`),kH(HH,`defaultProps`,zH);var UH=[`item`],WH=(0,A.forwardRef)((e,t)=>A.createElement(Rz,{chartName:`FunnelChart`,defaultTooltipEventType:`item`,validateTooltipEventTypes:UH,tooltipPayloadSearcher:SS,categoricalChartProps:e,ref:t}));export{bl as $,qO as A,KT as B,SP as C,AM as D,vN as E,YO as F,Ow as G,lT as H,TO as I,hC as J,aw as K,hD as L,GO as M,KO as N,ij as O,JO as P,yu as Q,qE as R,oF as S,QN as T,eT as U,dT as V,Yw as W,h_ as X,nC as Y,Du as Z,VL as _,VV as a,Zs as at,mI as b,PV as c,gn as ct,Qz as d,ll as et,Hz as f,QL as g,lR as h,UV as i,Qs as it,WO as j,Gk as k,jV as l,N as lt,TR as m,HH as n,Pc as nt,RV as o,$s as ot,Bz as p,gC as q,oH as r,Tc as rt,IV as s,wn as st,WH as t,qc as tt,zB as u,Te as ut,nL as v,uP as w,OF as x,ZI as y,EE as z};
\ No newline at end of file
@@ -1 +0,0 @@
-import{t as e}from"./rolldown-runtime-D_juG1Xi.js";import{t}from"./react-BcXKmAwN.js";var n=e(((exports,t)=>{var n=`Expected a function`,r=NaN,i=`[object Symbol]`,a=/^\s+|\s+$/g,o=/^[-+]0x[0-9a-f]+$/i,s=/^0b[01]+$/i,c=/^0o[0-7]+$/i,l=parseInt,u=typeof global==`object`&&global&&global.Object===Object&&global,d=typeof self==`object`&&self&&self.Object===Object&&self,f=u||d||Function(`return this`)(),p=Object.prototype.toString,m=Math.max,h=Math.min,g=function(){return f.Date.now()};function _(e,t,r){var i,a,o,s,c,l,u=0,d=!1,f=!1,p=!0;if(typeof e!=`function`)throw TypeError(n);t=x(t)||0,v(r)&&(d=!!r.leading,f=`maxWait`in r,o=f?m(x(r.maxWait)||0,t):o,p=`trailing`in r?!!r.trailing:p);function _(t){var n=i,r=a;return i=a=void 0,u=t,s=e.apply(r,n),s}function y(e){return u=e,c=setTimeout(C,t),d?_(e):s}function b(e){var n=e-l,r=e-u,i=t-n;return f?h(i,o-r):i}function S(e){var n=e-l,r=e-u;return l===void 0||n>=t||n<0||f&&r>=o}function C(){var e=g();if(S(e))return w(e);c=setTimeout(C,b(e))}function w(e){return c=void 0,p&&i?_(e):(i=a=void 0,s)}function T(){c!==void 0&&clearTimeout(c),u=0,i=l=a=c=void 0}function E(){return c===void 0?s:w(g())}function D(){var e=g(),n=S(e);if(i=arguments,a=this,l=e,n){if(c===void 0)return y(l);if(f)return c=setTimeout(C,t),_(l)}return c===void 0&&(c=setTimeout(C,t)),s}return D.cancel=T,D.flush=E,D}function v(e){var t=typeof e;return!!e&&(t==`object`||t==`function`)}function y(e){return!!e&&typeof e==`object`}function b(e){return typeof e==`symbol`||y(e)&&p.call(e)==i}function x(e){if(typeof e==`number`)return e;if(b(e))return r;if(v(e)){var t=typeof e.valueOf==`function`?e.valueOf():e;e=v(t)?t+``:t}if(typeof e!=`string`)return e===0?e:+e;e=e.replace(a,``);var n=s.test(e);return n||c.test(e)?l(e.slice(2),n?2:8):o.test(e)?r:+e}t.exports=_})),r=e((exports=>{function r(e){"@babel/helpers - typeof";return r=typeof Symbol==`function`&&typeof Symbol.iterator==`symbol`?function(e){return typeof e}:function(e){return e&&typeof Symbol==`function`&&e.constructor===Symbol&&e!==Symbol.prototype?`symbol`:typeof e},r(e)}Object.defineProperty(exports,`__esModule`,{value:!0});var i=s(t()),a=s(n()),o=[`element`,`onChange`,`value`,`minLength`,`debounceTimeout`,`forceNotifyByEnter`,`forceNotifyOnBlur`,`onKeyDown`,`onBlur`,`inputRef`];function s(e){return e&&e.__esModule?e:{default:e}}function c(e,t){if(e==null)return{};var n=l(e,t),r,i;if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(i=0;i<a.length;i++)r=a[i],!(t.indexOf(r)>=0)&&Object.prototype.propertyIsEnumerable.call(e,r)&&(n[r]=e[r])}return n}function l(e,t){if(e==null)return{};var n={},r=Object.keys(e),i,a;for(a=0;a<r.length;a++)i=r[a],!(t.indexOf(i)>=0)&&(n[i]=e[i]);return n}function u(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function d(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?u(Object(n),!0).forEach(function(t){S(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):u(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function f(e,t){if(!(e instanceof t))throw TypeError(`Cannot call a class as a function`)}function p(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,`value`in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}function m(e,t,n){return t&&p(e.prototype,t),n&&p(e,n),Object.defineProperty(e,`prototype`,{writable:!1}),e}function h(e,t){if(typeof t!=`function`&&t!==null)throw TypeError(`Super expression must either be null or a function`);e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,`prototype`,{writable:!1}),t&&g(e,t)}function g(e,t){return g=Object.setPrototypeOf||function(e,t){return e.__proto__=t,e},g(e,t)}function _(e){var t=b();return function(){var n=x(e),r;if(t){var i=x(this).constructor;r=Reflect.construct(n,arguments,i)}else r=n.apply(this,arguments);return v(this,r)}}function v(e,t){if(t&&(r(t)===`object`||typeof t==`function`))return t;if(t!==void 0)throw TypeError(`Derived constructors may only return object or undefined`);return y(e)}function y(e){if(e===void 0)throw ReferenceError(`this hasn't been initialised - super() hasn't been called`);return e}function b(){if(typeof Reflect>`u`||!Reflect.construct||Reflect.construct.sham)return!1;if(typeof Proxy==`function`)return!0;try{return Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],function(){})),!0}catch{return!1}}function x(e){return x=Object.setPrototypeOf?Object.getPrototypeOf:function(e){return e.__proto__||Object.getPrototypeOf(e)},x(e)}function S(e,t,n){return t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}var C=function(e){h(n,e);var t=_(n);function n(e){var r;f(this,n),r=t.call(this,e),S(y(r),`onChange`,function(e){e.persist();var t=r.state.value,n=r.props.minLength;r.setState({value:e.target.value},function(){var i=r.state.value;if(i.length>=n){r.notify(e);return}t.length>i.length&&r.notify(d(d({},e),{},{target:d(d({},e.target),{},{value:``})}))})}),S(y(r),`onKeyDown`,function(e){e.key===`Enter`&&r.forceNotify(e);var t=r.props.onKeyDown;t&&(e.persist(),t(e))}),S(y(r),`onBlur`,function(e){r.forceNotify(e);var t=r.props.onBlur;t&&(e.persist(),t(e))}),S(y(r),`createNotifier`,function(e){if(e<0)r.notify=function(){return null};else if(e===0)r.notify=r.doNotify;else{var t=(0,a.default)(function(e){r.isDebouncing=!1,r.doNotify(e)},e);r.notify=function(e){r.isDebouncing=!0,t(e)},r.flush=function(){return t.flush()},r.cancel=function(){r.isDebouncing=!1,t.cancel()}}}),S(y(r),`doNotify`,function(){r.props.onChange.apply(void 0,arguments)}),S(y(r),`forceNotify`,function(e){var t=r.props.debounceTimeout;if(!(!r.isDebouncing&&t>0)){r.cancel&&r.cancel();var n=r.state.value,i=r.props.minLength;n.length>=i?r.doNotify(e):r.doNotify(d(d({},e),{},{target:d(d({},e.target),{},{value:n})}))}}),r.isDebouncing=!1,r.state={value:e.value===void 0||e.value===null?``:e.value};var i=r.props.debounceTimeout;return r.createNotifier(i),r}return m(n,[{key:`componentDidUpdate`,value:function(e){if(!this.isDebouncing){var t=this.props,n=t.value,r=t.debounceTimeout,i=e.debounceTimeout,a=e.value,o=this.state.value;n!==void 0&&a!==n&&o!==n&&this.setState({value:n}),r!==i&&this.createNotifier(r)}}},{key:`componentWillUnmount`,value:function(){this.flush&&this.flush()}},{key:`render`,value:function(){var e=this.props,t=e.element;e.onChange,e.value,e.minLength,e.debounceTimeout;var n=e.forceNotifyByEnter,r=e.forceNotifyOnBlur,a=e.onKeyDown,s=e.onBlur,l=e.inputRef,u=c(e,o),f=this.state.value,p=n?{onKeyDown:this.onKeyDown}:a?{onKeyDown:a}:{},m=r?{onBlur:this.onBlur}:s?{onBlur:s}:{},h=l?{ref:l}:{};return i.default.createElement(t,d(d(d(d({},u),{},{onChange:this.onChange,value:f},p),m),h))}}]),n}(i.default.PureComponent);exports.DebounceInput=C,S(C,`defaultProps`,{element:`input`,type:`text`,onKeyDown:void 0,onBlur:void 0,value:void 0,minLength:0,debounceTimeout:100,forceNotifyByEnter:!0,forceNotifyOnBlur:!0,inputRef:void 0})})),i=e(((exports,t)=>{var n=r(),i=n.DebounceInput;i.DebounceInput=i,t.exports=i}));export{i as t};
\ No newline at end of file
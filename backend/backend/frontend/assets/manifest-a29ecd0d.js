@@ -1 +0,0 @@
-window.__reactRouterManifest={"entry":{"module":"/assets/entry.client-Ckj2P0Y0.js","imports":["/assets/react-dom-Dr_efIFp.js","/assets/chunk-NISHYRIK-BsYev12b.js","/assets/react-BcXKmAwN.js","/assets/rolldown-runtime-D_juG1Xi.js"],"css":[]},"routes":{"root":{"id":"root","path":"","hasAction":false,"hasLoader":false,"hasClientAction":false,"hasClientLoader":false,"hasClientMiddleware":false,"hasErrorBoundary":false,"module":"/assets/root-td3M8eFE.js","imports":["/assets/react-dom-Dr_efIFp.js","/assets/chunk-NISHYRIK-BsYev12b.js","/assets/react-BcXKmAwN.js","/assets/rolldown-runtime-D_juG1Xi.js","/assets/reflex-env-9XpqE36O.js","/assets/emotion-react.browser.esm-B3Hu227f.js","/assets/esm-D5Cammm2.js","/assets/createLucideIcon-DvMhwGZ5.js","/assets/react-is-BiweJ67z.js","/assets/shim-DLiwten_.js"],"css":[]},"routes/[empdashboard]._index":{"id":"routes/[empdashboard]._index","parentId":"root","path":"empdashboard","index":true,"hasAction":false,"hasLoader":false,"hasClientAction":false,"hasClientLoader":false,"hasClientMiddleware":false,"hasErrorBoundary":false,"module":"/assets/_empdashboard_._index-DRBiE70L.js","imports":["/assets/reflex-env-9XpqE36O.js","/assets/emotion-react.browser.esm-B3Hu227f.js","/assets/esm-D5Cammm2.js","/assets/lib-D8E8fr-q.js","/assets/createLucideIcon-DvMhwGZ5.js","/assets/calendar-x-DWj0leKb.js","/assets/stateful_components-BJUxbsqK.js","/assets/clock-CK397qlP.js","/assets/trending-up-BoAe-G0q.js","/assets/user-DxYhwzmx.js","/assets/react-dom-Dr_efIFp.js","/assets/react-is-BiweJ67z.js","/assets/chunk-NISHYRIK-BsYev12b.js","/assets/react-BcXKmAwN.js","/assets/shim-DLiwten_.js","/assets/rolldown-runtime-D_juG1Xi.js"],"css":[]},"routes/[attendance]._index":{"id":"routes/[attendance]._index","parentId":"root","path":"attendance","index":true,"hasAction":false,"hasLoader":false,"hasClientAction":false,"hasClientLoader":false,"hasClientMiddleware":false,"hasErrorBoundary":false,"module":"/assets/_attendance_._index-qF7eKhkg.js","imports":["/assets/reflex-env-9XpqE36O.js","/assets/emotion-react.browser.esm-B3Hu227f.js","/assets/esm-D5Cammm2.js","/assets/lib-D8E8fr-q.js","/assets/createLucideIcon-DvMhwGZ5.js","/assets/users-h3LY_qm3.js","/assets/stateful_components-BJUxbsqK.js","/assets/clock-CK397qlP.js","/assets/react-dom-Dr_efIFp.js","/assets/react-is-BiweJ67z.js","/assets/chunk-NISHYRIK-BsYev12b.js","/assets/react-BcXKmAwN.js","/assets/shim-DLiwten_.js","/assets/rolldown-runtime-D_juG1Xi.js"],"css":[]},"routes/[emppayrole]._index":{"id":"routes/[emppayrole]._index","parentId":"root","path":"emppayrole","index":true,"hasAction":false,"hasLoader":false,"hasClientAction":false,"hasClientLoader":false,"hasClientMiddleware":false,"hasErrorBoundary":false,"module":"/assets/_emppayrole_._index-B6fQfvVy.js","imports":["/assets/reflex-env-9XpqE36O.js","/assets/emotion-react.browser.esm-B3Hu227f.js","/assets/esm-D5Cammm2.js","/assets/lib-D8E8fr-q.js","/assets/createLucideIcon-DvMhwGZ5.js","/assets/stateful_components-BJUxbsqK.js","/assets/user-DxYhwzmx.js","/assets/react-dom-Dr_efIFp.js","/assets/react-is-BiweJ67z.js","/assets/chunk-NISHYRIK-BsYev12b.js","/assets/react-BcXKmAwN.js","/assets/shim-DLiwten_.js","/assets/rolldown-runtime-D_juG1Xi.js"],"css":[]},"routes/[dashboard]._index":{"id":"routes/[dashboard]._index","parentId":"root","path":"dashboard","index":true,"hasAction":false,"hasLoader":false,"hasClientAction":false,"hasClientLoader":false,"hasClientMiddleware":false,"hasErrorBoundary":false,"module":"/assets/_dashboard_._index-BjptslDJ.js","imports":["/assets/reflex-env-9XpqE36O.js","/assets/emotion-react.browser.esm-B3Hu227f.js","/assets/esm-D5Cammm2.js","/assets/lib-D8E8fr-q.js","/assets/createLucideIcon-DvMhwGZ5.js","/assets/users-h3LY_qm3.js","/assets/stateful_components-BJUxbsqK.js","/assets/clock-CK397qlP.js","/assets/trending-up-BoAe-G0q.js","/assets/react-dom-Dr_efIFp.js","/assets/react-is-BiweJ67z.js","/assets/chunk-NISHYRIK-BsYev12b.js","/assets/react-BcXKmAwN.js","/assets/shim-DLiwten_.js","/assets/rolldown-runtime-D_juG1Xi.js"],"css":[]},"routes/[empleaves]._index":{"id":"routes/[empleaves]._index","parentId":"root","path":"empleaves","index":true,"hasAction":false,"hasLoader":false,"hasClientAction":false,"hasClientLoader":false,"hasClientMiddleware":false,"hasErrorBoundary":false,"module":"/assets/_empleaves_._index-CYG2awGA.js","imports":["/assets/reflex-env-9XpqE36O.js","/assets/emotion-react.browser.esm-B3Hu227f.js","/assets/esm-D5Cammm2.js","/assets/dist-BvsYPXTs.js","/assets/lib-D8E8fr-q.js","/assets/createLucideIcon-DvMhwGZ5.js","/assets/calendar-x-DWj0leKb.js","/assets/stateful_components-BJUxbsqK.js","/assets/clock-CK397qlP.js","/assets/trending-up-BoAe-G0q.js","/assets/user-DxYhwzmx.js","/assets/react-dom-Dr_efIFp.js","/assets/react-is-BiweJ67z.js","/assets/chunk-NISHYRIK-BsYev12b.js","/assets/react-BcXKmAwN.js","/assets/shim-DLiwten_.js","/assets/rolldown-runtime-D_juG1Xi.js"],"css":[]},"routes/[employees]._index":{"id":"routes/[employees]._index","parentId":"root","path":"employees","index":true,"hasAction":false,"hasLoader":false,"hasClientAction":false,"hasClientLoader":false,"hasClientMiddleware":false,"hasErrorBoundary":false,"module":"/assets/_employees_._index-DrzXVYU2.js","imports":["/assets/reflex-env-9XpqE36O.js","/assets/emotion-react.browser.esm-B3Hu227f.js","/assets/esm-D5Cammm2.js","/assets/dist-BvsYPXTs.js","/assets/lib-D8E8fr-q.js","/assets/createLucideIcon-DvMhwGZ5.js","/assets/users-h3LY_qm3.js","/assets/stateful_components-BJUxbsqK.js","/assets/react-dom-Dr_efIFp.js","/assets/react-is-BiweJ67z.js","/assets/chunk-NISHYRIK-BsYev12b.js","/assets/react-BcXKmAwN.js","/assets/shim-DLiwten_.js","/assets/rolldown-runtime-D_juG1Xi.js"],"css":[]},"routes/[register]._index":{"id":"routes/[register]._index","parentId":"root","path":"register","index":true,"hasAction":false,"hasLoader":false,"hasClientAction":false,"hasClientLoader":false,"hasClientMiddleware":false,"hasErrorBoundary":false,"module":"/assets/_register_._index-D2teVvFA.js","imports":["/assets/reflex-env-9XpqE36O.js","/assets/emotion-react.browser.esm-B3Hu227f.js","/assets/esm-D5Cammm2.js","/assets/lib-D8E8fr-q.js","/assets/react-dom-Dr_efIFp.js","/assets/react-is-BiweJ67z.js","/assets/chunk-NISHYRIK-BsYev12b.js","/assets/react-BcXKmAwN.js","/assets/shim-DLiwten_.js","/assets/rolldown-runtime-D_juG1Xi.js"],"css":[]},"routes/[payroll]._index":{"id":"routes/[payroll]._index","parentId":"root","path":"payroll","index":true,"hasAction":false,"hasLoader":false,"hasClientAction":false,"hasClientLoader":false,"hasClientMiddleware":false,"hasErrorBoundary":false,"module":"/assets/_payroll_._index-CHdONA_u.js","imports":["/assets/reflex-env-9XpqE36O.js","/assets/emotion-react.browser.esm-B3Hu227f.js","/assets/esm-D5Cammm2.js","/assets/es6-CST6UfWb.js","/assets/lib-D8E8fr-q.js","/assets/createLucideIcon-DvMhwGZ5.js","/assets/users-h3LY_qm3.js","/assets/stateful_components-BJUxbsqK.js","/assets/react-dom-Dr_efIFp.js","/assets/react-is-BiweJ67z.js","/assets/chunk-NISHYRIK-BsYev12b.js","/assets/react-BcXKmAwN.js","/assets/shim-DLiwten_.js","/assets/rolldown-runtime-D_juG1Xi.js"],"css":[]},"routes/[login]._index":{"id":"routes/[login]._index","parentId":"root","path":"login","index":true,"hasAction":false,"hasLoader":false,"hasClientAction":false,"hasClientLoader":false,"hasClientMiddleware":false,"hasErrorBoundary":false,"module":"/assets/_login_._index-CR6Lp3_k.js","imports":["/assets/reflex-env-9XpqE36O.js","/assets/emotion-react.browser.esm-B3Hu227f.js","/assets/esm-D5Cammm2.js","/assets/lib-D8E8fr-q.js","/assets/react-dom-Dr_efIFp.js","/assets/react-is-BiweJ67z.js","/assets/chunk-NISHYRIK-BsYev12b.js","/assets/react-BcXKmAwN.js","/assets/shim-DLiwten_.js","/assets/rolldown-runtime-D_juG1Xi.js"],"css":[]},"routes/_index":{"id":"routes/_index","parentId":"root","index":true,"hasAction":false,"hasLoader":false,"hasClientAction":false,"hasClientLoader":false,"hasClientMiddleware":false,"hasErrorBoundary":false,"module":"/assets/_index-nVepjK7m.js","imports":["/assets/reflex-env-9XpqE36O.js","/assets/emotion-react.browser.esm-B3Hu227f.js","/assets/esm-D5Cammm2.js","/assets/react-dom-Dr_efIFp.js","/assets/react-is-BiweJ67z.js","/assets/chunk-NISHYRIK-BsYev12b.js","/assets/react-BcXKmAwN.js","/assets/shim-DLiwten_.js","/assets/rolldown-runtime-D_juG1Xi.js"],"css":[]},"routes/[404]._index":{"id":"routes/[404]._index","parentId":"root","path":"*","hasAction":false,"hasLoader":false,"hasClientAction":false,"hasClientLoader":false,"hasClientMiddleware":false,"hasErrorBoundary":false,"module":"/assets/_404_._index-C_Nequuz.js","imports":["/assets/emotion-react.browser.esm-B3Hu227f.js","/assets/react-is-BiweJ67z.js","/assets/chunk-NISHYRIK-BsYev12b.js","/assets/react-BcXKmAwN.js","/assets/rolldown-runtime-D_juG1Xi.js"],"css":[]}},"url":"/assets/manifest-a29ecd0d.js","version":"a29ecd0d"};
\ No newline at end of file
@@ -1 +0,0 @@
-var e={PING:`https://ostaffsync-backend.onrender.com/ping`,EVENT:`wss://ostaffsync-backend.onrender.com/_event`,UPLOAD:`https://ostaffsync-backend.onrender.com/_upload`,AUTH_CODESPACE:`https://ostaffsync-backend.onrender.com/auth-codespace`,HEALTH:`https://ostaffsync-backend.onrender.com/_health`,ALL_ROUTES:`https://ostaffsync-backend.onrender.com/_all_routes`,TEST_MODE:!1};export{e as t};
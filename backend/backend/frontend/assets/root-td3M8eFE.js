@@ -1,26 +0,0 @@
-import{a as e,r as t}from"./rolldown-runtime-D_juG1Xi.js";import{t as n}from"./react-BcXKmAwN.js";import{t as r}from"./react-dom-Dr_efIFp.js";import{A as i,a,d as o,i as s,r as c,s as l,u}from"./chunk-NISHYRIK-BsYev12b.js";import{B as d,F as f,H as p,I as ee,K as m,P as h,R as g,S as _,T as v,U as y,V as b,q as x,t as S,w as C,z as w}from"./esm-D5Cammm2.js";import{t as T}from"./reflex-env-9XpqE36O.js";import{n as E,r as D,t as O}from"./emotion-react.browser.esm-B3Hu227f.js";import"./react-is-BiweJ67z.js";import"./shim-DLiwten_.js";import{t as k}from"./createLucideIcon-DvMhwGZ5.js";var A=e(n()),j=(0,A.createContext)(null),M={didCatch:!1,error:null},N=class extends A.Component{constructor(e){super(e),this.resetErrorBoundary=this.resetErrorBoundary.bind(this),this.state=M}static getDerivedStateFromError(e){return{didCatch:!0,error:e}}resetErrorBoundary(){let{error:e}=this.state;if(e!==null){var t,n,r=[...arguments];(t=(n=this.props).onReset)==null||t.call(n,{args:r,reason:`imperative-api`}),this.setState(M)}}componentDidCatch(e,t){var n,r;(n=(r=this.props).onError)==null||n.call(r,e,t)}componentDidUpdate(e,t){let{didCatch:n}=this.state,{resetKeys:r}=this.props;if(n&&t.error!==null&&te(e.resetKeys,r)){var i,a;(i=(a=this.props).onReset)==null||i.call(a,{next:r,prev:e.resetKeys,reason:`keys`}),this.setState(M)}}render(){let{children:e,fallbackRender:t,FallbackComponent:n,fallback:r}=this.props,{didCatch:i,error:a}=this.state,o=e;if(i){let e={error:a,resetErrorBoundary:this.resetErrorBoundary};if(typeof t==`function`)o=t(e);else if(n)o=(0,A.createElement)(n,e);else if(r!==void 0)o=r;else throw a}return(0,A.createElement)(j.Provider,{value:{didCatch:i,error:a,resetErrorBoundary:this.resetErrorBoundary}},o)}};function te(){let e=arguments.length>0&&arguments[0]!==void 0?arguments[0]:[],t=arguments.length>1&&arguments[1]!==void 0?arguments[1]:[];return e.length!==t.length||e.some((e,n)=>!Object.is(e,t[n]))}var P=(0,A.createContext)({theme:d,resolvedTheme:`light`,setTheme:()=>{}});function F({children:e,defaultTheme:t=`system`}){let[n,r]=(0,A.useState)(t),[i,a]=(0,A.useState)(t===`system`?`light`:t),[o,s]=(0,A.useState)(!1),c=(0,A.useRef)(!0);(0,A.useEffect)(()=>{if(!c.current)return;c.current=!1;let e=localStorage.getItem(`theme`)||t;r(e),s(!0)});let l=(0,A.useMemo)(()=>n===`system`?i:n,[n,i]);return(0,A.useEffect)(()=>{let e=window.matchMedia(`(prefers-color-scheme: dark)`),t=()=>{a(e.matches?`dark`:`light`)};return t(),e.addEventListener(`change`,t),()=>{e.removeEventListener(`change`,t)}}),(0,A.useEffect)(()=>{let e=localStorage.getItem(`theme`);!o&&e!==null||localStorage.setItem(`theme`,n)},[n]),(0,A.useEffect)(()=>{if(!o)return;let e=window.document.documentElement;e.classList.remove(`light`,`dark`),e.classList.add(l),e.style.colorScheme=l},[l,o]),(0,A.createElement)(P.Provider,{value:{theme:n,resolvedTheme:l,setTheme:r}},e)}function ne(){return(0,A.useContext)(P)}function re({children:e}){let{theme:t,resolvedTheme:n,setTheme:r}=ne();return(0,A.useEffect)(()=>{let e=document.querySelector(`.radix-themes[data-is-root-theme="true"]`);e&&(e.classList.remove(`light`,`dark`),e.classList.add(n))},[n]),(0,A.createElement)(h.Provider,{value:{rawColorMode:t,resolvedColorMode:n,toggleColorMode:()=>{r(n===`light`?`dark`:`light`)},setColorMode:e=>{[`light`,`dark`,`system`].includes(e)||(console.error(`Invalid color mode "${e}". Defaulting to "${d}".`),e=d),r(e)}}},e)}var I=e(r(),1);function ie(e){if(!e||typeof document>`u`)return;let t=document.head||document.getElementsByTagName(`head`)[0],n=document.createElement(`style`);n.type=`text/css`,t.appendChild(n),n.styleSheet?n.styleSheet.cssText=e:n.appendChild(document.createTextNode(e))}var ae=e=>{switch(e){case`success`:return se;case`info`:return z;case`warning`:return R;case`error`:return ce;default:return null}},L=Array(12).fill(0),oe=({visible:e,className:t})=>A.createElement(`div`,{className:[`sonner-loading-wrapper`,t].filter(Boolean).join(` `),"data-visible":e},A.createElement(`div`,{className:`sonner-spinner`},L.map((e,t)=>A.createElement(`div`,{className:`sonner-loading-bar`,key:`spinner-bar-${t}`})))),se=A.createElement(`svg`,{xmlns:`http://www.w3.org/2000/svg`,viewBox:`0 0 20 20`,fill:`currentColor`,height:`20`,width:`20`},A.createElement(`path`,{fillRule:`evenodd`,d:`M10 18a8 8 0 100-16 8 8 0 000 16zm3.857-9.809a.75.75 0 00-1.214-.882l-3.483 4.79-1.88-1.88a.75.75 0 10-1.06 1.061l2.5 2.5a.75.75 0 001.137-.089l4-5.5z`,clipRule:`evenodd`})),R=A.createElement(`svg`,{xmlns:`http://www.w3.org/2000/svg`,viewBox:`0 0 24 24`,fill:`currentColor`,height:`20`,width:`20`},A.createElement(`path`,{fillRule:`evenodd`,d:`M9.401 3.003c1.155-2 4.043-2 5.197 0l7.355 12.748c1.154 2-.29 4.5-2.599 4.5H4.645c-2.309 0-3.752-2.5-2.598-4.5L9.4 3.003zM12 8.25a.75.75 0 01.75.75v3.75a.75.75 0 01-1.5 0V9a.75.75 0 01.75-.75zm0 8.25a.75.75 0 100-1.5.75.75 0 000 1.5z`,clipRule:`evenodd`})),z=A.createElement(`svg`,{xmlns:`http://www.w3.org/2000/svg`,viewBox:`0 0 20 20`,fill:`currentColor`,height:`20`,width:`20`},A.createElement(`path`,{fillRule:`evenodd`,d:`M18 10a8 8 0 11-16 0 8 8 0 0116 0zm-7-4a1 1 0 11-2 0 1 1 0 012 0zM9 9a.75.75 0 000 1.5h.253a.25.25 0 01.244.304l-.459 2.066A1.75 1.75 0 0010.747 15H11a.75.75 0 000-1.5h-.253a.25.25 0 01-.244-.304l.459-2.066A1.75 1.75 0 009.253 9H9z`,clipRule:`evenodd`})),ce=A.createElement(`svg`,{xmlns:`http://www.w3.org/2000/svg`,viewBox:`0 0 20 20`,fill:`currentColor`,height:`20`,width:`20`},A.createElement(`path`,{fillRule:`evenodd`,d:`M18 10a8 8 0 11-16 0 8 8 0 0116 0zm-8-5a.75.75 0 01.75.75v4.5a.75.75 0 01-1.5 0v-4.5A.75.75 0 0110 5zm0 10a1 1 0 100-2 1 1 0 000 2z`,clipRule:`evenodd`})),le=A.createElement(`svg`,{xmlns:`http://www.w3.org/2000/svg`,width:`12`,height:`12`,viewBox:`0 0 24 24`,fill:`none`,stroke:`currentColor`,strokeWidth:`1.5`,strokeLinecap:`round`,strokeLinejoin:`round`},A.createElement(`line`,{x1:`18`,y1:`6`,x2:`6`,y2:`18`}),A.createElement(`line`,{x1:`6`,y1:`6`,x2:`18`,y2:`18`})),ue=()=>{let[e,t]=A.useState(document.hidden);return A.useEffect(()=>{let e=()=>{t(document.hidden)};return document.addEventListener(`visibilitychange`,e),()=>window.removeEventListener(`visibilitychange`,e)},[]),e},B=1,V=new class{constructor(){this.subscribe=e=>(this.subscribers.push(e),()=>{let t=this.subscribers.indexOf(e);this.subscribers.splice(t,1)}),this.publish=e=>{this.subscribers.forEach(t=>t(e))},this.addToast=e=>{this.publish(e),this.toasts=[...this.toasts,e]},this.create=e=>{let{message:t,...n}=e,r=typeof e?.id==`number`||e.id?.length>0?e.id:B++,i=this.toasts.find(e=>e.id===r),a=e.dismissible===void 0?!0:e.dismissible;return this.dismissedToasts.has(r)&&this.dismissedToasts.delete(r),i?this.toasts=this.toasts.map(n=>n.id===r?(this.publish({...n,...e,id:r,title:t}),{...n,...e,id:r,dismissible:a,title:t}):n):this.addToast({title:t,...n,dismissible:a,id:r}),r},this.dismiss=e=>(e?(this.dismissedToasts.add(e),requestAnimationFrame(()=>this.subscribers.forEach(t=>t({id:e,dismiss:!0})))):this.toasts.forEach(e=>{this.subscribers.forEach(t=>t({id:e.id,dismiss:!0}))}),e),this.message=(e,t)=>this.create({...t,message:e}),this.error=(e,t)=>this.create({...t,message:e,type:`error`}),this.success=(e,t)=>this.create({...t,type:`success`,message:e}),this.info=(e,t)=>this.create({...t,type:`info`,message:e}),this.warning=(e,t)=>this.create({...t,type:`warning`,message:e}),this.loading=(e,t)=>this.create({...t,type:`loading`,message:e}),this.promise=(e,t)=>{if(!t)return;let n;t.loading!==void 0&&(n=this.create({...t,promise:e,type:`loading`,message:t.loading,description:typeof t.description==`function`?void 0:t.description}));let r=Promise.resolve(e instanceof Function?e():e),i=n!==void 0,a,o=r.then(async e=>{if(a=[`resolve`,e],A.isValidElement(e))i=!1,this.create({id:n,type:`default`,message:e});else if(H(e)&&!e.ok){i=!1;let r=typeof t.error==`function`?await t.error(`HTTP error! status: ${e.status}`):t.error,a=typeof t.description==`function`?await t.description(`HTTP error! status: ${e.status}`):t.description,o=typeof r==`object`&&!A.isValidElement(r)?r:{message:r};this.create({id:n,type:`error`,description:a,...o})}else if(e instanceof Error){i=!1;let r=typeof t.error==`function`?await t.error(e):t.error,a=typeof t.description==`function`?await t.description(e):t.description,o=typeof r==`object`&&!A.isValidElement(r)?r:{message:r};this.create({id:n,type:`error`,description:a,...o})}else if(t.success!==void 0){i=!1;let r=typeof t.success==`function`?await t.success(e):t.success,a=typeof t.description==`function`?await t.description(e):t.description,o=typeof r==`object`&&!A.isValidElement(r)?r:{message:r};this.create({id:n,type:`success`,description:a,...o})}}).catch(async e=>{if(a=[`reject`,e],t.error!==void 0){i=!1;let r=typeof t.error==`function`?await t.error(e):t.error,a=typeof t.description==`function`?await t.description(e):t.description,o=typeof r==`object`&&!A.isValidElement(r)?r:{message:r};this.create({id:n,type:`error`,description:a,...o})}}).finally(()=>{i&&(this.dismiss(n),n=void 0),t.finally==null||t.finally.call(t)}),s=()=>new Promise((e,t)=>o.then(()=>a[0]===`reject`?t(a[1]):e(a[1])).catch(t));return typeof n!=`string`&&typeof n!=`number`?{unwrap:s}:Object.assign(n,{unwrap:s})},this.custom=(e,t)=>{let n=t?.id||B++;return this.create({jsx:e(n),id:n,...t}),n},this.getActiveToasts=()=>this.toasts.filter(e=>!this.dismissedToasts.has(e.id)),this.subscribers=[],this.toasts=[],this.dismissedToasts=new Set}},de=(e,t)=>{let n=t?.id||B++;return V.addToast({title:e,...t,id:n}),n},H=e=>e&&typeof e==`object`&&`ok`in e&&typeof e.ok==`boolean`&&`status`in e&&typeof e.status==`number`,U=de,fe=Object.assign(U,{success:V.success,info:V.info,warning:V.warning,error:V.error,custom:V.custom,message:V.message,promise:V.promise,dismiss:V.dismiss,loading:V.loading},{getHistory:()=>V.toasts,getToasts:()=>V.getActiveToasts()});ie(`[data-sonner-toaster][dir=ltr],html[dir=ltr]{--toast-icon-margin-start:-3px;--toast-icon-margin-end:4px;--toast-svg-margin-start:-1px;--toast-svg-margin-end:0px;--toast-button-margin-start:auto;--toast-button-margin-end:0;--toast-close-button-start:0;--toast-close-button-end:unset;--toast-close-button-transform:translate(-35%, -35%)}[data-sonner-toaster][dir=rtl],html[dir=rtl]{--toast-icon-margin-start:4px;--toast-icon-margin-end:-3px;--toast-svg-margin-start:0px;--toast-svg-margin-end:-1px;--toast-button-margin-start:0;--toast-button-margin-end:auto;--toast-close-button-start:unset;--toast-close-button-end:0;--toast-close-button-transform:translate(35%, -35%)}[data-sonner-toaster]{position:fixed;width:var(--width);font-family:ui-sans-serif,system-ui,-apple-system,BlinkMacSystemFont,Segoe UI,Roboto,Helvetica Neue,Arial,Noto Sans,sans-serif,Apple Color Emoji,Segoe UI Emoji,Segoe UI Symbol,Noto Color Emoji;--gray1:hsl(0, 0%, 99%);--gray2:hsl(0, 0%, 97.3%);--gray3:hsl(0, 0%, 95.1%);--gray4:hsl(0, 0%, 93%);--gray5:hsl(0, 0%, 90.9%);--gray6:hsl(0, 0%, 88.7%);--gray7:hsl(0, 0%, 85.8%);--gray8:hsl(0, 0%, 78%);--gray9:hsl(0, 0%, 56.1%);--gray10:hsl(0, 0%, 52.3%);--gray11:hsl(0, 0%, 43.5%);--gray12:hsl(0, 0%, 9%);--border-radius:8px;box-sizing:border-box;padding:0;margin:0;list-style:none;outline:0;z-index:999999999;transition:transform .4s ease}@media (hover:none) and (pointer:coarse){[data-sonner-toaster][data-lifted=true]{transform:none}}[data-sonner-toaster][data-x-position=right]{right:var(--offset-right)}[data-sonner-toaster][data-x-position=left]{left:var(--offset-left)}[data-sonner-toaster][data-x-position=center]{left:50%;transform:translateX(-50%)}[data-sonner-toaster][data-y-position=top]{top:var(--offset-top)}[data-sonner-toaster][data-y-position=bottom]{bottom:var(--offset-bottom)}[data-sonner-toast]{--y:translateY(100%);--lift-amount:calc(var(--lift) * var(--gap));z-index:var(--z-index);position:absolute;opacity:0;transform:var(--y);touch-action:none;transition:transform .4s,opacity .4s,height .4s,box-shadow .2s;box-sizing:border-box;outline:0;overflow-wrap:anywhere}[data-sonner-toast][data-styled=true]{padding:16px;background:var(--normal-bg);border:1px solid var(--normal-border);color:var(--normal-text);border-radius:var(--border-radius);box-shadow:0 4px 12px rgba(0,0,0,.1);width:var(--width);font-size:13px;display:flex;align-items:center;gap:6px}[data-sonner-toast]:focus-visible{box-shadow:0 4px 12px rgba(0,0,0,.1),0 0 0 2px rgba(0,0,0,.2)}[data-sonner-toast][data-y-position=top]{top:0;--y:translateY(-100%);--lift:1;--lift-amount:calc(1 * var(--gap))}[data-sonner-toast][data-y-position=bottom]{bottom:0;--y:translateY(100%);--lift:-1;--lift-amount:calc(var(--lift) * var(--gap))}[data-sonner-toast][data-styled=true] [data-description]{font-weight:400;line-height:1.4;color:#3f3f3f}[data-rich-colors=true][data-sonner-toast][data-styled=true] [data-description]{color:inherit}[data-sonner-toaster][data-sonner-theme=dark] [data-description]{color:#e8e8e8}[data-sonner-toast][data-styled=true] [data-title]{font-weight:500;line-height:1.5;color:inherit}[data-sonner-toast][data-styled=true] [data-icon]{display:flex;height:16px;width:16px;position:relative;justify-content:flex-start;align-items:center;flex-shrink:0;margin-left:var(--toast-icon-margin-start);margin-right:var(--toast-icon-margin-end)}[data-sonner-toast][data-promise=true] [data-icon]>svg{opacity:0;transform:scale(.8);transform-origin:center;animation:sonner-fade-in .3s ease forwards}[data-sonner-toast][data-styled=true] [data-icon]>*{flex-shrink:0}[data-sonner-toast][data-styled=true] [data-icon] svg{margin-left:var(--toast-svg-margin-start);margin-right:var(--toast-svg-margin-end)}[data-sonner-toast][data-styled=true] [data-content]{display:flex;flex-direction:column;gap:2px}[data-sonner-toast][data-styled=true] [data-button]{border-radius:4px;padding-left:8px;padding-right:8px;height:24px;font-size:12px;color:var(--normal-bg);background:var(--normal-text);margin-left:var(--toast-button-margin-start);margin-right:var(--toast-button-margin-end);border:none;font-weight:500;cursor:pointer;outline:0;display:flex;align-items:center;flex-shrink:0;transition:opacity .4s,box-shadow .2s}[data-sonner-toast][data-styled=true] [data-button]:focus-visible{box-shadow:0 0 0 2px rgba(0,0,0,.4)}[data-sonner-toast][data-styled=true] [data-button]:first-of-type{margin-left:var(--toast-button-margin-start);margin-right:var(--toast-button-margin-end)}[data-sonner-toast][data-styled=true] [data-cancel]{color:var(--normal-text);background:rgba(0,0,0,.08)}[data-sonner-toaster][data-sonner-theme=dark] [data-sonner-toast][data-styled=true] [data-cancel]{background:rgba(255,255,255,.3)}[data-sonner-toast][data-styled=true] [data-close-button]{position:absolute;left:var(--toast-close-button-start);right:var(--toast-close-button-end);top:0;height:20px;width:20px;display:flex;justify-content:center;align-items:center;padding:0;color:var(--gray12);background:var(--normal-bg);border:1px solid var(--gray4);transform:var(--toast-close-button-transform);border-radius:50%;cursor:pointer;z-index:1;transition:opacity .1s,background .2s,border-color .2s}[data-sonner-toast][data-styled=true] [data-close-button]:focus-visible{box-shadow:0 4px 12px rgba(0,0,0,.1),0 0 0 2px rgba(0,0,0,.2)}[data-sonner-toast][data-styled=true] [data-disabled=true]{cursor:not-allowed}[data-sonner-toast][data-styled=true]:hover [data-close-button]:hover{background:var(--gray2);border-color:var(--gray5)}[data-sonner-toast][data-swiping=true]::before{content:'';position:absolute;left:-100%;right:-100%;height:100%;z-index:-1}[data-sonner-toast][data-y-position=top][data-swiping=true]::before{bottom:50%;transform:scaleY(3) translateY(50%)}[data-sonner-toast][data-y-position=bottom][data-swiping=true]::before{top:50%;transform:scaleY(3) translateY(-50%)}[data-sonner-toast][data-swiping=false][data-removed=true]::before{content:'';position:absolute;inset:0;transform:scaleY(2)}[data-sonner-toast][data-expanded=true]::after{content:'';position:absolute;left:0;height:calc(var(--gap) + 1px);bottom:100%;width:100%}[data-sonner-toast][data-mounted=true]{--y:translateY(0);opacity:1}[data-sonner-toast][data-expanded=false][data-front=false]{--scale:var(--toasts-before) * 0.05 + 1;--y:translateY(calc(var(--lift-amount) * var(--toasts-before))) scale(calc(-1 * var(--scale)));height:var(--front-toast-height)}[data-sonner-toast]>*{transition:opacity .4s}[data-sonner-toast][data-x-position=right]{right:0}[data-sonner-toast][data-x-position=left]{left:0}[data-sonner-toast][data-expanded=false][data-front=false][data-styled=true]>*{opacity:0}[data-sonner-toast][data-visible=false]{opacity:0;pointer-events:none}[data-sonner-toast][data-mounted=true][data-expanded=true]{--y:translateY(calc(var(--lift) * var(--offset)));height:var(--initial-height)}[data-sonner-toast][data-removed=true][data-front=true][data-swipe-out=false]{--y:translateY(calc(var(--lift) * -100%));opacity:0}[data-sonner-toast][data-removed=true][data-front=false][data-swipe-out=false][data-expanded=true]{--y:translateY(calc(var(--lift) * var(--offset) + var(--lift) * -100%));opacity:0}[data-sonner-toast][data-removed=true][data-front=false][data-swipe-out=false][data-expanded=false]{--y:translateY(40%);opacity:0;transition:transform .5s,opacity .2s}[data-sonner-toast][data-removed=true][data-front=false]::before{height:calc(var(--initial-height) + 20%)}[data-sonner-toast][data-swiping=true]{transform:var(--y) translateY(var(--swipe-amount-y,0)) translateX(var(--swipe-amount-x,0));transition:none}[data-sonner-toast][data-swiped=true]{user-select:none}[data-sonner-toast][data-swipe-out=true][data-y-position=bottom],[data-sonner-toast][data-swipe-out=true][data-y-position=top]{animation-duration:.2s;animation-timing-function:ease-out;animation-fill-mode:forwards}[data-sonner-toast][data-swipe-out=true][data-swipe-direction=left]{animation-name:swipe-out-left}[data-sonner-toast][data-swipe-out=true][data-swipe-direction=right]{animation-name:swipe-out-right}[data-sonner-toast][data-swipe-out=true][data-swipe-direction=up]{animation-name:swipe-out-up}[data-sonner-toast][data-swipe-out=true][data-swipe-direction=down]{animation-name:swipe-out-down}@keyframes swipe-out-left{from{transform:var(--y) translateX(var(--swipe-amount-x));opacity:1}to{transform:var(--y) translateX(calc(var(--swipe-amount-x) - 100%));opacity:0}}@keyframes swipe-out-right{from{transform:var(--y) translateX(var(--swipe-amount-x));opacity:1}to{transform:var(--y) translateX(calc(var(--swipe-amount-x) + 100%));opacity:0}}@keyframes swipe-out-up{from{transform:var(--y) translateY(var(--swipe-amount-y));opacity:1}to{transform:var(--y) translateY(calc(var(--swipe-amount-y) - 100%));opacity:0}}@keyframes swipe-out-down{from{transform:var(--y) translateY(var(--swipe-amount-y));opacity:1}to{transform:var(--y) translateY(calc(var(--swipe-amount-y) + 100%));opacity:0}}@media (max-width:600px){[data-sonner-toaster]{position:fixed;right:var(--mobile-offset-right);left:var(--mobile-offset-left);width:100%}[data-sonner-toaster][dir=rtl]{left:calc(var(--mobile-offset-left) * -1)}[data-sonner-toaster] [data-sonner-toast]{left:0;right:0;width:calc(100% - var(--mobile-offset-left) * 2)}[data-sonner-toaster][data-x-position=left]{left:var(--mobile-offset-left)}[data-sonner-toaster][data-y-position=bottom]{bottom:var(--mobile-offset-bottom)}[data-sonner-toaster][data-y-position=top]{top:var(--mobile-offset-top)}[data-sonner-toaster][data-x-position=center]{left:var(--mobile-offset-left);right:var(--mobile-offset-right);transform:none}}[data-sonner-toaster][data-sonner-theme=light]{--normal-bg:#fff;--normal-border:var(--gray4);--normal-text:var(--gray12);--success-bg:hsl(143, 85%, 96%);--success-border:hsl(145, 92%, 87%);--success-text:hsl(140, 100%, 27%);--info-bg:hsl(208, 100%, 97%);--info-border:hsl(221, 91%, 93%);--info-text:hsl(210, 92%, 45%);--warning-bg:hsl(49, 100%, 97%);--warning-border:hsl(49, 91%, 84%);--warning-text:hsl(31, 92%, 45%);--error-bg:hsl(359, 100%, 97%);--error-border:hsl(359, 100%, 94%);--error-text:hsl(360, 100%, 45%)}[data-sonner-toaster][data-sonner-theme=light] [data-sonner-toast][data-invert=true]{--normal-bg:#000;--normal-border:hsl(0, 0%, 20%);--normal-text:var(--gray1)}[data-sonner-toaster][data-sonner-theme=dark] [data-sonner-toast][data-invert=true]{--normal-bg:#fff;--normal-border:var(--gray3);--normal-text:var(--gray12)}[data-sonner-toaster][data-sonner-theme=dark]{--normal-bg:#000;--normal-bg-hover:hsl(0, 0%, 12%);--normal-border:hsl(0, 0%, 20%);--normal-border-hover:hsl(0, 0%, 25%);--normal-text:var(--gray1);--success-bg:hsl(150, 100%, 6%);--success-border:hsl(147, 100%, 12%);--success-text:hsl(150, 86%, 65%);--info-bg:hsl(215, 100%, 6%);--info-border:hsl(223, 43%, 17%);--info-text:hsl(216, 87%, 65%);--warning-bg:hsl(64, 100%, 6%);--warning-border:hsl(60, 100%, 9%);--warning-text:hsl(46, 87%, 65%);--error-bg:hsl(358, 76%, 10%);--error-border:hsl(357, 89%, 16%);--error-text:hsl(358, 100%, 81%)}[data-sonner-toaster][data-sonner-theme=dark] [data-sonner-toast] [data-close-button]{background:var(--normal-bg);border-color:var(--normal-border);color:var(--normal-text)}[data-sonner-toaster][data-sonner-theme=dark] [data-sonner-toast] [data-close-button]:hover{background:var(--normal-bg-hover);border-color:var(--normal-border-hover)}[data-rich-colors=true][data-sonner-toast][data-type=success]{background:var(--success-bg);border-color:var(--success-border);color:var(--success-text)}[data-rich-colors=true][data-sonner-toast][data-type=success] [data-close-button]{background:var(--success-bg);border-color:var(--success-border);color:var(--success-text)}[data-rich-colors=true][data-sonner-toast][data-type=info]{background:var(--info-bg);border-color:var(--info-border);color:var(--info-text)}[data-rich-colors=true][data-sonner-toast][data-type=info] [data-close-button]{background:var(--info-bg);border-color:var(--info-border);color:var(--info-text)}[data-rich-colors=true][data-sonner-toast][data-type=warning]{background:var(--warning-bg);border-color:var(--warning-border);color:var(--warning-text)}[data-rich-colors=true][data-sonner-toast][data-type=warning] [data-close-button]{background:var(--warning-bg);border-color:var(--warning-border);color:var(--warning-text)}[data-rich-colors=true][data-sonner-toast][data-type=error]{background:var(--error-bg);border-color:var(--error-border);color:var(--error-text)}[data-rich-colors=true][data-sonner-toast][data-type=error] [data-close-button]{background:var(--error-bg);border-color:var(--error-border);color:var(--error-text)}.sonner-loading-wrapper{--size:16px;height:var(--size);width:var(--size);position:absolute;inset:0;z-index:10}.sonner-loading-wrapper[data-visible=false]{transform-origin:center;animation:sonner-fade-out .2s ease forwards}.sonner-spinner{position:relative;top:50%;left:50%;height:var(--size);width:var(--size)}.sonner-loading-bar{animation:sonner-spin 1.2s linear infinite;background:var(--gray11);border-radius:6px;height:8%;left:-10%;position:absolute;top:-3.9%;width:24%}.sonner-loading-bar:first-child{animation-delay:-1.2s;transform:rotate(.0001deg) translate(146%)}.sonner-loading-bar:nth-child(2){animation-delay:-1.1s;transform:rotate(30deg) translate(146%)}.sonner-loading-bar:nth-child(3){animation-delay:-1s;transform:rotate(60deg) translate(146%)}.sonner-loading-bar:nth-child(4){animation-delay:-.9s;transform:rotate(90deg) translate(146%)}.sonner-loading-bar:nth-child(5){animation-delay:-.8s;transform:rotate(120deg) translate(146%)}.sonner-loading-bar:nth-child(6){animation-delay:-.7s;transform:rotate(150deg) translate(146%)}.sonner-loading-bar:nth-child(7){animation-delay:-.6s;transform:rotate(180deg) translate(146%)}.sonner-loading-bar:nth-child(8){animation-delay:-.5s;transform:rotate(210deg) translate(146%)}.sonner-loading-bar:nth-child(9){animation-delay:-.4s;transform:rotate(240deg) translate(146%)}.sonner-loading-bar:nth-child(10){animation-delay:-.3s;transform:rotate(270deg) translate(146%)}.sonner-loading-bar:nth-child(11){animation-delay:-.2s;transform:rotate(300deg) translate(146%)}.sonner-loading-bar:nth-child(12){animation-delay:-.1s;transform:rotate(330deg) translate(146%)}@keyframes sonner-fade-in{0%{opacity:0;transform:scale(.8)}100%{opacity:1;transform:scale(1)}}@keyframes sonner-fade-out{0%{opacity:1;transform:scale(1)}100%{opacity:0;transform:scale(.8)}}@keyframes sonner-spin{0%{opacity:1}100%{opacity:.15}}@media (prefers-reduced-motion){.sonner-loading-bar,[data-sonner-toast],[data-sonner-toast]>*{transition:none!important;animation:none!important}}.sonner-loader{position:absolute;top:50%;left:50%;transform:translate(-50%,-50%);transform-origin:center;transition:opacity .2s,transform .2s}.sonner-loader[data-visible=false]{opacity:0;transform:scale(.8) translate(-50%,-50%)}`);function W(e){return e.label!==void 0}var pe=3,G=`24px`,me=`16px`,he=4e3,ge=356,K=14,_e=45,ve=200;function q(...e){return e.filter(Boolean).join(` `)}function ye(e){let[t,n]=e.split(`-`),r=[];return t&&r.push(t),n&&r.push(n),r}var J=e=>{let{invert:t,toast:n,unstyled:r,interacting:i,setHeights:a,visibleToasts:o,heights:s,index:c,toasts:l,expanded:u,removeToast:d,defaultRichColors:f,closeButton:p,style:ee,cancelButtonStyle:m,actionButtonStyle:h,className:g=``,descriptionClassName:_=``,duration:v,position:y,gap:b,expandByDefault:x,classNames:S,icons:C,closeButtonAriaLabel:w=`Close toast`}=e,[T,E]=A.useState(null),[D,O]=A.useState(null),[k,j]=A.useState(!1),[M,N]=A.useState(!1),[te,P]=A.useState(!1),[F,ne]=A.useState(!1),[re,I]=A.useState(!1),[ie,L]=A.useState(0),[se,R]=A.useState(0),z=A.useRef(n.duration||v||he),ce=A.useRef(null),B=A.useRef(null),V=c===0,de=c+1<=o,H=n.type,U=n.dismissible!==!1,fe=n.className||``,pe=n.descriptionClassName||``,G=A.useMemo(()=>s.findIndex(e=>e.toastId===n.id)||0,[s,n.id]),me=A.useMemo(()=>n.closeButton??p,[n.closeButton,p]),ge=A.useMemo(()=>n.duration||v||he,[n.duration,v]),K=A.useRef(0),J=A.useRef(0),Y=A.useRef(0),X=A.useRef(null),[be,xe]=y.split(`-`),Se=A.useMemo(()=>s.reduce((e,t,n)=>n>=G?e:e+t.height,0),[s,G]),Z=ue(),Ce=n.invert||t,Q=H===`loading`;J.current=A.useMemo(()=>G*b+Se,[G,Se]),A.useEffect(()=>{z.current=ge},[ge]),A.useEffect(()=>{j(!0)},[]),A.useEffect(()=>{let e=B.current;if(e){let t=e.getBoundingClientRect().height;return R(t),a(e=>[{toastId:n.id,height:t,position:n.position},...e]),()=>a(e=>e.filter(e=>e.toastId!==n.id))}},[a,n.id]),A.useLayoutEffect(()=>{if(!k)return;let e=B.current,t=e.style.height;e.style.height=`auto`;let r=e.getBoundingClientRect().height;e.style.height=t,R(r),a(e=>e.find(e=>e.toastId===n.id)?e.map(e=>e.toastId===n.id?{...e,height:r}:e):[{toastId:n.id,height:r,position:n.position},...e])},[k,n.title,n.description,a,n.id,n.jsx,n.action,n.cancel]);let $=A.useCallback(()=>{N(!0),L(J.current),a(e=>e.filter(e=>e.toastId!==n.id)),setTimeout(()=>{d(n)},ve)},[n,d,a,J]);A.useEffect(()=>{if(n.promise&&H===`loading`||n.duration===1/0||n.type===`loading`)return;let e;return u||i||Z?(()=>{if(Y.current<K.current){let e=new Date().getTime()-K.current;z.current-=e}Y.current=new Date().getTime()})():z.current!==1/0&&(K.current=new Date().getTime(),e=setTimeout(()=>{n.onAutoClose==null||n.onAutoClose.call(n,n),$()},z.current)),()=>clearTimeout(e)},[u,i,n,H,Z,$]),A.useEffect(()=>{n.delete&&($(),n.onDismiss==null||n.onDismiss.call(n,n))},[$,n.delete]);function we(){return C?.loading?A.createElement(`div`,{className:q(S?.loader,n?.classNames?.loader,`sonner-loader`),"data-visible":H===`loading`},C.loading):A.createElement(oe,{className:q(S?.loader,n?.classNames?.loader),visible:H===`loading`})}let Te=n.icon||C?.[H]||ae(H);return A.createElement(`li`,{tabIndex:0,ref:B,className:q(g,fe,S?.toast,n?.classNames?.toast,S?.default,S?.[H],n?.classNames?.[H]),"data-sonner-toast":``,"data-rich-colors":n.richColors??f,"data-styled":!(n.jsx||n.unstyled||r),"data-mounted":k,"data-promise":!!n.promise,"data-swiped":re,"data-removed":M,"data-visible":de,"data-y-position":be,"data-x-position":xe,"data-index":c,"data-front":V,"data-swiping":te,"data-dismissible":U,"data-type":H,"data-invert":Ce,"data-swipe-out":F,"data-swipe-direction":D,"data-expanded":!!(u||x&&k),"data-testid":n.testId,style:{"--index":c,"--toasts-before":c,"--z-index":l.length-c,"--offset":`${M?ie:J.current}px`,"--initial-height":x?`auto`:`${se}px`,...ee,...n.style},onDragEnd:()=>{P(!1),E(null),X.current=null},onPointerDown:e=>{e.button!==2&&(Q||!U||(ce.current=new Date,L(J.current),e.target.setPointerCapture(e.pointerId),e.target.tagName!==`BUTTON`&&(P(!0),X.current={x:e.clientX,y:e.clientY})))},onPointerUp:()=>{if(F||!U)return;X.current=null;let e=Number(B.current?.style.getPropertyValue(`--swipe-amount-x`).replace(`px`,``)||0),t=Number(B.current?.style.getPropertyValue(`--swipe-amount-y`).replace(`px`,``)||0),r=new Date().getTime()-ce.current?.getTime(),i=T===`x`?e:t,a=Math.abs(i)/r;if(Math.abs(i)>=_e||a>.11){L(J.current),n.onDismiss==null||n.onDismiss.call(n,n),O(T===`x`?e>0?`right`:`left`:t>0?`down`:`up`),$(),ne(!0);return}else{var o,s;(o=B.current)==null||o.style.setProperty(`--swipe-amount-x`,`0px`),(s=B.current)==null||s.style.setProperty(`--swipe-amount-y`,`0px`)}I(!1),P(!1),E(null)},onPointerMove:t=>{var n,r;if(!X.current||!U||window.getSelection()?.toString().length>0)return;let i=t.clientY-X.current.y,a=t.clientX-X.current.x,o=e.swipeDirections??ye(y);!T&&(Math.abs(a)>1||Math.abs(i)>1)&&E(Math.abs(a)>Math.abs(i)?`x`:`y`);let s={x:0,y:0},c=e=>1/(1.5+Math.abs(e)/20);if(T===`y`){if(o.includes(`top`)||o.includes(`bottom`))if(o.includes(`top`)&&i<0||o.includes(`bottom`)&&i>0)s.y=i;else{let e=i*c(i);s.y=Math.abs(e)<Math.abs(i)?e:i}}else if(T===`x`&&(o.includes(`left`)||o.includes(`right`)))if(o.includes(`left`)&&a<0||o.includes(`right`)&&a>0)s.x=a;else{let e=a*c(a);s.x=Math.abs(e)<Math.abs(a)?e:a}(Math.abs(s.x)>0||Math.abs(s.y)>0)&&I(!0),(n=B.current)==null||n.style.setProperty(`--swipe-amount-x`,`${s.x}px`),(r=B.current)==null||r.style.setProperty(`--swipe-amount-y`,`${s.y}px`)}},me&&!n.jsx&&H!==`loading`?A.createElement(`button`,{"aria-label":w,"data-disabled":Q,"data-close-button":!0,onClick:Q||!U?()=>{}:()=>{$(),n.onDismiss==null||n.onDismiss.call(n,n)},className:q(S?.closeButton,n?.classNames?.closeButton)},C?.close??le):null,(H||n.icon||n.promise)&&n.icon!==null&&(C?.[H]!==null||n.icon)?A.createElement(`div`,{"data-icon":``,className:q(S?.icon,n?.classNames?.icon)},n.promise||n.type===`loading`&&!n.icon?n.icon||we():null,n.type===`loading`?null:Te):null,A.createElement(`div`,{"data-content":``,className:q(S?.content,n?.classNames?.content)},A.createElement(`div`,{"data-title":``,className:q(S?.title,n?.classNames?.title)},n.jsx?n.jsx:typeof n.title==`function`?n.title():n.title),n.description?A.createElement(`div`,{"data-description":``,className:q(_,pe,S?.description,n?.classNames?.description)},typeof n.description==`function`?n.description():n.description):null),A.isValidElement(n.cancel)?n.cancel:n.cancel&&W(n.cancel)?A.createElement(`button`,{"data-button":!0,"data-cancel":!0,style:n.cancelButtonStyle||m,onClick:e=>{W(n.cancel)&&U&&(n.cancel.onClick==null||n.cancel.onClick.call(n.cancel,e),$())},className:q(S?.cancelButton,n?.classNames?.cancelButton)},n.cancel.label):null,A.isValidElement(n.action)?n.action:n.action&&W(n.action)?A.createElement(`button`,{"data-button":!0,"data-action":!0,style:n.actionButtonStyle||h,onClick:e=>{W(n.action)&&(n.action.onClick==null||n.action.onClick.call(n.action,e),!e.defaultPrevented&&$())},className:q(S?.actionButton,n?.classNames?.actionButton)},n.action.label):null)};function Y(){if(typeof window>`u`||typeof document>`u`)return`ltr`;let e=document.documentElement.getAttribute(`dir`);return e===`auto`||!e?window.getComputedStyle(document.documentElement).direction:e}function X(e,t){let n={};return[e,t].forEach((e,t)=>{let r=t===1,i=r?`--mobile-offset`:`--offset`,a=r?me:G;function o(e){[`top`,`right`,`bottom`,`left`].forEach(t=>{n[`${i}-${t}`]=typeof e==`number`?`${e}px`:e})}typeof e==`number`||typeof e==`string`?o(e):typeof e==`object`?[`top`,`right`,`bottom`,`left`].forEach(t=>{e[t]===void 0?n[`${i}-${t}`]=a:n[`${i}-${t}`]=typeof e[t]==`number`?`${e[t]}px`:e[t]}):o(a)}),n}var be=A.forwardRef(function(e,t){let{id:n,invert:r,position:i=`bottom-right`,hotkey:a=[`altKey`,`KeyT`],expand:o,closeButton:s,className:c,offset:l,mobileOffset:u,theme:d=`light`,richColors:f,duration:p,style:ee,visibleToasts:m=pe,toastOptions:h,dir:g=Y(),gap:_=K,icons:v,containerAriaLabel:y=`Notifications`}=e,[b,x]=A.useState([]),S=A.useMemo(()=>n?b.filter(e=>e.toasterId===n):b.filter(e=>!e.toasterId),[b,n]),C=A.useMemo(()=>Array.from(new Set([i].concat(S.filter(e=>e.position).map(e=>e.position)))),[S,i]),[w,T]=A.useState([]),[E,D]=A.useState(!1),[O,k]=A.useState(!1),[j,M]=A.useState(d===`system`?typeof window<`u`&&window.matchMedia&&window.matchMedia(`(prefers-color-scheme: dark)`).matches?`dark`:`light`:d),N=A.useRef(null),te=a.join(`+`).replace(/Key/g,``).replace(/Digit/g,``),P=A.useRef(null),F=A.useRef(!1),ne=A.useCallback(e=>{x(t=>(t.find(t=>t.id===e.id)?.delete||V.dismiss(e.id),t.filter(({id:t})=>t!==e.id)))},[]);return A.useEffect(()=>V.subscribe(e=>{if(e.dismiss){requestAnimationFrame(()=>{x(t=>t.map(t=>t.id===e.id?{...t,delete:!0}:t))});return}setTimeout(()=>{I.flushSync(()=>{x(t=>{let n=t.findIndex(t=>t.id===e.id);return n===-1?[e,...t]:[...t.slice(0,n),{...t[n],...e},...t.slice(n+1)]})})})}),[b]),A.useEffect(()=>{if(d!==`system`){M(d);return}if(d===`system`&&(window.matchMedia&&window.matchMedia(`(prefers-color-scheme: dark)`).matches?M(`dark`):M(`light`)),typeof window>`u`)return;let e=window.matchMedia(`(prefers-color-scheme: dark)`);try{e.addEventListener(`change`,({matches:e})=>{M(e?`dark`:`light`)})}catch{e.addListener(({matches:e})=>{try{M(e?`dark`:`light`)}catch(e){console.error(e)}})}},[d]),A.useEffect(()=>{b.length<=1&&D(!1)},[b]),A.useEffect(()=>{let e=e=>{if(a.every(t=>e[t]||e.code===t)){var t;D(!0),(t=N.current)==null||t.focus()}e.code===`Escape`&&(document.activeElement===N.current||N.current?.contains(document.activeElement))&&D(!1)};return document.addEventListener(`keydown`,e),()=>document.removeEventListener(`keydown`,e)},[a]),A.useEffect(()=>{if(N.current)return()=>{P.current&&(P.current.focus({preventScroll:!0}),P.current=null,F.current=!1)}},[N.current]),A.createElement(`section`,{ref:t,"aria-label":`${y} ${te}`,tabIndex:-1,"aria-live":`polite`,"aria-relevant":`additions text`,"aria-atomic":`false`,suppressHydrationWarning:!0},C.map((t,n)=>{let[i,a]=t.split(`-`);return S.length?A.createElement(`ol`,{key:t,dir:g===`auto`?Y():g,tabIndex:-1,ref:N,className:c,"data-sonner-toaster":!0,"data-sonner-theme":j,"data-y-position":i,"data-x-position":a,style:{"--front-toast-height":`${w[0]?.height||0}px`,"--width":`${ge}px`,"--gap":`${_}px`,...ee,...X(l,u)},onBlur:e=>{F.current&&!e.currentTarget.contains(e.relatedTarget)&&(F.current=!1,P.current&&=(P.current.focus({preventScroll:!0}),null))},onFocus:e=>{e.target instanceof HTMLElement&&e.target.dataset.dismissible===`false`||F.current||(F.current=!0,P.current=e.relatedTarget)},onMouseEnter:()=>D(!0),onMouseMove:()=>D(!0),onMouseLeave:()=>{O||D(!1)},onDragEnd:()=>D(!1),onPointerDown:e=>{e.target instanceof HTMLElement&&e.target.dataset.dismissible===`false`||k(!0)},onPointerUp:()=>k(!1)},S.filter(e=>!e.position&&n===0||e.position===t).map((n,i)=>A.createElement(J,{key:n.id,icons:v,index:i,toast:n,defaultRichColors:f,duration:h?.duration??p,className:h?.className,descriptionClassName:h?.descriptionClassName,invert:r,visibleToasts:m,closeButton:h?.closeButton??s,interacting:O,position:t,style:h?.style,unstyled:h?.unstyled,classNames:h?.classNames,cancelButtonStyle:h?.cancelButtonStyle,actionButtonStyle:h?.actionButtonStyle,closeButtonAriaLabel:h?.closeButtonAriaLabel,removeToast:ne,toasts:S.filter(e=>e.position==n.position),heights:w.filter(e=>e.position==n.position),setHeights:T,expandByDefault:o,gap:_,expanded:E,swipeDirections:e.swipeDirections}))):null}))}),xe=k(`wifi-off`,[[`path`,{d:`M12 20h.01`,key:`zekei9`}],[`path`,{d:`M8.5 16.429a5 5 0 0 1 7 0`,key:`1bycff`}],[`path`,{d:`M5 12.859a10 10 0 0 1 5.17-2.69`,key:`1dl1wf`}],[`path`,{d:`M19 12.859a10 10 0 0 0-2.007-1.523`,key:`4k23kn`}],[`path`,{d:`M2 8.82a15 15 0 0 1 4.177-2.643`,key:`1grhjp`}],[`path`,{d:`M22 8.82a15 15 0 0 0-11.288-3.764`,key:`z3jwby`}],[`path`,{d:`m2 2 20 20`,key:`1ooewy`}]]),Se=t({DefaultOverlayComponents:()=>Q,MemoizedBadge:()=>Z,MemoizedToastProvider:()=>Ce});const Z=(0,A.memo)(({})=>{let{resolvedColorMode:e}=(0,A.useContext)(h);return E(`a`,{css:{position:`fixed`,bottom:`1rem`,right:`1rem`,display:`flex`,flexDirection:`row`,gap:`0.375rem`,alignItems:`center`,width:`auto`,borderRadius:`0.5rem`,color:e?.valueOf?.()===`light`?.valueOf?.()?`#E5E7EB`:`#27282B`,border:e?.valueOf?.()===`light`?.valueOf?.()?`1px solid #27282B`:`1px solid #E5E7EB`,backgroundColor:e?.valueOf?.()===`light`?.valueOf?.()?`#151618`:`#FCFCFD`,padding:`0.375rem`,transition:`background-color 0.2s ease-in-out`,boxShadow:`0 1px 2px 0 rgba(0, 0, 0, 0.05)`,zIndex:`9998`,cursor:`pointer`,align:`center`,textAlign:`center`},href:`https://reflex.dev`,target:`_blank`},E(`svg`,{css:{fill:`white`,viewBox:`0 0 16 16`},height:`16`,width:`16`,xmlns:`http://www.w3.org/2000/svg`},E(`rect`,{css:{fill:`#6E56CF`},height:`16`,rx:`2`,width:`16`}),E(`path`,{css:{fill:`white`},d:`M10 9V13H12V9H10Z`}),E(`path`,{css:{fill:`white`},d:`M4 3V13H6V9H10V7H6V5H10V7H12V3H4Z`})),E(_,{css:{"@media screen and (min-width: 0)":{display:`none`},"@media screen and (min-width: 30em)":{display:`none`},"@media screen and (min-width: 48em)":{display:`none`},"@media screen and (min-width: 62em)":{display:`block`}}},E(v,{as:`p`,css:{color:`var(--slate-1)`,fontWeight:`600`,fontFamily:`'Instrument Sans', sans-serif`,"--default-font-family":`'Instrument Sans', sans-serif`,fontSize:`0.875rem`,lineHeight:`1rem`,letterSpacing:`-0.00656rem`}},`Built with Reflex`)))}),Ce=(0,A.memo)(({})=>{let{resolvedColorMode:e}=(0,A.useContext)(h);return m.__toast=fe,E(be,{closeButton:!1,expand:!0,position:`bottom-right`,richColors:!0,theme:e})}),Q=(0,A.memo)(({})=>{let[e,t]=(0,A.useContext)(f),n=m.__toast,r={description:`Check if server is reachable at `+y(T.EVENT).href,closeButton:!0,duration:12e4,id:`websocket-error`},[i,a]=(0,A.useState)(!1),[o,s]=(0,A.useState)(!1);return(0,A.useEffect)(()=>{t.length>=2?i||n?.error(`Cannot connect to server: `+(t.length>0?t[t.length-1].message:``)+`.`,{...r,onDismiss:()=>a(!0)}):(n?.dismiss(`websocket-error`),a(!1))},[t,o]),E(A.Fragment,{},E(`div`,{css:{position:`fixed`,width:`100vw`,height:`0`},title:`Connection Error: `+(t.length>0?t[t.length-1].message:``)},E(A.Fragment,{},t.length>0?E(A.Fragment,{},E(xe,{css:{color:`crimson`,zIndex:9999,position:`fixed`,bottom:`33px`,right:`33px`,animation:D({from:{opacity:0},to:{opacity:1}})+` 1s infinite`},size:32})):E(A.Fragment,{}))),E(A.Fragment,{}))});var $={styles:{global:{":root":{},body:{}}}},we=`/assets/__reflex_global_styles-1B3ds0L2.css`;function Te({children:e}){return E(`html`,{lang:`en`,suppressHydrationWarning:!0},E(`head`,{},E(`script`,{},`
-// Only run in browser environment, not during SSR
-if (typeof document !== 'undefined') {
-    try {
-        const theme = localStorage.getItem("theme") || "system";
-        const systemPreference = window.matchMedia("(prefers-color-scheme: dark)").matches ? "dark" : "light";
-        const resolvedTheme = theme === "system" ? systemPreference : theme;
-
-        // Apply theme immediately - blocks until complete
-        // Use classList to avoid overwriting other classes
-        document.documentElement.classList.remove("light", "dark");
-        document.documentElement.classList.add(resolvedTheme);
-        document.documentElement.style.colorScheme = resolvedTheme;
-
-    } catch (e) {
-        // Fallback to system preference on any error (resolve "system" to actual theme)
-        const fallbackTheme = window.matchMedia("(prefers-color-scheme: dark)").matches ? "dark" : "light";
-        document.documentElement.classList.remove("light", "dark");
-        document.documentElement.classList.add(fallbackTheme);
-        document.documentElement.style.colorScheme = fallbackTheme;
-    }
-}
-`),E(`meta`,{charSet:`utf-8`}),E(`meta`,{content:`width=device-width, initial-scale=1`,name:`viewport`}),E(a,{}),E(`link`,{href:we,rel:`stylesheet`,type:`text/css`}),E(s,{})),E(`body`,{},e,E(o,{}),E(u,{})))}function Ee({children:e}){let[t,n]=(0,A.useContext)(f);return E(A.StrictMode,{},E(N,{fallbackRender:e=>E(`div`,{css:{height:`100%`,width:`100%`,position:`absolute`,backgroundColor:`#fff`,color:`#000`,display:`flex`,alignItems:`center`,justifyContent:`center`}},E(`div`,{css:{display:`flex`,flexDirection:`column`,gap:`1rem`}},E(`div`,{css:{display:`flex`,flexDirection:`column`,gap:`1rem`,maxWidth:`50ch`,border:`1px solid #888888`,borderRadius:`0.25rem`,padding:`1rem`}},E(`h2`,{css:{fontSize:`1.25rem`,fontWeight:`bold`}},`An error occurred while rendering this page.`),E(`p`,{css:{opacity:`0.75`}},`This is an error with the application itself.`),E(`details`,{},E(`summary`,{css:{padding:`0.5rem`}},`Error message`),E(`div`,{css:{width:`100%`,maxHeight:`50vh`,overflow:`auto`,background:`#000`,color:`#fff`,borderRadius:`0.25rem`}},E(`div`,{css:{padding:`0.5rem`,width:`fit-content`}},E(`pre`,{},e.error.name+`: `+e.error.message+`
-`+e.error.stack))),E(`button`,{css:{padding:`0.35rem 0.75rem`,margin:`0.5rem`,background:`#fff`,color:`#000`,border:`1px solid #000`,borderRadius:`0.25rem`,fontWeight:`bold`},onClick:n=>t([p(`_call_function`,{function:()=>navigator?.clipboard?.writeText(e.error.name+`: `+e.error.message+`
-`+e.error.stack),callback:null},{})],[n],{})},`Copy`))),E(`hr`,{css:{borderColor:`currentColor`,opacity:`0.25`}}),E(c,{to:`https://reflex.dev`},E(`div`,{css:{display:`flex`,alignItems:`baseline`,justifyContent:`center`,fontFamily:`monospace`,"--default-font-family":`monospace`,gap:`0.5rem`}},`Built with `,E(`svg`,{"aria-label":`Reflex`,css:{fill:`currentColor`},height:`12`,role:`img`,width:`56`,xmlns:`http://www.w3.org/2000/svg`},E(`path`,{d:`M0 11.5999V0.399902H8.96V4.8799H6.72V2.6399H2.24V4.8799H6.72V7.1199H2.24V11.5999H0ZM6.72 11.5999V7.1199H8.96V11.5999H6.72Z`}),E(`path`,{d:`M11.2 11.5999V0.399902H17.92V2.6399H13.44V4.8799H17.92V7.1199H13.44V9.3599H17.92V11.5999H11.2Z`}),E(`path`,{d:`M20.16 11.5999V0.399902H26.88V2.6399H22.4V4.8799H26.88V7.1199H22.4V11.5999H20.16Z`}),E(`path`,{d:`M29.12 11.5999V0.399902H31.36V9.3599H35.84V11.5999H29.12Z`}),E(`path`,{d:`M38.08 11.5999V0.399902H44.8V2.6399H40.32V4.8799H44.8V7.1199H40.32V9.3599H44.8V11.5999H38.08Z`}),E(`path`,{d:`M47.04 4.8799V0.399902H49.28V4.8799H47.04ZM53.76 4.8799V0.399902H56V4.8799H53.76ZM49.28 7.1199V4.8799H53.76V7.1199H49.28ZM47.04 11.5999V7.1199H49.28V11.5999H47.04ZM53.76 11.5999V7.1199H56V11.5999H53.76Z`}),E(`title`,{},`Reflex`)))))),onError:(e,n)=>t([p(`reflex___state____state.reflex___state____frontend_event_exception_state.handle_frontend_exception`,{info:e?.name+`: `+e?.message+`
-`+e?.stack,component_stack:n?.componentStack},{})],[e,n],{})},E(re,{},E(A.Fragment,{},E(Ce,{}),E(C,{accentColor:`blue`,css:{...$.styles.global[`:root`],...$.styles.global.body}},E(A.Fragment,{},E(Q,{}),E(A.Fragment,{},e,E(Z,{}))))))))}function De({children:e}){return(0,A.useEffect)(()=>{let e={react:A,"@radix-ui/themes":S,"@emotion/react":O,"$/utils/context":w,"$/utils/state":x,"$/utils/components":Se};window.__reflex=e},[]),E(Te,{},E(F,{defaultTheme:d,attribute:`class`},E(g,{},E(ee,{},E(Ee,{},e)))))}var Oe=i(function(){return E(l,{})});export{De as Layout,Oe as default};
\ No newline at end of file
@@ -1 +0,0 @@
-import{a as e}from"./rolldown-runtime-D_juG1Xi.js";import{t}from"./react-BcXKmAwN.js";import{F as n,H as r,L as i,T as a,W as o,b as s,n as c}from"./esm-D5Cammm2.js";import{n as l}from"./emotion-react.browser.esm-B3Hu227f.js";import{t as u}from"./createLucideIcon-DvMhwGZ5.js";import{t as d}from"./lib-D8E8fr-q.js";var f=u(`calendar`,[[`path`,{d:`M8 2v4`,key:`1cmpym`}],[`path`,{d:`M16 2v4`,key:`4m81vk`}],[`rect`,{width:`18`,height:`18`,x:`3`,y:`4`,rx:`2`,key:`1hopcy`}],[`path`,{d:`M3 10h18`,key:`8toen8`}]]),p=u(`layout-dashboard`,[[`rect`,{width:`7`,height:`9`,x:`3`,y:`3`,rx:`1`,key:`10lvy0`}],[`rect`,{width:`7`,height:`5`,x:`14`,y:`3`,rx:`1`,key:`16une8`}],[`rect`,{width:`7`,height:`9`,x:`14`,y:`12`,rx:`1`,key:`1hutg5`}],[`rect`,{width:`7`,height:`5`,x:`3`,y:`16`,rx:`1`,key:`ldoo1y`}]]),m=u(`wallet`,[[`path`,{d:`M19 7V4a1 1 0 0 0-1-1H5a2 2 0 0 0 0 4h15a1 1 0 0 1 1 1v4h-3a2 2 0 0 0 0 4h3a1 1 0 0 0 1-1v-2a1 1 0 0 0-1-1`,key:`18etb6`}],[`path`,{d:`M3 5v14a2 2 0 0 0 2 2h15a1 1 0 0 0 1-1v-4`,key:`xoc0q4`}]]),h=e(t()),g=e(d());function _(){let e=(0,h.useContext)(i.reflex___state____state__templates___login____login_state);return l(a,{as:`p`,size:`3`,weight:`bold`},e.full_name_rx_state_)}function v(){let e=(0,h.useContext)(i.reflex___state____state__templates___login____login_state);return l(h.Fragment,{},e.full_name_rx_state_?.valueOf?.()===``?.valueOf?.()?l(h.Fragment,{},l(a,{as:`p`,size:`3`,weight:`bold`},`Admin`)):l(h.Fragment,{},l(_,{})))}function y(){let e=(0,h.useContext)(i.reflex___state____state__templates___login____login_state);return l(a,{as:`p`,css:{color:`gray`},size:`2`},e.username_rx_state_)}function b(){let[e,t]=(0,h.useContext)(n),i=(0,h.useCallback)((t=>e([r(`reflex___state____state.templates___login____login_state.logout_user`,{},{})],[t],{})),[e,r]);return l(s,{color:`red`,css:{marginTop:`0.75rem`},onClick:i,size:`2`},`Logout`)}function x(){let e=(0,h.useContext)(i.reflex___state____state__templates___login____login_state__components___admin_dash_side_nav____admin_state__templates___admin_payroll_dashboard____payroll_dashboard_state),[t,a]=(0,h.useContext)(n),s=(0,h.useCallback)((e=>t([r(`reflex___state____state.templates___login____login_state.components___admin_dash_side_nav____admin_state.templates___admin_payroll_dashboard____payroll_dashboard_state.set_month`,{month:e?.target?.value},{})],[e],{})),[t,r]);return l(g.default,{css:{width:`200px`},debounceTimeout:300,element:c,onChange:s,type:`month`,value:o(e.month_selected_rx_state_)?e.month_selected_rx_state_:``})}function S(){let e=(0,h.useContext)(i.reflex___state____state__templates___login____login_state);return l(h.Fragment,{},e.full_name_rx_state_?.valueOf?.()===``?.valueOf?.()?l(h.Fragment,{},l(a,{as:`p`,size:`3`,weight:`bold`},`Employee`)):l(h.Fragment,{},l(_,{})))}export{y as a,f as c,S as i,x as n,m as o,v as r,p as s,b as t};
\ No newline at end of file
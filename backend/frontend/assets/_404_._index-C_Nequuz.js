@@ -1 +0,0 @@
-import{a as e}from"./rolldown-runtime-D_juG1Xi.js";import{t}from"./react-BcXKmAwN.js";import{A as n}from"./chunk-NISHYRIK-BsYev12b.js";import{n as r}from"./emotion-react.browser.esm-B3Hu227f.js";import"./react-is-BiweJ67z.js";var i=e(t()),a=n(function(){return r(i.Fragment,{},r(`span`,{},`404: Page not found`),r(`title`,{},`404 - Not Found`),r(`meta`,{content:`The page was not found`,name:`description`}),r(`meta`,{content:`favicon.ico`,property:`og:image`}))});export{a as default};
\ No newline at end of file
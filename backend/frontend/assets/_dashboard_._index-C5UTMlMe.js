@@ -1 +0,0 @@
-import{a as e}from"./rolldown-runtime-D_juG1Xi.js";import{t}from"./react-BcXKmAwN.js";import"./react-dom-Dr_efIFp.js";import{A as n,r}from"./chunk-NISHYRIK-BsYev12b.js";import{C as i,E as a,F as o,H as s,L as c,S as l,T as u,_ as d,a as f,b as p,c as m,d as h,i as g,l as _,o as v,s as y,u as b,v as x,x as S,y as C}from"./esm-d7QI_Eml.js";import"./reflex-env-CtwX00K9.js";import{n as w}from"./emotion-react.browser.esm-B3Hu227f.js";import"./react-is-BiweJ67z.js";import"./shim-DLiwten_.js";import{t as T}from"./createLucideIcon-DvMhwGZ5.js";import{n as E,t as D}from"./users-h3LY_qm3.js";import{a as O,c as k,o as A,r as j,s as M,t as N}from"./stateful_components-EggvQ1Ld.js";import{t as P}from"./clock-CK397qlP.js";import{n as F,t as I}from"./trending-up-BoAe-G0q.js";import"./lib-D8E8fr-q.js";var L=T(`user-plus`,[[`path`,{d:`M16 21v-2a4 4 0 0 0-4-4H6a4 4 0 0 0-4 4v2`,key:`1yyitq`}],[`circle`,{cx:`9`,cy:`7`,r:`4`,key:`nufk8`}],[`line`,{x1:`19`,x2:`19`,y1:`8`,y2:`14`,key:`1bvyxn`}],[`line`,{x1:`22`,x2:`16`,y1:`11`,y2:`11`,key:`1shjgl`}]]),R=T(`user-x`,[[`path`,{d:`M16 21v-2a4 4 0 0 0-4-4H6a4 4 0 0 0-4 4v2`,key:`1yyitq`}],[`circle`,{cx:`9`,cy:`7`,r:`4`,key:`nufk8`}],[`line`,{x1:`17`,x2:`22`,y1:`8`,y2:`13`,key:`3nzzx3`}],[`line`,{x1:`22`,x2:`17`,y1:`8`,y2:`13`,key:`1swrse`}]]),z=e(t());function B(){let e=(0,z.useContext)(c.reflex___state____state__templates___login____login_state);return w(u,{as:`p`},e.tenant_id_rx_state_)}function V(){let e=(0,z.useContext)(c.reflex___state____state__templates___login____login_state__components___admin_dash_side_nav____admin_state__templates___admin_dashboard____admin_dashboard_state);return w(u,{as:`p`,css:{fontWeight:`bold`}},e.formatted_date_rx_state_)}function H(){let e=(0,z.useContext)(c.reflex___state____state__templates___login____login_state__components___admin_dash_side_nav____admin_state__templates___admin_dashboard____admin_dashboard_state);return w(z.Fragment,{},e.isLogin_rx_state_?w(z.Fragment,{},w(u,{as:`p`,css:{color:`red`}},`Sign-out`)):w(z.Fragment,{},w(u,{as:`p`,css:{color:`blue`}},`Sign-in`)))}function U(){let[e,t]=(0,z.useContext)(o),n=(0,z.useCallback)(t=>e([s(`reflex___state____state.templates___login____login_state.components___admin_dash_side_nav____admin_state.templates___admin_dashboard____admin_dashboard_state.LoginStateUpdate`,{},{})],[t],{}),[e,s]);return w(p,{onClick:n},w(H,{}))}function W(){let e=(0,z.useContext)(c.reflex___state____state__templates___login____login_state__components___admin_dash_side_nav____admin_state__templates___admin_dashboard____admin_dashboard_state);return w(u,{as:`p`},`Login time: `+e.check_in_rx_state_)}function G(){let e=(0,z.useContext)(c.reflex___state____state__templates___login____login_state__components___admin_dash_side_nav____admin_state__templates___admin_dashboard____admin_dashboard_state);return w(u,{as:`p`},`Logout time: `+e.check_out_rx_state_)}function K(){let e=(0,z.useContext)(c.reflex___state____state__templates___login____login_state__components___admin_dash_side_nav____admin_state__templates___admin_dashboard____admin_dashboard_state);return w(a,{css:{fontWeight:`bold`,color:`gray.800`},size:`6`},e.Total_Employees_rx_state_)}function q(){let e=(0,z.useContext)(c.reflex___state____state__templates___login____login_state__components___admin_dash_side_nav____admin_state__templates___admin_dashboard____admin_dashboard_state);return w(a,{css:{fontWeight:`bold`,color:`gray.800`},size:`6`},e.New_Hires_rx_state_)}function J(){let e=(0,z.useContext)(c.reflex___state____state__templates___login____login_state__components___admin_dash_side_nav____admin_state__templates___admin_dashboard____admin_dashboard_state);return w(a,{css:{fontWeight:`bold`,color:`gray.800`},size:`6`},e.Attrition_rx_state_)}function Y(){let e=(0,z.useContext)(c.reflex___state____state__templates___login____login_state__components___admin_dash_side_nav____admin_state__templates___admin_dashboard____admin_dashboard_state);return w(a,{css:{fontWeight:`bold`,color:`gray.800`},size:`6`},e.Leave_Requests_rx_state_)}function X(){let e=(0,z.useContext)(c.reflex___state____state__templates___login____login_state__components___admin_dash_side_nav____admin_state__templates___admin_dashboard____admin_dashboard_state);return w(a,{css:{fontWeight:`bold`,color:`gray.800`},size:`6`},e.Attendance_Rate_rx_state_)}function Z(){let e=(0,z.useContext)(c.reflex___state____state__templates___login____login_state__components___admin_dash_side_nav____admin_state__templates___admin_dashboard____admin_dashboard_state);return w(z.Fragment,{},Array.prototype.map.call(e.employees_data_rx_state_??[],(e,t)=>w(g,{key:t},w(f,{},e?.name),w(v,{},e?.email),w(v,{},e?.role),w(v,{},e?.check_in),w(v,{},e?.check_out),w(v,{},e?.status),w(v,{},e?.date_joined),w(v,{},e?.days_since))))}function Q(){let e=(0,z.useContext)(c.reflex___state____state__templates___login____login_state__components___admin_dash_side_nav____admin_state__templates___admin_dashboard____admin_dashboard_state);return w(z.Fragment,{},e.employees_data_rx_state_.length>0?w(Z,{}):w(z.Fragment,{},w(g,{},w(f,{colSpan:8,css:{textAlign:`center`},py:`4`},w(u,{as:`p`},`No active employees found.`)))))}function $(){(0,z.useEffect)(()=>(((...t)=>e([s(`reflex___state____state.templates___login____login_state.components___admin_dash_side_nav____admin_state.templates___admin_dashboard____admin_dashboard_state.on_mount`,{},{})],t,{}))(),()=>{}),[]);let[e,t]=(0,z.useContext)(o);return w(l,{css:{width:`100%`,height:`100vh`,overflowY:`auto`,p:`6`}},w(S,{align:`start`,className:`rx-Stack`,css:{p:`8`,borderRadius:`12`,shadow:`sm`,width:`100%`},direction:`column`,gap:`3`},w(B,{}),w(S,{align:`end`,className:`rx-Stack`,css:{mb:`6`},direction:`row`,gap:`4`},w(V,{}),w(U,{}),w(S,{align:`start`,className:`rx-Stack`,direction:`column`,gap:`3`},w(W,{}),w(G,{}))),w(x,{columns:`repeat(auto-fit, minmax(230px, 1fr))`,css:{justifyItems:`center`,width:`100%`},gap:`6`},w(C,{css:{background:`white`,shadow:`sm`,borderRadius:`10`,width:`250px`,height:`200px`,textAlign:`center`,"&:hover":{shadow:`md`,transform:`scale(1.03)`,transition:`all 0.25s ease`}}},w(S,{align:`center`,css:{gap:`1`,p:`4`},direction:`column`,justify:`center`},w(l,{css:{background:`blue.100`,p:`3`,borderRadius:`full`,mb:`3`}},w(D,{css:{color:`blue.600`},size:22})),w(K,{}),w(u,{as:`p`,css:{fontSize:`2`,color:`gray.600`}},`Total Employees`),w(S,{align:`center`,css:{gap:`1`,mt:`1`},direction:`row`},w(I,{size:12}),w(u,{as:`p`,css:{fontSize:`2`,fontWeight:`semibold`}},`0%`)))),w(C,{css:{background:`white`,shadow:`sm`,borderRadius:`10`,width:`250px`,height:`200px`,textAlign:`center`,"&:hover":{shadow:`md`,transform:`scale(1.03)`,transition:`all 0.25s ease`}}},w(S,{align:`center`,css:{gap:`1`,p:`4`},direction:`column`,justify:`center`},w(l,{css:{background:`green.100`,p:`3`,borderRadius:`full`,mb:`3`}},w(L,{css:{color:`green.600`},size:22})),w(q,{}),w(u,{as:`p`,css:{fontSize:`2`,color:`gray.600`}},`New Hires (This Month)`),w(S,{align:`center`,css:{gap:`1`,mt:`1`},direction:`row`},w(I,{size:12}),w(u,{as:`p`,css:{fontSize:`2`,fontWeight:`semibold`}},`0%`)))),w(C,{css:{background:`white`,shadow:`sm`,borderRadius:`10`,width:`250px`,height:`200px`,textAlign:`center`,"&:hover":{shadow:`md`,transform:`scale(1.03)`,transition:`all 0.25s ease`}}},w(S,{align:`center`,css:{gap:`1`,p:`4`},direction:`column`,justify:`center`},w(l,{css:{background:`red.100`,p:`3`,borderRadius:`full`,mb:`3`}},w(R,{css:{color:`red.600`},size:22})),w(J,{}),w(u,{as:`p`,css:{fontSize:`2`,color:`gray.600`}},`Attrition`),w(S,{align:`center`,css:{gap:`1`,mt:`1`},direction:`row`},w(F,{size:12}),w(u,{as:`p`,css:{fontSize:`2`,fontWeight:`semibold`}},`1.1%`)))),w(C,{css:{background:`white`,shadow:`sm`,borderRadius:`10`,width:`250px`,height:`200px`,textAlign:`center`,"&:hover":{shadow:`md`,transform:`scale(1.03)`,transition:`all 0.25s ease`}}},w(S,{align:`center`,css:{gap:`1`,p:`4`},direction:`column`,justify:`center`},w(l,{css:{background:`purple.100`,p:`3`,borderRadius:`full`,mb:`3`}},w(k,{css:{color:`purple.600`},size:22})),w(Y,{}),w(u,{as:`p`,css:{fontSize:`2`,color:`gray.600`}},`Leave Requests`),w(S,{align:`center`,css:{gap:`1`,mt:`1`},direction:`row`},w(I,{size:12}),w(u,{as:`p`,css:{fontSize:`2`,fontWeight:`semibold`}},`0%`)))),w(C,{css:{background:`white`,shadow:`sm`,borderRadius:`10`,width:`250px`,height:`200px`,textAlign:`center`,"&:hover":{shadow:`md`,transform:`scale(1.03)`,transition:`all 0.25s ease`}}},w(S,{align:`center`,css:{gap:`1`,p:`4`},direction:`column`,justify:`center`},w(l,{css:{background:`teal.100`,p:`3`,borderRadius:`full`,mb:`3`}},w(P,{css:{color:`teal.600`},size:22})),w(X,{}),w(u,{as:`p`,css:{fontSize:`2`,color:`gray.600`}},`Attendance Rate %`),w(S,{align:`center`,css:{gap:`1`,mt:`1`},direction:`row`},w(I,{size:12}),w(u,{as:`p`,css:{fontSize:`2`,fontWeight:`semibold`}},`0%`))))),w(S,{align:`start`,className:`rx-Stack`,css:{mt:`8`},direction:`column`,gap:`2`},w(b,{css:{width:`100%`,border:`1px solid`,borderColor:`gray.200`,borderRadius:`md`,overflowX:`auto`}},w(m,{},w(g,{},w(_,{css:{width:`150px`}},`Name`),w(_,{css:{width:`200px`}},`Email`),w(_,{css:{width:`100px`}},`Role`),w(_,{css:{width:`120px`}},`Check-in Today`),w(_,{css:{width:`120px`}},`Check-out Today`),w(_,{css:{width:`100px`}},`status today`),w(_,{css:{width:`140px`}},`Date of Joining`),w(_,{css:{width:`140px`}},`Days Since Joining`))),w(y,{},w(Q,{}))))))}var ee=n(function(){return w(z.Fragment,{},w(S,{align:`start`,className:`rx-Stack`,direction:`column`,gap:`0`},w(S,{align:`center`,className:`rx-Stack`,css:{width:`100%`,paddingTop:`1.5`,paddingBottom:`1.5`,paddingInlineStart:`6`,paddingInlineEnd:`6`,backgroundColor:`#FFF44F`,boxShadow:`0 2px 8px rgba(0, 0, 0, 0.15)`,position:`sticky`,top:`0`,zIndex:`1000`},direction:`row`,justify:`between`,gap:`3`},w(u,{as:`p`,css:{color:`#1E3A8A`,fontSize:`2`,fontWeight:`bold`,paddingInlineStart:`2`,paddingInlineEnd:`2`,"&:hover":{color:`#2563EB`,transition:`color 0.3s ease`}}},`OStaffSync`),w(S,{align:`center`,className:`rx-Stack`,css:{margin:`20`},direction:`row`,gap:`5`},w(d,{asChild:!0,css:{color:`black`,fontSize:`1.1`,paddingInlineStart:`2`,paddingInlineEnd:`2`,"&:hover":{color:`#2563EB`,transform:`scale(1.05)`,transition:`all 0.3s ease-in-out`}}},w(r,{to:`/login`},`Logout`)))),w(S,{align:`start`,className:`rx-Stack`,css:{width:`100%`},direction:`row`,gap:`3`},w(l,{},w(S,{align:`start`,className:`rx-Stack`,css:{height:`100vh`,backgroundColor:`var(--accent-2)`,width:`18rem`,borderRight:`1px solid var(--gray-6)`},direction:`column`,justify:`between`,gap:`2`},w(S,{align:`center`,className:`rx-Stack`,css:{padding:`1rem`},direction:`row`,gap:`3`},w(E,{size:22}),w(u,{as:`p`,size:`5`,weight:`bold`},`OStaffSync`)),w(h,{size:`4`}),w(d,{asChild:!0,css:{"&:hover":{color:`var(--accent-8)`}}},w(r,{to:`/dashboard`},w(S,{align:`center`,className:`rx-Stack`,css:{"&:hover":{background:`var(--accent-4)`,color:`var(--accent-11)`,cursor:`pointer`},width:`100%`,paddingInlineStart:`0.5rem`,paddingInlineEnd:`0.5rem`,paddingTop:`0.75rem`,paddingBottom:`0.75rem`},direction:`row`,gap:`3`},w(M,{}),w(u,{as:`p`,size:`4`},`Dashboard`)))),w(d,{asChild:!0,css:{"&:hover":{color:`var(--accent-8)`}}},w(r,{to:`/employees`},w(S,{align:`center`,className:`rx-Stack`,css:{"&:hover":{background:`var(--accent-4)`,color:`var(--accent-11)`,cursor:`pointer`},width:`100%`,paddingInlineStart:`0.5rem`,paddingInlineEnd:`0.5rem`,paddingTop:`0.75rem`,paddingBottom:`0.75rem`},direction:`row`,gap:`3`},w(D,{}),w(u,{as:`p`,size:`4`},`Employees`)))),w(d,{asChild:!0,css:{"&:hover":{color:`var(--accent-8)`}}},w(r,{to:`/attendance`},w(S,{align:`center`,className:`rx-Stack`,css:{"&:hover":{background:`var(--accent-4)`,color:`var(--accent-11)`,cursor:`pointer`},width:`100%`,paddingInlineStart:`0.5rem`,paddingInlineEnd:`0.5rem`,paddingTop:`0.75rem`,paddingBottom:`0.75rem`},direction:`row`,gap:`3`},w(k,{}),w(u,{as:`p`,size:`4`},`Attendance`)))),w(d,{asChild:!0,css:{"&:hover":{color:`var(--accent-8)`}}},w(r,{to:`/payroll`},w(S,{align:`center`,className:`rx-Stack`,css:{"&:hover":{background:`var(--accent-4)`,color:`var(--accent-11)`,cursor:`pointer`},width:`100%`,paddingInlineStart:`0.5rem`,paddingInlineEnd:`0.5rem`,paddingTop:`0.75rem`,paddingBottom:`0.75rem`},direction:`row`,gap:`3`},w(A,{}),w(u,{as:`p`,size:`4`},`Payroll`)))),w(S,{css:{flex:1,justifySelf:`stretch`,alignSelf:`stretch`}}),w(l,{css:{padding:`1rem`,borderTop:`1px solid var(--gray-5)`}},w(S,{align:`center`,className:`rx-Stack`,css:{width:`100%`},direction:`row`,justify:`between`,gap:`3`},w(i,{fallback:`👤`,size:`3`}),w(S,{align:`start`,className:`rx-Stack`,direction:`column`,gap:`0`},w(j,{}),w(O,{}))),w(N,{})))),w($,{}))),w(`title`,{},`Ostaffsync | Dashboard`),w(`meta`,{content:`favicon.ico`,property:`og:image`}))});export{ee as default};
\ No newline at end of file
@@ -1 +0,0 @@
-import{a as e}from"./rolldown-runtime-D_juG1Xi.js";import{t}from"./react-BcXKmAwN.js";import"./react-dom-Dr_efIFp.js";import{A as n,r}from"./chunk-NISHYRIK-BsYev12b.js";import{C as i,E as a,F as o,H as s,L as c,S as l,T as u,_ as d,a as f,b as p,c as m,d as h,i as g,l as _,o as v,s as y,u as b,v as x,x as S,y as C}from"./esm-d7QI_Eml.js";import"./reflex-env-CtwX00K9.js";import{n as w}from"./emotion-react.browser.esm-B3Hu227f.js";import"./react-is-BiweJ67z.js";import"./shim-DLiwten_.js";import{t as T}from"./createLucideIcon-DvMhwGZ5.js";import{n as E,t as D}from"./calendar-x-DWj0leKb.js";import{a as O,c as k,i as A,o as j,s as M,t as N}from"./stateful_components-EggvQ1Ld.js";import{t as P}from"./clock-CK397qlP.js";import{n as F,t as I}from"./trending-up-BoAe-G0q.js";import{t as L}from"./user-DxYhwzmx.js";import"./lib-D8E8fr-q.js";var R=T(`activity`,[[`path`,{d:`M22 12h-2.48a2 2 0 0 0-1.93 1.46l-2.35 8.36a.25.25 0 0 1-.48 0L9.24 2.18a.25.25 0 0 0-.48 0l-2.35 8.36A2 2 0 0 1 4.49 12H2`,key:`169zse`}]]),z=e(t());function B(){let e=(0,z.useContext)(c.reflex___state____state__templates___login____login_state);return w(u,{as:`p`},`Welcome, `+e.user_id_rx_state_+`!`)}function V(){let e=(0,z.useContext)(c.reflex___state____state__templates___login____login_state__components___employee_dash_side_nav____employee_state__templates___employee_dashboard____employee_dashboard_state);return w(u,{as:`p`,css:{fontWeight:`bold`}},e.formatted_date_rx_state_)}function H(){let e=(0,z.useContext)(c.reflex___state____state__templates___login____login_state__components___employee_dash_side_nav____employee_state__templates___employee_dashboard____employee_dashboard_state);return w(z.Fragment,{},e.isLogin_rx_state_?w(z.Fragment,{},w(u,{as:`p`,css:{color:`red`}},`Sign-out`)):w(z.Fragment,{},w(u,{as:`p`,css:{color:`blue`}},`Sign-in`)))}function U(){let[e,t]=(0,z.useContext)(o),n=(0,z.useCallback)(t=>e([s(`reflex___state____state.templates___login____login_state.components___employee_dash_side_nav____employee_state.templates___employee_dashboard____employee_dashboard_state.LoginStateUpdate`,{},{})],[t],{}),[e,s]);return w(p,{onClick:n},w(H,{}))}function W(){let e=(0,z.useContext)(c.reflex___state____state__templates___login____login_state__components___employee_dash_side_nav____employee_state__templates___employee_dashboard____employee_dashboard_state);return w(u,{as:`p`},`Login time: `+e.check_in_rx_state_)}function G(){let e=(0,z.useContext)(c.reflex___state____state__templates___login____login_state__components___employee_dash_side_nav____employee_state__templates___employee_dashboard____employee_dashboard_state);return w(u,{as:`p`},`Logout time: `+e.check_out_rx_state_)}function K(){let e=(0,z.useContext)(c.reflex___state____state__templates___login____login_state__components___employee_dash_side_nav____employee_state__templates___employee_dashboard____employee_dashboard_state);return w(a,{css:{fontWeight:`bold`,color:`gray.800`},size:`6`},e.Present_Days_This_Month_rx_state_)}function q(){let e=(0,z.useContext)(c.reflex___state____state__templates___login____login_state__components___employee_dash_side_nav____employee_state__templates___employee_dashboard____employee_dashboard_state);return w(a,{css:{fontWeight:`bold`,color:`gray.800`},size:`6`},e.Leaves_Taken_rx_state_)}function J(){let e=(0,z.useContext)(c.reflex___state____state__templates___login____login_state__components___employee_dash_side_nav____employee_state__templates___employee_dashboard____employee_dashboard_state);return w(a,{css:{fontWeight:`bold`,color:`gray.800`},size:`6`},e.Leaves_Remaining_rx_state_)}function Y(){let e=(0,z.useContext)(c.reflex___state____state__templates___login____login_state__components___employee_dash_side_nav____employee_state__templates___employee_dashboard____employee_dashboard_state);return w(a,{css:{fontWeight:`bold`,color:`gray.800`},size:`6`},e.My_Attendance_Rate_rx_state_)}function X(){let e=(0,z.useContext)(c.reflex___state____state__templates___login____login_state__components___employee_dash_side_nav____employee_state__templates___employee_dashboard____employee_dashboard_state);return w(z.Fragment,{},Array.prototype.map.call(e.attendance_data_rx_state_??[],(e,t)=>w(g,{key:t},w(f,{},e?.date),w(v,{},e?.check_in),w(v,{},e?.check_out),w(v,{},e?.status),w(v,{},e?.hours_worked))))}function Z(){let e=(0,z.useContext)(c.reflex___state____state__templates___login____login_state__components___employee_dash_side_nav____employee_state__templates___employee_dashboard____employee_dashboard_state);return w(z.Fragment,{},e.attendance_data_rx_state_.length>0?w(X,{}):w(z.Fragment,{},w(g,{},w(f,{colSpan:5,css:{textAlign:`center`},py:`4`},w(u,{as:`p`},`No attendance records found.`)))))}function Q(){(0,z.useEffect)(()=>(((...t)=>e([s(`reflex___state____state.templates___login____login_state.components___employee_dash_side_nav____employee_state.templates___employee_dashboard____employee_dashboard_state.on_mount`,{},{})],t,{}))(),()=>{}),[]);let[e,t]=(0,z.useContext)(o);return w(l,{css:{width:`100%`,height:`100vh`,overflowY:`auto`,p:`6`}},w(S,{align:`start`,className:`rx-Stack`,css:{p:`8`,borderRadius:`12`,shadow:`2`,width:`100%`},direction:`column`,gap:`3`},w(B,{}),w(S,{align:`end`,className:`rx-Stack`,css:{mb:`6`},direction:`row`,gap:`4`},w(V,{}),w(U,{}),w(S,{align:`start`,className:`rx-Stack`,direction:`column`,gap:`3`},w(W,{}),w(G,{}))),w(x,{columns:`repeat(auto-fit, minmax(230px, 1fr))`,css:{justifyItems:`center`,width:`100%`},gap:`6`},w(C,{css:{background:`white`,shadow:`2`,borderRadius:`10`,width:`250px`,height:`200px`,textAlign:`center`,"&:hover":{shadow:`md`,transform:`scale(1.03)`,transition:`all 0.25s ease`}}},w(S,{align:`center`,css:{gap:`1`,p:`4`},direction:`column`,justify:`center`},w(l,{css:{background:`blue.100`,p:`3`,borderRadius:`full`,mb:`3`}},w(P,{css:{color:`blue.600`},size:22})),w(K,{}),w(u,{as:`p`,css:{fontSize:`2`,color:`gray.600`}},`Present Days (This Month)`),w(S,{align:`center`,css:{gap:`1`,mt:`1`},direction:`row`},w(I,{size:12}),w(u,{as:`p`,css:{fontSize:`2`,fontWeight:`semibold`}},`3.2%`)))),w(C,{css:{background:`white`,shadow:`2`,borderRadius:`10`,width:`250px`,height:`200px`,textAlign:`center`,"&:hover":{shadow:`md`,transform:`scale(1.03)`,transition:`all 0.25s ease`}}},w(S,{align:`center`,css:{gap:`1`,p:`4`},direction:`column`,justify:`center`},w(l,{css:{background:`orange.100`,p:`3`,borderRadius:`full`,mb:`3`}},w(D,{css:{color:`orange.600`},size:22})),w(q,{}),w(u,{as:`p`,css:{fontSize:`2`,color:`gray.600`}},`Leaves Taken (This Year)`),w(S,{align:`center`,css:{gap:`1`,mt:`1`},direction:`row`},w(F,{size:12}),w(u,{as:`p`,css:{fontSize:`2`,fontWeight:`semibold`}},`2.1%`)))),w(C,{css:{background:`white`,shadow:`2`,borderRadius:`10`,width:`250px`,height:`200px`,textAlign:`center`,"&:hover":{shadow:`md`,transform:`scale(1.03)`,transition:`all 0.25s ease`}}},w(S,{align:`center`,css:{gap:`1`,p:`4`},direction:`column`,justify:`center`},w(l,{css:{background:`green.100`,p:`3`,borderRadius:`full`,mb:`3`}},w(E,{css:{color:`green.600`},size:22})),w(J,{}),w(u,{as:`p`,css:{fontSize:`2`,color:`gray.600`}},`Leaves Remaining`),w(S,{align:`center`,css:{gap:`1`,mt:`1`},direction:`row`},w(I,{size:12}),w(u,{as:`p`,css:{fontSize:`2`,fontWeight:`semibold`}},`18.0%`)))),w(C,{css:{background:`white`,shadow:`2`,borderRadius:`10`,width:`250px`,height:`200px`,textAlign:`center`,"&:hover":{shadow:`md`,transform:`scale(1.03)`,transition:`all 0.25s ease`}}},w(S,{align:`center`,css:{gap:`1`,p:`4`},direction:`column`,justify:`center`},w(l,{css:{background:`teal.100`,p:`3`,borderRadius:`full`,mb:`3`}},w(R,{css:{color:`teal.600`},size:22})),w(Y,{}),w(u,{as:`p`,css:{fontSize:`2`,color:`gray.600`}},`My Attendance Rate %`),w(S,{align:`center`,css:{gap:`1`,mt:`1`},direction:`row`},w(I,{size:12}),w(u,{as:`p`,css:{fontSize:`2`,fontWeight:`semibold`}},`0.8%`))))),w(S,{align:`start`,className:`rx-Stack`,css:{mt:`8`},direction:`column`,gap:`2`},w(b,{css:{width:`100%`,border:`1px solid`,borderColor:`gray.200`,borderRadius:`md`,overflowX:`auto`}},w(m,{},w(g,{},w(_,{css:{width:`120px`}},`Date`),w(_,{css:{width:`100px`}},`Check-in`),w(_,{css:{width:`100px`}},`Check-out`),w(_,{css:{width:`100px`}},`Status`),w(_,{css:{width:`120px`}},`Hours Worked`))),w(y,{},w(Z,{}))))))}var $=n(function(){return w(z.Fragment,{},w(S,{align:`start`,className:`rx-Stack`,direction:`column`,gap:`0`},w(S,{align:`center`,className:`rx-Stack`,css:{width:`100%`,paddingTop:`1.5`,paddingBottom:`1.5`,paddingInlineStart:`6`,paddingInlineEnd:`6`,backgroundColor:`#FFF44F`,boxShadow:`0 2px 8px rgba(0, 0, 0, 0.15)`,position:`sticky`,top:`0`,zIndex:`1000`},direction:`row`,justify:`between`,gap:`3`},w(u,{as:`p`,css:{color:`#1E3A8A`,fontSize:`2`,fontWeight:`bold`,paddingInlineStart:`2`,paddingInlineEnd:`2`,"&:hover":{color:`#2563EB`,transition:`color 0.3s ease`}}},`OStaffSync`),w(S,{align:`center`,className:`rx-Stack`,css:{margin:`20`},direction:`row`,gap:`5`},w(d,{asChild:!0,css:{color:`black`,fontSize:`1.1`,paddingInlineStart:`2`,paddingInlineEnd:`2`,"&:hover":{color:`#2563EB`,transform:`scale(1.05)`,transition:`all 0.3s ease-in-out`}}},w(r,{to:`/login`},`Logout`)))),w(S,{align:`start`,className:`rx-Stack`,css:{width:`100%`},direction:`row`,gap:`3`},w(l,{},w(S,{align:`start`,className:`rx-Stack`,css:{height:`100vh`,backgroundColor:`var(--accent-2)`,width:`18rem`,borderRight:`1px solid var(--gray-6)`},direction:`column`,justify:`between`,gap:`2`},w(S,{align:`center`,className:`rx-Stack`,css:{padding:`1rem`},direction:`row`,gap:`3`},w(L,{size:22}),w(u,{as:`p`,size:`5`,weight:`bold`},`OStaffSync`),w(u,{as:`p`,css:{color:`gray`},size:`3`},`Employee`)),w(h,{size:`4`}),w(d,{asChild:!0,css:{"&:hover":{color:`var(--accent-8)`}}},w(r,{to:`/empdashboard`},w(S,{align:`center`,className:`rx-Stack`,css:{"&:hover":{background:`var(--accent-4)`,color:`var(--accent-11)`,cursor:`pointer`},width:`100%`,paddingInlineStart:`0.5rem`,paddingInlineEnd:`0.5rem`,paddingTop:`0.75rem`,paddingBottom:`0.75rem`},direction:`row`,gap:`3`},w(M,{}),w(u,{as:`p`,size:`4`},`Dashboard`)))),w(d,{asChild:!0,css:{"&:hover":{color:`var(--accent-8)`}}},w(r,{to:`/empleaves`},w(S,{align:`center`,className:`rx-Stack`,css:{"&:hover":{background:`var(--accent-4)`,color:`var(--accent-11)`,cursor:`pointer`},width:`100%`,paddingInlineStart:`0.5rem`,paddingInlineEnd:`0.5rem`,paddingTop:`0.75rem`,paddingBottom:`0.75rem`},direction:`row`,gap:`3`},w(k,{}),w(u,{as:`p`,size:`4`},`Leaves`)))),w(d,{asChild:!0,css:{"&:hover":{color:`var(--accent-8)`}}},w(r,{to:`/emppayrole`},w(S,{align:`center`,className:`rx-Stack`,css:{"&:hover":{background:`var(--accent-4)`,color:`var(--accent-11)`,cursor:`pointer`},width:`100%`,paddingInlineStart:`0.5rem`,paddingInlineEnd:`0.5rem`,paddingTop:`0.75rem`,paddingBottom:`0.75rem`},direction:`row`,gap:`3`},w(j,{}),w(u,{as:`p`,size:`4`},`Payroll`)))),w(S,{css:{flex:1,justifySelf:`stretch`,alignSelf:`stretch`}}),w(l,{css:{padding:`1rem`,borderTop:`1px solid var(--gray-5)`}},w(S,{align:`center`,className:`rx-Stack`,css:{width:`100%`},direction:`row`,justify:`between`,gap:`3`},w(i,{fallback:`👤`,size:`3`}),w(S,{align:`start`,className:`rx-Stack`,direction:`column`,gap:`0`},w(A,{}),w(O,{}))),w(N,{})))),w(Q,{}))),w(`title`,{},`Ostaffsync | Empdashboard`),w(`meta`,{content:`favicon.ico`,property:`og:image`}))});export{$ as default};
\ No newline at end of file
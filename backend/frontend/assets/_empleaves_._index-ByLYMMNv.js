@@ -1 +0,0 @@
-import{a as e}from"./rolldown-runtime-D_juG1Xi.js";import{t}from"./react-BcXKmAwN.js";import"./react-dom-Dr_efIFp.js";import{A as n,r}from"./chunk-NISHYRIK-BsYev12b.js";import{C as i,E as a,F as o,H as s,L as c,S as l,T as u,W as d,_ as f,a as p,b as m,c as h,d as g,f as _,g as v,h as y,i as b,l as x,m as ee,n as S,o as C,p as te,r as w,s as T,u as E,v as D,x as O,y as k}from"./esm-d7QI_Eml.js";import"./reflex-env-CtwX00K9.js";import{n as A}from"./emotion-react.browser.esm-B3Hu227f.js";import"./react-is-BiweJ67z.js";import"./shim-DLiwten_.js";import{n as j,r as M,t as N}from"./dist-Q3q4enLd.js";import"./createLucideIcon-DvMhwGZ5.js";import{n as P,t as F}from"./calendar-x-DWj0leKb.js";import{a as I,c as L,i as R,o as z,s as B,t as V}from"./stateful_components-EggvQ1Ld.js";import{t as H}from"./clock-CK397qlP.js";import{n as U,t as W}from"./trending-up-BoAe-G0q.js";import{t as G}from"./user-DxYhwzmx.js";import{t as K}from"./lib-D8E8fr-q.js";var q=e(t()),J=e(K());function Y(){let e=(0,q.useContext)(c.reflex___state____state__templates___login____login_state__components___employee_dash_side_nav____employee_state__templates___employee_leave_dashboard____employee_leaves_state);return A(u,{as:`p`},`Leaves Management - `+e.formatted_date_rx_state_)}function X(){let e=(0,q.useContext)(c.reflex___state____state__templates___login____login_state__components___employee_dash_side_nav____employee_state__templates___employee_leave_dashboard____employee_leaves_state);return A(a,{css:{fontWeight:`bold`,color:`gray.800`},size:`6`},e.Leaves_Taken_rx_state_)}function Z(){let e=(0,q.useContext)(c.reflex___state____state__templates___login____login_state__components___employee_dash_side_nav____employee_state__templates___employee_leave_dashboard____employee_leaves_state);return A(a,{css:{fontWeight:`bold`,color:`gray.800`},size:`6`},e.Leaves_Remaining_rx_state_)}function Q(){let e=(0,q.useContext)(c.reflex___state____state__templates___login____login_state__components___employee_dash_side_nav____employee_state__templates___employee_leave_dashboard____employee_leaves_state);return A(a,{css:{fontWeight:`bold`,color:`gray.800`},size:`6`},e.Pending_Requests_rx_state_)}function ne(){let e=(0,q.useContext)(c.reflex___state____state__templates___login____login_state__components___employee_dash_side_nav____employee_state__templates___employee_leave_dashboard____employee_leaves_state);return A(v,{},``,Array.prototype.map.call(e.leave_type_rx_state_.split(``)??[],(e,t)=>A(y,{key:t,value:e},e)))}function re(){let[e,t]=(0,q.useContext)(o),n=(0,q.useCallback)(t=>e([s(`reflex___state____state.templates___login____login_state.components___employee_dash_side_nav____employee_state.templates___employee_leave_dashboard____employee_leaves_state.set_leave_type`,{value:t},{})],[t],{}),[e,s]);return A(_,{css:{"@media screen and (min-width: 0)":{options:`Vacation`},"@media screen and (min-width: 30em)":{options:`Sick Leave`},"@media screen and (min-width: 48em)":{options:`Personal`},"@media screen and (min-width: 62em)":{options:`Maternity/Paternity`}},onValueChange:n},A(ee,{placeholder:`Select Leave Type`}),A(te,{},A(ne,{})))}function ie(){let e=(0,q.useContext)(c.reflex___state____state__templates___login____login_state__components___employee_dash_side_nav____employee_state__templates___employee_leave_dashboard____employee_leaves_state),[t,n]=(0,q.useContext)(o),r=(0,q.useCallback)(e=>t([s(`reflex___state____state.templates___login____login_state.components___employee_dash_side_nav____employee_state.templates___employee_leave_dashboard____employee_leaves_state.set_start_date`,{value:e?.target?.value},{})],[e],{}),[t,s]);return A(J.default,{debounceTimeout:300,element:S,onChange:r,type:`date`,value:d(e.formatted_start_date_rx_state_)?e.formatted_start_date_rx_state_:``})}function ae(){let e=(0,q.useContext)(c.reflex___state____state__templates___login____login_state__components___employee_dash_side_nav____employee_state__templates___employee_leave_dashboard____employee_leaves_state),[t,n]=(0,q.useContext)(o),r=(0,q.useCallback)(e=>t([s(`reflex___state____state.templates___login____login_state.components___employee_dash_side_nav____employee_state.templates___employee_leave_dashboard____employee_leaves_state.set_end_date`,{value:e?.target?.value},{})],[e],{}),[t,s]);return A(J.default,{debounceTimeout:300,element:S,onChange:r,type:`date`,value:d(e.formatted_end_date_rx_state_)?e.formatted_end_date_rx_state_:``})}function oe(){let[e,t]=(0,q.useContext)(o),n=(0,q.useContext)(c.reflex___state____state__templates___login____login_state__components___employee_dash_side_nav____employee_state__templates___employee_leave_dashboard____employee_leaves_state),r=(0,q.useCallback)(t=>e([s(`reflex___state____state.templates___login____login_state.components___employee_dash_side_nav____employee_state.templates___employee_leave_dashboard____employee_leaves_state.set_notes`,{value:t?.target?.value},{})],[t],{}),[e,s]);return A(w,{css:{"& textarea":null},onChange:r,rows:`3`},n.notes_rx_state_)}function $(){let[e,t]=(0,q.useContext)(o),n=(0,q.useCallback)(t=>e([s(`reflex___state____state.templates___login____login_state.components___employee_dash_side_nav____employee_state.templates___employee_leave_dashboard____employee_leaves_state.submit_leave_request`,{},{})],[t],{}),[e,s]);return A(m,{color:`blue`,css:{width:`full`},onClick:n},`Submit Request`)}function se(){let[e,t]=(0,q.useContext)(o),n=(0,q.useCallback)(t=>{let n=t.target;t.preventDefault(),{...Object.fromEntries(new FormData(n).entries())},((...t)=>e([s(`_call_function`,{function:()=>null,callback:null},{preventDefault:!0})],t,{}))(t)});return A(M,{className:`Root `,css:{width:`100%`},onSubmit:n},A(O,{align:`stretch`,className:`rx-Stack`,direction:`column`,gap:`4`},A(re,{}),A(O,{align:`start`,className:`rx-Stack`,direction:`row`,gap:`4`},A(N,{className:`Field `,css:{display:`grid`,marginBottom:`10px`}},A(j,{className:`Label `,css:{fontSize:`15px`,fontWeight:`500`,lineHeight:`35px`}},`Start Date`),A(ie,{})),A(N,{className:`Field `,css:{display:`grid`,marginBottom:`10px`}},A(j,{className:`Label `,css:{fontSize:`15px`,fontWeight:`500`,lineHeight:`35px`}},`End Date`),A(ae,{}))),A(N,{className:`Field `,css:{display:`grid`,marginBottom:`10px`}},A(j,{className:`Label `,css:{fontSize:`15px`,fontWeight:`500`,lineHeight:`35px`}},`Notes (Optional)`),A(oe,{})),A($,{})))}function ce(){let e=(0,q.useContext)(c.reflex___state____state__templates___login____login_state__components___employee_dash_side_nav____employee_state__templates___employee_leave_dashboard____employee_leaves_state);return A(q.Fragment,{},Array.prototype.map.call(e.leaves_data_rx_state_??[],(e,t)=>A(b,{key:t},A(p,{},e?.type),A(C,{},e?.start_date),A(C,{},e?.end_date),A(C,{},e?.duration),A(C,{},e?.status),A(C,{},e?.requested))))}function le(){let e=(0,q.useContext)(c.reflex___state____state__templates___login____login_state__components___employee_dash_side_nav____employee_state__templates___employee_leave_dashboard____employee_leaves_state);return A(q.Fragment,{},e.leaves_data_rx_state_.length>0?A(ce,{}):A(q.Fragment,{},A(b,{},A(p,{colSpan:6,css:{textAlign:`center`},py:`4`},A(u,{as:`p`},`No leave records found.`)))))}function ue(){(0,q.useEffect)(()=>(((...t)=>e([s(`reflex___state____state.templates___login____login_state.components___employee_dash_side_nav____employee_state.templates___employee_leave_dashboard____employee_leaves_state.on_mount`,{},{})],t,{}))(),()=>{}),[]);let[e,t]=(0,q.useContext)(o);return A(l,{css:{width:`100%`,height:`100vh`,overflowY:`auto`,p:`6`}},A(O,{align:`start`,className:`rx-Stack`,css:{p:`8`,borderRadius:`12`,shadow:`sm`,width:`100%`},direction:`column`,gap:`3`},A(Y,{}),A(D,{columns:`repeat(auto-fit, minmax(230px, 1fr))`,css:{justifyItems:`center`,width:`100%`},gap:`6`},A(k,{css:{background:`white`,shadow:`sm`,borderRadius:`10`,width:`250px`,height:`200px`,textAlign:`center`,"&:hover":{shadow:`md`,transform:`scale(1.03)`,transition:`all 0.25s ease`}}},A(O,{align:`center`,css:{gap:`1`,p:`4`},direction:`column`,justify:`center`},A(l,{css:{background:`orange.100`,p:`3`,borderRadius:`full`,mb:`3`}},A(F,{css:{color:`orange.600`},size:22})),A(X,{}),A(u,{as:`p`,css:{fontSize:`2`,color:`gray.600`}},`Leaves Taken (This Year)`),A(O,{align:`center`,css:{gap:`1`,mt:`1`},direction:`row`},A(U,{size:12}),A(u,{as:`p`,css:{fontSize:`2`,fontWeight:`semibold`}},`2.1%`)))),A(k,{css:{background:`white`,shadow:`sm`,borderRadius:`10`,width:`250px`,height:`200px`,textAlign:`center`,"&:hover":{shadow:`md`,transform:`scale(1.03)`,transition:`all 0.25s ease`}}},A(O,{align:`center`,css:{gap:`1`,p:`4`},direction:`column`,justify:`center`},A(l,{css:{background:`green.100`,p:`3`,borderRadius:`full`,mb:`3`}},A(P,{css:{color:`green.600`},size:22})),A(Z,{}),A(u,{as:`p`,css:{fontSize:`2`,color:`gray.600`}},`Leaves Remaining`),A(O,{align:`center`,css:{gap:`1`,mt:`1`},direction:`row`},A(W,{size:12}),A(u,{as:`p`,css:{fontSize:`2`,fontWeight:`semibold`}},`18.0%`)))),A(k,{css:{background:`white`,shadow:`sm`,borderRadius:`10`,width:`250px`,height:`200px`,textAlign:`center`,"&:hover":{shadow:`md`,transform:`scale(1.03)`,transition:`all 0.25s ease`}}},A(O,{align:`center`,css:{gap:`1`,p:`4`},direction:`column`,justify:`center`},A(l,{css:{background:`yellow.100`,p:`3`,borderRadius:`full`,mb:`3`}},A(H,{css:{color:`yellow.600`},size:22})),A(Q,{}),A(u,{as:`p`,css:{fontSize:`2`,color:`gray.600`}},`Pending Requests`),A(O,{align:`center`,css:{gap:`1`,mt:`1`},direction:`row`},A(W,{size:12}),A(u,{as:`p`,css:{fontSize:`2`,fontWeight:`semibold`}},`1`))))),A(k,{css:{background:`white`,shadow:`sm`,borderRadius:`md`,p:`6`,mb:`8`}},A(a,{css:{mb:`4`},size:`6`},`Request New Leave`),A(se,{})),A(O,{align:`start`,className:`rx-Stack`,css:{mt:`8`},direction:`column`,gap:`2`},A(E,{css:{width:`100%`,border:`1px solid`,borderColor:`gray.200`,borderRadius:`md`,overflowX:`auto`}},A(h,{},A(b,{},A(x,{css:{width:`120px`}},`Type`),A(x,{css:{width:`120px`}},`Start Date`),A(x,{css:{width:`120px`}},`End Date`),A(x,{css:{width:`140px`}},`Duration (Days)`),A(x,{css:{width:`100px`}},`Status`),A(x,{css:{width:`120px`}},`Requested`))),A(T,{},A(le,{}))))))}var de=n(function(){return A(q.Fragment,{},A(O,{align:`start`,className:`rx-Stack`,direction:`column`,gap:`0`},A(O,{align:`center`,className:`rx-Stack`,css:{width:`100%`,paddingTop:`1.5`,paddingBottom:`1.5`,paddingInlineStart:`6`,paddingInlineEnd:`6`,backgroundColor:`#FFF44F`,boxShadow:`0 2px 8px rgba(0, 0, 0, 0.15)`,position:`sticky`,top:`0`,zIndex:`1000`},direction:`row`,justify:`between`,gap:`3`},A(u,{as:`p`,css:{color:`#1E3A8A`,fontSize:`2`,fontWeight:`bold`,paddingInlineStart:`2`,paddingInlineEnd:`2`,"&:hover":{color:`#2563EB`,transition:`color 0.3s ease`}}},`OStaffSync`),A(O,{align:`center`,className:`rx-Stack`,css:{margin:`20`},direction:`row`,gap:`5`},A(f,{asChild:!0,css:{color:`black`,fontSize:`1.1`,paddingInlineStart:`2`,paddingInlineEnd:`2`,"&:hover":{color:`#2563EB`,transform:`scale(1.05)`,transition:`all 0.3s ease-in-out`}}},A(r,{to:`/login`},`Logout`)))),A(O,{align:`start`,className:`rx-Stack`,css:{width:`100%`},direction:`row`,gap:`3`},A(l,{},A(O,{align:`start`,className:`rx-Stack`,css:{height:`100vh`,backgroundColor:`var(--accent-2)`,width:`18rem`,borderRight:`1px solid var(--gray-6)`},direction:`column`,justify:`between`,gap:`2`},A(O,{align:`center`,className:`rx-Stack`,css:{padding:`1rem`},direction:`row`,gap:`3`},A(G,{size:22}),A(u,{as:`p`,size:`5`,weight:`bold`},`OStaffSync`),A(u,{as:`p`,css:{color:`gray`},size:`3`},`Employee`)),A(g,{size:`4`}),A(f,{asChild:!0,css:{"&:hover":{color:`var(--accent-8)`}}},A(r,{to:`/empdashboard`},A(O,{align:`center`,className:`rx-Stack`,css:{"&:hover":{background:`var(--accent-4)`,color:`var(--accent-11)`,cursor:`pointer`},width:`100%`,paddingInlineStart:`0.5rem`,paddingInlineEnd:`0.5rem`,paddingTop:`0.75rem`,paddingBottom:`0.75rem`},direction:`row`,gap:`3`},A(B,{}),A(u,{as:`p`,size:`4`},`Dashboard`)))),A(f,{asChild:!0,css:{"&:hover":{color:`var(--accent-8)`}}},A(r,{to:`/empleaves`},A(O,{align:`center`,className:`rx-Stack`,css:{"&:hover":{background:`var(--accent-4)`,color:`var(--accent-11)`,cursor:`pointer`},width:`100%`,paddingInlineStart:`0.5rem`,paddingInlineEnd:`0.5rem`,paddingTop:`0.75rem`,paddingBottom:`0.75rem`},direction:`row`,gap:`3`},A(L,{}),A(u,{as:`p`,size:`4`},`Leaves`)))),A(f,{asChild:!0,css:{"&:hover":{color:`var(--accent-8)`}}},A(r,{to:`/emppayrole`},A(O,{align:`center`,className:`rx-Stack`,css:{"&:hover":{background:`var(--accent-4)`,color:`var(--accent-11)`,cursor:`pointer`},width:`100%`,paddingInlineStart:`0.5rem`,paddingInlineEnd:`0.5rem`,paddingTop:`0.75rem`,paddingBottom:`0.75rem`},direction:`row`,gap:`3`},A(z,{}),A(u,{as:`p`,size:`4`},`Payroll`)))),A(O,{css:{flex:1,justifySelf:`stretch`,alignSelf:`stretch`}}),A(l,{css:{padding:`1rem`,borderTop:`1px solid var(--gray-5)`}},A(O,{align:`center`,className:`rx-Stack`,css:{width:`100%`},direction:`row`,justify:`between`,gap:`3`},A(i,{fallback:`👤`,size:`3`}),A(O,{align:`start`,className:`rx-Stack`,direction:`column`,gap:`0`},A(R,{}),A(I,{}))),A(V,{})))),A(ue,{}))),A(`title`,{},`Ostaffsync | Empleaves`),A(`meta`,{content:`favicon.ico`,property:`og:image`}))});export{de as default};
\ No newline at end of file
@@ -1 +0,0 @@
-import{a as e}from"./rolldown-runtime-D_juG1Xi.js";import{t}from"./react-BcXKmAwN.js";import"./react-dom-Dr_efIFp.js";import{A as n,r}from"./chunk-NISHYRIK-BsYev12b.js";import{C as i,E as a,F as o,G as s,H as c,L as l,S as u,T as d,_ as f,b as p,c as m,d as h,f as g,g as _,h as v,i as y,l as b,m as x,o as S,p as C,s as w,u as T,x as E,y as D}from"./esm-d7QI_Eml.js";import"./reflex-env-CtwX00K9.js";import{n as O}from"./emotion-react.browser.esm-B3Hu227f.js";import"./react-is-BiweJ67z.js";import"./shim-DLiwten_.js";import{t as k}from"./createLucideIcon-DvMhwGZ5.js";import{a as A,c as j,i as M,o as N,s as P,t as F}from"./stateful_components-EggvQ1Ld.js";import{t as I}from"./user-DxYhwzmx.js";import"./lib-D8E8fr-q.js";var L=k(`circle-question-mark`,[[`circle`,{cx:`12`,cy:`12`,r:`10`,key:`1mglay`}],[`path`,{d:`M9.09 9a3 3 0 0 1 5.83 1c0 2-3 3-3 3`,key:`1u773s`}],[`path`,{d:`M12 17h.01`,key:`p32p05`}]]),R=k(`credit-card`,[[`rect`,{width:`20`,height:`14`,x:`2`,y:`5`,rx:`2`,key:`ynyp8z`}],[`line`,{x1:`2`,x2:`22`,y1:`10`,y2:`10`,key:`1b3vmo`}]]),z=e(t());function B(){let e=(0,z.useContext)(l.reflex___state____state__templates___login____login_state__components___employee_dash_side_nav____employee_state__templates___employee_payrole_dashboard____employee_payroll_state);return O(_,{},``,Array.prototype.map.call(e.available_months_rx_state_??[],(e,t)=>O(v,{key:t,value:e},e)))}function V(){let e=(0,z.useContext)(l.reflex___state____state__templates___login____login_state__components___employee_dash_side_nav____employee_state__templates___employee_payrole_dashboard____employee_payroll_state),[t,n]=(0,z.useContext)(o),r=(0,z.useCallback)(e=>t([c(`reflex___state____state.templates___login____login_state.components___employee_dash_side_nav____employee_state.templates___employee_payrole_dashboard____employee_payroll_state.set_month`,{month:e},{})],[e],{}),[t,c]);return O(g,{onValueChange:r,value:e.month_selected_rx_state_},O(x,{css:{width:`200px`},placeholder:`Select Month`}),O(C,{},O(B,{})))}function H(){let[e,t]=(0,z.useContext)(o),n=(0,z.useCallback)(t=>e([c(`reflex___state____state.templates___login____login_state.components___employee_dash_side_nav____employee_state.templates___employee_payrole_dashboard____employee_payroll_state.load_payroll`,{},{})],[t],{}),[e,c]);return O(p,{onClick:n},`Load Payroll`)}function U(){let e=(0,z.useContext)(l.reflex___state____state__templates___login____login_state__components___employee_dash_side_nav____employee_state__templates___employee_payrole_dashboard____employee_payroll_state);return O(S,{},e.payroll_data_rx_state_?.gross_salary)}function W(){let e=(0,z.useContext)(l.reflex___state____state__templates___login____login_state__components___employee_dash_side_nav____employee_state__templates___employee_payrole_dashboard____employee_payroll_state);return O(S,{},e.payroll_data_rx_state_?.deductions)}function G(){let e=(0,z.useContext)(l.reflex___state____state__templates___login____login_state__components___employee_dash_side_nav____employee_state__templates___employee_payrole_dashboard____employee_payroll_state);return O(S,{},e.payroll_data_rx_state_?.net_salary)}function K(){let e=(0,z.useContext)(l.reflex___state____state__templates___login____login_state__components___employee_dash_side_nav____employee_state__templates___employee_payrole_dashboard____employee_payroll_state);return O(S,{},e.payroll_data_rx_state_?.processed_at)}function q(){let e=(0,z.useContext)(l.reflex___state____state__templates___login____login_state__components___employee_dash_side_nav____employee_state__templates___employee_payrole_dashboard____employee_payroll_state);return O(z.Fragment,{},s(e.payroll_data_rx_state_)?O(z.Fragment,{},O(T,{css:{width:`100%`,border:`1px solid`,borderColor:`gray.200`,borderRadius:`md`}},O(m,{},O(y,{},O(b,{},`Gross Salary`),O(b,{},`Deductions`),O(b,{},`Net Salary`),O(b,{},`Processed At`))),O(w,{},O(y,{},O(U,{}),O(W,{}),O(G,{}),O(K,{}))))):O(z.Fragment,{},O(d,{as:`p`,css:{color:`gray.500`}},`No payroll data for selected month.`)))}function J(){(0,z.useEffect)(()=>(((...t)=>e([c(`reflex___state____state.templates___login____login_state.components___employee_dash_side_nav____employee_state.templates___employee_payrole_dashboard____employee_payroll_state.on_load`,{},{})],t,{}))(),()=>{}),[]);let[e,t]=(0,z.useContext)(o);return O(E,{align:`start`,className:`rx-Stack`,direction:`column`,gap:`0`},O(E,{align:`center`,className:`rx-Stack`,css:{width:`100%`,paddingTop:`1.5`,paddingBottom:`1.5`,paddingInlineStart:`6`,paddingInlineEnd:`6`,backgroundColor:`#FFF44F`,boxShadow:`0 2px 8px rgba(0, 0, 0, 0.15)`,position:`sticky`,top:`0`,zIndex:`1000`},direction:`row`,justify:`between`,gap:`3`},O(d,{as:`p`,css:{color:`#1E3A8A`,fontSize:`2`,fontWeight:`bold`,paddingInlineStart:`2`,paddingInlineEnd:`2`,"&:hover":{color:`#2563EB`,transition:`color 0.3s ease`}}},`OStaffSync`),O(E,{align:`center`,className:`rx-Stack`,css:{margin:`20`},direction:`row`,gap:`5`},O(f,{asChild:!0,css:{color:`black`,fontSize:`1.1`,paddingInlineStart:`2`,paddingInlineEnd:`2`,"&:hover":{color:`#2563EB`,transform:`scale(1.05)`,transition:`all 0.3s ease-in-out`}}},O(r,{to:`/login`},`Logout`)))),O(E,{align:`start`,className:`rx-Stack`,direction:`row`,gap:`4`},O(u,{},O(E,{align:`start`,className:`rx-Stack`,css:{height:`100vh`,backgroundColor:`var(--accent-2)`,width:`18rem`,borderRight:`1px solid var(--gray-6)`},direction:`column`,justify:`between`,gap:`2`},O(E,{align:`center`,className:`rx-Stack`,css:{padding:`1rem`},direction:`row`,gap:`3`},O(I,{size:22}),O(d,{as:`p`,size:`5`,weight:`bold`},`OStaffSync`),O(d,{as:`p`,css:{color:`gray`},size:`3`},`Employee`)),O(h,{size:`4`}),O(f,{asChild:!0,css:{"&:hover":{color:`var(--accent-8)`}}},O(r,{to:`/empdashboard`},O(E,{align:`center`,className:`rx-Stack`,css:{"&:hover":{background:`var(--accent-4)`,color:`var(--accent-11)`,cursor:`pointer`},width:`100%`,paddingInlineStart:`0.5rem`,paddingInlineEnd:`0.5rem`,paddingTop:`0.75rem`,paddingBottom:`0.75rem`},direction:`row`,gap:`3`},O(P,{}),O(d,{as:`p`,size:`4`},`Dashboard`)))),O(f,{asChild:!0,css:{"&:hover":{color:`var(--accent-8)`}}},O(r,{to:`/empleaves`},O(E,{align:`center`,className:`rx-Stack`,css:{"&:hover":{background:`var(--accent-4)`,color:`var(--accent-11)`,cursor:`pointer`},width:`100%`,paddingInlineStart:`0.5rem`,paddingInlineEnd:`0.5rem`,paddingTop:`0.75rem`,paddingBottom:`0.75rem`},direction:`row`,gap:`3`},O(j,{}),O(d,{as:`p`,size:`4`},`Leaves`)))),O(f,{asChild:!0,css:{"&:hover":{color:`var(--accent-8)`}}},O(r,{to:`/emppayrole`},O(E,{align:`center`,className:`rx-Stack`,css:{"&:hover":{background:`var(--accent-4)`,color:`var(--accent-11)`,cursor:`pointer`},width:`100%`,paddingInlineStart:`0.5rem`,paddingInlineEnd:`0.5rem`,paddingTop:`0.75rem`,paddingBottom:`0.75rem`},direction:`row`,gap:`3`},O(N,{}),O(d,{as:`p`,size:`4`},`Payroll`)))),O(E,{css:{flex:1,justifySelf:`stretch`,alignSelf:`stretch`}}),O(u,{css:{padding:`1rem`,borderTop:`1px solid var(--gray-5)`}},O(E,{align:`center`,className:`rx-Stack`,css:{width:`100%`},direction:`row`,justify:`between`,gap:`3`},O(i,{fallback:`👤`,size:`3`}),O(E,{align:`start`,className:`rx-Stack`,direction:`column`,gap:`0`},O(M,{}),O(A,{}))),O(F,{})))),O(u,{css:{width:`100%`,height:`100vh`,overflowY:`auto`}},O(E,{align:`start`,className:`rx-Stack`,css:{p:`6`},direction:`column`,gap:`6`},O(a,{css:{mb:`4`},size:`5`},`Employee Payroll Dashboard`),O(E,{align:`start`,className:`rx-Stack`,css:{mb:4},direction:`row`,gap:`3`},O(d,{as:`p`},`Select Month:`),O(V,{}),O(H,{})),O(E,{align:`start`,className:`rx-Stack`,direction:`row`,gap:`5`,wrap:`wrap`},O(D,{css:{background:`white`,shadow:`sm`,borderRadius:`12`,width:`230px`,height:`140px`,"&:hover":{shadow:`md`,transform:`scale(1.03)`,transition:`all 0.25s ease`}}},O(E,{align:`center`,css:{p:`4`,gap:`2`},direction:`column`,justify:`center`},O(N,{css:{color:`green.600`},size:22}),O(u,{},O(a,{css:{fontWeight:`bold`,color:`gray.800`},size:`6`},`reflex___state____state__templates___login____login_state__components___employee_dash_side_nav____employee_state__templates___employee_payrole_dashboard____employee_payroll_state.total_salary_rx_state_`),O(d,{as:`p`,css:{fontSize:`2`,color:`gray.600`}},`Net Salary`)))),O(D,{css:{background:`white`,shadow:`sm`,borderRadius:`12`,width:`230px`,height:`140px`,"&:hover":{shadow:`md`,transform:`scale(1.03)`,transition:`all 0.25s ease`}}},O(E,{align:`center`,css:{p:`4`,gap:`2`},direction:`column`,justify:`center`},O(R,{css:{color:`blue.600`},size:22}),O(u,{},O(a,{css:{fontWeight:`bold`,color:`gray.800`},size:`6`},`reflex___state____state__templates___login____login_state__components___employee_dash_side_nav____employee_state__templates___employee_payrole_dashboard____employee_payroll_state.gross_salary_rx_state_`),O(d,{as:`p`,css:{fontSize:`2`,color:`gray.600`}},`Gross Salary`)))),O(D,{css:{background:`white`,shadow:`sm`,borderRadius:`12`,width:`230px`,height:`140px`,"&:hover":{shadow:`md`,transform:`scale(1.03)`,transition:`all 0.25s ease`}}},O(E,{align:`center`,css:{p:`4`,gap:`2`},direction:`column`,justify:`center`},O(L,{css:{color:`red.600`},size:22}),O(u,{},O(a,{css:{fontWeight:`bold`,color:`gray.800`},size:`6`},`reflex___state____state__templates___login____login_state__components___employee_dash_side_nav____employee_state__templates___employee_payrole_dashboard____employee_payroll_state.deductions_rx_state_`),O(d,{as:`p`,css:{fontSize:`2`,color:`gray.600`}},`Deductions`))))),O(q,{})))))}var Y=n(function(){return O(z.Fragment,{},O(J,{}),O(`title`,{},`Ostaffsync | Emppayrole`),O(`meta`,{content:`favicon.ico`,property:`og:image`}))});export{Y as default};
\ No newline at end of file
@@ -1 +0,0 @@
-import{a as e}from"./rolldown-runtime-D_juG1Xi.js";import{t}from"./react-BcXKmAwN.js";import"./react-dom-Dr_efIFp.js";import{A as n,r}from"./chunk-NISHYRIK-BsYev12b.js";import{E as i,F as a,H as o,L as s,S as c,T as l,W as u,_ as d,b as f,n as p,x as m,y as h}from"./esm-d7QI_Eml.js";import"./reflex-env-CtwX00K9.js";import{n as g}from"./emotion-react.browser.esm-B3Hu227f.js";import"./react-is-BiweJ67z.js";import"./shim-DLiwten_.js";import{t as _}from"./lib-D8E8fr-q.js";var v=e(t()),y=e(_());function b(){let e=(0,v.useContext)(s.reflex___state____state__templates___login____login_state),[t,n]=(0,v.useContext)(a),r=(0,v.useCallback)(e=>t([o(`reflex___state____state.templates___login____login_state.set_company_name`,{value:e?.target?.value},{})],[e],{}),[t,o]);return g(y.default,{css:{marginBottom:`0.5em`},debounceTimeout:300,element:p,onChange:r,placeholder:`Company Name`,value:u(e.company_name_rx_state_)?e.company_name_rx_state_:``})}function x(){let e=(0,v.useContext)(s.reflex___state____state__templates___login____login_state),[t,n]=(0,v.useContext)(a),r=(0,v.useCallback)(e=>t([o(`reflex___state____state.templates___login____login_state.set_username`,{value:e?.target?.value},{})],[e],{}),[t,o]);return g(y.default,{css:{marginBottom:`0.5em`},debounceTimeout:300,element:p,onChange:r,placeholder:`Username`,value:u(e.username_rx_state_)?e.username_rx_state_:``})}function S(){let e=(0,v.useContext)(s.reflex___state____state__templates___login____login_state),[t,n]=(0,v.useContext)(a),r=(0,v.useCallback)(e=>t([o(`reflex___state____state.templates___login____login_state.set_password`,{value:e?.target?.value},{})],[e],{}),[t,o]);return g(y.default,{css:{type:`password`,marginBottom:`0.5em`},debounceTimeout:300,element:p,onChange:r,placeholder:`Password`,value:u(e.password_rx_state_)?e.password_rx_state_:``})}function C(){let[e,t]=(0,v.useContext)(a),n=(0,v.useCallback)(t=>e([o(`reflex___state____state.templates___login____login_state.login_user`,{},{})],[t],{}),[e,o]);return g(f,{color:`blue`,css:{width:`100%`,borderRadius:`lg`,fontWeight:`bold`},onClick:n},`Login`)}function w(){let e=(0,v.useContext)(s.reflex___state____state__templates___login____login_state);return g(l,{as:`p`,css:{marginTop:`1em`,color:`gray`}},e.message_rx_state_)}var T=n(function(){return g(v.Fragment,{},g(c,{},g(m,{align:`center`,className:`rx-Stack`,css:{width:`100%`,paddingTop:`1.5`,paddingBottom:`1.5`,paddingInlineStart:`6`,paddingInlineEnd:`6`,backgroundColor:`#FFF44F`,boxShadow:`0 2px 8px rgba(0, 0, 0, 0.15)`,position:`sticky`,top:`0`,zIndex:`1000`},direction:`row`,justify:`between`,gap:`3`},g(l,{as:`p`,css:{color:`#1E3A8A`,fontSize:`2`,fontWeight:`bold`,paddingInlineStart:`2`,paddingInlineEnd:`2`,"&:hover":{color:`#2563EB`,transition:`color 0.3s ease`}}},`OStaffSync`),g(m,{align:`center`,className:`rx-Stack`,css:{margin:`20`},direction:`row`,gap:`5`},g(d,{asChild:!0,css:{color:`black`,fontSize:`1.1`,paddingInlineStart:`2`,paddingInlineEnd:`2`,"&:hover":{color:`#2563EB`,transform:`scale(1.05)`,transition:`all 0.3s ease-in-out`}}},g(r,{to:`/`},`Home`)),g(d,{asChild:!0,css:{color:`black`,fontSize:`1.1`,paddingInlineStart:`2`,paddingInlineEnd:`2`,"&:hover":{color:`#2563EB`,transform:`scale(1.05)`,transition:`all 0.3s ease-in-out`}}},g(r,{to:`/about`},`About`)),g(d,{asChild:!0,css:{color:`black`,fontSize:`1.1`,paddingInlineStart:`2`,paddingInlineEnd:`2`,"&:hover":{color:`#2563EB`,transform:`scale(1.05)`,transition:`all 0.3s ease-in-out`}}},g(r,{to:`/login`},`Login`)),g(d,{asChild:!0,css:{color:`black`,fontSize:`1.1`,paddingInlineStart:`2`,paddingInlineEnd:`2`,"&:hover":{color:`#2563EB`,transform:`scale(1.05)`,transition:`all 0.3s ease-in-out`}}},g(r,{to:`/register`},`Register`)))),g(m,{css:{display:`flex`,alignItems:`center`,justifyContent:`center`,background:`#F3F4F6`,minHeight:`100vh`,paddingTop:`4em`,paddingBottom:`4em`}},g(h,{css:{width:`26em`,padding:`2em`,borderRadius:`xl`,boxShadow:`md`,background:`white`}},g(m,{align:`center`,className:`rx-Stack`,css:{width:`100%`},direction:`column`,gap:`3`},g(i,{css:{fontSize:`2xl`,color:`#1E3A8A`}},`Welcome Back!`),g(l,{as:`p`,css:{color:`gray`,marginBottom:`1em`}},`Sign in to your company workspace.`),g(b,{}),g(x,{}),g(S,{}),g(C,{}),g(w,{}),g(m,{align:`center`,className:`rx-Stack`,css:{marginTop:`1em`},direction:`row`,gap:`3`},g(l,{as:`p`,css:{color:`gray`}},`Don't have an account?`),g(d,{asChild:!0,css:{color:`blue.600`,fontWeight:`medium`,"&:hover":{color:`var(--accent-8)`}}},g(r,{to:`/register`},`Register here`))))))),g(`title`,{},`Ostaffsync | Login`),g(`meta`,{content:`favicon.ico`,property:`og:image`}))});export{T as default};
\ No newline at end of file
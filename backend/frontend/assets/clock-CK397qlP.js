@@ -1 +0,0 @@
-import{t as e}from"./createLucideIcon-DvMhwGZ5.js";var t=e(`clock`,[[`path`,{d:`M12 6v6l4 2`,key:`mmk7yg`}],[`circle`,{cx:`12`,cy:`12`,r:`10`,key:`1mglay`}]]);export{t};
\ No newline at end of file
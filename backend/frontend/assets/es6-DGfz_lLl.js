@@ -1 +0,0 @@
-import"./react-BcXKmAwN.js";import"./react-dom-Dr_efIFp.js";import"./react-is-BiweJ67z.js";import"./shim-DLiwten_.js";import{$ as e,A as t,B as n,C as r,D as i,E as a,F as o,G as s,H as c,I as l,J as u,K as d,L as f,M as p,N as m,O as h,P as g,Q as _,R as v,S as y,T as b,U as x,V as S,W as C,X as w,Y as T,Z as E,_ as D,a as O,at as k,b as A,c as j,ct as M,d as N,et as P,f as F,g as I,h as L,i as R,it as z,j as B,k as V,l as H,lt as U,m as W,n as G,nt as K,o as q,ot as J,p as Y,q as X,r as Z,rt as Q,s as $,st as ee,t as te,tt as ne,u as re,ut as ie,v as ae,w as oe,x as se,y as ce,z as le}from"./es6-BSLagGQG.js";export{ce as Area,q as AreaChart,h as Bar,F as BarChart,a as Brush,y as CartesianAxis,se as CartesianGrid,X as Cell,R as ComposedChart,e as Cross,P as Curve,x as Customized,ee as DefaultLegendContent,K as DefaultTooltipContent,S as Dot,W as ErrorBar,G as Funnel,te as FunnelChart,ne as Global,s as Label,C as LabelList,U as Layer,Q as Legend,A as Line,Y as LineChart,l as Pie,N as PieChart,v as PolarAngleAxis,n as PolarGrid,le as PolarRadiusAxis,c as Polygon,V as Radar,j as RadarChart,i as RadialBar,O as RadialBarChart,_ as Rectangle,r as ReferenceArea,oe as ReferenceDot,b as ReferenceLine,u as ResponsiveContainer,H as Sankey,D as Scatter,$ as ScatterChart,E as Sector,Z as SunburstChart,ie as Surface,M as Symbols,d as Text,T as Tooltip,f as Trapezoid,re as Treemap,I as XAxis,L as YAxis,ae as ZAxis,w as getNiceTickValues,t as useActiveTooltipDataPoints,B as useActiveTooltipLabel,z as useChartHeight,k as useChartWidth,J as useMargin,p as useOffset,m as usePlotArea,g as useXAxisDomain,o as useYAxisDomain};
\ No newline at end of file
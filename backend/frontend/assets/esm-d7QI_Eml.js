@@ -1,89 +0,0 @@
-import{a as __toESM,r as __export,t as __commonJSMin}from"./rolldown-runtime-D_juG1Xi.js";import{t as require_react}from"./react-BcXKmAwN.js";import{t as require_react_dom}from"./react-dom-Dr_efIFp.js";import{D as useNavigate,E as useLocation,O as useParams,k as useSearchParams}from"./chunk-NISHYRIK-BsYev12b.js";import{t as env_default}from"./reflex-env-CtwX00K9.js";import{n as jsx$34}from"./emotion-react.browser.esm-B3Hu227f.js";import{t as require_shim}from"./shim-DLiwten_.js";var PACKET_TYPES=Object.create(null);PACKET_TYPES.open=`0`,PACKET_TYPES.close=`1`,PACKET_TYPES.ping=`2`,PACKET_TYPES.pong=`3`,PACKET_TYPES.message=`4`,PACKET_TYPES.upgrade=`5`,PACKET_TYPES.noop=`6`;var PACKET_TYPES_REVERSE=Object.create(null);Object.keys(PACKET_TYPES).forEach(key$1=>{PACKET_TYPES_REVERSE[PACKET_TYPES[key$1]]=key$1});var ERROR_PACKET={type:`error`,data:`parser error`},withNativeBlob$1=typeof Blob==`function`||typeof Blob<`u`&&Object.prototype.toString.call(Blob)===`[object BlobConstructor]`,withNativeArrayBuffer$2=typeof ArrayBuffer==`function`,isView$1=obj=>typeof ArrayBuffer.isView==`function`?ArrayBuffer.isView(obj):obj&&obj.buffer instanceof ArrayBuffer,encodePacket=({type,data},supportsBinary,callback)=>withNativeBlob$1&&data instanceof Blob?supportsBinary?callback(data):encodeBlobAsBase64(data,callback):withNativeArrayBuffer$2&&(data instanceof ArrayBuffer||isView$1(data))?supportsBinary?callback(data):encodeBlobAsBase64(new Blob([data]),callback):callback(PACKET_TYPES[type]+(data||``)),encodeBlobAsBase64=(data,callback)=>{let fileReader=new FileReader;return fileReader.onload=function(){let content=fileReader.result.split(`,`)[1];callback(`b`+(content||``))},fileReader.readAsDataURL(data)};function toArray(data){return data instanceof Uint8Array?data:data instanceof ArrayBuffer?new Uint8Array(data):new Uint8Array(data.buffer,data.byteOffset,data.byteLength)}var TEXT_ENCODER;function encodePacketToBinary(packet,callback){if(withNativeBlob$1&&packet.data instanceof Blob)return packet.data.arrayBuffer().then(toArray).then(callback);if(withNativeArrayBuffer$2&&(packet.data instanceof ArrayBuffer||isView$1(packet.data)))return callback(toArray(packet.data));encodePacket(packet,!1,encoded=>{TEXT_ENCODER||=new TextEncoder,callback(TEXT_ENCODER.encode(encoded))})}var chars=`ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/`,lookup$1=typeof Uint8Array>`u`?[]:new Uint8Array(256);for(let i$23=0;i$23<64;i$23++)lookup$1[chars.charCodeAt(i$23)]=i$23;const decode$1=base64=>{let bufferLength=base64.length*.75,len=base64.length,i$23,p$36=0,encoded1,encoded2,encoded3,encoded4;base64[base64.length-1]===`=`&&(bufferLength--,base64[base64.length-2]===`=`&&bufferLength--);let arraybuffer=new ArrayBuffer(bufferLength),bytes=new Uint8Array(arraybuffer);for(i$23=0;i$23<len;i$23+=4)encoded1=lookup$1[base64.charCodeAt(i$23)],encoded2=lookup$1[base64.charCodeAt(i$23+1)],encoded3=lookup$1[base64.charCodeAt(i$23+2)],encoded4=lookup$1[base64.charCodeAt(i$23+3)],bytes[p$36++]=encoded1<<2|encoded2>>4,bytes[p$36++]=(encoded2&15)<<4|encoded3>>2,bytes[p$36++]=(encoded3&3)<<6|encoded4&63;return arraybuffer};var withNativeArrayBuffer$1=typeof ArrayBuffer==`function`;const decodePacket=(encodedPacket,binaryType)=>{if(typeof encodedPacket!=`string`)return{type:`message`,data:mapBinary(encodedPacket,binaryType)};let type=encodedPacket.charAt(0);return type===`b`?{type:`message`,data:decodeBase64Packet(encodedPacket.substring(1),binaryType)}:PACKET_TYPES_REVERSE[type]?encodedPacket.length>1?{type:PACKET_TYPES_REVERSE[type],data:encodedPacket.substring(1)}:{type:PACKET_TYPES_REVERSE[type]}:ERROR_PACKET};var decodeBase64Packet=(data,binaryType)=>{if(withNativeArrayBuffer$1){let decoded=decode$1(data);return mapBinary(decoded,binaryType)}else return{base64:!0,data}},mapBinary=(data,binaryType)=>{switch(binaryType){case`blob`:return data instanceof Blob?data:new Blob([data]);case`arraybuffer`:default:return data instanceof ArrayBuffer?data:data.buffer}},SEPARATOR=``,encodePayload=(packets,callback)=>{let length=packets.length,encodedPackets=Array(length),count$2=0;packets.forEach((packet,i$23)=>{encodePacket(packet,!1,encodedPacket=>{encodedPackets[i$23]=encodedPacket,++count$2===length&&callback(encodedPackets.join(SEPARATOR))})})},decodePayload=(encodedPayload,binaryType)=>{let encodedPackets=encodedPayload.split(SEPARATOR),packets=[];for(let i$23=0;i$23<encodedPackets.length;i$23++){let decodedPacket=decodePacket(encodedPackets[i$23],binaryType);if(packets.push(decodedPacket),decodedPacket.type===`error`)break}return packets};function createPacketEncoderStream(){return new TransformStream({transform(packet,controller){encodePacketToBinary(packet,encodedPacket=>{let payloadLength=encodedPacket.length,header;if(payloadLength<126)header=new Uint8Array(1),new DataView(header.buffer).setUint8(0,payloadLength);else if(payloadLength<65536){header=new Uint8Array(3);let view=new DataView(header.buffer);view.setUint8(0,126),view.setUint16(1,payloadLength)}else{header=new Uint8Array(9);let view=new DataView(header.buffer);view.setUint8(0,127),view.setBigUint64(1,BigInt(payloadLength))}packet.data&&typeof packet.data!=`string`&&(header[0]|=128),controller.enqueue(header),controller.enqueue(encodedPacket)})}})}var TEXT_DECODER;function totalLength(chunks){return chunks.reduce((acc,chunk)=>acc+chunk.length,0)}function concatChunks(chunks,size$3){if(chunks[0].length===size$3)return chunks.shift();let buffer$1=new Uint8Array(size$3),j=0;for(let i$23=0;i$23<size$3;i$23++)buffer$1[i$23]=chunks[0][j++],j===chunks[0].length&&(chunks.shift(),j=0);return chunks.length&&j<chunks[0].length&&(chunks[0]=chunks[0].slice(j)),buffer$1}function createPacketDecoderStream(maxPayload,binaryType){TEXT_DECODER||=new TextDecoder;let chunks=[],state=0,expectedLength=-1,isBinary$1=!1;return new TransformStream({transform(chunk,controller){for(chunks.push(chunk);;){if(state===0){if(totalLength(chunks)<1)break;let header=concatChunks(chunks,1);isBinary$1=(header[0]&128)==128,expectedLength=header[0]&127,state=expectedLength<126?3:expectedLength===126?1:2}else if(state===1){if(totalLength(chunks)<2)break;let headerArray=concatChunks(chunks,2);expectedLength=new DataView(headerArray.buffer,headerArray.byteOffset,headerArray.length).getUint16(0),state=3}else if(state===2){if(totalLength(chunks)<8)break;let headerArray=concatChunks(chunks,8),view=new DataView(headerArray.buffer,headerArray.byteOffset,headerArray.length),n$24=view.getUint32(0);if(n$24>2**21-1){controller.enqueue(ERROR_PACKET);break}expectedLength=n$24*2**32+view.getUint32(4),state=3}else{if(totalLength(chunks)<expectedLength)break;let data=concatChunks(chunks,expectedLength);controller.enqueue(decodePacket(isBinary$1?data:TEXT_DECODER.decode(data),binaryType)),state=0}if(expectedLength===0||expectedLength>maxPayload){controller.enqueue(ERROR_PACKET);break}}}})}const protocol$2=4;function Emitter(obj){if(obj)return mixin(obj)}function mixin(obj){for(var key$1 in Emitter.prototype)obj[key$1]=Emitter.prototype[key$1];return obj}Emitter.prototype.on=Emitter.prototype.addEventListener=function(event,fn){return this._callbacks=this._callbacks||{},(this._callbacks[`$`+event]=this._callbacks[`$`+event]||[]).push(fn),this},Emitter.prototype.once=function(event,fn){function on$1(){this.off(event,on$1),fn.apply(this,arguments)}return on$1.fn=fn,this.on(event,on$1),this},Emitter.prototype.off=Emitter.prototype.removeListener=Emitter.prototype.removeAllListeners=Emitter.prototype.removeEventListener=function(event,fn){if(this._callbacks=this._callbacks||{},arguments.length==0)return this._callbacks={},this;var callbacks=this._callbacks[`$`+event];if(!callbacks)return this;if(arguments.length==1)return delete this._callbacks[`$`+event],this;for(var cb,i$23=0;i$23<callbacks.length;i$23++)if(cb=callbacks[i$23],cb===fn||cb.fn===fn){callbacks.splice(i$23,1);break}return callbacks.length===0&&delete this._callbacks[`$`+event],this},Emitter.prototype.emit=function(event){this._callbacks=this._callbacks||{};for(var args=Array(arguments.length-1),callbacks=this._callbacks[`$`+event],i$23=1;i$23<arguments.length;i$23++)args[i$23-1]=arguments[i$23];if(callbacks){callbacks=callbacks.slice(0);for(var i$23=0,len=callbacks.length;i$23<len;++i$23)callbacks[i$23].apply(this,args)}return this},Emitter.prototype.emitReserved=Emitter.prototype.emit,Emitter.prototype.listeners=function(event){return this._callbacks=this._callbacks||{},this._callbacks[`$`+event]||[]},Emitter.prototype.hasListeners=function(event){return!!this.listeners(event).length};const nextTick=(()=>typeof Promise==`function`&&typeof Promise.resolve==`function`?cb=>Promise.resolve().then(cb):(cb,setTimeoutFn)=>setTimeoutFn(cb,0))(),globalThisShim=(()=>typeof self<`u`?self:typeof window<`u`?window:Function(`return this`)())(),defaultBinaryType=`arraybuffer`;function pick(obj,...attr){return attr.reduce((acc,k$2)=>(obj.hasOwnProperty(k$2)&&(acc[k$2]=obj[k$2]),acc),{})}var NATIVE_SET_TIMEOUT=globalThisShim.setTimeout,NATIVE_CLEAR_TIMEOUT=globalThisShim.clearTimeout;function installTimerFunctions(obj,opts){opts.useNativeTimers?(obj.setTimeoutFn=NATIVE_SET_TIMEOUT.bind(globalThisShim),obj.clearTimeoutFn=NATIVE_CLEAR_TIMEOUT.bind(globalThisShim)):(obj.setTimeoutFn=globalThisShim.setTimeout.bind(globalThisShim),obj.clearTimeoutFn=globalThisShim.clearTimeout.bind(globalThisShim))}var BASE64_OVERHEAD=1.33;function byteLength(obj){return typeof obj==`string`?utf8Length(obj):Math.ceil((obj.byteLength||obj.size)*BASE64_OVERHEAD)}function utf8Length(str){let c$5=0,length=0;for(let i$23=0,l$12=str.length;i$23<l$12;i$23++)c$5=str.charCodeAt(i$23),c$5<128?length+=1:c$5<2048?length+=2:c$5<55296||c$5>=57344?length+=3:(i$23++,length+=4);return length}function randomString(){return Date.now().toString(36).substring(3)+Math.random().toString(36).substring(2,5)}function encode(obj){let str=``;for(let i$23 in obj)obj.hasOwnProperty(i$23)&&(str.length&&(str+=`&`),str+=encodeURIComponent(i$23)+`=`+encodeURIComponent(obj[i$23]));return str}function decode(qs){let qry={},pairs=qs.split(`&`);for(let i$23=0,l$12=pairs.length;i$23<l$12;i$23++){let pair=pairs[i$23].split(`=`);qry[decodeURIComponent(pair[0])]=decodeURIComponent(pair[1])}return qry}var TransportError=class extends Error{constructor(reason,description,context){super(reason),this.description=description,this.context=context,this.type=`TransportError`}},Transport=class extends Emitter{constructor(opts){super(),this.writable=!1,installTimerFunctions(this,opts),this.opts=opts,this.query=opts.query,this.socket=opts.socket,this.supportsBinary=!opts.forceBase64}onError(reason,description,context){return super.emitReserved(`error`,new TransportError(reason,description,context)),this}open(){return this.readyState=`opening`,this.doOpen(),this}close(){return(this.readyState===`opening`||this.readyState===`open`)&&(this.doClose(),this.onClose()),this}send(packets){this.readyState===`open`&&this.write(packets)}onOpen(){this.readyState=`open`,this.writable=!0,super.emitReserved(`open`)}onData(data){let packet=decodePacket(data,this.socket.binaryType);this.onPacket(packet)}onPacket(packet){super.emitReserved(`packet`,packet)}onClose(details){this.readyState=`closed`,super.emitReserved(`close`,details)}pause(onPause){}createUri(schema,query={}){return schema+`://`+this._hostname()+this._port()+this.opts.path+this._query(query)}_hostname(){let hostname=this.opts.hostname;return hostname.indexOf(`:`)===-1?hostname:`[`+hostname+`]`}_port(){return this.opts.port&&(this.opts.secure&&Number(this.opts.port!==443)||!this.opts.secure&&Number(this.opts.port)!==80)?`:`+this.opts.port:``}_query(query){let encodedQuery=encode(query);return encodedQuery.length?`?`+encodedQuery:``}},Polling=class extends Transport{constructor(){super(...arguments),this._polling=!1}get name(){return`polling`}doOpen(){this._poll()}pause(onPause){this.readyState=`pausing`;let pause=()=>{this.readyState=`paused`,onPause()};if(this._polling||!this.writable){let total=0;this._polling&&(total++,this.once(`pollComplete`,function(){--total||pause()})),this.writable||(total++,this.once(`drain`,function(){--total||pause()}))}else pause()}_poll(){this._polling=!0,this.doPoll(),this.emitReserved(`poll`)}onData(data){decodePayload(data,this.socket.binaryType).forEach(packet=>{if(this.readyState===`opening`&&packet.type===`open`&&this.onOpen(),packet.type===`close`)return this.onClose({description:`transport closed by the server`}),!1;this.onPacket(packet)}),this.readyState!==`closed`&&(this._polling=!1,this.emitReserved(`pollComplete`),this.readyState===`open`&&this._poll())}doClose(){let close=()=>{this.write([{type:`close`}])};this.readyState===`open`?close():this.once(`open`,close)}write(packets){this.writable=!1,encodePayload(packets,data=>{this.doWrite(data,()=>{this.writable=!0,this.emitReserved(`drain`)})})}uri(){let schema=this.opts.secure?`https`:`http`,query=this.query||{};return!1!==this.opts.timestampRequests&&(query[this.opts.timestampParam]=randomString()),!this.supportsBinary&&!query.sid&&(query.b64=1),this.createUri(schema,query)}},value=!1;try{value=typeof XMLHttpRequest<`u`&&`withCredentials`in new XMLHttpRequest}catch{}const hasCORS=value;function empty(){}var BaseXHR=class extends Polling{constructor(opts){if(super(opts),typeof location<`u`){let isSSL=location.protocol===`https:`,port=location.port;port||=isSSL?`443`:`80`,this.xd=typeof location<`u`&&opts.hostname!==location.hostname||port!==opts.port}}doWrite(data,fn){let req=this.request({method:`POST`,data});req.on(`success`,fn),req.on(`error`,(xhrStatus,context)=>{this.onError(`xhr post error`,xhrStatus,context)})}doPoll(){let req=this.request();req.on(`data`,this.onData.bind(this)),req.on(`error`,(xhrStatus,context)=>{this.onError(`xhr poll error`,xhrStatus,context)}),this.pollXhr=req}},Request=class Request extends Emitter{constructor(createRequest,uri,opts){super(),this.createRequest=createRequest,installTimerFunctions(this,opts),this._opts=opts,this._method=opts.method||`GET`,this._uri=uri,this._data=opts.data===void 0?null:opts.data,this._create()}_create(){var _a;let opts=pick(this._opts,`agent`,`pfx`,`key`,`passphrase`,`cert`,`ca`,`ciphers`,`rejectUnauthorized`,`autoUnref`);opts.xdomain=!!this._opts.xd;let xhr=this._xhr=this.createRequest(opts);try{xhr.open(this._method,this._uri,!0);try{if(this._opts.extraHeaders)for(let i$23 in xhr.setDisableHeaderCheck&&xhr.setDisableHeaderCheck(!0),this._opts.extraHeaders)this._opts.extraHeaders.hasOwnProperty(i$23)&&xhr.setRequestHeader(i$23,this._opts.extraHeaders[i$23])}catch{}if(this._method===`POST`)try{xhr.setRequestHeader(`Content-type`,`text/plain;charset=UTF-8`)}catch{}try{xhr.setRequestHeader(`Accept`,`*/*`)}catch{}(_a=this._opts.cookieJar)==null||_a.addCookies(xhr),`withCredentials`in xhr&&(xhr.withCredentials=this._opts.withCredentials),this._opts.requestTimeout&&(xhr.timeout=this._opts.requestTimeout),xhr.onreadystatechange=()=>{var _a$1;xhr.readyState===3&&((_a$1=this._opts.cookieJar)==null||_a$1.parseCookies(xhr.getResponseHeader(`set-cookie`))),xhr.readyState===4&&(xhr.status===200||xhr.status===1223?this._onLoad():this.setTimeoutFn(()=>{this._onError(typeof xhr.status==`number`?xhr.status:0)},0))},xhr.send(this._data)}catch(e$31){this.setTimeoutFn(()=>{this._onError(e$31)},0);return}typeof document<`u`&&(this._index=Request.requestsCount++,Request.requests[this._index]=this)}_onError(err){this.emitReserved(`error`,err,this._xhr),this._cleanup(!0)}_cleanup(fromError){if(!(this._xhr===void 0||this._xhr===null)){if(this._xhr.onreadystatechange=empty,fromError)try{this._xhr.abort()}catch{}typeof document<`u`&&delete Request.requests[this._index],this._xhr=null}}_onLoad(){let data=this._xhr.responseText;data!==null&&(this.emitReserved(`data`,data),this.emitReserved(`success`),this._cleanup())}abort(){this._cleanup()}};if(Request.requestsCount=0,Request.requests={},typeof document<`u`){if(typeof attachEvent==`function`)attachEvent(`onunload`,unloadHandler);else if(typeof addEventListener==`function`){let terminationEvent=`onpagehide`in globalThisShim?`pagehide`:`unload`;addEventListener(terminationEvent,unloadHandler,!1)}}function unloadHandler(){for(let i$23 in Request.requests)Request.requests.hasOwnProperty(i$23)&&Request.requests[i$23].abort()}var hasXHR2=(function(){let xhr=newRequest({xdomain:!1});return xhr&&xhr.responseType!==null})(),XHR=class extends BaseXHR{constructor(opts){super(opts);let forceBase64=opts&&opts.forceBase64;this.supportsBinary=hasXHR2&&!forceBase64}request(opts={}){return Object.assign(opts,{xd:this.xd},this.opts),new Request(newRequest,this.uri(),opts)}};function newRequest(opts){let xdomain=opts.xdomain;try{if(typeof XMLHttpRequest<`u`&&(!xdomain||hasCORS))return new XMLHttpRequest}catch{}if(!xdomain)try{return new globalThisShim[[`Active`,`Object`].join(`X`)](`Microsoft.XMLHTTP`)}catch{}}var isReactNative=typeof navigator<`u`&&typeof navigator.product==`string`&&navigator.product.toLowerCase()===`reactnative`,BaseWS=class extends Transport{get name(){return`websocket`}doOpen(){let uri=this.uri(),protocols=this.opts.protocols,opts=isReactNative?{}:pick(this.opts,`agent`,`perMessageDeflate`,`pfx`,`key`,`passphrase`,`cert`,`ca`,`ciphers`,`rejectUnauthorized`,`localAddress`,`protocolVersion`,`origin`,`maxPayload`,`family`,`checkServerIdentity`);this.opts.extraHeaders&&(opts.headers=this.opts.extraHeaders);try{this.ws=this.createSocket(uri,protocols,opts)}catch(err){return this.emitReserved(`error`,err)}this.ws.binaryType=this.socket.binaryType,this.addEventListeners()}addEventListeners(){this.ws.onopen=()=>{this.opts.autoUnref&&this.ws._socket.unref(),this.onOpen()},this.ws.onclose=closeEvent=>this.onClose({description:`websocket connection closed`,context:closeEvent}),this.ws.onmessage=ev=>this.onData(ev.data),this.ws.onerror=e$31=>this.onError(`websocket error`,e$31)}write(packets){this.writable=!1;for(let i$23=0;i$23<packets.length;i$23++){let packet=packets[i$23],lastPacket=i$23===packets.length-1;encodePacket(packet,this.supportsBinary,data=>{try{this.doWrite(packet,data)}catch{}lastPacket&&nextTick(()=>{this.writable=!0,this.emitReserved(`drain`)},this.setTimeoutFn)})}}doClose(){this.ws!==void 0&&(this.ws.onerror=()=>{},this.ws.close(),this.ws=null)}uri(){let schema=this.opts.secure?`wss`:`ws`,query=this.query||{};return this.opts.timestampRequests&&(query[this.opts.timestampParam]=randomString()),this.supportsBinary||(query.b64=1),this.createUri(schema,query)}},WebSocketCtor=globalThisShim.WebSocket||globalThisShim.MozWebSocket;const transports={websocket:class extends BaseWS{createSocket(uri,protocols,opts){return isReactNative?new WebSocketCtor(uri,protocols,opts):protocols?new WebSocketCtor(uri,protocols):new WebSocketCtor(uri)}doWrite(_packet,data){this.ws.send(data)}},webtransport:class extends Transport{get name(){return`webtransport`}doOpen(){try{this._transport=new WebTransport(this.createUri(`https`),this.opts.transportOptions[this.name])}catch(err){return this.emitReserved(`error`,err)}this._transport.closed.then(()=>{this.onClose()}).catch(err=>{this.onError(`webtransport error`,err)}),this._transport.ready.then(()=>{this._transport.createBidirectionalStream().then(stream=>{let decoderStream=createPacketDecoderStream(2**53-1,this.socket.binaryType),reader=stream.readable.pipeThrough(decoderStream).getReader(),encoderStream=createPacketEncoderStream();encoderStream.readable.pipeTo(stream.writable),this._writer=encoderStream.writable.getWriter();let read$1=()=>{reader.read().then(({done,value:value$1})=>{done||(this.onPacket(value$1),read$1())}).catch(err=>{})};read$1();let packet={type:`open`};this.query.sid&&(packet.data=`{"sid":"${this.query.sid}"}`),this._writer.write(packet).then(()=>this.onOpen())})})}write(packets){this.writable=!1;for(let i$23=0;i$23<packets.length;i$23++){let packet=packets[i$23],lastPacket=i$23===packets.length-1;this._writer.write(packet).then(()=>{lastPacket&&nextTick(()=>{this.writable=!0,this.emitReserved(`drain`)},this.setTimeoutFn)})}}doClose(){var _a;(_a=this._transport)==null||_a.close()}},polling:XHR};var re=/^(?:(?![^:@\/?#]+:[^:@\/]*@)(http|https|ws|wss):\/\/)?((?:(([^:@\/?#]*)(?::([^:@\/?#]*))?)?@)?((?:[a-f0-9]{0,4}:){2,7}[a-f0-9]{0,4}|[^:\/?#]*)(?::(\d*))?)(((\/(?:[^?#](?![^?#\/]*\.[^?#\/.]+(?:[?#]|$)))*\/?)?([^?#\/]*))(?:\?([^#]*))?(?:#(.*))?)/,parts=[`source`,`protocol`,`authority`,`userInfo`,`user`,`password`,`host`,`port`,`relative`,`path`,`directory`,`file`,`query`,`anchor`];function parse$2(str){if(str.length>8e3)throw`URI too long`;let src=str,b$5=str.indexOf(`[`),e$31=str.indexOf(`]`);b$5!=-1&&e$31!=-1&&(str=str.substring(0,b$5)+str.substring(b$5,e$31).replace(/:/g,`;`)+str.substring(e$31,str.length));let m$15=re.exec(str||``),uri={},i$23=14;for(;i$23--;)uri[parts[i$23]]=m$15[i$23]||``;return b$5!=-1&&e$31!=-1&&(uri.source=src,uri.host=uri.host.substring(1,uri.host.length-1).replace(/;/g,`:`),uri.authority=uri.authority.replace(`[`,``).replace(`]`,``).replace(/;/g,`:`),uri.ipv6uri=!0),uri.pathNames=pathNames(uri,uri.path),uri.queryKey=queryKey(uri,uri.query),uri}function pathNames(obj,path){let regx=/\/{2,9}/g,names=path.replace(regx,`/`).split(`/`);return(path.slice(0,1)==`/`||path.length===0)&&names.splice(0,1),path.slice(-1)==`/`&&names.splice(names.length-1,1),names}function queryKey(uri,query){let data={};return query.replace(/(?:^|&)([^&=]*)=?([^&]*)/g,function($0,$1,$2){$1&&(data[$1]=$2)}),data}var withEventListeners=typeof addEventListener==`function`&&typeof removeEventListener==`function`,OFFLINE_EVENT_LISTENERS=[];withEventListeners&&addEventListener(`offline`,()=>{OFFLINE_EVENT_LISTENERS.forEach(listener=>listener())},!1);var SocketWithoutUpgrade=class SocketWithoutUpgrade extends Emitter{constructor(uri,opts){if(super(),this.binaryType=`arraybuffer`,this.writeBuffer=[],this._prevBufferLen=0,this._pingInterval=-1,this._pingTimeout=-1,this._maxPayload=-1,this._pingTimeoutTime=1/0,uri&&typeof uri==`object`&&(opts=uri,uri=null),uri){let parsedUri=parse$2(uri);opts.hostname=parsedUri.host,opts.secure=parsedUri.protocol===`https`||parsedUri.protocol===`wss`,opts.port=parsedUri.port,parsedUri.query&&(opts.query=parsedUri.query)}else opts.host&&(opts.hostname=parse$2(opts.host).host);installTimerFunctions(this,opts),this.secure=opts.secure==null?typeof location<`u`&&location.protocol===`https:`:opts.secure,opts.hostname&&!opts.port&&(opts.port=this.secure?`443`:`80`),this.hostname=opts.hostname||(typeof location<`u`?location.hostname:`localhost`),this.port=opts.port||(typeof location<`u`&&location.port?location.port:this.secure?`443`:`80`),this.transports=[],this._transportsByName={},opts.transports.forEach(t$28=>{let transportName=t$28.prototype.name;this.transports.push(transportName),this._transportsByName[transportName]=t$28}),this.opts=Object.assign({path:`/engine.io`,agent:!1,withCredentials:!1,upgrade:!0,timestampParam:`t`,rememberUpgrade:!1,addTrailingSlash:!0,rejectUnauthorized:!0,perMessageDeflate:{threshold:1024},transportOptions:{},closeOnBeforeunload:!1},opts),this.opts.path=this.opts.path.replace(/\/$/,``)+(this.opts.addTrailingSlash?`/`:``),typeof this.opts.query==`string`&&(this.opts.query=decode(this.opts.query)),withEventListeners&&(this.opts.closeOnBeforeunload&&(this._beforeunloadEventListener=()=>{this.transport&&(this.transport.removeAllListeners(),this.transport.close())},addEventListener(`beforeunload`,this._beforeunloadEventListener,!1)),this.hostname!==`localhost`&&(this._offlineEventListener=()=>{this._onClose(`transport close`,{description:`network connection lost`})},OFFLINE_EVENT_LISTENERS.push(this._offlineEventListener))),this.opts.withCredentials&&(this._cookieJar=void 0),this._open()}createTransport(name){let query=Object.assign({},this.opts.query);query.EIO=4,query.transport=name,this.id&&(query.sid=this.id);let opts=Object.assign({},this.opts,{query,socket:this,hostname:this.hostname,secure:this.secure,port:this.port},this.opts.transportOptions[name]);return new this._transportsByName[name](opts)}_open(){if(this.transports.length===0){this.setTimeoutFn(()=>{this.emitReserved(`error`,`No transports available`)},0);return}let transportName=this.opts.rememberUpgrade&&SocketWithoutUpgrade.priorWebsocketSuccess&&this.transports.indexOf(`websocket`)!==-1?`websocket`:this.transports[0];this.readyState=`opening`;let transport=this.createTransport(transportName);transport.open(),this.setTransport(transport)}setTransport(transport){this.transport&&this.transport.removeAllListeners(),this.transport=transport,transport.on(`drain`,this._onDrain.bind(this)).on(`packet`,this._onPacket.bind(this)).on(`error`,this._onError.bind(this)).on(`close`,reason=>this._onClose(`transport close`,reason))}onOpen(){this.readyState=`open`,SocketWithoutUpgrade.priorWebsocketSuccess=this.transport.name===`websocket`,this.emitReserved(`open`),this.flush()}_onPacket(packet){if(this.readyState===`opening`||this.readyState===`open`||this.readyState===`closing`)switch(this.emitReserved(`packet`,packet),this.emitReserved(`heartbeat`),packet.type){case`open`:this.onHandshake(JSON.parse(packet.data));break;case`ping`:this._sendPacket(`pong`),this.emitReserved(`ping`),this.emitReserved(`pong`),this._resetPingTimeout();break;case`error`:let err=Error(`server error`);err.code=packet.data,this._onError(err);break;case`message`:this.emitReserved(`data`,packet.data),this.emitReserved(`message`,packet.data);break}}onHandshake(data){this.emitReserved(`handshake`,data),this.id=data.sid,this.transport.query.sid=data.sid,this._pingInterval=data.pingInterval,this._pingTimeout=data.pingTimeout,this._maxPayload=data.maxPayload,this.onOpen(),this.readyState!==`closed`&&this._resetPingTimeout()}_resetPingTimeout(){this.clearTimeoutFn(this._pingTimeoutTimer);let delay=this._pingInterval+this._pingTimeout;this._pingTimeoutTime=Date.now()+delay,this._pingTimeoutTimer=this.setTimeoutFn(()=>{this._onClose(`ping timeout`)},delay),this.opts.autoUnref&&this._pingTimeoutTimer.unref()}_onDrain(){this.writeBuffer.splice(0,this._prevBufferLen),this._prevBufferLen=0,this.writeBuffer.length===0?this.emitReserved(`drain`):this.flush()}flush(){if(this.readyState!==`closed`&&this.transport.writable&&!this.upgrading&&this.writeBuffer.length){let packets=this._getWritablePackets();this.transport.send(packets),this._prevBufferLen=packets.length,this.emitReserved(`flush`)}}_getWritablePackets(){if(!(this._maxPayload&&this.transport.name===`polling`&&this.writeBuffer.length>1))return this.writeBuffer;let payloadSize=1;for(let i$23=0;i$23<this.writeBuffer.length;i$23++){let data=this.writeBuffer[i$23].data;if(data&&(payloadSize+=byteLength(data)),i$23>0&&payloadSize>this._maxPayload)return this.writeBuffer.slice(0,i$23);payloadSize+=2}return this.writeBuffer}_hasPingExpired(){if(!this._pingTimeoutTime)return!0;let hasExpired=Date.now()>this._pingTimeoutTime;return hasExpired&&(this._pingTimeoutTime=0,nextTick(()=>{this._onClose(`ping timeout`)},this.setTimeoutFn)),hasExpired}write(msg,options$1,fn){return this._sendPacket(`message`,msg,options$1,fn),this}send(msg,options$1,fn){return this._sendPacket(`message`,msg,options$1,fn),this}_sendPacket(type,data,options$1,fn){if(typeof data==`function`&&(fn=data,data=void 0),typeof options$1==`function`&&(fn=options$1,options$1=null),this.readyState===`closing`||this.readyState===`closed`)return;options$1||={},options$1.compress=!1!==options$1.compress;let packet={type,data,options:options$1};this.emitReserved(`packetCreate`,packet),this.writeBuffer.push(packet),fn&&this.once(`flush`,fn),this.flush()}close(){let close=()=>{this._onClose(`forced close`),this.transport.close()},cleanupAndClose=()=>{this.off(`upgrade`,cleanupAndClose),this.off(`upgradeError`,cleanupAndClose),close()},waitForUpgrade=()=>{this.once(`upgrade`,cleanupAndClose),this.once(`upgradeError`,cleanupAndClose)};return(this.readyState===`opening`||this.readyState===`open`)&&(this.readyState=`closing`,this.writeBuffer.length?this.once(`drain`,()=>{this.upgrading?waitForUpgrade():close()}):this.upgrading?waitForUpgrade():close()),this}_onError(err){if(SocketWithoutUpgrade.priorWebsocketSuccess=!1,this.opts.tryAllTransports&&this.transports.length>1&&this.readyState===`opening`)return this.transports.shift(),this._open();this.emitReserved(`error`,err),this._onClose(`transport error`,err)}_onClose(reason,description){if(this.readyState===`opening`||this.readyState===`open`||this.readyState===`closing`){if(this.clearTimeoutFn(this._pingTimeoutTimer),this.transport.removeAllListeners(`close`),this.transport.close(),this.transport.removeAllListeners(),withEventListeners&&(this._beforeunloadEventListener&&removeEventListener(`beforeunload`,this._beforeunloadEventListener,!1),this._offlineEventListener)){let i$23=OFFLINE_EVENT_LISTENERS.indexOf(this._offlineEventListener);i$23!==-1&&OFFLINE_EVENT_LISTENERS.splice(i$23,1)}this.readyState=`closed`,this.id=null,this.emitReserved(`close`,reason,description),this.writeBuffer=[],this._prevBufferLen=0}}};SocketWithoutUpgrade.protocol=4;var SocketWithUpgrade=class extends SocketWithoutUpgrade{constructor(){super(...arguments),this._upgrades=[]}onOpen(){if(super.onOpen(),this.readyState===`open`&&this.opts.upgrade)for(let i$23=0;i$23<this._upgrades.length;i$23++)this._probe(this._upgrades[i$23])}_probe(name){let transport=this.createTransport(name),failed=!1;SocketWithoutUpgrade.priorWebsocketSuccess=!1;let onTransportOpen=()=>{failed||(transport.send([{type:`ping`,data:`probe`}]),transport.once(`packet`,msg=>{if(!failed)if(msg.type===`pong`&&msg.data===`probe`){if(this.upgrading=!0,this.emitReserved(`upgrading`,transport),!transport)return;SocketWithoutUpgrade.priorWebsocketSuccess=transport.name===`websocket`,this.transport.pause(()=>{failed||this.readyState!==`closed`&&(cleanup(),this.setTransport(transport),transport.send([{type:`upgrade`}]),this.emitReserved(`upgrade`,transport),transport=null,this.upgrading=!1,this.flush())})}else{let err=Error(`probe error`);err.transport=transport.name,this.emitReserved(`upgradeError`,err)}}))};function freezeTransport(){failed||(failed=!0,cleanup(),transport.close(),transport=null)}let onerror=err=>{let error=Error(`probe error: `+err);error.transport=transport.name,freezeTransport(),this.emitReserved(`upgradeError`,error)};function onTransportClose(){onerror(`transport closed`)}function onclose(){onerror(`socket closed`)}function onupgrade(to){transport&&to.name!==transport.name&&freezeTransport()}let cleanup=()=>{transport.removeListener(`open`,onTransportOpen),transport.removeListener(`error`,onerror),transport.removeListener(`close`,onTransportClose),this.off(`close`,onclose),this.off(`upgrading`,onupgrade)};transport.once(`open`,onTransportOpen),transport.once(`error`,onerror),transport.once(`close`,onTransportClose),this.once(`close`,onclose),this.once(`upgrading`,onupgrade),this._upgrades.indexOf(`webtransport`)!==-1&&name!==`webtransport`?this.setTimeoutFn(()=>{failed||transport.open()},200):transport.open()}onHandshake(data){this._upgrades=this._filterUpgrades(data.upgrades),super.onHandshake(data)}_filterUpgrades(upgrades){let filteredUpgrades=[];for(let i$23=0;i$23<upgrades.length;i$23++)~this.transports.indexOf(upgrades[i$23])&&filteredUpgrades.push(upgrades[i$23]);return filteredUpgrades}},Socket$1=class extends SocketWithUpgrade{constructor(uri,opts={}){let o$28=typeof uri==`object`?uri:opts;(!o$28.transports||o$28.transports&&typeof o$28.transports[0]==`string`)&&(o$28.transports=(o$28.transports||[`polling`,`websocket`,`webtransport`]).map(transportName=>transports[transportName]).filter(t$28=>!!t$28)),super(uri,o$28)}};const protocol$1=Socket$1.protocol;function url(uri,path=``,loc){let obj=uri;loc||=typeof location<`u`&&location,uri??=loc.protocol+`//`+loc.host,typeof uri==`string`&&(uri.charAt(0)===`/`&&(uri=uri.charAt(1)===`/`?loc.protocol+uri:loc.host+uri),/^(https?|wss?):\/\//.test(uri)||(uri=loc===void 0?`https://`+uri:loc.protocol+`//`+uri),obj=parse$2(uri)),obj.port||(/^(http|ws)$/.test(obj.protocol)?obj.port=`80`:/^(http|ws)s$/.test(obj.protocol)&&(obj.port=`443`)),obj.path=obj.path||`/`;let host=obj.host.indexOf(`:`)===-1?obj.host:`[`+obj.host+`]`;return obj.id=obj.protocol+`://`+host+`:`+obj.port+path,obj.href=obj.protocol+`://`+host+(loc&&loc.port===obj.port?``:`:`+obj.port),obj}var withNativeArrayBuffer=typeof ArrayBuffer==`function`,isView=obj=>typeof ArrayBuffer.isView==`function`?ArrayBuffer.isView(obj):obj.buffer instanceof ArrayBuffer,toString=Object.prototype.toString,withNativeBlob=typeof Blob==`function`||typeof Blob<`u`&&toString.call(Blob)===`[object BlobConstructor]`,withNativeFile=typeof File==`function`||typeof File<`u`&&toString.call(File)===`[object FileConstructor]`;function isBinary(obj){return withNativeArrayBuffer&&(obj instanceof ArrayBuffer||isView(obj))||withNativeBlob&&obj instanceof Blob||withNativeFile&&obj instanceof File}function hasBinary(obj,toJSON){if(!obj||typeof obj!=`object`)return!1;if(Array.isArray(obj)){for(let i$23=0,l$12=obj.length;i$23<l$12;i$23++)if(hasBinary(obj[i$23]))return!0;return!1}if(isBinary(obj))return!0;if(obj.toJSON&&typeof obj.toJSON==`function`&&arguments.length===1)return hasBinary(obj.toJSON(),!0);for(let key$1 in obj)if(Object.prototype.hasOwnProperty.call(obj,key$1)&&hasBinary(obj[key$1]))return!0;return!1}function deconstructPacket(packet){let buffers=[],packetData=packet.data,pack=packet;return pack.data=_deconstructPacket(packetData,buffers),pack.attachments=buffers.length,{packet:pack,buffers}}function _deconstructPacket(data,buffers){if(!data)return data;if(isBinary(data)){let placeholder={_placeholder:!0,num:buffers.length};return buffers.push(data),placeholder}else if(Array.isArray(data)){let newData=Array(data.length);for(let i$23=0;i$23<data.length;i$23++)newData[i$23]=_deconstructPacket(data[i$23],buffers);return newData}else if(typeof data==`object`&&!(data instanceof Date)){let newData={};for(let key$1 in data)Object.prototype.hasOwnProperty.call(data,key$1)&&(newData[key$1]=_deconstructPacket(data[key$1],buffers));return newData}return data}function reconstructPacket(packet,buffers){return packet.data=_reconstructPacket(packet.data,buffers),delete packet.attachments,packet}function _reconstructPacket(data,buffers){if(!data)return data;if(data&&data._placeholder===!0){if(typeof data.num==`number`&&data.num>=0&&data.num<buffers.length)return buffers[data.num];throw Error(`illegal attachments`)}else if(Array.isArray(data))for(let i$23=0;i$23<data.length;i$23++)data[i$23]=_reconstructPacket(data[i$23],buffers);else if(typeof data==`object`)for(let key$1 in data)Object.prototype.hasOwnProperty.call(data,key$1)&&(data[key$1]=_reconstructPacket(data[key$1],buffers));return data}var esm_exports$1=__export({Decoder:()=>Decoder,Encoder:()=>Encoder,PacketType:()=>PacketType,protocol:()=>5}),RESERVED_EVENTS$1=[`connect`,`connect_error`,`disconnect`,`disconnecting`,`newListener`,`removeListener`];const protocol=5;var PacketType;(function(PacketType$1){PacketType$1[PacketType$1.CONNECT=0]=`CONNECT`,PacketType$1[PacketType$1.DISCONNECT=1]=`DISCONNECT`,PacketType$1[PacketType$1.EVENT=2]=`EVENT`,PacketType$1[PacketType$1.ACK=3]=`ACK`,PacketType$1[PacketType$1.CONNECT_ERROR=4]=`CONNECT_ERROR`,PacketType$1[PacketType$1.BINARY_EVENT=5]=`BINARY_EVENT`,PacketType$1[PacketType$1.BINARY_ACK=6]=`BINARY_ACK`})(PacketType||={});var Encoder=class{constructor(replacer){this.replacer=replacer}encode(obj){return(obj.type===PacketType.EVENT||obj.type===PacketType.ACK)&&hasBinary(obj)?this.encodeAsBinary({type:obj.type===PacketType.EVENT?PacketType.BINARY_EVENT:PacketType.BINARY_ACK,nsp:obj.nsp,data:obj.data,id:obj.id}):[this.encodeAsString(obj)]}encodeAsString(obj){let str=``+obj.type;return(obj.type===PacketType.BINARY_EVENT||obj.type===PacketType.BINARY_ACK)&&(str+=obj.attachments+`-`),obj.nsp&&obj.nsp!==`/`&&(str+=obj.nsp+`,`),obj.id!=null&&(str+=obj.id),obj.data!=null&&(str+=JSON.stringify(obj.data,this.replacer)),str}encodeAsBinary(obj){let deconstruction=deconstructPacket(obj),pack=this.encodeAsString(deconstruction.packet),buffers=deconstruction.buffers;return buffers.unshift(pack),buffers}};function isObject(value$1){return Object.prototype.toString.call(value$1)===`[object Object]`}var Decoder=class Decoder extends Emitter{constructor(reviver){super(),this.reviver=reviver}add(obj){let packet;if(typeof obj==`string`){if(this.reconstructor)throw Error(`got plaintext data when reconstructing a packet`);packet=this.decodeString(obj);let isBinaryEvent=packet.type===PacketType.BINARY_EVENT;isBinaryEvent||packet.type===PacketType.BINARY_ACK?(packet.type=isBinaryEvent?PacketType.EVENT:PacketType.ACK,this.reconstructor=new BinaryReconstructor(packet),packet.attachments===0&&super.emitReserved(`decoded`,packet)):super.emitReserved(`decoded`,packet)}else if(isBinary(obj)||obj.base64)if(this.reconstructor)packet=this.reconstructor.takeBinaryData(obj),packet&&(this.reconstructor=null,super.emitReserved(`decoded`,packet));else throw Error(`got binary data when not reconstructing a packet`);else throw Error(`Unknown type: `+obj)}decodeString(str){let i$23=0,p$36={type:Number(str.charAt(0))};if(PacketType[p$36.type]===void 0)throw Error(`unknown packet type `+p$36.type);if(p$36.type===PacketType.BINARY_EVENT||p$36.type===PacketType.BINARY_ACK){let start=i$23+1;for(;str.charAt(++i$23)!==`-`&&i$23!=str.length;);let buf=str.substring(start,i$23);if(buf!=Number(buf)||str.charAt(i$23)!==`-`)throw Error(`Illegal attachments`);p$36.attachments=Number(buf)}if(str.charAt(i$23+1)===`/`){let start=i$23+1;for(;++i$23&&!(str.charAt(i$23)===`,`||i$23===str.length););p$36.nsp=str.substring(start,i$23)}else p$36.nsp=`/`;let next=str.charAt(i$23+1);if(next!==``&&Number(next)==next){let start=i$23+1;for(;++i$23;){let c$5=str.charAt(i$23);if(c$5==null||Number(c$5)!=c$5){--i$23;break}if(i$23===str.length)break}p$36.id=Number(str.substring(start,i$23+1))}if(str.charAt(++i$23)){let payload=this.tryParse(str.substr(i$23));if(Decoder.isPayloadValid(p$36.type,payload))p$36.data=payload;else throw Error(`invalid payload`)}return p$36}tryParse(str){try{return JSON.parse(str,this.reviver)}catch{return!1}}static isPayloadValid(type,payload){switch(type){case PacketType.CONNECT:return isObject(payload);case PacketType.DISCONNECT:return payload===void 0;case PacketType.CONNECT_ERROR:return typeof payload==`string`||isObject(payload);case PacketType.EVENT:case PacketType.BINARY_EVENT:return Array.isArray(payload)&&(typeof payload[0]==`number`||typeof payload[0]==`string`&&RESERVED_EVENTS$1.indexOf(payload[0])===-1);case PacketType.ACK:case PacketType.BINARY_ACK:return Array.isArray(payload)}}destroy(){this.reconstructor&&=(this.reconstructor.finishedReconstruction(),null)}},BinaryReconstructor=class{constructor(packet){this.packet=packet,this.buffers=[],this.reconPack=packet}takeBinaryData(binData){if(this.buffers.push(binData),this.buffers.length===this.reconPack.attachments){let packet=reconstructPacket(this.reconPack,this.buffers);return this.finishedReconstruction(),packet}return null}finishedReconstruction(){this.reconPack=null,this.buffers=[]}};function on(obj,ev,fn){return obj.on(ev,fn),function(){obj.off(ev,fn)}}var RESERVED_EVENTS=Object.freeze({connect:1,connect_error:1,disconnect:1,disconnecting:1,newListener:1,removeListener:1}),Socket=class extends Emitter{constructor(io,nsp,opts){super(),this.connected=!1,this.recovered=!1,this.receiveBuffer=[],this.sendBuffer=[],this._queue=[],this._queueSeq=0,this.ids=0,this.acks={},this.flags={},this.io=io,this.nsp=nsp,opts&&opts.auth&&(this.auth=opts.auth),this._opts=Object.assign({},opts),this.io._autoConnect&&this.open()}get disconnected(){return!this.connected}subEvents(){if(this.subs)return;let io=this.io;this.subs=[on(io,`open`,this.onopen.bind(this)),on(io,`packet`,this.onpacket.bind(this)),on(io,`error`,this.onerror.bind(this)),on(io,`close`,this.onclose.bind(this))]}get active(){return!!this.subs}connect(){return this.connected?this:(this.subEvents(),this.io._reconnecting||this.io.open(),this.io._readyState===`open`&&this.onopen(),this)}open(){return this.connect()}send(...args){return args.unshift(`message`),this.emit.apply(this,args),this}emit(ev,...args){var _a,_b,_c;if(RESERVED_EVENTS.hasOwnProperty(ev))throw Error(`"`+ev.toString()+`" is a reserved event name`);if(args.unshift(ev),this._opts.retries&&!this.flags.fromQueue&&!this.flags.volatile)return this._addToQueue(args),this;let packet={type:PacketType.EVENT,data:args};if(packet.options={},packet.options.compress=this.flags.compress!==!1,typeof args[args.length-1]==`function`){let id=this.ids++,ack=args.pop();this._registerAckCallback(id,ack),packet.id=id}let isTransportWritable=this.io.engine?.transport?.writable,isConnected=this.connected&&!this.io.engine?._hasPingExpired();return this.flags.volatile&&!isTransportWritable||(isConnected?(this.notifyOutgoingListeners(packet),this.packet(packet)):this.sendBuffer.push(packet)),this.flags={},this}_registerAckCallback(id,ack){var _a;let timeout=this.flags.timeout??this._opts.ackTimeout;if(timeout===void 0){this.acks[id]=ack;return}let timer=this.io.setTimeoutFn(()=>{delete this.acks[id];for(let i$23=0;i$23<this.sendBuffer.length;i$23++)this.sendBuffer[i$23].id===id&&this.sendBuffer.splice(i$23,1);ack.call(this,Error(`operation has timed out`))},timeout),fn=(...args)=>{this.io.clearTimeoutFn(timer),ack.apply(this,args)};fn.withError=!0,this.acks[id]=fn}emitWithAck(ev,...args){return new Promise((resolve,reject)=>{let fn=(arg1,arg2)=>arg1?reject(arg1):resolve(arg2);fn.withError=!0,args.push(fn),this.emit(ev,...args)})}_addToQueue(args){let ack;typeof args[args.length-1]==`function`&&(ack=args.pop());let packet={id:this._queueSeq++,tryCount:0,pending:!1,args,flags:Object.assign({fromQueue:!0},this.flags)};args.push((err,...responseArgs)=>{if(packet===this._queue[0])return err===null?(this._queue.shift(),ack&&ack(null,...responseArgs)):packet.tryCount>this._opts.retries&&(this._queue.shift(),ack&&ack(err)),packet.pending=!1,this._drainQueue()}),this._queue.push(packet),this._drainQueue()}_drainQueue(force=!1){if(!this.connected||this._queue.length===0)return;let packet=this._queue[0];packet.pending&&!force||(packet.pending=!0,packet.tryCount++,this.flags=packet.flags,this.emit.apply(this,packet.args))}packet(packet){packet.nsp=this.nsp,this.io._packet(packet)}onopen(){typeof this.auth==`function`?this.auth(data=>{this._sendConnectPacket(data)}):this._sendConnectPacket(this.auth)}_sendConnectPacket(data){this.packet({type:PacketType.CONNECT,data:this._pid?Object.assign({pid:this._pid,offset:this._lastOffset},data):data})}onerror(err){this.connected||this.emitReserved(`connect_error`,err)}onclose(reason,description){this.connected=!1,delete this.id,this.emitReserved(`disconnect`,reason,description),this._clearAcks()}_clearAcks(){Object.keys(this.acks).forEach(id=>{if(!this.sendBuffer.some(packet=>String(packet.id)===id)){let ack=this.acks[id];delete this.acks[id],ack.withError&&ack.call(this,Error(`socket has been disconnected`))}})}onpacket(packet){if(packet.nsp===this.nsp)switch(packet.type){case PacketType.CONNECT:packet.data&&packet.data.sid?this.onconnect(packet.data.sid,packet.data.pid):this.emitReserved(`connect_error`,Error(`It seems you are trying to reach a Socket.IO server in v2.x with a v3.x client, but they are not compatible (more information here: https://socket.io/docs/v3/migrating-from-2-x-to-3-0/)`));break;case PacketType.EVENT:case PacketType.BINARY_EVENT:this.onevent(packet);break;case PacketType.ACK:case PacketType.BINARY_ACK:this.onack(packet);break;case PacketType.DISCONNECT:this.ondisconnect();break;case PacketType.CONNECT_ERROR:this.destroy();let err=Error(packet.data.message);err.data=packet.data.data,this.emitReserved(`connect_error`,err);break}}onevent(packet){let args=packet.data||[];packet.id!=null&&args.push(this.ack(packet.id)),this.connected?this.emitEvent(args):this.receiveBuffer.push(Object.freeze(args))}emitEvent(args){if(this._anyListeners&&this._anyListeners.length){let listeners=this._anyListeners.slice();for(let listener of listeners)listener.apply(this,args)}super.emit.apply(this,args),this._pid&&args.length&&typeof args[args.length-1]==`string`&&(this._lastOffset=args[args.length-1])}ack(id){let self$1=this,sent=!1;return function(...args){sent||(sent=!0,self$1.packet({type:PacketType.ACK,id,data:args}))}}onack(packet){let ack=this.acks[packet.id];typeof ack==`function`&&(delete this.acks[packet.id],ack.withError&&packet.data.unshift(null),ack.apply(this,packet.data))}onconnect(id,pid){this.id=id,this.recovered=pid&&this._pid===pid,this._pid=pid,this.connected=!0,this.emitBuffered(),this.emitReserved(`connect`),this._drainQueue(!0)}emitBuffered(){this.receiveBuffer.forEach(args=>this.emitEvent(args)),this.receiveBuffer=[],this.sendBuffer.forEach(packet=>{this.notifyOutgoingListeners(packet),this.packet(packet)}),this.sendBuffer=[]}ondisconnect(){this.destroy(),this.onclose(`io server disconnect`)}destroy(){this.subs&&=(this.subs.forEach(subDestroy=>subDestroy()),void 0),this.io._destroy(this)}disconnect(){return this.connected&&this.packet({type:PacketType.DISCONNECT}),this.destroy(),this.connected&&this.onclose(`io client disconnect`),this}close(){return this.disconnect()}compress(compress){return this.flags.compress=compress,this}get volatile(){return this.flags.volatile=!0,this}timeout(timeout){return this.flags.timeout=timeout,this}onAny(listener){return this._anyListeners=this._anyListeners||[],this._anyListeners.push(listener),this}prependAny(listener){return this._anyListeners=this._anyListeners||[],this._anyListeners.unshift(listener),this}offAny(listener){if(!this._anyListeners)return this;if(listener){let listeners=this._anyListeners;for(let i$23=0;i$23<listeners.length;i$23++)if(listener===listeners[i$23])return listeners.splice(i$23,1),this}else this._anyListeners=[];return this}listenersAny(){return this._anyListeners||[]}onAnyOutgoing(listener){return this._anyOutgoingListeners=this._anyOutgoingListeners||[],this._anyOutgoingListeners.push(listener),this}prependAnyOutgoing(listener){return this._anyOutgoingListeners=this._anyOutgoingListeners||[],this._anyOutgoingListeners.unshift(listener),this}offAnyOutgoing(listener){if(!this._anyOutgoingListeners)return this;if(listener){let listeners=this._anyOutgoingListeners;for(let i$23=0;i$23<listeners.length;i$23++)if(listener===listeners[i$23])return listeners.splice(i$23,1),this}else this._anyOutgoingListeners=[];return this}listenersAnyOutgoing(){return this._anyOutgoingListeners||[]}notifyOutgoingListeners(packet){if(this._anyOutgoingListeners&&this._anyOutgoingListeners.length){let listeners=this._anyOutgoingListeners.slice();for(let listener of listeners)listener.apply(this,packet.data)}}};function Backoff(opts){opts||={},this.ms=opts.min||100,this.max=opts.max||1e4,this.factor=opts.factor||2,this.jitter=opts.jitter>0&&opts.jitter<=1?opts.jitter:0,this.attempts=0}Backoff.prototype.duration=function(){var ms=this.ms*this.factor**+ this.attempts++;if(this.jitter){var rand=Math.random(),deviation=Math.floor(rand*this.jitter*ms);ms=Math.floor(rand*10)&1?ms+deviation:ms-deviation}return Math.min(ms,this.max)|0},Backoff.prototype.reset=function(){this.attempts=0},Backoff.prototype.setMin=function(min$1){this.ms=min$1},Backoff.prototype.setMax=function(max$1){this.max=max$1},Backoff.prototype.setJitter=function(jitter){this.jitter=jitter};var Manager=class extends Emitter{constructor(uri,opts){var _a;super(),this.nsps={},this.subs=[],uri&&typeof uri==`object`&&(opts=uri,uri=void 0),opts||={},opts.path=opts.path||`/socket.io`,this.opts=opts,installTimerFunctions(this,opts),this.reconnection(opts.reconnection!==!1),this.reconnectionAttempts(opts.reconnectionAttempts||1/0),this.reconnectionDelay(opts.reconnectionDelay||1e3),this.reconnectionDelayMax(opts.reconnectionDelayMax||5e3),this.randomizationFactor(opts.randomizationFactor??.5),this.backoff=new Backoff({min:this.reconnectionDelay(),max:this.reconnectionDelayMax(),jitter:this.randomizationFactor()}),this.timeout(opts.timeout==null?2e4:opts.timeout),this._readyState=`closed`,this.uri=uri;let _parser=opts.parser||esm_exports$1;this.encoder=new _parser.Encoder,this.decoder=new _parser.Decoder,this._autoConnect=opts.autoConnect!==!1,this._autoConnect&&this.open()}reconnection(v$10){return arguments.length?(this._reconnection=!!v$10,v$10||(this.skipReconnect=!0),this):this._reconnection}reconnectionAttempts(v$10){return v$10===void 0?this._reconnectionAttempts:(this._reconnectionAttempts=v$10,this)}reconnectionDelay(v$10){var _a;return v$10===void 0?this._reconnectionDelay:(this._reconnectionDelay=v$10,(_a=this.backoff)==null||_a.setMin(v$10),this)}randomizationFactor(v$10){var _a;return v$10===void 0?this._randomizationFactor:(this._randomizationFactor=v$10,(_a=this.backoff)==null||_a.setJitter(v$10),this)}reconnectionDelayMax(v$10){var _a;return v$10===void 0?this._reconnectionDelayMax:(this._reconnectionDelayMax=v$10,(_a=this.backoff)==null||_a.setMax(v$10),this)}timeout(v$10){return arguments.length?(this._timeout=v$10,this):this._timeout}maybeReconnectOnOpen(){!this._reconnecting&&this._reconnection&&this.backoff.attempts===0&&this.reconnect()}open(fn){if(~this._readyState.indexOf(`open`))return this;this.engine=new Socket$1(this.uri,this.opts);let socket=this.engine,self$1=this;this._readyState=`opening`,this.skipReconnect=!1;let openSubDestroy=on(socket,`open`,function(){self$1.onopen(),fn&&fn()}),onError=err=>{this.cleanup(),this._readyState=`closed`,this.emitReserved(`error`,err),fn?fn(err):this.maybeReconnectOnOpen()},errorSub=on(socket,`error`,onError);if(!1!==this._timeout){let timeout=this._timeout,timer=this.setTimeoutFn(()=>{openSubDestroy(),onError(Error(`timeout`)),socket.close()},timeout);this.opts.autoUnref&&timer.unref(),this.subs.push(()=>{this.clearTimeoutFn(timer)})}return this.subs.push(openSubDestroy),this.subs.push(errorSub),this}connect(fn){return this.open(fn)}onopen(){this.cleanup(),this._readyState=`open`,this.emitReserved(`open`);let socket=this.engine;this.subs.push(on(socket,`ping`,this.onping.bind(this)),on(socket,`data`,this.ondata.bind(this)),on(socket,`error`,this.onerror.bind(this)),on(socket,`close`,this.onclose.bind(this)),on(this.decoder,`decoded`,this.ondecoded.bind(this)))}onping(){this.emitReserved(`ping`)}ondata(data){try{this.decoder.add(data)}catch(e$31){this.onclose(`parse error`,e$31)}}ondecoded(packet){nextTick(()=>{this.emitReserved(`packet`,packet)},this.setTimeoutFn)}onerror(err){this.emitReserved(`error`,err)}socket(nsp,opts){let socket=this.nsps[nsp];return socket?this._autoConnect&&!socket.active&&socket.connect():(socket=new Socket(this,nsp,opts),this.nsps[nsp]=socket),socket}_destroy(socket){let nsps=Object.keys(this.nsps);for(let nsp of nsps)if(this.nsps[nsp].active)return;this._close()}_packet(packet){let encodedPackets=this.encoder.encode(packet);for(let i$23=0;i$23<encodedPackets.length;i$23++)this.engine.write(encodedPackets[i$23],packet.options)}cleanup(){this.subs.forEach(subDestroy=>subDestroy()),this.subs.length=0,this.decoder.destroy()}_close(){this.skipReconnect=!0,this._reconnecting=!1,this.onclose(`forced close`)}disconnect(){return this._close()}onclose(reason,description){var _a;this.cleanup(),(_a=this.engine)==null||_a.close(),this.backoff.reset(),this._readyState=`closed`,this.emitReserved(`close`,reason,description),this._reconnection&&!this.skipReconnect&&this.reconnect()}reconnect(){if(this._reconnecting||this.skipReconnect)return this;let self$1=this;if(this.backoff.attempts>=this._reconnectionAttempts)this.backoff.reset(),this.emitReserved(`reconnect_failed`),this._reconnecting=!1;else{let delay=this.backoff.duration();this._reconnecting=!0;let timer=this.setTimeoutFn(()=>{self$1.skipReconnect||(this.emitReserved(`reconnect_attempt`,self$1.backoff.attempts),!self$1.skipReconnect&&self$1.open(err=>{err?(self$1._reconnecting=!1,self$1.reconnect(),this.emitReserved(`reconnect_error`,err)):self$1.onreconnect()}))},delay);this.opts.autoUnref&&timer.unref(),this.subs.push(()=>{this.clearTimeoutFn(timer)})}}onreconnect(){let attempt=this.backoff.attempts;this._reconnecting=!1,this.backoff.reset(),this.emitReserved(`reconnect`,attempt)}},cache={};function lookup(uri,opts){typeof uri==`object`&&(opts=uri,uri=void 0),opts||={};let parsed=url(uri,opts.path||`/socket.io`),source$1=parsed.source,id=parsed.id,path=parsed.path,sameNamespace=cache[id]&&path in cache[id].nsps,newConnection=opts.forceNew||opts[`force new connection`]||!1===opts.multiplex||sameNamespace,io;return newConnection?io=new Manager(source$1,opts):(cache[id]||(cache[id]=new Manager(source$1,opts)),io=cache[id]),parsed.query&&!opts.query&&(opts.query=parsed.queryKey),io.socket(parsed.path,opts)}Object.assign(lookup,{Manager,Socket,io:lookup,connect:lookup});var unicode={Space_Separator:/[\u1680\u2000-\u200A\u202F\u205F\u3000]/,ID_Start:/[\xAA\xB5\xBA\xC0-\xD6\xD8-\xF6\xF8-\u02C1\u02C6-\u02D1\u02E0-\u02E4\u02EC\u02EE\u0370-\u0374\u0376\u0377\u037A-\u037D\u037F\u0386\u0388-\u038A\u038C\u038E-\u03A1\u03A3-\u03F5\u03F7-\u0481\u048A-\u052F\u0531-\u0556\u0559\u0561-\u0587\u05D0-\u05EA\u05F0-\u05F2\u0620-\u064A\u066E\u066F\u0671-\u06D3\u06D5\u06E5\u06E6\u06EE\u06EF\u06FA-\u06FC\u06FF\u0710\u0712-\u072F\u074D-\u07A5\u07B1\u07CA-\u07EA\u07F4\u07F5\u07FA\u0800-\u0815\u081A\u0824\u0828\u0840-\u0858\u0860-\u086A\u08A0-\u08B4\u08B6-\u08BD\u0904-\u0939\u093D\u0950\u0958-\u0961\u0971-\u0980\u0985-\u098C\u098F\u0990\u0993-\u09A8\u09AA-\u09B0\u09B2\u09B6-\u09B9\u09BD\u09CE\u09DC\u09DD\u09DF-\u09E1\u09F0\u09F1\u09FC\u0A05-\u0A0A\u0A0F\u0A10\u0A13-\u0A28\u0A2A-\u0A30\u0A32\u0A33\u0A35\u0A36\u0A38\u0A39\u0A59-\u0A5C\u0A5E\u0A72-\u0A74\u0A85-\u0A8D\u0A8F-\u0A91\u0A93-\u0AA8\u0AAA-\u0AB0\u0AB2\u0AB3\u0AB5-\u0AB9\u0ABD\u0AD0\u0AE0\u0AE1\u0AF9\u0B05-\u0B0C\u0B0F\u0B10\u0B13-\u0B28\u0B2A-\u0B30\u0B32\u0B33\u0B35-\u0B39\u0B3D\u0B5C\u0B5D\u0B5F-\u0B61\u0B71\u0B83\u0B85-\u0B8A\u0B8E-\u0B90\u0B92-\u0B95\u0B99\u0B9A\u0B9C\u0B9E\u0B9F\u0BA3\u0BA4\u0BA8-\u0BAA\u0BAE-\u0BB9\u0BD0\u0C05-\u0C0C\u0C0E-\u0C10\u0C12-\u0C28\u0C2A-\u0C39\u0C3D\u0C58-\u0C5A\u0C60\u0C61\u0C80\u0C85-\u0C8C\u0C8E-\u0C90\u0C92-\u0CA8\u0CAA-\u0CB3\u0CB5-\u0CB9\u0CBD\u0CDE\u0CE0\u0CE1\u0CF1\u0CF2\u0D05-\u0D0C\u0D0E-\u0D10\u0D12-\u0D3A\u0D3D\u0D4E\u0D54-\u0D56\u0D5F-\u0D61\u0D7A-\u0D7F\u0D85-\u0D96\u0D9A-\u0DB1\u0DB3-\u0DBB\u0DBD\u0DC0-\u0DC6\u0E01-\u0E30\u0E32\u0E33\u0E40-\u0E46\u0E81\u0E82\u0E84\u0E87\u0E88\u0E8A\u0E8D\u0E94-\u0E97\u0E99-\u0E9F\u0EA1-\u0EA3\u0EA5\u0EA7\u0EAA\u0EAB\u0EAD-\u0EB0\u0EB2\u0EB3\u0EBD\u0EC0-\u0EC4\u0EC6\u0EDC-\u0EDF\u0F00\u0F40-\u0F47\u0F49-\u0F6C\u0F88-\u0F8C\u1000-\u102A\u103F\u1050-\u1055\u105A-\u105D\u1061\u1065\u1066\u106E-\u1070\u1075-\u1081\u108E\u10A0-\u10C5\u10C7\u10CD\u10D0-\u10FA\u10FC-\u1248\u124A-\u124D\u1250-\u1256\u1258\u125A-\u125D\u1260-\u1288\u128A-\u128D\u1290-\u12B0\u12B2-\u12B5\u12B8-\u12BE\u12C0\u12C2-\u12C5\u12C8-\u12D6\u12D8-\u1310\u1312-\u1315\u1318-\u135A\u1380-\u138F\u13A0-\u13F5\u13F8-\u13FD\u1401-\u166C\u166F-\u167F\u1681-\u169A\u16A0-\u16EA\u16EE-\u16F8\u1700-\u170C\u170E-\u1711\u1720-\u1731\u1740-\u1751\u1760-\u176C\u176E-\u1770\u1780-\u17B3\u17D7\u17DC\u1820-\u1877\u1880-\u1884\u1887-\u18A8\u18AA\u18B0-\u18F5\u1900-\u191E\u1950-\u196D\u1970-\u1974\u1980-\u19AB\u19B0-\u19C9\u1A00-\u1A16\u1A20-\u1A54\u1AA7\u1B05-\u1B33\u1B45-\u1B4B\u1B83-\u1BA0\u1BAE\u1BAF\u1BBA-\u1BE5\u1C00-\u1C23\u1C4D-\u1C4F\u1C5A-\u1C7D\u1C80-\u1C88\u1CE9-\u1CEC\u1CEE-\u1CF1\u1CF5\u1CF6\u1D00-\u1DBF\u1E00-\u1F15\u1F18-\u1F1D\u1F20-\u1F45\u1F48-\u1F4D\u1F50-\u1F57\u1F59\u1F5B\u1F5D\u1F5F-\u1F7D\u1F80-\u1FB4\u1FB6-\u1FBC\u1FBE\u1FC2-\u1FC4\u1FC6-\u1FCC\u1FD0-\u1FD3\u1FD6-\u1FDB\u1FE0-\u1FEC\u1FF2-\u1FF4\u1FF6-\u1FFC\u2071\u207F\u2090-\u209C\u2102\u2107\u210A-\u2113\u2115\u2119-\u211D\u2124\u2126\u2128\u212A-\u212D\u212F-\u2139\u213C-\u213F\u2145-\u2149\u214E\u2160-\u2188\u2C00-\u2C2E\u2C30-\u2C5E\u2C60-\u2CE4\u2CEB-\u2CEE\u2CF2\u2CF3\u2D00-\u2D25\u2D27\u2D2D\u2D30-\u2D67\u2D6F\u2D80-\u2D96\u2DA0-\u2DA6\u2DA8-\u2DAE\u2DB0-\u2DB6\u2DB8-\u2DBE\u2DC0-\u2DC6\u2DC8-\u2DCE\u2DD0-\u2DD6\u2DD8-\u2DDE\u2E2F\u3005-\u3007\u3021-\u3029\u3031-\u3035\u3038-\u303C\u3041-\u3096\u309D-\u309F\u30A1-\u30FA\u30FC-\u30FF\u3105-\u312E\u3131-\u318E\u31A0-\u31BA\u31F0-\u31FF\u3400-\u4DB5\u4E00-\u9FEA\uA000-\uA48C\uA4D0-\uA4FD\uA500-\uA60C\uA610-\uA61F\uA62A\uA62B\uA640-\uA66E\uA67F-\uA69D\uA6A0-\uA6EF\uA717-\uA71F\uA722-\uA788\uA78B-\uA7AE\uA7B0-\uA7B7\uA7F7-\uA801\uA803-\uA805\uA807-\uA80A\uA80C-\uA822\uA840-\uA873\uA882-\uA8B3\uA8F2-\uA8F7\uA8FB\uA8FD\uA90A-\uA925\uA930-\uA946\uA960-\uA97C\uA984-\uA9B2\uA9CF\uA9E0-\uA9E4\uA9E6-\uA9EF\uA9FA-\uA9FE\uAA00-\uAA28\uAA40-\uAA42\uAA44-\uAA4B\uAA60-\uAA76\uAA7A\uAA7E-\uAAAF\uAAB1\uAAB5\uAAB6\uAAB9-\uAABD\uAAC0\uAAC2\uAADB-\uAADD\uAAE0-\uAAEA\uAAF2-\uAAF4\uAB01-\uAB06\uAB09-\uAB0E\uAB11-\uAB16\uAB20-\uAB26\uAB28-\uAB2E\uAB30-\uAB5A\uAB5C-\uAB65\uAB70-\uABE2\uAC00-\uD7A3\uD7B0-\uD7C6\uD7CB-\uD7FB\uF900-\uFA6D\uFA70-\uFAD9\uFB00-\uFB06\uFB13-\uFB17\uFB1D\uFB1F-\uFB28\uFB2A-\uFB36\uFB38-\uFB3C\uFB3E\uFB40\uFB41\uFB43\uFB44\uFB46-\uFBB1\uFBD3-\uFD3D\uFD50-\uFD8F\uFD92-\uFDC7\uFDF0-\uFDFB\uFE70-\uFE74\uFE76-\uFEFC\uFF21-\uFF3A\uFF41-\uFF5A\uFF66-\uFFBE\uFFC2-\uFFC7\uFFCA-\uFFCF\uFFD2-\uFFD7\uFFDA-\uFFDC]|\uD800[\uDC00-\uDC0B\uDC0D-\uDC26\uDC28-\uDC3A\uDC3C\uDC3D\uDC3F-\uDC4D\uDC50-\uDC5D\uDC80-\uDCFA\uDD40-\uDD74\uDE80-\uDE9C\uDEA0-\uDED0\uDF00-\uDF1F\uDF2D-\uDF4A\uDF50-\uDF75\uDF80-\uDF9D\uDFA0-\uDFC3\uDFC8-\uDFCF\uDFD1-\uDFD5]|\uD801[\uDC00-\uDC9D\uDCB0-\uDCD3\uDCD8-\uDCFB\uDD00-\uDD27\uDD30-\uDD63\uDE00-\uDF36\uDF40-\uDF55\uDF60-\uDF67]|\uD802[\uDC00-\uDC05\uDC08\uDC0A-\uDC35\uDC37\uDC38\uDC3C\uDC3F-\uDC55\uDC60-\uDC76\uDC80-\uDC9E\uDCE0-\uDCF2\uDCF4\uDCF5\uDD00-\uDD15\uDD20-\uDD39\uDD80-\uDDB7\uDDBE\uDDBF\uDE00\uDE10-\uDE13\uDE15-\uDE17\uDE19-\uDE33\uDE60-\uDE7C\uDE80-\uDE9C\uDEC0-\uDEC7\uDEC9-\uDEE4\uDF00-\uDF35\uDF40-\uDF55\uDF60-\uDF72\uDF80-\uDF91]|\uD803[\uDC00-\uDC48\uDC80-\uDCB2\uDCC0-\uDCF2]|\uD804[\uDC03-\uDC37\uDC83-\uDCAF\uDCD0-\uDCE8\uDD03-\uDD26\uDD50-\uDD72\uDD76\uDD83-\uDDB2\uDDC1-\uDDC4\uDDDA\uDDDC\uDE00-\uDE11\uDE13-\uDE2B\uDE80-\uDE86\uDE88\uDE8A-\uDE8D\uDE8F-\uDE9D\uDE9F-\uDEA8\uDEB0-\uDEDE\uDF05-\uDF0C\uDF0F\uDF10\uDF13-\uDF28\uDF2A-\uDF30\uDF32\uDF33\uDF35-\uDF39\uDF3D\uDF50\uDF5D-\uDF61]|\uD805[\uDC00-\uDC34\uDC47-\uDC4A\uDC80-\uDCAF\uDCC4\uDCC5\uDCC7\uDD80-\uDDAE\uDDD8-\uDDDB\uDE00-\uDE2F\uDE44\uDE80-\uDEAA\uDF00-\uDF19]|\uD806[\uDCA0-\uDCDF\uDCFF\uDE00\uDE0B-\uDE32\uDE3A\uDE50\uDE5C-\uDE83\uDE86-\uDE89\uDEC0-\uDEF8]|\uD807[\uDC00-\uDC08\uDC0A-\uDC2E\uDC40\uDC72-\uDC8F\uDD00-\uDD06\uDD08\uDD09\uDD0B-\uDD30\uDD46]|\uD808[\uDC00-\uDF99]|\uD809[\uDC00-\uDC6E\uDC80-\uDD43]|[\uD80C\uD81C-\uD820\uD840-\uD868\uD86A-\uD86C\uD86F-\uD872\uD874-\uD879][\uDC00-\uDFFF]|\uD80D[\uDC00-\uDC2E]|\uD811[\uDC00-\uDE46]|\uD81A[\uDC00-\uDE38\uDE40-\uDE5E\uDED0-\uDEED\uDF00-\uDF2F\uDF40-\uDF43\uDF63-\uDF77\uDF7D-\uDF8F]|\uD81B[\uDF00-\uDF44\uDF50\uDF93-\uDF9F\uDFE0\uDFE1]|\uD821[\uDC00-\uDFEC]|\uD822[\uDC00-\uDEF2]|\uD82C[\uDC00-\uDD1E\uDD70-\uDEFB]|\uD82F[\uDC00-\uDC6A\uDC70-\uDC7C\uDC80-\uDC88\uDC90-\uDC99]|\uD835[\uDC00-\uDC54\uDC56-\uDC9C\uDC9E\uDC9F\uDCA2\uDCA5\uDCA6\uDCA9-\uDCAC\uDCAE-\uDCB9\uDCBB\uDCBD-\uDCC3\uDCC5-\uDD05\uDD07-\uDD0A\uDD0D-\uDD14\uDD16-\uDD1C\uDD1E-\uDD39\uDD3B-\uDD3E\uDD40-\uDD44\uDD46\uDD4A-\uDD50\uDD52-\uDEA5\uDEA8-\uDEC0\uDEC2-\uDEDA\uDEDC-\uDEFA\uDEFC-\uDF14\uDF16-\uDF34\uDF36-\uDF4E\uDF50-\uDF6E\uDF70-\uDF88\uDF8A-\uDFA8\uDFAA-\uDFC2\uDFC4-\uDFCB]|\uD83A[\uDC00-\uDCC4\uDD00-\uDD43]|\uD83B[\uDE00-\uDE03\uDE05-\uDE1F\uDE21\uDE22\uDE24\uDE27\uDE29-\uDE32\uDE34-\uDE37\uDE39\uDE3B\uDE42\uDE47\uDE49\uDE4B\uDE4D-\uDE4F\uDE51\uDE52\uDE54\uDE57\uDE59\uDE5B\uDE5D\uDE5F\uDE61\uDE62\uDE64\uDE67-\uDE6A\uDE6C-\uDE72\uDE74-\uDE77\uDE79-\uDE7C\uDE7E\uDE80-\uDE89\uDE8B-\uDE9B\uDEA1-\uDEA3\uDEA5-\uDEA9\uDEAB-\uDEBB]|\uD869[\uDC00-\uDED6\uDF00-\uDFFF]|\uD86D[\uDC00-\uDF34\uDF40-\uDFFF]|\uD86E[\uDC00-\uDC1D\uDC20-\uDFFF]|\uD873[\uDC00-\uDEA1\uDEB0-\uDFFF]|\uD87A[\uDC00-\uDFE0]|\uD87E[\uDC00-\uDE1D]/,ID_Continue:/[\xAA\xB5\xBA\xC0-\xD6\xD8-\xF6\xF8-\u02C1\u02C6-\u02D1\u02E0-\u02E4\u02EC\u02EE\u0300-\u0374\u0376\u0377\u037A-\u037D\u037F\u0386\u0388-\u038A\u038C\u038E-\u03A1\u03A3-\u03F5\u03F7-\u0481\u0483-\u0487\u048A-\u052F\u0531-\u0556\u0559\u0561-\u0587\u0591-\u05BD\u05BF\u05C1\u05C2\u05C4\u05C5\u05C7\u05D0-\u05EA\u05F0-\u05F2\u0610-\u061A\u0620-\u0669\u066E-\u06D3\u06D5-\u06DC\u06DF-\u06E8\u06EA-\u06FC\u06FF\u0710-\u074A\u074D-\u07B1\u07C0-\u07F5\u07FA\u0800-\u082D\u0840-\u085B\u0860-\u086A\u08A0-\u08B4\u08B6-\u08BD\u08D4-\u08E1\u08E3-\u0963\u0966-\u096F\u0971-\u0983\u0985-\u098C\u098F\u0990\u0993-\u09A8\u09AA-\u09B0\u09B2\u09B6-\u09B9\u09BC-\u09C4\u09C7\u09C8\u09CB-\u09CE\u09D7\u09DC\u09DD\u09DF-\u09E3\u09E6-\u09F1\u09FC\u0A01-\u0A03\u0A05-\u0A0A\u0A0F\u0A10\u0A13-\u0A28\u0A2A-\u0A30\u0A32\u0A33\u0A35\u0A36\u0A38\u0A39\u0A3C\u0A3E-\u0A42\u0A47\u0A48\u0A4B-\u0A4D\u0A51\u0A59-\u0A5C\u0A5E\u0A66-\u0A75\u0A81-\u0A83\u0A85-\u0A8D\u0A8F-\u0A91\u0A93-\u0AA8\u0AAA-\u0AB0\u0AB2\u0AB3\u0AB5-\u0AB9\u0ABC-\u0AC5\u0AC7-\u0AC9\u0ACB-\u0ACD\u0AD0\u0AE0-\u0AE3\u0AE6-\u0AEF\u0AF9-\u0AFF\u0B01-\u0B03\u0B05-\u0B0C\u0B0F\u0B10\u0B13-\u0B28\u0B2A-\u0B30\u0B32\u0B33\u0B35-\u0B39\u0B3C-\u0B44\u0B47\u0B48\u0B4B-\u0B4D\u0B56\u0B57\u0B5C\u0B5D\u0B5F-\u0B63\u0B66-\u0B6F\u0B71\u0B82\u0B83\u0B85-\u0B8A\u0B8E-\u0B90\u0B92-\u0B95\u0B99\u0B9A\u0B9C\u0B9E\u0B9F\u0BA3\u0BA4\u0BA8-\u0BAA\u0BAE-\u0BB9\u0BBE-\u0BC2\u0BC6-\u0BC8\u0BCA-\u0BCD\u0BD0\u0BD7\u0BE6-\u0BEF\u0C00-\u0C03\u0C05-\u0C0C\u0C0E-\u0C10\u0C12-\u0C28\u0C2A-\u0C39\u0C3D-\u0C44\u0C46-\u0C48\u0C4A-\u0C4D\u0C55\u0C56\u0C58-\u0C5A\u0C60-\u0C63\u0C66-\u0C6F\u0C80-\u0C83\u0C85-\u0C8C\u0C8E-\u0C90\u0C92-\u0CA8\u0CAA-\u0CB3\u0CB5-\u0CB9\u0CBC-\u0CC4\u0CC6-\u0CC8\u0CCA-\u0CCD\u0CD5\u0CD6\u0CDE\u0CE0-\u0CE3\u0CE6-\u0CEF\u0CF1\u0CF2\u0D00-\u0D03\u0D05-\u0D0C\u0D0E-\u0D10\u0D12-\u0D44\u0D46-\u0D48\u0D4A-\u0D4E\u0D54-\u0D57\u0D5F-\u0D63\u0D66-\u0D6F\u0D7A-\u0D7F\u0D82\u0D83\u0D85-\u0D96\u0D9A-\u0DB1\u0DB3-\u0DBB\u0DBD\u0DC0-\u0DC6\u0DCA\u0DCF-\u0DD4\u0DD6\u0DD8-\u0DDF\u0DE6-\u0DEF\u0DF2\u0DF3\u0E01-\u0E3A\u0E40-\u0E4E\u0E50-\u0E59\u0E81\u0E82\u0E84\u0E87\u0E88\u0E8A\u0E8D\u0E94-\u0E97\u0E99-\u0E9F\u0EA1-\u0EA3\u0EA5\u0EA7\u0EAA\u0EAB\u0EAD-\u0EB9\u0EBB-\u0EBD\u0EC0-\u0EC4\u0EC6\u0EC8-\u0ECD\u0ED0-\u0ED9\u0EDC-\u0EDF\u0F00\u0F18\u0F19\u0F20-\u0F29\u0F35\u0F37\u0F39\u0F3E-\u0F47\u0F49-\u0F6C\u0F71-\u0F84\u0F86-\u0F97\u0F99-\u0FBC\u0FC6\u1000-\u1049\u1050-\u109D\u10A0-\u10C5\u10C7\u10CD\u10D0-\u10FA\u10FC-\u1248\u124A-\u124D\u1250-\u1256\u1258\u125A-\u125D\u1260-\u1288\u128A-\u128D\u1290-\u12B0\u12B2-\u12B5\u12B8-\u12BE\u12C0\u12C2-\u12C5\u12C8-\u12D6\u12D8-\u1310\u1312-\u1315\u1318-\u135A\u135D-\u135F\u1380-\u138F\u13A0-\u13F5\u13F8-\u13FD\u1401-\u166C\u166F-\u167F\u1681-\u169A\u16A0-\u16EA\u16EE-\u16F8\u1700-\u170C\u170E-\u1714\u1720-\u1734\u1740-\u1753\u1760-\u176C\u176E-\u1770\u1772\u1773\u1780-\u17D3\u17D7\u17DC\u17DD\u17E0-\u17E9\u180B-\u180D\u1810-\u1819\u1820-\u1877\u1880-\u18AA\u18B0-\u18F5\u1900-\u191E\u1920-\u192B\u1930-\u193B\u1946-\u196D\u1970-\u1974\u1980-\u19AB\u19B0-\u19C9\u19D0-\u19D9\u1A00-\u1A1B\u1A20-\u1A5E\u1A60-\u1A7C\u1A7F-\u1A89\u1A90-\u1A99\u1AA7\u1AB0-\u1ABD\u1B00-\u1B4B\u1B50-\u1B59\u1B6B-\u1B73\u1B80-\u1BF3\u1C00-\u1C37\u1C40-\u1C49\u1C4D-\u1C7D\u1C80-\u1C88\u1CD0-\u1CD2\u1CD4-\u1CF9\u1D00-\u1DF9\u1DFB-\u1F15\u1F18-\u1F1D\u1F20-\u1F45\u1F48-\u1F4D\u1F50-\u1F57\u1F59\u1F5B\u1F5D\u1F5F-\u1F7D\u1F80-\u1FB4\u1FB6-\u1FBC\u1FBE\u1FC2-\u1FC4\u1FC6-\u1FCC\u1FD0-\u1FD3\u1FD6-\u1FDB\u1FE0-\u1FEC\u1FF2-\u1FF4\u1FF6-\u1FFC\u203F\u2040\u2054\u2071\u207F\u2090-\u209C\u20D0-\u20DC\u20E1\u20E5-\u20F0\u2102\u2107\u210A-\u2113\u2115\u2119-\u211D\u2124\u2126\u2128\u212A-\u212D\u212F-\u2139\u213C-\u213F\u2145-\u2149\u214E\u2160-\u2188\u2C00-\u2C2E\u2C30-\u2C5E\u2C60-\u2CE4\u2CEB-\u2CF3\u2D00-\u2D25\u2D27\u2D2D\u2D30-\u2D67\u2D6F\u2D7F-\u2D96\u2DA0-\u2DA6\u2DA8-\u2DAE\u2DB0-\u2DB6\u2DB8-\u2DBE\u2DC0-\u2DC6\u2DC8-\u2DCE\u2DD0-\u2DD6\u2DD8-\u2DDE\u2DE0-\u2DFF\u2E2F\u3005-\u3007\u3021-\u302F\u3031-\u3035\u3038-\u303C\u3041-\u3096\u3099\u309A\u309D-\u309F\u30A1-\u30FA\u30FC-\u30FF\u3105-\u312E\u3131-\u318E\u31A0-\u31BA\u31F0-\u31FF\u3400-\u4DB5\u4E00-\u9FEA\uA000-\uA48C\uA4D0-\uA4FD\uA500-\uA60C\uA610-\uA62B\uA640-\uA66F\uA674-\uA67D\uA67F-\uA6F1\uA717-\uA71F\uA722-\uA788\uA78B-\uA7AE\uA7B0-\uA7B7\uA7F7-\uA827\uA840-\uA873\uA880-\uA8C5\uA8D0-\uA8D9\uA8E0-\uA8F7\uA8FB\uA8FD\uA900-\uA92D\uA930-\uA953\uA960-\uA97C\uA980-\uA9C0\uA9CF-\uA9D9\uA9E0-\uA9FE\uAA00-\uAA36\uAA40-\uAA4D\uAA50-\uAA59\uAA60-\uAA76\uAA7A-\uAAC2\uAADB-\uAADD\uAAE0-\uAAEF\uAAF2-\uAAF6\uAB01-\uAB06\uAB09-\uAB0E\uAB11-\uAB16\uAB20-\uAB26\uAB28-\uAB2E\uAB30-\uAB5A\uAB5C-\uAB65\uAB70-\uABEA\uABEC\uABED\uABF0-\uABF9\uAC00-\uD7A3\uD7B0-\uD7C6\uD7CB-\uD7FB\uF900-\uFA6D\uFA70-\uFAD9\uFB00-\uFB06\uFB13-\uFB17\uFB1D-\uFB28\uFB2A-\uFB36\uFB38-\uFB3C\uFB3E\uFB40\uFB41\uFB43\uFB44\uFB46-\uFBB1\uFBD3-\uFD3D\uFD50-\uFD8F\uFD92-\uFDC7\uFDF0-\uFDFB\uFE00-\uFE0F\uFE20-\uFE2F\uFE33\uFE34\uFE4D-\uFE4F\uFE70-\uFE74\uFE76-\uFEFC\uFF10-\uFF19\uFF21-\uFF3A\uFF3F\uFF41-\uFF5A\uFF66-\uFFBE\uFFC2-\uFFC7\uFFCA-\uFFCF\uFFD2-\uFFD7\uFFDA-\uFFDC]|\uD800[\uDC00-\uDC0B\uDC0D-\uDC26\uDC28-\uDC3A\uDC3C\uDC3D\uDC3F-\uDC4D\uDC50-\uDC5D\uDC80-\uDCFA\uDD40-\uDD74\uDDFD\uDE80-\uDE9C\uDEA0-\uDED0\uDEE0\uDF00-\uDF1F\uDF2D-\uDF4A\uDF50-\uDF7A\uDF80-\uDF9D\uDFA0-\uDFC3\uDFC8-\uDFCF\uDFD1-\uDFD5]|\uD801[\uDC00-\uDC9D\uDCA0-\uDCA9\uDCB0-\uDCD3\uDCD8-\uDCFB\uDD00-\uDD27\uDD30-\uDD63\uDE00-\uDF36\uDF40-\uDF55\uDF60-\uDF67]|\uD802[\uDC00-\uDC05\uDC08\uDC0A-\uDC35\uDC37\uDC38\uDC3C\uDC3F-\uDC55\uDC60-\uDC76\uDC80-\uDC9E\uDCE0-\uDCF2\uDCF4\uDCF5\uDD00-\uDD15\uDD20-\uDD39\uDD80-\uDDB7\uDDBE\uDDBF\uDE00-\uDE03\uDE05\uDE06\uDE0C-\uDE13\uDE15-\uDE17\uDE19-\uDE33\uDE38-\uDE3A\uDE3F\uDE60-\uDE7C\uDE80-\uDE9C\uDEC0-\uDEC7\uDEC9-\uDEE6\uDF00-\uDF35\uDF40-\uDF55\uDF60-\uDF72\uDF80-\uDF91]|\uD803[\uDC00-\uDC48\uDC80-\uDCB2\uDCC0-\uDCF2]|\uD804[\uDC00-\uDC46\uDC66-\uDC6F\uDC7F-\uDCBA\uDCD0-\uDCE8\uDCF0-\uDCF9\uDD00-\uDD34\uDD36-\uDD3F\uDD50-\uDD73\uDD76\uDD80-\uDDC4\uDDCA-\uDDCC\uDDD0-\uDDDA\uDDDC\uDE00-\uDE11\uDE13-\uDE37\uDE3E\uDE80-\uDE86\uDE88\uDE8A-\uDE8D\uDE8F-\uDE9D\uDE9F-\uDEA8\uDEB0-\uDEEA\uDEF0-\uDEF9\uDF00-\uDF03\uDF05-\uDF0C\uDF0F\uDF10\uDF13-\uDF28\uDF2A-\uDF30\uDF32\uDF33\uDF35-\uDF39\uDF3C-\uDF44\uDF47\uDF48\uDF4B-\uDF4D\uDF50\uDF57\uDF5D-\uDF63\uDF66-\uDF6C\uDF70-\uDF74]|\uD805[\uDC00-\uDC4A\uDC50-\uDC59\uDC80-\uDCC5\uDCC7\uDCD0-\uDCD9\uDD80-\uDDB5\uDDB8-\uDDC0\uDDD8-\uDDDD\uDE00-\uDE40\uDE44\uDE50-\uDE59\uDE80-\uDEB7\uDEC0-\uDEC9\uDF00-\uDF19\uDF1D-\uDF2B\uDF30-\uDF39]|\uD806[\uDCA0-\uDCE9\uDCFF\uDE00-\uDE3E\uDE47\uDE50-\uDE83\uDE86-\uDE99\uDEC0-\uDEF8]|\uD807[\uDC00-\uDC08\uDC0A-\uDC36\uDC38-\uDC40\uDC50-\uDC59\uDC72-\uDC8F\uDC92-\uDCA7\uDCA9-\uDCB6\uDD00-\uDD06\uDD08\uDD09\uDD0B-\uDD36\uDD3A\uDD3C\uDD3D\uDD3F-\uDD47\uDD50-\uDD59]|\uD808[\uDC00-\uDF99]|\uD809[\uDC00-\uDC6E\uDC80-\uDD43]|[\uD80C\uD81C-\uD820\uD840-\uD868\uD86A-\uD86C\uD86F-\uD872\uD874-\uD879][\uDC00-\uDFFF]|\uD80D[\uDC00-\uDC2E]|\uD811[\uDC00-\uDE46]|\uD81A[\uDC00-\uDE38\uDE40-\uDE5E\uDE60-\uDE69\uDED0-\uDEED\uDEF0-\uDEF4\uDF00-\uDF36\uDF40-\uDF43\uDF50-\uDF59\uDF63-\uDF77\uDF7D-\uDF8F]|\uD81B[\uDF00-\uDF44\uDF50-\uDF7E\uDF8F-\uDF9F\uDFE0\uDFE1]|\uD821[\uDC00-\uDFEC]|\uD822[\uDC00-\uDEF2]|\uD82C[\uDC00-\uDD1E\uDD70-\uDEFB]|\uD82F[\uDC00-\uDC6A\uDC70-\uDC7C\uDC80-\uDC88\uDC90-\uDC99\uDC9D\uDC9E]|\uD834[\uDD65-\uDD69\uDD6D-\uDD72\uDD7B-\uDD82\uDD85-\uDD8B\uDDAA-\uDDAD\uDE42-\uDE44]|\uD835[\uDC00-\uDC54\uDC56-\uDC9C\uDC9E\uDC9F\uDCA2\uDCA5\uDCA6\uDCA9-\uDCAC\uDCAE-\uDCB9\uDCBB\uDCBD-\uDCC3\uDCC5-\uDD05\uDD07-\uDD0A\uDD0D-\uDD14\uDD16-\uDD1C\uDD1E-\uDD39\uDD3B-\uDD3E\uDD40-\uDD44\uDD46\uDD4A-\uDD50\uDD52-\uDEA5\uDEA8-\uDEC0\uDEC2-\uDEDA\uDEDC-\uDEFA\uDEFC-\uDF14\uDF16-\uDF34\uDF36-\uDF4E\uDF50-\uDF6E\uDF70-\uDF88\uDF8A-\uDFA8\uDFAA-\uDFC2\uDFC4-\uDFCB\uDFCE-\uDFFF]|\uD836[\uDE00-\uDE36\uDE3B-\uDE6C\uDE75\uDE84\uDE9B-\uDE9F\uDEA1-\uDEAF]|\uD838[\uDC00-\uDC06\uDC08-\uDC18\uDC1B-\uDC21\uDC23\uDC24\uDC26-\uDC2A]|\uD83A[\uDC00-\uDCC4\uDCD0-\uDCD6\uDD00-\uDD4A\uDD50-\uDD59]|\uD83B[\uDE00-\uDE03\uDE05-\uDE1F\uDE21\uDE22\uDE24\uDE27\uDE29-\uDE32\uDE34-\uDE37\uDE39\uDE3B\uDE42\uDE47\uDE49\uDE4B\uDE4D-\uDE4F\uDE51\uDE52\uDE54\uDE57\uDE59\uDE5B\uDE5D\uDE5F\uDE61\uDE62\uDE64\uDE67-\uDE6A\uDE6C-\uDE72\uDE74-\uDE77\uDE79-\uDE7C\uDE7E\uDE80-\uDE89\uDE8B-\uDE9B\uDEA1-\uDEA3\uDEA5-\uDEA9\uDEAB-\uDEBB]|\uD869[\uDC00-\uDED6\uDF00-\uDFFF]|\uD86D[\uDC00-\uDF34\uDF40-\uDFFF]|\uD86E[\uDC00-\uDC1D\uDC20-\uDFFF]|\uD873[\uDC00-\uDEA1\uDEB0-\uDFFF]|\uD87A[\uDC00-\uDFE0]|\uD87E[\uDC00-\uDE1D]|\uDB40[\uDD00-\uDDEF]/},util={isSpaceSeparator(c$5){return typeof c$5==`string`&&unicode.Space_Separator.test(c$5)},isIdStartChar(c$5){return typeof c$5==`string`&&(c$5>=`a`&&c$5<=`z`||c$5>=`A`&&c$5<=`Z`||c$5===`$`||c$5===`_`||unicode.ID_Start.test(c$5))},isIdContinueChar(c$5){return typeof c$5==`string`&&(c$5>=`a`&&c$5<=`z`||c$5>=`A`&&c$5<=`Z`||c$5>=`0`&&c$5<=`9`||c$5===`$`||c$5===`_`||c$5===`‌`||c$5===`‍`||unicode.ID_Continue.test(c$5))},isDigit(c$5){return typeof c$5==`string`&&/[0-9]/.test(c$5)},isHexDigit(c$5){return typeof c$5==`string`&&/[0-9A-Fa-f]/.test(c$5)}},source,parseState,stack,pos,line,column,token$1,key,root,parse$1=function(text,reviver){source=String(text),parseState=`start`,stack=[],pos=0,line=1,column=0,token$1=void 0,key=void 0,root=void 0;do token$1=lex(),parseStates[parseState]();while(token$1.type!==`eof`);return typeof reviver==`function`?internalize({"":root},``,reviver):root};function internalize(holder,name,reviver){let value$1=holder[name];if(typeof value$1==`object`&&value$1)if(Array.isArray(value$1))for(let i$23=0;i$23<value$1.length;i$23++){let key$1=String(i$23),replacement=internalize(value$1,key$1,reviver);replacement===void 0?delete value$1[key$1]:Object.defineProperty(value$1,key$1,{value:replacement,writable:!0,enumerable:!0,configurable:!0})}else for(let key$1 in value$1){let replacement=internalize(value$1,key$1,reviver);replacement===void 0?delete value$1[key$1]:Object.defineProperty(value$1,key$1,{value:replacement,writable:!0,enumerable:!0,configurable:!0})}return reviver.call(holder,name,value$1)}var lexState,buffer,doubleQuote,sign,c$4;function lex(){for(lexState=`default`,buffer=``,doubleQuote=!1,sign=1;;){c$4=peek();let token$2=lexStates[lexState]();if(token$2)return token$2}}function peek(){if(source[pos])return String.fromCodePoint(source.codePointAt(pos))}function read(){let c$5=peek();return c$5===`
-`?(line++,column=0):c$5?column+=c$5.length:column++,c$5&&(pos+=c$5.length),c$5}var lexStates={default(){switch(c$4){case`	`:case`\v`:case`\f`:case` `:case`\xA0`:case`﻿`:case`
-`:case`\r`:case`\u2028`:case`\u2029`:read();return;case`/`:read(),lexState=`comment`;return;case void 0:return read(),newToken(`eof`)}if(util.isSpaceSeparator(c$4)){read();return}return lexStates[parseState]()},comment(){switch(c$4){case`*`:read(),lexState=`multiLineComment`;return;case`/`:read(),lexState=`singleLineComment`;return}throw invalidChar(read())},multiLineComment(){switch(c$4){case`*`:read(),lexState=`multiLineCommentAsterisk`;return;case void 0:throw invalidChar(read())}read()},multiLineCommentAsterisk(){switch(c$4){case`*`:read();return;case`/`:read(),lexState=`default`;return;case void 0:throw invalidChar(read())}read(),lexState=`multiLineComment`},singleLineComment(){switch(c$4){case`
-`:case`\r`:case`\u2028`:case`\u2029`:read(),lexState=`default`;return;case void 0:return read(),newToken(`eof`)}read()},value(){switch(c$4){case`{`:case`[`:return newToken(`punctuator`,read());case`n`:return read(),literal(`ull`),newToken(`null`,null);case`t`:return read(),literal(`rue`),newToken(`boolean`,!0);case`f`:return read(),literal(`alse`),newToken(`boolean`,!1);case`-`:case`+`:read()===`-`&&(sign=-1),lexState=`sign`;return;case`.`:buffer=read(),lexState=`decimalPointLeading`;return;case`0`:buffer=read(),lexState=`zero`;return;case`1`:case`2`:case`3`:case`4`:case`5`:case`6`:case`7`:case`8`:case`9`:buffer=read(),lexState=`decimalInteger`;return;case`I`:return read(),literal(`nfinity`),newToken(`numeric`,1/0);case`N`:return read(),literal(`aN`),newToken(`numeric`,NaN);case`"`:case`'`:doubleQuote=read()===`"`,buffer=``,lexState=`string`;return}throw invalidChar(read())},identifierNameStartEscape(){if(c$4!==`u`)throw invalidChar(read());read();let u$9=unicodeEscape();switch(u$9){case`$`:case`_`:break;default:if(!util.isIdStartChar(u$9))throw invalidIdentifier();break}buffer+=u$9,lexState=`identifierName`},identifierName(){switch(c$4){case`$`:case`_`:case`‌`:case`‍`:buffer+=read();return;case`\\`:read(),lexState=`identifierNameEscape`;return}if(util.isIdContinueChar(c$4)){buffer+=read();return}return newToken(`identifier`,buffer)},identifierNameEscape(){if(c$4!==`u`)throw invalidChar(read());read();let u$9=unicodeEscape();switch(u$9){case`$`:case`_`:case`‌`:case`‍`:break;default:if(!util.isIdContinueChar(u$9))throw invalidIdentifier();break}buffer+=u$9,lexState=`identifierName`},sign(){switch(c$4){case`.`:buffer=read(),lexState=`decimalPointLeading`;return;case`0`:buffer=read(),lexState=`zero`;return;case`1`:case`2`:case`3`:case`4`:case`5`:case`6`:case`7`:case`8`:case`9`:buffer=read(),lexState=`decimalInteger`;return;case`I`:return read(),literal(`nfinity`),newToken(`numeric`,sign*(1/0));case`N`:return read(),literal(`aN`),newToken(`numeric`,NaN)}throw invalidChar(read())},zero(){switch(c$4){case`.`:buffer+=read(),lexState=`decimalPoint`;return;case`e`:case`E`:buffer+=read(),lexState=`decimalExponent`;return;case`x`:case`X`:buffer+=read(),lexState=`hexadecimal`;return}return newToken(`numeric`,sign*0)},decimalInteger(){switch(c$4){case`.`:buffer+=read(),lexState=`decimalPoint`;return;case`e`:case`E`:buffer+=read(),lexState=`decimalExponent`;return}if(util.isDigit(c$4)){buffer+=read();return}return newToken(`numeric`,sign*Number(buffer))},decimalPointLeading(){if(util.isDigit(c$4)){buffer+=read(),lexState=`decimalFraction`;return}throw invalidChar(read())},decimalPoint(){switch(c$4){case`e`:case`E`:buffer+=read(),lexState=`decimalExponent`;return}if(util.isDigit(c$4)){buffer+=read(),lexState=`decimalFraction`;return}return newToken(`numeric`,sign*Number(buffer))},decimalFraction(){switch(c$4){case`e`:case`E`:buffer+=read(),lexState=`decimalExponent`;return}if(util.isDigit(c$4)){buffer+=read();return}return newToken(`numeric`,sign*Number(buffer))},decimalExponent(){switch(c$4){case`+`:case`-`:buffer+=read(),lexState=`decimalExponentSign`;return}if(util.isDigit(c$4)){buffer+=read(),lexState=`decimalExponentInteger`;return}throw invalidChar(read())},decimalExponentSign(){if(util.isDigit(c$4)){buffer+=read(),lexState=`decimalExponentInteger`;return}throw invalidChar(read())},decimalExponentInteger(){if(util.isDigit(c$4)){buffer+=read();return}return newToken(`numeric`,sign*Number(buffer))},hexadecimal(){if(util.isHexDigit(c$4)){buffer+=read(),lexState=`hexadecimalInteger`;return}throw invalidChar(read())},hexadecimalInteger(){if(util.isHexDigit(c$4)){buffer+=read();return}return newToken(`numeric`,sign*Number(buffer))},string(){switch(c$4){case`\\`:read(),buffer+=escape();return;case`"`:if(doubleQuote)return read(),newToken(`string`,buffer);buffer+=read();return;case`'`:if(!doubleQuote)return read(),newToken(`string`,buffer);buffer+=read();return;case`
-`:case`\r`:throw invalidChar(read());case`\u2028`:case`\u2029`:separatorChar(c$4);break;case void 0:throw invalidChar(read())}buffer+=read()},start(){switch(c$4){case`{`:case`[`:return newToken(`punctuator`,read())}lexState=`value`},beforePropertyName(){switch(c$4){case`$`:case`_`:buffer=read(),lexState=`identifierName`;return;case`\\`:read(),lexState=`identifierNameStartEscape`;return;case`}`:return newToken(`punctuator`,read());case`"`:case`'`:doubleQuote=read()===`"`,lexState=`string`;return}if(util.isIdStartChar(c$4)){buffer+=read(),lexState=`identifierName`;return}throw invalidChar(read())},afterPropertyName(){if(c$4===`:`)return newToken(`punctuator`,read());throw invalidChar(read())},beforePropertyValue(){lexState=`value`},afterPropertyValue(){switch(c$4){case`,`:case`}`:return newToken(`punctuator`,read())}throw invalidChar(read())},beforeArrayValue(){if(c$4===`]`)return newToken(`punctuator`,read());lexState=`value`},afterArrayValue(){switch(c$4){case`,`:case`]`:return newToken(`punctuator`,read())}throw invalidChar(read())},end(){throw invalidChar(read())}};function newToken(type,value$1){return{type,value:value$1,line,column}}function literal(s$23){for(let c$5 of s$23){if(peek()!==c$5)throw invalidChar(read());read()}}function escape(){switch(peek()){case`b`:return read(),`\b`;case`f`:return read(),`\f`;case`n`:return read(),`
-`;case`r`:return read(),`\r`;case`t`:return read(),`	`;case`v`:return read(),`\v`;case`0`:if(read(),util.isDigit(peek()))throw invalidChar(read());return`\0`;case`x`:return read(),hexEscape();case`u`:return read(),unicodeEscape();case`
-`:case`\u2028`:case`\u2029`:return read(),``;case`\r`:return read(),peek()===`
-`&&read(),``;case`1`:case`2`:case`3`:case`4`:case`5`:case`6`:case`7`:case`8`:case`9`:throw invalidChar(read());case void 0:throw invalidChar(read())}return read()}function hexEscape(){let buffer$1=``,c$5=peek();if(!util.isHexDigit(c$5)||(buffer$1+=read(),c$5=peek(),!util.isHexDigit(c$5)))throw invalidChar(read());return buffer$1+=read(),String.fromCodePoint(parseInt(buffer$1,16))}function unicodeEscape(){let buffer$1=``,count$2=4;for(;count$2-- >0;){let c$5=peek();if(!util.isHexDigit(c$5))throw invalidChar(read());buffer$1+=read()}return String.fromCodePoint(parseInt(buffer$1,16))}var parseStates={start(){if(token$1.type===`eof`)throw invalidEOF();push()},beforePropertyName(){switch(token$1.type){case`identifier`:case`string`:key=token$1.value,parseState=`afterPropertyName`;return;case`punctuator`:pop();return;case`eof`:throw invalidEOF()}},afterPropertyName(){if(token$1.type===`eof`)throw invalidEOF();parseState=`beforePropertyValue`},beforePropertyValue(){if(token$1.type===`eof`)throw invalidEOF();push()},beforeArrayValue(){if(token$1.type===`eof`)throw invalidEOF();if(token$1.type===`punctuator`&&token$1.value===`]`){pop();return}push()},afterPropertyValue(){if(token$1.type===`eof`)throw invalidEOF();switch(token$1.value){case`,`:parseState=`beforePropertyName`;return;case`}`:pop()}},afterArrayValue(){if(token$1.type===`eof`)throw invalidEOF();switch(token$1.value){case`,`:parseState=`beforeArrayValue`;return;case`]`:pop()}},end(){}};function push(){let value$1;switch(token$1.type){case`punctuator`:switch(token$1.value){case`{`:value$1={};break;case`[`:value$1=[];break}break;case`null`:case`boolean`:case`numeric`:case`string`:value$1=token$1.value;break}if(root===void 0)root=value$1;else{let parent=stack[stack.length-1];Array.isArray(parent)?parent.push(value$1):Object.defineProperty(parent,key,{value:value$1,writable:!0,enumerable:!0,configurable:!0})}if(typeof value$1==`object`&&value$1)stack.push(value$1),parseState=Array.isArray(value$1)?`beforeArrayValue`:`beforePropertyName`;else{let current=stack[stack.length-1];parseState=current==null?`end`:Array.isArray(current)?`afterArrayValue`:`afterPropertyValue`}}function pop(){stack.pop();let current=stack[stack.length-1];parseState=current==null?`end`:Array.isArray(current)?`afterArrayValue`:`afterPropertyValue`}function invalidChar(c$5){return syntaxError(c$5===void 0?`JSON5: invalid end of input at ${line}:${column}`:`JSON5: invalid character '${formatChar(c$5)}' at ${line}:${column}`)}function invalidEOF(){return syntaxError(`JSON5: invalid end of input at ${line}:${column}`)}function invalidIdentifier(){return column-=5,syntaxError(`JSON5: invalid identifier character at ${line}:${column}`)}function separatorChar(c$5){console.warn(`JSON5: '${formatChar(c$5)}' in strings is not valid ECMAScript; consider escaping`)}function formatChar(c$5){let replacements={"'":`\\'`,'"':`\\"`,"\\":`\\\\`,"\b":`\\b`,"\f":`\\f`,"\n":`\\n`,"\r":`\\r`,"	":`\\t`,"\v":`\\v`,"\0":`\\0`,"\u2028":`\\u2028`,"\u2029":`\\u2029`};if(replacements[c$5])return replacements[c$5];if(c$5<` `){let hexString=c$5.charCodeAt(0).toString(16);return`\\x`+(`00`+hexString).substring(hexString.length)}return c$5}function syntaxError(message){let err=SyntaxError(message);return err.lineNumber=line,err.columnNumber=column,err}var dist_default={parse:parse$1,stringify:function(value$1,replacer,space){let stack$1=[],indent=``,propertyList,replacerFunc,gap=``,quote;if(typeof replacer==`object`&&replacer&&!Array.isArray(replacer)&&(space=replacer.space,quote=replacer.quote,replacer=replacer.replacer),typeof replacer==`function`)replacerFunc=replacer;else if(Array.isArray(replacer)){propertyList=[];for(let v$10 of replacer){let item;typeof v$10==`string`?item=v$10:(typeof v$10==`number`||v$10 instanceof String||v$10 instanceof Number)&&(item=String(v$10)),item!==void 0&&propertyList.indexOf(item)<0&&propertyList.push(item)}}return space instanceof Number?space=Number(space):space instanceof String&&(space=String(space)),typeof space==`number`?space>0&&(space=Math.min(10,Math.floor(space)),gap=`          `.substr(0,space)):typeof space==`string`&&(gap=space.substr(0,10)),serializeProperty(``,{"":value$1});function serializeProperty(key$1,holder){let value$2=holder[key$1];switch(value$2!=null&&(typeof value$2.toJSON5==`function`?value$2=value$2.toJSON5(key$1):typeof value$2.toJSON==`function`&&(value$2=value$2.toJSON(key$1))),replacerFunc&&(value$2=replacerFunc.call(holder,key$1,value$2)),value$2 instanceof Number?value$2=Number(value$2):value$2 instanceof String?value$2=String(value$2):value$2 instanceof Boolean&&(value$2=value$2.valueOf()),value$2){case null:return`null`;case!0:return`true`;case!1:return`false`}if(typeof value$2==`string`)return quoteString(value$2,!1);if(typeof value$2==`number`)return String(value$2);if(typeof value$2==`object`)return Array.isArray(value$2)?serializeArray(value$2):serializeObject(value$2)}function quoteString(value$2){let quotes={"'":.1,'"':.2},replacements={"'":`\\'`,'"':`\\"`,"\\":`\\\\`,"\b":`\\b`,"\f":`\\f`,"\n":`\\n`,"\r":`\\r`,"	":`\\t`,"\v":`\\v`,"\0":`\\0`,"\u2028":`\\u2028`,"\u2029":`\\u2029`},product=``;for(let i$23=0;i$23<value$2.length;i$23++){let c$5=value$2[i$23];switch(c$5){case`'`:case`"`:quotes[c$5]++,product+=c$5;continue;case`\0`:if(util.isDigit(value$2[i$23+1])){product+=`\\x00`;continue}}if(replacements[c$5]){product+=replacements[c$5];continue}if(c$5<` `){let hexString=c$5.charCodeAt(0).toString(16);product+=`\\x`+(`00`+hexString).substring(hexString.length);continue}product+=c$5}let quoteChar=quote||Object.keys(quotes).reduce((a$37,b$5)=>quotes[a$37]<quotes[b$5]?a$37:b$5);return product=product.replace(new RegExp(quoteChar,`g`),replacements[quoteChar]),quoteChar+product+quoteChar}function serializeObject(value$2){if(stack$1.indexOf(value$2)>=0)throw TypeError(`Converting circular structure to JSON5`);stack$1.push(value$2);let stepback=indent;indent+=gap;let keys=propertyList||Object.keys(value$2),partial=[];for(let key$1 of keys){let propertyString=serializeProperty(key$1,value$2);if(propertyString!==void 0){let member=serializeKey(key$1)+`:`;gap!==``&&(member+=` `),member+=propertyString,partial.push(member)}}let final;if(partial.length===0)final=`{}`;else{let properties;if(gap===``)properties=partial.join(`,`),final=`{`+properties+`}`;else{let separator=`,
-`+indent;properties=partial.join(separator),final=`{
-`+indent+properties+`,
-`+stepback+`}`}}return stack$1.pop(),indent=stepback,final}function serializeKey(key$1){if(key$1.length===0)return quoteString(key$1,!0);let firstChar=String.fromCodePoint(key$1.codePointAt(0));if(!util.isIdStartChar(firstChar))return quoteString(key$1,!0);for(let i$23=firstChar.length;i$23<key$1.length;i$23++)if(!util.isIdContinueChar(String.fromCodePoint(key$1.codePointAt(i$23))))return quoteString(key$1,!0);return key$1}function serializeArray(value$2){if(stack$1.indexOf(value$2)>=0)throw TypeError(`Converting circular structure to JSON5`);stack$1.push(value$2);let stepback=indent;indent+=gap;let partial=[];for(let i$23=0;i$23<value$2.length;i$23++){let propertyString=serializeProperty(String(i$23),value$2);partial.push(propertyString===void 0?`null`:propertyString)}let final;if(partial.length===0)final=`[]`;else if(gap===``)final=`[`+partial.join(`,`)+`]`;else{let separator=`,
-`+indent,properties=partial.join(separator);final=`[
-`+indent+properties+`,
-`+stepback+`]`}return stack$1.pop(),indent=stepback,final}}};const version=`0.8.14.post1`,project_hash=29475602386964906e22,last_reflex_run_datetime=`2025-10-29 20:15:19.781523`;var reflex_default={version:`0.8.14.post1`,project_hash:29475602386964906e22,last_reflex_run_datetime:`2025-10-29 20:15:19.781523`},cookie={},hasRequiredCookie;function requireCookie(){if(hasRequiredCookie)return cookie;hasRequiredCookie=1,cookie.parse=parse$3,cookie.serialize=serialize;var __toString=Object.prototype.toString,__hasOwnProperty=Object.prototype.hasOwnProperty,cookieNameRegExp=/^[!#$%&'*+\-.^_`|~0-9A-Za-z]+$/,cookieValueRegExp=/^("?)[\u0021\u0023-\u002B\u002D-\u003A\u003C-\u005B\u005D-\u007E]*\1$/,domainValueRegExp=/^([.]?[a-z0-9]([a-z0-9-]{0,61}[a-z0-9])?)([.][a-z0-9]([a-z0-9-]{0,61}[a-z0-9])?)*$/i,pathValueRegExp=/^[\u0020-\u003A\u003D-\u007E]*$/;function parse$3(str,opt){if(typeof str!=`string`)throw TypeError(`argument str must be a string`);var obj={},len=str.length;if(len<2)return obj;var dec=opt&&opt.decode||decode$2,index$1=0,eqIdx=0,endIdx=0;do{if(eqIdx=str.indexOf(`=`,index$1),eqIdx===-1)break;if(endIdx=str.indexOf(`;`,index$1),endIdx===-1)endIdx=len;else if(eqIdx>endIdx){index$1=str.lastIndexOf(`;`,eqIdx-1)+1;continue}var keyStartIdx=startIndex(str,index$1,eqIdx),keyEndIdx=endIndex(str,eqIdx,keyStartIdx),key$1=str.slice(keyStartIdx,keyEndIdx);if(!__hasOwnProperty.call(obj,key$1)){var valStartIdx=startIndex(str,eqIdx+1,endIdx),valEndIdx=endIndex(str,endIdx,valStartIdx);str.charCodeAt(valStartIdx)===34&&str.charCodeAt(valEndIdx-1)===34&&(valStartIdx++,valEndIdx--);var val=str.slice(valStartIdx,valEndIdx);obj[key$1]=tryDecode(val,dec)}index$1=endIdx+1}while(index$1<len);return obj}function startIndex(str,index$1,max$1){do{var code=str.charCodeAt(index$1);if(code!==32&&code!==9)return index$1}while(++index$1<max$1);return max$1}function endIndex(str,index$1,min$1){for(;index$1>min$1;){var code=str.charCodeAt(--index$1);if(code!==32&&code!==9)return index$1+1}return min$1}function serialize(name,val,opt){var enc=opt&&opt.encode||encodeURIComponent;if(typeof enc!=`function`)throw TypeError(`option encode is invalid`);if(!cookieNameRegExp.test(name))throw TypeError(`argument name is invalid`);var value$1=enc(val);if(!cookieValueRegExp.test(value$1))throw TypeError(`argument val is invalid`);var str=name+`=`+value$1;if(!opt)return str;if(opt.maxAge!=null){var maxAge=Math.floor(opt.maxAge);if(!isFinite(maxAge))throw TypeError(`option maxAge is invalid`);str+=`; Max-Age=`+maxAge}if(opt.domain){if(!domainValueRegExp.test(opt.domain))throw TypeError(`option domain is invalid`);str+=`; Domain=`+opt.domain}if(opt.path){if(!pathValueRegExp.test(opt.path))throw TypeError(`option path is invalid`);str+=`; Path=`+opt.path}if(opt.expires){var expires=opt.expires;if(!isDate(expires)||isNaN(expires.valueOf()))throw TypeError(`option expires is invalid`);str+=`; Expires=`+expires.toUTCString()}if(opt.httpOnly&&(str+=`; HttpOnly`),opt.secure&&(str+=`; Secure`),opt.partitioned&&(str+=`; Partitioned`),opt.priority)switch(typeof opt.priority==`string`?opt.priority.toLowerCase():opt.priority){case`low`:str+=`; Priority=Low`;break;case`medium`:str+=`; Priority=Medium`;break;case`high`:str+=`; Priority=High`;break;default:throw TypeError(`option priority is invalid`)}if(opt.sameSite)switch(typeof opt.sameSite==`string`?opt.sameSite.toLowerCase():opt.sameSite){case!0:str+=`; SameSite=Strict`;break;case`lax`:str+=`; SameSite=Lax`;break;case`strict`:str+=`; SameSite=Strict`;break;case`none`:str+=`; SameSite=None`;break;default:throw TypeError(`option sameSite is invalid`)}return str}function decode$2(str){return str.indexOf(`%`)===-1?str:decodeURIComponent(str)}function isDate(val){return __toString.call(val)===`[object Date]`}function tryDecode(str,decode$3){try{return decode$3(str)}catch{return str}}return cookie}var cookieExports=requireCookie();function hasDocumentCookie(){let testingValue=typeof global>`u`?void 0:global.TEST_HAS_DOCUMENT_COOKIE;return typeof testingValue==`boolean`?testingValue:typeof document==`object`&&typeof document.cookie==`string`}function parseCookies(cookies$1){return typeof cookies$1==`string`?cookieExports.parse(cookies$1):typeof cookies$1==`object`&&cookies$1?cookies$1:{}}function readCookie(value$1,options$1={}){let cleanValue=cleanupCookieValue(value$1);if(!options$1.doNotParse)try{return JSON.parse(cleanValue)}catch{}return value$1}function cleanupCookieValue(value$1){return value$1&&value$1[0]===`j`&&value$1[1]===`:`?value$1.substr(2):value$1}var Cookies=class{constructor(cookies$1,defaultSetOptions={}){this.changeListeners=[],this.HAS_DOCUMENT_COOKIE=!1,this.update=()=>{if(!this.HAS_DOCUMENT_COOKIE)return;let previousCookies=this.cookies;this.cookies=cookieExports.parse(document.cookie),this._checkChanges(previousCookies)};let domCookies=typeof document>`u`?``:document.cookie;this.cookies=parseCookies(cookies$1||domCookies),this.defaultSetOptions=defaultSetOptions,this.HAS_DOCUMENT_COOKIE=hasDocumentCookie()}_emitChange(params){for(let i$23=0;i$23<this.changeListeners.length;++i$23)this.changeListeners[i$23](params)}_checkChanges(previousCookies){new Set(Object.keys(previousCookies).concat(Object.keys(this.cookies))).forEach(name=>{previousCookies[name]!==this.cookies[name]&&this._emitChange({name,value:readCookie(this.cookies[name])})})}_startPolling(){this.pollingInterval=setInterval(this.update,300)}_stopPolling(){this.pollingInterval&&clearInterval(this.pollingInterval)}get(name,options$1={}){return options$1.doNotUpdate||this.update(),readCookie(this.cookies[name],options$1)}getAll(options$1={}){options$1.doNotUpdate||this.update();let result={};for(let name in this.cookies)result[name]=readCookie(this.cookies[name],options$1);return result}set(name,value$1,options$1){options$1=options$1?Object.assign(Object.assign({},this.defaultSetOptions),options$1):this.defaultSetOptions;let stringValue=typeof value$1==`string`?value$1:JSON.stringify(value$1);this.cookies=Object.assign(Object.assign({},this.cookies),{[name]:stringValue}),this.HAS_DOCUMENT_COOKIE&&(document.cookie=cookieExports.serialize(name,stringValue,options$1)),this._emitChange({name,value:value$1,options:options$1})}remove(name,options$1){let finalOptions=options$1=Object.assign(Object.assign(Object.assign({},this.defaultSetOptions),options$1),{expires:new Date(1970,1,1,0,0,1),maxAge:0});this.cookies=Object.assign({},this.cookies),delete this.cookies[name],this.HAS_DOCUMENT_COOKIE&&(document.cookie=cookieExports.serialize(name,``,finalOptions)),this._emitChange({name,value:void 0,options:options$1})}addChangeListener(callback){this.changeListeners.push(callback),this.HAS_DOCUMENT_COOKIE&&this.changeListeners.length===1&&(typeof window==`object`&&`cookieStore`in window?window.cookieStore.addEventListener(`change`,this.update):this._startPolling())}removeChangeListener(callback){let idx=this.changeListeners.indexOf(callback);idx>=0&&this.changeListeners.splice(idx,1),this.HAS_DOCUMENT_COOKIE&&this.changeListeners.length===0&&(typeof window==`object`&&`cookieStore`in window?window.cookieStore.removeEventListener(`change`,this.update):this._stopPolling())}},debounce_timeout_id={};function debounce(name,func,delay){let key$1=`${name}__${delay}`;clearTimeout(debounce_timeout_id[key$1]),debounce_timeout_id[key$1]=setTimeout(()=>{func(),delete debounce_timeout_id[key$1]},delay)}var in_throttle={};function throttle(name,limit){let key$1=`${name}__${limit}`;return in_throttle[key$1]?!1:(in_throttle[key$1]=!0,setTimeout(()=>{delete in_throttle[key$1]},limit),!0)}const uploadFiles=async(handler,files,upload_id,on_upload_progress,extra_headers,socket,refs$1,getBackendURL$1,getToken$1)=>{if(files===void 0||files.length===0)return!1;let upload_ref_name=`__upload_controllers_${upload_id}`;if(refs$1[upload_ref_name])return console.log(`Upload already in progress for `,upload_id),!1;let resp_idx=0,eventHandler=progressEvent=>{let event_callbacks=socket._callbacks.$event;progressEvent.event.target.responseText.trim().split(`
-`).slice(resp_idx).map(chunk_json=>{try{let chunk=dist_default.parse(chunk_json);event_callbacks.map((f$20,ix)=>{f$20(chunk).then(()=>{ix===event_callbacks.length-1&&(resp_idx+=1)}).catch(e$31=>{progressEvent.progress===1&&console.log(`Error processing chunk`,chunk,e$31)})})}catch(e$31){progressEvent.progress===1&&console.log(`Error parsing chunk`,chunk_json,e$31);return}})},controller=new AbortController,formdata=new FormData;return files.forEach(file=>{formdata.append(`files`,file,file.path||file.name)}),refs$1[upload_ref_name]=controller,new Promise((resolve,reject)=>{let xhr=new XMLHttpRequest;xhr.onload=function(){xhr.status>=200&&xhr.status<300?resolve({data:xhr.responseText,status:xhr.status,statusText:xhr.statusText,headers:{get:name=>xhr.getResponseHeader(name)}}):reject(Error(`HTTP error! status: ${xhr.status}`))},xhr.onerror=function(){reject(Error(`Network error`))},xhr.onabort=function(){reject(Error(`Upload aborted`))},on_upload_progress&&(xhr.upload.onprogress=function(event){if(event.lengthComputable){let progressEvent={loaded:event.loaded,total:event.total,progress:event.loaded/event.total};on_upload_progress(progressEvent)}}),xhr.onprogress=function(event){if(eventHandler){let progressEvent={event:{target:{responseText:xhr.responseText}},progress:event.lengthComputable?event.loaded/event.total:0};eventHandler(progressEvent)}},controller.signal.addEventListener(`abort`,()=>{xhr.abort()}),xhr.open(`POST`,getBackendURL$1(env_default.UPLOAD)),xhr.setRequestHeader(`Reflex-Client-Token`,getToken$1()),xhr.setRequestHeader(`Reflex-Event-Handler`,handler);for(let[key$1,value$1]of Object.entries(extra_headers||{}))xhr.setRequestHeader(key$1,value$1);try{xhr.send(formdata)}catch(error){reject(error)}}).catch(error=>(console.log(`Upload error:`,error.message),!1)).finally(()=>{delete refs$1[upload_ref_name]})};var state_exports=__export({ReflexEvent:()=>ReflexEvent,applyDelta:()=>applyDelta,applyEvent:()=>applyEvent,applyRestEvent:()=>applyRestEvent,connect:()=>connect,evalReactComponent:()=>evalReactComponent,generateUUID:()=>generateUUID,getBackendURL:()=>getBackendURL,getRefValue:()=>getRefValue,getRefValues:()=>getRefValues,getToken:()=>getToken,hydrateClientStorage:()=>hydrateClientStorage,isBackendDisabled:()=>isBackendDisabled,isNotNullOrUndefined:()=>isNotNullOrUndefined,isStateful:()=>isStateful,isTrue:()=>isTrue,processEvent:()=>processEvent,queueEventIfSocketExists:()=>queueEventIfSocketExists,queueEvents:()=>queueEvents,refs:()=>refs,spreadArraysOrObjects:()=>spreadArraysOrObjects,useEventLoop:()=>useEventLoop}),import_react=__toESM(require_react()),EVENTURL=env_default.EVENT,SAME_DOMAIN_HOSTNAMES=[`localhost`,`0.0.0.0`,`::`,`0:0:0:0:0:0:0:0`],token,TOKEN_KEY=`token`,cookies=new Cookies;const refs={};var event_processing=!1,event_queue=[];const generateUUID=()=>{let d$9=new Date().getTime(),d2=performance&&performance.now&&performance.now()*1e3||0;return`xxxxxxxx-xxxx-4xxx-yxxx-xxxxxxxxxxxx`.replace(/[xy]/g,c$5=>{let r$38=Math.random()*16;return d$9>0?(r$38=(d$9+r$38)%16|0,d$9=Math.floor(d$9/16)):(r$38=(d2+r$38)%16|0,d2=Math.floor(d2/16)),(c$5==`x`?r$38:r$38&7|8).toString(16)})},getToken=()=>token||(typeof window<`u`&&(window.sessionStorage.getItem(TOKEN_KEY)||window.sessionStorage.setItem(TOKEN_KEY,generateUUID()),token=window.sessionStorage.getItem(TOKEN_KEY)),token),getBackendURL=url_str=>{let endpoint=new URL(url_str);return typeof window<`u`&&SAME_DOMAIN_HOSTNAMES.includes(endpoint.hostname)&&(endpoint.hostname=window.location.hostname,window.location.protocol===`https:`&&(endpoint.protocol===`ws:`?endpoint.protocol=`wss:`:endpoint.protocol===`http:`&&(endpoint.protocol=`https:`),endpoint.port=``)),endpoint},isBackendDisabled=()=>{let cookie$1=document.cookie.split(`; `).find(row=>row.startsWith(`backend-enabled=`));return cookie$1!==void 0&&cookie$1.split(`=`)[1]==`false`},isStateful=()=>event_queue.length===0?!1:event_queue.some(event=>event.name.startsWith(`reflex___state`)),applyDelta=(state,delta)=>({...state,...delta}),evalReactComponent=async component=>{!window.React&&window.__reflex&&(window.React=window.__reflex.react);let dataUri=`data:text/javascript;charset=utf-8,`+encodeURIComponent(component);return(await eval(`import(dataUri)`)).default},queueEventIfSocketExists=async(events,socket,navigate,params)=>{socket&&await queueEvents(events,socket,navigate,params)};function urlFrom(string){try{return new URL(string)}catch{return}}const applyEvent=async(event,socket,navigate,params)=>{if(event.name==`_redirect`){if((event.payload.path??void 0)===void 0)return!1;if(event.payload.external)return window.open(event.payload.path,`_blank`,`noopener`+(event.payload.popup?`,popup`:``)),!1;let url$1=urlFrom(event.payload.path),pathname=event.payload.path;if(url$1){if(url$1.host!==window.location.host)return window.location.assign(event.payload.path),!1;pathname=url$1.pathname+url$1.search+url$1.hash}return event.payload.replace?navigate(pathname,{replace:!0}):navigate(pathname),!1}if(event.name==`_remove_cookie`)return cookies.remove(event.payload.key,{...event.payload.options}),queueEventIfSocketExists(initialEvents(),socket,navigate,params),!1;if(event.name==`_clear_local_storage`)return localStorage.clear(),queueEventIfSocketExists(initialEvents(),socket,navigate,params),!1;if(event.name==`_remove_local_storage`)return localStorage.removeItem(event.payload.key),queueEventIfSocketExists(initialEvents(),socket,navigate,params),!1;if(event.name==`_clear_session_storage`)return sessionStorage.clear(),queueEvents(initialEvents(),socket,navigate,params),!1;if(event.name==`_remove_session_storage`)return sessionStorage.removeItem(event.payload.key),queueEvents(initialEvents(),socket,navigate,params),!1;if(event.name==`_download`){let a$37=document.createElement(`a`);return a$37.hidden=!0,a$37.href=event.payload.url,a$37.href.includes(`getBackendURL(env.UPLOAD)`)&&(a$37.href=eval?.(event.payload.url.replace(`getBackendURL(env.UPLOAD)`,`"${getBackendURL(env_default.UPLOAD)}"`))),a$37.download=event.payload.filename,a$37.click(),a$37.remove(),!1}if(event.name==`_set_focus`){let current=(event.payload.ref in refs?refs[event.payload.ref]:event.payload.ref)?.current;return current===void 0||current?.focus===void 0?console.error(`No element found for ref ${event.payload.ref} in _set_focus`):current.focus(),!1}if(event.name==`_blur_focus`){let current=(event.payload.ref in refs?refs[event.payload.ref]:event.payload.ref)?.current;return current===void 0||current?.blur===void 0?console.error(`No element found for ref ${event.payload.ref} in _blur_focus`):current.blur(),!1}if(event.name==`_set_value`){let ref=event.payload.ref in refs?refs[event.payload.ref]:event.payload.ref;return ref.current&&(ref.current.value=event.payload.value),!1}if(event.name==`_call_function`&&typeof event.payload.function!=`string`){try{let eval_result=event.payload.function();if(event.payload.callback){let final_result=eval_result&&typeof eval_result.then==`function`?await eval_result:eval_result;(typeof event.payload.callback==`string`?eval(event.payload.callback):event.payload.callback)(final_result)}}catch(e$31){console.log(`_call_function`,e$31),window&&window?.onerror&&window.onerror(e$31.message,null,null,null,e$31)}return!1}if(event.name==`_call_script`||event.name==`_call_function`){try{let eval_result=event.name==`_call_script`?eval(event.payload.javascript_code):eval(event.payload.function)();if(event.payload.callback){let final_result=eval_result&&typeof eval_result.then==`function`?await eval_result:eval_result;(typeof event.payload.callback==`string`?eval(event.payload.callback):event.payload.callback)(final_result)}}catch(e$31){console.log(`_call_script`,e$31),window&&window?.onerror&&window.onerror(e$31.message,null,null,null,e$31)}return!1}return event.token=getToken(),(event.router_data===void 0||Object.keys(event.router_data).length===0)&&(event.router_data={pathname:window.location.pathname,query:{...Object.fromEntries(new URLSearchParams(window.location.search)),...params()},asPath:window.location.pathname+window.location.search+window.location.hash}),socket?(socket.emit(`event`,event),!0):!1},applyRestEvent=async(event,socket,navigate,params)=>{let eventSent=!1;return event.handler===`uploadFiles`?event.payload.files===void 0||event.payload.files.length===0?await applyEvent(ReflexEvent(event.name,{files:[]}),socket,navigate,params):(uploadFiles(event.name,event.payload.files,event.payload.upload_id,event.payload.on_upload_progress,event.payload.extra_headers,socket,refs,getBackendURL,getToken),!1):!1},queueEvents=async(events,socket,prepend,navigate,params)=>{prepend&&(events=[...events,...Array.from({length:event_queue.length}).map(()=>event_queue.shift())]),event_queue.push(...events.filter(e$31=>e$31!=null)),await processEvent(socket.current,navigate,params)},processEvent=async(socket,navigate,params)=>{if(isStateful()&&!(socket&&socket.connected)||event_queue.length===0||event_processing)return;event_processing=!0;let event=event_queue.shift(),eventSent=!1;eventSent=event.handler?await applyRestEvent(event,socket,navigate,params):await applyEvent(event,socket,navigate,params),eventSent||(event_processing=!1,await processEvent(socket,navigate,params))},connect=async(socket,dispatch,transports$1,setConnectErrors,client_storage={},navigate,params)=>{let endpoint=getBackendURL(EVENTURL),on_hydrated_queue=[];socket.current=lookup(endpoint.href,{path:endpoint.pathname,transports:transports$1,protocols:[reflex_default.version],autoUnref:!1,query:{token:getToken()}}),socket.current.io.encoder.replacer=(k$2,v$10)=>v$10===void 0?null:v$10,socket.current.io.decoder.tryParse=str=>{try{return dist_default.parse(str)}catch{return!1}};function checkVisibility(){document.visibilityState===`visible`&&(socket.current?socket.current.connected?console.log(`Socket is reconnected `):(console.log(`Socket is disconnected, attempting to reconnect `),socket.current.connect()):connect(socket,dispatch,transports$1,setConnectErrors,client_storage,navigate,params))}let disconnectTrigger=event=>{socket.current?.connected&&(console.log(`Disconnect websocket on unload`),socket.current.disconnect())},pagehideHandler=event=>{event.persisted&&socket.current?.connected&&(console.log(`Disconnect backend before bfcache on navigation`),socket.current.disconnect())};socket.current.on(`connect`,async()=>{for(setConnectErrors([]),window.addEventListener(`pagehide`,pagehideHandler),window.addEventListener(`beforeunload`,disconnectTrigger),window.addEventListener(`unload`,disconnectTrigger);event_queue.length>0&&!event_processing;)await processEvent(socket.current,navigate,()=>params.current)}),socket.current.on(`connect_error`,error=>{setConnectErrors(connectErrors=>[connectErrors.slice(-9),error])}),socket.current.on(`disconnect`,()=>{socket.current=null,event_processing=!1,window.removeEventListener(`unload`,disconnectTrigger),window.removeEventListener(`beforeunload`,disconnectTrigger),window.removeEventListener(`pagehide`,pagehideHandler)}),socket.current.on(`event`,async update=>{for(let substate in update.delta)dispatch[substate](update.delta[substate]),substate===`reflex___state____state`&&update.delta[substate]?.is_hydrated_rx_state_&&(queueEvents(on_hydrated_queue,socket,!1,navigate,params),on_hydrated_queue.length=0);applyClientStorageDelta(client_storage,update.delta),event_processing=!update.final,update.events&&queueEvents(update.events,socket,!1,navigate,params)}),socket.current.on(`reload`,async event=>{event_processing=!1,on_hydrated_queue.push(event),queueEvents(initialEvents(),socket,!0,navigate,params)}),socket.current.on(`new_token`,async new_token=>{token=new_token,window.sessionStorage.setItem(TOKEN_KEY,new_token)}),document.addEventListener(`visibilitychange`,checkVisibility)},ReflexEvent=(name,payload={},event_actions={},handler=null)=>({name,payload,handler,event_actions}),hydrateClientStorage=client_storage=>{let client_storage_values={};if(client_storage.cookies)for(let state_key in client_storage.cookies){let cookie_name=client_storage.cookies[state_key].name||state_key,cookie_value=cookies.get(cookie_name,{doNotParse:!0});cookie_value!==void 0&&(client_storage_values[state_key]=cookie_value)}if(client_storage.local_storage&&typeof window<`u`)for(let state_key in client_storage.local_storage){let options$1=client_storage.local_storage[state_key],local_storage_value=localStorage.getItem(options$1.name||state_key);local_storage_value!==null&&(client_storage_values[state_key]=local_storage_value)}if(client_storage.session_storage&&typeof window<`u`)for(let state_key in client_storage.session_storage){let session_options=client_storage.session_storage[state_key],session_storage_value=sessionStorage.getItem(session_options.name||state_key);session_storage_value!=null&&(client_storage_values[state_key]=session_storage_value)}return client_storage.cookies||client_storage.local_storage||client_storage.session_storage?client_storage_values:{}};var applyClientStorageDelta=(client_storage,delta)=>{let unqualified_states=Object.keys(delta).filter(key$1=>key$1.split(`.`).length===1);if(unqualified_states.length===1){let main_state=delta[unqualified_states[0]];if(main_state.is_hydrated_rx_state_!==void 0&&!main_state.is_hydrated_rx_state_)return}for(let substate in delta)for(let key$1 in delta[substate]){let state_key=`${substate}.${key$1}`;if(client_storage.cookies&&state_key in client_storage.cookies){let cookie_options={...client_storage.cookies[state_key]},cookie_name=cookie_options.name||state_key;delete cookie_options.name,cookies.set(cookie_name,delta[substate][key$1],cookie_options)}else if(client_storage.local_storage&&state_key in client_storage.local_storage&&typeof window<`u`){let options$1=client_storage.local_storage[state_key];localStorage.setItem(options$1.name||state_key,delta[substate][key$1])}else if(client_storage.session_storage&&state_key in client_storage.session_storage&&typeof window<`u`){let session_options=client_storage.session_storage[state_key];sessionStorage.setItem(session_options.name||state_key,delta[substate][key$1])}}};const useEventLoop=(dispatch,initial_events=()=>[],client_storage={})=>{let socket=(0,import_react.useRef)(null),location$1=useLocation(),navigate=useNavigate(),paramsR=useParams(),prevLocationRef=(0,import_react.useRef)(location$1),[searchParams]=useSearchParams(),[connectErrors,setConnectErrors]=(0,import_react.useState)([]),params=(0,import_react.useRef)(paramsR);(0,import_react.useEffect)(()=>{let{"*":splat,...remainingParams}=paramsR;splat?params.current={...remainingParams,splat:splat.split(`/`)}:params.current=remainingParams},[paramsR]);let ensureSocketConnected=(0,import_react.useCallback)(async()=>{Object.keys(initialState).length>1&&!isBackendDisabled()&&!socket.current&&await connect(socket,dispatch,[`websocket`],setConnectErrors,client_storage,navigate,()=>params.current)},[socket,dispatch,setConnectErrors,client_storage,navigate,params]),addEvents=(0,import_react.useCallback)((events,args,event_actions)=>{let _events=events.filter(e$31=>e$31!=null);ensureSocketConnected(),args instanceof Array||(args=[args]),event_actions=_events.reduce((acc,e$31)=>({...acc,...e$31.event_actions}),event_actions??{});let _e=args.filter(o$28=>o$28?.preventDefault!==void 0)[0];event_actions?.preventDefault&&_e?.preventDefault&&_e.preventDefault(),event_actions?.stopPropagation&&_e?.stopPropagation&&_e.stopPropagation();let combined_name=_events.map(e$31=>e$31.name).join(`+++`);event_actions?.temporal&&(!socket.current||!socket.current.connected)||event_actions?.throttle&&!throttle(combined_name,event_actions.throttle)||(event_actions?.debounce?debounce(combined_name,()=>queueEvents(_events,socket,!1,navigate,()=>params.current),event_actions.debounce):queueEvents(_events,socket,!1,navigate,()=>params.current))},[]),sentHydrate=(0,import_react.useRef)(!1);(0,import_react.useEffect)(()=>{sentHydrate.current||=(queueEvents(initial_events(),socket,!0,navigate,()=>params.current),!0)},[]),(0,import_react.useEffect)(()=>{typeof window>`u`||(window.onerror=function(msg,url$1,lineNo,columnNo,error){return addEvents([ReflexEvent(`${exception_state_name}.handle_frontend_exception`,{info:error.name+`: `+error.message+`
-`+error.stack,component_stack:``})]),!1},window.onunhandledrejection=function(event){return addEvents([ReflexEvent(`${exception_state_name}.handle_frontend_exception`,{info:event.reason?.name+`: `+event.reason?.message+`
-`+event.reason?.stack,component_stack:``})]),!1})},[]),(0,import_react.useEffect)(()=>(ensureSocketConnected(),()=>{socket.current&&socket.current.disconnect()}),[]),(0,import_react.useEffect)(()=>{isBackendDisabled()||!socket.current||!socket.current.connected||(async()=>{for(;event_queue.length>0&&!event_processing;)await ensureSocketConnected(),await processEvent(socket.current,navigate,()=>params.current)})()}),(0,import_react.useEffect)(()=>{let storage_to_state_map={};if(client_storage.local_storage&&typeof window<`u`)for(let state_key in client_storage.local_storage){let options$1=client_storage.local_storage[state_key];if(options$1.sync){let local_storage_value_key=options$1.name||state_key;storage_to_state_map[local_storage_value_key]=state_key}}let handleStorage=e$31=>{if(storage_to_state_map[e$31.key]){let vars={};vars[storage_to_state_map[e$31.key]]=e$31.newValue;let event=ReflexEvent(`${state_name}.reflex___state____update_vars_internal_state.update_vars_internal`,{vars});addEvents([event],e$31)}};return window.addEventListener(`storage`,handleStorage),()=>window.removeEventListener(`storage`,handleStorage)});let handleNavigationEvents=(0,import_react.useRef)(!1);return(0,import_react.useEffect)(()=>{if(!handleNavigationEvents.current){handleNavigationEvents.current=!0;return}if(location$1.state?.fromNotFound||location$1.pathname+location$1.search===prevLocationRef.current.pathname+prevLocationRef.current.search&&location$1.hash)return;let main_state_dispatch=dispatch.reflex___state____state;main_state_dispatch!==void 0&&main_state_dispatch({is_hydrated_rx_state_:!1}),addEvents(onLoadInternalEvent()),prevLocationRef.current=location$1},[location$1,dispatch,onLoadInternalEvent,addEvents]),[addEvents,connectErrors]},isTrue=val=>Array.isArray(val)?val.length>0:val===Object(val)?Object.keys(val).length>0:!!val,isNotNullOrUndefined=val=>(val??void 0)!==void 0,getRefValue=ref=>{if(!(!ref||!ref.current))return ref.current.type==`checkbox`?ref.current.checked:ref.current.className?.includes(`rt-CheckboxRoot`)||ref.current.className?.includes(`rt-SwitchRoot`)?ref.current.ariaChecked==`true`:ref.current.className?.includes(`rt-SliderRoot`)?ref.current.querySelector(`.rt-SliderThumb`)?.ariaValueNow:ref.current.value||ref.current.querySelector&&ref.current.querySelector(`:checked`)&&ref.current.querySelector(`:checked`)?.value},getRefValues=refs$1=>{if(refs$1)return refs$1.map(ref=>ref.current?ref.current.value||ref.current.getAttribute(`aria-valuenow`):null)},spreadArraysOrObjects=(first,second)=>{if(Array.isArray(first)&&Array.isArray(second))return[...first,...second];if(typeof first==`object`&&typeof second==`object`)return{...first,...second};throw Error(`Both parameters must be either arrays or objects.`)};var context_exports=__export({ClientSide:()=>ClientSide,ColorModeContext:()=>ColorModeContext,DispatchContext:()=>DispatchContext,EventLoopContext:()=>EventLoopContext,EventLoopProvider:()=>EventLoopProvider,StateContexts:()=>StateContexts,StateProvider:()=>StateProvider,UploadFilesContext:()=>UploadFilesContext,UploadFilesProvider:()=>UploadFilesProvider,clientStorage:()=>clientStorage,defaultColorMode:()=>defaultColorMode,exception_state_name:()=>exception_state_name,initialEvents:()=>initialEvents,initialState:()=>initialState,isDevMode:()=>!1,onLoadInternalEvent:()=>onLoadInternalEvent,state_name:()=>state_name});const initialState={reflex___state____state:{is_hydrated_rx_state_:!1,router_rx_state_:{session:{client_token:``,client_ip:``,session_id:``},headers:{host:``,origin:``,upgrade:``,connection:``,cookie:``,pragma:``,cache_control:``,user_agent:``,sec_websocket_version:``,sec_websocket_key:``,sec_websocket_extensions:``,accept_encoding:``,accept_language:``,raw_headers:{}},page:{host:``,path:``,raw_path:``,full_path:``,full_raw_path:``,params:{}},url:``,route_id:``}},"reflex___state____state.o_staff_sync___o_staff_sync____state":{},"reflex___state____state.reflex___state____frontend_event_exception_state":{},"reflex___state____state.reflex___state____on_load_internal_state":{},"reflex___state____state.reflex___state____update_vars_internal_state":{},"reflex___state____state.templates___home____state":{},"reflex___state____state.templates___login____login_state":{company_name_rx_state_:``,full_name_rx_state_:``,message_rx_state_:``,password_rx_state_:``,role_rx_state_:``,session_id_rx_state_:``,tenant_id_rx_state_:``,user_id_rx_state_:``,username_rx_state_:``},"reflex___state____state.templates___login____login_state.components___admin_dash_side_nav____admin_state":{dashboard_filter_rx_state_:``},"reflex___state____state.templates___login____login_state.components___admin_dash_side_nav____admin_state.templates___admin_attendance_dashboard____attendance_dashboard_state":{absent_today_rx_state_:0,attendance_data_rx_state_:[],attendance_rate_rx_state_:0,current_month_rx_state_:`October 2025`,date_selected_rx_state_:`2025-10-29`,employee_options_rx_state_:[],end_date_rx_state_:`2025-10-29`,formatted_date_rx_state_:`October 29, 2025`,leave_requests_rx_state_:[],monthly_attendance_rx_state_:[],monthly_header_rx_state_:`Monthly Attendance for — - October 2025`,present_today_rx_state_:0,report_data_rx_state_:[],selected_user_id_rx_state_:null,selected_user_name_rx_state_:``,show_report_rx_state_:!1,start_date_rx_state_:`2025-10-01`,total_employees_rx_state_:0},"reflex___state____state.templates___login____login_state.components___admin_dash_side_nav____admin_state.templates___admin_dashboard____admin_dashboard_state":{Attendance_Rate_rx_state_:0,Attrition_rx_state_:0,Departments_rx_state_:0,Leave_Requests_rx_state_:0,New_Hires_rx_state_:0,Total_Employees_rx_state_:0,check_in_rx_state_:null,check_out_rx_state_:null,date_now_rx_state_:`2025-10-29 14:45:12.169730+00:00`,employees_data_rx_state_:[],formatted_date_rx_state_:`October 29, 2025`,isLogin_rx_state_:!0},"reflex___state____state.templates___login____login_state.components___admin_dash_side_nav____admin_state.templates___admin_employees_management_dashboard____employee_crud_state":{email_rx_state_:``,employees_rx_state_:[],name_rx_state_:``,selected_user_id_rx_state_:``,status_rx_state_:`active`},"reflex___state____state.templates___login____login_state.components___admin_dash_side_nav____admin_state.templates___admin_payroll_dashboard____payroll_dashboard_state":{all_employees_rx_state_:[],average_salary_rx_state_:0,deductions_rx_state_:0,formatted_month_rx_state_:`October 2025`,gross_salary_rx_state_:0,month_selected_rx_state_:`2025-10`,net_salary_rx_state_:0,payroll_data_rx_state_:[],pending_count_rx_state_:0,salary_trend_rx_state_:[],selected_user_name_rx_state_:``,total_employees_rx_state_:0,total_salary_rx_state_:0},"reflex___state____state.templates___login____login_state.components___employee_dash_side_nav____employee_state":{dashboard_filter_rx_state_:``},"reflex___state____state.templates___login____login_state.components___employee_dash_side_nav____employee_state.templates___employee_dashboard____employee_dashboard_state":{Leaves_Remaining_rx_state_:0,Leaves_Taken_rx_state_:0,My_Attendance_Rate_rx_state_:0,Present_Days_This_Month_rx_state_:0,attendance_data_rx_state_:[],check_in_rx_state_:null,check_out_rx_state_:null,date_now_rx_state_:`2025-10-29 14:45:12.154313+00:00`,formatted_date_rx_state_:`October 29, 2025`,isLogin_rx_state_:!0},"reflex___state____state.templates___login____login_state.components___employee_dash_side_nav____employee_state.templates___employee_leave_dashboard____employee_leaves_state":{Leaves_Remaining_rx_state_:0,Leaves_Taken_rx_state_:0,Pending_Requests_rx_state_:0,date_now_rx_state_:`2025-10-29 14:45:12.158100+00:00`,end_date_rx_state_:`2025-10-30`,formatted_date_rx_state_:`October 29, 2025`,formatted_end_date_rx_state_:`2025-10-30`,formatted_start_date_rx_state_:`2025-10-29`,leave_type_rx_state_:`Vacation`,leaves_data_rx_state_:[],notes_rx_state_:``,start_date_rx_state_:`2025-10-29`},"reflex___state____state.templates___login____login_state.components___employee_dash_side_nav____employee_state.templates___employee_payrole_dashboard____employee_payroll_state":{available_months_rx_state_:[],deductions_rx_state_:0,gross_salary_rx_state_:0,month_selected_rx_state_:`2025-10`,net_salary_rx_state_:0,payroll_data_rx_state_:{},total_salary_rx_state_:0},"reflex___state____state.templates___registeration____register_state":{company_name_rx_state_:``,email_rx_state_:``,message_rx_state_:``,name_rx_state_:``,password_rx_state_:``,role_rx_state_:`Employee`,username_rx_state_:``}},defaultColorMode=`system`,ColorModeContext=(0,import_react.createContext)(null),UploadFilesContext=(0,import_react.createContext)(null),DispatchContext=(0,import_react.createContext)(null),StateContexts={reflex___state____state:(0,import_react.createContext)(null),reflex___state____state__o_staff_sync___o_staff_sync____state:(0,import_react.createContext)(null),reflex___state____state__reflex___state____frontend_event_exception_state:(0,import_react.createContext)(null),reflex___state____state__reflex___state____on_load_internal_state:(0,import_react.createContext)(null),reflex___state____state__reflex___state____update_vars_internal_state:(0,import_react.createContext)(null),reflex___state____state__templates___home____state:(0,import_react.createContext)(null),reflex___state____state__templates___login____login_state:(0,import_react.createContext)(null),reflex___state____state__templates___login____login_state__components___admin_dash_side_nav____admin_state:(0,import_react.createContext)(null),reflex___state____state__templates___login____login_state__components___admin_dash_side_nav____admin_state__templates___admin_attendance_dashboard____attendance_dashboard_state:(0,import_react.createContext)(null),reflex___state____state__templates___login____login_state__components___admin_dash_side_nav____admin_state__templates___admin_dashboard____admin_dashboard_state:(0,import_react.createContext)(null),reflex___state____state__templates___login____login_state__components___admin_dash_side_nav____admin_state__templates___admin_employees_management_dashboard____employee_crud_state:(0,import_react.createContext)(null),reflex___state____state__templates___login____login_state__components___admin_dash_side_nav____admin_state__templates___admin_payroll_dashboard____payroll_dashboard_state:(0,import_react.createContext)(null),reflex___state____state__templates___login____login_state__components___employee_dash_side_nav____employee_state:(0,import_react.createContext)(null),reflex___state____state__templates___login____login_state__components___employee_dash_side_nav____employee_state__templates___employee_dashboard____employee_dashboard_state:(0,import_react.createContext)(null),reflex___state____state__templates___login____login_state__components___employee_dash_side_nav____employee_state__templates___employee_leave_dashboard____employee_leaves_state:(0,import_react.createContext)(null),reflex___state____state__templates___login____login_state__components___employee_dash_side_nav____employee_state__templates___employee_payrole_dashboard____employee_payroll_state:(0,import_react.createContext)(null),reflex___state____state__templates___registeration____register_state:(0,import_react.createContext)(null)},EventLoopContext=(0,import_react.createContext)(null),clientStorage={cookies:{},local_storage:{},session_storage:{}},state_name=`reflex___state____state`,exception_state_name=`reflex___state____state.reflex___state____frontend_event_exception_state`,onLoadInternalEvent=()=>{let internal_events=[],client_storage_vars=hydrateClientStorage(clientStorage);return client_storage_vars&&Object.keys(client_storage_vars).length!==0&&internal_events.push(ReflexEvent(`reflex___state____state.reflex___state____update_vars_internal_state.update_vars_internal`,{vars:client_storage_vars})),internal_events.push(ReflexEvent(`reflex___state____state.reflex___state____on_load_internal_state.on_load_internal`)),internal_events},initialEvents=()=>[ReflexEvent(`reflex___state____state.hydrate`),...onLoadInternalEvent()],isDevMode=!1;function UploadFilesProvider({children}){let[filesById,setFilesById]=(0,import_react.useState)({});return refs.__clear_selected_files=id=>setFilesById(filesById$1=>{let newFilesById={...filesById$1};return delete newFilesById[id],newFilesById}),(0,import_react.createElement)(UploadFilesContext.Provider,{value:[filesById,setFilesById]},children)}function ClientSide(component){return({children,...props})=>{let[Component,setComponent]=(0,import_react.useState)(null);return(0,import_react.useEffect)(()=>{setComponent(component)},[]),Component?jsx$34(Component,props,children):null}}function EventLoopProvider({children}){let dispatch=(0,import_react.useContext)(DispatchContext),[addEvents,connectErrors]=useEventLoop(dispatch,initialEvents,clientStorage);return(0,import_react.createElement)(EventLoopContext.Provider,{value:[addEvents,connectErrors]},children)}function StateProvider({children}){let[reflex___state____state,dispatch_reflex___state____state]=(0,import_react.useReducer)(applyDelta,initialState.reflex___state____state),[reflex___state____state__o_staff_sync___o_staff_sync____state,dispatch_reflex___state____state__o_staff_sync___o_staff_sync____state]=(0,import_react.useReducer)(applyDelta,initialState[`reflex___state____state.o_staff_sync___o_staff_sync____state`]),[reflex___state____state__reflex___state____frontend_event_exception_state,dispatch_reflex___state____state__reflex___state____frontend_event_exception_state]=(0,import_react.useReducer)(applyDelta,initialState[`reflex___state____state.reflex___state____frontend_event_exception_state`]),[reflex___state____state__reflex___state____on_load_internal_state,dispatch_reflex___state____state__reflex___state____on_load_internal_state]=(0,import_react.useReducer)(applyDelta,initialState[`reflex___state____state.reflex___state____on_load_internal_state`]),[reflex___state____state__reflex___state____update_vars_internal_state,dispatch_reflex___state____state__reflex___state____update_vars_internal_state]=(0,import_react.useReducer)(applyDelta,initialState[`reflex___state____state.reflex___state____update_vars_internal_state`]),[reflex___state____state__templates___home____state,dispatch_reflex___state____state__templates___home____state]=(0,import_react.useReducer)(applyDelta,initialState[`reflex___state____state.templates___home____state`]),[reflex___state____state__templates___login____login_state,dispatch_reflex___state____state__templates___login____login_state]=(0,import_react.useReducer)(applyDelta,initialState[`reflex___state____state.templates___login____login_state`]),[reflex___state____state__templates___login____login_state__components___admin_dash_side_nav____admin_state,dispatch_reflex___state____state__templates___login____login_state__components___admin_dash_side_nav____admin_state]=(0,import_react.useReducer)(applyDelta,initialState[`reflex___state____state.templates___login____login_state.components___admin_dash_side_nav____admin_state`]),[reflex___state____state__templates___login____login_state__components___admin_dash_side_nav____admin_state__templates___admin_attendance_dashboard____attendance_dashboard_state,dispatch_reflex___state____state__templates___login____login_state__components___admin_dash_side_nav____admin_state__templates___admin_attendance_dashboard____attendance_dashboard_state]=(0,import_react.useReducer)(applyDelta,initialState[`reflex___state____state.templates___login____login_state.components___admin_dash_side_nav____admin_state.templates___admin_attendance_dashboard____attendance_dashboard_state`]),[reflex___state____state__templates___login____login_state__components___admin_dash_side_nav____admin_state__templates___admin_dashboard____admin_dashboard_state,dispatch_reflex___state____state__templates___login____login_state__components___admin_dash_side_nav____admin_state__templates___admin_dashboard____admin_dashboard_state]=(0,import_react.useReducer)(applyDelta,initialState[`reflex___state____state.templates___login____login_state.components___admin_dash_side_nav____admin_state.templates___admin_dashboard____admin_dashboard_state`]),[reflex___state____state__templates___login____login_state__components___admin_dash_side_nav____admin_state__templates___admin_employees_management_dashboard____employee_crud_state,dispatch_reflex___state____state__templates___login____login_state__components___admin_dash_side_nav____admin_state__templates___admin_employees_management_dashboard____employee_crud_state]=(0,import_react.useReducer)(applyDelta,initialState[`reflex___state____state.templates___login____login_state.components___admin_dash_side_nav____admin_state.templates___admin_employees_management_dashboard____employee_crud_state`]),[reflex___state____state__templates___login____login_state__components___admin_dash_side_nav____admin_state__templates___admin_payroll_dashboard____payroll_dashboard_state,dispatch_reflex___state____state__templates___login____login_state__components___admin_dash_side_nav____admin_state__templates___admin_payroll_dashboard____payroll_dashboard_state]=(0,import_react.useReducer)(applyDelta,initialState[`reflex___state____state.templates___login____login_state.components___admin_dash_side_nav____admin_state.templates___admin_payroll_dashboard____payroll_dashboard_state`]),[reflex___state____state__templates___login____login_state__components___employee_dash_side_nav____employee_state,dispatch_reflex___state____state__templates___login____login_state__components___employee_dash_side_nav____employee_state]=(0,import_react.useReducer)(applyDelta,initialState[`reflex___state____state.templates___login____login_state.components___employee_dash_side_nav____employee_state`]),[reflex___state____state__templates___login____login_state__components___employee_dash_side_nav____employee_state__templates___employee_dashboard____employee_dashboard_state,dispatch_reflex___state____state__templates___login____login_state__components___employee_dash_side_nav____employee_state__templates___employee_dashboard____employee_dashboard_state]=(0,import_react.useReducer)(applyDelta,initialState[`reflex___state____state.templates___login____login_state.components___employee_dash_side_nav____employee_state.templates___employee_dashboard____employee_dashboard_state`]),[reflex___state____state__templates___login____login_state__components___employee_dash_side_nav____employee_state__templates___employee_leave_dashboard____employee_leaves_state,dispatch_reflex___state____state__templates___login____login_state__components___employee_dash_side_nav____employee_state__templates___employee_leave_dashboard____employee_leaves_state]=(0,import_react.useReducer)(applyDelta,initialState[`reflex___state____state.templates___login____login_state.components___employee_dash_side_nav____employee_state.templates___employee_leave_dashboard____employee_leaves_state`]),[reflex___state____state__templates___login____login_state__components___employee_dash_side_nav____employee_state__templates___employee_payrole_dashboard____employee_payroll_state,dispatch_reflex___state____state__templates___login____login_state__components___employee_dash_side_nav____employee_state__templates___employee_payrole_dashboard____employee_payroll_state]=(0,import_react.useReducer)(applyDelta,initialState[`reflex___state____state.templates___login____login_state.components___employee_dash_side_nav____employee_state.templates___employee_payrole_dashboard____employee_payroll_state`]),[reflex___state____state__templates___registeration____register_state,dispatch_reflex___state____state__templates___registeration____register_state]=(0,import_react.useReducer)(applyDelta,initialState[`reflex___state____state.templates___registeration____register_state`]),dispatchers=(0,import_react.useMemo)(()=>({reflex___state____state:dispatch_reflex___state____state,"reflex___state____state.o_staff_sync___o_staff_sync____state":dispatch_reflex___state____state__o_staff_sync___o_staff_sync____state,"reflex___state____state.reflex___state____frontend_event_exception_state":dispatch_reflex___state____state__reflex___state____frontend_event_exception_state,"reflex___state____state.reflex___state____on_load_internal_state":dispatch_reflex___state____state__reflex___state____on_load_internal_state,"reflex___state____state.reflex___state____update_vars_internal_state":dispatch_reflex___state____state__reflex___state____update_vars_internal_state,"reflex___state____state.templates___home____state":dispatch_reflex___state____state__templates___home____state,"reflex___state____state.templates___login____login_state":dispatch_reflex___state____state__templates___login____login_state,"reflex___state____state.templates___login____login_state.components___admin_dash_side_nav____admin_state":dispatch_reflex___state____state__templates___login____login_state__components___admin_dash_side_nav____admin_state,"reflex___state____state.templates___login____login_state.components___admin_dash_side_nav____admin_state.templates___admin_attendance_dashboard____attendance_dashboard_state":dispatch_reflex___state____state__templates___login____login_state__components___admin_dash_side_nav____admin_state__templates___admin_attendance_dashboard____attendance_dashboard_state,"reflex___state____state.templates___login____login_state.components___admin_dash_side_nav____admin_state.templates___admin_dashboard____admin_dashboard_state":dispatch_reflex___state____state__templates___login____login_state__components___admin_dash_side_nav____admin_state__templates___admin_dashboard____admin_dashboard_state,"reflex___state____state.templates___login____login_state.components___admin_dash_side_nav____admin_state.templates___admin_employees_management_dashboard____employee_crud_state":dispatch_reflex___state____state__templates___login____login_state__components___admin_dash_side_nav____admin_state__templates___admin_employees_management_dashboard____employee_crud_state,"reflex___state____state.templates___login____login_state.components___admin_dash_side_nav____admin_state.templates___admin_payroll_dashboard____payroll_dashboard_state":dispatch_reflex___state____state__templates___login____login_state__components___admin_dash_side_nav____admin_state__templates___admin_payroll_dashboard____payroll_dashboard_state,"reflex___state____state.templates___login____login_state.components___employee_dash_side_nav____employee_state":dispatch_reflex___state____state__templates___login____login_state__components___employee_dash_side_nav____employee_state,"reflex___state____state.templates___login____login_state.components___employee_dash_side_nav____employee_state.templates___employee_dashboard____employee_dashboard_state":dispatch_reflex___state____state__templates___login____login_state__components___employee_dash_side_nav____employee_state__templates___employee_dashboard____employee_dashboard_state,"reflex___state____state.templates___login____login_state.components___employee_dash_side_nav____employee_state.templates___employee_leave_dashboard____employee_leaves_state":dispatch_reflex___state____state__templates___login____login_state__components___employee_dash_side_nav____employee_state__templates___employee_leave_dashboard____employee_leaves_state,"reflex___state____state.templates___login____login_state.components___employee_dash_side_nav____employee_state.templates___employee_payrole_dashboard____employee_payroll_state":dispatch_reflex___state____state__templates___login____login_state__components___employee_dash_side_nav____employee_state__templates___employee_payrole_dashboard____employee_payroll_state,"reflex___state____state.templates___registeration____register_state":dispatch_reflex___state____state__templates___registeration____register_state}),[]);return(0,import_react.createElement)(StateContexts.reflex___state____state,{value:reflex___state____state},(0,import_react.createElement)(StateContexts.reflex___state____state__o_staff_sync___o_staff_sync____state,{value:reflex___state____state__o_staff_sync___o_staff_sync____state},(0,import_react.createElement)(StateContexts.reflex___state____state__reflex___state____frontend_event_exception_state,{value:reflex___state____state__reflex___state____frontend_event_exception_state},(0,import_react.createElement)(StateContexts.reflex___state____state__reflex___state____on_load_internal_state,{value:reflex___state____state__reflex___state____on_load_internal_state},(0,import_react.createElement)(StateContexts.reflex___state____state__reflex___state____update_vars_internal_state,{value:reflex___state____state__reflex___state____update_vars_internal_state},(0,import_react.createElement)(StateContexts.reflex___state____state__templates___home____state,{value:reflex___state____state__templates___home____state},(0,import_react.createElement)(StateContexts.reflex___state____state__templates___login____login_state,{value:reflex___state____state__templates___login____login_state},(0,import_react.createElement)(StateContexts.reflex___state____state__templates___login____login_state__components___admin_dash_side_nav____admin_state,{value:reflex___state____state__templates___login____login_state__components___admin_dash_side_nav____admin_state},(0,import_react.createElement)(StateContexts.reflex___state____state__templates___login____login_state__components___admin_dash_side_nav____admin_state__templates___admin_attendance_dashboard____attendance_dashboard_state,{value:reflex___state____state__templates___login____login_state__components___admin_dash_side_nav____admin_state__templates___admin_attendance_dashboard____attendance_dashboard_state},(0,import_react.createElement)(StateContexts.reflex___state____state__templates___login____login_state__components___admin_dash_side_nav____admin_state__templates___admin_dashboard____admin_dashboard_state,{value:reflex___state____state__templates___login____login_state__components___admin_dash_side_nav____admin_state__templates___admin_dashboard____admin_dashboard_state},(0,import_react.createElement)(StateContexts.reflex___state____state__templates___login____login_state__components___admin_dash_side_nav____admin_state__templates___admin_employees_management_dashboard____employee_crud_state,{value:reflex___state____state__templates___login____login_state__components___admin_dash_side_nav____admin_state__templates___admin_employees_management_dashboard____employee_crud_state},(0,import_react.createElement)(StateContexts.reflex___state____state__templates___login____login_state__components___admin_dash_side_nav____admin_state__templates___admin_payroll_dashboard____payroll_dashboard_state,{value:reflex___state____state__templates___login____login_state__components___admin_dash_side_nav____admin_state__templates___admin_payroll_dashboard____payroll_dashboard_state},(0,import_react.createElement)(StateContexts.reflex___state____state__templates___login____login_state__components___employee_dash_side_nav____employee_state,{value:reflex___state____state__templates___login____login_state__components___employee_dash_side_nav____employee_state},(0,import_react.createElement)(StateContexts.reflex___state____state__templates___login____login_state__components___employee_dash_side_nav____employee_state__templates___employee_dashboard____employee_dashboard_state,{value:reflex___state____state__templates___login____login_state__components___employee_dash_side_nav____employee_state__templates___employee_dashboard____employee_dashboard_state},(0,import_react.createElement)(StateContexts.reflex___state____state__templates___login____login_state__components___employee_dash_side_nav____employee_state__templates___employee_leave_dashboard____employee_leaves_state,{value:reflex___state____state__templates___login____login_state__components___employee_dash_side_nav____employee_state__templates___employee_leave_dashboard____employee_leaves_state},(0,import_react.createElement)(StateContexts.reflex___state____state__templates___login____login_state__components___employee_dash_side_nav____employee_state__templates___employee_payrole_dashboard____employee_payroll_state,{value:reflex___state____state__templates___login____login_state__components___employee_dash_side_nav____employee_state__templates___employee_payrole_dashboard____employee_payroll_state},(0,import_react.createElement)(StateContexts.reflex___state____state__templates___registeration____register_state,{value:reflex___state____state__templates___registeration____register_state},(0,import_react.createElement)(DispatchContext,{value:dispatchers},children))))))))))))))))))}function setRef(ref,value$1){if(typeof ref==`function`)return ref(value$1);ref!=null&&(ref.current=value$1)}function composeRefs(...refs$1){return node=>{let hasCleanup=!1,cleanups=refs$1.map(ref=>{let cleanup=setRef(ref,node);return!hasCleanup&&typeof cleanup==`function`&&(hasCleanup=!0),cleanup});if(hasCleanup)return()=>{for(let i$23=0;i$23<cleanups.length;i$23++){let cleanup=cleanups[i$23];typeof cleanup==`function`?cleanup():setRef(refs$1[i$23],null)}}}}function useComposedRefs(...refs$1){return import_react.useCallback(composeRefs(...refs$1),refs$1)}var require_react_jsx_runtime_production=__commonJSMin((exports=>{var REACT_ELEMENT_TYPE=Symbol.for(`react.transitional.element`),REACT_FRAGMENT_TYPE=Symbol.for(`react.fragment`);function jsxProd(type,config,maybeKey){var key$1=null;if(maybeKey!==void 0&&(key$1=``+maybeKey),config.key!==void 0&&(key$1=``+config.key),`key`in config)for(var propName in maybeKey={},config)propName!==`key`&&(maybeKey[propName]=config[propName]);else maybeKey=config;return config=maybeKey.ref,{$$typeof:REACT_ELEMENT_TYPE,type,key:key$1,ref:config===void 0?null:config,props:maybeKey}}exports.Fragment=REACT_FRAGMENT_TYPE,exports.jsx=jsxProd,exports.jsxs=jsxProd})),require_jsx_runtime=__commonJSMin(((exports,module)=>{module.exports=require_react_jsx_runtime_production()})),import_jsx_runtime=__toESM(require_jsx_runtime(),1);function createSlot(ownerName){let SlotClone=createSlotClone(ownerName),Slot2=import_react.forwardRef((props,forwardedRef)=>{let{children,...slotProps}=props,childrenArray=import_react.Children.toArray(children),slottable=childrenArray.find(isSlottable);if(slottable){let newElement=slottable.props.children,newChildren=childrenArray.map(child=>child===slottable?import_react.Children.count(newElement)>1?import_react.Children.only(null):import_react.isValidElement(newElement)?newElement.props.children:null:child);return(0,import_jsx_runtime.jsx)(SlotClone,{...slotProps,ref:forwardedRef,children:import_react.isValidElement(newElement)?import_react.cloneElement(newElement,void 0,newChildren):null})}return(0,import_jsx_runtime.jsx)(SlotClone,{...slotProps,ref:forwardedRef,children})});return Slot2.displayName=`${ownerName}.Slot`,Slot2}var Slot$4=createSlot(`Slot`);function createSlotClone(ownerName){let SlotClone=import_react.forwardRef((props,forwardedRef)=>{let{children,...slotProps}=props;if(import_react.isValidElement(children)){let childrenRef=getElementRef$1(children),props2=mergeProps(slotProps,children.props);return children.type!==import_react.Fragment&&(props2.ref=forwardedRef?composeRefs(forwardedRef,childrenRef):childrenRef),import_react.cloneElement(children,props2)}return import_react.Children.count(children)>1?import_react.Children.only(null):null});return SlotClone.displayName=`${ownerName}.SlotClone`,SlotClone}var SLOTTABLE_IDENTIFIER=Symbol(`radix.slottable`);function createSlottable(ownerName){let Slottable2=({children})=>(0,import_jsx_runtime.jsx)(import_jsx_runtime.Fragment,{children});return Slottable2.displayName=`${ownerName}.Slottable`,Slottable2.__radixId=SLOTTABLE_IDENTIFIER,Slottable2}var Slottable$2=createSlottable(`Slottable`);function isSlottable(child){return import_react.isValidElement(child)&&typeof child.type==`function`&&`__radixId`in child.type&&child.type.__radixId===SLOTTABLE_IDENTIFIER}function mergeProps(slotProps,childProps){let overrideProps={...childProps};for(let propName in childProps){let slotPropValue=slotProps[propName],childPropValue=childProps[propName];/^on[A-Z]/.test(propName)?slotPropValue&&childPropValue?overrideProps[propName]=(...args)=>{let result=childPropValue(...args);return slotPropValue(...args),result}:slotPropValue&&(overrideProps[propName]=slotPropValue):propName===`style`?overrideProps[propName]={...slotPropValue,...childPropValue}:propName===`className`&&(overrideProps[propName]=[slotPropValue,childPropValue].filter(Boolean).join(` `))}return{...slotProps,...overrideProps}}function getElementRef$1(element){let getter=Object.getOwnPropertyDescriptor(element.props,`ref`)?.get,mayWarn=getter&&`isReactWarning`in getter&&getter.isReactWarning;return mayWarn?element.ref:(getter=Object.getOwnPropertyDescriptor(element,`ref`)?.get,mayWarn=getter&&`isReactWarning`in getter&&getter.isReactWarning,mayWarn?element.props.ref:element.props.ref||element.ref)}var import_react_dom$4=__toESM(require_react_dom(),1),Primitive$1=[`a`,`button`,`div`,`form`,`h2`,`h3`,`img`,`input`,`label`,`li`,`nav`,`ol`,`p`,`select`,`span`,`svg`,`ul`].reduce((primitive,node)=>{let Slot$5=createSlot(`Primitive.${node}`),Node$1=import_react.forwardRef((props,forwardedRef)=>{let{asChild,...primitiveProps}=props,Comp=asChild?Slot$5:node;return typeof window<`u`&&(window[Symbol.for(`radix-ui`)]=!0),(0,import_jsx_runtime.jsx)(Comp,{...primitiveProps,ref:forwardedRef})});return Node$1.displayName=`Primitive.${node}`,{...primitive,[node]:Node$1}},{});function dispatchDiscreteCustomEvent(target,event){target&&import_react_dom$4.flushSync(()=>target.dispatchEvent(event))}var VISUALLY_HIDDEN_STYLES=Object.freeze({position:`absolute`,border:0,width:1,height:1,padding:0,margin:-1,overflow:`hidden`,clip:`rect(0, 0, 0, 0)`,whiteSpace:`nowrap`,wordWrap:`normal`}),NAME$4=`VisuallyHidden`,VisuallyHidden=import_react.forwardRef((props,forwardedRef)=>(0,import_jsx_runtime.jsx)(Primitive$1.span,{...props,ref:forwardedRef,style:{...VISUALLY_HIDDEN_STYLES,...props.style}}));VisuallyHidden.displayName=NAME$4;var Root$10=VisuallyHidden,NAME$3=`AccessibleIcon`,AccessibleIcon=({children,label})=>{let child=import_react.Children.only(children);return(0,import_jsx_runtime.jsxs)(import_jsx_runtime.Fragment,{children:[import_react.cloneElement(child,{"aria-hidden":`true`,focusable:`false`}),(0,import_jsx_runtime.jsx)(Root$10,{children:label})]})};AccessibleIcon.displayName=NAME$3;var Root2$11=AccessibleIcon;function createContext2(rootComponentName,defaultContext){let Context=import_react.createContext(defaultContext),Provider$2=props=>{let{children,...context}=props,value$1=import_react.useMemo(()=>context,Object.values(context));return(0,import_jsx_runtime.jsx)(Context.Provider,{value:value$1,children})};Provider$2.displayName=rootComponentName+`Provider`;function useContext2(consumerName){let context=import_react.useContext(Context);if(context)return context;if(defaultContext!==void 0)return defaultContext;throw Error(`\`${consumerName}\` must be used within \`${rootComponentName}\``)}return[Provider$2,useContext2]}function createContextScope(scopeName,createContextScopeDeps=[]){let defaultContexts=[];function createContext3(rootComponentName,defaultContext){let BaseContext=import_react.createContext(defaultContext),index$1=defaultContexts.length;defaultContexts=[...defaultContexts,defaultContext];let Provider$2=props=>{let{scope,children,...context}=props,Context=scope?.[scopeName]?.[index$1]||BaseContext,value$1=import_react.useMemo(()=>context,Object.values(context));return(0,import_jsx_runtime.jsx)(Context.Provider,{value:value$1,children})};Provider$2.displayName=rootComponentName+`Provider`;function useContext2(consumerName,scope){let Context=scope?.[scopeName]?.[index$1]||BaseContext,context=import_react.useContext(Context);if(context)return context;if(defaultContext!==void 0)return defaultContext;throw Error(`\`${consumerName}\` must be used within \`${rootComponentName}\``)}return[Provider$2,useContext2]}let createScope=()=>{let scopeContexts=defaultContexts.map(defaultContext=>import_react.createContext(defaultContext));return function(scope){let contexts=scope?.[scopeName]||scopeContexts;return import_react.useMemo(()=>({[`__scope${scopeName}`]:{...scope,[scopeName]:contexts}}),[scope,contexts])}};return createScope.scopeName=scopeName,[createContext3,composeContextScopes(createScope,...createContextScopeDeps)]}function composeContextScopes(...scopes){let baseScope=scopes[0];if(scopes.length===1)return baseScope;let createScope=()=>{let scopeHooks=scopes.map(createScope2=>({useScope:createScope2(),scopeName:createScope2.scopeName}));return function(overrideScopes){let nextScopes=scopeHooks.reduce((nextScopes2,{useScope,scopeName})=>{let currentScope=useScope(overrideScopes)[`__scope${scopeName}`];return{...nextScopes2,...currentScope}},{});return import_react.useMemo(()=>({[`__scope${baseScope.scopeName}`]:nextScopes}),[nextScopes])}};return createScope.scopeName=baseScope.scopeName,createScope}function createCollection(name){let PROVIDER_NAME$1=name+`CollectionProvider`,[createCollectionContext,createCollectionScope$5]=createContextScope(PROVIDER_NAME$1),[CollectionProviderImpl,useCollectionContext]=createCollectionContext(PROVIDER_NAME$1,{collectionRef:{current:null},itemMap:new Map}),CollectionProvider=props=>{let{scope,children}=props,ref=import_react.useRef(null),itemMap=import_react.useRef(new Map).current;return(0,import_jsx_runtime.jsx)(CollectionProviderImpl,{scope,itemMap,collectionRef:ref,children})};CollectionProvider.displayName=PROVIDER_NAME$1;let COLLECTION_SLOT_NAME=name+`CollectionSlot`,CollectionSlotImpl=createSlot(COLLECTION_SLOT_NAME),CollectionSlot=import_react.forwardRef((props,forwardedRef)=>{let{scope,children}=props,context=useCollectionContext(COLLECTION_SLOT_NAME,scope),composedRefs=useComposedRefs(forwardedRef,context.collectionRef);return(0,import_jsx_runtime.jsx)(CollectionSlotImpl,{ref:composedRefs,children})});CollectionSlot.displayName=COLLECTION_SLOT_NAME;let ITEM_SLOT_NAME=name+`CollectionItemSlot`,ITEM_DATA_ATTR=`data-radix-collection-item`,CollectionItemSlotImpl=createSlot(ITEM_SLOT_NAME),CollectionItemSlot=import_react.forwardRef((props,forwardedRef)=>{let{scope,children,...itemData}=props,ref=import_react.useRef(null),composedRefs=useComposedRefs(forwardedRef,ref),context=useCollectionContext(ITEM_SLOT_NAME,scope);return import_react.useEffect(()=>(context.itemMap.set(ref,{ref,...itemData}),()=>void context.itemMap.delete(ref))),(0,import_jsx_runtime.jsx)(CollectionItemSlotImpl,{[ITEM_DATA_ATTR]:``,ref:composedRefs,children})});CollectionItemSlot.displayName=ITEM_SLOT_NAME;function useCollection$5(scope){let context=useCollectionContext(name+`CollectionConsumer`,scope);return import_react.useCallback(()=>{let collectionNode=context.collectionRef.current;if(!collectionNode)return[];let orderedNodes=Array.from(collectionNode.querySelectorAll(`[${ITEM_DATA_ATTR}]`));return Array.from(context.itemMap.values()).sort((a$37,b$5)=>orderedNodes.indexOf(a$37.ref.current)-orderedNodes.indexOf(b$5.ref.current))},[context.collectionRef,context.itemMap])}return[{Provider:CollectionProvider,Slot:CollectionSlot,ItemSlot:CollectionItemSlot},useCollection$5,createCollectionScope$5]}var canUseDOM=!!(typeof window<`u`&&window.document&&window.document.createElement);function composeEventHandlers(originalEventHandler,ourEventHandler,{checkForDefaultPrevented=!0}={}){return function(event){if(originalEventHandler?.(event),checkForDefaultPrevented===!1||!event.defaultPrevented)return ourEventHandler?.(event)}}var useLayoutEffect2=globalThis?.document?import_react.useLayoutEffect:()=>{},useInsertionEffect=import_react.useInsertionEffect||useLayoutEffect2;function useControllableState({prop,defaultProp,onChange=()=>{},caller}){let[uncontrolledProp,setUncontrolledProp,onChangeRef]=useUncontrolledState({defaultProp,onChange}),isControlled=prop!==void 0,value$1=isControlled?prop:uncontrolledProp;{let isControlledRef=import_react.useRef(prop!==void 0);import_react.useEffect(()=>{let wasControlled=isControlledRef.current;if(wasControlled!==isControlled){let from=wasControlled?`controlled`:`uncontrolled`,to=isControlled?`controlled`:`uncontrolled`;console.warn(`${caller} is changing from ${from} to ${to}. Components should not switch from controlled to uncontrolled (or vice versa). Decide between using a controlled or uncontrolled value for the lifetime of the component.`)}isControlledRef.current=isControlled},[isControlled,caller])}let setValue=import_react.useCallback(nextValue=>{if(isControlled){let value2=isFunction$1(nextValue)?nextValue(prop):nextValue;value2!==prop&&onChangeRef.current?.(value2)}else setUncontrolledProp(nextValue)},[isControlled,prop,setUncontrolledProp,onChangeRef]);return[value$1,setValue]}function useUncontrolledState({defaultProp,onChange}){let[value$1,setValue]=import_react.useState(defaultProp),prevValueRef=import_react.useRef(value$1),onChangeRef=import_react.useRef(onChange);return useInsertionEffect(()=>{onChangeRef.current=onChange},[onChange]),import_react.useEffect(()=>{prevValueRef.current!==value$1&&(onChangeRef.current?.(value$1),prevValueRef.current=value$1)},[value$1,prevValueRef]),[value$1,setValue,onChangeRef]}function isFunction$1(value$1){return typeof value$1==`function`}var SYNC_STATE=Symbol(`RADIX:SYNC_STATE`);function useStateMachine$1(initialState$1,machine){return import_react.useReducer((state,event)=>machine[state][event]??state,initialState$1)}var Presence=props=>{let{present,children}=props,presence=usePresence(present),child=typeof children==`function`?children({present:presence.isPresent}):import_react.Children.only(children),ref=useComposedRefs(presence.ref,getElementRef(child));return typeof children==`function`||presence.isPresent?import_react.cloneElement(child,{ref}):null};Presence.displayName=`Presence`;function usePresence(present){let[node,setNode]=import_react.useState(),stylesRef=import_react.useRef(null),prevPresentRef=import_react.useRef(present),prevAnimationNameRef=import_react.useRef(`none`),[state,send]=useStateMachine$1(present?`mounted`:`unmounted`,{mounted:{UNMOUNT:`unmounted`,ANIMATION_OUT:`unmountSuspended`},unmountSuspended:{MOUNT:`mounted`,ANIMATION_END:`unmounted`},unmounted:{MOUNT:`mounted`}});return import_react.useEffect(()=>{let currentAnimationName=getAnimationName(stylesRef.current);prevAnimationNameRef.current=state===`mounted`?currentAnimationName:`none`},[state]),useLayoutEffect2(()=>{let styles=stylesRef.current,wasPresent=prevPresentRef.current;if(wasPresent!==present){let prevAnimationName=prevAnimationNameRef.current,currentAnimationName=getAnimationName(styles);present?send(`MOUNT`):currentAnimationName===`none`||styles?.display===`none`?send(`UNMOUNT`):send(wasPresent&&prevAnimationName!==currentAnimationName?`ANIMATION_OUT`:`UNMOUNT`),prevPresentRef.current=present}},[present,send]),useLayoutEffect2(()=>{if(node){let timeoutId,ownerWindow=node.ownerDocument.defaultView??window,handleAnimationEnd=event=>{let isCurrentAnimation=getAnimationName(stylesRef.current).includes(CSS.escape(event.animationName));if(event.target===node&&isCurrentAnimation&&(send(`ANIMATION_END`),!prevPresentRef.current)){let currentFillMode=node.style.animationFillMode;node.style.animationFillMode=`forwards`,timeoutId=ownerWindow.setTimeout(()=>{node.style.animationFillMode===`forwards`&&(node.style.animationFillMode=currentFillMode)})}},handleAnimationStart=event=>{event.target===node&&(prevAnimationNameRef.current=getAnimationName(stylesRef.current))};return node.addEventListener(`animationstart`,handleAnimationStart),node.addEventListener(`animationcancel`,handleAnimationEnd),node.addEventListener(`animationend`,handleAnimationEnd),()=>{ownerWindow.clearTimeout(timeoutId),node.removeEventListener(`animationstart`,handleAnimationStart),node.removeEventListener(`animationcancel`,handleAnimationEnd),node.removeEventListener(`animationend`,handleAnimationEnd)}}else send(`ANIMATION_END`)},[node,send]),{isPresent:[`mounted`,`unmountSuspended`].includes(state),ref:import_react.useCallback(node2=>{stylesRef.current=node2?getComputedStyle(node2):null,setNode(node2)},[])}}function getAnimationName(styles){return styles?.animationName||`none`}function getElementRef(element){let getter=Object.getOwnPropertyDescriptor(element.props,`ref`)?.get,mayWarn=getter&&`isReactWarning`in getter&&getter.isReactWarning;return mayWarn?element.ref:(getter=Object.getOwnPropertyDescriptor(element,`ref`)?.get,mayWarn=getter&&`isReactWarning`in getter&&getter.isReactWarning,mayWarn?element.props.ref:element.props.ref||element.ref)}var useReactId=import_react.useId||(()=>void 0),count$1=0;function useId(deterministicId){let[id,setId]=import_react.useState(useReactId());return useLayoutEffect2(()=>{deterministicId||setId(reactId=>reactId??String(count$1++))},[deterministicId]),deterministicId||(id?`radix-${id}`:``)}var dist_exports$19=__export({DirectionProvider:()=>DirectionProvider,Provider:()=>Provider$1,useDirection:()=>useDirection}),DirectionContext=import_react.createContext(void 0),DirectionProvider=props=>{let{dir,children}=props;return(0,import_jsx_runtime.jsx)(DirectionContext.Provider,{value:dir,children})};function useDirection(localDir){let globalDir=import_react.useContext(DirectionContext);return localDir||globalDir||`ltr`}var Provider$1=DirectionProvider;function useCallbackRef(callback){let callbackRef=import_react.useRef(callback);return import_react.useEffect(()=>{callbackRef.current=callback}),import_react.useMemo(()=>(...args)=>callbackRef.current?.(...args),[])}function useEscapeKeydown(onEscapeKeyDownProp,ownerDocument=globalThis?.document){let onEscapeKeyDown=useCallbackRef(onEscapeKeyDownProp);import_react.useEffect(()=>{let handleKeyDown=event=>{event.key===`Escape`&&onEscapeKeyDown(event)};return ownerDocument.addEventListener(`keydown`,handleKeyDown,{capture:!0}),()=>ownerDocument.removeEventListener(`keydown`,handleKeyDown,{capture:!0})},[onEscapeKeyDown,ownerDocument])}var DISMISSABLE_LAYER_NAME=`DismissableLayer`,CONTEXT_UPDATE=`dismissableLayer.update`,POINTER_DOWN_OUTSIDE=`dismissableLayer.pointerDownOutside`,FOCUS_OUTSIDE=`dismissableLayer.focusOutside`,originalBodyPointerEvents,DismissableLayerContext=import_react.createContext({layers:new Set,layersWithOutsidePointerEventsDisabled:new Set,branches:new Set}),DismissableLayer=import_react.forwardRef((props,forwardedRef)=>{let{disableOutsidePointerEvents=!1,onEscapeKeyDown,onPointerDownOutside,onFocusOutside,onInteractOutside,onDismiss,...layerProps}=props,context=import_react.useContext(DismissableLayerContext),[node,setNode]=import_react.useState(null),ownerDocument=node?.ownerDocument??globalThis?.document,[,force]=import_react.useState({}),composedRefs=useComposedRefs(forwardedRef,node2=>setNode(node2)),layers=Array.from(context.layers),[highestLayerWithOutsidePointerEventsDisabled]=[...context.layersWithOutsidePointerEventsDisabled].slice(-1),highestLayerWithOutsidePointerEventsDisabledIndex=layers.indexOf(highestLayerWithOutsidePointerEventsDisabled),index$1=node?layers.indexOf(node):-1,isBodyPointerEventsDisabled=context.layersWithOutsidePointerEventsDisabled.size>0,isPointerEventsEnabled=index$1>=highestLayerWithOutsidePointerEventsDisabledIndex,pointerDownOutside=usePointerDownOutside(event=>{let target=event.target,isPointerDownOnBranch=[...context.branches].some(branch=>branch.contains(target));!isPointerEventsEnabled||isPointerDownOnBranch||(onPointerDownOutside?.(event),onInteractOutside?.(event),event.defaultPrevented||onDismiss?.())},ownerDocument),focusOutside=useFocusOutside(event=>{let target=event.target;[...context.branches].some(branch=>branch.contains(target))||(onFocusOutside?.(event),onInteractOutside?.(event),event.defaultPrevented||onDismiss?.())},ownerDocument);return useEscapeKeydown(event=>{index$1===context.layers.size-1&&(onEscapeKeyDown?.(event),!event.defaultPrevented&&onDismiss&&(event.preventDefault(),onDismiss()))},ownerDocument),import_react.useEffect(()=>{if(node)return disableOutsidePointerEvents&&(context.layersWithOutsidePointerEventsDisabled.size===0&&(originalBodyPointerEvents=ownerDocument.body.style.pointerEvents,ownerDocument.body.style.pointerEvents=`none`),context.layersWithOutsidePointerEventsDisabled.add(node)),context.layers.add(node),dispatchUpdate(),()=>{disableOutsidePointerEvents&&context.layersWithOutsidePointerEventsDisabled.size===1&&(ownerDocument.body.style.pointerEvents=originalBodyPointerEvents)}},[node,ownerDocument,disableOutsidePointerEvents,context]),import_react.useEffect(()=>()=>{node&&(context.layers.delete(node),context.layersWithOutsidePointerEventsDisabled.delete(node),dispatchUpdate())},[node,context]),import_react.useEffect(()=>{let handleUpdate=()=>force({});return document.addEventListener(CONTEXT_UPDATE,handleUpdate),()=>document.removeEventListener(CONTEXT_UPDATE,handleUpdate)},[]),(0,import_jsx_runtime.jsx)(Primitive$1.div,{...layerProps,ref:composedRefs,style:{pointerEvents:isBodyPointerEventsDisabled?isPointerEventsEnabled?`auto`:`none`:void 0,...props.style},onFocusCapture:composeEventHandlers(props.onFocusCapture,focusOutside.onFocusCapture),onBlurCapture:composeEventHandlers(props.onBlurCapture,focusOutside.onBlurCapture),onPointerDownCapture:composeEventHandlers(props.onPointerDownCapture,pointerDownOutside.onPointerDownCapture)})});DismissableLayer.displayName=DISMISSABLE_LAYER_NAME;var BRANCH_NAME=`DismissableLayerBranch`,DismissableLayerBranch=import_react.forwardRef((props,forwardedRef)=>{let context=import_react.useContext(DismissableLayerContext),ref=import_react.useRef(null),composedRefs=useComposedRefs(forwardedRef,ref);return import_react.useEffect(()=>{let node=ref.current;if(node)return context.branches.add(node),()=>{context.branches.delete(node)}},[context.branches]),(0,import_jsx_runtime.jsx)(Primitive$1.div,{...props,ref:composedRefs})});DismissableLayerBranch.displayName=BRANCH_NAME;function usePointerDownOutside(onPointerDownOutside,ownerDocument=globalThis?.document){let handlePointerDownOutside=useCallbackRef(onPointerDownOutside),isPointerInsideReactTreeRef=import_react.useRef(!1),handleClickRef=import_react.useRef(()=>{});return import_react.useEffect(()=>{let handlePointerDown=event=>{if(event.target&&!isPointerInsideReactTreeRef.current){let handleAndDispatchPointerDownOutsideEvent2=function(){handleAndDispatchCustomEvent(POINTER_DOWN_OUTSIDE,handlePointerDownOutside,eventDetail,{discrete:!0})},eventDetail={originalEvent:event};event.pointerType===`touch`?(ownerDocument.removeEventListener(`click`,handleClickRef.current),handleClickRef.current=handleAndDispatchPointerDownOutsideEvent2,ownerDocument.addEventListener(`click`,handleClickRef.current,{once:!0})):handleAndDispatchPointerDownOutsideEvent2()}else ownerDocument.removeEventListener(`click`,handleClickRef.current);isPointerInsideReactTreeRef.current=!1},timerId=window.setTimeout(()=>{ownerDocument.addEventListener(`pointerdown`,handlePointerDown)},0);return()=>{window.clearTimeout(timerId),ownerDocument.removeEventListener(`pointerdown`,handlePointerDown),ownerDocument.removeEventListener(`click`,handleClickRef.current)}},[ownerDocument,handlePointerDownOutside]),{onPointerDownCapture:()=>isPointerInsideReactTreeRef.current=!0}}function useFocusOutside(onFocusOutside,ownerDocument=globalThis?.document){let handleFocusOutside=useCallbackRef(onFocusOutside),isFocusInsideReactTreeRef=import_react.useRef(!1);return import_react.useEffect(()=>{let handleFocus=event=>{event.target&&!isFocusInsideReactTreeRef.current&&handleAndDispatchCustomEvent(FOCUS_OUTSIDE,handleFocusOutside,{originalEvent:event},{discrete:!1})};return ownerDocument.addEventListener(`focusin`,handleFocus),()=>ownerDocument.removeEventListener(`focusin`,handleFocus)},[ownerDocument,handleFocusOutside]),{onFocusCapture:()=>isFocusInsideReactTreeRef.current=!0,onBlurCapture:()=>isFocusInsideReactTreeRef.current=!1}}function dispatchUpdate(){let event=new CustomEvent(CONTEXT_UPDATE);document.dispatchEvent(event)}function handleAndDispatchCustomEvent(name,handler,detail,{discrete}){let target=detail.originalEvent.target,event=new CustomEvent(name,{bubbles:!1,cancelable:!0,detail});handler&&target.addEventListener(name,handler,{once:!0}),discrete?dispatchDiscreteCustomEvent(target,event):target.dispatchEvent(event)}var AUTOFOCUS_ON_MOUNT=`focusScope.autoFocusOnMount`,AUTOFOCUS_ON_UNMOUNT=`focusScope.autoFocusOnUnmount`,EVENT_OPTIONS$1={bubbles:!1,cancelable:!0},FOCUS_SCOPE_NAME=`FocusScope`,FocusScope=import_react.forwardRef((props,forwardedRef)=>{let{loop=!1,trapped=!1,onMountAutoFocus:onMountAutoFocusProp,onUnmountAutoFocus:onUnmountAutoFocusProp,...scopeProps}=props,[container,setContainer]=import_react.useState(null),onMountAutoFocus=useCallbackRef(onMountAutoFocusProp),onUnmountAutoFocus=useCallbackRef(onUnmountAutoFocusProp),lastFocusedElementRef=import_react.useRef(null),composedRefs=useComposedRefs(forwardedRef,node=>setContainer(node)),focusScope=import_react.useRef({paused:!1,pause(){this.paused=!0},resume(){this.paused=!1}}).current;import_react.useEffect(()=>{if(trapped){let handleFocusIn2=function(event){if(focusScope.paused||!container)return;let target=event.target;container.contains(target)?lastFocusedElementRef.current=target:focus(lastFocusedElementRef.current,{select:!0})},handleFocusOut2=function(event){if(focusScope.paused||!container)return;let relatedTarget=event.relatedTarget;relatedTarget!==null&&(container.contains(relatedTarget)||focus(lastFocusedElementRef.current,{select:!0}))},handleMutations2=function(mutations){if(document.activeElement===document.body)for(let mutation of mutations)mutation.removedNodes.length>0&&focus(container)};document.addEventListener(`focusin`,handleFocusIn2),document.addEventListener(`focusout`,handleFocusOut2);let mutationObserver=new MutationObserver(handleMutations2);return container&&mutationObserver.observe(container,{childList:!0,subtree:!0}),()=>{document.removeEventListener(`focusin`,handleFocusIn2),document.removeEventListener(`focusout`,handleFocusOut2),mutationObserver.disconnect()}}},[trapped,container,focusScope.paused]),import_react.useEffect(()=>{if(container){focusScopesStack.add(focusScope);let previouslyFocusedElement=document.activeElement;if(!container.contains(previouslyFocusedElement)){let mountEvent=new CustomEvent(AUTOFOCUS_ON_MOUNT,EVENT_OPTIONS$1);container.addEventListener(AUTOFOCUS_ON_MOUNT,onMountAutoFocus),container.dispatchEvent(mountEvent),mountEvent.defaultPrevented||(focusFirst$3(removeLinks(getTabbableCandidates$1(container)),{select:!0}),document.activeElement===previouslyFocusedElement&&focus(container))}return()=>{container.removeEventListener(AUTOFOCUS_ON_MOUNT,onMountAutoFocus),setTimeout(()=>{let unmountEvent=new CustomEvent(AUTOFOCUS_ON_UNMOUNT,EVENT_OPTIONS$1);container.addEventListener(AUTOFOCUS_ON_UNMOUNT,onUnmountAutoFocus),container.dispatchEvent(unmountEvent),unmountEvent.defaultPrevented||focus(previouslyFocusedElement??document.body,{select:!0}),container.removeEventListener(AUTOFOCUS_ON_UNMOUNT,onUnmountAutoFocus),focusScopesStack.remove(focusScope)},0)}}},[container,onMountAutoFocus,onUnmountAutoFocus,focusScope]);let handleKeyDown=import_react.useCallback(event=>{if(!loop&&!trapped||focusScope.paused)return;let isTabKey=event.key===`Tab`&&!event.altKey&&!event.ctrlKey&&!event.metaKey,focusedElement=document.activeElement;if(isTabKey&&focusedElement){let container2=event.currentTarget,[first,last]=getTabbableEdges(container2);first&&last?!event.shiftKey&&focusedElement===last?(event.preventDefault(),loop&&focus(first,{select:!0})):event.shiftKey&&focusedElement===first&&(event.preventDefault(),loop&&focus(last,{select:!0})):focusedElement===container2&&event.preventDefault()}},[loop,trapped,focusScope.paused]);return(0,import_jsx_runtime.jsx)(Primitive$1.div,{tabIndex:-1,...scopeProps,ref:composedRefs,onKeyDown:handleKeyDown})});FocusScope.displayName=FOCUS_SCOPE_NAME;function focusFirst$3(candidates,{select=!1}={}){let previouslyFocusedElement=document.activeElement;for(let candidate of candidates)if(focus(candidate,{select}),document.activeElement!==previouslyFocusedElement)return}function getTabbableEdges(container){let candidates=getTabbableCandidates$1(container),first=findVisible(candidates,container),last=findVisible(candidates.reverse(),container);return[first,last]}function getTabbableCandidates$1(container){let nodes=[],walker=document.createTreeWalker(container,NodeFilter.SHOW_ELEMENT,{acceptNode:node=>{let isHiddenInput=node.tagName===`INPUT`&&node.type===`hidden`;return node.disabled||node.hidden||isHiddenInput?NodeFilter.FILTER_SKIP:node.tabIndex>=0?NodeFilter.FILTER_ACCEPT:NodeFilter.FILTER_SKIP}});for(;walker.nextNode();)nodes.push(walker.currentNode);return nodes}function findVisible(elements,container){for(let element of elements)if(!isHidden(element,{upTo:container}))return element}function isHidden(node,{upTo}){if(getComputedStyle(node).visibility===`hidden`)return!0;for(;node;){if(upTo!==void 0&&node===upTo)return!1;if(getComputedStyle(node).display===`none`)return!0;node=node.parentElement}return!1}function isSelectableInput(element){return element instanceof HTMLInputElement&&`select`in element}function focus(element,{select=!1}={}){if(element&&element.focus){let previouslyFocusedElement=document.activeElement;element.focus({preventScroll:!0}),element!==previouslyFocusedElement&&isSelectableInput(element)&&select&&element.select()}}var focusScopesStack=createFocusScopesStack();function createFocusScopesStack(){let stack$1=[];return{add(focusScope){let activeFocusScope=stack$1[0];focusScope!==activeFocusScope&&activeFocusScope?.pause(),stack$1=arrayRemove(stack$1,focusScope),stack$1.unshift(focusScope)},remove(focusScope){stack$1=arrayRemove(stack$1,focusScope),stack$1[0]?.resume()}}}function arrayRemove(array,item){let updatedArray=[...array],index$1=updatedArray.indexOf(item);return index$1!==-1&&updatedArray.splice(index$1,1),updatedArray}function removeLinks(items){return items.filter(item=>item.tagName!==`A`)}var import_react_dom$3=__toESM(require_react_dom(),1),PORTAL_NAME$9=`Portal`,Portal=import_react.forwardRef((props,forwardedRef)=>{let{container:containerProp,...portalProps}=props,[mounted,setMounted]=import_react.useState(!1);useLayoutEffect2(()=>setMounted(!0),[]);let container=containerProp||mounted&&globalThis?.document?.body;return container?import_react_dom$3.createPortal((0,import_jsx_runtime.jsx)(Primitive$1.div,{...portalProps,ref:forwardedRef}),container):null});Portal.displayName=PORTAL_NAME$9;var Root$9=Portal,count=0;function useFocusGuards(){import_react.useEffect(()=>{let edgeGuards=document.querySelectorAll(`[data-radix-focus-guard]`);return document.body.insertAdjacentElement(`afterbegin`,edgeGuards[0]??createFocusGuard()),document.body.insertAdjacentElement(`beforeend`,edgeGuards[1]??createFocusGuard()),count++,()=>{count===1&&document.querySelectorAll(`[data-radix-focus-guard]`).forEach(node=>node.remove()),count--}},[])}function createFocusGuard(){let element=document.createElement(`span`);return element.setAttribute(`data-radix-focus-guard`,``),element.tabIndex=0,element.style.outline=`none`,element.style.opacity=`0`,element.style.position=`fixed`,element.style.pointerEvents=`none`,element}var __assign=function(){return __assign=Object.assign||function(t$28){for(var s$23,i$23=1,n$24=arguments.length;i$23<n$24;i$23++)for(var p$36 in s$23=arguments[i$23],s$23)Object.prototype.hasOwnProperty.call(s$23,p$36)&&(t$28[p$36]=s$23[p$36]);return t$28},__assign.apply(this,arguments)};function __rest(s$23,e$31){var t$28={};for(var p$36 in s$23)Object.prototype.hasOwnProperty.call(s$23,p$36)&&e$31.indexOf(p$36)<0&&(t$28[p$36]=s$23[p$36]);if(s$23!=null&&typeof Object.getOwnPropertySymbols==`function`)for(var i$23=0,p$36=Object.getOwnPropertySymbols(s$23);i$23<p$36.length;i$23++)e$31.indexOf(p$36[i$23])<0&&Object.prototype.propertyIsEnumerable.call(s$23,p$36[i$23])&&(t$28[p$36[i$23]]=s$23[p$36[i$23]]);return t$28}function __spreadArray(to,from,pack){if(pack||arguments.length===2)for(var i$23=0,l$12=from.length,ar;i$23<l$12;i$23++)(ar||!(i$23 in from))&&(ar||=Array.prototype.slice.call(from,0,i$23),ar[i$23]=from[i$23]);return to.concat(ar||Array.prototype.slice.call(from))}var zeroRightClassName=`right-scroll-bar-position`,fullWidthClassName=`width-before-scroll-bar`,noScrollbarsClassName=`with-scroll-bars-hidden`,removedBarSizeVariable=`--removed-body-scroll-bar-size`;function assignRef(ref,value$1){return typeof ref==`function`?ref(value$1):ref&&(ref.current=value$1),ref}function useCallbackRef$1(initialValue,callback){var ref=(0,import_react.useState)(function(){return{value:initialValue,callback,facade:{get current(){return ref.value},set current(value$1){var last=ref.value;last!==value$1&&(ref.value=value$1,ref.callback(value$1,last))}}}})[0];return ref.callback=callback,ref.facade}var useIsomorphicLayoutEffect=typeof window<`u`?import_react.useLayoutEffect:import_react.useEffect,currentValues=new WeakMap;function useMergeRefs(refs$1,defaultValue){var callbackRef=useCallbackRef$1(defaultValue||null,function(newValue){return refs$1.forEach(function(ref){return assignRef(ref,newValue)})});return useIsomorphicLayoutEffect(function(){var oldValue=currentValues.get(callbackRef);if(oldValue){var prevRefs_1=new Set(oldValue),nextRefs_1=new Set(refs$1),current_1=callbackRef.current;prevRefs_1.forEach(function(ref){nextRefs_1.has(ref)||assignRef(ref,null)}),nextRefs_1.forEach(function(ref){prevRefs_1.has(ref)||assignRef(ref,current_1)})}currentValues.set(callbackRef,refs$1)},[refs$1]),callbackRef}function ItoI(a$37){return a$37}function innerCreateMedium(defaults,middleware){middleware===void 0&&(middleware=ItoI);var buffer$1=[],assigned=!1;return{read:function(){if(assigned)throw Error("Sidecar: could not `read` from an `assigned` medium. `read` could be used only with `useMedium`.");return buffer$1.length?buffer$1[buffer$1.length-1]:defaults},useMedium:function(data){var item=middleware(data,assigned);return buffer$1.push(item),function(){buffer$1=buffer$1.filter(function(x$3){return x$3!==item})}},assignSyncMedium:function(cb){for(assigned=!0;buffer$1.length;){var cbs=buffer$1;buffer$1=[],cbs.forEach(cb)}buffer$1={push:function(x$3){return cb(x$3)},filter:function(){return buffer$1}}},assignMedium:function(cb){assigned=!0;var pendingQueue=[];if(buffer$1.length){var cbs=buffer$1;buffer$1=[],cbs.forEach(cb),pendingQueue=buffer$1}var executeQueue=function(){var cbs$1=pendingQueue;pendingQueue=[],cbs$1.forEach(cb)},cycle=function(){return Promise.resolve().then(executeQueue)};cycle(),buffer$1={push:function(x$3){pendingQueue.push(x$3),cycle()},filter:function(filter){return pendingQueue=pendingQueue.filter(filter),buffer$1}}}}}function createSidecarMedium(options$1){options$1===void 0&&(options$1={});var medium=innerCreateMedium(null);return medium.options=__assign({async:!0,ssr:!1},options$1),medium}var SideCar=function(_a){var sideCar=_a.sideCar,rest=__rest(_a,[`sideCar`]);if(!sideCar)throw Error("Sidecar: please provide `sideCar` property to import the right car");var Target=sideCar.read();if(!Target)throw Error(`Sidecar medium not found`);return import_react.createElement(Target,__assign({},rest))};SideCar.isSideCarExport=!0;function exportSidecar(medium,exported){return medium.useMedium(exported),SideCar}var effectCar=createSidecarMedium(),nothing=function(){},RemoveScroll=import_react.forwardRef(function(props,parentRef){var ref=import_react.useRef(null),_a=import_react.useState({onScrollCapture:nothing,onWheelCapture:nothing,onTouchMoveCapture:nothing}),callbacks=_a[0],setCallbacks=_a[1],forwardProps=props.forwardProps,children=props.children,className=props.className,removeScrollBar=props.removeScrollBar,enabled=props.enabled,shards=props.shards,sideCar=props.sideCar,noRelative=props.noRelative,noIsolation=props.noIsolation,inert=props.inert,allowPinchZoom=props.allowPinchZoom,_b=props.as,Container=_b===void 0?`div`:_b,gapMode=props.gapMode,rest=__rest(props,[`forwardProps`,`children`,`className`,`removeScrollBar`,`enabled`,`shards`,`sideCar`,`noRelative`,`noIsolation`,`inert`,`allowPinchZoom`,`as`,`gapMode`]),SideCar$1=sideCar,containerRef=useMergeRefs([ref,parentRef]),containerProps=__assign(__assign({},rest),callbacks);return import_react.createElement(import_react.Fragment,null,enabled&&import_react.createElement(SideCar$1,{sideCar:effectCar,removeScrollBar,shards,noRelative,noIsolation,inert,setCallbacks,allowPinchZoom:!!allowPinchZoom,lockRef:ref,gapMode}),forwardProps?import_react.cloneElement(import_react.Children.only(children),__assign(__assign({},containerProps),{ref:containerRef})):import_react.createElement(Container,__assign({},containerProps,{className,ref:containerRef}),children))});RemoveScroll.defaultProps={enabled:!0,removeScrollBar:!0,inert:!1},RemoveScroll.classNames={fullWidth:fullWidthClassName,zeroRight:zeroRightClassName};var currentNonce,getNonce=function(){if(currentNonce)return currentNonce;if(typeof __webpack_nonce__<`u`)return __webpack_nonce__};function makeStyleTag(){if(!document)return null;var tag=document.createElement(`style`);tag.type=`text/css`;var nonce=getNonce();return nonce&&tag.setAttribute(`nonce`,nonce),tag}function injectStyles(tag,css){tag.styleSheet?tag.styleSheet.cssText=css:tag.appendChild(document.createTextNode(css))}function insertStyleTag(tag){(document.head||document.getElementsByTagName(`head`)[0]).appendChild(tag)}var stylesheetSingleton=function(){var counter=0,stylesheet=null;return{add:function(style){counter==0&&(stylesheet=makeStyleTag())&&(injectStyles(stylesheet,style),insertStyleTag(stylesheet)),counter++},remove:function(){counter--,!counter&&stylesheet&&(stylesheet.parentNode&&stylesheet.parentNode.removeChild(stylesheet),stylesheet=null)}}},styleHookSingleton=function(){var sheet=stylesheetSingleton();return function(styles,isDynamic){import_react.useEffect(function(){return sheet.add(styles),function(){sheet.remove()}},[styles&&isDynamic])}},styleSingleton=function(){var useStyle=styleHookSingleton();return function(_a){var styles=_a.styles,dynamic=_a.dynamic;return useStyle(styles,dynamic),null}},zeroGap={left:0,top:0,right:0,gap:0},parse=function(x$3){return parseInt(x$3||``,10)||0},getOffset=function(gapMode){var cs=window.getComputedStyle(document.body),left=cs[gapMode===`padding`?`paddingLeft`:`marginLeft`],top=cs[gapMode===`padding`?`paddingTop`:`marginTop`],right=cs[gapMode===`padding`?`paddingRight`:`marginRight`];return[parse(left),parse(top),parse(right)]},getGapWidth=function(gapMode){if(gapMode===void 0&&(gapMode=`margin`),typeof window>`u`)return zeroGap;var offsets=getOffset(gapMode),documentWidth=document.documentElement.clientWidth,windowWidth=window.innerWidth;return{left:offsets[0],top:offsets[1],right:offsets[2],gap:Math.max(0,windowWidth-documentWidth+offsets[2]-offsets[0])}},Style=styleSingleton(),lockAttribute=`data-scroll-locked`,getStyles=function(_a,allowRelative,gapMode,important){var left=_a.left,top=_a.top,right=_a.right,gap=_a.gap;return gapMode===void 0&&(gapMode=`margin`),`
-  .${noScrollbarsClassName} {
-   overflow: hidden ${important};
-   padding-right: ${gap}px ${important};
-  }
-  body[${lockAttribute}] {
-    overflow: hidden ${important};
-    overscroll-behavior: contain;
-    ${[allowRelative&&`position: relative ${important};`,gapMode===`margin`&&`
-    padding-left: ${left}px;
-    padding-top: ${top}px;
-    padding-right: ${right}px;
-    margin-left:0;
-    margin-top:0;
-    margin-right: ${gap}px ${important};
-    `,gapMode===`padding`&&`padding-right: ${gap}px ${important};`].filter(Boolean).join(``)}
-  }
-  
-  .${zeroRightClassName} {
-    right: ${gap}px ${important};
-  }
-  
-  .${fullWidthClassName} {
-    margin-right: ${gap}px ${important};
-  }
-  
-  .${zeroRightClassName} .${zeroRightClassName} {
-    right: 0 ${important};
-  }
-  
-  .${fullWidthClassName} .${fullWidthClassName} {
-    margin-right: 0 ${important};
-  }
-  
-  body[${lockAttribute}] {
-    ${removedBarSizeVariable}: ${gap}px;
-  }
-`},getCurrentUseCounter=function(){var counter=parseInt(document.body.getAttribute(`data-scroll-locked`)||`0`,10);return isFinite(counter)?counter:0},useLockAttribute=function(){import_react.useEffect(function(){return document.body.setAttribute(lockAttribute,(getCurrentUseCounter()+1).toString()),function(){var newCounter=getCurrentUseCounter()-1;newCounter<=0?document.body.removeAttribute(lockAttribute):document.body.setAttribute(lockAttribute,newCounter.toString())}},[])},RemoveScrollBar=function(_a){var noRelative=_a.noRelative,noImportant=_a.noImportant,_b=_a.gapMode,gapMode=_b===void 0?`margin`:_b;useLockAttribute();var gap=import_react.useMemo(function(){return getGapWidth(gapMode)},[gapMode]);return import_react.createElement(Style,{styles:getStyles(gap,!noRelative,gapMode,noImportant?``:`!important`)})},passiveSupported=!1;if(typeof window<`u`)try{var options=Object.defineProperty({},`passive`,{get:function(){return passiveSupported=!0,!0}});window.addEventListener(`test`,options,options),window.removeEventListener(`test`,options,options)}catch{passiveSupported=!1}var nonPassive=passiveSupported?{passive:!1}:!1,alwaysContainsScroll=function(node){return node.tagName===`TEXTAREA`},elementCanBeScrolled=function(node,overflow){if(!(node instanceof Element))return!1;var styles=window.getComputedStyle(node);return styles[overflow]!==`hidden`&&!(styles.overflowY===styles.overflowX&&!alwaysContainsScroll(node)&&styles[overflow]===`visible`)},elementCouldBeVScrolled=function(node){return elementCanBeScrolled(node,`overflowY`)},elementCouldBeHScrolled=function(node){return elementCanBeScrolled(node,`overflowX`)},locationCouldBeScrolled=function(axis,node){var ownerDocument=node.ownerDocument,current=node;do{if(typeof ShadowRoot<`u`&&current instanceof ShadowRoot&&(current=current.host),elementCouldBeScrolled(axis,current)){var _a=getScrollVariables(axis,current),scrollHeight=_a[1],clientHeight=_a[2];if(scrollHeight>clientHeight)return!0}current=current.parentNode}while(current&&current!==ownerDocument.body);return!1},getVScrollVariables=function(_a){var scrollTop=_a.scrollTop,scrollHeight=_a.scrollHeight,clientHeight=_a.clientHeight;return[scrollTop,scrollHeight,clientHeight]},getHScrollVariables=function(_a){var scrollLeft=_a.scrollLeft,scrollWidth=_a.scrollWidth,clientWidth=_a.clientWidth;return[scrollLeft,scrollWidth,clientWidth]},elementCouldBeScrolled=function(axis,node){return axis===`v`?elementCouldBeVScrolled(node):elementCouldBeHScrolled(node)},getScrollVariables=function(axis,node){return axis===`v`?getVScrollVariables(node):getHScrollVariables(node)},getDirectionFactor=function(axis,direction){return axis===`h`&&direction===`rtl`?-1:1},handleScroll=function(axis,endTarget,event,sourceDelta,noOverscroll){var directionFactor=getDirectionFactor(axis,window.getComputedStyle(endTarget).direction),delta=directionFactor*sourceDelta,target=event.target,targetInLock=endTarget.contains(target),shouldCancelScroll=!1,isDeltaPositive=delta>0,availableScroll=0,availableScrollTop=0;do{if(!target)break;var _a=getScrollVariables(axis,target),position=_a[0],scroll_1=_a[1],capacity=_a[2],elementScroll=scroll_1-capacity-directionFactor*position;(position||elementScroll)&&elementCouldBeScrolled(axis,target)&&(availableScroll+=elementScroll,availableScrollTop+=position);var parent_1=target.parentNode;target=parent_1&&parent_1.nodeType===Node.DOCUMENT_FRAGMENT_NODE?parent_1.host:parent_1}while(!targetInLock&&target!==document.body||targetInLock&&(endTarget.contains(target)||endTarget===target));return(isDeltaPositive&&(noOverscroll&&Math.abs(availableScroll)<1||!noOverscroll&&delta>availableScroll)||!isDeltaPositive&&(noOverscroll&&Math.abs(availableScrollTop)<1||!noOverscroll&&-delta>availableScrollTop))&&(shouldCancelScroll=!0),shouldCancelScroll},getTouchXY=function(event){return`changedTouches`in event?[event.changedTouches[0].clientX,event.changedTouches[0].clientY]:[0,0]},getDeltaXY=function(event){return[event.deltaX,event.deltaY]},extractRef=function(ref){return ref&&`current`in ref?ref.current:ref},deltaCompare=function(x$3,y$6){return x$3[0]===y$6[0]&&x$3[1]===y$6[1]},generateStyle=function(id){return`
-  .block-interactivity-${id} {pointer-events: none;}
-  .allow-interactivity-${id} {pointer-events: all;}
-`},idCounter=0,lockStack=[];function RemoveScrollSideCar(props){var shouldPreventQueue=import_react.useRef([]),touchStartRef=import_react.useRef([0,0]),activeAxis=import_react.useRef(),id=import_react.useState(idCounter++)[0],Style$1=import_react.useState(styleSingleton)[0],lastProps=import_react.useRef(props);import_react.useEffect(function(){lastProps.current=props},[props]),import_react.useEffect(function(){if(props.inert){document.body.classList.add(`block-interactivity-${id}`);var allow_1=__spreadArray([props.lockRef.current],(props.shards||[]).map(extractRef),!0).filter(Boolean);return allow_1.forEach(function(el){return el.classList.add(`allow-interactivity-${id}`)}),function(){document.body.classList.remove(`block-interactivity-${id}`),allow_1.forEach(function(el){return el.classList.remove(`allow-interactivity-${id}`)})}}},[props.inert,props.lockRef.current,props.shards]);var shouldCancelEvent=import_react.useCallback(function(event,parent){if(`touches`in event&&event.touches.length===2||event.type===`wheel`&&event.ctrlKey)return!lastProps.current.allowPinchZoom;var touch=getTouchXY(event),touchStart=touchStartRef.current,deltaX=`deltaX`in event?event.deltaX:touchStart[0]-touch[0],deltaY=`deltaY`in event?event.deltaY:touchStart[1]-touch[1],currentAxis,target=event.target,moveDirection=Math.abs(deltaX)>Math.abs(deltaY)?`h`:`v`;if(`touches`in event&&moveDirection===`h`&&target.type===`range`)return!1;var canBeScrolledInMainDirection=locationCouldBeScrolled(moveDirection,target);if(!canBeScrolledInMainDirection)return!0;if(canBeScrolledInMainDirection?currentAxis=moveDirection:(currentAxis=moveDirection===`v`?`h`:`v`,canBeScrolledInMainDirection=locationCouldBeScrolled(moveDirection,target)),!canBeScrolledInMainDirection)return!1;if(!activeAxis.current&&`changedTouches`in event&&(deltaX||deltaY)&&(activeAxis.current=currentAxis),!currentAxis)return!0;var cancelingAxis=activeAxis.current||currentAxis;return handleScroll(cancelingAxis,parent,event,cancelingAxis===`h`?deltaX:deltaY,!0)},[]),shouldPrevent=import_react.useCallback(function(_event){var event=_event;if(!(!lockStack.length||lockStack[lockStack.length-1]!==Style$1)){var delta=`deltaY`in event?getDeltaXY(event):getTouchXY(event),sourceEvent=shouldPreventQueue.current.filter(function(e$31){return e$31.name===event.type&&(e$31.target===event.target||event.target===e$31.shadowParent)&&deltaCompare(e$31.delta,delta)})[0];if(sourceEvent&&sourceEvent.should){event.cancelable&&event.preventDefault();return}if(!sourceEvent){var shardNodes=(lastProps.current.shards||[]).map(extractRef).filter(Boolean).filter(function(node){return node.contains(event.target)});(shardNodes.length>0?shouldCancelEvent(event,shardNodes[0]):!lastProps.current.noIsolation)&&event.cancelable&&event.preventDefault()}}},[]),shouldCancel=import_react.useCallback(function(name,delta,target,should){var event={name,delta,target,should,shadowParent:getOutermostShadowParent(target)};shouldPreventQueue.current.push(event),setTimeout(function(){shouldPreventQueue.current=shouldPreventQueue.current.filter(function(e$31){return e$31!==event})},1)},[]),scrollTouchStart=import_react.useCallback(function(event){touchStartRef.current=getTouchXY(event),activeAxis.current=void 0},[]),scrollWheel=import_react.useCallback(function(event){shouldCancel(event.type,getDeltaXY(event),event.target,shouldCancelEvent(event,props.lockRef.current))},[]),scrollTouchMove=import_react.useCallback(function(event){shouldCancel(event.type,getTouchXY(event),event.target,shouldCancelEvent(event,props.lockRef.current))},[]);import_react.useEffect(function(){return lockStack.push(Style$1),props.setCallbacks({onScrollCapture:scrollWheel,onWheelCapture:scrollWheel,onTouchMoveCapture:scrollTouchMove}),document.addEventListener(`wheel`,shouldPrevent,nonPassive),document.addEventListener(`touchmove`,shouldPrevent,nonPassive),document.addEventListener(`touchstart`,scrollTouchStart,nonPassive),function(){lockStack=lockStack.filter(function(inst){return inst!==Style$1}),document.removeEventListener(`wheel`,shouldPrevent,nonPassive),document.removeEventListener(`touchmove`,shouldPrevent,nonPassive),document.removeEventListener(`touchstart`,scrollTouchStart,nonPassive)}},[]);var removeScrollBar=props.removeScrollBar,inert=props.inert;return import_react.createElement(import_react.Fragment,null,inert?import_react.createElement(Style$1,{styles:generateStyle(id)}):null,removeScrollBar?import_react.createElement(RemoveScrollBar,{noRelative:props.noRelative,gapMode:props.gapMode}):null)}function getOutermostShadowParent(node){for(var shadowParent=null;node!==null;)node instanceof ShadowRoot&&(shadowParent=node.host,node=node.host),node=node.parentNode;return shadowParent}var sidecar_default=exportSidecar(effectCar,RemoveScrollSideCar),ReactRemoveScroll=import_react.forwardRef(function(props,ref){return import_react.createElement(RemoveScroll,__assign({},props,{ref,sideCar:sidecar_default}))});ReactRemoveScroll.classNames=RemoveScroll.classNames;var Combination_default=ReactRemoveScroll,getDefaultParent=function(originalTarget){return typeof document>`u`?null:(Array.isArray(originalTarget)?originalTarget[0]:originalTarget).ownerDocument.body},counterMap=new WeakMap,uncontrolledNodes=new WeakMap,markerMap={},lockCount=0,unwrapHost=function(node){return node&&(node.host||unwrapHost(node.parentNode))},correctTargets=function(parent,targets){return targets.map(function(target){if(parent.contains(target))return target;var correctedTarget=unwrapHost(target);return correctedTarget&&parent.contains(correctedTarget)?correctedTarget:(console.error(`aria-hidden`,target,`in not contained inside`,parent,`. Doing nothing`),null)}).filter(function(x$3){return!!x$3})},applyAttributeToOthers=function(originalTarget,parentNode,markerName,controlAttribute){var targets=correctTargets(parentNode,Array.isArray(originalTarget)?originalTarget:[originalTarget]);markerMap[markerName]||(markerMap[markerName]=new WeakMap);var markerCounter=markerMap[markerName],hiddenNodes=[],elementsToKeep=new Set,elementsToStop=new Set(targets),keep=function(el){!el||elementsToKeep.has(el)||(elementsToKeep.add(el),keep(el.parentNode))};targets.forEach(keep);var deep=function(parent){!parent||elementsToStop.has(parent)||Array.prototype.forEach.call(parent.children,function(node){if(elementsToKeep.has(node))deep(node);else try{var attr=node.getAttribute(controlAttribute),alreadyHidden=attr!==null&&attr!==`false`,counterValue=(counterMap.get(node)||0)+1,markerValue=(markerCounter.get(node)||0)+1;counterMap.set(node,counterValue),markerCounter.set(node,markerValue),hiddenNodes.push(node),counterValue===1&&alreadyHidden&&uncontrolledNodes.set(node,!0),markerValue===1&&node.setAttribute(markerName,`true`),alreadyHidden||node.setAttribute(controlAttribute,`true`)}catch(e$31){console.error(`aria-hidden: cannot operate on `,node,e$31)}})};return deep(parentNode),elementsToKeep.clear(),lockCount++,function(){hiddenNodes.forEach(function(node){var counterValue=counterMap.get(node)-1,markerValue=markerCounter.get(node)-1;counterMap.set(node,counterValue),markerCounter.set(node,markerValue),counterValue||(uncontrolledNodes.has(node)||node.removeAttribute(controlAttribute),uncontrolledNodes.delete(node)),markerValue||node.removeAttribute(markerName)}),lockCount--,lockCount||(counterMap=new WeakMap,counterMap=new WeakMap,uncontrolledNodes=new WeakMap,markerMap={})}},hideOthers=function(originalTarget,parentNode,markerName){markerName===void 0&&(markerName=`data-aria-hidden`);var targets=Array.from(Array.isArray(originalTarget)?originalTarget:[originalTarget]),activeParentNode=parentNode||getDefaultParent(originalTarget);return activeParentNode?(targets.push.apply(targets,Array.from(activeParentNode.querySelectorAll(`[aria-live], script`))),applyAttributeToOthers(targets,activeParentNode,markerName,`aria-hidden`)):function(){return null}},DIALOG_NAME=`Dialog`,[createDialogContext,createDialogScope]=createContextScope(DIALOG_NAME),[DialogProvider,useDialogContext]=createDialogContext(DIALOG_NAME),Dialog=props=>{let{__scopeDialog,children,open:openProp,defaultOpen,onOpenChange,modal=!0}=props,triggerRef=import_react.useRef(null),contentRef=import_react.useRef(null),[open,setOpen]=useControllableState({prop:openProp,defaultProp:defaultOpen??!1,onChange:onOpenChange,caller:DIALOG_NAME});return(0,import_jsx_runtime.jsx)(DialogProvider,{scope:__scopeDialog,triggerRef,contentRef,contentId:useId(),titleId:useId(),descriptionId:useId(),open,onOpenChange:setOpen,onOpenToggle:import_react.useCallback(()=>setOpen(prevOpen=>!prevOpen),[setOpen]),modal,children})};Dialog.displayName=DIALOG_NAME;var TRIGGER_NAME$10=`DialogTrigger`,DialogTrigger=import_react.forwardRef((props,forwardedRef)=>{let{__scopeDialog,...triggerProps}=props,context=useDialogContext(TRIGGER_NAME$10,__scopeDialog),composedTriggerRef=useComposedRefs(forwardedRef,context.triggerRef);return(0,import_jsx_runtime.jsx)(Primitive$1.button,{type:`button`,"aria-haspopup":`dialog`,"aria-expanded":context.open,"aria-controls":context.contentId,"data-state":getState$4(context.open),...triggerProps,ref:composedTriggerRef,onClick:composeEventHandlers(props.onClick,context.onOpenToggle)})});DialogTrigger.displayName=TRIGGER_NAME$10;var PORTAL_NAME$8=`DialogPortal`,[PortalProvider$4,usePortalContext$4]=createDialogContext(PORTAL_NAME$8,{forceMount:void 0}),DialogPortal=props=>{let{__scopeDialog,forceMount,children,container}=props,context=useDialogContext(PORTAL_NAME$8,__scopeDialog);return(0,import_jsx_runtime.jsx)(PortalProvider$4,{scope:__scopeDialog,forceMount,children:import_react.Children.map(children,child=>(0,import_jsx_runtime.jsx)(Presence,{present:forceMount||context.open,children:(0,import_jsx_runtime.jsx)(Portal,{asChild:!0,container,children:child})}))})};DialogPortal.displayName=PORTAL_NAME$8;var OVERLAY_NAME$1=`DialogOverlay`,DialogOverlay=import_react.forwardRef((props,forwardedRef)=>{let portalContext=usePortalContext$4(OVERLAY_NAME$1,props.__scopeDialog),{forceMount=portalContext.forceMount,...overlayProps}=props,context=useDialogContext(OVERLAY_NAME$1,props.__scopeDialog);return context.modal?(0,import_jsx_runtime.jsx)(Presence,{present:forceMount||context.open,children:(0,import_jsx_runtime.jsx)(DialogOverlayImpl,{...overlayProps,ref:forwardedRef})}):null});DialogOverlay.displayName=OVERLAY_NAME$1;var Slot$3=createSlot(`DialogOverlay.RemoveScroll`),DialogOverlayImpl=import_react.forwardRef((props,forwardedRef)=>{let{__scopeDialog,...overlayProps}=props,context=useDialogContext(OVERLAY_NAME$1,__scopeDialog);return(0,import_jsx_runtime.jsx)(Combination_default,{as:Slot$3,allowPinchZoom:!0,shards:[context.contentRef],children:(0,import_jsx_runtime.jsx)(Primitive$1.div,{"data-state":getState$4(context.open),...overlayProps,ref:forwardedRef,style:{pointerEvents:`auto`,...overlayProps.style}})})}),CONTENT_NAME$11=`DialogContent`,DialogContent=import_react.forwardRef((props,forwardedRef)=>{let portalContext=usePortalContext$4(CONTENT_NAME$11,props.__scopeDialog),{forceMount=portalContext.forceMount,...contentProps}=props,context=useDialogContext(CONTENT_NAME$11,props.__scopeDialog);return(0,import_jsx_runtime.jsx)(Presence,{present:forceMount||context.open,children:context.modal?(0,import_jsx_runtime.jsx)(DialogContentModal,{...contentProps,ref:forwardedRef}):(0,import_jsx_runtime.jsx)(DialogContentNonModal,{...contentProps,ref:forwardedRef})})});DialogContent.displayName=CONTENT_NAME$11;var DialogContentModal=import_react.forwardRef((props,forwardedRef)=>{let context=useDialogContext(CONTENT_NAME$11,props.__scopeDialog),contentRef=import_react.useRef(null),composedRefs=useComposedRefs(forwardedRef,context.contentRef,contentRef);return import_react.useEffect(()=>{let content=contentRef.current;if(content)return hideOthers(content)},[]),(0,import_jsx_runtime.jsx)(DialogContentImpl,{...props,ref:composedRefs,trapFocus:context.open,disableOutsidePointerEvents:!0,onCloseAutoFocus:composeEventHandlers(props.onCloseAutoFocus,event=>{event.preventDefault(),context.triggerRef.current?.focus()}),onPointerDownOutside:composeEventHandlers(props.onPointerDownOutside,event=>{let originalEvent=event.detail.originalEvent,ctrlLeftClick=originalEvent.button===0&&originalEvent.ctrlKey===!0;(originalEvent.button===2||ctrlLeftClick)&&event.preventDefault()}),onFocusOutside:composeEventHandlers(props.onFocusOutside,event=>event.preventDefault())})}),DialogContentNonModal=import_react.forwardRef((props,forwardedRef)=>{let context=useDialogContext(CONTENT_NAME$11,props.__scopeDialog),hasInteractedOutsideRef=import_react.useRef(!1),hasPointerDownOutsideRef=import_react.useRef(!1);return(0,import_jsx_runtime.jsx)(DialogContentImpl,{...props,ref:forwardedRef,trapFocus:!1,disableOutsidePointerEvents:!1,onCloseAutoFocus:event=>{props.onCloseAutoFocus?.(event),event.defaultPrevented||(hasInteractedOutsideRef.current||context.triggerRef.current?.focus(),event.preventDefault()),hasInteractedOutsideRef.current=!1,hasPointerDownOutsideRef.current=!1},onInteractOutside:event=>{props.onInteractOutside?.(event),event.defaultPrevented||(hasInteractedOutsideRef.current=!0,event.detail.originalEvent.type===`pointerdown`&&(hasPointerDownOutsideRef.current=!0));let target=event.target;context.triggerRef.current?.contains(target)&&event.preventDefault(),event.detail.originalEvent.type===`focusin`&&hasPointerDownOutsideRef.current&&event.preventDefault()}})}),DialogContentImpl=import_react.forwardRef((props,forwardedRef)=>{let{__scopeDialog,trapFocus,onOpenAutoFocus,onCloseAutoFocus,...contentProps}=props,context=useDialogContext(CONTENT_NAME$11,__scopeDialog),contentRef=import_react.useRef(null),composedRefs=useComposedRefs(forwardedRef,contentRef);return useFocusGuards(),(0,import_jsx_runtime.jsxs)(import_jsx_runtime.Fragment,{children:[(0,import_jsx_runtime.jsx)(FocusScope,{asChild:!0,loop:!0,trapped:trapFocus,onMountAutoFocus:onOpenAutoFocus,onUnmountAutoFocus:onCloseAutoFocus,children:(0,import_jsx_runtime.jsx)(DismissableLayer,{role:`dialog`,id:context.contentId,"aria-describedby":context.descriptionId,"aria-labelledby":context.titleId,"data-state":getState$4(context.open),...contentProps,ref:composedRefs,onDismiss:()=>context.onOpenChange(!1)})}),(0,import_jsx_runtime.jsxs)(import_jsx_runtime.Fragment,{children:[(0,import_jsx_runtime.jsx)(TitleWarning,{titleId:context.titleId}),(0,import_jsx_runtime.jsx)(DescriptionWarning$1,{contentRef,descriptionId:context.descriptionId})]})]})}),TITLE_NAME$1=`DialogTitle`,DialogTitle=import_react.forwardRef((props,forwardedRef)=>{let{__scopeDialog,...titleProps}=props,context=useDialogContext(TITLE_NAME$1,__scopeDialog);return(0,import_jsx_runtime.jsx)(Primitive$1.h2,{id:context.titleId,...titleProps,ref:forwardedRef})});DialogTitle.displayName=TITLE_NAME$1;var DESCRIPTION_NAME$1=`DialogDescription`,DialogDescription=import_react.forwardRef((props,forwardedRef)=>{let{__scopeDialog,...descriptionProps}=props,context=useDialogContext(DESCRIPTION_NAME$1,__scopeDialog);return(0,import_jsx_runtime.jsx)(Primitive$1.p,{id:context.descriptionId,...descriptionProps,ref:forwardedRef})});DialogDescription.displayName=DESCRIPTION_NAME$1;var CLOSE_NAME$1=`DialogClose`,DialogClose=import_react.forwardRef((props,forwardedRef)=>{let{__scopeDialog,...closeProps}=props,context=useDialogContext(CLOSE_NAME$1,__scopeDialog);return(0,import_jsx_runtime.jsx)(Primitive$1.button,{type:`button`,...closeProps,ref:forwardedRef,onClick:composeEventHandlers(props.onClick,()=>context.onOpenChange(!1))})});DialogClose.displayName=CLOSE_NAME$1;function getState$4(open){return open?`open`:`closed`}var TITLE_WARNING_NAME=`DialogTitleWarning`,[WarningProvider,useWarningContext]=createContext2(TITLE_WARNING_NAME,{contentName:CONTENT_NAME$11,titleName:TITLE_NAME$1,docsSlug:`dialog`}),TitleWarning=({titleId})=>{let titleWarningContext=useWarningContext(TITLE_WARNING_NAME),MESSAGE=`\`${titleWarningContext.contentName}\` requires a \`${titleWarningContext.titleName}\` for the component to be accessible for screen reader users.
-
-If you want to hide the \`${titleWarningContext.titleName}\`, you can wrap it with our VisuallyHidden component.
-
-For more information, see https://radix-ui.com/primitives/docs/components/${titleWarningContext.docsSlug}`;return import_react.useEffect(()=>{titleId&&(document.getElementById(titleId)||console.error(MESSAGE))},[MESSAGE,titleId]),null},DESCRIPTION_WARNING_NAME=`DialogDescriptionWarning`,DescriptionWarning$1=({contentRef,descriptionId})=>{let MESSAGE=`Warning: Missing \`Description\` or \`aria-describedby={undefined}\` for {${useWarningContext(DESCRIPTION_WARNING_NAME).contentName}}.`;return import_react.useEffect(()=>{let describedById=contentRef.current?.getAttribute(`aria-describedby`);descriptionId&&describedById&&(document.getElementById(descriptionId)||console.warn(MESSAGE))},[MESSAGE,contentRef,descriptionId]),null},Root$8=Dialog,Trigger$7=DialogTrigger,Portal$6=DialogPortal,Overlay=DialogOverlay,Content$2=DialogContent,Title=DialogTitle,Description=DialogDescription,Close$1=DialogClose,ROOT_NAME=`AlertDialog`,[createAlertDialogContext,createAlertDialogScope]=createContextScope(ROOT_NAME,[createDialogScope]),useDialogScope=createDialogScope(),AlertDialog=props=>{let{__scopeAlertDialog,...alertDialogProps}=props,dialogScope=useDialogScope(__scopeAlertDialog);return(0,import_jsx_runtime.jsx)(Root$8,{...dialogScope,...alertDialogProps,modal:!0})};AlertDialog.displayName=ROOT_NAME;var TRIGGER_NAME$9=`AlertDialogTrigger`,AlertDialogTrigger=import_react.forwardRef((props,forwardedRef)=>{let{__scopeAlertDialog,...triggerProps}=props,dialogScope=useDialogScope(__scopeAlertDialog);return(0,import_jsx_runtime.jsx)(Trigger$7,{...dialogScope,...triggerProps,ref:forwardedRef})});AlertDialogTrigger.displayName=TRIGGER_NAME$9;var PORTAL_NAME$7=`AlertDialogPortal`,AlertDialogPortal=props=>{let{__scopeAlertDialog,...portalProps}=props,dialogScope=useDialogScope(__scopeAlertDialog);return(0,import_jsx_runtime.jsx)(Portal$6,{...dialogScope,...portalProps})};AlertDialogPortal.displayName=PORTAL_NAME$7;var OVERLAY_NAME=`AlertDialogOverlay`,AlertDialogOverlay=import_react.forwardRef((props,forwardedRef)=>{let{__scopeAlertDialog,...overlayProps}=props,dialogScope=useDialogScope(__scopeAlertDialog);return(0,import_jsx_runtime.jsx)(Overlay,{...dialogScope,...overlayProps,ref:forwardedRef})});AlertDialogOverlay.displayName=OVERLAY_NAME;var CONTENT_NAME$10=`AlertDialogContent`,[AlertDialogContentProvider,useAlertDialogContentContext]=createAlertDialogContext(CONTENT_NAME$10),Slottable$1=createSlottable(`AlertDialogContent`),AlertDialogContent=import_react.forwardRef((props,forwardedRef)=>{let{__scopeAlertDialog,children,...contentProps}=props,dialogScope=useDialogScope(__scopeAlertDialog),contentRef=import_react.useRef(null),composedRefs=useComposedRefs(forwardedRef,contentRef),cancelRef=import_react.useRef(null);return(0,import_jsx_runtime.jsx)(WarningProvider,{contentName:CONTENT_NAME$10,titleName:TITLE_NAME,docsSlug:`alert-dialog`,children:(0,import_jsx_runtime.jsx)(AlertDialogContentProvider,{scope:__scopeAlertDialog,cancelRef,children:(0,import_jsx_runtime.jsxs)(Content$2,{role:`alertdialog`,...dialogScope,...contentProps,ref:composedRefs,onOpenAutoFocus:composeEventHandlers(contentProps.onOpenAutoFocus,event=>{event.preventDefault(),cancelRef.current?.focus({preventScroll:!0})}),onPointerDownOutside:event=>event.preventDefault(),onInteractOutside:event=>event.preventDefault(),children:[(0,import_jsx_runtime.jsx)(Slottable$1,{children}),(0,import_jsx_runtime.jsx)(DescriptionWarning,{contentRef})]})})})});AlertDialogContent.displayName=CONTENT_NAME$10;var TITLE_NAME=`AlertDialogTitle`,AlertDialogTitle=import_react.forwardRef((props,forwardedRef)=>{let{__scopeAlertDialog,...titleProps}=props,dialogScope=useDialogScope(__scopeAlertDialog);return(0,import_jsx_runtime.jsx)(Title,{...dialogScope,...titleProps,ref:forwardedRef})});AlertDialogTitle.displayName=TITLE_NAME;var DESCRIPTION_NAME=`AlertDialogDescription`,AlertDialogDescription=import_react.forwardRef((props,forwardedRef)=>{let{__scopeAlertDialog,...descriptionProps}=props,dialogScope=useDialogScope(__scopeAlertDialog);return(0,import_jsx_runtime.jsx)(Description,{...dialogScope,...descriptionProps,ref:forwardedRef})});AlertDialogDescription.displayName=DESCRIPTION_NAME;var ACTION_NAME=`AlertDialogAction`,AlertDialogAction=import_react.forwardRef((props,forwardedRef)=>{let{__scopeAlertDialog,...actionProps}=props,dialogScope=useDialogScope(__scopeAlertDialog);return(0,import_jsx_runtime.jsx)(Close$1,{...dialogScope,...actionProps,ref:forwardedRef})});AlertDialogAction.displayName=ACTION_NAME;var CANCEL_NAME=`AlertDialogCancel`,AlertDialogCancel=import_react.forwardRef((props,forwardedRef)=>{let{__scopeAlertDialog,...cancelProps}=props,{cancelRef}=useAlertDialogContentContext(CANCEL_NAME,__scopeAlertDialog),dialogScope=useDialogScope(__scopeAlertDialog),ref=useComposedRefs(forwardedRef,cancelRef);return(0,import_jsx_runtime.jsx)(Close$1,{...dialogScope,...cancelProps,ref})});AlertDialogCancel.displayName=CANCEL_NAME;var DescriptionWarning=({contentRef})=>{let MESSAGE=`\`${CONTENT_NAME$10}\` requires a description for the component to be accessible for screen reader users.
-
-You can add a description to the \`${CONTENT_NAME$10}\` by passing a \`${DESCRIPTION_NAME}\` component as a child, which also benefits sighted users by adding visible context to the dialog.
-
-Alternatively, you can use your own component as a description by assigning it an \`id\` and passing the same value to the \`aria-describedby\` prop in \`${CONTENT_NAME$10}\`. If the description is confusing or duplicative for sighted users, you can use the \`@radix-ui/react-visually-hidden\` primitive as a wrapper around your description component.
-
-For more information, see https://radix-ui.com/primitives/docs/components/alert-dialog`;return import_react.useEffect(()=>{document.getElementById(contentRef.current?.getAttribute(`aria-describedby`))||console.warn(MESSAGE)},[MESSAGE,contentRef]),null},Root2$10=AlertDialog,Trigger2=AlertDialogTrigger,Portal2$2=AlertDialogPortal,Overlay2=AlertDialogOverlay,Content2$7=AlertDialogContent,Action=AlertDialogAction,Cancel=AlertDialogCancel,Title2=AlertDialogTitle,Description2=AlertDialogDescription,NAME$2=`AspectRatio`,AspectRatio=import_react.forwardRef((props,forwardedRef)=>{let{ratio=1/1,style,...aspectRatioProps}=props;return(0,import_jsx_runtime.jsx)(`div`,{style:{position:`relative`,width:`100%`,paddingBottom:`${100/ratio}%`},"data-radix-aspect-ratio-wrapper":``,children:(0,import_jsx_runtime.jsx)(Primitive$1.div,{...aspectRatioProps,ref:forwardedRef,style:{...style,position:`absolute`,top:0,right:0,bottom:0,left:0}})})});AspectRatio.displayName=NAME$2;var Root$7=AspectRatio,import_shim=__toESM(require_shim(),1);function useIsHydrated(){return(0,import_shim.useSyncExternalStore)(subscribe,()=>!0,()=>!1)}function subscribe(){return()=>{}}var AVATAR_NAME=`Avatar`,[createAvatarContext,createAvatarScope]=createContextScope(AVATAR_NAME),[AvatarProvider,useAvatarContext]=createAvatarContext(AVATAR_NAME),Avatar=import_react.forwardRef((props,forwardedRef)=>{let{__scopeAvatar,...avatarProps}=props,[imageLoadingStatus,setImageLoadingStatus]=import_react.useState(`idle`);return(0,import_jsx_runtime.jsx)(AvatarProvider,{scope:__scopeAvatar,imageLoadingStatus,onImageLoadingStatusChange:setImageLoadingStatus,children:(0,import_jsx_runtime.jsx)(Primitive$1.span,{...avatarProps,ref:forwardedRef})})});Avatar.displayName=AVATAR_NAME;var IMAGE_NAME=`AvatarImage`,AvatarImage=import_react.forwardRef((props,forwardedRef)=>{let{__scopeAvatar,src,onLoadingStatusChange=()=>{},...imageProps}=props,context=useAvatarContext(IMAGE_NAME,__scopeAvatar),imageLoadingStatus=useImageLoadingStatus(src,imageProps),handleLoadingStatusChange=useCallbackRef(status=>{onLoadingStatusChange(status),context.onImageLoadingStatusChange(status)});return useLayoutEffect2(()=>{imageLoadingStatus!==`idle`&&handleLoadingStatusChange(imageLoadingStatus)},[imageLoadingStatus,handleLoadingStatusChange]),imageLoadingStatus===`loaded`?(0,import_jsx_runtime.jsx)(Primitive$1.img,{...imageProps,ref:forwardedRef,src}):null});AvatarImage.displayName=IMAGE_NAME;var FALLBACK_NAME=`AvatarFallback`,AvatarFallback=import_react.forwardRef((props,forwardedRef)=>{let{__scopeAvatar,delayMs,...fallbackProps}=props,context=useAvatarContext(FALLBACK_NAME,__scopeAvatar),[canRender,setCanRender]=import_react.useState(delayMs===void 0);return import_react.useEffect(()=>{if(delayMs!==void 0){let timerId=window.setTimeout(()=>setCanRender(!0),delayMs);return()=>window.clearTimeout(timerId)}},[delayMs]),canRender&&context.imageLoadingStatus!==`loaded`?(0,import_jsx_runtime.jsx)(Primitive$1.span,{...fallbackProps,ref:forwardedRef}):null});AvatarFallback.displayName=FALLBACK_NAME;function resolveLoadingStatus(image,src){return image?src?(image.src!==src&&(image.src=src),image.complete&&image.naturalWidth>0?`loaded`:`loading`):`error`:`idle`}function useImageLoadingStatus(src,{referrerPolicy,crossOrigin}){let isHydrated=useIsHydrated(),imageRef=import_react.useRef(null),image=(()=>isHydrated?(imageRef.current||=new window.Image,imageRef.current):null)(),[loadingStatus,setLoadingStatus]=import_react.useState(()=>resolveLoadingStatus(image,src));return useLayoutEffect2(()=>{setLoadingStatus(resolveLoadingStatus(image,src))},[image,src]),useLayoutEffect2(()=>{let updateStatus=status=>()=>{setLoadingStatus(status)};if(!image)return;let handleLoad=updateStatus(`loaded`),handleError=updateStatus(`error`);return image.addEventListener(`load`,handleLoad),image.addEventListener(`error`,handleError),referrerPolicy&&(image.referrerPolicy=referrerPolicy),typeof crossOrigin==`string`&&(image.crossOrigin=crossOrigin),()=>{image.removeEventListener(`load`,handleLoad),image.removeEventListener(`error`,handleError)}},[image,crossOrigin,referrerPolicy]),loadingStatus}var Root$6=Avatar,Image=AvatarImage,Fallback=AvatarFallback;function usePrevious(value$1){let ref=import_react.useRef({value:value$1,previous:value$1});return import_react.useMemo(()=>(ref.current.value!==value$1&&(ref.current.previous=ref.current.value,ref.current.value=value$1),ref.current.previous),[value$1])}function useSize(element){let[size$3,setSize]=import_react.useState(void 0);return useLayoutEffect2(()=>{if(element){setSize({width:element.offsetWidth,height:element.offsetHeight});let resizeObserver=new ResizeObserver(entries=>{if(!Array.isArray(entries)||!entries.length)return;let entry=entries[0],width,height;if(`borderBoxSize`in entry){let borderSizeEntry=entry.borderBoxSize,borderSize=Array.isArray(borderSizeEntry)?borderSizeEntry[0]:borderSizeEntry;width=borderSize.inlineSize,height=borderSize.blockSize}else width=element.offsetWidth,height=element.offsetHeight;setSize({width,height})});return resizeObserver.observe(element,{box:`border-box`}),()=>resizeObserver.unobserve(element)}else setSize(void 0)},[element]),size$3}var CHECKBOX_NAME=`Checkbox`,[createCheckboxContext,createCheckboxScope]=createContextScope(CHECKBOX_NAME),[CheckboxProviderImpl,useCheckboxContext]=createCheckboxContext(CHECKBOX_NAME);function CheckboxProvider(props){let{__scopeCheckbox,checked:checkedProp,children,defaultChecked,disabled,form,name,onCheckedChange,required,value:value$1=`on`,internal_do_not_use_render}=props,[checked,setChecked]=useControllableState({prop:checkedProp,defaultProp:defaultChecked??!1,onChange:onCheckedChange,caller:CHECKBOX_NAME}),[control,setControl]=import_react.useState(null),[bubbleInput,setBubbleInput]=import_react.useState(null),hasConsumerStoppedPropagationRef=import_react.useRef(!1),isFormControl=control?!!form||!!control.closest(`form`):!0,context={checked,disabled,setChecked,control,setControl,name,form,value:value$1,hasConsumerStoppedPropagationRef,required,defaultChecked:isIndeterminate$1(defaultChecked)?!1:defaultChecked,isFormControl,bubbleInput,setBubbleInput};return(0,import_jsx_runtime.jsx)(CheckboxProviderImpl,{scope:__scopeCheckbox,...context,children:isFunction(internal_do_not_use_render)?internal_do_not_use_render(context):children})}var TRIGGER_NAME$8=`CheckboxTrigger`,CheckboxTrigger=import_react.forwardRef(({__scopeCheckbox,onKeyDown,onClick,...checkboxProps},forwardedRef)=>{let{control,value:value$1,disabled,checked,required,setControl,setChecked,hasConsumerStoppedPropagationRef,isFormControl,bubbleInput}=useCheckboxContext(TRIGGER_NAME$8,__scopeCheckbox),composedRefs=useComposedRefs(forwardedRef,setControl),initialCheckedStateRef=import_react.useRef(checked);return import_react.useEffect(()=>{let form=control?.form;if(form){let reset=()=>setChecked(initialCheckedStateRef.current);return form.addEventListener(`reset`,reset),()=>form.removeEventListener(`reset`,reset)}},[control,setChecked]),(0,import_jsx_runtime.jsx)(Primitive$1.button,{type:`button`,role:`checkbox`,"aria-checked":isIndeterminate$1(checked)?`mixed`:checked,"aria-required":required,"data-state":getState$3(checked),"data-disabled":disabled?``:void 0,disabled,value:value$1,...checkboxProps,ref:composedRefs,onKeyDown:composeEventHandlers(onKeyDown,event=>{event.key===`Enter`&&event.preventDefault()}),onClick:composeEventHandlers(onClick,event=>{setChecked(prevChecked=>isIndeterminate$1(prevChecked)?!0:!prevChecked),bubbleInput&&isFormControl&&(hasConsumerStoppedPropagationRef.current=event.isPropagationStopped(),hasConsumerStoppedPropagationRef.current||event.stopPropagation())})})});CheckboxTrigger.displayName=TRIGGER_NAME$8;var Checkbox=import_react.forwardRef((props,forwardedRef)=>{let{__scopeCheckbox,name,checked,defaultChecked,required,disabled,value:value$1,onCheckedChange,form,...checkboxProps}=props;return(0,import_jsx_runtime.jsx)(CheckboxProvider,{__scopeCheckbox,checked,defaultChecked,disabled,required,onCheckedChange,name,form,value:value$1,internal_do_not_use_render:({isFormControl})=>(0,import_jsx_runtime.jsxs)(import_jsx_runtime.Fragment,{children:[(0,import_jsx_runtime.jsx)(CheckboxTrigger,{...checkboxProps,ref:forwardedRef,__scopeCheckbox}),isFormControl&&(0,import_jsx_runtime.jsx)(CheckboxBubbleInput,{__scopeCheckbox})]})})});Checkbox.displayName=CHECKBOX_NAME;var INDICATOR_NAME$5=`CheckboxIndicator`,CheckboxIndicator=import_react.forwardRef((props,forwardedRef)=>{let{__scopeCheckbox,forceMount,...indicatorProps}=props,context=useCheckboxContext(INDICATOR_NAME$5,__scopeCheckbox);return(0,import_jsx_runtime.jsx)(Presence,{present:forceMount||isIndeterminate$1(context.checked)||context.checked===!0,children:(0,import_jsx_runtime.jsx)(Primitive$1.span,{"data-state":getState$3(context.checked),"data-disabled":context.disabled?``:void 0,...indicatorProps,ref:forwardedRef,style:{pointerEvents:`none`,...props.style}})})});CheckboxIndicator.displayName=INDICATOR_NAME$5;var BUBBLE_INPUT_NAME$4=`CheckboxBubbleInput`,CheckboxBubbleInput=import_react.forwardRef(({__scopeCheckbox,...props},forwardedRef)=>{let{control,hasConsumerStoppedPropagationRef,checked,defaultChecked,required,disabled,name,value:value$1,form,bubbleInput,setBubbleInput}=useCheckboxContext(BUBBLE_INPUT_NAME$4,__scopeCheckbox),composedRefs=useComposedRefs(forwardedRef,setBubbleInput),prevChecked=usePrevious(checked),controlSize=useSize(control);import_react.useEffect(()=>{let input=bubbleInput;if(!input)return;let inputProto=window.HTMLInputElement.prototype,setChecked=Object.getOwnPropertyDescriptor(inputProto,`checked`).set,bubbles=!hasConsumerStoppedPropagationRef.current;if(prevChecked!==checked&&setChecked){let event=new Event(`click`,{bubbles});input.indeterminate=isIndeterminate$1(checked),setChecked.call(input,isIndeterminate$1(checked)?!1:checked),input.dispatchEvent(event)}},[bubbleInput,prevChecked,checked,hasConsumerStoppedPropagationRef]);let defaultCheckedRef=import_react.useRef(isIndeterminate$1(checked)?!1:checked);return(0,import_jsx_runtime.jsx)(Primitive$1.input,{type:`checkbox`,"aria-hidden":!0,defaultChecked:defaultChecked??defaultCheckedRef.current,required,disabled,name,value:value$1,form,...props,tabIndex:-1,ref:composedRefs,style:{...props.style,...controlSize,position:`absolute`,pointerEvents:`none`,opacity:0,margin:0,transform:`translateX(-100%)`}})});CheckboxBubbleInput.displayName=BUBBLE_INPUT_NAME$4;function isFunction(value$1){return typeof value$1==`function`}function isIndeterminate$1(checked){return checked===`indeterminate`}function getState$3(checked){return isIndeterminate$1(checked)?`indeterminate`:checked?`checked`:`unchecked`}var sides=[`top`,`right`,`bottom`,`left`],min=Math.min,max=Math.max,round=Math.round,floor=Math.floor,createCoords=v$10=>({x:v$10,y:v$10}),oppositeSideMap={left:`right`,right:`left`,bottom:`top`,top:`bottom`},oppositeAlignmentMap={start:`end`,end:`start`};function clamp$1(start,value$1,end){return max(start,min(value$1,end))}function evaluate(value$1,param){return typeof value$1==`function`?value$1(param):value$1}function getSide(placement){return placement.split(`-`)[0]}function getAlignment(placement){return placement.split(`-`)[1]}function getOppositeAxis(axis){return axis===`x`?`y`:`x`}function getAxisLength(axis){return axis===`y`?`height`:`width`}var yAxisSides=new Set([`top`,`bottom`]);function getSideAxis(placement){return yAxisSides.has(getSide(placement))?`y`:`x`}function getAlignmentAxis(placement){return getOppositeAxis(getSideAxis(placement))}function getAlignmentSides(placement,rects,rtl){rtl===void 0&&(rtl=!1);let alignment=getAlignment(placement),alignmentAxis=getAlignmentAxis(placement),length=getAxisLength(alignmentAxis),mainAlignmentSide=alignmentAxis===`x`?alignment===(rtl?`end`:`start`)?`right`:`left`:alignment===`start`?`bottom`:`top`;return rects.reference[length]>rects.floating[length]&&(mainAlignmentSide=getOppositePlacement(mainAlignmentSide)),[mainAlignmentSide,getOppositePlacement(mainAlignmentSide)]}function getExpandedPlacements(placement){let oppositePlacement=getOppositePlacement(placement);return[getOppositeAlignmentPlacement(placement),oppositePlacement,getOppositeAlignmentPlacement(oppositePlacement)]}function getOppositeAlignmentPlacement(placement){return placement.replace(/start|end/g,alignment=>oppositeAlignmentMap[alignment])}var lrPlacement=[`left`,`right`],rlPlacement=[`right`,`left`],tbPlacement=[`top`,`bottom`],btPlacement=[`bottom`,`top`];function getSideList(side,isStart,rtl){switch(side){case`top`:case`bottom`:return rtl?isStart?rlPlacement:lrPlacement:isStart?lrPlacement:rlPlacement;case`left`:case`right`:return isStart?tbPlacement:btPlacement;default:return[]}}function getOppositeAxisPlacements(placement,flipAlignment,direction,rtl){let alignment=getAlignment(placement),list=getSideList(getSide(placement),direction===`start`,rtl);return alignment&&(list=list.map(side=>side+`-`+alignment),flipAlignment&&(list=list.concat(list.map(getOppositeAlignmentPlacement)))),list}function getOppositePlacement(placement){return placement.replace(/left|right|bottom|top/g,side=>oppositeSideMap[side])}function expandPaddingObject(padding){return{top:0,right:0,bottom:0,left:0,...padding}}function getPaddingObject(padding){return typeof padding==`number`?{top:padding,right:padding,bottom:padding,left:padding}:expandPaddingObject(padding)}function rectToClientRect(rect){let{x:x$3,y:y$6,width,height}=rect;return{width,height,top:y$6,left:x$3,right:x$3+width,bottom:y$6+height,x:x$3,y:y$6}}function computeCoordsFromPlacement(_ref,placement,rtl){let{reference,floating}=_ref,sideAxis=getSideAxis(placement),alignmentAxis=getAlignmentAxis(placement),alignLength=getAxisLength(alignmentAxis),side=getSide(placement),isVertical=sideAxis===`y`,commonX=reference.x+reference.width/2-floating.width/2,commonY=reference.y+reference.height/2-floating.height/2,commonAlign=reference[alignLength]/2-floating[alignLength]/2,coords;switch(side){case`top`:coords={x:commonX,y:reference.y-floating.height};break;case`bottom`:coords={x:commonX,y:reference.y+reference.height};break;case`right`:coords={x:reference.x+reference.width,y:commonY};break;case`left`:coords={x:reference.x-floating.width,y:commonY};break;default:coords={x:reference.x,y:reference.y}}switch(getAlignment(placement)){case`start`:coords[alignmentAxis]-=commonAlign*(rtl&&isVertical?-1:1);break;case`end`:coords[alignmentAxis]+=commonAlign*(rtl&&isVertical?-1:1);break}return coords}var computePosition$1=async(reference,floating,config)=>{let{placement=`bottom`,strategy=`absolute`,middleware=[],platform:platform$1}=config,validMiddleware=middleware.filter(Boolean),rtl=await(platform$1.isRTL==null?void 0:platform$1.isRTL(floating)),rects=await platform$1.getElementRects({reference,floating,strategy}),{x:x$3,y:y$6}=computeCoordsFromPlacement(rects,placement,rtl),statefulPlacement=placement,middlewareData={},resetCount=0;for(let i$23=0;i$23<validMiddleware.length;i$23++){let{name,fn}=validMiddleware[i$23],{x:nextX,y:nextY,data,reset}=await fn({x:x$3,y:y$6,initialPlacement:placement,placement:statefulPlacement,strategy,middlewareData,rects,platform:platform$1,elements:{reference,floating}});x$3=nextX??x$3,y$6=nextY??y$6,middlewareData={...middlewareData,[name]:{...middlewareData[name],...data}},reset&&resetCount<=50&&(resetCount++,typeof reset==`object`&&(reset.placement&&(statefulPlacement=reset.placement),reset.rects&&(rects=reset.rects===!0?await platform$1.getElementRects({reference,floating,strategy}):reset.rects),{x:x$3,y:y$6}=computeCoordsFromPlacement(rects,statefulPlacement,rtl)),i$23=-1)}return{x:x$3,y:y$6,placement:statefulPlacement,strategy,middlewareData}};async function detectOverflow$1(state,options$1){var _await$platform$isEle;options$1===void 0&&(options$1={});let{x:x$3,y:y$6,platform:platform$1,rects,elements,strategy}=state,{boundary=`clippingAncestors`,rootBoundary=`viewport`,elementContext=`floating`,altBoundary=!1,padding=0}=evaluate(options$1,state),paddingObject=getPaddingObject(padding),element=elements[altBoundary?elementContext===`floating`?`reference`:`floating`:elementContext],clippingClientRect=rectToClientRect(await platform$1.getClippingRect({element:await(platform$1.isElement==null?void 0:platform$1.isElement(element))??!0?element:element.contextElement||await(platform$1.getDocumentElement==null?void 0:platform$1.getDocumentElement(elements.floating)),boundary,rootBoundary,strategy})),rect=elementContext===`floating`?{x:x$3,y:y$6,width:rects.floating.width,height:rects.floating.height}:rects.reference,offsetParent=await(platform$1.getOffsetParent==null?void 0:platform$1.getOffsetParent(elements.floating)),offsetScale=await(platform$1.isElement==null?void 0:platform$1.isElement(offsetParent))&&await(platform$1.getScale==null?void 0:platform$1.getScale(offsetParent))||{x:1,y:1},elementClientRect=rectToClientRect(platform$1.convertOffsetParentRelativeRectToViewportRelativeRect?await platform$1.convertOffsetParentRelativeRectToViewportRelativeRect({elements,rect,offsetParent,strategy}):rect);return{top:(clippingClientRect.top-elementClientRect.top+paddingObject.top)/offsetScale.y,bottom:(elementClientRect.bottom-clippingClientRect.bottom+paddingObject.bottom)/offsetScale.y,left:(clippingClientRect.left-elementClientRect.left+paddingObject.left)/offsetScale.x,right:(elementClientRect.right-clippingClientRect.right+paddingObject.right)/offsetScale.x}}var arrow$2=options$1=>({name:`arrow`,options:options$1,async fn(state){let{x:x$3,y:y$6,placement,rects,platform:platform$1,elements,middlewareData}=state,{element,padding=0}=evaluate(options$1,state)||{};if(element==null)return{};let paddingObject=getPaddingObject(padding),coords={x:x$3,y:y$6},axis=getAlignmentAxis(placement),length=getAxisLength(axis),arrowDimensions=await platform$1.getDimensions(element),isYAxis=axis===`y`,minProp=isYAxis?`top`:`left`,maxProp=isYAxis?`bottom`:`right`,clientProp=isYAxis?`clientHeight`:`clientWidth`,endDiff=rects.reference[length]+rects.reference[axis]-coords[axis]-rects.floating[length],startDiff=coords[axis]-rects.reference[axis],arrowOffsetParent=await(platform$1.getOffsetParent==null?void 0:platform$1.getOffsetParent(element)),clientSize=arrowOffsetParent?arrowOffsetParent[clientProp]:0;(!clientSize||!await(platform$1.isElement==null?void 0:platform$1.isElement(arrowOffsetParent)))&&(clientSize=elements.floating[clientProp]||rects.floating[length]);let centerToReference=endDiff/2-startDiff/2,largestPossiblePadding=clientSize/2-arrowDimensions[length]/2-1,minPadding=min(paddingObject[minProp],largestPossiblePadding),maxPadding=min(paddingObject[maxProp],largestPossiblePadding),min$1=minPadding,max$1=clientSize-arrowDimensions[length]-maxPadding,center=clientSize/2-arrowDimensions[length]/2+centerToReference,offset$3=clamp$1(min$1,center,max$1),shouldAddOffset=!middlewareData.arrow&&getAlignment(placement)!=null&&center!==offset$3&&rects.reference[length]/2-(center<min$1?minPadding:maxPadding)-arrowDimensions[length]/2<0,alignmentOffset=shouldAddOffset?center<min$1?center-min$1:center-max$1:0;return{[axis]:coords[axis]+alignmentOffset,data:{[axis]:offset$3,centerOffset:center-offset$3-alignmentOffset,...shouldAddOffset&&{alignmentOffset}},reset:shouldAddOffset}}}),flip$2=function(options$1){return options$1===void 0&&(options$1={}),{name:`flip`,options:options$1,async fn(state){var _middlewareData$arrow,_middlewareData$flip;let{placement,middlewareData,rects,initialPlacement,platform:platform$1,elements}=state,{mainAxis:checkMainAxis=!0,crossAxis:checkCrossAxis=!0,fallbackPlacements:specifiedFallbackPlacements,fallbackStrategy=`bestFit`,fallbackAxisSideDirection=`none`,flipAlignment=!0,...detectOverflowOptions}=evaluate(options$1,state);if((_middlewareData$arrow=middlewareData.arrow)!=null&&_middlewareData$arrow.alignmentOffset)return{};let side=getSide(placement),initialSideAxis=getSideAxis(initialPlacement),isBasePlacement=getSide(initialPlacement)===initialPlacement,rtl=await(platform$1.isRTL==null?void 0:platform$1.isRTL(elements.floating)),fallbackPlacements=specifiedFallbackPlacements||(isBasePlacement||!flipAlignment?[getOppositePlacement(initialPlacement)]:getExpandedPlacements(initialPlacement)),hasFallbackAxisSideDirection=fallbackAxisSideDirection!==`none`;!specifiedFallbackPlacements&&hasFallbackAxisSideDirection&&fallbackPlacements.push(...getOppositeAxisPlacements(initialPlacement,flipAlignment,fallbackAxisSideDirection,rtl));let placements$1=[initialPlacement,...fallbackPlacements],overflow=await detectOverflow$1(state,detectOverflowOptions),overflows=[],overflowsData=middlewareData.flip?.overflows||[];if(checkMainAxis&&overflows.push(overflow[side]),checkCrossAxis){let sides$1=getAlignmentSides(placement,rects,rtl);overflows.push(overflow[sides$1[0]],overflow[sides$1[1]])}if(overflowsData=[...overflowsData,{placement,overflows}],!overflows.every(side$1=>side$1<=0)){var _middlewareData$flip2,_overflowsData$filter;let nextIndex=(middlewareData.flip?.index||0)+1,nextPlacement=placements$1[nextIndex];if(nextPlacement&&(!(checkCrossAxis===`alignment`&&initialSideAxis!==getSideAxis(nextPlacement))||overflowsData.every(d$9=>getSideAxis(d$9.placement)===initialSideAxis?d$9.overflows[0]>0:!0)))return{data:{index:nextIndex,overflows:overflowsData},reset:{placement:nextPlacement}};let resetPlacement=overflowsData.filter(d$9=>d$9.overflows[0]<=0).sort((a$37,b$5)=>a$37.overflows[1]-b$5.overflows[1])[0]?.placement;if(!resetPlacement)switch(fallbackStrategy){case`bestFit`:{var _overflowsData$filter2;let placement$1=overflowsData.filter(d$9=>{if(hasFallbackAxisSideDirection){let currentSideAxis=getSideAxis(d$9.placement);return currentSideAxis===initialSideAxis||currentSideAxis===`y`}return!0}).map(d$9=>[d$9.placement,d$9.overflows.filter(overflow$1=>overflow$1>0).reduce((acc,overflow$1)=>acc+overflow$1,0)]).sort((a$37,b$5)=>a$37[1]-b$5[1])[0]?.[0];placement$1&&(resetPlacement=placement$1);break}case`initialPlacement`:resetPlacement=initialPlacement;break}if(placement!==resetPlacement)return{reset:{placement:resetPlacement}}}return{}}}};function getSideOffsets(overflow,rect){return{top:overflow.top-rect.height,right:overflow.right-rect.width,bottom:overflow.bottom-rect.height,left:overflow.left-rect.width}}function isAnySideFullyClipped(overflow){return sides.some(side=>overflow[side]>=0)}var hide$2=function(options$1){return options$1===void 0&&(options$1={}),{name:`hide`,options:options$1,async fn(state){let{rects}=state,{strategy=`referenceHidden`,...detectOverflowOptions}=evaluate(options$1,state);switch(strategy){case`referenceHidden`:{let overflow=await detectOverflow$1(state,{...detectOverflowOptions,elementContext:`reference`}),offsets=getSideOffsets(overflow,rects.reference);return{data:{referenceHiddenOffsets:offsets,referenceHidden:isAnySideFullyClipped(offsets)}}}case`escaped`:{let overflow=await detectOverflow$1(state,{...detectOverflowOptions,altBoundary:!0}),offsets=getSideOffsets(overflow,rects.floating);return{data:{escapedOffsets:offsets,escaped:isAnySideFullyClipped(offsets)}}}default:return{}}}}},originSides=new Set([`left`,`top`]);async function convertValueToCoords(state,options$1){let{placement,platform:platform$1,elements}=state,rtl=await(platform$1.isRTL==null?void 0:platform$1.isRTL(elements.floating)),side=getSide(placement),alignment=getAlignment(placement),isVertical=getSideAxis(placement)===`y`,mainAxisMulti=originSides.has(side)?-1:1,crossAxisMulti=rtl&&isVertical?-1:1,rawValue=evaluate(options$1,state),{mainAxis,crossAxis,alignmentAxis}=typeof rawValue==`number`?{mainAxis:rawValue,crossAxis:0,alignmentAxis:null}:{mainAxis:rawValue.mainAxis||0,crossAxis:rawValue.crossAxis||0,alignmentAxis:rawValue.alignmentAxis};return alignment&&typeof alignmentAxis==`number`&&(crossAxis=alignment===`end`?alignmentAxis*-1:alignmentAxis),isVertical?{x:crossAxis*crossAxisMulti,y:mainAxis*mainAxisMulti}:{x:mainAxis*mainAxisMulti,y:crossAxis*crossAxisMulti}}var offset$2=function(options$1){return options$1===void 0&&(options$1=0),{name:`offset`,options:options$1,async fn(state){var _middlewareData$offse,_middlewareData$arrow;let{x:x$3,y:y$6,placement,middlewareData}=state,diffCoords=await convertValueToCoords(state,options$1);return placement===middlewareData.offset?.placement&&(_middlewareData$arrow=middlewareData.arrow)!=null&&_middlewareData$arrow.alignmentOffset?{}:{x:x$3+diffCoords.x,y:y$6+diffCoords.y,data:{...diffCoords,placement}}}}},shift$2=function(options$1){return options$1===void 0&&(options$1={}),{name:`shift`,options:options$1,async fn(state){let{x:x$3,y:y$6,placement}=state,{mainAxis:checkMainAxis=!0,crossAxis:checkCrossAxis=!1,limiter={fn:_ref=>{let{x:x$4,y:y$7}=_ref;return{x:x$4,y:y$7}}},...detectOverflowOptions}=evaluate(options$1,state),coords={x:x$3,y:y$6},overflow=await detectOverflow$1(state,detectOverflowOptions),crossAxis=getSideAxis(getSide(placement)),mainAxis=getOppositeAxis(crossAxis),mainAxisCoord=coords[mainAxis],crossAxisCoord=coords[crossAxis];if(checkMainAxis){let minSide=mainAxis===`y`?`top`:`left`,maxSide=mainAxis===`y`?`bottom`:`right`,min$1=mainAxisCoord+overflow[minSide],max$1=mainAxisCoord-overflow[maxSide];mainAxisCoord=clamp$1(min$1,mainAxisCoord,max$1)}if(checkCrossAxis){let minSide=crossAxis===`y`?`top`:`left`,maxSide=crossAxis===`y`?`bottom`:`right`,min$1=crossAxisCoord+overflow[minSide],max$1=crossAxisCoord-overflow[maxSide];crossAxisCoord=clamp$1(min$1,crossAxisCoord,max$1)}let limitedCoords=limiter.fn({...state,[mainAxis]:mainAxisCoord,[crossAxis]:crossAxisCoord});return{...limitedCoords,data:{x:limitedCoords.x-x$3,y:limitedCoords.y-y$6,enabled:{[mainAxis]:checkMainAxis,[crossAxis]:checkCrossAxis}}}}}},limitShift$2=function(options$1){return options$1===void 0&&(options$1={}),{options:options$1,fn(state){let{x:x$3,y:y$6,placement,rects,middlewareData}=state,{offset:offset$3=0,mainAxis:checkMainAxis=!0,crossAxis:checkCrossAxis=!0}=evaluate(options$1,state),coords={x:x$3,y:y$6},crossAxis=getSideAxis(placement),mainAxis=getOppositeAxis(crossAxis),mainAxisCoord=coords[mainAxis],crossAxisCoord=coords[crossAxis],rawOffset=evaluate(offset$3,state),computedOffset=typeof rawOffset==`number`?{mainAxis:rawOffset,crossAxis:0}:{mainAxis:0,crossAxis:0,...rawOffset};if(checkMainAxis){let len=mainAxis===`y`?`height`:`width`,limitMin=rects.reference[mainAxis]-rects.floating[len]+computedOffset.mainAxis,limitMax=rects.reference[mainAxis]+rects.reference[len]-computedOffset.mainAxis;mainAxisCoord<limitMin?mainAxisCoord=limitMin:mainAxisCoord>limitMax&&(mainAxisCoord=limitMax)}if(checkCrossAxis){var _middlewareData$offse,_middlewareData$offse2;let len=mainAxis===`y`?`width`:`height`,isOriginSide=originSides.has(getSide(placement)),limitMin=rects.reference[crossAxis]-rects.floating[len]+(isOriginSide&&middlewareData.offset?.[crossAxis]||0)+(isOriginSide?0:computedOffset.crossAxis),limitMax=rects.reference[crossAxis]+rects.reference[len]+(isOriginSide?0:middlewareData.offset?.[crossAxis]||0)-(isOriginSide?computedOffset.crossAxis:0);crossAxisCoord<limitMin?crossAxisCoord=limitMin:crossAxisCoord>limitMax&&(crossAxisCoord=limitMax)}return{[mainAxis]:mainAxisCoord,[crossAxis]:crossAxisCoord}}}},size$2=function(options$1){return options$1===void 0&&(options$1={}),{name:`size`,options:options$1,async fn(state){var _state$middlewareData,_state$middlewareData2;let{placement,rects,platform:platform$1,elements}=state,{apply=()=>{},...detectOverflowOptions}=evaluate(options$1,state),overflow=await detectOverflow$1(state,detectOverflowOptions),side=getSide(placement),alignment=getAlignment(placement),isYAxis=getSideAxis(placement)===`y`,{width,height}=rects.floating,heightSide,widthSide;side===`top`||side===`bottom`?(heightSide=side,widthSide=alignment===(await(platform$1.isRTL==null?void 0:platform$1.isRTL(elements.floating))?`start`:`end`)?`left`:`right`):(widthSide=side,heightSide=alignment===`end`?`top`:`bottom`);let maximumClippingHeight=height-overflow.top-overflow.bottom,maximumClippingWidth=width-overflow.left-overflow.right,overflowAvailableHeight=min(height-overflow[heightSide],maximumClippingHeight),overflowAvailableWidth=min(width-overflow[widthSide],maximumClippingWidth),noShift=!state.middlewareData.shift,availableHeight=overflowAvailableHeight,availableWidth=overflowAvailableWidth;if((_state$middlewareData=state.middlewareData.shift)!=null&&_state$middlewareData.enabled.x&&(availableWidth=maximumClippingWidth),(_state$middlewareData2=state.middlewareData.shift)!=null&&_state$middlewareData2.enabled.y&&(availableHeight=maximumClippingHeight),noShift&&!alignment){let xMin=max(overflow.left,0),xMax=max(overflow.right,0),yMin=max(overflow.top,0),yMax=max(overflow.bottom,0);isYAxis?availableWidth=width-2*(xMin!==0||xMax!==0?xMin+xMax:max(overflow.left,overflow.right)):availableHeight=height-2*(yMin!==0||yMax!==0?yMin+yMax:max(overflow.top,overflow.bottom))}await apply({...state,availableWidth,availableHeight});let nextDimensions=await platform$1.getDimensions(elements.floating);return width!==nextDimensions.width||height!==nextDimensions.height?{reset:{rects:!0}}:{}}}};function hasWindow(){return typeof window<`u`}function getNodeName(node){return isNode(node)?(node.nodeName||``).toLowerCase():`#document`}function getWindow(node){var _node$ownerDocument;return(node==null||(_node$ownerDocument=node.ownerDocument)==null?void 0:_node$ownerDocument.defaultView)||window}function getDocumentElement(node){var _ref;return((isNode(node)?node.ownerDocument:node.document)||window.document)?.documentElement}function isNode(value$1){return hasWindow()?value$1 instanceof Node||value$1 instanceof getWindow(value$1).Node:!1}function isElement(value$1){return hasWindow()?value$1 instanceof Element||value$1 instanceof getWindow(value$1).Element:!1}function isHTMLElement(value$1){return hasWindow()?value$1 instanceof HTMLElement||value$1 instanceof getWindow(value$1).HTMLElement:!1}function isShadowRoot(value$1){return!hasWindow()||typeof ShadowRoot>`u`?!1:value$1 instanceof ShadowRoot||value$1 instanceof getWindow(value$1).ShadowRoot}var invalidOverflowDisplayValues=new Set([`inline`,`contents`]);function isOverflowElement(element){let{overflow,overflowX,overflowY,display}=getComputedStyle$1(element);return/auto|scroll|overlay|hidden|clip/.test(overflow+overflowY+overflowX)&&!invalidOverflowDisplayValues.has(display)}var tableElements=new Set([`table`,`td`,`th`]);function isTableElement(element){return tableElements.has(getNodeName(element))}var topLayerSelectors=[`:popover-open`,`:modal`];function isTopLayer(element){return topLayerSelectors.some(selector=>{try{return element.matches(selector)}catch{return!1}})}var transformProperties=[`transform`,`translate`,`scale`,`rotate`,`perspective`],willChangeValues=[`transform`,`translate`,`scale`,`rotate`,`perspective`,`filter`],containValues=[`paint`,`layout`,`strict`,`content`];function isContainingBlock(elementOrCss){let webkit=isWebKit(),css=isElement(elementOrCss)?getComputedStyle$1(elementOrCss):elementOrCss;return transformProperties.some(value$1=>css[value$1]?css[value$1]!==`none`:!1)||(css.containerType?css.containerType!==`normal`:!1)||!webkit&&(css.backdropFilter?css.backdropFilter!==`none`:!1)||!webkit&&(css.filter?css.filter!==`none`:!1)||willChangeValues.some(value$1=>(css.willChange||``).includes(value$1))||containValues.some(value$1=>(css.contain||``).includes(value$1))}function getContainingBlock(element){let currentNode=getParentNode(element);for(;isHTMLElement(currentNode)&&!isLastTraversableNode(currentNode);){if(isContainingBlock(currentNode))return currentNode;if(isTopLayer(currentNode))return null;currentNode=getParentNode(currentNode)}return null}function isWebKit(){return typeof CSS>`u`||!CSS.supports?!1:CSS.supports(`-webkit-backdrop-filter`,`none`)}var lastTraversableNodeNames=new Set([`html`,`body`,`#document`]);function isLastTraversableNode(node){return lastTraversableNodeNames.has(getNodeName(node))}function getComputedStyle$1(element){return getWindow(element).getComputedStyle(element)}function getNodeScroll(element){return isElement(element)?{scrollLeft:element.scrollLeft,scrollTop:element.scrollTop}:{scrollLeft:element.scrollX,scrollTop:element.scrollY}}function getParentNode(node){if(getNodeName(node)===`html`)return node;let result=node.assignedSlot||node.parentNode||isShadowRoot(node)&&node.host||getDocumentElement(node);return isShadowRoot(result)?result.host:result}function getNearestOverflowAncestor(node){let parentNode=getParentNode(node);return isLastTraversableNode(parentNode)?node.ownerDocument?node.ownerDocument.body:node.body:isHTMLElement(parentNode)&&isOverflowElement(parentNode)?parentNode:getNearestOverflowAncestor(parentNode)}function getOverflowAncestors(node,list,traverseIframes){var _node$ownerDocument2;list===void 0&&(list=[]),traverseIframes===void 0&&(traverseIframes=!0);let scrollableAncestor=getNearestOverflowAncestor(node),isBody=scrollableAncestor===node.ownerDocument?.body,win=getWindow(scrollableAncestor);if(isBody){let frameElement=getFrameElement(win);return list.concat(win,win.visualViewport||[],isOverflowElement(scrollableAncestor)?scrollableAncestor:[],frameElement&&traverseIframes?getOverflowAncestors(frameElement):[])}return list.concat(scrollableAncestor,getOverflowAncestors(scrollableAncestor,[],traverseIframes))}function getFrameElement(win){return win.parent&&Object.getPrototypeOf(win.parent)?win.frameElement:null}function getCssDimensions(element){let css=getComputedStyle$1(element),width=parseFloat(css.width)||0,height=parseFloat(css.height)||0,hasOffset=isHTMLElement(element),offsetWidth=hasOffset?element.offsetWidth:width,offsetHeight=hasOffset?element.offsetHeight:height,shouldFallback=round(width)!==offsetWidth||round(height)!==offsetHeight;return shouldFallback&&(width=offsetWidth,height=offsetHeight),{width,height,$:shouldFallback}}function unwrapElement(element){return isElement(element)?element:element.contextElement}function getScale(element){let domElement=unwrapElement(element);if(!isHTMLElement(domElement))return createCoords(1);let rect=domElement.getBoundingClientRect(),{width,height,$}=getCssDimensions(domElement),x$3=($?round(rect.width):rect.width)/width,y$6=($?round(rect.height):rect.height)/height;return(!x$3||!Number.isFinite(x$3))&&(x$3=1),(!y$6||!Number.isFinite(y$6))&&(y$6=1),{x:x$3,y:y$6}}var noOffsets=createCoords(0);function getVisualOffsets(element){let win=getWindow(element);return!isWebKit()||!win.visualViewport?noOffsets:{x:win.visualViewport.offsetLeft,y:win.visualViewport.offsetTop}}function shouldAddVisualOffsets(element,isFixed,floatingOffsetParent){return isFixed===void 0&&(isFixed=!1),!floatingOffsetParent||isFixed&&floatingOffsetParent!==getWindow(element)?!1:isFixed}function getBoundingClientRect(element,includeScale,isFixedStrategy,offsetParent){includeScale===void 0&&(includeScale=!1),isFixedStrategy===void 0&&(isFixedStrategy=!1);let clientRect=element.getBoundingClientRect(),domElement=unwrapElement(element),scale=createCoords(1);includeScale&&(offsetParent?isElement(offsetParent)&&(scale=getScale(offsetParent)):scale=getScale(element));let visualOffsets=shouldAddVisualOffsets(domElement,isFixedStrategy,offsetParent)?getVisualOffsets(domElement):createCoords(0),x$3=(clientRect.left+visualOffsets.x)/scale.x,y$6=(clientRect.top+visualOffsets.y)/scale.y,width=clientRect.width/scale.x,height=clientRect.height/scale.y;if(domElement){let win=getWindow(domElement),offsetWin=offsetParent&&isElement(offsetParent)?getWindow(offsetParent):offsetParent,currentWin=win,currentIFrame=getFrameElement(currentWin);for(;currentIFrame&&offsetParent&&offsetWin!==currentWin;){let iframeScale=getScale(currentIFrame),iframeRect=currentIFrame.getBoundingClientRect(),css=getComputedStyle$1(currentIFrame),left=iframeRect.left+(currentIFrame.clientLeft+parseFloat(css.paddingLeft))*iframeScale.x,top=iframeRect.top+(currentIFrame.clientTop+parseFloat(css.paddingTop))*iframeScale.y;x$3*=iframeScale.x,y$6*=iframeScale.y,width*=iframeScale.x,height*=iframeScale.y,x$3+=left,y$6+=top,currentWin=getWindow(currentIFrame),currentIFrame=getFrameElement(currentWin)}}return rectToClientRect({width,height,x:x$3,y:y$6})}function getWindowScrollBarX(element,rect){let leftScroll=getNodeScroll(element).scrollLeft;return rect?rect.left+leftScroll:getBoundingClientRect(getDocumentElement(element)).left+leftScroll}function getHTMLOffset(documentElement,scroll){let htmlRect=documentElement.getBoundingClientRect(),x$3=htmlRect.left+scroll.scrollLeft-getWindowScrollBarX(documentElement,htmlRect),y$6=htmlRect.top+scroll.scrollTop;return{x:x$3,y:y$6}}function convertOffsetParentRelativeRectToViewportRelativeRect(_ref){let{elements,rect,offsetParent,strategy}=_ref,isFixed=strategy===`fixed`,documentElement=getDocumentElement(offsetParent),topLayer=elements?isTopLayer(elements.floating):!1;if(offsetParent===documentElement||topLayer&&isFixed)return rect;let scroll={scrollLeft:0,scrollTop:0},scale=createCoords(1),offsets=createCoords(0),isOffsetParentAnElement=isHTMLElement(offsetParent);if((isOffsetParentAnElement||!isOffsetParentAnElement&&!isFixed)&&((getNodeName(offsetParent)!==`body`||isOverflowElement(documentElement))&&(scroll=getNodeScroll(offsetParent)),isHTMLElement(offsetParent))){let offsetRect=getBoundingClientRect(offsetParent);scale=getScale(offsetParent),offsets.x=offsetRect.x+offsetParent.clientLeft,offsets.y=offsetRect.y+offsetParent.clientTop}let htmlOffset=documentElement&&!isOffsetParentAnElement&&!isFixed?getHTMLOffset(documentElement,scroll):createCoords(0);return{width:rect.width*scale.x,height:rect.height*scale.y,x:rect.x*scale.x-scroll.scrollLeft*scale.x+offsets.x+htmlOffset.x,y:rect.y*scale.y-scroll.scrollTop*scale.y+offsets.y+htmlOffset.y}}function getClientRects(element){return Array.from(element.getClientRects())}function getDocumentRect(element){let html=getDocumentElement(element),scroll=getNodeScroll(element),body=element.ownerDocument.body,width=max(html.scrollWidth,html.clientWidth,body.scrollWidth,body.clientWidth),height=max(html.scrollHeight,html.clientHeight,body.scrollHeight,body.clientHeight),x$3=-scroll.scrollLeft+getWindowScrollBarX(element),y$6=-scroll.scrollTop;return getComputedStyle$1(body).direction===`rtl`&&(x$3+=max(html.clientWidth,body.clientWidth)-width),{width,height,x:x$3,y:y$6}}var SCROLLBAR_MAX=25;function getViewportRect(element,strategy){let win=getWindow(element),html=getDocumentElement(element),visualViewport=win.visualViewport,width=html.clientWidth,height=html.clientHeight,x$3=0,y$6=0;if(visualViewport){width=visualViewport.width,height=visualViewport.height;let visualViewportBased=isWebKit();(!visualViewportBased||visualViewportBased&&strategy===`fixed`)&&(x$3=visualViewport.offsetLeft,y$6=visualViewport.offsetTop)}let windowScrollbarX=getWindowScrollBarX(html);if(windowScrollbarX<=0){let doc=html.ownerDocument,body=doc.body,bodyStyles=getComputedStyle(body),bodyMarginInline=doc.compatMode===`CSS1Compat`&&parseFloat(bodyStyles.marginLeft)+parseFloat(bodyStyles.marginRight)||0,clippingStableScrollbarWidth=Math.abs(html.clientWidth-body.clientWidth-bodyMarginInline);clippingStableScrollbarWidth<=SCROLLBAR_MAX&&(width-=clippingStableScrollbarWidth)}else windowScrollbarX<=SCROLLBAR_MAX&&(width+=windowScrollbarX);return{width,height,x:x$3,y:y$6}}var absoluteOrFixed=new Set([`absolute`,`fixed`]);function getInnerBoundingClientRect(element,strategy){let clientRect=getBoundingClientRect(element,!0,strategy===`fixed`),top=clientRect.top+element.clientTop,left=clientRect.left+element.clientLeft,scale=isHTMLElement(element)?getScale(element):createCoords(1),width=element.clientWidth*scale.x,height=element.clientHeight*scale.y,x$3=left*scale.x,y$6=top*scale.y;return{width,height,x:x$3,y:y$6}}function getClientRectFromClippingAncestor(element,clippingAncestor,strategy){let rect;if(clippingAncestor===`viewport`)rect=getViewportRect(element,strategy);else if(clippingAncestor===`document`)rect=getDocumentRect(getDocumentElement(element));else if(isElement(clippingAncestor))rect=getInnerBoundingClientRect(clippingAncestor,strategy);else{let visualOffsets=getVisualOffsets(element);rect={x:clippingAncestor.x-visualOffsets.x,y:clippingAncestor.y-visualOffsets.y,width:clippingAncestor.width,height:clippingAncestor.height}}return rectToClientRect(rect)}function hasFixedPositionAncestor(element,stopNode){let parentNode=getParentNode(element);return parentNode===stopNode||!isElement(parentNode)||isLastTraversableNode(parentNode)?!1:getComputedStyle$1(parentNode).position===`fixed`||hasFixedPositionAncestor(parentNode,stopNode)}function getClippingElementAncestors(element,cache$1){let cachedResult=cache$1.get(element);if(cachedResult)return cachedResult;let result=getOverflowAncestors(element,[],!1).filter(el=>isElement(el)&&getNodeName(el)!==`body`),currentContainingBlockComputedStyle=null,elementIsFixed=getComputedStyle$1(element).position===`fixed`,currentNode=elementIsFixed?getParentNode(element):element;for(;isElement(currentNode)&&!isLastTraversableNode(currentNode);){let computedStyle=getComputedStyle$1(currentNode),currentNodeIsContaining=isContainingBlock(currentNode);!currentNodeIsContaining&&computedStyle.position===`fixed`&&(currentContainingBlockComputedStyle=null),(elementIsFixed?!currentNodeIsContaining&&!currentContainingBlockComputedStyle:!currentNodeIsContaining&&computedStyle.position===`static`&&currentContainingBlockComputedStyle&&absoluteOrFixed.has(currentContainingBlockComputedStyle.position)||isOverflowElement(currentNode)&&!currentNodeIsContaining&&hasFixedPositionAncestor(element,currentNode))?result=result.filter(ancestor=>ancestor!==currentNode):currentContainingBlockComputedStyle=computedStyle,currentNode=getParentNode(currentNode)}return cache$1.set(element,result),result}function getClippingRect(_ref){let{element,boundary,rootBoundary,strategy}=_ref,clippingAncestors=[...boundary===`clippingAncestors`?isTopLayer(element)?[]:getClippingElementAncestors(element,this._c):[].concat(boundary),rootBoundary],firstClippingAncestor=clippingAncestors[0],clippingRect=clippingAncestors.reduce((accRect,clippingAncestor)=>{let rect=getClientRectFromClippingAncestor(element,clippingAncestor,strategy);return accRect.top=max(rect.top,accRect.top),accRect.right=min(rect.right,accRect.right),accRect.bottom=min(rect.bottom,accRect.bottom),accRect.left=max(rect.left,accRect.left),accRect},getClientRectFromClippingAncestor(element,firstClippingAncestor,strategy));return{width:clippingRect.right-clippingRect.left,height:clippingRect.bottom-clippingRect.top,x:clippingRect.left,y:clippingRect.top}}function getDimensions(element){let{width,height}=getCssDimensions(element);return{width,height}}function getRectRelativeToOffsetParent(element,offsetParent,strategy){let isOffsetParentAnElement=isHTMLElement(offsetParent),documentElement=getDocumentElement(offsetParent),isFixed=strategy===`fixed`,rect=getBoundingClientRect(element,!0,isFixed,offsetParent),scroll={scrollLeft:0,scrollTop:0},offsets=createCoords(0);function setLeftRTLScrollbarOffset(){offsets.x=getWindowScrollBarX(documentElement)}if(isOffsetParentAnElement||!isOffsetParentAnElement&&!isFixed)if((getNodeName(offsetParent)!==`body`||isOverflowElement(documentElement))&&(scroll=getNodeScroll(offsetParent)),isOffsetParentAnElement){let offsetRect=getBoundingClientRect(offsetParent,!0,isFixed,offsetParent);offsets.x=offsetRect.x+offsetParent.clientLeft,offsets.y=offsetRect.y+offsetParent.clientTop}else documentElement&&setLeftRTLScrollbarOffset();isFixed&&!isOffsetParentAnElement&&documentElement&&setLeftRTLScrollbarOffset();let htmlOffset=documentElement&&!isOffsetParentAnElement&&!isFixed?getHTMLOffset(documentElement,scroll):createCoords(0),x$3=rect.left+scroll.scrollLeft-offsets.x-htmlOffset.x,y$6=rect.top+scroll.scrollTop-offsets.y-htmlOffset.y;return{x:x$3,y:y$6,width:rect.width,height:rect.height}}function isStaticPositioned(element){return getComputedStyle$1(element).position===`static`}function getTrueOffsetParent(element,polyfill){if(!isHTMLElement(element)||getComputedStyle$1(element).position===`fixed`)return null;if(polyfill)return polyfill(element);let rawOffsetParent=element.offsetParent;return getDocumentElement(element)===rawOffsetParent&&(rawOffsetParent=rawOffsetParent.ownerDocument.body),rawOffsetParent}function getOffsetParent(element,polyfill){let win=getWindow(element);if(isTopLayer(element))return win;if(!isHTMLElement(element)){let svgOffsetParent=getParentNode(element);for(;svgOffsetParent&&!isLastTraversableNode(svgOffsetParent);){if(isElement(svgOffsetParent)&&!isStaticPositioned(svgOffsetParent))return svgOffsetParent;svgOffsetParent=getParentNode(svgOffsetParent)}return win}let offsetParent=getTrueOffsetParent(element,polyfill);for(;offsetParent&&isTableElement(offsetParent)&&isStaticPositioned(offsetParent);)offsetParent=getTrueOffsetParent(offsetParent,polyfill);return offsetParent&&isLastTraversableNode(offsetParent)&&isStaticPositioned(offsetParent)&&!isContainingBlock(offsetParent)?win:offsetParent||getContainingBlock(element)||win}var getElementRects=async function(data){let getOffsetParentFn=this.getOffsetParent||getOffsetParent,getDimensionsFn=this.getDimensions,floatingDimensions=await getDimensionsFn(data.floating);return{reference:getRectRelativeToOffsetParent(data.reference,await getOffsetParentFn(data.floating),data.strategy),floating:{x:0,y:0,width:floatingDimensions.width,height:floatingDimensions.height}}};function isRTL(element){return getComputedStyle$1(element).direction===`rtl`}var platform={convertOffsetParentRelativeRectToViewportRelativeRect,getDocumentElement,getClippingRect,getOffsetParent,getElementRects,getClientRects,getDimensions,getScale,isElement,isRTL};function rectsAreEqual(a$37,b$5){return a$37.x===b$5.x&&a$37.y===b$5.y&&a$37.width===b$5.width&&a$37.height===b$5.height}function observeMove(element,onMove){let io=null,timeoutId,root$1=getDocumentElement(element);function cleanup(){var _io;clearTimeout(timeoutId),(_io=io)==null||_io.disconnect(),io=null}function refresh(skip,threshold){skip===void 0&&(skip=!1),threshold===void 0&&(threshold=1),cleanup();let elementRectForRootMargin=element.getBoundingClientRect(),{left,top,width,height}=elementRectForRootMargin;if(skip||onMove(),!width||!height)return;let insetTop=floor(top),insetRight=floor(root$1.clientWidth-(left+width)),insetBottom=floor(root$1.clientHeight-(top+height)),insetLeft=floor(left),options$1={rootMargin:-insetTop+`px `+-insetRight+`px `+-insetBottom+`px `+-insetLeft+`px`,threshold:max(0,min(1,threshold))||1},isFirstUpdate=!0;function handleObserve(entries){let ratio=entries[0].intersectionRatio;if(ratio!==threshold){if(!isFirstUpdate)return refresh();ratio?refresh(!1,ratio):timeoutId=setTimeout(()=>{refresh(!1,1e-7)},1e3)}ratio===1&&!rectsAreEqual(elementRectForRootMargin,element.getBoundingClientRect())&&refresh(),isFirstUpdate=!1}try{io=new IntersectionObserver(handleObserve,{...options$1,root:root$1.ownerDocument})}catch{io=new IntersectionObserver(handleObserve,options$1)}io.observe(element)}return refresh(!0),cleanup}function autoUpdate(reference,floating,update,options$1){options$1===void 0&&(options$1={});let{ancestorScroll=!0,ancestorResize=!0,elementResize=typeof ResizeObserver==`function`,layoutShift=typeof IntersectionObserver==`function`,animationFrame=!1}=options$1,referenceEl=unwrapElement(reference),ancestors=ancestorScroll||ancestorResize?[...referenceEl?getOverflowAncestors(referenceEl):[],...getOverflowAncestors(floating)]:[];ancestors.forEach(ancestor=>{ancestorScroll&&ancestor.addEventListener(`scroll`,update,{passive:!0}),ancestorResize&&ancestor.addEventListener(`resize`,update)});let cleanupIo=referenceEl&&layoutShift?observeMove(referenceEl,update):null,reobserveFrame=-1,resizeObserver=null;elementResize&&(resizeObserver=new ResizeObserver(_ref=>{let[firstEntry]=_ref;firstEntry&&firstEntry.target===referenceEl&&resizeObserver&&(resizeObserver.unobserve(floating),cancelAnimationFrame(reobserveFrame),reobserveFrame=requestAnimationFrame(()=>{var _resizeObserver;(_resizeObserver=resizeObserver)==null||_resizeObserver.observe(floating)})),update()}),referenceEl&&!animationFrame&&resizeObserver.observe(referenceEl),resizeObserver.observe(floating));let frameId,prevRefRect=animationFrame?getBoundingClientRect(reference):null;animationFrame&&frameLoop();function frameLoop(){let nextRefRect=getBoundingClientRect(reference);prevRefRect&&!rectsAreEqual(prevRefRect,nextRefRect)&&update(),prevRefRect=nextRefRect,frameId=requestAnimationFrame(frameLoop)}return update(),()=>{var _resizeObserver2;ancestors.forEach(ancestor=>{ancestorScroll&&ancestor.removeEventListener(`scroll`,update),ancestorResize&&ancestor.removeEventListener(`resize`,update)}),cleanupIo?.(),(_resizeObserver2=resizeObserver)==null||_resizeObserver2.disconnect(),resizeObserver=null,animationFrame&&cancelAnimationFrame(frameId)}}var offset$1=offset$2,shift$1=shift$2,flip$1=flip$2,size$1=size$2,hide$1=hide$2,arrow$1=arrow$2,limitShift$1=limitShift$2,computePosition=(reference,floating,options$1)=>{let cache$1=new Map,mergedOptions={platform,...options$1},platformWithCache={...mergedOptions.platform,_c:cache$1};return computePosition$1(reference,floating,{...mergedOptions,platform:platformWithCache})},import_react_dom$2=__toESM(require_react_dom(),1),index=typeof document<`u`?import_react.useLayoutEffect:function(){};function deepEqual(a$37,b$5){if(a$37===b$5)return!0;if(typeof a$37!=typeof b$5)return!1;if(typeof a$37==`function`&&a$37.toString()===b$5.toString())return!0;let length,i$23,keys;if(a$37&&b$5&&typeof a$37==`object`){if(Array.isArray(a$37)){if(length=a$37.length,length!==b$5.length)return!1;for(i$23=length;i$23--!==0;)if(!deepEqual(a$37[i$23],b$5[i$23]))return!1;return!0}if(keys=Object.keys(a$37),length=keys.length,length!==Object.keys(b$5).length)return!1;for(i$23=length;i$23--!==0;)if(!{}.hasOwnProperty.call(b$5,keys[i$23]))return!1;for(i$23=length;i$23--!==0;){let key$1=keys[i$23];if(!(key$1===`_owner`&&a$37.$$typeof)&&!deepEqual(a$37[key$1],b$5[key$1]))return!1}return!0}return a$37!==a$37&&b$5!==b$5}function getDPR(element){return typeof window>`u`?1:(element.ownerDocument.defaultView||window).devicePixelRatio||1}function roundByDPR(element,value$1){let dpr=getDPR(element);return Math.round(value$1*dpr)/dpr}function useLatestRef(value$1){let ref=import_react.useRef(value$1);return index(()=>{ref.current=value$1}),ref}function useFloating(options$1){options$1===void 0&&(options$1={});let{placement=`bottom`,strategy=`absolute`,middleware=[],platform:platform$1,elements:{reference:externalReference,floating:externalFloating}={},transform=!0,whileElementsMounted,open}=options$1,[data,setData]=import_react.useState({x:0,y:0,strategy,placement,middlewareData:{},isPositioned:!1}),[latestMiddleware,setLatestMiddleware]=import_react.useState(middleware);deepEqual(latestMiddleware,middleware)||setLatestMiddleware(middleware);let[_reference,_setReference]=import_react.useState(null),[_floating,_setFloating]=import_react.useState(null),setReference=import_react.useCallback(node=>{node!==referenceRef.current&&(referenceRef.current=node,_setReference(node))},[]),setFloating=import_react.useCallback(node=>{node!==floatingRef.current&&(floatingRef.current=node,_setFloating(node))},[]),referenceEl=externalReference||_reference,floatingEl=externalFloating||_floating,referenceRef=import_react.useRef(null),floatingRef=import_react.useRef(null),dataRef=import_react.useRef(data),hasWhileElementsMounted=whileElementsMounted!=null,whileElementsMountedRef=useLatestRef(whileElementsMounted),platformRef=useLatestRef(platform$1),openRef=useLatestRef(open),update=import_react.useCallback(()=>{if(!referenceRef.current||!floatingRef.current)return;let config={placement,strategy,middleware:latestMiddleware};platformRef.current&&(config.platform=platformRef.current),computePosition(referenceRef.current,floatingRef.current,config).then(data$1=>{let fullData={...data$1,isPositioned:openRef.current!==!1};isMountedRef.current&&!deepEqual(dataRef.current,fullData)&&(dataRef.current=fullData,import_react_dom$2.flushSync(()=>{setData(fullData)}))})},[latestMiddleware,placement,strategy,platformRef,openRef]);index(()=>{open===!1&&dataRef.current.isPositioned&&(dataRef.current.isPositioned=!1,setData(data$1=>({...data$1,isPositioned:!1})))},[open]);let isMountedRef=import_react.useRef(!1);index(()=>(isMountedRef.current=!0,()=>{isMountedRef.current=!1}),[]),index(()=>{if(referenceEl&&(referenceRef.current=referenceEl),floatingEl&&(floatingRef.current=floatingEl),referenceEl&&floatingEl){if(whileElementsMountedRef.current)return whileElementsMountedRef.current(referenceEl,floatingEl,update);update()}},[referenceEl,floatingEl,update,whileElementsMountedRef,hasWhileElementsMounted]);let refs$1=import_react.useMemo(()=>({reference:referenceRef,floating:floatingRef,setReference,setFloating}),[setReference,setFloating]),elements=import_react.useMemo(()=>({reference:referenceEl,floating:floatingEl}),[referenceEl,floatingEl]),floatingStyles=import_react.useMemo(()=>{let initialStyles={position:strategy,left:0,top:0};if(!elements.floating)return initialStyles;let x$3=roundByDPR(elements.floating,data.x),y$6=roundByDPR(elements.floating,data.y);return transform?{...initialStyles,transform:`translate(`+x$3+`px, `+y$6+`px)`,...getDPR(elements.floating)>=1.5&&{willChange:`transform`}}:{position:strategy,left:x$3,top:y$6}},[strategy,transform,elements.floating,data.x,data.y]);return import_react.useMemo(()=>({...data,update,refs:refs$1,elements,floatingStyles}),[data,update,refs$1,elements,floatingStyles])}var arrow$1$1=options$1=>{function isRef(value$1){return{}.hasOwnProperty.call(value$1,`current`)}return{name:`arrow`,options:options$1,fn(state){let{element,padding}=typeof options$1==`function`?options$1(state):options$1;return element&&isRef(element)?element.current==null?{}:arrow$1({element:element.current,padding}).fn(state):element?arrow$1({element,padding}).fn(state):{}}}},offset=(options$1,deps)=>({...offset$1(options$1),options:[options$1,deps]}),shift=(options$1,deps)=>({...shift$1(options$1),options:[options$1,deps]}),limitShift=(options$1,deps)=>({...limitShift$1(options$1),options:[options$1,deps]}),flip=(options$1,deps)=>({...flip$1(options$1),options:[options$1,deps]}),size=(options$1,deps)=>({...size$1(options$1),options:[options$1,deps]}),hide=(options$1,deps)=>({...hide$1(options$1),options:[options$1,deps]}),arrow=(options$1,deps)=>({...arrow$1$1(options$1),options:[options$1,deps]}),NAME$1=`Arrow`,Arrow$1=import_react.forwardRef((props,forwardedRef)=>{let{children,width=10,height=5,...arrowProps}=props;return(0,import_jsx_runtime.jsx)(Primitive$1.svg,{...arrowProps,ref:forwardedRef,width,height,viewBox:`0 0 30 10`,preserveAspectRatio:`none`,children:props.asChild?children:(0,import_jsx_runtime.jsx)(`polygon`,{points:`0,0 30,0 15,10`})})});Arrow$1.displayName=NAME$1;var Root$5=Arrow$1,POPPER_NAME=`Popper`,[createPopperContext,createPopperScope]=createContextScope(POPPER_NAME),[PopperProvider,usePopperContext]=createPopperContext(POPPER_NAME),Popper=props=>{let{__scopePopper,children}=props,[anchor,setAnchor]=import_react.useState(null);return(0,import_jsx_runtime.jsx)(PopperProvider,{scope:__scopePopper,anchor,onAnchorChange:setAnchor,children})};Popper.displayName=POPPER_NAME;var ANCHOR_NAME$2=`PopperAnchor`,PopperAnchor=import_react.forwardRef((props,forwardedRef)=>{let{__scopePopper,virtualRef,...anchorProps}=props,context=usePopperContext(ANCHOR_NAME$2,__scopePopper),ref=import_react.useRef(null),composedRefs=useComposedRefs(forwardedRef,ref),anchorRef=import_react.useRef(null);return import_react.useEffect(()=>{let previousAnchor=anchorRef.current;anchorRef.current=virtualRef?.current||ref.current,previousAnchor!==anchorRef.current&&context.onAnchorChange(anchorRef.current)}),virtualRef?null:(0,import_jsx_runtime.jsx)(Primitive$1.div,{...anchorProps,ref:composedRefs})});PopperAnchor.displayName=ANCHOR_NAME$2;var CONTENT_NAME$9=`PopperContent`,[PopperContentProvider,useContentContext]=createPopperContext(CONTENT_NAME$9),PopperContent=import_react.forwardRef((props,forwardedRef)=>{let{__scopePopper,side=`bottom`,sideOffset=0,align=`center`,alignOffset=0,arrowPadding=0,avoidCollisions=!0,collisionBoundary=[],collisionPadding:collisionPaddingProp=0,sticky=`partial`,hideWhenDetached=!1,updatePositionStrategy=`optimized`,onPlaced,...contentProps}=props,context=usePopperContext(CONTENT_NAME$9,__scopePopper),[content,setContent]=import_react.useState(null),composedRefs=useComposedRefs(forwardedRef,node=>setContent(node)),[arrow$3,setArrow]=import_react.useState(null),arrowSize=useSize(arrow$3),arrowWidth=arrowSize?.width??0,arrowHeight=arrowSize?.height??0,desiredPlacement=side+(align===`center`?``:`-`+align),collisionPadding=typeof collisionPaddingProp==`number`?collisionPaddingProp:{top:0,right:0,bottom:0,left:0,...collisionPaddingProp},boundary=Array.isArray(collisionBoundary)?collisionBoundary:[collisionBoundary],hasExplicitBoundaries=boundary.length>0,detectOverflowOptions={padding:collisionPadding,boundary:boundary.filter(isNotNull),altBoundary:hasExplicitBoundaries},{refs:refs$1,floatingStyles,placement,isPositioned,middlewareData}=useFloating({strategy:`fixed`,placement:desiredPlacement,whileElementsMounted:(...args)=>autoUpdate(...args,{animationFrame:updatePositionStrategy===`always`}),elements:{reference:context.anchor},middleware:[offset({mainAxis:sideOffset+arrowHeight,alignmentAxis:alignOffset}),avoidCollisions&&shift({mainAxis:!0,crossAxis:!1,limiter:sticky===`partial`?limitShift():void 0,...detectOverflowOptions}),avoidCollisions&&flip({...detectOverflowOptions}),size({...detectOverflowOptions,apply:({elements,rects,availableWidth,availableHeight})=>{let{width:anchorWidth,height:anchorHeight}=rects.reference,contentStyle=elements.floating.style;contentStyle.setProperty(`--radix-popper-available-width`,`${availableWidth}px`),contentStyle.setProperty(`--radix-popper-available-height`,`${availableHeight}px`),contentStyle.setProperty(`--radix-popper-anchor-width`,`${anchorWidth}px`),contentStyle.setProperty(`--radix-popper-anchor-height`,`${anchorHeight}px`)}}),arrow$3&&arrow({element:arrow$3,padding:arrowPadding}),transformOrigin({arrowWidth,arrowHeight}),hideWhenDetached&&hide({strategy:`referenceHidden`,...detectOverflowOptions})]}),[placedSide,placedAlign]=getSideAndAlignFromPlacement(placement),handlePlaced=useCallbackRef(onPlaced);useLayoutEffect2(()=>{isPositioned&&handlePlaced?.()},[isPositioned,handlePlaced]);let arrowX=middlewareData.arrow?.x,arrowY=middlewareData.arrow?.y,cannotCenterArrow=middlewareData.arrow?.centerOffset!==0,[contentZIndex,setContentZIndex]=import_react.useState();return useLayoutEffect2(()=>{content&&setContentZIndex(window.getComputedStyle(content).zIndex)},[content]),(0,import_jsx_runtime.jsx)(`div`,{ref:refs$1.setFloating,"data-radix-popper-content-wrapper":``,style:{...floatingStyles,transform:isPositioned?floatingStyles.transform:`translate(0, -200%)`,minWidth:`max-content`,zIndex:contentZIndex,"--radix-popper-transform-origin":[middlewareData.transformOrigin?.x,middlewareData.transformOrigin?.y].join(` `),...middlewareData.hide?.referenceHidden&&{visibility:`hidden`,pointerEvents:`none`}},dir:props.dir,children:(0,import_jsx_runtime.jsx)(PopperContentProvider,{scope:__scopePopper,placedSide,onArrowChange:setArrow,arrowX,arrowY,shouldHideArrow:cannotCenterArrow,children:(0,import_jsx_runtime.jsx)(Primitive$1.div,{"data-side":placedSide,"data-align":placedAlign,...contentProps,ref:composedRefs,style:{...contentProps.style,animation:isPositioned?void 0:`none`}})})})});PopperContent.displayName=CONTENT_NAME$9;var ARROW_NAME$7=`PopperArrow`,OPPOSITE_SIDE={top:`bottom`,right:`left`,bottom:`top`,left:`right`},PopperArrow=import_react.forwardRef(function(props,forwardedRef){let{__scopePopper,...arrowProps}=props,contentContext=useContentContext(ARROW_NAME$7,__scopePopper),baseSide=OPPOSITE_SIDE[contentContext.placedSide];return(0,import_jsx_runtime.jsx)(`span`,{ref:contentContext.onArrowChange,style:{position:`absolute`,left:contentContext.arrowX,top:contentContext.arrowY,[baseSide]:0,transformOrigin:{top:``,right:`0 0`,bottom:`center 0`,left:`100% 0`}[contentContext.placedSide],transform:{top:`translateY(100%)`,right:`translateY(50%) rotate(90deg) translateX(-50%)`,bottom:`rotate(180deg)`,left:`translateY(50%) rotate(-90deg) translateX(50%)`}[contentContext.placedSide],visibility:contentContext.shouldHideArrow?`hidden`:void 0},children:(0,import_jsx_runtime.jsx)(Root$5,{...arrowProps,ref:forwardedRef,style:{...arrowProps.style,display:`block`}})})});PopperArrow.displayName=ARROW_NAME$7;function isNotNull(value$1){return value$1!==null}var transformOrigin=options$1=>({name:`transformOrigin`,options:options$1,fn(data){let{placement,rects,middlewareData}=data,isArrowHidden=middlewareData.arrow?.centerOffset!==0,arrowWidth=isArrowHidden?0:options$1.arrowWidth,arrowHeight=isArrowHidden?0:options$1.arrowHeight,[placedSide,placedAlign]=getSideAndAlignFromPlacement(placement),noArrowAlign={start:`0%`,center:`50%`,end:`100%`}[placedAlign],arrowXCenter=(middlewareData.arrow?.x??0)+arrowWidth/2,arrowYCenter=(middlewareData.arrow?.y??0)+arrowHeight/2,x$3=``,y$6=``;return placedSide===`bottom`?(x$3=isArrowHidden?noArrowAlign:`${arrowXCenter}px`,y$6=`${-arrowHeight}px`):placedSide===`top`?(x$3=isArrowHidden?noArrowAlign:`${arrowXCenter}px`,y$6=`${rects.floating.height+arrowHeight}px`):placedSide===`right`?(x$3=`${-arrowHeight}px`,y$6=isArrowHidden?noArrowAlign:`${arrowYCenter}px`):placedSide===`left`&&(x$3=`${rects.floating.width+arrowHeight}px`,y$6=isArrowHidden?noArrowAlign:`${arrowYCenter}px`),{data:{x:x$3,y:y$6}}}});function getSideAndAlignFromPlacement(placement){let[side,align=`center`]=placement.split(`-`);return[side,align]}var Root2$9=Popper,Anchor=PopperAnchor,Content$1=PopperContent,Arrow=PopperArrow,ENTRY_FOCUS=`rovingFocusGroup.onEntryFocus`,EVENT_OPTIONS={bubbles:!1,cancelable:!0},GROUP_NAME$4=`RovingFocusGroup`,[Collection$4,useCollection$4,createCollectionScope$4]=createCollection(GROUP_NAME$4),[createRovingFocusGroupContext,createRovingFocusGroupScope]=createContextScope(GROUP_NAME$4,[createCollectionScope$4]),[RovingFocusProvider,useRovingFocusContext]=createRovingFocusGroupContext(GROUP_NAME$4),RovingFocusGroup=import_react.forwardRef((props,forwardedRef)=>(0,import_jsx_runtime.jsx)(Collection$4.Provider,{scope:props.__scopeRovingFocusGroup,children:(0,import_jsx_runtime.jsx)(Collection$4.Slot,{scope:props.__scopeRovingFocusGroup,children:(0,import_jsx_runtime.jsx)(RovingFocusGroupImpl,{...props,ref:forwardedRef})})}));RovingFocusGroup.displayName=GROUP_NAME$4;var RovingFocusGroupImpl=import_react.forwardRef((props,forwardedRef)=>{let{__scopeRovingFocusGroup,orientation,loop=!1,dir,currentTabStopId:currentTabStopIdProp,defaultCurrentTabStopId,onCurrentTabStopIdChange,onEntryFocus,preventScrollOnEntryFocus=!1,...groupProps}=props,ref=import_react.useRef(null),composedRefs=useComposedRefs(forwardedRef,ref),direction=useDirection(dir),[currentTabStopId,setCurrentTabStopId]=useControllableState({prop:currentTabStopIdProp,defaultProp:defaultCurrentTabStopId??null,onChange:onCurrentTabStopIdChange,caller:GROUP_NAME$4}),[isTabbingBackOut,setIsTabbingBackOut]=import_react.useState(!1),handleEntryFocus=useCallbackRef(onEntryFocus),getItems=useCollection$4(__scopeRovingFocusGroup),isClickFocusRef=import_react.useRef(!1),[focusableItemsCount,setFocusableItemsCount]=import_react.useState(0);return import_react.useEffect(()=>{let node=ref.current;if(node)return node.addEventListener(ENTRY_FOCUS,handleEntryFocus),()=>node.removeEventListener(ENTRY_FOCUS,handleEntryFocus)},[handleEntryFocus]),(0,import_jsx_runtime.jsx)(RovingFocusProvider,{scope:__scopeRovingFocusGroup,orientation,dir:direction,loop,currentTabStopId,onItemFocus:import_react.useCallback(tabStopId=>setCurrentTabStopId(tabStopId),[setCurrentTabStopId]),onItemShiftTab:import_react.useCallback(()=>setIsTabbingBackOut(!0),[]),onFocusableItemAdd:import_react.useCallback(()=>setFocusableItemsCount(prevCount=>prevCount+1),[]),onFocusableItemRemove:import_react.useCallback(()=>setFocusableItemsCount(prevCount=>prevCount-1),[]),children:(0,import_jsx_runtime.jsx)(Primitive$1.div,{tabIndex:isTabbingBackOut||focusableItemsCount===0?-1:0,"data-orientation":orientation,...groupProps,ref:composedRefs,style:{outline:`none`,...props.style},onMouseDown:composeEventHandlers(props.onMouseDown,()=>{isClickFocusRef.current=!0}),onFocus:composeEventHandlers(props.onFocus,event=>{let isKeyboardFocus=!isClickFocusRef.current;if(event.target===event.currentTarget&&isKeyboardFocus&&!isTabbingBackOut){let entryFocusEvent=new CustomEvent(ENTRY_FOCUS,EVENT_OPTIONS);if(event.currentTarget.dispatchEvent(entryFocusEvent),!entryFocusEvent.defaultPrevented){let items=getItems().filter(item=>item.focusable),activeItem=items.find(item=>item.active),currentItem=items.find(item=>item.id===currentTabStopId),candidateNodes=[activeItem,currentItem,...items].filter(Boolean).map(item=>item.ref.current);focusFirst$2(candidateNodes,preventScrollOnEntryFocus)}}isClickFocusRef.current=!1}),onBlur:composeEventHandlers(props.onBlur,()=>setIsTabbingBackOut(!1))})})}),ITEM_NAME$7=`RovingFocusGroupItem`,RovingFocusGroupItem=import_react.forwardRef((props,forwardedRef)=>{let{__scopeRovingFocusGroup,focusable=!0,active=!1,tabStopId,children,...itemProps}=props,autoId=useId(),id=tabStopId||autoId,context=useRovingFocusContext(ITEM_NAME$7,__scopeRovingFocusGroup),isCurrentTabStop=context.currentTabStopId===id,getItems=useCollection$4(__scopeRovingFocusGroup),{onFocusableItemAdd,onFocusableItemRemove,currentTabStopId}=context;return import_react.useEffect(()=>{if(focusable)return onFocusableItemAdd(),()=>onFocusableItemRemove()},[focusable,onFocusableItemAdd,onFocusableItemRemove]),(0,import_jsx_runtime.jsx)(Collection$4.ItemSlot,{scope:__scopeRovingFocusGroup,id,focusable,active,children:(0,import_jsx_runtime.jsx)(Primitive$1.span,{tabIndex:isCurrentTabStop?0:-1,"data-orientation":context.orientation,...itemProps,ref:forwardedRef,onMouseDown:composeEventHandlers(props.onMouseDown,event=>{focusable?context.onItemFocus(id):event.preventDefault()}),onFocus:composeEventHandlers(props.onFocus,()=>context.onItemFocus(id)),onKeyDown:composeEventHandlers(props.onKeyDown,event=>{if(event.key===`Tab`&&event.shiftKey){context.onItemShiftTab();return}if(event.target!==event.currentTarget)return;let focusIntent=getFocusIntent(event,context.orientation,context.dir);if(focusIntent!==void 0){if(event.metaKey||event.ctrlKey||event.altKey||event.shiftKey)return;event.preventDefault();let candidateNodes=getItems().filter(item=>item.focusable).map(item=>item.ref.current);if(focusIntent===`last`)candidateNodes.reverse();else if(focusIntent===`prev`||focusIntent===`next`){focusIntent===`prev`&&candidateNodes.reverse();let currentIndex=candidateNodes.indexOf(event.currentTarget);candidateNodes=context.loop?wrapArray$2(candidateNodes,currentIndex+1):candidateNodes.slice(currentIndex+1)}setTimeout(()=>focusFirst$2(candidateNodes))}}),children:typeof children==`function`?children({isCurrentTabStop,hasTabStop:currentTabStopId!=null}):children})})});RovingFocusGroupItem.displayName=ITEM_NAME$7;var MAP_KEY_TO_FOCUS_INTENT={ArrowLeft:`prev`,ArrowUp:`prev`,ArrowRight:`next`,ArrowDown:`next`,PageUp:`first`,Home:`first`,PageDown:`last`,End:`last`};function getDirectionAwareKey(key$1,dir){return dir===`rtl`?key$1===`ArrowLeft`?`ArrowRight`:key$1===`ArrowRight`?`ArrowLeft`:key$1:key$1}function getFocusIntent(event,orientation,dir){let key$1=getDirectionAwareKey(event.key,dir);if(!(orientation===`vertical`&&[`ArrowLeft`,`ArrowRight`].includes(key$1))&&!(orientation===`horizontal`&&[`ArrowUp`,`ArrowDown`].includes(key$1)))return MAP_KEY_TO_FOCUS_INTENT[key$1]}function focusFirst$2(candidates,preventScroll=!1){let PREVIOUSLY_FOCUSED_ELEMENT=document.activeElement;for(let candidate of candidates)if(candidate===PREVIOUSLY_FOCUSED_ELEMENT||(candidate.focus({preventScroll}),document.activeElement!==PREVIOUSLY_FOCUSED_ELEMENT))return}function wrapArray$2(array,startIndex){return array.map((_,index$1)=>array[(startIndex+index$1)%array.length])}var Root$4=RovingFocusGroup,Item$2=RovingFocusGroupItem,SELECTION_KEYS$1=[`Enter`,` `],FIRST_KEYS=[`ArrowDown`,`PageUp`,`Home`],LAST_KEYS=[`ArrowUp`,`PageDown`,`End`],FIRST_LAST_KEYS=[...FIRST_KEYS,...LAST_KEYS],SUB_OPEN_KEYS={ltr:[...SELECTION_KEYS$1,`ArrowRight`],rtl:[...SELECTION_KEYS$1,`ArrowLeft`]},SUB_CLOSE_KEYS={ltr:[`ArrowLeft`],rtl:[`ArrowRight`]},MENU_NAME=`Menu`,[Collection$3,useCollection$3,createCollectionScope$3]=createCollection(MENU_NAME),[createMenuContext,createMenuScope]=createContextScope(MENU_NAME,[createCollectionScope$3,createPopperScope,createRovingFocusGroupScope]),usePopperScope$4=createPopperScope(),useRovingFocusGroupScope$3=createRovingFocusGroupScope(),[MenuProvider,useMenuContext]=createMenuContext(MENU_NAME),[MenuRootProvider,useMenuRootContext]=createMenuContext(MENU_NAME),Menu=props=>{let{__scopeMenu,open=!1,children,dir,onOpenChange,modal=!0}=props,popperScope=usePopperScope$4(__scopeMenu),[content,setContent]=import_react.useState(null),isUsingKeyboardRef=import_react.useRef(!1),handleOpenChange=useCallbackRef(onOpenChange),direction=useDirection(dir);return import_react.useEffect(()=>{let handleKeyDown=()=>{isUsingKeyboardRef.current=!0,document.addEventListener(`pointerdown`,handlePointer,{capture:!0,once:!0}),document.addEventListener(`pointermove`,handlePointer,{capture:!0,once:!0})},handlePointer=()=>isUsingKeyboardRef.current=!1;return document.addEventListener(`keydown`,handleKeyDown,{capture:!0}),()=>{document.removeEventListener(`keydown`,handleKeyDown,{capture:!0}),document.removeEventListener(`pointerdown`,handlePointer,{capture:!0}),document.removeEventListener(`pointermove`,handlePointer,{capture:!0})}},[]),(0,import_jsx_runtime.jsx)(Root2$9,{...popperScope,children:(0,import_jsx_runtime.jsx)(MenuProvider,{scope:__scopeMenu,open,onOpenChange:handleOpenChange,content,onContentChange:setContent,children:(0,import_jsx_runtime.jsx)(MenuRootProvider,{scope:__scopeMenu,onClose:import_react.useCallback(()=>handleOpenChange(!1),[handleOpenChange]),isUsingKeyboardRef,dir:direction,modal,children})})})};Menu.displayName=MENU_NAME;var ANCHOR_NAME$1=`MenuAnchor`,MenuAnchor=import_react.forwardRef((props,forwardedRef)=>{let{__scopeMenu,...anchorProps}=props,popperScope=usePopperScope$4(__scopeMenu);return(0,import_jsx_runtime.jsx)(Anchor,{...popperScope,...anchorProps,ref:forwardedRef})});MenuAnchor.displayName=ANCHOR_NAME$1;var PORTAL_NAME$6=`MenuPortal`,[PortalProvider$3,usePortalContext$3]=createMenuContext(PORTAL_NAME$6,{forceMount:void 0}),MenuPortal=props=>{let{__scopeMenu,forceMount,children,container}=props,context=useMenuContext(PORTAL_NAME$6,__scopeMenu);return(0,import_jsx_runtime.jsx)(PortalProvider$3,{scope:__scopeMenu,forceMount,children:(0,import_jsx_runtime.jsx)(Presence,{present:forceMount||context.open,children:(0,import_jsx_runtime.jsx)(Portal,{asChild:!0,container,children})})})};MenuPortal.displayName=PORTAL_NAME$6;var CONTENT_NAME$8=`MenuContent`,[MenuContentProvider,useMenuContentContext]=createMenuContext(CONTENT_NAME$8),MenuContent=import_react.forwardRef((props,forwardedRef)=>{let portalContext=usePortalContext$3(CONTENT_NAME$8,props.__scopeMenu),{forceMount=portalContext.forceMount,...contentProps}=props,context=useMenuContext(CONTENT_NAME$8,props.__scopeMenu),rootContext=useMenuRootContext(CONTENT_NAME$8,props.__scopeMenu);return(0,import_jsx_runtime.jsx)(Collection$3.Provider,{scope:props.__scopeMenu,children:(0,import_jsx_runtime.jsx)(Presence,{present:forceMount||context.open,children:(0,import_jsx_runtime.jsx)(Collection$3.Slot,{scope:props.__scopeMenu,children:rootContext.modal?(0,import_jsx_runtime.jsx)(MenuRootContentModal,{...contentProps,ref:forwardedRef}):(0,import_jsx_runtime.jsx)(MenuRootContentNonModal,{...contentProps,ref:forwardedRef})})})})}),MenuRootContentModal=import_react.forwardRef((props,forwardedRef)=>{let context=useMenuContext(CONTENT_NAME$8,props.__scopeMenu),ref=import_react.useRef(null),composedRefs=useComposedRefs(forwardedRef,ref);return import_react.useEffect(()=>{let content=ref.current;if(content)return hideOthers(content)},[]),(0,import_jsx_runtime.jsx)(MenuContentImpl,{...props,ref:composedRefs,trapFocus:context.open,disableOutsidePointerEvents:context.open,disableOutsideScroll:!0,onFocusOutside:composeEventHandlers(props.onFocusOutside,event=>event.preventDefault(),{checkForDefaultPrevented:!1}),onDismiss:()=>context.onOpenChange(!1)})}),MenuRootContentNonModal=import_react.forwardRef((props,forwardedRef)=>{let context=useMenuContext(CONTENT_NAME$8,props.__scopeMenu);return(0,import_jsx_runtime.jsx)(MenuContentImpl,{...props,ref:forwardedRef,trapFocus:!1,disableOutsidePointerEvents:!1,disableOutsideScroll:!1,onDismiss:()=>context.onOpenChange(!1)})}),Slot$2=createSlot(`MenuContent.ScrollLock`),MenuContentImpl=import_react.forwardRef((props,forwardedRef)=>{let{__scopeMenu,loop=!1,trapFocus,onOpenAutoFocus,onCloseAutoFocus,disableOutsidePointerEvents,onEntryFocus,onEscapeKeyDown,onPointerDownOutside,onFocusOutside,onInteractOutside,onDismiss,disableOutsideScroll,...contentProps}=props,context=useMenuContext(CONTENT_NAME$8,__scopeMenu),rootContext=useMenuRootContext(CONTENT_NAME$8,__scopeMenu),popperScope=usePopperScope$4(__scopeMenu),rovingFocusGroupScope=useRovingFocusGroupScope$3(__scopeMenu),getItems=useCollection$3(__scopeMenu),[currentItemId,setCurrentItemId]=import_react.useState(null),contentRef=import_react.useRef(null),composedRefs=useComposedRefs(forwardedRef,contentRef,context.onContentChange),timerRef=import_react.useRef(0),searchRef=import_react.useRef(``),pointerGraceTimerRef=import_react.useRef(0),pointerGraceIntentRef=import_react.useRef(null),pointerDirRef=import_react.useRef(`right`),lastPointerXRef=import_react.useRef(0),ScrollLockWrapper=disableOutsideScroll?Combination_default:import_react.Fragment,scrollLockWrapperProps=disableOutsideScroll?{as:Slot$2,allowPinchZoom:!0}:void 0,handleTypeaheadSearch=key$1=>{let search=searchRef.current+key$1,items=getItems().filter(item=>!item.disabled),currentItem=document.activeElement,currentMatch=items.find(item=>item.ref.current===currentItem)?.textValue,values=items.map(item=>item.textValue),nextMatch=getNextMatch(values,search,currentMatch),newItem=items.find(item=>item.textValue===nextMatch)?.ref.current;(function updateSearch(value$1){searchRef.current=value$1,window.clearTimeout(timerRef.current),value$1!==``&&(timerRef.current=window.setTimeout(()=>updateSearch(``),1e3))})(search),newItem&&setTimeout(()=>newItem.focus())};import_react.useEffect(()=>()=>window.clearTimeout(timerRef.current),[]),useFocusGuards();let isPointerMovingToSubmenu=import_react.useCallback(event=>pointerDirRef.current===pointerGraceIntentRef.current?.side&&isPointerInGraceArea(event,pointerGraceIntentRef.current?.area),[]);return(0,import_jsx_runtime.jsx)(MenuContentProvider,{scope:__scopeMenu,searchRef,onItemEnter:import_react.useCallback(event=>{isPointerMovingToSubmenu(event)&&event.preventDefault()},[isPointerMovingToSubmenu]),onItemLeave:import_react.useCallback(event=>{isPointerMovingToSubmenu(event)||(contentRef.current?.focus(),setCurrentItemId(null))},[isPointerMovingToSubmenu]),onTriggerLeave:import_react.useCallback(event=>{isPointerMovingToSubmenu(event)&&event.preventDefault()},[isPointerMovingToSubmenu]),pointerGraceTimerRef,onPointerGraceIntentChange:import_react.useCallback(intent=>{pointerGraceIntentRef.current=intent},[]),children:(0,import_jsx_runtime.jsx)(ScrollLockWrapper,{...scrollLockWrapperProps,children:(0,import_jsx_runtime.jsx)(FocusScope,{asChild:!0,trapped:trapFocus,onMountAutoFocus:composeEventHandlers(onOpenAutoFocus,event=>{event.preventDefault(),contentRef.current?.focus({preventScroll:!0})}),onUnmountAutoFocus:onCloseAutoFocus,children:(0,import_jsx_runtime.jsx)(DismissableLayer,{asChild:!0,disableOutsidePointerEvents,onEscapeKeyDown,onPointerDownOutside,onFocusOutside,onInteractOutside,onDismiss,children:(0,import_jsx_runtime.jsx)(Root$4,{asChild:!0,...rovingFocusGroupScope,dir:rootContext.dir,orientation:`vertical`,loop,currentTabStopId:currentItemId,onCurrentTabStopIdChange:setCurrentItemId,onEntryFocus:composeEventHandlers(onEntryFocus,event=>{rootContext.isUsingKeyboardRef.current||event.preventDefault()}),preventScrollOnEntryFocus:!0,children:(0,import_jsx_runtime.jsx)(Content$1,{role:`menu`,"aria-orientation":`vertical`,"data-state":getOpenState$1(context.open),"data-radix-menu-content":``,dir:rootContext.dir,...popperScope,...contentProps,ref:composedRefs,style:{outline:`none`,...contentProps.style},onKeyDown:composeEventHandlers(contentProps.onKeyDown,event=>{let isKeyDownInside=event.target.closest(`[data-radix-menu-content]`)===event.currentTarget,isModifierKey=event.ctrlKey||event.altKey||event.metaKey,isCharacterKey=event.key.length===1;isKeyDownInside&&(event.key===`Tab`&&event.preventDefault(),!isModifierKey&&isCharacterKey&&handleTypeaheadSearch(event.key));let content=contentRef.current;if(event.target!==content||!FIRST_LAST_KEYS.includes(event.key))return;event.preventDefault();let candidateNodes=getItems().filter(item=>!item.disabled).map(item=>item.ref.current);LAST_KEYS.includes(event.key)&&candidateNodes.reverse(),focusFirst$1(candidateNodes)}),onBlur:composeEventHandlers(props.onBlur,event=>{event.currentTarget.contains(event.target)||(window.clearTimeout(timerRef.current),searchRef.current=``)}),onPointerMove:composeEventHandlers(props.onPointerMove,whenMouse$1(event=>{let target=event.target,pointerXHasChanged=lastPointerXRef.current!==event.clientX;event.currentTarget.contains(target)&&pointerXHasChanged&&(pointerDirRef.current=event.clientX>lastPointerXRef.current?`right`:`left`,lastPointerXRef.current=event.clientX)}))})})})})})})});MenuContent.displayName=CONTENT_NAME$8;var GROUP_NAME$3=`MenuGroup`,MenuGroup=import_react.forwardRef((props,forwardedRef)=>{let{__scopeMenu,...groupProps}=props;return(0,import_jsx_runtime.jsx)(Primitive$1.div,{role:`group`,...groupProps,ref:forwardedRef})});MenuGroup.displayName=GROUP_NAME$3;var LABEL_NAME$3=`MenuLabel`,MenuLabel=import_react.forwardRef((props,forwardedRef)=>{let{__scopeMenu,...labelProps}=props;return(0,import_jsx_runtime.jsx)(Primitive$1.div,{...labelProps,ref:forwardedRef})});MenuLabel.displayName=LABEL_NAME$3;var ITEM_NAME$6=`MenuItem`,ITEM_SELECT=`menu.itemSelect`,MenuItem=import_react.forwardRef((props,forwardedRef)=>{let{disabled=!1,onSelect,...itemProps}=props,ref=import_react.useRef(null),rootContext=useMenuRootContext(ITEM_NAME$6,props.__scopeMenu),contentContext=useMenuContentContext(ITEM_NAME$6,props.__scopeMenu),composedRefs=useComposedRefs(forwardedRef,ref),isPointerDownRef=import_react.useRef(!1),handleSelect=()=>{let menuItem=ref.current;if(!disabled&&menuItem){let itemSelectEvent=new CustomEvent(ITEM_SELECT,{bubbles:!0,cancelable:!0});menuItem.addEventListener(ITEM_SELECT,event=>onSelect?.(event),{once:!0}),dispatchDiscreteCustomEvent(menuItem,itemSelectEvent),itemSelectEvent.defaultPrevented?isPointerDownRef.current=!1:rootContext.onClose()}};return(0,import_jsx_runtime.jsx)(MenuItemImpl,{...itemProps,ref:composedRefs,disabled,onClick:composeEventHandlers(props.onClick,handleSelect),onPointerDown:event=>{props.onPointerDown?.(event),isPointerDownRef.current=!0},onPointerUp:composeEventHandlers(props.onPointerUp,event=>{isPointerDownRef.current||event.currentTarget?.click()}),onKeyDown:composeEventHandlers(props.onKeyDown,event=>{let isTypingAhead=contentContext.searchRef.current!==``;disabled||isTypingAhead&&event.key===` `||SELECTION_KEYS$1.includes(event.key)&&(event.currentTarget.click(),event.preventDefault())})})});MenuItem.displayName=ITEM_NAME$6;var MenuItemImpl=import_react.forwardRef((props,forwardedRef)=>{let{__scopeMenu,disabled=!1,textValue,...itemProps}=props,contentContext=useMenuContentContext(ITEM_NAME$6,__scopeMenu),rovingFocusGroupScope=useRovingFocusGroupScope$3(__scopeMenu),ref=import_react.useRef(null),composedRefs=useComposedRefs(forwardedRef,ref),[isFocused,setIsFocused]=import_react.useState(!1),[textContent,setTextContent]=import_react.useState(``);return import_react.useEffect(()=>{let menuItem=ref.current;menuItem&&setTextContent((menuItem.textContent??``).trim())},[itemProps.children]),(0,import_jsx_runtime.jsx)(Collection$3.ItemSlot,{scope:__scopeMenu,disabled,textValue:textValue??textContent,children:(0,import_jsx_runtime.jsx)(Item$2,{asChild:!0,...rovingFocusGroupScope,focusable:!disabled,children:(0,import_jsx_runtime.jsx)(Primitive$1.div,{role:`menuitem`,"data-highlighted":isFocused?``:void 0,"aria-disabled":disabled||void 0,"data-disabled":disabled?``:void 0,...itemProps,ref:composedRefs,onPointerMove:composeEventHandlers(props.onPointerMove,whenMouse$1(event=>{disabled?contentContext.onItemLeave(event):(contentContext.onItemEnter(event),event.defaultPrevented||event.currentTarget.focus({preventScroll:!0}))})),onPointerLeave:composeEventHandlers(props.onPointerLeave,whenMouse$1(event=>contentContext.onItemLeave(event))),onFocus:composeEventHandlers(props.onFocus,()=>setIsFocused(!0)),onBlur:composeEventHandlers(props.onBlur,()=>setIsFocused(!1))})})})}),CHECKBOX_ITEM_NAME$2=`MenuCheckboxItem`,MenuCheckboxItem=import_react.forwardRef((props,forwardedRef)=>{let{checked=!1,onCheckedChange,...checkboxItemProps}=props;return(0,import_jsx_runtime.jsx)(ItemIndicatorProvider,{scope:props.__scopeMenu,checked,children:(0,import_jsx_runtime.jsx)(MenuItem,{role:`menuitemcheckbox`,"aria-checked":isIndeterminate(checked)?`mixed`:checked,...checkboxItemProps,ref:forwardedRef,"data-state":getCheckedState(checked),onSelect:composeEventHandlers(checkboxItemProps.onSelect,()=>onCheckedChange?.(isIndeterminate(checked)?!0:!checked),{checkForDefaultPrevented:!1})})})});MenuCheckboxItem.displayName=CHECKBOX_ITEM_NAME$2;var RADIO_GROUP_NAME$3=`MenuRadioGroup`,[RadioGroupProvider$1,useRadioGroupContext$1]=createMenuContext(RADIO_GROUP_NAME$3,{value:void 0,onValueChange:()=>{}}),MenuRadioGroup=import_react.forwardRef((props,forwardedRef)=>{let{value:value$1,onValueChange,...groupProps}=props,handleValueChange=useCallbackRef(onValueChange);return(0,import_jsx_runtime.jsx)(RadioGroupProvider$1,{scope:props.__scopeMenu,value:value$1,onValueChange:handleValueChange,children:(0,import_jsx_runtime.jsx)(MenuGroup,{...groupProps,ref:forwardedRef})})});MenuRadioGroup.displayName=RADIO_GROUP_NAME$3;var RADIO_ITEM_NAME$2=`MenuRadioItem`,MenuRadioItem=import_react.forwardRef((props,forwardedRef)=>{let{value:value$1,...radioItemProps}=props,context=useRadioGroupContext$1(RADIO_ITEM_NAME$2,props.__scopeMenu),checked=value$1===context.value;return(0,import_jsx_runtime.jsx)(ItemIndicatorProvider,{scope:props.__scopeMenu,checked,children:(0,import_jsx_runtime.jsx)(MenuItem,{role:`menuitemradio`,"aria-checked":checked,...radioItemProps,ref:forwardedRef,"data-state":getCheckedState(checked),onSelect:composeEventHandlers(radioItemProps.onSelect,()=>context.onValueChange?.(value$1),{checkForDefaultPrevented:!1})})})});MenuRadioItem.displayName=RADIO_ITEM_NAME$2;var ITEM_INDICATOR_NAME$1=`MenuItemIndicator`,[ItemIndicatorProvider,useItemIndicatorContext]=createMenuContext(ITEM_INDICATOR_NAME$1,{checked:!1}),MenuItemIndicator=import_react.forwardRef((props,forwardedRef)=>{let{__scopeMenu,forceMount,...itemIndicatorProps}=props,indicatorContext=useItemIndicatorContext(ITEM_INDICATOR_NAME$1,__scopeMenu);return(0,import_jsx_runtime.jsx)(Presence,{present:forceMount||isIndeterminate(indicatorContext.checked)||indicatorContext.checked===!0,children:(0,import_jsx_runtime.jsx)(Primitive$1.span,{...itemIndicatorProps,ref:forwardedRef,"data-state":getCheckedState(indicatorContext.checked)})})});MenuItemIndicator.displayName=ITEM_INDICATOR_NAME$1;var SEPARATOR_NAME$3=`MenuSeparator`,MenuSeparator=import_react.forwardRef((props,forwardedRef)=>{let{__scopeMenu,...separatorProps}=props;return(0,import_jsx_runtime.jsx)(Primitive$1.div,{role:`separator`,"aria-orientation":`horizontal`,...separatorProps,ref:forwardedRef})});MenuSeparator.displayName=SEPARATOR_NAME$3;var ARROW_NAME$6=`MenuArrow`,MenuArrow=import_react.forwardRef((props,forwardedRef)=>{let{__scopeMenu,...arrowProps}=props,popperScope=usePopperScope$4(__scopeMenu);return(0,import_jsx_runtime.jsx)(Arrow,{...popperScope,...arrowProps,ref:forwardedRef})});MenuArrow.displayName=ARROW_NAME$6;var SUB_NAME$2=`MenuSub`,[MenuSubProvider,useMenuSubContext]=createMenuContext(SUB_NAME$2),MenuSub=props=>{let{__scopeMenu,children,open=!1,onOpenChange}=props,parentMenuContext=useMenuContext(SUB_NAME$2,__scopeMenu),popperScope=usePopperScope$4(__scopeMenu),[trigger,setTrigger]=import_react.useState(null),[content,setContent]=import_react.useState(null),handleOpenChange=useCallbackRef(onOpenChange);return import_react.useEffect(()=>(parentMenuContext.open===!1&&handleOpenChange(!1),()=>handleOpenChange(!1)),[parentMenuContext.open,handleOpenChange]),(0,import_jsx_runtime.jsx)(Root2$9,{...popperScope,children:(0,import_jsx_runtime.jsx)(MenuProvider,{scope:__scopeMenu,open,onOpenChange:handleOpenChange,content,onContentChange:setContent,children:(0,import_jsx_runtime.jsx)(MenuSubProvider,{scope:__scopeMenu,contentId:useId(),triggerId:useId(),trigger,onTriggerChange:setTrigger,children})})})};MenuSub.displayName=SUB_NAME$2;var SUB_TRIGGER_NAME$2=`MenuSubTrigger`,MenuSubTrigger=import_react.forwardRef((props,forwardedRef)=>{let context=useMenuContext(SUB_TRIGGER_NAME$2,props.__scopeMenu),rootContext=useMenuRootContext(SUB_TRIGGER_NAME$2,props.__scopeMenu),subContext=useMenuSubContext(SUB_TRIGGER_NAME$2,props.__scopeMenu),contentContext=useMenuContentContext(SUB_TRIGGER_NAME$2,props.__scopeMenu),openTimerRef=import_react.useRef(null),{pointerGraceTimerRef,onPointerGraceIntentChange}=contentContext,scope={__scopeMenu:props.__scopeMenu},clearOpenTimer=import_react.useCallback(()=>{openTimerRef.current&&window.clearTimeout(openTimerRef.current),openTimerRef.current=null},[]);return import_react.useEffect(()=>clearOpenTimer,[clearOpenTimer]),import_react.useEffect(()=>{let pointerGraceTimer=pointerGraceTimerRef.current;return()=>{window.clearTimeout(pointerGraceTimer),onPointerGraceIntentChange(null)}},[pointerGraceTimerRef,onPointerGraceIntentChange]),(0,import_jsx_runtime.jsx)(MenuAnchor,{asChild:!0,...scope,children:(0,import_jsx_runtime.jsx)(MenuItemImpl,{id:subContext.triggerId,"aria-haspopup":`menu`,"aria-expanded":context.open,"aria-controls":subContext.contentId,"data-state":getOpenState$1(context.open),...props,ref:composeRefs(forwardedRef,subContext.onTriggerChange),onClick:event=>{props.onClick?.(event),!(props.disabled||event.defaultPrevented)&&(event.currentTarget.focus(),context.open||context.onOpenChange(!0))},onPointerMove:composeEventHandlers(props.onPointerMove,whenMouse$1(event=>{contentContext.onItemEnter(event),!event.defaultPrevented&&!props.disabled&&!context.open&&!openTimerRef.current&&(contentContext.onPointerGraceIntentChange(null),openTimerRef.current=window.setTimeout(()=>{context.onOpenChange(!0),clearOpenTimer()},100))})),onPointerLeave:composeEventHandlers(props.onPointerLeave,whenMouse$1(event=>{clearOpenTimer();let contentRect=context.content?.getBoundingClientRect();if(contentRect){let side=context.content?.dataset.side,rightSide=side===`right`,bleed=rightSide?-5:5,contentNearEdge=contentRect[rightSide?`left`:`right`],contentFarEdge=contentRect[rightSide?`right`:`left`];contentContext.onPointerGraceIntentChange({area:[{x:event.clientX+bleed,y:event.clientY},{x:contentNearEdge,y:contentRect.top},{x:contentFarEdge,y:contentRect.top},{x:contentFarEdge,y:contentRect.bottom},{x:contentNearEdge,y:contentRect.bottom}],side}),window.clearTimeout(pointerGraceTimerRef.current),pointerGraceTimerRef.current=window.setTimeout(()=>contentContext.onPointerGraceIntentChange(null),300)}else{if(contentContext.onTriggerLeave(event),event.defaultPrevented)return;contentContext.onPointerGraceIntentChange(null)}})),onKeyDown:composeEventHandlers(props.onKeyDown,event=>{let isTypingAhead=contentContext.searchRef.current!==``;props.disabled||isTypingAhead&&event.key===` `||SUB_OPEN_KEYS[rootContext.dir].includes(event.key)&&(context.onOpenChange(!0),context.content?.focus(),event.preventDefault())})})})});MenuSubTrigger.displayName=SUB_TRIGGER_NAME$2;var SUB_CONTENT_NAME$2=`MenuSubContent`,MenuSubContent=import_react.forwardRef((props,forwardedRef)=>{let portalContext=usePortalContext$3(CONTENT_NAME$8,props.__scopeMenu),{forceMount=portalContext.forceMount,...subContentProps}=props,context=useMenuContext(CONTENT_NAME$8,props.__scopeMenu),rootContext=useMenuRootContext(CONTENT_NAME$8,props.__scopeMenu),subContext=useMenuSubContext(SUB_CONTENT_NAME$2,props.__scopeMenu),ref=import_react.useRef(null),composedRefs=useComposedRefs(forwardedRef,ref);return(0,import_jsx_runtime.jsx)(Collection$3.Provider,{scope:props.__scopeMenu,children:(0,import_jsx_runtime.jsx)(Presence,{present:forceMount||context.open,children:(0,import_jsx_runtime.jsx)(Collection$3.Slot,{scope:props.__scopeMenu,children:(0,import_jsx_runtime.jsx)(MenuContentImpl,{id:subContext.contentId,"aria-labelledby":subContext.triggerId,...subContentProps,ref:composedRefs,align:`start`,side:rootContext.dir===`rtl`?`left`:`right`,disableOutsidePointerEvents:!1,disableOutsideScroll:!1,trapFocus:!1,onOpenAutoFocus:event=>{rootContext.isUsingKeyboardRef.current&&ref.current?.focus(),event.preventDefault()},onCloseAutoFocus:event=>event.preventDefault(),onFocusOutside:composeEventHandlers(props.onFocusOutside,event=>{event.target!==subContext.trigger&&context.onOpenChange(!1)}),onEscapeKeyDown:composeEventHandlers(props.onEscapeKeyDown,event=>{rootContext.onClose(),event.preventDefault()}),onKeyDown:composeEventHandlers(props.onKeyDown,event=>{let isKeyDownInside=event.currentTarget.contains(event.target),isCloseKey=SUB_CLOSE_KEYS[rootContext.dir].includes(event.key);isKeyDownInside&&isCloseKey&&(context.onOpenChange(!1),subContext.trigger?.focus(),event.preventDefault())})})})})})});MenuSubContent.displayName=SUB_CONTENT_NAME$2;function getOpenState$1(open){return open?`open`:`closed`}function isIndeterminate(checked){return checked===`indeterminate`}function getCheckedState(checked){return isIndeterminate(checked)?`indeterminate`:checked?`checked`:`unchecked`}function focusFirst$1(candidates){let PREVIOUSLY_FOCUSED_ELEMENT=document.activeElement;for(let candidate of candidates)if(candidate===PREVIOUSLY_FOCUSED_ELEMENT||(candidate.focus(),document.activeElement!==PREVIOUSLY_FOCUSED_ELEMENT))return}function wrapArray$1(array,startIndex){return array.map((_,index$1)=>array[(startIndex+index$1)%array.length])}function getNextMatch(values,search,currentMatch){let normalizedSearch=search.length>1&&Array.from(search).every(char=>char===search[0])?search[0]:search,currentMatchIndex=currentMatch?values.indexOf(currentMatch):-1,wrappedValues=wrapArray$1(values,Math.max(currentMatchIndex,0));normalizedSearch.length===1&&(wrappedValues=wrappedValues.filter(v$10=>v$10!==currentMatch));let nextMatch=wrappedValues.find(value$1=>value$1.toLowerCase().startsWith(normalizedSearch.toLowerCase()));return nextMatch===currentMatch?void 0:nextMatch}function isPointInPolygon$1(point,polygon){let{x:x$3,y:y$6}=point,inside=!1;for(let i$23=0,j=polygon.length-1;i$23<polygon.length;j=i$23++){let ii=polygon[i$23],jj=polygon[j],xi=ii.x,yi=ii.y,xj=jj.x,yj=jj.y;yi>y$6!=yj>y$6&&x$3<(xj-xi)*(y$6-yi)/(yj-yi)+xi&&(inside=!inside)}return inside}function isPointerInGraceArea(event,area){if(!area)return!1;let cursorPos={x:event.clientX,y:event.clientY};return isPointInPolygon$1(cursorPos,area)}function whenMouse$1(handler){return event=>event.pointerType===`mouse`?handler(event):void 0}var Root3$1=Menu,Anchor2$1=MenuAnchor,Portal$5=MenuPortal,Content2$6=MenuContent,Group$1=MenuGroup,Label$1=MenuLabel,Item2$4=MenuItem,CheckboxItem=MenuCheckboxItem,RadioGroup$1=MenuRadioGroup,RadioItem=MenuRadioItem,ItemIndicator$1=MenuItemIndicator,Separator$1=MenuSeparator,Arrow2$1=MenuArrow,Sub=MenuSub,SubTrigger=MenuSubTrigger,SubContent=MenuSubContent,CONTEXT_MENU_NAME=`ContextMenu`,[createContextMenuContext,createContextMenuScope]=createContextScope(CONTEXT_MENU_NAME,[createMenuScope]),useMenuScope$1=createMenuScope(),[ContextMenuProvider,useContextMenuContext]=createContextMenuContext(CONTEXT_MENU_NAME),ContextMenu=props=>{let{__scopeContextMenu,children,onOpenChange,dir,modal=!0}=props,[open,setOpen]=import_react.useState(!1),menuScope=useMenuScope$1(__scopeContextMenu),handleOpenChangeProp=useCallbackRef(onOpenChange),handleOpenChange=import_react.useCallback(open2=>{setOpen(open2),handleOpenChangeProp(open2)},[handleOpenChangeProp]);return(0,import_jsx_runtime.jsx)(ContextMenuProvider,{scope:__scopeContextMenu,open,onOpenChange:handleOpenChange,modal,children:(0,import_jsx_runtime.jsx)(Root3$1,{...menuScope,dir,open,onOpenChange:handleOpenChange,modal,children})})};ContextMenu.displayName=CONTEXT_MENU_NAME;var TRIGGER_NAME$7=`ContextMenuTrigger`,ContextMenuTrigger=import_react.forwardRef((props,forwardedRef)=>{let{__scopeContextMenu,disabled=!1,...triggerProps}=props,context=useContextMenuContext(TRIGGER_NAME$7,__scopeContextMenu),menuScope=useMenuScope$1(__scopeContextMenu),pointRef=import_react.useRef({x:0,y:0}),virtualRef=import_react.useRef({getBoundingClientRect:()=>DOMRect.fromRect({width:0,height:0,...pointRef.current})}),longPressTimerRef=import_react.useRef(0),clearLongPress=import_react.useCallback(()=>window.clearTimeout(longPressTimerRef.current),[]),handleOpen=event=>{pointRef.current={x:event.clientX,y:event.clientY},context.onOpenChange(!0)};return import_react.useEffect(()=>clearLongPress,[clearLongPress]),import_react.useEffect(()=>void(disabled&&clearLongPress()),[disabled,clearLongPress]),(0,import_jsx_runtime.jsxs)(import_jsx_runtime.Fragment,{children:[(0,import_jsx_runtime.jsx)(Anchor2$1,{...menuScope,virtualRef}),(0,import_jsx_runtime.jsx)(Primitive$1.span,{"data-state":context.open?`open`:`closed`,"data-disabled":disabled?``:void 0,...triggerProps,ref:forwardedRef,style:{WebkitTouchCallout:`none`,...props.style},onContextMenu:disabled?props.onContextMenu:composeEventHandlers(props.onContextMenu,event=>{clearLongPress(),handleOpen(event),event.preventDefault()}),onPointerDown:disabled?props.onPointerDown:composeEventHandlers(props.onPointerDown,whenTouchOrPen(event=>{clearLongPress(),longPressTimerRef.current=window.setTimeout(()=>handleOpen(event),700)})),onPointerMove:disabled?props.onPointerMove:composeEventHandlers(props.onPointerMove,whenTouchOrPen(clearLongPress)),onPointerCancel:disabled?props.onPointerCancel:composeEventHandlers(props.onPointerCancel,whenTouchOrPen(clearLongPress)),onPointerUp:disabled?props.onPointerUp:composeEventHandlers(props.onPointerUp,whenTouchOrPen(clearLongPress))})]})});ContextMenuTrigger.displayName=TRIGGER_NAME$7;var PORTAL_NAME$5=`ContextMenuPortal`,ContextMenuPortal=props=>{let{__scopeContextMenu,...portalProps}=props,menuScope=useMenuScope$1(__scopeContextMenu);return(0,import_jsx_runtime.jsx)(Portal$5,{...menuScope,...portalProps})};ContextMenuPortal.displayName=PORTAL_NAME$5;var CONTENT_NAME$7=`ContextMenuContent`,ContextMenuContent=import_react.forwardRef((props,forwardedRef)=>{let{__scopeContextMenu,...contentProps}=props,context=useContextMenuContext(CONTENT_NAME$7,__scopeContextMenu),menuScope=useMenuScope$1(__scopeContextMenu),hasInteractedOutsideRef=import_react.useRef(!1);return(0,import_jsx_runtime.jsx)(Content2$6,{...menuScope,...contentProps,ref:forwardedRef,side:`right`,sideOffset:2,align:`start`,onCloseAutoFocus:event=>{props.onCloseAutoFocus?.(event),!event.defaultPrevented&&hasInteractedOutsideRef.current&&event.preventDefault(),hasInteractedOutsideRef.current=!1},onInteractOutside:event=>{props.onInteractOutside?.(event),!event.defaultPrevented&&!context.modal&&(hasInteractedOutsideRef.current=!0)},style:{...props.style,"--radix-context-menu-content-transform-origin":`var(--radix-popper-transform-origin)`,"--radix-context-menu-content-available-width":`var(--radix-popper-available-width)`,"--radix-context-menu-content-available-height":`var(--radix-popper-available-height)`,"--radix-context-menu-trigger-width":`var(--radix-popper-anchor-width)`,"--radix-context-menu-trigger-height":`var(--radix-popper-anchor-height)`}})});ContextMenuContent.displayName=CONTENT_NAME$7;var GROUP_NAME$2=`ContextMenuGroup`,ContextMenuGroup=import_react.forwardRef((props,forwardedRef)=>{let{__scopeContextMenu,...groupProps}=props,menuScope=useMenuScope$1(__scopeContextMenu);return(0,import_jsx_runtime.jsx)(Group$1,{...menuScope,...groupProps,ref:forwardedRef})});ContextMenuGroup.displayName=GROUP_NAME$2;var LABEL_NAME$2=`ContextMenuLabel`,ContextMenuLabel=import_react.forwardRef((props,forwardedRef)=>{let{__scopeContextMenu,...labelProps}=props,menuScope=useMenuScope$1(__scopeContextMenu);return(0,import_jsx_runtime.jsx)(Label$1,{...menuScope,...labelProps,ref:forwardedRef})});ContextMenuLabel.displayName=LABEL_NAME$2;var ITEM_NAME$5=`ContextMenuItem`,ContextMenuItem=import_react.forwardRef((props,forwardedRef)=>{let{__scopeContextMenu,...itemProps}=props,menuScope=useMenuScope$1(__scopeContextMenu);return(0,import_jsx_runtime.jsx)(Item2$4,{...menuScope,...itemProps,ref:forwardedRef})});ContextMenuItem.displayName=ITEM_NAME$5;var CHECKBOX_ITEM_NAME$1=`ContextMenuCheckboxItem`,ContextMenuCheckboxItem=import_react.forwardRef((props,forwardedRef)=>{let{__scopeContextMenu,...checkboxItemProps}=props,menuScope=useMenuScope$1(__scopeContextMenu);return(0,import_jsx_runtime.jsx)(CheckboxItem,{...menuScope,...checkboxItemProps,ref:forwardedRef})});ContextMenuCheckboxItem.displayName=CHECKBOX_ITEM_NAME$1;var RADIO_GROUP_NAME$2=`ContextMenuRadioGroup`,ContextMenuRadioGroup=import_react.forwardRef((props,forwardedRef)=>{let{__scopeContextMenu,...radioGroupProps}=props,menuScope=useMenuScope$1(__scopeContextMenu);return(0,import_jsx_runtime.jsx)(RadioGroup$1,{...menuScope,...radioGroupProps,ref:forwardedRef})});ContextMenuRadioGroup.displayName=RADIO_GROUP_NAME$2;var RADIO_ITEM_NAME$1=`ContextMenuRadioItem`,ContextMenuRadioItem=import_react.forwardRef((props,forwardedRef)=>{let{__scopeContextMenu,...radioItemProps}=props,menuScope=useMenuScope$1(__scopeContextMenu);return(0,import_jsx_runtime.jsx)(RadioItem,{...menuScope,...radioItemProps,ref:forwardedRef})});ContextMenuRadioItem.displayName=RADIO_ITEM_NAME$1;var INDICATOR_NAME$4=`ContextMenuItemIndicator`,ContextMenuItemIndicator=import_react.forwardRef((props,forwardedRef)=>{let{__scopeContextMenu,...itemIndicatorProps}=props,menuScope=useMenuScope$1(__scopeContextMenu);return(0,import_jsx_runtime.jsx)(ItemIndicator$1,{...menuScope,...itemIndicatorProps,ref:forwardedRef})});ContextMenuItemIndicator.displayName=INDICATOR_NAME$4;var SEPARATOR_NAME$2=`ContextMenuSeparator`,ContextMenuSeparator=import_react.forwardRef((props,forwardedRef)=>{let{__scopeContextMenu,...separatorProps}=props,menuScope=useMenuScope$1(__scopeContextMenu);return(0,import_jsx_runtime.jsx)(Separator$1,{...menuScope,...separatorProps,ref:forwardedRef})});ContextMenuSeparator.displayName=SEPARATOR_NAME$2;var ARROW_NAME$5=`ContextMenuArrow`,ContextMenuArrow=import_react.forwardRef((props,forwardedRef)=>{let{__scopeContextMenu,...arrowProps}=props,menuScope=useMenuScope$1(__scopeContextMenu);return(0,import_jsx_runtime.jsx)(Arrow2$1,{...menuScope,...arrowProps,ref:forwardedRef})});ContextMenuArrow.displayName=ARROW_NAME$5;var SUB_NAME$1=`ContextMenuSub`,ContextMenuSub=props=>{let{__scopeContextMenu,children,onOpenChange,open:openProp,defaultOpen}=props,menuScope=useMenuScope$1(__scopeContextMenu),[open,setOpen]=useControllableState({prop:openProp,defaultProp:defaultOpen??!1,onChange:onOpenChange,caller:SUB_NAME$1});return(0,import_jsx_runtime.jsx)(Sub,{...menuScope,open,onOpenChange:setOpen,children})};ContextMenuSub.displayName=SUB_NAME$1;var SUB_TRIGGER_NAME$1=`ContextMenuSubTrigger`,ContextMenuSubTrigger=import_react.forwardRef((props,forwardedRef)=>{let{__scopeContextMenu,...triggerItemProps}=props,menuScope=useMenuScope$1(__scopeContextMenu);return(0,import_jsx_runtime.jsx)(SubTrigger,{...menuScope,...triggerItemProps,ref:forwardedRef})});ContextMenuSubTrigger.displayName=SUB_TRIGGER_NAME$1;var SUB_CONTENT_NAME$1=`ContextMenuSubContent`,ContextMenuSubContent=import_react.forwardRef((props,forwardedRef)=>{let{__scopeContextMenu,...subContentProps}=props,menuScope=useMenuScope$1(__scopeContextMenu);return(0,import_jsx_runtime.jsx)(SubContent,{...menuScope,...subContentProps,ref:forwardedRef,style:{...props.style,"--radix-context-menu-content-transform-origin":`var(--radix-popper-transform-origin)`,"--radix-context-menu-content-available-width":`var(--radix-popper-available-width)`,"--radix-context-menu-content-available-height":`var(--radix-popper-available-height)`,"--radix-context-menu-trigger-width":`var(--radix-popper-anchor-width)`,"--radix-context-menu-trigger-height":`var(--radix-popper-anchor-height)`}})});ContextMenuSubContent.displayName=SUB_CONTENT_NAME$1;function whenTouchOrPen(handler){return event=>event.pointerType===`mouse`?void 0:handler(event)}var Root2$8=ContextMenu,Trigger$6=ContextMenuTrigger,Portal2$1=ContextMenuPortal,Content2$5=ContextMenuContent,Group2$1=ContextMenuGroup,Label2$1=ContextMenuLabel,Item2$3=ContextMenuItem,CheckboxItem2$1=ContextMenuCheckboxItem,RadioGroup2$1=ContextMenuRadioGroup,RadioItem2$1=ContextMenuRadioItem,ItemIndicator2$1=ContextMenuItemIndicator,Separator2$1=ContextMenuSeparator,Sub2$1=ContextMenuSub,SubTrigger2$1=ContextMenuSubTrigger,SubContent2$1=ContextMenuSubContent,DROPDOWN_MENU_NAME=`DropdownMenu`,[createDropdownMenuContext,createDropdownMenuScope]=createContextScope(DROPDOWN_MENU_NAME,[createMenuScope]),useMenuScope=createMenuScope(),[DropdownMenuProvider,useDropdownMenuContext]=createDropdownMenuContext(DROPDOWN_MENU_NAME),DropdownMenu=props=>{let{__scopeDropdownMenu,children,dir,open:openProp,defaultOpen,onOpenChange,modal=!0}=props,menuScope=useMenuScope(__scopeDropdownMenu),triggerRef=import_react.useRef(null),[open,setOpen]=useControllableState({prop:openProp,defaultProp:defaultOpen??!1,onChange:onOpenChange,caller:DROPDOWN_MENU_NAME});return(0,import_jsx_runtime.jsx)(DropdownMenuProvider,{scope:__scopeDropdownMenu,triggerId:useId(),triggerRef,contentId:useId(),open,onOpenChange:setOpen,onOpenToggle:import_react.useCallback(()=>setOpen(prevOpen=>!prevOpen),[setOpen]),modal,children:(0,import_jsx_runtime.jsx)(Root3$1,{...menuScope,open,onOpenChange:setOpen,dir,modal,children})})};DropdownMenu.displayName=DROPDOWN_MENU_NAME;var TRIGGER_NAME$6=`DropdownMenuTrigger`,DropdownMenuTrigger=import_react.forwardRef((props,forwardedRef)=>{let{__scopeDropdownMenu,disabled=!1,...triggerProps}=props,context=useDropdownMenuContext(TRIGGER_NAME$6,__scopeDropdownMenu),menuScope=useMenuScope(__scopeDropdownMenu);return(0,import_jsx_runtime.jsx)(Anchor2$1,{asChild:!0,...menuScope,children:(0,import_jsx_runtime.jsx)(Primitive$1.button,{type:`button`,id:context.triggerId,"aria-haspopup":`menu`,"aria-expanded":context.open,"aria-controls":context.open?context.contentId:void 0,"data-state":context.open?`open`:`closed`,"data-disabled":disabled?``:void 0,disabled,...triggerProps,ref:composeRefs(forwardedRef,context.triggerRef),onPointerDown:composeEventHandlers(props.onPointerDown,event=>{!disabled&&event.button===0&&event.ctrlKey===!1&&(context.onOpenToggle(),context.open||event.preventDefault())}),onKeyDown:composeEventHandlers(props.onKeyDown,event=>{disabled||([`Enter`,` `].includes(event.key)&&context.onOpenToggle(),event.key===`ArrowDown`&&context.onOpenChange(!0),[`Enter`,` `,`ArrowDown`].includes(event.key)&&event.preventDefault())})})})});DropdownMenuTrigger.displayName=TRIGGER_NAME$6;var PORTAL_NAME$4=`DropdownMenuPortal`,DropdownMenuPortal=props=>{let{__scopeDropdownMenu,...portalProps}=props,menuScope=useMenuScope(__scopeDropdownMenu);return(0,import_jsx_runtime.jsx)(Portal$5,{...menuScope,...portalProps})};DropdownMenuPortal.displayName=PORTAL_NAME$4;var CONTENT_NAME$6=`DropdownMenuContent`,DropdownMenuContent=import_react.forwardRef((props,forwardedRef)=>{let{__scopeDropdownMenu,...contentProps}=props,context=useDropdownMenuContext(CONTENT_NAME$6,__scopeDropdownMenu),menuScope=useMenuScope(__scopeDropdownMenu),hasInteractedOutsideRef=import_react.useRef(!1);return(0,import_jsx_runtime.jsx)(Content2$6,{id:context.contentId,"aria-labelledby":context.triggerId,...menuScope,...contentProps,ref:forwardedRef,onCloseAutoFocus:composeEventHandlers(props.onCloseAutoFocus,event=>{hasInteractedOutsideRef.current||context.triggerRef.current?.focus(),hasInteractedOutsideRef.current=!1,event.preventDefault()}),onInteractOutside:composeEventHandlers(props.onInteractOutside,event=>{let originalEvent=event.detail.originalEvent,ctrlLeftClick=originalEvent.button===0&&originalEvent.ctrlKey===!0,isRightClick=originalEvent.button===2||ctrlLeftClick;(!context.modal||isRightClick)&&(hasInteractedOutsideRef.current=!0)}),style:{...props.style,"--radix-dropdown-menu-content-transform-origin":`var(--radix-popper-transform-origin)`,"--radix-dropdown-menu-content-available-width":`var(--radix-popper-available-width)`,"--radix-dropdown-menu-content-available-height":`var(--radix-popper-available-height)`,"--radix-dropdown-menu-trigger-width":`var(--radix-popper-anchor-width)`,"--radix-dropdown-menu-trigger-height":`var(--radix-popper-anchor-height)`}})});DropdownMenuContent.displayName=CONTENT_NAME$6;var GROUP_NAME$1=`DropdownMenuGroup`,DropdownMenuGroup=import_react.forwardRef((props,forwardedRef)=>{let{__scopeDropdownMenu,...groupProps}=props,menuScope=useMenuScope(__scopeDropdownMenu);return(0,import_jsx_runtime.jsx)(Group$1,{...menuScope,...groupProps,ref:forwardedRef})});DropdownMenuGroup.displayName=GROUP_NAME$1;var LABEL_NAME$1=`DropdownMenuLabel`,DropdownMenuLabel=import_react.forwardRef((props,forwardedRef)=>{let{__scopeDropdownMenu,...labelProps}=props,menuScope=useMenuScope(__scopeDropdownMenu);return(0,import_jsx_runtime.jsx)(Label$1,{...menuScope,...labelProps,ref:forwardedRef})});DropdownMenuLabel.displayName=LABEL_NAME$1;var ITEM_NAME$4=`DropdownMenuItem`,DropdownMenuItem=import_react.forwardRef((props,forwardedRef)=>{let{__scopeDropdownMenu,...itemProps}=props,menuScope=useMenuScope(__scopeDropdownMenu);return(0,import_jsx_runtime.jsx)(Item2$4,{...menuScope,...itemProps,ref:forwardedRef})});DropdownMenuItem.displayName=ITEM_NAME$4;var CHECKBOX_ITEM_NAME=`DropdownMenuCheckboxItem`,DropdownMenuCheckboxItem=import_react.forwardRef((props,forwardedRef)=>{let{__scopeDropdownMenu,...checkboxItemProps}=props,menuScope=useMenuScope(__scopeDropdownMenu);return(0,import_jsx_runtime.jsx)(CheckboxItem,{...menuScope,...checkboxItemProps,ref:forwardedRef})});DropdownMenuCheckboxItem.displayName=CHECKBOX_ITEM_NAME;var RADIO_GROUP_NAME$1=`DropdownMenuRadioGroup`,DropdownMenuRadioGroup=import_react.forwardRef((props,forwardedRef)=>{let{__scopeDropdownMenu,...radioGroupProps}=props,menuScope=useMenuScope(__scopeDropdownMenu);return(0,import_jsx_runtime.jsx)(RadioGroup$1,{...menuScope,...radioGroupProps,ref:forwardedRef})});DropdownMenuRadioGroup.displayName=RADIO_GROUP_NAME$1;var RADIO_ITEM_NAME=`DropdownMenuRadioItem`,DropdownMenuRadioItem=import_react.forwardRef((props,forwardedRef)=>{let{__scopeDropdownMenu,...radioItemProps}=props,menuScope=useMenuScope(__scopeDropdownMenu);return(0,import_jsx_runtime.jsx)(RadioItem,{...menuScope,...radioItemProps,ref:forwardedRef})});DropdownMenuRadioItem.displayName=RADIO_ITEM_NAME;var INDICATOR_NAME$3=`DropdownMenuItemIndicator`,DropdownMenuItemIndicator=import_react.forwardRef((props,forwardedRef)=>{let{__scopeDropdownMenu,...itemIndicatorProps}=props,menuScope=useMenuScope(__scopeDropdownMenu);return(0,import_jsx_runtime.jsx)(ItemIndicator$1,{...menuScope,...itemIndicatorProps,ref:forwardedRef})});DropdownMenuItemIndicator.displayName=INDICATOR_NAME$3;var SEPARATOR_NAME$1=`DropdownMenuSeparator`,DropdownMenuSeparator=import_react.forwardRef((props,forwardedRef)=>{let{__scopeDropdownMenu,...separatorProps}=props,menuScope=useMenuScope(__scopeDropdownMenu);return(0,import_jsx_runtime.jsx)(Separator$1,{...menuScope,...separatorProps,ref:forwardedRef})});DropdownMenuSeparator.displayName=SEPARATOR_NAME$1;var ARROW_NAME$4=`DropdownMenuArrow`,DropdownMenuArrow=import_react.forwardRef((props,forwardedRef)=>{let{__scopeDropdownMenu,...arrowProps}=props,menuScope=useMenuScope(__scopeDropdownMenu);return(0,import_jsx_runtime.jsx)(Arrow2$1,{...menuScope,...arrowProps,ref:forwardedRef})});DropdownMenuArrow.displayName=ARROW_NAME$4;var DropdownMenuSub=props=>{let{__scopeDropdownMenu,children,open:openProp,onOpenChange,defaultOpen}=props,menuScope=useMenuScope(__scopeDropdownMenu),[open,setOpen]=useControllableState({prop:openProp,defaultProp:defaultOpen??!1,onChange:onOpenChange,caller:`DropdownMenuSub`});return(0,import_jsx_runtime.jsx)(Sub,{...menuScope,open,onOpenChange:setOpen,children})},SUB_TRIGGER_NAME=`DropdownMenuSubTrigger`,DropdownMenuSubTrigger=import_react.forwardRef((props,forwardedRef)=>{let{__scopeDropdownMenu,...subTriggerProps}=props,menuScope=useMenuScope(__scopeDropdownMenu);return(0,import_jsx_runtime.jsx)(SubTrigger,{...menuScope,...subTriggerProps,ref:forwardedRef})});DropdownMenuSubTrigger.displayName=SUB_TRIGGER_NAME;var SUB_CONTENT_NAME=`DropdownMenuSubContent`,DropdownMenuSubContent=import_react.forwardRef((props,forwardedRef)=>{let{__scopeDropdownMenu,...subContentProps}=props,menuScope=useMenuScope(__scopeDropdownMenu);return(0,import_jsx_runtime.jsx)(SubContent,{...menuScope,...subContentProps,ref:forwardedRef,style:{...props.style,"--radix-dropdown-menu-content-transform-origin":`var(--radix-popper-transform-origin)`,"--radix-dropdown-menu-content-available-width":`var(--radix-popper-available-width)`,"--radix-dropdown-menu-content-available-height":`var(--radix-popper-available-height)`,"--radix-dropdown-menu-trigger-width":`var(--radix-popper-anchor-width)`,"--radix-dropdown-menu-trigger-height":`var(--radix-popper-anchor-height)`}})});DropdownMenuSubContent.displayName=SUB_CONTENT_NAME;var Root2$7=DropdownMenu,Trigger$5=DropdownMenuTrigger,Portal2=DropdownMenuPortal,Content2$4=DropdownMenuContent,Group2=DropdownMenuGroup,Label2=DropdownMenuLabel,Item2$2=DropdownMenuItem,CheckboxItem2=DropdownMenuCheckboxItem,RadioGroup2=DropdownMenuRadioGroup,RadioItem2=DropdownMenuRadioItem,ItemIndicator2=DropdownMenuItemIndicator,Separator2=DropdownMenuSeparator,Sub2=DropdownMenuSub,SubTrigger2=DropdownMenuSubTrigger,SubContent2=DropdownMenuSubContent,originalBodyUserSelect,HOVERCARD_NAME=`HoverCard`,[createHoverCardContext,createHoverCardScope]=createContextScope(HOVERCARD_NAME,[createPopperScope]),usePopperScope$3=createPopperScope(),[HoverCardProvider,useHoverCardContext]=createHoverCardContext(HOVERCARD_NAME),HoverCard=props=>{let{__scopeHoverCard,children,open:openProp,defaultOpen,onOpenChange,openDelay=700,closeDelay=300}=props,popperScope=usePopperScope$3(__scopeHoverCard),openTimerRef=import_react.useRef(0),closeTimerRef=import_react.useRef(0),hasSelectionRef=import_react.useRef(!1),isPointerDownOnContentRef=import_react.useRef(!1),[open,setOpen]=useControllableState({prop:openProp,defaultProp:defaultOpen??!1,onChange:onOpenChange,caller:HOVERCARD_NAME}),handleOpen=import_react.useCallback(()=>{clearTimeout(closeTimerRef.current),openTimerRef.current=window.setTimeout(()=>setOpen(!0),openDelay)},[openDelay,setOpen]),handleClose=import_react.useCallback(()=>{clearTimeout(openTimerRef.current),!hasSelectionRef.current&&!isPointerDownOnContentRef.current&&(closeTimerRef.current=window.setTimeout(()=>setOpen(!1),closeDelay))},[closeDelay,setOpen]),handleDismiss=import_react.useCallback(()=>setOpen(!1),[setOpen]);return import_react.useEffect(()=>()=>{clearTimeout(openTimerRef.current),clearTimeout(closeTimerRef.current)},[]),(0,import_jsx_runtime.jsx)(HoverCardProvider,{scope:__scopeHoverCard,open,onOpenChange:setOpen,onOpen:handleOpen,onClose:handleClose,onDismiss:handleDismiss,hasSelectionRef,isPointerDownOnContentRef,children:(0,import_jsx_runtime.jsx)(Root2$9,{...popperScope,children})})};HoverCard.displayName=HOVERCARD_NAME;var TRIGGER_NAME$5=`HoverCardTrigger`,HoverCardTrigger=import_react.forwardRef((props,forwardedRef)=>{let{__scopeHoverCard,...triggerProps}=props,context=useHoverCardContext(TRIGGER_NAME$5,__scopeHoverCard),popperScope=usePopperScope$3(__scopeHoverCard);return(0,import_jsx_runtime.jsx)(Anchor,{asChild:!0,...popperScope,children:(0,import_jsx_runtime.jsx)(Primitive$1.a,{"data-state":context.open?`open`:`closed`,...triggerProps,ref:forwardedRef,onPointerEnter:composeEventHandlers(props.onPointerEnter,excludeTouch(context.onOpen)),onPointerLeave:composeEventHandlers(props.onPointerLeave,excludeTouch(context.onClose)),onFocus:composeEventHandlers(props.onFocus,context.onOpen),onBlur:composeEventHandlers(props.onBlur,context.onClose),onTouchStart:composeEventHandlers(props.onTouchStart,event=>event.preventDefault())})})});HoverCardTrigger.displayName=TRIGGER_NAME$5;var PORTAL_NAME$3=`HoverCardPortal`,[PortalProvider$2,usePortalContext$2]=createHoverCardContext(PORTAL_NAME$3,{forceMount:void 0}),HoverCardPortal=props=>{let{__scopeHoverCard,forceMount,children,container}=props,context=useHoverCardContext(PORTAL_NAME$3,__scopeHoverCard);return(0,import_jsx_runtime.jsx)(PortalProvider$2,{scope:__scopeHoverCard,forceMount,children:(0,import_jsx_runtime.jsx)(Presence,{present:forceMount||context.open,children:(0,import_jsx_runtime.jsx)(Portal,{asChild:!0,container,children})})})};HoverCardPortal.displayName=PORTAL_NAME$3;var CONTENT_NAME$5=`HoverCardContent`,HoverCardContent=import_react.forwardRef((props,forwardedRef)=>{let portalContext=usePortalContext$2(CONTENT_NAME$5,props.__scopeHoverCard),{forceMount=portalContext.forceMount,...contentProps}=props,context=useHoverCardContext(CONTENT_NAME$5,props.__scopeHoverCard);return(0,import_jsx_runtime.jsx)(Presence,{present:forceMount||context.open,children:(0,import_jsx_runtime.jsx)(HoverCardContentImpl,{"data-state":context.open?`open`:`closed`,...contentProps,onPointerEnter:composeEventHandlers(props.onPointerEnter,excludeTouch(context.onOpen)),onPointerLeave:composeEventHandlers(props.onPointerLeave,excludeTouch(context.onClose)),ref:forwardedRef})})});HoverCardContent.displayName=CONTENT_NAME$5;var HoverCardContentImpl=import_react.forwardRef((props,forwardedRef)=>{let{__scopeHoverCard,onEscapeKeyDown,onPointerDownOutside,onFocusOutside,onInteractOutside,...contentProps}=props,context=useHoverCardContext(CONTENT_NAME$5,__scopeHoverCard),popperScope=usePopperScope$3(__scopeHoverCard),ref=import_react.useRef(null),composedRefs=useComposedRefs(forwardedRef,ref),[containSelection,setContainSelection]=import_react.useState(!1);return import_react.useEffect(()=>{if(containSelection){let body=document.body;return originalBodyUserSelect=body.style.userSelect||body.style.webkitUserSelect,body.style.userSelect=`none`,body.style.webkitUserSelect=`none`,()=>{body.style.userSelect=originalBodyUserSelect,body.style.webkitUserSelect=originalBodyUserSelect}}},[containSelection]),import_react.useEffect(()=>{if(ref.current){let handlePointerUp=()=>{setContainSelection(!1),context.isPointerDownOnContentRef.current=!1,setTimeout(()=>{document.getSelection()?.toString()!==``&&(context.hasSelectionRef.current=!0)})};return document.addEventListener(`pointerup`,handlePointerUp),()=>{document.removeEventListener(`pointerup`,handlePointerUp),context.hasSelectionRef.current=!1,context.isPointerDownOnContentRef.current=!1}}},[context.isPointerDownOnContentRef,context.hasSelectionRef]),import_react.useEffect(()=>{ref.current&&getTabbableNodes(ref.current).forEach(tabbable=>tabbable.setAttribute(`tabindex`,`-1`))}),(0,import_jsx_runtime.jsx)(DismissableLayer,{asChild:!0,disableOutsidePointerEvents:!1,onInteractOutside,onEscapeKeyDown,onPointerDownOutside,onFocusOutside:composeEventHandlers(onFocusOutside,event=>{event.preventDefault()}),onDismiss:context.onDismiss,children:(0,import_jsx_runtime.jsx)(Content$1,{...popperScope,...contentProps,onPointerDown:composeEventHandlers(contentProps.onPointerDown,event=>{event.currentTarget.contains(event.target)&&setContainSelection(!0),context.hasSelectionRef.current=!1,context.isPointerDownOnContentRef.current=!0}),ref:composedRefs,style:{...contentProps.style,userSelect:containSelection?`text`:void 0,WebkitUserSelect:containSelection?`text`:void 0,"--radix-hover-card-content-transform-origin":`var(--radix-popper-transform-origin)`,"--radix-hover-card-content-available-width":`var(--radix-popper-available-width)`,"--radix-hover-card-content-available-height":`var(--radix-popper-available-height)`,"--radix-hover-card-trigger-width":`var(--radix-popper-anchor-width)`,"--radix-hover-card-trigger-height":`var(--radix-popper-anchor-height)`}})})}),ARROW_NAME$3=`HoverCardArrow`,HoverCardArrow=import_react.forwardRef((props,forwardedRef)=>{let{__scopeHoverCard,...arrowProps}=props,popperScope=usePopperScope$3(__scopeHoverCard);return(0,import_jsx_runtime.jsx)(Arrow,{...popperScope,...arrowProps,ref:forwardedRef})});HoverCardArrow.displayName=ARROW_NAME$3;function excludeTouch(eventHandler){return event=>event.pointerType===`touch`?void 0:eventHandler()}function getTabbableNodes(container){let nodes=[],walker=document.createTreeWalker(container,NodeFilter.SHOW_ELEMENT,{acceptNode:node=>node.tabIndex>=0?NodeFilter.FILTER_ACCEPT:NodeFilter.FILTER_SKIP});for(;walker.nextNode();)nodes.push(walker.currentNode);return nodes}var Root2$6=HoverCard,Trigger$4=HoverCardTrigger,Portal$4=HoverCardPortal,Content2$3=HoverCardContent,import_react_dom$1=__toESM(require_react_dom(),1),NAVIGATION_MENU_NAME=`NavigationMenu`,[Collection$2,useCollection$2,createCollectionScope$2]=createCollection(NAVIGATION_MENU_NAME),[FocusGroupCollection,useFocusGroupCollection,createFocusGroupCollectionScope]=createCollection(NAVIGATION_MENU_NAME),[createNavigationMenuContext,createNavigationMenuScope]=createContextScope(NAVIGATION_MENU_NAME,[createCollectionScope$2,createFocusGroupCollectionScope]),[NavigationMenuProviderImpl,useNavigationMenuContext]=createNavigationMenuContext(NAVIGATION_MENU_NAME),[ViewportContentProvider,useViewportContentContext]=createNavigationMenuContext(NAVIGATION_MENU_NAME),NavigationMenu=import_react.forwardRef((props,forwardedRef)=>{let{__scopeNavigationMenu,value:valueProp,onValueChange,defaultValue,delayDuration=200,skipDelayDuration=300,orientation=`horizontal`,dir,...NavigationMenuProps}=props,[navigationMenu,setNavigationMenu]=import_react.useState(null),composedRef=useComposedRefs(forwardedRef,node=>setNavigationMenu(node)),direction=useDirection(dir),openTimerRef=import_react.useRef(0),closeTimerRef=import_react.useRef(0),skipDelayTimerRef=import_react.useRef(0),[isOpenDelayed,setIsOpenDelayed]=import_react.useState(!0),[value$1,setValue]=useControllableState({prop:valueProp,onChange:value2=>{let isOpen=value2!==``,hasSkipDelayDuration=skipDelayDuration>0;isOpen?(window.clearTimeout(skipDelayTimerRef.current),hasSkipDelayDuration&&setIsOpenDelayed(!1)):(window.clearTimeout(skipDelayTimerRef.current),skipDelayTimerRef.current=window.setTimeout(()=>setIsOpenDelayed(!0),skipDelayDuration)),onValueChange?.(value2)},defaultProp:defaultValue??``,caller:NAVIGATION_MENU_NAME}),startCloseTimer=import_react.useCallback(()=>{window.clearTimeout(closeTimerRef.current),closeTimerRef.current=window.setTimeout(()=>setValue(``),150)},[setValue]),handleOpen=import_react.useCallback(itemValue=>{window.clearTimeout(closeTimerRef.current),setValue(itemValue)},[setValue]),handleDelayedOpen=import_react.useCallback(itemValue=>{value$1===itemValue?window.clearTimeout(closeTimerRef.current):openTimerRef.current=window.setTimeout(()=>{window.clearTimeout(closeTimerRef.current),setValue(itemValue)},delayDuration)},[value$1,setValue,delayDuration]);return import_react.useEffect(()=>()=>{window.clearTimeout(openTimerRef.current),window.clearTimeout(closeTimerRef.current),window.clearTimeout(skipDelayTimerRef.current)},[]),(0,import_jsx_runtime.jsx)(NavigationMenuProvider,{scope:__scopeNavigationMenu,isRootMenu:!0,value:value$1,dir:direction,orientation,rootNavigationMenu:navigationMenu,onTriggerEnter:itemValue=>{window.clearTimeout(openTimerRef.current),isOpenDelayed?handleDelayedOpen(itemValue):handleOpen(itemValue)},onTriggerLeave:()=>{window.clearTimeout(openTimerRef.current),startCloseTimer()},onContentEnter:()=>window.clearTimeout(closeTimerRef.current),onContentLeave:startCloseTimer,onItemSelect:itemValue=>{setValue(prevValue=>prevValue===itemValue?``:itemValue)},onItemDismiss:()=>setValue(``),children:(0,import_jsx_runtime.jsx)(Primitive$1.nav,{"aria-label":`Main`,"data-orientation":orientation,dir:direction,...NavigationMenuProps,ref:composedRef})})});NavigationMenu.displayName=NAVIGATION_MENU_NAME;var SUB_NAME=`NavigationMenuSub`,NavigationMenuSub=import_react.forwardRef((props,forwardedRef)=>{let{__scopeNavigationMenu,value:valueProp,onValueChange,defaultValue,orientation=`horizontal`,...subProps}=props,context=useNavigationMenuContext(SUB_NAME,__scopeNavigationMenu),[value$1,setValue]=useControllableState({prop:valueProp,onChange:onValueChange,defaultProp:defaultValue??``,caller:SUB_NAME});return(0,import_jsx_runtime.jsx)(NavigationMenuProvider,{scope:__scopeNavigationMenu,isRootMenu:!1,value:value$1,dir:context.dir,orientation,rootNavigationMenu:context.rootNavigationMenu,onTriggerEnter:itemValue=>setValue(itemValue),onItemSelect:itemValue=>setValue(itemValue),onItemDismiss:()=>setValue(``),children:(0,import_jsx_runtime.jsx)(Primitive$1.div,{"data-orientation":orientation,...subProps,ref:forwardedRef})})});NavigationMenuSub.displayName=SUB_NAME;var NavigationMenuProvider=props=>{let{scope,isRootMenu,rootNavigationMenu,dir,orientation,children,value:value$1,onItemSelect,onItemDismiss,onTriggerEnter,onTriggerLeave,onContentEnter,onContentLeave}=props,[viewport,setViewport]=import_react.useState(null),[viewportContent,setViewportContent]=import_react.useState(new Map),[indicatorTrack,setIndicatorTrack]=import_react.useState(null);return(0,import_jsx_runtime.jsx)(NavigationMenuProviderImpl,{scope,isRootMenu,rootNavigationMenu,value:value$1,previousValue:usePrevious(value$1),baseId:useId(),dir,orientation,viewport,onViewportChange:setViewport,indicatorTrack,onIndicatorTrackChange:setIndicatorTrack,onTriggerEnter:useCallbackRef(onTriggerEnter),onTriggerLeave:useCallbackRef(onTriggerLeave),onContentEnter:useCallbackRef(onContentEnter),onContentLeave:useCallbackRef(onContentLeave),onItemSelect:useCallbackRef(onItemSelect),onItemDismiss:useCallbackRef(onItemDismiss),onViewportContentChange:import_react.useCallback((contentValue,contentData)=>{setViewportContent(prevContent=>(prevContent.set(contentValue,contentData),new Map(prevContent)))},[]),onViewportContentRemove:import_react.useCallback(contentValue=>{setViewportContent(prevContent=>prevContent.has(contentValue)?(prevContent.delete(contentValue),new Map(prevContent)):prevContent)},[]),children:(0,import_jsx_runtime.jsx)(Collection$2.Provider,{scope,children:(0,import_jsx_runtime.jsx)(ViewportContentProvider,{scope,items:viewportContent,children})})})},LIST_NAME=`NavigationMenuList`,NavigationMenuList=import_react.forwardRef((props,forwardedRef)=>{let{__scopeNavigationMenu,...listProps}=props,context=useNavigationMenuContext(LIST_NAME,__scopeNavigationMenu),list=(0,import_jsx_runtime.jsx)(Primitive$1.ul,{"data-orientation":context.orientation,...listProps,ref:forwardedRef});return(0,import_jsx_runtime.jsx)(Primitive$1.div,{style:{position:`relative`},ref:context.onIndicatorTrackChange,children:(0,import_jsx_runtime.jsx)(Collection$2.Slot,{scope:__scopeNavigationMenu,children:context.isRootMenu?(0,import_jsx_runtime.jsx)(FocusGroup,{asChild:!0,children:list}):list})})});NavigationMenuList.displayName=LIST_NAME;var ITEM_NAME$3=`NavigationMenuItem`,[NavigationMenuItemContextProvider,useNavigationMenuItemContext]=createNavigationMenuContext(ITEM_NAME$3),NavigationMenuItem=import_react.forwardRef((props,forwardedRef)=>{let{__scopeNavigationMenu,value:valueProp,...itemProps}=props,autoValue=useId(),value$1=valueProp||autoValue||`LEGACY_REACT_AUTO_VALUE`,contentRef=import_react.useRef(null),triggerRef=import_react.useRef(null),focusProxyRef=import_react.useRef(null),restoreContentTabOrderRef=import_react.useRef(()=>{}),wasEscapeCloseRef=import_react.useRef(!1),handleContentEntry=import_react.useCallback((side=`start`)=>{if(contentRef.current){restoreContentTabOrderRef.current();let candidates=getTabbableCandidates(contentRef.current);candidates.length&&focusFirst(side===`start`?candidates:candidates.reverse())}},[]),handleContentExit=import_react.useCallback(()=>{if(contentRef.current){let candidates=getTabbableCandidates(contentRef.current);candidates.length&&(restoreContentTabOrderRef.current=removeFromTabOrder(candidates))}},[]);return(0,import_jsx_runtime.jsx)(NavigationMenuItemContextProvider,{scope:__scopeNavigationMenu,value:value$1,triggerRef,contentRef,focusProxyRef,wasEscapeCloseRef,onEntryKeyDown:handleContentEntry,onFocusProxyEnter:handleContentEntry,onRootContentClose:handleContentExit,onContentFocusOutside:handleContentExit,children:(0,import_jsx_runtime.jsx)(Primitive$1.li,{...itemProps,ref:forwardedRef})})});NavigationMenuItem.displayName=ITEM_NAME$3;var TRIGGER_NAME$4=`NavigationMenuTrigger`,NavigationMenuTrigger=import_react.forwardRef((props,forwardedRef)=>{let{__scopeNavigationMenu,disabled,...triggerProps}=props,context=useNavigationMenuContext(TRIGGER_NAME$4,props.__scopeNavigationMenu),itemContext=useNavigationMenuItemContext(TRIGGER_NAME$4,props.__scopeNavigationMenu),ref=import_react.useRef(null),composedRefs=useComposedRefs(ref,itemContext.triggerRef,forwardedRef),triggerId=makeTriggerId$1(context.baseId,itemContext.value),contentId=makeContentId$1(context.baseId,itemContext.value),hasPointerMoveOpenedRef=import_react.useRef(!1),wasClickCloseRef=import_react.useRef(!1),open=itemContext.value===context.value;return(0,import_jsx_runtime.jsxs)(import_jsx_runtime.Fragment,{children:[(0,import_jsx_runtime.jsx)(Collection$2.ItemSlot,{scope:__scopeNavigationMenu,value:itemContext.value,children:(0,import_jsx_runtime.jsx)(FocusGroupItem,{asChild:!0,children:(0,import_jsx_runtime.jsx)(Primitive$1.button,{id:triggerId,disabled,"data-disabled":disabled?``:void 0,"data-state":getOpenState(open),"aria-expanded":open,"aria-controls":contentId,...triggerProps,ref:composedRefs,onPointerEnter:composeEventHandlers(props.onPointerEnter,()=>{wasClickCloseRef.current=!1,itemContext.wasEscapeCloseRef.current=!1}),onPointerMove:composeEventHandlers(props.onPointerMove,whenMouse(()=>{disabled||wasClickCloseRef.current||itemContext.wasEscapeCloseRef.current||hasPointerMoveOpenedRef.current||(context.onTriggerEnter(itemContext.value),hasPointerMoveOpenedRef.current=!0)})),onPointerLeave:composeEventHandlers(props.onPointerLeave,whenMouse(()=>{disabled||(context.onTriggerLeave(),hasPointerMoveOpenedRef.current=!1)})),onClick:composeEventHandlers(props.onClick,()=>{context.onItemSelect(itemContext.value),wasClickCloseRef.current=open}),onKeyDown:composeEventHandlers(props.onKeyDown,event=>{let entryKey={horizontal:`ArrowDown`,vertical:context.dir===`rtl`?`ArrowLeft`:`ArrowRight`}[context.orientation];open&&event.key===entryKey&&(itemContext.onEntryKeyDown(),event.preventDefault())})})})}),open&&(0,import_jsx_runtime.jsxs)(import_jsx_runtime.Fragment,{children:[(0,import_jsx_runtime.jsx)(Root$10,{"aria-hidden":!0,tabIndex:0,ref:itemContext.focusProxyRef,onFocus:event=>{let content=itemContext.contentRef.current,prevFocusedElement=event.relatedTarget,wasTriggerFocused=prevFocusedElement===ref.current,wasFocusFromContent=content?.contains(prevFocusedElement);(wasTriggerFocused||!wasFocusFromContent)&&itemContext.onFocusProxyEnter(wasTriggerFocused?`start`:`end`)}}),context.viewport&&(0,import_jsx_runtime.jsx)(`span`,{"aria-owns":contentId})]})]})});NavigationMenuTrigger.displayName=TRIGGER_NAME$4;var LINK_NAME=`NavigationMenuLink`,LINK_SELECT=`navigationMenu.linkSelect`,NavigationMenuLink=import_react.forwardRef((props,forwardedRef)=>{let{__scopeNavigationMenu,active,onSelect,...linkProps}=props;return(0,import_jsx_runtime.jsx)(FocusGroupItem,{asChild:!0,children:(0,import_jsx_runtime.jsx)(Primitive$1.a,{"data-active":active?``:void 0,"aria-current":active?`page`:void 0,...linkProps,ref:forwardedRef,onClick:composeEventHandlers(props.onClick,event=>{let target=event.target,linkSelectEvent=new CustomEvent(LINK_SELECT,{bubbles:!0,cancelable:!0});if(target.addEventListener(LINK_SELECT,event2=>onSelect?.(event2),{once:!0}),dispatchDiscreteCustomEvent(target,linkSelectEvent),!linkSelectEvent.defaultPrevented&&!event.metaKey){let rootContentDismissEvent=new CustomEvent(ROOT_CONTENT_DISMISS,{bubbles:!0,cancelable:!0});dispatchDiscreteCustomEvent(target,rootContentDismissEvent)}},{checkForDefaultPrevented:!1})})})});NavigationMenuLink.displayName=LINK_NAME;var INDICATOR_NAME$2=`NavigationMenuIndicator`,NavigationMenuIndicator=import_react.forwardRef((props,forwardedRef)=>{let{forceMount,...indicatorProps}=props,context=useNavigationMenuContext(INDICATOR_NAME$2,props.__scopeNavigationMenu),isVisible=!!context.value;return context.indicatorTrack?import_react_dom$1.createPortal((0,import_jsx_runtime.jsx)(Presence,{present:forceMount||isVisible,children:(0,import_jsx_runtime.jsx)(NavigationMenuIndicatorImpl,{...indicatorProps,ref:forwardedRef})}),context.indicatorTrack):null});NavigationMenuIndicator.displayName=INDICATOR_NAME$2;var NavigationMenuIndicatorImpl=import_react.forwardRef((props,forwardedRef)=>{let{__scopeNavigationMenu,...indicatorProps}=props,context=useNavigationMenuContext(INDICATOR_NAME$2,__scopeNavigationMenu),getItems=useCollection$2(__scopeNavigationMenu),[activeTrigger,setActiveTrigger]=import_react.useState(null),[position,setPosition]=import_react.useState(null),isHorizontal=context.orientation===`horizontal`,isVisible=!!context.value;import_react.useEffect(()=>{let triggerNode=getItems().find(item=>item.value===context.value)?.ref.current;triggerNode&&setActiveTrigger(triggerNode)},[getItems,context.value]);let handlePositionChange=()=>{activeTrigger&&setPosition({size:isHorizontal?activeTrigger.offsetWidth:activeTrigger.offsetHeight,offset:isHorizontal?activeTrigger.offsetLeft:activeTrigger.offsetTop})};return useResizeObserver$1(activeTrigger,handlePositionChange),useResizeObserver$1(context.indicatorTrack,handlePositionChange),position?(0,import_jsx_runtime.jsx)(Primitive$1.div,{"aria-hidden":!0,"data-state":isVisible?`visible`:`hidden`,"data-orientation":context.orientation,...indicatorProps,ref:forwardedRef,style:{position:`absolute`,...isHorizontal?{left:0,width:position.size+`px`,transform:`translateX(${position.offset}px)`}:{top:0,height:position.size+`px`,transform:`translateY(${position.offset}px)`},...indicatorProps.style}}):null}),CONTENT_NAME$4=`NavigationMenuContent`,NavigationMenuContent=import_react.forwardRef((props,forwardedRef)=>{let{forceMount,...contentProps}=props,context=useNavigationMenuContext(CONTENT_NAME$4,props.__scopeNavigationMenu),itemContext=useNavigationMenuItemContext(CONTENT_NAME$4,props.__scopeNavigationMenu),composedRefs=useComposedRefs(itemContext.contentRef,forwardedRef),open=itemContext.value===context.value,commonProps={value:itemContext.value,triggerRef:itemContext.triggerRef,focusProxyRef:itemContext.focusProxyRef,wasEscapeCloseRef:itemContext.wasEscapeCloseRef,onContentFocusOutside:itemContext.onContentFocusOutside,onRootContentClose:itemContext.onRootContentClose,...contentProps};return context.viewport?(0,import_jsx_runtime.jsx)(ViewportContentMounter,{forceMount,...commonProps,ref:composedRefs}):(0,import_jsx_runtime.jsx)(Presence,{present:forceMount||open,children:(0,import_jsx_runtime.jsx)(NavigationMenuContentImpl,{"data-state":getOpenState(open),...commonProps,ref:composedRefs,onPointerEnter:composeEventHandlers(props.onPointerEnter,context.onContentEnter),onPointerLeave:composeEventHandlers(props.onPointerLeave,whenMouse(context.onContentLeave)),style:{pointerEvents:!open&&context.isRootMenu?`none`:void 0,...commonProps.style}})})});NavigationMenuContent.displayName=CONTENT_NAME$4;var ViewportContentMounter=import_react.forwardRef((props,forwardedRef)=>{let{onViewportContentChange,onViewportContentRemove}=useNavigationMenuContext(CONTENT_NAME$4,props.__scopeNavigationMenu);return useLayoutEffect2(()=>{onViewportContentChange(props.value,{ref:forwardedRef,...props})},[props,forwardedRef,onViewportContentChange]),useLayoutEffect2(()=>()=>onViewportContentRemove(props.value),[props.value,onViewportContentRemove]),null}),ROOT_CONTENT_DISMISS=`navigationMenu.rootContentDismiss`,NavigationMenuContentImpl=import_react.forwardRef((props,forwardedRef)=>{let{__scopeNavigationMenu,value:value$1,triggerRef,focusProxyRef,wasEscapeCloseRef,onRootContentClose,onContentFocusOutside,...contentProps}=props,context=useNavigationMenuContext(CONTENT_NAME$4,__scopeNavigationMenu),ref=import_react.useRef(null),composedRefs=useComposedRefs(ref,forwardedRef),triggerId=makeTriggerId$1(context.baseId,value$1),contentId=makeContentId$1(context.baseId,value$1),getItems=useCollection$2(__scopeNavigationMenu),prevMotionAttributeRef=import_react.useRef(null),{onItemDismiss}=context;import_react.useEffect(()=>{let content=ref.current;if(context.isRootMenu&&content){let handleClose=()=>{onItemDismiss(),onRootContentClose(),content.contains(document.activeElement)&&triggerRef.current?.focus()};return content.addEventListener(ROOT_CONTENT_DISMISS,handleClose),()=>content.removeEventListener(ROOT_CONTENT_DISMISS,handleClose)}},[context.isRootMenu,props.value,triggerRef,onItemDismiss,onRootContentClose]);let motionAttribute=import_react.useMemo(()=>{let values=getItems().map(item=>item.value);context.dir===`rtl`&&values.reverse();let index$1=values.indexOf(context.value),prevIndex=values.indexOf(context.previousValue),isSelected=value$1===context.value,wasSelected=prevIndex===values.indexOf(value$1);if(!isSelected&&!wasSelected)return prevMotionAttributeRef.current;let attribute=(()=>{if(index$1!==prevIndex){if(isSelected&&prevIndex!==-1)return index$1>prevIndex?`from-end`:`from-start`;if(wasSelected&&index$1!==-1)return index$1>prevIndex?`to-start`:`to-end`}return null})();return prevMotionAttributeRef.current=attribute,attribute},[context.previousValue,context.value,context.dir,getItems,value$1]);return(0,import_jsx_runtime.jsx)(FocusGroup,{asChild:!0,children:(0,import_jsx_runtime.jsx)(DismissableLayer,{id:contentId,"aria-labelledby":triggerId,"data-motion":motionAttribute,"data-orientation":context.orientation,...contentProps,ref:composedRefs,disableOutsidePointerEvents:!1,onDismiss:()=>{let rootContentDismissEvent=new Event(ROOT_CONTENT_DISMISS,{bubbles:!0,cancelable:!0});ref.current?.dispatchEvent(rootContentDismissEvent)},onFocusOutside:composeEventHandlers(props.onFocusOutside,event=>{onContentFocusOutside();let target=event.target;context.rootNavigationMenu?.contains(target)&&event.preventDefault()}),onPointerDownOutside:composeEventHandlers(props.onPointerDownOutside,event=>{let target=event.target,isTrigger=getItems().some(item=>item.ref.current?.contains(target)),isRootViewport=context.isRootMenu&&context.viewport?.contains(target);(isTrigger||isRootViewport||!context.isRootMenu)&&event.preventDefault()}),onKeyDown:composeEventHandlers(props.onKeyDown,event=>{let isMetaKey=event.altKey||event.ctrlKey||event.metaKey;if(event.key===`Tab`&&!isMetaKey){let candidates=getTabbableCandidates(event.currentTarget),focusedElement=document.activeElement,index$1=candidates.findIndex(candidate=>candidate===focusedElement),nextCandidates=event.shiftKey?candidates.slice(0,index$1).reverse():candidates.slice(index$1+1,candidates.length);focusFirst(nextCandidates)?event.preventDefault():focusProxyRef.current?.focus()}}),onEscapeKeyDown:composeEventHandlers(props.onEscapeKeyDown,_event=>{wasEscapeCloseRef.current=!0})})})}),VIEWPORT_NAME$2=`NavigationMenuViewport`,NavigationMenuViewport=import_react.forwardRef((props,forwardedRef)=>{let{forceMount,...viewportProps}=props,open=!!useNavigationMenuContext(VIEWPORT_NAME$2,props.__scopeNavigationMenu).value;return(0,import_jsx_runtime.jsx)(Presence,{present:forceMount||open,children:(0,import_jsx_runtime.jsx)(NavigationMenuViewportImpl,{...viewportProps,ref:forwardedRef})})});NavigationMenuViewport.displayName=VIEWPORT_NAME$2;var NavigationMenuViewportImpl=import_react.forwardRef((props,forwardedRef)=>{let{__scopeNavigationMenu,children,...viewportImplProps}=props,context=useNavigationMenuContext(VIEWPORT_NAME$2,__scopeNavigationMenu),composedRefs=useComposedRefs(forwardedRef,context.onViewportChange),viewportContentContext=useViewportContentContext(CONTENT_NAME$4,props.__scopeNavigationMenu),[size$3,setSize]=import_react.useState(null),[content,setContent]=import_react.useState(null),viewportWidth=size$3?size$3?.width+`px`:void 0,viewportHeight=size$3?size$3?.height+`px`:void 0,open=!!context.value,activeContentValue=open?context.value:context.previousValue;return useResizeObserver$1(content,()=>{content&&setSize({width:content.offsetWidth,height:content.offsetHeight})}),(0,import_jsx_runtime.jsx)(Primitive$1.div,{"data-state":getOpenState(open),"data-orientation":context.orientation,...viewportImplProps,ref:composedRefs,style:{pointerEvents:!open&&context.isRootMenu?`none`:void 0,"--radix-navigation-menu-viewport-width":viewportWidth,"--radix-navigation-menu-viewport-height":viewportHeight,...viewportImplProps.style},onPointerEnter:composeEventHandlers(props.onPointerEnter,context.onContentEnter),onPointerLeave:composeEventHandlers(props.onPointerLeave,whenMouse(context.onContentLeave)),children:Array.from(viewportContentContext.items).map(([value$1,{ref,forceMount,...props2}])=>{let isActive=activeContentValue===value$1;return(0,import_jsx_runtime.jsx)(Presence,{present:forceMount||isActive,children:(0,import_jsx_runtime.jsx)(NavigationMenuContentImpl,{...props2,ref:composeRefs(ref,node=>{isActive&&node&&setContent(node)})})},value$1)})})}),FOCUS_GROUP_NAME=`FocusGroup`,FocusGroup=import_react.forwardRef((props,forwardedRef)=>{let{__scopeNavigationMenu,...groupProps}=props,context=useNavigationMenuContext(FOCUS_GROUP_NAME,__scopeNavigationMenu);return(0,import_jsx_runtime.jsx)(FocusGroupCollection.Provider,{scope:__scopeNavigationMenu,children:(0,import_jsx_runtime.jsx)(FocusGroupCollection.Slot,{scope:__scopeNavigationMenu,children:(0,import_jsx_runtime.jsx)(Primitive$1.div,{dir:context.dir,...groupProps,ref:forwardedRef})})})}),ARROW_KEYS$2=[`ArrowRight`,`ArrowLeft`,`ArrowUp`,`ArrowDown`],FOCUS_GROUP_ITEM_NAME=`FocusGroupItem`,FocusGroupItem=import_react.forwardRef((props,forwardedRef)=>{let{__scopeNavigationMenu,...groupProps}=props,getItems=useFocusGroupCollection(__scopeNavigationMenu),context=useNavigationMenuContext(FOCUS_GROUP_ITEM_NAME,__scopeNavigationMenu);return(0,import_jsx_runtime.jsx)(FocusGroupCollection.ItemSlot,{scope:__scopeNavigationMenu,children:(0,import_jsx_runtime.jsx)(Primitive$1.button,{...groupProps,ref:forwardedRef,onKeyDown:composeEventHandlers(props.onKeyDown,event=>{if([`Home`,`End`,...ARROW_KEYS$2].includes(event.key)){let candidateNodes=getItems().map(item=>item.ref.current);if([context.dir===`rtl`?`ArrowRight`:`ArrowLeft`,`ArrowUp`,`End`].includes(event.key)&&candidateNodes.reverse(),ARROW_KEYS$2.includes(event.key)){let currentIndex=candidateNodes.indexOf(event.currentTarget);candidateNodes=candidateNodes.slice(currentIndex+1)}setTimeout(()=>focusFirst(candidateNodes)),event.preventDefault()}})})})});function getTabbableCandidates(container){let nodes=[],walker=document.createTreeWalker(container,NodeFilter.SHOW_ELEMENT,{acceptNode:node=>{let isHiddenInput=node.tagName===`INPUT`&&node.type===`hidden`;return node.disabled||node.hidden||isHiddenInput?NodeFilter.FILTER_SKIP:node.tabIndex>=0?NodeFilter.FILTER_ACCEPT:NodeFilter.FILTER_SKIP}});for(;walker.nextNode();)nodes.push(walker.currentNode);return nodes}function focusFirst(candidates){let previouslyFocusedElement=document.activeElement;return candidates.some(candidate=>candidate===previouslyFocusedElement?!0:(candidate.focus(),document.activeElement!==previouslyFocusedElement))}function removeFromTabOrder(candidates){return candidates.forEach(candidate=>{candidate.dataset.tabindex=candidate.getAttribute(`tabindex`)||``,candidate.setAttribute(`tabindex`,`-1`)}),()=>{candidates.forEach(candidate=>{let prevTabIndex=candidate.dataset.tabindex;candidate.setAttribute(`tabindex`,prevTabIndex)})}}function useResizeObserver$1(element,onResize){let handleResize=useCallbackRef(onResize);useLayoutEffect2(()=>{let rAF=0;if(element){let resizeObserver=new ResizeObserver(()=>{cancelAnimationFrame(rAF),rAF=window.requestAnimationFrame(handleResize)});return resizeObserver.observe(element),()=>{window.cancelAnimationFrame(rAF),resizeObserver.unobserve(element)}}},[element,handleResize])}function getOpenState(open){return open?`open`:`closed`}function makeTriggerId$1(baseId,value$1){return`${baseId}-trigger-${value$1}`}function makeContentId$1(baseId,value$1){return`${baseId}-content-${value$1}`}function whenMouse(handler){return event=>event.pointerType===`mouse`?handler(event):void 0}var Root2$5=NavigationMenu,List$1=NavigationMenuList,Item$1=NavigationMenuItem,Link=NavigationMenuLink;function clamp(value$1,[min$1,max$1]){return Math.min(max$1,Math.max(min$1,value$1))}var POPOVER_NAME=`Popover`,[createPopoverContext,createPopoverScope]=createContextScope(POPOVER_NAME,[createPopperScope]),usePopperScope$2=createPopperScope(),[PopoverProvider,usePopoverContext]=createPopoverContext(POPOVER_NAME),Popover=props=>{let{__scopePopover,children,open:openProp,defaultOpen,onOpenChange,modal=!1}=props,popperScope=usePopperScope$2(__scopePopover),triggerRef=import_react.useRef(null),[hasCustomAnchor,setHasCustomAnchor]=import_react.useState(!1),[open,setOpen]=useControllableState({prop:openProp,defaultProp:defaultOpen??!1,onChange:onOpenChange,caller:POPOVER_NAME});return(0,import_jsx_runtime.jsx)(Root2$9,{...popperScope,children:(0,import_jsx_runtime.jsx)(PopoverProvider,{scope:__scopePopover,contentId:useId(),triggerRef,open,onOpenChange:setOpen,onOpenToggle:import_react.useCallback(()=>setOpen(prevOpen=>!prevOpen),[setOpen]),hasCustomAnchor,onCustomAnchorAdd:import_react.useCallback(()=>setHasCustomAnchor(!0),[]),onCustomAnchorRemove:import_react.useCallback(()=>setHasCustomAnchor(!1),[]),modal,children})})};Popover.displayName=POPOVER_NAME;var ANCHOR_NAME=`PopoverAnchor`,PopoverAnchor=import_react.forwardRef((props,forwardedRef)=>{let{__scopePopover,...anchorProps}=props,context=usePopoverContext(ANCHOR_NAME,__scopePopover),popperScope=usePopperScope$2(__scopePopover),{onCustomAnchorAdd,onCustomAnchorRemove}=context;return import_react.useEffect(()=>(onCustomAnchorAdd(),()=>onCustomAnchorRemove()),[onCustomAnchorAdd,onCustomAnchorRemove]),(0,import_jsx_runtime.jsx)(Anchor,{...popperScope,...anchorProps,ref:forwardedRef})});PopoverAnchor.displayName=ANCHOR_NAME;var TRIGGER_NAME$3=`PopoverTrigger`,PopoverTrigger=import_react.forwardRef((props,forwardedRef)=>{let{__scopePopover,...triggerProps}=props,context=usePopoverContext(TRIGGER_NAME$3,__scopePopover),popperScope=usePopperScope$2(__scopePopover),composedTriggerRef=useComposedRefs(forwardedRef,context.triggerRef),trigger=(0,import_jsx_runtime.jsx)(Primitive$1.button,{type:`button`,"aria-haspopup":`dialog`,"aria-expanded":context.open,"aria-controls":context.contentId,"data-state":getState$2(context.open),...triggerProps,ref:composedTriggerRef,onClick:composeEventHandlers(props.onClick,context.onOpenToggle)});return context.hasCustomAnchor?trigger:(0,import_jsx_runtime.jsx)(Anchor,{asChild:!0,...popperScope,children:trigger})});PopoverTrigger.displayName=TRIGGER_NAME$3;var PORTAL_NAME$2=`PopoverPortal`,[PortalProvider$1,usePortalContext$1]=createPopoverContext(PORTAL_NAME$2,{forceMount:void 0}),PopoverPortal=props=>{let{__scopePopover,forceMount,children,container}=props,context=usePopoverContext(PORTAL_NAME$2,__scopePopover);return(0,import_jsx_runtime.jsx)(PortalProvider$1,{scope:__scopePopover,forceMount,children:(0,import_jsx_runtime.jsx)(Presence,{present:forceMount||context.open,children:(0,import_jsx_runtime.jsx)(Portal,{asChild:!0,container,children})})})};PopoverPortal.displayName=PORTAL_NAME$2;var CONTENT_NAME$3=`PopoverContent`,PopoverContent=import_react.forwardRef((props,forwardedRef)=>{let portalContext=usePortalContext$1(CONTENT_NAME$3,props.__scopePopover),{forceMount=portalContext.forceMount,...contentProps}=props,context=usePopoverContext(CONTENT_NAME$3,props.__scopePopover);return(0,import_jsx_runtime.jsx)(Presence,{present:forceMount||context.open,children:context.modal?(0,import_jsx_runtime.jsx)(PopoverContentModal,{...contentProps,ref:forwardedRef}):(0,import_jsx_runtime.jsx)(PopoverContentNonModal,{...contentProps,ref:forwardedRef})})});PopoverContent.displayName=CONTENT_NAME$3;var Slot$1=createSlot(`PopoverContent.RemoveScroll`),PopoverContentModal=import_react.forwardRef((props,forwardedRef)=>{let context=usePopoverContext(CONTENT_NAME$3,props.__scopePopover),contentRef=import_react.useRef(null),composedRefs=useComposedRefs(forwardedRef,contentRef),isRightClickOutsideRef=import_react.useRef(!1);return import_react.useEffect(()=>{let content=contentRef.current;if(content)return hideOthers(content)},[]),(0,import_jsx_runtime.jsx)(Combination_default,{as:Slot$1,allowPinchZoom:!0,children:(0,import_jsx_runtime.jsx)(PopoverContentImpl,{...props,ref:composedRefs,trapFocus:context.open,disableOutsidePointerEvents:!0,onCloseAutoFocus:composeEventHandlers(props.onCloseAutoFocus,event=>{event.preventDefault(),isRightClickOutsideRef.current||context.triggerRef.current?.focus()}),onPointerDownOutside:composeEventHandlers(props.onPointerDownOutside,event=>{let originalEvent=event.detail.originalEvent,ctrlLeftClick=originalEvent.button===0&&originalEvent.ctrlKey===!0;isRightClickOutsideRef.current=originalEvent.button===2||ctrlLeftClick},{checkForDefaultPrevented:!1}),onFocusOutside:composeEventHandlers(props.onFocusOutside,event=>event.preventDefault(),{checkForDefaultPrevented:!1})})})}),PopoverContentNonModal=import_react.forwardRef((props,forwardedRef)=>{let context=usePopoverContext(CONTENT_NAME$3,props.__scopePopover),hasInteractedOutsideRef=import_react.useRef(!1),hasPointerDownOutsideRef=import_react.useRef(!1);return(0,import_jsx_runtime.jsx)(PopoverContentImpl,{...props,ref:forwardedRef,trapFocus:!1,disableOutsidePointerEvents:!1,onCloseAutoFocus:event=>{props.onCloseAutoFocus?.(event),event.defaultPrevented||(hasInteractedOutsideRef.current||context.triggerRef.current?.focus(),event.preventDefault()),hasInteractedOutsideRef.current=!1,hasPointerDownOutsideRef.current=!1},onInteractOutside:event=>{props.onInteractOutside?.(event),event.defaultPrevented||(hasInteractedOutsideRef.current=!0,event.detail.originalEvent.type===`pointerdown`&&(hasPointerDownOutsideRef.current=!0));let target=event.target;context.triggerRef.current?.contains(target)&&event.preventDefault(),event.detail.originalEvent.type===`focusin`&&hasPointerDownOutsideRef.current&&event.preventDefault()}})}),PopoverContentImpl=import_react.forwardRef((props,forwardedRef)=>{let{__scopePopover,trapFocus,onOpenAutoFocus,onCloseAutoFocus,disableOutsidePointerEvents,onEscapeKeyDown,onPointerDownOutside,onFocusOutside,onInteractOutside,...contentProps}=props,context=usePopoverContext(CONTENT_NAME$3,__scopePopover),popperScope=usePopperScope$2(__scopePopover);return useFocusGuards(),(0,import_jsx_runtime.jsx)(FocusScope,{asChild:!0,loop:!0,trapped:trapFocus,onMountAutoFocus:onOpenAutoFocus,onUnmountAutoFocus:onCloseAutoFocus,children:(0,import_jsx_runtime.jsx)(DismissableLayer,{asChild:!0,disableOutsidePointerEvents,onInteractOutside,onEscapeKeyDown,onPointerDownOutside,onFocusOutside,onDismiss:()=>context.onOpenChange(!1),children:(0,import_jsx_runtime.jsx)(Content$1,{"data-state":getState$2(context.open),role:`dialog`,id:context.contentId,...popperScope,...contentProps,ref:forwardedRef,style:{...contentProps.style,"--radix-popover-content-transform-origin":`var(--radix-popper-transform-origin)`,"--radix-popover-content-available-width":`var(--radix-popper-available-width)`,"--radix-popover-content-available-height":`var(--radix-popper-available-height)`,"--radix-popover-trigger-width":`var(--radix-popper-anchor-width)`,"--radix-popover-trigger-height":`var(--radix-popper-anchor-height)`}})})})}),CLOSE_NAME=`PopoverClose`,PopoverClose=import_react.forwardRef((props,forwardedRef)=>{let{__scopePopover,...closeProps}=props,context=usePopoverContext(CLOSE_NAME,__scopePopover);return(0,import_jsx_runtime.jsx)(Primitive$1.button,{type:`button`,...closeProps,ref:forwardedRef,onClick:composeEventHandlers(props.onClick,()=>context.onOpenChange(!1))})});PopoverClose.displayName=CLOSE_NAME;var ARROW_NAME$2=`PopoverArrow`,PopoverArrow=import_react.forwardRef((props,forwardedRef)=>{let{__scopePopover,...arrowProps}=props,popperScope=usePopperScope$2(__scopePopover);return(0,import_jsx_runtime.jsx)(Arrow,{...popperScope,...arrowProps,ref:forwardedRef})});PopoverArrow.displayName=ARROW_NAME$2;function getState$2(open){return open?`open`:`closed`}var Root2$4=Popover,Anchor2=PopoverAnchor,Trigger$3=PopoverTrigger,Portal$3=PopoverPortal,Content2$2=PopoverContent,Close=PopoverClose,PROGRESS_NAME=`Progress`,DEFAULT_MAX=100,[createProgressContext,createProgressScope]=createContextScope(PROGRESS_NAME),[ProgressProvider,useProgressContext]=createProgressContext(PROGRESS_NAME),Progress=import_react.forwardRef((props,forwardedRef)=>{let{__scopeProgress,value:valueProp=null,max:maxProp,getValueLabel=defaultGetValueLabel,...progressProps}=props;(maxProp||maxProp===0)&&!isValidMaxNumber(maxProp)&&console.error(getInvalidMaxError(`${maxProp}`,`Progress`));let max$1=isValidMaxNumber(maxProp)?maxProp:DEFAULT_MAX;valueProp!==null&&!isValidValueNumber(valueProp,max$1)&&console.error(getInvalidValueError(`${valueProp}`,`Progress`));let value$1=isValidValueNumber(valueProp,max$1)?valueProp:null,valueLabel=isNumber(value$1)?getValueLabel(value$1,max$1):void 0;return(0,import_jsx_runtime.jsx)(ProgressProvider,{scope:__scopeProgress,value:value$1,max:max$1,children:(0,import_jsx_runtime.jsx)(Primitive$1.div,{"aria-valuemax":max$1,"aria-valuemin":0,"aria-valuenow":isNumber(value$1)?value$1:void 0,"aria-valuetext":valueLabel,role:`progressbar`,"data-state":getProgressState(value$1,max$1),"data-value":value$1??void 0,"data-max":max$1,...progressProps,ref:forwardedRef})})});Progress.displayName=PROGRESS_NAME;var INDICATOR_NAME$1=`ProgressIndicator`,ProgressIndicator=import_react.forwardRef((props,forwardedRef)=>{let{__scopeProgress,...indicatorProps}=props,context=useProgressContext(INDICATOR_NAME$1,__scopeProgress);return(0,import_jsx_runtime.jsx)(Primitive$1.div,{"data-state":getProgressState(context.value,context.max),"data-value":context.value??void 0,"data-max":context.max,...indicatorProps,ref:forwardedRef})});ProgressIndicator.displayName=INDICATOR_NAME$1;function defaultGetValueLabel(value$1,max$1){return`${Math.round(value$1/max$1*100)}%`}function getProgressState(value$1,maxValue){return value$1==null?`indeterminate`:value$1===maxValue?`complete`:`loading`}function isNumber(value$1){return typeof value$1==`number`}function isValidMaxNumber(max$1){return isNumber(max$1)&&!isNaN(max$1)&&max$1>0}function isValidValueNumber(value$1,max$1){return isNumber(value$1)&&!isNaN(value$1)&&value$1<=max$1&&value$1>=0}function getInvalidMaxError(propValue,componentName){return`Invalid prop \`max\` of value \`${propValue}\` supplied to \`${componentName}\`. Only numbers greater than 0 are valid max values. Defaulting to \`${DEFAULT_MAX}\`.`}function getInvalidValueError(propValue,componentName){return`Invalid prop \`value\` of value \`${propValue}\` supplied to \`${componentName}\`. The \`value\` prop must be:
-  - a positive number
-  - less than the value passed to \`max\` (or ${DEFAULT_MAX} if no \`max\` prop is set)
-  - \`null\` or \`undefined\` if the progress is indeterminate.
-
-Defaulting to \`null\`.`}var Root$3=Progress,Indicator=ProgressIndicator,RADIO_NAME=`Radio`,[createRadioContext,createRadioScope]=createContextScope(RADIO_NAME),[RadioProvider,useRadioContext]=createRadioContext(RADIO_NAME),Radio=import_react.forwardRef((props,forwardedRef)=>{let{__scopeRadio,name,checked=!1,required,disabled,value:value$1=`on`,onCheck,form,...radioProps}=props,[button,setButton]=import_react.useState(null),composedRefs=useComposedRefs(forwardedRef,node=>setButton(node)),hasConsumerStoppedPropagationRef=import_react.useRef(!1),isFormControl=button?form||!!button.closest(`form`):!0;return(0,import_jsx_runtime.jsxs)(RadioProvider,{scope:__scopeRadio,checked,disabled,children:[(0,import_jsx_runtime.jsx)(Primitive$1.button,{type:`button`,role:`radio`,"aria-checked":checked,"data-state":getState$1(checked),"data-disabled":disabled?``:void 0,disabled,value:value$1,...radioProps,ref:composedRefs,onClick:composeEventHandlers(props.onClick,event=>{checked||onCheck?.(),isFormControl&&(hasConsumerStoppedPropagationRef.current=event.isPropagationStopped(),hasConsumerStoppedPropagationRef.current||event.stopPropagation())})}),isFormControl&&(0,import_jsx_runtime.jsx)(RadioBubbleInput,{control:button,bubbles:!hasConsumerStoppedPropagationRef.current,name,value:value$1,checked,required,disabled,form,style:{transform:`translateX(-100%)`}})]})});Radio.displayName=RADIO_NAME;var INDICATOR_NAME=`RadioIndicator`,RadioIndicator=import_react.forwardRef((props,forwardedRef)=>{let{__scopeRadio,forceMount,...indicatorProps}=props,context=useRadioContext(INDICATOR_NAME,__scopeRadio);return(0,import_jsx_runtime.jsx)(Presence,{present:forceMount||context.checked,children:(0,import_jsx_runtime.jsx)(Primitive$1.span,{"data-state":getState$1(context.checked),"data-disabled":context.disabled?``:void 0,...indicatorProps,ref:forwardedRef})})});RadioIndicator.displayName=INDICATOR_NAME;var BUBBLE_INPUT_NAME$3=`RadioBubbleInput`,RadioBubbleInput=import_react.forwardRef(({__scopeRadio,control,checked,bubbles=!0,...props},forwardedRef)=>{let ref=import_react.useRef(null),composedRefs=useComposedRefs(ref,forwardedRef),prevChecked=usePrevious(checked),controlSize=useSize(control);return import_react.useEffect(()=>{let input=ref.current;if(!input)return;let inputProto=window.HTMLInputElement.prototype,setChecked=Object.getOwnPropertyDescriptor(inputProto,`checked`).set;if(prevChecked!==checked&&setChecked){let event=new Event(`click`,{bubbles});setChecked.call(input,checked),input.dispatchEvent(event)}},[prevChecked,checked,bubbles]),(0,import_jsx_runtime.jsx)(Primitive$1.input,{type:`radio`,"aria-hidden":!0,defaultChecked:checked,...props,tabIndex:-1,ref:composedRefs,style:{...props.style,...controlSize,position:`absolute`,pointerEvents:`none`,opacity:0,margin:0}})});RadioBubbleInput.displayName=BUBBLE_INPUT_NAME$3;function getState$1(checked){return checked?`checked`:`unchecked`}var ARROW_KEYS$1=[`ArrowUp`,`ArrowDown`,`ArrowLeft`,`ArrowRight`],RADIO_GROUP_NAME=`RadioGroup`,[createRadioGroupContext,createRadioGroupScope]=createContextScope(RADIO_GROUP_NAME,[createRovingFocusGroupScope,createRadioScope]),useRovingFocusGroupScope$2=createRovingFocusGroupScope(),useRadioScope=createRadioScope(),[RadioGroupProvider,useRadioGroupContext]=createRadioGroupContext(RADIO_GROUP_NAME),RadioGroup=import_react.forwardRef((props,forwardedRef)=>{let{__scopeRadioGroup,name,defaultValue,value:valueProp,required=!1,disabled=!1,orientation,dir,loop=!0,onValueChange,...groupProps}=props,rovingFocusGroupScope=useRovingFocusGroupScope$2(__scopeRadioGroup),direction=useDirection(dir),[value$1,setValue]=useControllableState({prop:valueProp,defaultProp:defaultValue??null,onChange:onValueChange,caller:RADIO_GROUP_NAME});return(0,import_jsx_runtime.jsx)(RadioGroupProvider,{scope:__scopeRadioGroup,name,required,disabled,value:value$1,onValueChange:setValue,children:(0,import_jsx_runtime.jsx)(Root$4,{asChild:!0,...rovingFocusGroupScope,orientation,dir:direction,loop,children:(0,import_jsx_runtime.jsx)(Primitive$1.div,{role:`radiogroup`,"aria-required":required,"aria-orientation":orientation,"data-disabled":disabled?``:void 0,dir:direction,...groupProps,ref:forwardedRef})})})});RadioGroup.displayName=RADIO_GROUP_NAME;var ITEM_NAME$2=`RadioGroupItem`,RadioGroupItem=import_react.forwardRef((props,forwardedRef)=>{let{__scopeRadioGroup,disabled,...itemProps}=props,context=useRadioGroupContext(ITEM_NAME$2,__scopeRadioGroup),isDisabled=context.disabled||disabled,rovingFocusGroupScope=useRovingFocusGroupScope$2(__scopeRadioGroup),radioScope=useRadioScope(__scopeRadioGroup),ref=import_react.useRef(null),composedRefs=useComposedRefs(forwardedRef,ref),checked=context.value===itemProps.value,isArrowKeyPressedRef=import_react.useRef(!1);return import_react.useEffect(()=>{let handleKeyDown=event=>{ARROW_KEYS$1.includes(event.key)&&(isArrowKeyPressedRef.current=!0)},handleKeyUp=()=>isArrowKeyPressedRef.current=!1;return document.addEventListener(`keydown`,handleKeyDown),document.addEventListener(`keyup`,handleKeyUp),()=>{document.removeEventListener(`keydown`,handleKeyDown),document.removeEventListener(`keyup`,handleKeyUp)}},[]),(0,import_jsx_runtime.jsx)(Item$2,{asChild:!0,...rovingFocusGroupScope,focusable:!isDisabled,active:checked,children:(0,import_jsx_runtime.jsx)(Radio,{disabled:isDisabled,required:context.required,checked,...radioScope,...itemProps,name:context.name,ref:composedRefs,onCheck:()=>context.onValueChange(itemProps.value),onKeyDown:composeEventHandlers(event=>{event.key===`Enter`&&event.preventDefault()}),onFocus:composeEventHandlers(itemProps.onFocus,()=>{isArrowKeyPressedRef.current&&ref.current?.click()})})})});RadioGroupItem.displayName=ITEM_NAME$2;var INDICATOR_NAME2=`RadioGroupIndicator`,RadioGroupIndicator=import_react.forwardRef((props,forwardedRef)=>{let{__scopeRadioGroup,...indicatorProps}=props,radioScope=useRadioScope(__scopeRadioGroup);return(0,import_jsx_runtime.jsx)(RadioIndicator,{...radioScope,...indicatorProps,ref:forwardedRef})});RadioGroupIndicator.displayName=INDICATOR_NAME2;var Root2$3=RadioGroup,Item2$1=RadioGroupItem;function useStateMachine(initialState$1,machine){return import_react.useReducer((state,event)=>machine[state][event]??state,initialState$1)}var SCROLL_AREA_NAME=`ScrollArea`,[createScrollAreaContext,createScrollAreaScope]=createContextScope(SCROLL_AREA_NAME),[ScrollAreaProvider,useScrollAreaContext]=createScrollAreaContext(SCROLL_AREA_NAME),ScrollArea=import_react.forwardRef((props,forwardedRef)=>{let{__scopeScrollArea,type=`hover`,dir,scrollHideDelay=600,...scrollAreaProps}=props,[scrollArea,setScrollArea]=import_react.useState(null),[viewport,setViewport]=import_react.useState(null),[content,setContent]=import_react.useState(null),[scrollbarX,setScrollbarX]=import_react.useState(null),[scrollbarY,setScrollbarY]=import_react.useState(null),[cornerWidth,setCornerWidth]=import_react.useState(0),[cornerHeight,setCornerHeight]=import_react.useState(0),[scrollbarXEnabled,setScrollbarXEnabled]=import_react.useState(!1),[scrollbarYEnabled,setScrollbarYEnabled]=import_react.useState(!1),composedRefs=useComposedRefs(forwardedRef,node=>setScrollArea(node)),direction=useDirection(dir);return(0,import_jsx_runtime.jsx)(ScrollAreaProvider,{scope:__scopeScrollArea,type,dir:direction,scrollHideDelay,scrollArea,viewport,onViewportChange:setViewport,content,onContentChange:setContent,scrollbarX,onScrollbarXChange:setScrollbarX,scrollbarXEnabled,onScrollbarXEnabledChange:setScrollbarXEnabled,scrollbarY,onScrollbarYChange:setScrollbarY,scrollbarYEnabled,onScrollbarYEnabledChange:setScrollbarYEnabled,onCornerWidthChange:setCornerWidth,onCornerHeightChange:setCornerHeight,children:(0,import_jsx_runtime.jsx)(Primitive$1.div,{dir:direction,...scrollAreaProps,ref:composedRefs,style:{position:`relative`,"--radix-scroll-area-corner-width":cornerWidth+`px`,"--radix-scroll-area-corner-height":cornerHeight+`px`,...props.style}})})});ScrollArea.displayName=SCROLL_AREA_NAME;var VIEWPORT_NAME$1=`ScrollAreaViewport`,ScrollAreaViewport=import_react.forwardRef((props,forwardedRef)=>{let{__scopeScrollArea,children,nonce,...viewportProps}=props,context=useScrollAreaContext(VIEWPORT_NAME$1,__scopeScrollArea),ref=import_react.useRef(null),composedRefs=useComposedRefs(forwardedRef,ref,context.onViewportChange);return(0,import_jsx_runtime.jsxs)(import_jsx_runtime.Fragment,{children:[(0,import_jsx_runtime.jsx)(`style`,{dangerouslySetInnerHTML:{__html:`[data-radix-scroll-area-viewport]{scrollbar-width:none;-ms-overflow-style:none;-webkit-overflow-scrolling:touch;}[data-radix-scroll-area-viewport]::-webkit-scrollbar{display:none}`},nonce}),(0,import_jsx_runtime.jsx)(Primitive$1.div,{"data-radix-scroll-area-viewport":``,...viewportProps,ref:composedRefs,style:{overflowX:context.scrollbarXEnabled?`scroll`:`hidden`,overflowY:context.scrollbarYEnabled?`scroll`:`hidden`,...props.style},children:(0,import_jsx_runtime.jsx)(`div`,{ref:context.onContentChange,style:{minWidth:`100%`,display:`table`},children})})]})});ScrollAreaViewport.displayName=VIEWPORT_NAME$1;var SCROLLBAR_NAME=`ScrollAreaScrollbar`,ScrollAreaScrollbar=import_react.forwardRef((props,forwardedRef)=>{let{forceMount,...scrollbarProps}=props,context=useScrollAreaContext(SCROLLBAR_NAME,props.__scopeScrollArea),{onScrollbarXEnabledChange,onScrollbarYEnabledChange}=context,isHorizontal=props.orientation===`horizontal`;return import_react.useEffect(()=>(isHorizontal?onScrollbarXEnabledChange(!0):onScrollbarYEnabledChange(!0),()=>{isHorizontal?onScrollbarXEnabledChange(!1):onScrollbarYEnabledChange(!1)}),[isHorizontal,onScrollbarXEnabledChange,onScrollbarYEnabledChange]),context.type===`hover`?(0,import_jsx_runtime.jsx)(ScrollAreaScrollbarHover,{...scrollbarProps,ref:forwardedRef,forceMount}):context.type===`scroll`?(0,import_jsx_runtime.jsx)(ScrollAreaScrollbarScroll,{...scrollbarProps,ref:forwardedRef,forceMount}):context.type===`auto`?(0,import_jsx_runtime.jsx)(ScrollAreaScrollbarAuto,{...scrollbarProps,ref:forwardedRef,forceMount}):context.type===`always`?(0,import_jsx_runtime.jsx)(ScrollAreaScrollbarVisible,{...scrollbarProps,ref:forwardedRef}):null});ScrollAreaScrollbar.displayName=SCROLLBAR_NAME;var ScrollAreaScrollbarHover=import_react.forwardRef((props,forwardedRef)=>{let{forceMount,...scrollbarProps}=props,context=useScrollAreaContext(SCROLLBAR_NAME,props.__scopeScrollArea),[visible,setVisible]=import_react.useState(!1);return import_react.useEffect(()=>{let scrollArea=context.scrollArea,hideTimer=0;if(scrollArea){let handlePointerEnter=()=>{window.clearTimeout(hideTimer),setVisible(!0)},handlePointerLeave=()=>{hideTimer=window.setTimeout(()=>setVisible(!1),context.scrollHideDelay)};return scrollArea.addEventListener(`pointerenter`,handlePointerEnter),scrollArea.addEventListener(`pointerleave`,handlePointerLeave),()=>{window.clearTimeout(hideTimer),scrollArea.removeEventListener(`pointerenter`,handlePointerEnter),scrollArea.removeEventListener(`pointerleave`,handlePointerLeave)}}},[context.scrollArea,context.scrollHideDelay]),(0,import_jsx_runtime.jsx)(Presence,{present:forceMount||visible,children:(0,import_jsx_runtime.jsx)(ScrollAreaScrollbarAuto,{"data-state":visible?`visible`:`hidden`,...scrollbarProps,ref:forwardedRef})})}),ScrollAreaScrollbarScroll=import_react.forwardRef((props,forwardedRef)=>{let{forceMount,...scrollbarProps}=props,context=useScrollAreaContext(SCROLLBAR_NAME,props.__scopeScrollArea),isHorizontal=props.orientation===`horizontal`,debounceScrollEnd=useDebounceCallback(()=>send(`SCROLL_END`),100),[state,send]=useStateMachine(`hidden`,{hidden:{SCROLL:`scrolling`},scrolling:{SCROLL_END:`idle`,POINTER_ENTER:`interacting`},interacting:{SCROLL:`interacting`,POINTER_LEAVE:`idle`},idle:{HIDE:`hidden`,SCROLL:`scrolling`,POINTER_ENTER:`interacting`}});return import_react.useEffect(()=>{if(state===`idle`){let hideTimer=window.setTimeout(()=>send(`HIDE`),context.scrollHideDelay);return()=>window.clearTimeout(hideTimer)}},[state,context.scrollHideDelay,send]),import_react.useEffect(()=>{let viewport=context.viewport,scrollDirection=isHorizontal?`scrollLeft`:`scrollTop`;if(viewport){let prevScrollPos=viewport[scrollDirection],handleScroll$1=()=>{let scrollPos=viewport[scrollDirection];prevScrollPos!==scrollPos&&(send(`SCROLL`),debounceScrollEnd()),prevScrollPos=scrollPos};return viewport.addEventListener(`scroll`,handleScroll$1),()=>viewport.removeEventListener(`scroll`,handleScroll$1)}},[context.viewport,isHorizontal,send,debounceScrollEnd]),(0,import_jsx_runtime.jsx)(Presence,{present:forceMount||state!==`hidden`,children:(0,import_jsx_runtime.jsx)(ScrollAreaScrollbarVisible,{"data-state":state===`hidden`?`hidden`:`visible`,...scrollbarProps,ref:forwardedRef,onPointerEnter:composeEventHandlers(props.onPointerEnter,()=>send(`POINTER_ENTER`)),onPointerLeave:composeEventHandlers(props.onPointerLeave,()=>send(`POINTER_LEAVE`))})})}),ScrollAreaScrollbarAuto=import_react.forwardRef((props,forwardedRef)=>{let context=useScrollAreaContext(SCROLLBAR_NAME,props.__scopeScrollArea),{forceMount,...scrollbarProps}=props,[visible,setVisible]=import_react.useState(!1),isHorizontal=props.orientation===`horizontal`,handleResize=useDebounceCallback(()=>{if(context.viewport){let isOverflowX=context.viewport.offsetWidth<context.viewport.scrollWidth,isOverflowY=context.viewport.offsetHeight<context.viewport.scrollHeight;setVisible(isHorizontal?isOverflowX:isOverflowY)}},10);return useResizeObserver(context.viewport,handleResize),useResizeObserver(context.content,handleResize),(0,import_jsx_runtime.jsx)(Presence,{present:forceMount||visible,children:(0,import_jsx_runtime.jsx)(ScrollAreaScrollbarVisible,{"data-state":visible?`visible`:`hidden`,...scrollbarProps,ref:forwardedRef})})}),ScrollAreaScrollbarVisible=import_react.forwardRef((props,forwardedRef)=>{let{orientation=`vertical`,...scrollbarProps}=props,context=useScrollAreaContext(SCROLLBAR_NAME,props.__scopeScrollArea),thumbRef=import_react.useRef(null),pointerOffsetRef=import_react.useRef(0),[sizes,setSizes]=import_react.useState({content:0,viewport:0,scrollbar:{size:0,paddingStart:0,paddingEnd:0}}),thumbRatio=getThumbRatio(sizes.viewport,sizes.content),commonProps={...scrollbarProps,sizes,onSizesChange:setSizes,hasThumb:thumbRatio>0&&thumbRatio<1,onThumbChange:thumb=>thumbRef.current=thumb,onThumbPointerUp:()=>pointerOffsetRef.current=0,onThumbPointerDown:pointerPos=>pointerOffsetRef.current=pointerPos};function getScrollPosition(pointerPos,dir){return getScrollPositionFromPointer(pointerPos,pointerOffsetRef.current,sizes,dir)}return orientation===`horizontal`?(0,import_jsx_runtime.jsx)(ScrollAreaScrollbarX,{...commonProps,ref:forwardedRef,onThumbPositionChange:()=>{if(context.viewport&&thumbRef.current){let scrollPos=context.viewport.scrollLeft,offset$3=getThumbOffsetFromScroll(scrollPos,sizes,context.dir);thumbRef.current.style.transform=`translate3d(${offset$3}px, 0, 0)`}},onWheelScroll:scrollPos=>{context.viewport&&(context.viewport.scrollLeft=scrollPos)},onDragScroll:pointerPos=>{context.viewport&&(context.viewport.scrollLeft=getScrollPosition(pointerPos,context.dir))}}):orientation===`vertical`?(0,import_jsx_runtime.jsx)(ScrollAreaScrollbarY,{...commonProps,ref:forwardedRef,onThumbPositionChange:()=>{if(context.viewport&&thumbRef.current){let scrollPos=context.viewport.scrollTop,offset$3=getThumbOffsetFromScroll(scrollPos,sizes);thumbRef.current.style.transform=`translate3d(0, ${offset$3}px, 0)`}},onWheelScroll:scrollPos=>{context.viewport&&(context.viewport.scrollTop=scrollPos)},onDragScroll:pointerPos=>{context.viewport&&(context.viewport.scrollTop=getScrollPosition(pointerPos))}}):null}),ScrollAreaScrollbarX=import_react.forwardRef((props,forwardedRef)=>{let{sizes,onSizesChange,...scrollbarProps}=props,context=useScrollAreaContext(SCROLLBAR_NAME,props.__scopeScrollArea),[computedStyle,setComputedStyle]=import_react.useState(),ref=import_react.useRef(null),composeRefs$1=useComposedRefs(forwardedRef,ref,context.onScrollbarXChange);return import_react.useEffect(()=>{ref.current&&setComputedStyle(getComputedStyle(ref.current))},[ref]),(0,import_jsx_runtime.jsx)(ScrollAreaScrollbarImpl,{"data-orientation":`horizontal`,...scrollbarProps,ref:composeRefs$1,sizes,style:{bottom:0,left:context.dir===`rtl`?`var(--radix-scroll-area-corner-width)`:0,right:context.dir===`ltr`?`var(--radix-scroll-area-corner-width)`:0,"--radix-scroll-area-thumb-width":getThumbSize(sizes)+`px`,...props.style},onThumbPointerDown:pointerPos=>props.onThumbPointerDown(pointerPos.x),onDragScroll:pointerPos=>props.onDragScroll(pointerPos.x),onWheelScroll:(event,maxScrollPos)=>{if(context.viewport){let scrollPos=context.viewport.scrollLeft+event.deltaX;props.onWheelScroll(scrollPos),isScrollingWithinScrollbarBounds(scrollPos,maxScrollPos)&&event.preventDefault()}},onResize:()=>{ref.current&&context.viewport&&computedStyle&&onSizesChange({content:context.viewport.scrollWidth,viewport:context.viewport.offsetWidth,scrollbar:{size:ref.current.clientWidth,paddingStart:toInt(computedStyle.paddingLeft),paddingEnd:toInt(computedStyle.paddingRight)}})}})}),ScrollAreaScrollbarY=import_react.forwardRef((props,forwardedRef)=>{let{sizes,onSizesChange,...scrollbarProps}=props,context=useScrollAreaContext(SCROLLBAR_NAME,props.__scopeScrollArea),[computedStyle,setComputedStyle]=import_react.useState(),ref=import_react.useRef(null),composeRefs$1=useComposedRefs(forwardedRef,ref,context.onScrollbarYChange);return import_react.useEffect(()=>{ref.current&&setComputedStyle(getComputedStyle(ref.current))},[ref]),(0,import_jsx_runtime.jsx)(ScrollAreaScrollbarImpl,{"data-orientation":`vertical`,...scrollbarProps,ref:composeRefs$1,sizes,style:{top:0,right:context.dir===`ltr`?0:void 0,left:context.dir===`rtl`?0:void 0,bottom:`var(--radix-scroll-area-corner-height)`,"--radix-scroll-area-thumb-height":getThumbSize(sizes)+`px`,...props.style},onThumbPointerDown:pointerPos=>props.onThumbPointerDown(pointerPos.y),onDragScroll:pointerPos=>props.onDragScroll(pointerPos.y),onWheelScroll:(event,maxScrollPos)=>{if(context.viewport){let scrollPos=context.viewport.scrollTop+event.deltaY;props.onWheelScroll(scrollPos),isScrollingWithinScrollbarBounds(scrollPos,maxScrollPos)&&event.preventDefault()}},onResize:()=>{ref.current&&context.viewport&&computedStyle&&onSizesChange({content:context.viewport.scrollHeight,viewport:context.viewport.offsetHeight,scrollbar:{size:ref.current.clientHeight,paddingStart:toInt(computedStyle.paddingTop),paddingEnd:toInt(computedStyle.paddingBottom)}})}})}),[ScrollbarProvider,useScrollbarContext]=createScrollAreaContext(SCROLLBAR_NAME),ScrollAreaScrollbarImpl=import_react.forwardRef((props,forwardedRef)=>{let{__scopeScrollArea,sizes,hasThumb,onThumbChange,onThumbPointerUp,onThumbPointerDown,onThumbPositionChange,onDragScroll,onWheelScroll,onResize,...scrollbarProps}=props,context=useScrollAreaContext(SCROLLBAR_NAME,__scopeScrollArea),[scrollbar,setScrollbar]=import_react.useState(null),composeRefs$1=useComposedRefs(forwardedRef,node=>setScrollbar(node)),rectRef=import_react.useRef(null),prevWebkitUserSelectRef=import_react.useRef(``),viewport=context.viewport,maxScrollPos=sizes.content-sizes.viewport,handleWheelScroll=useCallbackRef(onWheelScroll),handleThumbPositionChange=useCallbackRef(onThumbPositionChange),handleResize=useDebounceCallback(onResize,10);function handleDragScroll(event){if(rectRef.current){let x$3=event.clientX-rectRef.current.left,y$6=event.clientY-rectRef.current.top;onDragScroll({x:x$3,y:y$6})}}return import_react.useEffect(()=>{let handleWheel=event=>{let element=event.target;scrollbar?.contains(element)&&handleWheelScroll(event,maxScrollPos)};return document.addEventListener(`wheel`,handleWheel,{passive:!1}),()=>document.removeEventListener(`wheel`,handleWheel,{passive:!1})},[viewport,scrollbar,maxScrollPos,handleWheelScroll]),import_react.useEffect(handleThumbPositionChange,[sizes,handleThumbPositionChange]),useResizeObserver(scrollbar,handleResize),useResizeObserver(context.content,handleResize),(0,import_jsx_runtime.jsx)(ScrollbarProvider,{scope:__scopeScrollArea,scrollbar,hasThumb,onThumbChange:useCallbackRef(onThumbChange),onThumbPointerUp:useCallbackRef(onThumbPointerUp),onThumbPositionChange:handleThumbPositionChange,onThumbPointerDown:useCallbackRef(onThumbPointerDown),children:(0,import_jsx_runtime.jsx)(Primitive$1.div,{...scrollbarProps,ref:composeRefs$1,style:{position:`absolute`,...scrollbarProps.style},onPointerDown:composeEventHandlers(props.onPointerDown,event=>{event.button===0&&(event.target.setPointerCapture(event.pointerId),rectRef.current=scrollbar.getBoundingClientRect(),prevWebkitUserSelectRef.current=document.body.style.webkitUserSelect,document.body.style.webkitUserSelect=`none`,context.viewport&&(context.viewport.style.scrollBehavior=`auto`),handleDragScroll(event))}),onPointerMove:composeEventHandlers(props.onPointerMove,handleDragScroll),onPointerUp:composeEventHandlers(props.onPointerUp,event=>{let element=event.target;element.hasPointerCapture(event.pointerId)&&element.releasePointerCapture(event.pointerId),document.body.style.webkitUserSelect=prevWebkitUserSelectRef.current,context.viewport&&(context.viewport.style.scrollBehavior=``),rectRef.current=null})})})}),THUMB_NAME$2=`ScrollAreaThumb`,ScrollAreaThumb=import_react.forwardRef((props,forwardedRef)=>{let{forceMount,...thumbProps}=props,scrollbarContext=useScrollbarContext(THUMB_NAME$2,props.__scopeScrollArea);return(0,import_jsx_runtime.jsx)(Presence,{present:forceMount||scrollbarContext.hasThumb,children:(0,import_jsx_runtime.jsx)(ScrollAreaThumbImpl,{ref:forwardedRef,...thumbProps})})}),ScrollAreaThumbImpl=import_react.forwardRef((props,forwardedRef)=>{let{__scopeScrollArea,style,...thumbProps}=props,scrollAreaContext=useScrollAreaContext(THUMB_NAME$2,__scopeScrollArea),scrollbarContext=useScrollbarContext(THUMB_NAME$2,__scopeScrollArea),{onThumbPositionChange}=scrollbarContext,composedRef=useComposedRefs(forwardedRef,node=>scrollbarContext.onThumbChange(node)),removeUnlinkedScrollListenerRef=import_react.useRef(void 0),debounceScrollEnd=useDebounceCallback(()=>{removeUnlinkedScrollListenerRef.current&&=(removeUnlinkedScrollListenerRef.current(),void 0)},100);return import_react.useEffect(()=>{let viewport=scrollAreaContext.viewport;if(viewport){let handleScroll$1=()=>{debounceScrollEnd(),removeUnlinkedScrollListenerRef.current||(removeUnlinkedScrollListenerRef.current=addUnlinkedScrollListener(viewport,onThumbPositionChange),onThumbPositionChange())};return onThumbPositionChange(),viewport.addEventListener(`scroll`,handleScroll$1),()=>viewport.removeEventListener(`scroll`,handleScroll$1)}},[scrollAreaContext.viewport,debounceScrollEnd,onThumbPositionChange]),(0,import_jsx_runtime.jsx)(Primitive$1.div,{"data-state":scrollbarContext.hasThumb?`visible`:`hidden`,...thumbProps,ref:composedRef,style:{width:`var(--radix-scroll-area-thumb-width)`,height:`var(--radix-scroll-area-thumb-height)`,...style},onPointerDownCapture:composeEventHandlers(props.onPointerDownCapture,event=>{let thumbRect=event.target.getBoundingClientRect(),x$3=event.clientX-thumbRect.left,y$6=event.clientY-thumbRect.top;scrollbarContext.onThumbPointerDown({x:x$3,y:y$6})}),onPointerUp:composeEventHandlers(props.onPointerUp,scrollbarContext.onThumbPointerUp)})});ScrollAreaThumb.displayName=THUMB_NAME$2;var CORNER_NAME=`ScrollAreaCorner`,ScrollAreaCorner=import_react.forwardRef((props,forwardedRef)=>{let context=useScrollAreaContext(CORNER_NAME,props.__scopeScrollArea),hasBothScrollbarsVisible=!!(context.scrollbarX&&context.scrollbarY);return context.type!==`scroll`&&hasBothScrollbarsVisible?(0,import_jsx_runtime.jsx)(ScrollAreaCornerImpl,{...props,ref:forwardedRef}):null});ScrollAreaCorner.displayName=CORNER_NAME;var ScrollAreaCornerImpl=import_react.forwardRef((props,forwardedRef)=>{let{__scopeScrollArea,...cornerProps}=props,context=useScrollAreaContext(CORNER_NAME,__scopeScrollArea),[width,setWidth]=import_react.useState(0),[height,setHeight]=import_react.useState(0),hasSize=!!(width&&height);return useResizeObserver(context.scrollbarX,()=>{let height2=context.scrollbarX?.offsetHeight||0;context.onCornerHeightChange(height2),setHeight(height2)}),useResizeObserver(context.scrollbarY,()=>{let width2=context.scrollbarY?.offsetWidth||0;context.onCornerWidthChange(width2),setWidth(width2)}),hasSize?(0,import_jsx_runtime.jsx)(Primitive$1.div,{...cornerProps,ref:forwardedRef,style:{width,height,position:`absolute`,right:context.dir===`ltr`?0:void 0,left:context.dir===`rtl`?0:void 0,bottom:0,...props.style}}):null});function toInt(value$1){return value$1?parseInt(value$1,10):0}function getThumbRatio(viewportSize,contentSize){let ratio=viewportSize/contentSize;return isNaN(ratio)?0:ratio}function getThumbSize(sizes){let ratio=getThumbRatio(sizes.viewport,sizes.content),scrollbarPadding=sizes.scrollbar.paddingStart+sizes.scrollbar.paddingEnd,thumbSize=(sizes.scrollbar.size-scrollbarPadding)*ratio;return Math.max(thumbSize,18)}function getScrollPositionFromPointer(pointerPos,pointerOffset,sizes,dir=`ltr`){let thumbSizePx=getThumbSize(sizes),thumbCenter=thumbSizePx/2,offset$3=pointerOffset||thumbCenter,thumbOffsetFromEnd=thumbSizePx-offset$3,minPointerPos=sizes.scrollbar.paddingStart+offset$3,maxPointerPos=sizes.scrollbar.size-sizes.scrollbar.paddingEnd-thumbOffsetFromEnd,maxScrollPos=sizes.content-sizes.viewport,scrollRange=dir===`ltr`?[0,maxScrollPos]:[maxScrollPos*-1,0];return linearScale$1([minPointerPos,maxPointerPos],scrollRange)(pointerPos)}function getThumbOffsetFromScroll(scrollPos,sizes,dir=`ltr`){let thumbSizePx=getThumbSize(sizes),scrollbarPadding=sizes.scrollbar.paddingStart+sizes.scrollbar.paddingEnd,scrollbar=sizes.scrollbar.size-scrollbarPadding,maxScrollPos=sizes.content-sizes.viewport,maxThumbPos=scrollbar-thumbSizePx,scrollClampRange=dir===`ltr`?[0,maxScrollPos]:[maxScrollPos*-1,0],scrollWithoutMomentum=clamp(scrollPos,scrollClampRange);return linearScale$1([0,maxScrollPos],[0,maxThumbPos])(scrollWithoutMomentum)}function linearScale$1(input,output){return value$1=>{if(input[0]===input[1]||output[0]===output[1])return output[0];let ratio=(output[1]-output[0])/(input[1]-input[0]);return output[0]+ratio*(value$1-input[0])}}function isScrollingWithinScrollbarBounds(scrollPos,maxScrollPos){return scrollPos>0&&scrollPos<maxScrollPos}var addUnlinkedScrollListener=(node,handler=()=>{})=>{let prevPosition={left:node.scrollLeft,top:node.scrollTop},rAF=0;return(function loop(){let position={left:node.scrollLeft,top:node.scrollTop},isHorizontalScroll=prevPosition.left!==position.left,isVerticalScroll=prevPosition.top!==position.top;(isHorizontalScroll||isVerticalScroll)&&handler(),prevPosition=position,rAF=window.requestAnimationFrame(loop)})(),()=>window.cancelAnimationFrame(rAF)};function useDebounceCallback(callback,delay){let handleCallback=useCallbackRef(callback),debounceTimerRef=import_react.useRef(0);return import_react.useEffect(()=>()=>window.clearTimeout(debounceTimerRef.current),[]),import_react.useCallback(()=>{window.clearTimeout(debounceTimerRef.current),debounceTimerRef.current=window.setTimeout(handleCallback,delay)},[handleCallback,delay])}function useResizeObserver(element,onResize){let handleResize=useCallbackRef(onResize);useLayoutEffect2(()=>{let rAF=0;if(element){let resizeObserver=new ResizeObserver(()=>{cancelAnimationFrame(rAF),rAF=window.requestAnimationFrame(handleResize)});return resizeObserver.observe(element),()=>{window.cancelAnimationFrame(rAF),resizeObserver.unobserve(element)}}},[element,handleResize])}var Root$2=ScrollArea,Viewport$1=ScrollAreaViewport,Scrollbar=ScrollAreaScrollbar,Thumb$2=ScrollAreaThumb,Corner=ScrollAreaCorner,import_react_dom=__toESM(require_react_dom(),1),OPEN_KEYS=[` `,`Enter`,`ArrowUp`,`ArrowDown`],SELECTION_KEYS=[` `,`Enter`],SELECT_NAME=`Select`,[Collection$1,useCollection$1,createCollectionScope$1]=createCollection(SELECT_NAME),[createSelectContext,createSelectScope]=createContextScope(SELECT_NAME,[createCollectionScope$1,createPopperScope]),usePopperScope$1=createPopperScope(),[SelectProvider,useSelectContext]=createSelectContext(SELECT_NAME),[SelectNativeOptionsProvider,useSelectNativeOptionsContext]=createSelectContext(SELECT_NAME),Select=props=>{let{__scopeSelect,children,open:openProp,defaultOpen,onOpenChange,value:valueProp,defaultValue,onValueChange,dir,name,autoComplete,disabled,required,form}=props,popperScope=usePopperScope$1(__scopeSelect),[trigger,setTrigger]=import_react.useState(null),[valueNode,setValueNode]=import_react.useState(null),[valueNodeHasChildren,setValueNodeHasChildren]=import_react.useState(!1),direction=useDirection(dir),[open,setOpen]=useControllableState({prop:openProp,defaultProp:defaultOpen??!1,onChange:onOpenChange,caller:SELECT_NAME}),[value$1,setValue]=useControllableState({prop:valueProp,defaultProp:defaultValue,onChange:onValueChange,caller:SELECT_NAME}),triggerPointerDownPosRef=import_react.useRef(null),isFormControl=trigger?form||!!trigger.closest(`form`):!0,[nativeOptionsSet,setNativeOptionsSet]=import_react.useState(new Set),nativeSelectKey=Array.from(nativeOptionsSet).map(option=>option.props.value).join(`;`);return(0,import_jsx_runtime.jsx)(Root2$9,{...popperScope,children:(0,import_jsx_runtime.jsxs)(SelectProvider,{required,scope:__scopeSelect,trigger,onTriggerChange:setTrigger,valueNode,onValueNodeChange:setValueNode,valueNodeHasChildren,onValueNodeHasChildrenChange:setValueNodeHasChildren,contentId:useId(),value:value$1,onValueChange:setValue,open,onOpenChange:setOpen,dir:direction,triggerPointerDownPosRef,disabled,children:[(0,import_jsx_runtime.jsx)(Collection$1.Provider,{scope:__scopeSelect,children:(0,import_jsx_runtime.jsx)(SelectNativeOptionsProvider,{scope:props.__scopeSelect,onNativeOptionAdd:import_react.useCallback(option=>{setNativeOptionsSet(prev=>new Set(prev).add(option))},[]),onNativeOptionRemove:import_react.useCallback(option=>{setNativeOptionsSet(prev=>{let optionsSet=new Set(prev);return optionsSet.delete(option),optionsSet})},[]),children})}),isFormControl?(0,import_jsx_runtime.jsxs)(SelectBubbleInput,{"aria-hidden":!0,required,tabIndex:-1,name,autoComplete,value:value$1,onChange:event=>setValue(event.target.value),disabled,form,children:[value$1===void 0?(0,import_jsx_runtime.jsx)(`option`,{value:``}):null,Array.from(nativeOptionsSet)]},nativeSelectKey):null]})})};Select.displayName=SELECT_NAME;var TRIGGER_NAME$2=`SelectTrigger`,SelectTrigger=import_react.forwardRef((props,forwardedRef)=>{let{__scopeSelect,disabled=!1,...triggerProps}=props,popperScope=usePopperScope$1(__scopeSelect),context=useSelectContext(TRIGGER_NAME$2,__scopeSelect),isDisabled=context.disabled||disabled,composedRefs=useComposedRefs(forwardedRef,context.onTriggerChange),getItems=useCollection$1(__scopeSelect),pointerTypeRef=import_react.useRef(`touch`),[searchRef,handleTypeaheadSearch,resetTypeahead]=useTypeaheadSearch(search=>{let enabledItems=getItems().filter(item=>!item.disabled),currentItem=enabledItems.find(item=>item.value===context.value),nextItem=findNextItem(enabledItems,search,currentItem);nextItem!==void 0&&context.onValueChange(nextItem.value)}),handleOpen=pointerEvent=>{isDisabled||(context.onOpenChange(!0),resetTypeahead()),pointerEvent&&(context.triggerPointerDownPosRef.current={x:Math.round(pointerEvent.pageX),y:Math.round(pointerEvent.pageY)})};return(0,import_jsx_runtime.jsx)(Anchor,{asChild:!0,...popperScope,children:(0,import_jsx_runtime.jsx)(Primitive$1.button,{type:`button`,role:`combobox`,"aria-controls":context.contentId,"aria-expanded":context.open,"aria-required":context.required,"aria-autocomplete":`none`,dir:context.dir,"data-state":context.open?`open`:`closed`,disabled:isDisabled,"data-disabled":isDisabled?``:void 0,"data-placeholder":shouldShowPlaceholder(context.value)?``:void 0,...triggerProps,ref:composedRefs,onClick:composeEventHandlers(triggerProps.onClick,event=>{event.currentTarget.focus(),pointerTypeRef.current!==`mouse`&&handleOpen(event)}),onPointerDown:composeEventHandlers(triggerProps.onPointerDown,event=>{pointerTypeRef.current=event.pointerType;let target=event.target;target.hasPointerCapture(event.pointerId)&&target.releasePointerCapture(event.pointerId),event.button===0&&event.ctrlKey===!1&&event.pointerType===`mouse`&&(handleOpen(event),event.preventDefault())}),onKeyDown:composeEventHandlers(triggerProps.onKeyDown,event=>{let isTypingAhead=searchRef.current!==``;!(event.ctrlKey||event.altKey||event.metaKey)&&event.key.length===1&&handleTypeaheadSearch(event.key),!(isTypingAhead&&event.key===` `)&&OPEN_KEYS.includes(event.key)&&(handleOpen(),event.preventDefault())})})})});SelectTrigger.displayName=TRIGGER_NAME$2;var VALUE_NAME=`SelectValue`,SelectValue=import_react.forwardRef((props,forwardedRef)=>{let{__scopeSelect,className,style,children,placeholder=``,...valueProps}=props,context=useSelectContext(VALUE_NAME,__scopeSelect),{onValueNodeHasChildrenChange}=context,hasChildren=children!==void 0,composedRefs=useComposedRefs(forwardedRef,context.onValueNodeChange);return useLayoutEffect2(()=>{onValueNodeHasChildrenChange(hasChildren)},[onValueNodeHasChildrenChange,hasChildren]),(0,import_jsx_runtime.jsx)(Primitive$1.span,{...valueProps,ref:composedRefs,style:{pointerEvents:`none`},children:shouldShowPlaceholder(context.value)?(0,import_jsx_runtime.jsx)(import_jsx_runtime.Fragment,{children:placeholder}):children})});SelectValue.displayName=VALUE_NAME;var ICON_NAME=`SelectIcon`,SelectIcon=import_react.forwardRef((props,forwardedRef)=>{let{__scopeSelect,children,...iconProps}=props;return(0,import_jsx_runtime.jsx)(Primitive$1.span,{"aria-hidden":!0,...iconProps,ref:forwardedRef,children:children||`▼`})});SelectIcon.displayName=ICON_NAME;var PORTAL_NAME$1=`SelectPortal`,SelectPortal=props=>(0,import_jsx_runtime.jsx)(Portal,{asChild:!0,...props});SelectPortal.displayName=PORTAL_NAME$1;var CONTENT_NAME$2=`SelectContent`,SelectContent=import_react.forwardRef((props,forwardedRef)=>{let context=useSelectContext(CONTENT_NAME$2,props.__scopeSelect),[fragment,setFragment]=import_react.useState();if(useLayoutEffect2(()=>{setFragment(new DocumentFragment)},[]),!context.open){let frag=fragment;return frag?import_react_dom.createPortal((0,import_jsx_runtime.jsx)(SelectContentProvider,{scope:props.__scopeSelect,children:(0,import_jsx_runtime.jsx)(Collection$1.Slot,{scope:props.__scopeSelect,children:(0,import_jsx_runtime.jsx)(`div`,{children:props.children})})}),frag):null}return(0,import_jsx_runtime.jsx)(SelectContentImpl,{...props,ref:forwardedRef})});SelectContent.displayName=CONTENT_NAME$2;var CONTENT_MARGIN=10,[SelectContentProvider,useSelectContentContext]=createSelectContext(CONTENT_NAME$2),CONTENT_IMPL_NAME=`SelectContentImpl`,Slot=createSlot(`SelectContent.RemoveScroll`),SelectContentImpl=import_react.forwardRef((props,forwardedRef)=>{let{__scopeSelect,position=`item-aligned`,onCloseAutoFocus,onEscapeKeyDown,onPointerDownOutside,side,sideOffset,align,alignOffset,arrowPadding,collisionBoundary,collisionPadding,sticky,hideWhenDetached,avoidCollisions,...contentProps}=props,context=useSelectContext(CONTENT_NAME$2,__scopeSelect),[content,setContent]=import_react.useState(null),[viewport,setViewport]=import_react.useState(null),composedRefs=useComposedRefs(forwardedRef,node=>setContent(node)),[selectedItem,setSelectedItem]=import_react.useState(null),[selectedItemText,setSelectedItemText]=import_react.useState(null),getItems=useCollection$1(__scopeSelect),[isPositioned,setIsPositioned]=import_react.useState(!1),firstValidItemFoundRef=import_react.useRef(!1);import_react.useEffect(()=>{if(content)return hideOthers(content)},[content]),useFocusGuards();let focusFirst$4=import_react.useCallback(candidates=>{let[firstItem,...restItems]=getItems().map(item=>item.ref.current),[lastItem]=restItems.slice(-1),PREVIOUSLY_FOCUSED_ELEMENT=document.activeElement;for(let candidate of candidates)if(candidate===PREVIOUSLY_FOCUSED_ELEMENT||(candidate?.scrollIntoView({block:`nearest`}),candidate===firstItem&&viewport&&(viewport.scrollTop=0),candidate===lastItem&&viewport&&(viewport.scrollTop=viewport.scrollHeight),candidate?.focus(),document.activeElement!==PREVIOUSLY_FOCUSED_ELEMENT))return},[getItems,viewport]),focusSelectedItem=import_react.useCallback(()=>focusFirst$4([selectedItem,content]),[focusFirst$4,selectedItem,content]);import_react.useEffect(()=>{isPositioned&&focusSelectedItem()},[isPositioned,focusSelectedItem]);let{onOpenChange,triggerPointerDownPosRef}=context;import_react.useEffect(()=>{if(content){let pointerMoveDelta={x:0,y:0},handlePointerMove=event=>{pointerMoveDelta={x:Math.abs(Math.round(event.pageX)-(triggerPointerDownPosRef.current?.x??0)),y:Math.abs(Math.round(event.pageY)-(triggerPointerDownPosRef.current?.y??0))}},handlePointerUp=event=>{pointerMoveDelta.x<=10&&pointerMoveDelta.y<=10?event.preventDefault():content.contains(event.target)||onOpenChange(!1),document.removeEventListener(`pointermove`,handlePointerMove),triggerPointerDownPosRef.current=null};return triggerPointerDownPosRef.current!==null&&(document.addEventListener(`pointermove`,handlePointerMove),document.addEventListener(`pointerup`,handlePointerUp,{capture:!0,once:!0})),()=>{document.removeEventListener(`pointermove`,handlePointerMove),document.removeEventListener(`pointerup`,handlePointerUp,{capture:!0})}}},[content,onOpenChange,triggerPointerDownPosRef]),import_react.useEffect(()=>{let close=()=>onOpenChange(!1);return window.addEventListener(`blur`,close),window.addEventListener(`resize`,close),()=>{window.removeEventListener(`blur`,close),window.removeEventListener(`resize`,close)}},[onOpenChange]);let[searchRef,handleTypeaheadSearch]=useTypeaheadSearch(search=>{let enabledItems=getItems().filter(item=>!item.disabled),currentItem=enabledItems.find(item=>item.ref.current===document.activeElement),nextItem=findNextItem(enabledItems,search,currentItem);nextItem&&setTimeout(()=>nextItem.ref.current.focus())}),itemRefCallback=import_react.useCallback((node,value$1,disabled)=>{let isFirstValidItem=!firstValidItemFoundRef.current&&!disabled;(context.value!==void 0&&context.value===value$1||isFirstValidItem)&&(setSelectedItem(node),isFirstValidItem&&(firstValidItemFoundRef.current=!0))},[context.value]),handleItemLeave=import_react.useCallback(()=>content?.focus(),[content]),itemTextRefCallback=import_react.useCallback((node,value$1,disabled)=>{let isFirstValidItem=!firstValidItemFoundRef.current&&!disabled;(context.value!==void 0&&context.value===value$1||isFirstValidItem)&&setSelectedItemText(node)},[context.value]),SelectPosition=position===`popper`?SelectPopperPosition:SelectItemAlignedPosition,popperContentProps=SelectPosition===SelectPopperPosition?{side,sideOffset,align,alignOffset,arrowPadding,collisionBoundary,collisionPadding,sticky,hideWhenDetached,avoidCollisions}:{};return(0,import_jsx_runtime.jsx)(SelectContentProvider,{scope:__scopeSelect,content,viewport,onViewportChange:setViewport,itemRefCallback,selectedItem,onItemLeave:handleItemLeave,itemTextRefCallback,focusSelectedItem,selectedItemText,position,isPositioned,searchRef,children:(0,import_jsx_runtime.jsx)(Combination_default,{as:Slot,allowPinchZoom:!0,children:(0,import_jsx_runtime.jsx)(FocusScope,{asChild:!0,trapped:context.open,onMountAutoFocus:event=>{event.preventDefault()},onUnmountAutoFocus:composeEventHandlers(onCloseAutoFocus,event=>{context.trigger?.focus({preventScroll:!0}),event.preventDefault()}),children:(0,import_jsx_runtime.jsx)(DismissableLayer,{asChild:!0,disableOutsidePointerEvents:!0,onEscapeKeyDown,onPointerDownOutside,onFocusOutside:event=>event.preventDefault(),onDismiss:()=>context.onOpenChange(!1),children:(0,import_jsx_runtime.jsx)(SelectPosition,{role:`listbox`,id:context.contentId,"data-state":context.open?`open`:`closed`,dir:context.dir,onContextMenu:event=>event.preventDefault(),...contentProps,...popperContentProps,onPlaced:()=>setIsPositioned(!0),ref:composedRefs,style:{display:`flex`,flexDirection:`column`,outline:`none`,...contentProps.style},onKeyDown:composeEventHandlers(contentProps.onKeyDown,event=>{let isModifierKey=event.ctrlKey||event.altKey||event.metaKey;if(event.key===`Tab`&&event.preventDefault(),!isModifierKey&&event.key.length===1&&handleTypeaheadSearch(event.key),[`ArrowUp`,`ArrowDown`,`Home`,`End`].includes(event.key)){let candidateNodes=getItems().filter(item=>!item.disabled).map(item=>item.ref.current);if([`ArrowUp`,`End`].includes(event.key)&&(candidateNodes=candidateNodes.slice().reverse()),[`ArrowUp`,`ArrowDown`].includes(event.key)){let currentElement=event.target,currentIndex=candidateNodes.indexOf(currentElement);candidateNodes=candidateNodes.slice(currentIndex+1)}setTimeout(()=>focusFirst$4(candidateNodes)),event.preventDefault()}})})})})})})});SelectContentImpl.displayName=CONTENT_IMPL_NAME;var ITEM_ALIGNED_POSITION_NAME=`SelectItemAlignedPosition`,SelectItemAlignedPosition=import_react.forwardRef((props,forwardedRef)=>{let{__scopeSelect,onPlaced,...popperProps}=props,context=useSelectContext(CONTENT_NAME$2,__scopeSelect),contentContext=useSelectContentContext(CONTENT_NAME$2,__scopeSelect),[contentWrapper,setContentWrapper]=import_react.useState(null),[content,setContent]=import_react.useState(null),composedRefs=useComposedRefs(forwardedRef,node=>setContent(node)),getItems=useCollection$1(__scopeSelect),shouldExpandOnScrollRef=import_react.useRef(!1),shouldRepositionRef=import_react.useRef(!0),{viewport,selectedItem,selectedItemText,focusSelectedItem}=contentContext,position=import_react.useCallback(()=>{if(context.trigger&&context.valueNode&&contentWrapper&&content&&viewport&&selectedItem&&selectedItemText){let triggerRect=context.trigger.getBoundingClientRect(),contentRect=content.getBoundingClientRect(),valueNodeRect=context.valueNode.getBoundingClientRect(),itemTextRect=selectedItemText.getBoundingClientRect();if(context.dir!==`rtl`){let itemTextOffset=itemTextRect.left-contentRect.left,left=valueNodeRect.left-itemTextOffset,leftDelta=triggerRect.left-left,minContentWidth=triggerRect.width+leftDelta,contentWidth=Math.max(minContentWidth,contentRect.width),rightEdge=window.innerWidth-CONTENT_MARGIN,clampedLeft=clamp(left,[CONTENT_MARGIN,Math.max(CONTENT_MARGIN,rightEdge-contentWidth)]);contentWrapper.style.minWidth=minContentWidth+`px`,contentWrapper.style.left=clampedLeft+`px`}else{let itemTextOffset=contentRect.right-itemTextRect.right,right=window.innerWidth-valueNodeRect.right-itemTextOffset,rightDelta=window.innerWidth-triggerRect.right-right,minContentWidth=triggerRect.width+rightDelta,contentWidth=Math.max(minContentWidth,contentRect.width),leftEdge=window.innerWidth-CONTENT_MARGIN,clampedRight=clamp(right,[CONTENT_MARGIN,Math.max(CONTENT_MARGIN,leftEdge-contentWidth)]);contentWrapper.style.minWidth=minContentWidth+`px`,contentWrapper.style.right=clampedRight+`px`}let items=getItems(),availableHeight=window.innerHeight-CONTENT_MARGIN*2,itemsHeight=viewport.scrollHeight,contentStyles=window.getComputedStyle(content),contentBorderTopWidth=parseInt(contentStyles.borderTopWidth,10),contentPaddingTop=parseInt(contentStyles.paddingTop,10),contentBorderBottomWidth=parseInt(contentStyles.borderBottomWidth,10),contentPaddingBottom=parseInt(contentStyles.paddingBottom,10),fullContentHeight=contentBorderTopWidth+contentPaddingTop+itemsHeight+contentPaddingBottom+contentBorderBottomWidth,minContentHeight=Math.min(selectedItem.offsetHeight*5,fullContentHeight),viewportStyles=window.getComputedStyle(viewport),viewportPaddingTop=parseInt(viewportStyles.paddingTop,10),viewportPaddingBottom=parseInt(viewportStyles.paddingBottom,10),topEdgeToTriggerMiddle=triggerRect.top+triggerRect.height/2-CONTENT_MARGIN,triggerMiddleToBottomEdge=availableHeight-topEdgeToTriggerMiddle,selectedItemHalfHeight=selectedItem.offsetHeight/2,itemOffsetMiddle=selectedItem.offsetTop+selectedItemHalfHeight,contentTopToItemMiddle=contentBorderTopWidth+contentPaddingTop+itemOffsetMiddle,itemMiddleToContentBottom=fullContentHeight-contentTopToItemMiddle;if(contentTopToItemMiddle<=topEdgeToTriggerMiddle){let isLastItem=items.length>0&&selectedItem===items[items.length-1].ref.current;contentWrapper.style.bottom=`0px`;let viewportOffsetBottom=content.clientHeight-viewport.offsetTop-viewport.offsetHeight,clampedTriggerMiddleToBottomEdge=Math.max(triggerMiddleToBottomEdge,selectedItemHalfHeight+(isLastItem?viewportPaddingBottom:0)+viewportOffsetBottom+contentBorderBottomWidth),height=contentTopToItemMiddle+clampedTriggerMiddleToBottomEdge;contentWrapper.style.height=height+`px`}else{let isFirstItem=items.length>0&&selectedItem===items[0].ref.current;contentWrapper.style.top=`0px`;let height=Math.max(topEdgeToTriggerMiddle,contentBorderTopWidth+viewport.offsetTop+(isFirstItem?viewportPaddingTop:0)+selectedItemHalfHeight)+itemMiddleToContentBottom;contentWrapper.style.height=height+`px`,viewport.scrollTop=contentTopToItemMiddle-topEdgeToTriggerMiddle+viewport.offsetTop}contentWrapper.style.margin=`${CONTENT_MARGIN}px 0`,contentWrapper.style.minHeight=minContentHeight+`px`,contentWrapper.style.maxHeight=availableHeight+`px`,onPlaced?.(),requestAnimationFrame(()=>shouldExpandOnScrollRef.current=!0)}},[getItems,context.trigger,context.valueNode,contentWrapper,content,viewport,selectedItem,selectedItemText,context.dir,onPlaced]);useLayoutEffect2(()=>position(),[position]);let[contentZIndex,setContentZIndex]=import_react.useState();useLayoutEffect2(()=>{content&&setContentZIndex(window.getComputedStyle(content).zIndex)},[content]);let handleScrollButtonChange=import_react.useCallback(node=>{node&&shouldRepositionRef.current===!0&&(position(),focusSelectedItem?.(),shouldRepositionRef.current=!1)},[position,focusSelectedItem]);return(0,import_jsx_runtime.jsx)(SelectViewportProvider,{scope:__scopeSelect,contentWrapper,shouldExpandOnScrollRef,onScrollButtonChange:handleScrollButtonChange,children:(0,import_jsx_runtime.jsx)(`div`,{ref:setContentWrapper,style:{display:`flex`,flexDirection:`column`,position:`fixed`,zIndex:contentZIndex},children:(0,import_jsx_runtime.jsx)(Primitive$1.div,{...popperProps,ref:composedRefs,style:{boxSizing:`border-box`,maxHeight:`100%`,...popperProps.style}})})})});SelectItemAlignedPosition.displayName=ITEM_ALIGNED_POSITION_NAME;var POPPER_POSITION_NAME=`SelectPopperPosition`,SelectPopperPosition=import_react.forwardRef((props,forwardedRef)=>{let{__scopeSelect,align=`start`,collisionPadding=CONTENT_MARGIN,...popperProps}=props,popperScope=usePopperScope$1(__scopeSelect);return(0,import_jsx_runtime.jsx)(Content$1,{...popperScope,...popperProps,ref:forwardedRef,align,collisionPadding,style:{boxSizing:`border-box`,...popperProps.style,"--radix-select-content-transform-origin":`var(--radix-popper-transform-origin)`,"--radix-select-content-available-width":`var(--radix-popper-available-width)`,"--radix-select-content-available-height":`var(--radix-popper-available-height)`,"--radix-select-trigger-width":`var(--radix-popper-anchor-width)`,"--radix-select-trigger-height":`var(--radix-popper-anchor-height)`}})});SelectPopperPosition.displayName=POPPER_POSITION_NAME;var[SelectViewportProvider,useSelectViewportContext]=createSelectContext(CONTENT_NAME$2,{}),VIEWPORT_NAME=`SelectViewport`,SelectViewport=import_react.forwardRef((props,forwardedRef)=>{let{__scopeSelect,nonce,...viewportProps}=props,contentContext=useSelectContentContext(VIEWPORT_NAME,__scopeSelect),viewportContext=useSelectViewportContext(VIEWPORT_NAME,__scopeSelect),composedRefs=useComposedRefs(forwardedRef,contentContext.onViewportChange),prevScrollTopRef=import_react.useRef(0);return(0,import_jsx_runtime.jsxs)(import_jsx_runtime.Fragment,{children:[(0,import_jsx_runtime.jsx)(`style`,{dangerouslySetInnerHTML:{__html:`[data-radix-select-viewport]{scrollbar-width:none;-ms-overflow-style:none;-webkit-overflow-scrolling:touch;}[data-radix-select-viewport]::-webkit-scrollbar{display:none}`},nonce}),(0,import_jsx_runtime.jsx)(Collection$1.Slot,{scope:__scopeSelect,children:(0,import_jsx_runtime.jsx)(Primitive$1.div,{"data-radix-select-viewport":``,role:`presentation`,...viewportProps,ref:composedRefs,style:{position:`relative`,flex:1,overflow:`hidden auto`,...viewportProps.style},onScroll:composeEventHandlers(viewportProps.onScroll,event=>{let viewport=event.currentTarget,{contentWrapper,shouldExpandOnScrollRef}=viewportContext;if(shouldExpandOnScrollRef?.current&&contentWrapper){let scrolledBy=Math.abs(prevScrollTopRef.current-viewport.scrollTop);if(scrolledBy>0){let availableHeight=window.innerHeight-CONTENT_MARGIN*2,cssMinHeight=parseFloat(contentWrapper.style.minHeight),cssHeight=parseFloat(contentWrapper.style.height),prevHeight=Math.max(cssMinHeight,cssHeight);if(prevHeight<availableHeight){let nextHeight=prevHeight+scrolledBy,clampedNextHeight=Math.min(availableHeight,nextHeight),heightDiff=nextHeight-clampedNextHeight;contentWrapper.style.height=clampedNextHeight+`px`,contentWrapper.style.bottom===`0px`&&(viewport.scrollTop=heightDiff>0?heightDiff:0,contentWrapper.style.justifyContent=`flex-end`)}}}prevScrollTopRef.current=viewport.scrollTop})})})]})});SelectViewport.displayName=VIEWPORT_NAME;var GROUP_NAME=`SelectGroup`,[SelectGroupContextProvider,useSelectGroupContext]=createSelectContext(GROUP_NAME),SelectGroup=import_react.forwardRef((props,forwardedRef)=>{let{__scopeSelect,...groupProps}=props,groupId=useId();return(0,import_jsx_runtime.jsx)(SelectGroupContextProvider,{scope:__scopeSelect,id:groupId,children:(0,import_jsx_runtime.jsx)(Primitive$1.div,{role:`group`,"aria-labelledby":groupId,...groupProps,ref:forwardedRef})})});SelectGroup.displayName=GROUP_NAME;var LABEL_NAME=`SelectLabel`,SelectLabel=import_react.forwardRef((props,forwardedRef)=>{let{__scopeSelect,...labelProps}=props,groupContext=useSelectGroupContext(LABEL_NAME,__scopeSelect);return(0,import_jsx_runtime.jsx)(Primitive$1.div,{id:groupContext.id,...labelProps,ref:forwardedRef})});SelectLabel.displayName=LABEL_NAME;var ITEM_NAME$1=`SelectItem`,[SelectItemContextProvider,useSelectItemContext]=createSelectContext(ITEM_NAME$1),SelectItem=import_react.forwardRef((props,forwardedRef)=>{let{__scopeSelect,value:value$1,disabled=!1,textValue:textValueProp,...itemProps}=props,context=useSelectContext(ITEM_NAME$1,__scopeSelect),contentContext=useSelectContentContext(ITEM_NAME$1,__scopeSelect),isSelected=context.value===value$1,[textValue,setTextValue]=import_react.useState(textValueProp??``),[isFocused,setIsFocused]=import_react.useState(!1),composedRefs=useComposedRefs(forwardedRef,node=>contentContext.itemRefCallback?.(node,value$1,disabled)),textId=useId(),pointerTypeRef=import_react.useRef(`touch`),handleSelect=()=>{disabled||(context.onValueChange(value$1),context.onOpenChange(!1))};if(value$1===``)throw Error(`A <Select.Item /> must have a value prop that is not an empty string. This is because the Select value can be set to an empty string to clear the selection and show the placeholder.`);return(0,import_jsx_runtime.jsx)(SelectItemContextProvider,{scope:__scopeSelect,value:value$1,disabled,textId,isSelected,onItemTextChange:import_react.useCallback(node=>{setTextValue(prevTextValue=>prevTextValue||(node?.textContent??``).trim())},[]),children:(0,import_jsx_runtime.jsx)(Collection$1.ItemSlot,{scope:__scopeSelect,value:value$1,disabled,textValue,children:(0,import_jsx_runtime.jsx)(Primitive$1.div,{role:`option`,"aria-labelledby":textId,"data-highlighted":isFocused?``:void 0,"aria-selected":isSelected&&isFocused,"data-state":isSelected?`checked`:`unchecked`,"aria-disabled":disabled||void 0,"data-disabled":disabled?``:void 0,tabIndex:disabled?void 0:-1,...itemProps,ref:composedRefs,onFocus:composeEventHandlers(itemProps.onFocus,()=>setIsFocused(!0)),onBlur:composeEventHandlers(itemProps.onBlur,()=>setIsFocused(!1)),onClick:composeEventHandlers(itemProps.onClick,()=>{pointerTypeRef.current!==`mouse`&&handleSelect()}),onPointerUp:composeEventHandlers(itemProps.onPointerUp,()=>{pointerTypeRef.current===`mouse`&&handleSelect()}),onPointerDown:composeEventHandlers(itemProps.onPointerDown,event=>{pointerTypeRef.current=event.pointerType}),onPointerMove:composeEventHandlers(itemProps.onPointerMove,event=>{pointerTypeRef.current=event.pointerType,disabled?contentContext.onItemLeave?.():pointerTypeRef.current===`mouse`&&event.currentTarget.focus({preventScroll:!0})}),onPointerLeave:composeEventHandlers(itemProps.onPointerLeave,event=>{event.currentTarget===document.activeElement&&contentContext.onItemLeave?.()}),onKeyDown:composeEventHandlers(itemProps.onKeyDown,event=>{contentContext.searchRef?.current!==``&&event.key===` `||(SELECTION_KEYS.includes(event.key)&&handleSelect(),event.key===` `&&event.preventDefault())})})})})});SelectItem.displayName=ITEM_NAME$1;var ITEM_TEXT_NAME=`SelectItemText`,SelectItemText=import_react.forwardRef((props,forwardedRef)=>{let{__scopeSelect,className,style,...itemTextProps}=props,context=useSelectContext(ITEM_TEXT_NAME,__scopeSelect),contentContext=useSelectContentContext(ITEM_TEXT_NAME,__scopeSelect),itemContext=useSelectItemContext(ITEM_TEXT_NAME,__scopeSelect),nativeOptionsContext=useSelectNativeOptionsContext(ITEM_TEXT_NAME,__scopeSelect),[itemTextNode,setItemTextNode]=import_react.useState(null),composedRefs=useComposedRefs(forwardedRef,node=>setItemTextNode(node),itemContext.onItemTextChange,node=>contentContext.itemTextRefCallback?.(node,itemContext.value,itemContext.disabled)),textContent=itemTextNode?.textContent,nativeOption=import_react.useMemo(()=>(0,import_jsx_runtime.jsx)(`option`,{value:itemContext.value,disabled:itemContext.disabled,children:textContent},itemContext.value),[itemContext.disabled,itemContext.value,textContent]),{onNativeOptionAdd,onNativeOptionRemove}=nativeOptionsContext;return useLayoutEffect2(()=>(onNativeOptionAdd(nativeOption),()=>onNativeOptionRemove(nativeOption)),[onNativeOptionAdd,onNativeOptionRemove,nativeOption]),(0,import_jsx_runtime.jsxs)(import_jsx_runtime.Fragment,{children:[(0,import_jsx_runtime.jsx)(Primitive$1.span,{id:itemContext.textId,...itemTextProps,ref:composedRefs}),itemContext.isSelected&&context.valueNode&&!context.valueNodeHasChildren?import_react_dom.createPortal(itemTextProps.children,context.valueNode):null]})});SelectItemText.displayName=ITEM_TEXT_NAME;var ITEM_INDICATOR_NAME=`SelectItemIndicator`,SelectItemIndicator=import_react.forwardRef((props,forwardedRef)=>{let{__scopeSelect,...itemIndicatorProps}=props;return useSelectItemContext(ITEM_INDICATOR_NAME,__scopeSelect).isSelected?(0,import_jsx_runtime.jsx)(Primitive$1.span,{"aria-hidden":!0,...itemIndicatorProps,ref:forwardedRef}):null});SelectItemIndicator.displayName=ITEM_INDICATOR_NAME;var SCROLL_UP_BUTTON_NAME=`SelectScrollUpButton`,SelectScrollUpButton=import_react.forwardRef((props,forwardedRef)=>{let contentContext=useSelectContentContext(SCROLL_UP_BUTTON_NAME,props.__scopeSelect),viewportContext=useSelectViewportContext(SCROLL_UP_BUTTON_NAME,props.__scopeSelect),[canScrollUp,setCanScrollUp]=import_react.useState(!1),composedRefs=useComposedRefs(forwardedRef,viewportContext.onScrollButtonChange);return useLayoutEffect2(()=>{if(contentContext.viewport&&contentContext.isPositioned){let handleScroll2=function(){let canScrollUp2=viewport.scrollTop>0;setCanScrollUp(canScrollUp2)},viewport=contentContext.viewport;return handleScroll2(),viewport.addEventListener(`scroll`,handleScroll2),()=>viewport.removeEventListener(`scroll`,handleScroll2)}},[contentContext.viewport,contentContext.isPositioned]),canScrollUp?(0,import_jsx_runtime.jsx)(SelectScrollButtonImpl,{...props,ref:composedRefs,onAutoScroll:()=>{let{viewport,selectedItem}=contentContext;viewport&&selectedItem&&(viewport.scrollTop-=selectedItem.offsetHeight)}}):null});SelectScrollUpButton.displayName=SCROLL_UP_BUTTON_NAME;var SCROLL_DOWN_BUTTON_NAME=`SelectScrollDownButton`,SelectScrollDownButton=import_react.forwardRef((props,forwardedRef)=>{let contentContext=useSelectContentContext(SCROLL_DOWN_BUTTON_NAME,props.__scopeSelect),viewportContext=useSelectViewportContext(SCROLL_DOWN_BUTTON_NAME,props.__scopeSelect),[canScrollDown,setCanScrollDown]=import_react.useState(!1),composedRefs=useComposedRefs(forwardedRef,viewportContext.onScrollButtonChange);return useLayoutEffect2(()=>{if(contentContext.viewport&&contentContext.isPositioned){let handleScroll2=function(){let maxScroll=viewport.scrollHeight-viewport.clientHeight,canScrollDown2=Math.ceil(viewport.scrollTop)<maxScroll;setCanScrollDown(canScrollDown2)},viewport=contentContext.viewport;return handleScroll2(),viewport.addEventListener(`scroll`,handleScroll2),()=>viewport.removeEventListener(`scroll`,handleScroll2)}},[contentContext.viewport,contentContext.isPositioned]),canScrollDown?(0,import_jsx_runtime.jsx)(SelectScrollButtonImpl,{...props,ref:composedRefs,onAutoScroll:()=>{let{viewport,selectedItem}=contentContext;viewport&&selectedItem&&(viewport.scrollTop+=selectedItem.offsetHeight)}}):null});SelectScrollDownButton.displayName=SCROLL_DOWN_BUTTON_NAME;var SelectScrollButtonImpl=import_react.forwardRef((props,forwardedRef)=>{let{__scopeSelect,onAutoScroll,...scrollIndicatorProps}=props,contentContext=useSelectContentContext(`SelectScrollButton`,__scopeSelect),autoScrollTimerRef=import_react.useRef(null),getItems=useCollection$1(__scopeSelect),clearAutoScrollTimer=import_react.useCallback(()=>{autoScrollTimerRef.current!==null&&(window.clearInterval(autoScrollTimerRef.current),autoScrollTimerRef.current=null)},[]);return import_react.useEffect(()=>()=>clearAutoScrollTimer(),[clearAutoScrollTimer]),useLayoutEffect2(()=>{getItems().find(item=>item.ref.current===document.activeElement)?.ref.current?.scrollIntoView({block:`nearest`})},[getItems]),(0,import_jsx_runtime.jsx)(Primitive$1.div,{"aria-hidden":!0,...scrollIndicatorProps,ref:forwardedRef,style:{flexShrink:0,...scrollIndicatorProps.style},onPointerDown:composeEventHandlers(scrollIndicatorProps.onPointerDown,()=>{autoScrollTimerRef.current===null&&(autoScrollTimerRef.current=window.setInterval(onAutoScroll,50))}),onPointerMove:composeEventHandlers(scrollIndicatorProps.onPointerMove,()=>{contentContext.onItemLeave?.(),autoScrollTimerRef.current===null&&(autoScrollTimerRef.current=window.setInterval(onAutoScroll,50))}),onPointerLeave:composeEventHandlers(scrollIndicatorProps.onPointerLeave,()=>{clearAutoScrollTimer()})})}),SEPARATOR_NAME=`SelectSeparator`,SelectSeparator=import_react.forwardRef((props,forwardedRef)=>{let{__scopeSelect,...separatorProps}=props;return(0,import_jsx_runtime.jsx)(Primitive$1.div,{"aria-hidden":!0,...separatorProps,ref:forwardedRef})});SelectSeparator.displayName=SEPARATOR_NAME;var ARROW_NAME$1=`SelectArrow`,SelectArrow=import_react.forwardRef((props,forwardedRef)=>{let{__scopeSelect,...arrowProps}=props,popperScope=usePopperScope$1(__scopeSelect),context=useSelectContext(ARROW_NAME$1,__scopeSelect),contentContext=useSelectContentContext(ARROW_NAME$1,__scopeSelect);return context.open&&contentContext.position===`popper`?(0,import_jsx_runtime.jsx)(Arrow,{...popperScope,...arrowProps,ref:forwardedRef}):null});SelectArrow.displayName=ARROW_NAME$1;var BUBBLE_INPUT_NAME$2=`SelectBubbleInput`,SelectBubbleInput=import_react.forwardRef(({__scopeSelect,value:value$1,...props},forwardedRef)=>{let ref=import_react.useRef(null),composedRefs=useComposedRefs(forwardedRef,ref),prevValue=usePrevious(value$1);return import_react.useEffect(()=>{let select=ref.current;if(!select)return;let selectProto=window.HTMLSelectElement.prototype,setValue=Object.getOwnPropertyDescriptor(selectProto,`value`).set;if(prevValue!==value$1&&setValue){let event=new Event(`change`,{bubbles:!0});setValue.call(select,value$1),select.dispatchEvent(event)}},[prevValue,value$1]),(0,import_jsx_runtime.jsx)(Primitive$1.select,{...props,style:{...VISUALLY_HIDDEN_STYLES,...props.style},ref:composedRefs,defaultValue:value$1})});SelectBubbleInput.displayName=BUBBLE_INPUT_NAME$2;function shouldShowPlaceholder(value$1){return value$1===``||value$1===void 0}function useTypeaheadSearch(onSearchChange){let handleSearchChange=useCallbackRef(onSearchChange),searchRef=import_react.useRef(``),timerRef=import_react.useRef(0),handleTypeaheadSearch=import_react.useCallback(key$1=>{let search=searchRef.current+key$1;handleSearchChange(search),(function updateSearch(value$1){searchRef.current=value$1,window.clearTimeout(timerRef.current),value$1!==``&&(timerRef.current=window.setTimeout(()=>updateSearch(``),1e3))})(search)},[handleSearchChange]),resetTypeahead=import_react.useCallback(()=>{searchRef.current=``,window.clearTimeout(timerRef.current)},[]);return import_react.useEffect(()=>()=>window.clearTimeout(timerRef.current),[]),[searchRef,handleTypeaheadSearch,resetTypeahead]}function findNextItem(items,search,currentItem){let normalizedSearch=search.length>1&&Array.from(search).every(char=>char===search[0])?search[0]:search,currentItemIndex=currentItem?items.indexOf(currentItem):-1,wrappedItems=wrapArray(items,Math.max(currentItemIndex,0));normalizedSearch.length===1&&(wrappedItems=wrappedItems.filter(v$10=>v$10!==currentItem));let nextItem=wrappedItems.find(item=>item.textValue.toLowerCase().startsWith(normalizedSearch.toLowerCase()));return nextItem===currentItem?void 0:nextItem}function wrapArray(array,startIndex){return array.map((_,index$1)=>array[(startIndex+index$1)%array.length])}var Root2$2=Select,Trigger$2=SelectTrigger,Value=SelectValue,Icon=SelectIcon,Portal$2=SelectPortal,Content2$1=SelectContent,Viewport=SelectViewport,Group=SelectGroup,Label=SelectLabel,Item=SelectItem,ItemText=SelectItemText,ItemIndicator=SelectItemIndicator,Separator=SelectSeparator,PAGE_KEYS=[`PageUp`,`PageDown`],ARROW_KEYS=[`ArrowUp`,`ArrowDown`,`ArrowLeft`,`ArrowRight`],BACK_KEYS={"from-left":[`Home`,`PageDown`,`ArrowDown`,`ArrowLeft`],"from-right":[`Home`,`PageDown`,`ArrowDown`,`ArrowRight`],"from-bottom":[`Home`,`PageDown`,`ArrowDown`,`ArrowLeft`],"from-top":[`Home`,`PageDown`,`ArrowUp`,`ArrowLeft`]},SLIDER_NAME=`Slider`,[Collection,useCollection,createCollectionScope]=createCollection(SLIDER_NAME),[createSliderContext,createSliderScope]=createContextScope(SLIDER_NAME,[createCollectionScope]),[SliderProvider,useSliderContext]=createSliderContext(SLIDER_NAME),Slider=import_react.forwardRef((props,forwardedRef)=>{let{name,min:min$1=0,max:max$1=100,step=1,orientation=`horizontal`,disabled=!1,minStepsBetweenThumbs=0,defaultValue=[min$1],value:value$1,onValueChange=()=>{},onValueCommit=()=>{},inverted=!1,form,...sliderProps}=props,thumbRefs=import_react.useRef(new Set),valueIndexToChangeRef=import_react.useRef(0),SliderOrientation=orientation===`horizontal`?SliderHorizontal:SliderVertical,[values=[],setValues]=useControllableState({prop:value$1,defaultProp:defaultValue,onChange:value2=>{[...thumbRefs.current][valueIndexToChangeRef.current]?.focus(),onValueChange(value2)}}),valuesBeforeSlideStartRef=import_react.useRef(values);function handleSlideStart(value2){let closestIndex=getClosestValueIndex(values,value2);updateValues(value2,closestIndex)}function handleSlideMove(value2){updateValues(value2,valueIndexToChangeRef.current)}function handleSlideEnd(){let prevValue=valuesBeforeSlideStartRef.current[valueIndexToChangeRef.current];values[valueIndexToChangeRef.current]!==prevValue&&onValueCommit(values)}function updateValues(value2,atIndex,{commit}={commit:!1}){let decimalCount=getDecimalCount(step),snapToStep=roundValue(Math.round((value2-min$1)/step)*step+min$1,decimalCount),nextValue=clamp(snapToStep,[min$1,max$1]);setValues((prevValues=[])=>{let nextValues=getNextSortedValues(prevValues,nextValue,atIndex);if(hasMinStepsBetweenValues(nextValues,minStepsBetweenThumbs*step)){valueIndexToChangeRef.current=nextValues.indexOf(nextValue);let hasChanged=String(nextValues)!==String(prevValues);return hasChanged&&commit&&onValueCommit(nextValues),hasChanged?nextValues:prevValues}else return prevValues})}return(0,import_jsx_runtime.jsx)(SliderProvider,{scope:props.__scopeSlider,name,disabled,min:min$1,max:max$1,valueIndexToChangeRef,thumbs:thumbRefs.current,values,orientation,form,children:(0,import_jsx_runtime.jsx)(Collection.Provider,{scope:props.__scopeSlider,children:(0,import_jsx_runtime.jsx)(Collection.Slot,{scope:props.__scopeSlider,children:(0,import_jsx_runtime.jsx)(SliderOrientation,{"aria-disabled":disabled,"data-disabled":disabled?``:void 0,...sliderProps,ref:forwardedRef,onPointerDown:composeEventHandlers(sliderProps.onPointerDown,()=>{disabled||(valuesBeforeSlideStartRef.current=values)}),min:min$1,max:max$1,inverted,onSlideStart:disabled?void 0:handleSlideStart,onSlideMove:disabled?void 0:handleSlideMove,onSlideEnd:disabled?void 0:handleSlideEnd,onHomeKeyDown:()=>!disabled&&updateValues(min$1,0,{commit:!0}),onEndKeyDown:()=>!disabled&&updateValues(max$1,values.length-1,{commit:!0}),onStepKeyDown:({event,direction:stepDirection})=>{if(!disabled){let multiplier=PAGE_KEYS.includes(event.key)||event.shiftKey&&ARROW_KEYS.includes(event.key)?10:1,atIndex=valueIndexToChangeRef.current,value2=values[atIndex],stepInDirection=step*multiplier*stepDirection;updateValues(value2+stepInDirection,atIndex,{commit:!0})}}})})})})});Slider.displayName=SLIDER_NAME;var[SliderOrientationProvider,useSliderOrientationContext]=createSliderContext(SLIDER_NAME,{startEdge:`left`,endEdge:`right`,size:`width`,direction:1}),SliderHorizontal=import_react.forwardRef((props,forwardedRef)=>{let{min:min$1,max:max$1,dir,inverted,onSlideStart,onSlideMove,onSlideEnd,onStepKeyDown,...sliderProps}=props,[slider,setSlider]=import_react.useState(null),composedRefs=useComposedRefs(forwardedRef,node=>setSlider(node)),rectRef=import_react.useRef(void 0),direction=useDirection(dir),isDirectionLTR=direction===`ltr`,isSlidingFromLeft=isDirectionLTR&&!inverted||!isDirectionLTR&&inverted;function getValueFromPointer(pointerPosition){let rect=rectRef.current||slider.getBoundingClientRect(),input=[0,rect.width],value$1=linearScale(input,isSlidingFromLeft?[min$1,max$1]:[max$1,min$1]);return rectRef.current=rect,value$1(pointerPosition-rect.left)}return(0,import_jsx_runtime.jsx)(SliderOrientationProvider,{scope:props.__scopeSlider,startEdge:isSlidingFromLeft?`left`:`right`,endEdge:isSlidingFromLeft?`right`:`left`,direction:isSlidingFromLeft?1:-1,size:`width`,children:(0,import_jsx_runtime.jsx)(SliderImpl,{dir:direction,"data-orientation":`horizontal`,...sliderProps,ref:composedRefs,style:{...sliderProps.style,"--radix-slider-thumb-transform":`translateX(-50%)`},onSlideStart:event=>{let value$1=getValueFromPointer(event.clientX);onSlideStart?.(value$1)},onSlideMove:event=>{let value$1=getValueFromPointer(event.clientX);onSlideMove?.(value$1)},onSlideEnd:()=>{rectRef.current=void 0,onSlideEnd?.()},onStepKeyDown:event=>{let isBackKey=BACK_KEYS[isSlidingFromLeft?`from-left`:`from-right`].includes(event.key);onStepKeyDown?.({event,direction:isBackKey?-1:1})}})})}),SliderVertical=import_react.forwardRef((props,forwardedRef)=>{let{min:min$1,max:max$1,inverted,onSlideStart,onSlideMove,onSlideEnd,onStepKeyDown,...sliderProps}=props,sliderRef=import_react.useRef(null),ref=useComposedRefs(forwardedRef,sliderRef),rectRef=import_react.useRef(void 0),isSlidingFromBottom=!inverted;function getValueFromPointer(pointerPosition){let rect=rectRef.current||sliderRef.current.getBoundingClientRect(),input=[0,rect.height],value$1=linearScale(input,isSlidingFromBottom?[max$1,min$1]:[min$1,max$1]);return rectRef.current=rect,value$1(pointerPosition-rect.top)}return(0,import_jsx_runtime.jsx)(SliderOrientationProvider,{scope:props.__scopeSlider,startEdge:isSlidingFromBottom?`bottom`:`top`,endEdge:isSlidingFromBottom?`top`:`bottom`,size:`height`,direction:isSlidingFromBottom?1:-1,children:(0,import_jsx_runtime.jsx)(SliderImpl,{"data-orientation":`vertical`,...sliderProps,ref,style:{...sliderProps.style,"--radix-slider-thumb-transform":`translateY(50%)`},onSlideStart:event=>{let value$1=getValueFromPointer(event.clientY);onSlideStart?.(value$1)},onSlideMove:event=>{let value$1=getValueFromPointer(event.clientY);onSlideMove?.(value$1)},onSlideEnd:()=>{rectRef.current=void 0,onSlideEnd?.()},onStepKeyDown:event=>{let isBackKey=BACK_KEYS[isSlidingFromBottom?`from-bottom`:`from-top`].includes(event.key);onStepKeyDown?.({event,direction:isBackKey?-1:1})}})})}),SliderImpl=import_react.forwardRef((props,forwardedRef)=>{let{__scopeSlider,onSlideStart,onSlideMove,onSlideEnd,onHomeKeyDown,onEndKeyDown,onStepKeyDown,...sliderProps}=props,context=useSliderContext(SLIDER_NAME,__scopeSlider);return(0,import_jsx_runtime.jsx)(Primitive$1.span,{...sliderProps,ref:forwardedRef,onKeyDown:composeEventHandlers(props.onKeyDown,event=>{event.key===`Home`?(onHomeKeyDown(event),event.preventDefault()):event.key===`End`?(onEndKeyDown(event),event.preventDefault()):PAGE_KEYS.concat(ARROW_KEYS).includes(event.key)&&(onStepKeyDown(event),event.preventDefault())}),onPointerDown:composeEventHandlers(props.onPointerDown,event=>{let target=event.target;target.setPointerCapture(event.pointerId),event.preventDefault(),context.thumbs.has(target)?target.focus():onSlideStart(event)}),onPointerMove:composeEventHandlers(props.onPointerMove,event=>{event.target.hasPointerCapture(event.pointerId)&&onSlideMove(event)}),onPointerUp:composeEventHandlers(props.onPointerUp,event=>{let target=event.target;target.hasPointerCapture(event.pointerId)&&(target.releasePointerCapture(event.pointerId),onSlideEnd(event))})})}),TRACK_NAME=`SliderTrack`,SliderTrack=import_react.forwardRef((props,forwardedRef)=>{let{__scopeSlider,...trackProps}=props,context=useSliderContext(TRACK_NAME,__scopeSlider);return(0,import_jsx_runtime.jsx)(Primitive$1.span,{"data-disabled":context.disabled?``:void 0,"data-orientation":context.orientation,...trackProps,ref:forwardedRef})});SliderTrack.displayName=TRACK_NAME;var RANGE_NAME=`SliderRange`,SliderRange=import_react.forwardRef((props,forwardedRef)=>{let{__scopeSlider,...rangeProps}=props,context=useSliderContext(RANGE_NAME,__scopeSlider),orientation=useSliderOrientationContext(RANGE_NAME,__scopeSlider),ref=import_react.useRef(null),composedRefs=useComposedRefs(forwardedRef,ref),valuesCount=context.values.length,percentages=context.values.map(value$1=>convertValueToPercentage(value$1,context.min,context.max)),offsetStart=valuesCount>1?Math.min(...percentages):0,offsetEnd=100-Math.max(...percentages);return(0,import_jsx_runtime.jsx)(Primitive$1.span,{"data-orientation":context.orientation,"data-disabled":context.disabled?``:void 0,...rangeProps,ref:composedRefs,style:{...props.style,[orientation.startEdge]:offsetStart+`%`,[orientation.endEdge]:offsetEnd+`%`}})});SliderRange.displayName=RANGE_NAME;var THUMB_NAME$1=`SliderThumb`,SliderThumb=import_react.forwardRef((props,forwardedRef)=>{let getItems=useCollection(props.__scopeSlider),[thumb,setThumb]=import_react.useState(null),composedRefs=useComposedRefs(forwardedRef,node=>setThumb(node)),index$1=import_react.useMemo(()=>thumb?getItems().findIndex(item=>item.ref.current===thumb):-1,[getItems,thumb]);return(0,import_jsx_runtime.jsx)(SliderThumbImpl,{...props,ref:composedRefs,index:index$1})}),SliderThumbImpl=import_react.forwardRef((props,forwardedRef)=>{let{__scopeSlider,index:index$1,name,...thumbProps}=props,context=useSliderContext(THUMB_NAME$1,__scopeSlider),orientation=useSliderOrientationContext(THUMB_NAME$1,__scopeSlider),[thumb,setThumb]=import_react.useState(null),composedRefs=useComposedRefs(forwardedRef,node=>setThumb(node)),isFormControl=thumb?context.form||!!thumb.closest(`form`):!0,size$3=useSize(thumb),value$1=context.values[index$1],percent=value$1===void 0?0:convertValueToPercentage(value$1,context.min,context.max),label=getLabel(index$1,context.values.length),orientationSize=size$3?.[orientation.size],thumbInBoundsOffset=orientationSize?getThumbInBoundsOffset(orientationSize,percent,orientation.direction):0;return import_react.useEffect(()=>{if(thumb)return context.thumbs.add(thumb),()=>{context.thumbs.delete(thumb)}},[thumb,context.thumbs]),(0,import_jsx_runtime.jsxs)(`span`,{style:{transform:`var(--radix-slider-thumb-transform)`,position:`absolute`,[orientation.startEdge]:`calc(${percent}% + ${thumbInBoundsOffset}px)`},children:[(0,import_jsx_runtime.jsx)(Collection.ItemSlot,{scope:props.__scopeSlider,children:(0,import_jsx_runtime.jsx)(Primitive$1.span,{role:`slider`,"aria-label":props[`aria-label`]||label,"aria-valuemin":context.min,"aria-valuenow":value$1,"aria-valuemax":context.max,"aria-orientation":context.orientation,"data-orientation":context.orientation,"data-disabled":context.disabled?``:void 0,tabIndex:context.disabled?void 0:0,...thumbProps,ref:composedRefs,style:value$1===void 0?{display:`none`}:props.style,onFocus:composeEventHandlers(props.onFocus,()=>{context.valueIndexToChangeRef.current=index$1})})}),isFormControl&&(0,import_jsx_runtime.jsx)(SliderBubbleInput,{name:name??(context.name?context.name+(context.values.length>1?`[]`:``):void 0),form:context.form,value:value$1},index$1)]})});SliderThumb.displayName=THUMB_NAME$1;var BUBBLE_INPUT_NAME$1=`RadioBubbleInput`,SliderBubbleInput=import_react.forwardRef(({__scopeSlider,value:value$1,...props},forwardedRef)=>{let ref=import_react.useRef(null),composedRefs=useComposedRefs(ref,forwardedRef),prevValue=usePrevious(value$1);return import_react.useEffect(()=>{let input=ref.current;if(!input)return;let inputProto=window.HTMLInputElement.prototype,setValue=Object.getOwnPropertyDescriptor(inputProto,`value`).set;if(prevValue!==value$1&&setValue){let event=new Event(`input`,{bubbles:!0});setValue.call(input,value$1),input.dispatchEvent(event)}},[prevValue,value$1]),(0,import_jsx_runtime.jsx)(Primitive$1.input,{style:{display:`none`},...props,ref:composedRefs,defaultValue:value$1})});SliderBubbleInput.displayName=BUBBLE_INPUT_NAME$1;function getNextSortedValues(prevValues=[],nextValue,atIndex){let nextValues=[...prevValues];return nextValues[atIndex]=nextValue,nextValues.sort((a$37,b$5)=>a$37-b$5)}function convertValueToPercentage(value$1,min$1,max$1){let percentage=100/(max$1-min$1)*(value$1-min$1);return clamp(percentage,[0,100])}function getLabel(index$1,totalValues){if(totalValues>2)return`Value ${index$1+1} of ${totalValues}`;if(totalValues===2)return[`Minimum`,`Maximum`][index$1]}function getClosestValueIndex(values,nextValue){if(values.length===1)return 0;let distances=values.map(value$1=>Math.abs(value$1-nextValue)),closestDistance=Math.min(...distances);return distances.indexOf(closestDistance)}function getThumbInBoundsOffset(width,left,direction){let halfWidth=width/2,offset$3=linearScale([0,50],[0,halfWidth]);return(halfWidth-offset$3(left)*direction)*direction}function getStepsBetweenValues(values){return values.slice(0,-1).map((value$1,index$1)=>values[index$1+1]-value$1)}function hasMinStepsBetweenValues(values,minStepsBetweenValues){if(minStepsBetweenValues>0){let stepsBetweenValues=getStepsBetweenValues(values);return Math.min(...stepsBetweenValues)>=minStepsBetweenValues}return!0}function linearScale(input,output){return value$1=>{if(input[0]===input[1]||output[0]===output[1])return output[0];let ratio=(output[1]-output[0])/(input[1]-input[0]);return output[0]+ratio*(value$1-input[0])}}function getDecimalCount(value$1){return(String(value$1).split(`.`)[1]||``).length}function roundValue(value$1,decimalCount){let rounder=10**decimalCount;return Math.round(value$1*rounder)/rounder}var Root$1=Slider,Track=SliderTrack,Range=SliderRange,Thumb$1=SliderThumb,SWITCH_NAME=`Switch`,[createSwitchContext,createSwitchScope]=createContextScope(SWITCH_NAME),[SwitchProvider,useSwitchContext]=createSwitchContext(SWITCH_NAME),Switch=import_react.forwardRef((props,forwardedRef)=>{let{__scopeSwitch,name,checked:checkedProp,defaultChecked,required,disabled,value:value$1=`on`,onCheckedChange,form,...switchProps}=props,[button,setButton]=import_react.useState(null),composedRefs=useComposedRefs(forwardedRef,node=>setButton(node)),hasConsumerStoppedPropagationRef=import_react.useRef(!1),isFormControl=button?form||!!button.closest(`form`):!0,[checked,setChecked]=useControllableState({prop:checkedProp,defaultProp:defaultChecked??!1,onChange:onCheckedChange,caller:SWITCH_NAME});return(0,import_jsx_runtime.jsxs)(SwitchProvider,{scope:__scopeSwitch,checked,disabled,children:[(0,import_jsx_runtime.jsx)(Primitive$1.button,{type:`button`,role:`switch`,"aria-checked":checked,"aria-required":required,"data-state":getState(checked),"data-disabled":disabled?``:void 0,disabled,value:value$1,...switchProps,ref:composedRefs,onClick:composeEventHandlers(props.onClick,event=>{setChecked(prevChecked=>!prevChecked),isFormControl&&(hasConsumerStoppedPropagationRef.current=event.isPropagationStopped(),hasConsumerStoppedPropagationRef.current||event.stopPropagation())})}),isFormControl&&(0,import_jsx_runtime.jsx)(SwitchBubbleInput,{control:button,bubbles:!hasConsumerStoppedPropagationRef.current,name,value:value$1,checked,required,disabled,form,style:{transform:`translateX(-100%)`}})]})});Switch.displayName=SWITCH_NAME;var THUMB_NAME=`SwitchThumb`,SwitchThumb=import_react.forwardRef((props,forwardedRef)=>{let{__scopeSwitch,...thumbProps}=props,context=useSwitchContext(THUMB_NAME,__scopeSwitch);return(0,import_jsx_runtime.jsx)(Primitive$1.span,{"data-state":getState(context.checked),"data-disabled":context.disabled?``:void 0,...thumbProps,ref:forwardedRef})});SwitchThumb.displayName=THUMB_NAME;var BUBBLE_INPUT_NAME=`SwitchBubbleInput`,SwitchBubbleInput=import_react.forwardRef(({__scopeSwitch,control,checked,bubbles=!0,...props},forwardedRef)=>{let ref=import_react.useRef(null),composedRefs=useComposedRefs(ref,forwardedRef),prevChecked=usePrevious(checked),controlSize=useSize(control);return import_react.useEffect(()=>{let input=ref.current;if(!input)return;let inputProto=window.HTMLInputElement.prototype,setChecked=Object.getOwnPropertyDescriptor(inputProto,`checked`).set;if(prevChecked!==checked&&setChecked){let event=new Event(`click`,{bubbles});setChecked.call(input,checked),input.dispatchEvent(event)}},[prevChecked,checked,bubbles]),(0,import_jsx_runtime.jsx)(`input`,{type:`checkbox`,"aria-hidden":!0,defaultChecked:checked,...props,tabIndex:-1,ref:composedRefs,style:{...props.style,...controlSize,position:`absolute`,pointerEvents:`none`,opacity:0,margin:0}})});SwitchBubbleInput.displayName=BUBBLE_INPUT_NAME;function getState(checked){return checked?`checked`:`unchecked`}var Root=Switch,Thumb=SwitchThumb,TABS_NAME=`Tabs`,[createTabsContext,createTabsScope]=createContextScope(TABS_NAME,[createRovingFocusGroupScope]),useRovingFocusGroupScope$1=createRovingFocusGroupScope(),[TabsProvider,useTabsContext]=createTabsContext(TABS_NAME),Tabs=import_react.forwardRef((props,forwardedRef)=>{let{__scopeTabs,value:valueProp,onValueChange,defaultValue,orientation=`horizontal`,dir,activationMode=`automatic`,...tabsProps}=props,direction=useDirection(dir),[value$1,setValue]=useControllableState({prop:valueProp,onChange:onValueChange,defaultProp:defaultValue??``,caller:TABS_NAME});return(0,import_jsx_runtime.jsx)(TabsProvider,{scope:__scopeTabs,baseId:useId(),value:value$1,onValueChange:setValue,orientation,dir:direction,activationMode,children:(0,import_jsx_runtime.jsx)(Primitive$1.div,{dir:direction,"data-orientation":orientation,...tabsProps,ref:forwardedRef})})});Tabs.displayName=TABS_NAME;var TAB_LIST_NAME=`TabsList`,TabsList=import_react.forwardRef((props,forwardedRef)=>{let{__scopeTabs,loop=!0,...listProps}=props,context=useTabsContext(TAB_LIST_NAME,__scopeTabs),rovingFocusGroupScope=useRovingFocusGroupScope$1(__scopeTabs);return(0,import_jsx_runtime.jsx)(Root$4,{asChild:!0,...rovingFocusGroupScope,orientation:context.orientation,dir:context.dir,loop,children:(0,import_jsx_runtime.jsx)(Primitive$1.div,{role:`tablist`,"aria-orientation":context.orientation,...listProps,ref:forwardedRef})})});TabsList.displayName=TAB_LIST_NAME;var TRIGGER_NAME$1=`TabsTrigger`,TabsTrigger=import_react.forwardRef((props,forwardedRef)=>{let{__scopeTabs,value:value$1,disabled=!1,...triggerProps}=props,context=useTabsContext(TRIGGER_NAME$1,__scopeTabs),rovingFocusGroupScope=useRovingFocusGroupScope$1(__scopeTabs),triggerId=makeTriggerId(context.baseId,value$1),contentId=makeContentId(context.baseId,value$1),isSelected=value$1===context.value;return(0,import_jsx_runtime.jsx)(Item$2,{asChild:!0,...rovingFocusGroupScope,focusable:!disabled,active:isSelected,children:(0,import_jsx_runtime.jsx)(Primitive$1.button,{type:`button`,role:`tab`,"aria-selected":isSelected,"aria-controls":contentId,"data-state":isSelected?`active`:`inactive`,"data-disabled":disabled?``:void 0,disabled,id:triggerId,...triggerProps,ref:forwardedRef,onMouseDown:composeEventHandlers(props.onMouseDown,event=>{!disabled&&event.button===0&&event.ctrlKey===!1?context.onValueChange(value$1):event.preventDefault()}),onKeyDown:composeEventHandlers(props.onKeyDown,event=>{[` `,`Enter`].includes(event.key)&&context.onValueChange(value$1)}),onFocus:composeEventHandlers(props.onFocus,()=>{let isAutomaticActivation=context.activationMode!==`manual`;!isSelected&&!disabled&&isAutomaticActivation&&context.onValueChange(value$1)})})})});TabsTrigger.displayName=TRIGGER_NAME$1;var CONTENT_NAME$1=`TabsContent`,TabsContent=import_react.forwardRef((props,forwardedRef)=>{let{__scopeTabs,value:value$1,forceMount,children,...contentProps}=props,context=useTabsContext(CONTENT_NAME$1,__scopeTabs),triggerId=makeTriggerId(context.baseId,value$1),contentId=makeContentId(context.baseId,value$1),isSelected=value$1===context.value,isMountAnimationPreventedRef=import_react.useRef(isSelected);return import_react.useEffect(()=>{let rAF=requestAnimationFrame(()=>isMountAnimationPreventedRef.current=!1);return()=>cancelAnimationFrame(rAF)},[]),(0,import_jsx_runtime.jsx)(Presence,{present:forceMount||isSelected,children:({present})=>(0,import_jsx_runtime.jsx)(Primitive$1.div,{"data-state":isSelected?`active`:`inactive`,"data-orientation":context.orientation,role:`tabpanel`,"aria-labelledby":triggerId,hidden:!present,id:contentId,tabIndex:0,...contentProps,ref:forwardedRef,style:{...props.style,animationDuration:isMountAnimationPreventedRef.current?`0s`:void 0},children:present&&children})})});TabsContent.displayName=CONTENT_NAME$1;function makeTriggerId(baseId,value$1){return`${baseId}-trigger-${value$1}`}function makeContentId(baseId,value$1){return`${baseId}-content-${value$1}`}var Root2$1=Tabs,List=TabsList,Trigger$1=TabsTrigger,Content=TabsContent,NAME=`Toggle`,Toggle=import_react.forwardRef((props,forwardedRef)=>{let{pressed:pressedProp,defaultPressed,onPressedChange,...buttonProps}=props,[pressed,setPressed]=useControllableState({prop:pressedProp,onChange:onPressedChange,defaultProp:defaultPressed??!1,caller:NAME});return(0,import_jsx_runtime.jsx)(Primitive$1.button,{type:`button`,"aria-pressed":pressed,"data-state":pressed?`on`:`off`,"data-disabled":props.disabled?``:void 0,...buttonProps,ref:forwardedRef,onClick:composeEventHandlers(props.onClick,()=>{props.disabled||setPressed(!pressed)})})});Toggle.displayName=NAME;var TOGGLE_GROUP_NAME=`ToggleGroup`,[createToggleGroupContext,createToggleGroupScope]=createContextScope(TOGGLE_GROUP_NAME,[createRovingFocusGroupScope]),useRovingFocusGroupScope=createRovingFocusGroupScope(),ToggleGroup=import_react.forwardRef((props,forwardedRef)=>{let{type,...toggleGroupProps}=props;if(type===`single`)return(0,import_jsx_runtime.jsx)(ToggleGroupImplSingle,{...toggleGroupProps,ref:forwardedRef});if(type===`multiple`)return(0,import_jsx_runtime.jsx)(ToggleGroupImplMultiple,{...toggleGroupProps,ref:forwardedRef});throw Error(`Missing prop \`type\` expected on \`${TOGGLE_GROUP_NAME}\``)});ToggleGroup.displayName=TOGGLE_GROUP_NAME;var[ToggleGroupValueProvider,useToggleGroupValueContext]=createToggleGroupContext(TOGGLE_GROUP_NAME),ToggleGroupImplSingle=import_react.forwardRef((props,forwardedRef)=>{let{value:valueProp,defaultValue,onValueChange=()=>{},...toggleGroupSingleProps}=props,[value$1,setValue]=useControllableState({prop:valueProp,defaultProp:defaultValue??``,onChange:onValueChange,caller:TOGGLE_GROUP_NAME});return(0,import_jsx_runtime.jsx)(ToggleGroupValueProvider,{scope:props.__scopeToggleGroup,type:`single`,value:import_react.useMemo(()=>value$1?[value$1]:[],[value$1]),onItemActivate:setValue,onItemDeactivate:import_react.useCallback(()=>setValue(``),[setValue]),children:(0,import_jsx_runtime.jsx)(ToggleGroupImpl,{...toggleGroupSingleProps,ref:forwardedRef})})}),ToggleGroupImplMultiple=import_react.forwardRef((props,forwardedRef)=>{let{value:valueProp,defaultValue,onValueChange=()=>{},...toggleGroupMultipleProps}=props,[value$1,setValue]=useControllableState({prop:valueProp,defaultProp:defaultValue??[],onChange:onValueChange,caller:TOGGLE_GROUP_NAME}),handleButtonActivate=import_react.useCallback(itemValue=>setValue((prevValue=[])=>[...prevValue,itemValue]),[setValue]),handleButtonDeactivate=import_react.useCallback(itemValue=>setValue((prevValue=[])=>prevValue.filter(value2=>value2!==itemValue)),[setValue]);return(0,import_jsx_runtime.jsx)(ToggleGroupValueProvider,{scope:props.__scopeToggleGroup,type:`multiple`,value:value$1,onItemActivate:handleButtonActivate,onItemDeactivate:handleButtonDeactivate,children:(0,import_jsx_runtime.jsx)(ToggleGroupImpl,{...toggleGroupMultipleProps,ref:forwardedRef})})});ToggleGroup.displayName=TOGGLE_GROUP_NAME;var[ToggleGroupContext,useToggleGroupContext]=createToggleGroupContext(TOGGLE_GROUP_NAME),ToggleGroupImpl=import_react.forwardRef((props,forwardedRef)=>{let{__scopeToggleGroup,disabled=!1,rovingFocus=!0,orientation,dir,loop=!0,...toggleGroupProps}=props,rovingFocusGroupScope=useRovingFocusGroupScope(__scopeToggleGroup),direction=useDirection(dir),commonProps={role:`group`,dir:direction,...toggleGroupProps};return(0,import_jsx_runtime.jsx)(ToggleGroupContext,{scope:__scopeToggleGroup,rovingFocus,disabled,children:rovingFocus?(0,import_jsx_runtime.jsx)(Root$4,{asChild:!0,...rovingFocusGroupScope,orientation,dir:direction,loop,children:(0,import_jsx_runtime.jsx)(Primitive$1.div,{...commonProps,ref:forwardedRef})}):(0,import_jsx_runtime.jsx)(Primitive$1.div,{...commonProps,ref:forwardedRef})})}),ITEM_NAME=`ToggleGroupItem`,ToggleGroupItem=import_react.forwardRef((props,forwardedRef)=>{let valueContext=useToggleGroupValueContext(ITEM_NAME,props.__scopeToggleGroup),context=useToggleGroupContext(ITEM_NAME,props.__scopeToggleGroup),rovingFocusGroupScope=useRovingFocusGroupScope(props.__scopeToggleGroup),pressed=valueContext.value.includes(props.value),disabled=context.disabled||props.disabled,commonProps={...props,pressed,disabled},ref=import_react.useRef(null);return context.rovingFocus?(0,import_jsx_runtime.jsx)(Item$2,{asChild:!0,...rovingFocusGroupScope,focusable:!disabled,active:pressed,ref,children:(0,import_jsx_runtime.jsx)(ToggleGroupItemImpl,{...commonProps,ref:forwardedRef})}):(0,import_jsx_runtime.jsx)(ToggleGroupItemImpl,{...commonProps,ref:forwardedRef})});ToggleGroupItem.displayName=ITEM_NAME;var ToggleGroupItemImpl=import_react.forwardRef((props,forwardedRef)=>{let{__scopeToggleGroup,value:value$1,...itemProps}=props,valueContext=useToggleGroupValueContext(ITEM_NAME,__scopeToggleGroup),singleProps={role:`radio`,"aria-checked":props.pressed,"aria-pressed":void 0},typeProps=valueContext.type===`single`?singleProps:void 0;return(0,import_jsx_runtime.jsx)(Toggle,{...typeProps,...itemProps,ref:forwardedRef,onPressedChange:pressed=>{pressed?valueContext.onItemActivate(value$1):valueContext.onItemDeactivate(value$1)}})}),Root2=ToggleGroup,Item2=ToggleGroupItem,[createTooltipContext,createTooltipScope]=createContextScope(`Tooltip`,[createPopperScope]),usePopperScope=createPopperScope(),PROVIDER_NAME=`TooltipProvider`,DEFAULT_DELAY_DURATION=700,TOOLTIP_OPEN=`tooltip.open`,[TooltipProviderContextProvider,useTooltipProviderContext]=createTooltipContext(PROVIDER_NAME),TooltipProvider=props=>{let{__scopeTooltip,delayDuration=DEFAULT_DELAY_DURATION,skipDelayDuration=300,disableHoverableContent=!1,children}=props,isOpenDelayedRef=import_react.useRef(!0),isPointerInTransitRef=import_react.useRef(!1),skipDelayTimerRef=import_react.useRef(0);return import_react.useEffect(()=>{let skipDelayTimer=skipDelayTimerRef.current;return()=>window.clearTimeout(skipDelayTimer)},[]),(0,import_jsx_runtime.jsx)(TooltipProviderContextProvider,{scope:__scopeTooltip,isOpenDelayedRef,delayDuration,onOpen:import_react.useCallback(()=>{window.clearTimeout(skipDelayTimerRef.current),isOpenDelayedRef.current=!1},[]),onClose:import_react.useCallback(()=>{window.clearTimeout(skipDelayTimerRef.current),skipDelayTimerRef.current=window.setTimeout(()=>isOpenDelayedRef.current=!0,skipDelayDuration)},[skipDelayDuration]),isPointerInTransitRef,onPointerInTransitChange:import_react.useCallback(inTransit=>{isPointerInTransitRef.current=inTransit},[]),disableHoverableContent,children})};TooltipProvider.displayName=PROVIDER_NAME;var TOOLTIP_NAME=`Tooltip`,[TooltipContextProvider,useTooltipContext]=createTooltipContext(TOOLTIP_NAME),Tooltip=props=>{let{__scopeTooltip,children,open:openProp,defaultOpen,onOpenChange,disableHoverableContent:disableHoverableContentProp,delayDuration:delayDurationProp}=props,providerContext=useTooltipProviderContext(TOOLTIP_NAME,props.__scopeTooltip),popperScope=usePopperScope(__scopeTooltip),[trigger,setTrigger]=import_react.useState(null),contentId=useId(),openTimerRef=import_react.useRef(0),disableHoverableContent=disableHoverableContentProp??providerContext.disableHoverableContent,delayDuration=delayDurationProp??providerContext.delayDuration,wasOpenDelayedRef=import_react.useRef(!1),[open,setOpen]=useControllableState({prop:openProp,defaultProp:defaultOpen??!1,onChange:open2=>{open2?(providerContext.onOpen(),document.dispatchEvent(new CustomEvent(TOOLTIP_OPEN))):providerContext.onClose(),onOpenChange?.(open2)},caller:TOOLTIP_NAME}),stateAttribute=import_react.useMemo(()=>open?wasOpenDelayedRef.current?`delayed-open`:`instant-open`:`closed`,[open]),handleOpen=import_react.useCallback(()=>{window.clearTimeout(openTimerRef.current),openTimerRef.current=0,wasOpenDelayedRef.current=!1,setOpen(!0)},[setOpen]),handleClose=import_react.useCallback(()=>{window.clearTimeout(openTimerRef.current),openTimerRef.current=0,setOpen(!1)},[setOpen]),handleDelayedOpen=import_react.useCallback(()=>{window.clearTimeout(openTimerRef.current),openTimerRef.current=window.setTimeout(()=>{wasOpenDelayedRef.current=!0,setOpen(!0),openTimerRef.current=0},delayDuration)},[delayDuration,setOpen]);return import_react.useEffect(()=>()=>{openTimerRef.current&&=(window.clearTimeout(openTimerRef.current),0)},[]),(0,import_jsx_runtime.jsx)(Root2$9,{...popperScope,children:(0,import_jsx_runtime.jsx)(TooltipContextProvider,{scope:__scopeTooltip,contentId,open,stateAttribute,trigger,onTriggerChange:setTrigger,onTriggerEnter:import_react.useCallback(()=>{providerContext.isOpenDelayedRef.current?handleDelayedOpen():handleOpen()},[providerContext.isOpenDelayedRef,handleDelayedOpen,handleOpen]),onTriggerLeave:import_react.useCallback(()=>{disableHoverableContent?handleClose():(window.clearTimeout(openTimerRef.current),openTimerRef.current=0)},[handleClose,disableHoverableContent]),onOpen:handleOpen,onClose:handleClose,disableHoverableContent,children})})};Tooltip.displayName=TOOLTIP_NAME;var TRIGGER_NAME=`TooltipTrigger`,TooltipTrigger=import_react.forwardRef((props,forwardedRef)=>{let{__scopeTooltip,...triggerProps}=props,context=useTooltipContext(TRIGGER_NAME,__scopeTooltip),providerContext=useTooltipProviderContext(TRIGGER_NAME,__scopeTooltip),popperScope=usePopperScope(__scopeTooltip),ref=import_react.useRef(null),composedRefs=useComposedRefs(forwardedRef,ref,context.onTriggerChange),isPointerDownRef=import_react.useRef(!1),hasPointerMoveOpenedRef=import_react.useRef(!1),handlePointerUp=import_react.useCallback(()=>isPointerDownRef.current=!1,[]);return import_react.useEffect(()=>()=>document.removeEventListener(`pointerup`,handlePointerUp),[handlePointerUp]),(0,import_jsx_runtime.jsx)(Anchor,{asChild:!0,...popperScope,children:(0,import_jsx_runtime.jsx)(Primitive$1.button,{"aria-describedby":context.open?context.contentId:void 0,"data-state":context.stateAttribute,...triggerProps,ref:composedRefs,onPointerMove:composeEventHandlers(props.onPointerMove,event=>{event.pointerType!==`touch`&&!hasPointerMoveOpenedRef.current&&!providerContext.isPointerInTransitRef.current&&(context.onTriggerEnter(),hasPointerMoveOpenedRef.current=!0)}),onPointerLeave:composeEventHandlers(props.onPointerLeave,()=>{context.onTriggerLeave(),hasPointerMoveOpenedRef.current=!1}),onPointerDown:composeEventHandlers(props.onPointerDown,()=>{context.open&&context.onClose(),isPointerDownRef.current=!0,document.addEventListener(`pointerup`,handlePointerUp,{once:!0})}),onFocus:composeEventHandlers(props.onFocus,()=>{isPointerDownRef.current||context.onOpen()}),onBlur:composeEventHandlers(props.onBlur,context.onClose),onClick:composeEventHandlers(props.onClick,context.onClose)})})});TooltipTrigger.displayName=TRIGGER_NAME;var PORTAL_NAME=`TooltipPortal`,[PortalProvider,usePortalContext]=createTooltipContext(PORTAL_NAME,{forceMount:void 0}),TooltipPortal=props=>{let{__scopeTooltip,forceMount,children,container}=props,context=useTooltipContext(PORTAL_NAME,__scopeTooltip);return(0,import_jsx_runtime.jsx)(PortalProvider,{scope:__scopeTooltip,forceMount,children:(0,import_jsx_runtime.jsx)(Presence,{present:forceMount||context.open,children:(0,import_jsx_runtime.jsx)(Portal,{asChild:!0,container,children})})})};TooltipPortal.displayName=PORTAL_NAME;var CONTENT_NAME=`TooltipContent`,TooltipContent=import_react.forwardRef((props,forwardedRef)=>{let portalContext=usePortalContext(CONTENT_NAME,props.__scopeTooltip),{forceMount=portalContext.forceMount,side=`top`,...contentProps}=props,context=useTooltipContext(CONTENT_NAME,props.__scopeTooltip);return(0,import_jsx_runtime.jsx)(Presence,{present:forceMount||context.open,children:context.disableHoverableContent?(0,import_jsx_runtime.jsx)(TooltipContentImpl,{side,...contentProps,ref:forwardedRef}):(0,import_jsx_runtime.jsx)(TooltipContentHoverable,{side,...contentProps,ref:forwardedRef})})}),TooltipContentHoverable=import_react.forwardRef((props,forwardedRef)=>{let context=useTooltipContext(CONTENT_NAME,props.__scopeTooltip),providerContext=useTooltipProviderContext(CONTENT_NAME,props.__scopeTooltip),ref=import_react.useRef(null),composedRefs=useComposedRefs(forwardedRef,ref),[pointerGraceArea,setPointerGraceArea]=import_react.useState(null),{trigger,onClose}=context,content=ref.current,{onPointerInTransitChange}=providerContext,handleRemoveGraceArea=import_react.useCallback(()=>{setPointerGraceArea(null),onPointerInTransitChange(!1)},[onPointerInTransitChange]),handleCreateGraceArea=import_react.useCallback((event,hoverTarget)=>{let currentTarget=event.currentTarget,exitPoint={x:event.clientX,y:event.clientY},exitSide=getExitSideFromRect(exitPoint,currentTarget.getBoundingClientRect()),paddedExitPoints=getPaddedExitPoints(exitPoint,exitSide),hoverTargetPoints=getPointsFromRect(hoverTarget.getBoundingClientRect()),graceArea=getHull([...paddedExitPoints,...hoverTargetPoints]);setPointerGraceArea(graceArea),onPointerInTransitChange(!0)},[onPointerInTransitChange]);return import_react.useEffect(()=>()=>handleRemoveGraceArea(),[handleRemoveGraceArea]),import_react.useEffect(()=>{if(trigger&&content){let handleTriggerLeave=event=>handleCreateGraceArea(event,content),handleContentLeave=event=>handleCreateGraceArea(event,trigger);return trigger.addEventListener(`pointerleave`,handleTriggerLeave),content.addEventListener(`pointerleave`,handleContentLeave),()=>{trigger.removeEventListener(`pointerleave`,handleTriggerLeave),content.removeEventListener(`pointerleave`,handleContentLeave)}}},[trigger,content,handleCreateGraceArea,handleRemoveGraceArea]),import_react.useEffect(()=>{if(pointerGraceArea){let handleTrackPointerGrace=event=>{let target=event.target,pointerPosition={x:event.clientX,y:event.clientY},hasEnteredTarget=trigger?.contains(target)||content?.contains(target),isPointerOutsideGraceArea=!isPointInPolygon(pointerPosition,pointerGraceArea);hasEnteredTarget?handleRemoveGraceArea():isPointerOutsideGraceArea&&(handleRemoveGraceArea(),onClose())};return document.addEventListener(`pointermove`,handleTrackPointerGrace),()=>document.removeEventListener(`pointermove`,handleTrackPointerGrace)}},[trigger,content,pointerGraceArea,onClose,handleRemoveGraceArea]),(0,import_jsx_runtime.jsx)(TooltipContentImpl,{...props,ref:composedRefs})}),[VisuallyHiddenContentContextProvider,useVisuallyHiddenContentContext]=createTooltipContext(TOOLTIP_NAME,{isInside:!1}),Slottable=createSlottable(`TooltipContent`),TooltipContentImpl=import_react.forwardRef((props,forwardedRef)=>{let{__scopeTooltip,children,"aria-label":ariaLabel,onEscapeKeyDown,onPointerDownOutside,...contentProps}=props,context=useTooltipContext(CONTENT_NAME,__scopeTooltip),popperScope=usePopperScope(__scopeTooltip),{onClose}=context;return import_react.useEffect(()=>(document.addEventListener(TOOLTIP_OPEN,onClose),()=>document.removeEventListener(TOOLTIP_OPEN,onClose)),[onClose]),import_react.useEffect(()=>{if(context.trigger){let handleScroll$1=event=>{event.target?.contains(context.trigger)&&onClose()};return window.addEventListener(`scroll`,handleScroll$1,{capture:!0}),()=>window.removeEventListener(`scroll`,handleScroll$1,{capture:!0})}},[context.trigger,onClose]),(0,import_jsx_runtime.jsx)(DismissableLayer,{asChild:!0,disableOutsidePointerEvents:!1,onEscapeKeyDown,onPointerDownOutside,onFocusOutside:event=>event.preventDefault(),onDismiss:onClose,children:(0,import_jsx_runtime.jsxs)(Content$1,{"data-state":context.stateAttribute,...popperScope,...contentProps,ref:forwardedRef,style:{...contentProps.style,"--radix-tooltip-content-transform-origin":`var(--radix-popper-transform-origin)`,"--radix-tooltip-content-available-width":`var(--radix-popper-available-width)`,"--radix-tooltip-content-available-height":`var(--radix-popper-available-height)`,"--radix-tooltip-trigger-width":`var(--radix-popper-anchor-width)`,"--radix-tooltip-trigger-height":`var(--radix-popper-anchor-height)`},children:[(0,import_jsx_runtime.jsx)(Slottable,{children}),(0,import_jsx_runtime.jsx)(VisuallyHiddenContentContextProvider,{scope:__scopeTooltip,isInside:!0,children:(0,import_jsx_runtime.jsx)(Root$10,{id:context.contentId,role:`tooltip`,children:ariaLabel||children})})]})})});TooltipContent.displayName=CONTENT_NAME;var ARROW_NAME=`TooltipArrow`,TooltipArrow=import_react.forwardRef((props,forwardedRef)=>{let{__scopeTooltip,...arrowProps}=props,popperScope=usePopperScope(__scopeTooltip);return useVisuallyHiddenContentContext(ARROW_NAME,__scopeTooltip).isInside?null:(0,import_jsx_runtime.jsx)(Arrow,{...popperScope,...arrowProps,ref:forwardedRef})});TooltipArrow.displayName=ARROW_NAME;function getExitSideFromRect(point,rect){let top=Math.abs(rect.top-point.y),bottom=Math.abs(rect.bottom-point.y),right=Math.abs(rect.right-point.x),left=Math.abs(rect.left-point.x);switch(Math.min(top,bottom,right,left)){case left:return`left`;case right:return`right`;case top:return`top`;case bottom:return`bottom`;default:throw Error(`unreachable`)}}function getPaddedExitPoints(exitPoint,exitSide,padding=5){let paddedExitPoints=[];switch(exitSide){case`top`:paddedExitPoints.push({x:exitPoint.x-padding,y:exitPoint.y+padding},{x:exitPoint.x+padding,y:exitPoint.y+padding});break;case`bottom`:paddedExitPoints.push({x:exitPoint.x-padding,y:exitPoint.y-padding},{x:exitPoint.x+padding,y:exitPoint.y-padding});break;case`left`:paddedExitPoints.push({x:exitPoint.x+padding,y:exitPoint.y-padding},{x:exitPoint.x+padding,y:exitPoint.y+padding});break;case`right`:paddedExitPoints.push({x:exitPoint.x-padding,y:exitPoint.y-padding},{x:exitPoint.x-padding,y:exitPoint.y+padding});break}return paddedExitPoints}function getPointsFromRect(rect){let{top,right,bottom,left}=rect;return[{x:left,y:top},{x:right,y:top},{x:right,y:bottom},{x:left,y:bottom}]}function isPointInPolygon(point,polygon){let{x:x$3,y:y$6}=point,inside=!1;for(let i$23=0,j=polygon.length-1;i$23<polygon.length;j=i$23++){let ii=polygon[i$23],jj=polygon[j],xi=ii.x,yi=ii.y,xj=jj.x,yj=jj.y;yi>y$6!=yj>y$6&&x$3<(xj-xi)*(y$6-yi)/(yj-yi)+xi&&(inside=!inside)}return inside}function getHull(points){let newPoints=points.slice();return newPoints.sort((a$37,b$5)=>a$37.x<b$5.x?-1:a$37.x>b$5.x?1:a$37.y<b$5.y?-1:a$37.y>b$5.y?1:0),getHullPresorted(newPoints)}function getHullPresorted(points){if(points.length<=1)return points.slice();let upperHull=[];for(let i$23=0;i$23<points.length;i$23++){let p$36=points[i$23];for(;upperHull.length>=2;){let q=upperHull[upperHull.length-1],r$38=upperHull[upperHull.length-2];if((q.x-r$38.x)*(p$36.y-r$38.y)>=(q.y-r$38.y)*(p$36.x-r$38.x))upperHull.pop();else break}upperHull.push(p$36)}upperHull.pop();let lowerHull=[];for(let i$23=points.length-1;i$23>=0;i$23--){let p$36=points[i$23];for(;lowerHull.length>=2;){let q=lowerHull[lowerHull.length-1],r$38=lowerHull[lowerHull.length-2];if((q.x-r$38.x)*(p$36.y-r$38.y)>=(q.y-r$38.y)*(p$36.x-r$38.x))lowerHull.pop();else break}lowerHull.push(p$36)}return lowerHull.pop(),upperHull.length===1&&lowerHull.length===1&&upperHull[0].x===lowerHull[0].x&&upperHull[0].y===lowerHull[0].y?upperHull:upperHull.concat(lowerHull)}var Provider=TooltipProvider,Root3=Tooltip,Trigger=TooltipTrigger,Portal$1=TooltipPortal,Content2=TooltipContent,Arrow2=TooltipArrow,s=Root2$11,require_classnames=__commonJSMin(((exports,module)=>{
-/*!
-Copyright (c) 2018 Jed Watson.
-Licensed under the MIT License (MIT), see
-http://jedwatson.github.io/classnames
-*/
-(function(){var hasOwn={}.hasOwnProperty;function classNames(){for(var classes=``,i$23=0;i$23<arguments.length;i$23++){var arg=arguments[i$23];arg&&(classes=appendClass(classes,parseValue(arg)))}return classes}function parseValue(arg){if(typeof arg==`string`||typeof arg==`number`)return arg;if(typeof arg!=`object`)return``;if(Array.isArray(arg))return classNames.apply(null,arg);if(arg.toString!==Object.prototype.toString&&!arg.toString.toString().includes(`[native code]`))return arg.toString();var classes=``;for(var key$1 in arg)hasOwn.call(arg,key$1)&&arg[key$1]&&(classes=appendClass(classes,key$1));return classes}function appendClass(value$1,newClass){return newClass?value$1?value$1+` `+newClass:value$1+newClass:value$1}module!==void 0&&module.exports?(classNames.default=classNames,module.exports=classNames):typeof define==`function`&&typeof define.amd==`object`&&define.amd?define(`classnames`,[],function(){return classNames}):window.classNames=classNames})()})),o$8={asChild:{type:`boolean`}},t={width:{type:`string`,className:`rt-r-w`,customProperties:[`--width`],responsive:!0},minWidth:{type:`string`,className:`rt-r-min-w`,customProperties:[`--min-width`],responsive:!0},maxWidth:{type:`string`,className:`rt-r-max-w`,customProperties:[`--max-width`],responsive:!0}},e$3={height:{type:`string`,className:`rt-r-h`,customProperties:[`--height`],responsive:!0},minHeight:{type:`string`,className:`rt-r-min-h`,customProperties:[`--min-height`],responsive:!0},maxHeight:{type:`string`,className:`rt-r-max-h`,customProperties:[`--max-height`],responsive:!0}},r$37=[`1`,`2`,`3`,`4`],s$10={...o$8,align:{type:`enum`,className:`rt-r-align`,values:[`start`,`center`],default:`center`},size:{type:`enum`,className:`rt-r-size`,values:r$37,default:`3`,responsive:!0},width:t.width,minWidth:t.minWidth,maxWidth:{...t.maxWidth,default:`600px`},...e$3},o$26=`gray.gold.bronze.brown.yellow.amber.orange.tomato.red.ruby.crimson.pink.plum.purple.violet.iris.indigo.blue.cyan.teal.jade.green.grass.lime.mint.sky`.split(`.`),e$22=[`auto`,`gray`,`mauve`,`slate`,`sage`,`olive`,`sand`],r$4={color:{type:`enum`,values:o$26,default:void 0}},s$7={color:{type:`enum`,values:o$26,default:``}},o$5={highContrast:{type:`boolean`,className:`rt-high-contrast`,default:void 0}},e$30=[`normal`,`start`,`end`,`both`],r$22={trim:{type:`enum`,className:`rt-r-lt`,values:e$30,responsive:!0}},e$29=[`left`,`center`,`right`],t$27={align:{type:`enum`,className:`rt-r-ta`,values:e$29,responsive:!0}},e$28=[`wrap`,`nowrap`,`pretty`,`balance`],r$13={wrap:{type:`enum`,className:`rt-r-tw`,values:e$28,responsive:!0}},e$2={truncate:{type:`boolean`,className:`rt-truncate`}},e$27=[`light`,`regular`,`medium`,`bold`],t$14={weight:{type:`enum`,className:`rt-r-weight`,values:e$27,responsive:!0}},m$14=[`h1`,`h2`,`h3`,`h4`,`h5`,`h6`],a$36=[`1`,`2`,`3`,`4`,`5`,`6`,`7`,`8`,`9`],n$23={as:{type:`enum`,values:m$14,default:`h1`},...o$8,size:{type:`enum`,className:`rt-r-size`,values:a$36,default:`6`,responsive:!0},...t$14,...t$27,...r$22,...e$2,...r$13,...r$4,...o$5},e$25=[`initial`,`xs`,`sm`,`md`,`lg`,`xl`];function e$26(n$24,r$38){return Object.prototype.hasOwnProperty.call(n$24,r$38)}function i$22(e$31){return typeof e$31==`object`&&Object.keys(e$31).some(s$23=>e$25.includes(s$23))}function R$4({className:r$38,customProperties:n$24,...t$28}){let p$36=g({allowArbitraryValues:!0,className:r$38,...t$28}),e$31=m$13({customProperties:n$24,...t$28});return[p$36,e$31]}function g({allowArbitraryValues:r$38,value:n$24,className:t$28,propValues:p$36,parseValue:e$31=s$24=>s$24}){let s$23=[];if(n$24){if(typeof n$24==`string`&&p$36.includes(n$24))return l$11(t$28,n$24,e$31);if(i$22(n$24)){let i$23=n$24;for(let o$28 in i$23){if(!e$26(i$23,o$28)||!e$25.includes(o$28))continue;let u$9=i$23[o$28];if(u$9!==void 0){if(p$36.includes(u$9)){let f$20=l$11(t$28,u$9,e$31),v$10=o$28===`initial`?f$20:`${o$28}:${f$20}`;s$23.push(v$10)}else if(r$38){let f$20=o$28===`initial`?t$28:`${o$28}:${t$28}`;s$23.push(f$20)}}}return s$23.join(` `)}if(r$38)return t$28}}function l$11(r$38,n$24,t$28){let p$36=r$38?`-`:``,e$31=t$28(n$24),s$23=e$31?.startsWith(`-`),i$23=s$23?`-`:``,o$28=s$23?e$31?.substring(1):e$31;return`${i$23}${r$38}${p$36}${o$28}`}function m$13({customProperties:r$38,value:n$24,propValues:t$28,parseValue:p$36=e$32=>e$32}){let e$31={};if(!(!n$24||typeof n$24==`string`&&t$28.includes(n$24))){if(typeof n$24==`string`&&(e$31=Object.fromEntries(r$38.map(s$23=>[s$23,n$24]))),i$22(n$24)){let s$23=n$24;for(let i$23 in s$23){if(!e$26(s$23,i$23)||!e$25.includes(i$23))continue;let o$28=s$23[i$23];if(!t$28.includes(o$28))for(let u$9 of r$38)e$31={[i$23===`initial`?u$9:`${u$9}-${i$23}`]:o$28,...e$31}}}for(let s$23 in e$31){let i$23=e$31[s$23];i$23!==void 0&&(e$31[s$23]=p$36(i$23))}return e$31}}function l$3(...t$28){let e$31={};for(let n$24 of t$28)n$24&&(e$31={...e$31,...n$24});return Object.keys(e$31).length?e$31:void 0}var import_classnames$53=__toESM(require_classnames());function N$6(...r$38){return Object.assign({},...r$38)}function v(r$38,...m$15){let t$28,l$12,a$37={...r$38},f$20=N$6(...m$15);for(let n$24 in f$20){let s$23=a$37[n$24],e$31=f$20[n$24];if(e$31.default!==void 0&&s$23===void 0&&(s$23=e$31.default),e$31.type===`enum`&&![e$31.default,...e$31.values].includes(s$23)&&!i$22(s$23)&&(s$23=e$31.default),a$37[n$24]=s$23,`className`in e$31&&e$31.className){delete a$37[n$24];let u$9=`responsive`in e$31;if(!s$23||i$22(s$23)&&!u$9)continue;if(i$22(s$23)&&(e$31.default!==void 0&&s$23.initial===void 0&&(s$23.initial=e$31.default),e$31.type===`enum`&&([e$31.default,...e$31.values].includes(s$23.initial)||(s$23.initial=e$31.default))),e$31.type===`enum`){let i$23=g({allowArbitraryValues:!1,value:s$23,className:e$31.className,propValues:e$31.values,parseValue:e$31.parseValue});t$28=(0,import_classnames$53.default)(t$28,i$23);continue}if(e$31.type===`string`||e$31.type===`enum | string`){let i$23=e$31.type===`string`?[]:e$31.values,[d$9,y$6]=R$4({className:e$31.className,customProperties:e$31.customProperties,propValues:i$23,parseValue:e$31.parseValue,value:s$23});l$12=l$3(l$12,y$6),t$28=(0,import_classnames$53.default)(t$28,d$9);continue}if(e$31.type===`boolean`&&s$23){t$28=(0,import_classnames$53.default)(t$28,e$31.className);continue}}}return a$37.className=(0,import_classnames$53.default)(t$28,r$38.className),a$37.style=l$3(l$12,r$38.style),a$37}var e$24=[`0`,`1`,`2`,`3`,`4`,`5`,`6`,`7`,`8`,`9`,`-1`,`-2`,`-3`,`-4`,`-5`,`-6`,`-7`,`-8`,`-9`],r$3={m:{type:`enum | string`,values:e$24,responsive:!0,className:`rt-r-m`,customProperties:[`--m`]},mx:{type:`enum | string`,values:e$24,responsive:!0,className:`rt-r-mx`,customProperties:[`--ml`,`--mr`]},my:{type:`enum | string`,values:e$24,responsive:!0,className:`rt-r-my`,customProperties:[`--mt`,`--mb`]},mt:{type:`enum | string`,values:e$24,responsive:!0,className:`rt-r-mt`,customProperties:[`--mt`]},mr:{type:`enum | string`,values:e$24,responsive:!0,className:`rt-r-mr`,customProperties:[`--mr`]},mb:{type:`enum | string`,values:e$24,responsive:!0,className:`rt-r-mb`,customProperties:[`--mb`]},ml:{type:`enum | string`,values:e$24,responsive:!0,className:`rt-r-ml`,customProperties:[`--ml`]}},import_classnames$52=__toESM(require_classnames()),r=import_react.forwardRef((p$36,t$28)=>{let{children:e$31,className:s$23,asChild:a$37,as:n$24=`h1`,color:i$23,...m$15}=v(p$36,n$23,r$3);return import_react.createElement(Slot$4,{"data-accent-color":i$23,...m$15,ref:t$28,className:(0,import_classnames$52.default)(`rt-Heading`,s$23)},a$37?e$31:import_react.createElement(n$24,null,e$31))});r.displayName=`Heading`;var m$12=[`span`,`div`,`label`,`p`],a$35=[`1`,`2`,`3`,`4`,`5`,`6`,`7`,`8`,`9`],n$22={as:{type:`enum`,values:m$12,default:`span`},...o$8,size:{type:`enum`,className:`rt-r-size`,values:a$35,responsive:!0},...t$14,...t$27,...r$22,...e$2,...r$13,...r$4,...o$5},import_classnames$51=__toESM(require_classnames()),p=import_react.forwardRef((t$28,r$38)=>{let{children:e$31,className:s$23,asChild:m$15,as:a$37=`span`,color:n$24,...P$8}=v(t$28,n$22,r$3);return import_react.createElement(Slot$4,{"data-accent-color":n$24,...P$8,ref:r$38,className:(0,import_classnames$51.default)(`rt-Text`,s$23)},m$15?e$31:import_react.createElement(a$37,null,e$31))});p.displayName=`Text`;function a(e$31){switch(e$31){case`tomato`:case`red`:case`ruby`:case`crimson`:case`pink`:case`plum`:case`purple`:case`violet`:return`mauve`;case`iris`:case`indigo`:case`blue`:case`sky`:case`cyan`:return`slate`;case`teal`:case`jade`:case`mint`:case`green`:return`sage`;case`grass`:case`lime`:return`olive`;case`yellow`:case`amber`:case`orange`:case`brown`:case`gold`:case`bronze`:return`sand`;case`gray`:return`gray`}}var e$23=[`none`,`small`,`medium`,`large`,`full`],r$5={radius:{type:`enum`,values:e$23,default:void 0}},p$35=[`inherit`,`light`,`dark`],t$26=[`solid`,`translucent`],n$21=[`90%`,`95%`,`100%`,`105%`,`110%`],s$1={...o$8,hasBackground:{type:`boolean`,default:!0},appearance:{type:`enum`,values:p$35,default:`inherit`},accentColor:{type:`enum`,values:o$26,default:`indigo`},grayColor:{type:`enum`,values:e$22,default:`auto`},panelBackground:{type:`enum`,values:t$26,default:`translucent`},radius:{type:`enum`,values:e$23,default:`medium`},scaling:{type:`enum`,values:n$21,default:`100%`}},import_classnames$50=__toESM(require_classnames()),d$7=()=>{},P$7=import_react.createContext(void 0);function H(){let a$37=import_react.useContext(P$7);if(a$37===void 0)throw Error("`useThemeContext` must be used within a `Theme`");return a$37}var R=import_react.forwardRef((a$37,s$23)=>import_react.useContext(P$7)===void 0?import_react.createElement(Provider,{delayDuration:200},import_react.createElement(Provider$1,{dir:`ltr`},import_react.createElement(I$4,{...a$37,ref:s$23}))):import_react.createElement(A$2,{...a$37,ref:s$23}));R.displayName=`Theme`;var I$4=import_react.forwardRef((a$37,s$23)=>{let{appearance:r$38=s$1.appearance.default,accentColor:c$5=s$1.accentColor.default,grayColor:l$12=s$1.grayColor.default,panelBackground:p$36=s$1.panelBackground.default,radius:n$24=s$1.radius.default,scaling:t$28=s$1.scaling.default,hasBackground:i$23=s$1.hasBackground.default,...u$9}=a$37,[h$3,m$15]=import_react.useState(r$38);import_react.useEffect(()=>m$15(r$38),[r$38]);let[y$6,g$7]=import_react.useState(c$5);import_react.useEffect(()=>g$7(c$5),[c$5]);let[v$10,C$6]=import_react.useState(l$12);import_react.useEffect(()=>C$6(l$12),[l$12]);let[k$2,f$20]=import_react.useState(p$36);import_react.useEffect(()=>f$20(p$36),[p$36]);let[B$4,x$3]=import_react.useState(n$24);import_react.useEffect(()=>x$3(n$24),[n$24]);let[T$5,b$5]=import_react.useState(t$28);return import_react.useEffect(()=>b$5(t$28),[t$28]),import_react.createElement(A$2,{...u$9,ref:s$23,isRoot:!0,hasBackground:i$23,appearance:h$3,accentColor:y$6,grayColor:v$10,panelBackground:k$2,radius:B$4,scaling:T$5,onAppearanceChange:m$15,onAccentColorChange:g$7,onGrayColorChange:C$6,onPanelBackgroundChange:f$20,onRadiusChange:x$3,onScalingChange:b$5})});I$4.displayName=`ThemeRoot`;var A$2=import_react.forwardRef((a$37,s$23)=>{let r$38=import_react.useContext(P$7),{asChild:c$5,isRoot:l$12,hasBackground:p$36,appearance:n$24=r$38?.appearance??s$1.appearance.default,accentColor:t$28=r$38?.accentColor??s$1.accentColor.default,grayColor:i$23=r$38?.resolvedGrayColor??s$1.grayColor.default,panelBackground:u$9=r$38?.panelBackground??s$1.panelBackground.default,radius:h$3=r$38?.radius??s$1.radius.default,scaling:m$15=r$38?.scaling??s$1.scaling.default,onAppearanceChange:y$6=d$7,onAccentColorChange:g$7=d$7,onGrayColorChange:v$10=d$7,onPanelBackgroundChange:C$6=d$7,onRadiusChange:k$2=d$7,onScalingChange:f$20=d$7,...B$4}=a$37,x$3=c$5?Slot$4:`div`,T$5=i$23===`auto`?a(t$28):i$23,b$5=a$37.appearance===`light`||a$37.appearance===`dark`,S$4=p$36===void 0?l$12||b$5:p$36;return import_react.createElement(P$7.Provider,{value:import_react.useMemo(()=>({appearance:n$24,accentColor:t$28,grayColor:i$23,resolvedGrayColor:T$5,panelBackground:u$9,radius:h$3,scaling:m$15,onAppearanceChange:y$6,onAccentColorChange:g$7,onGrayColorChange:v$10,onPanelBackgroundChange:C$6,onRadiusChange:k$2,onScalingChange:f$20}),[n$24,t$28,i$23,T$5,u$9,h$3,m$15,y$6,g$7,v$10,C$6,k$2,f$20])},import_react.createElement(x$3,{"data-is-root-theme":l$12?`true`:`false`,"data-accent-color":t$28,"data-gray-color":T$5,"data-has-background":S$4?`true`:`false`,"data-panel-background":u$9,"data-radius":h$3,"data-scaling":m$15,ref:s$23,...B$4,className:(0,import_classnames$50.default)(`radix-themes`,{light:n$24===`light`,dark:n$24===`dark`},B$4.className)}))});A$2.displayName=`ThemeImpl`;var a$11=t$28=>{if(!import_react.isValidElement(t$28))throw Error(`Expected a single React Element child, but got: ${import_react.Children.toArray(t$28).map(e$31=>typeof e$31==`object`&&`type`in e$31&&typeof e$31.type==`string`?e$31.type:typeof e$31).join(`, `)}`);return t$28},alert_dialog_exports=__export({Action:()=>D$1,Cancel:()=>A$1,Content:()=>p$34,Description:()=>m$11,Root:()=>n$20,Title:()=>g$6,Trigger:()=>s$22}),import_classnames$49=__toESM(require_classnames()),n$20=t$28=>import_react.createElement(Root2$10,{...t$28});n$20.displayName=`AlertDialog.Root`;var s$22=import_react.forwardRef(({children:t$28,...o$28},i$23)=>import_react.createElement(Trigger2,{...o$28,ref:i$23,asChild:!0},a$11(t$28)));s$22.displayName=`AlertDialog.Trigger`;var p$34=import_react.forwardRef(({align:t$28,...o$28},i$23)=>{let{align:P$8,...c$5}=s$10,{className:f$20}=v({align:t$28},{align:P$8}),{className:C$6,forceMount:d$9,container:y$6,...v$10}=v(o$28,c$5);return import_react.createElement(Portal2$2,{container:y$6,forceMount:d$9},import_react.createElement(R,{asChild:!0},import_react.createElement(Overlay2,{className:`rt-BaseDialogOverlay rt-AlertDialogOverlay`},import_react.createElement(`div`,{className:`rt-BaseDialogScroll rt-AlertDialogScroll`},import_react.createElement(`div`,{className:`rt-BaseDialogScrollPadding rt-AlertDialogScrollPadding ${f$20}`},import_react.createElement(Content2$7,{...v$10,ref:i$23,className:(0,import_classnames$49.default)(`rt-BaseDialogContent`,`rt-AlertDialogContent`,C$6)}))))))});p$34.displayName=`AlertDialog.Content`;var g$6=import_react.forwardRef((t$28,o$28)=>import_react.createElement(Title2,{asChild:!0},import_react.createElement(r,{size:`5`,mb:`3`,trim:`start`,...t$28,asChild:!1,ref:o$28})));g$6.displayName=`AlertDialog.Title`;var m$11=import_react.forwardRef((t$28,o$28)=>import_react.createElement(Description2,{asChild:!0},import_react.createElement(p,{as:`p`,size:`3`,...t$28,asChild:!1,ref:o$28})));m$11.displayName=`AlertDialog.Description`;var D$1=import_react.forwardRef(({children:t$28,...o$28},i$23)=>import_react.createElement(Action,{...o$28,ref:i$23,asChild:!0},a$11(t$28)));D$1.displayName=`AlertDialog.Action`;var A$1=import_react.forwardRef(({children:t$28,...o$28},i$23)=>import_react.createElement(Cancel,{...o$28,ref:i$23,asChild:!0},a$11(t$28)));A$1.displayName=`AlertDialog.Cancel`;var i$21=Root$7,s$21=[`1`,`2`,`3`,`4`,`5`,`6`,`7`,`8`,`9`],a$34=[`solid`,`soft`],p$33={...o$8,size:{type:`enum`,className:`rt-r-size`,values:s$21,default:`3`,responsive:!0},variant:{type:`enum`,className:`rt-variant`,values:a$34,default:`soft`},...s$7,...o$5,...r$5,fallback:{type:`ReactNode`,required:!0}};function d$2(i$23,e$31){let{asChild:r$38,children:c$5}=i$23;if(!r$38)return typeof e$31==`function`?e$31(c$5):e$31;let t$28=import_react.Children.only(c$5);return import_react.cloneElement(t$28,{children:typeof e$31==`function`?e$31(t$28.props.children):e$31})}var import_classnames$48=__toESM(require_classnames()),i$20=import_react.forwardRef((t$28,e$31)=>{let{asChild:o$28,children:a$37,className:s$23,style:p$36,color:v$10,radius:f$20,...d$9}=v(t$28,p$33,r$3);return import_react.createElement(Root$6,{"data-accent-color":v$10,"data-radius":f$20,className:(0,import_classnames$48.default)(`rt-reset`,`rt-AvatarRoot`,s$23),style:p$36,asChild:o$28},d$2({asChild:o$28,children:a$37},import_react.createElement(n$19,{ref:e$31,...d$9})))});i$20.displayName=`Avatar`;var n$19=import_react.forwardRef(({fallback:t$28,...e$31},o$28)=>{let[a$37,s$23]=import_react.useState(`idle`);return import_react.createElement(import_react.Fragment,null,a$37===`idle`||a$37===`loading`?import_react.createElement(`span`,{className:`rt-AvatarFallback`}):null,a$37===`error`?import_react.createElement(Fallback,{className:(0,import_classnames$48.default)(`rt-AvatarFallback`,{"rt-one-letter":typeof t$28==`string`&&t$28.length===1,"rt-two-letters":typeof t$28==`string`&&t$28.length===2}),delayMs:0},t$28):null,import_react.createElement(Image,{ref:o$28,className:`rt-AvatarImage`,...e$31,onLoadingStatusChange:p$36=>{e$31.onLoadingStatusChange?.(p$36),s$23(p$36)}}))});n$19.displayName=`AvatarImpl`;var t$25=[`1`,`2`,`3`],a$33=[`solid`,`soft`,`surface`,`outline`],p$32={...o$8,size:{type:`enum`,className:`rt-r-size`,values:t$25,default:`1`,responsive:!0},variant:{type:`enum`,className:`rt-variant`,values:a$33,default:`soft`},...s$7,...o$5,...r$5},import_classnames$47=__toESM(require_classnames()),e$21=import_react.forwardRef((r$38,p$36)=>{let{asChild:t$28,className:s$23,color:a$37,radius:m$15,...n$24}=v(r$38,p$32,r$3),d$9=t$28?Slot$4:`span`;return import_react.createElement(d$9,{"data-accent-color":a$37,"data-radius":m$15,...n$24,ref:p$36,className:(0,import_classnames$47.default)(`rt-reset`,`rt-Badge`,s$23)})});e$21.displayName=`Badge`;var import_classnames$46=__toESM(require_classnames()),e$20=import_react.forwardRef((t$28,p$36)=>{let{asChild:r$38,children:s$23,className:m$15,...l$12}=t$28,c$5=r$38?Slot$4:`blockquote`;return import_react.createElement(p,{asChild:!0,...l$12,ref:p$36,className:(0,import_classnames$46.default)(`rt-Blockquote`,m$15)},import_react.createElement(c$5,null,s$23))});e$20.displayName=`Blockquote`;var l$9=Slot$4,e$13=Slot$4,r$36=Slottable$2,s$20=[`div`,`span`],o$25=[`none`,`inline`,`inline-block`,`block`,`contents`],p$30={as:{type:`enum`,values:s$20,default:`div`},...o$8,display:{type:`enum`,className:`rt-r-display`,values:o$25,responsive:!0}},e$19=[`0`,`1`,`2`,`3`,`4`,`5`,`6`,`7`,`8`,`9`],p$3={p:{type:`enum | string`,className:`rt-r-p`,customProperties:[`--p`],values:e$19,responsive:!0},px:{type:`enum | string`,className:`rt-r-px`,customProperties:[`--pl`,`--pr`],values:e$19,responsive:!0},py:{type:`enum | string`,className:`rt-r-py`,customProperties:[`--pt`,`--pb`],values:e$19,responsive:!0},pt:{type:`enum | string`,className:`rt-r-pt`,customProperties:[`--pt`],values:e$19,responsive:!0},pr:{type:`enum | string`,className:`rt-r-pr`,customProperties:[`--pr`],values:e$19,responsive:!0},pb:{type:`enum | string`,className:`rt-r-pb`,customProperties:[`--pb`],values:e$19,responsive:!0},pl:{type:`enum | string`,className:`rt-r-pl`,customProperties:[`--pl`],values:e$19,responsive:!0}},r$35=[`visible`,`hidden`,`clip`,`scroll`,`auto`],i$19=[`static`,`relative`,`absolute`,`fixed`,`sticky`],e$18=[`0`,`1`,`2`,`3`,`4`,`5`,`6`,`7`,`8`,`9`,`-1`,`-2`,`-3`,`-4`,`-5`,`-6`,`-7`,`-8`,`-9`],p$31=[`0`,`1`],n$17=[`0`,`1`],u$4={...p$3,...t,...e$3,position:{type:`enum`,className:`rt-r-position`,values:i$19,responsive:!0},inset:{type:`enum | string`,className:`rt-r-inset`,customProperties:[`--inset`],values:e$18,responsive:!0},top:{type:`enum | string`,className:`rt-r-top`,customProperties:[`--top`],values:e$18,responsive:!0},right:{type:`enum | string`,className:`rt-r-right`,customProperties:[`--right`],values:e$18,responsive:!0},bottom:{type:`enum | string`,className:`rt-r-bottom`,customProperties:[`--bottom`],values:e$18,responsive:!0},left:{type:`enum | string`,className:`rt-r-left`,customProperties:[`--left`],values:e$18,responsive:!0},overflow:{type:`enum`,className:`rt-r-overflow`,values:r$35,responsive:!0},overflowX:{type:`enum`,className:`rt-r-ox`,values:r$35,responsive:!0},overflowY:{type:`enum`,className:`rt-r-oy`,values:r$35,responsive:!0},flexBasis:{type:`string`,className:`rt-r-fb`,customProperties:[`--flex-basis`],responsive:!0},flexShrink:{type:`enum | string`,className:`rt-r-fs`,customProperties:[`--flex-shrink`],values:p$31,responsive:!0},flexGrow:{type:`enum | string`,className:`rt-r-fg`,customProperties:[`--flex-grow`],values:n$17,responsive:!0},gridArea:{type:`string`,className:`rt-r-ga`,customProperties:[`--grid-area`],responsive:!0},gridColumn:{type:`string`,className:`rt-r-gc`,customProperties:[`--grid-column`],responsive:!0},gridColumnStart:{type:`string`,className:`rt-r-gcs`,customProperties:[`--grid-column-start`],responsive:!0},gridColumnEnd:{type:`string`,className:`rt-r-gce`,customProperties:[`--grid-column-end`],responsive:!0},gridRow:{type:`string`,className:`rt-r-gr`,customProperties:[`--grid-row`],responsive:!0},gridRowStart:{type:`string`,className:`rt-r-grs`,customProperties:[`--grid-row-start`],responsive:!0},gridRowEnd:{type:`string`,className:`rt-r-gre`,customProperties:[`--grid-row-end`],responsive:!0}},import_classnames$45=__toESM(require_classnames()),p$1=import_react.forwardRef((r$38,s$23)=>{let{className:t$28,asChild:e$31,as:m$15=`div`,...a$37}=v(r$38,p$30,u$4,r$3);return import_react.createElement(e$31?e$13:m$15,{...a$37,ref:s$23,className:(0,import_classnames$45.default)(`rt-Box`,t$28)})});p$1.displayName=`Box`;var t$24=[`1`,`2`,`3`,`4`],a$32=[`classic`,`solid`,`soft`,`surface`,`outline`,`ghost`],i$18={...o$8,size:{type:`enum`,className:`rt-r-size`,values:t$24,default:`2`,responsive:!0},variant:{type:`enum`,className:`rt-variant`,values:a$32,default:`solid`},...s$7,...o$5,...r$5,loading:{type:`boolean`,className:`rt-loading`,default:!1}},e$17=[`0`,`1`,`2`,`3`,`4`,`5`,`6`,`7`,`8`,`9`],p$26={gap:{type:`enum | string`,className:`rt-r-gap`,customProperties:[`--gap`],values:e$17,responsive:!0},gapX:{type:`enum | string`,className:`rt-r-cg`,customProperties:[`--column-gap`],values:e$17,responsive:!0},gapY:{type:`enum | string`,className:`rt-r-rg`,customProperties:[`--row-gap`],values:e$17,responsive:!0}},t$23=[`div`,`span`],p$29=[`none`,`inline-flex`,`flex`],a$31=[`row`,`column`,`row-reverse`,`column-reverse`],o$24=[`start`,`center`,`end`,`baseline`,`stretch`],n$15=[`start`,`center`,`end`,`between`],l$8=[`nowrap`,`wrap`,`wrap-reverse`],u$1={as:{type:`enum`,values:t$23,default:`div`},...o$8,display:{type:`enum`,className:`rt-r-display`,values:p$29,responsive:!0},direction:{type:`enum`,className:`rt-r-fd`,values:a$31,responsive:!0},align:{type:`enum`,className:`rt-r-ai`,values:o$24,responsive:!0},justify:{type:`enum`,className:`rt-r-jc`,values:n$15,parseValue:f$18,responsive:!0},wrap:{type:`enum`,className:`rt-r-fw`,values:l$8,responsive:!0},...p$26};function f$18(e$31){return e$31===`between`?`space-between`:e$31}var import_classnames$44=__toESM(require_classnames()),p$2=import_react.forwardRef((r$38,e$31)=>{let{className:s$23,asChild:t$28,as:m$15=`div`,...l$12}=v(r$38,u$1,u$4,r$3);return import_react.createElement(t$28?e$13:m$15,{...l$12,ref:e$31,className:(0,import_classnames$44.default)(`rt-Flex`,s$23)})});p$2.displayName=`Flex`;var e$16=[`1`,`2`,`3`],s$19={size:{type:`enum`,className:`rt-r-size`,values:e$16,default:`2`,responsive:!0},loading:{type:`boolean`,default:!0}},import_classnames$43=__toESM(require_classnames()),s$18=import_react.forwardRef((i$23,o$28)=>{let{className:a$37,children:e$31,loading:t$28,...m$15}=v(i$23,s$19,r$3);if(!t$28)return e$31;let r$38=import_react.createElement(`span`,{...m$15,ref:o$28,className:(0,import_classnames$43.default)(`rt-Spinner`,a$37)},import_react.createElement(`span`,{className:`rt-SpinnerLeaf`}),import_react.createElement(`span`,{className:`rt-SpinnerLeaf`}),import_react.createElement(`span`,{className:`rt-SpinnerLeaf`}),import_react.createElement(`span`,{className:`rt-SpinnerLeaf`}),import_react.createElement(`span`,{className:`rt-SpinnerLeaf`}),import_react.createElement(`span`,{className:`rt-SpinnerLeaf`}),import_react.createElement(`span`,{className:`rt-SpinnerLeaf`}),import_react.createElement(`span`,{className:`rt-SpinnerLeaf`}));return e$31===void 0?r$38:import_react.createElement(p$2,{asChild:!0,position:`relative`,align:`center`,justify:`center`},import_react.createElement(`span`,null,import_react.createElement(`span`,{"aria-hidden":!0,style:{display:`contents`,visibility:`hidden`},inert:void 0},e$31),import_react.createElement(p$2,{asChild:!0,align:`center`,justify:`center`,position:`absolute`,inset:`0`},import_react.createElement(`span`,null,r$38))))});s$18.displayName=`Spinner`;var d$6=Root$10,e$15=Root$10;function s$16(e$31,t$28){if(e$31!==void 0)return typeof e$31==`string`?t$28(e$31):Object.fromEntries(Object.entries(e$31).map(([n$24,o$28])=>[n$24,t$28(o$28)]))}function p$28(e$31){return e$31===`3`?`3`:`2`}function r$34(e$31){switch(e$31){case`1`:return`1`;case`2`:case`3`:return`2`;case`4`:return`3`}}var import_classnames$42=__toESM(require_classnames()),n$7=import_react.forwardRef((t$28,p$36)=>{let{size:i$23=i$18.size.default}=t$28,{className:a$37,children:e$31,asChild:m$15,color:d$9,radius:l$12,disabled:s$23=t$28.loading,...u$9}=v(t$28,i$18,r$3),f$20=m$15?Slot$4:`button`;return import_react.createElement(f$20,{"data-disabled":s$23||void 0,"data-accent-color":d$9,"data-radius":l$12,...u$9,ref:p$36,className:(0,import_classnames$42.default)(`rt-reset`,`rt-BaseButton`,a$37),disabled:s$23},t$28.loading?import_react.createElement(import_react.Fragment,null,import_react.createElement(`span`,{style:{display:`contents`,visibility:`hidden`},"aria-hidden":!0},e$31),import_react.createElement(d$6,null,e$31),import_react.createElement(p$2,{asChild:!0,align:`center`,justify:`center`,position:`absolute`,inset:`0`},import_react.createElement(`span`,null,import_react.createElement(s$18,{size:s$16(i$23,r$34)})))):e$31)});n$7.displayName=`BaseButton`;var import_classnames$41=__toESM(require_classnames()),o=import_react.forwardRef(({className:e$31,...n$24},r$38)=>import_react.createElement(n$7,{...n$24,ref:r$38,className:(0,import_classnames$41.default)(`rt-Button`,e$31)}));o.displayName=`Button`;var t$22=[`1`,`2`,`3`],r$33=[`soft`,`surface`,`outline`],a$28={...o$8,size:{type:`enum`,className:`rt-r-size`,values:t$22,default:`2`,responsive:!0},variant:{type:`enum`,className:`rt-variant`,values:r$33,default:`soft`},...s$7,...o$5},callout_exports=__export({Icon:()=>m$10,Root:()=>n$14,Text:()=>u$8}),import_classnames$40=__toESM(require_classnames()),a$29=import_react.createContext({}),n$14=import_react.forwardRef((t$28,l$12)=>{let{size:e$31=a$28.size.default}=t$28,{asChild:r$38,children:C$6,className:i$23,color:c$5,...f$20}=v(t$28,a$28,r$3),P$8=r$38?Slot$4:`div`;return import_react.createElement(P$8,{"data-accent-color":c$5,...f$20,className:(0,import_classnames$40.default)(`rt-CalloutRoot`,i$23),ref:l$12},import_react.createElement(a$29.Provider,{value:import_react.useMemo(()=>({size:e$31}),[e$31])},C$6))});n$14.displayName=`Callout.Root`;var m$10=import_react.forwardRef(({className:t$28,...l$12},e$31)=>import_react.createElement(`div`,{...l$12,className:(0,import_classnames$40.default)(`rt-CalloutIcon`,t$28),ref:e$31}));m$10.displayName=`Callout.Icon`;var u$8=import_react.forwardRef(({className:t$28,...l$12},e$31)=>{let{size:r$38}=import_react.useContext(a$29);return import_react.createElement(p,{as:`p`,size:s$16(r$38,p$28),...l$12,asChild:!1,ref:e$31,className:(0,import_classnames$40.default)(`rt-CalloutText`,t$28)})});u$8.displayName=`Callout.Text`;var e$14=[`1`,`2`,`3`,`4`,`5`],r$32=[`surface`,`classic`,`ghost`],a$27={...o$8,size:{type:`enum`,className:`rt-r-size`,values:e$14,default:`1`,responsive:!0},variant:{type:`enum`,className:`rt-variant`,values:r$32,default:`surface`}},import_classnames$39=__toESM(require_classnames()),o$23=import_react.forwardRef((p$36,e$31)=>{let{asChild:t$28,className:s$23,...a$37}=v(p$36,a$27,r$3),m$15=t$28?Slot$4:`div`;return import_react.createElement(m$15,{ref:e$31,...a$37,className:(0,import_classnames$39.default)(`rt-reset`,`rt-BaseCard`,`rt-Card`,s$23)})});o$23.displayName=`Card`;var Primitive=Primitive$1;Primitive.dispatchDiscreteCustomEvent=dispatchDiscreteCustomEvent,Primitive.Root=Primitive$1;var{useDirection:A}=dist_exports$19,P$6=`CheckboxGroup`,[M,O]=createContextScope(P$6,[createRovingFocusGroupScope,createCheckboxScope]),I$3=createRovingFocusGroupScope(),g$5=createCheckboxScope(),[w$1,T$3]=M(P$6),v$9=import_react.forwardRef((r$38,n$24)=>{let{__scopeCheckboxGroup:o$28,name:i$23,defaultValue:c$5,value:t$28,required:p$36=!1,disabled:s$23=!1,orientation:h$3,dir:l$12,loop:b$5=!0,onValueChange:u$9,...k$2}=r$38,S$4=I$3(o$28),R$5=A(l$12),[E$4=[],a$37]=useControllableState({prop:t$28,defaultProp:c$5,onChange:u$9}),F=import_react.useCallback(x$3=>a$37((m$15=[])=>[...m$15,x$3]),[a$37]),_=import_react.useCallback(x$3=>a$37((m$15=[])=>m$15.filter(V=>V!==x$3)),[a$37]);return import_react.createElement(w$1,{scope:o$28,name:i$23,required:p$36,disabled:s$23,value:E$4,onItemCheck:F,onItemUncheck:_},import_react.createElement(Root$4,{asChild:!0,...S$4,orientation:h$3,dir:R$5,loop:b$5},import_react.createElement(Primitive.div,{role:`group`,"data-disabled":s$23?``:void 0,dir:R$5,...k$2,ref:n$24})))});v$9.displayName=P$6;var y$5=`CheckboxGroupItem`,f$16=import_react.forwardRef((r$38,n$24)=>{let{__scopeCheckboxGroup:o$28,disabled:i$23,...c$5}=r$38,t$28=T$3(y$5,o$28),p$36=t$28.disabled||i$23,s$23=I$3(o$28),h$3=g$5(o$28),l$12=import_react.useRef(null),b$5=useComposedRefs(n$24,l$12),u$9=t$28.value?.includes(c$5.value);return import_react.createElement(Item$2,{asChild:!0,...s$23,focusable:!p$36,active:u$9},import_react.createElement(Checkbox,{name:t$28.name,disabled:p$36,required:t$28.required,checked:u$9,...h$3,...c$5,ref:b$5,onCheckedChange:k$2=>{k$2?t$28.onItemCheck(r$38.value):t$28.onItemUncheck(r$38.value)}}))});f$16.displayName=y$5;var B$2=`CheckboxGroupIndicator`,G$4=import_react.forwardRef((r$38,n$24)=>{let{__scopeCheckboxGroup:o$28,...i$23}=r$38,c$5=g$5(o$28);return import_react.createElement(CheckboxIndicator,{...c$5,...i$23,ref:n$24})});G$4.displayName=B$2;var H$1=v$9,K=f$16,X=G$4,a$26=[`div`,`span`],n$13=[`none`,`inline-grid`,`grid`],p$27=[`1`,`2`,`3`,`4`,`5`,`6`,`7`,`8`,`9`],u$7=[`1`,`2`,`3`,`4`,`5`,`6`,`7`,`8`,`9`],i$17=[`row`,`column`,`dense`,`row-dense`,`column-dense`],l$7=[`start`,`center`,`end`,`baseline`,`stretch`],f$15=[`start`,`center`,`end`,`between`],s$4={as:{type:`enum`,values:a$26,default:`div`},...o$8,display:{type:`enum`,className:`rt-r-display`,values:n$13,responsive:!0},areas:{type:`string`,className:`rt-r-gta`,customProperties:[`--grid-template-areas`],responsive:!0},columns:{type:`enum | string`,className:`rt-r-gtc`,customProperties:[`--grid-template-columns`],values:p$27,parseValue:r$31,responsive:!0},rows:{type:`enum | string`,className:`rt-r-gtr`,customProperties:[`--grid-template-rows`],values:u$7,parseValue:r$31,responsive:!0},flow:{type:`enum`,className:`rt-r-gaf`,values:i$17,responsive:!0},align:{type:`enum`,className:`rt-r-ai`,values:l$7,responsive:!0},justify:{type:`enum`,className:`rt-r-jc`,values:f$15,parseValue:m$9,responsive:!0},...p$26};function r$31(e$31){return s$4.columns.values.includes(e$31)?e$31:e$31?.match(/^\d+$/)?`repeat(${e$31}, minmax(0, 1fr))`:e$31}function m$9(e$31){return e$31===`between`?`space-between`:e$31}var a$25=[`1`,`2`,`3`],t$21=[`surface`,`classic`],p$25={...o$8,size:{type:`enum`,className:`rt-r-size`,values:a$25,default:`2`,responsive:!0},variant:{type:`enum`,className:`rt-variant`,values:t$21,default:`surface`},...r$4,...o$5,columns:{...s$4.columns,default:`repeat(auto-fit, minmax(200px, 1fr))`},gap:{...s$4.gap,default:`4`}},r$30=[`1`,`2`,`3`],o$22=[`classic`,`surface`,`soft`],t$20={size:{type:`enum`,className:`rt-r-size`,values:r$30,default:`2`,responsive:!0},variant:{type:`enum`,className:`rt-variant`,values:o$22,default:`surface`},...r$4,...o$5},import_classnames$38=__toESM(require_classnames()),o$1=import_react.forwardRef((p$36,s$23)=>{let{className:t$28,asChild:e$31,as:i$23=`div`,...m$15}=v(p$36,s$4,u$4,r$3);return import_react.createElement(e$31?e$13:i$23,{...m$15,ref:s$23,className:(0,import_classnames$38.default)(`rt-Grid`,t$28)})});o$1.displayName=`Grid`;var r$29=import_react.forwardRef((e$31,n$24)=>import_react.createElement(`svg`,{width:`9`,height:`9`,viewBox:`0 0 9 9`,fill:`currentcolor`,xmlns:`http://www.w3.org/2000/svg`,...e$31,ref:n$24},import_react.createElement(`path`,{fillRule:`evenodd`,clipRule:`evenodd`,d:`M0.75 4.5C0.75 4.08579 1.08579 3.75 1.5 3.75H7.5C7.91421 3.75 8.25 4.08579 8.25 4.5C8.25 4.91421 7.91421 5.25 7.5 5.25H1.5C1.08579 5.25 0.75 4.91421 0.75 4.5Z`})));r$29.displayName=`ThickDividerHorizontalIcon`;var t$8=import_react.forwardRef((e$31,n$24)=>import_react.createElement(`svg`,{width:`9`,height:`9`,viewBox:`0 0 9 9`,fill:`currentcolor`,xmlns:`http://www.w3.org/2000/svg`,...e$31,ref:n$24},import_react.createElement(`path`,{fillRule:`evenodd`,clipRule:`evenodd`,d:`M8.53547 0.62293C8.88226 0.849446 8.97976 1.3142 8.75325 1.66099L4.5083 8.1599C4.38833 8.34356 4.19397 8.4655 3.9764 8.49358C3.75883 8.52167 3.53987 8.45309 3.3772 8.30591L0.616113 5.80777C0.308959 5.52987 0.285246 5.05559 0.563148 4.74844C0.84105 4.44128 1.31533 4.41757 1.62249 4.69547L3.73256 6.60459L7.49741 0.840706C7.72393 0.493916 8.18868 0.396414 8.53547 0.62293Z`})));t$8.displayName=`ThickCheckIcon`;var i$5=import_react.forwardRef((e$31,n$24)=>import_react.createElement(`svg`,{width:`9`,height:`9`,viewBox:`0 0 9 9`,fill:`currentcolor`,xmlns:`http://www.w3.org/2000/svg`,...e$31,ref:n$24},import_react.createElement(`path`,{d:`M0.135232 3.15803C0.324102 2.95657 0.640521 2.94637 0.841971 3.13523L4.5 6.56464L8.158 3.13523C8.3595 2.94637 8.6759 2.95657 8.8648 3.15803C9.0536 3.35949 9.0434 3.67591 8.842 3.86477L4.84197 7.6148C4.64964 7.7951 4.35036 7.7951 4.15803 7.6148L0.158031 3.86477C-0.0434285 3.67591 -0.0536285 3.35949 0.135232 3.15803Z`})));i$5.displayName=`ChevronDownIcon`;var l$4=import_react.forwardRef((e$31,n$24)=>import_react.createElement(`svg`,{width:`9`,height:`9`,viewBox:`0 0 9 9`,fill:`currentcolor`,xmlns:`http://www.w3.org/2000/svg`,...e$31,ref:n$24},import_react.createElement(`path`,{fillRule:`evenodd`,clipRule:`evenodd`,d:`M3.23826 0.201711C3.54108 -0.0809141 4.01567 -0.0645489 4.29829 0.238264L7.79829 3.98826C8.06724 4.27642 8.06724 4.72359 7.79829 5.01174L4.29829 8.76174C4.01567 9.06455 3.54108 9.08092 3.23826 8.79829C2.93545 8.51567 2.91909 8.04108 3.20171 7.73826L6.22409 4.5L3.20171 1.26174C2.91909 0.958928 2.93545 0.484337 3.23826 0.201711Z`})));l$4.displayName=`ThickChevronRightIcon`;var checkbox_cards_exports=__export({Item:()=>k$1,Root:()=>b$4}),import_classnames$37=__toESM(require_classnames()),x$1=`CheckboxCards`,[G$3]=createContextScope(x$1,[O]),d$4=O(),[v$8,N$5]=G$3(x$1),b$4=import_react.forwardRef((e$31,s$23)=>{let{__scopeCheckboxCards:r$38,className:c$5,color:p$36,...C$6}=v(e$31,p$25,r$3),t$28=d$4(r$38);return import_react.createElement(v$8,{scope:r$38,size:e$31.size,highContrast:e$31.highContrast},import_react.createElement(o$1,{asChild:!0},import_react.createElement(H$1,{...t$28,"data-accent-color":p$36,...C$6,ref:s$23,className:(0,import_classnames$37.default)(`rt-CheckboxCardsRoot`,c$5)})))});b$4.displayName=`CheckboxCards.Root`;var k$1=import_react.forwardRef(({__scopeCheckboxCards:e$31,children:s$23,className:r$38,style:c$5,...p$36},C$6)=>{let t$28=N$5(`CheckboxCardsItem`,e$31),i$23=d$4(e$31),{className:P$8}=v({size:t$28?.size,variant:`surface`,highContrast:t$28?.highContrast},t$20);return import_react.createElement(`label`,{className:(0,import_classnames$37.default)(`rt-BaseCard`,`rt-CheckboxCardsItem`,r$38),style:c$5},s$23,import_react.createElement(K,{...i$23,...p$36,ref:C$6,className:(0,import_classnames$37.default)(`rt-reset`,`rt-BaseCheckboxRoot`,`rt-CheckboxCardCheckbox`,P$8)},import_react.createElement(X,{...i$23,asChild:!0,className:`rt-BaseCheckboxIndicator`},import_react.createElement(t$8,null))))});k$1.displayName=`CheckboxCards.Item`;var e$12={...o$8,...t$20},checkbox_group_exports=__export({Item:()=>l$6,Root:()=>f$14}),import_classnames$36=__toESM(require_classnames()),b$3=`CheckboxGroup`,[N$4]=createContextScope(b$3,[O]),G$2=O(),[E$2,P$5]=N$4(b$3),f$14=import_react.forwardRef(({color:s$23=e$12.color.default,highContrast:e$31=e$12.highContrast.default,size:r$38=e$12.size.default,variant:t$28=e$12.variant.default,...p$36},m$15)=>{let{__scopeCheckboxGroup:c$5,className:h$3,...I$5}=v(p$36,r$3),d$9=G$2(c$5);return import_react.createElement(E$2,{scope:c$5,color:s$23,size:r$38,highContrast:e$31,variant:t$28},import_react.createElement(H$1,{...d$9,...I$5,ref:m$15,className:(0,import_classnames$36.default)(`rt-CheckboxGroupRoot`,h$3)}))});f$14.displayName=`CheckboxGroup.Root`;var l$6=import_react.forwardRef((s$23,e$31)=>{let{__scopeCheckboxGroup:r$38,children:t$28,className:p$36,style:m$15,...c$5}=s$23,{size:h$3}=P$5(`CheckboxGroupItem`,r$38);return t$28?import_react.createElement(p,{as:`label`,size:h$3,className:(0,import_classnames$36.default)(`rt-CheckboxGroupItem`,p$36),style:m$15},import_react.createElement(i$16,{__scopeCheckboxGroup:r$38,...c$5,ref:e$31}),t$28&&import_react.createElement(`span`,{className:`rt-CheckboxGroupItemInner`},t$28)):import_react.createElement(i$16,{__scopeCheckboxGroup:r$38,...c$5,ref:e$31,className:p$36,style:m$15})});l$6.displayName=`CheckboxGroup.Item`;var i$16=import_react.forwardRef(({__scopeCheckboxGroup:s$23,...e$31},r$38)=>{let t$28=P$5(`CheckboxGroupItemCheckbox`,s$23),p$36=G$2(s$23),{color:m$15,className:c$5}=v({...e$31,...t$28},e$12,r$3);return import_react.createElement(K,{...p$36,"data-accent-color":m$15,...e$31,ref:r$38,className:(0,import_classnames$36.default)(`rt-reset`,`rt-BaseCheckboxRoot`,`rt-CheckboxGroupItemCheckbox`,c$5)},import_react.createElement(X,{...p$36,asChild:!0,className:`rt-BaseCheckboxIndicator`},import_react.createElement(t$8,null)))});i$16.displayName=`CheckboxGroup.ItemCheckbox`;var import_classnames$35=__toESM(require_classnames()),c$3=import_react.forwardRef((p$36,i$23)=>{let{className:s$23,color:h$3,checked:a$37,defaultChecked:o$28,onCheckedChange:m$15,...n$24}=v(p$36,t$20,r$3),[r$38,k$2]=useControllableState({prop:a$37,defaultProp:o$28,onChange:m$15});return import_react.createElement(Checkbox,{"data-accent-color":h$3,...n$24,defaultChecked:o$28,checked:r$38,onCheckedChange:k$2,asChild:!1,ref:i$23,className:(0,import_classnames$35.default)(`rt-reset`,`rt-BaseCheckboxRoot`,`rt-CheckboxRoot`,s$23)},import_react.createElement(CheckboxIndicator,{asChild:!0,className:`rt-BaseCheckboxIndicator rt-CheckboxIndicator`},import_react.createElement(r$38===`indeterminate`?r$29:t$8,null)))});c$3.displayName=`Checkbox`;var a$22=[`1`,`2`,`3`,`4`,`5`,`6`,`7`,`8`,`9`],i$15=[`solid`,`soft`,`outline`,`ghost`],f$13={...o$8,size:{type:`enum`,className:`rt-r-size`,values:a$22,responsive:!0},variant:{type:`enum`,className:`rt-variant`,values:i$15,default:`soft`},...t$14,...s$7,...o$5,...e$2,...r$13},import_classnames$34=__toESM(require_classnames()),p$24=import_react.forwardRef((o$28,t$28)=>{let{asChild:s$23,className:m$15,color:e$31,...d$9}=v(o$28,f$13,r$3),n$24=o$28.variant===`ghost`?e$31||void 0:e$31,a$37=s$23?Slot$4:`code`;return import_react.createElement(a$37,{"data-accent-color":n$24,...d$9,ref:t$28,className:(0,import_classnames$34.default)(`rt-reset`,`rt-Code`,m$15)})});p$24.displayName=`Code`;var r$28=[`1`,`2`,`3`,`4`],t$19=[`none`,`initial`],p$23=[`left`,`center`,`right`],n$12={...o$8,size:{type:`enum`,className:`rt-r-size`,values:r$28,default:`4`,responsive:!0},display:{type:`enum`,className:`rt-r-display`,values:t$19,parseValue:a$21,responsive:!0},align:{type:`enum`,className:`rt-r-ai`,values:p$23,parseValue:i$14,responsive:!0}};function a$21(e$31){return e$31===`initial`?`flex`:e$31}function i$14(e$31){return e$31===`left`?`start`:e$31===`right`?`end`:e$31}var import_classnames$33=__toESM(require_classnames()),p$22=import_react.forwardRef(({width:n$24,minWidth:s$23,maxWidth:i$23,height:m$15,minHeight:a$37,maxHeight:f$20,...P$8},l$12)=>{let{asChild:r$38,children:C$6,className:c$5,...y$6}=v(P$8,n$12,u$4,r$3),{className:d$9,style:h$3}=v({width:n$24,minWidth:s$23,maxWidth:i$23,height:m$15,minHeight:a$37,maxHeight:f$20},t,e$3),u$9=r$38?Slot$4:`div`;return import_react.createElement(u$9,{...y$6,ref:l$12,className:(0,import_classnames$33.default)(`rt-Container`,c$5)},d$2({asChild:r$38,children:C$6},v$10=>import_react.createElement(`div`,{className:(0,import_classnames$33.default)(`rt-ContainerInner`,d$9),style:h$3},v$10)))});p$22.displayName=`Container`;var r$27=[`1`,`2`,`3`],o$20=[`vertical`,`horizontal`,`both`],t$17={...o$8,size:{type:`enum`,className:`rt-r-size`,values:r$27,default:`1`,responsive:!0},...r$5,scrollbars:{type:`enum`,values:o$20,default:`both`}};function a$20(r$38){let{m:t$28,mx:m$15,my:o$28,mt:p$36,mr:n$24,mb:s$23,ml:e$31,...i$23}=r$38;return{m:t$28,mx:m$15,my:o$28,mt:p$36,mr:n$24,mb:s$23,ml:e$31,rest:i$23}}var import_classnames$32=__toESM(require_classnames()),r$26=r$3.m.values;function S$3(s$23){let[e$31,t$28]=R$4({className:`rt-r-m`,customProperties:[`--margin`],propValues:r$26,value:s$23.m}),[a$37,o$28]=R$4({className:`rt-r-mx`,customProperties:[`--margin-left`,`--margin-right`],propValues:r$26,value:s$23.mx}),[l$12,i$23]=R$4({className:`rt-r-my`,customProperties:[`--margin-top`,`--margin-bottom`],propValues:r$26,value:s$23.my}),[p$36,u$9]=R$4({className:`rt-r-mt`,customProperties:[`--margin-top`],propValues:r$26,value:s$23.mt}),[n$24,c$5]=R$4({className:`rt-r-mr`,customProperties:[`--margin-right`],propValues:r$26,value:s$23.mr}),[g$7,P$8]=R$4({className:`rt-r-mb`,customProperties:[`--margin-bottom`],propValues:r$26,value:s$23.mb}),[N$7,C$6]=R$4({className:`rt-r-ml`,customProperties:[`--margin-left`],propValues:r$26,value:s$23.ml});return[(0,import_classnames$32.default)(e$31,a$37,l$12,p$36,n$24,g$7,N$7),l$3(t$28,o$28,i$23,u$9,c$5,P$8,C$6)]}var import_classnames$31=__toESM(require_classnames()),c=import_react.forwardRef((n$24,S$4)=>{let{rest:f$20,...P$8}=a$20(n$24),[u$9,A$3]=S$3(P$8),{asChild:a$37,children:d$9,className:y$6,style:v$10,type:t$28,scrollHideDelay:N$7=t$28===`scroll`?void 0:0,dir:V,size:i$23=t$17.size.default,radius:p$36=t$17.radius.default,scrollbars:l$12=t$17.scrollbars.default,...b$5}=f$20;return import_react.createElement(Root$2,{type:t$28,scrollHideDelay:N$7,className:(0,import_classnames$31.default)(`rt-ScrollAreaRoot`,u$9,y$6),style:l$3(A$3,v$10),asChild:a$37},d$2({asChild:a$37,children:d$9},g$7=>import_react.createElement(import_react.Fragment,null,import_react.createElement(Viewport$1,{...b$5,ref:S$4,className:`rt-ScrollAreaViewport`},g$7),import_react.createElement(`div`,{className:`rt-ScrollAreaViewportFocusRing`}),l$12===`vertical`?null:import_react.createElement(Scrollbar,{"data-radius":p$36,orientation:`horizontal`,className:(0,import_classnames$31.default)(`rt-ScrollAreaScrollbar`,g({className:`rt-r-size`,value:i$23,propValues:t$17.size.values}))},import_react.createElement(Thumb$2,{className:`rt-ScrollAreaThumb`})),l$12===`horizontal`?null:import_react.createElement(Scrollbar,{"data-radius":p$36,orientation:`vertical`,className:(0,import_classnames$31.default)(`rt-ScrollAreaScrollbar`,g({className:`rt-r-size`,value:i$23,propValues:t$17.size.values}))},import_react.createElement(Thumb$2,{className:`rt-ScrollAreaThumb`})),l$12===`both`?import_react.createElement(Corner,{className:`rt-ScrollAreaCorner`}):null)))});c.displayName=`ScrollArea`;var o$19=[`1`,`2`],r$25=[`solid`,`soft`],n$9={size:{type:`enum`,className:`rt-r-size`,values:o$19,default:`2`,responsive:!0},variant:{type:`enum`,className:`rt-variant`,values:r$25,default:`solid`},...r$4,...o$5},a$18={...o$8,...r$4,shortcut:{type:`string`}},i$11={...r$4,shortcut:{type:`string`}},p$19={...r$4},context_menu_exports=__export({CheckboxItem:()=>G$1,Content:()=>v$7,Group:()=>N$3,Item:()=>R$3,Label:()=>y$4,RadioGroup:()=>T$2,RadioItem:()=>E$1,Root:()=>h$2,Separator:()=>W,Sub:()=>w,SubContent:()=>k,SubTrigger:()=>B$1,Trigger:()=>S$2}),import_classnames$30=__toESM(require_classnames()),h$2=t$28=>import_react.createElement(Root2$8,{...t$28});h$2.displayName=`ContextMenu.Root`;var S$2=import_react.forwardRef(({children:t$28,...n$24},o$28)=>import_react.createElement(Trigger$6,{...n$24,ref:o$28,asChild:!0},a$11(t$28)));S$2.displayName=`ContextMenu.Trigger`;var g$4=import_react.createContext({}),v$7=import_react.forwardRef((t$28,n$24)=>{let o$28=H(),{size:a$37=n$9.size.default,variant:u$9=n$9.variant.default,highContrast:i$23=n$9.highContrast.default}=t$28,{className:C$6,children:m$15,color:x$3,container:M$1,forceMount:l$12,...L$1}=v(t$28,n$9),c$5=x$3||o$28.accentColor;return import_react.createElement(Portal2$1,{container:M$1,forceMount:l$12},import_react.createElement(R,{asChild:!0},import_react.createElement(Content2$5,{"data-accent-color":c$5,alignOffset:-Number(a$37)*4,collisionPadding:10,...L$1,asChild:!1,ref:n$24,className:(0,import_classnames$30.default)(`rt-PopperContent`,`rt-BaseMenuContent`,`rt-ContextMenuContent`,C$6)},import_react.createElement(c,{type:`auto`},import_react.createElement(`div`,{className:(0,import_classnames$30.default)(`rt-BaseMenuViewport`,`rt-ContextMenuViewport`)},import_react.createElement(g$4.Provider,{value:import_react.useMemo(()=>({size:a$37,variant:u$9,color:c$5,highContrast:i$23}),[a$37,u$9,c$5,i$23])},m$15))))))});v$7.displayName=`ContextMenu.Content`;var y$4=import_react.forwardRef(({className:t$28,...n$24},o$28)=>import_react.createElement(Label2$1,{...n$24,asChild:!1,ref:o$28,className:(0,import_classnames$30.default)(`rt-BaseMenuLabel`,`rt-ContextMenuLabel`,t$28)}));y$4.displayName=`ContextMenu.Label`;var R$3=import_react.forwardRef((t$28,n$24)=>{let{className:o$28,children:a$37,color:u$9=a$18.color.default,shortcut:i$23,...C$6}=t$28;return import_react.createElement(Item2$3,{"data-accent-color":u$9,...C$6,ref:n$24,className:(0,import_classnames$30.default)(`rt-reset`,`rt-BaseMenuItem`,`rt-ContextMenuItem`,o$28)},import_react.createElement(Slottable$2,null,a$37),i$23&&import_react.createElement(`div`,{className:`rt-BaseMenuShortcut rt-ContextMenuShortcut`},i$23))});R$3.displayName=`ContextMenu.Item`;var N$3=import_react.forwardRef(({className:t$28,...n$24},o$28)=>import_react.createElement(Group2$1,{...n$24,asChild:!1,ref:o$28,className:(0,import_classnames$30.default)(`rt-BaseMenuGroup`,`rt-ContextMenuGroup`,t$28)}));N$3.displayName=`ContextMenu.Group`;var T$2=import_react.forwardRef(({className:t$28,...n$24},o$28)=>import_react.createElement(RadioGroup2$1,{...n$24,asChild:!1,ref:o$28,className:(0,import_classnames$30.default)(`rt-BaseMenuRadioGroup`,`rt-ContextMenuRadioGroup`,t$28)}));T$2.displayName=`ContextMenu.RadioGroup`;var E$1=import_react.forwardRef((t$28,n$24)=>{let{children:o$28,className:a$37,color:u$9=p$19.color.default,...i$23}=t$28;return import_react.createElement(RadioItem2$1,{...i$23,asChild:!1,ref:n$24,"data-accent-color":u$9,className:(0,import_classnames$30.default)(`rt-BaseMenuItem`,`rt-BaseMenuRadioItem`,`rt-ContextMenuItem`,`rt-ContextMenuRadioItem`,a$37)},import_react.createElement(Slottable$2,null,o$28),import_react.createElement(ItemIndicator2$1,{className:`rt-BaseMenuItemIndicator rt-ContextMenuItemIndicator`},import_react.createElement(t$8,{className:`rt-BaseMenuItemIndicatorIcon rt-ContextMenuItemIndicatorIcon`})))});E$1.displayName=`ContextMenu.RadioItem`;var G$1=import_react.forwardRef((t$28,n$24)=>{let{children:o$28,className:a$37,shortcut:u$9,color:i$23=i$11.color.default,...C$6}=t$28;return import_react.createElement(CheckboxItem2$1,{...C$6,asChild:!1,ref:n$24,"data-accent-color":i$23,className:(0,import_classnames$30.default)(`rt-BaseMenuItem`,`rt-BaseMenuCheckboxItem`,`rt-ContextMenuItem`,`rt-ContextMenuCheckboxItem`,a$37)},import_react.createElement(Slottable$2,null,o$28),import_react.createElement(ItemIndicator2$1,{className:`rt-BaseMenuItemIndicator rt-ContextMenuItemIndicator`},import_react.createElement(t$8,{className:`rt-BaseMenuItemIndicatorIcon rt-ContextMenuItemIndicatorIcon`})),u$9&&import_react.createElement(`div`,{className:`rt-BaseMenuShortcut rt-ContextMenuShortcut`},u$9))});G$1.displayName=`ContextMenu.CheckboxItem`;var w=t$28=>import_react.createElement(Sub2$1,{...t$28});w.displayName=`ContextMenu.Sub`;var B$1=import_react.forwardRef((t$28,n$24)=>{let{className:o$28,children:a$37,...u$9}=t$28;return import_react.createElement(SubTrigger2$1,{...u$9,asChild:!1,ref:n$24,className:(0,import_classnames$30.default)(`rt-BaseMenuItem`,`rt-BaseMenuSubTrigger`,`rt-ContextMenuItem`,`rt-ContextMenuSubTrigger`,o$28)},a$37,import_react.createElement(`div`,{className:`rt-BaseMenuShortcut rt-ContextMenuShortcut`},import_react.createElement(l$4,{className:`rt-BaseMenuSubTriggerIcon rt-ContextMenuSubTriggerIcon`})))});B$1.displayName=`ContextMenu.SubTrigger`;var k=import_react.forwardRef((t$28,n$24)=>{let{size:o$28,variant:a$37,color:u$9,highContrast:i$23}=import_react.useContext(g$4),{className:C$6,children:m$15,container:x$3,forceMount:M$1,...l$12}=v({size:o$28,variant:a$37,color:u$9,highContrast:i$23,...t$28},n$9);return import_react.createElement(Portal2$1,{container:x$3,forceMount:M$1},import_react.createElement(R,{asChild:!0},import_react.createElement(SubContent2$1,{"data-accent-color":u$9,alignOffset:-Number(o$28)*4,sideOffset:1,collisionPadding:10,...l$12,asChild:!1,ref:n$24,className:(0,import_classnames$30.default)(`rt-PopperContent`,`rt-BaseMenuContent`,`rt-BaseMenuSubContent`,`rt-ContextMenuContent`,`rt-ContextMenuSubContent`,C$6)},import_react.createElement(c,{type:`auto`},import_react.createElement(`div`,{className:(0,import_classnames$30.default)(`rt-BaseMenuViewport`,`rt-ContextMenuViewport`)},m$15)))))});k.displayName=`ContextMenu.SubContent`;var W=import_react.forwardRef(({className:t$28,...n$24},o$28)=>import_react.createElement(Separator2$1,{...n$24,asChild:!1,ref:o$28,className:(0,import_classnames$30.default)(`rt-BaseMenuSeparator`,`rt-ContextMenuSeparator`,t$28)}));W.displayName=`ContextMenu.Separator`;var s$12=[`start`,`center`,`end`,`baseline`,`stretch`],i$13=[`horizontal`,`vertical`],a$19=[`1`,`2`,`3`],n$11={orientation:{type:`enum`,className:`rt-r-orientation`,values:i$13,default:`horizontal`,responsive:!0},size:{type:`enum`,className:`rt-r-size`,values:a$19,default:`2`,responsive:!0},trim:{...r$22.trim,className:`rt-r-trim`}},p$21={align:{type:`enum`,className:`rt-r-ai`,values:s$12,responsive:!0}},m$7={...t,...r$4,...o$5},data_list_exports=__export({Item:()=>m$8,Label:()=>L,Root:()=>i$12,Value:()=>l$5}),import_classnames$29=__toESM(require_classnames()),i$12=import_react.forwardRef((a$37,e$31)=>{let{className:s$23,...o$28}=v(a$37,n$11,r$3);return import_react.createElement(p,{asChild:!0},import_react.createElement(`dl`,{...o$28,ref:e$31,className:(0,import_classnames$29.default)(`rt-DataListRoot`,s$23)}))});i$12.displayName=`DataList.Root`;var m$8=import_react.forwardRef((a$37,e$31)=>{let{className:s$23,...o$28}=v(a$37,p$21);return import_react.createElement(`div`,{...o$28,ref:e$31,className:(0,import_classnames$29.default)(`rt-DataListItem`,s$23)})});m$8.displayName=`DataList.Item`;var L=import_react.forwardRef((a$37,e$31)=>{let{className:s$23,color:o$28,...n$24}=v(a$37,m$7);return import_react.createElement(`dt`,{...n$24,"data-accent-color":o$28,ref:e$31,className:(0,import_classnames$29.default)(`rt-DataListLabel`,s$23)})});L.displayName=`DataList.Label`;var l$5=import_react.forwardRef(({children:a$37,className:e$31,...s$23},o$28)=>import_react.createElement(`dd`,{...s$23,ref:o$28,className:(0,import_classnames$29.default)(e$31,`rt-DataListValue`)},a$37));l$5.displayName=`DataList.Value`;var dialog_exports=__export({Close:()=>D,Content:()=>p$20,Description:()=>m$6,Root:()=>s$11,Title:()=>g$3,Trigger:()=>n$10}),import_classnames$28=__toESM(require_classnames()),s$11=e$31=>import_react.createElement(Root$8,{...e$31,modal:!0});s$11.displayName=`Dialog.Root`;var n$10=import_react.forwardRef(({children:e$31,...i$23},r$38)=>import_react.createElement(Trigger$7,{...i$23,ref:r$38,asChild:!0},a$11(e$31)));n$10.displayName=`Dialog.Trigger`;var p$20=import_react.forwardRef(({align:e$31,...i$23},r$38)=>{let{align:P$8,...f$20}=s$10,{className:C$6}=v({align:e$31},{align:P$8}),{className:d$9,forceMount:c$5,container:y$6,...T$5}=v(i$23,f$20);return import_react.createElement(Portal$6,{container:y$6,forceMount:c$5},import_react.createElement(R,{asChild:!0},import_react.createElement(Overlay,{className:`rt-BaseDialogOverlay rt-DialogOverlay`},import_react.createElement(`div`,{className:`rt-BaseDialogScroll rt-DialogScroll`},import_react.createElement(`div`,{className:`rt-BaseDialogScrollPadding rt-DialogScrollPadding ${C$6}`},import_react.createElement(Content$2,{...T$5,ref:r$38,className:(0,import_classnames$28.default)(`rt-BaseDialogContent`,`rt-DialogContent`,d$9)}))))))});p$20.displayName=`Dialog.Content`;var g$3=import_react.forwardRef((e$31,i$23)=>import_react.createElement(Title,{asChild:!0},import_react.createElement(r,{size:`5`,mb:`3`,trim:`start`,...e$31,asChild:!1,ref:i$23})));g$3.displayName=`Dialog.Title`;var m$6=import_react.forwardRef((e$31,i$23)=>import_react.createElement(Description,{asChild:!0},import_react.createElement(p,{as:`p`,size:`3`,...e$31,asChild:!1,ref:i$23})));m$6.displayName=`Dialog.Description`;var D=import_react.forwardRef(({children:e$31,...i$23},r$38)=>import_react.createElement(Close$1,{...i$23,ref:r$38,asChild:!0},a$11(e$31)));D.displayName=`Dialog.Close`;var dropdown_menu_exports=__export({CheckboxItem:()=>T$1,Content:()=>g$2,Group:()=>R$2,Item:()=>v$5,Label:()=>y$3,RadioGroup:()=>S$1,RadioItem:()=>x,Root:()=>I$2,Separator:()=>B,Sub:()=>N$2,SubContent:()=>G,SubTrigger:()=>E,Trigger:()=>h$1,TriggerIcon:()=>i$5}),import_classnames$27=__toESM(require_classnames()),I$2=e$31=>import_react.createElement(Root2$7,{...e$31});I$2.displayName=`DropdownMenu.Root`;var h$1=import_react.forwardRef(({children:e$31,...n$24},r$38)=>import_react.createElement(Trigger$5,{...n$24,ref:r$38,asChild:!0},a$11(e$31)));h$1.displayName=`DropdownMenu.Trigger`;var b$2=import_react.createContext({}),g$2=import_react.forwardRef((e$31,n$24)=>{let r$38=H(),{size:s$23=n$9.size.default,variant:p$36=n$9.variant.default,highContrast:u$9=n$9.highContrast.default}=e$31,{className:a$37,children:m$15,color:M$1,container:w$2,forceMount:D$2,...k$2}=v(e$31,n$9),l$12=M$1||r$38.accentColor;return import_react.createElement(Portal2,{container:w$2,forceMount:D$2},import_react.createElement(R,{asChild:!0},import_react.createElement(Content2$4,{"data-accent-color":l$12,align:`start`,sideOffset:4,collisionPadding:10,...k$2,asChild:!1,ref:n$24,className:(0,import_classnames$27.default)(`rt-PopperContent`,`rt-BaseMenuContent`,`rt-DropdownMenuContent`,a$37)},import_react.createElement(c,{type:`auto`},import_react.createElement(`div`,{className:(0,import_classnames$27.default)(`rt-BaseMenuViewport`,`rt-DropdownMenuViewport`)},import_react.createElement(b$2.Provider,{value:import_react.useMemo(()=>({size:s$23,variant:p$36,color:l$12,highContrast:u$9}),[s$23,p$36,l$12,u$9])},m$15))))))});g$2.displayName=`DropdownMenu.Content`;var y$3=import_react.forwardRef(({className:e$31,...n$24},r$38)=>import_react.createElement(Label2,{...n$24,asChild:!1,ref:r$38,className:(0,import_classnames$27.default)(`rt-BaseMenuLabel`,`rt-DropdownMenuLabel`,e$31)}));y$3.displayName=`DropdownMenu.Label`;var v$5=import_react.forwardRef((e$31,n$24)=>{let{className:r$38,children:s$23,color:p$36=a$18.color.default,shortcut:u$9,...a$37}=e$31;return import_react.createElement(Item2$2,{"data-accent-color":p$36,...a$37,ref:n$24,className:(0,import_classnames$27.default)(`rt-reset`,`rt-BaseMenuItem`,`rt-DropdownMenuItem`,r$38)},import_react.createElement(Slottable$2,null,s$23),u$9&&import_react.createElement(`div`,{className:`rt-BaseMenuShortcut rt-DropdownMenuShortcut`},u$9))});v$5.displayName=`DropdownMenu.Item`;var R$2=import_react.forwardRef(({className:e$31,...n$24},r$38)=>import_react.createElement(Group2,{...n$24,asChild:!1,ref:r$38,className:(0,import_classnames$27.default)(`rt-BaseMenuGroup`,`rt-DropdownMenuGroup`,e$31)}));R$2.displayName=`DropdownMenu.Group`;var S$1=import_react.forwardRef(({className:e$31,...n$24},r$38)=>import_react.createElement(RadioGroup2,{...n$24,asChild:!1,ref:r$38,className:(0,import_classnames$27.default)(`rt-BaseMenuRadioGroup`,`rt-DropdownMenuRadioGroup`,e$31)}));S$1.displayName=`DropdownMenu.RadioGroup`;var x=import_react.forwardRef((e$31,n$24)=>{let{children:r$38,className:s$23,color:p$36=p$19.color.default,...u$9}=e$31;return import_react.createElement(RadioItem2,{...u$9,asChild:!1,ref:n$24,"data-accent-color":p$36,className:(0,import_classnames$27.default)(`rt-BaseMenuItem`,`rt-BaseMenuRadioItem`,`rt-DropdownMenuItem`,`rt-DropdownMenuRadioItem`,s$23)},r$38,import_react.createElement(ItemIndicator2,{className:`rt-BaseMenuItemIndicator rt-DropdownMenuItemIndicator`},import_react.createElement(t$8,{className:`rt-BaseMenuItemIndicatorIcon rt-DropdownMenuItemIndicatorIcon`})))});x.displayName=`DropdownMenu.RadioItem`;var T$1=import_react.forwardRef((e$31,n$24)=>{let{children:r$38,className:s$23,shortcut:p$36,color:u$9=i$11.color.default,...a$37}=e$31;return import_react.createElement(CheckboxItem2,{...a$37,asChild:!1,ref:n$24,"data-accent-color":u$9,className:(0,import_classnames$27.default)(`rt-BaseMenuItem`,`rt-BaseMenuCheckboxItem`,`rt-DropdownMenuItem`,`rt-DropdownMenuCheckboxItem`,s$23)},r$38,import_react.createElement(ItemIndicator2,{className:`rt-BaseMenuItemIndicator rt-DropdownMenuItemIndicator`},import_react.createElement(t$8,{className:`rt-BaseMenuItemIndicatorIcon rt-ContextMenuItemIndicatorIcon`})),p$36&&import_react.createElement(`div`,{className:`rt-BaseMenuShortcut rt-DropdownMenuShortcut`},p$36))});T$1.displayName=`DropdownMenu.CheckboxItem`;var N$2=e$31=>import_react.createElement(Sub2,{...e$31});N$2.displayName=`DropdownMenu.Sub`;var E=import_react.forwardRef((e$31,n$24)=>{let{className:r$38,children:s$23,...p$36}=e$31;return import_react.createElement(SubTrigger2,{...p$36,asChild:!1,ref:n$24,className:(0,import_classnames$27.default)(`rt-BaseMenuItem`,`rt-BaseMenuSubTrigger`,`rt-DropdownMenuItem`,`rt-DropdownMenuSubTrigger`,r$38)},s$23,import_react.createElement(`div`,{className:`rt-BaseMenuShortcut rt-DropdownMenuShortcut`},import_react.createElement(l$4,{className:`rt-BaseMenuSubTriggerIcon rt-DropdownMenuSubtriggerIcon`})))});E.displayName=`DropdownMenu.SubTrigger`;var G=import_react.forwardRef((e$31,n$24)=>{let{size:r$38,variant:s$23,color:p$36,highContrast:u$9}=import_react.useContext(b$2),{className:a$37,children:m$15,container:M$1,forceMount:w$2,...D$2}=v({size:r$38,variant:s$23,color:p$36,highContrast:u$9,...e$31},n$9);return import_react.createElement(Portal2,{container:M$1,forceMount:w$2},import_react.createElement(R,{asChild:!0},import_react.createElement(SubContent2,{"data-accent-color":p$36,alignOffset:-Number(r$38)*4,sideOffset:1,collisionPadding:10,...D$2,asChild:!1,ref:n$24,className:(0,import_classnames$27.default)(`rt-PopperContent`,`rt-BaseMenuContent`,`rt-BaseMenuSubContent`,`rt-DropdownMenuContent`,`rt-DropdownMenuSubContent`,a$37)},import_react.createElement(c,{type:`auto`},import_react.createElement(`div`,{className:(0,import_classnames$27.default)(`rt-BaseMenuViewport`,`rt-DropdownMenuViewport`)},m$15)))))});G.displayName=`DropdownMenu.SubContent`;var B=import_react.forwardRef(({className:e$31,...n$24},r$38)=>import_react.createElement(Separator2,{...n$24,asChild:!1,ref:r$38,className:(0,import_classnames$27.default)(`rt-BaseMenuSeparator`,`rt-DropdownMenuSeparator`,e$31)}));B.displayName=`DropdownMenu.Separator`;var t$16={...o$8,...e$2,...r$13},import_classnames$26=__toESM(require_classnames()),e$11=import_react.forwardRef((p$36,m$15)=>{let{asChild:r$38,className:t$28,...s$23}=v(p$36,t$16),f$20=r$38?Slot$4:`em`;return import_react.createElement(f$20,{...s$23,ref:m$15,className:(0,import_classnames$26.default)(`rt-Em`,t$28)})});e$11.displayName=`Em`;var r$23=[`1`,`2`,`3`],p$17={...o$8,size:{type:`enum`,className:`rt-r-size`,values:r$23,default:`2`,responsive:!0},width:t.width,minWidth:t.minWidth,maxWidth:{...t.maxWidth,default:`480px`},...e$3},hover_card_exports=__export({Content:()=>C$3,Root:()=>p$18,Trigger:()=>s$9}),import_classnames$25=__toESM(require_classnames()),p$18=e$31=>import_react.createElement(Root2$6,{closeDelay:150,openDelay:200,...e$31});p$18.displayName=`HoverCard.Root`;var s$9=import_react.forwardRef(({children:e$31,className:t$28,...n$24},a$37)=>import_react.createElement(Trigger$4,{ref:a$37,className:(0,import_classnames$25.default)(`rt-HoverCardTrigger`,t$28),...n$24,asChild:!0},a$11(e$31)));s$9.displayName=`HoverCard.Trigger`;var C$3=import_react.forwardRef((e$31,t$28)=>{let{className:n$24,forceMount:a$37,container:m$15,...d$9}=v(e$31,p$17);return import_react.createElement(Portal$4,{container:m$15,forceMount:a$37},import_react.createElement(R,{asChild:!0},import_react.createElement(Content2$3,{align:`start`,sideOffset:8,collisionPadding:10,...d$9,ref:t$28,className:(0,import_classnames$25.default)(`rt-PopperContent`,`rt-HoverCardContent`,n$24)})))});C$3.displayName=`HoverCard.Content`;var import_classnames$24=__toESM(require_classnames()),o$2=import_react.forwardRef(({className:e$31,...n$24},r$38)=>import_react.createElement(n$7,{...n$24,ref:r$38,className:(0,import_classnames$24.default)(`rt-IconButton`,e$31)}));o$2.displayName=`IconButton`;var a$17=[`all`,`x`,`y`,`top`,`bottom`,`left`,`right`],t$15=[`border-box`,`padding-box`],e$10=[`current`,`0`],u$6={...o$8,side:{type:`enum`,className:`rt-r-side`,values:a$17,default:`all`,responsive:!0},clip:{type:`enum`,className:`rt-r-clip`,values:t$15,default:`border-box`,responsive:!0},p:{type:`enum`,className:`rt-r-p`,values:e$10,parseValue:p$16,responsive:!0},px:{type:`enum`,className:`rt-r-px`,values:e$10,parseValue:p$16,responsive:!0},py:{type:`enum`,className:`rt-r-py`,values:e$10,parseValue:p$16,responsive:!0},pt:{type:`enum`,className:`rt-r-pt`,values:e$10,parseValue:p$16,responsive:!0},pr:{type:`enum`,className:`rt-r-pr`,values:e$10,parseValue:p$16,responsive:!0},pb:{type:`enum`,className:`rt-r-pb`,values:e$10,parseValue:p$16,responsive:!0},pl:{type:`enum`,className:`rt-r-pl`,values:e$10,parseValue:p$16,responsive:!0}};function p$16(s$23){return s$23===`current`?`inset`:s$23}var import_classnames$23=__toESM(require_classnames()),e$9=import_react.forwardRef((r$38,t$28)=>{let{asChild:p$36,className:s$23,...n$24}=v(r$38,u$6,r$3),m$15=p$36?Slot$4:`div`;return import_react.createElement(m$15,{...n$24,ref:t$28,className:(0,import_classnames$23.default)(`rt-Inset`,s$23)})});e$9.displayName=`Inset`;var e$8=[`1`,`2`,`3`,`4`,`5`,`6`,`7`,`8`,`9`],o$18={...o$8,size:{type:`enum`,className:`rt-r-size`,values:e$8,responsive:!0}},import_classnames$22=__toESM(require_classnames()),r$1=import_react.forwardRef((p$36,e$31)=>{let{asChild:t$28,className:s$23,...m$15}=v(p$36,o$18,r$3),d$9=t$28?Slot$4:`kbd`;return import_react.createElement(d$9,{...m$15,ref:e$31,className:(0,import_classnames$22.default)(`rt-reset`,`rt-Kbd`,s$23)})});r$1.displayName=`Kbd`;var n$6=[`1`,`2`,`3`,`4`,`5`,`6`,`7`,`8`,`9`],f$9=[`auto`,`always`,`hover`,`none`],m$5={...o$8,size:{type:`enum`,className:`rt-r-size`,values:n$6,responsive:!0},...t$14,...r$22,...e$2,...r$13,underline:{type:`enum`,className:`rt-underline`,values:f$9,default:`auto`},...s$7,...o$5},import_classnames$21=__toESM(require_classnames()),e$7=import_react.forwardRef((p$36,t$28)=>{let{children:r$38,className:s$23,color:n$24,asChild:i$23,...m$15}=v(p$36,m$5);return import_react.createElement(p,{...m$15,"data-accent-color":n$24,ref:t$28,asChild:!0,className:(0,import_classnames$21.default)(`rt-reset`,`rt-Link`,s$23)},i$23?r$38:import_react.createElement(`a`,null,r$38))});e$7.displayName=`Link`;var p$15=[`1`,`2`,`3`,`4`],r$21={...o$8,size:{type:`enum`,className:`rt-r-size`,values:p$15,default:`2`,responsive:!0},width:t.width,minWidth:t.minWidth,maxWidth:{...t.maxWidth,default:`480px`},...e$3},popover_exports=__export({Anchor:()=>m$4,Close:()=>v$4,Content:()=>i$8,Root:()=>P$4,Trigger:()=>s$6}),import_classnames$20=__toESM(require_classnames()),P$4=e$31=>import_react.createElement(Root2$4,{...e$31});P$4.displayName=`Popover.Root`;var s$6=import_react.forwardRef(({children:e$31,...r$38},t$28)=>import_react.createElement(Trigger$3,{...r$38,ref:t$28,asChild:!0},a$11(e$31)));s$6.displayName=`Popover.Trigger`;var i$8=import_react.forwardRef((e$31,r$38)=>{let{className:t$28,forceMount:a$37,container:f$20,...l$12}=v(e$31,r$21);return import_react.createElement(Portal$3,{container:f$20,forceMount:a$37},import_react.createElement(R,{asChild:!0},import_react.createElement(Content2$2,{align:`start`,sideOffset:8,collisionPadding:10,...l$12,ref:r$38,className:(0,import_classnames$20.default)(`rt-PopperContent`,`rt-PopoverContent`,t$28)})))});i$8.displayName=`Popover.Content`;var v$4=import_react.forwardRef(({children:e$31,...r$38},t$28)=>import_react.createElement(Close,{...r$38,ref:t$28,asChild:!0},a$11(e$31)));v$4.displayName=`Popover.Close`;var m$4=import_react.forwardRef(({children:e$31,...r$38},t$28)=>import_react.createElement(Anchor2,{...r$38,ref:t$28}));m$4.displayName=`Popover.Anchor`;var r$20=Root$9,P$3=Root$9,o$17=[`1`,`2`,`3`],t$13=[`classic`,`surface`,`soft`],a$15={size:{type:`enum`,className:`rt-r-size`,values:o$17,default:`2`,responsive:!0},variant:{type:`enum`,className:`rt-variant`,values:t$13,default:`surface`},...r$4,...o$5,...r$5,duration:{type:`string`}},import_classnames$19=__toESM(require_classnames()),s$5=import_react.forwardRef((p$36,t$28)=>{let{className:m$15,style:i$23,color:a$37,radius:n$24,duration:P$8,...r$38}=v(p$36,a$15,r$3);return import_react.createElement(Root$3,{"data-accent-color":a$37,"data-radius":n$24,ref:t$28,className:(0,import_classnames$19.default)(`rt-ProgressRoot`,m$15),style:l$3({"--progress-duration":`value`in r$38?void 0:P$8,"--progress-value":`value`in r$38?r$38.value:void 0,"--progress-max":`max`in r$38?r$38.max:void 0},i$23),...r$38,asChild:!1},import_react.createElement(Indicator,{className:`rt-ProgressIndicator`}))});s$5.displayName=`Progress`;var p$14={...o$8,...e$2,...r$13},import_classnames$18=__toESM(require_classnames()),e$6=import_react.forwardRef((t$28,p$36)=>{let{asChild:r$38,className:s$23,...m$15}=v(t$28,p$14),f$20=r$38?Slot$4:`q`;return import_react.createElement(f$20,{...m$15,ref:p$36,className:(0,import_classnames$18.default)(`rt-Quote`,s$23)})});e$6.displayName=`Quote`;var a$14=[`1`,`2`,`3`],t$12=[`surface`,`classic`],p$12={...o$8,size:{type:`enum`,className:`rt-r-size`,values:a$14,default:`2`,responsive:!0},variant:{type:`enum`,className:`rt-variant`,values:t$12,default:`surface`},...r$4,...o$5,columns:{...s$4.columns,default:`repeat(auto-fit, minmax(160px, 1fr))`},gap:{...s$4.gap,default:`4`}},radio_cards_exports=__export({Item:()=>i$7,Root:()=>p$13}),import_classnames$17=__toESM(require_classnames()),p$13=import_react.forwardRef((r$38,t$28)=>{let{className:e$31,color:d$9,...m$15}=v(r$38,p$12,r$3);return import_react.createElement(o$1,{asChild:!0},import_react.createElement(Root2$3,{"data-accent-color":d$9,...m$15,ref:t$28,className:(0,import_classnames$17.default)(`rt-RadioCardsRoot`,e$31)}))});p$13.displayName=`RadioCards.Root`;var i$7=import_react.forwardRef(({className:r$38,...t$28},e$31)=>import_react.createElement(Item2$1,{...t$28,asChild:!1,ref:e$31,className:(0,import_classnames$17.default)(`rt-reset`,`rt-BaseCard`,`rt-RadioCardsItem`,r$38)}));i$7.displayName=`RadioCards.Item`;var o$16=[`1`,`2`,`3`],t$11=[`classic`,`surface`,`soft`],a$12={...o$8,size:{type:`enum`,className:`rt-r-size`,values:o$16,default:`2`,responsive:!0},variant:{type:`enum`,className:`rt-variant`,values:t$11,default:`surface`},...r$4,...o$5},radio_group_exports=__export({Item:()=>y$2,Root:()=>I$1}),import_classnames$16=__toESM(require_classnames()),f$7=`RadioGroup`,[v$3]=createContextScope(f$7,[createRadioGroupScope]),P$2=createRadioGroupScope(),[S,l$2]=v$3(f$7),I$1=import_react.forwardRef(({color:a$37=a$12.color.default,highContrast:e$31=a$12.highContrast.default,size:r$38=a$12.size.default,variant:t$28=a$12.variant.default,...i$23},s$23)=>{let{__scopeRadioGroup:p$36,className:m$15,...x$3}=v(i$23,r$3),C$6=P$2(p$36);return import_react.createElement(S,{scope:p$36,color:a$37,highContrast:e$31,size:r$38,variant:t$28},import_react.createElement(Root2$3,{...C$6,...x$3,ref:s$23,className:(0,import_classnames$16.default)(`rt-RadioGroupRoot`,m$15)}))});I$1.displayName=`RadioGroup.Root`;var y$2=import_react.forwardRef((a$37,e$31)=>{let{__scopeRadioGroup:r$38,children:t$28,className:i$23,style:s$23,...p$36}=a$37,{size:m$15}=l$2(`RadioGroupItem`,r$38);return t$28?import_react.createElement(p,{as:`label`,size:m$15,className:(0,import_classnames$16.default)(`rt-RadioGroupItem`,i$23),style:s$23},import_react.createElement(n$4,{__scopeRadioGroup:r$38,...p$36,ref:e$31}),t$28&&import_react.createElement(`span`,{className:`rt-RadioGroupItemInner`},t$28)):import_react.createElement(n$4,{__scopeRadioGroup:r$38,...p$36,ref:e$31,className:i$23,style:s$23})});y$2.displayName=`RadioGroup.Item`;var n$4=import_react.forwardRef(({__scopeRadioGroup:a$37,...e$31},r$38)=>{let t$28=l$2(`RadioGroupItemRadio`,a$37),i$23=P$2(a$37),{color:s$23,className:p$36}=v({...e$31,...t$28},a$12,r$3);return import_react.createElement(Item2$1,{...i$23,"data-accent-color":s$23,...e$31,asChild:!1,ref:r$38,className:(0,import_classnames$16.default)(`rt-reset`,`rt-BaseRadioRoot`,p$36)})});n$4.displayName=`RadioGroup.ItemRadio`;var r$19=[`1`,`2`,`3`],o$15=[`classic`,`surface`,`soft`],t$10={size:{type:`enum`,className:`rt-r-size`,values:r$19,default:`2`,responsive:!0},variant:{type:`enum`,className:`rt-variant`,values:o$15,default:`surface`},...r$4,...o$5},import_classnames$15=__toESM(require_classnames()),e$5=import_react.forwardRef((r$38,t$28)=>{let p$36=import_react.useRef(null),{className:a$37,color:s$23,onChange:i$23,onValueChange:n$24,...m$15}=v(r$38,t$10,r$3);return import_react.createElement(`input`,{type:`radio`,"data-accent-color":s$23,...m$15,onChange:composeEventHandlers(i$23,d$9=>n$24?.(d$9.currentTarget.value)),ref:composeRefs(p$36,t$28),className:(0,import_classnames$15.default)(`rt-reset`,`rt-BaseRadioRoot`,`rt-RadioRoot`,a$37)})});e$5.displayName=`Radio`;var import_classnames$14=__toESM(require_classnames()),o$14=import_react.forwardRef(({className:t$28,children:r$38,...s$23},p$36)=>import_react.createElement(Slot$4,{...s$23,ref:p$36,className:(0,import_classnames$14.default)(`rt-reset`,t$28)},a$11(r$38)));o$14.displayName=`Reset`;var s$3=[`1`,`2`,`3`],a$10=[`surface`,`classic`],o$13={disabled:{type:`boolean`,className:`disabled`,default:!1},size:{type:`enum`,className:`rt-r-size`,values:s$3,default:`2`,responsive:!0},variant:{type:`enum`,className:`rt-variant`,values:a$10,default:`surface`},...r$5},segmented_control_exports=__export({Item:()=>l$1,Root:()=>p$11}),import_classnames$13=__toESM(require_classnames()),p$11=import_react.forwardRef((o$28,t$28)=>{let{className:r$38,children:n$24,radius:d$9,value:i$23,defaultValue:g$7,onValueChange:f$20,...P$8}=v(o$28,o$13,r$3),[u$9,C$6]=useControllableState({prop:i$23,onChange:f$20,defaultProp:g$7});return import_react.createElement(Root2,{"data-disabled":o$28.disabled||void 0,"data-radius":d$9,ref:t$28,className:(0,import_classnames$13.default)(`rt-SegmentedControlRoot`,r$38),onValueChange:s$23=>{s$23&&C$6(s$23)},...P$8,type:`single`,value:u$9,asChild:!1,disabled:!!o$28.disabled},n$24,import_react.createElement(`div`,{className:`rt-SegmentedControlIndicator`}))});p$11.displayName=`SegmentedControl.Root`;var l$1=import_react.forwardRef(({children:o$28,className:t$28,...r$38},n$24)=>import_react.createElement(Item2,{ref:n$24,className:(0,import_classnames$13.default)(`rt-reset`,`rt-SegmentedControlItem`,t$28),...r$38,disabled:!1,asChild:!1},import_react.createElement(`span`,{className:`rt-SegmentedControlItemSeparator`}),import_react.createElement(`span`,{className:`rt-SegmentedControlItemLabel`},import_react.createElement(`span`,{className:`rt-SegmentedControlItemLabelActive`},o$28),import_react.createElement(`span`,{className:`rt-SegmentedControlItemLabelInactive`,"aria-hidden":!0},o$28))));l$1.displayName=`SegmentedControl.Item`;var p$10=[`1`,`2`,`3`,`4`],o$12=[`none`,`initial`],t$9={...o$8,size:{type:`enum`,className:`rt-r-size`,values:p$10,default:`3`,responsive:!0},display:{type:`enum`,className:`rt-r-display`,values:o$12,parseValue:r$18,responsive:!0}};function r$18(e$31){return e$31===`initial`?`block`:e$31}var import_classnames$12=__toESM(require_classnames()),r$17=import_react.forwardRef((t$28,p$36)=>{let{asChild:e$31,className:s$23,...m$15}=v(t$28,t$9,u$4,r$3),i$23=e$31?Slot$4:`section`;return import_react.createElement(i$23,{...m$15,ref:p$36,className:(0,import_classnames$12.default)(`rt-Section`,s$23)})});r$17.displayName=`Section`;var r$16=[`1`,`2`,`3`],o$11={size:{type:`enum`,className:`rt-r-size`,values:r$16,default:`2`,responsive:!0}},a$8=[`classic`,`surface`,`soft`,`ghost`],i$6={variant:{type:`enum`,className:`rt-variant`,values:a$8,default:`surface`},...r$4,...r$5,placeholder:{type:`string`}},n$2=[`solid`,`soft`],p$9={variant:{type:`enum`,className:`rt-variant`,values:n$2,default:`solid`},...r$4,...o$5},select_exports=__export({Content:()=>g$1,Group:()=>y$1,Item:()=>v$2,Label:()=>h,Root:()=>C$1,Separator:()=>I,Trigger:()=>u$3}),import_classnames$11=__toESM(require_classnames()),f$5=import_react.createContext({}),C$1=r$38=>{let{children:o$28,size:t$28=o$11.size.default,...s$23}=r$38;return import_react.createElement(Root2$2,{...s$23},import_react.createElement(f$5.Provider,{value:import_react.useMemo(()=>({size:t$28}),[t$28])},o$28))};C$1.displayName=`Select.Root`;var u$3=import_react.forwardRef((r$38,o$28)=>{let t$28=import_react.useContext(f$5),{children:s$23,className:p$36,color:n$24,radius:m$15,placeholder:c$5,...S$4}=v({size:t$28?.size,...r$38},{size:o$11.size},i$6,r$3);return import_react.createElement(Trigger$2,{asChild:!0},import_react.createElement(`button`,{"data-accent-color":n$24,"data-radius":m$15,...S$4,ref:o$28,className:(0,import_classnames$11.default)(`rt-reset`,`rt-SelectTrigger`,p$36)},import_react.createElement(`span`,{className:`rt-SelectTriggerInner`},import_react.createElement(Value,{placeholder:c$5},s$23)),import_react.createElement(Icon,{asChild:!0},import_react.createElement(i$5,{className:`rt-SelectIcon`}))))});u$3.displayName=`Select.Trigger`;var g$1=import_react.forwardRef((r$38,o$28)=>{let t$28=import_react.useContext(f$5),{className:s$23,children:p$36,color:n$24,container:m$15,...c$5}=v({size:t$28?.size,...r$38},{size:o$11.size},p$9),S$4=H(),T$5=n$24||S$4.accentColor;return import_react.createElement(Portal$2,{container:m$15},import_react.createElement(R,{asChild:!0},import_react.createElement(Content2$1,{"data-accent-color":T$5,sideOffset:4,...c$5,asChild:!1,ref:o$28,className:(0,import_classnames$11.default)({"rt-PopperContent":c$5.position===`popper`},`rt-SelectContent`,s$23)},import_react.createElement(Root$2,{type:`auto`,className:`rt-ScrollAreaRoot`},import_react.createElement(Viewport,{asChild:!0,className:`rt-SelectViewport`},import_react.createElement(Viewport$1,{className:`rt-ScrollAreaViewport`,style:{overflowY:void 0}},p$36)),import_react.createElement(Scrollbar,{className:`rt-ScrollAreaScrollbar rt-r-size-1`,orientation:`vertical`},import_react.createElement(Thumb$2,{className:`rt-ScrollAreaThumb`}))))))});g$1.displayName=`Select.Content`;var v$2=import_react.forwardRef((r$38,o$28)=>{let{className:t$28,children:s$23,...p$36}=r$38;return import_react.createElement(Item,{...p$36,asChild:!1,ref:o$28,className:(0,import_classnames$11.default)(`rt-SelectItem`,t$28)},import_react.createElement(ItemIndicator,{className:`rt-SelectItemIndicator`},import_react.createElement(t$8,{className:`rt-SelectItemIndicatorIcon`})),import_react.createElement(ItemText,null,s$23))});v$2.displayName=`Select.Item`;var y$1=import_react.forwardRef(({className:r$38,...o$28},t$28)=>import_react.createElement(Group,{...o$28,asChild:!1,ref:t$28,className:(0,import_classnames$11.default)(`rt-SelectGroup`,r$38)}));y$1.displayName=`Select.Group`;var h=import_react.forwardRef(({className:r$38,...o$28},t$28)=>import_react.createElement(Label,{...o$28,asChild:!1,ref:t$28,className:(0,import_classnames$11.default)(`rt-SelectLabel`,r$38)}));h.displayName=`Select.Label`;var I=import_react.forwardRef(({className:r$38,...o$28},t$28)=>import_react.createElement(Separator,{...o$28,asChild:!1,ref:t$28,className:(0,import_classnames$11.default)(`rt-SelectSeparator`,r$38)}));I.displayName=`Select.Separator`;var e$4=[`horizontal`,`vertical`],r$15=[`1`,`2`,`3`,`4`],t$7={orientation:{type:`enum`,className:`rt-r-orientation`,values:e$4,default:`horizontal`,responsive:!0},size:{type:`enum`,className:`rt-r-size`,values:r$15,default:`1`,responsive:!0},color:{...r$4.color,default:`gray`},decorative:{type:`boolean`,default:!0}},import_classnames$10=__toESM(require_classnames()),o$10=import_react.forwardRef((p$36,e$31)=>{let{className:t$28,color:a$37,decorative:s$23,...m$15}=v(p$36,t$7,r$3);return import_react.createElement(`span`,{"data-accent-color":a$37,role:s$23?void 0:`separator`,...m$15,ref:e$31,className:(0,import_classnames$10.default)(`rt-Separator`,t$28)})});o$10.displayName=`Separator`;var r$2=!0,p$8={loading:{type:`boolean`,default:!0},...t,...e$3},import_classnames$9=__toESM(require_classnames()),r$14=import_react.forwardRef((t$28,p$36)=>{let{children:e$31,className:n$24,loading:s$23,...m$15}=v(t$28,p$8,r$3);if(!s$23)return e$31;let i$23=import_react.isValidElement(e$31)?Slot$4:`span`;return import_react.createElement(i$23,{ref:p$36,"aria-hidden":!0,className:(0,import_classnames$9.default)(`rt-Skeleton`,n$24),"data-inline-skeleton":import_react.isValidElement(e$31)?void 0:!0,tabIndex:-1,inert:r$2,...m$15},e$31)});r$14.displayName=`Skeleton`;var o$9=[`1`,`2`,`3`],t$6=[`classic`,`surface`,`soft`],a$6={size:{type:`enum`,className:`rt-r-size`,values:o$9,default:`2`,responsive:!0},variant:{type:`enum`,className:`rt-variant`,values:t$6,default:`surface`},...r$4,...o$5,...r$5},import_classnames$8=__toESM(require_classnames()),s$2=import_react.forwardRef((i$23,a$37)=>{let{className:d$9,color:l$12,radius:m$15,tabIndex:t$28,...r$38}=v(i$23,a$6,r$3);return import_react.createElement(Root$1,{"data-accent-color":l$12,"data-radius":m$15,ref:a$37,...r$38,asChild:!1,className:(0,import_classnames$8.default)(`rt-SliderRoot`,d$9)},import_react.createElement(Track,{className:`rt-SliderTrack`},import_react.createElement(Range,{className:(0,import_classnames$8.default)(`rt-SliderRange`,{"rt-high-contrast":i$23.highContrast}),"data-inverted":r$38.inverted?``:void 0})),(r$38.value??r$38.defaultValue??[]).map((S$4,n$24)=>import_react.createElement(Thumb$1,{key:n$24,className:`rt-SliderThumb`,...t$28===void 0?void 0:{tabIndex:t$28}})))});s$2.displayName=`Slider`;var p$6={...o$8,...e$2,...r$13},import_classnames$7=__toESM(require_classnames()),r$12=import_react.forwardRef((t$28,e$31)=>{let{asChild:p$36,className:s$23,...n$24}=v(t$28,p$6),m$15=p$36?Slot$4:`strong`;return import_react.createElement(m$15,{...n$24,ref:e$31,className:(0,import_classnames$7.default)(`rt-Strong`,s$23)})});r$12.displayName=`Strong`;var o$7=[`1`,`2`,`3`],t$5=[`classic`,`surface`,`soft`],a$5={size:{type:`enum`,className:`rt-r-size`,values:o$7,default:`2`,responsive:!0},variant:{type:`enum`,className:`rt-variant`,values:t$5,default:`surface`},...r$4,...o$5,...r$5},import_classnames$6=__toESM(require_classnames()),i$3=import_react.forwardRef((o$28,p$36)=>{let{className:s$23,color:m$15,radius:c$5,...a$37}=v(o$28,a$5,r$3);return import_react.createElement(Root,{"data-accent-color":m$15,"data-radius":c$5,...a$37,asChild:!1,ref:p$36,className:(0,import_classnames$6.default)(`rt-reset`,`rt-SwitchRoot`,s$23)},import_react.createElement(Thumb,{className:(0,import_classnames$6.default)(`rt-SwitchThumb`,{"rt-high-contrast":o$28.highContrast})}))});i$3.displayName=`Switch`;var r$10=[`1`,`2`],t$4=[`nowrap`,`wrap`,`wrap-reverse`],o$6=[`start`,`center`,`end`],p$4={size:{type:`enum`,className:`rt-r-size`,values:r$10,default:`2`,responsive:!0},wrap:{type:`enum`,className:`rt-r-fw`,values:t$4,responsive:!0},justify:{type:`enum`,className:`rt-r-jc`,values:o$6,responsive:!0},...r$4,...o$5},tab_nav_exports=__export({Link:()=>v$1,Root:()=>N$1}),import_classnames$5=__toESM(require_classnames()),N$1=import_react.forwardRef((t$28,r$38)=>{let{children:a$37,className:s$23,color:n$24,...p$36}=v(t$28,p$4,r$3);return import_react.createElement(Root2$5,{className:`rt-TabNavRoot`,"data-accent-color":n$24,...p$36,asChild:!1,ref:r$38},import_react.createElement(List$1,{className:(0,import_classnames$5.default)(`rt-reset`,`rt-BaseTabList`,`rt-TabNavList`,s$23)},a$37))});N$1.displayName=`TabNav.Root`;var v$1=import_react.forwardRef((t$28,r$38)=>{let{asChild:a$37,children:s$23,className:n$24,...p$36}=t$28;return import_react.createElement(Item$1,{className:`rt-TabNavItem`},import_react.createElement(Link,{...p$36,ref:r$38,className:(0,import_classnames$5.default)(`rt-reset`,`rt-BaseTabListTrigger`,`rt-TabNavLink`,n$24),onSelect:void 0,asChild:a$37},d$2({asChild:a$37,children:s$23},i$23=>import_react.createElement(import_react.Fragment,null,import_react.createElement(`span`,{className:`rt-BaseTabListTriggerInner rt-TabNavLinkInner`},i$23),import_react.createElement(`span`,{className:`rt-BaseTabListTriggerInnerHidden rt-TabNavLinkInnerHidden`},i$23)))))});v$1.displayName=`TabNav.Link`;var r$9=[`1`,`2`,`3`],a$4=[`surface`,`ghost`],o$4=[`auto`,`fixed`],n={size:{type:`enum`,className:`rt-r-size`,values:r$9,default:`2`,responsive:!0},variant:{type:`enum`,className:`rt-variant`,values:a$4,default:`ghost`},layout:{type:`enum`,className:`rt-r-tl`,values:o$4,responsive:!0}},i$2=[`start`,`center`,`end`,`baseline`],u$2={align:{type:`enum`,className:`rt-r-va`,values:i$2,parseValue:l,responsive:!0}};function l(e$31){return{baseline:`baseline`,start:`top`,center:`middle`,end:`bottom`}[e$31]}var p$5=[`start`,`center`,`end`],f$2={justify:{type:`enum`,className:`rt-r-ta`,values:p$5,parseValue:c$2,responsive:!0},...t,...p$3};function c$2(e$31){return{start:`left`,center:`center`,end:`right`}[e$31]}var table_exports=__export({Body:()=>b$1,Cell:()=>T,ColumnHeaderCell:()=>f$3,Header:()=>d$1,Root:()=>m$1,Row:()=>P$1,RowHeaderCell:()=>R$1}),import_classnames$4=__toESM(require_classnames()),m$1=import_react.forwardRef((o$28,l$12)=>{let{layout:a$37,...r$38}=n,{className:C$6,children:c$5,layout:y$6,...i$23}=v(o$28,r$38,r$3),w$2=g({value:y$6,className:n.layout.className,propValues:n.layout.values});return import_react.createElement(`div`,{ref:l$12,className:(0,import_classnames$4.default)(`rt-TableRoot`,C$6),...i$23},import_react.createElement(c,null,import_react.createElement(`table`,{className:(0,import_classnames$4.default)(`rt-TableRootTable`,w$2)},c$5)))});m$1.displayName=`Table.Root`;var d$1=import_react.forwardRef(({className:o$28,...l$12},a$37)=>import_react.createElement(`thead`,{...l$12,ref:a$37,className:(0,import_classnames$4.default)(`rt-TableHeader`,o$28)}));d$1.displayName=`Table.Header`;var b$1=import_react.forwardRef(({className:o$28,...l$12},a$37)=>import_react.createElement(`tbody`,{...l$12,ref:a$37,className:(0,import_classnames$4.default)(`rt-TableBody`,o$28)}));b$1.displayName=`Table.Body`;var P$1=import_react.forwardRef((o$28,l$12)=>{let{className:a$37,...r$38}=v(o$28,u$2);return import_react.createElement(`tr`,{...r$38,ref:l$12,className:(0,import_classnames$4.default)(`rt-TableRow`,a$37)})});P$1.displayName=`Table.Row`;var T=import_react.forwardRef((o$28,l$12)=>{let{className:a$37,...r$38}=v(o$28,f$2);return import_react.createElement(`td`,{className:(0,import_classnames$4.default)(`rt-TableCell`,a$37),ref:l$12,...r$38})});T.displayName=`Table.Cell`;var f$3=import_react.forwardRef((o$28,l$12)=>{let{className:a$37,...r$38}=v(o$28,f$2);return import_react.createElement(`th`,{className:(0,import_classnames$4.default)(`rt-TableCell`,`rt-TableColumnHeaderCell`,a$37),scope:`col`,ref:l$12,...r$38})});f$3.displayName=`Table.ColumnHeaderCell`;var R$1=import_react.forwardRef((o$28,l$12)=>{let{className:a$37,...r$38}=v(o$28,f$2);return import_react.createElement(`th`,{className:(0,import_classnames$4.default)(`rt-TableCell`,`rt-TableRowHeaderCell`,a$37),scope:`row`,ref:l$12,...r$38})});R$1.displayName=`Table.RowHeaderCell`;var tabs_exports=__export({Content:()=>f$1,List:()=>b,Root:()=>m,Trigger:()=>P}),import_classnames$3=__toESM(require_classnames()),m=import_react.forwardRef((t$28,o$28)=>{let{className:r$38,...e$31}=v(t$28,r$3);return import_react.createElement(Root2$1,{...e$31,ref:o$28,className:(0,import_classnames$3.default)(`rt-TabsRoot`,r$38)})});m.displayName=`Tabs.Root`;var b=import_react.forwardRef((t$28,o$28)=>{let{className:r$38,color:e$31,...n$24}=v(t$28,p$4,r$3);return import_react.createElement(List,{"data-accent-color":e$31,...n$24,asChild:!1,ref:o$28,className:(0,import_classnames$3.default)(`rt-BaseTabList`,`rt-TabsList`,r$38)})});b.displayName=`Tabs.List`;var P=import_react.forwardRef((t$28,o$28)=>{let{className:r$38,children:e$31,...n$24}=t$28;return import_react.createElement(Trigger$1,{...n$24,asChild:!1,ref:o$28,className:(0,import_classnames$3.default)(`rt-reset`,`rt-BaseTabListTrigger`,`rt-TabsTrigger`,r$38)},import_react.createElement(`span`,{className:`rt-BaseTabListTriggerInner rt-TabsTriggerInner`},e$31),import_react.createElement(`span`,{className:`rt-BaseTabListTriggerInnerHidden rt-TabsTriggerInnerHidden`},e$31))});P.displayName=`Tabs.Trigger`;var f$1=import_react.forwardRef((t$28,o$28)=>{let{className:r$38,...e$31}=v(t$28,r$3);return import_react.createElement(Content,{...e$31,ref:o$28,className:(0,import_classnames$3.default)(`rt-TabsContent`,r$38)})});f$1.displayName=`Tabs.Content`;var r$8=[`1`,`2`,`3`],t$2=[`classic`,`surface`,`soft`],o$3=[`none`,`vertical`,`horizontal`,`both`],a$2={size:{type:`enum`,className:`rt-r-size`,values:r$8,default:`2`,responsive:!0},variant:{type:`enum`,className:`rt-variant`,values:t$2,default:`surface`},resize:{type:`enum`,className:`rt-r-resize`,values:o$3,responsive:!0},...r$4,...r$5},import_classnames$2=__toESM(require_classnames()),r$7=import_react.forwardRef((t$28,o$28)=>{let{className:p$36,color:a$37,radius:s$23,style:m$15,...n$24}=v(t$28,a$2,r$3);return import_react.createElement(`div`,{"data-accent-color":a$37,"data-radius":s$23,className:(0,import_classnames$2.default)(`rt-TextAreaRoot`,p$36),style:m$15},import_react.createElement(`textarea`,{className:`rt-reset rt-TextAreaInput`,ref:o$28,...n$24}))});r$7.displayName=`TextArea`;var r$6=[`1`,`2`,`3`],t$1=[`classic`,`surface`,`soft`],f={size:{type:`enum`,className:`rt-r-size`,values:r$6,default:`2`,responsive:!0},variant:{type:`enum`,className:`rt-variant`,values:t$1,default:`surface`},...r$4,...r$5},a$1=[`left`,`right`],i={side:{type:`enum`,values:a$1},...r$4,gap:u$1.gap,px:p$3.px,pl:p$3.pl,pr:p$3.pr},text_field_exports=__export({Root:()=>u,Slot:()=>c$1}),import_classnames$1=__toESM(require_classnames()),u=import_react.forwardRef((r$38,s$23)=>{let e$31=import_react.useRef(null),{children:l$12,className:i$23,color:p$36,radius:f$20,style:x$3,...P$8}=v(r$38,f,r$3);return import_react.createElement(`div`,{"data-accent-color":p$36,"data-radius":f$20,style:x$3,className:(0,import_classnames$1.default)(`rt-TextFieldRoot`,i$23),onPointerDown:T$5=>{let n$24=T$5.target;if(n$24.closest(`input, button, a`))return;let o$28=e$31.current;if(!o$28)return;let a$37=n$24.closest(`
-            .rt-TextFieldSlot[data-side='right'],
-            .rt-TextFieldSlot:not([data-side='right']) ~ .rt-TextFieldSlot:not([data-side='left'])
-          `)?o$28.value.length:0;requestAnimationFrame(()=>{try{o$28.setSelectionRange(a$37,a$37)}catch{}o$28.focus()})}},import_react.createElement(`input`,{spellCheck:`false`,...P$8,ref:composeRefs(e$31,s$23),className:`rt-reset rt-TextFieldInput`}),l$12)});u.displayName=`TextField.Root`;var c$1=import_react.forwardRef((r$38,s$23)=>{let{className:e$31,color:l$12,side:i$23,...p$36}=v(r$38,i);return import_react.createElement(`div`,{"data-accent-color":l$12,"data-side":i$23,...p$36,ref:s$23,className:(0,import_classnames$1.default)(`rt-TextFieldSlot`,e$31)})});c$1.displayName=`TextField.Slot`;var N=import_react.forwardRef(({defaultOpen:n$24=!0,...a$37},l$12)=>{let[c$5,h$3]=import_react.useState(n$24);return import_react.createElement(z,{...a$37,ref:l$12,open:c$5,onOpenChange:h$3})});N.displayName=`ThemePanel`;var z=import_react.forwardRef((n$24,a$37)=>{let{open:l$12,onOpenChange:c$5,onAppearanceChange:h$3,...v$10}=n$24,G$5=H(),{appearance:d$9,onAppearanceChange:B$4,accentColor:g$7,onAccentColorChange:$,grayColor:f$20,onGrayColorChange:F,panelBackground:T$5,onPanelBackgroundChange:O$1,radius:w$2,onRadiusChange:D$2,scaling:x$3,onScalingChange:j}=G$5,E$4=h$3!==void 0,K$1=useCallbackRef(h$3),k$2=import_react.useCallback(t$28=>{let o$28=a9();if(d$9!==`inherit`){B$4(t$28);return}E$4?K$1(t$28):(H$2(t$28),l9(t$28)),o$28()},[d$9,B$4,E$4,K$1]),P$8=a(g$7),S$4=f$20===`auto`?P$8:f$20,[W$1,M$1]=import_react.useState(`idle`);async function U(){let t$28={appearance:d$9===s$1.appearance.default?void 0:d$9,accentColor:g$7===s$1.accentColor.default?void 0:g$7,grayColor:f$20===s$1.grayColor.default?void 0:f$20,panelBackground:T$5===s$1.panelBackground.default?void 0:T$5,radius:w$2===s$1.radius.default?void 0:w$2,scaling:x$3===s$1.scaling.default?void 0:x$3},o$28=Object.keys(t$28).filter(i$23=>t$28[i$23]!==void 0).map(i$23=>`${i$23}="${t$28[i$23]}"`).join(` `),m$15=o$28?`<Theme ${o$28}>`:`<Theme>`;M$1(`copying`),await navigator.clipboard.writeText(m$15),M$1(`copied`),setTimeout(()=>M$1(`idle`),2e3)}let[Z,H$2]=import_react.useState(d$9===`inherit`?null:d$9),b$5=`
-      [contenteditable],
-      [role="combobox"],
-      [role="listbox"],
-      [role="menu"],
-      input:not([type="radio"], [type="checkbox"]),
-      select,
-      textarea
-    `;return import_react.useEffect(()=>{function t$28(o$28){let m$15=o$28.altKey||o$28.ctrlKey||o$28.shiftKey||o$28.metaKey,i$23=document.activeElement?.closest(b$5);o$28.key?.toUpperCase()===`T`&&!m$15&&!i$23&&c$5(!l$12)}return document.addEventListener(`keydown`,t$28),()=>document.removeEventListener(`keydown`,t$28)},[c$5,l$12,b$5]),import_react.useEffect(()=>{function t$28(o$28){let m$15=o$28.altKey||o$28.ctrlKey||o$28.shiftKey||o$28.metaKey,i$23=document.activeElement?.closest(b$5);o$28.key?.toUpperCase()===`D`&&!m$15&&!i$23&&k$2(Z===`light`?`dark`:`light`)}return document.addEventListener(`keydown`,t$28),()=>document.removeEventListener(`keydown`,t$28)},[k$2,Z,b$5]),import_react.useEffect(()=>{let t$28=document.documentElement,o$28=document.body;function m$15(){let y$6=t$28.classList.contains(`dark`)||t$28.classList.contains(`dark-theme`)||o$28.classList.contains(`dark`)||o$28.classList.contains(`dark-theme`);H$2(d$9===`inherit`?y$6?`dark`:`light`:d$9)}let i$23=new MutationObserver(function(y$6){y$6.forEach(function(X$1){X$1.attributeName===`class`&&m$15()})});return m$15(),d$9===`inherit`&&(i$23.observe(t$28,{attributes:!0}),i$23.observe(o$28,{attributes:!0})),()=>i$23.disconnect()},[d$9]),import_react.createElement(R,{asChild:!0,radius:`medium`,scaling:`100%`},import_react.createElement(p$2,{direction:`column`,position:`fixed`,top:`0`,right:`0`,mr:`4`,mt:`4`,inert:l$12?void 0:r$2,...v$10,ref:a$37,style:{zIndex:9999,overflow:`hidden`,maxHeight:`calc(100vh - var(--space-4) - var(--space-4))`,borderRadius:`var(--radius-4)`,backgroundColor:`var(--color-panel-solid)`,transformOrigin:`top center`,transitionProperty:`transform, box-shadow`,transitionDuration:`200ms`,transitionTimingFunction:l$12?`ease-out`:`ease-in`,transform:l$12?`none`:`translateX(105%)`,boxShadow:l$12?`var(--shadow-5)`:`var(--shadow-2)`,...n$24.style}},import_react.createElement(c,null,import_react.createElement(p$1,{flexGrow:`1`,p:`5`,position:`relative`},import_react.createElement(p$1,{position:`absolute`,top:`0`,right:`0`,m:`2`},import_react.createElement(e$1,{content:`Press T to show/hide the Theme Panel`,side:`bottom`,sideOffset:6},import_react.createElement(r$1,{asChild:!0,size:`3`,tabIndex:0,className:`rt-ThemePanelShortcut`},import_react.createElement(`button`,{onClick:()=>c$5(!l$12)},`T`)))),import_react.createElement(r,{size:`5`,trim:`both`,as:`h3`,mb:`5`},`Theme`),import_react.createElement(p,{id:`accent-color-title`,as:`p`,size:`2`,weight:`medium`,mt:`5`},`Accent color`),import_react.createElement(o$1,{columns:`10`,gap:`2`,mt:`3`,role:`group`,"aria-labelledby":`accent-color-title`},s$1.accentColor.values.map(t$28=>import_react.createElement(`label`,{key:t$28,className:`rt-ThemePanelSwatch`,style:{backgroundColor:`var(--${t$28}-9)`}},import_react.createElement(e$1,{content:`${C(t$28)}${g$7===`gray`&&S$4!==`gray`?` (${C(S$4)})`:``}`},import_react.createElement(`input`,{className:`rt-ThemePanelSwatchInput`,type:`radio`,name:`accentColor`,value:t$28,checked:g$7===t$28,onChange:o$28=>$(o$28.target.value)}))))),import_react.createElement(p$2,{asChild:!0,align:`center`,justify:`between`},import_react.createElement(p,{as:`p`,id:`gray-color-title`,size:`2`,weight:`medium`,mt:`5`},`Gray color`)),import_react.createElement(o$1,{columns:`10`,gap:`2`,mt:`3`,role:`group`,"aria-labelledby":`gray-color-title`},s$1.grayColor.values.map(t$28=>import_react.createElement(p$2,{key:t$28,asChild:!0,align:`center`,justify:`center`},import_react.createElement(`label`,{className:`rt-ThemePanelSwatch`,style:{backgroundColor:t$28===`auto`?`var(--${P$8}-9)`:t$28===`gray`?`var(--gray-9)`:`var(--${t$28}-9)`,filter:t$28===`gray`?`saturate(0)`:void 0}},import_react.createElement(e$1,{content:`${C(t$28)}${t$28===`auto`?` (${C(P$8)})`:``}`},import_react.createElement(`input`,{className:`rt-ThemePanelSwatchInput`,type:`radio`,name:`grayColor`,value:t$28,checked:f$20===t$28,onChange:o$28=>F(o$28.target.value)})))))),import_react.createElement(p,{id:`appearance-title`,as:`p`,size:`2`,weight:`medium`,mt:`5`},`Appearance`),import_react.createElement(o$1,{columns:`2`,gap:`2`,mt:`3`,role:`group`,"aria-labelledby":`appearance-title`},[`light`,`dark`].map(t$28=>import_react.createElement(`label`,{key:t$28,className:`rt-ThemePanelRadioCard`},import_react.createElement(`input`,{className:`rt-ThemePanelRadioCardInput`,type:`radio`,name:`appearance`,value:t$28,checked:Z===t$28,onChange:o$28=>k$2(o$28.target.value)}),import_react.createElement(p$2,{align:`center`,justify:`center`,height:`32px`,gap:`2`},t$28===`light`?import_react.createElement(`svg`,{width:`15`,height:`15`,viewBox:`0 0 15 15`,fill:`none`,xmlns:`http://www.w3.org/2000/svg`,style:{margin:`0 -1px`}},import_react.createElement(`path`,{d:`M7.5 0C7.77614 0 8 0.223858 8 0.5V2.5C8 2.77614 7.77614 3 7.5 3C7.22386 3 7 2.77614 7 2.5V0.5C7 0.223858 7.22386 0 7.5 0ZM2.1967 2.1967C2.39196 2.00144 2.70854 2.00144 2.90381 2.1967L4.31802 3.61091C4.51328 3.80617 4.51328 4.12276 4.31802 4.31802C4.12276 4.51328 3.80617 4.51328 3.61091 4.31802L2.1967 2.90381C2.00144 2.70854 2.00144 2.39196 2.1967 2.1967ZM0.5 7C0.223858 7 0 7.22386 0 7.5C0 7.77614 0.223858 8 0.5 8H2.5C2.77614 8 3 7.77614 3 7.5C3 7.22386 2.77614 7 2.5 7H0.5ZM2.1967 12.8033C2.00144 12.608 2.00144 12.2915 2.1967 12.0962L3.61091 10.682C3.80617 10.4867 4.12276 10.4867 4.31802 10.682C4.51328 10.8772 4.51328 11.1938 4.31802 11.3891L2.90381 12.8033C2.70854 12.9986 2.39196 12.9986 2.1967 12.8033ZM12.5 7C12.2239 7 12 7.22386 12 7.5C12 7.77614 12.2239 8 12.5 8H14.5C14.7761 8 15 7.77614 15 7.5C15 7.22386 14.7761 7 14.5 7H12.5ZM10.682 4.31802C10.4867 4.12276 10.4867 3.80617 10.682 3.61091L12.0962 2.1967C12.2915 2.00144 12.608 2.00144 12.8033 2.1967C12.9986 2.39196 12.9986 2.70854 12.8033 2.90381L11.3891 4.31802C11.1938 4.51328 10.8772 4.51328 10.682 4.31802ZM8 12.5C8 12.2239 7.77614 12 7.5 12C7.22386 12 7 12.2239 7 12.5V14.5C7 14.7761 7.22386 15 7.5 15C7.77614 15 8 14.7761 8 14.5V12.5ZM10.682 10.682C10.8772 10.4867 11.1938 10.4867 11.3891 10.682L12.8033 12.0962C12.9986 12.2915 12.9986 12.608 12.8033 12.8033C12.608 12.9986 12.2915 12.9986 12.0962 12.8033L10.682 11.3891C10.4867 11.1938 10.4867 10.8772 10.682 10.682ZM5.5 7.5C5.5 6.39543 6.39543 5.5 7.5 5.5C8.60457 5.5 9.5 6.39543 9.5 7.5C9.5 8.60457 8.60457 9.5 7.5 9.5C6.39543 9.5 5.5 8.60457 5.5 7.5ZM7.5 4.5C5.84315 4.5 4.5 5.84315 4.5 7.5C4.5 9.15685 5.84315 10.5 7.5 10.5C9.15685 10.5 10.5 9.15685 10.5 7.5C10.5 5.84315 9.15685 4.5 7.5 4.5Z`,fill:`currentColor`,fillRule:`evenodd`,clipRule:`evenodd`})):import_react.createElement(`svg`,{width:`15`,height:`15`,viewBox:`0 0 15 15`,fill:`none`,xmlns:`http://www.w3.org/2000/svg`,style:{margin:`0 -1px`}},import_react.createElement(`path`,{d:`M2.89998 0.499976C2.89998 0.279062 2.72089 0.0999756 2.49998 0.0999756C2.27906 0.0999756 2.09998 0.279062 2.09998 0.499976V1.09998H1.49998C1.27906 1.09998 1.09998 1.27906 1.09998 1.49998C1.09998 1.72089 1.27906 1.89998 1.49998 1.89998H2.09998V2.49998C2.09998 2.72089 2.27906 2.89998 2.49998 2.89998C2.72089 2.89998 2.89998 2.72089 2.89998 2.49998V1.89998H3.49998C3.72089 1.89998 3.89998 1.72089 3.89998 1.49998C3.89998 1.27906 3.72089 1.09998 3.49998 1.09998H2.89998V0.499976ZM5.89998 3.49998C5.89998 3.27906 5.72089 3.09998 5.49998 3.09998C5.27906 3.09998 5.09998 3.27906 5.09998 3.49998V4.09998H4.49998C4.27906 4.09998 4.09998 4.27906 4.09998 4.49998C4.09998 4.72089 4.27906 4.89998 4.49998 4.89998H5.09998V5.49998C5.09998 5.72089 5.27906 5.89998 5.49998 5.89998C5.72089 5.89998 5.89998 5.72089 5.89998 5.49998V4.89998H6.49998C6.72089 4.89998 6.89998 4.72089 6.89998 4.49998C6.89998 4.27906 6.72089 4.09998 6.49998 4.09998H5.89998V3.49998ZM1.89998 6.49998C1.89998 6.27906 1.72089 6.09998 1.49998 6.09998C1.27906 6.09998 1.09998 6.27906 1.09998 6.49998V7.09998H0.499976C0.279062 7.09998 0.0999756 7.27906 0.0999756 7.49998C0.0999756 7.72089 0.279062 7.89998 0.499976 7.89998H1.09998V8.49998C1.09998 8.72089 1.27906 8.89997 1.49998 8.89997C1.72089 8.89997 1.89998 8.72089 1.89998 8.49998V7.89998H2.49998C2.72089 7.89998 2.89998 7.72089 2.89998 7.49998C2.89998 7.27906 2.72089 7.09998 2.49998 7.09998H1.89998V6.49998ZM8.54406 0.98184L8.24618 0.941586C8.03275 0.917676 7.90692 1.1655 8.02936 1.34194C8.17013 1.54479 8.29981 1.75592 8.41754 1.97445C8.91878 2.90485 9.20322 3.96932 9.20322 5.10022C9.20322 8.37201 6.82247 11.0878 3.69887 11.6097C3.45736 11.65 3.20988 11.6772 2.96008 11.6906C2.74563 11.702 2.62729 11.9535 2.77721 12.1072C2.84551 12.1773 2.91535 12.2458 2.98667 12.3128L3.05883 12.3795L3.31883 12.6045L3.50684 12.7532L3.62796 12.8433L3.81491 12.9742L3.99079 13.089C4.11175 13.1651 4.23536 13.2375 4.36157 13.3059L4.62496 13.4412L4.88553 13.5607L5.18837 13.6828L5.43169 13.7686C5.56564 13.8128 5.70149 13.8529 5.83857 13.8885C5.94262 13.9155 6.04767 13.9401 6.15405 13.9622C6.27993 13.9883 6.40713 14.0109 6.53544 14.0298L6.85241 14.0685L7.11934 14.0892C7.24637 14.0965 7.37436 14.1002 7.50322 14.1002C11.1483 14.1002 14.1032 11.1453 14.1032 7.50023C14.1032 7.25044 14.0893 7.00389 14.0623 6.76131L14.0255 6.48407C13.991 6.26083 13.9453 6.04129 13.8891 5.82642C13.8213 5.56709 13.7382 5.31398 13.6409 5.06881L13.5279 4.80132L13.4507 4.63542L13.3766 4.48666C13.2178 4.17773 13.0353 3.88295 12.8312 3.60423L12.6782 3.40352L12.4793 3.16432L12.3157 2.98361L12.1961 2.85951L12.0355 2.70246L11.8134 2.50184L11.4925 2.24191L11.2483 2.06498L10.9562 1.87446L10.6346 1.68894L10.3073 1.52378L10.1938 1.47176L9.95488 1.3706L9.67791 1.2669L9.42566 1.1846L9.10075 1.09489L8.83599 1.03486L8.54406 0.98184ZM10.4032 5.30023C10.4032 4.27588 10.2002 3.29829 9.83244 2.40604C11.7623 3.28995 13.1032 5.23862 13.1032 7.50023C13.1032 10.593 10.596 13.1002 7.50322 13.1002C6.63646 13.1002 5.81597 12.9036 5.08355 12.5522C6.5419 12.0941 7.81081 11.2082 8.74322 10.0416C8.87963 10.2284 9.10028 10.3497 9.34928 10.3497C9.76349 10.3497 10.0993 10.0139 10.0993 9.59971C10.0993 9.24256 9.84965 8.94373 9.51535 8.86816C9.57741 8.75165 9.63653 8.63334 9.6926 8.51332C9.88358 8.63163 10.1088 8.69993 10.35 8.69993C11.0403 8.69993 11.6 8.14028 11.6 7.44993C11.6 6.75976 11.0406 6.20024 10.3505 6.19993C10.3853 5.90487 10.4032 5.60464 10.4032 5.30023Z`,fill:`currentColor`,fillRule:`evenodd`,clipRule:`evenodd`})),import_react.createElement(p,{size:`1`,weight:`medium`},C(t$28)))))),import_react.createElement(p,{id:`radius-title`,as:`p`,size:`2`,weight:`medium`,mt:`5`},`Radius`),import_react.createElement(o$1,{columns:`5`,gap:`2`,mt:`3`,role:`group`,"aria-labelledby":`radius-title`},s$1.radius.values.map(t$28=>import_react.createElement(p$2,{key:t$28,direction:`column`,align:`center`},import_react.createElement(`label`,{className:`rt-ThemePanelRadioCard`},import_react.createElement(`input`,{className:`rt-ThemePanelRadioCardInput`,type:`radio`,name:`radius`,id:`theme-panel-radius-${t$28}`,value:t$28,checked:w$2===t$28,onChange:o$28=>D$2(o$28.target.value)}),import_react.createElement(R,{asChild:!0,radius:t$28},import_react.createElement(p$1,{m:`3`,width:`32px`,height:`32px`,style:{borderTopLeftRadius:t$28===`full`?`80%`:`var(--radius-5)`,backgroundImage:`linear-gradient(to bottom right, var(--accent-3), var(--accent-4))`,borderTop:`2px solid var(--accent-a8)`,borderLeft:`2px solid var(--accent-a8)`}}))),import_react.createElement(p$1,{asChild:!0,pt:`2`},import_react.createElement(p,{asChild:!0,size:`1`,color:`gray`},import_react.createElement(`label`,{htmlFor:`theme-panel-radius-${t$28}`},C(t$28))))))),import_react.createElement(p,{id:`scaling-title`,as:`p`,size:`2`,weight:`medium`,mt:`5`},`Scaling`),import_react.createElement(o$1,{columns:`5`,gap:`2`,mt:`3`,role:`group`,"aria-labelledby":`scaling-title`},s$1.scaling.values.map(t$28=>import_react.createElement(`label`,{key:t$28,className:`rt-ThemePanelRadioCard`},import_react.createElement(`input`,{className:`rt-ThemePanelRadioCardInput`,type:`radio`,name:`scaling`,value:t$28,checked:x$3===t$28,onChange:o$28=>j(o$28.target.value)}),import_react.createElement(p$2,{align:`center`,justify:`center`,height:`32px`},import_react.createElement(R,{asChild:!0,scaling:t$28},import_react.createElement(p$2,{align:`center`,justify:`center`},import_react.createElement(p,{size:`1`,weight:`medium`},C(t$28)))))))),import_react.createElement(p$2,{mt:`5`,align:`center`,gap:`2`},import_react.createElement(p,{id:`panel-background-title`,as:`p`,size:`2`,weight:`medium`},`Panel background`),import_react.createElement(P$4,null,import_react.createElement(s$6,null,import_react.createElement(o$2,{size:`1`,variant:`ghost`,color:`gray`},import_react.createElement(s,{label:`Learn more about panel background options`},import_react.createElement(`svg`,{width:`15`,height:`15`,viewBox:`0 0 15 15`,fill:`currentColor`,xmlns:`http://www.w3.org/2000/svg`},import_react.createElement(`path`,{d:`M7.49991 0.876892C3.84222 0.876892 0.877075 3.84204 0.877075 7.49972C0.877075 11.1574 3.84222 14.1226 7.49991 14.1226C11.1576 14.1226 14.1227 11.1574 14.1227 7.49972C14.1227 3.84204 11.1576 0.876892 7.49991 0.876892ZM1.82707 7.49972C1.82707 4.36671 4.36689 1.82689 7.49991 1.82689C10.6329 1.82689 13.1727 4.36671 13.1727 7.49972C13.1727 10.6327 10.6329 13.1726 7.49991 13.1726C4.36689 13.1726 1.82707 10.6327 1.82707 7.49972ZM8.24992 4.49999C8.24992 4.9142 7.91413 5.24999 7.49992 5.24999C7.08571 5.24999 6.74992 4.9142 6.74992 4.49999C6.74992 4.08577 7.08571 3.74999 7.49992 3.74999C7.91413 3.74999 8.24992 4.08577 8.24992 4.49999ZM6.00003 5.99999H6.50003H7.50003C7.77618 5.99999 8.00003 6.22384 8.00003 6.49999V9.99999H8.50003H9.00003V11H8.50003H7.50003H6.50003H6.00003V9.99999H6.50003H7.00003V6.99999H6.50003H6.00003V5.99999Z`,fillRule:`evenodd`,clipRule:`evenodd`}))))),import_react.createElement(i$8,{size:`1`,style:{maxWidth:220},side:`top`,align:`center`},import_react.createElement(p,{as:`p`,size:`2`},`Whether Card and Table panels are translucent, showing some of\xA0the background behind them.`)))),import_react.createElement(o$1,{columns:`2`,gap:`2`,mt:`3`,role:`group`,"aria-labelledby":`panel-background-title`},s$1.panelBackground.values.map(t$28=>import_react.createElement(`label`,{key:t$28,className:`rt-ThemePanelRadioCard`},import_react.createElement(`input`,{className:`rt-ThemePanelRadioCardInput`,type:`radio`,name:`panelBackground`,value:t$28,checked:T$5===t$28,onChange:o$28=>O$1(o$28.target.value)}),import_react.createElement(p$2,{align:`center`,justify:`center`,height:`32px`,gap:`2`},t$28===`solid`?import_react.createElement(`svg`,{width:`15`,height:`15`,viewBox:`0 0 15 15`,fill:`none`,xmlns:`http://www.w3.org/2000/svg`,style:{margin:`0 -2px`}},import_react.createElement(`path`,{d:`M0.877075 7.49988C0.877075 3.84219 3.84222 0.877045 7.49991 0.877045C11.1576 0.877045 14.1227 3.84219 14.1227 7.49988C14.1227 11.1575 11.1576 14.1227 7.49991 14.1227C3.84222 14.1227 0.877075 11.1575 0.877075 7.49988ZM7.49991 1.82704C4.36689 1.82704 1.82708 4.36686 1.82708 7.49988C1.82708 10.6329 4.36689 13.1727 7.49991 13.1727C10.6329 13.1727 13.1727 10.6329 13.1727 7.49988C13.1727 4.36686 10.6329 1.82704 7.49991 1.82704Z`,fill:`currentColor`,fillRule:`evenodd`,clipRule:`evenodd`})):import_react.createElement(`svg`,{width:`15`,height:`15`,viewBox:`0 0 15 15`,fill:`none`,xmlns:`http://www.w3.org/2000/svg`,style:{margin:`0 -2px`}},import_react.createElement(`path`,{opacity:`.05`,d:`M6.78296 13.376C8.73904 9.95284 8.73904 5.04719 6.78296 1.62405L7.21708 1.37598C9.261 4.95283 9.261 10.0472 7.21708 13.624L6.78296 13.376Z`,fill:`currentColor`,fillRule:`evenodd`,clipRule:`evenodd`}),import_react.createElement(`path`,{opacity:`.1`,d:`M7.28204 13.4775C9.23929 9.99523 9.23929 5.00475 7.28204 1.52248L7.71791 1.2775C9.76067 4.9119 9.76067 10.0881 7.71791 13.7225L7.28204 13.4775Z`,fill:`currentColor`,fillRule:`evenodd`,clipRule:`evenodd`}),import_react.createElement(`path`,{opacity:`.15`,d:`M7.82098 13.5064C9.72502 9.99523 9.72636 5.01411 7.82492 1.50084L8.26465 1.26285C10.2465 4.92466 10.2451 10.085 8.26052 13.7448L7.82098 13.5064Z`,fill:`currentColor`,fillRule:`evenodd`,clipRule:`evenodd`}),import_react.createElement(`path`,{opacity:`.2`,d:`M8.41284 13.429C10.1952 9.92842 10.1957 5.07537 8.41435 1.57402L8.85999 1.34729C10.7139 4.99113 10.7133 10.0128 8.85841 13.6559L8.41284 13.429Z`,fill:`currentColor`,fillRule:`evenodd`,clipRule:`evenodd`}),import_react.createElement(`path`,{opacity:`.25`,d:`M9.02441 13.2956C10.6567 9.8379 10.6586 5.17715 9.03005 1.71656L9.48245 1.50366C11.1745 5.09919 11.1726 9.91629 9.47657 13.5091L9.02441 13.2956Z`,fill:`currentColor`,fillRule:`evenodd`,clipRule:`evenodd`}),import_react.createElement(`path`,{opacity:`.3`,d:`M9.66809 13.0655C11.1097 9.69572 11.1107 5.3121 9.67088 1.94095L10.1307 1.74457C11.6241 5.24121 11.6231 9.76683 10.1278 13.2622L9.66809 13.0655Z`,fill:`currentColor`,fillRule:`evenodd`,clipRule:`evenodd`}),import_react.createElement(`path`,{opacity:`.35`,d:`M10.331 12.7456C11.5551 9.52073 11.5564 5.49103 10.3347 2.26444L10.8024 2.0874C12.0672 5.42815 12.0659 9.58394 10.7985 12.9231L10.331 12.7456Z`,fill:`currentColor`,fillRule:`evenodd`,clipRule:`evenodd`}),import_react.createElement(`path`,{opacity:`.4`,d:`M11.0155 12.2986C11.9938 9.29744 11.9948 5.71296 11.0184 2.71067L11.4939 2.55603C12.503 5.6589 12.502 9.35178 11.4909 12.4535L11.0155 12.2986Z`,fill:`currentColor`,fillRule:`evenodd`,clipRule:`evenodd`}),import_react.createElement(`path`,{opacity:`.45`,d:`M11.7214 11.668C12.4254 9.01303 12.4262 5.99691 11.7237 3.34116L12.2071 3.21329C12.9318 5.95292 12.931 9.05728 12.2047 11.7961L11.7214 11.668Z`,fill:`currentColor`,fillRule:`evenodd`,clipRule:`evenodd`}),import_react.createElement(`path`,{opacity:`.5`,d:`M12.4432 10.752C12.8524 8.63762 12.8523 6.36089 12.4429 4.2466L12.9338 4.15155C13.3553 6.32861 13.3554 8.66985 12.9341 10.847L12.4432 10.752Z`,fill:`currentColor`,fillRule:`evenodd`,clipRule:`evenodd`}),import_react.createElement(`path`,{d:`M0.877075 7.49988C0.877075 3.84219 3.84222 0.877045 7.49991 0.877045C11.1576 0.877045 14.1227 3.84219 14.1227 7.49988C14.1227 11.1575 11.1576 14.1227 7.49991 14.1227C3.84222 14.1227 0.877075 11.1575 0.877075 7.49988ZM7.49991 1.82704C4.36689 1.82704 1.82708 4.36686 1.82708 7.49988C1.82708 10.6329 4.36689 13.1727 7.49991 13.1727C10.6329 13.1727 13.1727 10.6329 13.1727 7.49988C13.1727 4.36686 10.6329 1.82704 7.49991 1.82704Z`,fill:`currentColor`,fillRule:`evenodd`,clipRule:`evenodd`})),import_react.createElement(p,{size:`1`,weight:`medium`},C(t$28)))))),import_react.createElement(o,{mt:`5`,style:{width:`100%`},onClick:U},W$1===`copied`?`Copied`:`Copy Theme`)))))});z.displayName=`ThemePanelImpl`;function a9(){let n$24=document.createElement(`style`);return n$24.appendChild(document.createTextNode(`*,*::before,*::after{-webkit-transition:none!important;-moz-transition:none!important;-o-transition:none!important;-ms-transition:none!important;transition:none!important}`)),document.head.appendChild(n$24),()=>{window.getComputedStyle(document.body),setTimeout(()=>{document.head.removeChild(n$24)},1)}}function C(n$24){return n$24.charAt(0).toUpperCase()+n$24.slice(1)}function l9(n$24){let a$37=document.documentElement,l$12=a$37.classList.contains(`light-theme`),c$5=a$37.classList.contains(`dark-theme`),h$3=a$37.classList.contains(`light`),v$10=a$37.classList.contains(`dark`);(l$12||c$5)&&(a$37.classList.remove(`light-theme`,`dark-theme`),a$37.style.colorScheme=n$24,a$37.classList.add(`${n$24}-theme`)),(h$3||v$10)&&(a$37.classList.remove(`light`,`dark`),a$37.style.colorScheme=n$24,a$37.classList.add(n$24)),!l$12&&!c$5&&!h$3&&!v$10&&(a$37.style.colorScheme=n$24,a$37.classList.add(n$24))}var e={content:{type:`ReactNode`,required:!0},width:t.width,minWidth:t.minWidth,maxWidth:{...t.maxWidth,default:`360px`}},import_classnames=__toESM(require_classnames()),e$1=import_react.forwardRef((i$23,p$36)=>{let{children:r$38,className:n$24,open:s$23,defaultOpen:l$12,onOpenChange:m$15,delayDuration:a$37,disableHoverableContent:f$20,content:P$8,container:T$5,forceMount:c$5,...d$9}=v(i$23,e),C$6={open:s$23,defaultOpen:l$12,onOpenChange:m$15,delayDuration:a$37,disableHoverableContent:f$20};return import_react.createElement(Root3,{...C$6},import_react.createElement(Trigger,{asChild:!0},r$38),import_react.createElement(Portal$1,{container:T$5,forceMount:c$5},import_react.createElement(R,{asChild:!0},import_react.createElement(Content2,{sideOffset:4,collisionPadding:10,...d$9,asChild:!1,ref:p$36,className:(0,import_classnames.default)(`rt-TooltipContent`,n$24)},import_react.createElement(p,{as:`p`,className:`rt-TooltipText`,size:`1`},P$8),import_react.createElement(Arrow2,{className:`rt-TooltipArrow`})))))});e$1.displayName=`Tooltip`;var esm_exports=__export({AccessibleIcon:()=>s,AlertDialog:()=>alert_dialog_exports,AspectRatio:()=>i$21,Avatar:()=>i$20,Badge:()=>e$21,Blockquote:()=>e$20,Box:()=>p$1,Button:()=>o,Callout:()=>callout_exports,Card:()=>o$23,Checkbox:()=>c$3,CheckboxCards:()=>checkbox_cards_exports,CheckboxGroup:()=>checkbox_group_exports,ChevronDownIcon:()=>i$5,Code:()=>p$24,Container:()=>p$22,ContextMenu:()=>context_menu_exports,DataList:()=>data_list_exports,Dialog:()=>dialog_exports,DropdownMenu:()=>dropdown_menu_exports,Em:()=>e$11,Flex:()=>p$2,Grid:()=>o$1,Heading:()=>r,HoverCard:()=>hover_card_exports,IconButton:()=>o$2,Inset:()=>e$9,Kbd:()=>r$1,Link:()=>e$7,Popover:()=>popover_exports,Portal:()=>r$20,Progress:()=>s$5,Quote:()=>e$6,Radio:()=>e$5,RadioCards:()=>radio_cards_exports,RadioGroup:()=>radio_group_exports,Reset:()=>o$14,ScrollArea:()=>c,Section:()=>r$17,SegmentedControl:()=>segmented_control_exports,Select:()=>select_exports,Separator:()=>o$10,Skeleton:()=>r$14,Slider:()=>s$2,Slot:()=>e$13,Slottable:()=>r$36,Spinner:()=>s$18,Strong:()=>r$12,Switch:()=>i$3,TabNav:()=>tab_nav_exports,Table:()=>table_exports,Tabs:()=>tabs_exports,Text:()=>p,TextArea:()=>r$7,TextField:()=>text_field_exports,Theme:()=>R,ThemeContext:()=>P$7,ThemePanel:()=>N,ThickCheckIcon:()=>t$8,ThickChevronRightIcon:()=>l$4,ThickDividerHorizontalIcon:()=>r$29,Tooltip:()=>e$1,VisuallyHidden:()=>d$6,useThemeContext:()=>H});export{Primitive$1 as A,defaultColorMode as B,i$20 as C,useId as D,r as E,EventLoopContext as F,isTrue as G,ReflexEvent as H,EventLoopProvider as I,refs as K,StateContexts as L,useComposedRefs as M,ClientSide as N,composeEventHandlers as O,ColorModeContext as P,StateProvider as R,p$1 as S,p as T,getBackendURL as U,isDevMode as V,isNotNullOrUndefined as W,e$7 as _,R$1 as a,o as b,d$1 as c,o$10 as d,C$1 as f,y$1 as g,v$2 as h,P$1 as i,require_jsx_runtime as j,createContextScope as k,f$3 as l,u$3 as m,u as n,T as o,g$1 as p,state_exports as q,r$7 as r,b$1 as s,esm_exports as t,m$1 as u,o$1 as v,R as w,p$2 as x,o$23 as y,context_exports as z};
\ No newline at end of file
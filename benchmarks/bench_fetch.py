@@ -0,0 +1,304 @@
+"""Row materialization: per-row Python loops vs column-wise fetch_records.
+
+For each dashboard loader, times the previous implementation (fetchall()
+and a Python loop that unpacks tuples, calls strftime and builds dicts)
+against the shipped one (formatting in SQL, aio.columns + aio.as_records),
+on the same cursor and data. Both must produce identical rows; the benchmark
+stops if they differ. Point HRMS_DB_PATH at a database filled by
+database_connections.seed:
+
+    HRMS_DB_PATH=/tmp/load.duckdb python -m database_connections.seed --tenants 1 --employees 50000 --years 1
+    HRMS_DB_PATH=/tmp/load.duckdb python -m benchmarks.bench_fetch [--runs 20] [--tenant seed-0001]
+
+--output appends one JSON line per run so regressions can be tracked over time.
+"""
+import argparse
+import json
+import os
+import statistics
+import time
+from datetime import date, datetime, timedelta
+
+from database_connections import aio
+from database_connections.pool import read_cursor
+from templates.admin_attendance_dashboard import DAILY_ATTENDANCE_SQL, MONTHLY_ATTENDANCE_SQL
+from templates.admin_dashboard import EMPLOYEES_TODAY_SQL
+from templates.admin_payroll_dashboard import PAYROLL_MONTH_SQL
+from templates.employee_dashboard import ATTENDANCE_HISTORY_SQL
+from templates.employee_leave_dashboard import LEAVE_HISTORY_SQL
+
+
+# ----------------------------
+# Previous loaders (baseline)
+# ----------------------------
+def loop_load_attendance(cur, tenant_id, day):
+    rows = cur.execute(
+        """
+        SELECT u.user_id, u.name, u.email, u.role, s.first_in, s.last_out
+        FROM users u
+        LEFT JOIN attendance_daily_summary s
+            ON s.tenant_id = u.tenant_id AND s.user_id = u.user_id AND s.date = ?
+        WHERE u.tenant_id = ? AND u.status = 'active'
+        ORDER BY u.name
+        """,
+        (day, tenant_id),
+    ).fetchall()
+    data = []
+    for user_id, name, email, role, check_in, check_out in rows:
+        data.append({
+            "user_id": user_id,
+            "name": name,
+            "email": email,
+            "role": role or "N/A",
+            "check_in": check_in.strftime("%H:%M:%S") if check_in else "-",
+            "check_out": check_out.strftime("%H:%M:%S") if check_out else "-",
+            "status": "Present" if check_in else "Absent",
+        })
+    return data
+
+
+def loop_get_employees(cur, tenant_id, day):
+    rows = cur.execute(
+        """
+        SELECT u.user_id, u.name, u.email, u.role, u.date_joined, s.first_in, s.last_out, s.status
+        FROM users u
+        LEFT JOIN attendance_daily_summary s
+            ON s.tenant_id = u.tenant_id AND s.user_id = u.user_id AND s.date = ?
+        WHERE u.tenant_id = ? AND u.status = 'active'
+        ORDER BY u.name
+        """,
+        (day, tenant_id),
+    ).fetchall()
+    data = []
+    for user_id, name, email, role, date_joined, check_in, check_out, status in rows:
+        data.append({
+            "user_id": user_id,
+            "name": name,
+            "email": email,
+            "role": role or "N/A",
+            "check_in": "Yes" if check_in is not None else "No",
+            "check_out": "Yes" if check_out is not None else "No",
+            "date_joined": date_joined.strftime("%Y-%m-%d") if date_joined else "N/A",
+            "days_since": (day - date_joined.date()).days if date_joined else 0,
+            "status": status,
+        })
+    return data
+
+
+def loop_get_monthly_attendance(cur, tenant_id, user_id, month_start, month_end):
+    rows = cur.execute(
+        """
+        SELECT date, first_in, last_out, status
+        FROM attendance_daily_summary
+        WHERE tenant_id = ? AND user_id = ? AND date >= ? AND date <= ?
+        ORDER BY date
+        """,
+        (tenant_id, user_id, month_start, month_end),
+    ).fetchall()
+    row_map = {r[0]: r for r in rows}
+    data = []
+    current = month_start
+    while current <= month_end:
+        if current in row_map:
+            _, check_in, check_out, status = row_map[current]
+            data.append({
+                "date": current.strftime("%Y-%m-%d"),
+                "check_in": check_in.strftime("%H:%M") if check_in else "N/A",
+                "check_out": check_out.strftime("%H:%M") if check_out else "N/A",
+                "status": status or "Present",
+            })
+        else:
+            data.append({"date": current.strftime("%Y-%m-%d"), "check_in": "Absent", "check_out": "N/A", "status": "Absent"})
+        current += timedelta(days=1)
+    return data
+
+
+def loop_get_attendance_history(cur, tenant_id, user_id, since):
+    rows = cur.execute(
+        """
+        SELECT date, first_in, last_out, status, worked_minutes
+        FROM attendance_daily_summary
+        WHERE tenant_id = ? AND user_id = ? AND date >= ?
+        ORDER BY date DESC
+        """,
+        (tenant_id, user_id, since),
+    ).fetchall()
+    data = []
+    for day, check_in, check_out, status, worked_minutes in rows:
+        data.append({
+            "date": day.strftime("%Y-%m-%d"),
+            "check_in": check_in.strftime("%H:%M") if check_in else "N/A",
+            "check_out": check_out.strftime("%H:%M") if check_out else "N/A",
+            "status": status or "N/A",
+            "hours_worked": f"{worked_minutes / 60:.1f}" if worked_minutes else "N/A",
+        })
+    return data
+
+
+def loop_get_leaves_history(cur, tenant_id, user_id):
+    rows = cur.execute(
+        """
+        SELECT leave_id, type, start_date, end_date, status, requested_at
+        FROM leaves
+        WHERE tenant_id = ? AND user_id = ?
+        ORDER BY requested_at DESC
+        """,
+        (tenant_id, user_id),
+    ).fetchall()
+    data = []
+    for leave_id, leave_type, start_d, end_d, status, requested in rows:
+        data.append({
+            "id": leave_id,
+            "type": leave_type or "N/A",
+            "start_date": start_d.strftime("%Y-%m-%d") if start_d else "N/A",
+            "end_date": end_d.strftime("%Y-%m-%d") if end_d else "N/A",
+            "duration": (end_d - start_d).days + 1 if start_d and end_d else 0,
+            "status": status or "N/A",
+            "requested": requested.strftime("%Y-%m-%d") if requested else "N/A",
+        })
+    return data
+
+
+def loop_load_payroll(cur, tenant_id, month_start, month_end):
+    rows = cur.execute(
+        """
+        SELECT u.user_id, u.name, p.month, p.gross_salary, p.deductions, p.net_salary
+        FROM payroll p
+        JOIN users u ON p.user_id = u.user_id
+        WHERE p.tenant_id = ? AND p.month >= ? AND p.month < ?
+        ORDER BY u.name
+        """,
+        (tenant_id, month_start, month_end),
+    ).fetchall()
+    data = []
+    for user_id, name, month, gross, ded, net in rows:
+        data.append({
+            "user_id": user_id,
+            "name": name,
+            "month": month.strftime("%Y-%m"),
+            "gross": gross or 0,
+            "deductions": ded or 0,
+            "net": net or 0,
+        })
+    return data
+
+
+def records(sql):
+    return lambda cur, *params: aio.as_records(aio.columns(cur, sql, params))
+
+
+def percentile(samples, p):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(p / 100 * (len(ordered) - 1))))]
+
+
+def pick(cur, tenant_id):
+    """(tenant_id, latest day, busiest user, latest payroll month) to drive the loaders."""
+    tenant_id = tenant_id or cur.execute(
+        "SELECT tenant_id FROM users GROUP BY tenant_id ORDER BY COUNT(*) DESC LIMIT 1"
+    ).fetchone()
+    if tenant_id is None:
+        raise SystemExit("[BENCH] No tenant found - seed the database first (python -m database_connections.seed)")
+    tenant_id = tenant_id if isinstance(tenant_id, str) else tenant_id[0]
+    day = cur.execute(
+        "SELECT MAX(date) FROM attendance_daily_summary WHERE tenant_id = ?", (tenant_id,)
+    ).fetchone()[0] or date.today()
+    user_id = cur.execute(
+        """
+        SELECT user_id FROM leaves WHERE tenant_id = ?
+        GROUP BY user_id ORDER BY COUNT(*) DESC LIMIT 1
+        """,
+        (tenant_id,),
+    ).fetchone()
+    if user_id is None:
+        user_id = cur.execute("SELECT MIN(user_id) FROM users WHERE tenant_id = ?", (tenant_id,)).fetchone()
+    month = cur.execute("SELECT MAX(month) FROM payroll WHERE tenant_id = ?", (tenant_id,)).fetchone()[0] or day
+    return tenant_id, day, user_id[0], month
+
+
+def run(args):
+    with read_cursor() as cur:
+        tenant_id, day, user_id, month = pick(cur, args.tenant)
+        month_start = day.replace(day=1)
+        month_end = (month_start + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+        pay_start = month.replace(day=1)
+        pay_end = (pay_start + timedelta(days=32)).replace(day=1)
+
+        cases = {
+            "load_attendance": (
+                loop_load_attendance, (tenant_id, day),
+                records(DAILY_ATTENDANCE_SQL), (day, tenant_id),
+            ),
+            "get_employees": (
+                loop_get_employees, (tenant_id, day),
+                records(EMPLOYEES_TODAY_SQL), (day, day, tenant_id),
+            ),
+            "get_monthly_attendance": (
+                loop_get_monthly_attendance, (tenant_id, user_id, month_start, month_end),
+                records(MONTHLY_ATTENDANCE_SQL), (month_start, month_end, tenant_id, user_id),
+            ),
+            "get_attendance_history": (
+                loop_get_attendance_history, (tenant_id, user_id, day - timedelta(days=30)),
+                records(ATTENDANCE_HISTORY_SQL), (tenant_id, user_id, day - timedelta(days=30)),
+            ),
+            "get_leaves_history": (
+                loop_get_leaves_history, (tenant_id, user_id),
+                records(LEAVE_HISTORY_SQL), (tenant_id, user_id),
+            ),
+            "load_payroll": (
+                loop_load_payroll, (tenant_id, pay_start, pay_end),
+                records(PAYROLL_MONTH_SQL), (tenant_id, pay_start, pay_end),
+            ),
+        }
+        print(f"[BENCH] tenant {tenant_id}, day {day}, user {user_id}, payroll month {pay_start:%Y-%m}")
+
+        results = {}
+        for name, (loop_fn, loop_params, new_fn, new_params) in cases.items():
+            if args.only and name not in args.only:
+                continue
+            expected, actual = loop_fn(cur, *loop_params), new_fn(cur, *new_params)
+            if expected != actual:
+                diff = next((i for i, (a, b) in enumerate(zip(expected, actual)) if a != b), min(len(expected), len(actual)))
+                raise SystemExit(
+                    f"[BENCH] {name}: rows differ at {diff} "
+                    f"({expected[diff:diff + 1]} vs {actual[diff:diff + 1]}, {len(expected)} vs {len(actual)} rows)"
+                )
+            timings = {}
+            for label, fn, params in (("loop", loop_fn, loop_params), ("columns", new_fn, new_params)):
+                samples = []
+                for _ in range(args.runs):
+                    started = time.perf_counter()
+                    fn(cur, *params)
+                    samples.append((time.perf_counter() - started) * 1000)
+                timings[label] = {"p50": round(statistics.median(samples), 3), "p95": round(percentile(samples, 95), 3)}
+            results[name] = {"rows": len(expected), **timings}
+
+    print(f"\n{'loader':24} {'rows':>8} {'loop p50':>10} {'cols p50':>10} {'speedup':>8}")
+    for name, r in results.items():
+        speedup = r["loop"]["p50"] / r["columns"]["p50"] if r["columns"]["p50"] else float("inf")
+        print(f"{name:24} {r['rows']:8d} {r['loop']['p50']:10.2f} {r['columns']['p50']:10.2f} {speedup:7.1f}x")
+
+    if args.output:
+        record = {
+            "at": datetime.now().isoformat(timespec="seconds"),
+            "db": os.environ.get("HRMS_DB_PATH", "hrms.duckdb"),
+            "tenant_id": tenant_id,
+            "runs": args.runs,
+            "loaders": results,
+        }
+        with open(args.output, "a") as f:
+            f.write(json.dumps(record) + "\n")
+        print(f"[BENCH] Appended results to {args.output}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tenant", help="tenant_id to drive (default: the largest tenant)")
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--only", nargs="*", help="subset of loaders to run")
+    parser.add_argument("--output", help="append a JSON line with the results to this file")
+    run(parser.parse_args())
+
+
+if __name__ == "__main__":
+    main()
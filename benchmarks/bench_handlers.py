@@ -0,0 +1,154 @@
+"""Latency of the dashboard state handlers against a seeded database.
+
+Drives the real Reflex event handlers (generate_report, load_attendance,
+get_metrics, load_payroll, login_user) in-process, the way the backend runs
+them for one client, and reports p50/p95/p99 per handler. Point
+HRMS_DB_PATH at a database filled by database_connections.seed:
+
+    HRMS_DB_PATH=/tmp/load.duckdb python -m database_connections.seed --tenants 3 --employees 10000 --years 2
+    HRMS_DB_PATH=/tmp/load.duckdb python -m benchmarks.bench_handlers [--runs 50] [--tenant seed-0001]
+
+--output appends one JSON line per run so regressions can be tracked over time.
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import time
+from datetime import date, datetime
+
+import reflex as rx
+
+from database_connections import aio
+from templates.admin_attendance_dashboard import AttendanceDashboardState
+from templates.admin_dashboard import AdminDashboardState
+from templates.admin_payroll_dashboard import PayrollDashboardState
+from templates.login import LoginState
+
+
+def substate(root, cls):
+    return root.get_substate(cls.get_full_name().split(".")[1:])
+
+
+async def pick_tenant(tenant_id: str | None):
+    """(tenant_id, company_name, admin username) of the given or largest seeded tenant."""
+    row = await aio.fetchone(
+        """
+        SELECT t.tenant_id, t.company_name, MIN(l.username)
+        FROM tenants t
+        JOIN users u ON u.tenant_id = t.tenant_id
+        JOIN logins l ON l.user_id = u.user_id
+        WHERE (? IS NULL OR t.tenant_id = ?)
+        GROUP BY t.tenant_id, t.company_name
+        ORDER BY COUNT(*) DESC
+        LIMIT 1
+        """,
+        (tenant_id, tenant_id),
+    )
+    if not row:
+        raise SystemExit("[BENCH] No tenant found - seed the database first (python -m database_connections.seed)")
+    admin = await aio.fetchone(
+        """
+        SELECT l.username FROM logins l JOIN users u ON l.user_id = u.user_id
+        WHERE l.tenant_id = ? AND u.role = 'admin' LIMIT 1
+        """,
+        (row[0],),
+        tenant_id=row[0],
+    )
+    return row[0], row[1], admin[0] if admin else row[2]
+
+
+async def workload(tenant_id: str, company: str, username: str, password: str):
+    """name -> zero-argument coroutine function running one handler call."""
+    root = rx.State(_reflex_internal_init=True)
+    attendance = substate(root, AttendanceDashboardState)
+    admin = substate(root, AdminDashboardState)
+    payroll = substate(root, PayrollDashboardState)
+    login = substate(root, LoginState)
+
+    today = date.today()
+    login.tenant_id = tenant_id
+    attendance.start_date = today.replace(day=1).strftime("%Y-%m-%d")
+    attendance.end_date = today.strftime("%Y-%m-%d")
+    attendance.date_selected = today.strftime("%Y-%m-%d")
+
+    latest = await aio.fetchone(
+        "SELECT MAX(month) FROM payroll WHERE tenant_id = ?", (tenant_id,), tenant_id=tenant_id
+    )
+    if latest and latest[0]:
+        payroll.month_selected = str(latest[0])[:7]
+
+    async def login_user():
+        login.company_name, login.username, login.password = company, username, password
+        login.user_id = ""
+        await login.login_user()
+        if not login.user_id:
+            raise SystemExit(f"[BENCH] login_user failed: {login.message}")
+
+    return {
+        "generate_report": attendance.generate_report,
+        "load_attendance": attendance.load_attendance,
+        "get_metrics": admin.get_metrics,
+        "load_payroll": payroll.load_payroll,
+        "login_user": login_user,
+    }
+
+
+def percentile(samples: list[float], p: int) -> float:
+    if len(samples) == 1:
+        return samples[0]
+    return statistics.quantiles(samples, n=100, method="inclusive")[p - 1]
+
+
+async def run(args):
+    tenant_id, company, username = await pick_tenant(args.tenant)
+    handlers = await workload(tenant_id, company, username, args.password)
+    users = (await aio.fetchone("SELECT COUNT(*) FROM users WHERE tenant_id = ?", (tenant_id,), tenant_id=tenant_id))[0]
+    print(f"[BENCH] {company} ({tenant_id}): {users:,} employees, {args.runs} runs per handler")
+
+    results = {}
+    for name, handler in handlers.items():
+        if args.only and name not in args.only:
+            continue
+        for _ in range(args.warmup):
+            await handler()
+        samples = []
+        for _ in range(args.runs):
+            started = time.perf_counter()
+            await handler()
+            samples.append((time.perf_counter() - started) * 1000)
+        results[name] = {p: round(percentile(samples, p), 3) for p in (50, 95, 99)}
+
+    print(f"\n{'handler':18} {'p50 ms':>10} {'p95 ms':>10} {'p99 ms':>10}")
+    for name, r in results.items():
+        print(f"{name:18} {r[50]:10.2f} {r[95]:10.2f} {r[99]:10.2f}")
+
+    if args.output:
+        record = {
+            "at": datetime.now().isoformat(timespec="seconds"),
+            "db": os.environ.get("HRMS_DB_PATH", "hrms.duckdb"),
+            "tenant_id": tenant_id,
+            "employees": users,
+            "runs": args.runs,
+            "handlers": {name: {f"p{p}": v for p, v in r.items()} for name, r in results.items()},
+        }
+        with open(args.output, "a") as f:
+            f.write(json.dumps(record) + "\n")
+        print(f"[BENCH] Appended results to {args.output}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tenant", help="tenant_id to drive (default: the largest tenant)")
+    parser.add_argument("--password", default="password", help="password the seeded logins use")
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--only", nargs="*", help="subset of handlers to run")
+    parser.add_argument("--output", help="append a JSON line with the results to this file")
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
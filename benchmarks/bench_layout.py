@@ -0,0 +1,168 @@
+"""Dashboard query latency before/after database_connections.layout.
+
+Builds a throwaway database with ~1M attendance rows (and a matching
+payroll history) inserted in arrival order, i.e. day by day with tenants
+interleaved, then times the hot dashboard queries twice: on the bare
+schema, and after layout.apply() + layout.cluster().
+
+Run from the repository root:
+    python -m benchmarks.bench_layout [--tenants 20] [--users 1500] [--days 37]
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from datetime import date, timedelta
+
+import duckdb
+
+from database_connections import attendance_summary, db_initial, layout
+
+
+def build(con, tenants: int, users: int, days: int, start: date):
+    db_initial.create_tables(con)
+    for name, _, _ in layout.INDEXES:
+        con.execute(f"DROP INDEX IF EXISTS {name}")
+
+    con.execute(
+        "INSERT INTO tenants (tenant_id, company_name) SELECT 't' || i, 'Tenant ' || i FROM range(?) r(i)",
+        (tenants,),
+    )
+    con.execute(
+        """
+        INSERT INTO users (user_id, tenant_id, company_name, name, email, role)
+        SELECT 't' || t || '-u' || u, 't' || t, 'Tenant ' || t, 'User ' || u, 'u' || u || '@t' || t, 'Engineer'
+        FROM range(?) a(t), range(?) b(u)
+        """,
+        (tenants, users),
+    )
+    # Arrival order: one day at a time, every tenant's check-ins interleaved.
+    con.execute(
+        """
+        INSERT INTO attendance (tenant_id, user_id, date, status, check_in, check_out)
+        SELECT
+            't' || t, 't' || t || '-u' || u, CAST(? AS DATE) + CAST(d AS INTEGER),
+            ['present', 'present', 'present', 'Half day', 'remote'][1 + (t + u + d) % 5],
+            CAST(? AS DATE) + CAST(d AS INTEGER) + INTERVAL 9 HOUR,
+            CAST(? AS DATE) + CAST(d AS INTEGER) + INTERVAL 17 HOUR
+        FROM range(?) a(t), range(?) b(u), range(?) c(d)
+        WHERE (u + d) % 11 <> 0
+        ORDER BY d, random()
+        """,
+        (start, start, start, tenants, users, days),
+    )
+    con.execute(
+        """
+        INSERT INTO payroll (payroll_id, tenant_id, user_id, month, gross_salary, deductions, net_salary)
+        SELECT
+            't' || t || '-u' || u || '-' || m, 't' || t, 't' || t || '-u' || u,
+            CAST(date_trunc('month', CAST(? AS DATE) - INTERVAL (m) MONTH) AS DATE),
+            5000, 500, 4500
+        FROM range(?) a(t), range(?) b(u), range(12) c(m)
+        ORDER BY m DESC, random()
+        """,
+        (start, tenants, users),
+    )
+    attendance_summary.rebuild(con)
+
+
+def queries(tenant: str, user: str, day: date):
+    month_start = day.replace(day=1)
+    return {
+        "check-out lookup (tenant, user, date)": (
+            "SELECT check_in, check_out FROM attendance WHERE tenant_id = ? AND user_id = ? AND date = ?",
+            (tenant, user, day),
+        ),
+        "employee 30-day history": (
+            "SELECT date, check_in, check_out, status FROM attendance "
+            "WHERE tenant_id = ? AND user_id = ? AND date >= ? ORDER BY date DESC",
+            (tenant, user, day - timedelta(days=30)),
+        ),
+        "daily attendance board": (
+            """
+            SELECT u.user_id, u.name, s.first_in, s.last_out
+            FROM users u
+            LEFT JOIN attendance_daily_summary s
+                ON s.tenant_id = u.tenant_id AND s.user_id = u.user_id AND s.date = ?
+            WHERE u.tenant_id = ? AND u.status = 'active'
+            ORDER BY u.name
+            """,
+            (day, tenant),
+        ),
+        "monthly report (raw attendance)": (
+            """
+            SELECT user_id, COUNT(*) FILTER (WHERE status = 'present'), COUNT(*)
+            FROM attendance
+            WHERE tenant_id = ? AND date >= ? AND date <= ?
+            GROUP BY user_id
+            """,
+            (tenant, month_start, day),
+        ),
+        "payroll month": (
+            """
+            SELECT u.name, p.month, p.gross_salary, p.deductions, p.net_salary
+            FROM payroll p JOIN users u ON p.user_id = u.user_id
+            WHERE p.tenant_id = ? AND p.month = ?
+            ORDER BY u.name
+            """,
+            (tenant, month_start),
+        ),
+        "pending leaves": (
+            "SELECT leave_id FROM leaves WHERE tenant_id = ? AND status = 'pending'",
+            (tenant,),
+        ),
+    }
+
+
+def measure(con, workload, repeat: int) -> dict[str, float]:
+    results = {}
+    for name, (sql, params) in workload.items():
+        con.execute(sql, params).fetchall()  # warm up
+        samples = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            con.execute(sql, params).fetchall()
+            samples.append((time.perf_counter() - started) * 1000)
+        results[name] = statistics.median(samples)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tenants", type=int, default=20)
+    parser.add_argument("--users", type=int, default=1500)
+    parser.add_argument("--days", type=int, default=37)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    start = date.today() - timedelta(days=args.days - 1)
+    with tempfile.TemporaryDirectory() as tmp:
+        con = duckdb.connect(os.path.join(tmp, "bench.duckdb"))
+
+        started = time.perf_counter()
+        build(con, args.tenants, args.users, args.days, start)
+        rows = con.execute("SELECT COUNT(*) FROM attendance").fetchone()[0]
+        print(f"[BENCH] Built {rows:,} attendance rows in {time.perf_counter() - started:.1f}s")
+
+        tenant = f"t{args.tenants // 2}"
+        workload = queries(tenant, f"{tenant}-u{args.users // 2}", date.today())
+        before = measure(con, workload, args.repeat)
+
+        started = time.perf_counter()
+        con.begin()
+        layout.apply(con)
+        layout.cluster(con)
+        con.commit()
+        con.execute("CHECKPOINT")
+        print(f"[BENCH] layout.apply + cluster took {time.perf_counter() - started:.1f}s")
+        after = measure(con, workload, args.repeat)
+        con.close()
+
+    print(f"\n{'query':42} {'before ms':>10} {'after ms':>10} {'speedup':>8}")
+    for name in workload:
+        print(f"{name:42} {before[name]:10.2f} {after[name]:10.2f} {before[name] / after[name]:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
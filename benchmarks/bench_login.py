@@ -0,0 +1,149 @@
+"""Sustainable login throughput during a login storm.
+
+Fires --logins LoginState.login_user calls, --concurrency at a time, for
+distinct seeded employees of one tenant, the way the 9:00 rush hits one
+backend process. Reports logins/sec, per-login latency and how late a 10 ms
+ticker on the event loop ran (password hashing must stay off the loop, so
+the lag should stay near zero however busy the hashing pool is) and how many
+write transactions the buffered last_login / audit bookkeeping took. Point
+HRMS_DB_PATH at a database filled by database_connections.seed:
+
+    HRMS_DB_PATH=/tmp/load.duckdb python -m database_connections.seed --tenants 1 --employees 10000 --years 1
+    HRMS_DB_PATH=/tmp/load.duckdb python -m benchmarks.bench_login [--logins 500] [--concurrency 64]
+
+HRMS_HASH_WORKERS and HRMS_SCRYPT_N change the pool size and hash cost.
+--output appends one JSON line per run so regressions can be tracked over time.
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import time
+from datetime import datetime
+
+import reflex as rx
+
+from database_connections import aio, login_audit, passwords
+from templates.login import LoginState
+
+
+def percentile(samples: list[float], p: int) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(p / 100 * (len(ordered) - 1))))]
+
+
+async def pick_logins(tenant_id: str | None, count: int) -> tuple[str, str, list[str]]:
+    """(tenant_id, company_name, usernames) of the given or largest seeded tenant."""
+    tenant = await aio.fetchone(
+        """
+        SELECT t.tenant_id, t.company_name
+        FROM tenants t JOIN users u ON u.tenant_id = t.tenant_id
+        WHERE (? IS NULL OR t.tenant_id = ?)
+        GROUP BY ALL ORDER BY COUNT(*) DESC LIMIT 1
+        """,
+        (tenant_id, tenant_id),
+    )
+    if not tenant:
+        raise SystemExit("[BENCH] No tenant found - seed the database first (python -m database_connections.seed)")
+    rows = await aio.fetchall(
+        "SELECT username FROM logins WHERE tenant_id = ? ORDER BY username LIMIT ?",
+        (tenant[0], count),
+        tenant_id=tenant[0],
+    )
+    return tenant[0], tenant[1], [r[0] for r in rows]
+
+
+async def ticker(lags: list[float], stop: asyncio.Event, interval: float = 0.01):
+    """Record how late each ``interval`` sleep wakes up, in ms."""
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(max(0.0, (time.perf_counter() - started - interval) * 1000))
+
+
+async def run(args):
+    tenant_id, company, usernames = await pick_logins(args.tenant, args.logins)
+    started = time.perf_counter()
+    passwords.hash_password(args.password)
+    hash_ms = (time.perf_counter() - started) * 1000
+    print(
+        f"[BENCH] tenant {tenant_id}: {len(usernames)} logins, concurrency {args.concurrency}, "
+        f"{passwords.HASH_WORKERS} hash workers, scrypt n={passwords.SCRYPT_N} ({hash_ms:.1f} ms per hash)"
+    )
+
+    queue = asyncio.Queue()
+    for username in usernames:
+        queue.put_nowait(username)
+    latencies, failures = [], []
+
+    async def client():
+        root = rx.State(_reflex_internal_init=True)
+        login = root.get_substate(LoginState.get_full_name().split(".")[1:])
+        while not queue.empty():
+            username = queue.get_nowait()
+            login.company_name, login.username, login.password = company, username, args.password
+            login.user_id = ""
+            t = time.perf_counter()
+            await login.login_user()
+            latencies.append((time.perf_counter() - t) * 1000)
+            if not login.user_id:
+                failures.append(f"{username}: {login.message}")
+
+    lags, stop = [], asyncio.Event()
+    tick = asyncio.create_task(ticker(lags, stop))
+    started = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(args.concurrency)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await tick
+    # Logins only buffer their bookkeeping; count the write transactions it took.
+    login_audit.get_recorder().flush()
+    bookkeeping = login_audit.stats()
+
+    if failures:
+        print(f"[BENCH] {len(failures)} logins failed, e.g. {failures[0]}")
+    result = {
+        "logins": len(latencies),
+        "failed": len(failures),
+        "seconds": round(elapsed, 3),
+        "logins_per_s": round(len(latencies) / elapsed, 1),
+        "latency_ms": {f"p{p}": round(percentile(latencies, p), 1) for p in (50, 95, 99)},
+        "loop_lag_ms": {"p99": round(percentile(lags, 99), 1), "max": round(max(lags), 1)} if lags else {},
+        "bookkeeping_batches": bookkeeping["batches"],
+    }
+    print(f"[BENCH] {result['logins_per_s']} logins/s ({result['logins']} in {elapsed:.1f}s)")
+    print(f"[BENCH] latency p50 {result['latency_ms']['p50']} ms, p95 {result['latency_ms']['p95']} ms, p99 {result['latency_ms']['p99']} ms")
+    if lags:
+        print(f"[BENCH] event loop lag p99 {result['loop_lag_ms']['p99']} ms, max {result['loop_lag_ms']['max']} ms "
+              f"(median {statistics.median(lags):.1f} ms)")
+    print(f"[BENCH] last_login/audit writes: {bookkeeping['flushed']} attempts in {bookkeeping['batches']} transactions")
+
+    if args.output:
+        record = {
+            "at": datetime.now().isoformat(timespec="seconds"),
+            "db": os.environ.get("HRMS_DB_PATH", "hrms.duckdb"),
+            "tenant_id": tenant_id,
+            "concurrency": args.concurrency,
+            "hash_workers": passwords.HASH_WORKERS,
+            "scrypt_n": passwords.SCRYPT_N,
+            "hash_ms": round(hash_ms, 1),
+            **result,
+        }
+        with open(args.output, "a") as f:
+            f.write(json.dumps(record) + "\n")
+        print(f"[BENCH] Appended results to {args.output}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tenant", help="tenant_id to log into (default: the largest tenant)")
+    parser.add_argument("--password", default="password", help="password the seeded logins use")
+    parser.add_argument("--logins", type=int, default=500, help="distinct employees to log in")
+    parser.add_argument("--concurrency", type=int, default=64, help="logins in flight at once")
+    parser.add_argument("--output", help="append a JSON line with the results to this file")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""Cold-start cost of the app: import time, build context and export time.
+
+Measures what a deploy pays before the first request is served:
+
+- import: seconds and peak RSS to import OStaffSync.OStaffSync (every state
+  class) in a fresh interpreter, median of --runs. The import must not open
+  the database or start the attendance writer; the benchmark fails if it does;
+- pages: seconds to build every registered page component, which only the
+  frontend compile pays (a production backend worker skips it);
+- context: files and bytes sent to `docker build`, honouring .dockerignore;
+- export: seconds for `reflex export --no-zip` (with --export; needs bun/node
+  and network on the first run);
+- image: size of a built image (with --image TAG; needs docker).
+
+    python -m benchmarks.bench_startup [--runs 5] [--export] [--image ostaffsync:latest]
+
+--output appends one JSON line per run so regressions can be tracked over time.
+"""
+import argparse
+import fnmatch
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+# Runs in the child interpreter; prints one JSON object.
+_IMPORT_PROBE = """
+import json, resource, time
+started = time.perf_counter()
+import OStaffSync.OStaffSync as main
+import_s = time.perf_counter() - started
+rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+from database_connections import attendance_ingest, cache, login_audit, pool
+side_effects = [
+    name for name, opened in (
+        ("database connection", pool._pool is not None and pool._pool._conn is not None),
+        ("query cache", cache._cache is not None),
+        ("attendance writer", attendance_ingest._ingestor is not None),
+        ("login audit writer", login_audit._recorder is not None),
+    ) if opened
+]
+started = time.perf_counter()
+for page in main.app._unevaluated_pages.values():
+    page.component()
+pages_s = time.perf_counter() - started
+print(json.dumps({"import_s": import_s, "rss_mb": rss_mb, "pages_s": pages_s, "side_effects": side_effects}))
+"""
+
+
+def import_probe(runs: int) -> dict:
+    """Median import time, peak RSS and page build time over fresh interpreters."""
+    env = {**os.environ, "PYTHONDONTWRITEBYTECODE": "1"}
+    samples = []
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", _IMPORT_PROBE], cwd=ROOT, env=env, check=True, capture_output=True, text=True
+        )
+        samples.append(json.loads(out.stdout.strip().splitlines()[-1]))
+    side_effects = sorted({name for sample in samples for name in sample["side_effects"]})
+    if side_effects:
+        raise SystemExit(f"[BENCH] Importing the app opened: {', '.join(side_effects)} - create them on first use")
+    return {key: statistics.median(sample[key] for sample in samples) for key in ("import_s", "rss_mb", "pages_s")}
+
+
+def _ignore_patterns() -> list[str]:
+    path = os.path.join(ROOT, ".dockerignore")
+    if not os.path.exists(path):
+        return []
+    with open(path) as f:
+        return [line.strip().rstrip("/") for line in f if line.strip() and not line.startswith("#")]
+
+
+def _ignored(rel: str, patterns: list[str]) -> bool:
+    for pattern in patterns:
+        if pattern.startswith("**/"):
+            if fnmatch.fnmatch(os.path.basename(rel), pattern[3:]):
+                return True
+        elif fnmatch.fnmatch(rel, pattern):
+            return True
+    return False
+
+
+def build_context() -> tuple[int, int]:
+    """(files, bytes) of the docker build context."""
+    patterns = _ignore_patterns()
+    files = size = 0
+    for dirpath, dirnames, filenames in os.walk(ROOT):
+        rel_dir = os.path.relpath(dirpath, ROOT)
+        rel_dir = "" if rel_dir == "." else rel_dir
+        dirnames[:] = [d for d in dirnames if not _ignored(os.path.join(rel_dir, d), patterns)]
+        for name in filenames:
+            rel = os.path.join(rel_dir, name)
+            if not _ignored(rel, patterns):
+                files += 1
+                size += os.path.getsize(os.path.join(ROOT, rel))
+    return files, size
+
+
+def export_seconds() -> float:
+    started = time.perf_counter()
+    subprocess.run(["reflex", "export", "--no-zip"], cwd=ROOT, check=True)
+    return time.perf_counter() - started
+
+
+def image_bytes(tag: str) -> int | None:
+    if not shutil.which("docker"):
+        print("[BENCH] docker not found, skipping image size")
+        return None
+    out = subprocess.run(
+        ["docker", "image", "inspect", tag, "--format", "{{.Size}}"], check=True, capture_output=True, text=True
+    )
+    return int(out.stdout.strip())
+
+
+def run(args):
+    record = {"at": datetime.now().isoformat(timespec="seconds"), "runs": args.runs}
+
+    probe = import_probe(args.runs)
+    record["import_s"], record["rss_mb"] = round(probe["import_s"], 3), round(probe["rss_mb"], 1)
+    record["pages_s"] = round(probe["pages_s"], 3)
+    print(
+        f"[BENCH] import OStaffSync.OStaffSync: {record['import_s']:.3f} s, "
+        f"peak RSS {record['rss_mb']:.0f} MB (median of {args.runs})"
+    )
+    print(f"[BENCH] build all page components: {record['pages_s']:.3f} s (frontend compile only)")
+
+    files, size = build_context()
+    record["context_files"], record["context_bytes"] = files, size
+    print(f"[BENCH] docker build context: {files} files, {size / 1e6:.1f} MB")
+
+    if args.export:
+        record["export_s"] = round(export_seconds(), 3)
+        print(f"[BENCH] reflex export --no-zip: {record['export_s']:.1f} s")
+
+    if args.image:
+        size = image_bytes(args.image)
+        if size is not None:
+            record["image"], record["image_bytes"] = args.image, size
+            print(f"[BENCH] image {args.image}: {size / 1e6:.1f} MB")
+
+    if args.output:
+        with open(args.output, "a") as f:
+            f.write(json.dumps(record) + "\n")
+        print(f"[BENCH] Appended results to {args.output}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters to time the import in")
+    parser.add_argument("--export", action="store_true", help="also time `reflex export --no-zip`")
+    parser.add_argument("--image", help="report the size of this already built docker image")
+    parser.add_argument("--output", help="append a JSON line with the results to this file")
+    run(parser.parse_args())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+from database_connections.pool import ConnectionPool, PoolExhausted, get_pool, read_cursor, write_cursor
@@ -0,0 +1,105 @@
+import asyncio
+import os
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+from database_connections.pool import MAX_READERS, read_cursor, write_cursor
+
+# ----------------------------
+# Async data-access layer
+# ----------------------------
+# DuckDB calls block, so Reflex handlers must never run them on the event
+# loop. Reads run on a bounded thread pool sized to the cursor pool, writes
+# on their own single-thread pool so a burst of heavy reports can never
+# starve check-ins. Each tenant may only occupy a slice of the read pool; its
+# semaphore lives only while some handler of that tenant holds or waits on
+# it, so the map stays as small as the set of tenants reading right now.
+#
+# Loaders that turn a result into state rows (list[dict]) use
+# fetch_records(): the query formats dates, timestamps and defaults itself
+# (strftime, COALESCE, CASE), the result is fetched column-wise with
+# fetchnumpy(), and the dicts are built in a single zip over the columns.
+# That replaces a per-row Python loop of tuple unpacking and strftime calls,
+# which on large tenants cost more than the query.
+
+TENANT_READ_LIMIT = int(os.environ.get("HRMS_TENANT_READ_LIMIT", "4"))
+
+_executors: dict[str, ThreadPoolExecutor] = {}
+_executors_pid: int | None = None
+_executors_lock = threading.Lock()
+_tenant_slots: weakref.WeakValueDictionary[str, asyncio.Semaphore] = weakref.WeakValueDictionary()
+
+
+def _executor(kind: str) -> ThreadPoolExecutor:
+    global _executors, _executors_pid
+    if _executors_pid != os.getpid():
+        with _executors_lock:
+            if _executors_pid != os.getpid():
+                _executors = {
+                    "read": ThreadPoolExecutor(MAX_READERS, thread_name_prefix="hrms-read"),
+                    "write": ThreadPoolExecutor(1, thread_name_prefix="hrms-write"),
+                }
+                _executors_pid = os.getpid()
+    return _executors[kind]
+
+
+def _tenant_slot(tenant_id: str | None) -> asyncio.Semaphore:
+    key = tenant_id or ""
+    slot = _tenant_slots.get(key)
+    if slot is None:
+        slot = _tenant_slots[key] = asyncio.Semaphore(TENANT_READ_LIMIT)
+    return slot
+
+
+async def run_read(fn, *args, tenant_id: str | None = None):
+    """Run ``fn(cur, *args)`` on a pooled read cursor off the event loop."""
+
+    def job():
+        with read_cursor() as cur:
+            return fn(cur, *args)
+
+    async with _tenant_slot(tenant_id):
+        return await asyncio.get_running_loop().run_in_executor(_executor("read"), job)
+
+
+async def run_write(fn, *args):
+    """Run ``fn(cur, *args)`` in a write transaction off the event loop."""
+
+    def job():
+        with write_cursor() as cur:
+            return fn(cur, *args)
+
+    return await asyncio.get_running_loop().run_in_executor(_executor("write"), job)
+
+
+def columns(cur, sql: str, params=()) -> dict[str, list]:
+    """Run ``sql`` and return its result as ``{column: values}`` (NULL -> None)."""
+    return {name: values.tolist() for name, values in cur.execute(sql, params).fetchnumpy().items()}
+
+
+def as_records(columns: dict[str, list]) -> list[dict]:
+    """One dict per row, keyed by column name, in a single pass."""
+    names = list(columns)
+    return [dict(zip(names, row)) for row in zip(*columns.values())]
+
+
+async def fetch_columns(sql: str, params=(), *, tenant_id: str | None = None) -> dict[str, list]:
+    return await run_read(lambda cur: columns(cur, sql, params), tenant_id=tenant_id)
+
+
+async def fetch_records(sql: str, params=(), *, tenant_id: str | None = None) -> list[dict]:
+    return as_records(await fetch_columns(sql, params, tenant_id=tenant_id))
+
+
+async def fetchall(sql: str, params=(), *, tenant_id: str | None = None) -> list[tuple]:
+    return await run_read(lambda cur: cur.execute(sql, params).fetchall(), tenant_id=tenant_id)
+
+
+async def fetchone(sql: str, params=(), *, tenant_id: str | None = None) -> tuple | None:
+    return await run_read(lambda cur: cur.execute(sql, params).fetchone(), tenant_id=tenant_id)
+
+
+async def execute(sql: str, params=()):
+    """Run a single write statement in its own transaction."""
+    await run_write(lambda cur: cur.execute(sql, params))
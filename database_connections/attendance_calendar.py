@@ -0,0 +1,117 @@
+import argparse
+from datetime import date, timedelta
+
+import numpy as np
+
+from database_connections.pool import read_cursor
+
+# ----------------------------
+# Attendance calendar
+# ----------------------------
+# A tenant's month as a dense employee x day matrix of status codes, built
+# with two queries on one cursor:
+#
+#   1. the active employees in display order (name, user_id), which fixes
+#      each employee's row index
+#   2. the month's attendance_daily_summary rows of those employees, mapped
+#      to (row, day, code) in SQL
+#
+# NumPy then scatters the (row, day, code) triples into a zero matrix in one
+# vectorized assignment. There is no per-day Python loop and no round trip
+# per employee, so the heatmap can show everyone's month at once. Pass
+# after/limit to page through a large tenant with the same (name, user_id)
+# keyset the employee table uses.
+
+# Matrix code -> attendance_daily_summary.status; 0 means no summary row
+# (not checked in, not employed yet, or a future day).
+STATUSES = ("", "present", "remote", "Half day", "leave", "absent")
+
+_CODE_SQL = " ".join(
+    f"WHEN '{status}' THEN {code}" for code, status in enumerate(STATUSES) if status
+)
+
+
+def month_bounds(day: date) -> tuple[date, date]:
+    """First and last day of ``day``'s month."""
+    month_start = day.replace(day=1)
+    next_month = (month_start + timedelta(days=32)).replace(day=1)
+    return month_start, next_month - timedelta(days=1)
+
+
+def month_matrix(cur, tenant_id: str, day: date, *, after: tuple[str, str] | None = None, limit: int | None = None) -> dict:
+    """Status matrix of ``day``'s month for the tenant's active employees.
+
+    Returns ``user_ids`` and ``names`` (one per row), ``days`` (the month's
+    dates) and ``codes``, a ``(len(user_ids), len(days))`` uint8 array of
+    indexes into STATUSES. ``after`` is the (name, user_id) of the last row
+    of the previous page.
+    """
+    month_start, month_end = month_bounds(day)
+    days = [month_start + timedelta(days=i) for i in range((month_end - month_start).days + 1)]
+
+    keyset = "AND (name, user_id) > (?, ?)" if after else ""
+    users = cur.execute(
+        f"""
+        SELECT user_id, name
+        FROM users
+        WHERE tenant_id = ? AND status = 'active' {keyset}
+        ORDER BY name, user_id
+        {"LIMIT ?" if limit else ""}
+        """,
+        (tenant_id, *(after or ()), *((limit,) if limit else ())),
+    ).fetchnumpy()
+    user_ids = users["user_id"].tolist()
+    codes = np.zeros((len(user_ids), len(days)), dtype=np.uint8)
+    if not user_ids:
+        return {"user_ids": [], "names": [], "days": days, "codes": codes}
+
+    cur.register("_calendar_users", {"user_id": users["user_id"], "row": np.arange(len(user_ids), dtype=np.int32)})
+    try:
+        cells = cur.execute(
+            f"""
+            SELECT
+                u.row,
+                date_diff('day', CAST(? AS DATE), s.date) AS day,
+                CASE s.status {_CODE_SQL} ELSE 0 END AS code
+            FROM attendance_daily_summary s
+            JOIN _calendar_users u ON u.user_id = s.user_id
+            WHERE s.tenant_id = ? AND s.date >= ? AND s.date <= ?
+            """,
+            (month_start, tenant_id, month_start, month_end),
+        ).fetchnumpy()
+    finally:
+        cur.unregister("_calendar_users")
+    codes[cells["row"], cells["day"]] = cells["code"]
+    return {"user_ids": user_ids, "names": users["name"].tolist(), "days": days, "codes": codes}
+
+
+def day_counts(codes: np.ndarray) -> dict[str, list[int]]:
+    """Employees per status for every day (column) of a matrix."""
+    return {
+        status: np.count_nonzero(codes == code, axis=0).tolist()
+        for code, status in enumerate(STATUSES)
+        if status
+    }
+
+
+# ----------------------------
+# CLI
+# ----------------------------
+def main():
+    parser = argparse.ArgumentParser(description="Print a tenant's monthly attendance totals per day.")
+    parser.add_argument("tenant_id")
+    parser.add_argument("--month", default=date.today().strftime("%Y-%m"), help="YYYY-MM (default: this month)")
+    args = parser.parse_args()
+
+    day = date.fromisoformat(f"{args.month}-01")
+    with read_cursor() as cur:
+        matrix = month_matrix(cur, args.tenant_id, day)
+    counts = day_counts(matrix["codes"])
+    print(f"[CALENDAR] {args.tenant_id} {args.month}: {len(matrix['user_ids'])} employees")
+    print("date        " + " ".join(f"{status:>9}" for status in counts))
+    for i, d in enumerate(matrix["days"]):
+        print(f"{d:%Y-%m-%d}  " + " ".join(f"{counts[status][i]:9d}" for status in counts))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,486 @@
+import argparse
+import asyncio
+import json
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from datetime import date, datetime
+
+import duckdb
+import pandas as pd
+
+from database_connections import attendance_summary
+from database_connections.pool import write_cursor
+
+# ----------------------------
+# Attendance ingestion
+# ----------------------------
+# Check-ins and check-outs are not written by the handler that receives them.
+# Handlers submit an event and await its acknowledgement; one writer thread
+# drains the queue in micro-batches:
+#
+#   1. append the batch to a local append-only log and fsync it once
+#   2. apply it in one write transaction: check-ins go in through the DuckDB
+#      appender, check-outs as one UPDATE ... FROM that also classifies the
+#      session, then the touched summary rows are refreshed and the last
+#      applied sequence number is recorded in ingest_offsets
+#   3. resolve every event's future with (old_status, new_status, applied)
+#
+# attendance holds one row per check-in session (at most one open per
+# employee and day) and attendance_daily_summary the one row per day.
+# Sessions carry the client's check-in/check-out event ids; an event whose id
+# is already stored, or that does not fit the open/closed state, is not
+# applied.
+#
+# A burst of check-ins at 9:00 therefore costs one fsync and one transaction
+# per batch instead of one transaction per click. The queue is bounded: when
+# the writer falls behind, submit() waits up to INGEST_SUBMIT_TIMEOUT and then
+# raises IngestBackpressure so the handler can ask the user to retry.
+#
+# A batch that fails because of its data (a constraint or conversion error)
+# is applied event by event, and only the events that fail on their own are
+# dropped. Any other failure (the write cursor busy past its acquire
+# timeout during an import or payroll run, a transaction conflict, I/O) is
+# retried with backoff until it goes through: the events are in the log and
+# must not be marked applied without being applied. Handlers wait at most
+# INGEST_ACK_TIMEOUT for that and get IngestTimeout; the event is still
+# applied later, and a retry with the same event_id is a no-op.
+#
+# After a crash, events that reached the log but not the database (seq above
+# ingest_offsets.applied_seq) are replayed when the writer starts. Replay can
+# also be run by hand:
+#   python -m database_connections.attendance_ingest --replay
+
+INGEST_LOG = os.environ.get("HRMS_INGEST_LOG", "attendance_ingest.log")
+INGEST_QUEUE = int(os.environ.get("HRMS_INGEST_QUEUE", "10000"))
+INGEST_BATCH = int(os.environ.get("HRMS_INGEST_BATCH", "500"))
+INGEST_FLUSH_MS = float(os.environ.get("HRMS_INGEST_FLUSH_MS", "20"))
+INGEST_SUBMIT_TIMEOUT = float(os.environ.get("HRMS_INGEST_SUBMIT_TIMEOUT", "2"))
+INGEST_ACK_TIMEOUT = float(os.environ.get("HRMS_INGEST_ACK_TIMEOUT", "30"))
+# Longest pause between retries of a batch the database did not accept.
+INGEST_RETRY_MAX_S = float(os.environ.get("HRMS_INGEST_RETRY_MAX_S", "5"))
+# The log is truncated once everything in it is applied and it outgrows this.
+INGEST_LOG_MAX_BYTES = int(os.environ.get("HRMS_INGEST_LOG_MAX_BYTES", str(64 * 1024 * 1024)))
+
+STREAM = "attendance"
+
+
+class IngestBackpressure(RuntimeError):
+    """Raised when the ingestion queue stays full for the submit timeout."""
+
+
+class IngestTimeout(RuntimeError):
+    """Raised when an event is not acknowledged within INGEST_ACK_TIMEOUT.
+
+    The event is queued or logged and will still be applied.
+    """
+
+
+# Errors caused by the events themselves; retrying cannot help, so the
+# events that raise them are dropped. Everything else is retried.
+_DATA_ERRORS = (duckdb.DataError, duckdb.IntegrityError, KeyError, TypeError, ValueError)
+
+
+def create_table(con):
+    con.execute("""
+    CREATE TABLE IF NOT EXISTS ingest_offsets (
+        stream TEXT PRIMARY KEY,
+        applied_seq BIGINT NOT NULL,
+        applied_at TIMESTAMP
+    )
+    """)
+
+
+def _applied_seq(cur) -> int:
+    row = cur.execute("SELECT applied_seq FROM ingest_offsets WHERE stream = ?", (STREAM,)).fetchone()
+    return row[0] if row else 0
+
+
+def _mark_applied(cur, seq: int):
+    cur.execute(
+        """
+        INSERT INTO ingest_offsets (stream, applied_seq, applied_at) VALUES (?, ?, NOW())
+        ON CONFLICT (stream) DO UPDATE SET applied_seq = excluded.applied_seq, applied_at = excluded.applied_at
+        """,
+        (STREAM, seq),
+    )
+
+
+def _session_state(cur) -> dict:
+    """(tenant_id, user_id, date) -> (has_open_session, applied event ids) for _ingest_keys."""
+    rows = cur.execute(
+        """
+        SELECT a.tenant_id, a.user_id, a.date,
+               bool_or(a.check_out IS NULL),
+               list_filter(flatten(list([a.check_in_event_id, a.check_out_event_id])), x -> x IS NOT NULL)
+        FROM attendance a
+        JOIN _ingest_keys k USING (tenant_id, user_id, date)
+        GROUP BY ALL
+        """
+    ).fetchall()
+    return {(r[0], r[1], r[2]): (r[3], set(r[4])) for r in rows}
+
+
+def apply_events(cur, events: list[dict]) -> list[tuple[str | None, str | None, bool]]:
+    """Apply logged events in order on the write cursor.
+
+    Each employee-day moves between "checked out" and "checked in"; an event
+    that does not fit the current state (a second check-in while a session
+    is open, a check-out with nothing open) or whose event_id was already
+    applied is skipped, so double clicks, retries and replays are harmless.
+
+    Returns ``(old_status, new_status, applied)`` per event, the statuses
+    being those of the day's summary row. When one employee has several
+    events in the batch the first carries the whole change and the rest
+    report no change, so counters built from the pairs stay exact.
+    """
+    keys = list(dict.fromkeys((e["tenant_id"], e["user_id"], e["date"]) for e in events))
+    key_frame = pd.DataFrame(keys, columns=["tenant_id", "user_id", "date"])
+    cur.register("_ingest_keys", key_frame)
+    old = {
+        (r[0], r[1], r[2]): r[3]
+        for r in cur.execute(
+            """
+            SELECT s.tenant_id, s.user_id, s.date, s.status
+            FROM attendance_daily_summary s
+            JOIN _ingest_keys k USING (tenant_id, user_id, date)
+            """
+        ).fetchall()
+    }
+
+    # Consecutive events of the same kind are applied together; order between
+    # kinds is kept, so a check-out never overtakes the check-in before it.
+    applied = set()
+    start = 0
+    while start < len(events):
+        kind = events[start]["kind"]
+        end = start
+        while end < len(events) and events[end]["kind"] == kind:
+            end += 1
+        state = _session_state(cur)
+        accepted = []
+        for e in events[start:end]:
+            key = (e["tenant_id"], e["user_id"], e["date"])
+            is_open, seen_ids = state.get(key, (False, set()))
+            event_id = e.get("event_id")
+            # A double click sends the check-in's id again as a check-out, so
+            # ids are matched across both kinds.
+            if event_id is not None and event_id in seen_ids:
+                continue
+            if (kind == "in") == is_open:
+                continue
+            state[key] = (kind == "in", seen_ids | {event_id})
+            accepted.append(e)
+            applied.add(e["seq"])
+        start = end
+        if not accepted:
+            continue
+
+        if kind == "in":
+            cur.append(
+                "attendance",
+                pd.DataFrame({
+                    "tenant_id": [e["tenant_id"] for e in accepted],
+                    "user_id": [e["user_id"] for e in accepted],
+                    "date": [e["date"] for e in accepted],
+                    "status": ["present"] * len(accepted),
+                    "check_in": [e["at"] for e in accepted],
+                    "check_in_event_id": [e.get("event_id") for e in accepted],
+                }),
+                by_name=True,
+            )
+        else:
+            # Close the open session; the day's status is derived from all of
+            # its sessions by the summary refresh below.
+            cur.register(
+                "_ingest_out",
+                pd.DataFrame(
+                    [(e["tenant_id"], e["user_id"], e["date"], e["at"], e.get("event_id")) for e in accepted],
+                    columns=["tenant_id", "user_id", "date", "at", "event_id"],
+                ),
+            )
+            cur.execute(
+                """
+                UPDATE attendance
+                SET check_out = o.at,
+                    check_out_event_id = o.event_id
+                FROM _ingest_out o
+                WHERE attendance.tenant_id = o.tenant_id
+                  AND attendance.user_id = o.user_id
+                  AND attendance.date = o.date
+                  AND attendance.check_out IS NULL
+                """
+            )
+            cur.unregister("_ingest_out")
+
+    cur.execute(
+        "INSERT OR REPLACE INTO attendance_daily_summary "
+        + attendance_summary._SUMMARY_SELECT.format(
+            where="""EXISTS (
+                SELECT 1 FROM _ingest_keys k
+                WHERE k.tenant_id = attendance.tenant_id AND k.user_id = attendance.user_id AND k.date = attendance.date
+            )"""
+        )
+    )
+    new = {
+        (r[0], r[1], r[2]): r[3]
+        for r in cur.execute(
+            """
+            SELECT s.tenant_id, s.user_id, s.date, s.status
+            FROM attendance_daily_summary s
+            JOIN _ingest_keys k USING (tenant_id, user_id, date)
+            """
+        ).fetchall()
+    }
+    cur.unregister("_ingest_keys")
+
+    results, seen = [], set()
+    for e in events:
+        key = (e["tenant_id"], e["user_id"], e["date"])
+        if key in seen:
+            results.append((new.get(key), new.get(key), e["seq"] in applied))
+        else:
+            seen.add(key)
+            results.append((old.get(key), new.get(key), e["seq"] in applied))
+
+    _mark_applied(cur, events[-1]["seq"])
+    return results
+
+
+def _encode(event: dict) -> str:
+    return json.dumps({**event, "date": event["date"].isoformat(), "at": event["at"].isoformat()})
+
+
+def _decode(line: str) -> dict:
+    event = json.loads(line)
+    event["date"] = date.fromisoformat(event["date"])
+    event["at"] = datetime.fromisoformat(event["at"])
+    return event
+
+
+class AttendanceIngestor:
+    """Bounded queue + single writer thread for check-in/out events."""
+
+    def __init__(self, log_path: str = INGEST_LOG, max_queue: int = INGEST_QUEUE,
+                 batch_size: int = INGEST_BATCH, flush_ms: float = INGEST_FLUSH_MS):
+        self.log_path = log_path
+        self.batch_size = batch_size
+        self.flush_ms = flush_ms
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._next_seq = 1
+        self._log = None
+        self._thread = None
+        self._start_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._stats = dict.fromkeys(
+            ("submitted", "applied", "batches", "replayed", "rejected", "failed", "retries", "errors"), 0
+        )
+
+    def _count(self, key: str, n: int = 1):
+        with self._stats_lock:
+            self._stats[key] += n
+
+    # ---------- startup / replay ----------
+    def start(self):
+        with self._start_lock:
+            if self._thread is not None:
+                return
+            self.replay()
+            self._log = open(self.log_path, "a", encoding="utf-8")
+            self._thread = threading.Thread(target=self._run, name="hrms-ingest", daemon=True)
+            self._thread.start()
+
+    def replay(self) -> int:
+        """Apply logged events the database has not seen yet, then reset the log."""
+        with write_cursor() as cur:
+            create_table(cur)
+            applied = _applied_seq(cur)
+        pending, last_seq = [], applied
+        if os.path.exists(self.log_path):
+            with open(self.log_path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        event = _decode(line)
+                    except (ValueError, KeyError):
+                        continue  # torn write of a crashed run or failed batch
+                    last_seq = max(last_seq, event["seq"])
+                    if event["seq"] > applied:
+                        pending.append(event)
+        # Transient failures are not retried here: start() raises and the
+        # next submit() replays again.
+        for start in range(0, len(pending), self.batch_size):
+            self._apply(pending[start:start + self.batch_size], retry=False)
+        if pending:
+            print(f"[INGEST] Replayed {len(pending)} attendance event(s) from {self.log_path}")
+        self._count("replayed", len(pending))
+        self._next_seq = last_seq + 1
+        open(self.log_path, "w").close()
+        return len(pending)
+
+    # ---------- producers ----------
+    def submit(self, event: dict, timeout: float = INGEST_SUBMIT_TIMEOUT) -> Future:
+        """Queue ``event``; the future resolves to (old_status, new_status, applied)."""
+        self.start()
+        future = Future()
+        try:
+            self._queue.put((event, future), timeout=timeout)
+        except queue.Full:
+            self._count("rejected")
+            raise IngestBackpressure(f"attendance queue full ({self._queue.maxsize} events waiting)") from None
+        self._count("submitted")
+        return future
+
+    # ---------- writer ----------
+    def _take_batch(self) -> list:
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.flush_ms / 1000
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                batch.append(self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _write(self, fn, retry: bool = True):
+        """Run ``fn(cur)`` in a write transaction, retrying non-data errors with backoff."""
+        delay = 0.05
+        while True:
+            try:
+                with write_cursor() as cur:
+                    return fn(cur)
+            except _DATA_ERRORS:
+                raise
+            except Exception as e:
+                if not retry:
+                    raise
+                delay = min(delay * 2, INGEST_RETRY_MAX_S)
+                self._count("retries")
+                print(f"[INGEST] Write failed ({e}); retrying in {delay:.1f}s")
+                time.sleep(delay)
+
+    def _apply(self, events: list[dict], retry: bool = True) -> list:
+        """Apply ``events``; returns apply_events' result or the data error per event."""
+        try:
+            return self._write(lambda cur: apply_events(cur, events), retry)
+        except _DATA_ERRORS as e:
+            if len(events) == 1:
+                error = e
+            else:
+                # The batch rolled back; retry event by event so one bad event
+                # (e.g. a deleted employee) cannot block the others or replay.
+                print(f"[INGEST] Batch of {len(events)} failed ({e}); applying one by one")
+                return [result for event in events for result in self._apply([event], retry)]
+        event = events[0]
+        self._write(lambda cur: _mark_applied(cur, event["seq"]), retry)
+        print(f"[INGEST] Dropped event {event['seq']} ({event['kind']} {event['user_id']}): {error}")
+        self._count("failed")
+        return [error]
+
+    def _run(self):
+        # Nothing may end this loop: handlers of every later event would
+        # wait for a writer that is gone.
+        while True:
+            batch = self._take_batch()
+            try:
+                self._process(batch)
+            except Exception as e:
+                self._count("errors")
+                print(f"[INGEST] Batch of {len(batch)} event(s) failed: {e}")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                time.sleep(INGEST_RETRY_MAX_S / 10)
+
+    def _process(self, batch: list):
+        events = []
+        for event, _ in batch:
+            events.append({**event, "seq": self._next_seq})
+            self._next_seq += 1
+        self._log.write("".join(_encode(e) + "\n" for e in events))
+        self._log.flush()
+        os.fsync(self._log.fileno())
+
+        results = self._apply(events)
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+        self._count("applied", len(events))
+        self._count("batches")
+
+        if self._queue.empty() and self._log.tell() > INGEST_LOG_MAX_BYTES:
+            # Everything written so far is applied.
+            self._log.truncate(0)
+            self._log.seek(0)
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            counters = dict(self._stats)
+        return {**counters, "queued": self._queue.qsize(), "max_queue": self._queue.maxsize,
+                "next_seq": self._next_seq}
+
+
+_ingestor: AttendanceIngestor | None = None
+_ingestor_pid: int | None = None
+_ingestor_lock = threading.Lock()
+
+
+def get_ingestor() -> AttendanceIngestor:
+    """Return the process-wide ingestor; its writer starts on first submit."""
+    global _ingestor, _ingestor_pid
+    if _ingestor is None or _ingestor_pid != os.getpid():
+        with _ingestor_lock:
+            if _ingestor is None or _ingestor_pid != os.getpid():
+                _ingestor = AttendanceIngestor()
+                _ingestor_pid = os.getpid()
+    return _ingestor
+
+
+async def _submit(event: dict) -> tuple[str | None, str | None, bool]:
+    ingestor = get_ingestor()
+    # submit() may block for INGEST_SUBMIT_TIMEOUT (and replays on first use),
+    # so keep it off the event loop.
+    future = await asyncio.get_running_loop().run_in_executor(None, ingestor.submit, event)
+    try:
+        # shield: giving up on the ack must not cancel the queued event.
+        return await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(future)), INGEST_ACK_TIMEOUT)
+    except asyncio.TimeoutError:
+        raise IngestTimeout(f"attendance event not acknowledged after {INGEST_ACK_TIMEOUT}s") from None
+
+
+async def check_in(tenant_id: str, user_id: str, day: date, at: datetime, event_id: str | None = None):
+    """Record a check-in; returns (old_status, new_status, applied).
+
+    ``event_id`` should be generated by the client once per click, so resends
+    of the same click are recognised and not applied twice.
+    """
+    return await _submit({"kind": "in", "tenant_id": tenant_id, "user_id": user_id,
+                          "date": day, "at": at, "event_id": event_id})
+
+
+async def check_out(tenant_id: str, user_id: str, day: date, at: datetime, event_id: str | None = None):
+    """Record a check-out; returns (old_status, new_status, applied) of the day's summary."""
+    return await _submit({"kind": "out", "tenant_id": tenant_id, "user_id": user_id,
+                          "date": day, "at": at, "event_id": event_id})
+
+
+def stats() -> dict:
+    return get_ingestor().stats()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Attendance ingestion log maintenance.")
+    parser.add_argument("--replay", action="store_true", help="apply events left in the log by a crashed run")
+    args = parser.parse_args()
+
+    if args.replay:
+        count = AttendanceIngestor().replay()
+        print(f"[INGEST] {count} event(s) replayed")
+    else:
+        parser.print_help()
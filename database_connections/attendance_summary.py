@@ -0,0 +1,133 @@
+import argparse
+
+from database_connections.pool import write_cursor
+
+# ----------------------------
+# Attendance daily summary
+# ----------------------------
+# attendance holds one row per check-in session. Dashboards only ever need one
+# row per employee per day, so that row is kept in attendance_daily_summary and
+# refreshed inside the same transaction as every check-in/out write:
+#
+#   first_in        earliest check-in of the day
+#   last_out        check-out of the latest session (NULL while checked in)
+#   status          the day's status, from the total worked_minutes (below)
+#   worked_minutes  total minutes across closed sessions
+#
+# The day's status is decided on the whole day, never on one session: under
+# 5 hours worked is absent, up to 7 hours a half day, longer a full day. A
+# 'leave' or 'remote' session keeps that status for a full day, and while a
+# session is still open the day counts as present (or leave/remote).
+#
+# Rebuild it from scratch (e.g. after a bulk import) with:
+#   python -m database_connections.attendance_summary [--tenant TENANT_ID]
+
+
+def create_table(con):
+    con.execute("""
+    CREATE TABLE IF NOT EXISTS attendance_daily_summary (
+        tenant_id TEXT NOT NULL,
+        date DATE NOT NULL,
+        user_id TEXT NOT NULL,
+        first_in TIMESTAMP,
+        last_out TIMESTAMP,
+        status TEXT,
+        worked_minutes INTEGER DEFAULT 0,
+        PRIMARY KEY (tenant_id, user_id, date)
+    )
+    """)
+
+
+_SUMMARY_SELECT = """
+    SELECT
+        tenant_id,
+        date,
+        user_id,
+        MIN(check_in) AS first_in,
+        arg_max(check_out, check_in) AS last_out,
+        CASE
+            WHEN bool_and(check_out IS NOT NULL) AND SUM(date_diff('minute', check_in, check_out)) < 300
+                THEN 'absent'
+            WHEN bool_and(check_out IS NOT NULL) AND SUM(date_diff('minute', check_in, check_out)) <= 420
+                THEN 'Half day'
+            ELSE COALESCE(arg_max(status, check_in) FILTER (WHERE status IN ('leave', 'remote')), 'present')
+        END AS status,
+        CAST(COALESCE(SUM(date_diff('minute', check_in, check_out)), 0) AS INTEGER) AS worked_minutes
+    FROM attendance
+    WHERE {where}
+    GROUP BY tenant_id, date, user_id
+"""
+
+
+def refresh(cur, tenant_id: str, user_id: str, day) -> tuple[str | None, str | None]:
+    """Recompute one employee's summary row for ``day``.
+
+    Must run on the write cursor, inside the transaction that changed the
+    attendance rows. Returns ``(old_status, new_status)`` so callers can
+    adjust cached counters without re-reading the table.
+    """
+    key = (tenant_id, user_id, day)
+    old = cur.execute(
+        "SELECT status FROM attendance_daily_summary WHERE tenant_id = ? AND user_id = ? AND date = ?",
+        key,
+    ).fetchone()
+    cur.execute(
+        "INSERT OR REPLACE INTO attendance_daily_summary "
+        + _SUMMARY_SELECT.format(where="tenant_id = ? AND user_id = ? AND date = ?"),
+        key,
+    )
+    new = cur.execute(
+        "SELECT status FROM attendance_daily_summary WHERE tenant_id = ? AND user_id = ? AND date = ?",
+        key,
+    ).fetchone()
+    return (old[0] if old else None), (new[0] if new else None)
+
+
+def rebuild(cur, tenant_id: str | None = None) -> int:
+    """Regenerate the summary from attendance for one tenant, or all of them."""
+    if tenant_id:
+        cur.execute("DELETE FROM attendance_daily_summary WHERE tenant_id = ?", (tenant_id,))
+        cur.execute(
+            "INSERT INTO attendance_daily_summary " + _SUMMARY_SELECT.format(where="tenant_id = ?"),
+            (tenant_id,),
+        )
+        count_sql, params = "SELECT COUNT(*) FROM attendance_daily_summary WHERE tenant_id = ?", (tenant_id,)
+    else:
+        cur.execute("DELETE FROM attendance_daily_summary")
+        cur.execute("INSERT INTO attendance_daily_summary " + _SUMMARY_SELECT.format(where="TRUE"))
+        count_sql, params = "SELECT COUNT(*) FROM attendance_daily_summary", ()
+    return cur.execute(count_sql, params).fetchone()[0]
+
+
+def rebuild_batch(cur, after_user_id: str, batch_size: int) -> str | None:
+    """Rebuild the summary for the next ``batch_size`` users after ``after_user_id``.
+
+    Returns the last user_id handled, or None once every user is done, so a
+    large history can be backfilled in short transactions.
+    """
+    user_ids = [
+        r[0]
+        for r in cur.execute(
+            "SELECT user_id FROM users WHERE user_id > ? ORDER BY user_id LIMIT ?",
+            (after_user_id, batch_size),
+        ).fetchall()
+    ]
+    if not user_ids:
+        return None
+    cur.execute("DELETE FROM attendance_daily_summary WHERE user_id IN (SELECT UNNEST(?))", (user_ids,))
+    cur.execute(
+        "INSERT INTO attendance_daily_summary "
+        + _SUMMARY_SELECT.format(where="user_id IN (SELECT UNNEST(?))"),
+        (user_ids,),
+    )
+    return user_ids[-1]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rebuild attendance_daily_summary from attendance.")
+    parser.add_argument("--tenant", help="only rebuild this tenant_id")
+    args = parser.parse_args()
+
+    with write_cursor() as cur:
+        rows = rebuild(cur, args.tenant)
+    print(f"[SUMMARY] Rebuilt {rows} daily rows" + (f" for tenant {args.tenant}" if args.tenant else ""))
@@ -0,0 +1,241 @@
+import json
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+from database_connections import aio
+
+# ----------------------------
+# Read-through query cache
+# ----------------------------
+# Tenant-level reads that every page mount repeats (active employee list,
+# company lookup at login, payroll month rows) are served from an in-process
+# LRU cache. Entries are keyed by (tenant, topics, sql, params) and expire
+# after a TTL; the least recently used entry is evicted once the cache is
+# full.
+#
+# Writers call invalidate(tenant_id, topic, ...) after committing. That
+# drops every entry of the tenant tagged with one of the topics and notifies
+# subscribers (e.g. other workers). Each (tenant, topic) also carries a version
+# that invalidate() bumps, so a read that started before a write never stores
+# its now-stale result.
+#
+# Topics in use: "tenants" (tenant_id None), "users", "attendance", "leaves",
+# "payroll".
+#
+# With REDIS_URL set (multi-worker deployments, see README) every worker keeps
+# its own cache and invalidations are relayed to the others over Redis
+# pub/sub. A message lost while a worker is reconnecting is covered by the TTL.
+
+CACHE_MAX_ENTRIES = int(os.environ.get("HRMS_CACHE_MAX_ENTRIES", "2048"))
+CACHE_TTL = float(os.environ.get("HRMS_CACHE_TTL", "60"))
+REDIS_URL = os.environ.get("REDIS_URL")
+REDIS_CHANNEL = os.environ.get("HRMS_CACHE_CHANNEL", "hrms:cache:invalidate")
+
+
+class QueryCache:
+    """Thread-safe LRU + TTL cache of query results, invalidated by topic.
+
+    Cached values are shared between callers and must be treated as
+    read-only.
+    """
+
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES, ttl: float = CACHE_TTL):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple, tuple[float, object]] = OrderedDict()
+        self._by_topic: dict[tuple, set[tuple]] = {}
+        self._versions: dict[tuple, int] = {}
+        self._listeners = []
+        self._stats = dict.fromkeys(("hits", "misses", "evictions", "expirations", "invalidations"), 0)
+
+    def versions(self, tenant_id, topics: tuple[str, ...]) -> tuple[int, ...]:
+        with self._lock:
+            return tuple(self._versions.get((tenant_id, t), 0) for t in topics)
+
+    def get(self, key: tuple):
+        """Return ``(True, value)`` on a fresh hit, else ``(False, None)``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats["misses"] += 1
+                return False, None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                self._drop(key)
+                self._stats["expirations"] += 1
+                self._stats["misses"] += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return True, value
+
+    def put(self, key: tuple, value, versions: tuple[int, ...]):
+        """Store ``value`` unless one of the key's topics changed since ``versions``."""
+        tenant_id, topics = key[0], key[1]
+        with self._lock:
+            if tuple(self._versions.get((tenant_id, t), 0) for t in topics) != versions:
+                return
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            for t in topics:
+                self._by_topic.setdefault((tenant_id, t), set()).add(key)
+            while len(self._entries) > self.max_entries:
+                self._drop(next(iter(self._entries)))
+                self._stats["evictions"] += 1
+
+    def _drop(self, key: tuple):
+        self._entries.pop(key, None)
+        for t in key[1]:
+            keys = self._by_topic.get((key[0], t))
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_topic[(key[0], t)]
+
+    def invalidate(self, tenant_id, *topics: str, notify: bool = True):
+        """Drop the tenant's entries for ``topics`` and tell subscribers."""
+        with self._lock:
+            for t in topics:
+                self._versions[(tenant_id, t)] = self._versions.get((tenant_id, t), 0) + 1
+                for key in list(self._by_topic.get((tenant_id, t), ())):
+                    self._drop(key)
+                self._stats["invalidations"] += 1
+            listeners = list(self._listeners) if notify else []
+        for listener in listeners:
+            listener(tenant_id, topics)
+
+    def subscribe(self, listener):
+        """Call ``listener(tenant_id, topics)`` after every local invalidation."""
+        with self._lock:
+            self._listeners.append(listener)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._by_topic.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl": self.ttl,
+                "hit_rate": round(self._stats["hits"] / lookups, 4) if lookups else 0.0,
+            }
+
+
+class RedisInvalidation:
+    """Relays a cache's invalidations to and from other workers via Redis pub/sub."""
+
+    def __init__(self, cache: QueryCache, url: str, channel: str = REDIS_CHANNEL):
+        import redis
+
+        self.cache = cache
+        self.channel = channel
+        self.origin = uuid.uuid4().hex
+        self._error = redis.RedisError
+        self._client = redis.Redis.from_url(url)
+        self._pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+        self._pubsub.subscribe(**{channel: self._receive})
+        self._thread = self._pubsub.run_in_thread(sleep_time=1.0, daemon=True)
+        cache.subscribe(self.publish)
+
+    def publish(self, tenant_id, topics):
+        message = json.dumps({"origin": self.origin, "tenant_id": tenant_id, "topics": list(topics)})
+        try:
+            self._client.publish(self.channel, message)
+        except self._error as e:
+            print(f"[CACHE] Could not publish invalidation for {tenant_id} {list(topics)}: {e}")
+
+    def _receive(self, message):
+        event = json.loads(message["data"])
+        if event["origin"] != self.origin:
+            self.cache.invalidate(event["tenant_id"], *event["topics"], notify=False)
+
+    def close(self):
+        self._thread.stop()
+        self._pubsub.close()
+        self._client.close()
+
+
+_cache: QueryCache | None = None
+_cache_pid: int | None = None
+_cache_lock = threading.Lock()
+
+
+def get_cache() -> QueryCache:
+    """Return the process-wide cache, creating it on first use.
+
+    Like the connection pool it is keyed on the process id, so every forked
+    worker starts empty and runs its own Redis subscriber.
+    """
+    global _cache, _cache_pid
+    if _cache is None or _cache_pid != os.getpid():
+        with _cache_lock:
+            if _cache is None or _cache_pid != os.getpid():
+                cache = QueryCache()
+                if REDIS_URL:
+                    RedisInvalidation(cache, REDIS_URL)
+                _cache, _cache_pid = cache, os.getpid()
+    return _cache
+
+
+def _topics(topics) -> tuple[str, ...]:
+    return (topics,) if isinstance(topics, str) else tuple(topics)
+
+
+async def fetchall(topics, sql: str, params=(), *, tenant_id: str | None = None) -> list[tuple]:
+    """Cached ``aio.fetchall``; ``topics`` names what invalidates the result."""
+    topics = _topics(topics)
+    cache = get_cache()
+    key = (tenant_id, topics, "all", sql, tuple(params))
+    hit, rows = cache.get(key)
+    if hit:
+        return rows
+    versions = cache.versions(tenant_id, topics)
+    rows = await aio.fetchall(sql, params, tenant_id=tenant_id)
+    cache.put(key, rows, versions)
+    return rows
+
+
+async def fetchone(topics, sql: str, params=(), *, tenant_id: str | None = None) -> tuple | None:
+    """Cached ``aio.fetchone``; a missing row (None) is cached too."""
+    topics = _topics(topics)
+    cache = get_cache()
+    key = (tenant_id, topics, "one", sql, tuple(params))
+    hit, row = cache.get(key)
+    if hit:
+        return row
+    versions = cache.versions(tenant_id, topics)
+    row = await aio.fetchone(sql, params, tenant_id=tenant_id)
+    cache.put(key, row, versions)
+    return row
+
+
+async def fetch_columns(topics, sql: str, params=(), *, tenant_id: str | None = None) -> dict[str, list]:
+    """Cached ``aio.fetch_columns``; build state rows with ``aio.as_records``."""
+    topics = _topics(topics)
+    cache = get_cache()
+    key = (tenant_id, topics, "columns", sql, tuple(params))
+    hit, columns = cache.get(key)
+    if hit:
+        return columns
+    versions = cache.versions(tenant_id, topics)
+    columns = await aio.fetch_columns(sql, params, tenant_id=tenant_id)
+    cache.put(key, columns, versions)
+    return columns
+
+
+def invalidate(tenant_id: str | None, *topics: str):
+    """Shortcut for ``get_cache().invalidate(...)``; call after the write commits."""
+    get_cache().invalidate(tenant_id, *topics)
+
+
+def stats() -> dict:
+    return get_cache().stats()
@@ -1,132 +1,144 @@
-import duckdb
 import uuid
 from datetime import datetime, date
 
-# Connect to DuckDB (creates file if not exists)
-con = duckdb.connect("hrms.duckdb")
+from database_connections import attendance_ingest, attendance_summary, layout, payroll_run
 
 # ----------------------------
 # 1. Create Tables
 # ----------------------------
 
-# Tenants table (represents companies)
-con.execute("""
-CREATE TABLE IF NOT EXISTS tenants (
-    tenant_id TEXT PRIMARY KEY,
-    company_name TEXT NOT NULL,
-    domain TEXT,
-    plan TEXT DEFAULT 'basic',
-    created_at TIMESTAMP DEFAULT NOW()
-)
-""")
-
-# Users table (employees)
-con.execute("""
-CREATE TABLE IF NOT EXISTS users (
-    user_id TEXT PRIMARY KEY,
-    tenant_id TEXT NOT NULL REFERENCES tenants(tenant_id),
-    company_name TEXT NOT NULL,
-    name TEXT NOT NULL,
-    email TEXT NOT NULL,
-    role TEXT,
-    status TEXT DEFAULT 'active',
-    date_joined TIMESTAMP DEFAULT NOW()
-)
-""")
-
-# Departments table
-con.execute("""
-CREATE TABLE IF NOT EXISTS departments (
-    dept_id TEXT PRIMARY KEY,
-    tenant_id TEXT NOT NULL REFERENCES tenants(tenant_id),
-    name TEXT,
-    manager_id TEXT REFERENCES users(user_id)
-)
-""")
-
-# Attendance table
-con.execute("""
-CREATE TABLE IF NOT EXISTS attendance (
-
-    tenant_id TEXT NOT NULL REFERENCES tenants(tenant_id),
-    user_id TEXT NOT NULL REFERENCES users(user_id),
-    date DATE NOT NULL,
-    status TEXT CHECK(status IN ('present', 'absent', 'Half day', 'leave', 'remote')),
-    check_in TIMESTAMP,
-    check_out TIMESTAMP
-)
-""")
-
-# Leaves table
-con.execute("""
-CREATE TABLE IF NOT EXISTS leaves (
-    leave_id TEXT PRIMARY KEY,
-    tenant_id TEXT NOT NULL REFERENCES tenants(tenant_id),
-    user_id TEXT NOT NULL REFERENCES users(user_id),
-    type TEXT,
-    start_date DATE,
-    end_date DATE,
-    status TEXT CHECK(status IN ('pending', 'approved', 'rejected')),
-    requested_at TIMESTAMP DEFAULT NOW()
-)
-""")
-
-# Payroll table
-con.execute("""
-CREATE TABLE IF NOT EXISTS payroll (
-    payroll_id TEXT PRIMARY KEY,
-    tenant_id TEXT NOT NULL REFERENCES tenants(tenant_id),
-    user_id TEXT NOT NULL REFERENCES users(user_id),
-    month TEXT,
-    gross_salary DOUBLE,
-    deductions DOUBLE,
-    net_salary DOUBLE,
-    processed_at TIMESTAMP DEFAULT NOW(),
-    UNIQUE(tenant_id, user_id, month)
-)
-""")
-
-# Logins table
-con.execute("""
-CREATE TABLE IF NOT EXISTS logins (
-    login_id TEXT PRIMARY KEY,
-    tenant_id TEXT NOT NULL REFERENCES tenants(tenant_id),
-    user_id TEXT NOT NULL REFERENCES users(user_id),
-    username TEXT NOT NULL UNIQUE,
-    password TEXT NOT NULL,
-    last_login TIMESTAMP,
-    failed_attempts INTEGER DEFAULT 0,
-    account_locked BOOLEAN DEFAULT FALSE,
-    created_at TIMESTAMP DEFAULT NOW()
-)
-""")
-
-
-#Performance table
-con.execute("""
-CREATE TABLE IF NOT EXISTS performance (
-    performance_id TEXT PRIMARY KEY,
-    tenant_id TEXT NOT NULL REFERENCES tenants(tenant_id),
-    user_id TEXT NOT NULL REFERENCES users(user_id),
-    kpi_name TEXT,
-    score DOUBLE,
-    review_date DATE,
-    notes TEXT
-)
-""")
-
-#Recruitment table
-con.execute("""
-CREATE TABLE IF NOT EXISTS recruitment (
-    candidate_id TEXT PRIMARY KEY,
-    tenant_id TEXT NOT NULL REFERENCES tenants(tenant_id),
-    name TEXT,
-    email TEXT,
-    position TEXT,
-    status TEXT CHECK(status IN ('applied', 'interview', 'hired', 'rejected')),
-    applied_at TIMESTAMP DEFAULT NOW()
-)
-""")
+def create_tables(con):
+    """Create the HRMS schema on the given cursor (idempotent)."""
+    # Tenants table (represents companies)
+    con.execute("""
+    CREATE TABLE IF NOT EXISTS tenants (
+        tenant_id TEXT PRIMARY KEY,
+        company_name TEXT NOT NULL,
+        domain TEXT,
+        plan TEXT DEFAULT 'basic',
+        created_at TIMESTAMP DEFAULT NOW()
+    )
+    """)
+
+    # Users table (employees)
+    con.execute("""
+    CREATE TABLE IF NOT EXISTS users (
+        user_id TEXT PRIMARY KEY,
+        tenant_id TEXT NOT NULL REFERENCES tenants(tenant_id),
+        company_name TEXT NOT NULL,
+        name TEXT NOT NULL,
+        email TEXT NOT NULL,
+        role TEXT,
+        status TEXT DEFAULT 'active',
+        date_joined TIMESTAMP DEFAULT NOW()
+    )
+    """)
+
+    # Departments table
+    con.execute("""
+    CREATE TABLE IF NOT EXISTS departments (
+        dept_id TEXT PRIMARY KEY,
+        tenant_id TEXT NOT NULL REFERENCES tenants(tenant_id),
+        name TEXT,
+        manager_id TEXT REFERENCES users(user_id)
+    )
+    """)
+
+    # Attendance table
+    con.execute("CREATE SEQUENCE IF NOT EXISTS attendance_id_seq")
+    con.execute("""
+    CREATE TABLE IF NOT EXISTS attendance (
+        attendance_id BIGINT PRIMARY KEY DEFAULT nextval('attendance_id_seq'),
+        tenant_id TEXT NOT NULL REFERENCES tenants(tenant_id),
+        user_id TEXT NOT NULL REFERENCES users(user_id),
+        date DATE NOT NULL,
+        status TEXT CHECK(status IN ('present', 'absent', 'Half day', 'leave', 'remote')),
+        check_in TIMESTAMP,
+        check_out TIMESTAMP,
+        check_in_event_id TEXT,
+        check_out_event_id TEXT
+    )
+    """)
+
+    # Leaves table
+    con.execute("""
+    CREATE TABLE IF NOT EXISTS leaves (
+        leave_id TEXT PRIMARY KEY,
+        tenant_id TEXT NOT NULL REFERENCES tenants(tenant_id),
+        user_id TEXT NOT NULL REFERENCES users(user_id),
+        type TEXT,
+        start_date DATE,
+        end_date DATE,
+        status TEXT CHECK(status IN ('pending', 'approved', 'rejected')),
+        requested_at TIMESTAMP DEFAULT NOW()
+    )
+    """)
+
+    # Payroll table
+    con.execute("""
+    CREATE TABLE IF NOT EXISTS payroll (
+        payroll_id TEXT PRIMARY KEY,
+        tenant_id TEXT NOT NULL REFERENCES tenants(tenant_id),
+        user_id TEXT NOT NULL REFERENCES users(user_id),
+        month DATE,
+        gross_salary DOUBLE,
+        deductions DOUBLE,
+        net_salary DOUBLE,
+        processed_at TIMESTAMP DEFAULT NOW(),
+        UNIQUE(tenant_id, user_id, month)
+    )
+    """)
+
+    # Logins table
+    con.execute("""
+    CREATE TABLE IF NOT EXISTS logins (
+        login_id TEXT PRIMARY KEY,
+        tenant_id TEXT NOT NULL REFERENCES tenants(tenant_id),
+        user_id TEXT NOT NULL REFERENCES users(user_id),
+        username TEXT NOT NULL UNIQUE,
+        password TEXT NOT NULL,
+        email TEXT,
+        last_login TIMESTAMP,
+        failed_attempts INTEGER DEFAULT 0,
+        account_locked BOOLEAN DEFAULT FALSE,
+        created_at TIMESTAMP DEFAULT NOW()
+    )
+    """)
+
+
+    #Performance table
+    con.execute("""
+    CREATE TABLE IF NOT EXISTS performance (
+        performance_id TEXT PRIMARY KEY,
+        tenant_id TEXT NOT NULL REFERENCES tenants(tenant_id),
+        user_id TEXT NOT NULL REFERENCES users(user_id),
+        kpi_name TEXT,
+        score DOUBLE,
+        review_date DATE,
+        notes TEXT
+    )
+    """)
+
+    #Recruitment table
+    con.execute("""
+    CREATE TABLE IF NOT EXISTS recruitment (
+        candidate_id TEXT PRIMARY KEY,
+        tenant_id TEXT NOT NULL REFERENCES tenants(tenant_id),
+        name TEXT,
+        email TEXT,
+        position TEXT,
+        status TEXT CHECK(status IN ('applied', 'interview', 'hired', 'rejected')),
+        applied_at TIMESTAMP DEFAULT NOW()
+    )
+    """)
+
+    # Salary structures and payroll run audit
+    payroll_run.create_tables(con)
+
+    # Derived tables, surrogate keys and composite indexes
+    attendance_summary.create_table(con)
+    attendance_ingest.create_table(con)
+    layout.apply(con)
 
 
 # ----------------------------
@@ -202,3 +214,15 @@ CREATE TABLE IF NOT EXISTS recruitment (
 # con.close()
 
 # print("\n✅ DuckDB HRMS setup complete with company_name included.")
+
+
+def migrate(dry_run: bool = False):
+    """Create or upgrade the database through the versioned migrations."""
+    from database_connections import migrations
+
+    return migrations.migrate(dry_run=dry_run)
+
+
+if __name__ == "__main__":
+    # Run with: python -m database_connections.db_initial
+    migrate()
@@ -0,0 +1,228 @@
+import argparse
+import os
+
+import pandas as pd
+
+from database_connections import passwords
+from database_connections.pool import read_cursor, write_cursor
+
+# ----------------------------
+# Bulk employee import
+# ----------------------------
+# Onboards a whole tenant from a CSV, XLSX or Parquet file. The file is
+# scanned by DuckDB on a read cursor, validated set-based and de-duplicated
+# (emails and usernames within the file, emails against the tenant's
+# employees, usernames against every login), passwords are hashed, and only
+# then one write transaction inserts users + logins in chunks so callers can
+# report progress.
+#
+# Columns (case-insensitive): name, email, password required; role, status,
+# username optional. username defaults to the email address.
+#
+# Passwords are stored as scrypt hashes (database_connections.passwords) at
+# the same cost as every other login: imported accounts are often the ones
+# nobody logs into for months, so they must not keep a weaker hash until a
+# first login upgrades it. The hashes are computed in parallel on the
+# hashing pool before the write transaction starts, so a large import takes
+# minutes but check-ins and logins are never blocked behind it.
+#
+# Run with:
+#   python -m database_connections.employee_import employees.csv --tenant TENANT_ID
+
+IMPORT_CHUNK = int(os.environ.get("HRMS_IMPORT_CHUNK", "10000"))
+MAX_REPORTED_ERRORS = 20
+
+_COLUMNS = ["name", "email", "password", "role", "status", "username"]
+_STATUSES = ["active", "inactive", "terminated"]
+
+
+def _reader(path: str) -> str:
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".csv":
+        return "read_csv(?, header = true, all_varchar = true)"
+    if ext == ".parquet":
+        return "read_parquet(?)"
+    if ext in (".xlsx", ".xls"):
+        # DuckDB's excel extension (auto-loaded on first use).
+        return "read_xlsx(?, header = true, all_varchar = true)"
+    raise ValueError(f"Unsupported file type '{ext}' (use .csv, .xlsx or .parquet)")
+
+
+def _stage(cur, path: str, tenant_id: str) -> tuple[str, pd.DataFrame]:
+    """Read and validate ``path`` on a read cursor; returns (company, rows).
+
+    rows has one entry per file row with ``error`` set on rejected ones:
+    invalid fields, an email or username repeated in the file, an email the
+    tenant already has or a username taken in any tenant (logins.username is
+    globally unique).
+    """
+    company = cur.execute("SELECT company_name FROM tenants WHERE tenant_id = ?", (tenant_id,)).fetchone()
+    if not company:
+        raise ValueError(f"Unknown tenant {tenant_id}")
+
+    columns = cur.execute(f"DESCRIBE SELECT * FROM {_reader(path)}", (path,)).fetchall()
+    present = {r[0].lower(): r[0] for r in columns}
+    missing = [c for c in ("name", "email", "password") if c not in present]
+    if missing:
+        raise ValueError(f"Missing column(s): {', '.join(missing)}")
+    col = {c: f'CAST("{present[c]}" AS VARCHAR)' if c in present else "NULL" for c in _COLUMNS}
+
+    # One pass: normalise, validate, assign keys and flag duplicates within
+    # the file and against existing employees and logins. Valid rows rank
+    # first among copies, so a rejected row never shadows a good one.
+    rows = cur.execute(
+        f"""
+        WITH src AS (
+            SELECT
+                row_number() OVER () AS row_no,
+                trim({col['name']}) AS name,
+                lower(trim({col['email']})) AS email,
+                {col['password']} AS password,
+                nullif(trim({col['role']}), '') AS role,
+                coalesce(nullif(lower(trim({col['status']})), ''), 'active') AS status,
+                coalesce(nullif(trim({col['username']}), ''), lower(trim({col['email']}))) AS username
+            FROM {_reader(path)}
+        ),
+        validated AS (
+            SELECT *,
+                CASE
+                    WHEN coalesce(name, '') = '' THEN 'missing name'
+                    WHEN NOT regexp_full_match(coalesce(email, ''), '[^@\\s]+@[^@\\s]+\\.[^@\\s]+') THEN 'invalid email'
+                    WHEN coalesce(password, '') = '' THEN 'missing password'
+                    WHEN status NOT IN (SELECT UNNEST(?)) THEN 'invalid status'
+                END AS invalid
+            FROM src
+        ),
+        checked AS (
+            SELECT *,
+                row_number() OVER (PARTITION BY email ORDER BY invalid IS NOT NULL, row_no) AS email_copy,
+                row_number() OVER (PARTITION BY username ORDER BY invalid IS NOT NULL, row_no) AS username_copy
+            FROM validated
+        )
+        SELECT
+            c.row_no, c.name, c.email, c.password, c.role, c.status, c.username,
+            CAST(uuid() AS VARCHAR) AS user_id,
+            CASE
+                WHEN c.invalid IS NOT NULL THEN c.invalid
+                WHEN c.email_copy > 1 THEN 'duplicate email in file'
+                WHEN e.email IS NOT NULL THEN 'email already exists'
+                WHEN c.username_copy > 1 THEN 'duplicate username in file'
+                WHEN l.username IS NOT NULL THEN 'username already taken'
+            END AS error
+        FROM checked c
+        LEFT JOIN (
+            SELECT DISTINCT lower(email) AS email FROM users WHERE tenant_id = ?
+        ) e ON e.email = c.email
+        LEFT JOIN logins l ON l.username = c.username
+        ORDER BY c.row_no
+        """,
+        (path, _STATUSES, tenant_id),
+    ).fetchdf()
+    return company[0], rows
+
+
+def _insert(cur, tenant_id: str, company: str, rows: pd.DataFrame, on_progress=None) -> pd.DataFrame:
+    """Insert validated, hashed ``rows`` on the write cursor; returns late conflicts.
+
+    Emails and usernames are checked again inside the transaction, so rows
+    that became duplicates after _stage are rejected instead of failing the
+    whole import on the logins.username constraint.
+    """
+    cur.register("_import_staged", rows)
+    cur.execute(
+        """
+        CREATE OR REPLACE TEMP TABLE _import_rows AS
+        SELECT s.*,
+            CASE
+                WHEN EXISTS (SELECT 1 FROM users u WHERE u.tenant_id = ? AND lower(u.email) = s.email)
+                    THEN 'email already exists'
+                WHEN EXISTS (SELECT 1 FROM logins l WHERE l.username = s.username)
+                    THEN 'username already taken'
+            END AS error
+        FROM _import_staged s
+        """,
+        (tenant_id,),
+    )
+    cur.unregister("_import_staged")
+
+    valid, last_row = cur.execute(
+        "SELECT COUNT(*) FILTER (WHERE error IS NULL), coalesce(MAX(row_no), 0) FROM _import_rows"
+    ).fetchone()
+    if on_progress:
+        on_progress(0, valid)
+
+    done = 0
+    for start in range(0, last_row, IMPORT_CHUNK):
+        bounds = (start, start + IMPORT_CHUNK)
+        done += cur.execute(
+            """
+            INSERT INTO users (user_id, tenant_id, company_name, name, email, role, status, date_joined)
+            SELECT user_id, ?, ?, name, email, role, status, NOW()
+            FROM _import_rows
+            WHERE error IS NULL AND row_no > ? AND row_no <= ?
+            """,
+            (tenant_id, company, *bounds),
+        ).fetchone()[0]
+        cur.execute(
+            """
+            INSERT INTO logins (login_id, tenant_id, user_id, username, password, email, account_locked, created_at)
+            SELECT CAST(uuid() AS VARCHAR), ?, user_id, username, password, email, FALSE, NOW()
+            FROM _import_rows
+            WHERE error IS NULL AND row_no > ? AND row_no <= ?
+            """,
+            (tenant_id, *bounds),
+        )
+        if on_progress:
+            on_progress(done, valid)
+
+    late = cur.execute("SELECT row_no, email, error FROM _import_rows WHERE error IS NOT NULL").fetchdf()
+    # A failed import rolls back with its transaction, temp table included.
+    cur.execute("DROP TABLE _import_rows")
+    return late
+
+
+def import_employees(path: str, tenant_id: str, on_progress=None) -> dict:
+    """Import employees from ``path`` into ``tenant_id``.
+
+    Runs in three steps so the write cursor is held only for the inserts:
+    the file is read and validated on a read cursor, passwords are hashed
+    on the hashing pool with no cursor held, then one short write
+    transaction inserts the rows. Call it off the event loop.
+
+    ``on_progress(done, total)`` is called after each inserted chunk. Returns
+    ``{"total", "imported", "rejected", "errors"}`` where errors lists the
+    first rejected rows as ``{"row", "email", "error"}``.
+    """
+    with read_cursor() as cur:
+        company, rows = _stage(cur, path, tenant_id)
+
+    valid = rows[rows["error"].isna()].drop(columns="error")
+    valid["password"] = list(passwords.get_executor().map(passwords.hash_password, valid["password"].tolist()))
+
+    with write_cursor() as cur:
+        late = _insert(cur, tenant_id, company, valid, on_progress)
+
+    rejected = pd.concat([rows.loc[rows["error"].notna(), ["row_no", "email", "error"]], late])
+    rejected = rejected.sort_values("row_no").head(MAX_REPORTED_ERRORS)
+    total, done = len(rows), len(valid) - len(late)
+    print(f"[IMPORT] {done} of {total} employees imported for tenant {tenant_id}")
+    return {
+        "total": total,
+        "imported": done,
+        "rejected": total - done,
+        "errors": [
+            {"row": int(r.row_no), "email": r.email if isinstance(r.email, str) else "", "error": r.error}
+            for r in rejected.itertuples()
+        ],
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bulk-import employees from CSV, XLSX or Parquet.")
+    parser.add_argument("path")
+    parser.add_argument("--tenant", required=True, help="tenant_id to import into")
+    args = parser.parse_args()
+
+    result = import_employees(args.path, args.tenant, lambda done, total: print(f"[IMPORT] {done}/{total}"))
+    for err in result["errors"]:
+        print(f"[IMPORT]   row {err['row']} ({err['email']}): {err['error']}")
@@ -0,0 +1,97 @@
+import argparse
+
+from database_connections.pool import get_pool, write_cursor
+
+# ----------------------------
+# Indexes and physical layout
+# ----------------------------
+# Hot queries filter on (tenant_id, user_id, date) or (tenant_id, status).
+# DuckDB answers point lookups from ART indexes and range scans from per
+# row-group min/max zone maps, so we keep a few composite indexes for the
+# lookups and periodically rewrite the big tables in tenant/date order so a
+# tenant's month lives in a handful of row groups.
+#
+# Note: DuckDB turns an UPDATE of an indexed column into delete + insert, which
+# trips foreign-key checks on rows other tables reference. Never index a
+# column of `users` that handlers update (status, name, ...).
+#
+# Run with:
+#   python -m database_connections.layout            # add key + indexes
+#   python -m database_connections.layout --cluster  # also rewrite in order
+
+INDEXES = [
+    ("idx_attendance_tenant_user_date", "attendance", "tenant_id, user_id, date"),
+    ("idx_users_tenant", "users", "tenant_id"),
+    ("idx_leaves_tenant_status", "leaves", "tenant_id, status"),
+]
+
+# Tables rewritten by cluster(), with their sort key. Tables whose rows are
+# referenced by foreign keys (tenants, users) cannot be rewritten this way.
+CLUSTER_ORDER = {
+    "attendance": "tenant_id, date, user_id",
+    "attendance_daily_summary": "tenant_id, date, user_id",
+    "payroll": "tenant_id, month, user_id",
+}
+
+
+def _has_column(con, table: str, column: str) -> bool:
+    return con.execute(
+        "SELECT COUNT(*) FROM information_schema.columns WHERE table_name = ? AND column_name = ?",
+        (table, column),
+    ).fetchone()[0] > 0
+
+
+def ensure_attendance_key(con):
+    """Give attendance rows created before attendance_id existed a surrogate key."""
+    con.execute("CREATE SEQUENCE IF NOT EXISTS attendance_id_seq")
+    if not _has_column(con, "attendance", "attendance_id"):
+        con.execute("ALTER TABLE attendance ADD COLUMN attendance_id BIGINT DEFAULT nextval('attendance_id_seq')")
+        con.execute("ALTER TABLE attendance ADD PRIMARY KEY (attendance_id)")
+        print("[LAYOUT] Added attendance.attendance_id")
+
+
+def create_indexes(con):
+    for name, table, columns in INDEXES:
+        con.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({columns})")
+
+
+def apply(con):
+    """Bring an existing database up to the current key/index layout."""
+    ensure_attendance_key(con)
+    create_indexes(con)
+
+
+def cluster(con, tables=None):
+    """Rewrite tables in CLUSTER_ORDER so zone maps prune by tenant and date.
+
+    Each table is copied in sort order into a fresh table created from its own
+    DDL, then swapped in by rename; rows keep every column (including
+    attendance_id). Run it inside a write transaction, then CHECKPOINT so the
+    old row groups are released.
+    """
+    for table in tables or CLUSTER_ORDER:
+        order = CLUSTER_ORDER[table]
+        ddl = con.execute("SELECT sql FROM duckdb_tables() WHERE table_name = ?", (table,)).fetchone()[0]
+        secondary = [(name, columns) for name, t, columns in INDEXES if t == table]
+        for name, _ in secondary:
+            con.execute(f"DROP INDEX IF EXISTS {name}")
+        con.execute(ddl.replace(f"CREATE TABLE {table}(", f"CREATE TABLE _cluster_{table}(", 1))
+        con.execute(f"INSERT INTO _cluster_{table} SELECT * FROM {table} ORDER BY {order}")
+        con.execute(f"DROP TABLE {table}")
+        con.execute(f"ALTER TABLE _cluster_{table} RENAME TO {table}")
+        for name, columns in secondary:
+            con.execute(f"CREATE INDEX {name} ON {table} ({columns})")
+        print(f"[LAYOUT] Clustered {table} by ({order})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Add keys/indexes and optionally re-cluster tables.")
+    parser.add_argument("--cluster", action="store_true", help="rewrite large tables in tenant/date order")
+    args = parser.parse_args()
+
+    with write_cursor() as con:
+        apply(con)
+        if args.cluster:
+            cluster(con)
+    if args.cluster:
+        get_pool().checkpoint()
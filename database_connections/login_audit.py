@@ -0,0 +1,270 @@
+import argparse
+import atexit
+import ipaddress
+import os
+import threading
+from datetime import datetime
+
+import pandas as pd
+
+from database_connections.pool import read_cursor, write_cursor
+
+# ----------------------------
+# Login bookkeeping
+# ----------------------------
+# A login does not write to the database itself. login_user records the
+# outcome here and returns; one writer thread per process flushes what has
+# accumulated every LOGIN_FLUSH_MS (or as soon as LOGIN_BATCH attempts are
+# waiting) in one write transaction:
+#
+#   - logins: one UPDATE ... FROM for the whole batch. Attempts on the same
+#     login are coalesced first: the latest successful login sets last_login
+#     and resets failed_attempts, failures after it are added on top, and a
+#     re-hashed password (see passwords.verify) is stored - unless the
+#     password was changed in the meantime, so a late flush never puts back
+#     a hash of the old password.
+#   - login_audit: every attempt, successful or not, with IP and user agent,
+#     appended through the DuckDB appender.
+#
+# So a 9:00 login rush costs a couple of write transactions per second
+# instead of one per login, and logins never wait for the writer lock.
+#
+# The buffer is in memory: a crash loses at most the last flush interval of
+# bookkeeping (a re-hash is simply repeated at the next login). If the writer
+# falls behind, audit rows beyond LOGIN_BUFFER are dropped and counted; the
+# coalesced logins updates are kept, they are bounded by the number of logins.
+#
+# The audited IP is the socket peer's. X-Forwarded-For is only believed when
+# the peer is one of HRMS_TRUSTED_PROXIES (comma-separated addresses or CIDR
+# ranges, empty by default): its hops are then read from the right, skipping
+# further trusted proxies, so a client cannot choose the address it is
+# audited under.
+
+LOGIN_FLUSH_MS = float(os.environ.get("HRMS_LOGIN_FLUSH_MS", "1000"))
+LOGIN_BATCH = int(os.environ.get("HRMS_LOGIN_BATCH", "1000"))
+LOGIN_BUFFER = int(os.environ.get("HRMS_LOGIN_BUFFER", "100000"))
+TRUSTED_PROXIES = [
+    ipaddress.ip_network(p.strip(), strict=False)
+    for p in os.environ.get("HRMS_TRUSTED_PROXIES", "").split(",")
+    if p.strip()
+]
+
+
+def _trusted(address: str, proxies) -> bool:
+    try:
+        ip = ipaddress.ip_address(address)
+    except ValueError:
+        return False
+    return any(ip in network for network in proxies)
+
+
+def client_ip(peer: str | None, forwarded: str = "", proxies=None) -> str | None:
+    """Client address of a request from ``peer`` carrying X-Forwarded-For ``forwarded``."""
+    proxies = TRUSTED_PROXIES if proxies is None else proxies
+    hops = [h.strip() for h in forwarded.split(",") if h.strip()]
+    address = peer
+    while address and hops and _trusted(address, proxies):
+        address = hops.pop()
+    return address or None
+
+
+def create_table(con):
+    con.execute("""
+    CREATE TABLE IF NOT EXISTS login_audit (
+        tenant_id TEXT,
+        login_id TEXT,
+        username TEXT NOT NULL,
+        success BOOLEAN NOT NULL,
+        ip TEXT,
+        user_agent TEXT,
+        attempted_at TIMESTAMP NOT NULL
+    )
+    """)
+
+
+_AUDIT_COLUMNS = ["tenant_id", "login_id", "username", "success", "ip", "user_agent", "attempted_at"]
+
+
+def apply_batch(cur, updates: dict, audit: list[tuple]):
+    """Write coalesced ``updates`` (login_id -> state) and ``audit`` rows on the write cursor."""
+    if updates:
+        cur.register(
+            "_login_updates",
+            pd.DataFrame(
+                [
+                    (login_id, u["last_login"], u["failures"], u["password"], u["old_password"])
+                    for login_id, u in updates.items()
+                ],
+                columns=["login_id", "last_login", "failures", "password", "old_password"],
+            ).astype({"last_login": "datetime64[us]"}),
+        )
+        cur.execute(
+            """
+            UPDATE logins
+            SET last_login = COALESCE(b.last_login, logins.last_login),
+                failed_attempts = CASE WHEN b.last_login IS NULL THEN COALESCE(logins.failed_attempts, 0) ELSE 0 END
+                                  + b.failures,
+                password = CASE WHEN logins.password = b.old_password THEN b.password ELSE logins.password END
+            FROM _login_updates b
+            WHERE logins.login_id = b.login_id
+            """
+        )
+        cur.unregister("_login_updates")
+    if audit:
+        cur.append("login_audit", pd.DataFrame(audit, columns=_AUDIT_COLUMNS), by_name=True)
+
+
+class LoginRecorder:
+    """In-memory buffer + writer thread for login bookkeeping."""
+
+    def __init__(self, flush_ms: float = LOGIN_FLUSH_MS, batch_size: int = LOGIN_BATCH,
+                 max_buffer: int = LOGIN_BUFFER):
+        self.flush_ms = flush_ms
+        self.batch_size = batch_size
+        self.max_buffer = max_buffer
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._updates: dict[str, dict] = {}
+        self._audit: list[tuple] = []
+        self._thread = None
+        self._stats = dict.fromkeys(("recorded", "flushed", "batches", "dropped", "failed"), 0)
+
+    def start(self):
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name="hrms-login-audit", daemon=True)
+            self._thread.start()
+        atexit.register(self.flush)
+
+    # ---------- producers ----------
+    def record(self, tenant_id: str | None, username: str, success: bool, login_ids=(),
+               ip: str | None = None, user_agent: str | None = None, password: str | None = None,
+               old_password: str | None = None, at: datetime | None = None):
+        """Buffer one login attempt; never blocks on the database.
+
+        ``login_ids`` are the logins the attempt was made against: the one
+        that signed in, or every candidate the password did not match.
+        ``password`` is a fresh hash to store for a successful login, in
+        place of ``old_password``, the stored value it was verified against.
+        """
+        self.start()
+        at = at or datetime.now()
+        with self._lock:
+            for login_id in login_ids:
+                update = self._updates.setdefault(
+                    login_id, {"last_login": None, "failures": 0, "password": None, "old_password": None}
+                )
+                if success:
+                    update.update(last_login=at, failures=0)
+                    if password:
+                        update.update(password=password, old_password=old_password)
+                else:
+                    update["failures"] += 1
+            if len(self._audit) < self.max_buffer:
+                self._audit.append((tenant_id, login_ids[0] if len(login_ids) == 1 else None,
+                                    username, success, ip, user_agent, at))
+            else:
+                self._stats["dropped"] += 1
+            self._stats["recorded"] += 1
+            pending = len(self._audit)
+        if pending >= self.batch_size:
+            self._wake.set()
+
+    # ---------- writer ----------
+    def flush(self) -> int:
+        """Write everything buffered so far; returns the number of audit rows."""
+        with self._flush_lock:
+            with self._lock:
+                updates, self._updates = self._updates, {}
+                audit, self._audit = self._audit, []
+            if not updates and not audit:
+                return 0
+            try:
+                with write_cursor() as cur:
+                    apply_batch(cur, updates, audit)
+            except Exception as e:
+                # Put the batch back in front of what arrived meanwhile so the
+                # next flush retries it.
+                with self._lock:
+                    for login_id, update in self._updates.items():
+                        merged = updates.setdefault(login_id, update)
+                        if merged is not update:
+                            if update["last_login"] is not None:
+                                merged.update(last_login=update["last_login"], failures=0)
+                            if update["password"]:
+                                merged.update(password=update["password"], old_password=update["old_password"])
+                            merged["failures"] += update["failures"]
+                    self._updates = updates
+                    self._audit = (audit + self._audit)[-self.max_buffer:]
+                    self._stats["failed"] += 1
+                print(f"[LOGINS] Flush of {len(audit)} login attempt(s) failed ({e}); retrying")
+                return 0
+            with self._lock:
+                self._stats["flushed"] += len(audit)
+                self._stats["batches"] += 1
+            return len(audit)
+
+    def _run(self):
+        while True:
+            self._wake.wait(self.flush_ms / 1000)
+            self._wake.clear()
+            self.flush()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {**self._stats, "pending": len(self._audit), "max_buffer": self.max_buffer}
+
+
+_recorder: LoginRecorder | None = None
+_recorder_pid: int | None = None
+_recorder_lock = threading.Lock()
+
+
+def get_recorder() -> LoginRecorder:
+    """Return the process-wide recorder; its writer starts on first record."""
+    global _recorder, _recorder_pid
+    if _recorder is None or _recorder_pid != os.getpid():
+        with _recorder_lock:
+            if _recorder is None or _recorder_pid != os.getpid():
+                _recorder = LoginRecorder()
+                _recorder_pid = os.getpid()
+    return _recorder
+
+
+def record(*args, **kwargs):
+    get_recorder().record(*args, **kwargs)
+
+
+def stats() -> dict:
+    return get_recorder().stats()
+
+
+# ----------------------------
+# CLI
+# ----------------------------
+def main():
+    parser = argparse.ArgumentParser(description="Show recent login attempts of a tenant.")
+    parser.add_argument("tenant_id")
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--failed", action="store_true", help="only failed attempts")
+    args = parser.parse_args()
+
+    with read_cursor() as cur:
+        rows = cur.execute(
+            """
+            SELECT attempted_at, username, success, ip, user_agent
+            FROM login_audit
+            WHERE tenant_id = ? AND (NOT ? OR NOT success)
+            ORDER BY attempted_at DESC
+            LIMIT ?
+            """,
+            (args.tenant_id, args.failed, args.limit),
+        ).fetchall()
+    for at, username, success, ip, user_agent in rows:
+        print(f"[LOGINS] {at:%Y-%m-%d %H:%M:%S}  {'ok  ' if success else 'FAIL'}  {username:<30} {ip or '-':<15} {user_agent or ''}")
+
+
+if __name__ == "__main__":
+    main()
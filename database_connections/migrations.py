@@ -0,0 +1,284 @@
+import argparse
+import os
+
+from database_connections import attendance_ingest, attendance_summary, layout, login_audit, payroll_run
+from database_connections.pool import write_cursor
+
+# ----------------------------
+# Versioned schema migrations
+# ----------------------------
+# Every schema change is a numbered migration recorded in schema_migrations.
+# A migration has two parts:
+#
+#   upgrade(cur)                     DDL, run in one short write transaction
+#   backfill(cur, after, batch_size) optional data fill, run afterwards in
+#                                    many small transactions; returns the key
+#                                    of the last row it handled, or None when
+#                                    done
+#
+# Backfill progress is committed together with each batch, so an interrupted
+# run resumes where it stopped and check-ins keep flowing between batches.
+#
+# Run with:
+#   python -m database_connections.migrations            # apply pending
+#   python -m database_connections.migrations --dry-run  # show the plan only
+
+BACKFILL_BATCH = int(os.environ.get("HRMS_MIGRATION_BATCH", "5000"))
+
+MIGRATIONS: list[tuple] = []  # (version, name, upgrade, backfill)
+
+
+def migration(version: int, name: str, backfill=None):
+    """Register ``upgrade(cur)`` as migration ``version``."""
+
+    def register(upgrade):
+        MIGRATIONS.append((version, name, upgrade, backfill))
+        MIGRATIONS.sort(key=lambda m: m[0])
+        return upgrade
+
+    return register
+
+
+class _DryRun(Exception):
+    """Raised inside the dry-run transaction so it is rolled back."""
+
+
+# ----------------------------
+# Migrations
+# ----------------------------
+
+@migration(1, "baseline schema")
+def _baseline(cur):
+    from database_connections.db_initial import create_tables
+
+    create_tables(cur)
+
+
+@migration(2, "attendance surrogate key and composite indexes")
+def _attendance_key_and_indexes(cur):
+    layout.apply(cur)
+
+
+def _backfill_summary(cur, after, batch_size):
+    return attendance_summary.rebuild_batch(cur, after or "", batch_size)
+
+
+@migration(3, "attendance_daily_summary", backfill=_backfill_summary)
+def _attendance_summary(cur):
+    attendance_summary.create_table(cur)
+
+
+def _backfill_login_email(cur, after, batch_size):
+    rows = cur.execute(
+        """
+        UPDATE logins SET email = u.email
+        FROM users u
+        WHERE u.user_id = logins.user_id
+          AND logins.login_id IN (
+              SELECT login_id FROM logins WHERE login_id > ? ORDER BY login_id LIMIT ?
+          )
+        RETURNING logins.login_id
+        """,
+        (after or "", batch_size),
+    ).fetchall()
+    return max(r[0] for r in rows) if rows else None
+
+
+@migration(4, "logins.email", backfill=_backfill_login_email)
+def _login_email(cur):
+    cur.execute("ALTER TABLE logins ADD COLUMN IF NOT EXISTS email TEXT")
+
+
+@migration(5, "salary_structures and payroll_runs")
+def _payroll_run_tables(cur):
+    payroll_run.create_tables(cur)
+
+
+@migration(6, "payroll.month as DATE")
+def _payroll_month_date(cur):
+    # DuckDB cannot retype a column inside a UNIQUE constraint, so the table
+    # is rebuilt from its own DDL with month as DATE and swapped in.
+    month_type = cur.execute(
+        "SELECT data_type FROM information_schema.columns WHERE table_name = 'payroll' AND column_name = 'month'"
+    ).fetchone()[0]
+    if month_type == "DATE":
+        return
+    ddl = cur.execute("SELECT sql FROM duckdb_tables() WHERE table_name = 'payroll'").fetchone()[0]
+    cur.execute(
+        ddl.replace("CREATE TABLE payroll(", "CREATE TABLE _payroll_v6(", 1).replace('"month" VARCHAR', '"month" DATE', 1)
+    )
+    cur.execute(
+        """
+        INSERT INTO _payroll_v6
+        SELECT * REPLACE (
+            CAST(date_trunc('month', CAST(CASE WHEN length(month) = 7 THEN month || '-01' ELSE month END AS DATE)) AS DATE)
+                AS month
+        )
+        FROM payroll
+        ORDER BY tenant_id, month, user_id
+        """
+    )
+    cur.execute("DROP TABLE payroll")
+    cur.execute("ALTER TABLE _payroll_v6 RENAME TO payroll")
+    cur.execute("ALTER TABLE payroll_runs ALTER COLUMN month TYPE DATE")
+
+
+@migration(7, "ingest_offsets")
+def _ingest_offsets(cur):
+    attendance_ingest.create_table(cur)
+
+
+@migration(8, "attendance check-in/out event ids")
+def _attendance_event_ids(cur):
+    cur.execute("ALTER TABLE attendance ADD COLUMN IF NOT EXISTS check_in_event_id TEXT")
+    cur.execute("ALTER TABLE attendance ADD COLUMN IF NOT EXISTS check_out_event_id TEXT")
+
+
+@migration(9, "login_audit")
+def _login_audit(cur):
+    login_audit.create_table(cur)
+
+
+@migration(10, "attendance day status from the day's total", backfill=_backfill_summary)
+def _summary_day_status(cur):
+    # Summary rows used to take the status of the day's latest session; the
+    # backfill recomputes them all from the sessions.
+    pass
+
+
+@migration(11, "tenants.domain_verified")
+def _tenant_domain_verified(cur):
+    # Existing domains were generated at registration, so none of them is
+    # verified until an admin confirms it (python -m database_connections.tenants).
+    cur.execute("ALTER TABLE tenants ADD COLUMN IF NOT EXISTS domain_verified BOOLEAN DEFAULT FALSE")
+
+
+# ----------------------------
+# Runner
+# ----------------------------
+
+def _ensure_version_table(cur):
+    cur.execute("""
+    CREATE TABLE IF NOT EXISTS schema_migrations (
+        version INTEGER PRIMARY KEY,
+        name TEXT NOT NULL,
+        applied_at TIMESTAMP DEFAULT NOW(),
+        backfill_cursor TEXT,
+        backfilled_at TIMESTAMP
+    )
+    """)
+
+
+def _has_table(cur, table: str) -> bool:
+    return cur.execute(
+        "SELECT COUNT(*) FROM information_schema.tables WHERE table_name = ?", (table,)
+    ).fetchone()[0] > 0
+
+
+def status(cur) -> dict[int, tuple]:
+    """Map of applied version -> (applied_at, backfill_cursor, backfilled_at)."""
+    if not _has_table(cur, "schema_migrations"):
+        return {}
+    rows = cur.execute(
+        "SELECT version, applied_at, backfill_cursor, backfilled_at FROM schema_migrations"
+    ).fetchall()
+    return {r[0]: r[1:] for r in rows}
+
+
+def _run_backfill(version: int, name: str, backfill, batch_size: int):
+    with write_cursor() as cur:
+        after = cur.execute(
+            "SELECT backfill_cursor FROM schema_migrations WHERE version = ?", (version,)
+        ).fetchone()[0]
+
+    batches = 0
+    while True:
+        with write_cursor() as cur:
+            after = backfill(cur, after, batch_size)
+            if after is None:
+                cur.execute("UPDATE schema_migrations SET backfilled_at = NOW() WHERE version = ?", (version,))
+            else:
+                cur.execute(
+                    "UPDATE schema_migrations SET backfill_cursor = ? WHERE version = ?", (str(after), version)
+                )
+        if after is None:
+            break
+        batches += 1
+        print(f"[MIGRATE]   {version:04d} {name}: batch {batches} done (cursor={after})")
+    print(f"[MIGRATE]   {version:04d} {name}: backfill complete")
+
+
+def _plan(cur):
+    """Prepare the version table and return (pending, unfinished) migrations.
+
+    A database created before this engine existed (tables present but no
+    schema_migrations) is stamped at version 1 and upgraded from there.
+    """
+    legacy = not _has_table(cur, "schema_migrations") and _has_table(cur, "tenants")
+    _ensure_version_table(cur)
+    if legacy:
+        cur.execute(
+            "INSERT INTO schema_migrations (version, name, backfilled_at) VALUES (1, ?, NOW())",
+            (MIGRATIONS[0][1],),
+        )
+        print("[MIGRATE] Existing database stamped at version 1")
+    applied = status(cur)
+
+    pending = [m for m in MIGRATIONS if m[0] not in applied]
+    unfinished = [m for m in MIGRATIONS if m[0] in applied and m[3] and applied[m[0]][2] is None]
+    return pending, unfinished
+
+
+def migrate(dry_run: bool = False, batch_size: int = BACKFILL_BATCH) -> list[int]:
+    """Apply every pending migration in order; returns the versions applied."""
+    if dry_run:
+        try:
+            with write_cursor() as cur:
+                pending, unfinished = _plan(cur)
+                for version, name, _, _ in unfinished:
+                    print(f"[MIGRATE] would resume backfill {version:04d} {name}")
+                for version, name, upgrade, backfill in pending:
+                    upgrade(cur)
+                    print(f"[MIGRATE] would apply {version:04d} {name}" + (" (+ backfill)" if backfill else ""))
+                raise _DryRun
+        except _DryRun:
+            if pending or unfinished:
+                print("[MIGRATE] Dry run: pending DDL applied cleanly and was rolled back")
+            else:
+                print("[MIGRATE] Schema is up to date")
+        return []
+
+    with write_cursor() as cur:
+        pending, unfinished = _plan(cur)
+
+    if not pending and not unfinished:
+        print("[MIGRATE] Schema is up to date")
+        return []
+
+    for version, name, _, backfill in unfinished:
+        _run_backfill(version, name, backfill, batch_size)
+
+    for version, name, upgrade, backfill in pending:
+        with write_cursor() as cur:
+            upgrade(cur)
+            cur.execute(
+                """
+                INSERT INTO schema_migrations (version, name, backfilled_at)
+                VALUES (?, ?, CASE WHEN ? THEN NULL ELSE NOW() END)
+                """,
+                (version, name, backfill is not None),
+            )
+        print(f"[MIGRATE] Applied {version:04d} {name}")
+        if backfill:
+            _run_backfill(version, name, backfill, batch_size)
+
+    return [m[0] for m in pending]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Apply pending HRMS schema migrations.")
+    parser.add_argument("--dry-run", action="store_true", help="show and validate pending migrations, change nothing")
+    parser.add_argument("--batch-size", type=int, default=BACKFILL_BATCH, help="rows per backfill transaction")
+    args = parser.parse_args()
+
+    migrate(dry_run=args.dry_run, batch_size=args.batch_size)
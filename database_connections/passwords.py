@@ -0,0 +1,148 @@
+import argparse
+import asyncio
+import functools
+import hashlib
+import hmac
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from database_connections.pool import read_cursor, write_cursor
+
+# ----------------------------
+# Password hashing
+# ----------------------------
+# logins.password holds a salted scrypt hash (hashlib, no extra dependency):
+#
+#   scrypt$<n>$<r>$<p>$<salt hex>$<key hex>
+#
+# scrypt is deliberately CPU- and memory-hard (~16 MB and tens of ms per
+# hash at the default cost), so handlers never run it on the event loop:
+# hash() and verify() run on a thread pool sized to the cores. hashlib
+# releases the GIL while hashing, so the threads really run in parallel.
+#
+# Rows written before hashing existed hold the plaintext password, and rows
+# hashed before a cost change hold the old parameters. verify() accepts both
+# and reports needs_rehash, and login_user then stores a fresh hash at the
+# current cost. `python -m database_connections.passwords --rehash-plaintext`
+# migrates the remaining plaintext rows without waiting for logins.
+
+SCRYPT_N = int(os.environ.get("HRMS_SCRYPT_N", str(2 ** 14)))
+SCRYPT_R = int(os.environ.get("HRMS_SCRYPT_R", "8"))
+SCRYPT_P = int(os.environ.get("HRMS_SCRYPT_P", "1"))
+HASH_WORKERS = int(os.environ.get("HRMS_HASH_WORKERS", str(os.cpu_count() or 1)))
+
+PREFIX = "scrypt$"
+_SALT_BYTES = 16
+_KEY_BYTES = 32
+
+
+def _derive(password: str, salt: bytes, n: int, r: int, p: int) -> bytes:
+    return hashlib.scrypt(
+        password.encode(), salt=salt, n=n, r=r, p=p, maxmem=256 * n * r * p, dklen=_KEY_BYTES
+    )
+
+
+def hash_password(password: str, n: int = SCRYPT_N, r: int = SCRYPT_R, p: int = SCRYPT_P) -> str:
+    """Salted scrypt hash of ``password`` in the logins.password format."""
+    salt = os.urandom(_SALT_BYTES)
+    return f"{PREFIX}{n}${r}${p}${salt.hex()}${_derive(password, salt, n, r, p).hex()}"
+
+
+@functools.cache
+def _dummy_hash() -> str:
+    # Verified when the username does not exist, so a miss costs as much as
+    # a wrong password and response times do not reveal which usernames exist.
+    return hash_password("")
+
+
+def verify_password(password: str, stored: str | None) -> tuple[bool, bool]:
+    """``(matches, needs_rehash)`` for ``password`` against a stored value.
+
+    ``stored`` may be a hash, a legacy plaintext password or None (no such
+    login). needs_rehash is only ever True for a match: the stored value is
+    plaintext or was hashed with other parameters than the current ones.
+    """
+    if stored is None:
+        verify_password(password, _dummy_hash())
+        return False, False
+    if not stored.startswith(PREFIX):
+        matches = hmac.compare_digest(stored.encode(), password.encode())
+        return matches, matches
+    try:
+        n, r, p, salt, key = stored[len(PREFIX):].split("$")
+        n, r, p = int(n), int(r), int(p)
+        expected = bytes.fromhex(key)
+        derived = _derive(password, bytes.fromhex(salt), n, r, p)
+    except ValueError:
+        return False, False
+    matches = hmac.compare_digest(derived, expected)
+    return matches, matches and (n, r, p) != (SCRYPT_N, SCRYPT_R, SCRYPT_P)
+
+
+_executor: ThreadPoolExecutor | None = None
+_executor_pid: int | None = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Process-wide hashing pool (recreated after a fork, like the DB pool)."""
+    global _executor, _executor_pid
+    if _executor is None or _executor_pid != os.getpid():
+        with _executor_lock:
+            if _executor is None or _executor_pid != os.getpid():
+                _executor = ThreadPoolExecutor(HASH_WORKERS, thread_name_prefix="hrms-hash")
+                _executor_pid = os.getpid()
+    return _executor
+
+
+async def hash(password: str) -> str:
+    """``hash_password`` on the hashing pool."""
+    return await asyncio.get_running_loop().run_in_executor(get_executor(), hash_password, password)
+
+
+async def verify(password: str, stored: str | None) -> tuple[bool, bool]:
+    """``verify_password`` on the hashing pool."""
+    return await asyncio.get_running_loop().run_in_executor(get_executor(), verify_password, password, stored)
+
+
+# ----------------------------
+# Plaintext migration
+# ----------------------------
+def rehash_plaintext(batch: int = 1000) -> int:
+    """Replace every plaintext logins.password with a hash; returns the count.
+
+    Batches are hashed outside the write transaction, and a row whose
+    password changed in the meantime is left alone (and picked up again).
+    """
+    done = 0
+    while True:
+        with read_cursor() as cur:
+            rows = cur.execute(
+                "SELECT login_id, password FROM logins WHERE NOT starts_with(password, ?) LIMIT ?",
+                (PREFIX, batch),
+            ).fetchall()
+        if not rows:
+            return done
+        hashes = list(get_executor().map(hash_password, [r[1] for r in rows]))
+        with write_cursor() as cur:
+            cur.executemany(
+                "UPDATE logins SET password = ? WHERE login_id = ? AND password = ?",
+                [(h, login_id, old) for h, (login_id, old) in zip(hashes, rows)],
+            )
+        done += len(rows)
+        print(f"[PASSWORDS] Hashed {done} plaintext passwords")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Password hash maintenance for logins.")
+    parser.add_argument("--rehash-plaintext", action="store_true", help="hash every password still stored in plaintext")
+    args = parser.parse_args()
+    if args.rehash_plaintext:
+        print(f"[PASSWORDS] {rehash_plaintext()} plaintext passwords hashed")
+    else:
+        parser.print_help()
+
+
+if __name__ == "__main__":
+    main()
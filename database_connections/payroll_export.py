@@ -0,0 +1,75 @@
+import argparse
+import os
+from datetime import datetime
+
+from database_connections.pool import read_cursor
+
+# ----------------------------
+# Payroll Parquet export
+# ----------------------------
+# Writes payroll history as Hive-partitioned Parquet, one directory per
+# tenant and month:
+#
+#   OUT_DIR/tenant_id=<id>/period=2026-09/data_0.parquet
+#
+# Readers (DuckDB, Spark, pandas/pyarrow) prune on the directory names, so a
+# month-level query touches one file however many years are exported, e.g.
+#   SELECT * FROM read_parquet('OUT_DIR/*/*/*.parquet', hive_partitioning = true)
+#   WHERE tenant_id = '...' AND period = '2026-09'
+#
+# Run with:
+#   python -m database_connections.payroll_export OUT_DIR [--tenant ID] [--from 2025-01] [--to 2025-12]
+
+
+def export_payroll(cur, out_dir: str, tenant_id: str | None = None,
+                   start_month: str | None = None, end_month: str | None = None) -> int:
+    """Export payroll rows to ``out_dir``; months are 'YYYY-MM', both inclusive.
+
+    Re-exporting a month overwrites its files. Returns the number of rows written.
+    """
+    where, params = ["TRUE"], []
+    if tenant_id:
+        where.append("tenant_id = ?")
+        params.append(tenant_id)
+    if start_month:
+        where.append("month >= ?")
+        params.append(datetime.strptime(start_month, "%Y-%m").date())
+    if end_month:
+        end = datetime.strptime(end_month, "%Y-%m").date()
+        where.append("month < ?")
+        params.append(end.replace(year=end.year + end.month // 12, month=end.month % 12 + 1))
+
+    # COPY takes no prepared parameters, so the filtered rows are staged in a
+    # temp table by a parameterised query first.
+    cur.execute(
+        f"""
+        CREATE OR REPLACE TEMP TABLE _payroll_export AS
+        SELECT *, strftime(month, '%Y-%m') AS period
+        FROM payroll
+        WHERE {' AND '.join(where)}
+        ORDER BY tenant_id, month, user_id
+        """,
+        params,
+    )
+    rows = cur.execute("SELECT COUNT(*) FROM _payroll_export").fetchone()[0]
+    os.makedirs(out_dir, exist_ok=True)
+    target = out_dir.replace("'", "''")
+    cur.execute(
+        f"COPY _payroll_export TO '{target}' "
+        "(FORMAT PARQUET, PARTITION_BY (tenant_id, period), OVERWRITE_OR_IGNORE)"
+    )
+    cur.execute("DROP TABLE _payroll_export")
+    print(f"[EXPORT] Wrote {rows} payroll rows to {out_dir}")
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export payroll as month-partitioned Parquet.")
+    parser.add_argument("out_dir")
+    parser.add_argument("--tenant", help="only export this tenant_id")
+    parser.add_argument("--from", dest="start_month", help="first month, YYYY-MM")
+    parser.add_argument("--to", dest="end_month", help="last month, YYYY-MM")
+    args = parser.parse_args()
+
+    with read_cursor() as cur:
+        export_payroll(cur, args.out_dir, args.tenant, args.start_month, args.end_month)
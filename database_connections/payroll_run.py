@@ -0,0 +1,202 @@
+import argparse
+import time
+import uuid
+from datetime import date, datetime
+
+from database_connections.pool import write_cursor
+
+# ----------------------------
+# Monthly payroll run
+# ----------------------------
+# Computes a month's payroll for every active employee of a tenant in one
+# set-based statement instead of one upsert per employee:
+#
+#   base      basic + allowances of the salary structure in effect on the
+#             last day of the month
+#   paid days present/remote/leave days + half of "Half day" days from
+#             attendance_daily_summary, plus approved leave weekdays with no
+#             attendance row
+#   gross     base * min(paid days / weekdays in month, 1)
+#   net       gross - gross * deduction_rate
+#
+# A normal run only fills employees that have no payroll row for the month
+# (manual edits survive); rerun=True recomputes and overwrites every row.
+# Either way, running it twice gives the same result. Each run is recorded in
+# payroll_runs with its timing.
+#
+# Run with:
+#   python -m database_connections.payroll_run --tenant TENANT_ID --month 2026-09 [--rerun]
+
+
+def create_tables(con):
+    con.execute("""
+    CREATE TABLE IF NOT EXISTS salary_structures (
+        tenant_id TEXT NOT NULL,
+        user_id TEXT NOT NULL,
+        effective_from DATE NOT NULL,
+        basic DOUBLE NOT NULL,
+        allowances DOUBLE DEFAULT 0,
+        deduction_rate DOUBLE DEFAULT 0,
+        PRIMARY KEY (tenant_id, user_id, effective_from)
+    )
+    """)
+    con.execute("""
+    CREATE TABLE IF NOT EXISTS payroll_runs (
+        run_id TEXT PRIMARY KEY,
+        tenant_id TEXT NOT NULL,
+        month DATE NOT NULL,
+        rerun BOOLEAN DEFAULT FALSE,
+        run_by TEXT,
+        started_at TIMESTAMP,
+        finished_at TIMESTAMP,
+        duration_ms DOUBLE,
+        employees INTEGER,
+        written INTEGER,
+        skipped INTEGER,
+        total_gross DOUBLE,
+        total_net DOUBLE
+    )
+    """)
+
+
+_PAYROLL_SELECT = """
+    WITH staff AS (
+        SELECT u.user_id
+        FROM users u
+        WHERE u.tenant_id = $tenant AND u.status = 'active'
+    ),
+    structure AS (
+        SELECT user_id, arg_max(basic + coalesce(allowances, 0), effective_from) AS base,
+               arg_max(coalesce(deduction_rate, 0), effective_from) AS deduction_rate
+        FROM salary_structures
+        WHERE tenant_id = $tenant AND effective_from <= $month_end
+        GROUP BY user_id
+    ),
+    worked AS (
+        SELECT user_id,
+               COUNT(*) FILTER (WHERE status IN ('present', 'remote', 'leave'))
+                   + 0.5 * COUNT(*) FILTER (WHERE status = 'Half day') AS days
+        FROM attendance_daily_summary
+        WHERE tenant_id = $tenant AND date BETWEEN $month_start AND $month_end
+        GROUP BY user_id
+    ),
+    leave_days AS (
+        SELECT l.user_id, COUNT(DISTINCT CAST(d AS DATE)) AS days
+        FROM leaves l,
+             generate_series(CAST(greatest(l.start_date, $month_start) AS TIMESTAMP),
+                             CAST(least(l.end_date, $month_end) AS TIMESTAMP), INTERVAL 1 DAY) g(d)
+        WHERE l.tenant_id = $tenant AND l.status = 'approved'
+          AND l.start_date <= $month_end AND l.end_date >= $month_start
+          AND dayofweek(d) BETWEEN 1 AND 5
+          AND NOT EXISTS (
+              SELECT 1 FROM attendance_daily_summary s
+              WHERE s.tenant_id = $tenant AND s.user_id = l.user_id AND s.date = CAST(d AS DATE)
+          )
+        GROUP BY l.user_id
+    ),
+    computed AS (
+        SELECT
+            s.user_id,
+            round(st.base * least((coalesce(w.days, 0) + coalesce(ld.days, 0)) / $working_days, 1), 2) AS gross,
+            st.deduction_rate
+        FROM staff s
+        JOIN structure st USING (user_id)
+        LEFT JOIN worked w USING (user_id)
+        LEFT JOIN leave_days ld USING (user_id)
+    )
+    SELECT
+        CAST(uuid() AS VARCHAR), $tenant, user_id, $month,
+        gross, round(gross * deduction_rate, 2), round(gross - round(gross * deduction_rate, 2), 2), NOW()
+    FROM computed
+"""
+
+
+def _working_days(month_start: date, month_end: date) -> int:
+    return sum(
+        1 for d in range(month_start.toordinal(), month_end.toordinal() + 1)
+        if date.fromordinal(d).weekday() < 5
+    )
+
+
+def run_payroll(cur, tenant_id: str, month: str, rerun: bool = False, run_by: str | None = None) -> dict:
+    """Compute payroll for ``month`` ('YYYY-MM') on the write cursor.
+
+    Returns the audit row as a dict.
+    """
+    started_at, started = datetime.now(), time.perf_counter()
+    month_start = datetime.strptime(month, "%Y-%m").date()
+    next_month = month_start.replace(year=month_start.year + month_start.month // 12,
+                                     month=month_start.month % 12 + 1)
+    month_end = date.fromordinal(next_month.toordinal() - 1)
+    params = {
+        "tenant": tenant_id,
+        "month": month_start,
+        "month_start": month_start,
+        "month_end": month_end,
+        "working_days": _working_days(month_start, month_end),
+    }
+
+    conflict = (
+        """DO UPDATE SET gross_salary = excluded.gross_salary,
+                         deductions = excluded.deductions,
+                         net_salary = excluded.net_salary,
+                         processed_at = excluded.processed_at"""
+        if rerun else "DO NOTHING"
+    )
+    written = cur.execute(
+        f"""
+        INSERT INTO payroll (payroll_id, tenant_id, user_id, month, gross_salary, deductions, net_salary, processed_at)
+        {_PAYROLL_SELECT}
+        ON CONFLICT (tenant_id, user_id, month) {conflict}
+        """,
+        params,
+    ).fetchone()[0]
+
+    employees, skipped = cur.execute(
+        """
+        SELECT COUNT(*), COUNT(*) FILTER (WHERE NOT EXISTS (
+            SELECT 1 FROM salary_structures s
+            WHERE s.tenant_id = u.tenant_id AND s.user_id = u.user_id AND s.effective_from <= ?
+        ))
+        FROM users u WHERE u.tenant_id = ? AND u.status = 'active'
+        """,
+        (month_end, tenant_id),
+    ).fetchone()
+    total_gross, total_net = cur.execute(
+        "SELECT coalesce(SUM(gross_salary), 0), coalesce(SUM(net_salary), 0) FROM payroll WHERE tenant_id = ? AND month = ?",
+        (tenant_id, params["month"]),
+    ).fetchone()
+
+    run = {
+        "run_id": str(uuid.uuid4()),
+        "tenant_id": tenant_id,
+        "month": params["month"],
+        "rerun": rerun,
+        "run_by": run_by,
+        "started_at": started_at,
+        "finished_at": datetime.now(),
+        "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+        "employees": employees,
+        "written": written,
+        "skipped": skipped,
+        "total_gross": round(total_gross, 2),
+        "total_net": round(total_net, 2),
+    }
+    cur.execute(
+        f"INSERT INTO payroll_runs ({', '.join(run)}) VALUES ({', '.join('?' * len(run))})",
+        tuple(run.values()),
+    )
+    print(f"[PAYROLL] {tenant_id} {month}: wrote {written} of {employees} employees "
+          f"({skipped} without salary structure) in {run['duration_ms']} ms")
+    return run
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run payroll for a tenant and month.")
+    parser.add_argument("--tenant", required=True, help="tenant_id to run payroll for")
+    parser.add_argument("--month", default=date.today().strftime("%Y-%m"), help="YYYY-MM (default: this month)")
+    parser.add_argument("--rerun", action="store_true", help="recompute and overwrite existing rows")
+    args = parser.parse_args()
+
+    with write_cursor() as cur:
+        run_payroll(cur, args.tenant, args.month, args.rerun)
@@ -0,0 +1,143 @@
+import os
+import queue
+import threading
+from contextlib import contextmanager
+
+import duckdb
+
+# ----------------------------
+# Shared DuckDB connection pool
+# ----------------------------
+# One database instance per process. Every event handler borrows its own
+# cursor (a duplicate of the root connection) so concurrent handlers no
+# longer share a single connection object.
+
+DB_PATH = os.environ.get("HRMS_DB_PATH", "hrms.duckdb")
+MAX_READERS = int(os.environ.get("HRMS_DB_MAX_READERS", "8"))
+ACQUIRE_TIMEOUT = float(os.environ.get("HRMS_DB_ACQUIRE_TIMEOUT", "30"))
+
+
+class PoolExhausted(RuntimeError):
+    """Raised when no cursor becomes free within the acquire timeout."""
+
+
+class ConnectionPool:
+    """Bounded cursor pool over a single DuckDB database instance.
+
+    Readers run concurrently, up to ``max_readers`` at a time. Writers are
+    serialized on one dedicated cursor and always run inside a transaction,
+    so a failed handler never leaves half-applied changes behind.
+    """
+
+    def __init__(self, database: str = DB_PATH, max_readers: int = MAX_READERS):
+        self.database = database
+        self.max_readers = max_readers
+        self._conn = None
+        self._open_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._write_cursor = None
+        self._idle = queue.LifoQueue(maxsize=max_readers)
+        self._slots = threading.BoundedSemaphore(max_readers)
+
+    def _connection(self) -> duckdb.DuckDBPyConnection:
+        if self._conn is None:
+            with self._open_lock:
+                if self._conn is None:
+                    try:
+                        self._conn = duckdb.connect(database=self.database)
+                    except duckdb.IOException as e:
+                        if "lock" not in str(e).lower():
+                            raise
+                        raise RuntimeError(
+                            f"{self.database} is already open in another process; DuckDB allows one "
+                            "process per database file (see 'Worker topology' in README.md)"
+                        ) from e
+        return self._conn
+
+    @contextmanager
+    def reader(self, timeout: float = ACQUIRE_TIMEOUT):
+        """Borrow a read cursor for the duration of the ``with`` block."""
+        if not self._slots.acquire(timeout=timeout):
+            raise PoolExhausted(f"no read cursor free after {timeout}s")
+        try:
+            try:
+                cur = self._idle.get_nowait()
+            except queue.Empty:
+                cur = self._connection().cursor()
+            try:
+                yield cur
+            finally:
+                # A partially fetched result (e.g. after fetchone()) keeps its
+                # auto-commit transaction open and pins an old snapshot, which
+                # makes later deletes trip foreign-key checks. Replacing it
+                # with a trivial query ends that transaction.
+                cur.execute("SELECT 1").fetchall()
+                self._idle.put_nowait(cur)
+        finally:
+            self._slots.release()
+
+    @contextmanager
+    def writer(self, timeout: float = ACQUIRE_TIMEOUT):
+        """Borrow the write cursor; commits on success, rolls back on error."""
+        if not self._write_lock.acquire(timeout=timeout):
+            raise PoolExhausted(f"write cursor still busy after {timeout}s")
+        try:
+            if self._write_cursor is None:
+                self._write_cursor = self._connection().cursor()
+            cur = self._write_cursor
+            cur.begin()
+            try:
+                yield cur
+            except BaseException:
+                cur.rollback()
+                raise
+            else:
+                cur.commit()
+        finally:
+            self._write_lock.release()
+
+    def checkpoint(self):
+        """Flush the WAL and release row groups left behind by bulk rewrites."""
+        with self._write_lock:
+            self._connection().execute("CHECKPOINT")
+
+    def close(self):
+        with self._open_lock:
+            while not self._idle.empty():
+                self._idle.get_nowait().close()
+            if self._write_cursor is not None:
+                self._write_cursor.close()
+                self._write_cursor = None
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_pool: ConnectionPool | None = None
+_pool_pid: int | None = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> ConnectionPool:
+    """Return the process-wide pool, creating it on first use.
+
+    The pool is keyed on the process id so forked workers open their own
+    database instance instead of inheriting the parent's handle.
+    """
+    global _pool, _pool_pid
+    if _pool is None or _pool_pid != os.getpid():
+        with _pool_lock:
+            if _pool is None or _pool_pid != os.getpid():
+                _pool = ConnectionPool()
+                _pool_pid = os.getpid()
+    return _pool
+
+
+def read_cursor(timeout: float = ACQUIRE_TIMEOUT):
+    """Shortcut for ``get_pool().reader()``."""
+    return get_pool().reader(timeout)
+
+
+def write_cursor(timeout: float = ACQUIRE_TIMEOUT):
+    """Shortcut for ``get_pool().writer()``."""
+    return get_pool().writer(timeout)
@@ -0,0 +1,235 @@
+import argparse
+import time
+from datetime import date, timedelta
+
+from database_connections import attendance_summary, layout, passwords
+from database_connections.db_initial import migrate
+from database_connections.pool import get_pool, write_cursor
+
+# ----------------------------
+# Synthetic multi-tenant data
+# ----------------------------
+# Fills the database with realistic-looking tenants for load testing:
+# users + logins, departments, years of weekday check-ins, leaves, monthly
+# payroll with salary structures and quarterly performance reviews. Everything is generated set-based
+# inside DuckDB (one transaction per tenant), so 100k employees per tenant is
+# a matter of minutes, not hours.
+#
+# Run with:
+#   python -m database_connections.seed --tenants 3 --employees 1000 --years 2
+#
+# Every seeded login uses the password given by --password (default
+# "password"); usernames look like "user42@seed-0001" and user0 of every
+# tenant is its admin.
+
+FIRST_NAMES = [
+    "Aarav", "Aditi", "Alex", "Amara", "Ana", "Arjun", "Ben", "Chen", "Chloe", "Daniel",
+    "Diya", "Elena", "Ethan", "Fatima", "Grace", "Hiro", "Isabel", "Ivan", "Jonas", "Kavya",
+    "Leah", "Liam", "Maya", "Mei", "Noah", "Nora", "Omar", "Priya", "Rahul", "Sara",
+    "Sofia", "Tariq", "Vikram", "Yara", "Zoe",
+]
+LAST_NAMES = [
+    "Anand", "Becker", "Costa", "Das", "Evans", "Fischer", "Garcia", "Gupta", "Haddad", "Iyer",
+    "Jensen", "Kim", "Kumar", "Lopez", "Martin", "Nair", "Novak", "Okafor", "Patel", "Quinn",
+    "Rao", "Rossi", "Sato", "Shah", "Silva", "Tanaka", "Nguyen", "Wang", "Weber", "Zhou",
+]
+DEPARTMENTS = ["Engineering", "Sales", "Marketing", "Finance", "HR", "Operations", "Support", "Legal"]
+ROLES = ["Engineer", "Senior Engineer", "Analyst", "Manager", "Designer", "Sales Executive", "HR Specialist", "Accountant"]
+KPIS = ["Delivery", "Quality", "Collaboration", "Ownership"]
+LEAVE_TYPES = ["Vacation", "Sick Leave", "Personal", "Maternity/Paternity"]
+
+
+def _seed_tenant(cur, n: int, employees: int, start: date, end: date, password: str):
+    tenant_id = f"seed-{n:04d}"
+    company = f"Seed Company {n:04d}"
+    params = {"tenant": tenant_id, "company": company, "employees": employees}
+
+    cur.execute(
+        "INSERT INTO tenants (tenant_id, company_name, domain, plan, created_at) VALUES (?, ?, ?, 'premium', ?)",
+        (tenant_id, company, f"{tenant_id}.io", start),
+    )
+
+    # Users: first/last names and roles drawn from the lists above.
+    cur.execute(
+        """
+        INSERT INTO users (user_id, tenant_id, company_name, name, email, role, status, date_joined)
+        SELECT
+            $tenant || '-u' || lpad(CAST(i AS VARCHAR), 6, '0'),
+            $tenant,
+            $company,
+            $first[1 + CAST(floor(random() * len($first)) AS INTEGER)] || ' '
+                || $last[1 + CAST(floor(random() * len($last)) AS INTEGER)],
+            'user' || i || '@' || $tenant || '.io',
+            CASE WHEN i = 0 THEN 'admin' ELSE $roles[1 + CAST(floor(random() * len($roles)) AS INTEGER)] END,
+            CASE WHEN i = 0 THEN 'active' WHEN random() < 0.03 THEN 'inactive' ELSE 'active' END,
+            CAST($start AS TIMESTAMP) - INTERVAL (CAST(random() * 900 AS INTEGER)) DAY
+        FROM range($employees) r(i)
+        """,
+        {**params, "first": FIRST_NAMES, "last": LAST_NAMES, "roles": ROLES, "start": start},
+    )
+
+    # Hashed once per tenant: every seeded login shares the password, so they
+    # may share the salt too; real logins each get their own.
+    cur.execute(
+        """
+        INSERT INTO logins (login_id, tenant_id, user_id, username, password, email, failed_attempts, account_locked, created_at)
+        SELECT user_id || '-login', tenant_id, user_id, split_part(email, '.io', 1), $password, email, 0, FALSE, date_joined
+        FROM users WHERE tenant_id = $tenant
+        """,
+        {"tenant": tenant_id, "password": passwords.hash_password(password)},
+    )
+
+    cur.execute(
+        """
+        INSERT INTO departments (dept_id, tenant_id, name, manager_id)
+        SELECT $tenant || '-d' || i, $tenant, $depts[i + 1],
+               $tenant || '-u' || lpad(CAST(i % $employees AS VARCHAR), 6, '0')
+        FROM range(len($depts)) r(i)
+        """,
+        {"tenant": tenant_id, "depts": DEPARTMENTS, "employees": employees},
+    )
+
+    # Attendance: one session per active employee per weekday. Roughly 4% of
+    # days have no row at all; the rest follow the dashboard's status rules.
+    cur.execute(
+        """
+        INSERT INTO attendance (tenant_id, user_id, date, status, check_in, check_out)
+        WITH days AS (
+            SELECT CAST(d AS DATE) AS day
+            FROM generate_series(CAST($start AS DATE), CAST($end AS DATE), INTERVAL 1 DAY) g(d)
+            WHERE dayofweek(d) BETWEEN 1 AND 5
+        ),
+        sessions AS (
+            SELECT u.user_id, d.day, random() AS r,
+                   d.day + INTERVAL 8 HOUR + INTERVAL (CAST(random() * 120 AS INTEGER)) MINUTE AS check_in
+            FROM users u, days d
+            WHERE u.tenant_id = $tenant AND u.status = 'active' AND d.day >= CAST(u.date_joined AS DATE)
+        )
+        SELECT
+            $tenant, user_id, day,
+            CASE WHEN r < 0.80 THEN 'present' WHEN r < 0.88 THEN 'remote'
+                 WHEN r < 0.93 THEN 'Half day' WHEN r < 0.96 THEN 'leave' ELSE 'absent' END,
+            check_in,
+            check_in + INTERVAL (CASE WHEN r < 0.88 THEN 480 + CAST(random() * 90 AS INTEGER)
+                                      WHEN r < 0.93 THEN 330
+                                      WHEN r < 0.96 THEN 0
+                                      ELSE 120 END) MINUTE
+        FROM sessions
+        WHERE r < 0.96 OR random() < 0.5
+        """,
+        {"tenant": tenant_id, "start": start, "end": end},
+    )
+
+    # Leaves: about four requests per employee per year.
+    years = max(1, (end - start).days // 365)
+    cur.execute(
+        """
+        INSERT INTO leaves (leave_id, tenant_id, user_id, type, start_date, end_date, status, requested_at)
+        SELECT
+            user_id || '-l' || k, $tenant, user_id,
+            $types[1 + CAST(floor(random() * len($types)) AS INTEGER)],
+            s, s + CAST(floor(random() * 4) AS INTEGER),
+            CASE WHEN s > current_date THEN 'pending'
+                 WHEN random() < 0.85 THEN 'approved' ELSE 'rejected' END,
+            CAST(s AS TIMESTAMP) - INTERVAL (CAST(1 + random() * 20 AS INTEGER)) DAY
+        FROM (
+            SELECT user_id, k,
+                   CAST($start AS DATE) + CAST(floor(random() * ($span + 30)) AS INTEGER) AS s
+            FROM users, range($per_user) r(k)
+            WHERE tenant_id = $tenant
+        )
+        """,
+        {"tenant": tenant_id, "types": LEAVE_TYPES, "start": start,
+         "span": (end - start).days, "per_user": 4 * years},
+    )
+
+    # Payroll: one row per employee per month in range.
+    cur.execute(
+        """
+        INSERT INTO payroll (payroll_id, tenant_id, user_id, month, gross_salary, deductions, net_salary, processed_at)
+        SELECT
+            user_id || '-p' || strftime(m, '%Y%m'), $tenant, user_id, m,
+            gross, round(gross * 0.15, 2), round(gross * 0.85, 2), m + INTERVAL 27 DAY
+        FROM (
+            SELECT u.user_id, CAST(m AS DATE) AS m,
+                   round(3000 + (hash(u.user_id) % 7000), 2) AS gross
+            FROM users u, generate_series(date_trunc('month', CAST($start AS DATE)),
+                                           CAST($end AS DATE), INTERVAL 1 MONTH) g(m)
+            WHERE u.tenant_id = $tenant
+        )
+        """,
+        {"tenant": tenant_id, "start": start, "end": end},
+    )
+
+    # Salary structures matching the seeded payroll (basic + allowances = gross).
+    cur.execute(
+        """
+        INSERT INTO salary_structures (tenant_id, user_id, effective_from, basic, allowances, deduction_rate)
+        SELECT $tenant, user_id, CAST(date_joined AS DATE), round(gross * 0.8, 2), round(gross * 0.2, 2), 0.15
+        FROM (
+            SELECT user_id, date_joined, round(3000 + (hash(user_id) % 7000), 2) AS gross
+            FROM users WHERE tenant_id = $tenant
+        )
+        """,
+        {"tenant": tenant_id},
+    )
+
+    # Performance: one review per KPI per employee per quarter.
+    cur.execute(
+        """
+        INSERT INTO performance (performance_id, tenant_id, user_id, kpi_name, score, review_date, notes)
+        SELECT user_id || '-k' || strftime(q, '%Y%m') || '-' || kpi, $tenant, user_id, kpi,
+               round(1 + random() * 4, 1), CAST(q AS DATE), NULL
+        FROM users u,
+             generate_series(date_trunc('quarter', CAST($start AS DATE)), CAST($end AS DATE), INTERVAL 3 MONTH) g(q),
+             unnest($kpis) k(kpi)
+        WHERE u.tenant_id = $tenant
+        """,
+        {"tenant": tenant_id, "start": start, "end": end, "kpis": KPIS},
+    )
+
+    attendance_summary.rebuild(cur, tenant_id)
+    return tenant_id, company
+
+
+def seed(tenants: int = 3, employees: int = 100, years: float = 1, seed_value: float = 0.42,
+         password: str = "password", cluster: bool = False):
+    """Generate ``tenants`` synthetic tenants; returns [(tenant_id, company_name)]."""
+    migrate()
+    end = date.today() - timedelta(days=1)
+    start = end - timedelta(days=int(365 * years))
+
+    with write_cursor() as cur:
+        first = cur.execute("SELECT COUNT(*) FROM tenants WHERE tenant_id LIKE 'seed-%'").fetchone()[0] + 1
+
+    created = []
+    for n in range(first, first + tenants):
+        started = time.perf_counter()
+        with write_cursor() as cur:
+            cur.execute("SELECT setseed(?)", ((seed_value + n / 1000) % 1,))
+            created.append(_seed_tenant(cur, n, employees, start, end, password))
+            rows = cur.execute(
+                "SELECT COUNT(*) FROM attendance WHERE tenant_id = ?", (created[-1][0],)
+            ).fetchone()[0]
+        print(f"[SEED] {created[-1][1]}: {employees} employees, {rows:,} attendance rows "
+              f"in {time.perf_counter() - started:.1f}s")
+
+    if cluster:
+        with write_cursor() as cur:
+            layout.cluster(cur)
+        get_pool().checkpoint()
+    return created
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fill the HRMS database with synthetic tenants.")
+    parser.add_argument("--tenants", type=int, default=3)
+    parser.add_argument("--employees", type=int, default=100, help="employees per tenant (10 to 100000)")
+    parser.add_argument("--years", type=float, default=1, help="years of attendance/payroll history")
+    parser.add_argument("--seed", type=float, default=0.42, help="random seed in [0, 1]")
+    parser.add_argument("--password", default="password", help="password for every seeded login")
+    parser.add_argument("--cluster", action="store_true", help="re-cluster tables afterwards")
+    args = parser.parse_args()
+
+    for tenant_id, company in seed(args.tenants, args.employees, args.years, args.seed, args.password, args.cluster):
+        print(f"[SEED] admin login: company '{company}', username 'user0@{tenant_id}', password '{args.password}'")
@@ -0,0 +1,194 @@
+import argparse
+import os
+import time
+from dataclasses import dataclass
+
+from database_connections import aio, cache
+from database_connections.pool import write_cursor
+
+# ----------------------------
+# Tenant directory
+# ----------------------------
+# Every login has to turn what the user typed (company name, work email) or
+# the host the app is served on into a tenant_id. The tenants table is tiny
+# and changes only on registration, so each process keeps all of it in
+# memory, indexed three ways:
+#
+#   normalized company name   "  ACME   corp " -> "acme corp"
+#   verified domain           "acme.io" (also matched by hr.acme.io, or
+#                             user@acme.io)
+#   tenant_id
+#
+# Only a domain an admin has set or verified (tenants.domain_verified) routes
+# logins; the domain suggested at registration does not, since anyone can
+# register any company name. A domain verified for more than one tenant
+# routes to none of them, so those users have to type their company name.
+#
+# Lookups never touch the database once the directory is loaded. It is loaded
+# at startup (load(), registered as a lifespan task) and reloaded on the
+# first lookup after the "tenants" cache topic was invalidated, locally or
+# by another worker over Redis. DIRECTORY_TTL bounds staleness if such an
+# invalidation message is lost.
+#
+# Set and verify a tenant's domain with:
+#   python -m database_connections.tenants TENANT_ID --domain acme.io
+#   python -m database_connections.tenants TENANT_ID --unverify
+
+DIRECTORY_TTL = float(os.environ.get("HRMS_TENANT_DIRECTORY_TTL", "300"))
+
+# SQL twin of normalize_company(), for checks inside write transactions.
+NORMALIZED_COMPANY_SQL = "lower(regexp_replace(trim(company_name), '\\s+', ' ', 'g'))"
+
+
+@dataclass(frozen=True)
+class Tenant:
+    tenant_id: str
+    company_name: str
+    domain: str | None
+    plan: str | None
+    domain_verified: bool = False
+
+
+def normalize_company(name: str) -> str:
+    """Case- and whitespace-insensitive form of a company name."""
+    return " ".join(name.split()).lower()
+
+
+def normalize_host(host: str) -> str:
+    """Bare lower-case host name: no scheme, port, path or trailing dot."""
+    host = host.strip().lower()
+    if "://" in host:
+        host = host.split("://", 1)[1]
+    return host.split("/", 1)[0].rsplit(":", 1)[0].rstrip(".")
+
+
+class TenantDirectory:
+    """Immutable snapshot of the tenants table, indexed for login lookups."""
+
+    def __init__(self, rows=(), version=None):
+        self.version = version
+        self.loaded_at = time.monotonic()
+        self.by_id: dict[str, Tenant] = {}
+        self.by_company: dict[str, Tenant] = {}
+        owners: dict[str, list[Tenant]] = {}
+        # Rows come oldest first, so if names collide the original tenant
+        # keeps them.
+        for row in rows:
+            tenant = Tenant(*row)
+            self.by_id[tenant.tenant_id] = tenant
+            self.by_company.setdefault(normalize_company(tenant.company_name), tenant)
+            if tenant.domain and tenant.domain_verified:
+                owners.setdefault(normalize_host(tenant.domain), []).append(tenant)
+        # A domain claimed by several tenants is not routed at all.
+        self.by_domain: dict[str, Tenant] = {d: t[0] for d, t in owners.items() if len(t) == 1}
+
+    def company(self, name: str) -> Tenant | None:
+        return self.by_company.get(normalize_company(name))
+
+    def domain(self, host: str) -> Tenant | None:
+        """Tenant owning ``host`` or its closest parent domain."""
+        labels = normalize_host(host).split(".")
+        for i in range(len(labels) - 1):
+            tenant = self.by_domain.get(".".join(labels[i:]))
+            if tenant:
+                return tenant
+        return None
+
+    def email(self, address: str) -> Tenant | None:
+        _, at, domain = address.rpartition("@")
+        return self.domain(domain) if at else None
+
+
+_directory = TenantDirectory()
+
+
+def _version():
+    return cache.get_cache().versions(None, ("tenants",))
+
+
+async def load() -> TenantDirectory:
+    """(Re)load the directory from the tenants table."""
+    global _directory
+    version = _version()
+    rows = await aio.fetchall(
+        """
+        SELECT tenant_id, company_name, domain, plan, coalesce(domain_verified, FALSE)
+        FROM tenants ORDER BY created_at, tenant_id
+        """
+    )
+    _directory = TenantDirectory(rows, version)
+    print(f"[TENANTS] Directory loaded: {len(_directory.by_id)} tenants")
+    return _directory
+
+
+async def get_directory() -> TenantDirectory:
+    """The current directory, reloaded first if tenants changed or it expired."""
+    directory = _directory
+    if directory.version != _version() or time.monotonic() - directory.loaded_at > DIRECTORY_TTL:
+        directory = await load()
+    return directory
+
+
+async def resolve(company: str = "", email: str = "", host: str = "") -> Tenant | None:
+    """Tenant for a login attempt.
+
+    A company name the user typed wins; without one the domain of the email
+    address, then the request host, is tried against verified domains.
+    """
+    directory = await get_directory()
+    if company.strip():
+        return directory.company(company)
+    return (email and directory.email(email)) or (host and directory.domain(host)) or None
+
+
+async def warm():
+    """Lifespan task: load the directory when a backend process starts."""
+    try:
+        await load()
+    except Exception as e:
+        # e.g. migrations not applied yet; the first login loads it instead.
+        print(f"[TENANTS] Could not preload the directory: {e}")
+
+
+def set_domain(tenant_id: str, domain: str | None = None, verified: bool = True) -> None:
+    """Set (or, with ``domain=None``, keep) ``tenant_id``'s domain and mark it verified or not.
+
+    Raises ValueError for an unknown tenant, a missing or malformed domain,
+    or one that another tenant has already verified.
+    """
+    with write_cursor() as cur:
+        row = cur.execute("SELECT domain FROM tenants WHERE tenant_id = ?", (tenant_id,)).fetchone()
+        if not row:
+            raise ValueError(f"Unknown tenant {tenant_id}")
+        domain = normalize_host(domain if domain is not None else row[0] or "")
+        if verified:
+            if "." not in domain or "@" in domain:
+                raise ValueError(f"Invalid domain '{domain}'")
+            owner = cur.execute(
+                "SELECT tenant_id FROM tenants WHERE lower(domain) = ? AND domain_verified AND tenant_id <> ?",
+                (domain, tenant_id),
+            ).fetchone()
+            if owner:
+                raise ValueError(f"Domain {domain} is already verified for tenant {owner[0]}")
+        cur.execute(
+            "UPDATE tenants SET domain = ?, domain_verified = ? WHERE tenant_id = ?",
+            (domain or None, verified, tenant_id),
+        )
+    cache.invalidate(None, "tenants")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Set or verify the domain a tenant's logins are routed on.")
+    parser.add_argument("tenant_id")
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument("--domain", help="set and verify this domain (e.g. acme.io)")
+    group.add_argument("--verify", action="store_true", help="verify the domain the tenant already has")
+    group.add_argument("--unverify", action="store_true", help="stop routing logins on the tenant's domain")
+    args = parser.parse_args()
+
+    try:
+        set_domain(args.tenant_id, args.domain, verified=not args.unverify)
+    except ValueError as e:
+        raise SystemExit(f"[TENANTS] {e}")
+    state = "no longer routed" if args.unverify else "verified"
+    print(f"[TENANTS] Domain of tenant {args.tenant_id} {state}")
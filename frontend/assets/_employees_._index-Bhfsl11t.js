@@ -1 +0,0 @@
-import{a as e}from"./rolldown-runtime-D_juG1Xi.js";import{t}from"./react-BcXKmAwN.js";import"./react-dom-Dr_efIFp.js";import{A as n,r}from"./chunk-NISHYRIK-BsYev12b.js";import{C as i,E as a,F as o,H as s,L as c,S as l,T as u,W as d,_ as f,b as p,c as m,d as h,f as g,g as _,h as v,i as y,l as b,m as x,n as S,o as C,p as w,s as T,u as E,x as D}from"./esm-CvOQchaW.js";import"./reflex-env-CtwX00K9.js";import{n as O}from"./emotion-react.browser.esm-B3Hu227f.js";import"./react-is-BiweJ67z.js";import"./shim-DLiwten_.js";import{r as k}from"./dist-CwLIn6Ym.js";import"./createLucideIcon-DvMhwGZ5.js";import{n as A,t as j}from"./users-h3LY_qm3.js";import{a as M,c as N,o as P,r as F,s as I,t as L}from"./stateful_components-DJaICTVT.js";import{t as R}from"./lib-D8E8fr-q.js";var z=e(t()),B=e(R());function V(){let e=(0,z.useContext)(c.reflex___state____state__templates___login____login_state__components___admin_dash_side_nav____admin_state__templates___admin_employees_management_dashboard____employee_crud_state),[t,n]=(0,z.useContext)(o),r=(0,z.useCallback)(e=>t([s(`reflex___state____state.templates___login____login_state.components___admin_dash_side_nav____admin_state.templates___admin_employees_management_dashboard____employee_crud_state.set_name`,{value:e?.target?.value},{})],[e],{}),[t,s]);return O(B.default,{debounceTimeout:300,element:S,onChange:r,placeholder:`Full Name`,value:d(e.name_rx_state_)?e.name_rx_state_:``})}function H(){let e=(0,z.useContext)(c.reflex___state____state__templates___login____login_state__components___admin_dash_side_nav____admin_state__templates___admin_employees_management_dashboard____employee_crud_state),[t,n]=(0,z.useContext)(o),r=(0,z.useCallback)(e=>t([s(`reflex___state____state.templates___login____login_state.components___admin_dash_side_nav____admin_state.templates___admin_employees_management_dashboard____employee_crud_state.set_email`,{value:e?.target?.value},{})],[e],{}),[t,s]);return O(B.default,{debounceTimeout:300,element:S,onChange:r,placeholder:`Email Address`,value:d(e.email_rx_state_)?e.email_rx_state_:``})}function U(){let[e,t]=(0,z.useContext)(o),n=(0,z.useCallback)(t=>e([s(`reflex___state____state.templates___login____login_state.set_role`,{value:t?.target?.value},{})],[t],{}),[e,s]);return O(B.default,{debounceTimeout:300,element:S,onChange:n,placeholder:`Role (e.g., Manager, Engineer)`,value:(d(``),``)})}function W(){let[e,t]=(0,z.useContext)(o),n=(0,z.useCallback)(t=>e([s(`reflex___state____state.templates___login____login_state.set_password`,{value:t?.target?.value},{})],[t],{}),[e,s]);return O(B.default,{debounceTimeout:300,element:S,onChange:n,placeholder:`Password`,value:(d(``),``)})}function G(){let e=(0,z.useContext)(c.reflex___state____state__templates___login____login_state__components___admin_dash_side_nav____admin_state__templates___admin_employees_management_dashboard____employee_crud_state);return O(z.Fragment,{},e.selected_user_id_rx_state_?.valueOf?.()===``?.valueOf?.()?O(z.Fragment,{},O(W,{})):O(z.Fragment,{}))}function K(){let e=(0,z.useContext)(c.reflex___state____state__templates___login____login_state__components___admin_dash_side_nav____admin_state__templates___admin_employees_management_dashboard____employee_crud_state),[t,n]=(0,z.useContext)(o),r=(0,z.useCallback)(e=>t([s(`reflex___state____state.templates___login____login_state.components___admin_dash_side_nav____admin_state.templates___admin_employees_management_dashboard____employee_crud_state.set_status`,{value:e},{})],[e],{}),[t,s]);return O(g,{onValueChange:r,value:e.status_rx_state_},O(x,{}),O(w,{},O(_,{},``,O(v,{value:`active`},`active`),O(v,{value:`inactive`},`inactive`),O(v,{value:`terminated`},`terminated`))))}function q(){let e=(0,z.useContext)(c.reflex___state____state__templates___login____login_state__components___admin_dash_side_nav____admin_state__templates___admin_employees_management_dashboard____employee_crud_state),[t,n]=(0,z.useContext)(o),r=(0,z.useCallback)(n=>t([e.selected_user_id_rx_state_?.valueOf?.()===``?.valueOf?.()?s(`reflex___state____state.templates___login____login_state.components___admin_dash_side_nav____admin_state.templates___admin_employees_management_dashboard____employee_crud_state.create_employee`,{},{}):s(`reflex___state____state.templates___login____login_state.components___admin_dash_side_nav____admin_state.templates___admin_employees_management_dashboard____employee_crud_state.update_employee`,{},{})],[n],{}),[t,s,e]);return O(p,{color:`green`,onClick:r},e.selected_user_id_rx_state_?.valueOf?.()===``?.valueOf?.()?`Create Employee`:`Update Employee`)}function J(){let[e,t]=(0,z.useContext)(o),n=(0,z.useCallback)(t=>e([s(`reflex___state____state.templates___login____login_state.components___admin_dash_side_nav____admin_state.templates___admin_employees_management_dashboard____employee_crud_state.set_name`,{value:``},{}),s(`reflex___state____state.templates___login____login_state.components___admin_dash_side_nav____admin_state.templates___admin_employees_management_dashboard____employee_crud_state.set_email`,{value:``},{}),s(`reflex___state____state.templates___login____login_state.set_role`,{value:``},{}),s(`reflex___state____state.templates___login____login_state.set_password`,{value:``},{}),s(`reflex___state____state.templates___login____login_state.components___admin_dash_side_nav____admin_state.templates___admin_employees_management_dashboard____employee_crud_state.set_selected_user_id`,{value:``},{})],[t],{}),[e,s]);return O(p,{color:`gray`,onClick:n},`Clear Form`)}function Y(){let[e,t]=(0,z.useContext)(o),n=(0,z.useCallback)(t=>{let n=t.target;t.preventDefault(),{...Object.fromEntries(new FormData(n).entries())},((...t)=>e([s(`_call_function`,{function:()=>null,callback:null},{preventDefault:!0})],t,{}))(t)});return O(k,{className:`Root `,css:{width:`100%`,maxWidth:`500px`,mb:`8`},onSubmit:n},O(D,{align:`start`,className:`rx-Stack`,direction:`column`,gap:`3`},O(V,{}),O(H,{}),O(U,{}),O(G,{}),O(K,{}),O(D,{align:`start`,className:`rx-Stack`,direction:`row`,gap:`3`},O(q,{}),O(J,{}))))}function X(){let e=(0,z.useContext)(c.reflex___state____state__templates___login____login_state__components___admin_dash_side_nav____admin_state__templates___admin_employees_management_dashboard____employee_crud_state),[t,n]=(0,z.useContext)(o);return O(T,{},Array.prototype.map.call(e.employees_rx_state_??[],(e,n)=>O(y,{key:n},O(C,{},e?.name),O(C,{},e?.email),O(C,{},e?.role),O(C,{},e?.status),O(C,{},e?.date_joined),O(C,{},O(D,{align:`start`,className:`rx-Stack`,direction:`row`,gap:`2`},O(p,{color:`blue`,onClick:n=>t([s(`reflex___state____state.templates___login____login_state.components___admin_dash_side_nav____admin_state.templates___admin_employees_management_dashboard____employee_crud_state.edit_employee`,{user_id:e?.user_id},{})],[n],{}),size:`1`,variant:`outline`},`Edit`),O(p,{color:`red`,onClick:n=>t([s(`reflex___state____state.templates___login____login_state.components___admin_dash_side_nav____admin_state.templates___admin_employees_management_dashboard____employee_crud_state.delete_employee`,{user_id:e?.user_id},{})],[n],{}),size:`1`,variant:`solid`},`Delete`))))))}function Z(){(0,z.useEffect)(()=>(((...t)=>e([s(`reflex___state____state.templates___login____login_state.components___admin_dash_side_nav____admin_state.templates___admin_employees_management_dashboard____employee_crud_state.load_employees`,{},{})],t,{}))(),()=>{}),[]);let[e,t]=(0,z.useContext)(o);return O(l,{css:{p:`8`,width:`100%`,height:`100vh`,overflowY:`auto`,background:`white`,borderRadius:`12`,shadow:`sm`}},O(D,{align:`start`,className:`rx-Stack`,direction:`column`,gap:`3`},O(a,{css:{mb:`6`,color:`gray.700`},size:`7`},`Employee Management Dashboard`),O(Y,{}),O(E,{},O(m,{},O(y,{},O(b,{},`Name`),O(b,{},`Email`),O(b,{},`Role`),O(b,{},`Status`),O(b,{},`Date Joined`),O(b,{},`Actions`))),O(X,{}))))}var Q=n(function(){return O(z.Fragment,{},O(D,{align:`start`,className:`rx-Stack`,direction:`column`,gap:`0`},O(D,{align:`center`,className:`rx-Stack`,css:{width:`100%`,paddingTop:`1.5`,paddingBottom:`1.5`,paddingInlineStart:`6`,paddingInlineEnd:`6`,backgroundColor:`#FFF44F`,boxShadow:`0 2px 8px rgba(0, 0, 0, 0.15)`,position:`sticky`,top:`0`,zIndex:`1000`},direction:`row`,justify:`between`,gap:`3`},O(u,{as:`p`,css:{color:`#1E3A8A`,fontSize:`2`,fontWeight:`bold`,paddingInlineStart:`2`,paddingInlineEnd:`2`,"&:hover":{color:`#2563EB`,transition:`color 0.3s ease`}}},`OStaffSync`),O(D,{align:`center`,className:`rx-Stack`,css:{margin:`20`},direction:`row`,gap:`5`},O(f,{asChild:!0,css:{color:`black`,fontSize:`1.1`,paddingInlineStart:`2`,paddingInlineEnd:`2`,"&:hover":{color:`#2563EB`,transform:`scale(1.05)`,transition:`all 0.3s ease-in-out`}}},O(r,{to:`/login`},`Logout`)))),O(D,{align:`start`,className:`rx-Stack`,css:{width:`100%`},direction:`row`,gap:`3`},O(l,{},O(D,{align:`start`,className:`rx-Stack`,css:{height:`100vh`,backgroundColor:`var(--accent-2)`,width:`18rem`,borderRight:`1px solid var(--gray-6)`},direction:`column`,justify:`between`,gap:`2`},O(D,{align:`center`,className:`rx-Stack`,css:{padding:`1rem`},direction:`row`,gap:`3`},O(A,{size:22}),O(u,{as:`p`,size:`5`,weight:`bold`},`OStaffSync`)),O(h,{size:`4`}),O(f,{asChild:!0,css:{"&:hover":{color:`var(--accent-8)`}}},O(r,{to:`/dashboard`},O(D,{align:`center`,className:`rx-Stack`,css:{"&:hover":{background:`var(--accent-4)`,color:`var(--accent-11)`,cursor:`pointer`},width:`100%`,paddingInlineStart:`0.5rem`,paddingInlineEnd:`0.5rem`,paddingTop:`0.75rem`,paddingBottom:`0.75rem`},direction:`row`,gap:`3`},O(I,{}),O(u,{as:`p`,size:`4`},`Dashboard`)))),O(f,{asChild:!0,css:{"&:hover":{color:`var(--accent-8)`}}},O(r,{to:`/employees`},O(D,{align:`center`,className:`rx-Stack`,css:{"&:hover":{background:`var(--accent-4)`,color:`var(--accent-11)`,cursor:`pointer`},width:`100%`,paddingInlineStart:`0.5rem`,paddingInlineEnd:`0.5rem`,paddingTop:`0.75rem`,paddingBottom:`0.75rem`},direction:`row`,gap:`3`},O(j,{}),O(u,{as:`p`,size:`4`},`Employees`)))),O(f,{asChild:!0,css:{"&:hover":{color:`var(--accent-8)`}}},O(r,{to:`/attendance`},O(D,{align:`center`,className:`rx-Stack`,css:{"&:hover":{background:`var(--accent-4)`,color:`var(--accent-11)`,cursor:`pointer`},width:`100%`,paddingInlineStart:`0.5rem`,paddingInlineEnd:`0.5rem`,paddingTop:`0.75rem`,paddingBottom:`0.75rem`},direction:`row`,gap:`3`},O(N,{}),O(u,{as:`p`,size:`4`},`Attendance`)))),O(f,{asChild:!0,css:{"&:hover":{color:`var(--accent-8)`}}},O(r,{to:`/payroll`},O(D,{align:`center`,className:`rx-Stack`,css:{"&:hover":{background:`var(--accent-4)`,color:`var(--accent-11)`,cursor:`pointer`},width:`100%`,paddingInlineStart:`0.5rem`,paddingInlineEnd:`0.5rem`,paddingTop:`0.75rem`,paddingBottom:`0.75rem`},direction:`row`,gap:`3`},O(P,{}),O(u,{as:`p`,size:`4`},`Payroll`)))),O(D,{css:{flex:1,justifySelf:`stretch`,alignSelf:`stretch`}}),O(l,{css:{padding:`1rem`,borderTop:`1px solid var(--gray-5)`}},O(D,{align:`center`,className:`rx-Stack`,css:{width:`100%`},direction:`row`,justify:`between`,gap:`3`},O(i,{fallback:`👤`,size:`3`}),O(D,{align:`start`,className:`rx-Stack`,direction:`column`,gap:`0`},O(F,{}),O(M,{}))),O(L,{})))),O(Z,{}))),O(`title`,{},`Ostaffsync | Employees`),O(`meta`,{content:`favicon.ico`,property:`og:image`}))});export{Q as default};
\ No newline at end of file
@@ -1 +0,0 @@
-import{a as e,i as t,n,r}from"./rolldown-runtime-D_juG1Xi.js";import{t as i}from"./react-BcXKmAwN.js";import"./react-dom-Dr_efIFp.js";import{A as a,r as o}from"./chunk-NISHYRIK-BsYev12b.js";import{E as s,K as c,S as l,T as u,_ as d,b as f,j as p,v as m,x as h}from"./esm-CvOQchaW.js";import"./reflex-env-CtwX00K9.js";import{n as g}from"./emotion-react.browser.esm-B3Hu227f.js";import"./react-is-BiweJ67z.js";import"./shim-DLiwten_.js";var _=e(i(),1),v=(0,_.createContext)({});function y(e){let t=(0,_.useRef)(null);return t.current===null&&(t.current=e()),t.current}var b=typeof window<`u`,x=b?_.useLayoutEffect:_.useEffect,S=(0,_.createContext)(null);function C(e,t){e.indexOf(t)===-1&&e.push(t)}function ee(e,t){let n=e.indexOf(t);n>-1&&e.splice(n,1)}var w=(e,t,n)=>n>t?t:n<e?e:n,T={},te=e=>/^-?(?:\d+(?:\.\d+)?|\.\d+)$/u.test(e);function ne(e){return typeof e==`object`&&!!e}var re=e=>/^0[^.\s]+$/u.test(e);function ie(e){let t;return()=>(t===void 0&&(t=e()),t)}var E=e=>e,ae=(e,t)=>n=>t(e(n)),oe=(...e)=>e.reduce(ae),se=(e,t,n)=>{let r=t-e;return r===0?1:(n-e)/r},ce=class{constructor(){this.subscriptions=[]}add(e){return C(this.subscriptions,e),()=>ee(this.subscriptions,e)}notify(e,t,n){let r=this.subscriptions.length;if(r)if(r===1)this.subscriptions[0](e,t,n);else for(let i=0;i<r;i++){let r=this.subscriptions[i];r&&r(e,t,n)}}getSize(){return this.subscriptions.length}clear(){this.subscriptions.length=0}},D=e=>e*1e3,O=e=>e/1e3;function le(e,t){return t?e*(1e3/t):0}var ue=(e,t,n)=>(((1-3*n+3*t)*e+(3*n-6*t))*e+3*t)*e,de=1e-7,fe=12;function pe(e,t,n,r,i){let a,o,s=0;do o=t+(n-t)/2,a=ue(o,r,i)-e,a>0?n=o:t=o;while(Math.abs(a)>de&&++s<fe);return o}function me(e,t,n,r){if(e===t&&n===r)return E;let i=t=>pe(t,0,1,e,n);return e=>e===0||e===1?e:ue(i(e),t,r)}var he=e=>t=>t<=.5?e(2*t)/2:(2-e(2*(1-t)))/2,ge=e=>t=>1-e(1-t),_e=me(.33,1.53,.69,.99),ve=ge(_e),ye=he(ve),be=e=>(e*=2)<1?.5*ve(e):.5*(2-2**(-10*(e-1))),xe=e=>1-Math.sin(Math.acos(e)),Se=ge(xe),Ce=he(xe),we=me(.42,0,1,1),Te=me(0,0,.58,1),Ee=me(.42,0,.58,1),De=e=>Array.isArray(e)&&typeof e[0]!=`number`,Oe=e=>Array.isArray(e)&&typeof e[0]==`number`,ke={linear:E,easeIn:we,easeInOut:Ee,easeOut:Te,circIn:xe,circInOut:Ce,circOut:Se,backIn:ve,backInOut:ye,backOut:_e,anticipate:be},Ae=e=>typeof e==`string`,je=e=>{if(Oe(e)){e.length;let[t,n,r,i]=e;return me(t,n,r,i)}else if(Ae(e))return ke[e],`${e}`,ke[e];return e},Me=[`setup`,`read`,`resolveKeyframes`,`preUpdate`,`update`,`preRender`,`render`,`postRender`],k={value:null,addProjectionMetrics:null};function Ne(e,t){let n=new Set,r=new Set,i=!1,a=!1,o=new WeakSet,s={delta:0,timestamp:0,isProcessing:!1},c=0;function l(t){o.has(t)&&(u.schedule(t),e()),c++,t(s)}let u={schedule:(e,t=!1,a=!1)=>{let s=a&&i?n:r;return t&&o.add(e),s.has(e)||s.add(e),e},cancel:e=>{r.delete(e),o.delete(e)},process:e=>{if(s=e,i){a=!0;return}i=!0,[n,r]=[r,n],n.forEach(l),t&&k.value&&k.value.frameloop[t].push(c),c=0,n.clear(),i=!1,a&&(a=!1,u.process(e))}};return u}var Pe=40;function Fe(e,t){let n=!1,r=!0,i={delta:0,timestamp:0,isProcessing:!1},a=()=>n=!0,o=Me.reduce((e,n)=>(e[n]=Ne(a,t?n:void 0),e),{}),{setup:s,read:c,resolveKeyframes:l,preUpdate:u,update:d,preRender:f,render:p,postRender:m}=o,h=()=>{let a=T.useManualTiming?i.timestamp:performance.now();n=!1,T.useManualTiming||(i.delta=r?1e3/60:Math.max(Math.min(a-i.timestamp,Pe),1)),i.timestamp=a,i.isProcessing=!0,s.process(i),c.process(i),l.process(i),u.process(i),d.process(i),f.process(i),p.process(i),m.process(i),i.isProcessing=!1,n&&t&&(r=!1,e(h))},g=()=>{n=!0,r=!0,i.isProcessing||e(h)};return{schedule:Me.reduce((e,t)=>{let r=o[t];return e[t]=(e,t=!1,i=!1)=>(n||g(),r.schedule(e,t,i)),e},{}),cancel:e=>{for(let t=0;t<Me.length;t++)o[Me[t]].cancel(e)},state:i,steps:o}}var{schedule:A,cancel:j,state:M,steps:Ie}=Fe(typeof requestAnimationFrame<`u`?requestAnimationFrame:E,!0),Le;function Re(){Le=void 0}var N={now:()=>(Le===void 0&&N.set(M.isProcessing||T.useManualTiming?M.timestamp:performance.now()),Le),set:e=>{Le=e,queueMicrotask(Re)}},ze={layout:0,mainThread:0,waapi:0},Be=e=>t=>typeof t==`string`&&t.startsWith(e),Ve=Be(`--`),He=Be(`var(--`),Ue=e=>He(e)?We.test(e.split(`/*`)[0].trim()):!1,We=/var\(--(?:[\w-]+\s*|[\w-]+\s*,(?:\s*[^)(\s]|\s*\((?:[^)(]|\([^)(]*\))*\))+\s*)\)$/iu,Ge={test:e=>typeof e==`number`,parse:parseFloat,transform:e=>e},Ke={...Ge,transform:e=>w(0,1,e)},qe={...Ge,default:1},Je=e=>Math.round(e*1e5)/1e5,Ye=/-?(?:\d+(?:\.\d+)?|\.\d+)/gu;function Xe(e){return e==null}var Ze=/^(?:#[\da-f]{3,8}|(?:rgb|hsl)a?\((?:-?[\d.]+%?[,\s]+){2}-?[\d.]+%?\s*(?:[,/]\s*)?(?:\b\d+(?:\.\d+)?|\.\d+)?%?\))$/iu,Qe=(e,t)=>n=>!!(typeof n==`string`&&Ze.test(n)&&n.startsWith(e)||t&&!Xe(n)&&Object.prototype.hasOwnProperty.call(n,t)),$e=(e,t,n)=>r=>{if(typeof r!=`string`)return r;let[i,a,o,s]=r.match(Ye);return{[e]:parseFloat(i),[t]:parseFloat(a),[n]:parseFloat(o),alpha:s===void 0?1:parseFloat(s)}},et=e=>w(0,255,e),tt={...Ge,transform:e=>Math.round(et(e))},P={test:Qe(`rgb`,`red`),parse:$e(`red`,`green`,`blue`),transform:({red:e,green:t,blue:n,alpha:r=1})=>`rgba(`+tt.transform(e)+`, `+tt.transform(t)+`, `+tt.transform(n)+`, `+Je(Ke.transform(r))+`)`};function nt(e){let t=``,n=``,r=``,i=``;return e.length>5?(t=e.substring(1,3),n=e.substring(3,5),r=e.substring(5,7),i=e.substring(7,9)):(t=e.substring(1,2),n=e.substring(2,3),r=e.substring(3,4),i=e.substring(4,5),t+=t,n+=n,r+=r,i+=i),{red:parseInt(t,16),green:parseInt(n,16),blue:parseInt(r,16),alpha:i?parseInt(i,16)/255:1}}var rt={test:Qe(`#`),parse:nt,transform:P.transform},it=e=>({test:t=>typeof t==`string`&&t.endsWith(e)&&t.split(` `).length===1,parse:parseFloat,transform:t=>`${t}${e}`}),F=it(`deg`),I=it(`%`),L=it(`px`),at=it(`vh`),ot=it(`vw`),st=(()=>({...I,parse:e=>I.parse(e)/100,transform:e=>I.transform(e*100)}))(),ct={test:Qe(`hsl`,`hue`),parse:$e(`hue`,`saturation`,`lightness`),transform:({hue:e,saturation:t,lightness:n,alpha:r=1})=>`hsla(`+Math.round(e)+`, `+I.transform(Je(t))+`, `+I.transform(Je(n))+`, `+Je(Ke.transform(r))+`)`},R={test:e=>P.test(e)||rt.test(e)||ct.test(e),parse:e=>P.test(e)?P.parse(e):ct.test(e)?ct.parse(e):rt.parse(e),transform:e=>typeof e==`string`?e:e.hasOwnProperty(`red`)?P.transform(e):ct.transform(e),getAnimatableNone:e=>{let t=R.parse(e);return t.alpha=0,R.transform(t)}},lt=/(?:#[\da-f]{3,8}|(?:rgb|hsl)a?\((?:-?[\d.]+%?[,\s]+){2}-?[\d.]+%?\s*(?:[,/]\s*)?(?:\b\d+(?:\.\d+)?|\.\d+)?%?\))/giu;function ut(e){return isNaN(e)&&typeof e==`string`&&(e.match(Ye)?.length||0)+(e.match(lt)?.length||0)>0}var dt=`number`,ft=`color`,pt=`var`,mt=`var(`,ht="${}",gt=/var\s*\(\s*--(?:[\w-]+\s*|[\w-]+\s*,(?:\s*[^)(\s]|\s*\((?:[^)(]|\([^)(]*\))*\))+\s*)\)|#[\da-f]{3,8}|(?:rgb|hsl)a?\((?:-?[\d.]+%?[,\s]+){2}-?[\d.]+%?\s*(?:[,/]\s*)?(?:\b\d+(?:\.\d+)?|\.\d+)?%?\)|-?(?:\d+(?:\.\d+)?|\.\d+)/giu;function _t(e){let t=e.toString(),n=[],r={color:[],number:[],var:[]},i=[],a=0,o=t.replace(gt,e=>(R.test(e)?(r.color.push(a),i.push(ft),n.push(R.parse(e))):e.startsWith(mt)?(r.var.push(a),i.push(pt),n.push(e)):(r.number.push(a),i.push(dt),n.push(parseFloat(e))),++a,ht)).split(ht);return{values:n,split:o,indexes:r,types:i}}function vt(e){return _t(e).values}function yt(e){let{split:t,types:n}=_t(e),r=t.length;return e=>{let i=``;for(let a=0;a<r;a++)if(i+=t[a],e[a]!==void 0){let t=n[a];t===dt?i+=Je(e[a]):t===ft?i+=R.transform(e[a]):i+=e[a]}return i}}var bt=e=>typeof e==`number`?0:R.test(e)?R.getAnimatableNone(e):e;function xt(e){let t=vt(e);return yt(e)(t.map(bt))}var z={test:ut,parse:vt,createTransformer:yt,getAnimatableNone:xt};function St(e,t,n){return n<0&&(n+=1),n>1&&--n,n<1/6?e+(t-e)*6*n:n<1/2?t:n<2/3?e+(t-e)*(2/3-n)*6:e}function Ct({hue:e,saturation:t,lightness:n,alpha:r}){e/=360,t/=100,n/=100;let i=0,a=0,o=0;if(!t)i=a=o=n;else{let r=n<.5?n*(1+t):n+t-n*t,s=2*n-r;i=St(s,r,e+1/3),a=St(s,r,e),o=St(s,r,e-1/3)}return{red:Math.round(i*255),green:Math.round(a*255),blue:Math.round(o*255),alpha:r}}function wt(e,t){return n=>n>0?t:e}var B=(e,t,n)=>e+(t-e)*n,Tt=(e,t,n)=>{let r=e*e,i=n*(t*t-r)+r;return i<0?0:Math.sqrt(i)},Et=[rt,P,ct],Dt=e=>Et.find(t=>t.test(e));function Ot(e){let t=Dt(e);if(`${e}`,!t)return!1;let n=t.parse(e);return t===ct&&(n=Ct(n)),n}var kt=(e,t)=>{let n=Ot(e),r=Ot(t);if(!n||!r)return wt(e,t);let i={...n};return e=>(i.red=Tt(n.red,r.red,e),i.green=Tt(n.green,r.green,e),i.blue=Tt(n.blue,r.blue,e),i.alpha=B(n.alpha,r.alpha,e),P.transform(i))},At=new Set([`none`,`hidden`]);function jt(e,t){return At.has(e)?n=>n<=0?e:t:n=>n>=1?t:e}function Mt(e,t){return n=>B(e,t,n)}function Nt(e){return typeof e==`number`?Mt:typeof e==`string`?Ue(e)?wt:R.test(e)?kt:Lt:Array.isArray(e)?Pt:typeof e==`object`?R.test(e)?kt:Ft:wt}function Pt(e,t){let n=[...e],r=n.length,i=e.map((e,n)=>Nt(e)(e,t[n]));return e=>{for(let t=0;t<r;t++)n[t]=i[t](e);return n}}function Ft(e,t){let n={...e,...t},r={};for(let i in n)e[i]!==void 0&&t[i]!==void 0&&(r[i]=Nt(e[i])(e[i],t[i]));return e=>{for(let t in r)n[t]=r[t](e);return n}}function It(e,t){let n=[],r={color:0,var:0,number:0};for(let i=0;i<t.values.length;i++){let a=t.types[i],o=e.indexes[a][r[a]];n[i]=e.values[o]??0,r[a]++}return n}var Lt=(e,t)=>{let n=z.createTransformer(t),r=_t(e),i=_t(t);return r.indexes.var.length===i.indexes.var.length&&r.indexes.color.length===i.indexes.color.length&&r.indexes.number.length>=i.indexes.number.length?At.has(e)&&!i.values.length||At.has(t)&&!r.values.length?jt(e,t):oe(Pt(It(r,i),i.values),n):(`${e}${t}`,wt(e,t))};function Rt(e,t,n){return typeof e==`number`&&typeof t==`number`&&typeof n==`number`?B(e,t,n):Nt(e)(e,t)}var zt=e=>{let t=({timestamp:t})=>e(t);return{start:(e=!0)=>A.update(t,e),stop:()=>j(t),now:()=>M.isProcessing?M.timestamp:N.now()}},Bt=(e,t,n=10)=>{let r=``,i=Math.max(Math.round(t/n),2);for(let t=0;t<i;t++)r+=Math.round(e(t/(i-1))*1e4)/1e4+`, `;return`linear(${r.substring(0,r.length-2)})`},Vt=2e4;function Ht(e){let t=0,n=e.next(t);for(;!n.done&&t<2e4;)t+=50,n=e.next(t);return t>=2e4?1/0:t}function Ut(e,t=100,n){let r=n({...e,keyframes:[0,t]}),i=Math.min(Ht(r),Vt);return{type:`keyframes`,ease:e=>r.next(i*e).value/t,duration:O(i)}}var Wt=5;function Gt(e,t,n){let r=Math.max(t-Wt,0);return le(n-e(r),t-r)}var V={stiffness:100,damping:10,mass:1,velocity:0,duration:800,bounce:.3,visualDuration:.3,restSpeed:{granular:.01,default:2},restDelta:{granular:.005,default:.5},minDuration:.01,maxDuration:10,minDamping:.05,maxDamping:1},Kt=.001;function qt({duration:e=V.duration,bounce:t=V.bounce,velocity:n=V.velocity,mass:r=V.mass}){let i,a;V.maxDuration;let o=1-t;o=w(V.minDamping,V.maxDamping,o),e=w(V.minDuration,V.maxDuration,O(e)),o<1?(i=t=>{let r=t*o,i=r*e,a=r-n,s=Xt(t,o),c=Math.exp(-i);return Kt-a/s*c},a=t=>{let r=t*o*e,a=r*n+n,s=o**2*t**2*e,c=Math.exp(-r),l=Xt(t**2,o);return(-i(t)+Kt>0?-1:1)*((a-s)*c)/l}):(i=t=>{let r=Math.exp(-t*e),i=(t-n)*e+1;return-Kt+r*i},a=t=>{let r=Math.exp(-t*e),i=(n-t)*(e*e);return r*i});let s=5/e,c=Yt(i,a,s);if(e=D(e),isNaN(c))return{stiffness:V.stiffness,damping:V.damping,duration:e};{let t=c**2*r;return{stiffness:t,damping:o*2*Math.sqrt(r*t),duration:e}}}var Jt=12;function Yt(e,t,n){let r=n;for(let n=1;n<Jt;n++)r-=e(r)/t(r);return r}function Xt(e,t){return e*Math.sqrt(1-t*t)}var Zt=[`duration`,`bounce`],Qt=[`stiffness`,`damping`,`mass`];function $t(e,t){return t.some(t=>e[t]!==void 0)}function en(e){let t={velocity:V.velocity,stiffness:V.stiffness,damping:V.damping,mass:V.mass,isResolvedFromDuration:!1,...e};if(!$t(e,Qt)&&$t(e,Zt))if(e.visualDuration){let n=e.visualDuration,r=2*Math.PI/(n*1.2),i=r*r,a=2*w(.05,1,1-(e.bounce||0))*Math.sqrt(i);t={...t,mass:V.mass,stiffness:i,damping:a}}else{let n=qt(e);t={...t,...n,mass:V.mass},t.isResolvedFromDuration=!0}return t}function tn(e=V.visualDuration,t=V.bounce){let n=typeof e==`object`?e:{visualDuration:e,keyframes:[0,1],bounce:t},{restSpeed:r,restDelta:i}=n,a=n.keyframes[0],o=n.keyframes[n.keyframes.length-1],s={done:!1,value:a},{stiffness:c,damping:l,mass:u,duration:d,velocity:f,isResolvedFromDuration:p}=en({...n,velocity:-O(n.velocity||0)}),m=f||0,h=l/(2*Math.sqrt(c*u)),g=o-a,_=O(Math.sqrt(c/u)),v=Math.abs(g)<5;r||=v?V.restSpeed.granular:V.restSpeed.default,i||=v?V.restDelta.granular:V.restDelta.default;let y;if(h<1){let e=Xt(_,h);y=t=>{let n=Math.exp(-h*_*t);return o-n*((m+h*_*g)/e*Math.sin(e*t)+g*Math.cos(e*t))}}else if(h===1)y=e=>o-Math.exp(-_*e)*(g+(m+_*g)*e);else{let e=_*Math.sqrt(h*h-1);y=t=>{let n=Math.exp(-h*_*t),r=Math.min(e*t,300);return o-n*((m+h*_*g)*Math.sinh(r)+e*g*Math.cosh(r))/e}}let b={calculatedDuration:p&&d||null,next:e=>{let t=y(e);if(p)s.done=e>=d;else{let n=e===0?m:0;h<1&&(n=e===0?D(m):Gt(y,e,t));let a=Math.abs(n)<=r,c=Math.abs(o-t)<=i;s.done=a&&c}return s.value=s.done?o:t,s},toString:()=>{let e=Math.min(Ht(b),Vt),t=Bt(t=>b.next(e*t).value,e,30);return e+`ms `+t},toTransition:()=>{}};return b}tn.applyToOptions=e=>{let t=Ut(e,100,tn);return e.ease=t.ease,e.duration=D(t.duration),e.type=`keyframes`,e};function nn({keyframes:e,velocity:t=0,power:n=.8,timeConstant:r=325,bounceDamping:i=10,bounceStiffness:a=500,modifyTarget:o,min:s,max:c,restDelta:l=.5,restSpeed:u}){let d=e[0],f={done:!1,value:d},p=e=>s!==void 0&&e<s||c!==void 0&&e>c,m=e=>s===void 0?c:c===void 0||Math.abs(s-e)<Math.abs(c-e)?s:c,h=n*t,g=d+h,_=o===void 0?g:o(g);_!==g&&(h=_-d);let v=e=>-h*Math.exp(-e/r),y=e=>_+v(e),b=e=>{let t=v(e),n=y(e);f.done=Math.abs(t)<=l,f.value=f.done?_:n},x,S,C=e=>{p(f.value)&&(x=e,S=tn({keyframes:[f.value,m(f.value)],velocity:Gt(y,e,f.value),damping:i,stiffness:a,restDelta:l,restSpeed:u}))};return C(0),{calculatedDuration:null,next:e=>{let t=!1;return!S&&x===void 0&&(t=!0,b(e),C(e)),x!==void 0&&e>=x?S.next(e-x):(!t&&b(e),f)}}}function rn(e,t,n){let r=[],i=n||T.mix||Rt,a=e.length-1;for(let n=0;n<a;n++){let a=i(e[n],e[n+1]);if(t){let e=Array.isArray(t)?t[n]||E:t;a=oe(e,a)}r.push(a)}return r}function an(e,t,{clamp:n=!0,ease:r,mixer:i}={}){let a=e.length;if(t.length,a===1)return()=>t[0];if(a===2&&t[0]===t[1])return()=>t[1];let o=e[0]===e[1];e[0]>e[a-1]&&(e=[...e].reverse(),t=[...t].reverse());let s=rn(t,r,i),c=s.length,l=n=>{if(o&&n<e[0])return t[0];let r=0;if(c>1)for(;r<e.length-2&&!(n<e[r+1]);r++);let i=se(e[r],e[r+1],n);return s[r](i)};return n?t=>l(w(e[0],e[a-1],t)):l}function on(e,t){let n=e[e.length-1];for(let r=1;r<=t;r++){let i=se(0,t,r);e.push(B(n,1,i))}}function sn(e){let t=[0];return on(t,e.length-1),t}function cn(e,t){return e.map(e=>e*t)}function ln(e,t){return e.map(()=>t||Ee).splice(0,e.length-1)}function un({duration:e=300,keyframes:t,times:n,ease:r=`easeInOut`}){let i=De(r)?r.map(je):je(r),a={done:!1,value:t[0]},o=cn(n&&n.length===t.length?n:sn(t),e),s=an(o,t,{ease:Array.isArray(i)?i:ln(t,i)});return{calculatedDuration:e,next:t=>(a.value=s(t),a.done=t>=e,a)}}var dn=e=>e!==null;function fn(e,{repeat:t,repeatType:n=`loop`},r,i=1){let a=e.filter(dn),o=i<0||t&&n!==`loop`&&t%2==1?0:a.length-1;return!o||r===void 0?a[o]:r}var pn={decay:nn,inertia:nn,tween:un,keyframes:un,spring:tn};function mn(e){typeof e.type==`string`&&(e.type=pn[e.type])}var hn=class{constructor(){this.updateFinished()}get finished(){return this._finished}updateFinished(){this._finished=new Promise(e=>{this.resolve=e})}notifyFinished(){this.resolve()}then(e,t){return this.finished.then(e,t)}},gn=e=>e/100,_n=class extends hn{constructor(e){super(),this.state=`idle`,this.startTime=null,this.isStopped=!1,this.currentTime=0,this.holdTime=null,this.playbackSpeed=1,this.stop=()=>{let{motionValue:e}=this.options;e&&e.updatedAt!==N.now()&&this.tick(N.now()),this.isStopped=!0,this.state!==`idle`&&(this.teardown(),this.options.onStop?.())},ze.mainThread++,this.options=e,this.initAnimation(),this.play(),e.autoplay===!1&&this.pause()}initAnimation(){let{options:e}=this;mn(e);let{type:t=un,repeat:n=0,repeatDelay:r=0,repeatType:i,velocity:a=0}=e,{keyframes:o}=e,s=t||un;s!==un&&typeof o[0]!=`number`&&(this.mixKeyframes=oe(gn,Rt(o[0],o[1])),o=[0,100]);let c=s({...e,keyframes:o});i===`mirror`&&(this.mirroredGenerator=s({...e,keyframes:[...o].reverse(),velocity:-a})),c.calculatedDuration===null&&(c.calculatedDuration=Ht(c));let{calculatedDuration:l}=c;this.calculatedDuration=l,this.resolvedDuration=l+r,this.totalDuration=this.resolvedDuration*(n+1)-r,this.generator=c}updateTime(e){let t=Math.round(e-this.startTime)*this.playbackSpeed;this.holdTime===null?this.currentTime=t:this.currentTime=this.holdTime}tick(e,t=!1){let{generator:n,totalDuration:r,mixKeyframes:i,mirroredGenerator:a,resolvedDuration:o,calculatedDuration:s}=this;if(this.startTime===null)return n.next(0);let{delay:c=0,keyframes:l,repeat:u,repeatType:d,repeatDelay:f,type:p,onUpdate:m,finalKeyframe:h}=this.options;this.speed>0?this.startTime=Math.min(this.startTime,e):this.speed<0&&(this.startTime=Math.min(e-r/this.speed,this.startTime)),t?this.currentTime=e:this.updateTime(e);let g=this.currentTime-c*(this.playbackSpeed>=0?1:-1),_=this.playbackSpeed>=0?g<0:g>r;this.currentTime=Math.max(g,0),this.state===`finished`&&this.holdTime===null&&(this.currentTime=r);let v=this.currentTime,y=n;if(u){let e=Math.min(this.currentTime,r)/o,t=Math.floor(e),n=e%1;!n&&e>=1&&(n=1),n===1&&t--,t=Math.min(t,u+1),t%2&&(d===`reverse`?(n=1-n,f&&(n-=f/o)):d===`mirror`&&(y=a)),v=w(0,1,n)*o}let b=_?{done:!1,value:l[0]}:y.next(v);i&&(b.value=i(b.value));let{done:x}=b;!_&&s!==null&&(x=this.playbackSpeed>=0?this.currentTime>=r:this.currentTime<=0);let S=this.holdTime===null&&(this.state===`finished`||this.state===`running`&&x);return S&&p!==nn&&(b.value=fn(l,this.options,h,this.speed)),m&&m(b.value),S&&this.finish(),b}then(e,t){return this.finished.then(e,t)}get duration(){return O(this.calculatedDuration)}get iterationDuration(){let{delay:e=0}=this.options||{};return this.duration+O(e)}get time(){return O(this.currentTime)}set time(e){e=D(e),this.currentTime=e,this.startTime===null||this.holdTime!==null||this.playbackSpeed===0?this.holdTime=e:this.driver&&(this.startTime=this.driver.now()-e/this.playbackSpeed),this.driver?.start(!1)}get speed(){return this.playbackSpeed}set speed(e){this.updateTime(N.now());let t=this.playbackSpeed!==e;this.playbackSpeed=e,t&&(this.time=O(this.currentTime))}play(){if(this.isStopped)return;let{driver:e=zt,startTime:t}=this.options;this.driver||=e(e=>this.tick(e)),this.options.onPlay?.();let n=this.driver.now();this.state===`finished`?(this.updateFinished(),this.startTime=n):this.holdTime===null?this.startTime||=t??n:this.startTime=n-this.holdTime,this.state===`finished`&&this.speed<0&&(this.startTime+=this.calculatedDuration),this.holdTime=null,this.state=`running`,this.driver.start()}pause(){this.state=`paused`,this.updateTime(N.now()),this.holdTime=this.currentTime}complete(){this.state!==`running`&&this.play(),this.state=`finished`,this.holdTime=null}finish(){this.notifyFinished(),this.teardown(),this.state=`finished`,this.options.onComplete?.()}cancel(){this.holdTime=null,this.startTime=0,this.tick(0),this.teardown(),this.options.onCancel?.()}teardown(){this.state=`idle`,this.stopDriver(),this.startTime=this.holdTime=null,ze.mainThread--}stopDriver(){this.driver&&=(this.driver.stop(),void 0)}sample(e){return this.startTime=0,this.tick(e,!0)}attachTimeline(e){return this.options.allowFlatten&&(this.options.type=`keyframes`,this.options.ease=`linear`,this.initAnimation()),this.driver?.stop(),e.observe(this)}};function vn(e){for(let t=1;t<e.length;t++)e[t]??(e[t]=e[t-1])}var H=e=>e*180/Math.PI,yn=e=>{let t=H(Math.atan2(e[1],e[0]));return xn(t)},bn={x:4,y:5,translateX:4,translateY:5,scaleX:0,scaleY:3,scale:e=>(Math.abs(e[0])+Math.abs(e[3]))/2,rotate:yn,rotateZ:yn,skewX:e=>H(Math.atan(e[1])),skewY:e=>H(Math.atan(e[2])),skew:e=>(Math.abs(e[1])+Math.abs(e[2]))/2},xn=e=>(e%=360,e<0&&(e+=360),e),Sn=yn,Cn=e=>Math.sqrt(e[0]*e[0]+e[1]*e[1]),wn=e=>Math.sqrt(e[4]*e[4]+e[5]*e[5]),Tn={x:12,y:13,z:14,translateX:12,translateY:13,translateZ:14,scaleX:Cn,scaleY:wn,scale:e=>(Cn(e)+wn(e))/2,rotateX:e=>xn(H(Math.atan2(e[6],e[5]))),rotateY:e=>xn(H(Math.atan2(-e[2],e[0]))),rotateZ:Sn,rotate:Sn,skewX:e=>H(Math.atan(e[4])),skewY:e=>H(Math.atan(e[1])),skew:e=>(Math.abs(e[1])+Math.abs(e[4]))/2};function En(e){return e.includes(`scale`)?1:0}function Dn(e,t){if(!e||e===`none`)return En(t);let n=e.match(/^matrix3d\(([-\d.e\s,]+)\)$/u),r,i;if(n)r=Tn,i=n;else{let t=e.match(/^matrix\(([-\d.e\s,]+)\)$/u);r=bn,i=t}if(!i)return En(t);let a=r[t],o=i[1].split(`,`).map(kn);return typeof a==`function`?a(o):o[a]}var On=(e,t)=>{let{transform:n=`none`}=getComputedStyle(e);return Dn(n,t)};function kn(e){return parseFloat(e.trim())}var An=[`transformPerspective`,`x`,`y`,`z`,`translateX`,`translateY`,`translateZ`,`scale`,`scaleX`,`scaleY`,`rotate`,`rotateX`,`rotateY`,`rotateZ`,`skew`,`skewX`,`skewY`],jn=(()=>new Set(An))(),Mn=e=>e===Ge||e===L,Nn=new Set([`x`,`y`,`z`]),Pn=An.filter(e=>!Nn.has(e));function Fn(e){let t=[];return Pn.forEach(n=>{let r=e.getValue(n);r!==void 0&&(t.push([n,r.get()]),r.set(n.startsWith(`scale`)?1:0))}),t}var U={width:({x:e},{paddingLeft:t=`0`,paddingRight:n=`0`})=>e.max-e.min-parseFloat(t)-parseFloat(n),height:({y:e},{paddingTop:t=`0`,paddingBottom:n=`0`})=>e.max-e.min-parseFloat(t)-parseFloat(n),top:(e,{top:t})=>parseFloat(t),left:(e,{left:t})=>parseFloat(t),bottom:({y:e},{top:t})=>parseFloat(t)+(e.max-e.min),right:({x:e},{left:t})=>parseFloat(t)+(e.max-e.min),x:(e,{transform:t})=>Dn(t,`x`),y:(e,{transform:t})=>Dn(t,`y`)};U.translateX=U.x,U.translateY=U.y;var In=new Set,Ln=!1,Rn=!1,zn=!1;function Bn(){if(Rn){let e=Array.from(In).filter(e=>e.needsMeasurement),t=new Set(e.map(e=>e.element)),n=new Map;t.forEach(e=>{let t=Fn(e);t.length&&(n.set(e,t),e.render())}),e.forEach(e=>e.measureInitialState()),t.forEach(e=>{e.render();let t=n.get(e);t&&t.forEach(([t,n])=>{e.getValue(t)?.set(n)})}),e.forEach(e=>e.measureEndState()),e.forEach(e=>{e.suspendedScrollY!==void 0&&window.scrollTo(0,e.suspendedScrollY)})}Rn=!1,Ln=!1,In.forEach(e=>e.complete(zn)),In.clear()}function Vn(){In.forEach(e=>{e.readKeyframes(),e.needsMeasurement&&(Rn=!0)})}function Hn(){zn=!0,Vn(),Bn(),zn=!1}var Un=class{constructor(e,t,n,r,i,a=!1){this.state=`pending`,this.isAsync=!1,this.needsMeasurement=!1,this.unresolvedKeyframes=[...e],this.onComplete=t,this.name=n,this.motionValue=r,this.element=i,this.isAsync=a}scheduleResolve(){this.state=`scheduled`,this.isAsync?(In.add(this),Ln||(Ln=!0,A.read(Vn),A.resolveKeyframes(Bn))):(this.readKeyframes(),this.complete())}readKeyframes(){let{unresolvedKeyframes:e,name:t,element:n,motionValue:r}=this;if(e[0]===null){let i=r?.get(),a=e[e.length-1];if(i!==void 0)e[0]=i;else if(n&&t){let r=n.readValue(t,a);r!=null&&(e[0]=r)}e[0]===void 0&&(e[0]=a),r&&i===void 0&&r.set(e[0])}vn(e)}setFinalKeyframe(){}measureInitialState(){}renderEndStyles(){}measureEndState(){}complete(e=!1){this.state=`complete`,this.onComplete(this.unresolvedKeyframes,this.finalKeyframe,e),In.delete(this)}cancel(){this.state===`scheduled`&&(In.delete(this),this.state=`pending`)}resume(){this.state===`pending`&&this.scheduleResolve()}},Wn=e=>e.startsWith(`--`);function Gn(e,t,n){Wn(t)?e.style.setProperty(t,n):e.style[t]=n}var Kn=ie(()=>window.ScrollTimeline!==void 0),qn={};function Jn(e,t){let n=ie(e);return()=>qn[t]??n()}var Yn=Jn(()=>{try{document.createElement(`div`).animate({opacity:0},{easing:`linear(0, 1)`})}catch{return!1}return!0},`linearEasing`),Xn=([e,t,n,r])=>`cubic-bezier(${e}, ${t}, ${n}, ${r})`,Zn={linear:`linear`,ease:`ease`,easeIn:`ease-in`,easeOut:`ease-out`,easeInOut:`ease-in-out`,circIn:Xn([0,.65,.55,1]),circOut:Xn([.55,0,1,.45]),backIn:Xn([.31,.01,.66,-.59]),backOut:Xn([.33,1.53,.69,.99])};function Qn(e,t){if(e)return typeof e==`function`?Yn()?Bt(e,t):`ease-out`:Oe(e)?Xn(e):Array.isArray(e)?e.map(e=>Qn(e,t)||Zn.easeOut):Zn[e]}function $n(e,t,n,{delay:r=0,duration:i=300,repeat:a=0,repeatType:o=`loop`,ease:s=`easeOut`,times:c}={},l=void 0){let u={[t]:n};c&&(u.offset=c);let d=Qn(s,i);Array.isArray(d)&&(u.easing=d),k.value&&ze.waapi++;let f={delay:r,duration:i,easing:Array.isArray(d)?`linear`:d,fill:`both`,iterations:a+1,direction:o===`reverse`?`alternate`:`normal`};l&&(f.pseudoElement=l);let p=e.animate(u,f);return k.value&&p.finished.finally(()=>{ze.waapi--}),p}function er(e){return typeof e==`function`&&`applyToOptions`in e}function tr({type:e,...t}){return er(e)&&Yn()?e.applyToOptions(t):(t.duration??=300,t.ease??=`easeOut`,t)}var nr=class extends hn{constructor(e){if(super(),this.finishedTime=null,this.isStopped=!1,!e)return;let{element:t,name:n,keyframes:r,pseudoElement:i,allowFlatten:a=!1,finalKeyframe:o,onComplete:s}=e;this.isPseudoElement=!!i,this.allowFlatten=a,this.options=e,e.type;let c=tr(e);this.animation=$n(t,n,r,c,i),c.autoplay===!1&&this.animation.pause(),this.animation.onfinish=()=>{if(this.finishedTime=this.time,!i){let e=fn(r,this.options,o,this.speed);this.updateMotionValue?this.updateMotionValue(e):Gn(t,n,e),this.animation.cancel()}s?.(),this.notifyFinished()}}play(){this.isStopped||(this.animation.play(),this.state===`finished`&&this.updateFinished())}pause(){this.animation.pause()}complete(){this.animation.finish?.()}cancel(){try{this.animation.cancel()}catch{}}stop(){if(this.isStopped)return;this.isStopped=!0;let{state:e}=this;e===`idle`||e===`finished`||(this.updateMotionValue?this.updateMotionValue():this.commitStyles(),this.isPseudoElement||this.cancel())}commitStyles(){this.isPseudoElement||this.animation.commitStyles?.()}get duration(){let e=this.animation.effect?.getComputedTiming?.().duration||0;return O(Number(e))}get iterationDuration(){let{delay:e=0}=this.options||{};return this.duration+O(e)}get time(){return O(Number(this.animation.currentTime)||0)}set time(e){this.finishedTime=null,this.animation.currentTime=D(e)}get speed(){return this.animation.playbackRate}set speed(e){e<0&&(this.finishedTime=null),this.animation.playbackRate=e}get state(){return this.finishedTime===null?this.animation.playState:`finished`}get startTime(){return Number(this.animation.startTime)}set startTime(e){this.animation.startTime=e}attachTimeline({timeline:e,observe:t}){return this.allowFlatten&&this.animation.effect?.updateTiming({easing:`linear`}),this.animation.onfinish=null,e&&Kn()?(this.animation.timeline=e,E):t(this)}},rr={anticipate:be,backInOut:ye,circInOut:Ce};function ir(e){return e in rr}function ar(e){typeof e.ease==`string`&&ir(e.ease)&&(e.ease=rr[e.ease])}var or=10,sr=class extends nr{constructor(e){ar(e),mn(e),super(e),e.startTime&&(this.startTime=e.startTime),this.options=e}updateMotionValue(e){let{motionValue:t,onUpdate:n,onComplete:r,element:i,...a}=this.options;if(!t)return;if(e!==void 0){t.set(e);return}let o=new _n({...a,autoplay:!1}),s=D(this.finishedTime??this.time);t.setWithVelocity(o.sample(s-or).value,o.sample(s).value,or),o.stop()}},cr=(e,t)=>t===`zIndex`?!1:!!(typeof e==`number`||Array.isArray(e)||typeof e==`string`&&(z.test(e)||e===`0`)&&!e.startsWith(`url(`));function lr(e){let t=e[0];if(e.length===1)return!0;for(let n=0;n<e.length;n++)if(e[n]!==t)return!0}function ur(e,t,n,r){let i=e[0];if(i===null)return!1;if(t===`display`||t===`visibility`)return!0;let a=e[e.length-1],o=cr(i,t),s=cr(a,t);return`${t}${i}${a}${o?a:i}`,!o||!s?!1:lr(e)||(n===`spring`||er(n))&&r}function dr(e){e.duration=0,e.type=`keyframes`}var fr=new Set([`opacity`,`clipPath`,`filter`,`transform`]),pr=ie(()=>Object.hasOwnProperty.call(Element.prototype,`animate`));function mr(e){let{motionValue:t,name:n,repeatDelay:r,repeatType:i,damping:a,type:o}=e;if(!(t?.owner?.current instanceof HTMLElement))return!1;let{onUpdate:s,transformTemplate:c}=t.owner.getProps();return pr()&&n&&fr.has(n)&&(n!==`transform`||!c)&&!s&&!r&&i!==`mirror`&&a!==0&&o!==`inertia`}var hr=40,gr=class extends hn{constructor({autoplay:e=!0,delay:t=0,type:n=`keyframes`,repeat:r=0,repeatDelay:i=0,repeatType:a=`loop`,keyframes:o,name:s,motionValue:c,element:l,...u}){super(),this.stop=()=>{this._animation&&(this._animation.stop(),this.stopTimeline?.()),this.keyframeResolver?.cancel()},this.createdAt=N.now();let d={autoplay:e,delay:t,type:n,repeat:r,repeatDelay:i,repeatType:a,name:s,motionValue:c,element:l,...u};this.keyframeResolver=new(l?.KeyframeResolver||Un)(o,(e,t,n)=>this.onKeyframesResolved(e,t,d,!n),s,c,l),this.keyframeResolver?.scheduleResolve()}onKeyframesResolved(e,t,n,r){this.keyframeResolver=void 0;let{name:i,type:a,velocity:o,delay:s,isHandoff:c,onUpdate:l}=n;this.resolvedAt=N.now(),ur(e,i,a,o)||((T.instantAnimations||!s)&&l?.(fn(e,n,t)),e[0]=e[e.length-1],dr(n),n.repeat=0);let u={startTime:r?this.resolvedAt&&this.resolvedAt-this.createdAt>hr?this.resolvedAt:this.createdAt:void 0,finalKeyframe:t,...n,keyframes:e},d=!c&&mr(u)?new sr({...u,element:u.motionValue.owner.current}):new _n(u);d.finished.then(()=>this.notifyFinished()).catch(E),this.pendingTimeline&&=(this.stopTimeline=d.attachTimeline(this.pendingTimeline),void 0),this._animation=d}get finished(){return this._animation?this.animation.finished:this._finished}then(e,t){return this.finished.finally(e).then(()=>{})}get animation(){return this._animation||(this.keyframeResolver?.resume(),Hn()),this._animation}get duration(){return this.animation.duration}get iterationDuration(){return this.animation.iterationDuration}get time(){return this.animation.time}set time(e){this.animation.time=e}get speed(){return this.animation.speed}get state(){return this.animation.state}set speed(e){this.animation.speed=e}get startTime(){return this.animation.startTime}attachTimeline(e){return this._animation?this.stopTimeline=this.animation.attachTimeline(e):this.pendingTimeline=e,()=>this.stop()}play(){this.animation.play()}pause(){this.animation.pause()}complete(){this.animation.complete()}cancel(){this._animation&&this.animation.cancel(),this.keyframeResolver?.cancel()}},_r=/^var\(--(?:([\w-]+)|([\w-]+), ?([a-zA-Z\d ()%#.,-]+))\)/u;function vr(e){let t=_r.exec(e);if(!t)return[,];let[,n,r,i]=t;return[`--${n??r}`,i]}function yr(e,t,n=1){`${e}`;let[r,i]=vr(e);if(!r)return;let a=window.getComputedStyle(t).getPropertyValue(r);if(a){let e=a.trim();return te(e)?parseFloat(e):e}return Ue(i)?yr(i,t,n+1):i}function br(e,t){return e?.[t]??e?.default??e}var xr=new Set([`width`,`height`,`top`,`left`,`right`,`bottom`,...An]),Sr={test:e=>e===`auto`,parse:e=>e},Cr=e=>t=>t.test(e),wr=[Ge,L,I,F,ot,at,Sr],Tr=e=>wr.find(Cr(e));function Er(e){return typeof e==`number`?e===0:e===null?!0:e===`none`||e===`0`||re(e)}var Dr=new Set([`brightness`,`contrast`,`saturate`,`opacity`]);function Or(e){let[t,n]=e.slice(0,-1).split(`(`);if(t===`drop-shadow`)return e;let[r]=n.match(Ye)||[];if(!r)return e;let i=n.replace(r,``),a=Dr.has(t)?1:0;return r!==n&&(a*=100),t+`(`+a+i+`)`}var kr=/\b([a-z-]*)\(.*?\)/gu,Ar={...z,getAnimatableNone:e=>{let t=e.match(kr);return t?t.map(Or).join(` `):e}},jr={...Ge,transform:Math.round},Mr={borderWidth:L,borderTopWidth:L,borderRightWidth:L,borderBottomWidth:L,borderLeftWidth:L,borderRadius:L,radius:L,borderTopLeftRadius:L,borderTopRightRadius:L,borderBottomRightRadius:L,borderBottomLeftRadius:L,width:L,maxWidth:L,height:L,maxHeight:L,top:L,right:L,bottom:L,left:L,padding:L,paddingTop:L,paddingRight:L,paddingBottom:L,paddingLeft:L,margin:L,marginTop:L,marginRight:L,marginBottom:L,marginLeft:L,backgroundPositionX:L,backgroundPositionY:L,rotate:F,rotateX:F,rotateY:F,rotateZ:F,scale:qe,scaleX:qe,scaleY:qe,scaleZ:qe,skew:F,skewX:F,skewY:F,distance:L,translateX:L,translateY:L,translateZ:L,x:L,y:L,z:L,perspective:L,transformPerspective:L,opacity:Ke,originX:st,originY:st,originZ:L,zIndex:jr,fillOpacity:Ke,strokeOpacity:Ke,numOctaves:jr},Nr={...Mr,color:R,backgroundColor:R,outlineColor:R,fill:R,stroke:R,borderColor:R,borderTopColor:R,borderRightColor:R,borderBottomColor:R,borderLeftColor:R,filter:Ar,WebkitFilter:Ar},Pr=e=>Nr[e];function Fr(e,t){let n=Pr(e);return n!==Ar&&(n=z),n.getAnimatableNone?n.getAnimatableNone(t):void 0}var Ir=new Set([`auto`,`none`,`0`]);function Lr(e,t,n){let r=0,i;for(;r<e.length&&!i;){let t=e[r];typeof t==`string`&&!Ir.has(t)&&_t(t).values.length&&(i=e[r]),r++}if(i&&n)for(let r of t)e[r]=Fr(n,i)}var Rr=class extends Un{constructor(e,t,n,r,i){super(e,t,n,r,i,!0)}readKeyframes(){let{unresolvedKeyframes:e,element:t,name:n}=this;if(!t||!t.current)return;super.readKeyframes();for(let n=0;n<e.length;n++){let r=e[n];if(typeof r==`string`&&(r=r.trim(),Ue(r))){let i=yr(r,t.current);i!==void 0&&(e[n]=i),n===e.length-1&&(this.finalKeyframe=r)}}if(this.resolveNoneKeyframes(),!xr.has(n)||e.length!==2)return;let[r,i]=e,a=Tr(r),o=Tr(i);if(a!==o)if(Mn(a)&&Mn(o))for(let t=0;t<e.length;t++){let n=e[t];typeof n==`string`&&(e[t]=parseFloat(n))}else U[n]&&(this.needsMeasurement=!0)}resolveNoneKeyframes(){let{unresolvedKeyframes:e,name:t}=this,n=[];for(let t=0;t<e.length;t++)(e[t]===null||Er(e[t]))&&n.push(t);n.length&&Lr(e,n,t)}measureInitialState(){let{element:e,unresolvedKeyframes:t,name:n}=this;if(!e||!e.current)return;n===`height`&&(this.suspendedScrollY=window.pageYOffset),this.measuredOrigin=U[n](e.measureViewportBox(),window.getComputedStyle(e.current)),t[0]=this.measuredOrigin;let r=t[t.length-1];r!==void 0&&e.getValue(n,r).jump(r,!1)}measureEndState(){let{element:e,name:t,unresolvedKeyframes:n}=this;if(!e||!e.current)return;let r=e.getValue(t);r&&r.jump(this.measuredOrigin,!1);let i=n.length-1,a=n[i];n[i]=U[t](e.measureViewportBox(),window.getComputedStyle(e.current)),a!==null&&this.finalKeyframe===void 0&&(this.finalKeyframe=a),this.removedTransforms?.length&&this.removedTransforms.forEach(([t,n])=>{e.getValue(t).set(n)}),this.resolveNoneKeyframes()}};function zr(e,t,n){if(e instanceof EventTarget)return[e];if(typeof e==`string`){let r=document;t&&(r=t.current);let i=n?.[e]??r.querySelectorAll(e);return i?Array.from(i):[]}return Array.from(e)}var Br=(e,t)=>t&&typeof e==`number`?t.transform(e):e;function Vr(e){return ne(e)&&`offsetHeight`in e}var Hr=30,Ur=e=>!isNaN(parseFloat(e)),Wr={current:void 0},Gr=class{constructor(e,t={}){this.canTrackVelocity=null,this.events={},this.updateAndNotify=e=>{let t=N.now();if(this.updatedAt!==t&&this.setPrevFrameValue(),this.prev=this.current,this.setCurrent(e),this.current!==this.prev&&(this.events.change?.notify(this.current),this.dependents))for(let e of this.dependents)e.dirty()},this.hasAnimated=!1,this.setCurrent(e),this.owner=t.owner}setCurrent(e){this.current=e,this.updatedAt=N.now(),this.canTrackVelocity===null&&e!==void 0&&(this.canTrackVelocity=Ur(this.current))}setPrevFrameValue(e=this.current){this.prevFrameValue=e,this.prevUpdatedAt=this.updatedAt}onChange(e){return this.on(`change`,e)}on(e,t){this.events[e]||(this.events[e]=new ce);let n=this.events[e].add(t);return e===`change`?()=>{n(),A.read(()=>{this.events.change.getSize()||this.stop()})}:n}clearListeners(){for(let e in this.events)this.events[e].clear()}attach(e,t){this.passiveEffect=e,this.stopPassiveEffect=t}set(e){this.passiveEffect?this.passiveEffect(e,this.updateAndNotify):this.updateAndNotify(e)}setWithVelocity(e,t,n){this.set(t),this.prev=void 0,this.prevFrameValue=e,this.prevUpdatedAt=this.updatedAt-n}jump(e,t=!0){this.updateAndNotify(e),this.prev=e,this.prevUpdatedAt=this.prevFrameValue=void 0,t&&this.stop(),this.stopPassiveEffect&&this.stopPassiveEffect()}dirty(){this.events.change?.notify(this.current)}addDependent(e){this.dependents||=new Set,this.dependents.add(e)}removeDependent(e){this.dependents&&this.dependents.delete(e)}get(){return Wr.current&&Wr.current.push(this),this.current}getPrevious(){return this.prev}getVelocity(){let e=N.now();if(!this.canTrackVelocity||this.prevFrameValue===void 0||e-this.updatedAt>Hr)return 0;let t=Math.min(this.updatedAt-this.prevUpdatedAt,Hr);return le(parseFloat(this.current)-parseFloat(this.prevFrameValue),t)}start(e){return this.stop(),new Promise(t=>{this.hasAnimated=!0,this.animation=e(t),this.events.animationStart&&this.events.animationStart.notify()}).then(()=>{this.events.animationComplete&&this.events.animationComplete.notify(),this.clearAnimation()})}stop(){this.animation&&(this.animation.stop(),this.events.animationCancel&&this.events.animationCancel.notify()),this.clearAnimation()}isAnimating(){return!!this.animation}clearAnimation(){delete this.animation}destroy(){this.dependents?.clear(),this.events.destroy?.notify(),this.clearListeners(),this.stop(),this.stopPassiveEffect&&this.stopPassiveEffect()}};function Kr(e,t){return new Gr(e,t)}var{schedule:qr,cancel:Jr}=Fe(queueMicrotask,!1),W={x:!1,y:!1};function Yr(){return W.x||W.y}function Xr(e){return e===`x`||e===`y`?W[e]?null:(W[e]=!0,()=>{W[e]=!1}):W.x||W.y?null:(W.x=W.y=!0,()=>{W.x=W.y=!1})}function Zr(e,t){let n=zr(e),r=new AbortController,i={passive:!0,...t,signal:r.signal};return[n,i,()=>r.abort()]}function Qr(e){return!(e.pointerType===`touch`||Yr())}function $r(e,t,n={}){let[r,i,a]=Zr(e,n),o=e=>{if(!Qr(e))return;let{target:n}=e,r=t(n,e);if(typeof r!=`function`||!n)return;let a=e=>{Qr(e)&&(r(e),n.removeEventListener(`pointerleave`,a))};n.addEventListener(`pointerleave`,a,i)};return r.forEach(e=>{e.addEventListener(`pointerenter`,o,i)}),a}var ei=(e,t)=>t?e===t?!0:ei(e,t.parentElement):!1,ti=e=>e.pointerType===`mouse`?typeof e.button!=`number`||e.button<=0:e.isPrimary!==!1,ni=new Set([`BUTTON`,`INPUT`,`SELECT`,`TEXTAREA`,`A`]);function ri(e){return ni.has(e.tagName)||e.tabIndex!==-1}var ii=new WeakSet;function ai(e){return t=>{t.key===`Enter`&&e(t)}}function oi(e,t){e.dispatchEvent(new PointerEvent(`pointer`+t,{isPrimary:!0,bubbles:!0}))}var si=(e,t)=>{let n=e.currentTarget;if(!n)return;let r=ai(()=>{if(ii.has(n))return;oi(n,`down`);let e=ai(()=>{oi(n,`up`)});n.addEventListener(`keyup`,e,t),n.addEventListener(`blur`,()=>oi(n,`cancel`),t)});n.addEventListener(`keydown`,r,t),n.addEventListener(`blur`,()=>n.removeEventListener(`keydown`,r),t)};function ci(e){return ti(e)&&!Yr()}function li(e,t,n={}){let[r,i,a]=Zr(e,n),o=e=>{let r=e.currentTarget;if(!ci(e))return;ii.add(r);let a=t(r,e),o=(e,t)=>{window.removeEventListener(`pointerup`,s),window.removeEventListener(`pointercancel`,c),ii.has(r)&&ii.delete(r),ci(e)&&typeof a==`function`&&a(e,{success:t})},s=e=>{o(e,r===window||r===document||n.useGlobalTarget||ei(r,e.target))},c=e=>{o(e,!1)};window.addEventListener(`pointerup`,s,i),window.addEventListener(`pointercancel`,c,i)};return r.forEach(e=>{(n.useGlobalTarget?window:e).addEventListener(`pointerdown`,o,i),Vr(e)&&(e.addEventListener(`focus`,e=>si(e,i)),!ri(e)&&!e.hasAttribute(`tabindex`)&&(e.tabIndex=0))}),a}function ui(e){return ne(e)&&`ownerSVGElement`in e}function di(e){return ui(e)&&e.tagName===`svg`}var G=e=>!!(e&&e.getVelocity),fi=[...wr,R,z],pi=e=>fi.find(Cr(e)),mi=(0,_.createContext)({transformPagePoint:e=>e,isStatic:!1,reducedMotion:`never`});function hi(e=!0){let t=(0,_.useContext)(S);if(t===null)return[!0,null];let{isPresent:n,onExitComplete:r,register:i}=t,a=(0,_.useId)();(0,_.useEffect)(()=>{if(e)return i(a)},[e]);let o=(0,_.useCallback)(()=>e&&r&&r(a),[a,r,e]);return!n&&r?[!1,o]:[!0]}var gi=(0,_.createContext)({strict:!1}),_i={animation:[`animate`,`variants`,`whileHover`,`whileTap`,`exit`,`whileInView`,`whileFocus`,`whileDrag`],exit:[`exit`],drag:[`drag`,`dragControls`],focus:[`whileFocus`],hover:[`whileHover`,`onHoverStart`,`onHoverEnd`],tap:[`whileTap`,`onTap`,`onTapStart`,`onTapCancel`],pan:[`onPan`,`onPanStart`,`onPanSessionStart`,`onPanEnd`],inView:[`whileInView`,`onViewportEnter`,`onViewportLeave`],layout:[`layout`,`layoutId`]},vi={};for(let e in _i)vi[e]={isEnabled:t=>_i[e].some(e=>!!t[e])};function yi(e){for(let t in e)vi[t]={...vi[t],...e[t]}}var bi=new Set(`animate.exit.variants.initial.style.values.variants.transition.transformTemplate.custom.inherit.onBeforeLayoutMeasure.onAnimationStart.onAnimationComplete.onUpdate.onDragStart.onDrag.onDragEnd.onMeasureDragConstraints.onDirectionLock.onDragTransitionEnd._dragX._dragY.onHoverStart.onHoverEnd.onViewportEnter.onViewportLeave.globalTapTarget.ignoreStrict.viewport`.split(`.`));function xi(e){return e.startsWith(`while`)||e.startsWith(`drag`)&&e!==`draggable`||e.startsWith(`layout`)||e.startsWith(`onTap`)||e.startsWith(`onPan`)||e.startsWith(`onLayout`)||bi.has(e)}var Si=r({default:()=>Ci}),Ci,wi=n((()=>{throw Ci={},Error(`Could not resolve "@emotion/is-prop-valid" imported by "framer-motion".`)})),Ti=e=>!xi(e);function Ei(e){typeof e==`function`&&(Ti=t=>t.startsWith(`on`)?!xi(t):e(t))}try{Ei((wi(),t(Si)).default)}catch{}function Di(e,t,n){let r={};for(let i in e){if(i===`values`&&typeof e.values==`object`)continue;(Ti(i)||n===!0&&xi(i)||!t&&!xi(i)||e.draggable&&i.startsWith(`onDrag`))&&(r[i]=e[i])}return r}var Oi=(0,_.createContext)({});function ki(e){return typeof e==`object`&&!!e&&typeof e.start==`function`}function Ai(e){return typeof e==`string`||Array.isArray(e)}var ji=[`animate`,`whileInView`,`whileFocus`,`whileHover`,`whileTap`,`whileDrag`,`exit`],Mi=[`initial`,...ji];function Ni(e){return ki(e.animate)||Mi.some(t=>Ai(e[t]))}function Pi(e){return!!(Ni(e)||e.variants)}function Fi(e,t){if(Ni(e)){let{initial:t,animate:n}=e;return{initial:t===!1||Ai(t)?t:void 0,animate:Ai(n)?n:void 0}}return e.inherit===!1?{}:t}function Ii(e){let{initial:t,animate:n}=Fi(e,(0,_.useContext)(Oi));return(0,_.useMemo)(()=>({initial:t,animate:n}),[Li(t),Li(n)])}function Li(e){return Array.isArray(e)?e.join(` `):e}var Ri={};function zi(e){for(let t in e)Ri[t]=e[t],Ve(t)&&(Ri[t].isCSSVariable=!0)}function Bi(e,{layout:t,layoutId:n}){return jn.has(e)||e.startsWith(`origin`)||(t||n!==void 0)&&(!!Ri[e]||e===`opacity`)}var Vi={x:`translateX`,y:`translateY`,z:`translateZ`,transformPerspective:`perspective`},Hi=An.length;function Ui(e,t,n){let r=``,i=!0;for(let a=0;a<Hi;a++){let o=An[a],s=e[o];if(s===void 0)continue;let c=!0;if(c=typeof s==`number`?s===(o.startsWith(`scale`)?1:0):parseFloat(s)===0,!c||n){let e=Br(s,Mr[o]);if(!c){i=!1;let t=Vi[o]||o;r+=`${t}(${e}) `}n&&(t[o]=e)}}return r=r.trim(),n?r=n(t,i?``:r):i&&(r=`none`),r}function Wi(e,t,n){let{style:r,vars:i,transformOrigin:a}=e,o=!1,s=!1;for(let e in t){let n=t[e];if(jn.has(e)){o=!0;continue}else if(Ve(e)){i[e]=n;continue}else{let t=Br(n,Mr[e]);e.startsWith(`origin`)?(s=!0,a[e]=t):r[e]=t}}if(t.transform||(o||n?r.transform=Ui(t,e.transform,n):r.transform&&=`none`),s){let{originX:e=`50%`,originY:t=`50%`,originZ:n=0}=a;r.transformOrigin=`${e} ${t} ${n}`}}var Gi=()=>({style:{},transform:{},transformOrigin:{},vars:{}});function Ki(e,t,n){for(let r in t)!G(t[r])&&!Bi(r,n)&&(e[r]=t[r])}function qi({transformTemplate:e},t){return(0,_.useMemo)(()=>{let n=Gi();return Wi(n,t,e),Object.assign({},n.vars,n.style)},[t])}function Ji(e,t){let n=e.style||{},r={};return Ki(r,n,e),Object.assign(r,qi(e,t)),r}function Yi(e,t){let n={},r=Ji(e,t);return e.drag&&e.dragListener!==!1&&(n.draggable=!1,r.userSelect=r.WebkitUserSelect=r.WebkitTouchCallout=`none`,r.touchAction=e.drag===!0?`none`:`pan-${e.drag===`x`?`y`:`x`}`),e.tabIndex===void 0&&(e.onTap||e.onTapStart||e.whileTap)&&(n.tabIndex=0),n.style=r,n}var Xi={offset:`stroke-dashoffset`,array:`stroke-dasharray`},Zi={offset:`strokeDashoffset`,array:`strokeDasharray`};function Qi(e,t,n=1,r=0,i=!0){e.pathLength=1;let a=i?Xi:Zi;e[a.offset]=L.transform(-r);let o=L.transform(t),s=L.transform(n);e[a.array]=`${o} ${s}`}function $i(e,{attrX:t,attrY:n,attrScale:r,pathLength:i,pathSpacing:a=1,pathOffset:o=0,...s},c,l,u){if(Wi(e,s,l),c){e.style.viewBox&&(e.attrs.viewBox=e.style.viewBox);return}e.attrs=e.style,e.style={};let{attrs:d,style:f}=e;d.transform&&(f.transform=d.transform,delete d.transform),(f.transform||d.transformOrigin)&&(f.transformOrigin=d.transformOrigin??`50% 50%`,delete d.transformOrigin),f.transform&&(f.transformBox=u?.transformBox??`fill-box`,delete d.transformBox),t!==void 0&&(d.x=t),n!==void 0&&(d.y=n),r!==void 0&&(d.scale=r),i!==void 0&&Qi(d,i,a,o,!1)}var ea=()=>({...Gi(),attrs:{}}),ta=e=>typeof e==`string`&&e.toLowerCase()===`svg`;function na(e,t,n,r){let i=(0,_.useMemo)(()=>{let n=ea();return $i(n,t,ta(r),e.transformTemplate,e.style),{...n.attrs,style:{...n.style}}},[t]);if(e.style){let t={};Ki(t,e.style,e),i.style={...t,...i.style}}return i}var ra=[`animate`,`circle`,`defs`,`desc`,`ellipse`,`g`,`image`,`line`,`filter`,`marker`,`mask`,`metadata`,`path`,`pattern`,`polygon`,`polyline`,`rect`,`stop`,`switch`,`symbol`,`svg`,`text`,`tspan`,`use`,`view`];function ia(e){return typeof e!=`string`||e.includes(`-`)?!1:!!(ra.indexOf(e)>-1||/[A-Z]/u.test(e))}function aa(e,t,n,{latestValues:r},i,a=!1){let o=(ia(e)?na:Yi)(t,r,i,e),s=Di(t,typeof e==`string`,a),c=e===_.Fragment?{}:{...s,...o,ref:n},{children:l}=t,u=(0,_.useMemo)(()=>G(l)?l.get():l,[l]);return(0,_.createElement)(e,{...c,children:u})}function oa(e){let t=[{},{}];return e?.values.forEach((e,n)=>{t[0][n]=e.get(),t[1][n]=e.getVelocity()}),t}function sa(e,t,n,r){if(typeof t==`function`){let[i,a]=oa(r);t=t(n===void 0?e.custom:n,i,a)}if(typeof t==`string`&&(t=e.variants&&e.variants[t]),typeof t==`function`){let[i,a]=oa(r);t=t(n===void 0?e.custom:n,i,a)}return t}function ca(e){return G(e)?e.get():e}function la({scrapeMotionValuesFromProps:e,createRenderState:t},n,r,i){return{latestValues:ua(n,r,i,e),renderState:t()}}function ua(e,t,n,r){let i={},a=r(e,{});for(let e in a)i[e]=ca(a[e]);let{initial:o,animate:s}=e,c=Ni(e),l=Pi(e);t&&l&&!c&&e.inherit!==!1&&(o===void 0&&(o=t.initial),s===void 0&&(s=t.animate));let u=n?n.initial===!1:!1;u||=o===!1;let d=u?s:o;if(d&&typeof d!=`boolean`&&!ki(d)){let t=Array.isArray(d)?d:[d];for(let n=0;n<t.length;n++){let r=sa(e,t[n]);if(r){let{transitionEnd:e,transition:t,...n}=r;for(let e in n){let t=n[e];if(Array.isArray(t)){let e=u?t.length-1:0;t=t[e]}t!==null&&(i[e]=t)}for(let t in e)i[t]=e[t]}}}return i}var da=e=>(t,n)=>{let r=(0,_.useContext)(Oi),i=(0,_.useContext)(S),a=()=>la(e,t,r,i);return n?a():y(a)};function fa(e,t,n){let{style:r}=e,i={};for(let a in r)(G(r[a])||t.style&&G(t.style[a])||Bi(a,e)||n?.getValue(a)?.liveStyle!==void 0)&&(i[a]=r[a]);return i}var pa=da({scrapeMotionValuesFromProps:fa,createRenderState:Gi});function ma(e,t,n){let r=fa(e,t,n);for(let n in e)if(G(e[n])||G(t[n])){let t=An.indexOf(n)===-1?n:`attr`+n.charAt(0).toUpperCase()+n.substring(1);r[t]=e[n]}return r}var ha=da({scrapeMotionValuesFromProps:ma,createRenderState:ea}),ga=Symbol.for(`motionComponentSymbol`);function _a(e){return e&&typeof e==`object`&&Object.prototype.hasOwnProperty.call(e,`current`)}function va(e,t,n){return(0,_.useCallback)(r=>{r&&e.onMount&&e.onMount(r),t&&(r?t.mount(r):t.unmount()),n&&(typeof n==`function`?n(r):_a(n)&&(n.current=r))},[t])}var ya=e=>e.replace(/([a-z])([A-Z])/gu,`$1-$2`).toLowerCase(),ba=`data-`+ya(`framerAppearId`),xa=(0,_.createContext)({});function Sa(e,t,n,r,i){let{visualElement:a}=(0,_.useContext)(Oi),o=(0,_.useContext)(gi),s=(0,_.useContext)(S),c=(0,_.useContext)(mi).reducedMotion,l=(0,_.useRef)(null);r||=o.renderer,!l.current&&r&&(l.current=r(e,{visualState:t,parent:a,props:n,presenceContext:s,blockInitialAnimation:s?s.initial===!1:!1,reducedMotionConfig:c}));let u=l.current,d=(0,_.useContext)(xa);u&&!u.projection&&i&&(u.type===`html`||u.type===`svg`)&&Ca(l.current,n,i,d);let f=(0,_.useRef)(!1);(0,_.useInsertionEffect)(()=>{u&&f.current&&u.update(n,s)});let p=n[ba],m=(0,_.useRef)(!!p&&!window.MotionHandoffIsComplete?.(p)&&window.MotionHasOptimisedAnimation?.(p));return x(()=>{u&&(f.current=!0,window.MotionIsMounted=!0,u.updateFeatures(),u.scheduleRenderMicrotask(),m.current&&u.animationState&&u.animationState.animateChanges())}),(0,_.useEffect)(()=>{u&&(!m.current&&u.animationState&&u.animationState.animateChanges(),m.current&&=(queueMicrotask(()=>{window.MotionHandoffMarkAsComplete?.(p)}),!1),u.enteringChildren=void 0)}),u}function Ca(e,t,n,r){let{layoutId:i,layout:a,drag:o,dragConstraints:s,layoutScroll:c,layoutRoot:l,layoutCrossfade:u}=t;e.projection=new n(e.latestValues,t[`data-framer-portal-id`]?void 0:wa(e.parent)),e.projection.setOptions({layoutId:i,layout:a,alwaysMeasureLayout:!!o||s&&_a(s),visualElement:e,animationType:typeof a==`string`?a:`both`,initialPromotionConfig:r,crossfade:u,layoutScroll:c,layoutRoot:l})}function wa(e){if(e)return e.options.allowProjection===!1?wa(e.parent):e.projection}var Ta=e(p(),1);function Ea(e,{forwardMotionProps:t=!1}={},n,r){n&&yi(n);let i=ia(e)?ha:pa;function a(a,o){let s,c={...(0,_.useContext)(mi),...a,layoutId:Da(a)},{isStatic:l}=c,u=Ii(a),d=i(a,l);if(!l&&b){Oa(c,n);let t=ka(c);s=t.MeasureLayout,u.visualElement=Sa(e,d,c,r,t.ProjectionNode)}return(0,Ta.jsxs)(Oi.Provider,{value:u,children:[s&&u.visualElement?(0,Ta.jsx)(s,{visualElement:u.visualElement,...c}):null,aa(e,a,va(d,u.visualElement,o),d,l,t)]})}a.displayName=`motion.${typeof e==`string`?e:`create(${e.displayName??e.name??``})`}`;let o=(0,_.forwardRef)(a);return o[ga]=e,o}function Da({layoutId:e}){let t=(0,_.useContext)(v).id;return t&&e!==void 0?t+`-`+e:e}function Oa(e,t){(0,_.useContext)(gi).strict}function ka(e){let{drag:t,layout:n}=vi;if(!t&&!n)return{};let r={...t,...n};return{MeasureLayout:t?.isEnabled(e)||n?.isEnabled(e)?r.MeasureLayout:void 0,ProjectionNode:r.ProjectionNode}}function Aa(e,t){if(typeof Proxy>`u`)return Ea;let n=new Map,r=(n,r)=>Ea(n,r,e,t);return new Proxy((e,t)=>r(e,t),{get:(i,a)=>a===`create`?r:(n.has(a)||n.set(a,Ea(a,void 0,e,t)),n.get(a))})}function ja({top:e,left:t,right:n,bottom:r}){return{x:{min:t,max:n},y:{min:e,max:r}}}function Ma({x:e,y:t}){return{top:t.min,right:e.max,bottom:t.max,left:e.min}}function Na(e,t){if(!t)return e;let n=t({x:e.left,y:e.top}),r=t({x:e.right,y:e.bottom});return{top:n.y,left:n.x,bottom:r.y,right:r.x}}function Pa(e){return e===void 0||e===1}function Fa({scale:e,scaleX:t,scaleY:n}){return!Pa(e)||!Pa(t)||!Pa(n)}function Ia(e){return Fa(e)||La(e)||e.z||e.rotate||e.rotateX||e.rotateY||e.skewX||e.skewY}function La(e){return Ra(e.x)||Ra(e.y)}function Ra(e){return e&&e!==`0%`}function za(e,t,n){let r=e-n,i=t*r;return n+i}function Ba(e,t,n,r,i){return i!==void 0&&(e=za(e,i,r)),za(e,n,r)+t}function Va(e,t=0,n=1,r,i){e.min=Ba(e.min,t,n,r,i),e.max=Ba(e.max,t,n,r,i)}function Ha(e,{x:t,y:n}){Va(e.x,t.translate,t.scale,t.originPoint),Va(e.y,n.translate,n.scale,n.originPoint)}var Ua=.999999999999,Wa=1.0000000000001;function Ga(e,t,n,r=!1){let i=n.length;if(!i)return;t.x=t.y=1;let a,o;for(let s=0;s<i;s++){a=n[s],o=a.projectionDelta;let{visualElement:i}=a.options;i&&i.props.style&&i.props.style.display===`contents`||(r&&a.options.layoutScroll&&a.scroll&&a!==a.root&&Ja(e,{x:-a.scroll.offset.x,y:-a.scroll.offset.y}),o&&(t.x*=o.x.scale,t.y*=o.y.scale,Ha(e,o)),r&&Ia(a.latestValues)&&Ja(e,a.latestValues))}t.x<Wa&&t.x>Ua&&(t.x=1),t.y<Wa&&t.y>Ua&&(t.y=1)}function Ka(e,t){e.min+=t,e.max+=t}function qa(e,t,n,r,i=.5){let a=B(e.min,e.max,i);Va(e,t,n,a,r)}function Ja(e,t){qa(e.x,t.x,t.scaleX,t.scale,t.originX),qa(e.y,t.y,t.scaleY,t.scale,t.originY)}function Ya(e,t){return ja(Na(e.getBoundingClientRect(),t))}function Xa(e,t,n){let r=Ya(e,n),{scroll:i}=t;return i&&(Ka(r.x,i.offset.x),Ka(r.y,i.offset.y)),r}var Za=()=>({translate:0,scale:1,origin:0,originPoint:0}),Qa=()=>({x:Za(),y:Za()}),$a=()=>({min:0,max:0}),K=()=>({x:$a(),y:$a()}),eo={current:null},to={current:!1};function no(){if(to.current=!0,b)if(window.matchMedia){let e=window.matchMedia(`(prefers-reduced-motion)`),t=()=>eo.current=e.matches;e.addEventListener(`change`,t),t()}else eo.current=!1}var ro=new WeakMap;function io(e,t,n){for(let r in t){let i=t[r],a=n[r];if(G(i))e.addValue(r,i);else if(G(a))e.addValue(r,Kr(i,{owner:e}));else if(a!==i)if(e.hasValue(r)){let t=e.getValue(r);t.liveStyle===!0?t.jump(i):t.hasAnimated||t.set(i)}else{let t=e.getStaticValue(r);e.addValue(r,Kr(t===void 0?i:t,{owner:e}))}}for(let r in n)t[r]===void 0&&e.removeValue(r);return t}var ao=[`AnimationStart`,`AnimationComplete`,`Update`,`BeforeLayoutMeasure`,`LayoutMeasure`,`LayoutAnimationStart`,`LayoutAnimationComplete`],oo=class{scrapeMotionValuesFromProps(e,t,n){return{}}constructor({parent:e,props:t,presenceContext:n,reducedMotionConfig:r,blockInitialAnimation:i,visualState:a},o={}){this.current=null,this.children=new Set,this.isVariantNode=!1,this.isControllingVariants=!1,this.shouldReduceMotion=null,this.values=new Map,this.KeyframeResolver=Un,this.features={},this.valueSubscriptions=new Map,this.prevMotionValues={},this.events={},this.propEventSubscriptions={},this.notifyUpdate=()=>this.notify(`Update`,this.latestValues),this.render=()=>{this.current&&(this.triggerBuild(),this.renderInstance(this.current,this.renderState,this.props.style,this.projection))},this.renderScheduledAt=0,this.scheduleRender=()=>{let e=N.now();this.renderScheduledAt<e&&(this.renderScheduledAt=e,A.render(this.render,!1,!0))};let{latestValues:s,renderState:c}=a;this.latestValues=s,this.baseTarget={...s},this.initialValues=t.initial?{...s}:{},this.renderState=c,this.parent=e,this.props=t,this.presenceContext=n,this.depth=e?e.depth+1:0,this.reducedMotionConfig=r,this.options=o,this.blockInitialAnimation=!!i,this.isControllingVariants=Ni(t),this.isVariantNode=Pi(t),this.isVariantNode&&(this.variantChildren=new Set),this.manuallyAnimateOnMount=!!(e&&e.current);let{willChange:l,...u}=this.scrapeMotionValuesFromProps(t,{},this);for(let e in u){let t=u[e];s[e]!==void 0&&G(t)&&t.set(s[e])}}mount(e){this.current=e,ro.set(e,this),this.projection&&!this.projection.instance&&this.projection.mount(e),this.parent&&this.isVariantNode&&!this.isControllingVariants&&(this.removeFromVariantTree=this.parent.addVariantChild(this)),this.values.forEach((e,t)=>this.bindToMotionValue(t,e)),!to.current&&no(),this.shouldReduceMotion=this.reducedMotionConfig===`never`?!1:this.reducedMotionConfig===`always`?!0:eo.current,this.parent?.addChild(this),this.update(this.props,this.presenceContext)}unmount(){for(let e in this.projection&&this.projection.unmount(),j(this.notifyUpdate),j(this.render),this.valueSubscriptions.forEach(e=>e()),this.valueSubscriptions.clear(),this.removeFromVariantTree&&this.removeFromVariantTree(),this.parent?.removeChild(this),this.events)this.events[e].clear();for(let e in this.features){let t=this.features[e];t&&(t.unmount(),t.isMounted=!1)}this.current=null}addChild(e){this.children.add(e),this.enteringChildren??=new Set,this.enteringChildren.add(e)}removeChild(e){this.children.delete(e),this.enteringChildren&&this.enteringChildren.delete(e)}bindToMotionValue(e,t){this.valueSubscriptions.has(e)&&this.valueSubscriptions.get(e)();let n=jn.has(e);n&&this.onBindTransform&&this.onBindTransform();let r=t.on(`change`,t=>{this.latestValues[e]=t,this.props.onUpdate&&A.preRender(this.notifyUpdate),n&&this.projection&&(this.projection.isTransformDirty=!0),this.scheduleRender()}),i;window.MotionCheckAppearSync&&(i=window.MotionCheckAppearSync(this,e,t)),this.valueSubscriptions.set(e,()=>{r(),i&&i(),t.owner&&t.stop()})}sortNodePosition(e){return!this.current||!this.sortInstanceNodePosition||this.type!==e.type?0:this.sortInstanceNodePosition(this.current,e.current)}updateFeatures(){let e=`animation`;for(e in vi){let t=vi[e];if(!t)continue;let{isEnabled:n,Feature:r}=t;if(!this.features[e]&&r&&n(this.props)&&(this.features[e]=new r(this)),this.features[e]){let t=this.features[e];t.isMounted?t.update():(t.mount(),t.isMounted=!0)}}}triggerBuild(){this.build(this.renderState,this.latestValues,this.props)}measureViewportBox(){return this.current?this.measureInstanceViewportBox(this.current,this.props):K()}getStaticValue(e){return this.latestValues[e]}setStaticValue(e,t){this.latestValues[e]=t}update(e,t){(e.transformTemplate||this.props.transformTemplate)&&this.scheduleRender(),this.prevProps=this.props,this.props=e,this.prevPresenceContext=this.presenceContext,this.presenceContext=t;for(let t=0;t<ao.length;t++){let n=ao[t];this.propEventSubscriptions[n]&&(this.propEventSubscriptions[n](),delete this.propEventSubscriptions[n]);let r=`on`+n,i=e[r];i&&(this.propEventSubscriptions[n]=this.on(n,i))}this.prevMotionValues=io(this,this.scrapeMotionValuesFromProps(e,this.prevProps,this),this.prevMotionValues),this.handleChildMotionValue&&this.handleChildMotionValue()}getProps(){return this.props}getVariant(e){return this.props.variants?this.props.variants[e]:void 0}getDefaultTransition(){return this.props.transition}getTransformPagePoint(){return this.props.transformPagePoint}getClosestVariantNode(){return this.isVariantNode?this:this.parent?this.parent.getClosestVariantNode():void 0}addVariantChild(e){let t=this.getClosestVariantNode();if(t)return t.variantChildren&&t.variantChildren.add(e),()=>t.variantChildren.delete(e)}addValue(e,t){let n=this.values.get(e);t!==n&&(n&&this.removeValue(e),this.bindToMotionValue(e,t),this.values.set(e,t),this.latestValues[e]=t.get())}removeValue(e){this.values.delete(e);let t=this.valueSubscriptions.get(e);t&&(t(),this.valueSubscriptions.delete(e)),delete this.latestValues[e],this.removeValueFromRenderState(e,this.renderState)}hasValue(e){return this.values.has(e)}getValue(e,t){if(this.props.values&&this.props.values[e])return this.props.values[e];let n=this.values.get(e);return n===void 0&&t!==void 0&&(n=Kr(t===null?void 0:t,{owner:this}),this.addValue(e,n)),n}readValue(e,t){let n=this.latestValues[e]!==void 0||!this.current?this.latestValues[e]:this.getBaseTargetFromProps(this.props,e)??this.readValueFromInstance(this.current,e,this.options);return n!=null&&(typeof n==`string`&&(te(n)||re(n))?n=parseFloat(n):!pi(n)&&z.test(t)&&(n=Fr(e,t)),this.setBaseTarget(e,G(n)?n.get():n)),G(n)?n.get():n}setBaseTarget(e,t){this.baseTarget[e]=t}getBaseTarget(e){let{initial:t}=this.props,n;if(typeof t==`string`||typeof t==`object`){let r=sa(this.props,t,this.presenceContext?.custom);r&&(n=r[e])}if(t&&n!==void 0)return n;let r=this.getBaseTargetFromProps(this.props,e);return r!==void 0&&!G(r)?r:this.initialValues[e]!==void 0&&n===void 0?void 0:this.baseTarget[e]}on(e,t){return this.events[e]||(this.events[e]=new ce),this.events[e].add(t)}notify(e,...t){this.events[e]&&this.events[e].notify(...t)}scheduleRenderMicrotask(){qr.render(this.render)}},so=class extends oo{constructor(){super(...arguments),this.KeyframeResolver=Rr}sortInstanceNodePosition(e,t){return e.compareDocumentPosition(t)&2?1:-1}getBaseTargetFromProps(e,t){return e.style?e.style[t]:void 0}removeValueFromRenderState(e,{vars:t,style:n}){delete t[e],delete n[e]}handleChildMotionValue(){this.childSubscription&&(this.childSubscription(),delete this.childSubscription);let{children:e}=this.props;G(e)&&(this.childSubscription=e.on(`change`,e=>{this.current&&(this.current.textContent=`${e}`)}))}};function co(e,{style:t,vars:n},r,i){let a=e.style,o;for(o in t)a[o]=t[o];for(o in i?.applyProjectionStyles(a,r),n)a.setProperty(o,n[o])}function lo(e){return window.getComputedStyle(e)}var uo=class extends so{constructor(){super(...arguments),this.type=`html`,this.renderInstance=co}readValueFromInstance(e,t){if(jn.has(t))return this.projection?.isProjecting?En(t):On(e,t);{let n=lo(e),r=(Ve(t)?n.getPropertyValue(t):n[t])||0;return typeof r==`string`?r.trim():r}}measureInstanceViewportBox(e,{transformPagePoint:t}){return Ya(e,t)}build(e,t,n){Wi(e,t,n.transformTemplate)}scrapeMotionValuesFromProps(e,t,n){return fa(e,t,n)}},fo=new Set([`baseFrequency`,`diffuseConstant`,`kernelMatrix`,`kernelUnitLength`,`keySplines`,`keyTimes`,`limitingConeAngle`,`markerHeight`,`markerWidth`,`numOctaves`,`targetX`,`targetY`,`surfaceScale`,`specularConstant`,`specularExponent`,`stdDeviation`,`tableValues`,`viewBox`,`gradientTransform`,`pathLength`,`startOffset`,`textLength`,`lengthAdjust`]);function po(e,t,n,r){for(let n in co(e,t,void 0,r),t.attrs)e.setAttribute(fo.has(n)?n:ya(n),t.attrs[n])}var mo=class extends so{constructor(){super(...arguments),this.type=`svg`,this.isSVGTag=!1,this.measureInstanceViewportBox=K}getBaseTargetFromProps(e,t){return e[t]}readValueFromInstance(e,t){if(jn.has(t)){let e=Pr(t);return e&&e.default||0}return t=fo.has(t)?t:ya(t),e.getAttribute(t)}scrapeMotionValuesFromProps(e,t,n){return ma(e,t,n)}build(e,t,n){$i(e,t,this.isSVGTag,n.transformTemplate,n.style)}renderInstance(e,t,n,r){po(e,t,n,r)}mount(e){this.isSVGTag=ta(e.tagName),super.mount(e)}},ho=(e,t)=>ia(e)?new mo(t):new uo(t,{allowProjection:e!==_.Fragment});function go(e,t,n){let r=e.getProps();return sa(r,t,n===void 0?r.custom:n,e)}var _o=e=>Array.isArray(e);function vo(e,t,n){e.hasValue(t)?e.getValue(t).set(n):e.addValue(t,Kr(n))}function yo(e){return _o(e)?e[e.length-1]||0:e}function bo(e,t){let{transitionEnd:n={},transition:r={},...i}=go(e,t)||{};for(let t in i={...i,...n},i){let n=yo(i[t]);vo(e,t,n)}}function xo(e){return!!(G(e)&&e.add)}function So(e,t){let n=e.getValue(`willChange`);if(xo(n))return n.add(t);if(!n&&T.WillChange){let n=new T.WillChange(`auto`);e.addValue(`willChange`,n),n.add(t)}}function Co(e){return e.props[ba]}var wo=e=>e!==null;function To(e,{repeat:t,repeatType:n=`loop`},r){let i=e.filter(wo),a=t&&n!==`loop`&&t%2==1?0:i.length-1;return!a||r===void 0?i[a]:r}var Eo={type:`spring`,stiffness:500,damping:25,restSpeed:10},Do=e=>({type:`spring`,stiffness:550,damping:e===0?2*Math.sqrt(550):30,restSpeed:10}),Oo={type:`keyframes`,duration:.8},ko={type:`keyframes`,ease:[.25,.1,.35,1],duration:.3},Ao=(e,{keyframes:t})=>t.length>2?Oo:jn.has(e)?e.startsWith(`scale`)?Do(t[1]):Eo:ko;function jo({when:e,delay:t,delayChildren:n,staggerChildren:r,staggerDirection:i,repeat:a,repeatType:o,repeatDelay:s,from:c,elapsed:l,...u}){return!!Object.keys(u).length}var Mo=(e,t,n,r={},i,a)=>o=>{let s=br(r,e)||{},c=s.delay||r.delay||0,{elapsed:l=0}=r;l-=D(c);let u={keyframes:Array.isArray(n)?n:[null,n],ease:`easeOut`,velocity:t.getVelocity(),...s,delay:-l,onUpdate:e=>{t.set(e),s.onUpdate&&s.onUpdate(e)},onComplete:()=>{o(),s.onComplete&&s.onComplete()},name:e,motionValue:t,element:a?void 0:i};jo(s)||Object.assign(u,Ao(e,u)),u.duration&&=D(u.duration),u.repeatDelay&&=D(u.repeatDelay),u.from!==void 0&&(u.keyframes[0]=u.from);let d=!1;if((u.type===!1||u.duration===0&&!u.repeatDelay)&&(dr(u),u.delay===0&&(d=!0)),(T.instantAnimations||T.skipAnimations)&&(d=!0,dr(u),u.delay=0),u.allowFlatten=!s.type&&!s.ease,d&&!a&&t.get()!==void 0){let e=To(u.keyframes,s);if(e!==void 0){A.update(()=>{u.onUpdate(e),u.onComplete()});return}}return s.isSync?new _n(u):new gr(u)};function No({protectedKeys:e,needsAnimating:t},n){let r=e.hasOwnProperty(n)&&t[n]!==!0;return t[n]=!1,r}function Po(e,t,{delay:n=0,transitionOverride:r,type:i}={}){let{transition:a=e.getDefaultTransition(),transitionEnd:o,...s}=t;r&&(a=r);let c=[],l=i&&e.animationState&&e.animationState.getState()[i];for(let t in s){let r=e.getValue(t,e.latestValues[t]??null),i=s[t];if(i===void 0||l&&No(l,t))continue;let o={delay:n,...br(a||{},t)},u=r.get();if(u!==void 0&&!r.isAnimating&&!Array.isArray(i)&&i===u&&!o.velocity)continue;let d=!1;if(window.MotionHandoffAnimation){let n=Co(e);if(n){let e=window.MotionHandoffAnimation(n,t,A);e!==null&&(o.startTime=e,d=!0)}}So(e,t),r.start(Mo(t,r,i,e.shouldReduceMotion&&xr.has(t)?{type:!1}:o,e,d));let f=r.animation;f&&c.push(f)}return o&&Promise.all(c).then(()=>{A.update(()=>{o&&bo(e,o)})}),c}function Fo(e,t,n,r=0,i=1){let a=Array.from(e).sort((e,t)=>e.sortNodePosition(t)).indexOf(t),o=e.size,s=(o-1)*r;return typeof n==`function`?n(a,o):i===1?a*r:s-a*r}function Io(e,t,n={}){let r=go(e,t,n.type===`exit`?e.presenceContext?.custom:void 0),{transition:i=e.getDefaultTransition()||{}}=r||{};n.transitionOverride&&(i=n.transitionOverride);let a=r?()=>Promise.all(Po(e,r,n)):()=>Promise.resolve(),o=e.variantChildren&&e.variantChildren.size?(r=0)=>{let{delayChildren:a=0,staggerChildren:o,staggerDirection:s}=i;return Lo(e,t,r,a,o,s,n)}:()=>Promise.resolve(),{when:s}=i;if(s){let[e,t]=s===`beforeChildren`?[a,o]:[o,a];return e().then(()=>t())}else return Promise.all([a(),o(n.delay)])}function Lo(e,t,n=0,r=0,i=0,a=1,o){let s=[];for(let c of e.variantChildren)c.notify(`AnimationStart`,t),s.push(Io(c,t,{...o,delay:n+(typeof r==`function`?0:r)+Fo(e.variantChildren,c,r,i,a)}).then(()=>c.notify(`AnimationComplete`,t)));return Promise.all(s)}function Ro(e,t,n={}){e.notify(`AnimationStart`,t);let r;if(Array.isArray(t)){let i=t.map(t=>Io(e,t,n));r=Promise.all(i)}else if(typeof t==`string`)r=Io(e,t,n);else{let i=typeof t==`function`?go(e,t,n.custom):t;r=Promise.all(Po(e,i,n))}return r.then(()=>{e.notify(`AnimationComplete`,t)})}function zo(e,t){if(!Array.isArray(t))return!1;let n=t.length;if(n!==e.length)return!1;for(let r=0;r<n;r++)if(t[r]!==e[r])return!1;return!0}var Bo=Mi.length;function Vo(e){if(!e)return;if(!e.isControllingVariants){let t=e.parent&&Vo(e.parent)||{};return e.props.initial!==void 0&&(t.initial=e.props.initial),t}let t={};for(let n=0;n<Bo;n++){let r=Mi[n],i=e.props[r];(Ai(i)||i===!1)&&(t[r]=i)}return t}var Ho=[...ji].reverse(),Uo=ji.length;function Wo(e){return t=>Promise.all(t.map(({animation:t,options:n})=>Ro(e,t,n)))}function Go(e){let t=Wo(e),n=qo(),r=!0,i=t=>(n,r)=>{let i=go(e,r,t===`exit`?e.presenceContext?.custom:void 0);if(i){let{transition:e,transitionEnd:t,...r}=i;n={...n,...r,...t}}return n};function a(n){t=n(e)}function o(a){let{props:o}=e,s=Vo(e.parent)||{},c=[],l=new Set,u={},d=1/0;for(let t=0;t<Uo;t++){let f=Ho[t],p=n[f],m=o[f]===void 0?s[f]:o[f],h=Ai(m),g=f===a?p.isActive:null;g===!1&&(d=t);let _=m===s[f]&&m!==o[f]&&h;if(_&&r&&e.manuallyAnimateOnMount&&(_=!1),p.protectedKeys={...u},!p.isActive&&g===null||!m&&!p.prevProp||ki(m)||typeof m==`boolean`)continue;let v=Ko(p.prevProp,m),y=v||f===a&&p.isActive&&!_&&h||t>d&&h,b=!1,x=Array.isArray(m)?m:[m],S=x.reduce(i(f),{});g===!1&&(S={});let{prevResolvedValues:C={}}=p,ee={...C,...S},w=t=>{y=!0,l.has(t)&&(b=!0,l.delete(t)),p.needsAnimating[t]=!0;let n=e.getValue(t);n&&(n.liveStyle=!1)};for(let e in ee){let t=S[e],n=C[e];if(u.hasOwnProperty(e))continue;let r=!1;r=_o(t)&&_o(n)?!zo(t,n):t!==n,r?t==null?l.add(e):w(e):t!==void 0&&l.has(e)?w(e):p.protectedKeys[e]=!0}p.prevProp=m,p.prevResolvedValues=S,p.isActive&&(u={...u,...S}),r&&e.blockInitialAnimation&&(y=!1);let T=_&&v;y&&(!T||b)&&c.push(...x.map(t=>{let n={type:f};if(typeof t==`string`&&r&&!T&&e.manuallyAnimateOnMount&&e.parent){let{parent:r}=e,i=go(r,t);if(r.enteringChildren&&i){let{delayChildren:t}=i.transition||{};n.delay=Fo(r.enteringChildren,e,t)}}return{animation:t,options:n}}))}if(l.size){let t={};if(typeof o.initial!=`boolean`){let n=go(e,Array.isArray(o.initial)?o.initial[0]:o.initial);n&&n.transition&&(t.transition=n.transition)}l.forEach(n=>{let r=e.getBaseTarget(n),i=e.getValue(n);i&&(i.liveStyle=!0),t[n]=r??null}),c.push({animation:t})}let f=!!c.length;return r&&(o.initial===!1||o.initial===o.animate)&&!e.manuallyAnimateOnMount&&(f=!1),r=!1,f?t(c):Promise.resolve()}function s(t,r){if(n[t].isActive===r)return Promise.resolve();e.variantChildren?.forEach(e=>e.animationState?.setActive(t,r)),n[t].isActive=r;let i=o(t);for(let e in n)n[e].protectedKeys={};return i}return{animateChanges:o,setActive:s,setAnimateFunction:a,getState:()=>n,reset:()=>{n=qo()}}}function Ko(e,t){return typeof t==`string`?t!==e:Array.isArray(t)?!zo(t,e):!1}function q(e=!1){return{isActive:e,protectedKeys:{},needsAnimating:{},prevResolvedValues:{}}}function qo(){return{animate:q(!0),whileInView:q(),whileHover:q(),whileTap:q(),whileDrag:q(),whileFocus:q(),exit:q()}}var J=class{constructor(e){this.isMounted=!1,this.node=e}update(){}},Jo=class extends J{constructor(e){super(e),e.animationState||=Go(e)}updateAnimationControlsSubscription(){let{animate:e}=this.node.getProps();ki(e)&&(this.unmountControls=e.subscribe(this.node))}mount(){this.updateAnimationControlsSubscription()}update(){let{animate:e}=this.node.getProps(),{animate:t}=this.node.prevProps||{};e!==t&&this.updateAnimationControlsSubscription()}unmount(){this.node.animationState.reset(),this.unmountControls?.()}},Yo=0,Xo={animation:{Feature:Jo},exit:{Feature:class extends J{constructor(){super(...arguments),this.id=Yo++}update(){if(!this.node.presenceContext)return;let{isPresent:e,onExitComplete:t}=this.node.presenceContext,{isPresent:n}=this.node.prevPresenceContext||{};if(!this.node.animationState||e===n)return;let r=this.node.animationState.setActive(`exit`,!e);t&&!e&&r.then(()=>{t(this.id)})}mount(){let{register:e,onExitComplete:t}=this.node.presenceContext||{};t&&t(this.id),e&&(this.unmount=e(this.id))}unmount(){}}}};function Zo(e,t,n,r={passive:!0}){return e.addEventListener(t,n,r),()=>e.removeEventListener(t,n)}function Qo(e){return{point:{x:e.pageX,y:e.pageY}}}var $o=e=>t=>ti(t)&&e(t,Qo(t));function es(e,t,n,r){return Zo(e,t,$o(n),r)}var ts=1e-4,ns=1-ts,rs=1+ts,os=.01,ss=0-os,cs=0+os;function Y(e){return e.max-e.min}function ls(e,t,n){return Math.abs(e-t)<=n}function us(e,t,n,r=.5){e.origin=r,e.originPoint=B(t.min,t.max,e.origin),e.scale=Y(n)/Y(t),e.translate=B(n.min,n.max,e.origin)-e.originPoint,(e.scale>=ns&&e.scale<=rs||isNaN(e.scale))&&(e.scale=1),(e.translate>=ss&&e.translate<=cs||isNaN(e.translate))&&(e.translate=0)}function ds(e,t,n,r){us(e.x,t.x,n.x,r?r.originX:void 0),us(e.y,t.y,n.y,r?r.originY:void 0)}function fs(e,t,n){e.min=n.min+t.min,e.max=e.min+Y(t)}function ps(e,t,n){fs(e.x,t.x,n.x),fs(e.y,t.y,n.y)}function ms(e,t,n){e.min=t.min-n.min,e.max=e.min+Y(t)}function hs(e,t,n){ms(e.x,t.x,n.x),ms(e.y,t.y,n.y)}function X(e){return[e(`x`),e(`y`)]}var gs=({current:e})=>e?e.ownerDocument.defaultView:null,_s=(e,t)=>Math.abs(e-t);function vs(e,t){let n=_s(e.x,t.x),r=_s(e.y,t.y);return Math.sqrt(n**2+r**2)}var ys=class{constructor(e,t,{transformPagePoint:n,contextWindow:r=window,dragSnapToOrigin:i=!1,distanceThreshold:a=3}={}){if(this.startEvent=null,this.lastMoveEvent=null,this.lastMoveEventInfo=null,this.handlers={},this.contextWindow=window,this.updatePoint=()=>{if(!(this.lastMoveEvent&&this.lastMoveEventInfo))return;let e=Ss(this.lastMoveEventInfo,this.history),t=this.startEvent!==null,n=vs(e.offset,{x:0,y:0})>=this.distanceThreshold;if(!t&&!n)return;let{point:r}=e,{timestamp:i}=M;this.history.push({...r,timestamp:i});let{onStart:a,onMove:o}=this.handlers;t||(a&&a(this.lastMoveEvent,e),this.startEvent=this.lastMoveEvent),o&&o(this.lastMoveEvent,e)},this.handlePointerMove=(e,t)=>{this.lastMoveEvent=e,this.lastMoveEventInfo=bs(t,this.transformPagePoint),A.update(this.updatePoint,!0)},this.handlePointerUp=(e,t)=>{this.end();let{onEnd:n,onSessionEnd:r,resumeAnimation:i}=this.handlers;if(this.dragSnapToOrigin&&i&&i(),!(this.lastMoveEvent&&this.lastMoveEventInfo))return;let a=Ss(e.type===`pointercancel`?this.lastMoveEventInfo:bs(t,this.transformPagePoint),this.history);this.startEvent&&n&&n(e,a),r&&r(e,a)},!ti(e))return;this.dragSnapToOrigin=i,this.handlers=t,this.transformPagePoint=n,this.distanceThreshold=a,this.contextWindow=r||window;let o=Qo(e),s=bs(o,this.transformPagePoint),{point:c}=s,{timestamp:l}=M;this.history=[{...c,timestamp:l}];let{onSessionStart:u}=t;u&&u(e,Ss(s,this.history)),this.removeListeners=oe(es(this.contextWindow,`pointermove`,this.handlePointerMove),es(this.contextWindow,`pointerup`,this.handlePointerUp),es(this.contextWindow,`pointercancel`,this.handlePointerUp))}updateHandlers(e){this.handlers=e}end(){this.removeListeners&&this.removeListeners(),j(this.updatePoint)}};function bs(e,t){return t?{point:t(e.point)}:e}function xs(e,t){return{x:e.x-t.x,y:e.y-t.y}}function Ss({point:e},t){return{point:e,delta:xs(e,ws(t)),offset:xs(e,Cs(t)),velocity:Ts(t,.1)}}function Cs(e){return e[0]}function ws(e){return e[e.length-1]}function Ts(e,t){if(e.length<2)return{x:0,y:0};let n=e.length-1,r=null,i=ws(e);for(;n>=0&&(r=e[n],!(i.timestamp-r.timestamp>D(t)));)n--;if(!r)return{x:0,y:0};let a=O(i.timestamp-r.timestamp);if(a===0)return{x:0,y:0};let o={x:(i.x-r.x)/a,y:(i.y-r.y)/a};return o.x===1/0&&(o.x=0),o.y===1/0&&(o.y=0),o}function Es(e,{min:t,max:n},r){return t!==void 0&&e<t?e=r?B(t,e,r.min):Math.max(e,t):n!==void 0&&e>n&&(e=r?B(n,e,r.max):Math.min(e,n)),e}function Ds(e,t,n){return{min:t===void 0?void 0:e.min+t,max:n===void 0?void 0:e.max+n-(e.max-e.min)}}function Os(e,{top:t,left:n,bottom:r,right:i}){return{x:Ds(e.x,n,i),y:Ds(e.y,t,r)}}function ks(e,t){let n=t.min-e.min,r=t.max-e.max;return t.max-t.min<e.max-e.min&&([n,r]=[r,n]),{min:n,max:r}}function As(e,t){return{x:ks(e.x,t.x),y:ks(e.y,t.y)}}function js(e,t){let n=.5,r=Y(e),i=Y(t);return i>r?n=se(t.min,t.max-r,e.min):r>i&&(n=se(e.min,e.max-i,t.min)),w(0,1,n)}function Ms(e,t){let n={};return t.min!==void 0&&(n.min=t.min-e.min),t.max!==void 0&&(n.max=t.max-e.min),n}var Ns=.35;function Ps(e=Ns){return e===!1?e=0:e===!0&&(e=Ns),{x:Fs(e,`left`,`right`),y:Fs(e,`top`,`bottom`)}}function Fs(e,t,n){return{min:Is(e,t),max:Is(e,n)}}function Is(e,t){return typeof e==`number`?e:e[t]||0}var Ls=new WeakMap,Rs=class{constructor(e){this.openDragLock=null,this.isDragging=!1,this.currentDirection=null,this.originPoint={x:0,y:0},this.constraints=!1,this.hasMutatedConstraints=!1,this.elastic=K(),this.latestPointerEvent=null,this.latestPanInfo=null,this.visualElement=e}start(e,{snapToCursor:t=!1,distanceThreshold:n}={}){let{presenceContext:r}=this.visualElement;if(r&&r.isPresent===!1)return;let i=e=>{let{dragSnapToOrigin:n}=this.getProps();n?this.pauseAnimation():this.stopAnimation(),t&&this.snapToCursor(Qo(e).point)},a=(e,t)=>{let{drag:n,dragPropagation:r,onDragStart:i}=this.getProps();if(n&&!r&&(this.openDragLock&&this.openDragLock(),this.openDragLock=Xr(n),!this.openDragLock))return;this.latestPointerEvent=e,this.latestPanInfo=t,this.isDragging=!0,this.currentDirection=null,this.resolveConstraints(),this.visualElement.projection&&(this.visualElement.projection.isAnimationBlocked=!0,this.visualElement.projection.target=void 0),X(e=>{let t=this.getAxisMotionValue(e).get()||0;if(I.test(t)){let{projection:n}=this.visualElement;if(n&&n.layout){let r=n.layout.layoutBox[e];r&&(t=Y(r)*(parseFloat(t)/100))}}this.originPoint[e]=t}),i&&A.postRender(()=>i(e,t)),So(this.visualElement,`transform`);let{animationState:a}=this.visualElement;a&&a.setActive(`whileDrag`,!0)},o=(e,t)=>{this.latestPointerEvent=e,this.latestPanInfo=t;let{dragPropagation:n,dragDirectionLock:r,onDirectionLock:i,onDrag:a}=this.getProps();if(!n&&!this.openDragLock)return;let{offset:o}=t;if(r&&this.currentDirection===null){this.currentDirection=Bs(o),this.currentDirection!==null&&i&&i(this.currentDirection);return}this.updateAxis(`x`,t.point,o),this.updateAxis(`y`,t.point,o),this.visualElement.render(),a&&a(e,t)},s=(e,t)=>{this.latestPointerEvent=e,this.latestPanInfo=t,this.stop(e,t),this.latestPointerEvent=null,this.latestPanInfo=null},c=()=>X(e=>this.getAnimationState(e)===`paused`&&this.getAxisMotionValue(e).animation?.play()),{dragSnapToOrigin:l}=this.getProps();this.panSession=new ys(e,{onSessionStart:i,onStart:a,onMove:o,onSessionEnd:s,resumeAnimation:c},{transformPagePoint:this.visualElement.getTransformPagePoint(),dragSnapToOrigin:l,distanceThreshold:n,contextWindow:gs(this.visualElement)})}stop(e,t){let n=e||this.latestPointerEvent,r=t||this.latestPanInfo,i=this.isDragging;if(this.cancel(),!i||!r||!n)return;let{velocity:a}=r;this.startAnimation(a);let{onDragEnd:o}=this.getProps();o&&A.postRender(()=>o(n,r))}cancel(){this.isDragging=!1;let{projection:e,animationState:t}=this.visualElement;e&&(e.isAnimationBlocked=!1),this.panSession&&this.panSession.end(),this.panSession=void 0;let{dragPropagation:n}=this.getProps();!n&&this.openDragLock&&(this.openDragLock(),this.openDragLock=null),t&&t.setActive(`whileDrag`,!1)}updateAxis(e,t,n){let{drag:r}=this.getProps();if(!n||!zs(e,r,this.currentDirection))return;let i=this.getAxisMotionValue(e),a=this.originPoint[e]+n[e];this.constraints&&this.constraints[e]&&(a=Es(a,this.constraints[e],this.elastic[e])),i.set(a)}resolveConstraints(){let{dragConstraints:e,dragElastic:t}=this.getProps(),n=this.visualElement.projection&&!this.visualElement.projection.layout?this.visualElement.projection.measure(!1):this.visualElement.projection?.layout,r=this.constraints;e&&_a(e)?this.constraints||=this.resolveRefConstraints():e&&n?this.constraints=Os(n.layoutBox,e):this.constraints=!1,this.elastic=Ps(t),r!==this.constraints&&n&&this.constraints&&!this.hasMutatedConstraints&&X(e=>{this.constraints!==!1&&this.getAxisMotionValue(e)&&(this.constraints[e]=Ms(n.layoutBox[e],this.constraints[e]))})}resolveRefConstraints(){let{dragConstraints:e,onMeasureDragConstraints:t}=this.getProps();if(!e||!_a(e))return!1;let n=e.current,{projection:r}=this.visualElement;if(!r||!r.layout)return!1;let i=Xa(n,r.root,this.visualElement.getTransformPagePoint()),a=As(r.layout.layoutBox,i);if(t){let e=t(Ma(a));this.hasMutatedConstraints=!!e,e&&(a=ja(e))}return a}startAnimation(e){let{drag:t,dragMomentum:n,dragElastic:r,dragTransition:i,dragSnapToOrigin:a,onDragTransitionEnd:o}=this.getProps(),s=this.constraints||{},c=X(o=>{if(!zs(o,t,this.currentDirection))return;let c=s&&s[o]||{};a&&(c={min:0,max:0});let l=r?200:1e6,u=r?40:1e7,d={type:`inertia`,velocity:n?e[o]:0,bounceStiffness:l,bounceDamping:u,timeConstant:750,restDelta:1,restSpeed:10,...i,...c};return this.startAxisValueAnimation(o,d)});return Promise.all(c).then(o)}startAxisValueAnimation(e,t){let n=this.getAxisMotionValue(e);return So(this.visualElement,e),n.start(Mo(e,n,0,t,this.visualElement,!1))}stopAnimation(){X(e=>this.getAxisMotionValue(e).stop())}pauseAnimation(){X(e=>this.getAxisMotionValue(e).animation?.pause())}getAnimationState(e){return this.getAxisMotionValue(e).animation?.state}getAxisMotionValue(e){let t=`_drag${e.toUpperCase()}`,n=this.visualElement.getProps();return n[t]||this.visualElement.getValue(e,(n.initial?n.initial[e]:void 0)||0)}snapToCursor(e){X(t=>{let{drag:n}=this.getProps();if(!zs(t,n,this.currentDirection))return;let{projection:r}=this.visualElement,i=this.getAxisMotionValue(t);if(r&&r.layout){let{min:n,max:a}=r.layout.layoutBox[t];i.set(e[t]-B(n,a,.5))}})}scalePositionWithinConstraints(){if(!this.visualElement.current)return;let{drag:e,dragConstraints:t}=this.getProps(),{projection:n}=this.visualElement;if(!_a(t)||!n||!this.constraints)return;this.stopAnimation();let r={x:0,y:0};X(e=>{let t=this.getAxisMotionValue(e);if(t&&this.constraints!==!1){let n=t.get();r[e]=js({min:n,max:n},this.constraints[e])}});let{transformTemplate:i}=this.visualElement.getProps();this.visualElement.current.style.transform=i?i({},``):`none`,n.root&&n.root.updateScroll(),n.updateLayout(),this.resolveConstraints(),X(t=>{if(!zs(t,e,null))return;let n=this.getAxisMotionValue(t),{min:i,max:a}=this.constraints[t];n.set(B(i,a,r[t]))})}addListeners(){if(!this.visualElement.current)return;Ls.set(this.visualElement,this);let e=this.visualElement.current,t=es(e,`pointerdown`,e=>{let{drag:t,dragListener:n=!0}=this.getProps();t&&n&&this.start(e)}),n=()=>{let{dragConstraints:e}=this.getProps();_a(e)&&e.current&&(this.constraints=this.resolveRefConstraints())},{projection:r}=this.visualElement,i=r.addEventListener(`measure`,n);r&&!r.layout&&(r.root&&r.root.updateScroll(),r.updateLayout()),A.read(n);let a=Zo(window,`resize`,()=>this.scalePositionWithinConstraints()),o=r.addEventListener(`didUpdate`,(({delta:e,hasLayoutChanged:t})=>{this.isDragging&&t&&(X(t=>{let n=this.getAxisMotionValue(t);n&&(this.originPoint[t]+=e[t].translate,n.set(n.get()+e[t].translate))}),this.visualElement.render())}));return()=>{a(),t(),i(),o&&o()}}getProps(){let e=this.visualElement.getProps(),{drag:t=!1,dragDirectionLock:n=!1,dragPropagation:r=!1,dragConstraints:i=!1,dragElastic:a=Ns,dragMomentum:o=!0}=e;return{...e,drag:t,dragDirectionLock:n,dragPropagation:r,dragConstraints:i,dragElastic:a,dragMomentum:o}}};function zs(e,t,n){return(t===!0||t===e)&&(n===null||n===e)}function Bs(e,t=10){let n=null;return Math.abs(e.y)>t?n=`y`:Math.abs(e.x)>t&&(n=`x`),n}var Vs=class extends J{constructor(e){super(e),this.removeGroupControls=E,this.removeListeners=E,this.controls=new Rs(e)}mount(){let{dragControls:e}=this.node.getProps();e&&(this.removeGroupControls=e.subscribe(this.controls)),this.removeListeners=this.controls.addListeners()||E}unmount(){this.removeGroupControls(),this.removeListeners()}},Hs=e=>(t,n)=>{e&&A.postRender(()=>e(t,n))},Us=class extends J{constructor(){super(...arguments),this.removePointerDownListener=E}onPointerDown(e){this.session=new ys(e,this.createPanHandlers(),{transformPagePoint:this.node.getTransformPagePoint(),contextWindow:gs(this.node)})}createPanHandlers(){let{onPanSessionStart:e,onPanStart:t,onPan:n,onPanEnd:r}=this.node.getProps();return{onSessionStart:Hs(e),onStart:Hs(t),onMove:n,onEnd:(e,t)=>{delete this.session,r&&A.postRender(()=>r(e,t))}}}mount(){this.removePointerDownListener=es(this.node.current,`pointerdown`,e=>this.onPointerDown(e))}update(){this.session&&this.session.updateHandlers(this.createPanHandlers())}unmount(){this.removePointerDownListener(),this.session&&this.session.end()}},Ws={hasAnimatedSinceResize:!0,hasEverUpdated:!1};function Gs(e,t){return t.max===t.min?0:e/(t.max-t.min)*100}var Ks={correct:(e,t)=>{if(!t.target)return e;if(typeof e==`string`)if(L.test(e))e=parseFloat(e);else return e;let n=Gs(e,t.target.x),r=Gs(e,t.target.y);return`${n}% ${r}%`}},qs={correct:(e,{treeScale:t,projectionDelta:n})=>{let r=e,i=z.parse(e);if(i.length>5)return r;let a=z.createTransformer(e),o=typeof i[0]==`number`?0:1,s=n.x.scale*t.x,c=n.y.scale*t.y;i[0+o]/=s,i[1+o]/=c;let l=B(s,c,.5);return typeof i[2+o]==`number`&&(i[2+o]/=l),typeof i[3+o]==`number`&&(i[3+o]/=l),a(i)}},Js=!1,Ys=class extends _.Component{componentDidMount(){let{visualElement:e,layoutGroup:t,switchLayoutGroup:n,layoutId:r}=this.props,{projection:i}=e;zi(Zs),i&&(t.group&&t.group.add(i),n&&n.register&&r&&n.register(i),Js&&i.root.didUpdate(),i.addEventListener(`animationComplete`,()=>{this.safeToRemove()}),i.setOptions({...i.options,onExitComplete:()=>this.safeToRemove()})),Ws.hasEverUpdated=!0}getSnapshotBeforeUpdate(e){let{layoutDependency:t,visualElement:n,drag:r,isPresent:i}=this.props,{projection:a}=n;return a?(a.isPresent=i,Js=!0,r||e.layoutDependency!==t||t===void 0||e.isPresent!==i?a.willUpdate():this.safeToRemove(),e.isPresent!==i&&(i?a.promote():a.relegate()||A.postRender(()=>{let e=a.getStack();(!e||!e.members.length)&&this.safeToRemove()})),null):null}componentDidUpdate(){let{projection:e}=this.props.visualElement;e&&(e.root.didUpdate(),qr.postRender(()=>{!e.currentAnimation&&e.isLead()&&this.safeToRemove()}))}componentWillUnmount(){let{visualElement:e,layoutGroup:t,switchLayoutGroup:n}=this.props,{projection:r}=e;Js=!0,r&&(r.scheduleCheckAfterUnmount(),t&&t.group&&t.group.remove(r),n&&n.deregister&&n.deregister(r))}safeToRemove(){let{safeToRemove:e}=this.props;e&&e()}render(){return null}};function Xs(e){let[t,n]=hi(),r=(0,_.useContext)(v);return(0,Ta.jsx)(Ys,{...e,layoutGroup:r,switchLayoutGroup:(0,_.useContext)(xa),isPresent:t,safeToRemove:n})}var Zs={borderRadius:{...Ks,applyTo:[`borderTopLeftRadius`,`borderTopRightRadius`,`borderBottomLeftRadius`,`borderBottomRightRadius`]},borderTopLeftRadius:Ks,borderTopRightRadius:Ks,borderBottomLeftRadius:Ks,borderBottomRightRadius:Ks,boxShadow:qs};function Qs(e,t,n){let r=G(e)?e:Kr(e);return r.start(Mo(``,r,t,n)),r.animation}var $s=(e,t)=>e.depth-t.depth,ec=class{constructor(){this.children=[],this.isDirty=!1}add(e){C(this.children,e),this.isDirty=!0}remove(e){ee(this.children,e),this.isDirty=!0}forEach(e){this.isDirty&&this.children.sort($s),this.isDirty=!1,this.children.forEach(e)}};function tc(e,t){let n=N.now(),r=({timestamp:i})=>{let a=i-n;a>=t&&(j(r),e(a-t))};return A.setup(r,!0),()=>j(r)}var nc=[`TopLeft`,`TopRight`,`BottomLeft`,`BottomRight`],rc=nc.length,ic=e=>typeof e==`string`?parseFloat(e):e,ac=e=>typeof e==`number`||L.test(e);function oc(e,t,n,r,i,a){i?(e.opacity=B(0,n.opacity??1,cc(r)),e.opacityExit=B(t.opacity??1,0,lc(r))):a&&(e.opacity=B(t.opacity??1,n.opacity??1,r));for(let i=0;i<rc;i++){let a=`border${nc[i]}Radius`,o=sc(t,a),s=sc(n,a);o===void 0&&s===void 0||(o||=0,s||=0,o===0||s===0||ac(o)===ac(s)?(e[a]=Math.max(B(ic(o),ic(s),r),0),(I.test(s)||I.test(o))&&(e[a]+=`%`)):e[a]=s)}(t.rotate||n.rotate)&&(e.rotate=B(t.rotate||0,n.rotate||0,r))}function sc(e,t){return e[t]===void 0?e.borderRadius:e[t]}var cc=uc(0,.5,Se),lc=uc(.5,.95,E);function uc(e,t,n){return r=>r<e?0:r>t?1:n(se(e,t,r))}function dc(e,t){e.min=t.min,e.max=t.max}function Z(e,t){dc(e.x,t.x),dc(e.y,t.y)}function fc(e,t){e.translate=t.translate,e.scale=t.scale,e.originPoint=t.originPoint,e.origin=t.origin}function pc(e,t,n,r,i){return e-=t,e=za(e,1/n,r),i!==void 0&&(e=za(e,1/i,r)),e}function mc(e,t=0,n=1,r=.5,i,a=e,o=e){if(I.test(t)&&(t=parseFloat(t),t=B(o.min,o.max,t/100)-o.min),typeof t!=`number`)return;let s=B(a.min,a.max,r);e===a&&(s-=t),e.min=pc(e.min,t,n,s,i),e.max=pc(e.max,t,n,s,i)}function hc(e,t,[n,r,i],a,o){mc(e,t[n],t[r],t[i],t.scale,a,o)}var gc=[`x`,`scaleX`,`originX`],_c=[`y`,`scaleY`,`originY`];function vc(e,t,n,r){hc(e.x,t,gc,n?n.x:void 0,r?r.x:void 0),hc(e.y,t,_c,n?n.y:void 0,r?r.y:void 0)}function yc(e){return e.translate===0&&e.scale===1}function bc(e){return yc(e.x)&&yc(e.y)}function xc(e,t){return e.min===t.min&&e.max===t.max}function Sc(e,t){return xc(e.x,t.x)&&xc(e.y,t.y)}function Cc(e,t){return Math.round(e.min)===Math.round(t.min)&&Math.round(e.max)===Math.round(t.max)}function wc(e,t){return Cc(e.x,t.x)&&Cc(e.y,t.y)}function Tc(e){return Y(e.x)/Y(e.y)}function Ec(e,t){return e.translate===t.translate&&e.scale===t.scale&&e.originPoint===t.originPoint}var Dc=class{constructor(){this.members=[]}add(e){C(this.members,e),e.scheduleRender()}remove(e){if(ee(this.members,e),e===this.prevLead&&(this.prevLead=void 0),e===this.lead){let e=this.members[this.members.length-1];e&&this.promote(e)}}relegate(e){let t=this.members.findIndex(t=>e===t);if(t===0)return!1;let n;for(let e=t;e>=0;e--){let t=this.members[e];if(t.isPresent!==!1){n=t;break}}return n?(this.promote(n),!0):!1}promote(e,t){let n=this.lead;if(e!==n&&(this.prevLead=n,this.lead=e,e.show(),n)){n.instance&&n.scheduleRender(),e.scheduleRender(),e.resumeFrom=n,t&&(e.resumeFrom.preserveOpacity=!0),n.snapshot&&(e.snapshot=n.snapshot,e.snapshot.latestValues=n.animationValues||n.latestValues),e.root&&e.root.isUpdating&&(e.isLayoutDirty=!0);let{crossfade:r}=e.options;r===!1&&n.hide()}}exitAnimationComplete(){this.members.forEach(e=>{let{options:t,resumingFrom:n}=e;t.onExitComplete&&t.onExitComplete(),n&&n.options.onExitComplete&&n.options.onExitComplete()})}scheduleRender(){this.members.forEach(e=>{e.instance&&e.scheduleRender(!1)})}removeLeadSnapshot(){this.lead&&this.lead.snapshot&&(this.lead.snapshot=void 0)}};function Oc(e,t,n){let r=``,i=e.x.translate/t.x,a=e.y.translate/t.y,o=n?.z||0;if((i||a||o)&&(r=`translate3d(${i}px, ${a}px, ${o}px) `),(t.x!==1||t.y!==1)&&(r+=`scale(${1/t.x}, ${1/t.y}) `),n){let{transformPerspective:e,rotate:t,rotateX:i,rotateY:a,skewX:o,skewY:s}=n;e&&(r=`perspective(${e}px) ${r}`),t&&(r+=`rotate(${t}deg) `),i&&(r+=`rotateX(${i}deg) `),a&&(r+=`rotateY(${a}deg) `),o&&(r+=`skewX(${o}deg) `),s&&(r+=`skewY(${s}deg) `)}let s=e.x.scale*t.x,c=e.y.scale*t.y;return(s!==1||c!==1)&&(r+=`scale(${s}, ${c})`),r||`none`}var Q={nodes:0,calculatedTargetDeltas:0,calculatedProjections:0},kc=[``,`X`,`Y`,`Z`],Ac=1e3,jc=0;function Mc(e,t,n,r){let{latestValues:i}=t;i[e]&&(n[e]=i[e],t.setStaticValue(e,0),r&&(r[e]=0))}function Nc(e){if(e.hasCheckedOptimisedAppear=!0,e.root===e)return;let{visualElement:t}=e.options;if(!t)return;let n=Co(t);if(window.MotionHasOptimisedAnimation(n,`transform`)){let{layout:t,layoutId:r}=e.options;window.MotionCancelOptimisedAnimation(n,`transform`,A,!(t||r))}let{parent:r}=e;r&&!r.hasCheckedOptimisedAppear&&Nc(r)}function Pc({attachResizeListener:e,defaultParent:t,measureScroll:n,checkIsScrollRoot:r,resetTransform:i}){return class{constructor(e={},n=t?.()){this.id=jc++,this.animationId=0,this.animationCommitId=0,this.children=new Set,this.options={},this.isTreeAnimating=!1,this.isAnimationBlocked=!1,this.isLayoutDirty=!1,this.isProjectionDirty=!1,this.isSharedProjectionDirty=!1,this.isTransformDirty=!1,this.updateManuallyBlocked=!1,this.updateBlockedByResize=!1,this.isUpdating=!1,this.isSVG=!1,this.needsReset=!1,this.shouldResetTransform=!1,this.hasCheckedOptimisedAppear=!1,this.treeScale={x:1,y:1},this.eventHandlers=new Map,this.hasTreeAnimated=!1,this.updateScheduled=!1,this.scheduleUpdate=()=>this.update(),this.projectionUpdateScheduled=!1,this.checkUpdateFailed=()=>{this.isUpdating&&(this.isUpdating=!1,this.clearAllSnapshots())},this.updateProjection=()=>{this.projectionUpdateScheduled=!1,k.value&&(Q.nodes=Q.calculatedTargetDeltas=Q.calculatedProjections=0),this.nodes.forEach(Lc),this.nodes.forEach(Wc),this.nodes.forEach(Gc),this.nodes.forEach(Rc),k.addProjectionMetrics&&k.addProjectionMetrics(Q)},this.resolvedRelativeTargetAt=0,this.hasProjected=!1,this.isVisible=!0,this.animationProgress=0,this.sharedNodes=new Map,this.latestValues=e,this.root=n?n.root||n:this,this.path=n?[...n.path,n]:[],this.parent=n,this.depth=n?n.depth+1:0;for(let e=0;e<this.path.length;e++)this.path[e].shouldResetTransform=!0;this.root===this&&(this.nodes=new ec)}addEventListener(e,t){return this.eventHandlers.has(e)||this.eventHandlers.set(e,new ce),this.eventHandlers.get(e).add(t)}notifyListeners(e,...t){let n=this.eventHandlers.get(e);n&&n.notify(...t)}hasListeners(e){return this.eventHandlers.has(e)}mount(t){if(this.instance)return;this.isSVG=ui(t)&&!di(t),this.instance=t;let{layoutId:n,layout:r,visualElement:i}=this.options;if(i&&!i.current&&i.mount(t),this.root.nodes.add(this),this.parent&&this.parent.children.add(this),this.root.hasTreeAnimated&&(r||n)&&(this.isLayoutDirty=!0),e){let n,r=0,i=()=>this.root.updateBlockedByResize=!1;A.read(()=>{r=window.innerWidth}),e(t,()=>{let e=window.innerWidth;e!==r&&(r=e,this.root.updateBlockedByResize=!0,n&&n(),n=tc(i,250),Ws.hasAnimatedSinceResize&&(Ws.hasAnimatedSinceResize=!1,this.nodes.forEach(Uc)))})}n&&this.root.registerSharedNode(n,this),this.options.animate!==!1&&i&&(n||r)&&this.addEventListener(`didUpdate`,({delta:e,hasLayoutChanged:t,hasRelativeLayoutChanged:n,layout:r})=>{if(this.isTreeAnimationBlocked()){this.target=void 0,this.relativeTarget=void 0;return}let a=this.options.transition||i.getDefaultTransition()||Qc,{onLayoutAnimationStart:o,onLayoutAnimationComplete:s}=i.getProps(),c=!this.targetLayout||!wc(this.targetLayout,r),l=!t&&n;if(this.options.layoutRoot||this.resumeFrom||l||t&&(c||!this.currentAnimation)){this.resumeFrom&&(this.resumingFrom=this.resumeFrom,this.resumingFrom.resumingFrom=void 0);let t={...br(a,`layout`),onPlay:o,onComplete:s};(i.shouldReduceMotion||this.options.layoutRoot)&&(t.delay=0,t.type=!1),this.startAnimation(t),this.setAnimationOrigin(e,l)}else t||Uc(this),this.isLead()&&this.options.onExitComplete&&this.options.onExitComplete();this.targetLayout=r})}unmount(){this.options.layoutId&&this.willUpdate(),this.root.nodes.remove(this);let e=this.getStack();e&&e.remove(this),this.parent&&this.parent.children.delete(this),this.instance=void 0,this.eventHandlers.clear(),j(this.updateProjection)}blockUpdate(){this.updateManuallyBlocked=!0}unblockUpdate(){this.updateManuallyBlocked=!1}isUpdateBlocked(){return this.updateManuallyBlocked||this.updateBlockedByResize}isTreeAnimationBlocked(){return this.isAnimationBlocked||this.parent&&this.parent.isTreeAnimationBlocked()||!1}startUpdate(){this.isUpdateBlocked()||(this.isUpdating=!0,this.nodes&&this.nodes.forEach(Kc),this.animationId++)}getTransformTemplate(){let{visualElement:e}=this.options;return e&&e.getProps().transformTemplate}willUpdate(e=!0){if(this.root.hasTreeAnimated=!0,this.root.isUpdateBlocked()){this.options.onExitComplete&&this.options.onExitComplete();return}if(window.MotionCancelOptimisedAnimation&&!this.hasCheckedOptimisedAppear&&Nc(this),!this.root.isUpdating&&this.root.startUpdate(),this.isLayoutDirty)return;this.isLayoutDirty=!0;for(let e=0;e<this.path.length;e++){let t=this.path[e];t.shouldResetTransform=!0,t.updateScroll(`snapshot`),t.options.layoutRoot&&t.willUpdate(!1)}let{layoutId:t,layout:n}=this.options;if(t===void 0&&!n)return;let r=this.getTransformTemplate();this.prevTransformTemplateValue=r?r(this.latestValues,``):void 0,this.updateSnapshot(),e&&this.notifyListeners(`willUpdate`)}update(){if(this.updateScheduled=!1,this.isUpdateBlocked()){this.unblockUpdate(),this.clearAllSnapshots(),this.nodes.forEach(Bc);return}if(this.animationId<=this.animationCommitId){this.nodes.forEach(Vc);return}this.animationCommitId=this.animationId,this.isUpdating?(this.isUpdating=!1,this.nodes.forEach(Hc),this.nodes.forEach(Fc),this.nodes.forEach(Ic)):this.nodes.forEach(Vc),this.clearAllSnapshots();let e=N.now();M.delta=w(0,1e3/60,e-M.timestamp),M.timestamp=e,M.isProcessing=!0,Ie.update.process(M),Ie.preRender.process(M),Ie.render.process(M),M.isProcessing=!1}didUpdate(){this.updateScheduled||(this.updateScheduled=!0,qr.read(this.scheduleUpdate))}clearAllSnapshots(){this.nodes.forEach(zc),this.sharedNodes.forEach(qc)}scheduleUpdateProjection(){this.projectionUpdateScheduled||(this.projectionUpdateScheduled=!0,A.preRender(this.updateProjection,!1,!0))}scheduleCheckAfterUnmount(){A.postRender(()=>{this.isLayoutDirty?this.root.didUpdate():this.root.checkUpdateFailed()})}updateSnapshot(){this.snapshot||!this.instance||(this.snapshot=this.measure(),this.snapshot&&!Y(this.snapshot.measuredBox.x)&&!Y(this.snapshot.measuredBox.y)&&(this.snapshot=void 0))}updateLayout(){if(!this.instance||(this.updateScroll(),!(this.options.alwaysMeasureLayout&&this.isLead())&&!this.isLayoutDirty))return;if(this.resumeFrom&&!this.resumeFrom.instance)for(let e=0;e<this.path.length;e++)this.path[e].updateScroll();let e=this.layout;this.layout=this.measure(!1),this.layoutCorrected=K(),this.isLayoutDirty=!1,this.projectionDelta=void 0,this.notifyListeners(`measure`,this.layout.layoutBox);let{visualElement:t}=this.options;t&&t.notify(`LayoutMeasure`,this.layout.layoutBox,e?e.layoutBox:void 0)}updateScroll(e=`measure`){let t=!!(this.options.layoutScroll&&this.instance);if(this.scroll&&this.scroll.animationId===this.root.animationId&&this.scroll.phase===e&&(t=!1),t&&this.instance){let t=r(this.instance);this.scroll={animationId:this.root.animationId,phase:e,isRoot:t,offset:n(this.instance),wasRoot:this.scroll?this.scroll.isRoot:t}}}resetTransform(){if(!i)return;let e=this.isLayoutDirty||this.shouldResetTransform||this.options.alwaysMeasureLayout,t=this.projectionDelta&&!bc(this.projectionDelta),n=this.getTransformTemplate(),r=n?n(this.latestValues,``):void 0,a=r!==this.prevTransformTemplateValue;e&&this.instance&&(t||Ia(this.latestValues)||a)&&(i(this.instance,r),this.shouldResetTransform=!1,this.scheduleRender())}measure(e=!0){let t=this.measurePageBox(),n=this.removeElementScroll(t);return e&&(n=this.removeTransform(n)),nl(n),{animationId:this.root.animationId,measuredBox:t,layoutBox:n,latestValues:{},source:this.id}}measurePageBox(){let{visualElement:e}=this.options;if(!e)return K();let t=e.measureViewportBox();if(!(this.scroll?.wasRoot||this.path.some(il))){let{scroll:e}=this.root;e&&(Ka(t.x,e.offset.x),Ka(t.y,e.offset.y))}return t}removeElementScroll(e){let t=K();if(Z(t,e),this.scroll?.wasRoot)return t;for(let n=0;n<this.path.length;n++){let r=this.path[n],{scroll:i,options:a}=r;r!==this.root&&i&&a.layoutScroll&&(i.wasRoot&&Z(t,e),Ka(t.x,i.offset.x),Ka(t.y,i.offset.y))}return t}applyTransform(e,t=!1){let n=K();Z(n,e);for(let e=0;e<this.path.length;e++){let r=this.path[e];!t&&r.options.layoutScroll&&r.scroll&&r!==r.root&&Ja(n,{x:-r.scroll.offset.x,y:-r.scroll.offset.y}),Ia(r.latestValues)&&Ja(n,r.latestValues)}return Ia(this.latestValues)&&Ja(n,this.latestValues),n}removeTransform(e){let t=K();Z(t,e);for(let e=0;e<this.path.length;e++){let n=this.path[e];if(!n.instance||!Ia(n.latestValues))continue;Fa(n.latestValues)&&n.updateSnapshot();let r=K(),i=n.measurePageBox();Z(r,i),vc(t,n.latestValues,n.snapshot?n.snapshot.layoutBox:void 0,r)}return Ia(this.latestValues)&&vc(t,this.latestValues),t}setTargetDelta(e){this.targetDelta=e,this.root.scheduleUpdateProjection(),this.isProjectionDirty=!0}setOptions(e){this.options={...this.options,...e,crossfade:e.crossfade===void 0?!0:e.crossfade}}clearMeasurements(){this.scroll=void 0,this.layout=void 0,this.snapshot=void 0,this.prevTransformTemplateValue=void 0,this.targetDelta=void 0,this.target=void 0,this.isLayoutDirty=!1}forceRelativeParentToResolveTarget(){this.relativeParent&&this.relativeParent.resolvedRelativeTargetAt!==M.timestamp&&this.relativeParent.resolveTargetDelta(!0)}resolveTargetDelta(e=!1){let t=this.getLead();this.isProjectionDirty||=t.isProjectionDirty,this.isTransformDirty||=t.isTransformDirty,this.isSharedProjectionDirty||=t.isSharedProjectionDirty;let n=!!this.resumingFrom||this!==t;if(!(e||n&&this.isSharedProjectionDirty||this.isProjectionDirty||this.parent?.isProjectionDirty||this.attemptToResolveRelativeTarget||this.root.updateBlockedByResize))return;let{layout:r,layoutId:i}=this.options;if(!(!this.layout||!(r||i))){if(this.resolvedRelativeTargetAt=M.timestamp,!this.targetDelta&&!this.relativeTarget){let e=this.getClosestProjectingParent();e&&e.layout&&this.animationProgress!==1?(this.relativeParent=e,this.forceRelativeParentToResolveTarget(),this.relativeTarget=K(),this.relativeTargetOrigin=K(),hs(this.relativeTargetOrigin,this.layout.layoutBox,e.layout.layoutBox),Z(this.relativeTarget,this.relativeTargetOrigin)):this.relativeParent=this.relativeTarget=void 0}if(!(!this.relativeTarget&&!this.targetDelta)){if(this.target||(this.target=K(),this.targetWithTransforms=K()),this.relativeTarget&&this.relativeTargetOrigin&&this.relativeParent&&this.relativeParent.target?(this.forceRelativeParentToResolveTarget(),ps(this.target,this.relativeTarget,this.relativeParent.target)):this.targetDelta?(this.resumingFrom?this.target=this.applyTransform(this.layout.layoutBox):Z(this.target,this.layout.layoutBox),Ha(this.target,this.targetDelta)):Z(this.target,this.layout.layoutBox),this.attemptToResolveRelativeTarget){this.attemptToResolveRelativeTarget=!1;let e=this.getClosestProjectingParent();e&&!!e.resumingFrom==!!this.resumingFrom&&!e.options.layoutScroll&&e.target&&this.animationProgress!==1?(this.relativeParent=e,this.forceRelativeParentToResolveTarget(),this.relativeTarget=K(),this.relativeTargetOrigin=K(),hs(this.relativeTargetOrigin,this.target,e.target),Z(this.relativeTarget,this.relativeTargetOrigin)):this.relativeParent=this.relativeTarget=void 0}k.value&&Q.calculatedTargetDeltas++}}}getClosestProjectingParent(){if(!(!this.parent||Fa(this.parent.latestValues)||La(this.parent.latestValues)))return this.parent.isProjecting()?this.parent:this.parent.getClosestProjectingParent()}isProjecting(){return!!((this.relativeTarget||this.targetDelta||this.options.layoutRoot)&&this.layout)}calcProjection(){let e=this.getLead(),t=!!this.resumingFrom||this!==e,n=!0;if((this.isProjectionDirty||this.parent?.isProjectionDirty)&&(n=!1),t&&(this.isSharedProjectionDirty||this.isTransformDirty)&&(n=!1),this.resolvedRelativeTargetAt===M.timestamp&&(n=!1),n)return;let{layout:r,layoutId:i}=this.options;if(this.isTreeAnimating=!!(this.parent&&this.parent.isTreeAnimating||this.currentAnimation||this.pendingAnimation),this.isTreeAnimating||(this.targetDelta=this.relativeTarget=void 0),!this.layout||!(r||i))return;Z(this.layoutCorrected,this.layout.layoutBox);let a=this.treeScale.x,o=this.treeScale.y;Ga(this.layoutCorrected,this.treeScale,this.path,t),e.layout&&!e.target&&(this.treeScale.x!==1||this.treeScale.y!==1)&&(e.target=e.layout.layoutBox,e.targetWithTransforms=K());let{target:s}=e;if(!s){this.prevProjectionDelta&&(this.createProjectionDeltas(),this.scheduleRender());return}!this.projectionDelta||!this.prevProjectionDelta?this.createProjectionDeltas():(fc(this.prevProjectionDelta.x,this.projectionDelta.x),fc(this.prevProjectionDelta.y,this.projectionDelta.y)),ds(this.projectionDelta,this.layoutCorrected,s,this.latestValues),(this.treeScale.x!==a||this.treeScale.y!==o||!Ec(this.projectionDelta.x,this.prevProjectionDelta.x)||!Ec(this.projectionDelta.y,this.prevProjectionDelta.y))&&(this.hasProjected=!0,this.scheduleRender(),this.notifyListeners(`projectionUpdate`,s)),k.value&&Q.calculatedProjections++}hide(){this.isVisible=!1}show(){this.isVisible=!0}scheduleRender(e=!0){if(this.options.visualElement?.scheduleRender(),e){let e=this.getStack();e&&e.scheduleRender()}this.resumingFrom&&!this.resumingFrom.instance&&(this.resumingFrom=void 0)}createProjectionDeltas(){this.prevProjectionDelta=Qa(),this.projectionDelta=Qa(),this.projectionDeltaWithTransform=Qa()}setAnimationOrigin(e,t=!1){let n=this.snapshot,r=n?n.latestValues:{},i={...this.latestValues},a=Qa();(!this.relativeParent||!this.relativeParent.options.layoutRoot)&&(this.relativeTarget=this.relativeTargetOrigin=void 0),this.attemptToResolveRelativeTarget=!t;let o=K(),s=n?n.source:void 0,c=this.layout?this.layout.source:void 0,l=s!==c,u=this.getStack(),d=!u||u.members.length<=1,f=!!(l&&!d&&this.options.crossfade===!0&&!this.path.some(Zc));this.animationProgress=0;let p;this.mixTargetDelta=t=>{let n=t/1e3;Jc(a.x,e.x,n),Jc(a.y,e.y,n),this.setTargetDelta(a),this.relativeTarget&&this.relativeTargetOrigin&&this.layout&&this.relativeParent&&this.relativeParent.layout&&(hs(o,this.layout.layoutBox,this.relativeParent.layout.layoutBox),Xc(this.relativeTarget,this.relativeTargetOrigin,o,n),p&&Sc(this.relativeTarget,p)&&(this.isProjectionDirty=!1),p||=K(),Z(p,this.relativeTarget)),l&&(this.animationValues=i,oc(i,r,this.latestValues,n,f,d)),this.root.scheduleUpdateProjection(),this.scheduleRender(),this.animationProgress=n},this.mixTargetDelta(this.options.layoutRoot?1e3:0)}startAnimation(e){this.notifyListeners(`animationStart`),this.currentAnimation?.stop(),this.resumingFrom?.currentAnimation?.stop(),this.pendingAnimation&&=(j(this.pendingAnimation),void 0),this.pendingAnimation=A.update(()=>{Ws.hasAnimatedSinceResize=!0,ze.layout++,this.motionValue||=Kr(0),this.currentAnimation=Qs(this.motionValue,[0,1e3],{...e,velocity:0,isSync:!0,onUpdate:t=>{this.mixTargetDelta(t),e.onUpdate&&e.onUpdate(t)},onStop:()=>{ze.layout--},onComplete:()=>{ze.layout--,e.onComplete&&e.onComplete(),this.completeAnimation()}}),this.resumingFrom&&(this.resumingFrom.currentAnimation=this.currentAnimation),this.pendingAnimation=void 0})}completeAnimation(){this.resumingFrom&&(this.resumingFrom.currentAnimation=void 0,this.resumingFrom.preserveOpacity=void 0);let e=this.getStack();e&&e.exitAnimationComplete(),this.resumingFrom=this.currentAnimation=this.animationValues=void 0,this.notifyListeners(`animationComplete`)}finishAnimation(){this.currentAnimation&&(this.mixTargetDelta&&this.mixTargetDelta(Ac),this.currentAnimation.stop()),this.completeAnimation()}applyTransformsToTarget(){let e=this.getLead(),{targetWithTransforms:t,target:n,layout:r,latestValues:i}=e;if(!(!t||!n||!r)){if(this!==e&&this.layout&&r&&rl(this.options.animationType,this.layout.layoutBox,r.layoutBox)){n=this.target||K();let t=Y(this.layout.layoutBox.x);n.x.min=e.target.x.min,n.x.max=n.x.min+t;let r=Y(this.layout.layoutBox.y);n.y.min=e.target.y.min,n.y.max=n.y.min+r}Z(t,n),Ja(t,i),ds(this.projectionDeltaWithTransform,this.layoutCorrected,t,i)}}registerSharedNode(e,t){this.sharedNodes.has(e)||this.sharedNodes.set(e,new Dc),this.sharedNodes.get(e).add(t);let n=t.options.initialPromotionConfig;t.promote({transition:n?n.transition:void 0,preserveFollowOpacity:n&&n.shouldPreserveFollowOpacity?n.shouldPreserveFollowOpacity(t):void 0})}isLead(){let e=this.getStack();return e?e.lead===this:!0}getLead(){let{layoutId:e}=this.options;return e&&this.getStack()?.lead||this}getPrevLead(){let{layoutId:e}=this.options;return e?this.getStack()?.prevLead:void 0}getStack(){let{layoutId:e}=this.options;if(e)return this.root.sharedNodes.get(e)}promote({needsReset:e,transition:t,preserveFollowOpacity:n}={}){let r=this.getStack();r&&r.promote(this,n),e&&(this.projectionDelta=void 0,this.needsReset=!0),t&&this.setOptions({transition:t})}relegate(){let e=this.getStack();return e?e.relegate(this):!1}resetSkewAndRotation(){let{visualElement:e}=this.options;if(!e)return;let t=!1,{latestValues:n}=e;if((n.z||n.rotate||n.rotateX||n.rotateY||n.rotateZ||n.skewX||n.skewY)&&(t=!0),!t)return;let r={};n.z&&Mc(`z`,e,r,this.animationValues);for(let t=0;t<kc.length;t++)Mc(`rotate${kc[t]}`,e,r,this.animationValues),Mc(`skew${kc[t]}`,e,r,this.animationValues);for(let t in e.render(),r)e.setStaticValue(t,r[t]),this.animationValues&&(this.animationValues[t]=r[t]);e.scheduleRender()}applyProjectionStyles(e,t){if(!this.instance||this.isSVG)return;if(!this.isVisible){e.visibility=`hidden`;return}let n=this.getTransformTemplate();if(this.needsReset){this.needsReset=!1,e.visibility=``,e.opacity=``,e.pointerEvents=ca(t?.pointerEvents)||``,e.transform=n?n(this.latestValues,``):`none`;return}let r=this.getLead();if(!this.projectionDelta||!this.layout||!r.target){this.options.layoutId&&(e.opacity=this.latestValues.opacity===void 0?1:this.latestValues.opacity,e.pointerEvents=ca(t?.pointerEvents)||``),this.hasProjected&&!Ia(this.latestValues)&&(e.transform=n?n({},``):`none`,this.hasProjected=!1);return}e.visibility=``;let i=r.animationValues||r.latestValues;this.applyTransformsToTarget();let a=Oc(this.projectionDeltaWithTransform,this.treeScale,i);n&&(a=n(i,a)),e.transform=a;let{x:o,y:s}=this.projectionDelta;for(let t in e.transformOrigin=`${o.origin*100}% ${s.origin*100}% 0`,r.animationValues?e.opacity=r===this?i.opacity??this.latestValues.opacity??1:this.preserveOpacity?this.latestValues.opacity:i.opacityExit:e.opacity=r===this?i.opacity===void 0?``:i.opacity:i.opacityExit===void 0?0:i.opacityExit,Ri){if(i[t]===void 0)continue;let{correct:n,applyTo:o,isCSSVariable:s}=Ri[t],c=a===`none`?i[t]:n(i[t],r);if(o){let t=o.length;for(let n=0;n<t;n++)e[o[n]]=c}else s?this.options.visualElement.renderState.vars[t]=c:e[t]=c}this.options.layoutId&&(e.pointerEvents=r===this?ca(t?.pointerEvents)||``:`none`)}clearSnapshot(){this.resumeFrom=this.snapshot=void 0}resetTree(){this.root.nodes.forEach(e=>e.currentAnimation?.stop()),this.root.nodes.forEach(Bc),this.root.sharedNodes.clear()}}}function Fc(e){e.updateLayout()}function Ic(e){let t=e.resumeFrom?.snapshot||e.snapshot;if(e.isLead()&&e.layout&&t&&e.hasListeners(`didUpdate`)){let{layoutBox:n,measuredBox:r}=e.layout,{animationType:i}=e.options,a=t.source!==e.layout.source;i===`size`?X(e=>{let r=a?t.measuredBox[e]:t.layoutBox[e],i=Y(r);r.min=n[e].min,r.max=r.min+i}):rl(i,t.layoutBox,n)&&X(r=>{let i=a?t.measuredBox[r]:t.layoutBox[r],o=Y(n[r]);i.max=i.min+o,e.relativeTarget&&!e.currentAnimation&&(e.isProjectionDirty=!0,e.relativeTarget[r].max=e.relativeTarget[r].min+o)});let o=Qa();ds(o,n,t.layoutBox);let s=Qa();a?ds(s,e.applyTransform(r,!0),t.measuredBox):ds(s,n,t.layoutBox);let c=!bc(o),l=!1;if(!e.resumeFrom){let r=e.getClosestProjectingParent();if(r&&!r.resumeFrom){let{snapshot:i,layout:a}=r;if(i&&a){let o=K();hs(o,t.layoutBox,i.layoutBox);let s=K();hs(s,n,a.layoutBox),wc(o,s)||(l=!0),r.options.layoutRoot&&(e.relativeTarget=s,e.relativeTargetOrigin=o,e.relativeParent=r)}}}e.notifyListeners(`didUpdate`,{layout:n,snapshot:t,delta:s,layoutDelta:o,hasLayoutChanged:c,hasRelativeLayoutChanged:l})}else if(e.isLead()){let{onExitComplete:t}=e.options;t&&t()}e.options.transition=void 0}function Lc(e){k.value&&Q.nodes++,e.parent&&(e.isProjecting()||(e.isProjectionDirty=e.parent.isProjectionDirty),e.isSharedProjectionDirty||=!!(e.isProjectionDirty||e.parent.isProjectionDirty||e.parent.isSharedProjectionDirty),e.isTransformDirty||=e.parent.isTransformDirty)}function Rc(e){e.isProjectionDirty=e.isSharedProjectionDirty=e.isTransformDirty=!1}function zc(e){e.clearSnapshot()}function Bc(e){e.clearMeasurements()}function Vc(e){e.isLayoutDirty=!1}function Hc(e){let{visualElement:t}=e.options;t&&t.getProps().onBeforeLayoutMeasure&&t.notify(`BeforeLayoutMeasure`),e.resetTransform()}function Uc(e){e.finishAnimation(),e.targetDelta=e.relativeTarget=e.target=void 0,e.isProjectionDirty=!0}function Wc(e){e.resolveTargetDelta()}function Gc(e){e.calcProjection()}function Kc(e){e.resetSkewAndRotation()}function qc(e){e.removeLeadSnapshot()}function Jc(e,t,n){e.translate=B(t.translate,0,n),e.scale=B(t.scale,1,n),e.origin=t.origin,e.originPoint=t.originPoint}function Yc(e,t,n,r){e.min=B(t.min,n.min,r),e.max=B(t.max,n.max,r)}function Xc(e,t,n,r){Yc(e.x,t.x,n.x,r),Yc(e.y,t.y,n.y,r)}function Zc(e){return e.animationValues&&e.animationValues.opacityExit!==void 0}var Qc={duration:.45,ease:[.4,0,.1,1]},$c=e=>typeof navigator<`u`&&navigator.userAgent&&navigator.userAgent.toLowerCase().includes(e),el=$c(`applewebkit/`)&&!$c(`chrome/`)?Math.round:E;function tl(e){e.min=el(e.min),e.max=el(e.max)}function nl(e){tl(e.x),tl(e.y)}function rl(e,t,n){return e===`position`||e===`preserve-aspect`&&!ls(Tc(t),Tc(n),.2)}function il(e){return e!==e.root&&e.scroll?.wasRoot}var al=Pc({attachResizeListener:(e,t)=>Zo(e,`resize`,t),measureScroll:()=>({x:document.documentElement.scrollLeft||document.body.scrollLeft,y:document.documentElement.scrollTop||document.body.scrollTop}),checkIsScrollRoot:()=>!0}),ol={current:void 0},sl=Pc({measureScroll:e=>({x:e.scrollLeft,y:e.scrollTop}),defaultParent:()=>{if(!ol.current){let e=new al({});e.mount(window),e.setOptions({layoutScroll:!0}),ol.current=e}return ol.current},resetTransform:(e,t)=>{e.style.transform=t===void 0?`none`:t},checkIsScrollRoot:e=>window.getComputedStyle(e).position===`fixed`}),cl={pan:{Feature:Us},drag:{Feature:Vs,ProjectionNode:sl,MeasureLayout:Xs}};function ll(e,t,n){let{props:r}=e;e.animationState&&r.whileHover&&e.animationState.setActive(`whileHover`,n===`Start`);let i=`onHover`+n,a=r[i];a&&A.postRender(()=>a(t,Qo(t)))}var ul=class extends J{mount(){let{current:e}=this.node;e&&(this.unmount=$r(e,(e,t)=>(ll(this.node,t,`Start`),e=>ll(this.node,e,`End`))))}unmount(){}},dl=class extends J{constructor(){super(...arguments),this.isActive=!1}onFocus(){let e=!1;try{e=this.node.current.matches(`:focus-visible`)}catch{e=!0}!e||!this.node.animationState||(this.node.animationState.setActive(`whileFocus`,!0),this.isActive=!0)}onBlur(){!this.isActive||!this.node.animationState||(this.node.animationState.setActive(`whileFocus`,!1),this.isActive=!1)}mount(){this.unmount=oe(Zo(this.node.current,`focus`,()=>this.onFocus()),Zo(this.node.current,`blur`,()=>this.onBlur()))}unmount(){}};function fl(e,t,n){let{props:r}=e;if(e.current instanceof HTMLButtonElement&&e.current.disabled)return;e.animationState&&r.whileTap&&e.animationState.setActive(`whileTap`,n===`Start`);let i=`onTap`+(n===`End`?``:n),a=r[i];a&&A.postRender(()=>a(t,Qo(t)))}var pl=class extends J{mount(){let{current:e}=this.node;e&&(this.unmount=li(e,(e,t)=>(fl(this.node,t,`Start`),(e,{success:t})=>fl(this.node,e,t?`End`:`Cancel`)),{useGlobalTarget:this.node.props.globalTapTarget}))}unmount(){}},ml=new WeakMap,hl=new WeakMap,gl=e=>{let t=ml.get(e.target);t&&t(e)},_l=e=>{e.forEach(gl)};function vl({root:e,...t}){let n=e||document;hl.has(n)||hl.set(n,{});let r=hl.get(n),i=JSON.stringify(t);return r[i]||(r[i]=new IntersectionObserver(_l,{root:e,...t})),r[i]}function yl(e,t,n){let r=vl(t);return ml.set(e,n),r.observe(e),()=>{ml.delete(e),r.unobserve(e)}}var bl={some:0,all:1},xl=class extends J{constructor(){super(...arguments),this.hasEnteredView=!1,this.isInView=!1}startObserver(){this.unmount();let{viewport:e={}}=this.node.getProps(),{root:t,margin:n,amount:r=`some`,once:i}=e,a={root:t?t.current:void 0,rootMargin:n,threshold:typeof r==`number`?r:bl[r]};return yl(this.node.current,a,e=>{let{isIntersecting:t}=e;if(this.isInView===t||(this.isInView=t,i&&!t&&this.hasEnteredView))return;t&&(this.hasEnteredView=!0),this.node.animationState&&this.node.animationState.setActive(`whileInView`,t);let{onViewportEnter:n,onViewportLeave:r}=this.node.getProps(),a=t?n:r;a&&a(e)})}mount(){this.startObserver()}update(){if(typeof IntersectionObserver>`u`)return;let{props:e,prevProps:t}=this.node;[`amount`,`margin`,`root`].some(Sl(e,t))&&this.startObserver()}unmount(){}};function Sl({viewport:e={}},{viewport:t={}}={}){return n=>e[n]!==t[n]}var Cl={inView:{Feature:xl},tap:{Feature:pl},focus:{Feature:dl},hover:{Feature:ul}},wl={layout:{ProjectionNode:sl,MeasureLayout:Xs}},Tl={...Xo,...Cl,...cl,...wl},$=Aa(Tl,ho),El=a(function(){let e=(0,_.useRef)(null);c.ref_HR_Time_Saved_counter=e;let t=(0,_.useRef)(null);c.ref_Employees_Managed_counter=t;let n=(0,_.useRef)(null);return c.ref_Startups_Using_OStaffSync_counter=n,g(_.Fragment,{},g(h,{align:`start`,className:`rx-Stack`,css:{width:`100%`},direction:`column`,gap:`0`},g(h,{align:`center`,className:`rx-Stack`,css:{width:`100%`,paddingTop:`1.5`,paddingBottom:`1.5`,paddingInlineStart:`6`,paddingInlineEnd:`6`,backgroundColor:`#FFF44F`,boxShadow:`0 2px 8px rgba(0, 0, 0, 0.15)`,position:`sticky`,top:`0`,zIndex:`1000`},direction:`row`,justify:`between`,gap:`3`},g(u,{as:`p`,css:{color:`#1E3A8A`,fontSize:`2`,fontWeight:`bold`,paddingInlineStart:`2`,paddingInlineEnd:`2`,"&:hover":{color:`#2563EB`,transition:`color 0.3s ease`}}},`OStaffSync`),g(h,{align:`center`,className:`rx-Stack`,css:{margin:`20`},direction:`row`,gap:`5`},g(d,{asChild:!0,css:{color:`black`,fontSize:`1.1`,paddingInlineStart:`2`,paddingInlineEnd:`2`,"&:hover":{color:`#2563EB`,transform:`scale(1.05)`,transition:`all 0.3s ease-in-out`}}},g(o,{to:`/`},`Home`)),g(d,{asChild:!0,css:{color:`black`,fontSize:`1.1`,paddingInlineStart:`2`,paddingInlineEnd:`2`,"&:hover":{color:`#2563EB`,transform:`scale(1.05)`,transition:`all 0.3s ease-in-out`}}},g(o,{to:`/about`},`About`)),g(d,{asChild:!0,css:{color:`black`,fontSize:`1.1`,paddingInlineStart:`2`,paddingInlineEnd:`2`,"&:hover":{color:`#2563EB`,transform:`scale(1.05)`,transition:`all 0.3s ease-in-out`}}},g(o,{to:`/login`},`Login`)),g(d,{asChild:!0,css:{color:`black`,fontSize:`1.1`,paddingInlineStart:`2`,paddingInlineEnd:`2`,"&:hover":{color:`#2563EB`,transform:`scale(1.05)`,transition:`all 0.3s ease-in-out`}}},g(o,{to:`/register`},`Register`)))),g(l,{css:{width:`100vw`,height:`100vh`,background:`linear-gradient(135deg, #667eea 0%, #764ba2 50%, #f093fb 100%)`,align:`center`,justify:`center`,paddingInlineStart:`4`,paddingInlineEnd:`4`}},g(h,{align:`center`,className:`rx-Stack`,direction:`column`,gap:`8`},g($.div,{animate:{opacity:1,y:0},initial:{opacity:0,y:-50},transition:{duration:1,ease:`easeOut`}},g(s,{css:{fontSize:`6xl`,color:`white`,fontWeight:`extrabold`,textAlign:`center`}},`Transform Your HR. Open Source. Fully Flexible.`)),g($.div,{animate:{opacity:1,y:0},initial:{opacity:0,y:30},transition:{duration:1,delay:.3,ease:`easeOut`}},g(u,{as:`p`,css:{fontSize:`2xl`,color:`gray.100`,textAlign:`center`,maxWidth:`3xl`,lineHeight:`taller`}},`Empower your team with a modern HR management system that handles payroll, attendance, performance, and more—without limits.`)),g($.div,{animate:{opacity:1,y:0},initial:{opacity:0,y:20},transition:{duration:1,delay:.5,ease:`easeOut`}},g(h,{align:`start`,className:`rx-Stack`,css:{maxWidth:`3xl`},direction:`column`,gap:`4`},g(h,{align:`start`,className:`rx-Stack`,direction:`row`,gap:`3`},g(u,{as:`p`,css:{fontSize:`xl`}},`✅`),g(u,{as:`p`,css:{fontSize:`4`,color:`gray.100`}},`Completely Free & Open Source: Take full control of your HR processes.`)),g(h,{align:`start`,className:`rx-Stack`,direction:`row`,gap:`3`},g(u,{as:`p`,css:{fontSize:`xl`}},`✅`),g(u,{as:`p`,css:{fontSize:`4`,color:`gray.100`}},`All-in-One HR Solution: Simplify recruitment, payroll, performance, and employee management.`)),g(h,{align:`start`,className:`rx-Stack`,direction:`row`,gap:`3`},g(u,{as:`p`,css:{fontSize:`xl`}},`✅`),g(u,{as:`p`,css:{fontSize:`4`,color:`gray.100`}},`Designed for Teams: Flexible, scalable, and easy to use for any organization size.`)))),g(h,{align:`start`,className:`rx-Stack`,css:{marginTop:`8`},direction:`row`,justify:`center`,gap:`8`,wrap:`wrap`},g($.div,{animate:{opacity:1,y:0},initial:{opacity:0,y:80},transition:{duration:1,ease:`easeOut`}},g(h,{align:`center`,className:`rx-Stack`,direction:`column`,gap:`3`},g(u,{as:`p`,css:{fontSize:`3xl`,fontWeight:`extrabold`,color:`#9f7aea`},id:`HR Time Saved-counter`,ref:e},50),g(u,{as:`p`,css:{fontSize:`3`,color:`gray.100`}},`HR Time Saved`))),g($.div,{animate:{opacity:1,y:0},initial:{opacity:0,y:80},transition:{duration:1,ease:`easeOut`}},g(h,{align:`center`,className:`rx-Stack`,direction:`column`,gap:`3`},g(u,{as:`p`,css:{fontSize:`3xl`,fontWeight:`extrabold`,color:`#48bb78`},id:`Employees Managed-counter`,ref:t},80),g(u,{as:`p`,css:{fontSize:`3`,color:`gray.100`}},`Employees Managed`))),g($.div,{animate:{opacity:1,y:0},initial:{opacity:0,y:80},transition:{duration:1,ease:`easeOut`}},g(h,{align:`center`,className:`rx-Stack`,direction:`column`,gap:`3`},g(u,{as:`p`,css:{fontSize:`3xl`,fontWeight:`extrabold`,color:`#4299e1`},id:`Startups Using OStaffSync-counter`,ref:n},70),g(u,{as:`p`,css:{fontSize:`3`,color:`gray.100`}},`Startups Using OStaffSync`)))),g(h,{align:`start`,className:`rx-Stack`,css:{marginTop:`6`},direction:`row`,justify:`center`,gap:`8`},g($.div,{animate:{opacity:1,scale:1},css:{whileHover:{background:`blue.400`,transform:`translateY(-2px)`}},initial:{opacity:0,scale:.9},transition:{duration:.8,delay:.7,ease:`easeOut`}},g(f,{css:{backgroundColor:`white`,color:`blue.600`,fontWeight:`bold`,width:`48`,height:`16`},size:`4`,variant:`solid`},`Get Started Today`)),g($.div,{animate:{opacity:1,scale:1},css:{whileHover:{background:`whiteAlpha.200`,transform:`translateY(-2px)`}},initial:{opacity:0,scale:.9},transition:{duration:.8,delay:.9,ease:`easeOut`}},g(f,{css:{borderColor:`white`,color:`white`,fontWeight:`bold`,width:`48`,height:`16`},size:`4`,variant:`outline`},`Learn More`))),g($.div,{animate:{opacity:1,y:0},initial:{opacity:0,y:20},transition:{duration:1,delay:1.1,ease:`easeOut`}},g(u,{as:`p`,css:{fontSize:`4`,color:`gray.200`,textAlign:`center`,maxWidth:`3xl`}},`Your HR, your way. Streamline workflows, empower employees, and save time.`)))),g(l,{css:{width:`100vw`,paddingTop:`20`,paddingBottom:`20`,backgroundColor:`gray.50`,align:`center`}},g(h,{align:`center`,className:`rx-Stack`,direction:`column`,gap:`9`},g(s,{css:{fontSize:`3xl`,fontWeight:`extrabold`,color:`blue.600`,textAlign:`center`}},`Key Features`),g(m,{columns:`2`,css:{width:`full`},gap:`8`},g($.div,{animate:{opacity:1,y:0},initial:{opacity:0,y:50},transition:{duration:.6,delay:0,ease:`easeOut`}},g(h,{align:`center`,className:`rx-Stack`,css:{padding:`6`,backgroundColor:`white`,borderRadius:`xl`,boxShadow:`xl`,width:`full`,"&:hover":{transform:`translateY(-6px)`,boxShadow:`2xl`}},direction:`column`,gap:`4`},g(l,{css:{fontSize:`3xl`,backgroundColor:`blue.400`,borderRadius:`full`,padding:`4`,color:`white`}},`👤`),g(s,{css:{fontSize:`xl`,fontWeight:`bold`,color:`gray.800`,textAlign:`center`}},`Employee Management`),g(u,{as:`p`,css:{fontSize:`3`,color:`gray.600`,textAlign:`center`}},`Centralize all employee records and HR tasks.`))),g($.div,{animate:{opacity:1,y:0},initial:{opacity:0,y:50},transition:{duration:.6,delay:.2,ease:`easeOut`}},g(h,{align:`center`,className:`rx-Stack`,css:{padding:`6`,backgroundColor:`white`,borderRadius:`xl`,boxShadow:`xl`,width:`full`,"&:hover":{transform:`translateY(-6px)`,boxShadow:`2xl`}},direction:`column`,gap:`4`},g(l,{css:{fontSize:`3xl`,backgroundColor:`green.400`,borderRadius:`full`,padding:`4`,color:`white`}},`💰`),g(s,{css:{fontSize:`xl`,fontWeight:`bold`,color:`gray.800`,textAlign:`center`}},`Payroll & Attendance`),g(u,{as:`p`,css:{fontSize:`3`,color:`gray.600`,textAlign:`center`}},`Automate payroll and track attendance easily.`))),g($.div,{animate:{opacity:1,y:0},initial:{opacity:0,y:50},transition:{duration:.6,delay:.4,ease:`easeOut`}},g(h,{align:`center`,className:`rx-Stack`,css:{padding:`6`,backgroundColor:`white`,borderRadius:`xl`,boxShadow:`xl`,width:`full`,"&:hover":{transform:`translateY(-6px)`,boxShadow:`2xl`}},direction:`column`,gap:`4`},g(l,{css:{fontSize:`3xl`,backgroundColor:`purple.400`,borderRadius:`full`,padding:`4`,color:`white`}},`📊`),g(s,{css:{fontSize:`xl`,fontWeight:`bold`,color:`gray.800`,textAlign:`center`}},`Performance Tracking`),g(u,{as:`p`,css:{fontSize:`3`,color:`gray.600`,textAlign:`center`}},`Monitor KPIs, goals, and appraisals effectively.`))),g($.div,{animate:{opacity:1,y:0},initial:{opacity:0,y:50},transition:{duration:.6,delay:.6000000000000001,ease:`easeOut`}},g(h,{align:`center`,className:`rx-Stack`,css:{padding:`6`,backgroundColor:`white`,borderRadius:`xl`,boxShadow:`xl`,width:`full`,"&:hover":{transform:`translateY(-6px)`,boxShadow:`2xl`}},direction:`column`,gap:`4`},g(l,{css:{fontSize:`3xl`,backgroundColor:`orange.400`,borderRadius:`full`,padding:`4`,color:`white`}},`🔍`),g(s,{css:{fontSize:`xl`,fontWeight:`bold`,color:`gray.800`,textAlign:`center`}},`Recruitment & Onboarding`),g(u,{as:`p`,css:{fontSize:`3`,color:`gray.600`,textAlign:`center`}},`Manage candidates and onboarding in one platform.`)))))),g(l,{css:{width:`100vw`,paddingTop:`24`,paddingBottom:`24`,backgroundColor:`gray.50`,align:`center`}},g(h,{align:`center`,className:`rx-Stack`,direction:`column`,gap:`9`},g(s,{css:{fontSize:`3xl`,fontWeight:`extrabold`,color:`blue.600`,textAlign:`center`}},`What Startups Say`),g(h,{align:`start`,className:`rx-Stack`,direction:`row`,justify:`center`,gap:`9`,wrap:`wrap`},g($.div,{animate:{opacity:1,y:0},initial:{opacity:0,y:40},transition:{duration:.6,delay:0,ease:`easeOut`}},g(h,{align:`center`,className:`rx-Stack`,css:{padding:`8`,backgroundColor:`white`,borderRadius:`xl`,boxShadow:`2xl`,width:`sm`},direction:`column`,gap:`4`},g(u,{as:`p`,css:{fontSize:`6xl`,color:`blue.600`,textAlign:`center`,lineHeight:`0.5`}},`“`),g(u,{as:`p`,css:{fontSize:`2xl`,color:`gray.800`,fontWeight:`semibold`,textAlign:`center`,lineHeight:`tall`}},`OStaffSync reduced our HR workload by 50%!`),g(u,{as:`p`,css:{fontSize:`3`,color:`gray.500`,textAlign:`center`}},`- Ravi K, StartupX`),g(l,{css:{fontSize:`4xl`,padding:`2`,backgroundColor:`blue.100`,borderRadius:`full`,marginTop:`4`}},`👨‍💼`))),g($.div,{animate:{opacity:1,y:0},initial:{opacity:0,y:40},transition:{duration:.6,delay:.2,ease:`easeOut`}},g(h,{align:`center`,className:`rx-Stack`,css:{padding:`8`,backgroundColor:`white`,borderRadius:`xl`,boxShadow:`2xl`,width:`sm`},direction:`column`,gap:`4`},g(u,{as:`p`,css:{fontSize:`6xl`,color:`blue.600`,textAlign:`center`,lineHeight:`0.5`}},`“`),g(u,{as:`p`,css:{fontSize:`2xl`,color:`gray.800`,fontWeight:`semibold`,textAlign:`center`,lineHeight:`tall`}},`The payroll module is a lifesaver.`),g(u,{as:`p`,css:{fontSize:`3`,color:`gray.500`,textAlign:`center`}},`- Anika S, TechNova`),g(l,{css:{fontSize:`4xl`,padding:`2`,backgroundColor:`blue.100`,borderRadius:`full`,marginTop:`4`}},`👩‍💼`))),g($.div,{animate:{opacity:1,y:0},initial:{opacity:0,y:40},transition:{duration:.6,delay:.4,ease:`easeOut`}},g(h,{align:`center`,className:`rx-Stack`,css:{padding:`8`,backgroundColor:`white`,borderRadius:`xl`,boxShadow:`2xl`,width:`sm`},direction:`column`,gap:`4`},g(u,{as:`p`,css:{fontSize:`6xl`,color:`blue.600`,textAlign:`center`,lineHeight:`0.5`}},`“`),g(u,{as:`p`,css:{fontSize:`2xl`,color:`gray.800`,fontWeight:`semibold`,textAlign:`center`,lineHeight:`tall`}},`Simplified our employee management completely.`),g(u,{as:`p`,css:{fontSize:`3`,color:`gray.500`,textAlign:`center`}},`- Rahul P, Innovatech`),g(l,{css:{fontSize:`4xl`,padding:`2`,backgroundColor:`blue.100`,borderRadius:`full`,marginTop:`4`}},`👨‍💻`)))))),g(l,{css:{width:`100vw`,paddingTop:`6`,paddingBottom:`6`,backgroundColor:`gray.900`,align:`center`}},g(h,{align:`center`,className:`rx-Stack`,direction:`column`,gap:`4`},g(u,{as:`p`,css:{color:`gray.500`,fontSize:`sm`}},`© 2025 OStaffSync. All rights reserved.`),g(h,{align:`start`,className:`rx-Stack`,direction:`row`,gap:`6`},g(u,{as:`p`,css:{color:`blue.600`,fontWeight:`bold`,"&:hover":{textDecoration:`underline`}}},`GitHub`),g(u,{as:`p`,css:{color:`blue.600`,fontWeight:`bold`,"&:hover":{textDecoration:`underline`}}},`Docs`))))),g(`title`,{},`Ostaffsync | Index`),g(`meta`,{content:`favicon.ico`,property:`og:image`}))});export{El as default};
\ No newline at end of file
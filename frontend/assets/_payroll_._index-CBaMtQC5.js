@@ -1,2 +0,0 @@
-const __vite__mapDeps=(i,m=__vite__mapDeps,d=(m.f||(m.f=["assets/es6-DGfz_lLl.js","assets/es6-BSLagGQG.js","assets/react-dom-Dr_efIFp.js","assets/react-BcXKmAwN.js","assets/rolldown-runtime-D_juG1Xi.js","assets/react-is-BiweJ67z.js","assets/shim-DLiwten_.js"])))=>i.map(i=>d[i]);
-import{a as e}from"./rolldown-runtime-D_juG1Xi.js";import{t}from"./react-BcXKmAwN.js";import"./react-dom-Dr_efIFp.js";import{A as n,r}from"./chunk-NISHYRIK-BsYev12b.js";import{C as i,E as a,F as o,G as s,H as c,L as l,N as u,S as d,T as f,W as p,_ as m,b as h,c as g,d as _,f as v,h as y,i as b,l as x,m as S,n as C,o as w,p as T,s as E,u as ee,x as D,y as O}from"./esm-CvOQchaW.js";import"./reflex-env-CtwX00K9.js";import{n as k}from"./emotion-react.browser.esm-B3Hu227f.js";import"./react-is-BiweJ67z.js";import"./shim-DLiwten_.js";import{t as A}from"./createLucideIcon-DvMhwGZ5.js";import{n as j,t as M}from"./users-h3LY_qm3.js";import{a as N,c as P,n as F,o as I,r as L,s as R,t as z}from"./stateful_components-DJaICTVT.js";import{t as B}from"./lib-D8E8fr-q.js";import{J as V,Y as H,b as te,g as U,h as W}from"./es6-BSLagGQG.js";var G=A(`chart-bar`,[[`path`,{d:`M3 3v16a2 2 0 0 0 2 2h16`,key:`c24i48`}],[`path`,{d:`M7 16h8`,key:`srdodz`}],[`path`,{d:`M7 11h12`,key:`127s9w`}],[`path`,{d:`M7 6h3`,key:`w9rmul`}]]),K=`modulepreload`,q=function(e){return`/`+e},J={};const Y=function(e,t,n){let r=Promise.resolve();if(t&&t.length>0){let e=document.getElementsByTagName(`link`),i=document.querySelector(`meta[property=csp-nonce]`),a=i?.nonce||i?.getAttribute(`nonce`);function o(e){return Promise.all(e.map(e=>Promise.resolve(e).then(e=>({status:`fulfilled`,value:e}),e=>({status:`rejected`,reason:e}))))}r=o(t.map(t=>{if(t=q(t,n),t in J)return;J[t]=!0;let r=t.endsWith(`.css`),i=r?`[rel="stylesheet"]`:``;if(n)for(let n=e.length-1;n>=0;n--){let i=e[n];if(i.href===t&&(!r||i.rel===`stylesheet`))return}else if(document.querySelector(`link[href="${t}"]${i}`))return;let o=document.createElement(`link`);if(o.rel=r?`stylesheet`:K,r||(o.as=`script`),o.crossOrigin=``,o.href=t,a&&o.setAttribute(`nonce`,a),document.head.appendChild(o),r)return new Promise((e,n)=>{o.addEventListener(`load`,e),o.addEventListener(`error`,()=>n(Error(`Unable to preload CSS for ${t}`)))})}))}function i(e){let t=new Event(`vite:preloadError`,{cancelable:!0});if(t.payload=e,window.dispatchEvent(t),!t.defaultPrevented)throw e}return r.then(t=>{for(let e of t||[]){if(e.status!==`rejected`)continue;i(e.reason)}return e().catch(i)})};var X=e(t()),Z=e(B()),Q=u((0,X.lazy)(()=>Y(()=>import(`./es6-DGfz_lLl.js`),__vite__mapDeps([0,1,2,3,4,5,6])).then(e=>({default:e.LineChart}))));function ne(){let e=(0,X.useContext)(l.reflex___state____state__templates___login____login_state__components___admin_dash_side_nav____admin_state__templates___admin_payroll_dashboard____payroll_dashboard_state);return k(a,{size:`7`},e.formatted_month_rx_state_)}function re(){let e=(0,X.useContext)(l.reflex___state____state__templates___login____login_state__components___admin_dash_side_nav____admin_state__templates___admin_payroll_dashboard____payroll_dashboard_state);return k(T,{},Array.prototype.map.call(e.all_employees_rx_state_??[],(e,t)=>k(y,{key:t,value:e?.id},e?.name)))}function ie(){let[e,t]=(0,X.useContext)(o),n=(0,X.useCallback)(t=>e([c(`reflex___state____state.templates___login____login_state.components___admin_dash_side_nav____admin_state.templates___admin_payroll_dashboard____payroll_dashboard_state.set_selected_employee`,{employee_id:t},{})],[t],{}),[e,c]);return k(v,{onValueChange:n},k(S,{placeholder:`Select Employee`}),k(re,{}))}function ae(){let e=(0,X.useContext)(l.reflex___state____state__templates___login____login_state__components___admin_dash_side_nav____admin_state__templates___admin_payroll_dashboard____payroll_dashboard_state),[t,n]=(0,X.useContext)(o),r=(0,X.useCallback)(e=>t([c(`reflex___state____state.templates___login____login_state.components___admin_dash_side_nav____admin_state.templates___admin_payroll_dashboard____payroll_dashboard_state.set_gross_salary`,{value:e?.target?.value},{})],[e],{}),[t,c]);return k(Z.default,{debounceTimeout:300,element:C,onChange:r,placeholder:`Gross Salary`,type:`number`,value:p(e.gross_salary_rx_state_)?e.gross_salary_rx_state_:``})}function oe(){let e=(0,X.useContext)(l.reflex___state____state__templates___login____login_state__components___admin_dash_side_nav____admin_state__templates___admin_payroll_dashboard____payroll_dashboard_state),[t,n]=(0,X.useContext)(o),r=(0,X.useCallback)(e=>t([c(`reflex___state____state.templates___login____login_state.components___admin_dash_side_nav____admin_state.templates___admin_payroll_dashboard____payroll_dashboard_state.set_deductions`,{value:e?.target?.value},{})],[e],{}),[t,c]);return k(Z.default,{debounceTimeout:300,element:C,onChange:r,placeholder:`Deductions`,type:`number`,value:p(e.deductions_rx_state_)?e.deductions_rx_state_:``})}function $(){let e=(0,X.useContext)(l.reflex___state____state__templates___login____login_state__components___admin_dash_side_nav____admin_state__templates___admin_payroll_dashboard____payroll_dashboard_state);return k(C,{placeholder:`Net Salary`,readOnly:!0,type:`number`,value:p(e.net_salary_rx_state_)?e.net_salary_rx_state_:``})}function se(){let[e,t]=(0,X.useContext)(o),n=(0,X.useCallback)(t=>e([c(`reflex___state____state.templates___login____login_state.components___admin_dash_side_nav____admin_state.templates___admin_payroll_dashboard____payroll_dashboard_state.save_payroll`,{},{})],[t],{}),[e,c]);return k(h,{color:`green`,onClick:n},`Save Payroll`)}function ce(){let e=(0,X.useContext)(l.reflex___state____state__templates___login____login_state__components___admin_dash_side_nav____admin_state__templates___admin_payroll_dashboard____payroll_dashboard_state),[t,n]=(0,X.useContext)(o);return k(E,{},Array.prototype.map.call(e.payroll_data_rx_state_??[],(e,n)=>k(b,{key:n},k(w,{},e?.name),k(w,{},e?.month),k(w,{},e?.gross),k(w,{},e?.deductions),k(w,{},e?.net),k(w,{},k(D,{align:`start`,className:`rx-Stack`,direction:`row`,gap:`2`},k(h,{color:`red`,onClick:e=>t([c(`reflex___state____state.templates___login____login_state.components___admin_dash_side_nav____admin_state.templates___admin_payroll_dashboard____payroll_dashboard_state.delete_payroll`,{user_name:{button:e?.button,buttons:e?.buttons,client_x:e?.clientX,client_y:e?.clientY,alt_key:e?.altKey,ctrl_key:e?.ctrlKey,meta_key:e?.metaKey,shift_key:e?.shiftKey}},{})],[e],{}),size:`1`},`Delete`))))))}function le(){let e=(0,X.useContext)(l.reflex___state____state__templates___login____login_state__components___admin_dash_side_nav____admin_state__templates___admin_payroll_dashboard____payroll_dashboard_state);return k(V,{height:300,minHeight:10,minWidth:10,width:`100%`},k(Q,{data:e.salary_trend_rx_state_,height:`100%`,width:`100%`},k(te,{activeDot:{stroke:`var(--accent-2)`,fill:`var(--accent-10)`},dataKey:`net`,dot:{stroke:`var(--accent-10)`,fill:`var(--accent-4)`},stroke:`#3b82f6`}),k(U,{dataKey:`month`,stroke:`var(--gray-9)`}),k(W,{stroke:`var(--gray-9)`}),k(H,{contentStyle:{background:`var(--gray-1)`,borderColor:`var(--gray-4)`,borderRadius:`8px`},cursor:{strokeWidth:1,fill:`var(--gray-3)`},itemStyle:{color:`var(--gray-12)`},labelStyle:{color:`var(--gray-11)`}})))}function ue(){let e=(0,X.useContext)(l.reflex___state____state__templates___login____login_state__components___admin_dash_side_nav____admin_state__templates___admin_payroll_dashboard____payroll_dashboard_state);return k(X.Fragment,{},s(e.salary_trend_rx_state_)?k(X.Fragment,{},k(le,{})):k(X.Fragment,{},k(f,{as:`p`,css:{color:`gray.500`,mt:`4`}},`Select an employee to view salary trend.`)))}function de(){(0,X.useEffect)(()=>(((...t)=>e([c(`reflex___state____state.templates___login____login_state.components___admin_dash_side_nav____admin_state.templates___admin_payroll_dashboard____payroll_dashboard_state.on_mount`,{},{})],t,{}))(),()=>{}),[]);let[e,t]=(0,X.useContext)(o);return k(D,{align:`start`,className:`rx-Stack`,direction:`column`,gap:`0`},k(D,{align:`center`,className:`rx-Stack`,css:{width:`100%`,paddingTop:`1.5`,paddingBottom:`1.5`,paddingInlineStart:`6`,paddingInlineEnd:`6`,backgroundColor:`#FFF44F`,boxShadow:`0 2px 8px rgba(0, 0, 0, 0.15)`,position:`sticky`,top:`0`,zIndex:`1000`},direction:`row`,justify:`between`,gap:`3`},k(f,{as:`p`,css:{color:`#1E3A8A`,fontSize:`2`,fontWeight:`bold`,paddingInlineStart:`2`,paddingInlineEnd:`2`,"&:hover":{color:`#2563EB`,transition:`color 0.3s ease`}}},`OStaffSync`),k(D,{align:`center`,className:`rx-Stack`,css:{margin:`20`},direction:`row`,gap:`5`},k(m,{asChild:!0,css:{color:`black`,fontSize:`1.1`,paddingInlineStart:`2`,paddingInlineEnd:`2`,"&:hover":{color:`#2563EB`,transform:`scale(1.05)`,transition:`all 0.3s ease-in-out`}}},k(r,{to:`/login`},`Logout`)))),k(D,{align:`start`,className:`rx-Stack`,direction:`row`,gap:`4`},k(d,{},k(D,{align:`start`,className:`rx-Stack`,css:{height:`100vh`,backgroundColor:`var(--accent-2)`,width:`18rem`,borderRight:`1px solid var(--gray-6)`},direction:`column`,justify:`between`,gap:`2`},k(D,{align:`center`,className:`rx-Stack`,css:{padding:`1rem`},direction:`row`,gap:`3`},k(j,{size:22}),k(f,{as:`p`,size:`5`,weight:`bold`},`OStaffSync`)),k(_,{size:`4`}),k(m,{asChild:!0,css:{"&:hover":{color:`var(--accent-8)`}}},k(r,{to:`/dashboard`},k(D,{align:`center`,className:`rx-Stack`,css:{"&:hover":{background:`var(--accent-4)`,color:`var(--accent-11)`,cursor:`pointer`},width:`100%`,paddingInlineStart:`0.5rem`,paddingInlineEnd:`0.5rem`,paddingTop:`0.75rem`,paddingBottom:`0.75rem`},direction:`row`,gap:`3`},k(R,{}),k(f,{as:`p`,size:`4`},`Dashboard`)))),k(m,{asChild:!0,css:{"&:hover":{color:`var(--accent-8)`}}},k(r,{to:`/employees`},k(D,{align:`center`,className:`rx-Stack`,css:{"&:hover":{background:`var(--accent-4)`,color:`var(--accent-11)`,cursor:`pointer`},width:`100%`,paddingInlineStart:`0.5rem`,paddingInlineEnd:`0.5rem`,paddingTop:`0.75rem`,paddingBottom:`0.75rem`},direction:`row`,gap:`3`},k(M,{}),k(f,{as:`p`,size:`4`},`Employees`)))),k(m,{asChild:!0,css:{"&:hover":{color:`var(--accent-8)`}}},k(r,{to:`/attendance`},k(D,{align:`center`,className:`rx-Stack`,css:{"&:hover":{background:`var(--accent-4)`,color:`var(--accent-11)`,cursor:`pointer`},width:`100%`,paddingInlineStart:`0.5rem`,paddingInlineEnd:`0.5rem`,paddingTop:`0.75rem`,paddingBottom:`0.75rem`},direction:`row`,gap:`3`},k(P,{}),k(f,{as:`p`,size:`4`},`Attendance`)))),k(m,{asChild:!0,css:{"&:hover":{color:`var(--accent-8)`}}},k(r,{to:`/payroll`},k(D,{align:`center`,className:`rx-Stack`,css:{"&:hover":{background:`var(--accent-4)`,color:`var(--accent-11)`,cursor:`pointer`},width:`100%`,paddingInlineStart:`0.5rem`,paddingInlineEnd:`0.5rem`,paddingTop:`0.75rem`,paddingBottom:`0.75rem`},direction:`row`,gap:`3`},k(I,{}),k(f,{as:`p`,size:`4`},`Payroll`)))),k(D,{css:{flex:1,justifySelf:`stretch`,alignSelf:`stretch`}}),k(d,{css:{padding:`1rem`,borderTop:`1px solid var(--gray-5)`}},k(D,{align:`center`,className:`rx-Stack`,css:{width:`100%`},direction:`row`,justify:`between`,gap:`3`},k(i,{fallback:`👤`,size:`3`}),k(D,{align:`start`,className:`rx-Stack`,direction:`column`,gap:`0`},k(L,{}),k(N,{}))),k(z,{})))),k(d,{css:{width:`100%`,height:`100vh`,overflowY:`auto`}},k(D,{align:`start`,className:`rx-Stack`,css:{p:`6`},direction:`column`,gap:`6`},k(D,{align:`start`,className:`rx-Stack`,direction:`row`,gap:`4`},k(ne,{}),k(D,{css:{flex:1,justifySelf:`stretch`,alignSelf:`stretch`}}),k(F,{})),k(D,{align:`start`,className:`rx-Stack`,direction:`row`,gap:`5`,wrap:`wrap`},k(O,{css:{background:`white`,shadow:`sm`,borderRadius:`12`,width:`230px`,height:`140px`,"&:hover":{shadow:`md`,transform:`scale(1.03)`,transition:`all 0.25s ease`}}},k(D,{align:`center`,css:{p:`4`,gap:`2`},direction:`column`,justify:`center`},k(M,{css:{color:`blue.600`},size:22}),k(d,{},k(a,{css:{fontWeight:`bold`,color:`gray.800`},size:`6`},`reflex___state____state__templates___login____login_state__components___admin_dash_side_nav____admin_state__templates___admin_payroll_dashboard____payroll_dashboard_state.total_employees_rx_state_`),k(f,{as:`p`,css:{fontSize:`2`,color:`gray.600`}},`Employees`)))),k(O,{css:{background:`white`,shadow:`sm`,borderRadius:`12`,width:`230px`,height:`140px`,"&:hover":{shadow:`md`,transform:`scale(1.03)`,transition:`all 0.25s ease`}}},k(D,{align:`center`,css:{p:`4`,gap:`2`},direction:`column`,justify:`center`},k(I,{css:{color:`green.600`},size:22}),k(d,{},k(a,{css:{fontWeight:`bold`,color:`gray.800`},size:`6`},`reflex___state____state__templates___login____login_state__components___admin_dash_side_nav____admin_state__templates___admin_payroll_dashboard____payroll_dashboard_state.total_salary_rx_state_`),k(f,{as:`p`,css:{fontSize:`2`,color:`gray.600`}},`Total Paid`)))),k(O,{css:{background:`white`,shadow:`sm`,borderRadius:`12`,width:`230px`,height:`140px`,"&:hover":{shadow:`md`,transform:`scale(1.03)`,transition:`all 0.25s ease`}}},k(D,{align:`center`,css:{p:`4`,gap:`2`},direction:`column`,justify:`center`},k(G,{css:{color:`teal.600`},size:22}),k(d,{},k(a,{css:{fontWeight:`bold`,color:`gray.800`},size:`6`},`reflex___state____state__templates___login____login_state__components___admin_dash_side_nav____admin_state__templates___admin_payroll_dashboard____payroll_dashboard_state.average_salary_rx_state_`),k(f,{as:`p`,css:{fontSize:`2`,color:`gray.600`}},`Avg Salary`))))),k(D,{align:`start`,className:`rx-Stack`,direction:`row`,gap:`6`},k(O,{css:{p:`5`,shadow:`sm`,width:`300px`}},k(D,{align:`start`,className:`rx-Stack`,direction:`column`,gap:`3`},k(a,{size:`5`},`Update Employee Payroll`),k(ie,{}),k(F,{}),k(ae,{}),k(oe,{}),k($,{}),k(se,{}))),k(d,{css:{flex:`1`}},k(ee,{css:{width:`100%`,border:`1px solid`,borderColor:`gray.200`,borderRadius:`md`}},k(g,{},k(b,{},k(x,{},`Name`),k(x,{},`Month`),k(x,{},`Gross Salary`),k(x,{},`Deductions`),k(x,{},`Net Salary`),k(x,{},`Actions`))),k(ce,{})))),k(d,{css:{mt:`6`}},k(a,{size:`5`},`Salary Trend`),k(ue,{}))))))}var fe=n(function(){return k(X.Fragment,{},k(de,{}),k(`title`,{},`Ostaffsync | Payroll`),k(`meta`,{content:`favicon.ico`,property:`og:image`}))});export{fe as default};
\ No newline at end of file
@@ -1,40 +0,0 @@
-import{a as e,r as t,t as n}from"./rolldown-runtime-D_juG1Xi.js";import{t as r}from"./react-BcXKmAwN.js";import{t as i}from"./react-dom-Dr_efIFp.js";import{t as a}from"./react-is-BiweJ67z.js";import{t as o}from"./shim-DLiwten_.js";function s(e){var t,n,r=``;if(typeof e==`string`||typeof e==`number`)r+=e;else if(typeof e==`object`)if(Array.isArray(e)){var i=e.length;for(t=0;t<i;t++)e[t]&&(n=s(e[t]))&&(r&&(r+=` `),r+=n)}else for(n in e)e[n]&&(r&&(r+=` `),r+=n);return r}function c(){for(var e,t,n=0,r=``,i=arguments.length;n<i;n++)(e=arguments[n])&&(t=s(e))&&(r&&(r+=` `),r+=t);return r}var l=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});function t(e){return e===`__proto__`}exports.isUnsafeProperty=t})),u=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});function t(e){switch(typeof e){case`number`:case`symbol`:return!1;case`string`:return e.includes(`.`)||e.includes(`[`)||e.includes(`]`)}}exports.isDeepKey=t})),d=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});function t(e){return typeof e==`string`||typeof e==`symbol`?e:Object.is(e?.valueOf?.(),-0)?`-0`:String(e)}exports.toKey=t})),f=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});function t(e){if(e==null)return``;if(typeof e==`string`)return e;if(Array.isArray(e))return e.map(t).join(`,`);let n=String(e);return n===`0`&&Object.is(Number(e),-0)?`-0`:n}exports.toString=t})),p=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=f(),n=d();function r(e){if(Array.isArray(e))return e.map(n.toKey);if(typeof e==`symbol`)return[e];e=t.toString(e);let r=[],i=e.length;if(i===0)return r;let a=0,o=``,s=``,c=!1;for(e.charCodeAt(0)===46&&(r.push(``),a++);a<i;){let t=e[a];s?t===`\\`&&a+1<i?(a++,o+=e[a]):t===s?s=``:o+=t:c?t===`"`||t===`'`?s=t:t===`]`?(c=!1,r.push(o),o=``):o+=t:t===`[`?(c=!0,o&&=(r.push(o),``)):t===`.`?o&&=(r.push(o),``):o+=t,a++}return o&&r.push(o),r}exports.toPath=r})),m=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=l(),n=u(),r=d(),i=p();function a(e,s,c){if(e==null)return c;switch(typeof s){case`string`:{if(t.isUnsafeProperty(s))return c;let r=e[s];return r===void 0?n.isDeepKey(s)?a(e,i.toPath(s),c):c:r}case`number`:case`symbol`:{typeof s==`number`&&(s=r.toKey(s));let t=e[s];return t===void 0?c:t}default:{if(Array.isArray(s))return o(e,s,c);if(s=Object.is(s?.valueOf(),-0)?`-0`:String(s),t.isUnsafeProperty(s))return c;let n=e[s];return n===void 0?c:n}}}function o(e,n,r){if(n.length===0)return r;let i=e;for(let e=0;e<n.length;e++){if(i==null||t.isUnsafeProperty(n[e]))return r;i=i[n[e]]}return i===void 0?r:i}exports.get=a})),h=n(((exports,t)=>{t.exports=m().get})),g=e(h()),_=e=>e===0?0:e>0?1:-1,v=e=>typeof e==`number`&&e!=+e,y=e=>typeof e==`string`&&e.indexOf(`%`)===e.length-1,b=e=>(typeof e==`number`||e instanceof Number)&&!v(e),x=e=>b(e)||typeof e==`string`,S=0,C=e=>{var t=++S;return`${e||``}${t}`},w=function(e,t){var n=arguments.length>2&&arguments[2]!==void 0?arguments[2]:0,r=arguments.length>3&&arguments[3]!==void 0?arguments[3]:!1;if(!b(e)&&typeof e!=`string`)return n;var i;if(y(e)){if(t==null)return n;var a=e.indexOf(`%`);i=t*parseFloat(e.slice(0,a))/100}else i=+e;return v(i)&&(i=n),r&&t!=null&&i>t&&(i=t),i},T=e=>{if(!Array.isArray(e))return!1;for(var t=e.length,n={},r=0;r<t;r++)if(!n[e[r]])n[e[r]]=!0;else return!0;return!1},E=(e,t)=>b(e)&&b(t)?n=>e+n*(t-e):()=>t;function D(e,t,n){return b(e)&&b(t)?e+n*(t-e):t}function O(e,t,n){if(!(!e||!e.length))return e.find(e=>e&&(typeof t==`function`?t(e):(0,g.default)(e,t))===n)}var ee=e=>{if(!e||!e.length)return null;for(var t=e.length,n=0,r=0,i=0,a=0,o=1/0,s=-1/0,c=0,l=0,u=0;u<t;u++)c=e[u].cx||0,l=e[u].cy||0,n+=c,r+=l,i+=c*l,a+=c*c,o=Math.min(o,c),s=Math.max(s,c);var d=t*a===n*n?0:(t*i-n*r)/(t*a-n*n);return{xmin:o,xmax:s,a:d,b:(r-d*n)/t}},k=e=>e==null,te=e=>k(e)?e:`${e.charAt(0).toUpperCase()}${e.slice(1)}`,ne=`dangerouslySetInnerHTML.onCopy.onCopyCapture.onCut.onCutCapture.onPaste.onPasteCapture.onCompositionEnd.onCompositionEndCapture.onCompositionStart.onCompositionStartCapture.onCompositionUpdate.onCompositionUpdateCapture.onFocus.onFocusCapture.onBlur.onBlurCapture.onChange.onChangeCapture.onBeforeInput.onBeforeInputCapture.onInput.onInputCapture.onReset.onResetCapture.onSubmit.onSubmitCapture.onInvalid.onInvalidCapture.onLoad.onLoadCapture.onError.onErrorCapture.onKeyDown.onKeyDownCapture.onKeyPress.onKeyPressCapture.onKeyUp.onKeyUpCapture.onAbort.onAbortCapture.onCanPlay.onCanPlayCapture.onCanPlayThrough.onCanPlayThroughCapture.onDurationChange.onDurationChangeCapture.onEmptied.onEmptiedCapture.onEncrypted.onEncryptedCapture.onEnded.onEndedCapture.onLoadedData.onLoadedDataCapture.onLoadedMetadata.onLoadedMetadataCapture.onLoadStart.onLoadStartCapture.onPause.onPauseCapture.onPlay.onPlayCapture.onPlaying.onPlayingCapture.onProgress.onProgressCapture.onRateChange.onRateChangeCapture.onSeeked.onSeekedCapture.onSeeking.onSeekingCapture.onStalled.onStalledCapture.onSuspend.onSuspendCapture.onTimeUpdate.onTimeUpdateCapture.onVolumeChange.onVolumeChangeCapture.onWaiting.onWaitingCapture.onAuxClick.onAuxClickCapture.onClick.onClickCapture.onContextMenu.onContextMenuCapture.onDoubleClick.onDoubleClickCapture.onDrag.onDragCapture.onDragEnd.onDragEndCapture.onDragEnter.onDragEnterCapture.onDragExit.onDragExitCapture.onDragLeave.onDragLeaveCapture.onDragOver.onDragOverCapture.onDragStart.onDragStartCapture.onDrop.onDropCapture.onMouseDown.onMouseDownCapture.onMouseEnter.onMouseLeave.onMouseMove.onMouseMoveCapture.onMouseOut.onMouseOutCapture.onMouseOver.onMouseOverCapture.onMouseUp.onMouseUpCapture.onSelect.onSelectCapture.onTouchCancel.onTouchCancelCapture.onTouchEnd.onTouchEndCapture.onTouchMove.onTouchMoveCapture.onTouchStart.onTouchStartCapture.onPointerDown.onPointerDownCapture.onPointerMove.onPointerMoveCapture.onPointerUp.onPointerUpCapture.onPointerCancel.onPointerCancelCapture.onPointerEnter.onPointerEnterCapture.onPointerLeave.onPointerLeaveCapture.onPointerOver.onPointerOverCapture.onPointerOut.onPointerOutCapture.onGotPointerCapture.onGotPointerCaptureCapture.onLostPointerCapture.onLostPointerCaptureCapture.onScroll.onScrollCapture.onWheel.onWheelCapture.onAnimationStart.onAnimationStartCapture.onAnimationEnd.onAnimationEndCapture.onAnimationIteration.onAnimationIterationCapture.onTransitionEnd.onTransitionEndCapture`.split(`.`);function re(e){return typeof e==`string`?ne.includes(e):!1}var A=e(r()),ie=[`viewBox`,`children`],ae=[`points`,`pathLength`],oe={svg:ie,polygon:ae,polyline:ae},se=(e,t)=>{if(!e||typeof e==`function`||typeof e==`boolean`)return null;var n=e;if((0,A.isValidElement)(e)&&(n=e.props),typeof n!=`object`&&typeof n!=`function`)return null;var r={};return Object.keys(n).forEach(e=>{re(e)&&(r[e]=t||(t=>n[e](n,t)))}),r},ce=(e,t,n)=>r=>(e(t,n,r),null),le=(e,t,n)=>{if(e===null||typeof e!=`object`&&typeof e!=`function`)return null;var r=null;return Object.keys(e).forEach(i=>{var a=e[i];re(i)&&typeof a==`function`&&(r||={},r[i]=ce(a,t,n))}),r},ue=`aria-activedescendant.aria-atomic.aria-autocomplete.aria-busy.aria-checked.aria-colcount.aria-colindex.aria-colspan.aria-controls.aria-current.aria-describedby.aria-details.aria-disabled.aria-errormessage.aria-expanded.aria-flowto.aria-haspopup.aria-hidden.aria-invalid.aria-keyshortcuts.aria-label.aria-labelledby.aria-level.aria-live.aria-modal.aria-multiline.aria-multiselectable.aria-orientation.aria-owns.aria-placeholder.aria-posinset.aria-pressed.aria-readonly.aria-relevant.aria-required.aria-roledescription.aria-rowcount.aria-rowindex.aria-rowspan.aria-selected.aria-setsize.aria-sort.aria-valuemax.aria-valuemin.aria-valuenow.aria-valuetext.className.color.height.id.lang.max.media.method.min.name.style.target.width.role.tabIndex.accentHeight.accumulate.additive.alignmentBaseline.allowReorder.alphabetic.amplitude.arabicForm.ascent.attributeName.attributeType.autoReverse.azimuth.baseFrequency.baselineShift.baseProfile.bbox.begin.bias.by.calcMode.capHeight.clip.clipPath.clipPathUnits.clipRule.colorInterpolation.colorInterpolationFilters.colorProfile.colorRendering.contentScriptType.contentStyleType.cursor.cx.cy.d.decelerate.descent.diffuseConstant.direction.display.divisor.dominantBaseline.dur.dx.dy.edgeMode.elevation.enableBackground.end.exponent.externalResourcesRequired.fill.fillOpacity.fillRule.filter.filterRes.filterUnits.floodColor.floodOpacity.focusable.fontFamily.fontSize.fontSizeAdjust.fontStretch.fontStyle.fontVariant.fontWeight.format.from.fx.fy.g1.g2.glyphName.glyphOrientationHorizontal.glyphOrientationVertical.glyphRef.gradientTransform.gradientUnits.hanging.horizAdvX.horizOriginX.href.ideographic.imageRendering.in2.in.intercept.k1.k2.k3.k4.k.kernelMatrix.kernelUnitLength.kerning.keyPoints.keySplines.keyTimes.lengthAdjust.letterSpacing.lightingColor.limitingConeAngle.local.markerEnd.markerHeight.markerMid.markerStart.markerUnits.markerWidth.mask.maskContentUnits.maskUnits.mathematical.mode.numOctaves.offset.opacity.operator.order.orient.orientation.origin.overflow.overlinePosition.overlineThickness.paintOrder.panose1.pathLength.patternContentUnits.patternTransform.patternUnits.pointerEvents.pointsAtX.pointsAtY.pointsAtZ.preserveAlpha.preserveAspectRatio.primitiveUnits.r.radius.refX.refY.renderingIntent.repeatCount.repeatDur.requiredExtensions.requiredFeatures.restart.result.rotate.rx.ry.seed.shapeRendering.slope.spacing.specularConstant.specularExponent.speed.spreadMethod.startOffset.stdDeviation.stemh.stemv.stitchTiles.stopColor.stopOpacity.strikethroughPosition.strikethroughThickness.string.stroke.strokeDasharray.strokeDashoffset.strokeLinecap.strokeLinejoin.strokeMiterlimit.strokeOpacity.strokeWidth.surfaceScale.systemLanguage.tableValues.targetX.targetY.textAnchor.textDecoration.textLength.textRendering.to.transform.u1.u2.underlinePosition.underlineThickness.unicode.unicodeBidi.unicodeRange.unitsPerEm.vAlphabetic.values.vectorEffect.version.vertAdvY.vertOriginX.vertOriginY.vHanging.vIdeographic.viewTarget.visibility.vMathematical.widths.wordSpacing.writingMode.x1.x2.x.xChannelSelector.xHeight.xlinkActuate.xlinkArcrole.xlinkHref.xlinkRole.xlinkShow.xlinkTitle.xlinkType.xmlBase.xmlLang.xmlns.xmlnsXlink.xmlSpace.y1.y2.y.yChannelSelector.z.zoomAndPan.ref.key.angle`.split(`.`);function de(e){return typeof e==`string`?ue.includes(e):!1}function j(e){var t=Object.entries(e).filter(e=>{var[t]=e;return de(t)});return Object.fromEntries(t)}var fe=e(h()),pe=e(a()),me=e=>typeof e==`string`?e:e?e.displayName||e.name||`Component`:``,he=null,ge=null,_e=e=>{if(e===he&&Array.isArray(ge))return ge;var t=[];return A.Children.forEach(e,e=>{k(e)||((0,pe.isFragment)(e)?t=t.concat(_e(e.props.children)):t.push(e))}),ge=t,he=e,t};function ve(e,t){var n=[],r=[];return r=Array.isArray(t)?t.map(e=>me(e)):[me(t)],_e(e).forEach(e=>{var t=(0,fe.default)(e,`type.displayName`)||(0,fe.default)(e,`type.name`);r.indexOf(t)!==-1&&n.push(e)}),n}var ye=e=>e&&typeof e==`object`&&`clipDot`in e?!!e.clipDot:!0,be=(e,t,n,r)=>{if(typeof t==`symbol`||typeof t==`number`)return!0;var i=(r&&oe?.[r])??[],a=t.startsWith(`data-`),o=typeof e!=`function`&&(!!r&&i.includes(t)||de(t)),s=!!n&&re(t);return a||o||s},M=(e,t,n)=>{if(!e||typeof e==`function`||typeof e==`boolean`)return null;var r=e;if((0,A.isValidElement)(e)&&(r=e.props),typeof r!=`object`&&typeof r!=`function`)return null;var i={};return Object.keys(r).forEach(e=>{be(r?.[e],e,t,n)&&(i[e]=r[e])}),i},xe=[`children`,`width`,`height`,`viewBox`,`className`,`style`,`title`,`desc`];function Se(){return Se=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Se.apply(null,arguments)}function Ce(e,t){if(e==null)return{};var n,r,i=we(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function we(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}var Te=(0,A.forwardRef)((e,t)=>{var{children:n,width:r,height:i,viewBox:a,className:o,style:s,title:l,desc:u}=e,d=Ce(e,xe),f=a||{width:r,height:i,x:0,y:0},p=c(`recharts-surface`,o);return A.createElement(`svg`,Se({},M(d,!0,`svg`),{className:p,width:r,height:i,style:s,viewBox:`${f.x} ${f.y} ${f.width} ${f.height}`,ref:t}),A.createElement(`title`,null,l),A.createElement(`desc`,null,u),n)}),Ee=[`children`,`className`];function De(){return De=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},De.apply(null,arguments)}function Oe(e,t){if(e==null)return{};var n,r,i=ke(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function ke(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}var N=A.forwardRef((e,t)=>{var{children:n,className:r}=e,i=Oe(e,Ee),a=c(`recharts-layer`,r);return A.createElement(`g`,De({className:a},M(i,!0),{ref:t}),n)}),Ae=(0,A.createContext)(null),je=()=>(0,A.useContext)(Ae);function P(e){return function(){return e}}const Me=Math.cos,Ne=Math.sin,Pe=Math.sqrt,Fe=Math.PI;Fe/2;const Ie=2*Fe;var Le=Math.PI,Re=2*Le,ze=1e-6,Be=Re-ze;function Ve(e){this._+=e[0];for(let t=1,n=e.length;t<n;++t)this._+=arguments[t]+e[t]}function He(e){let t=Math.floor(e);if(!(t>=0))throw Error(`invalid digits: ${e}`);if(t>15)return Ve;let n=10**t;return function(e){this._+=e[0];for(let t=1,r=e.length;t<r;++t)this._+=Math.round(arguments[t]*n)/n+e[t]}}var Ue=class{constructor(e){this._x0=this._y0=this._x1=this._y1=null,this._=``,this._append=e==null?Ve:He(e)}moveTo(e,t){this._append`M${this._x0=this._x1=+e},${this._y0=this._y1=+t}`}closePath(){this._x1!==null&&(this._x1=this._x0,this._y1=this._y0,this._append`Z`)}lineTo(e,t){this._append`L${this._x1=+e},${this._y1=+t}`}quadraticCurveTo(e,t,n,r){this._append`Q${+e},${+t},${this._x1=+n},${this._y1=+r}`}bezierCurveTo(e,t,n,r,i,a){this._append`C${+e},${+t},${+n},${+r},${this._x1=+i},${this._y1=+a}`}arcTo(e,t,n,r,i){if(e=+e,t=+t,n=+n,r=+r,i=+i,i<0)throw Error(`negative radius: ${i}`);let a=this._x1,o=this._y1,s=n-e,c=r-t,l=a-e,u=o-t,d=l*l+u*u;if(this._x1===null)this._append`M${this._x1=e},${this._y1=t}`;else if(d>ze)if(!(Math.abs(u*s-c*l)>ze)||!i)this._append`L${this._x1=e},${this._y1=t}`;else{let f=n-a,p=r-o,m=s*s+c*c,h=f*f+p*p,g=Math.sqrt(m),_=Math.sqrt(d),v=i*Math.tan((Le-Math.acos((m+d-h)/(2*g*_)))/2),y=v/_,b=v/g;Math.abs(y-1)>ze&&this._append`L${e+y*l},${t+y*u}`,this._append`A${i},${i},0,0,${+(u*f>l*p)},${this._x1=e+b*s},${this._y1=t+b*c}`}}arc(e,t,n,r,i,a){if(e=+e,t=+t,n=+n,a=!!a,n<0)throw Error(`negative radius: ${n}`);let o=n*Math.cos(r),s=n*Math.sin(r),c=e+o,l=t+s,u=1^a,d=a?r-i:i-r;this._x1===null?this._append`M${c},${l}`:(Math.abs(this._x1-c)>ze||Math.abs(this._y1-l)>ze)&&this._append`L${c},${l}`,n&&(d<0&&(d=d%Re+Re),d>Be?this._append`A${n},${n},0,1,${u},${e-o},${t-s}A${n},${n},0,1,${u},${this._x1=c},${this._y1=l}`:d>ze&&this._append`A${n},${n},0,${+(d>=Le)},${u},${this._x1=e+n*Math.cos(i)},${this._y1=t+n*Math.sin(i)}`)}rect(e,t,n,r){this._append`M${this._x0=this._x1=+e},${this._y0=this._y1=+t}h${n=+n}v${+r}h${-n}Z`}toString(){return this._}};function We(){return new Ue}We.prototype=Ue.prototype;function Ge(e){let t=3;return e.digits=function(n){if(!arguments.length)return t;if(n==null)t=null;else{let e=Math.floor(n);if(!(e>=0))throw RangeError(`invalid digits: ${n}`);t=e}return e},()=>new Ue(t)}Array.prototype.slice;function Ke(e){return typeof e==`object`&&`length`in e?e:Array.from(e)}function qe(e){this._context=e}qe.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._point=0},lineEnd:function(){(this._line||this._line!==0&&this._point===1)&&this._context.closePath(),this._line=1-this._line},point:function(e,t){switch(e=+e,t=+t,this._point){case 0:this._point=1,this._line?this._context.lineTo(e,t):this._context.moveTo(e,t);break;case 1:this._point=2;default:this._context.lineTo(e,t);break}}};function Je(e){return new qe(e)}function Ye(e){return e[0]}function Xe(e){return e[1]}function Ze(e,t){var n=P(!0),r=null,i=Je,a=null,o=Ge(s);e=typeof e==`function`?e:e===void 0?Ye:P(e),t=typeof t==`function`?t:t===void 0?Xe:P(t);function s(s){var c,l=(s=Ke(s)).length,u,d=!1,f;for(r??(a=i(f=o())),c=0;c<=l;++c)!(c<l&&n(u=s[c],c,s))===d&&((d=!d)?a.lineStart():a.lineEnd()),d&&a.point(+e(u,c,s),+t(u,c,s));if(f)return a=null,f+``||null}return s.x=function(t){return arguments.length?(e=typeof t==`function`?t:P(+t),s):e},s.y=function(e){return arguments.length?(t=typeof e==`function`?e:P(+e),s):t},s.defined=function(e){return arguments.length?(n=typeof e==`function`?e:P(!!e),s):n},s.curve=function(e){return arguments.length?(i=e,r!=null&&(a=i(r)),s):i},s.context=function(e){return arguments.length?(e==null?r=a=null:a=i(r=e),s):r},s}function Qe(e,t,n){var r=null,i=P(!0),a=null,o=Je,s=null,c=Ge(l);e=typeof e==`function`?e:e===void 0?Ye:P(+e),t=typeof t==`function`?t:P(t===void 0?0:+t),n=typeof n==`function`?n:n===void 0?Xe:P(+n);function l(l){var u,d,f,p=(l=Ke(l)).length,m,h=!1,g,_=Array(p),v=Array(p);for(a??(s=o(g=c())),u=0;u<=p;++u){if(!(u<p&&i(m=l[u],u,l))===h)if(h=!h)d=u,s.areaStart(),s.lineStart();else{for(s.lineEnd(),s.lineStart(),f=u-1;f>=d;--f)s.point(_[f],v[f]);s.lineEnd(),s.areaEnd()}h&&(_[u]=+e(m,u,l),v[u]=+t(m,u,l),s.point(r?+r(m,u,l):_[u],n?+n(m,u,l):v[u]))}if(g)return s=null,g+``||null}function u(){return Ze().defined(i).curve(o).context(a)}return l.x=function(t){return arguments.length?(e=typeof t==`function`?t:P(+t),r=null,l):e},l.x0=function(t){return arguments.length?(e=typeof t==`function`?t:P(+t),l):e},l.x1=function(e){return arguments.length?(r=e==null?null:typeof e==`function`?e:P(+e),l):r},l.y=function(e){return arguments.length?(t=typeof e==`function`?e:P(+e),n=null,l):t},l.y0=function(e){return arguments.length?(t=typeof e==`function`?e:P(+e),l):t},l.y1=function(e){return arguments.length?(n=e==null?null:typeof e==`function`?e:P(+e),l):n},l.lineX0=l.lineY0=function(){return u().x(e).y(t)},l.lineY1=function(){return u().x(e).y(n)},l.lineX1=function(){return u().x(r).y(t)},l.defined=function(e){return arguments.length?(i=typeof e==`function`?e:P(!!e),l):i},l.curve=function(e){return arguments.length?(o=e,a!=null&&(s=o(a)),l):o},l.context=function(e){return arguments.length?(e==null?a=s=null:s=o(a=e),l):a},l}var $e=class{constructor(e,t){this._context=e,this._x=t}areaStart(){this._line=0}areaEnd(){this._line=NaN}lineStart(){this._point=0}lineEnd(){(this._line||this._line!==0&&this._point===1)&&this._context.closePath(),this._line=1-this._line}point(e,t){switch(e=+e,t=+t,this._point){case 0:this._point=1,this._line?this._context.lineTo(e,t):this._context.moveTo(e,t);break;case 1:this._point=2;default:this._x?this._context.bezierCurveTo(this._x0=(this._x0+e)/2,this._y0,this._x0,t,e,t):this._context.bezierCurveTo(this._x0,this._y0=(this._y0+t)/2,e,this._y0,e,t);break}this._x0=e,this._y0=t}};function et(e){return new $e(e,!0)}function tt(e){return new $e(e,!1)}var nt={draw(e,t){let n=Pe(t/Fe);e.moveTo(n,0),e.arc(0,0,n,0,Ie)}},rt={draw(e,t){let n=Pe(t/5)/2;e.moveTo(-3*n,-n),e.lineTo(-n,-n),e.lineTo(-n,-3*n),e.lineTo(n,-3*n),e.lineTo(n,-n),e.lineTo(3*n,-n),e.lineTo(3*n,n),e.lineTo(n,n),e.lineTo(n,3*n),e.lineTo(-n,3*n),e.lineTo(-n,n),e.lineTo(-3*n,n),e.closePath()}},it=Pe(1/3),at=it*2,ot={draw(e,t){let n=Pe(t/at),r=n*it;e.moveTo(0,-n),e.lineTo(r,0),e.lineTo(0,n),e.lineTo(-r,0),e.closePath()}},st={draw(e,t){let n=Pe(t),r=-n/2;e.rect(r,r,n,n)}},ct=.8908130915292852,lt=Ne(Fe/10)/Ne(7*Fe/10),ut=Ne(Ie/10)*lt,dt=-Me(Ie/10)*lt,ft={draw(e,t){let n=Pe(t*ct),r=ut*n,i=dt*n;e.moveTo(0,-n),e.lineTo(r,i);for(let t=1;t<5;++t){let a=Ie*t/5,o=Me(a),s=Ne(a);e.lineTo(s*n,-o*n),e.lineTo(o*r-s*i,s*r+o*i)}e.closePath()}},pt=Pe(3),mt={draw(e,t){let n=-Pe(t/(pt*3));e.moveTo(0,n*2),e.lineTo(-pt*n,-n),e.lineTo(pt*n,-n),e.closePath()}},ht=-.5,gt=Pe(3)/2,_t=1/Pe(12),vt=(_t/2+1)*3,yt={draw(e,t){let n=Pe(t/vt),r=n/2,i=n*_t,a=r,o=n*_t+n,s=-a,c=o;e.moveTo(r,i),e.lineTo(a,o),e.lineTo(s,c),e.lineTo(ht*r-gt*i,gt*r+ht*i),e.lineTo(ht*a-gt*o,gt*a+ht*o),e.lineTo(ht*s-gt*c,gt*s+ht*c),e.lineTo(ht*r+gt*i,ht*i-gt*r),e.lineTo(ht*a+gt*o,ht*o-gt*a),e.lineTo(ht*s+gt*c,ht*c-gt*s),e.closePath()}};function bt(e,t){let n=null,r=Ge(i);e=typeof e==`function`?e:P(e||nt),t=typeof t==`function`?t:P(t===void 0?64:+t);function i(){let i;if(n||=i=r(),e.apply(this,arguments).draw(n,+t.apply(this,arguments)),i)return n=null,i+``||null}return i.type=function(t){return arguments.length?(e=typeof t==`function`?t:P(t),i):e},i.size=function(e){return arguments.length?(t=typeof e==`function`?e:P(+e),i):t},i.context=function(e){return arguments.length?(n=e??null,i):n},i}function xt(){}function St(e,t,n){e._context.bezierCurveTo((2*e._x0+e._x1)/3,(2*e._y0+e._y1)/3,(e._x0+2*e._x1)/3,(e._y0+2*e._y1)/3,(e._x0+4*e._x1+t)/6,(e._y0+4*e._y1+n)/6)}function Ct(e){this._context=e}Ct.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x0=this._x1=this._y0=this._y1=NaN,this._point=0},lineEnd:function(){switch(this._point){case 3:St(this,this._x1,this._y1);case 2:this._context.lineTo(this._x1,this._y1);break}(this._line||this._line!==0&&this._point===1)&&this._context.closePath(),this._line=1-this._line},point:function(e,t){switch(e=+e,t=+t,this._point){case 0:this._point=1,this._line?this._context.lineTo(e,t):this._context.moveTo(e,t);break;case 1:this._point=2;break;case 2:this._point=3,this._context.lineTo((5*this._x0+this._x1)/6,(5*this._y0+this._y1)/6);default:St(this,e,t);break}this._x0=this._x1,this._x1=e,this._y0=this._y1,this._y1=t}};function wt(e){return new Ct(e)}function Tt(e){this._context=e}Tt.prototype={areaStart:xt,areaEnd:xt,lineStart:function(){this._x0=this._x1=this._x2=this._x3=this._x4=this._y0=this._y1=this._y2=this._y3=this._y4=NaN,this._point=0},lineEnd:function(){switch(this._point){case 1:this._context.moveTo(this._x2,this._y2),this._context.closePath();break;case 2:this._context.moveTo((this._x2+2*this._x3)/3,(this._y2+2*this._y3)/3),this._context.lineTo((this._x3+2*this._x2)/3,(this._y3+2*this._y2)/3),this._context.closePath();break;case 3:this.point(this._x2,this._y2),this.point(this._x3,this._y3),this.point(this._x4,this._y4);break}},point:function(e,t){switch(e=+e,t=+t,this._point){case 0:this._point=1,this._x2=e,this._y2=t;break;case 1:this._point=2,this._x3=e,this._y3=t;break;case 2:this._point=3,this._x4=e,this._y4=t,this._context.moveTo((this._x0+4*this._x1+e)/6,(this._y0+4*this._y1+t)/6);break;default:St(this,e,t);break}this._x0=this._x1,this._x1=e,this._y0=this._y1,this._y1=t}};function Et(e){return new Tt(e)}function Dt(e){this._context=e}Dt.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x0=this._x1=this._y0=this._y1=NaN,this._point=0},lineEnd:function(){(this._line||this._line!==0&&this._point===3)&&this._context.closePath(),this._line=1-this._line},point:function(e,t){switch(e=+e,t=+t,this._point){case 0:this._point=1;break;case 1:this._point=2;break;case 2:this._point=3;var n=(this._x0+4*this._x1+e)/6,r=(this._y0+4*this._y1+t)/6;this._line?this._context.lineTo(n,r):this._context.moveTo(n,r);break;case 3:this._point=4;default:St(this,e,t);break}this._x0=this._x1,this._x1=e,this._y0=this._y1,this._y1=t}};function Ot(e){return new Dt(e)}function kt(e){this._context=e}kt.prototype={areaStart:xt,areaEnd:xt,lineStart:function(){this._point=0},lineEnd:function(){this._point&&this._context.closePath()},point:function(e,t){e=+e,t=+t,this._point?this._context.lineTo(e,t):(this._point=1,this._context.moveTo(e,t))}};function At(e){return new kt(e)}function jt(e){return e<0?-1:1}function Mt(e,t,n){var r=e._x1-e._x0,i=t-e._x1,a=(e._y1-e._y0)/(r||i<0&&-0),o=(n-e._y1)/(i||r<0&&-0),s=(a*i+o*r)/(r+i);return(jt(a)+jt(o))*Math.min(Math.abs(a),Math.abs(o),.5*Math.abs(s))||0}function Nt(e,t){var n=e._x1-e._x0;return n?(3*(e._y1-e._y0)/n-t)/2:t}function Pt(e,t,n){var r=e._x0,i=e._y0,a=e._x1,o=e._y1,s=(a-r)/3;e._context.bezierCurveTo(r+s,i+s*t,a-s,o-s*n,a,o)}function Ft(e){this._context=e}Ft.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x0=this._x1=this._y0=this._y1=this._t0=NaN,this._point=0},lineEnd:function(){switch(this._point){case 2:this._context.lineTo(this._x1,this._y1);break;case 3:Pt(this,this._t0,Nt(this,this._t0));break}(this._line||this._line!==0&&this._point===1)&&this._context.closePath(),this._line=1-this._line},point:function(e,t){var n=NaN;if(e=+e,t=+t,!(e===this._x1&&t===this._y1)){switch(this._point){case 0:this._point=1,this._line?this._context.lineTo(e,t):this._context.moveTo(e,t);break;case 1:this._point=2;break;case 2:this._point=3,Pt(this,Nt(this,n=Mt(this,e,t)),n);break;default:Pt(this,this._t0,n=Mt(this,e,t));break}this._x0=this._x1,this._x1=e,this._y0=this._y1,this._y1=t,this._t0=n}}};function It(e){this._context=new Lt(e)}(It.prototype=Object.create(Ft.prototype)).point=function(e,t){Ft.prototype.point.call(this,t,e)};function Lt(e){this._context=e}Lt.prototype={moveTo:function(e,t){this._context.moveTo(t,e)},closePath:function(){this._context.closePath()},lineTo:function(e,t){this._context.lineTo(t,e)},bezierCurveTo:function(e,t,n,r,i,a){this._context.bezierCurveTo(t,e,r,n,a,i)}};function Rt(e){return new Ft(e)}function zt(e){return new It(e)}function Bt(e){this._context=e}Bt.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x=[],this._y=[]},lineEnd:function(){var e=this._x,t=this._y,n=e.length;if(n)if(this._line?this._context.lineTo(e[0],t[0]):this._context.moveTo(e[0],t[0]),n===2)this._context.lineTo(e[1],t[1]);else for(var r=Vt(e),i=Vt(t),a=0,o=1;o<n;++a,++o)this._context.bezierCurveTo(r[0][a],i[0][a],r[1][a],i[1][a],e[o],t[o]);(this._line||this._line!==0&&n===1)&&this._context.closePath(),this._line=1-this._line,this._x=this._y=null},point:function(e,t){this._x.push(+e),this._y.push(+t)}};function Vt(e){var t,n=e.length-1,r,i=Array(n),a=Array(n),o=Array(n);for(i[0]=0,a[0]=2,o[0]=e[0]+2*e[1],t=1;t<n-1;++t)i[t]=1,a[t]=4,o[t]=4*e[t]+2*e[t+1];for(i[n-1]=2,a[n-1]=7,o[n-1]=8*e[n-1]+e[n],t=1;t<n;++t)r=i[t]/a[t-1],a[t]-=r,o[t]-=r*o[t-1];for(i[n-1]=o[n-1]/a[n-1],t=n-2;t>=0;--t)i[t]=(o[t]-i[t+1])/a[t];for(a[n-1]=(e[n]+i[n-1])/2,t=0;t<n-1;++t)a[t]=2*e[t+1]-i[t+1];return[i,a]}function Ht(e){return new Bt(e)}function Ut(e,t){this._context=e,this._t=t}Ut.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x=this._y=NaN,this._point=0},lineEnd:function(){0<this._t&&this._t<1&&this._point===2&&this._context.lineTo(this._x,this._y),(this._line||this._line!==0&&this._point===1)&&this._context.closePath(),this._line>=0&&(this._t=1-this._t,this._line=1-this._line)},point:function(e,t){switch(e=+e,t=+t,this._point){case 0:this._point=1,this._line?this._context.lineTo(e,t):this._context.moveTo(e,t);break;case 1:this._point=2;default:if(this._t<=0)this._context.lineTo(this._x,t),this._context.lineTo(e,t);else{var n=this._x*(1-this._t)+e*this._t;this._context.lineTo(n,this._y),this._context.lineTo(n,t)}break}this._x=e,this._y=t}};function Wt(e){return new Ut(e,.5)}function Gt(e){return new Ut(e,0)}function Kt(e){return new Ut(e,1)}function qt(e,t){if((o=e.length)>1)for(var n=1,r,i,a=e[t[0]],o,s=a.length;n<o;++n)for(i=a,a=e[t[n]],r=0;r<s;++r)a[r][1]+=a[r][0]=isNaN(i[r][1])?i[r][0]:i[r][1]}function Jt(e){for(var t=e.length,n=Array(t);--t>=0;)n[t]=t;return n}function Yt(e,t){return e[t]}function Xt(e){let t=[];return t.key=e,t}function Zt(){var e=P([]),t=Jt,n=qt,r=Yt;function i(i){var a=Array.from(e.apply(this,arguments),Xt),o,s=a.length,c=-1,l;for(let e of i)for(o=0,++c;o<s;++o)(a[o][c]=[0,+r(e,a[o].key,c,i)]).data=e;for(o=0,l=Ke(t(a));o<s;++o)a[l[o]].index=o;return n(a,l),a}return i.keys=function(t){return arguments.length?(e=typeof t==`function`?t:P(Array.from(t)),i):e},i.value=function(e){return arguments.length?(r=typeof e==`function`?e:P(+e),i):r},i.order=function(e){return arguments.length?(t=e==null?Jt:typeof e==`function`?e:P(Array.from(e)),i):t},i.offset=function(e){return arguments.length?(n=e??qt,i):n},i}function Qt(e,t){if((r=e.length)>0){for(var n,r,i=0,a=e[0].length,o;i<a;++i){for(o=n=0;n<r;++n)o+=e[n][i][1]||0;if(o)for(n=0;n<r;++n)e[n][i][1]/=o}qt(e,t)}}function $t(e,t){if((i=e.length)>0){for(var n=0,r=e[t[0]],i,a=r.length;n<a;++n){for(var o=0,s=0;o<i;++o)s+=e[o][n][1]||0;r[n][1]+=r[n][0]=-s/2}qt(e,t)}}function en(e,t){if(!(!((o=e.length)>0)||!((a=(i=e[t[0]]).length)>0))){for(var n=0,r=1,i,a,o;r<a;++r){for(var s=0,c=0,l=0;s<o;++s){for(var u=e[t[s]],d=u[r][1]||0,f=u[r-1][1]||0,p=(d-f)/2,m=0;m<s;++m){var h=e[t[m]],g=h[r][1]||0,_=h[r-1][1]||0;p+=g-_}c+=d,l+=p*d}i[r-1][1]+=i[r-1][0]=n,c&&(n-=l/c)}i[r-1][1]+=i[r-1][0]=n,qt(e,t)}}var tn=[`type`,`size`,`sizeType`];function nn(){return nn=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},nn.apply(null,arguments)}function rn(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function an(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?rn(Object(n),!0).forEach(function(t){on(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):rn(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function on(e,t,n){return(t=sn(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function sn(e){var t=cn(e,`string`);return typeof t==`symbol`?t:t+``}function cn(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function ln(e,t){if(e==null)return{};var n,r,i=un(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function un(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}var dn={symbolCircle:nt,symbolCross:rt,symbolDiamond:ot,symbolSquare:st,symbolStar:ft,symbolTriangle:mt,symbolWye:yt},fn=Math.PI/180,pn=e=>{var t=`symbol${te(e)}`;return dn[t]||nt},mn=(e,t,n)=>{if(t===`area`)return e;switch(n){case`cross`:return 5*e*e/9;case`diamond`:return .5*e*e/Math.sqrt(3);case`square`:return e*e;case`star`:var r=18*fn;return 1.25*e*e*(Math.tan(r)-Math.tan(r*2)*Math.tan(r)**2);case`triangle`:return Math.sqrt(3)*e*e/4;case`wye`:return(21-10*Math.sqrt(3))*e*e/8;default:return Math.PI*e*e/4}},hn=(e,t)=>{dn[`symbol${te(e)}`]=t},gn=e=>{var{type:t=`circle`,size:n=64,sizeType:r=`area`}=e,i=ln(e,tn),a=an(an({},i),{},{type:t,size:n,sizeType:r}),o=`circle`;typeof t==`string`&&(o=t);var s=()=>{var e=pn(o);return bt().type(e).size(mn(n,r,o))()},{className:l,cx:u,cy:d}=a,f=M(a,!0);return u===+u&&d===+d&&n===+n?A.createElement(`path`,nn({},f,{className:c(`recharts-symbols`,l),transform:`translate(${u}, ${d})`,d:s()})):null};gn.registerSymbol=hn;function _n(){return _n=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},_n.apply(null,arguments)}function vn(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function yn(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?vn(Object(n),!0).forEach(function(t){bn(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):vn(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function bn(e,t,n){return(t=xn(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function xn(e){var t=Sn(e,`string`);return typeof t==`symbol`?t:t+``}function Sn(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}var Cn=32,wn=class extends A.PureComponent{renderIcon(e,t){var{inactiveColor:n}=this.props,r=Cn/2,i=Cn/6,a=Cn/3,o=e.inactive?n:e.color,s=t??e.type;if(s===`none`)return null;if(s===`plainline`)return A.createElement(`line`,{strokeWidth:4,fill:`none`,stroke:o,strokeDasharray:e.payload.strokeDasharray,x1:0,y1:r,x2:Cn,y2:r,className:`recharts-legend-icon`});if(s===`line`)return A.createElement(`path`,{strokeWidth:4,fill:`none`,stroke:o,d:`M0,${r}h${a}
-            A${i},${i},0,1,1,${2*a},${r}
-            H${Cn}M${2*a},${r}
-            A${i},${i},0,1,1,${a},${r}`,className:`recharts-legend-icon`});if(s===`rect`)return A.createElement(`path`,{stroke:`none`,fill:o,d:`M0,${Cn/8}h${Cn}v${Cn*3/4}h${-Cn}z`,className:`recharts-legend-icon`});if(A.isValidElement(e.legendIcon)){var c=yn({},e);return delete c.legendIcon,A.cloneElement(e.legendIcon,c)}return A.createElement(gn,{fill:o,cx:r,cy:r,size:Cn,sizeType:`diameter`,type:s})}renderItems(){var{payload:e,iconSize:t,layout:n,formatter:r,inactiveColor:i,iconType:a}=this.props,o={x:0,y:0,width:Cn,height:Cn},s={display:n===`horizontal`?`inline-block`:`block`,marginRight:10},l={display:`inline-block`,verticalAlign:`middle`,marginRight:4};return e.map((e,n)=>{var u=e.formatter||r,d=c({"recharts-legend-item":!0,[`legend-item-${n}`]:!0,inactive:e.inactive});if(e.type===`none`)return null;var f=e.inactive?i:e.color,p=u?u(e.value,e,n):e.value;return A.createElement(`li`,_n({className:d,style:s,key:`legend-item-${n}`},le(this.props,e,n)),A.createElement(Te,{width:t,height:t,viewBox:o,style:l,"aria-label":`${p} legend icon`},this.renderIcon(e,a)),A.createElement(`span`,{className:`recharts-legend-item-text`,style:{color:f}},p))})}render(){var{payload:e,layout:t,align:n}=this.props;if(!e||!e.length)return null;var r={padding:0,margin:0,textAlign:t===`horizontal`?n:`left`};return A.createElement(`ul`,{className:`recharts-default-legend`,style:r},this.renderItems())}};bn(wn,`displayName`,`Legend`),bn(wn,`defaultProps`,{align:`center`,iconSize:14,inactiveColor:`#ccc`,layout:`horizontal`,verticalAlign:`middle`});var Tn=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});function t(e,t){let n=new Map;for(let r=0;r<e.length;r++){let i=e[r],a=t(i);n.has(a)||n.set(a,i)}return Array.from(n.values())}exports.uniqBy=t})),En=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});function t(e){return e}exports.identity=t})),Dn=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});function t(e){return Number.isSafeInteger(e)&&e>=0}exports.isLength=t})),On=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=Dn();function n(e){return e!=null&&typeof e!=`function`&&t.isLength(e.length)}exports.isArrayLike=n})),kn=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});function t(e){return typeof e==`object`&&!!e}exports.isObjectLike=t})),An=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=On(),n=kn();function r(e){return n.isObjectLike(e)&&t.isArrayLike(e)}exports.isArrayLikeObject=r})),jn=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=m();function n(e){return function(n){return t.get(n,e)}}exports.property=n})),Mn=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});function t(e){return e!==null&&(typeof e==`object`||typeof e==`function`)}exports.isObject=t})),Nn=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});function t(e){return e==null||typeof e!=`object`&&typeof e!=`function`}exports.isPrimitive=t})),Pn=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});function t(e,t){return e===t||Number.isNaN(e)&&Number.isNaN(t)}exports.eq=t})),Fn=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=Mn(),n=Nn(),r=Pn();function i(e,t,n){return typeof n==`function`?a(e,t,function e(t,r,i,o,s,c){let l=n(t,r,i,o,s,c);return l===void 0?a(t,r,e,c):!!l},new Map):i(e,t,()=>void 0)}function a(e,n,i,s){if(n===e)return!0;switch(typeof n){case`object`:return o(e,n,i,s);case`function`:return Object.keys(n).length>0?a(e,{...n},i,s):r.eq(e,n);default:return t.isObject(e)?typeof n==`string`?n===``:!0:r.eq(e,n)}}function o(e,t,r,i){if(t==null)return!0;if(Array.isArray(t))return c(e,t,r,i);if(t instanceof Map)return s(e,t,r,i);if(t instanceof Set)return l(e,t,r,i);let a=Object.keys(t);if(e==null)return a.length===0;if(a.length===0)return!0;if(i?.has(t))return i.get(t)===e;i?.set(t,e);try{for(let o=0;o<a.length;o++){let s=a[o];if(!n.isPrimitive(e)&&!(s in e)||t[s]===void 0&&e[s]!==void 0||t[s]===null&&e[s]!==null||!r(e[s],t[s],s,e,t,i))return!1}return!0}finally{i?.delete(t)}}function s(e,t,n,r){if(t.size===0)return!0;if(!(e instanceof Map))return!1;for(let[i,a]of t.entries()){let o=e.get(i);if(n(o,a,i,e,t,r)===!1)return!1}return!0}function c(e,t,n,r){if(t.length===0)return!0;if(!Array.isArray(e))return!1;let i=new Set;for(let a=0;a<t.length;a++){let o=t[a],s=!1;for(let c=0;c<e.length;c++){if(i.has(c))continue;let l=e[c],u=!1;if(n(l,o,a,e,t,r)&&(u=!0),u){i.add(c),s=!0;break}}if(!s)return!1}return!0}function l(e,t,n,r){return t.size===0?!0:e instanceof Set?c([...e],[...t],n,r):!1}exports.isMatchWith=i,exports.isSetMatch=l})),In=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=Fn();function n(e,n){return t.isMatchWith(e,n,()=>void 0)}exports.isMatch=n})),Ln=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});function t(e){return Object.getOwnPropertySymbols(e).filter(t=>Object.prototype.propertyIsEnumerable.call(e,t))}exports.getSymbols=t})),Rn=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});function t(e){return e==null?e===void 0?`[object Undefined]`:`[object Null]`:Object.prototype.toString.call(e)}exports.getTag=t})),zn=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`}),exports.argumentsTag=`[object Arguments]`,exports.arrayBufferTag=`[object ArrayBuffer]`,exports.arrayTag=`[object Array]`,exports.bigInt64ArrayTag=`[object BigInt64Array]`,exports.bigUint64ArrayTag=`[object BigUint64Array]`,exports.booleanTag=`[object Boolean]`,exports.dataViewTag=`[object DataView]`,exports.dateTag=`[object Date]`,exports.errorTag=`[object Error]`,exports.float32ArrayTag=`[object Float32Array]`,exports.float64ArrayTag=`[object Float64Array]`,exports.functionTag=`[object Function]`,exports.int16ArrayTag=`[object Int16Array]`,exports.int32ArrayTag=`[object Int32Array]`,exports.int8ArrayTag=`[object Int8Array]`,exports.mapTag=`[object Map]`,exports.numberTag=`[object Number]`,exports.objectTag=`[object Object]`,exports.regexpTag=`[object RegExp]`,exports.setTag=`[object Set]`,exports.stringTag=`[object String]`,exports.symbolTag=`[object Symbol]`,exports.uint16ArrayTag=`[object Uint16Array]`,exports.uint32ArrayTag=`[object Uint32Array]`,exports.uint8ArrayTag=`[object Uint8Array]`,exports.uint8ClampedArrayTag=`[object Uint8ClampedArray]`})),Bn=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});function t(e){return ArrayBuffer.isView(e)&&!(e instanceof DataView)}exports.isTypedArray=t})),Vn=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=Ln(),n=Rn(),r=zn(),i=Nn(),a=Bn();function o(e,t){return s(e,void 0,e,new Map,t)}function s(e,t,n,r=new Map,o=void 0){let u=o?.(e,t,n,r);if(u!==void 0)return u;if(i.isPrimitive(e))return e;if(r.has(e))return r.get(e);if(Array.isArray(e)){let t=Array(e.length);r.set(e,t);for(let i=0;i<e.length;i++)t[i]=s(e[i],i,n,r,o);return Object.hasOwn(e,`index`)&&(t.index=e.index),Object.hasOwn(e,`input`)&&(t.input=e.input),t}if(e instanceof Date)return new Date(e.getTime());if(e instanceof RegExp){let t=new RegExp(e.source,e.flags);return t.lastIndex=e.lastIndex,t}if(e instanceof Map){let t=new Map;r.set(e,t);for(let[i,a]of e)t.set(i,s(a,i,n,r,o));return t}if(e instanceof Set){let t=new Set;r.set(e,t);for(let i of e)t.add(s(i,void 0,n,r,o));return t}if(typeof Buffer<`u`&&Buffer.isBuffer(e))return e.subarray();if(a.isTypedArray(e)){let t=new(Object.getPrototypeOf(e)).constructor(e.length);r.set(e,t);for(let i=0;i<e.length;i++)t[i]=s(e[i],i,n,r,o);return t}if(e instanceof ArrayBuffer||typeof SharedArrayBuffer<`u`&&e instanceof SharedArrayBuffer)return e.slice(0);if(e instanceof DataView){let t=new DataView(e.buffer.slice(0),e.byteOffset,e.byteLength);return r.set(e,t),c(t,e,n,r,o),t}if(typeof File<`u`&&e instanceof File){let t=new File([e],e.name,{type:e.type});return r.set(e,t),c(t,e,n,r,o),t}if(typeof Blob<`u`&&e instanceof Blob){let t=new Blob([e],{type:e.type});return r.set(e,t),c(t,e,n,r,o),t}if(e instanceof Error){let t=new e.constructor;return r.set(e,t),t.message=e.message,t.name=e.name,t.stack=e.stack,t.cause=e.cause,c(t,e,n,r,o),t}if(e instanceof Boolean){let t=new Boolean(e.valueOf());return r.set(e,t),c(t,e,n,r,o),t}if(e instanceof Number){let t=new Number(e.valueOf());return r.set(e,t),c(t,e,n,r,o),t}if(e instanceof String){let t=new String(e.valueOf());return r.set(e,t),c(t,e,n,r,o),t}if(typeof e==`object`&&l(e)){let t=Object.create(Object.getPrototypeOf(e));return r.set(e,t),c(t,e,n,r,o),t}return e}function c(e,n,r=e,i,a){let o=[...Object.keys(n),...t.getSymbols(n)];for(let t=0;t<o.length;t++){let c=o[t],l=Object.getOwnPropertyDescriptor(e,c);(l==null||l.writable)&&(e[c]=s(n[c],c,r,i,a))}}function l(e){switch(n.getTag(e)){case r.argumentsTag:case r.arrayTag:case r.arrayBufferTag:case r.dataViewTag:case r.booleanTag:case r.dateTag:case r.float32ArrayTag:case r.float64ArrayTag:case r.int8ArrayTag:case r.int16ArrayTag:case r.int32ArrayTag:case r.mapTag:case r.numberTag:case r.objectTag:case r.regexpTag:case r.setTag:case r.stringTag:case r.symbolTag:case r.uint8ArrayTag:case r.uint8ClampedArrayTag:case r.uint16ArrayTag:case r.uint32ArrayTag:return!0;default:return!1}}exports.cloneDeepWith=o,exports.cloneDeepWithImpl=s,exports.copyProperties=c})),Hn=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=Vn();function n(e){return t.cloneDeepWithImpl(e,void 0,e,new Map,void 0)}exports.cloneDeep=n})),Un=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=In(),n=Hn();function r(e){return e=n.cloneDeep(e),n=>t.isMatch(n,e)}exports.matches=r})),Wn=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=Vn(),n=zn();function r(e,r){return t.cloneDeepWith(e,(i,a,o,s)=>{let c=r?.(i,a,o,s);if(c!==void 0)return c;if(typeof e==`object`)switch(Object.prototype.toString.call(e)){case n.numberTag:case n.stringTag:case n.booleanTag:{let n=new e.constructor(e?.valueOf());return t.copyProperties(n,e),n}case n.argumentsTag:{let n={};return t.copyProperties(n,e),n.length=e.length,n[Symbol.iterator]=e[Symbol.iterator],n}default:return}})}exports.cloneDeepWith=r})),Gn=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=Wn();function n(e){return t.cloneDeepWith(e)}exports.cloneDeep=n})),Kn=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=/^(?:0|[1-9]\d*)$/;function n(e,n=2**53-1){switch(typeof e){case`number`:return Number.isInteger(e)&&e>=0&&e<n;case`symbol`:return!1;case`string`:return t.test(e)}}exports.isIndex=n})),qn=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=Rn();function n(e){return typeof e==`object`&&!!e&&t.getTag(e)===`[object Arguments]`}exports.isArguments=n})),Jn=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=u(),n=Kn(),r=qn(),i=p();function a(e,a){let o;if(o=Array.isArray(a)?a:typeof a==`string`&&t.isDeepKey(a)&&e?.[a]==null?i.toPath(a):[a],o.length===0)return!1;let s=e;for(let e=0;e<o.length;e++){let t=o[e];if((s==null||!Object.hasOwn(s,t))&&!((Array.isArray(s)||r.isArguments(s))&&n.isIndex(t)&&t<s.length))return!1;s=s[t]}return!0}exports.has=a})),Yn=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=In(),n=d(),r=Gn(),i=m(),a=Jn();function o(e,o){switch(typeof e){case`object`:Object.is(e?.valueOf(),-0)&&(e=`-0`);break;case`number`:e=n.toKey(e);break}return o=r.cloneDeep(o),function(n){let r=i.get(n,e);return r===void 0?a.has(n,e):o===void 0?r===void 0:t.isMatch(r,o)}}exports.matchesProperty=o})),Xn=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=En(),n=jn(),r=Un(),i=Yn();function a(e){if(e==null)return t.identity;switch(typeof e){case`function`:return e;case`object`:return Array.isArray(e)&&e.length===2?i.matchesProperty(e[0],e[1]):r.matches(e);case`string`:case`symbol`:case`number`:return n.property(e)}}exports.iteratee=a})),Zn=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=Tn(),n=En(),r=An(),i=Xn();function a(e,a=n.identity){return r.isArrayLikeObject(e)?t.uniqBy(Array.from(e),i.iteratee(a)):[]}exports.uniqBy=a})),Qn=e(n(((exports,t)=>{t.exports=Zn().uniqBy}))());function $n(e,t,n){return t===!0?(0,Qn.default)(e,n):typeof t==`function`?(0,Qn.default)(e,t):e}var er=n((exports=>{var t=r(),n=o();function i(e,t){return e===t&&(e!==0||1/e==1/t)||e!==e&&t!==t}var a=typeof Object.is==`function`?Object.is:i,s=n.useSyncExternalStore,c=t.useRef,l=t.useEffect,u=t.useMemo,d=t.useDebugValue;exports.useSyncExternalStoreWithSelector=function(e,t,n,r,i){var o=c(null);if(o.current===null){var f={hasValue:!1,value:null};o.current=f}else f=o.current;o=u(function(){function e(e){if(!o){if(o=!0,s=e,e=r(e),i!==void 0&&f.hasValue){var t=f.value;if(i(t,e))return c=t}return c=e}if(t=c,a(s,e))return t;var n=r(e);return i!==void 0&&i(t,n)?(s=e,t):(s=e,c=n)}var o=!1,s,c,l=n===void 0?null:n;return[function(){return e(t())},l===null?void 0:function(){return e(l())}]},[t,n,r,i]);var p=s(e,o[0],o[1]);return l(function(){f.hasValue=!0,f.value=p},[p]),d(p),p}})),tr=n(((exports,t)=>{t.exports=er()})),nr=(0,A.createContext)(null),rr=e(tr()),ir=e=>e,F=()=>{var e=(0,A.useContext)(nr);return e?e.store.dispatch:ir},ar=()=>{},or=()=>ar,sr=(e,t)=>e===t;function I(e){var t=(0,A.useContext)(nr);return(0,rr.useSyncExternalStoreWithSelector)(t?t.subscription.addNestedSub:or,t?t.store.getState:ar,t?t.store.getState:ar,t?e:ar,sr)}function cr(e,t=`expected a function, instead received ${typeof e}`){if(typeof e!=`function`)throw TypeError(t)}function lr(e,t=`expected an object, instead received ${typeof e}`){if(typeof e!=`object`)throw TypeError(t)}function ur(e,t=`expected all items to be functions, instead received the following types: `){if(!e.every(e=>typeof e==`function`)){let n=e.map(e=>typeof e==`function`?`function ${e.name||`unnamed`}()`:typeof e).join(`, `);throw TypeError(`${t}[${n}]`)}}var dr=e=>Array.isArray(e)?e:[e];function fr(e){let t=Array.isArray(e[0])?e[0]:e;return ur(t,`createSelector expects all input-selectors to be functions, but received the following types: `),t}function pr(e,t){let n=[],{length:r}=e;for(let i=0;i<r;i++)n.push(e[i].apply(null,t));return n}var mr=0,hr=null,gr=class{revision=mr;_value;_lastValue;_isEqual=_r;constructor(e,t=_r){this._value=this._lastValue=e,this._isEqual=t}get value(){return hr?.add(this),this._value}set value(e){this.value!==e&&(this._value=e,this.revision=++mr)}};function _r(e,t){return e===t}function vr(e){return e instanceof gr||console.warn(`Not a valid cell! `,e),e.value}function yr(e,t=_r){return new gr(e,t)}var br=(e,t)=>!1;function xr(){return yr(null,br)}var Sr=e=>{let t=e.collectionTag;t===null&&(t=e.collectionTag=xr()),vr(t)},Cr=0,wr=Object.getPrototypeOf({}),Tr=class{constructor(e){this.value=e,this.value=e,this.tag.value=e}proxy=new Proxy(this,Er);tag=xr();tags={};children={};collectionTag=null;id=Cr++},Er={get(e,t){function n(){let{value:n}=e,r=Reflect.get(n,t);if(typeof t==`symbol`||t in wr)return r;if(typeof r==`object`&&r){let n=e.children[t];return n===void 0&&(n=e.children[t]=kr(r)),n.tag&&vr(n.tag),n.proxy}else{let n=e.tags[t];return n===void 0&&(n=e.tags[t]=xr(),n.value=r),vr(n),r}}return n()},ownKeys(e){return Sr(e),Reflect.ownKeys(e.value)},getOwnPropertyDescriptor(e,t){return Reflect.getOwnPropertyDescriptor(e.value,t)},has(e,t){return Reflect.has(e.value,t)}},Dr=class{constructor(e){this.value=e,this.value=e,this.tag.value=e}proxy=new Proxy([this],Or);tag=xr();tags={};children={};collectionTag=null;id=Cr++},Or={get([e],t){return t===`length`&&Sr(e),Er.get(e,t)},ownKeys([e]){return Er.ownKeys(e)},getOwnPropertyDescriptor([e],t){return Er.getOwnPropertyDescriptor(e,t)},has([e],t){return Er.has(e,t)}};function kr(e){return Array.isArray(e)?new Dr(e):new Tr(e)}var Ar=class{constructor(e){this.value=e}deref(){return this.value}},jr=typeof WeakRef<`u`?WeakRef:Ar,Mr=0,Nr=1;function Pr(){return{s:Mr,v:void 0,o:null,p:null}}function Fr(e,t={}){let n=Pr(),{resultEqualityCheck:r}=t,i,a=0;function o(){let t=n,{length:o}=arguments;for(let e=0,n=o;e<n;e++){let n=arguments[e];if(typeof n==`function`||typeof n==`object`&&n){let e=t.o;e===null&&(t.o=e=new WeakMap);let r=e.get(n);r===void 0?(t=Pr(),e.set(n,t)):t=r}else{let e=t.p;e===null&&(t.p=e=new Map);let r=e.get(n);r===void 0?(t=Pr(),e.set(n,t)):t=r}}let s=t,c;if(t.s===Nr)c=t.v;else if(c=e.apply(null,arguments),a++,r){let e=i?.deref?.()??i;e!=null&&r(e,c)&&(c=e,a!==0&&a--),i=typeof c==`object`&&c||typeof c==`function`?new jr(c):c}return s.s=Nr,s.v=c,c}return o.clearCache=()=>{n=Pr(),o.resetResultsCount()},o.resultsCount=()=>a,o.resetResultsCount=()=>{a=0},o}function Ir(e,...t){let n=typeof e==`function`?{memoize:e,memoizeOptions:t}:e,r=(...e)=>{let t=0,r=0,i,a={},o=e.pop();typeof o==`object`&&(a=o,o=e.pop()),cr(o,`createSelector expects an output function after the inputs, but received: [${typeof o}]`);let{memoize:s,memoizeOptions:c=[],argsMemoize:l=Fr,argsMemoizeOptions:u=[],devModeChecks:d={}}={...n,...a},f=dr(c),p=dr(u),m=fr(e),h=s(function(){return t++,o.apply(null,arguments)},...f),g=l(function(){r++;let e=pr(m,arguments);return i=h.apply(null,e),i},...p);return Object.assign(g,{resultFunc:o,memoizedResultFunc:h,dependencies:m,dependencyRecomputations:()=>r,resetDependencyRecomputations:()=>{r=0},lastResult:()=>i,recomputations:()=>t,resetRecomputations:()=>{t=0},memoize:s,argsMemoize:l})};return Object.assign(r,{withTypes:()=>r}),r}var L=Ir(Fr),Lr=Object.assign((e,t=L)=>{lr(e,`createStructuredSelector expects first argument to be an object where each property is a selector, instead received a ${typeof e}`);let n=Object.keys(e),r=n.map(t=>e[t]);return t(r,(...e)=>e.reduce((e,t,r)=>(e[n[r]]=t,e),{}))},{withTypes:()=>Lr}),Rr=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});function t(e){return typeof e==`symbol`?1:e===null?2:e===void 0?3:e===e?0:4}exports.compareValues=(e,n,r)=>{if(e!==n){let i=t(e),a=t(n);if(i===a&&i===0){if(e<n)return r===`desc`?1:-1;if(e>n)return r===`desc`?-1:1}return r===`desc`?a-i:i-a}return 0}})),zr=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});function t(e){return typeof e==`symbol`||e instanceof Symbol}exports.isSymbol=t})),Br=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=zr(),n=/\.|\[(?:[^[\]]*|(["'])(?:(?!\1)[^\\]|\\.)*?\1)\]/,r=/^\w*$/;function i(e,i){return Array.isArray(e)?!1:typeof e==`number`||typeof e==`boolean`||e==null||t.isSymbol(e)?!0:typeof e==`string`&&(r.test(e)||!n.test(e))||i!=null&&Object.hasOwn(i,e)}exports.isKey=i})),Vr=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=Rr(),n=Br(),r=p();function i(e,i,a,o){if(e==null)return[];a=o?void 0:a,Array.isArray(e)||(e=Object.values(e)),Array.isArray(i)||(i=i==null?[null]:[i]),i.length===0&&(i=[null]),Array.isArray(a)||(a=a==null?[]:[a]),a=a.map(e=>String(e));let s=(e,t)=>{let n=e;for(let e=0;e<t.length&&n!=null;++e)n=n[t[e]];return n},c=(e,t)=>t==null||e==null?t:typeof e==`object`&&`key`in e?Object.hasOwn(t,e.key)?t[e.key]:s(t,e.path):typeof e==`function`?e(t):Array.isArray(e)?s(t,e):typeof t==`object`?t[e]:t,l=i.map(e=>(Array.isArray(e)&&e.length===1&&(e=e[0]),e==null||typeof e==`function`||Array.isArray(e)||n.isKey(e)?e:{key:e,path:r.toPath(e)}));return e.map(e=>({original:e,criteria:l.map(t=>c(t,e))})).slice().sort((e,n)=>{for(let r=0;r<l.length;r++){let i=t.compareValues(e.criteria[r],n.criteria[r],a[r]);if(i!==0)return i}return 0}).map(e=>e.original)}exports.orderBy=i})),Hr=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});function t(e,t=1){let n=[],r=Math.floor(t),i=(e,t)=>{for(let a=0;a<e.length;a++){let o=e[a];Array.isArray(o)&&t<r?i(o,t+1):n.push(o)}};return i(e,0),n}exports.flatten=t})),Ur=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=Kn(),n=On(),r=Mn(),i=Pn();function a(e,a,o){return r.isObject(o)&&(typeof a==`number`&&n.isArrayLike(o)&&t.isIndex(a)&&a<o.length||typeof a==`string`&&a in o)?i.eq(o[a],e):!1}exports.isIterateeCall=a})),Wr=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=Vr(),n=Hr(),r=Ur();function i(e,...i){let a=i.length;return a>1&&r.isIterateeCall(e,i[0],i[1])?i=[]:a>2&&r.isIterateeCall(i[0],i[1],i[2])&&(i=[i[0]]),t.orderBy(e,n.flatten(i),[`asc`])}exports.sortBy=i})),Gr=n(((exports,t)=>{t.exports=Wr().sortBy})),Kr=e(Gr()),qr=e=>e.legend.settings,Jr=e=>e.legend.size,Yr=L([e=>e.legend.payload,qr],(e,t)=>{var{itemSorter:n}=t,r=e.flat(1);return n?(0,Kr.default)(r,n):r});function Xr(){return I(Yr)}var Zr=1;function Qr(){var e=arguments.length>0&&arguments[0]!==void 0?arguments[0]:[],[t,n]=(0,A.useState)({height:0,left:0,top:0,width:0}),r=(0,A.useCallback)(e=>{if(e!=null){var r=e.getBoundingClientRect(),i={height:r.height,left:r.left,top:r.top,width:r.width};(Math.abs(i.height-t.height)>Zr||Math.abs(i.left-t.left)>Zr||Math.abs(i.top-t.top)>Zr||Math.abs(i.width-t.width)>Zr)&&n({height:i.height,left:i.left,top:i.top,width:i.width})}},[t.width,t.height,t.top,t.left,...e]);return[t,r]}function $r(e){return`Minified Redux error #${e}; visit https://redux.js.org/Errors?code=${e} for the full message or use the non-minified dev environment for full errors. `}var ei=(()=>typeof Symbol==`function`&&Symbol.observable||`@@observable`)(),ti=()=>Math.random().toString(36).substring(7).split(``).join(`.`),ni={INIT:`@@redux/INIT${ti()}`,REPLACE:`@@redux/REPLACE${ti()}`,PROBE_UNKNOWN_ACTION:()=>`@@redux/PROBE_UNKNOWN_ACTION${ti()}`};function ri(e){if(typeof e!=`object`||!e)return!1;let t=e;for(;Object.getPrototypeOf(t)!==null;)t=Object.getPrototypeOf(t);return Object.getPrototypeOf(e)===t||Object.getPrototypeOf(e)===null}function ii(e,t,n){if(typeof e!=`function`)throw Error($r(2));if(typeof t==`function`&&typeof n==`function`||typeof n==`function`&&typeof arguments[3]==`function`)throw Error($r(0));if(typeof t==`function`&&n===void 0&&(n=t,t=void 0),n!==void 0){if(typeof n!=`function`)throw Error($r(1));return n(ii)(e,t)}let r=e,i=t,a=new Map,o=a,s=0,c=!1;function l(){o===a&&(o=new Map,a.forEach((e,t)=>{o.set(t,e)}))}function u(){if(c)throw Error($r(3));return i}function d(e){if(typeof e!=`function`)throw Error($r(4));if(c)throw Error($r(5));let t=!0;l();let n=s++;return o.set(n,e),function(){if(t){if(c)throw Error($r(6));t=!1,l(),o.delete(n),a=null}}}function f(e){if(!ri(e))throw Error($r(7));if(e.type===void 0)throw Error($r(8));if(typeof e.type!=`string`)throw Error($r(17));if(c)throw Error($r(9));try{c=!0,i=r(i,e)}finally{c=!1}return(a=o).forEach(e=>{e()}),e}function p(e){if(typeof e!=`function`)throw Error($r(10));r=e,f({type:ni.REPLACE})}function m(){let e=d;return{subscribe(t){if(typeof t!=`object`||!t)throw Error($r(11));function n(){let e=t;e.next&&e.next(u())}return n(),{unsubscribe:e(n)}},[ei](){return this}}}return f({type:ni.INIT}),{dispatch:f,subscribe:d,getState:u,replaceReducer:p,[ei]:m}}function ai(e){Object.keys(e).forEach(t=>{let n=e[t];if(n(void 0,{type:ni.INIT})===void 0)throw Error($r(12));if(n(void 0,{type:ni.PROBE_UNKNOWN_ACTION()})===void 0)throw Error($r(13))})}function oi(e){let t=Object.keys(e),n={};for(let r=0;r<t.length;r++){let i=t[r];typeof e[i]==`function`&&(n[i]=e[i])}let r=Object.keys(n),i;try{ai(n)}catch(e){i=e}return function(e={},t){if(i)throw i;let a=!1,o={};for(let i=0;i<r.length;i++){let s=r[i],c=n[s],l=e[s],u=c(l,t);if(u===void 0)throw t&&t.type,Error($r(14));o[s]=u,a||=u!==l}return a||=r.length!==Object.keys(e).length,a?o:e}}function si(...e){return e.length===0?e=>e:e.length===1?e[0]:e.reduce((e,t)=>(...n)=>e(t(...n)))}function ci(...e){return t=>(n,r)=>{let i=t(n,r),a=()=>{throw Error($r(15))},o={getState:i.getState,dispatch:(e,...t)=>a(e,...t)},s=e.map(e=>e(o));return a=si(...s)(i.dispatch),{...i,dispatch:a}}}function li(e){return ri(e)&&`type`in e&&typeof e.type==`string`}var ui=Symbol.for(`immer-nothing`),di=Symbol.for(`immer-draftable`),fi=Symbol.for(`immer-state`);function pi(e,...t){throw Error(`[Immer] minified error nr: ${e}. Full error at: https://bit.ly/3cXEKWf`)}var mi=Object.getPrototypeOf;function hi(e){return!!e&&!!e[fi]}function gi(e){return e?yi(e)||Array.isArray(e)||!!e[di]||!!e.constructor?.[di]||Ti(e)||Ei(e):!1}var _i=Object.prototype.constructor.toString(),vi=new WeakMap;function yi(e){if(!e||typeof e!=`object`)return!1;let t=Object.getPrototypeOf(e);if(t===null||t===Object.prototype)return!0;let n=Object.hasOwnProperty.call(t,`constructor`)&&t.constructor;if(n===Object)return!0;if(typeof n!=`function`)return!1;let r=vi.get(n);return r===void 0&&(r=Function.toString.call(n),vi.set(n,r)),r===_i}function bi(e,t,n=!0){xi(e)===0?(n?Reflect.ownKeys(e):Object.keys(e)).forEach(n=>{t(n,e[n],e)}):e.forEach((n,r)=>t(r,n,e))}function xi(e){let t=e[fi];return t?t.type_:Array.isArray(e)?1:Ti(e)?2:Ei(e)?3:0}function Si(e,t){return xi(e)===2?e.has(t):Object.prototype.hasOwnProperty.call(e,t)}function Ci(e,t,n){let r=xi(e);r===2?e.set(t,n):r===3?e.add(n):e[t]=n}function wi(e,t){return e===t?e!==0||1/e==1/t:e!==e&&t!==t}function Ti(e){return e instanceof Map}function Ei(e){return e instanceof Set}function Di(e){return e.copy_||e.base_}function Oi(e,t){if(Ti(e))return new Map(e);if(Ei(e))return new Set(e);if(Array.isArray(e))return Array.prototype.slice.call(e);let n=yi(e);if(t===!0||t===`class_only`&&!n){let t=Object.getOwnPropertyDescriptors(e);delete t[fi];let n=Reflect.ownKeys(t);for(let r=0;r<n.length;r++){let i=n[r],a=t[i];a.writable===!1&&(a.writable=!0,a.configurable=!0),(a.get||a.set)&&(t[i]={configurable:!0,writable:!0,enumerable:a.enumerable,value:e[i]})}return Object.create(mi(e),t)}else{let t=mi(e);if(t!==null&&n)return{...e};let r=Object.create(t);return Object.assign(r,e)}}function ki(e,t=!1){return Mi(e)||hi(e)||!gi(e)?e:(xi(e)>1&&Object.defineProperties(e,{set:ji,add:ji,clear:ji,delete:ji}),Object.freeze(e),t&&Object.values(e).forEach(e=>ki(e,!0)),e)}function Ai(){pi(2)}var ji={value:Ai};function Mi(e){return typeof e!=`object`||!e?!0:Object.isFrozen(e)}var Ni={};function Pi(e){let t=Ni[e];return t||pi(0,e),t}var Fi;function Ii(){return Fi}function Li(e,t){return{drafts_:[],parent_:e,immer_:t,canAutoFreeze_:!0,unfinalizedDrafts_:0}}function Ri(e,t){t&&(Pi(`Patches`),e.patches_=[],e.inversePatches_=[],e.patchListener_=t)}function zi(e){Bi(e),e.drafts_.forEach(Hi),e.drafts_=null}function Bi(e){e===Fi&&(Fi=e.parent_)}function Vi(e){return Fi=Li(Fi,e)}function Hi(e){let t=e[fi];t.type_===0||t.type_===1?t.revoke_():t.revoked_=!0}function Ui(e,t){t.unfinalizedDrafts_=t.drafts_.length;let n=t.drafts_[0];return e!==void 0&&e!==n?(n[fi].modified_&&(zi(t),pi(4)),gi(e)&&(e=Wi(t,e),!t.parent_&&Ki(t,e)),t.patches_&&Pi(`Patches`).generateReplacementPatches_(n[fi].base_,e,t.patches_,t.inversePatches_)):e=Wi(t,n,[]),zi(t),t.patches_&&t.patchListener_(t.patches_,t.inversePatches_),e===ui?void 0:e}function Wi(e,t,n){if(Mi(t))return t;let r=e.immer_.shouldUseStrictIteration(),i=t[fi];if(!i)return bi(t,(r,a)=>Gi(e,i,t,r,a,n),r),t;if(i.scope_!==e)return t;if(!i.modified_)return Ki(e,i.base_,!0),i.base_;if(!i.finalized_){i.finalized_=!0,i.scope_.unfinalizedDrafts_--;let t=i.copy_,a=t,o=!1;i.type_===3&&(a=new Set(t),t.clear(),o=!0),bi(a,(r,a)=>Gi(e,i,t,r,a,n,o),r),Ki(e,t,!1),n&&e.patches_&&Pi(`Patches`).generatePatches_(i,n,e.patches_,e.inversePatches_)}return i.copy_}function Gi(e,t,n,r,i,a,o){if(i==null||typeof i!=`object`&&!o)return;let s=Mi(i);if(!(s&&!o)){if(hi(i)){let o=a&&t&&t.type_!==3&&!Si(t.assigned_,r)?a.concat(r):void 0,s=Wi(e,i,o);if(Ci(n,r,s),hi(s))e.canAutoFreeze_=!1;else return}else o&&n.add(i);if(gi(i)&&!s){if(!e.immer_.autoFreeze_&&e.unfinalizedDrafts_<1||t&&t.base_&&t.base_[r]===i&&s)return;Wi(e,i),(!t||!t.scope_.parent_)&&typeof r!=`symbol`&&(Ti(n)?n.has(r):Object.prototype.propertyIsEnumerable.call(n,r))&&Ki(e,i)}}}function Ki(e,t,n=!1){!e.parent_&&e.immer_.autoFreeze_&&e.canAutoFreeze_&&ki(t,n)}function qi(e,t){let n=Array.isArray(e),r={type_:n?1:0,scope_:t?t.scope_:Ii(),modified_:!1,finalized_:!1,assigned_:{},parent_:t,base_:e,draft_:null,copy_:null,revoke_:null,isManual_:!1},i=r,a=Ji;n&&(i=[r],a=Yi);let{revoke:o,proxy:s}=Proxy.revocable(i,a);return r.draft_=s,r.revoke_=o,s}var Ji={get(e,t){if(t===fi)return e;let n=Di(e);if(!Si(n,t))return Zi(e,n,t);let r=n[t];return e.finalized_||!gi(r)?r:r===Xi(e.base_,t)?(ea(e),e.copy_[t]=na(r,e)):r},has(e,t){return t in Di(e)},ownKeys(e){return Reflect.ownKeys(Di(e))},set(e,t,n){let r=Qi(Di(e),t);if(r?.set)return r.set.call(e.draft_,n),!0;if(!e.modified_){let r=Xi(Di(e),t),i=r?.[fi];if(i&&i.base_===n)return e.copy_[t]=n,e.assigned_[t]=!1,!0;if(wi(n,r)&&(n!==void 0||Si(e.base_,t)))return!0;ea(e),$i(e)}return e.copy_[t]===n&&(n!==void 0||t in e.copy_)||Number.isNaN(n)&&Number.isNaN(e.copy_[t])?!0:(e.copy_[t]=n,e.assigned_[t]=!0,!0)},deleteProperty(e,t){return Xi(e.base_,t)!==void 0||t in e.base_?(e.assigned_[t]=!1,ea(e),$i(e)):delete e.assigned_[t],e.copy_&&delete e.copy_[t],!0},getOwnPropertyDescriptor(e,t){let n=Di(e),r=Reflect.getOwnPropertyDescriptor(n,t);return r&&{writable:!0,configurable:e.type_!==1||t!==`length`,enumerable:r.enumerable,value:n[t]}},defineProperty(){pi(11)},getPrototypeOf(e){return mi(e.base_)},setPrototypeOf(){pi(12)}},Yi={};bi(Ji,(e,t)=>{Yi[e]=function(){return arguments[0]=arguments[0][0],t.apply(this,arguments)}}),Yi.deleteProperty=function(e,t){return Yi.set.call(this,e,t,void 0)},Yi.set=function(e,t,n){return Ji.set.call(this,e[0],t,n,e[0])};function Xi(e,t){let n=e[fi];return(n?Di(n):e)[t]}function Zi(e,t,n){let r=Qi(t,n);return r?`value`in r?r.value:r.get?.call(e.draft_):void 0}function Qi(e,t){if(!(t in e))return;let n=mi(e);for(;n;){let e=Object.getOwnPropertyDescriptor(n,t);if(e)return e;n=mi(n)}}function $i(e){e.modified_||(e.modified_=!0,e.parent_&&$i(e.parent_))}function ea(e){e.copy_||=Oi(e.base_,e.scope_.immer_.useStrictShallowCopy_)}var ta=class{constructor(e){this.autoFreeze_=!0,this.useStrictShallowCopy_=!1,this.useStrictIteration_=!0,this.produce=(e,t,n)=>{if(typeof e==`function`&&typeof t!=`function`){let n=t;t=e;let r=this;return function(e=n,...i){return r.produce(e,e=>t.call(this,e,...i))}}typeof t!=`function`&&pi(6),n!==void 0&&typeof n!=`function`&&pi(7);let r;if(gi(e)){let i=Vi(this),a=na(e,void 0),o=!0;try{r=t(a),o=!1}finally{o?zi(i):Bi(i)}return Ri(i,n),Ui(r,i)}else if(!e||typeof e!=`object`){if(r=t(e),r===void 0&&(r=e),r===ui&&(r=void 0),this.autoFreeze_&&ki(r,!0),n){let t=[],i=[];Pi(`Patches`).generateReplacementPatches_(e,r,t,i),n(t,i)}return r}else pi(1,e)},this.produceWithPatches=(e,t)=>{if(typeof e==`function`)return(t,...n)=>this.produceWithPatches(t,t=>e(t,...n));let n,r;return[this.produce(e,t,(e,t)=>{n=e,r=t}),n,r]},typeof e?.autoFreeze==`boolean`&&this.setAutoFreeze(e.autoFreeze),typeof e?.useStrictShallowCopy==`boolean`&&this.setUseStrictShallowCopy(e.useStrictShallowCopy),typeof e?.useStrictIteration==`boolean`&&this.setUseStrictIteration(e.useStrictIteration)}createDraft(e){gi(e)||pi(8),hi(e)&&(e=ra(e));let t=Vi(this),n=na(e,void 0);return n[fi].isManual_=!0,Bi(t),n}finishDraft(e,t){let n=e&&e[fi];(!n||!n.isManual_)&&pi(9);let{scope_:r}=n;return Ri(r,t),Ui(void 0,r)}setAutoFreeze(e){this.autoFreeze_=e}setUseStrictShallowCopy(e){this.useStrictShallowCopy_=e}setUseStrictIteration(e){this.useStrictIteration_=e}shouldUseStrictIteration(){return this.useStrictIteration_}applyPatches(e,t){let n;for(n=t.length-1;n>=0;n--){let r=t[n];if(r.path.length===0&&r.op===`replace`){e=r.value;break}}n>-1&&(t=t.slice(n+1));let r=Pi(`Patches`).applyPatches_;return hi(e)?r(e,t):this.produce(e,e=>r(e,t))}};function na(e,t){let n=Ti(e)?Pi(`MapSet`).proxyMap_(e,t):Ei(e)?Pi(`MapSet`).proxySet_(e,t):qi(e,t);return(t?t.scope_:Ii()).drafts_.push(n),n}function ra(e){return hi(e)||pi(10,e),ia(e)}function ia(e){if(!gi(e)||Mi(e))return e;let t=e[fi],n,r=!0;if(t){if(!t.modified_)return t.base_;t.finalized_=!0,n=Oi(e,t.scope_.immer_.useStrictShallowCopy_),r=t.scope_.immer_.shouldUseStrictIteration()}else n=Oi(e,!0);return bi(n,(e,t)=>{Ci(n,e,ia(t))},r),t&&(t.finalized_=!1),n}var aa=new ta,oa=aa.produce;function sa(e){return e}function ca(e){return({dispatch:t,getState:n})=>r=>i=>typeof i==`function`?i(t,n,e):r(i)}var la=ca(),ua=ca,da=typeof window<`u`&&window.__REDUX_DEVTOOLS_EXTENSION_COMPOSE__?window.__REDUX_DEVTOOLS_EXTENSION_COMPOSE__:function(){return arguments.length===0?void 0:typeof arguments[0]==`object`?si:si.apply(null,arguments)};typeof window<`u`&&window.__REDUX_DEVTOOLS_EXTENSION__&&window.__REDUX_DEVTOOLS_EXTENSION__;function fa(e,t){function n(...n){if(t){let r=t(...n);if(!r)throw Error(xo(0));return{type:e,payload:r.payload,...`meta`in r&&{meta:r.meta},...`error`in r&&{error:r.error}}}return{type:e,payload:n[0]}}return n.toString=()=>`${e}`,n.type=e,n.match=t=>li(t)&&t.type===e,n}var pa=class e extends Array{constructor(...t){super(...t),Object.setPrototypeOf(this,e.prototype)}static get[Symbol.species](){return e}concat(...e){return super.concat.apply(this,e)}prepend(...t){return t.length===1&&Array.isArray(t[0])?new e(...t[0].concat(this)):new e(...t.concat(this))}};function ma(e){return gi(e)?oa(e,()=>{}):e}function ha(e,t,n){return e.has(t)?e.get(t):e.set(t,n(t)).get(t)}function ga(e){return typeof e==`boolean`}var _a=()=>function(e){let{thunk:t=!0,immutableCheck:n=!0,serializableCheck:r=!0,actionCreatorCheck:i=!0}=e??{},a=new pa;return t&&(ga(t)?a.push(la):a.push(ua(t.extraArgument))),a},va=e=>t=>{setTimeout(t,e)},ya=(e={type:`raf`})=>t=>(...n)=>{let r=t(...n),i=!0,a=!1,o=!1,s=new Set,c=e.type===`tick`?queueMicrotask:e.type===`raf`?typeof window<`u`&&window.requestAnimationFrame?window.requestAnimationFrame:va(10):e.type===`callback`?e.queueNotification:va(e.timeout),l=()=>{o=!1,a&&(a=!1,s.forEach(e=>e()))};return Object.assign({},r,{subscribe(e){let t=r.subscribe(()=>i&&e());return s.add(e),()=>{t(),s.delete(e)}},dispatch(e){try{return i=!e?.meta?.RTK_autoBatch,a=!i,a&&(o||(o=!0,c(l))),r.dispatch(e)}finally{i=!0}}})},ba=e=>function(t){let{autoBatch:n=!0}=t??{},r=new pa(e);return n&&r.push(ya(typeof n==`object`?n:void 0)),r};function xa(e){let t=_a(),{reducer:n=void 0,middleware:r,devTools:i=!0,duplicateMiddlewareCheck:a=!0,preloadedState:o=void 0,enhancers:s=void 0}=e||{},c;if(typeof n==`function`)c=n;else if(ri(n))c=oi(n);else throw Error(xo(1));let l;l=typeof r==`function`?r(t):t();let u=si;i&&(u=da({trace:!1,...typeof i==`object`&&i}));let d=ci(...l),f=ba(d),p=typeof s==`function`?s(f):f(),m=u(...p);return ii(c,o,m)}function Sa(e){let t={},n=[],r,i={addCase(e,n){let r=typeof e==`string`?e:e.type;if(!r)throw Error(xo(28));if(r in t)throw Error(xo(29));return t[r]=n,i},addAsyncThunk(e,r){return r.pending&&(t[e.pending.type]=r.pending),r.rejected&&(t[e.rejected.type]=r.rejected),r.fulfilled&&(t[e.fulfilled.type]=r.fulfilled),r.settled&&n.push({matcher:e.settled,reducer:r.settled}),i},addMatcher(e,t){return n.push({matcher:e,reducer:t}),i},addDefaultCase(e){return r=e,i}};return e(i),[t,n,r]}function Ca(e){return typeof e==`function`}function wa(e,t){let[n,r,i]=Sa(t),a;if(Ca(e))a=()=>ma(e());else{let t=ma(e);a=()=>t}function o(e=a(),t){let o=[n[t.type],...r.filter(({matcher:e})=>e(t)).map(({reducer:e})=>e)];return o.filter(e=>!!e).length===0&&(o=[i]),o.reduce((e,n)=>{if(n)if(hi(e)){let r=n(e,t);return r===void 0?e:r}else if(gi(e))return oa(e,e=>n(e,t));else{let r=n(e,t);if(r===void 0){if(e===null)return e;throw Error(`A case reducer on a non-draftable value must not return undefined`)}return r}return e},e)}return o.getInitialState=a,o}var Ta=`ModuleSymbhasOwnPr-0123456789ABCDEFGHNRVfgctiUvz_KqYTJkLxpZXIjQW`,Ea=(e=21)=>{let t=``,n=e;for(;n--;)t+=Ta[Math.random()*64|0];return t},Da=Symbol.for(`rtk-slice-createasyncthunk`),Oa=(e=>(e.reducer=`reducer`,e.reducerWithPrepare=`reducerWithPrepare`,e.asyncThunk=`asyncThunk`,e))(Oa||{});function ka(e,t){return`${e}/${t}`}function Aa({creators:e}={}){let t=e?.asyncThunk?.[Da];return function(e){let{name:n,reducerPath:r=n}=e;if(!n)throw Error(xo(11));let i=(typeof e.reducers==`function`?e.reducers(Na()):e.reducers)||{},a=Object.keys(i),o={sliceCaseReducersByName:{},sliceCaseReducersByType:{},actionCreators:{},sliceMatchers:[]},s={addCase(e,t){let n=typeof e==`string`?e:e.type;if(!n)throw Error(xo(12));if(n in o.sliceCaseReducersByType)throw Error(xo(13));return o.sliceCaseReducersByType[n]=t,s},addMatcher(e,t){return o.sliceMatchers.push({matcher:e,reducer:t}),s},exposeAction(e,t){return o.actionCreators[e]=t,s},exposeCaseReducer(e,t){return o.sliceCaseReducersByName[e]=t,s}};a.forEach(r=>{let a=i[r],o={reducerName:r,type:ka(n,r),createNotation:typeof e.reducers==`function`};Fa(a)?La(o,a,s,t):Pa(o,a,s)});function c(){let[t={},n=[],r=void 0]=typeof e.extraReducers==`function`?Sa(e.extraReducers):[e.extraReducers],i={...t,...o.sliceCaseReducersByType};return wa(e.initialState,e=>{for(let t in i)e.addCase(t,i[t]);for(let t of o.sliceMatchers)e.addMatcher(t.matcher,t.reducer);for(let t of n)e.addMatcher(t.matcher,t.reducer);r&&e.addDefaultCase(r)})}let l=e=>e,u=new Map,d=new WeakMap,f;function p(e,t){return f||=c(),f(e,t)}function m(){return f||=c(),f.getInitialState()}function h(t,n=!1){function r(e){let i=e[t];return i===void 0&&n&&(i=ha(d,r,m)),i}function i(t=l){let r=ha(u,n,()=>new WeakMap);return ha(r,t,()=>{let r={};for(let[i,a]of Object.entries(e.selectors??{}))r[i]=ja(a,t,()=>ha(d,t,m),n);return r})}return{reducerPath:t,getSelectors:i,get selectors(){return i(r)},selectSlice:r}}let g={name:n,reducer:p,actions:o.actionCreators,caseReducers:o.sliceCaseReducersByName,getInitialState:m,...h(r),injectInto(e,{reducerPath:t,...n}={}){let i=t??r;return e.inject({reducerPath:i,reducer:p},n),{...g,...h(i,!0)}}};return g}}function ja(e,t,n,r){function i(i,...a){let o=t(i);return o===void 0&&r&&(o=n()),e(o,...a)}return i.unwrapped=e,i}var Ma=Aa();function Na(){function e(e,t){return{_reducerDefinitionType:`asyncThunk`,payloadCreator:e,...t}}return e.withTypes=()=>e,{reducer(e){return Object.assign({[e.name](...t){return e(...t)}}[e.name],{_reducerDefinitionType:`reducer`})},preparedReducer(e,t){return{_reducerDefinitionType:`reducerWithPrepare`,prepare:e,reducer:t}},asyncThunk:e}}function Pa({type:e,reducerName:t,createNotation:n},r,i){let a,o;if(`reducer`in r){if(n&&!Ia(r))throw Error(xo(17));a=r.reducer,o=r.prepare}else a=r;i.addCase(e,a).exposeCaseReducer(t,a).exposeAction(t,o?fa(e,o):fa(e))}function Fa(e){return e._reducerDefinitionType===`asyncThunk`}function Ia(e){return e._reducerDefinitionType===`reducerWithPrepare`}function La({type:e,reducerName:t},n,r,i){if(!i)throw Error(xo(18));let{payloadCreator:a,fulfilled:o,pending:s,rejected:c,settled:l,options:u}=n,d=i(e,a,u);r.exposeAction(t,d),o&&r.addCase(d.fulfilled,o),s&&r.addCase(d.pending,s),c&&r.addCase(d.rejected,c),l&&r.addMatcher(d.settled,l),r.exposeCaseReducer(t,{fulfilled:o||Ra,pending:s||Ra,rejected:c||Ra,settled:l||Ra})}function Ra(){}var za=`task`,Ba=`listener`,Va=`completed`,Ha=`cancelled`,Ua=`task-${Ha}`,Wa=`task-${Va}`,Ga=`${Ba}-${Ha}`,Ka=`${Ba}-${Va}`,qa=class{constructor(e){this.code=e,this.message=`${za} ${Ha} (reason: ${e})`}name=`TaskAbortError`;message},Ja=(e,t)=>{if(typeof e!=`function`)throw TypeError(xo(32))},Ya=()=>{},Xa=(e,t=Ya)=>(e.catch(t),e),Za=(e,t)=>(e.addEventListener(`abort`,t,{once:!0}),()=>e.removeEventListener(`abort`,t)),Qa=(e,t)=>{let n=e.signal;n.aborted||(`reason`in n||Object.defineProperty(n,`reason`,{enumerable:!0,value:t,configurable:!0,writable:!0}),e.abort(t))},$a=e=>{if(e.aborted){let{reason:t}=e;throw new qa(t)}};function eo(e,t){let n=Ya;return new Promise((r,i)=>{let a=()=>i(new qa(e.reason));if(e.aborted){a();return}n=Za(e,a),t.finally(()=>n()).then(r,i)}).finally(()=>{n=Ya})}var to=async(e,t)=>{try{return await Promise.resolve(),{status:`ok`,value:await e()}}catch(e){return{status:e instanceof qa?`cancelled`:`rejected`,error:e}}finally{t?.()}},no=e=>t=>Xa(eo(e,t).then(t=>($a(e),t))),ro=e=>{let t=no(e);return e=>t(new Promise(t=>setTimeout(t,e)))},{assign:io}=Object,ao={},oo=`listenerMiddleware`,so=(e,t)=>{let n=t=>Za(e,()=>Qa(t,e.reason));return(r,i)=>{Ja(r,`taskExecutor`);let a=new AbortController;n(a);let o=to(async()=>{$a(e),$a(a.signal);let t=await r({pause:no(a.signal),delay:ro(a.signal),signal:a.signal});return $a(a.signal),t},()=>Qa(a,Wa));return i?.autoJoin&&t.push(o.catch(Ya)),{result:no(e)(o),cancel(){Qa(a,Ua)}}}},co=(e,t)=>{let n=async(n,r)=>{$a(t);let i=()=>{},a=[new Promise((t,r)=>{let a=e({predicate:n,effect:(e,n)=>{n.unsubscribe(),t([e,n.getState(),n.getOriginalState()])}});i=()=>{a(),r()}})];r!=null&&a.push(new Promise(e=>setTimeout(e,r,null)));try{let e=await eo(t,Promise.race(a));return $a(t),e}finally{i()}};return(e,t)=>Xa(n(e,t))},lo=e=>{let{type:t,actionCreator:n,matcher:r,predicate:i,effect:a}=e;if(t)i=fa(t).match;else if(n)t=n.type,i=n.match;else if(r)i=r;else if(!i)throw Error(xo(21));return Ja(a,`options.listener`),{predicate:i,type:t,effect:a}},uo=io(e=>{let{type:t,predicate:n,effect:r}=lo(e);return{id:Ea(),effect:r,type:t,predicate:n,pending:new Set,unsubscribe:()=>{throw Error(xo(22))}}},{withTypes:()=>uo}),fo=(e,t)=>{let{type:n,effect:r,predicate:i}=lo(t);return Array.from(e.values()).find(e=>(typeof n==`string`?e.type===n:e.predicate===i)&&e.effect===r)},po=e=>{e.pending.forEach(e=>{Qa(e,Ga)})},mo=(e,t)=>()=>{for(let e of t.keys())po(e);e.clear()},ho=(e,t,n)=>{try{e(t,n)}catch(e){setTimeout(()=>{throw e},0)}},go=io(fa(`${oo}/add`),{withTypes:()=>go}),_o=fa(`${oo}/removeAll`),vo=io(fa(`${oo}/remove`),{withTypes:()=>vo}),yo=(...e)=>{console.error(`${oo}/error`,...e)},bo=(e={})=>{let t=new Map,n=new Map,r=e=>{let t=n.get(e)??0;n.set(e,t+1)},i=e=>{let t=n.get(e)??1;t===1?n.delete(e):n.set(e,t-1)},{extra:a,onError:o=yo}=e;Ja(o,`onError`);let s=e=>(e.unsubscribe=()=>t.delete(e.id),t.set(e.id,e),t=>{e.unsubscribe(),t?.cancelActive&&po(e)}),c=e=>{let n=fo(t,e)??uo(e);return s(n)};io(c,{withTypes:()=>c});let l=e=>{let n=fo(t,e);return n&&(n.unsubscribe(),e.cancelActive&&po(n)),!!n};io(l,{withTypes:()=>l});let u=async(e,n,s,l)=>{let u=new AbortController,d=co(c,u.signal),f=[];try{e.pending.add(u),r(e),await Promise.resolve(e.effect(n,io({},s,{getOriginalState:l,condition:(e,t)=>d(e,t).then(Boolean),take:d,delay:ro(u.signal),pause:no(u.signal),extra:a,signal:u.signal,fork:so(u.signal,f),unsubscribe:e.unsubscribe,subscribe:()=>{t.set(e.id,e)},cancelActiveListeners:()=>{e.pending.forEach((e,t,n)=>{e!==u&&(Qa(e,Ga),n.delete(e))})},cancel:()=>{Qa(u,Ga),e.pending.delete(u)},throwIfCancelled:()=>{$a(u.signal)}})))}catch(e){e instanceof qa||ho(o,e,{raisedBy:`effect`})}finally{await Promise.all(f),Qa(u,Ka),i(e),e.pending.delete(u)}},d=mo(t,n);return{middleware:e=>n=>r=>{if(!li(r))return n(r);if(go.match(r))return c(r.payload);if(_o.match(r)){d();return}if(vo.match(r))return l(r.payload);let i=e.getState(),a=()=>{if(i===ao)throw Error(xo(23));return i},s;try{if(s=n(r),t.size>0){let n=e.getState(),s=Array.from(t.values());for(let t of s){let s=!1;try{s=t.predicate(r,n,i)}catch(e){s=!1,ho(o,e,{raisedBy:`predicate`})}if(!s)continue;u(t,r,e,a)}}}finally{i=ao}return s},startListening:c,stopListening:l,clearListeners:d}};function xo(e){return`Minified Redux Toolkit error #${e}; visit https://redux-toolkit.js.org/Errors?code=${e} for the full message or use the non-minified dev environment for full errors. `}var So=Ma({name:`chartLayout`,initialState:{layoutType:`horizontal`,width:0,height:0,margin:{top:5,right:5,bottom:5,left:5},scale:1},reducers:{setLayout(e,t){e.layoutType=t.payload},setChartSize(e,t){e.width=t.payload.width,e.height=t.payload.height},setMargin(e,t){e.margin.top=t.payload.top??0,e.margin.right=t.payload.right??0,e.margin.bottom=t.payload.bottom??0,e.margin.left=t.payload.left??0},setScale(e,t){e.scale=t.payload}}}),{setMargin:Co,setLayout:wo,setChartSize:To,setScale:Eo}=So.actions,Do=So.reducer;function Oo(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function ko(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?Oo(Object(n),!0).forEach(function(t){Ao(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Oo(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function Ao(e,t,n){return(t=jo(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function jo(e){var t=Mo(e,`string`);return typeof t==`symbol`?t:t+``}function Mo(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}var No=Math.PI/180,Po=e=>e*Math.PI/180,Fo=e=>e*180/Math.PI,R=(e,t,n,r)=>({x:e+Math.cos(-No*r)*n,y:t+Math.sin(-No*r)*n}),Io=function(e,t){var n=arguments.length>2&&arguments[2]!==void 0?arguments[2]:{top:0,right:0,bottom:0,left:0,width:0,height:0,brushBottom:0};return Math.min(Math.abs(e-(n.left||0)-(n.right||0)),Math.abs(t-(n.top||0)-(n.bottom||0)))/2},Lo=(e,t)=>{var{x:n,y:r}=e,{x:i,y:a}=t;return Math.sqrt((n-i)**2+(r-a)**2)},Ro=(e,t)=>{var{x:n,y:r}=e,{cx:i,cy:a}=t,o=Lo({x:n,y:r},{x:i,y:a});if(o<=0)return{radius:o,angle:0};var s=(n-i)/o,c=Math.acos(s);return r>a&&(c=2*Math.PI-c),{radius:o,angle:Fo(c),angleInRadian:c}},zo=e=>{var{startAngle:t,endAngle:n}=e,r=Math.floor(t/360),i=Math.floor(n/360),a=Math.min(r,i);return{startAngle:t-a*360,endAngle:n-a*360}},Bo=(e,t)=>{var{startAngle:n,endAngle:r}=t,i=Math.floor(n/360),a=Math.floor(r/360);return e+Math.min(i,a)*360},Vo=(e,t)=>{var{x:n,y:r}=e,{radius:i,angle:a}=Ro({x:n,y:r},t),{innerRadius:o,outerRadius:s}=t;if(i<o||i>s||i===0)return null;var{startAngle:c,endAngle:l}=zo(t),u=a,d;if(c<=l){for(;u>l;)u-=360;for(;u<c;)u+=360;d=u>=c&&u<=l}else{for(;u>c;)u-=360;for(;u<l;)u+=360;d=u>=l&&u<=c}return d?ko(ko({},t),{},{radius:i,angle:Bo(u,t)}):null},Ho=e=>!(0,A.isValidElement)(e)&&typeof e!=`function`&&typeof e!=`boolean`&&e!=null?e.className:``;function Uo(e,t,n){return Array.isArray(e)&&e&&t+n!==0?e.slice(t,n+1):e}var Wo=e(Gr()),Go=e(h());function Ko(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function qo(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?Ko(Object(n),!0).forEach(function(t){Jo(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Ko(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function Jo(e,t,n){return(t=Yo(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Yo(e){var t=Xo(e,`string`);return typeof t==`symbol`?t:t+``}function Xo(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function z(e,t,n){return k(e)||k(t)?n:x(t)?(0,Go.default)(e,t,n):typeof t==`function`?t(e):n}var Zo=(e,t,n,r,i)=>{var a=-1,o=t?.length??0;if(o<=1||e==null)return 0;if(r===`angleAxis`&&i!=null&&Math.abs(Math.abs(i[1]-i[0])-360)<=1e-6)for(var s=0;s<o;s++){var c=s>0?n[s-1].coordinate:n[o-1].coordinate,l=n[s].coordinate,u=s>=o-1?n[0].coordinate:n[s+1].coordinate,d=void 0;if(_(l-c)!==_(u-l)){var f=[];if(_(u-l)===_(i[1]-i[0])){d=u;var p=l+i[1]-i[0];f[0]=Math.min(p,(p+c)/2),f[1]=Math.max(p,(p+c)/2)}else{d=c;var m=u+i[1]-i[0];f[0]=Math.min(l,(m+l)/2),f[1]=Math.max(l,(m+l)/2)}var h=[Math.min(l,(d+l)/2),Math.max(l,(d+l)/2)];if(e>h[0]&&e<=h[1]||e>=f[0]&&e<=f[1]){({index:a}=n[s]);break}}else{var g=Math.min(c,u),v=Math.max(c,u);if(e>(g+l)/2&&e<=(v+l)/2){({index:a}=n[s]);break}}}else if(t){for(var y=0;y<o;y++)if(y===0&&e<=(t[y].coordinate+t[y+1].coordinate)/2||y>0&&y<o-1&&e>(t[y].coordinate+t[y-1].coordinate)/2&&e<=(t[y].coordinate+t[y+1].coordinate)/2||y===o-1&&e>(t[y].coordinate+t[y-1].coordinate)/2){({index:a}=t[y]);break}}return a},Qo=(e,t,n)=>{if(t&&n){var{width:r,height:i}=n,{align:a,verticalAlign:o,layout:s}=t;if((s===`vertical`||s===`horizontal`&&o===`middle`)&&a!==`center`&&b(e[a]))return qo(qo({},e),{},{[a]:e[a]+(r||0)});if((s===`horizontal`||s===`vertical`&&a===`center`)&&o!==`middle`&&b(e[o]))return qo(qo({},e),{},{[o]:e[o]+(i||0)})}return e},$o=(e,t)=>e===`horizontal`&&t===`xAxis`||e===`vertical`&&t===`yAxis`||e===`centric`&&t===`angleAxis`||e===`radial`&&t===`radiusAxis`,es=(e,t,n,r)=>{if(r)return e.map(e=>e.coordinate);var i,a,o=e.map(e=>(e.coordinate===t&&(i=!0),e.coordinate===n&&(a=!0),e.coordinate));return i||o.push(t),a||o.push(n),o},ts=(e,t,n)=>{if(!e)return null;var{duplicateDomain:r,type:i,range:a,scale:o,realScaleType:s,isCategorical:c,categoricalDomain:l,tickCount:u,ticks:d,niceTicks:f,axisType:p}=e;if(!o)return null;var m=s===`scaleBand`&&o.bandwidth?o.bandwidth()/2:2,h=(t||n)&&i===`category`&&o.bandwidth?o.bandwidth()/m:0;return h=p===`angleAxis`&&a&&a.length>=2?_(a[0]-a[1])*2*h:h,t&&(d||f)?(d||f||[]).map((e,t)=>{var n=r?r.indexOf(e):e;return{coordinate:o(n)+h,value:e,offset:h,index:t}}).filter(e=>!v(e.coordinate)):c&&l?l.map((e,t)=>({coordinate:o(e)+h,value:e,index:t,offset:h})):o.ticks&&!n&&u!=null?o.ticks(u).map((e,t)=>({coordinate:o(e)+h,value:e,offset:h,index:t})):o.domain().map((e,t)=>({coordinate:o(e)+h,value:r?r[e]:e,index:t,offset:h}))},ns=1e-4,rs=e=>{var t=e.domain();if(!(!t||t.length<=2)){var n=t.length,r=e.range(),i=Math.min(r[0],r[1])-ns,a=Math.max(r[0],r[1])+ns,o=e(t[0]),s=e(t[n-1]);(o<i||o>a||s<i||s>a)&&e.domain([t[0],t[n-1]])}},os=(e,t)=>{if(!t||t.length!==2||!b(t[0])||!b(t[1]))return e;var n=Math.min(t[0],t[1]),r=Math.max(t[0],t[1]),i=[e[0],e[1]];return(!b(e[0])||e[0]<n)&&(i[0]=n),(!b(e[1])||e[1]>r)&&(i[1]=r),i[0]>r&&(i[0]=r),i[1]<n&&(i[1]=n),i},ss={sign:e=>{var t=e.length;if(!(t<=0))for(var n=0,r=e[0].length;n<r;++n)for(var i=0,a=0,o=0;o<t;++o){var s=v(e[o][n][1])?e[o][n][0]:e[o][n][1];s>=0?(e[o][n][0]=i,e[o][n][1]=i+s,i=e[o][n][1]):(e[o][n][0]=a,e[o][n][1]=a+s,a=e[o][n][1])}},expand:Qt,none:qt,silhouette:$t,wiggle:en,positive:e=>{var t=e.length;if(!(t<=0))for(var n=0,r=e[0].length;n<r;++n)for(var i=0,a=0;a<t;++a){var o=v(e[a][n][1])?e[a][n][0]:e[a][n][1];o>=0?(e[a][n][0]=i,e[a][n][1]=i+o,i=e[a][n][1]):(e[a][n][0]=0,e[a][n][1]=0)}}},cs=(e,t,n)=>{var r=ss[n];return Zt().keys(t).value((e,t)=>+z(e,t,0)).order(Jt).offset(r)(e)};function ls(e){return e==null?void 0:String(e)}function us(e){var{axis:t,ticks:n,bandSize:r,entry:i,index:a,dataKey:o}=e;if(t.type===`category`){if(!t.allowDuplicatedCategory&&t.dataKey&&!k(i[t.dataKey])){var s=O(n,`value`,i[t.dataKey]);if(s)return s.coordinate+r/2}return n[a]?n[a].coordinate+r/2:null}var c=z(i,k(o)?t.dataKey:o);return k(c)?null:t.scale(c)}var ds=e=>{var{axis:t,ticks:n,offset:r,bandSize:i,entry:a,index:o}=e;if(t.type===`category`)return n[o]?n[o].coordinate+r:null;var s=z(a,t.dataKey,t.scale.domain()[o]);return k(s)?null:t.scale(s)-i/2+r},fs=e=>{var{numericAxis:t}=e,n=t.scale.domain();if(t.type===`number`){var r=Math.min(n[0],n[1]),i=Math.max(n[0],n[1]);return r<=0&&i>=0?0:i<0?i:r}return n[0]},ps=e=>{var t=e.flat(2).filter(b);return[Math.min(...t),Math.max(...t)]},ms=e=>[e[0]===1/0?0:e[0],e[1]===-1/0?0:e[1]],hs=(e,t,n)=>{if(e!=null)return ms(Object.keys(e).reduce((r,i)=>{var{stackedData:a}=e[i],o=a.reduce((e,r)=>{var i=Uo(r,t,n),a=ps(i);return[Math.min(e[0],a[0]),Math.max(e[1],a[1])]},[1/0,-1/0]);return[Math.min(o[0],r[0]),Math.max(o[1],r[1])]},[1/0,-1/0]))},gs=/^dataMin[\s]*-[\s]*([0-9]+([.]{1}[0-9]+){0,1})$/,_s=/^dataMax[\s]*\+[\s]*([0-9]+([.]{1}[0-9]+){0,1})$/,vs=(e,t,n)=>{if(e&&e.scale&&e.scale.bandwidth){var r=e.scale.bandwidth();if(!n||r>0)return r}if(e&&t&&t.length>=2){for(var i=(0,Wo.default)(t,e=>e.coordinate),a=1/0,o=1,s=i.length;o<s;o++){var c=i[o],l=i[o-1];a=Math.min((c.coordinate||0)-(l.coordinate||0),a)}return a===1/0?0:a}return n?void 0:0};function ys(e){var{tooltipEntrySettings:t,dataKey:n,payload:r,value:i,name:a}=e;return qo(qo({},t),{},{dataKey:n,payload:r,value:i,name:a})}function bs(e,t){if(e)return String(e);if(typeof t==`string`)return t}function xs(e,t,n,r,i){return n===`horizontal`||n===`vertical`?e>=i.left&&e<=i.left+i.width&&t>=i.top&&t<=i.top+i.height?{x:e,y:t}:null:r?Vo({x:e,y:t},r):null}var Ss=(e,t,n,r)=>{var i=t.find(e=>e&&e.index===n);if(i){if(e===`horizontal`)return{x:i.coordinate,y:r.y};if(e===`vertical`)return{x:r.x,y:i.coordinate};if(e===`centric`){var a=i.coordinate,{radius:o}=r;return qo(qo(qo({},r),R(r.cx,r.cy,o,a)),{},{angle:a,radius:o})}var s=i.coordinate,{angle:c}=r;return qo(qo(qo({},r),R(r.cx,r.cy,s,c)),{},{angle:c,radius:s})}return{x:0,y:0}},Cs=(e,t)=>t===`horizontal`?e.x:t===`vertical`?e.y:t===`centric`?e.angle:e.radius,ws=e=>e.layout.width,Ts=e=>e.layout.height,Es=e=>e.layout.scale,Ds=e=>e.layout.margin,Os=L(e=>e.cartesianAxis.xAxis,e=>Object.values(e)),ks=L(e=>e.cartesianAxis.yAxis,e=>Object.values(e)),As=[`#1890FF`,`#66B5FF`,`#41D9C7`,`#2FC25B`,`#6EDB8F`,`#9AE65C`,`#FACC14`,`#E6965C`,`#57AD71`,`#223273`,`#738AE6`,`#7564CC`,`#8543E0`,`#A877ED`,`#5C8EE6`,`#13C2C2`,`#70E0E0`,`#5CA3E6`,`#3436C7`,`#8082FF`,`#DD81E6`,`#F04864`,`#FA7D92`,`#D598D9`],js=`data-recharts-item-index`,Ms=`data-recharts-item-data-key`;function Ns(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function Ps(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?Ns(Object(n),!0).forEach(function(t){Fs(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Ns(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function Fs(e,t,n){return(t=Is(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Is(e){var t=Ls(e,`string`);return typeof t==`symbol`?t:t+``}function Ls(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}var Rs=e=>e.brush.height;function zs(e){return ks(e).reduce((e,t)=>{if(t.orientation===`left`&&!t.mirror&&!t.hide){var n=typeof t.width==`number`?t.width:60;return e+n}return e},0)}function Bs(e){return ks(e).reduce((e,t)=>{if(t.orientation===`right`&&!t.mirror&&!t.hide){var n=typeof t.width==`number`?t.width:60;return e+n}return e},0)}function Vs(e){return Os(e).reduce((e,t)=>t.orientation===`top`&&!t.mirror&&!t.hide?e+t.height:e,0)}function Hs(e){return Os(e).reduce((e,t)=>t.orientation===`bottom`&&!t.mirror&&!t.hide?e+t.height:e,0)}var Us=L([ws,Ts,Ds,Rs,zs,Bs,Vs,Hs,qr,Jr],(e,t,n,r,i,a,o,s,c,l)=>{var u={left:(n.left||0)+i,right:(n.right||0)+a},d={top:(n.top||0)+o,bottom:(n.bottom||0)+s},f=Ps(Ps({},d),u),p=f.bottom;f.bottom+=r,f=Qo(f,c,l);var m=e-f.left-f.right,h=t-f.top-f.bottom;return Ps(Ps({brushBottom:p},f),{},{width:Math.max(m,0),height:Math.max(h,0)})}),Ws=L(Us,e=>({x:e.left,y:e.top,width:e.width,height:e.height})),Gs=L(ws,Ts,(e,t)=>({x:0,y:0,width:e,height:t})),Ks=(0,A.createContext)(null),B=()=>(0,A.useContext)(Ks)!=null,qs=e=>{var{children:t}=e;return A.createElement(Ks.Provider,{value:!0},t)},Js=e=>e.brush,Ys=L([Js,Us,Ds],(e,t,n)=>({height:e.height,x:b(e.x)?e.x:t.left,y:b(e.y)?e.y:t.top+t.height+t.brushBottom-(n?.bottom||0),width:b(e.width)?e.width:t.width})),Xs=()=>{var e=B(),t=I(Ws),n=I(Ys),r=I(Js)?.padding;return!e||!n||!r?t:{width:n.width-r.left-r.right,height:n.height-r.top-r.bottom,x:r.left,y:r.top}},Zs={top:0,bottom:0,left:0,right:0,width:0,height:0,brushBottom:0},Qs=()=>I(Us)??Zs,$s=()=>I(ws),ec=()=>I(Ts),tc=()=>I(e=>e.layout.margin),V=e=>e.layout.layoutType,nc=()=>I(V),rc=e=>{var t=F();return(0,A.useEffect)(()=>{t(To(e))},[t,e]),null},ic=e=>{var{margin:t}=e,n=F();return(0,A.useEffect)(()=>{n(Co(t))},[n,t]),null},ac=Ma({name:`legend`,initialState:{settings:{layout:`horizontal`,align:`center`,verticalAlign:`middle`,itemSorter:`value`},size:{width:0,height:0},payload:[]},reducers:{setLegendSize(e,t){e.size.width=t.payload.width,e.size.height=t.payload.height},setLegendSettings(e,t){e.settings.align=t.payload.align,e.settings.layout=t.payload.layout,e.settings.verticalAlign=t.payload.verticalAlign,e.settings.itemSorter=t.payload.itemSorter},addLegendPayload(e,t){e.payload.push(sa(t.payload))},removeLegendPayload(e,t){var n=ra(e).payload.indexOf(sa(t.payload));n>-1&&e.payload.splice(n,1)}}}),{setLegendSize:oc,setLegendSettings:sc,addLegendPayload:cc,removeLegendPayload:lc}=ac.actions,uc=ac.reducer,dc=e(i()),fc=[`contextPayload`];function pc(){return pc=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},pc.apply(null,arguments)}function mc(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function hc(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?mc(Object(n),!0).forEach(function(t){gc(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):mc(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function gc(e,t,n){return(t=_c(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function _c(e){var t=vc(e,`string`);return typeof t==`symbol`?t:t+``}function vc(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function yc(e,t){if(e==null)return{};var n,r,i=bc(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function bc(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}function xc(e){return e.value}function Sc(e){var{contextPayload:t}=e,n=yc(e,fc),r=$n(t,e.payloadUniqBy,xc),i=hc(hc({},n),{},{payload:r});return A.isValidElement(e.content)?A.cloneElement(e.content,i):typeof e.content==`function`?A.createElement(e.content,i):A.createElement(wn,i)}function Cc(e,t,n,r,i,a){var{layout:o,align:s,verticalAlign:c}=t,l,u;return(!e||(e.left===void 0||e.left===null)&&(e.right===void 0||e.right===null))&&(l=s===`center`&&o===`vertical`?{left:((r||0)-a.width)/2}:s===`right`?{right:n&&n.right||0}:{left:n&&n.left||0}),(!e||(e.top===void 0||e.top===null)&&(e.bottom===void 0||e.bottom===null))&&(u=c===`middle`?{top:((i||0)-a.height)/2}:c===`bottom`?{bottom:n&&n.bottom||0}:{top:n&&n.top||0}),hc(hc({},l),u)}function wc(e){var t=F();return(0,A.useEffect)(()=>{t(sc(e))},[t,e]),null}function Tc(e){var t=F();return(0,A.useEffect)(()=>(t(oc(e)),()=>{t(oc({width:0,height:0}))}),[t,e]),null}function Ec(e){var t=Xr(),n=je(),r=tc(),{width:i,height:a,wrapperStyle:o,portal:s}=e,[c,l]=Qr([t]),u=$s(),d=ec();if(u==null||d==null)return null;var f=u-(r.left||0)-(r.right||0),p=Dc.getWidthOrHeight(e.layout,a,i,f),m=s?o:hc(hc({position:`absolute`,width:p?.width||i||`auto`,height:p?.height||a||`auto`},Cc(o,e,r,u,d,c)),o),h=s??n;if(h==null)return null;var g=A.createElement(`div`,{className:`recharts-legend-wrapper`,style:m,ref:l},A.createElement(wc,{layout:e.layout,align:e.align,verticalAlign:e.verticalAlign,itemSorter:e.itemSorter}),A.createElement(Tc,{width:c.width,height:c.height}),A.createElement(Sc,pc({},e,p,{margin:r,chartWidth:u,chartHeight:d,contextPayload:t})));return(0,dc.createPortal)(g,h)}var Dc=class extends A.PureComponent{static getWidthOrHeight(e,t,n,r){return e===`vertical`&&b(t)?{height:t}:e===`horizontal`?{width:n||r}:null}render(){return A.createElement(Ec,this.props)}};gc(Dc,`displayName`,`Legend`),gc(Dc,`defaultProps`,{align:`center`,iconSize:14,itemSorter:`value`,layout:`horizontal`,verticalAlign:`bottom`});var Oc=e(Gr());function kc(){return kc=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},kc.apply(null,arguments)}function Ac(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function jc(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?Ac(Object(n),!0).forEach(function(t){Mc(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Ac(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function Mc(e,t,n){return(t=Nc(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Nc(e){var t=Pc(e,`string`);return typeof t==`symbol`?t:t+``}function Pc(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function Fc(e){return Array.isArray(e)&&x(e[0])&&x(e[1])?e.join(` ~ `):e}var Ic=e=>{var{separator:t=` : `,contentStyle:n={},itemStyle:r={},labelStyle:i={},payload:a,formatter:o,itemSorter:s,wrapperClassName:l,labelClassName:u,label:d,labelFormatter:f,accessibilityLayer:p=!1}=e,m=()=>{if(a&&a.length){var e={padding:0,margin:0},n=(s?(0,Oc.default)(a,s):a).map((e,n)=>{if(e.type===`none`)return null;var i=e.formatter||o||Fc,{value:s,name:c}=e,l=s,u=c;if(i){var d=i(s,c,e,n,a);if(Array.isArray(d))[l,u]=d;else if(d!=null)l=d;else return null}var f=jc({display:`block`,paddingTop:4,paddingBottom:4,color:e.color||`#000`},r);return A.createElement(`li`,{className:`recharts-tooltip-item`,key:`tooltip-item-${n}`,style:f},x(u)?A.createElement(`span`,{className:`recharts-tooltip-item-name`},u):null,x(u)?A.createElement(`span`,{className:`recharts-tooltip-item-separator`},t):null,A.createElement(`span`,{className:`recharts-tooltip-item-value`},l),A.createElement(`span`,{className:`recharts-tooltip-item-unit`},e.unit||``))});return A.createElement(`ul`,{className:`recharts-tooltip-item-list`,style:e},n)}return null},h=jc({margin:0,padding:10,backgroundColor:`#fff`,border:`1px solid #ccc`,whiteSpace:`nowrap`},n),g=jc({margin:0},i),_=!k(d),v=_?d:``,y=c(`recharts-default-tooltip`,l),b=c(`recharts-tooltip-label`,u);_&&f&&a!=null&&(v=f(d,a));var S=p?{role:`status`,"aria-live":`assertive`}:{};return A.createElement(`div`,kc({className:y,style:h},S),A.createElement(`p`,{className:b,style:g},A.isValidElement(v)?v:`${v}`),m())},Lc=`recharts-tooltip-wrapper`,Rc={visibility:`hidden`};function zc(e){var{coordinate:t,translateX:n,translateY:r}=e;return c(Lc,{[`${Lc}-right`]:b(n)&&t&&b(t.x)&&n>=t.x,[`${Lc}-left`]:b(n)&&t&&b(t.x)&&n<t.x,[`${Lc}-bottom`]:b(r)&&t&&b(t.y)&&r>=t.y,[`${Lc}-top`]:b(r)&&t&&b(t.y)&&r<t.y})}function Bc(e){var{allowEscapeViewBox:t,coordinate:n,key:r,offsetTopLeft:i,position:a,reverseDirection:o,tooltipDimension:s,viewBox:c,viewBoxDimension:l}=e;if(a&&b(a[r]))return a[r];var u=n[r]-s-(i>0?i:0),d=n[r]+i;if(t[r])return o[r]?u:d;var f=c[r];if(f==null)return 0;if(o[r])return u<f?Math.max(d,f):Math.max(u,f);if(l==null)return 0;var p=d+s,m=f+l;return p>m?Math.max(u,f):Math.max(d,f)}function Vc(e){var{translateX:t,translateY:n,useTranslate3d:r}=e;return{transform:r?`translate3d(${t}px, ${n}px, 0)`:`translate(${t}px, ${n}px)`}}function Hc(e){var{allowEscapeViewBox:t,coordinate:n,offsetTopLeft:r,position:i,reverseDirection:a,tooltipBox:o,useTranslate3d:s,viewBox:c}=e,l,u,d;return o.height>0&&o.width>0&&n?(u=Bc({allowEscapeViewBox:t,coordinate:n,key:`x`,offsetTopLeft:r,position:i,reverseDirection:a,tooltipDimension:o.width,viewBox:c,viewBoxDimension:c.width}),d=Bc({allowEscapeViewBox:t,coordinate:n,key:`y`,offsetTopLeft:r,position:i,reverseDirection:a,tooltipDimension:o.height,viewBox:c,viewBoxDimension:c.height}),l=Vc({translateX:u,translateY:d,useTranslate3d:s})):l=Rc,{cssProperties:l,cssClasses:zc({translateX:u,translateY:d,coordinate:n})}}function Uc(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function Wc(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?Uc(Object(n),!0).forEach(function(t){Gc(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Uc(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function Gc(e,t,n){return(t=Kc(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Kc(e){var t=qc(e,`string`);return typeof t==`symbol`?t:t+``}function qc(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}var Jc=class extends A.PureComponent{constructor(){super(...arguments),Gc(this,`state`,{dismissed:!1,dismissedAtCoordinate:{x:0,y:0}}),Gc(this,`handleKeyDown`,e=>{e.key===`Escape`&&this.setState({dismissed:!0,dismissedAtCoordinate:{x:this.props.coordinate?.x??0,y:this.props.coordinate?.y??0}})})}componentDidMount(){document.addEventListener(`keydown`,this.handleKeyDown)}componentWillUnmount(){document.removeEventListener(`keydown`,this.handleKeyDown)}componentDidUpdate(){this.state.dismissed&&(this.props.coordinate?.x!==this.state.dismissedAtCoordinate.x||this.props.coordinate?.y!==this.state.dismissedAtCoordinate.y)&&(this.state.dismissed=!1)}render(){var{active:e,allowEscapeViewBox:t,animationDuration:n,animationEasing:r,children:i,coordinate:a,hasPayload:o,isAnimationActive:s,offset:c,position:l,reverseDirection:u,useTranslate3d:d,viewBox:f,wrapperStyle:p,lastBoundingBox:m,innerRef:h,hasPortalFromProps:g}=this.props,{cssClasses:_,cssProperties:v}=Hc({allowEscapeViewBox:t,coordinate:a,offsetTopLeft:c,position:l,reverseDirection:u,tooltipBox:{height:m.height,width:m.width},useTranslate3d:d,viewBox:f}),y=g?{}:Wc(Wc({transition:s&&e?`transform ${n}ms ${r}`:void 0},v),{},{pointerEvents:`none`,visibility:!this.state.dismissed&&e&&o?`visible`:`hidden`,position:`absolute`,top:0,left:0}),b=Wc(Wc({},y),{},{visibility:!this.state.dismissed&&e&&o?`visible`:`hidden`},p);return A.createElement(`div`,{xmlns:`http://www.w3.org/1999/xhtml`,tabIndex:-1,className:_,style:b,ref:h},i)}},Yc={devToolsEnabled:!1,isSsr:(()=>!(typeof window<`u`&&window.document&&window.document.createElement&&window.setTimeout))()},Xc=()=>I(e=>e.rootProps.accessibilityLayer);function Zc(e){return Number.isFinite(e)}function Qc(e){return typeof e==`number`&&e>0&&Number.isFinite(e)}function $c(){return $c=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},$c.apply(null,arguments)}function el(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function tl(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?el(Object(n),!0).forEach(function(t){nl(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):el(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function nl(e,t,n){return(t=rl(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function rl(e){var t=il(e,`string`);return typeof t==`symbol`?t:t+``}function il(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}var al={curveBasisClosed:Et,curveBasisOpen:Ot,curveBasis:wt,curveBumpX:et,curveBumpY:tt,curveLinearClosed:At,curveLinear:Je,curveMonotoneX:Rt,curveMonotoneY:zt,curveNatural:Ht,curveStep:Wt,curveStepAfter:Kt,curveStepBefore:Gt},ol=e=>Zc(e.x)&&Zc(e.y),sl=e=>e.x,cl=e=>e.y,ll=(e,t)=>{if(typeof e==`function`)return e;var n=`curve${te(e)}`;return(n===`curveMonotone`||n===`curveBump`)&&t?al[`${n}${t===`vertical`?`Y`:`X`}`]:al[n]||Je},ul=e=>{var{type:t=`linear`,points:n=[],baseLine:r,layout:i,connectNulls:a=!1}=e,o=ll(t,i),s=a?n.filter(ol):n,c;if(Array.isArray(r)){var l=a?r.filter(e=>ol(e)):r,u=s.map((e,t)=>tl(tl({},e),{},{base:l[t]}));return c=i===`vertical`?Qe().y(cl).x1(sl).x0(e=>e.base.x):Qe().x(sl).y1(cl).y0(e=>e.base.y),c.defined(ol).curve(o),c(u)}return c=i===`vertical`&&b(r)?Qe().y(cl).x1(sl).x0(r):b(r)?Qe().x(sl).y1(cl).y0(r):Ze().x(sl).y(cl),c.defined(ol).curve(o),c(s)},dl=e=>{var{className:t,points:n,path:r,pathRef:i}=e;if((!n||!n.length)&&!r)return null;var a=n&&n.length?ul(e):r;return A.createElement(`path`,$c({},j(e),se(e),{className:c(`recharts-curve`,t),d:a===null?void 0:a,ref:i}))},fl=[`x`,`y`,`top`,`left`,`width`,`height`,`className`];function pl(){return pl=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},pl.apply(null,arguments)}function ml(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function hl(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?ml(Object(n),!0).forEach(function(t){gl(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):ml(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function gl(e,t,n){return(t=_l(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function _l(e){var t=vl(e,`string`);return typeof t==`symbol`?t:t+``}function vl(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function yl(e,t){if(e==null)return{};var n,r,i=bl(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function bl(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}var xl=(e,t,n,r,i,a)=>`M${e},${i}v${r}M${a},${t}h${n}`,Sl=e=>{var{x:t=0,y:n=0,top:r=0,left:i=0,width:a=0,height:o=0,className:s}=e,l=yl(e,fl),u=hl({x:t,y:n,top:r,left:i,width:a,height:o},l);return!b(t)||!b(n)||!b(a)||!b(o)||!b(r)||!b(i)?null:A.createElement(`path`,pl({},M(u,!0),{className:c(`recharts-cross`,s),d:xl(t,n,a,o,r,i)}))};function Cl(e,t,n,r){var i=r/2;return{stroke:`none`,fill:`#ccc`,x:e===`horizontal`?t.x-i:n.left+.5,y:e===`horizontal`?n.top+.5:t.y-i,width:e===`horizontal`?r:n.width-1,height:e===`horizontal`?n.height-1:r}}function wl(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function Tl(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?wl(Object(n),!0).forEach(function(t){El(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):wl(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function El(e,t,n){return(t=Dl(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Dl(e){var t=Ol(e,`string`);return typeof t==`symbol`?t:t+``}function Ol(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function H(e,t){var n=Tl({},e),r=t;return Object.keys(t).reduce((e,t)=>(e[t]===void 0&&r[t]!==void 0&&(e[t]=r[t]),e),n)}function kl(){}function Al(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function jl(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?Al(Object(n),!0).forEach(function(t){Ml(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Al(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function Ml(e,t,n){return(t=Nl(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Nl(e){var t=Pl(e,`string`);return typeof t==`symbol`?t:t+``}function Pl(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}var Fl=e=>e.replace(/([A-Z])/g,e=>`-${e.toLowerCase()}`),Il=(e,t,n)=>e.map(e=>`${Fl(e)} ${t}ms ${n}`).join(`,`),Ll=(e,t)=>[Object.keys(e),Object.keys(t)].reduce((e,t)=>e.filter(e=>t.includes(e))),Rl=(e,t)=>Object.keys(t).reduce((n,r)=>jl(jl({},n),{},{[r]:e(r,t[r])}),{});function zl(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function Bl(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?zl(Object(n),!0).forEach(function(t){Vl(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):zl(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function Vl(e,t,n){return(t=Hl(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Hl(e){var t=Ul(e,`string`);return typeof t==`symbol`?t:t+``}function Ul(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}var Wl=(e,t,n)=>e+(t-e)*n,Gl=e=>{var{from:t,to:n}=e;return t!==n},Kl=(e,t,n)=>{var r=Rl((t,n)=>{if(Gl(n)){var[r,i]=e(n.from,n.to,n.velocity);return Bl(Bl({},n),{},{from:r,velocity:i})}return n},t);return n<1?Rl((e,t)=>Gl(t)?Bl(Bl({},t),{},{velocity:Wl(t.velocity,r[e].velocity,n),from:Wl(t.from,r[e].from,n)}):t,t):Kl(e,r,n-1)};function ql(e,t,n,r,i,a){var o,s=r.reduce((n,r)=>Bl(Bl({},n),{},{[r]:{from:e[r],velocity:0,to:t[r]}}),{}),c=()=>Rl((e,t)=>t.from,s),l=()=>!Object.values(s).filter(Gl).length,u=null,d=r=>{o||=r;var f=(r-o)/n.dt;s=Kl(n,s,f),i(Bl(Bl(Bl({},e),t),c())),o=r,l()||(u=a.setTimeout(d))};return()=>(u=a.setTimeout(d),()=>{u()})}function Jl(e,t,n,r,i,a,o){var s=null,c=i.reduce((n,r)=>Bl(Bl({},n),{},{[r]:[e[r],t[r]]}),{}),l,u=i=>{l||=i;var d=(i-l)/r,f=Rl((e,t)=>Wl(...t,n(d)),c);if(a(Bl(Bl(Bl({},e),t),f)),d<1)s=o.setTimeout(u);else{var p=Rl((e,t)=>Wl(...t,n(1)),c);a(Bl(Bl(Bl({},e),t),p))}};return()=>(s=o.setTimeout(u),()=>{s()})}var Yl=(e,t,n,r,i,a)=>{var o=Ll(e,t);return n.isStepper===!0?ql(e,t,n,o,i,a):Jl(e,t,n,r,o,i,a)},Xl=(e,t)=>[0,3*e,3*t-6*e,3*e-3*t+1],Zl=(e,t)=>e.map((e,n)=>e*t**n).reduce((e,t)=>e+t),Ql=(e,t)=>n=>{var r=Xl(e,t);return Zl(r,n)},$l=(e,t)=>n=>{var r=[...Xl(e,t).map((e,t)=>e*t).slice(1),0];return Zl(r,n)},eu=function(){var e,t,n,r,i=[...arguments];if(i.length===1)switch(i[0]){case`linear`:[e,n,t,r]=[0,0,1,1];break;case`ease`:[e,n,t,r]=[.25,.1,.25,1];break;case`ease-in`:[e,n,t,r]=[.42,0,1,1];break;case`ease-out`:[e,n,t,r]=[.42,0,.58,1];break;case`ease-in-out`:[e,n,t,r]=[0,0,.58,1];break;default:var a=i[0].split(`(`);a[0]===`cubic-bezier`&&a[1].split(`)`)[0].split(`,`).length===4&&([e,n,t,r]=a[1].split(`)`)[0].split(`,`).map(e=>parseFloat(e)))}else i.length===4&&([e,n,t,r]=i);var o=Ql(e,t),s=Ql(n,r),c=$l(e,t),l=e=>e>1?1:e<0?0:e,u=e=>{for(var t=e>1?1:e,n=t,r=0;r<8;++r){var i=o(n)-t,a=c(n);if(Math.abs(i-t)<1e-4||a<1e-4)return s(n);n=l(n-i/a)}return s(n)};return u.isStepper=!1,u},tu=function(){var{stiff:e=100,damping:t=8,dt:n=17}=arguments.length>0&&arguments[0]!==void 0?arguments[0]:{},r=(r,i,a)=>{var o=-(r-i)*e,s=a*t,c=a+(o-s)*n/1e3,l=a*n/1e3+r;return Math.abs(l-i)<1e-4&&Math.abs(c)<1e-4?[i,0]:[l,c]};return r.isStepper=!0,r.dt=n,r},nu=e=>{if(typeof e==`string`)switch(e){case`ease`:case`ease-in-out`:case`ease-out`:case`ease-in`:case`linear`:return eu(e);case`spring`:return tu();default:if(e.split(`(`)[0]===`cubic-bezier`)return eu(e)}return typeof e==`function`?e:null};function ru(e){var t,n=()=>null,r=!1,i=null,a=o=>{if(!r){if(Array.isArray(o)){if(!o.length)return;var[s,...c]=o;if(typeof s==`number`){i=e.setTimeout(a.bind(null,c),s);return}a(s),i=e.setTimeout(a.bind(null,c));return}typeof o==`string`&&(t=o,n(t)),typeof o==`object`&&(t=o,n(t)),typeof o==`function`&&o()}};return{stop:()=>{r=!0},start:e=>{r=!1,i&&=(i(),null),a(e)},subscribe:e=>(n=e,()=>{n=()=>null}),getTimeoutController:()=>e}}var iu=class{setTimeout(e){var t=arguments.length>1&&arguments[1]!==void 0?arguments[1]:0,n=performance.now(),r=null,i=a=>{a-n>=t?e(a):typeof requestAnimationFrame==`function`&&(r=requestAnimationFrame(i))};return r=requestAnimationFrame(i),()=>{cancelAnimationFrame(r)}}};function au(){return ru(new iu)}var ou=(0,A.createContext)(au);function su(e,t){var n=(0,A.useContext)(ou);return(0,A.useMemo)(()=>t??n(e),[e,t,n])}var cu={begin:0,duration:1e3,easing:`ease`,isActive:!0,canBegin:!0,onAnimationEnd:()=>{},onAnimationStart:()=>{}},lu={t:0},uu={t:1};function du(e){var t=H(e,cu),{isActive:n,canBegin:r,duration:i,easing:a,begin:o,onAnimationEnd:s,onAnimationStart:c,children:l}=t,u=su(t.animationId,t.animationManager),[d,f]=(0,A.useState)(n?lu:uu),p=(0,A.useRef)(null);return(0,A.useEffect)(()=>{n||f(uu)},[n]),(0,A.useEffect)(()=>{if(!n||!r)return kl;var e=Yl(lu,uu,nu(a),i,f,u.getTimeoutController());return u.start([c,o,()=>{p.current=e()},i,s]),()=>{u.stop(),p.current&&p.current(),s()}},[n,r,i,a,o,c,s,u]),l(d.t)}function fu(e){var t=arguments.length>1&&arguments[1]!==void 0?arguments[1]:`animation-`,n=(0,A.useRef)(C(t)),r=(0,A.useRef)(e);return r.current!==e&&(n.current=C(t),r.current=e),n.current}function pu(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function mu(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?pu(Object(n),!0).forEach(function(t){hu(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):pu(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function hu(e,t,n){return(t=gu(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function gu(e){var t=_u(e,`string`);return typeof t==`symbol`?t:t+``}function _u(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function vu(){return vu=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},vu.apply(null,arguments)}var yu=(e,t,n,r,i)=>{var a=Math.min(Math.abs(n)/2,Math.abs(r)/2),o=r>=0?1:-1,s=n>=0?1:-1,c=r>=0&&n>=0||r<0&&n<0?1:0,l;if(a>0&&i instanceof Array){for(var u=[0,0,0,0],d=0,f=4;d<f;d++)u[d]=i[d]>a?a:i[d];l=`M${e},${t+o*u[0]}`,u[0]>0&&(l+=`A ${u[0]},${u[0]},0,0,${c},${e+s*u[0]},${t}`),l+=`L ${e+n-s*u[1]},${t}`,u[1]>0&&(l+=`A ${u[1]},${u[1]},0,0,${c},
-        ${e+n},${t+o*u[1]}`),l+=`L ${e+n},${t+r-o*u[2]}`,u[2]>0&&(l+=`A ${u[2]},${u[2]},0,0,${c},
-        ${e+n-s*u[2]},${t+r}`),l+=`L ${e+s*u[3]},${t+r}`,u[3]>0&&(l+=`A ${u[3]},${u[3]},0,0,${c},
-        ${e},${t+r-o*u[3]}`),l+=`Z`}else if(a>0&&i===+i&&i>0){var p=Math.min(a,i);l=`M ${e},${t+o*p}
-            A ${p},${p},0,0,${c},${e+s*p},${t}
-            L ${e+n-s*p},${t}
-            A ${p},${p},0,0,${c},${e+n},${t+o*p}
-            L ${e+n},${t+r-o*p}
-            A ${p},${p},0,0,${c},${e+n-s*p},${t+r}
-            L ${e+s*p},${t+r}
-            A ${p},${p},0,0,${c},${e},${t+r-o*p} Z`}else l=`M ${e},${t} h ${n} v ${r} h ${-n} Z`;return l},bu={x:0,y:0,width:0,height:0,radius:0,isAnimationActive:!1,isUpdateAnimationActive:!1,animationBegin:0,animationDuration:1500,animationEasing:`ease`},xu=e=>{var t=H(e,bu),n=(0,A.useRef)(null),[r,i]=(0,A.useState)(-1);(0,A.useEffect)(()=>{if(n.current&&n.current.getTotalLength)try{var e=n.current.getTotalLength();e&&i(e)}catch{}},[]);var{x:a,y:o,width:s,height:l,radius:u,className:d}=t,{animationEasing:f,animationDuration:p,animationBegin:m,isAnimationActive:h,isUpdateAnimationActive:g}=t,_=(0,A.useRef)(s),v=(0,A.useRef)(l),y=(0,A.useRef)(a),b=(0,A.useRef)(o),x=(0,A.useMemo)(()=>({x:a,y:o,width:s,height:l,radius:u}),[a,o,s,l,u]),S=fu(x,`rectangle-`);if(a!==+a||o!==+o||s!==+s||l!==+l||s===0||l===0)return null;var C=c(`recharts-rectangle`,d);if(!g)return A.createElement(`path`,vu({},M(t,!0),{className:C,d:yu(a,o,s,l,u)}));var w=_.current,T=v.current,E=y.current,O=b.current,ee=`0px ${r===-1?1:r}px`,k=`${r}px 0px`,te=Il([`strokeDasharray`],p,typeof f==`string`?f:void 0);return A.createElement(du,{animationId:S,key:S,canBegin:r>0,duration:p,easing:f,isActive:g,begin:m},e=>{var r=D(w,s,e),i=D(T,l,e),c=D(E,a,e),d=D(O,o,e);n.current&&(_.current=r,v.current=i,y.current=c,b.current=d);var f=h?e>0?{transition:te,strokeDasharray:k}:{strokeDasharray:ee}:{strokeDasharray:k};return A.createElement(`path`,vu({},M(t,!0),{className:C,d:yu(c,d,r,i,u),ref:n,style:mu(mu({},f),t.style)}))})};function Su(e){var{cx:t,cy:n,radius:r,startAngle:i,endAngle:a}=e,o=R(t,n,r,i),s=R(t,n,r,a);return{points:[o,s],cx:t,cy:n,radius:r,startAngle:i,endAngle:a}}function Cu(){return Cu=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Cu.apply(null,arguments)}var wu=(e,t)=>{var n=_(t-e),r=Math.min(Math.abs(t-e),359.999);return n*r},Tu=e=>{var{cx:t,cy:n,radius:r,angle:i,sign:a,isExternal:o,cornerRadius:s,cornerIsExternal:c}=e,l=s*(o?1:-1)+r,u=Math.asin(s/l)/No,d=c?i:i+a*u,f=R(t,n,l,d),p=R(t,n,r,d),m=c?i-a*u:i,h=R(t,n,l*Math.cos(u*No),m);return{center:f,circleTangency:p,lineTangency:h,theta:u}},Eu=e=>{var{cx:t,cy:n,innerRadius:r,outerRadius:i,startAngle:a,endAngle:o}=e,s=wu(a,o),c=a+s,l=R(t,n,i,a),u=R(t,n,i,c),d=`M ${l.x},${l.y}
-    A ${i},${i},0,
-    ${+(Math.abs(s)>180)},${+(a>c)},
-    ${u.x},${u.y}
-  `;if(r>0){var f=R(t,n,r,a),p=R(t,n,r,c);d+=`L ${p.x},${p.y}
-            A ${r},${r},0,
-            ${+(Math.abs(s)>180)},${+(a<=c)},
-            ${f.x},${f.y} Z`}else d+=`L ${t},${n} Z`;return d},Du=e=>{var{cx:t,cy:n,innerRadius:r,outerRadius:i,cornerRadius:a,forceCornerRadius:o,cornerIsExternal:s,startAngle:c,endAngle:l}=e,u=_(l-c),{circleTangency:d,lineTangency:f,theta:p}=Tu({cx:t,cy:n,radius:i,angle:c,sign:u,cornerRadius:a,cornerIsExternal:s}),{circleTangency:m,lineTangency:h,theta:g}=Tu({cx:t,cy:n,radius:i,angle:l,sign:-u,cornerRadius:a,cornerIsExternal:s}),v=s?Math.abs(c-l):Math.abs(c-l)-p-g;if(v<0)return o?`M ${f.x},${f.y}
-        a${a},${a},0,0,1,${a*2},0
-        a${a},${a},0,0,1,${-a*2},0
-      `:Eu({cx:t,cy:n,innerRadius:r,outerRadius:i,startAngle:c,endAngle:l});var y=`M ${f.x},${f.y}
-    A${a},${a},0,0,${+(u<0)},${d.x},${d.y}
-    A${i},${i},0,${+(v>180)},${+(u<0)},${m.x},${m.y}
-    A${a},${a},0,0,${+(u<0)},${h.x},${h.y}
-  `;if(r>0){var{circleTangency:b,lineTangency:x,theta:S}=Tu({cx:t,cy:n,radius:r,angle:c,sign:u,isExternal:!0,cornerRadius:a,cornerIsExternal:s}),{circleTangency:C,lineTangency:w,theta:T}=Tu({cx:t,cy:n,radius:r,angle:l,sign:-u,isExternal:!0,cornerRadius:a,cornerIsExternal:s}),E=s?Math.abs(c-l):Math.abs(c-l)-S-T;if(E<0&&a===0)return`${y}L${t},${n}Z`;y+=`L${w.x},${w.y}
-      A${a},${a},0,0,${+(u<0)},${C.x},${C.y}
-      A${r},${r},0,${+(E>180)},${+(u>0)},${b.x},${b.y}
-      A${a},${a},0,0,${+(u<0)},${x.x},${x.y}Z`}else y+=`L${t},${n}Z`;return y},Ou={cx:0,cy:0,innerRadius:0,outerRadius:0,startAngle:0,endAngle:0,cornerRadius:0,forceCornerRadius:!1,cornerIsExternal:!1},ku=e=>{var t=H(e,Ou),{cx:n,cy:r,innerRadius:i,outerRadius:a,cornerRadius:o,forceCornerRadius:s,cornerIsExternal:l,startAngle:u,endAngle:d,className:f}=t;if(a<i||u===d)return null;var p=c(`recharts-sector`,f),m=a-i,h=w(o,m,0,!0),g=h>0&&Math.abs(u-d)<360?Du({cx:n,cy:r,innerRadius:i,outerRadius:a,cornerRadius:Math.min(h,m/2),forceCornerRadius:s,cornerIsExternal:l,startAngle:u,endAngle:d}):Eu({cx:n,cy:r,innerRadius:i,outerRadius:a,startAngle:u,endAngle:d});return A.createElement(`path`,Cu({},M(t,!0),{className:p,d:g}))};function Au(e,t,n){var r,i,a,o;if(e===`horizontal`)r=t.x,a=r,i=n.top,o=n.top+n.height;else if(e===`vertical`)i=t.y,o=i,r=n.left,a=n.left+n.width;else if(t.cx!=null&&t.cy!=null)if(e===`centric`){var{cx:s,cy:c,innerRadius:l,outerRadius:u,angle:d}=t,f=R(s,c,l,d),p=R(s,c,u,d);r=f.x,i=f.y,a=p.x,o=p.y}else return Su(t);return[{x:r,y:i},{x:a,y:o}]}var ju=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=zr();function n(e){return t.isSymbol(e)?NaN:Number(e)}exports.toNumber=n})),Mu=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=ju();function n(e){return e?(e=t.toNumber(e),e===1/0||e===-1/0?(e<0?-1:1)*Number.MAX_VALUE:e===e?e:0):e===0?e:0}exports.toFinite=n})),Nu=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=Ur(),n=Mu();function r(e,r,i){i&&typeof i!=`number`&&t.isIterateeCall(e,r,i)&&(r=i=void 0),e=n.toFinite(e),r===void 0?(r=e,e=0):r=n.toFinite(r),i=i===void 0?e<r?1:-1:n.toFinite(i);let a=Math.max(Math.ceil((r-e)/(i||1)),0),o=Array(a);for(let t=0;t<a;t++)o[t]=e,e+=i;return o}exports.range=r})),Pu=n(((exports,t)=>{t.exports=Nu().range}));function Fu(e,t){return e==null||t==null?NaN:e<t?-1:e>t?1:e>=t?0:NaN}function Iu(e,t){return e==null||t==null?NaN:t<e?-1:t>e?1:t>=e?0:NaN}function Lu(e){let t,n,r;e.length===2?(t=e===Fu||e===Iu?e:Ru,n=e,r=e):(t=Fu,n=(t,n)=>Fu(e(t),n),r=(t,n)=>e(t)-n);function i(e,r,i=0,a=e.length){if(i<a){if(t(r,r)!==0)return a;do{let t=i+a>>>1;n(e[t],r)<0?i=t+1:a=t}while(i<a)}return i}function a(e,r,i=0,a=e.length){if(i<a){if(t(r,r)!==0)return a;do{let t=i+a>>>1;n(e[t],r)<=0?i=t+1:a=t}while(i<a)}return i}function o(e,t,n=0,a=e.length){let o=i(e,t,n,a-1);return o>n&&r(e[o-1],t)>-r(e[o],t)?o-1:o}return{left:i,center:o,right:a}}function Ru(){return 0}function zu(e){return e===null?NaN:+e}function*Bu(e,t){if(t===void 0)for(let t of e)t!=null&&(t=+t)>=t&&(yield t);else{let n=-1;for(let r of e)(r=t(r,++n,e))!=null&&(r=+r)>=r&&(yield r)}}var Vu=Lu(Fu);const Hu=Vu.right;Vu.left,Lu(zu).center;var Uu=Hu,Wu=class extends Map{constructor(e,t=Ju){if(super(),Object.defineProperties(this,{_intern:{value:new Map},_key:{value:t}}),e!=null)for(let[t,n]of e)this.set(t,n)}get(e){return super.get(Gu(this,e))}has(e){return super.has(Gu(this,e))}set(e,t){return super.set(Ku(this,e),t)}delete(e){return super.delete(qu(this,e))}};function Gu({_intern:e,_key:t},n){let r=t(n);return e.has(r)?e.get(r):n}function Ku({_intern:e,_key:t},n){let r=t(n);return e.has(r)?e.get(r):(e.set(r,n),n)}function qu({_intern:e,_key:t},n){let r=t(n);return e.has(r)&&(n=e.get(r),e.delete(r)),n}function Ju(e){return typeof e==`object`&&e?e.valueOf():e}function Yu(e=Fu){if(e===Fu)return Xu;if(typeof e!=`function`)throw TypeError(`compare is not a function`);return(t,n)=>{let r=e(t,n);return r||r===0?r:(e(n,n)===0)-(e(t,t)===0)}}function Xu(e,t){return(e==null||!(e>=e))-(t==null||!(t>=t))||(e<t?-1:e>t?1:0)}var Zu=Math.sqrt(50),Qu=Math.sqrt(10),$u=Math.sqrt(2);function ed(e,t,n){let r=(t-e)/Math.max(0,n),i=Math.floor(Math.log10(r)),a=r/10**i,o=a>=Zu?10:a>=Qu?5:a>=$u?2:1,s,c,l;return i<0?(l=10**-i/o,s=Math.round(e*l),c=Math.round(t*l),s/l<e&&++s,c/l>t&&--c,l=-l):(l=10**i*o,s=Math.round(e/l),c=Math.round(t/l),s*l<e&&++s,c*l>t&&--c),c<s&&.5<=n&&n<2?ed(e,t,n*2):[s,c,l]}function td(e,t,n){if(t=+t,e=+e,n=+n,!(n>0))return[];if(e===t)return[e];let r=t<e,[i,a,o]=r?ed(t,e,n):ed(e,t,n);if(!(a>=i))return[];let s=a-i+1,c=Array(s);if(r)if(o<0)for(let e=0;e<s;++e)c[e]=(a-e)/-o;else for(let e=0;e<s;++e)c[e]=(a-e)*o;else if(o<0)for(let e=0;e<s;++e)c[e]=(i+e)/-o;else for(let e=0;e<s;++e)c[e]=(i+e)*o;return c}function nd(e,t,n){return t=+t,e=+e,n=+n,ed(e,t,n)[2]}function rd(e,t,n){t=+t,e=+e,n=+n;let r=t<e,i=r?nd(t,e,n):nd(e,t,n);return(r?-1:1)*(i<0?1/-i:i)}function id(e,t){let n;if(t===void 0)for(let t of e)t!=null&&(n<t||n===void 0&&t>=t)&&(n=t);else{let r=-1;for(let i of e)(i=t(i,++r,e))!=null&&(n<i||n===void 0&&i>=i)&&(n=i)}return n}function ad(e,t){let n;if(t===void 0)for(let t of e)t!=null&&(n>t||n===void 0&&t>=t)&&(n=t);else{let r=-1;for(let i of e)(i=t(i,++r,e))!=null&&(n>i||n===void 0&&i>=i)&&(n=i)}return n}function od(e,t,n=0,r=1/0,i){if(t=Math.floor(t),n=Math.floor(Math.max(0,n)),r=Math.floor(Math.min(e.length-1,r)),!(n<=t&&t<=r))return e;for(i=i===void 0?Xu:Yu(i);r>n;){if(r-n>600){let a=r-n+1,o=t-n+1,s=Math.log(a),c=.5*Math.exp(2*s/3),l=.5*Math.sqrt(s*c*(a-c)/a)*(o-a/2<0?-1:1),u=Math.max(n,Math.floor(t-o*c/a+l)),d=Math.min(r,Math.floor(t+(a-o)*c/a+l));od(e,t,u,d,i)}let a=e[t],o=n,s=r;for(sd(e,n,t),i(e[r],a)>0&&sd(e,n,r);o<s;){for(sd(e,o,s),++o,--s;i(e[o],a)<0;)++o;for(;i(e[s],a)>0;)--s}i(e[n],a)===0?sd(e,n,s):(++s,sd(e,s,r)),s<=t&&(n=s+1),t<=s&&(r=s-1)}return e}function sd(e,t,n){let r=e[t];e[t]=e[n],e[n]=r}function cd(e,t,n){if(e=Float64Array.from(Bu(e,n)),!(!(r=e.length)||isNaN(t=+t))){if(t<=0||r<2)return ad(e);if(t>=1)return id(e);var r,i=(r-1)*t,a=Math.floor(i),o=id(od(e,a).subarray(0,a+1)),s=ad(e.subarray(a+1));return o+(s-o)*(i-a)}}function ld(e,t,n=zu){if(!(!(r=e.length)||isNaN(t=+t))){if(t<=0||r<2)return+n(e[0],0,e);if(t>=1)return+n(e[r-1],r-1,e);var r,i=(r-1)*t,a=Math.floor(i),o=+n(e[a],a,e),s=+n(e[a+1],a+1,e);return o+(s-o)*(i-a)}}function ud(e,t,n){e=+e,t=+t,n=(i=arguments.length)<2?(t=e,e=0,1):i<3?1:+n;for(var r=-1,i=Math.max(0,Math.ceil((t-e)/n))|0,a=Array(i);++r<i;)a[r]=e+r*n;return a}function dd(e,t){switch(arguments.length){case 0:break;case 1:this.range(e);break;default:this.range(t).domain(e);break}return this}function fd(e,t){switch(arguments.length){case 0:break;case 1:typeof e==`function`?this.interpolator(e):this.range(e);break;default:this.domain(e),typeof t==`function`?this.interpolator(t):this.range(t);break}return this}const pd=Symbol(`implicit`);function md(){var e=new Wu,t=[],n=[],r=pd;function i(i){let a=e.get(i);if(a===void 0){if(r!==pd)return r;e.set(i,a=t.push(i)-1)}return n[a%n.length]}return i.domain=function(n){if(!arguments.length)return t.slice();t=[],e=new Wu;for(let r of n){if(e.has(r))continue;e.set(r,t.push(r)-1)}return i},i.range=function(e){return arguments.length?(n=Array.from(e),i):n.slice()},i.unknown=function(e){return arguments.length?(r=e,i):r},i.copy=function(){return md(t,n).unknown(r)},dd.apply(i,arguments),i}function hd(){var e=md().unknown(void 0),t=e.domain,n=e.range,r=0,i=1,a,o,s=!1,c=0,l=0,u=.5;delete e.unknown;function d(){var e=t().length,d=i<r,f=d?i:r,p=d?r:i;a=(p-f)/Math.max(1,e-c+l*2),s&&(a=Math.floor(a)),f+=(p-f-a*(e-c))*u,o=a*(1-c),s&&(f=Math.round(f),o=Math.round(o));var m=ud(e).map(function(e){return f+a*e});return n(d?m.reverse():m)}return e.domain=function(e){return arguments.length?(t(e),d()):t()},e.range=function(e){return arguments.length?([r,i]=e,r=+r,i=+i,d()):[r,i]},e.rangeRound=function(e){return[r,i]=e,r=+r,i=+i,s=!0,d()},e.bandwidth=function(){return o},e.step=function(){return a},e.round=function(e){return arguments.length?(s=!!e,d()):s},e.padding=function(e){return arguments.length?(c=Math.min(1,l=+e),d()):c},e.paddingInner=function(e){return arguments.length?(c=Math.min(1,e),d()):c},e.paddingOuter=function(e){return arguments.length?(l=+e,d()):l},e.align=function(e){return arguments.length?(u=Math.max(0,Math.min(1,e)),d()):u},e.copy=function(){return hd(t(),[r,i]).round(s).paddingInner(c).paddingOuter(l).align(u)},dd.apply(d(),arguments)}function gd(e){var t=e.copy;return e.padding=e.paddingOuter,delete e.paddingInner,delete e.paddingOuter,e.copy=function(){return gd(t())},e}function _d(){return gd(hd.apply(null,arguments).paddingInner(1))}function vd(e,t,n){e.prototype=t.prototype=n,n.constructor=e}function yd(e,t){var n=Object.create(e.prototype);for(var r in t)n[r]=t[r];return n}function bd(){}var xd=.7,Sd=1/xd,Cd=`\\s*([+-]?\\d+)\\s*`,wd=`\\s*([+-]?(?:\\d*\\.)?\\d+(?:[eE][+-]?\\d+)?)\\s*`,Td=`\\s*([+-]?(?:\\d*\\.)?\\d+(?:[eE][+-]?\\d+)?)%\\s*`,Ed=/^#([0-9a-f]{3,8})$/,Dd=RegExp(`^rgb\\(${Cd},${Cd},${Cd}\\)$`),Od=RegExp(`^rgb\\(${Td},${Td},${Td}\\)$`),kd=RegExp(`^rgba\\(${Cd},${Cd},${Cd},${wd}\\)$`),Ad=RegExp(`^rgba\\(${Td},${Td},${Td},${wd}\\)$`),jd=RegExp(`^hsl\\(${wd},${Td},${Td}\\)$`),Md=RegExp(`^hsla\\(${wd},${Td},${Td},${wd}\\)$`),Nd={aliceblue:15792383,antiquewhite:16444375,aqua:65535,aquamarine:8388564,azure:15794175,beige:16119260,bisque:16770244,black:0,blanchedalmond:16772045,blue:255,blueviolet:9055202,brown:10824234,burlywood:14596231,cadetblue:6266528,chartreuse:8388352,chocolate:13789470,coral:16744272,cornflowerblue:6591981,cornsilk:16775388,crimson:14423100,cyan:65535,darkblue:139,darkcyan:35723,darkgoldenrod:12092939,darkgray:11119017,darkgreen:25600,darkgrey:11119017,darkkhaki:12433259,darkmagenta:9109643,darkolivegreen:5597999,darkorange:16747520,darkorchid:10040012,darkred:9109504,darksalmon:15308410,darkseagreen:9419919,darkslateblue:4734347,darkslategray:3100495,darkslategrey:3100495,darkturquoise:52945,darkviolet:9699539,deeppink:16716947,deepskyblue:49151,dimgray:6908265,dimgrey:6908265,dodgerblue:2003199,firebrick:11674146,floralwhite:16775920,forestgreen:2263842,fuchsia:16711935,gainsboro:14474460,ghostwhite:16316671,gold:16766720,goldenrod:14329120,gray:8421504,green:32768,greenyellow:11403055,grey:8421504,honeydew:15794160,hotpink:16738740,indianred:13458524,indigo:4915330,ivory:16777200,khaki:15787660,lavender:15132410,lavenderblush:16773365,lawngreen:8190976,lemonchiffon:16775885,lightblue:11393254,lightcoral:15761536,lightcyan:14745599,lightgoldenrodyellow:16448210,lightgray:13882323,lightgreen:9498256,lightgrey:13882323,lightpink:16758465,lightsalmon:16752762,lightseagreen:2142890,lightskyblue:8900346,lightslategray:7833753,lightslategrey:7833753,lightsteelblue:11584734,lightyellow:16777184,lime:65280,limegreen:3329330,linen:16445670,magenta:16711935,maroon:8388608,mediumaquamarine:6737322,mediumblue:205,mediumorchid:12211667,mediumpurple:9662683,mediumseagreen:3978097,mediumslateblue:8087790,mediumspringgreen:64154,mediumturquoise:4772300,mediumvioletred:13047173,midnightblue:1644912,mintcream:16121850,mistyrose:16770273,moccasin:16770229,navajowhite:16768685,navy:128,oldlace:16643558,olive:8421376,olivedrab:7048739,orange:16753920,orangered:16729344,orchid:14315734,palegoldenrod:15657130,palegreen:10025880,paleturquoise:11529966,palevioletred:14381203,papayawhip:16773077,peachpuff:16767673,peru:13468991,pink:16761035,plum:14524637,powderblue:11591910,purple:8388736,rebeccapurple:6697881,red:16711680,rosybrown:12357519,royalblue:4286945,saddlebrown:9127187,salmon:16416882,sandybrown:16032864,seagreen:3050327,seashell:16774638,sienna:10506797,silver:12632256,skyblue:8900331,slateblue:6970061,slategray:7372944,slategrey:7372944,snow:16775930,springgreen:65407,steelblue:4620980,tan:13808780,teal:32896,thistle:14204888,tomato:16737095,turquoise:4251856,violet:15631086,wheat:16113331,white:16777215,whitesmoke:16119285,yellow:16776960,yellowgreen:10145074};vd(bd,Rd,{copy(e){return Object.assign(new this.constructor,this,e)},displayable(){return this.rgb().displayable()},hex:Pd,formatHex:Pd,formatHex8:Fd,formatHsl:Id,formatRgb:Ld,toString:Ld});function Pd(){return this.rgb().formatHex()}function Fd(){return this.rgb().formatHex8()}function Id(){return Zd(this).formatHsl()}function Ld(){return this.rgb().formatRgb()}function Rd(e){var t,n;return e=(e+``).trim().toLowerCase(),(t=Ed.exec(e))?(n=t[1].length,t=parseInt(t[1],16),n===6?zd(t):n===3?new Ud(t>>8&15|t>>4&240,t>>4&15|t&240,(t&15)<<4|t&15,1):n===8?Bd(t>>24&255,t>>16&255,t>>8&255,(t&255)/255):n===4?Bd(t>>12&15|t>>8&240,t>>8&15|t>>4&240,t>>4&15|t&240,((t&15)<<4|t&15)/255):null):(t=Dd.exec(e))?new Ud(t[1],t[2],t[3],1):(t=Od.exec(e))?new Ud(t[1]*255/100,t[2]*255/100,t[3]*255/100,1):(t=kd.exec(e))?Bd(t[1],t[2],t[3],t[4]):(t=Ad.exec(e))?Bd(t[1]*255/100,t[2]*255/100,t[3]*255/100,t[4]):(t=jd.exec(e))?Xd(t[1],t[2]/100,t[3]/100,1):(t=Md.exec(e))?Xd(t[1],t[2]/100,t[3]/100,t[4]):Nd.hasOwnProperty(e)?zd(Nd[e]):e===`transparent`?new Ud(NaN,NaN,NaN,0):null}function zd(e){return new Ud(e>>16&255,e>>8&255,e&255,1)}function Bd(e,t,n,r){return r<=0&&(e=t=n=NaN),new Ud(e,t,n,r)}function Vd(e){return e instanceof bd||(e=Rd(e)),e?(e=e.rgb(),new Ud(e.r,e.g,e.b,e.opacity)):new Ud}function Hd(e,t,n,r){return arguments.length===1?Vd(e):new Ud(e,t,n,r??1)}function Ud(e,t,n,r){this.r=+e,this.g=+t,this.b=+n,this.opacity=+r}vd(Ud,Hd,yd(bd,{brighter(e){return e=e==null?Sd:Sd**+e,new Ud(this.r*e,this.g*e,this.b*e,this.opacity)},darker(e){return e=e==null?xd:xd**+e,new Ud(this.r*e,this.g*e,this.b*e,this.opacity)},rgb(){return this},clamp(){return new Ud(Jd(this.r),Jd(this.g),Jd(this.b),qd(this.opacity))},displayable(){return-.5<=this.r&&this.r<255.5&&-.5<=this.g&&this.g<255.5&&-.5<=this.b&&this.b<255.5&&0<=this.opacity&&this.opacity<=1},hex:Wd,formatHex:Wd,formatHex8:Gd,formatRgb:Kd,toString:Kd}));function Wd(){return`#${Yd(this.r)}${Yd(this.g)}${Yd(this.b)}`}function Gd(){return`#${Yd(this.r)}${Yd(this.g)}${Yd(this.b)}${Yd((isNaN(this.opacity)?1:this.opacity)*255)}`}function Kd(){let e=qd(this.opacity);return`${e===1?`rgb(`:`rgba(`}${Jd(this.r)}, ${Jd(this.g)}, ${Jd(this.b)}${e===1?`)`:`, ${e})`}`}function qd(e){return isNaN(e)?1:Math.max(0,Math.min(1,e))}function Jd(e){return Math.max(0,Math.min(255,Math.round(e)||0))}function Yd(e){return e=Jd(e),(e<16?`0`:``)+e.toString(16)}function Xd(e,t,n,r){return r<=0?e=t=n=NaN:n<=0||n>=1?e=t=NaN:t<=0&&(e=NaN),new $d(e,t,n,r)}function Zd(e){if(e instanceof $d)return new $d(e.h,e.s,e.l,e.opacity);if(e instanceof bd||(e=Rd(e)),!e)return new $d;if(e instanceof $d)return e;e=e.rgb();var t=e.r/255,n=e.g/255,r=e.b/255,i=Math.min(t,n,r),a=Math.max(t,n,r),o=NaN,s=a-i,c=(a+i)/2;return s?(o=t===a?(n-r)/s+(n<r)*6:n===a?(r-t)/s+2:(t-n)/s+4,s/=c<.5?a+i:2-a-i,o*=60):s=c>0&&c<1?0:o,new $d(o,s,c,e.opacity)}function Qd(e,t,n,r){return arguments.length===1?Zd(e):new $d(e,t,n,r??1)}function $d(e,t,n,r){this.h=+e,this.s=+t,this.l=+n,this.opacity=+r}vd($d,Qd,yd(bd,{brighter(e){return e=e==null?Sd:Sd**+e,new $d(this.h,this.s,this.l*e,this.opacity)},darker(e){return e=e==null?xd:xd**+e,new $d(this.h,this.s,this.l*e,this.opacity)},rgb(){var e=this.h%360+(this.h<0)*360,t=isNaN(e)||isNaN(this.s)?0:this.s,n=this.l,r=n+(n<.5?n:1-n)*t,i=2*n-r;return new Ud(nf(e>=240?e-240:e+120,i,r),nf(e,i,r),nf(e<120?e+240:e-120,i,r),this.opacity)},clamp(){return new $d(ef(this.h),tf(this.s),tf(this.l),qd(this.opacity))},displayable(){return(0<=this.s&&this.s<=1||isNaN(this.s))&&0<=this.l&&this.l<=1&&0<=this.opacity&&this.opacity<=1},formatHsl(){let e=qd(this.opacity);return`${e===1?`hsl(`:`hsla(`}${ef(this.h)}, ${tf(this.s)*100}%, ${tf(this.l)*100}%${e===1?`)`:`, ${e})`}`}}));function ef(e){return e=(e||0)%360,e<0?e+360:e}function tf(e){return Math.max(0,Math.min(1,e||0))}function nf(e,t,n){return(e<60?t+(n-t)*e/60:e<180?n:e<240?t+(n-t)*(240-e)/60:t)*255}var rf=e=>()=>e;function af(e,t){return function(n){return e+n*t}}function sf(e,t,n){return e**=+n,t=t**+n-e,n=1/n,function(r){return(e+r*t)**+n}}function cf(e){return(e=+e)==1?lf:function(t,n){return n-t?sf(t,n,e):rf(isNaN(t)?n:t)}}function lf(e,t){var n=t-e;return n?af(e,n):rf(isNaN(e)?t:e)}var uf=(function e(t){var n=cf(t);function r(e,t){var r=n((e=Hd(e)).r,(t=Hd(t)).r),i=n(e.g,t.g),a=n(e.b,t.b),o=lf(e.opacity,t.opacity);return function(t){return e.r=r(t),e.g=i(t),e.b=a(t),e.opacity=o(t),e+``}}return r.gamma=e,r})(1);function df(e,t){t||=[];var n=e?Math.min(t.length,e.length):0,r=t.slice(),i;return function(a){for(i=0;i<n;++i)r[i]=e[i]*(1-a)+t[i]*a;return r}}function ff(e){return ArrayBuffer.isView(e)&&!(e instanceof DataView)}function pf(e,t){var n=t?t.length:0,r=e?Math.min(n,e.length):0,i=Array(r),a=Array(n),o;for(o=0;o<r;++o)i[o]=Sf(e[o],t[o]);for(;o<n;++o)a[o]=t[o];return function(e){for(o=0;o<r;++o)a[o]=i[o](e);return a}}function mf(e,t){var n=new Date;return e=+e,t=+t,function(r){return n.setTime(e*(1-r)+t*r),n}}function hf(e,t){return e=+e,t=+t,function(n){return e*(1-n)+t*n}}function gf(e,t){var n={},r={},i;for(i in(typeof e!=`object`||!e)&&(e={}),(typeof t!=`object`||!t)&&(t={}),t)i in e?n[i]=Sf(e[i],t[i]):r[i]=t[i];return function(e){for(i in n)r[i]=n[i](e);return r}}var _f=/[-+]?(?:\d+\.?\d*|\.?\d+)(?:[eE][-+]?\d+)?/g,vf=new RegExp(_f.source,`g`);function yf(e){return function(){return e}}function bf(e){return function(t){return e(t)+``}}function xf(e,t){var n=_f.lastIndex=vf.lastIndex=0,r,i,a,o=-1,s=[],c=[];for(e+=``,t+=``;(r=_f.exec(e))&&(i=vf.exec(t));)(a=i.index)>n&&(a=t.slice(n,a),s[o]?s[o]+=a:s[++o]=a),(r=r[0])===(i=i[0])?s[o]?s[o]+=i:s[++o]=i:(s[++o]=null,c.push({i:o,x:hf(r,i)})),n=vf.lastIndex;return n<t.length&&(a=t.slice(n),s[o]?s[o]+=a:s[++o]=a),s.length<2?c[0]?bf(c[0].x):yf(t):(t=c.length,function(e){for(var n=0,r;n<t;++n)s[(r=c[n]).i]=r.x(e);return s.join(``)})}function Sf(e,t){var n=typeof t,r;return t==null||n===`boolean`?rf(t):(n===`number`?hf:n===`string`?(r=Rd(t))?(t=r,uf):xf:t instanceof Rd?uf:t instanceof Date?mf:ff(t)?df:Array.isArray(t)?pf:typeof t.valueOf!=`function`&&typeof t.toString!=`function`||isNaN(t)?gf:hf)(e,t)}function Cf(e,t){return e=+e,t=+t,function(n){return Math.round(e*(1-n)+t*n)}}function wf(e,t){t===void 0&&(t=e,e=Sf);for(var n=0,r=t.length-1,i=t[0],a=Array(r<0?0:r);n<r;)a[n]=e(i,i=t[++n]);return function(e){var t=Math.max(0,Math.min(r-1,Math.floor(e*=r)));return a[t](e-t)}}function Tf(e){return function(){return e}}function Ef(e){return+e}var Df=[0,1];function Of(e){return e}function kf(e,t){return(t-=e=+e)?function(n){return(n-e)/t}:Tf(isNaN(t)?NaN:.5)}function Af(e,t){var n;return e>t&&(n=e,e=t,t=n),function(n){return Math.max(e,Math.min(t,n))}}function jf(e,t,n){var r=e[0],i=e[1],a=t[0],o=t[1];return i<r?(r=kf(i,r),a=n(o,a)):(r=kf(r,i),a=n(a,o)),function(e){return a(r(e))}}function Mf(e,t,n){var r=Math.min(e.length,t.length)-1,i=Array(r),a=Array(r),o=-1;for(e[r]<e[0]&&(e=e.slice().reverse(),t=t.slice().reverse());++o<r;)i[o]=kf(e[o],e[o+1]),a[o]=n(t[o],t[o+1]);return function(t){var n=Uu(e,t,1,r)-1;return a[n](i[n](t))}}function Nf(e,t){return t.domain(e.domain()).range(e.range()).interpolate(e.interpolate()).clamp(e.clamp()).unknown(e.unknown())}function Pf(){var e=Df,t=Df,n=Sf,r,i,a,o=Of,s,c,l;function u(){var n=Math.min(e.length,t.length);return o!==Of&&(o=Af(e[0],e[n-1])),s=n>2?Mf:jf,c=l=null,d}function d(i){return i==null||isNaN(i=+i)?a:(c||=s(e.map(r),t,n))(r(o(i)))}return d.invert=function(n){return o(i((l||=s(t,e.map(r),hf))(n)))},d.domain=function(t){return arguments.length?(e=Array.from(t,Ef),u()):e.slice()},d.range=function(e){return arguments.length?(t=Array.from(e),u()):t.slice()},d.rangeRound=function(e){return t=Array.from(e),n=Cf,u()},d.clamp=function(e){return arguments.length?(o=e?!0:Of,u()):o!==Of},d.interpolate=function(e){return arguments.length?(n=e,u()):n},d.unknown=function(e){return arguments.length?(a=e,d):a},function(e,t){return r=e,i=t,u()}}function Ff(){return Pf()(Of,Of)}function If(e){return Math.abs(e=Math.round(e))>=1e21?e.toLocaleString(`en`).replace(/,/g,``):e.toString(10)}function Lf(e,t){if((n=(e=t?e.toExponential(t-1):e.toExponential()).indexOf(`e`))<0)return null;var n,r=e.slice(0,n);return[r.length>1?r[0]+r.slice(2):r,+e.slice(n+1)]}function Rf(e){return e=Lf(Math.abs(e)),e?e[1]:NaN}function zf(e,t){return function(n,r){for(var i=n.length,a=[],o=0,s=e[0],c=0;i>0&&s>0&&(c+s+1>r&&(s=Math.max(1,r-c)),a.push(n.substring(i-=s,i+s)),!((c+=s+1)>r));)s=e[o=(o+1)%e.length];return a.reverse().join(t)}}function Bf(e){return function(t){return t.replace(/[0-9]/g,function(t){return e[+t]})}}var Vf=/^(?:(.)?([<>=^]))?([+\-( ])?([$#])?(0)?(\d+)?(,)?(\.\d+)?(~)?([a-z%])?$/i;function Hf(e){if(!(t=Vf.exec(e)))throw Error(`invalid format: `+e);var t;return new Uf({fill:t[1],align:t[2],sign:t[3],symbol:t[4],zero:t[5],width:t[6],comma:t[7],precision:t[8]&&t[8].slice(1),trim:t[9],type:t[10]})}Hf.prototype=Uf.prototype;function Uf(e){this.fill=e.fill===void 0?` `:e.fill+``,this.align=e.align===void 0?`>`:e.align+``,this.sign=e.sign===void 0?`-`:e.sign+``,this.symbol=e.symbol===void 0?``:e.symbol+``,this.zero=!!e.zero,this.width=e.width===void 0?void 0:+e.width,this.comma=!!e.comma,this.precision=e.precision===void 0?void 0:+e.precision,this.trim=!!e.trim,this.type=e.type===void 0?``:e.type+``}Uf.prototype.toString=function(){return this.fill+this.align+this.sign+this.symbol+(this.zero?`0`:``)+(this.width===void 0?``:Math.max(1,this.width|0))+(this.comma?`,`:``)+(this.precision===void 0?``:`.`+Math.max(0,this.precision|0))+(this.trim?`~`:``)+this.type};function Wf(e){out:for(var t=e.length,n=1,r=-1,i;n<t;++n)switch(e[n]){case`.`:r=i=n;break;case`0`:r===0&&(r=n),i=n;break;default:if(!+e[n])break out;r>0&&(r=0);break}return r>0?e.slice(0,r)+e.slice(i+1):e}var Gf;function Kf(e,t){var n=Lf(e,t);if(!n)return e+``;var r=n[0],i=n[1],a=i-(Gf=Math.max(-8,Math.min(8,Math.floor(i/3)))*3)+1,o=r.length;return a===o?r:a>o?r+Array(a-o+1).join(`0`):a>0?r.slice(0,a)+`.`+r.slice(a):`0.`+Array(1-a).join(`0`)+Lf(e,Math.max(0,t+a-1))[0]}function qf(e,t){var n=Lf(e,t);if(!n)return e+``;var r=n[0],i=n[1];return i<0?`0.`+Array(-i).join(`0`)+r:r.length>i+1?r.slice(0,i+1)+`.`+r.slice(i+1):r+Array(i-r.length+2).join(`0`)}var Jf={"%":(e,t)=>(e*100).toFixed(t),b:e=>Math.round(e).toString(2),c:e=>e+``,d:If,e:(e,t)=>e.toExponential(t),f:(e,t)=>e.toFixed(t),g:(e,t)=>e.toPrecision(t),o:e=>Math.round(e).toString(8),p:(e,t)=>qf(e*100,t),r:qf,s:Kf,X:e=>Math.round(e).toString(16).toUpperCase(),x:e=>Math.round(e).toString(16)};function Yf(e){return e}var Xf=Array.prototype.map,Zf=[`y`,`z`,`a`,`f`,`p`,`n`,`µ`,`m`,``,`k`,`M`,`G`,`T`,`P`,`E`,`Z`,`Y`];function Qf(e){var t=e.grouping===void 0||e.thousands===void 0?Yf:zf(Xf.call(e.grouping,Number),e.thousands+``),n=e.currency===void 0?``:e.currency[0]+``,r=e.currency===void 0?``:e.currency[1]+``,i=e.decimal===void 0?`.`:e.decimal+``,a=e.numerals===void 0?Yf:Bf(Xf.call(e.numerals,String)),o=e.percent===void 0?`%`:e.percent+``,s=e.minus===void 0?`−`:e.minus+``,c=e.nan===void 0?`NaN`:e.nan+``;function l(e){e=Hf(e);var l=e.fill,u=e.align,d=e.sign,f=e.symbol,p=e.zero,m=e.width,h=e.comma,g=e.precision,_=e.trim,v=e.type;v===`n`?(h=!0,v=`g`):Jf[v]||(g===void 0&&(g=12),_=!0,v=`g`),(p||l===`0`&&u===`=`)&&(p=!0,l=`0`,u=`=`);var y=f===`$`?n:f===`#`&&/[boxX]/.test(v)?`0`+v.toLowerCase():``,b=f===`$`?r:/[%p]/.test(v)?o:``,x=Jf[v],S=/[defgprs%]/.test(v);g=g===void 0?6:/[gprs]/.test(v)?Math.max(1,Math.min(21,g)):Math.max(0,Math.min(20,g));function C(e){var n=y,r=b,o,f,C;if(v===`c`)r=x(e)+r,e=``;else{e=+e;var w=e<0||1/e<0;if(e=isNaN(e)?c:x(Math.abs(e),g),_&&(e=Wf(e)),w&&+e==0&&d!==`+`&&(w=!1),n=(w?d===`(`?d:s:d===`-`||d===`(`?``:d)+n,r=(v===`s`?Zf[8+Gf/3]:``)+r+(w&&d===`(`?`)`:``),S){for(o=-1,f=e.length;++o<f;)if(C=e.charCodeAt(o),48>C||C>57){r=(C===46?i+e.slice(o+1):e.slice(o))+r,e=e.slice(0,o);break}}}h&&!p&&(e=t(e,1/0));var T=n.length+e.length+r.length,E=T<m?Array(m-T+1).join(l):``;switch(h&&p&&(e=t(E+e,E.length?m-r.length:1/0),E=``),u){case`<`:e=n+e+r+E;break;case`=`:e=n+E+e+r;break;case`^`:e=E.slice(0,T=E.length>>1)+n+e+r+E.slice(T);break;default:e=E+n+e+r;break}return a(e)}return C.toString=function(){return e+``},C}function u(e,t){var n=l((e=Hf(e),e.type=`f`,e)),r=Math.max(-8,Math.min(8,Math.floor(Rf(t)/3)))*3,i=10**-r,a=Zf[8+r/3];return function(e){return n(i*e)+a}}return{format:l,formatPrefix:u}}var $f,ep,tp;np({thousands:`,`,grouping:[3],currency:[`$`,``]});function np(e){return $f=Qf(e),ep=$f.format,tp=$f.formatPrefix,$f}function rp(e){return Math.max(0,-Rf(Math.abs(e)))}function ip(e,t){return Math.max(0,Math.max(-8,Math.min(8,Math.floor(Rf(t)/3)))*3-Rf(Math.abs(e)))}function ap(e,t){return e=Math.abs(e),t=Math.abs(t)-e,Math.max(0,Rf(t)-Rf(e))+1}function op(e,t,n,r){var i=rd(e,t,n),a;switch(r=Hf(r??`,f`),r.type){case`s`:var o=Math.max(Math.abs(e),Math.abs(t));return r.precision==null&&!isNaN(a=ip(i,o))&&(r.precision=a),tp(r,o);case``:case`e`:case`g`:case`p`:case`r`:r.precision==null&&!isNaN(a=ap(i,Math.max(Math.abs(e),Math.abs(t))))&&(r.precision=a-(r.type===`e`));break;case`f`:case`%`:r.precision==null&&!isNaN(a=rp(i))&&(r.precision=a-(r.type===`%`)*2);break}return ep(r)}function sp(e){var t=e.domain;return e.ticks=function(e){var n=t();return td(n[0],n[n.length-1],e??10)},e.tickFormat=function(e,n){var r=t();return op(r[0],r[r.length-1],e??10,n)},e.nice=function(n){n??=10;var r=t(),i=0,a=r.length-1,o=r[i],s=r[a],c,l,u=10;for(s<o&&(l=o,o=s,s=l,l=i,i=a,a=l);u-- >0;){if(l=nd(o,s,n),l===c)return r[i]=o,r[a]=s,t(r);if(l>0)o=Math.floor(o/l)*l,s=Math.ceil(s/l)*l;else if(l<0)o=Math.ceil(o*l)/l,s=Math.floor(s*l)/l;else break;c=l}return e},e}function cp(){var e=Ff();return e.copy=function(){return Nf(e,cp())},dd.apply(e,arguments),sp(e)}function lp(e){var t;function n(e){return e==null||isNaN(e=+e)?t:e}return n.invert=n,n.domain=n.range=function(t){return arguments.length?(e=Array.from(t,Ef),n):e.slice()},n.unknown=function(e){return arguments.length?(t=e,n):t},n.copy=function(){return lp(e).unknown(t)},e=arguments.length?Array.from(e,Ef):[0,1],sp(n)}function up(e,t){e=e.slice();var n=0,r=e.length-1,i=e[n],a=e[r],o;return a<i&&(o=n,n=r,r=o,o=i,i=a,a=o),e[n]=t.floor(i),e[r]=t.ceil(a),e}function dp(e){return Math.log(e)}function fp(e){return Math.exp(e)}function pp(e){return-Math.log(-e)}function mp(e){return-Math.exp(-e)}function hp(e){return isFinite(e)?+(`1e`+e):e<0?0:e}function gp(e){return e===10?hp:e===Math.E?Math.exp:t=>e**+t}function _p(e){return e===Math.E?Math.log:e===10&&Math.log10||e===2&&Math.log2||(e=Math.log(e),t=>Math.log(t)/e)}function vp(e){return(t,n)=>-e(-t,n)}function yp(e){let t=e(dp,fp),n=t.domain,r=10,i,a;function o(){return i=_p(r),a=gp(r),n()[0]<0?(i=vp(i),a=vp(a),e(pp,mp)):e(dp,fp),t}return t.base=function(e){return arguments.length?(r=+e,o()):r},t.domain=function(e){return arguments.length?(n(e),o()):n()},t.ticks=e=>{let t=n(),o=t[0],s=t[t.length-1],c=s<o;c&&([o,s]=[s,o]);let l=i(o),u=i(s),d,f,p=e==null?10:+e,m=[];if(!(r%1)&&u-l<p){if(l=Math.floor(l),u=Math.ceil(u),o>0){for(;l<=u;++l)for(d=1;d<r;++d)if(f=l<0?d/a(-l):d*a(l),!(f<o)){if(f>s)break;m.push(f)}}else for(;l<=u;++l)for(d=r-1;d>=1;--d)if(f=l>0?d/a(-l):d*a(l),!(f<o)){if(f>s)break;m.push(f)}m.length*2<p&&(m=td(o,s,p))}else m=td(l,u,Math.min(u-l,p)).map(a);return c?m.reverse():m},t.tickFormat=(e,n)=>{if(e??=10,n??=r===10?`s`:`,`,typeof n!=`function`&&(!(r%1)&&(n=Hf(n)).precision==null&&(n.trim=!0),n=ep(n)),e===1/0)return n;let o=Math.max(1,r*e/t.ticks().length);return e=>{let t=e/a(Math.round(i(e)));return t*r<r-.5&&(t*=r),t<=o?n(e):``}},t.nice=()=>n(up(n(),{floor:e=>a(Math.floor(i(e))),ceil:e=>a(Math.ceil(i(e)))})),t}function bp(){let e=yp(Pf()).domain([1,10]);return e.copy=()=>Nf(e,bp()).base(e.base()),dd.apply(e,arguments),e}function xp(e){return function(t){return Math.sign(t)*Math.log1p(Math.abs(t/e))}}function Sp(e){return function(t){return Math.sign(t)*Math.expm1(Math.abs(t))*e}}function Cp(e){var t=1,n=e(xp(t),Sp(t));return n.constant=function(n){return arguments.length?e(xp(t=+n),Sp(t)):t},sp(n)}function wp(){var e=Cp(Pf());return e.copy=function(){return Nf(e,wp()).constant(e.constant())},dd.apply(e,arguments)}function Tp(e){return function(t){return t<0?-((-t)**+e):t**+e}}function Ep(e){return e<0?-Math.sqrt(-e):Math.sqrt(e)}function Dp(e){return e<0?-e*e:e*e}function Op(e){var t=e(Of,Of),n=1;function r(){return n===1?e(Of,Of):n===.5?e(Ep,Dp):e(Tp(n),Tp(1/n))}return t.exponent=function(e){return arguments.length?(n=+e,r()):n},sp(t)}function kp(){var e=Op(Pf());return e.copy=function(){return Nf(e,kp()).exponent(e.exponent())},dd.apply(e,arguments),e}function Ap(){return kp.apply(null,arguments).exponent(.5)}function jp(e){return Math.sign(e)*e*e}function Mp(e){return Math.sign(e)*Math.sqrt(Math.abs(e))}function Np(){var e=Ff(),t=[0,1],n=!1,r;function i(t){var i=Mp(e(t));return isNaN(i)?r:n?Math.round(i):i}return i.invert=function(t){return e.invert(jp(t))},i.domain=function(t){return arguments.length?(e.domain(t),i):e.domain()},i.range=function(n){return arguments.length?(e.range((t=Array.from(n,Ef)).map(jp)),i):t.slice()},i.rangeRound=function(e){return i.range(e).round(!0)},i.round=function(e){return arguments.length?(n=!!e,i):n},i.clamp=function(t){return arguments.length?(e.clamp(t),i):e.clamp()},i.unknown=function(e){return arguments.length?(r=e,i):r},i.copy=function(){return Np(e.domain(),t).round(n).clamp(e.clamp()).unknown(r)},dd.apply(i,arguments),sp(i)}function Pp(){var e=[],t=[],n=[],r;function i(){var r=0,i=Math.max(1,t.length);for(n=Array(i-1);++r<i;)n[r-1]=ld(e,r/i);return a}function a(e){return e==null||isNaN(e=+e)?r:t[Uu(n,e)]}return a.invertExtent=function(r){var i=t.indexOf(r);return i<0?[NaN,NaN]:[i>0?n[i-1]:e[0],i<n.length?n[i]:e[e.length-1]]},a.domain=function(t){if(!arguments.length)return e.slice();e=[];for(let n of t)n!=null&&!isNaN(n=+n)&&e.push(n);return e.sort(Fu),i()},a.range=function(e){return arguments.length?(t=Array.from(e),i()):t.slice()},a.unknown=function(e){return arguments.length?(r=e,a):r},a.quantiles=function(){return n.slice()},a.copy=function(){return Pp().domain(e).range(t).unknown(r)},dd.apply(a,arguments)}function Fp(){var e=0,t=1,n=1,r=[.5],i=[0,1],a;function o(e){return e!=null&&e<=e?i[Uu(r,e,0,n)]:a}function s(){var i=-1;for(r=Array(n);++i<n;)r[i]=((i+1)*t-(i-n)*e)/(n+1);return o}return o.domain=function(n){return arguments.length?([e,t]=n,e=+e,t=+t,s()):[e,t]},o.range=function(e){return arguments.length?(n=(i=Array.from(e)).length-1,s()):i.slice()},o.invertExtent=function(a){var o=i.indexOf(a);return o<0?[NaN,NaN]:o<1?[e,r[0]]:o>=n?[r[n-1],t]:[r[o-1],r[o]]},o.unknown=function(e){return arguments.length&&(a=e),o},o.thresholds=function(){return r.slice()},o.copy=function(){return Fp().domain([e,t]).range(i).unknown(a)},dd.apply(sp(o),arguments)}function Ip(){var e=[.5],t=[0,1],n,r=1;function i(i){return i!=null&&i<=i?t[Uu(e,i,0,r)]:n}return i.domain=function(n){return arguments.length?(e=Array.from(n),r=Math.min(e.length,t.length-1),i):e.slice()},i.range=function(n){return arguments.length?(t=Array.from(n),r=Math.min(e.length,t.length-1),i):t.slice()},i.invertExtent=function(n){var r=t.indexOf(n);return[e[r-1],e[r]]},i.unknown=function(e){return arguments.length?(n=e,i):n},i.copy=function(){return Ip().domain(e).range(t).unknown(n)},dd.apply(i,arguments)}var Lp=new Date,Rp=new Date;function zp(e,t,n,r){function i(t){return e(t=arguments.length===0?new Date:new Date(+t)),t}return i.floor=t=>(e(t=new Date(+t)),t),i.ceil=n=>(e(n=new Date(n-1)),t(n,1),e(n),n),i.round=e=>{let t=i(e),n=i.ceil(e);return e-t<n-e?t:n},i.offset=(e,n)=>(t(e=new Date(+e),n==null?1:Math.floor(n)),e),i.range=(n,r,a)=>{let o=[];if(n=i.ceil(n),a=a==null?1:Math.floor(a),!(n<r)||!(a>0))return o;let s;do o.push(s=new Date(+n)),t(n,a),e(n);while(s<n&&n<r);return o},i.filter=n=>zp(t=>{if(t>=t)for(;e(t),!n(t);)t.setTime(t-1)},(e,r)=>{if(e>=e)if(r<0)for(;++r<=0;)for(;t(e,-1),!n(e););else for(;--r>=0;)for(;t(e,1),!n(e););}),n&&(i.count=(t,r)=>(Lp.setTime(+t),Rp.setTime(+r),e(Lp),e(Rp),Math.floor(n(Lp,Rp))),i.every=e=>(e=Math.floor(e),!isFinite(e)||!(e>0)?null:e>1?i.filter(r?t=>r(t)%e===0:t=>i.count(0,t)%e===0):i)),i}const Bp=zp(()=>{},(e,t)=>{e.setTime(+e+t)},(e,t)=>t-e);Bp.every=e=>(e=Math.floor(e),!isFinite(e)||!(e>0)?null:e>1?zp(t=>{t.setTime(Math.floor(t/e)*e)},(t,n)=>{t.setTime(+t+n*e)},(t,n)=>(n-t)/e):Bp),Bp.range;const Vp=1e3,Hp=Vp*60,Up=Hp*60,Wp=Up*24,Gp=Wp*7,Kp=Wp*30,qp=Wp*365,Jp=zp(e=>{e.setTime(e-e.getMilliseconds())},(e,t)=>{e.setTime(+e+t*Vp)},(e,t)=>(t-e)/Vp,e=>e.getUTCSeconds());Jp.range;const Yp=zp(e=>{e.setTime(e-e.getMilliseconds()-e.getSeconds()*Vp)},(e,t)=>{e.setTime(+e+t*Hp)},(e,t)=>(t-e)/Hp,e=>e.getMinutes());Yp.range;const Xp=zp(e=>{e.setUTCSeconds(0,0)},(e,t)=>{e.setTime(+e+t*Hp)},(e,t)=>(t-e)/Hp,e=>e.getUTCMinutes());Xp.range;const Zp=zp(e=>{e.setTime(e-e.getMilliseconds()-e.getSeconds()*Vp-e.getMinutes()*Hp)},(e,t)=>{e.setTime(+e+t*Up)},(e,t)=>(t-e)/Up,e=>e.getHours());Zp.range;const Qp=zp(e=>{e.setUTCMinutes(0,0,0)},(e,t)=>{e.setTime(+e+t*Up)},(e,t)=>(t-e)/Up,e=>e.getUTCHours());Qp.range;const $p=zp(e=>e.setHours(0,0,0,0),(e,t)=>e.setDate(e.getDate()+t),(e,t)=>(t-e-(t.getTimezoneOffset()-e.getTimezoneOffset())*Hp)/Wp,e=>e.getDate()-1);$p.range;const em=zp(e=>{e.setUTCHours(0,0,0,0)},(e,t)=>{e.setUTCDate(e.getUTCDate()+t)},(e,t)=>(t-e)/Wp,e=>e.getUTCDate()-1);em.range;const tm=zp(e=>{e.setUTCHours(0,0,0,0)},(e,t)=>{e.setUTCDate(e.getUTCDate()+t)},(e,t)=>(t-e)/Wp,e=>Math.floor(e/Wp));tm.range;function nm(e){return zp(t=>{t.setDate(t.getDate()-(t.getDay()+7-e)%7),t.setHours(0,0,0,0)},(e,t)=>{e.setDate(e.getDate()+t*7)},(e,t)=>(t-e-(t.getTimezoneOffset()-e.getTimezoneOffset())*Hp)/Gp)}const rm=nm(0),im=nm(1),am=nm(2),om=nm(3),sm=nm(4),cm=nm(5),lm=nm(6);rm.range,im.range,am.range,om.range,sm.range,cm.range,lm.range;function um(e){return zp(t=>{t.setUTCDate(t.getUTCDate()-(t.getUTCDay()+7-e)%7),t.setUTCHours(0,0,0,0)},(e,t)=>{e.setUTCDate(e.getUTCDate()+t*7)},(e,t)=>(t-e)/Gp)}const dm=um(0),fm=um(1),pm=um(2),mm=um(3),hm=um(4),gm=um(5),_m=um(6);dm.range,fm.range,pm.range,mm.range,hm.range,gm.range,_m.range;const vm=zp(e=>{e.setDate(1),e.setHours(0,0,0,0)},(e,t)=>{e.setMonth(e.getMonth()+t)},(e,t)=>t.getMonth()-e.getMonth()+(t.getFullYear()-e.getFullYear())*12,e=>e.getMonth());vm.range;const ym=zp(e=>{e.setUTCDate(1),e.setUTCHours(0,0,0,0)},(e,t)=>{e.setUTCMonth(e.getUTCMonth()+t)},(e,t)=>t.getUTCMonth()-e.getUTCMonth()+(t.getUTCFullYear()-e.getUTCFullYear())*12,e=>e.getUTCMonth());ym.range;const bm=zp(e=>{e.setMonth(0,1),e.setHours(0,0,0,0)},(e,t)=>{e.setFullYear(e.getFullYear()+t)},(e,t)=>t.getFullYear()-e.getFullYear(),e=>e.getFullYear());bm.every=e=>!isFinite(e=Math.floor(e))||!(e>0)?null:zp(t=>{t.setFullYear(Math.floor(t.getFullYear()/e)*e),t.setMonth(0,1),t.setHours(0,0,0,0)},(t,n)=>{t.setFullYear(t.getFullYear()+n*e)}),bm.range;const xm=zp(e=>{e.setUTCMonth(0,1),e.setUTCHours(0,0,0,0)},(e,t)=>{e.setUTCFullYear(e.getUTCFullYear()+t)},(e,t)=>t.getUTCFullYear()-e.getUTCFullYear(),e=>e.getUTCFullYear());xm.every=e=>!isFinite(e=Math.floor(e))||!(e>0)?null:zp(t=>{t.setUTCFullYear(Math.floor(t.getUTCFullYear()/e)*e),t.setUTCMonth(0,1),t.setUTCHours(0,0,0,0)},(t,n)=>{t.setUTCFullYear(t.getUTCFullYear()+n*e)}),xm.range;function Sm(e,t,n,r,i,a){let o=[[Jp,1,Vp],[Jp,5,5*Vp],[Jp,15,15*Vp],[Jp,30,30*Vp],[a,1,Hp],[a,5,5*Hp],[a,15,15*Hp],[a,30,30*Hp],[i,1,Up],[i,3,3*Up],[i,6,6*Up],[i,12,12*Up],[r,1,Wp],[r,2,2*Wp],[n,1,Gp],[t,1,Kp],[t,3,3*Kp],[e,1,qp]];function s(e,t,n){let r=t<e;r&&([e,t]=[t,e]);let i=n&&typeof n.range==`function`?n:c(e,t,n),a=i?i.range(e,+t+1):[];return r?a.reverse():a}function c(t,n,r){let i=Math.abs(n-t)/r,a=Lu(([,,e])=>e).right(o,i);if(a===o.length)return e.every(rd(t/qp,n/qp,r));if(a===0)return Bp.every(Math.max(rd(t,n,r),1));let[s,c]=o[i/o[a-1][2]<o[a][2]/i?a-1:a];return s.every(c)}return[s,c]}var[Cm,wm]=Sm(xm,ym,dm,tm,Qp,Xp),[Tm,Em]=Sm(bm,vm,rm,$p,Zp,Yp);function Dm(e){if(0<=e.y&&e.y<100){var t=new Date(-1,e.m,e.d,e.H,e.M,e.S,e.L);return t.setFullYear(e.y),t}return new Date(e.y,e.m,e.d,e.H,e.M,e.S,e.L)}function Om(e){if(0<=e.y&&e.y<100){var t=new Date(Date.UTC(-1,e.m,e.d,e.H,e.M,e.S,e.L));return t.setUTCFullYear(e.y),t}return new Date(Date.UTC(e.y,e.m,e.d,e.H,e.M,e.S,e.L))}function km(e,t,n){return{y:e,m:t,d:n,H:0,M:0,S:0,L:0}}function Am(e){var t=e.dateTime,n=e.date,r=e.time,i=e.periods,a=e.days,o=e.shortDays,s=e.months,c=e.shortMonths,l=Im(i),u=Lm(i),d=Im(a),f=Lm(a),p=Im(o),m=Lm(o),h=Im(s),g=Lm(s),_=Im(c),v=Lm(c),y={a:re,A,b:ie,B:ae,c:null,d:ih,e:ih,f:lh,g:bh,G:Sh,H:ah,I:oh,j:sh,L:ch,m:uh,M:dh,p:oe,q:se,Q:Gh,s:Kh,S:fh,u:ph,U:mh,V:gh,w:_h,W:vh,x:null,X:null,y:yh,Y:xh,Z:Ch,"%":Wh},b={a:ce,A:le,b:ue,B:de,c:null,d:wh,e:wh,f:kh,g:Bh,G:Hh,H:Th,I:Eh,j:Dh,L:Oh,m:Ah,M:jh,p:j,q:fe,Q:Gh,s:Kh,S:Mh,u:Nh,U:Ph,V:Ih,w:Lh,W:Rh,x:null,X:null,y:zh,Y:Vh,Z:Uh,"%":Wh},x={a:E,A:D,b:O,B:ee,c:k,d:Jm,e:Jm,f:eh,g:Wm,G:Um,H:Xm,I:Xm,j:Ym,L:$m,m:qm,M:Zm,p:T,q:Km,Q:nh,s:rh,S:Qm,u:zm,U:Bm,V:Vm,w:Rm,W:Hm,x:te,X:ne,y:Wm,Y:Um,Z:Gm,"%":th};y.x=S(n,y),y.X=S(r,y),y.c=S(t,y),b.x=S(n,b),b.X=S(r,b),b.c=S(t,b);function S(e,t){return function(n){var r=[],i=-1,a=0,o=e.length,s,c,l;for(n instanceof Date||(n=new Date(+n));++i<o;)e.charCodeAt(i)===37&&(r.push(e.slice(a,i)),(c=jm[s=e.charAt(++i)])==null?c=s===`e`?` `:`0`:s=e.charAt(++i),(l=t[s])&&(s=l(n,c)),r.push(s),a=i+1);return r.push(e.slice(a,i)),r.join(``)}}function C(e,t){return function(n){var r=km(1900,void 0,1),i=w(r,e,n+=``,0),a,o;if(i!=n.length)return null;if(`Q`in r)return new Date(r.Q);if(`s`in r)return new Date(r.s*1e3+(`L`in r?r.L:0));if(t&&!(`Z`in r)&&(r.Z=0),`p`in r&&(r.H=r.H%12+r.p*12),r.m===void 0&&(r.m=`q`in r?r.q:0),`V`in r){if(r.V<1||r.V>53)return null;`w`in r||(r.w=1),`Z`in r?(a=Om(km(r.y,0,1)),o=a.getUTCDay(),a=o>4||o===0?fm.ceil(a):fm(a),a=em.offset(a,(r.V-1)*7),r.y=a.getUTCFullYear(),r.m=a.getUTCMonth(),r.d=a.getUTCDate()+(r.w+6)%7):(a=Dm(km(r.y,0,1)),o=a.getDay(),a=o>4||o===0?im.ceil(a):im(a),a=$p.offset(a,(r.V-1)*7),r.y=a.getFullYear(),r.m=a.getMonth(),r.d=a.getDate()+(r.w+6)%7)}else (`W`in r||`U`in r)&&(`w`in r||(r.w=`u`in r?r.u%7:`W`in r?1:0),o=`Z`in r?Om(km(r.y,0,1)).getUTCDay():Dm(km(r.y,0,1)).getDay(),r.m=0,r.d=`W`in r?(r.w+6)%7+r.W*7-(o+5)%7:r.w+r.U*7-(o+6)%7);return`Z`in r?(r.H+=r.Z/100|0,r.M+=r.Z%100,Om(r)):Dm(r)}}function w(e,t,n,r){for(var i=0,a=t.length,o=n.length,s,c;i<a;){if(r>=o)return-1;if(s=t.charCodeAt(i++),s===37){if(s=t.charAt(i++),c=x[s in jm?t.charAt(i++):s],!c||(r=c(e,n,r))<0)return-1}else if(s!=n.charCodeAt(r++))return-1}return r}function T(e,t,n){var r=l.exec(t.slice(n));return r?(e.p=u.get(r[0].toLowerCase()),n+r[0].length):-1}function E(e,t,n){var r=p.exec(t.slice(n));return r?(e.w=m.get(r[0].toLowerCase()),n+r[0].length):-1}function D(e,t,n){var r=d.exec(t.slice(n));return r?(e.w=f.get(r[0].toLowerCase()),n+r[0].length):-1}function O(e,t,n){var r=_.exec(t.slice(n));return r?(e.m=v.get(r[0].toLowerCase()),n+r[0].length):-1}function ee(e,t,n){var r=h.exec(t.slice(n));return r?(e.m=g.get(r[0].toLowerCase()),n+r[0].length):-1}function k(e,n,r){return w(e,t,n,r)}function te(e,t,r){return w(e,n,t,r)}function ne(e,t,n){return w(e,r,t,n)}function re(e){return o[e.getDay()]}function A(e){return a[e.getDay()]}function ie(e){return c[e.getMonth()]}function ae(e){return s[e.getMonth()]}function oe(e){return i[+(e.getHours()>=12)]}function se(e){return 1+~~(e.getMonth()/3)}function ce(e){return o[e.getUTCDay()]}function le(e){return a[e.getUTCDay()]}function ue(e){return c[e.getUTCMonth()]}function de(e){return s[e.getUTCMonth()]}function j(e){return i[+(e.getUTCHours()>=12)]}function fe(e){return 1+~~(e.getUTCMonth()/3)}return{format:function(e){var t=S(e+=``,y);return t.toString=function(){return e},t},parse:function(e){var t=C(e+=``,!1);return t.toString=function(){return e},t},utcFormat:function(e){var t=S(e+=``,b);return t.toString=function(){return e},t},utcParse:function(e){var t=C(e+=``,!0);return t.toString=function(){return e},t}}}var jm={"-":``,_:` `,0:`0`},Mm=/^\s*\d+/,Nm=/^%/,Pm=/[\\^$*+?|[\]().{}]/g;function U(e,t,n){var r=e<0?`-`:``,i=(r?-e:e)+``,a=i.length;return r+(a<n?Array(n-a+1).join(t)+i:i)}function Fm(e){return e.replace(Pm,`\\$&`)}function Im(e){return RegExp(`^(?:`+e.map(Fm).join(`|`)+`)`,`i`)}function Lm(e){return new Map(e.map((e,t)=>[e.toLowerCase(),t]))}function Rm(e,t,n){var r=Mm.exec(t.slice(n,n+1));return r?(e.w=+r[0],n+r[0].length):-1}function zm(e,t,n){var r=Mm.exec(t.slice(n,n+1));return r?(e.u=+r[0],n+r[0].length):-1}function Bm(e,t,n){var r=Mm.exec(t.slice(n,n+2));return r?(e.U=+r[0],n+r[0].length):-1}function Vm(e,t,n){var r=Mm.exec(t.slice(n,n+2));return r?(e.V=+r[0],n+r[0].length):-1}function Hm(e,t,n){var r=Mm.exec(t.slice(n,n+2));return r?(e.W=+r[0],n+r[0].length):-1}function Um(e,t,n){var r=Mm.exec(t.slice(n,n+4));return r?(e.y=+r[0],n+r[0].length):-1}function Wm(e,t,n){var r=Mm.exec(t.slice(n,n+2));return r?(e.y=+r[0]+(+r[0]>68?1900:2e3),n+r[0].length):-1}function Gm(e,t,n){var r=/^(Z)|([+-]\d\d)(?::?(\d\d))?/.exec(t.slice(n,n+6));return r?(e.Z=r[1]?0:-(r[2]+(r[3]||`00`)),n+r[0].length):-1}function Km(e,t,n){var r=Mm.exec(t.slice(n,n+1));return r?(e.q=r[0]*3-3,n+r[0].length):-1}function qm(e,t,n){var r=Mm.exec(t.slice(n,n+2));return r?(e.m=r[0]-1,n+r[0].length):-1}function Jm(e,t,n){var r=Mm.exec(t.slice(n,n+2));return r?(e.d=+r[0],n+r[0].length):-1}function Ym(e,t,n){var r=Mm.exec(t.slice(n,n+3));return r?(e.m=0,e.d=+r[0],n+r[0].length):-1}function Xm(e,t,n){var r=Mm.exec(t.slice(n,n+2));return r?(e.H=+r[0],n+r[0].length):-1}function Zm(e,t,n){var r=Mm.exec(t.slice(n,n+2));return r?(e.M=+r[0],n+r[0].length):-1}function Qm(e,t,n){var r=Mm.exec(t.slice(n,n+2));return r?(e.S=+r[0],n+r[0].length):-1}function $m(e,t,n){var r=Mm.exec(t.slice(n,n+3));return r?(e.L=+r[0],n+r[0].length):-1}function eh(e,t,n){var r=Mm.exec(t.slice(n,n+6));return r?(e.L=Math.floor(r[0]/1e3),n+r[0].length):-1}function th(e,t,n){var r=Nm.exec(t.slice(n,n+1));return r?n+r[0].length:-1}function nh(e,t,n){var r=Mm.exec(t.slice(n));return r?(e.Q=+r[0],n+r[0].length):-1}function rh(e,t,n){var r=Mm.exec(t.slice(n));return r?(e.s=+r[0],n+r[0].length):-1}function ih(e,t){return U(e.getDate(),t,2)}function ah(e,t){return U(e.getHours(),t,2)}function oh(e,t){return U(e.getHours()%12||12,t,2)}function sh(e,t){return U(1+$p.count(bm(e),e),t,3)}function ch(e,t){return U(e.getMilliseconds(),t,3)}function lh(e,t){return ch(e,t)+`000`}function uh(e,t){return U(e.getMonth()+1,t,2)}function dh(e,t){return U(e.getMinutes(),t,2)}function fh(e,t){return U(e.getSeconds(),t,2)}function ph(e){var t=e.getDay();return t===0?7:t}function mh(e,t){return U(rm.count(bm(e)-1,e),t,2)}function hh(e){var t=e.getDay();return t>=4||t===0?sm(e):sm.ceil(e)}function gh(e,t){return e=hh(e),U(sm.count(bm(e),e)+(bm(e).getDay()===4),t,2)}function _h(e){return e.getDay()}function vh(e,t){return U(im.count(bm(e)-1,e),t,2)}function yh(e,t){return U(e.getFullYear()%100,t,2)}function bh(e,t){return e=hh(e),U(e.getFullYear()%100,t,2)}function xh(e,t){return U(e.getFullYear()%1e4,t,4)}function Sh(e,t){var n=e.getDay();return e=n>=4||n===0?sm(e):sm.ceil(e),U(e.getFullYear()%1e4,t,4)}function Ch(e){var t=e.getTimezoneOffset();return(t>0?`-`:(t*=-1,`+`))+U(t/60|0,`0`,2)+U(t%60,`0`,2)}function wh(e,t){return U(e.getUTCDate(),t,2)}function Th(e,t){return U(e.getUTCHours(),t,2)}function Eh(e,t){return U(e.getUTCHours()%12||12,t,2)}function Dh(e,t){return U(1+em.count(xm(e),e),t,3)}function Oh(e,t){return U(e.getUTCMilliseconds(),t,3)}function kh(e,t){return Oh(e,t)+`000`}function Ah(e,t){return U(e.getUTCMonth()+1,t,2)}function jh(e,t){return U(e.getUTCMinutes(),t,2)}function Mh(e,t){return U(e.getUTCSeconds(),t,2)}function Nh(e){var t=e.getUTCDay();return t===0?7:t}function Ph(e,t){return U(dm.count(xm(e)-1,e),t,2)}function Fh(e){var t=e.getUTCDay();return t>=4||t===0?hm(e):hm.ceil(e)}function Ih(e,t){return e=Fh(e),U(hm.count(xm(e),e)+(xm(e).getUTCDay()===4),t,2)}function Lh(e){return e.getUTCDay()}function Rh(e,t){return U(fm.count(xm(e)-1,e),t,2)}function zh(e,t){return U(e.getUTCFullYear()%100,t,2)}function Bh(e,t){return e=Fh(e),U(e.getUTCFullYear()%100,t,2)}function Vh(e,t){return U(e.getUTCFullYear()%1e4,t,4)}function Hh(e,t){var n=e.getUTCDay();return e=n>=4||n===0?hm(e):hm.ceil(e),U(e.getUTCFullYear()%1e4,t,4)}function Uh(){return`+0000`}function Wh(){return`%`}function Gh(e){return+e}function Kh(e){return Math.floor(e/1e3)}var qh,Jh,Yh;Xh({dateTime:`%x, %X`,date:`%-m/%-d/%Y`,time:`%-I:%M:%S %p`,periods:[`AM`,`PM`],days:[`Sunday`,`Monday`,`Tuesday`,`Wednesday`,`Thursday`,`Friday`,`Saturday`],shortDays:[`Sun`,`Mon`,`Tue`,`Wed`,`Thu`,`Fri`,`Sat`],months:[`January`,`February`,`March`,`April`,`May`,`June`,`July`,`August`,`September`,`October`,`November`,`December`],shortMonths:[`Jan`,`Feb`,`Mar`,`Apr`,`May`,`Jun`,`Jul`,`Aug`,`Sep`,`Oct`,`Nov`,`Dec`]});function Xh(e){return qh=Am(e),Jh=qh.format,qh.parse,Yh=qh.utcFormat,qh.utcParse,qh}function Zh(e){return new Date(e)}function Qh(e){return e instanceof Date?+e:+new Date(+e)}function $h(e,t,n,r,i,a,o,s,c,l){var u=Ff(),d=u.invert,f=u.domain,p=l(`.%L`),m=l(`:%S`),h=l(`%I:%M`),g=l(`%I %p`),_=l(`%a %d`),v=l(`%b %d`),y=l(`%B`),b=l(`%Y`);function x(e){return(c(e)<e?p:s(e)<e?m:o(e)<e?h:a(e)<e?g:r(e)<e?i(e)<e?_:v:n(e)<e?y:b)(e)}return u.invert=function(e){return new Date(d(e))},u.domain=function(e){return arguments.length?f(Array.from(e,Qh)):f().map(Zh)},u.ticks=function(t){var n=f();return e(n[0],n[n.length-1],t??10)},u.tickFormat=function(e,t){return t==null?x:l(t)},u.nice=function(e){var n=f();return(!e||typeof e.range!=`function`)&&(e=t(n[0],n[n.length-1],e??10)),e?f(up(n,e)):u},u.copy=function(){return Nf(u,$h(e,t,n,r,i,a,o,s,c,l))},u}function eg(){return dd.apply($h(Tm,Em,bm,vm,rm,$p,Zp,Yp,Jp,Jh).domain([new Date(2e3,0,1),new Date(2e3,0,2)]),arguments)}function tg(){return dd.apply($h(Cm,wm,xm,ym,dm,em,Qp,Xp,Jp,Yh).domain([Date.UTC(2e3,0,1),Date.UTC(2e3,0,2)]),arguments)}function ng(){var e=0,t=1,n,r,i,a,o=Of,s=!1,c;function l(e){return e==null||isNaN(e=+e)?c:o(i===0?.5:(e=(a(e)-n)*i,s?Math.max(0,Math.min(1,e)):e))}l.domain=function(o){return arguments.length?([e,t]=o,n=a(e=+e),r=a(t=+t),i=n===r?0:1/(r-n),l):[e,t]},l.clamp=function(e){return arguments.length?(s=!!e,l):s},l.interpolator=function(e){return arguments.length?(o=e,l):o};function u(e){return function(t){var n,r;return arguments.length?([n,r]=t,o=e(n,r),l):[o(0),o(1)]}}return l.range=u(Sf),l.rangeRound=u(Cf),l.unknown=function(e){return arguments.length?(c=e,l):c},function(o){return a=o,n=o(e),r=o(t),i=n===r?0:1/(r-n),l}}function rg(e,t){return t.domain(e.domain()).interpolator(e.interpolator()).clamp(e.clamp()).unknown(e.unknown())}function ig(){var e=sp(ng()(Of));return e.copy=function(){return rg(e,ig())},fd.apply(e,arguments)}function ag(){var e=yp(ng()).domain([1,10]);return e.copy=function(){return rg(e,ag()).base(e.base())},fd.apply(e,arguments)}function og(){var e=Cp(ng());return e.copy=function(){return rg(e,og()).constant(e.constant())},fd.apply(e,arguments)}function sg(){var e=Op(ng());return e.copy=function(){return rg(e,sg()).exponent(e.exponent())},fd.apply(e,arguments)}function cg(){return sg.apply(null,arguments).exponent(.5)}function lg(){var e=[],t=Of;function n(n){if(n!=null&&!isNaN(n=+n))return t((Uu(e,n,1)-1)/(e.length-1))}return n.domain=function(t){if(!arguments.length)return e.slice();e=[];for(let n of t)n!=null&&!isNaN(n=+n)&&e.push(n);return e.sort(Fu),n},n.interpolator=function(e){return arguments.length?(t=e,n):t},n.range=function(){return e.map((n,r)=>t(r/(e.length-1)))},n.quantiles=function(t){return Array.from({length:t+1},(n,r)=>cd(e,r/t))},n.copy=function(){return lg(t).domain(e)},fd.apply(n,arguments)}function ug(){var e=0,t=.5,n=1,r=1,i,a,o,s,c,l=Of,u,d=!1,f;function p(e){return isNaN(e=+e)?f:(e=.5+((e=+u(e))-a)*(r*e<r*a?s:c),l(d?Math.max(0,Math.min(1,e)):e))}p.domain=function(l){return arguments.length?([e,t,n]=l,i=u(e=+e),a=u(t=+t),o=u(n=+n),s=i===a?0:.5/(a-i),c=a===o?0:.5/(o-a),r=a<i?-1:1,p):[e,t,n]},p.clamp=function(e){return arguments.length?(d=!!e,p):d},p.interpolator=function(e){return arguments.length?(l=e,p):l};function m(e){return function(t){var n,r,i;return arguments.length?([n,r,i]=t,l=wf(e,[n,r,i]),p):[l(0),l(.5),l(1)]}}return p.range=m(Sf),p.rangeRound=m(Cf),p.unknown=function(e){return arguments.length?(f=e,p):f},function(l){return u=l,i=l(e),a=l(t),o=l(n),s=i===a?0:.5/(a-i),c=a===o?0:.5/(o-a),r=a<i?-1:1,p}}function dg(){var e=sp(ug()(Of));return e.copy=function(){return rg(e,dg())},fd.apply(e,arguments)}function fg(){var e=yp(ug()).domain([.1,1,10]);return e.copy=function(){return rg(e,fg()).base(e.base())},fd.apply(e,arguments)}function pg(){var e=Cp(ug());return e.copy=function(){return rg(e,pg()).constant(e.constant())},fd.apply(e,arguments)}function mg(){var e=Op(ug());return e.copy=function(){return rg(e,mg()).exponent(e.exponent())},fd.apply(e,arguments)}function hg(){return mg.apply(null,arguments).exponent(.5)}var gg=t({scaleBand:()=>hd,scaleDiverging:()=>dg,scaleDivergingLog:()=>fg,scaleDivergingPow:()=>mg,scaleDivergingSqrt:()=>hg,scaleDivergingSymlog:()=>pg,scaleIdentity:()=>lp,scaleImplicit:()=>pd,scaleLinear:()=>cp,scaleLog:()=>bp,scaleOrdinal:()=>md,scalePoint:()=>_d,scalePow:()=>kp,scaleQuantile:()=>Pp,scaleQuantize:()=>Fp,scaleRadial:()=>Np,scaleSequential:()=>ig,scaleSequentialLog:()=>ag,scaleSequentialPow:()=>sg,scaleSequentialQuantile:()=>lg,scaleSequentialSqrt:()=>cg,scaleSequentialSymlog:()=>og,scaleSqrt:()=>Ap,scaleSymlog:()=>wp,scaleThreshold:()=>Ip,scaleTime:()=>eg,scaleUtc:()=>tg,tickFormat:()=>op}),_g=e=>e.chartData,vg=L([_g],e=>{var t=e.chartData==null?0:e.chartData.length-1;return{chartData:e.chartData,computedData:e.computedData,dataEndIndex:t,dataStartIndex:0}}),yg=(e,t,n,r)=>r?vg(e):_g(e);function bg(e){if(Array.isArray(e)&&e.length===2){var[t,n]=e;if(Zc(t)&&Zc(n))return!0}return!1}function xg(e,t,n){return n?e:[Math.min(e[0],t[0]),Math.max(e[1],t[1])]}function Sg(e,t){if(t&&typeof e!=`function`&&Array.isArray(e)&&e.length===2){var[n,r]=e,i,a;if(Zc(n))i=n;else if(typeof n==`function`)return;if(Zc(r))a=r;else if(typeof r==`function`)return;var o=[i,a];if(bg(o))return o}}function Cg(e,t,n){if(!(!n&&t==null)){if(typeof e==`function`&&t!=null)try{var r=e(t,n);if(bg(r))return xg(r,t,n)}catch{}if(Array.isArray(e)&&e.length===2){var[i,a]=e,o,s;if(i===`auto`)t!=null&&(o=Math.min(...t));else if(b(i))o=i;else if(typeof i==`function`)try{t!=null&&(o=i(t?.[0]))}catch{}else if(typeof i==`string`&&gs.test(i)){var c=gs.exec(i);if(c==null||t==null)o=void 0;else{var l=+c[1];o=t[0]-l}}else o=t?.[0];if(a===`auto`)t!=null&&(s=Math.max(...t));else if(b(a))s=a;else if(typeof a==`function`)try{t!=null&&(s=a(t?.[1]))}catch{}else if(typeof a==`string`&&_s.test(a)){var u=_s.exec(a);if(u==null||t==null)s=void 0;else{var d=+u[1];s=t[1]+d}}else s=t?.[1];var f=[o,s];if(bg(f))return t==null?f:xg(f,t,n)}}}var wg=1e9,Tg={precision:20,rounding:4,toExpNeg:-7,toExpPos:21,LN10:`2.302585092994045684017991454684364207601101488628772976033327900967572609677352480235997205089598298341967784042286`},Eg,W=!0,Dg=`[DecimalError] `,Og=Dg+`Invalid argument: `,kg=Dg+`Exponent out of range: `,Ag=Math.floor,jg=Math.pow,Mg=/^(\d+(\.\d*)?|\.\d+)(e[+-]?\d+)?$/i,Ng,Pg=1e7,G=7,Fg=9007199254740991,Ig=Ag(Fg/G),K={};K.absoluteValue=K.abs=function(){var e=new this.constructor(this);return e.s&&=1,e},K.comparedTo=K.cmp=function(e){var t,n,r,i,a=this;if(e=new a.constructor(e),a.s!==e.s)return a.s||-e.s;if(a.e!==e.e)return a.e>e.e^a.s<0?1:-1;for(r=a.d.length,i=e.d.length,t=0,n=r<i?r:i;t<n;++t)if(a.d[t]!==e.d[t])return a.d[t]>e.d[t]^a.s<0?1:-1;return r===i?0:r>i^a.s<0?1:-1},K.decimalPlaces=K.dp=function(){var e=this,t=e.d.length-1,n=(t-e.e)*G;if(t=e.d[t],t)for(;t%10==0;t/=10)n--;return n<0?0:n},K.dividedBy=K.div=function(e){return Bg(this,new this.constructor(e))},K.dividedToIntegerBy=K.idiv=function(e){var t=this,n=t.constructor;return q(Bg(t,new n(e),0,1),n.precision)},K.equals=K.eq=function(e){return!this.cmp(e)},K.exponent=function(){return Hg(this)},K.greaterThan=K.gt=function(e){return this.cmp(e)>0},K.greaterThanOrEqualTo=K.gte=function(e){return this.cmp(e)>=0},K.isInteger=K.isint=function(){return this.e>this.d.length-2},K.isNegative=K.isneg=function(){return this.s<0},K.isPositive=K.ispos=function(){return this.s>0},K.isZero=function(){return this.s===0},K.lessThan=K.lt=function(e){return this.cmp(e)<0},K.lessThanOrEqualTo=K.lte=function(e){return this.cmp(e)<1},K.logarithm=K.log=function(e){var t,n=this,r=n.constructor,i=r.precision,a=i+5;if(e===void 0)e=new r(10);else if(e=new r(e),e.s<1||e.eq(Ng))throw Error(Dg+`NaN`);if(n.s<1)throw Error(Dg+(n.s?`NaN`:`-Infinity`));return n.eq(Ng)?new r(0):(W=!1,t=Bg(Gg(n,a),Gg(e,a),a),W=!0,q(t,i))},K.minus=K.sub=function(e){var t=this;return e=new t.constructor(e),t.s==e.s?qg(t,e):Lg(t,(e.s=-e.s,e))},K.modulo=K.mod=function(e){var t,n=this,r=n.constructor,i=r.precision;if(e=new r(e),!e.s)throw Error(Dg+`NaN`);return n.s?(W=!1,t=Bg(n,e,0,1).times(e),W=!0,n.minus(t)):q(new r(n),i)},K.naturalExponential=K.exp=function(){return Vg(this)},K.naturalLogarithm=K.ln=function(){return Gg(this)},K.negated=K.neg=function(){var e=new this.constructor(this);return e.s=-e.s||0,e},K.plus=K.add=function(e){var t=this;return e=new t.constructor(e),t.s==e.s?Lg(t,e):qg(t,(e.s=-e.s,e))},K.precision=K.sd=function(e){var t,n,r,i=this;if(e!==void 0&&e!==!!e&&e!==1&&e!==0)throw Error(Og+e);if(t=Hg(i)+1,r=i.d.length-1,n=r*G+1,r=i.d[r],r){for(;r%10==0;r/=10)n--;for(r=i.d[0];r>=10;r/=10)n++}return e&&t>n?t:n},K.squareRoot=K.sqrt=function(){var e,t,n,r,i,a,o,s=this,c=s.constructor;if(s.s<1){if(!s.s)return new c(0);throw Error(Dg+`NaN`)}for(e=Hg(s),W=!1,i=Math.sqrt(+s),i==0||i==1/0?(t=zg(s.d),(t.length+e)%2==0&&(t+=`0`),i=Math.sqrt(t),e=Ag((e+1)/2)-(e<0||e%2),i==1/0?t=`5e`+e:(t=i.toExponential(),t=t.slice(0,t.indexOf(`e`)+1)+e),r=new c(t)):r=new c(i.toString()),n=c.precision,i=o=n+3;;)if(a=r,r=a.plus(Bg(s,a,o+2)).times(.5),zg(a.d).slice(0,o)===(t=zg(r.d)).slice(0,o)){if(t=t.slice(o-3,o+1),i==o&&t==`4999`){if(q(a,n+1,0),a.times(a).eq(s)){r=a;break}}else if(t!=`9999`)break;o+=4}return W=!0,q(r,n)},K.times=K.mul=function(e){var t,n,r,i,a,o,s,c,l,u=this,d=u.constructor,f=u.d,p=(e=new d(e)).d;if(!u.s||!e.s)return new d(0);for(e.s*=u.s,n=u.e+e.e,c=f.length,l=p.length,c<l&&(a=f,f=p,p=a,o=c,c=l,l=o),a=[],o=c+l,r=o;r--;)a.push(0);for(r=l;--r>=0;){for(t=0,i=c+r;i>r;)s=a[i]+p[r]*f[i-r-1]+t,a[i--]=s%Pg|0,t=s/Pg|0;a[i]=(a[i]+t)%Pg|0}for(;!a[--o];)a.pop();return t?++n:a.shift(),e.d=a,e.e=n,W?q(e,d.precision):e},K.toDecimalPlaces=K.todp=function(e,t){var n=this,r=n.constructor;return n=new r(n),e===void 0?n:(Rg(e,0,wg),t===void 0?t=r.rounding:Rg(t,0,8),q(n,e+Hg(n)+1,t))},K.toExponential=function(e,t){var n,r=this,i=r.constructor;return e===void 0?n=Jg(r,!0):(Rg(e,0,wg),t===void 0?t=i.rounding:Rg(t,0,8),r=q(new i(r),e+1,t),n=Jg(r,!0,e+1)),n},K.toFixed=function(e,t){var n,r,i=this,a=i.constructor;return e===void 0?Jg(i):(Rg(e,0,wg),t===void 0?t=a.rounding:Rg(t,0,8),r=q(new a(i),e+Hg(i)+1,t),n=Jg(r.abs(),!1,e+Hg(r)+1),i.isneg()&&!i.isZero()?`-`+n:n)},K.toInteger=K.toint=function(){var e=this,t=e.constructor;return q(new t(e),Hg(e)+1,t.rounding)},K.toNumber=function(){return+this},K.toPower=K.pow=function(e){var t,n,r,i,a,o,s=this,c=s.constructor,l=12,u=+(e=new c(e));if(!e.s)return new c(Ng);if(s=new c(s),!s.s){if(e.s<1)throw Error(Dg+`Infinity`);return s}if(s.eq(Ng))return s;if(r=c.precision,e.eq(Ng))return q(s,r);if(t=e.e,n=e.d.length-1,o=t>=n,a=s.s,o){if((n=u<0?-u:u)<=Fg){for(i=new c(Ng),t=Math.ceil(r/G+4),W=!1;n%2&&(i=i.times(s),Yg(i.d,t)),n=Ag(n/2),n!==0;)s=s.times(s),Yg(s.d,t);return W=!0,e.s<0?new c(Ng).div(i):q(i,r)}}else if(a<0)throw Error(Dg+`NaN`);return a=a<0&&e.d[Math.max(t,n)]&1?-1:1,s.s=1,W=!1,i=e.times(Gg(s,r+l)),W=!0,i=Vg(i),i.s=a,i},K.toPrecision=function(e,t){var n,r,i=this,a=i.constructor;return e===void 0?(n=Hg(i),r=Jg(i,n<=a.toExpNeg||n>=a.toExpPos)):(Rg(e,1,wg),t===void 0?t=a.rounding:Rg(t,0,8),i=q(new a(i),e,t),n=Hg(i),r=Jg(i,e<=n||n<=a.toExpNeg,e)),r},K.toSignificantDigits=K.tosd=function(e,t){var n=this,r=n.constructor;return e===void 0?(e=r.precision,t=r.rounding):(Rg(e,1,wg),t===void 0?t=r.rounding:Rg(t,0,8)),q(new r(n),e,t)},K.toString=K.valueOf=K.val=K.toJSON=K[Symbol.for(`nodejs.util.inspect.custom`)]=function(){var e=this,t=Hg(e),n=e.constructor;return Jg(e,t<=n.toExpNeg||t>=n.toExpPos)};function Lg(e,t){var n,r,i,a,o,s,c,l,u=e.constructor,d=u.precision;if(!e.s||!t.s)return t.s||(t=new u(e)),W?q(t,d):t;if(c=e.d,l=t.d,o=e.e,i=t.e,c=c.slice(),a=o-i,a){for(a<0?(r=c,a=-a,s=l.length):(r=l,i=o,s=c.length),o=Math.ceil(d/G),s=o>s?o+1:s+1,a>s&&(a=s,r.length=1),r.reverse();a--;)r.push(0);r.reverse()}for(s=c.length,a=l.length,s-a<0&&(a=s,r=l,l=c,c=r),n=0;a;)n=(c[--a]=c[a]+l[a]+n)/Pg|0,c[a]%=Pg;for(n&&(c.unshift(n),++i),s=c.length;c[--s]==0;)c.pop();return t.d=c,t.e=i,W?q(t,d):t}function Rg(e,t,n){if(e!==~~e||e<t||e>n)throw Error(Og+e)}function zg(e){var t,n,r,i=e.length-1,a=``,o=e[0];if(i>0){for(a+=o,t=1;t<i;t++)r=e[t]+``,n=G-r.length,n&&(a+=Wg(n)),a+=r;o=e[t],r=o+``,n=G-r.length,n&&(a+=Wg(n))}else if(o===0)return`0`;for(;o%10==0;)o/=10;return a+o}var Bg=(function(){function e(e,t){var n,r=0,i=e.length;for(e=e.slice();i--;)n=e[i]*t+r,e[i]=n%Pg|0,r=n/Pg|0;return r&&e.unshift(r),e}function t(e,t,n,r){var i,a;if(n!=r)a=n>r?1:-1;else for(i=a=0;i<n;i++)if(e[i]!=t[i]){a=e[i]>t[i]?1:-1;break}return a}function n(e,t,n){for(var r=0;n--;)e[n]-=r,r=e[n]<t[n]?1:0,e[n]=r*Pg+e[n]-t[n];for(;!e[0]&&e.length>1;)e.shift()}return function(r,i,a,o){var s,c,l,u,d,f,p,m,h,g,_,v,y,b,x,S,C,w,T=r.constructor,E=r.s==i.s?1:-1,D=r.d,O=i.d;if(!r.s)return new T(r);if(!i.s)throw Error(Dg+`Division by zero`);for(c=r.e-i.e,C=O.length,x=D.length,p=new T(E),m=p.d=[],l=0;O[l]==(D[l]||0);)++l;if(O[l]>(D[l]||0)&&--c,v=a==null?a=T.precision:o?a+(Hg(r)-Hg(i))+1:a,v<0)return new T(0);if(v=v/G+2|0,l=0,C==1)for(u=0,O=O[0],v++;(l<x||u)&&v--;l++)y=u*Pg+(D[l]||0),m[l]=y/O|0,u=y%O|0;else{for(u=Pg/(O[0]+1)|0,u>1&&(O=e(O,u),D=e(D,u),C=O.length,x=D.length),b=C,h=D.slice(0,C),g=h.length;g<C;)h[g++]=0;w=O.slice(),w.unshift(0),S=O[0],O[1]>=Pg/2&&++S;do u=0,s=t(O,h,C,g),s<0?(_=h[0],C!=g&&(_=_*Pg+(h[1]||0)),u=_/S|0,u>1?(u>=Pg&&(u=Pg-1),d=e(O,u),f=d.length,g=h.length,s=t(d,h,f,g),s==1&&(u--,n(d,C<f?w:O,f))):(u==0&&(s=u=1),d=O.slice()),f=d.length,f<g&&d.unshift(0),n(h,d,g),s==-1&&(g=h.length,s=t(O,h,C,g),s<1&&(u++,n(h,C<g?w:O,g))),g=h.length):s===0&&(u++,h=[0]),m[l++]=u,s&&h[0]?h[g++]=D[b]||0:(h=[D[b]],g=1);while((b++<x||h[0]!==void 0)&&v--)}return m[0]||m.shift(),p.e=c,q(p,o?a+Hg(p)+1:a)}})();function Vg(e,t){var n,r,i,a,o,s,c=0,l=0,u=e.constructor,d=u.precision;if(Hg(e)>16)throw Error(kg+Hg(e));if(!e.s)return new u(Ng);for(t==null?(W=!1,s=d):s=t,o=new u(.03125);e.abs().gte(.1);)e=e.times(o),l+=5;for(r=Math.log(jg(2,l))/Math.LN10*2+5|0,s+=r,n=i=a=new u(Ng),u.precision=s;;){if(i=q(i.times(e),s),n=n.times(++c),o=a.plus(Bg(i,n,s)),zg(o.d).slice(0,s)===zg(a.d).slice(0,s)){for(;l--;)a=q(a.times(a),s);return u.precision=d,t==null?(W=!0,q(a,d)):a}a=o}}function Hg(e){for(var t=e.e*G,n=e.d[0];n>=10;n/=10)t++;return t}function Ug(e,t,n){if(t>e.LN10.sd())throw W=!0,n&&(e.precision=n),Error(Dg+`LN10 precision limit exceeded`);return q(new e(e.LN10),t)}function Wg(e){for(var t=``;e--;)t+=`0`;return t}function Gg(e,t){var n,r,i,a,o,s,c,l,u,d=1,f=10,p=e,m=p.d,h=p.constructor,g=h.precision;if(p.s<1)throw Error(Dg+(p.s?`NaN`:`-Infinity`));if(p.eq(Ng))return new h(0);if(t==null?(W=!1,l=g):l=t,p.eq(10))return t??(W=!0),Ug(h,l);if(l+=f,h.precision=l,n=zg(m),r=n.charAt(0),a=Hg(p),Math.abs(a)<0x5543df729c000){for(;r<7&&r!=1||r==1&&n.charAt(1)>3;)p=p.times(e),n=zg(p.d),r=n.charAt(0),d++;a=Hg(p),r>1?(p=new h(`0.`+n),a++):p=new h(r+`.`+n.slice(1))}else return c=Ug(h,l+2,g).times(a+``),p=Gg(new h(r+`.`+n.slice(1)),l-f).plus(c),h.precision=g,t==null?(W=!0,q(p,g)):p;for(s=o=p=Bg(p.minus(Ng),p.plus(Ng),l),u=q(p.times(p),l),i=3;;){if(o=q(o.times(u),l),c=s.plus(Bg(o,new h(i),l)),zg(c.d).slice(0,l)===zg(s.d).slice(0,l))return s=s.times(2),a!==0&&(s=s.plus(Ug(h,l+2,g).times(a+``))),s=Bg(s,new h(d),l),h.precision=g,t==null?(W=!0,q(s,g)):s;s=c,i+=2}}function Kg(e,t){var n,r,i;for((n=t.indexOf(`.`))>-1&&(t=t.replace(`.`,``)),(r=t.search(/e/i))>0?(n<0&&(n=r),n+=+t.slice(r+1),t=t.substring(0,r)):n<0&&(n=t.length),r=0;t.charCodeAt(r)===48;)++r;for(i=t.length;t.charCodeAt(i-1)===48;)--i;if(t=t.slice(r,i),t){if(i-=r,n=n-r-1,e.e=Ag(n/G),e.d=[],r=(n+1)%G,n<0&&(r+=G),r<i){for(r&&e.d.push(+t.slice(0,r)),i-=G;r<i;)e.d.push(+t.slice(r,r+=G));t=t.slice(r),r=G-t.length}else r-=i;for(;r--;)t+=`0`;if(e.d.push(+t),W&&(e.e>Ig||e.e<-Ig))throw Error(kg+n)}else e.s=0,e.e=0,e.d=[0];return e}function q(e,t,n){var r,i,a,o,s,c,l,u,d=e.d;for(o=1,a=d[0];a>=10;a/=10)o++;if(r=t-o,r<0)r+=G,i=t,l=d[u=0];else{if(u=Math.ceil((r+1)/G),a=d.length,u>=a)return e;for(l=a=d[u],o=1;a>=10;a/=10)o++;r%=G,i=r-G+o}if(n!==void 0&&(a=jg(10,o-i-1),s=l/a%10|0,c=t<0||d[u+1]!==void 0||l%a,c=n<4?(s||c)&&(n==0||n==(e.s<0?3:2)):s>5||s==5&&(n==4||c||n==6&&(r>0?i>0?l/jg(10,o-i):0:d[u-1])%10&1||n==(e.s<0?8:7))),t<1||!d[0])return c?(a=Hg(e),d.length=1,t=t-a-1,d[0]=jg(10,(G-t%G)%G),e.e=Ag(-t/G)||0):(d.length=1,d[0]=e.e=e.s=0),e;if(r==0?(d.length=u,a=1,u--):(d.length=u+1,a=jg(10,G-r),d[u]=i>0?(l/jg(10,o-i)%jg(10,i)|0)*a:0),c)for(;;)if(u==0){(d[0]+=a)==Pg&&(d[0]=1,++e.e);break}else{if(d[u]+=a,d[u]!=Pg)break;d[u--]=0,a=1}for(r=d.length;d[--r]===0;)d.pop();if(W&&(e.e>Ig||e.e<-Ig))throw Error(kg+Hg(e));return e}function qg(e,t){var n,r,i,a,o,s,c,l,u,d,f=e.constructor,p=f.precision;if(!e.s||!t.s)return t.s?t.s=-t.s:t=new f(e),W?q(t,p):t;if(c=e.d,d=t.d,r=t.e,l=e.e,c=c.slice(),o=l-r,o){for(u=o<0,u?(n=c,o=-o,s=d.length):(n=d,r=l,s=c.length),i=Math.max(Math.ceil(p/G),s)+2,o>i&&(o=i,n.length=1),n.reverse(),i=o;i--;)n.push(0);n.reverse()}else{for(i=c.length,s=d.length,u=i<s,u&&(s=i),i=0;i<s;i++)if(c[i]!=d[i]){u=c[i]<d[i];break}o=0}for(u&&(n=c,c=d,d=n,t.s=-t.s),s=c.length,i=d.length-s;i>0;--i)c[s++]=0;for(i=d.length;i>o;){if(c[--i]<d[i]){for(a=i;a&&c[--a]===0;)c[a]=Pg-1;--c[a],c[i]+=Pg}c[i]-=d[i]}for(;c[--s]===0;)c.pop();for(;c[0]===0;c.shift())--r;return c[0]?(t.d=c,t.e=r,W?q(t,p):t):new f(0)}function Jg(e,t,n){var r,i=Hg(e),a=zg(e.d),o=a.length;return t?(n&&(r=n-o)>0?a=a.charAt(0)+`.`+a.slice(1)+Wg(r):o>1&&(a=a.charAt(0)+`.`+a.slice(1)),a=a+(i<0?`e`:`e+`)+i):i<0?(a=`0.`+Wg(-i-1)+a,n&&(r=n-o)>0&&(a+=Wg(r))):i>=o?(a+=Wg(i+1-o),n&&(r=n-i-1)>0&&(a=a+`.`+Wg(r))):((r=i+1)<o&&(a=a.slice(0,r)+`.`+a.slice(r)),n&&(r=n-o)>0&&(i+1===o&&(a+=`.`),a+=Wg(r))),e.s<0?`-`+a:a}function Yg(e,t){if(e.length>t)return e.length=t,!0}function Xg(e){var t,n,r;function i(e){var t=this;if(!(t instanceof i))return new i(e);if(t.constructor=i,e instanceof i){t.s=e.s,t.e=e.e,t.d=(e=e.d)?e.slice():e;return}if(typeof e==`number`){if(e*0!=0)throw Error(Og+e);if(e>0)t.s=1;else if(e<0)e=-e,t.s=-1;else{t.s=0,t.e=0,t.d=[0];return}if(e===~~e&&e<1e7){t.e=0,t.d=[e];return}return Kg(t,e.toString())}else if(typeof e!=`string`)throw Error(Og+e);if(e.charCodeAt(0)===45?(e=e.slice(1),t.s=-1):t.s=1,Mg.test(e))Kg(t,e);else throw Error(Og+e)}if(i.prototype=K,i.ROUND_UP=0,i.ROUND_DOWN=1,i.ROUND_CEIL=2,i.ROUND_FLOOR=3,i.ROUND_HALF_UP=4,i.ROUND_HALF_DOWN=5,i.ROUND_HALF_EVEN=6,i.ROUND_HALF_CEIL=7,i.ROUND_HALF_FLOOR=8,i.clone=Xg,i.config=i.set=Zg,e===void 0&&(e={}),e)for(r=[`precision`,`rounding`,`toExpNeg`,`toExpPos`,`LN10`],t=0;t<r.length;)e.hasOwnProperty(n=r[t++])||(e[n]=this[n]);return i.config(e),i}function Zg(e){if(!e||typeof e!=`object`)throw Error(Dg+`Object expected`);var t,n,r,i=[`precision`,1,wg,`rounding`,0,8,`toExpNeg`,-1/0,0,`toExpPos`,0,1/0];for(t=0;t<i.length;t+=3)if((r=e[n=i[t]])!==void 0)if(Ag(r)===r&&r>=i[t+1]&&r<=i[t+2])this[n]=r;else throw Error(Og+n+`: `+r);if((r=e[n=`LN10`])!==void 0)if(r==Math.LN10)this[n]=new this(r);else throw Error(Og+n+`: `+r);return this}var Eg=Xg(Tg);Ng=new Eg(1);var J=Eg,Qg=e=>e,$g={"@@functional/placeholder":!0},e_=e=>e===$g,t_=e=>function t(){return arguments.length===0||arguments.length===1&&e_(arguments.length<=0?void 0:arguments[0])?t:e(...arguments)},n_=(e,t)=>e===1?t:t_(function(){var n=[...arguments],r=n.filter(e=>e!==$g).length;return r>=e?t(...n):n_(e-r,t_(function(){var e=[...arguments],r=n.map(t=>e_(t)?e.shift():t);return t(...r,...e)}))}),r_=e=>n_(e.length,e),i_=(e,t)=>{for(var n=[],r=e;r<t;++r)n[r-e]=r;return n},a_=r_((e,t)=>Array.isArray(t)?t.map(e):Object.keys(t).map(e=>t[e]).map(e)),o_=function(){var e=[...arguments];if(!e.length)return Qg;var t=e.reverse(),n=t[0],r=t.slice(1);return function(){return r.reduce((e,t)=>t(e),n(...arguments))}},s_=e=>Array.isArray(e)?e.reverse():e.split(``).reverse().join(``),c_=e=>{var t=null,n=null;return function(){var r=[...arguments];return t&&r.every((e,n)=>e===t?.[n])?n:(t=r,n=e(...r),n)}};function l_(e){return e===0?1:Math.floor(new J(e).abs().log(10).toNumber())+1}function u_(e,t,n){for(var r=new J(e),i=0,a=[];r.lt(t)&&i<1e5;)a.push(r.toNumber()),r=r.add(n),i++;return a}r_((e,t,n)=>{var r=+e,i=+t;return r+n*(i-r)}),r_((e,t,n)=>{var r=t-+e;return r||=1/0,(n-e)/r}),r_((e,t,n)=>{var r=t-+e;return r||=1/0,Math.max(0,Math.min(1,(n-e)/r))});var d_=e=>{var[t,n]=e,[r,i]=[t,n];return t>n&&([r,i]=[n,t]),[r,i]},f_=(e,t,n)=>{if(e.lte(0))return new J(0);var r=l_(e.toNumber()),i=new J(10).pow(r),a=e.div(i),o=r===1?.1:.05,s=new J(Math.ceil(a.div(o).toNumber())).add(n).mul(o).mul(i);return t?new J(s.toNumber()):new J(Math.ceil(s.toNumber()))},p_=(e,t,n)=>{var r=new J(1),i=new J(e);if(!i.isint()&&n){var a=Math.abs(e);a<1?(r=new J(10).pow(l_(e)-1),i=new J(Math.floor(i.div(r).toNumber())).mul(r)):a>1&&(i=new J(Math.floor(e)))}else e===0?i=new J(Math.floor((t-1)/2)):n||(i=new J(Math.floor(e)));var o=Math.floor((t-1)/2);return o_(a_(e=>i.add(new J(e-o).mul(r)).toNumber()),i_)(0,t)},m_=function(e,t,n,r){var i=arguments.length>4&&arguments[4]!==void 0?arguments[4]:0;if(!Number.isFinite((t-e)/(n-1)))return{step:new J(0),tickMin:new J(0),tickMax:new J(0)};var a=f_(new J(t).sub(e).div(n-1),r,i),o;e<=0&&t>=0?o=new J(0):(o=new J(e).add(t).div(2),o=o.sub(new J(o).mod(a)));var s=Math.ceil(o.sub(e).div(a).toNumber()),c=Math.ceil(new J(t).sub(o).div(a).toNumber()),l=s+c+1;return l>n?m_(e,t,n,r,i+1):(l<n&&(c=t>0?c+(n-l):c,s=t>0?s:s+(n-l)),{step:a,tickMin:o.sub(new J(s).mul(a)),tickMax:o.add(new J(c).mul(a))})};function h_(e){var[t,n]=e,r=arguments.length>1&&arguments[1]!==void 0?arguments[1]:6,i=arguments.length>2&&arguments[2]!==void 0?arguments[2]:!0,a=Math.max(r,2),[o,s]=d_([t,n]);if(o===-1/0||s===1/0){var c=s===1/0?[o,...i_(0,r-1).map(()=>1/0)]:[...i_(0,r-1).map(()=>-1/0),s];return t>n?s_(c):c}if(o===s)return p_(o,r,i);var{step:l,tickMin:u,tickMax:d}=m_(o,s,a,i,0),f=u_(u,d.add(new J(.1).mul(l)),l);return t>n?s_(f):f}function g_(e,t){var[n,r]=e,i=arguments.length>2&&arguments[2]!==void 0?arguments[2]:!0,[a,o]=d_([n,r]);if(a===-1/0||o===1/0)return[n,r];if(a===o)return[a];var s=Math.max(t,2),c=f_(new J(o).sub(a).div(s-1),i,0),l=[...u_(new J(a),new J(o),c),o];return i===!1&&(l=l.map(e=>Math.round(e))),n>r?s_(l):l}var __=c_(h_),v_=c_(g_),y_=e=>e.rootProps.maxBarSize,b_=e=>e.rootProps.barGap,x_=e=>e.rootProps.barCategoryGap,S_=e=>e.rootProps.barSize,C_=e=>e.rootProps.stackOffset,w_=e=>e.options.chartName,T_=e=>e.rootProps.syncId,E_=e=>e.rootProps.syncMethod,D_=e=>e.options.eventEmitter,O_={allowDuplicatedCategory:!0,angleAxisId:0,axisLine:!0,cx:0,cy:0,orientation:`outer`,reversed:!1,scale:`auto`,tick:!0,tickLine:!0,tickSize:8,type:`category`},k_={allowDataOverflow:!1,allowDuplicatedCategory:!0,angle:0,axisLine:!0,cx:0,cy:0,orientation:`right`,radiusAxisId:0,scale:`auto`,stroke:`#ccc`,tick:!0,tickCount:5,type:`number`},A_=(e,t)=>{if(!(!e||!t))return e!=null&&e.reversed?[t[1],t[0]]:t},j_={allowDataOverflow:!1,allowDecimals:!1,allowDuplicatedCategory:!1,dataKey:void 0,domain:void 0,id:O_.angleAxisId,includeHidden:!1,name:void 0,reversed:O_.reversed,scale:O_.scale,tick:O_.tick,tickCount:void 0,ticks:void 0,type:O_.type,unit:void 0},M_={allowDataOverflow:k_.allowDataOverflow,allowDecimals:!1,allowDuplicatedCategory:k_.allowDuplicatedCategory,dataKey:void 0,domain:void 0,id:k_.radiusAxisId,includeHidden:!1,name:void 0,reversed:!1,scale:k_.scale,tick:k_.tick,tickCount:k_.tickCount,ticks:void 0,type:k_.type,unit:void 0},N_={allowDataOverflow:!1,allowDecimals:!1,allowDuplicatedCategory:O_.allowDuplicatedCategory,dataKey:void 0,domain:void 0,id:O_.angleAxisId,includeHidden:!1,name:void 0,reversed:!1,scale:O_.scale,tick:O_.tick,tickCount:void 0,ticks:void 0,type:`number`,unit:void 0},P_={allowDataOverflow:k_.allowDataOverflow,allowDecimals:!1,allowDuplicatedCategory:k_.allowDuplicatedCategory,dataKey:void 0,domain:void 0,id:k_.radiusAxisId,includeHidden:!1,name:void 0,reversed:!1,scale:k_.scale,tick:k_.tick,tickCount:k_.tickCount,ticks:void 0,type:`category`,unit:void 0},F_=(e,t)=>e.polarAxis.angleAxis[t]==null?e.layout.layoutType===`radial`?N_:j_:e.polarAxis.angleAxis[t],I_=(e,t)=>e.polarAxis.radiusAxis[t]==null?e.layout.layoutType===`radial`?P_:M_:e.polarAxis.radiusAxis[t],L_=e=>e.polarOptions,R_=L([ws,Ts,Us],Io),z_=L([L_,R_],(e,t)=>{if(e!=null)return w(e.innerRadius,t,0)}),B_=L([L_,R_],(e,t)=>{if(e!=null)return w(e.outerRadius,t,t*.8)}),V_=L([L_],e=>{if(e==null)return[0,0];var{startAngle:t,endAngle:n}=e;return[t,n]}),H_=L([F_,V_],A_),U_=L([R_,z_,B_],(e,t,n)=>{if(!(e==null||t==null||n==null))return[t,n]}),W_=L([I_,U_],A_),G_=L([V,L_,z_,B_,ws,Ts],(e,t,n,r,i,a)=>{if(!(e!==`centric`&&e!==`radial`||t==null||n==null||r==null)){var{cx:o,cy:s,startAngle:c,endAngle:l}=t;return{cx:w(o,i,i/2),cy:w(s,a,a/2),innerRadius:n,outerRadius:r,startAngle:c,endAngle:l,clockWise:!1}}}),Y=(e,t)=>t,K_=(e,t,n)=>n;function q_(e){return e?.id}var J_=e=>{var t=V(e);return t===`horizontal`?`xAxis`:t===`vertical`?`yAxis`:t===`centric`?`angleAxis`:`radiusAxis`},Y_=e=>e.tooltip.settings.axisId,X_=e=>{var t=J_(e),n=Y_(e);return gv(e,t,n)},Z_=L([X_],e=>e?.dataKey);function Q_(e,t,n){var{chartData:r=[]}=t,{allowDuplicatedCategory:i,dataKey:a}=n,o=new Map;return e.forEach(e=>{var t=e.data??r;if(!(t==null||t.length===0)){var n=q_(e);t.forEach((t,r)=>{var s=a==null||i?r:String(z(t,a,null)),c=z(t,e.dataKey,0),l=o.has(s)?o.get(s):{};Object.assign(l,{[n]:c}),o.set(s,l)})}}),Array.from(o.values())}function $_(e){return e.stackId!=null&&e.dataKey!=null}var ev=e(Pu());function tv(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function nv(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?tv(Object(n),!0).forEach(function(t){rv(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):tv(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function rv(e,t,n){return(t=iv(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function iv(e){var t=av(e,`string`);return typeof t==`symbol`?t:t+``}function av(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}var ov=[0,`auto`],sv={allowDataOverflow:!1,allowDecimals:!0,allowDuplicatedCategory:!0,angle:0,dataKey:void 0,domain:void 0,height:30,hide:!0,id:0,includeHidden:!1,interval:`preserveEnd`,minTickGap:5,mirror:!1,name:void 0,orientation:`bottom`,padding:{left:0,right:0},reversed:!1,scale:`auto`,tick:!0,tickCount:5,tickFormatter:void 0,ticks:void 0,type:`category`,unit:void 0},cv=(e,t)=>e.cartesianAxis.xAxis[t],lv=(e,t)=>cv(e,t)??sv,uv={allowDataOverflow:!1,allowDecimals:!0,allowDuplicatedCategory:!0,angle:0,dataKey:void 0,domain:ov,hide:!0,id:0,includeHidden:!1,interval:`preserveEnd`,minTickGap:5,mirror:!1,name:void 0,orientation:`left`,padding:{top:0,bottom:0},reversed:!1,scale:`auto`,tick:!0,tickCount:5,tickFormatter:void 0,ticks:void 0,type:`number`,unit:void 0,width:60},dv=(e,t)=>e.cartesianAxis.yAxis[t],fv=(e,t)=>dv(e,t)??uv,pv={domain:[0,`auto`],includeHidden:!1,reversed:!1,allowDataOverflow:!1,allowDuplicatedCategory:!1,dataKey:void 0,id:0,name:``,range:[64,64],scale:`auto`,type:`number`,unit:``},mv=(e,t)=>e.cartesianAxis.zAxis[t]??pv,X=(e,t,n)=>{switch(t){case`xAxis`:return lv(e,n);case`yAxis`:return fv(e,n);case`zAxis`:return mv(e,n);case`angleAxis`:return F_(e,n);case`radiusAxis`:return I_(e,n);default:throw Error(`Unexpected axis type: ${t}`)}},hv=(e,t,n)=>{switch(t){case`xAxis`:return lv(e,n);case`yAxis`:return fv(e,n);default:throw Error(`Unexpected axis type: ${t}`)}},gv=(e,t,n)=>{switch(t){case`xAxis`:return lv(e,n);case`yAxis`:return fv(e,n);case`angleAxis`:return F_(e,n);case`radiusAxis`:return I_(e,n);default:throw Error(`Unexpected axis type: ${t}`)}},_v=e=>e.graphicalItems.cartesianItems.some(e=>e.type===`bar`)||e.graphicalItems.polarItems.some(e=>e.type===`radialBar`);function vv(e,t){return n=>{switch(e){case`xAxis`:return`xAxisId`in n&&n.xAxisId===t;case`yAxis`:return`yAxisId`in n&&n.yAxisId===t;case`zAxis`:return`zAxisId`in n&&n.zAxisId===t;case`angleAxis`:return`angleAxisId`in n&&n.angleAxisId===t;case`radiusAxis`:return`radiusAxisId`in n&&n.radiusAxisId===t;default:return!1}}}var yv=e=>e.graphicalItems.cartesianItems,bv=L([Y,K_],vv),xv=(e,t,n)=>e.filter(n).filter(e=>t?.includeHidden===!0?!0:!e.hide),Sv=L([yv,X,bv],xv),Cv=L([Sv],e=>e.filter(e=>e.type===`area`||e.type===`bar`).filter($_)),wv=e=>e.filter(e=>!(`stackId`in e)||e.stackId===void 0),Tv=L([Sv],wv),Ev=e=>e.map(e=>e.data).filter(Boolean).flat(1),Dv=L([Sv],Ev),Ov=(e,t)=>{var{chartData:n=[],dataStartIndex:r,dataEndIndex:i}=t;return e.length>0?e:n.slice(r,i+1)},kv=L([Dv,yg],Ov),Av=(e,t,n)=>t?.dataKey==null?n.length>0?n.map(e=>e.dataKey).flatMap(t=>e.map(e=>({value:z(e,t)}))):e.map(e=>({value:e})):e.map(e=>({value:z(e,t.dataKey)})),jv=L([kv,X,Sv],Av);function Mv(e,t){switch(e){case`xAxis`:return t.direction===`x`;case`yAxis`:return t.direction===`y`;default:return!1}}function Nv(e){return e.filter(e=>x(e)||e instanceof Date).map(Number).filter(e=>v(e)===!1)}function Pv(e,t,n){return!n||typeof t!=`number`||v(t)||!n.length?[]:Nv(n.flatMap(n=>{var r=z(e,n.dataKey),i,a;if(Array.isArray(r)?[i,a]=r:i=a=r,!(!Zc(i)||!Zc(a)))return[t-i,t+a]}))}var Fv=L([Cv,yg,X_],Q_),Iv=(e,t,n)=>{var r=t.reduce((e,t)=>t.stackId==null?e:(e[t.stackId]??(e[t.stackId]=[]),e[t.stackId].push(t),e),{});return Object.fromEntries(Object.entries(r).map(t=>{var[r,i]=t,a=i.map(q_);return[r,{stackedData:cs(e,a,n),graphicalItems:i}]}))},Lv=L([Fv,Cv,C_],Iv),Rv=(e,t,n)=>{var{dataStartIndex:r,dataEndIndex:i}=t;if(n!==`zAxis`){var a=hs(e,r,i);if(!(a!=null&&a[0]===0&&a[1]===0))return a}},zv=L([Lv,_g,Y],Rv),Bv=(e,t,n,r,i)=>n.length>0?e.flatMap(e=>n.flatMap(n=>{var a=r[n.id]?.filter(e=>Mv(i,e)),o=z(e,t.dataKey??n.dataKey);return{value:o,errorDomain:Pv(e,o,a)}})).filter(Boolean):t?.dataKey==null?e.map(e=>({value:e,errorDomain:[]})):e.map(e=>({value:z(e,t.dataKey),errorDomain:[]})),Vv=e=>e.errorBars,Hv=(e,t,n)=>e.flatMap(e=>t[e.id]).filter(Boolean).filter(e=>Mv(n,e));L([Tv,Vv,Y],Hv);var Uv=L([kv,X,Tv,Vv,Y],Bv);function Wv(e){var{value:t}=e;if(x(t)||t instanceof Date)return t}var Gv=e=>{var t=e.flatMap(e=>[e.value,e.errorDomain]).flat(1),n=Nv(t);if(n.length!==0)return[Math.min(...n),Math.max(...n)]},Kv=(e,t,n)=>{var r=e.map(Wv).filter(e=>e!=null);return n&&(t.dataKey==null||t.allowDuplicatedCategory&&T(r))?(0,ev.default)(0,e.length):t.allowDuplicatedCategory?r:Array.from(new Set(r))},qv=e=>{if(e==null||!(`domain`in e))return ov;if(e.domain!=null)return e.domain;if(e.ticks!=null){if(e.type===`number`){var t=Nv(e.ticks);return[Math.min(...t),Math.max(...t)]}if(e.type===`category`)return e.ticks.map(String)}return e?.domain??ov},Jv=function(){var e=[...arguments],t=e.filter(Boolean);if(t.length!==0){var n=t.flat(),r=Math.min(...n),i=Math.max(...n);return[r,i]}},Yv=e=>e.referenceElements.dots,Xv=(e,t,n)=>e.filter(e=>e.ifOverflow===`extendDomain`).filter(e=>t===`xAxis`?e.xAxisId===n:e.yAxisId===n),Zv=L([Yv,Y,K_],Xv),Qv=e=>e.referenceElements.areas,$v=L([Qv,Y,K_],Xv),ey=e=>e.referenceElements.lines,ty=L([ey,Y,K_],Xv),ny=(e,t)=>{var n=Nv(e.map(e=>t===`xAxis`?e.x:e.y));if(n.length!==0)return[Math.min(...n),Math.max(...n)]},ry=L(Zv,Y,ny),iy=(e,t)=>{var n=Nv(e.flatMap(e=>[t===`xAxis`?e.x1:e.y1,t===`xAxis`?e.x2:e.y2]));if(n.length!==0)return[Math.min(...n),Math.max(...n)]},ay=L([$v,Y],iy),oy=(e,t)=>{var n=Nv(e.map(e=>t===`xAxis`?e.x:e.y));if(n.length!==0)return[Math.min(...n),Math.max(...n)]},sy=L(ty,Y,oy),cy=L(ry,sy,ay,(e,t,n)=>Jv(e,n,t)),ly=L([X],qv),uy=(e,t,n,r,i,a,o)=>{var s=Sg(t,e.allowDataOverflow);if(s!=null)return s;var c=a===`vertical`&&o===`xAxis`||a===`horizontal`&&o===`yAxis`?Jv(n,i,Gv(r)):Jv(i,Gv(r));return Cg(t,c,e.allowDataOverflow)},dy=L([X,ly,zv,Uv,cy,V,Y],uy),fy=[0,1],py=(e,t,n,r,i,a,o)=>{if(!((e==null||n==null||n.length===0)&&o===void 0)){var{dataKey:s,type:c}=e,l=$o(t,a);return l&&s==null?(0,ev.default)(0,n.length):c===`category`?Kv(r,e,l):i===`expand`?fy:o}},my=L([X,V,kv,jv,C_,Y,dy],py),hy=(e,t,n,r,i)=>{if(e!=null){var{scale:a,type:o}=e;if(a===`auto`)return t===`radial`&&i===`radiusAxis`?`band`:t===`radial`&&i===`angleAxis`?`linear`:o===`category`&&r&&(r.indexOf(`LineChart`)>=0||r.indexOf(`AreaChart`)>=0||r.indexOf(`ComposedChart`)>=0&&!n)?`point`:o===`category`?`band`:`linear`;if(typeof a==`string`){var s=`scale${te(a)}`;return s in gg?s:`point`}}},gy=L([X,V,_v,w_,Y],hy);function _y(e){if(e!=null){if(e in gg)return gg[e]();var t=`scale${te(e)}`;if(t in gg)return gg[t]()}}function vy(e,t,n,r){if(!(n==null||r==null)){if(typeof e.scale==`function`)return e.scale.copy().domain(n).range(r);var i=_y(t);if(i!=null){var a=i.domain(n).range(r);return rs(a),a}}}var yy=(e,t,n)=>{var r=qv(t);if(!(n!==`auto`&&n!==`linear`)){if(t!=null&&t.tickCount&&Array.isArray(r)&&(r[0]===`auto`||r[1]===`auto`)&&bg(e))return __(e,t.tickCount,t.allowDecimals);if(t!=null&&t.tickCount&&t.type===`number`&&bg(e))return v_(e,t.tickCount,t.allowDecimals)}},by=L([my,gv,gy],yy),xy=(e,t,n,r)=>{if(r!==`angleAxis`&&e?.type===`number`&&bg(t)&&Array.isArray(n)&&n.length>0){var i=t[0],a=n[0],o=t[1],s=n[n.length-1];return[Math.min(i,a),Math.max(o,s)]}return t},Sy=L([X,my,by,Y],xy),Cy=L(jv,X,(e,t)=>{if(!(!t||t.type!==`number`)){var n=1/0,r=Array.from(Nv(e.map(e=>e.value))).sort((e,t)=>e-t);if(r.length<2)return 1/0;var i=r[r.length-1]-r[0];if(i===0)return 1/0;for(var a=0;a<r.length-1;a++){var o=r[a+1]-r[a];n=Math.min(n,o)}return n/i}}),wy=L(Cy,V,x_,Us,(e,t,n,r)=>r,(e,t,n,r,i)=>{if(!Zc(e))return 0;var a=t===`vertical`?r.height:r.width;if(i===`gap`)return e*a/2;if(i===`no-gap`){var o=w(n,e*a),s=e*a/2;return s-o-(s-o)/a*o}return 0}),Ty=(e,t)=>{var n=lv(e,t);return n==null||typeof n.padding!=`string`?0:wy(e,`xAxis`,t,n.padding)},Ey=(e,t)=>{var n=fv(e,t);return n==null||typeof n.padding!=`string`?0:wy(e,`yAxis`,t,n.padding)},Dy=L(lv,Ty,(e,t)=>{if(e==null)return{left:0,right:0};var{padding:n}=e;return typeof n==`string`?{left:t,right:t}:{left:(n.left??0)+t,right:(n.right??0)+t}}),Oy=L(fv,Ey,(e,t)=>{if(e==null)return{top:0,bottom:0};var{padding:n}=e;return typeof n==`string`?{top:t,bottom:t}:{top:(n.top??0)+t,bottom:(n.bottom??0)+t}}),ky=L([Us,Dy,Ys,Js,(e,t,n)=>n],(e,t,n,r,i)=>{var{padding:a}=r;return i?[a.left,n.width-a.right]:[e.left+t.left,e.left+e.width-t.right]}),Ay=L([Us,V,Oy,Ys,Js,(e,t,n)=>n],(e,t,n,r,i,a)=>{var{padding:o}=i;return a?[r.height-o.bottom,o.top]:t===`horizontal`?[e.top+e.height-n.bottom,e.top+n.top]:[e.top+n.top,e.top+e.height-n.bottom]}),jy=(e,t,n,r)=>{switch(t){case`xAxis`:return ky(e,n,r);case`yAxis`:return Ay(e,n,r);case`zAxis`:return mv(e,n)?.range;case`angleAxis`:return V_(e);case`radiusAxis`:return U_(e,n);default:return}},My=L([X,jy],A_),Ny=L([X,gy,Sy,My],vy);L([Sv,Vv,Y],Hv);function Py(e,t){return e.id<t.id?-1:e.id>t.id?1:0}var Fy=(e,t)=>t,Iy=(e,t,n)=>n,Ly=L(Os,Fy,Iy,(e,t,n)=>e.filter(e=>e.orientation===t).filter(e=>e.mirror===n).sort(Py)),Ry=L(ks,Fy,Iy,(e,t,n)=>e.filter(e=>e.orientation===t).filter(e=>e.mirror===n).sort(Py)),zy=(e,t)=>({width:e.width,height:t.height}),By=(e,t)=>({width:typeof t.width==`number`?t.width:60,height:e.height}),Vy=L(Us,lv,zy),Hy=(e,t,n)=>{switch(t){case`top`:return e.top;case`bottom`:return n-e.bottom;default:return 0}},Uy=(e,t,n)=>{switch(t){case`left`:return e.left;case`right`:return n-e.right;default:return 0}},Wy=L(Ts,Us,Ly,Fy,Iy,(e,t,n,r,i)=>{var a={},o;return n.forEach(n=>{var s=zy(t,n);o??=Hy(t,r,e);var c=r===`top`&&!i||r===`bottom`&&i;a[n.id]=o-Number(c)*s.height,o+=(c?-1:1)*s.height}),a}),Gy=L(ws,Us,Ry,Fy,Iy,(e,t,n,r,i)=>{var a={},o;return n.forEach(n=>{var s=By(t,n);o??=Uy(t,r,e);var c=r===`left`&&!i||r===`right`&&i;a[n.id]=o-Number(c)*s.width,o+=(c?-1:1)*s.width}),a}),Ky=L([Us,lv,(e,t)=>{var n=lv(e,t);if(n!=null)return Wy(e,n.orientation,n.mirror)},(e,t)=>t],(e,t,n,r)=>{if(t!=null){var i=n?.[r];return i==null?{x:e.left,y:0}:{x:e.left,y:i}}}),qy=L([Us,fv,(e,t)=>{var n=fv(e,t);if(n!=null)return Gy(e,n.orientation,n.mirror)},(e,t)=>t],(e,t,n,r)=>{if(t!=null){var i=n?.[r];return i==null?{x:0,y:e.top}:{x:i,y:e.top}}}),Jy=L(Us,fv,(e,t)=>({width:typeof t.width==`number`?t.width:60,height:e.height})),Yy=(e,t,n)=>{switch(t){case`xAxis`:return Vy(e,n).width;case`yAxis`:return Jy(e,n).height;default:return}},Xy=(e,t,n,r)=>{if(n!=null){var{allowDuplicatedCategory:i,type:a,dataKey:o}=n,s=$o(e,r),c=t.map(e=>e.value);if(o&&s&&a===`category`&&i&&T(c))return c}},Zy=L([V,jv,X,Y],Xy),Qy=(e,t,n,r)=>{if(!(n==null||n.dataKey==null)){var{type:i,scale:a}=n;if($o(e,r)&&(i===`number`||a!==`auto`))return t.map(e=>e.value)}},$y=L([V,jv,gv,Y],Qy),eb=L([V,hv,gy,Ny,Zy,$y,jy,by,Y],(e,t,n,r,i,a,o,s,c)=>{if(t==null)return null;var l=$o(e,c);return{angle:t.angle,interval:t.interval,minTickGap:t.minTickGap,orientation:t.orientation,tick:t.tick,tickCount:t.tickCount,tickFormatter:t.tickFormatter,ticks:t.ticks,type:t.type,unit:t.unit,axisType:c,categoricalDomain:a,duplicateDomain:i,isCategorical:l,niceTicks:s,range:o,realScaleType:n,scale:r}}),tb=(e,t,n,r,i,a,o,s,c)=>{if(!(t==null||r==null)){var l=$o(e,c),{type:u,ticks:d,tickCount:f}=t,p=n===`scaleBand`&&typeof r.bandwidth==`function`?r.bandwidth()/2:2,m=u===`category`&&r.bandwidth?r.bandwidth()/p:0;m=c===`angleAxis`&&a!=null&&a.length>=2?_(a[0]-a[1])*2*m:m;var h=d||i;return h?h.map((e,t)=>{var n=o?o.indexOf(e):e;return{index:t,coordinate:r(n)+m,value:e,offset:m}}).filter(e=>!v(e.coordinate)):l&&s?s.map((e,t)=>({coordinate:r(e)+m,value:e,index:t,offset:m})):r.ticks?r.ticks(f).map(e=>({coordinate:r(e)+m,value:e,offset:m})):r.domain().map((e,t)=>({coordinate:r(e)+m,value:o?o[e]:e,index:t,offset:m}))}},nb=L([V,gv,gy,Ny,by,jy,Zy,$y,Y],tb),rb=(e,t,n,r,i,a,o)=>{if(!(t==null||n==null||r==null||r[0]===r[1])){var s=$o(e,o),{tickCount:c}=t,l=0;return l=o===`angleAxis`&&r?.length>=2?_(r[0]-r[1])*2*l:l,s&&a?a.map((e,t)=>({coordinate:n(e)+l,value:e,index:t,offset:l})):n.ticks?n.ticks(c).map(e=>({coordinate:n(e)+l,value:e,offset:l})):n.domain().map((e,t)=>({coordinate:n(e)+l,value:i?i[e]:e,index:t,offset:l}))}},ib=L([V,gv,Ny,jy,Zy,$y,Y],rb),ab=L(X,Ny,(e,t)=>{if(!(e==null||t==null))return nv(nv({},e),{},{scale:t})}),ob=L([X,gy,my,My],vy),sb=L((e,t,n)=>mv(e,n),ob,(e,t)=>{if(!(e==null||t==null))return nv(nv({},e),{},{scale:t})}),cb=L([V,Os,ks],(e,t,n)=>{switch(e){case`horizontal`:return t.some(e=>e.reversed)?`right-to-left`:`left-to-right`;case`vertical`:return n.some(e=>e.reversed)?`bottom-to-top`:`top-to-bottom`;case`centric`:case`radial`:return`left-to-right`;default:return}}),lb=e=>e.options.defaultTooltipEventType,ub=e=>e.options.validateTooltipEventTypes;function db(e,t,n){if(e==null)return t;var r=e?`axis`:`item`;return n==null?t:n.includes(r)?r:t}function fb(e,t){var n=lb(e),r=ub(e);return db(t,n,r)}function pb(e){return I(t=>fb(t,e))}var mb=(e,t)=>{var n,r=Number(t);if(!(v(r)||t==null))return r>=0?e==null||(n=e[r])==null?void 0:n.value:void 0},hb=e=>e.tooltip.settings,gb={active:!1,index:null,dataKey:void 0,coordinate:void 0},_b=Ma({name:`tooltip`,initialState:{itemInteraction:{click:gb,hover:gb},axisInteraction:{click:gb,hover:gb},keyboardInteraction:gb,syncInteraction:{active:!1,index:null,dataKey:void 0,label:void 0,coordinate:void 0},tooltipItemPayloads:[],settings:{shared:void 0,trigger:`hover`,axisId:0,active:!1,defaultIndex:void 0}},reducers:{addTooltipEntrySettings(e,t){e.tooltipItemPayloads.push(sa(t.payload))},removeTooltipEntrySettings(e,t){var n=ra(e).tooltipItemPayloads.indexOf(sa(t.payload));n>-1&&e.tooltipItemPayloads.splice(n,1)},setTooltipSettingsState(e,t){e.settings=t.payload},setActiveMouseOverItemIndex(e,t){e.syncInteraction.active=!1,e.keyboardInteraction.active=!1,e.itemInteraction.hover.active=!0,e.itemInteraction.hover.index=t.payload.activeIndex,e.itemInteraction.hover.dataKey=t.payload.activeDataKey,e.itemInteraction.hover.coordinate=t.payload.activeCoordinate},mouseLeaveChart(e){e.itemInteraction.hover.active=!1,e.axisInteraction.hover.active=!1},mouseLeaveItem(e){e.itemInteraction.hover.active=!1},setActiveClickItemIndex(e,t){e.syncInteraction.active=!1,e.itemInteraction.click.active=!0,e.keyboardInteraction.active=!1,e.itemInteraction.click.index=t.payload.activeIndex,e.itemInteraction.click.dataKey=t.payload.activeDataKey,e.itemInteraction.click.coordinate=t.payload.activeCoordinate},setMouseOverAxisIndex(e,t){e.syncInteraction.active=!1,e.axisInteraction.hover.active=!0,e.keyboardInteraction.active=!1,e.axisInteraction.hover.index=t.payload.activeIndex,e.axisInteraction.hover.dataKey=t.payload.activeDataKey,e.axisInteraction.hover.coordinate=t.payload.activeCoordinate},setMouseClickAxisIndex(e,t){e.syncInteraction.active=!1,e.keyboardInteraction.active=!1,e.axisInteraction.click.active=!0,e.axisInteraction.click.index=t.payload.activeIndex,e.axisInteraction.click.dataKey=t.payload.activeDataKey,e.axisInteraction.click.coordinate=t.payload.activeCoordinate},setSyncInteraction(e,t){e.syncInteraction=t.payload},setKeyboardInteraction(e,t){e.keyboardInteraction.active=t.payload.active,e.keyboardInteraction.index=t.payload.activeIndex,e.keyboardInteraction.coordinate=t.payload.activeCoordinate,e.keyboardInteraction.dataKey=t.payload.activeDataKey}}}),{addTooltipEntrySettings:vb,removeTooltipEntrySettings:yb,setTooltipSettingsState:bb,setActiveMouseOverItemIndex:xb,mouseLeaveItem:Sb,mouseLeaveChart:Cb,setActiveClickItemIndex:wb,setMouseOverAxisIndex:Tb,setMouseClickAxisIndex:Eb,setSyncInteraction:Db,setKeyboardInteraction:Ob}=_b.actions,kb=_b.reducer;function Ab(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function jb(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?Ab(Object(n),!0).forEach(function(t){Mb(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Ab(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function Mb(e,t,n){return(t=Nb(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Nb(e){var t=Pb(e,`string`);return typeof t==`symbol`?t:t+``}function Pb(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function Fb(e,t,n){return t===`axis`?n===`click`?e.axisInteraction.click:e.axisInteraction.hover:n===`click`?e.itemInteraction.click:e.itemInteraction.hover}function Ib(e){return e.index!=null}var Lb=(e,t,n,r)=>{if(t==null)return gb;var i=Fb(e,t,n);if(i==null)return gb;if(i.active)return i;if(e.keyboardInteraction.active)return e.keyboardInteraction;if(e.syncInteraction.active&&e.syncInteraction.index!=null)return e.syncInteraction;var a=e.settings.active===!0;if(Ib(i)){if(a)return jb(jb({},i),{},{active:!0})}else if(r!=null)return{active:!0,coordinate:void 0,dataKey:void 0,index:r};return jb(jb({},gb),{},{coordinate:i.coordinate})},Rb=(e,t)=>{var n=e?.index;if(n==null)return null;var r=Number(n);if(!Zc(r))return n;var i=0,a=1/0;return t.length>0&&(a=t.length-1),String(Math.max(i,Math.min(r,a)))},zb=(e,t,n,r,i,a,o,s)=>{if(!(a==null||s==null)){var c=o[0],l=c==null?void 0:s(c.positions,a);if(l!=null)return l;var u=i?.[Number(a)];if(u)switch(n){case`horizontal`:return{x:u.coordinate,y:(r.top+t)/2};default:return{x:(r.left+e)/2,y:u.coordinate}}}},Bb=(e,t,n,r)=>{if(t===`axis`)return e.tooltipItemPayloads;if(e.tooltipItemPayloads.length===0)return[];var i=n===`hover`?e.itemInteraction.hover.dataKey:e.itemInteraction.click.dataKey;return i==null&&r!=null?[e.tooltipItemPayloads[0]]:e.tooltipItemPayloads.filter(e=>e.settings?.dataKey===i)},Vb=e=>e.options.tooltipPayloadSearcher,Hb=e=>e.tooltip;function Ub(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function Wb(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?Ub(Object(n),!0).forEach(function(t){Gb(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Ub(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function Gb(e,t,n){return(t=Kb(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Kb(e){var t=qb(e,`string`);return typeof t==`symbol`?t:t+``}function qb(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function Jb(e,t){return e??t}var Yb=(e,t,n,r,i,a,o)=>{if(!(t==null||a==null)){var{chartData:s,computedData:c,dataStartIndex:l,dataEndIndex:u}=n;return e.reduce((e,n)=>{var{dataDefinedOnItem:d,settings:f}=n,p=Jb(d,s),m=Array.isArray(p)?Uo(p,l,u):p,h=f?.dataKey??r,g=f?.nameKey,_=r&&Array.isArray(m)&&!Array.isArray(m[0])&&o===`axis`?O(m,r,i):a(m,t,c,g);return Array.isArray(_)?_.forEach(t=>{var n=Wb(Wb({},f),{},{name:t.name,unit:t.unit,color:void 0,fill:void 0});e.push(ys({tooltipEntrySettings:n,dataKey:t.dataKey,payload:t.payload,value:z(t.payload,t.dataKey),name:t.name}))}):e.push(ys({tooltipEntrySettings:f,dataKey:h,payload:_,value:z(_,h),name:z(_,g)??f?.name})),e},[])}},Xb=L([X_,V,_v,w_,J_],hy),Zb=L([e=>e.graphicalItems.cartesianItems,e=>e.graphicalItems.polarItems],(e,t)=>[...e,...t]),Qb=L([J_,Y_],vv),$b=L([Zb,X_,Qb],xv),ex=L([$b],e=>e.filter($_)),tx=L([$b],Ev),nx=L([tx,_g],Ov),rx=L([ex,_g,X_],Q_),ix=L([nx,X_,$b],Av),ax=L([X_],qv),ox=L([$b],e=>e.filter($_)),sx=L([rx,ox,C_],Iv),cx=L([sx,_g,J_],Rv),lx=L([$b],wv),ux=L([nx,X_,lx,Vv,J_],Bv),dx=L([Yv,J_,Y_],Xv),fx=L([dx,J_],ny),px=L([Qv,J_,Y_],Xv),mx=L([px,J_],iy),hx=L([ey,J_,Y_],Xv),gx=L([hx,J_],oy),_x=L([fx,gx,mx],Jv),vx=L([X_,ax,cx,ux,_x,V,J_],uy),yx=L([X_,V,nx,ix,C_,J_,vx],py),bx=L([yx,X_,Xb],yy),xx=L([X_,yx,bx,J_],xy),Sx=e=>{var t=J_(e),n=Y_(e);return jy(e,t,n,!1)},Cx=L([X_,Sx],A_),wx=L([X_,Xb,xx,Cx],vy),Tx=L([V,ix,X_,J_],Xy),Ex=L([V,ix,X_,J_],Qy),Dx=L([V,X_,Xb,wx,Sx,Tx,Ex,J_],(e,t,n,r,i,a,o,s)=>{if(t){var{type:c}=t,l=$o(e,s);if(r){var u=n===`scaleBand`&&r.bandwidth?r.bandwidth()/2:2,d=c===`category`&&r.bandwidth?r.bandwidth()/u:0;return d=s===`angleAxis`&&i!=null&&i?.length>=2?_(i[0]-i[1])*2*d:d,l&&o?o.map((e,t)=>({coordinate:r(e)+d,value:e,index:t,offset:d})):r.domain().map((e,t)=>({coordinate:r(e)+d,value:a?a[e]:e,index:t,offset:d}))}}}),Ox=L([lb,ub,hb],(e,t,n)=>db(n.shared,e,t)),kx=e=>e.tooltip.settings.trigger,Ax=e=>e.tooltip.settings.defaultIndex,jx=L([Hb,Ox,kx,Ax],Lb),Mx=L([jx,nx],Rb),Nx=L([Dx,Mx],mb),Px=L([jx],e=>{if(e)return e.dataKey}),Fx=L([Hb,Ox,kx,Ax],Bb),Ix=L([ws,Ts,V,Us,Dx,Ax,Fx,Vb],zb),Lx=L([jx,Ix],(e,t)=>e!=null&&e.coordinate?e.coordinate:t),Rx=L([jx],e=>e.active),zx=L([Fx,Mx,_g,Z_,Nx,Vb,Ox],Yb),Bx=L([zx],e=>{if(e!=null){var t=e.map(e=>e.payload).filter(e=>e!=null);return Array.from(new Set(t))}});function Vx(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function Hx(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?Vx(Object(n),!0).forEach(function(t){Ux(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Vx(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function Ux(e,t,n){return(t=Wx(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Wx(e){var t=Gx(e,`string`);return typeof t==`symbol`?t:t+``}function Gx(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}var Kx=()=>I(X_),qx=()=>{var e=Kx(),t=I(Dx),n=I(wx);return vs(Hx(Hx({},e),{},{scale:n}),t)},Jx=e(Gr()),Yx=()=>I(w_),Xx=(e,t)=>t,Zx=(e,t,n)=>n,Qx=(e,t,n,r)=>r,$x=L(Dx,e=>(0,Jx.default)(e,e=>e.coordinate)),eS=L([Hb,Xx,Zx,Qx],Lb),tS=L([eS,nx],Rb),nS=(e,t,n)=>{if(t!=null){var r=Hb(e);return t===`axis`?n===`hover`?r.axisInteraction.hover.dataKey:r.axisInteraction.click.dataKey:n===`hover`?r.itemInteraction.hover.dataKey:r.itemInteraction.click.dataKey}},rS=L([Hb,Xx,Zx,Qx],Bb),iS=L([ws,Ts,V,Us,Dx,Qx,rS,Vb],zb),aS=L([eS,iS],(e,t)=>e.coordinate??t),oS=L(Dx,tS,mb),sS=L([rS,tS,_g,Z_,oS,Vb,Xx],Yb),cS=L([eS],e=>({isActive:e.active,activeIndex:e.index})),lS=(e,t,n,r,i,a,o,s)=>{if(!(!e||!t||!r||!i||!a)){var c=xs(e.chartX,e.chartY,t,n,s);if(c){var l=Cs(c,t),u=Zo(l,o,a,r,i),d=Ss(t,a,u,c);return{activeIndex:String(u),activeCoordinate:d}}}};function uS(){return uS=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},uS.apply(null,arguments)}function dS(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function fS(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?dS(Object(n),!0).forEach(function(t){pS(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):dS(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function pS(e,t,n){return(t=mS(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function mS(e){var t=hS(e,`string`);return typeof t==`symbol`?t:t+``}function hS(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function gS(e){var{coordinate:t,payload:n,index:r,offset:i,tooltipAxisBandSize:a,layout:o,cursor:s,tooltipEventType:l,chartName:u}=e,d=t,f=n,p=r;if(!s||!d||u!==`ScatterChart`&&l!==`axis`)return null;var m,h;if(u===`ScatterChart`)m=d,h=Sl;else if(u===`BarChart`)m=Cl(o,d,i,a),h=xu;else if(o===`radial`){var{cx:g,cy:_,radius:v,startAngle:y,endAngle:b}=Su(d);m={cx:g,cy:_,startAngle:y,endAngle:b,innerRadius:v,outerRadius:v},h=ku}else m={points:Au(o,d,i)},h=dl;var x=typeof s==`object`&&`className`in s?s.className:void 0,S=fS(fS(fS(fS({stroke:`#ccc`,pointerEvents:`none`},i),m),M(s,!1)),{},{payload:f,payloadIndex:p,className:c(`recharts-tooltip-cursor`,x)});return(0,A.isValidElement)(s)?(0,A.cloneElement)(s,S):(0,A.createElement)(h,S)}function _S(e){var t=qx(),n=Qs(),r=nc(),i=Yx();return A.createElement(gS,uS({},e,{coordinate:e.coordinate,index:e.index,payload:e.payload,offset:n,layout:r,tooltipAxisBandSize:t,chartName:i}))}var vS=(0,A.createContext)(null),yS=()=>(0,A.useContext)(vS),bS=e(n(((exports,t)=>{var n=Object.prototype.hasOwnProperty,r=`~`;function i(){}Object.create&&(i.prototype=Object.create(null),new i().__proto__||(r=!1));function a(e,t,n){this.fn=e,this.context=t,this.once=n||!1}function o(e,t,n,i,o){if(typeof n!=`function`)throw TypeError(`The listener must be a function`);var s=new a(n,i||e,o),c=r?r+t:t;return e._events[c]?e._events[c].fn?e._events[c]=[e._events[c],s]:e._events[c].push(s):(e._events[c]=s,e._eventsCount++),e}function s(e,t){--e._eventsCount===0?e._events=new i:delete e._events[t]}function c(){this._events=new i,this._eventsCount=0}c.prototype.eventNames=function(){var e=[],t,i;if(this._eventsCount===0)return e;for(i in t=this._events)n.call(t,i)&&e.push(r?i.slice(1):i);return Object.getOwnPropertySymbols?e.concat(Object.getOwnPropertySymbols(t)):e},c.prototype.listeners=function(e){var t=r?r+e:e,n=this._events[t];if(!n)return[];if(n.fn)return[n.fn];for(var i=0,a=n.length,o=Array(a);i<a;i++)o[i]=n[i].fn;return o},c.prototype.listenerCount=function(e){var t=r?r+e:e,n=this._events[t];return n?n.fn?1:n.length:0},c.prototype.emit=function(e,t,n,i,a,o){var s=r?r+e:e;if(!this._events[s])return!1;var c=this._events[s],l=arguments.length,u,d;if(c.fn){switch(c.once&&this.removeListener(e,c.fn,void 0,!0),l){case 1:return c.fn.call(c.context),!0;case 2:return c.fn.call(c.context,t),!0;case 3:return c.fn.call(c.context,t,n),!0;case 4:return c.fn.call(c.context,t,n,i),!0;case 5:return c.fn.call(c.context,t,n,i,a),!0;case 6:return c.fn.call(c.context,t,n,i,a,o),!0}for(d=1,u=Array(l-1);d<l;d++)u[d-1]=arguments[d];c.fn.apply(c.context,u)}else{var f=c.length,p;for(d=0;d<f;d++)switch(c[d].once&&this.removeListener(e,c[d].fn,void 0,!0),l){case 1:c[d].fn.call(c[d].context);break;case 2:c[d].fn.call(c[d].context,t);break;case 3:c[d].fn.call(c[d].context,t,n);break;case 4:c[d].fn.call(c[d].context,t,n,i);break;default:if(!u)for(p=1,u=Array(l-1);p<l;p++)u[p-1]=arguments[p];c[d].fn.apply(c[d].context,u)}}return!0},c.prototype.on=function(e,t,n){return o(this,e,t,n,!1)},c.prototype.once=function(e,t,n){return o(this,e,t,n,!0)},c.prototype.removeListener=function(e,t,n,i){var a=r?r+e:e;if(!this._events[a])return this;if(!t)return s(this,a),this;var o=this._events[a];if(o.fn)o.fn===t&&(!i||o.once)&&(!n||o.context===n)&&s(this,a);else{for(var c=0,l=[],u=o.length;c<u;c++)(o[c].fn!==t||i&&!o[c].once||n&&o[c].context!==n)&&l.push(o[c]);l.length?this._events[a]=l.length===1?l[0]:l:s(this,a)}return this},c.prototype.removeAllListeners=function(e){var t;return e?(t=r?r+e:e,this._events[t]&&s(this,t)):(this._events=new i,this._eventsCount=0),this},c.prototype.off=c.prototype.removeListener,c.prototype.addListener=c.prototype.on,c.prefixed=r,c.EventEmitter=c,t!==void 0&&(t.exports=c)}))(),1).default,xS=new bS,SS=`recharts.syncEvent.tooltip`,CS=`recharts.syncEvent.brush`;function wS(e,t){if(t){var n=Number.parseInt(t,10);if(!v(n))return e?.[n]}}var TS=Ma({name:`options`,initialState:{chartName:``,tooltipPayloadSearcher:void 0,eventEmitter:void 0,defaultTooltipEventType:`axis`},reducers:{createEventEmitter:e=>{e.eventEmitter??=Symbol(`rechartsEventEmitter`)}}}),ES=TS.reducer,{createEventEmitter:DS}=TS.actions;function OS(e){return e.tooltip.syncInteraction}var kS=Ma({name:`chartData`,initialState:{chartData:void 0,computedData:void 0,dataStartIndex:0,dataEndIndex:0},reducers:{setChartData(e,t){if(e.chartData=t.payload,t.payload==null){e.dataStartIndex=0,e.dataEndIndex=0;return}t.payload.length>0&&e.dataEndIndex!==t.payload.length-1&&(e.dataEndIndex=t.payload.length-1)},setComputedData(e,t){e.computedData=t.payload},setDataStartEndIndexes(e,t){var{startIndex:n,endIndex:r}=t.payload;n!=null&&(e.dataStartIndex=n),r!=null&&(e.dataEndIndex=r)}}}),{setChartData:AS,setDataStartEndIndexes:jS,setComputedData:MS}=kS.actions,NS=kS.reducer,PS=[`x`,`y`];function FS(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function IS(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?FS(Object(n),!0).forEach(function(t){LS(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):FS(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function LS(e,t,n){return(t=RS(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function RS(e){var t=zS(e,`string`);return typeof t==`symbol`?t:t+``}function zS(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function BS(e,t){if(e==null)return{};var n,r,i=VS(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function VS(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}var HS=()=>{};function US(){var e=I(T_),t=I(D_),n=F(),r=I(E_),i=I(Dx),a=nc(),o=Xs(),s=I(e=>e.rootProps.className);(0,A.useEffect)(()=>{if(e==null)return HS;var s=(s,c,l)=>{if(t!==l&&e===s){if(r===`index`){var u;if(o&&c!=null&&(u=c.payload)!=null&&u.coordinate){var d=c.payload.coordinate,{x:f,y:p}=d,m=BS(d,PS),h=IS(IS(IS({},m),typeof f==`number`&&{x:Math.max(o.x,Math.min(f,o.x+o.width))}),typeof p==`number`&&{y:Math.max(o.y,Math.min(p,o.y+o.height))}),g=IS(IS({},c),{},{payload:IS(IS({},c.payload),{},{coordinate:h})});n(g)}else n(c);return}if(i!=null){var _;if(typeof r==`function`){var v={activeTooltipIndex:c.payload.index==null?void 0:Number(c.payload.index),isTooltipActive:c.payload.active,activeIndex:c.payload.index==null?void 0:Number(c.payload.index),activeLabel:c.payload.label,activeDataKey:c.payload.dataKey,activeCoordinate:c.payload.coordinate},y=r(i,v);_=i[y]}else r===`value`&&(_=i.find(e=>String(e.value)===c.payload.label));var{coordinate:b}=c.payload;if(_==null||c.payload.active===!1||b==null||o==null){n(Db({active:!1,coordinate:void 0,dataKey:void 0,index:null,label:void 0}));return}var{x,y:S}=b,C=Math.min(x,o.x+o.width),w=Math.min(S,o.y+o.height),T={x:a===`horizontal`?_.coordinate:C,y:a===`horizontal`?w:_.coordinate},E=Db({active:c.payload.active,coordinate:T,dataKey:c.payload.dataKey,index:String(_.index),label:c.payload.label});n(E)}}};return xS.on(SS,s),()=>{xS.off(SS,s)}},[s,n,t,e,r,i,a,o])}function WS(){var e=I(T_),t=I(D_),n=F();(0,A.useEffect)(()=>{if(e==null)return HS;var r=(r,i,a)=>{t!==a&&e===r&&n(jS(i))};return xS.on(CS,r),()=>{xS.off(CS,r)}},[n,t,e])}function GS(){var e=F();(0,A.useEffect)(()=>{e(DS())},[e]),US(),WS()}function KS(e,t,n,r,i,a){var o=I(n=>nS(n,e,t)),s=I(D_),c=I(T_),l=I(E_),u=I(OS),d=u?.active;(0,A.useEffect)(()=>{if(!d&&c!=null&&s!=null){var e=Db({active:a,coordinate:n,dataKey:o,index:i,label:typeof r==`number`?String(r):r});xS.emit(SS,c,e,s)}},[d,n,o,i,r,s,c,l,a])}function qS(){var e=I(T_),t=I(D_),n=I(e=>e.chartData.dataStartIndex),r=I(e=>e.chartData.dataEndIndex);(0,A.useEffect)(()=>{if(!(e==null||n==null||r==null||t==null)){var i={startIndex:n,endIndex:r};xS.emit(CS,e,i,t)}},[r,n,t,e])}var JS=e(i());function YS(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function XS(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?YS(Object(n),!0).forEach(function(t){ZS(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):YS(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function ZS(e,t,n){return(t=QS(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function QS(e){var t=$S(e,`string`);return typeof t==`symbol`?t:t+``}function $S(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function eC(e){return e.dataKey}function tC(e,t){return A.isValidElement(e)?A.cloneElement(e,t):typeof e==`function`?A.createElement(e,t):A.createElement(Ic,t)}var nC=[],rC={allowEscapeViewBox:{x:!1,y:!1},animationDuration:400,animationEasing:`ease`,axisId:0,contentStyle:{},cursor:!0,filterNull:!0,isAnimationActive:!Yc.isSsr,itemSorter:`name`,itemStyle:{},labelStyle:{},offset:10,reverseDirection:{x:!1,y:!1},separator:` : `,trigger:`hover`,useTranslate3d:!1,wrapperStyle:{}};function iC(e){var t=H(e,rC),{active:n,allowEscapeViewBox:r,animationDuration:i,animationEasing:a,content:o,filterNull:s,isAnimationActive:c,offset:l,payloadUniqBy:u,position:d,reverseDirection:f,useTranslate3d:p,wrapperStyle:m,cursor:h,shared:g,trigger:_,defaultIndex:v,portal:y,axisId:b}=t,x=F(),S=typeof v==`number`?String(v):v;(0,A.useEffect)(()=>{x(bb({shared:g,trigger:_,axisId:b,active:n,defaultIndex:S}))},[x,g,_,b,n,S]);var C=Xs(),w=Xc(),T=pb(g),{activeIndex:E,isActive:D}=I(e=>cS(e,T,_,S)),O=I(e=>sS(e,T,_,S)),ee=I(e=>oS(e,T,_,S)),k=I(e=>aS(e,T,_,S)),te=O,ne=yS(),re=n??D,[ie,ae]=Qr([te,re]),oe=T===`axis`?ee:void 0;KS(T,_,k,oe,E,re);var se=y??ne;if(se==null)return null;var ce=te??nC;re||(ce=nC),s&&ce.length&&(ce=$n(te.filter(e=>e.value!=null&&(e.hide!==!0||t.includeHidden)),u,eC));var le=ce.length>0,ue=A.createElement(Jc,{allowEscapeViewBox:r,animationDuration:i,animationEasing:a,isAnimationActive:c,active:re,coordinate:k,hasPayload:le,offset:l,position:d,reverseDirection:f,useTranslate3d:p,viewBox:C,wrapperStyle:m,lastBoundingBox:ie,innerRef:ae,hasPortalFromProps:!!y},tC(o,XS(XS({},t),{},{payload:ce,label:oe,active:re,coordinate:k,accessibilityLayer:w})));return A.createElement(A.Fragment,null,(0,JS.createPortal)(ue,se),re&&A.createElement(_S,{cursor:h,tooltipEventType:T,coordinate:k,payload:te,index:E}))}var aC=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});function t(e,t,{signal:n,edges:r}={}){let i,a=null,o=r!=null&&r.includes(`leading`),s=r==null||r.includes(`trailing`),c=()=>{a!==null&&(e.apply(i,a),i=void 0,a=null)},l=()=>{s&&c(),p()},u=null,d=()=>{u!=null&&clearTimeout(u),u=setTimeout(()=>{u=null,l()},t)},f=()=>{u!==null&&(clearTimeout(u),u=null)},p=()=>{f(),i=void 0,a=null},m=()=>{c()},h=function(...e){if(n?.aborted)return;i=this,a=e;let t=u==null;d(),o&&t&&c()};return h.schedule=d,h.cancel=p,h.flush=m,n?.addEventListener(`abort`,p,{once:!0}),h}exports.debounce=t})),oC=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=aC();function n(e,n=0,r={}){typeof r!=`object`&&(r={});let{leading:i=!1,trailing:a=!0,maxWait:o}=r,s=[,,];i&&(s[0]=`leading`),a&&(s[1]=`trailing`);let c,l=null,u=t.debounce(function(...t){c=e.apply(this,t),l=null},n,{edges:s}),d=function(...t){return o!=null&&(l===null&&(l=Date.now()),Date.now()-l>=o)?(c=e.apply(this,t),l=Date.now(),u.cancel(),u.schedule(),c):(u.apply(this,t),c)};return d.cancel=u.cancel,d.flush=()=>(u.flush(),c),d}exports.debounce=n})),sC=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=oC();function n(e,n=0,r={}){let{leading:i=!0,trailing:a=!0}=r;return t.debounce(e,n,{leading:i,maxWait:n,trailing:a})}exports.throttle=n})),cC=n(((exports,t)=>{t.exports=sC().throttle})),lC=!1,uC=function(e,t){var n=[...arguments].slice(2);if(lC&&typeof console<`u`&&console.warn&&(t===void 0&&console.warn(`LogUtils requires an error message argument`),!e))if(t===void 0)console.warn(`Minified exception occurred; use the non-minified dev environment for the full error message and additional helpful warnings.`);else{var r=0;console.warn(t.replace(/%s/g,()=>n[r++]))}},dC=e(cC());function fC(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function pC(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?fC(Object(n),!0).forEach(function(t){mC(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):fC(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function mC(e,t,n){return(t=hC(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function hC(e){var t=gC(e,`string`);return typeof t==`symbol`?t:t+``}function gC(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}var _C=(0,A.forwardRef)((e,t)=>{var{aspect:n,initialDimension:r={width:-1,height:-1},width:i=`100%`,height:a=`100%`,minWidth:o=0,minHeight:s,maxHeight:l,children:u,debounce:d=0,id:f,className:p,onResize:m,style:h={}}=e,g=(0,A.useRef)(null),_=(0,A.useRef)();_.current=m,(0,A.useImperativeHandle)(t,()=>g.current);var[v,b]=(0,A.useState)({containerWidth:r.width,containerHeight:r.height}),x=(0,A.useCallback)((e,t)=>{b(n=>{var r=Math.round(e),i=Math.round(t);return n.containerWidth===r&&n.containerHeight===i?n:{containerWidth:r,containerHeight:i}})},[]);(0,A.useEffect)(()=>{var e=e=>{var t,{width:n,height:r}=e[0].contentRect;x(n,r),(t=_.current)==null||t.call(_,n,r)};d>0&&(e=(0,dC.default)(e,d,{trailing:!0,leading:!1}));var t=new ResizeObserver(e),{width:n,height:r}=g.current.getBoundingClientRect();return x(n,r),t.observe(g.current),()=>{t.disconnect()}},[x,d]);var S=(0,A.useMemo)(()=>{var{containerWidth:e,containerHeight:t}=v;if(e<0||t<0)return null;uC(y(i)||y(a),`The width(%s) and height(%s) are both fixed numbers,
-       maybe you don't need to use a ResponsiveContainer.`,i,a),uC(!n||n>0,`The aspect(%s) must be greater than zero.`,n);var r=y(i)?e:i,c=y(a)?t:a;return n&&n>0&&(r?c=r/n:c&&(r=c*n),l&&c>l&&(c=l)),uC(r>0||c>0,`The width(%s) and height(%s) of chart should be greater than 0,
-       please check the style of container, or the props width(%s) and height(%s),
-       or add a minWidth(%s) or minHeight(%s) or use aspect(%s) to control the
-       height and width.`,r,c,i,a,o,s,n),A.Children.map(u,e=>(0,A.cloneElement)(e,{width:r,height:c,style:pC({width:r,height:c},e.props.style)}))},[n,u,a,l,s,o,v,i]);return A.createElement(`div`,{id:f?`${f}`:void 0,className:c(`recharts-responsive-container`,p),style:pC(pC({},h),{},{width:i,height:a,minWidth:o,minHeight:s,maxHeight:l}),ref:g},A.createElement(`div`,{style:{width:0,height:0,overflow:`visible`}},S))}),vC=e=>null;vC.displayName=`Cell`;function yC(e,t,n){return(t=bC(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function bC(e){var t=xC(e,`string`);return typeof t==`symbol`?t:t+``}function xC(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}var SC=class{constructor(e){yC(this,`cache`,new Map),this.maxSize=e}get(e){var t=this.cache.get(e);return t!==void 0&&(this.cache.delete(e),this.cache.set(e,t)),t}set(e,t){if(this.cache.has(e))this.cache.delete(e);else if(this.cache.size>=this.maxSize){var n=this.cache.keys().next().value;this.cache.delete(n)}this.cache.set(e,t)}clear(){this.cache.clear()}size(){return this.cache.size}};function CC(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function wC(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?CC(Object(n),!0).forEach(function(t){TC(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):CC(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function TC(e,t,n){return(t=EC(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function EC(e){var t=DC(e,`string`);return typeof t==`symbol`?t:t+``}function DC(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}var OC=wC({},{cacheSize:2e3,enableCache:!0}),kC=new SC(OC.cacheSize),AC={position:`absolute`,top:`-20000px`,left:0,padding:0,margin:0,border:`none`,whiteSpace:`pre`},jC=`recharts_measurement_span`;function MC(e,t){var n=t.fontSize||``,r=t.fontFamily||``,i=t.fontWeight||``,a=t.fontStyle||``,o=t.letterSpacing||``,s=t.textTransform||``;return`${e}|${n}|${r}|${i}|${a}|${o}|${s}`}var NC=(e,t)=>{try{var n=document.getElementById(jC);n||(n=document.createElement(`span`),n.setAttribute(`id`,jC),n.setAttribute(`aria-hidden`,`true`),document.body.appendChild(n)),Object.assign(n.style,AC,t),n.textContent=`${e}`;var r=n.getBoundingClientRect();return{width:r.width,height:r.height}}catch{return{width:0,height:0}}},PC=function(e){var t=arguments.length>1&&arguments[1]!==void 0?arguments[1]:{};if(e==null||Yc.isSsr)return{width:0,height:0};if(!OC.enableCache)return NC(e,t);var n=MC(e,t),r=kC.get(n);if(r)return r;var i=NC(e,t);return kC.set(n,i),i},FC=/(-?\d+(?:\.\d+)?[a-zA-Z%]*)([*/])(-?\d+(?:\.\d+)?[a-zA-Z%]*)/,IC=/(-?\d+(?:\.\d+)?[a-zA-Z%]*)([+-])(-?\d+(?:\.\d+)?[a-zA-Z%]*)/,LC=/^px|cm|vh|vw|em|rem|%|mm|in|pt|pc|ex|ch|vmin|vmax|Q$/,RC=/(-?\d+(?:\.\d+)?)([a-zA-Z%]+)?/,zC={cm:96/2.54,mm:96/25.4,pt:96/72,pc:96/6,in:96,Q:96/(2.54*40),px:1},BC=Object.keys(zC),VC=`NaN`;function HC(e,t){return e*zC[t]}var UC=class e{static parse(t){var[,n,r]=RC.exec(t)??[];return new e(parseFloat(n),r??``)}constructor(e,t){this.num=e,this.unit=t,this.num=e,this.unit=t,v(e)&&(this.unit=``),t!==``&&!LC.test(t)&&(this.num=NaN,this.unit=``),BC.includes(t)&&(this.num=HC(e,t),this.unit=`px`)}add(t){return this.unit===t.unit?new e(this.num+t.num,this.unit):new e(NaN,``)}subtract(t){return this.unit===t.unit?new e(this.num-t.num,this.unit):new e(NaN,``)}multiply(t){return this.unit!==``&&t.unit!==``&&this.unit!==t.unit?new e(NaN,``):new e(this.num*t.num,this.unit||t.unit)}divide(t){return this.unit!==``&&t.unit!==``&&this.unit!==t.unit?new e(NaN,``):new e(this.num/t.num,this.unit||t.unit)}toString(){return`${this.num}${this.unit}`}isNaN(){return v(this.num)}};function WC(e){if(e.includes(VC))return VC;for(var t=e;t.includes(`*`)||t.includes(`/`);){var[,n,r,i]=FC.exec(t)??[],a=UC.parse(n??``),o=UC.parse(i??``),s=r===`*`?a.multiply(o):a.divide(o);if(s.isNaN())return VC;t=t.replace(FC,s.toString())}for(;t.includes(`+`)||/.-\d+(?:\.\d+)?/.test(t);){var[,c,l,u]=IC.exec(t)??[],d=UC.parse(c??``),f=UC.parse(u??``),p=l===`+`?d.add(f):d.subtract(f);if(p.isNaN())return VC;t=t.replace(IC,p.toString())}return t}var GC=/\(([^()]*)\)/;function KC(e){for(var t=e,n;(n=GC.exec(t))!=null;){var[,r]=n;t=t.replace(GC,WC(r))}return t}function qC(e){var t=e.replace(/\s+/g,``);return t=KC(t),t=WC(t),t}function JC(e){try{return qC(e)}catch{return VC}}function YC(e){var t=JC(e.slice(5,-1));return t===VC?``:t}var XC=[`x`,`y`,`lineHeight`,`capHeight`,`scaleToFit`,`textAnchor`,`verticalAnchor`,`fill`],ZC=[`dx`,`dy`,`angle`,`className`,`breakAll`];function QC(){return QC=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},QC.apply(null,arguments)}function $C(e,t){if(e==null)return{};var n,r,i=ew(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function ew(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}var tw=/[ \f\n\r\t\v\u2028\u2029]+/,nw=e=>{var{children:t,breakAll:n,style:r}=e;try{var i=[];k(t)||(i=n?t.toString().split(``):t.toString().split(tw));var a=i.map(e=>({word:e,width:PC(e,r).width})),o=n?0:PC(`\xA0`,r).width;return{wordsWithComputedWidth:a,spaceWidth:o}}catch{return null}},rw=(e,t,n,r,i)=>{var{maxLines:a,children:o,style:s,breakAll:c}=e,l=b(a),u=o,d=function(){return(arguments.length>0&&arguments[0]!==void 0?arguments[0]:[]).reduce((e,t)=>{var{word:a,width:o}=t,s=e[e.length-1];if(s&&(r==null||i||s.width+o+n<Number(r)))s.words.push(a),s.width+=o+n;else{var c={words:[a],width:o};e.push(c)}return e},[])},f=d(t),p=e=>e.reduce((e,t)=>e.width>t.width?e:t);if(!l||i||!(f.length>a||p(f).width>Number(r)))return f;for(var m=`…`,h=e=>{var t=u.slice(0,e),n=nw({breakAll:c,style:s,children:t+m}).wordsWithComputedWidth,i=d(n);return[i.length>a||p(i).width>Number(r),i]},g=0,_=u.length-1,v=0,y;g<=_&&v<=u.length-1;){var x=Math.floor((g+_)/2),S=x-1,[C,w]=h(S),[T]=h(x);if(!C&&!T&&(g=x+1),C&&T&&(_=x-1),!C&&T){y=w;break}v++}return y||f},iw=e=>[{words:k(e)?[]:e.toString().split(tw)}],aw=e=>{var{width:t,scaleToFit:n,children:r,style:i,breakAll:a,maxLines:o}=e;if((t||n)&&!Yc.isSsr){var s,c,l=nw({breakAll:a,children:r,style:i});if(l){var{wordsWithComputedWidth:u,spaceWidth:d}=l;s=u,c=d}else return iw(r);return rw({breakAll:a,children:r,maxLines:o,style:i},s,c,t,n)}return iw(r)},ow=`#808080`,sw=(0,A.forwardRef)((e,t)=>{var{x:n=0,y:r=0,lineHeight:i=`1em`,capHeight:a=`0.71em`,scaleToFit:o=!1,textAnchor:s=`start`,verticalAnchor:l=`end`,fill:u=ow}=e,d=$C(e,XC),f=(0,A.useMemo)(()=>aw({breakAll:d.breakAll,children:d.children,maxLines:d.maxLines,scaleToFit:o,style:d.style,width:d.width}),[d.breakAll,d.children,d.maxLines,o,d.style,d.width]),{dx:p,dy:m,angle:h,className:g,breakAll:_}=d,v=$C(d,ZC);if(!x(n)||!x(r)||f.length===0)return null;var y=n+(b(p)?p:0),S=r+(b(m)?m:0),C;switch(l){case`start`:C=YC(`calc(${a})`);break;case`middle`:C=YC(`calc(${(f.length-1)/2} * -${i} + (${a} / 2))`);break;default:C=YC(`calc(${f.length-1} * -${i})`);break}var w=[];if(o){var T=f[0].width,{width:E}=d;w.push(`scale(${b(E)?E/T:1})`)}return h&&w.push(`rotate(${h}, ${y}, ${S})`),w.length&&(v.transform=w.join(` `)),A.createElement(`text`,QC({},M(v,!0),{ref:t,x:y,y:S,className:c(`recharts-text`,g),textAnchor:s,fill:u.includes(`url`)?ow:u}),f.map((e,t)=>{var n=e.words.join(_?``:` `);return A.createElement(`tspan`,{x:y,dy:t===0?C:i,key:`${n}-${t}`},n)}))});sw.displayName=`Text`;var cw=[`labelRef`];function lw(e,t){if(e==null)return{};var n,r,i=uw(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function uw(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}function dw(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function Z(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?dw(Object(n),!0).forEach(function(t){fw(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):dw(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function fw(e,t,n){return(t=pw(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function pw(e){var t=mw(e,`string`);return typeof t==`symbol`?t:t+``}function mw(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function hw(){return hw=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},hw.apply(null,arguments)}var gw=(0,A.createContext)(null),_w=e=>{var{x:t,y:n,width:r,height:i,children:a}=e,o=(0,A.useMemo)(()=>({x:t,y:n,width:r,height:i}),[t,n,r,i]);return A.createElement(gw.Provider,{value:o},a)},vw=()=>{var e=(0,A.useContext)(gw),t=Xs();return e||t},yw=(0,A.createContext)(null),bw=e=>{var{cx:t,cy:n,innerRadius:r,outerRadius:i,startAngle:a,endAngle:o,clockWise:s,children:c}=e,l=(0,A.useMemo)(()=>({cx:t,cy:n,innerRadius:r,outerRadius:i,startAngle:a,endAngle:o,clockWise:s}),[t,n,r,i,a,o,s]);return A.createElement(yw.Provider,{value:l},c)},xw=()=>{var e=(0,A.useContext)(yw),t=I(G_);return e||t},Sw=e=>{var{value:t,formatter:n}=e,r=k(e.children)?t:e.children;return typeof n==`function`?n(r):r},Cw=e=>e!=null&&typeof e==`function`,ww=(e,t)=>{var n=_(t-e),r=Math.min(Math.abs(t-e),360);return n*r},Tw=(e,t,n,r,i)=>{var{offset:a,className:o}=e,{cx:s,cy:l,innerRadius:u,outerRadius:d,startAngle:f,endAngle:p,clockWise:m}=i,h=(u+d)/2,g=ww(f,p),_=g>=0?1:-1,v,y;switch(t){case`insideStart`:v=f+_*a,y=m;break;case`insideEnd`:v=p-_*a,y=!m;break;case`end`:v=p+_*a,y=m;break;default:throw Error(`Unsupported position ${t}`)}y=g<=0?y:!y;var b=R(s,l,h,v),x=R(s,l,h,v+(y?1:-1)*359),S=`M${b.x},${b.y}
-    A${h},${h},0,1,${y?0:1},
-    ${x.x},${x.y}`,w=k(e.id)?C(`recharts-radial-line-`):e.id;return A.createElement(`text`,hw({},r,{dominantBaseline:`central`,className:c(`recharts-radial-bar-label`,o)}),A.createElement(`defs`,null,A.createElement(`path`,{id:w,d:S})),A.createElement(`textPath`,{xlinkHref:`#${w}`},n))},Ew=(e,t,n)=>{var{cx:r,cy:i,innerRadius:a,outerRadius:o,startAngle:s,endAngle:c}=e,l=(s+c)/2;if(n===`outside`){var{x:u,y:d}=R(r,i,o+t,l);return{x:u,y:d,textAnchor:u>=r?`start`:`end`,verticalAnchor:`middle`}}if(n===`center`)return{x:r,y:i,textAnchor:`middle`,verticalAnchor:`middle`};if(n===`centerTop`)return{x:r,y:i,textAnchor:`middle`,verticalAnchor:`start`};if(n===`centerBottom`)return{x:r,y:i,textAnchor:`middle`,verticalAnchor:`end`};var f=(a+o)/2,{x:p,y:m}=R(r,i,f,l);return{x:p,y:m,textAnchor:`middle`,verticalAnchor:`middle`}},Dw=e=>`cx`in e&&b(e.cx),Ow=(e,t)=>{var{parentViewBox:n,offset:r,position:i}=e,a;n!=null&&!Dw(n)&&(a=n);var{x:o,y:s,width:c,height:l}=t,u=l>=0?1:-1,d=u*r,f=u>0?`end`:`start`,p=u>0?`start`:`end`,m=c>=0?1:-1,h=m*r,g=m>0?`end`:`start`,_=m>0?`start`:`end`;if(i===`top`){var v={x:o+c/2,y:s-u*r,textAnchor:`middle`,verticalAnchor:f};return Z(Z({},v),a?{height:Math.max(s-a.y,0),width:c}:{})}if(i===`bottom`){var x={x:o+c/2,y:s+l+d,textAnchor:`middle`,verticalAnchor:p};return Z(Z({},x),a?{height:Math.max(a.y+a.height-(s+l),0),width:c}:{})}if(i===`left`){var S={x:o-h,y:s+l/2,textAnchor:g,verticalAnchor:`middle`};return Z(Z({},S),a?{width:Math.max(S.x-a.x,0),height:l}:{})}if(i===`right`){var C={x:o+c+h,y:s+l/2,textAnchor:_,verticalAnchor:`middle`};return Z(Z({},C),a?{width:Math.max(a.x+a.width-C.x,0),height:l}:{})}var T=a?{width:c,height:l}:{};return i===`insideLeft`?Z({x:o+h,y:s+l/2,textAnchor:_,verticalAnchor:`middle`},T):i===`insideRight`?Z({x:o+c-h,y:s+l/2,textAnchor:g,verticalAnchor:`middle`},T):i===`insideTop`?Z({x:o+c/2,y:s+d,textAnchor:`middle`,verticalAnchor:p},T):i===`insideBottom`?Z({x:o+c/2,y:s+l-d,textAnchor:`middle`,verticalAnchor:f},T):i===`insideTopLeft`?Z({x:o+h,y:s+d,textAnchor:_,verticalAnchor:p},T):i===`insideTopRight`?Z({x:o+c-h,y:s+d,textAnchor:g,verticalAnchor:p},T):i===`insideBottomLeft`?Z({x:o+h,y:s+l-d,textAnchor:_,verticalAnchor:f},T):i===`insideBottomRight`?Z({x:o+c-h,y:s+l-d,textAnchor:g,verticalAnchor:f},T):i&&typeof i==`object`&&(b(i.x)||y(i.x))&&(b(i.y)||y(i.y))?Z({x:o+w(i.x,c),y:s+w(i.y,l),textAnchor:`end`,verticalAnchor:`end`},T):Z({x:o+c/2,y:s+l/2,textAnchor:`middle`,verticalAnchor:`middle`},T)},kw={offset:5};function Aw(e){var t=H(e,kw),{viewBox:n,position:r,value:i,children:a,content:o,className:s=``,textBreakAll:l,labelRef:u}=t,d=xw(),f=vw(),p=n||(r===`center`?f:d??f);if(!p||k(i)&&k(a)&&!(0,A.isValidElement)(o)&&typeof o!=`function`)return null;var m=Z(Z({},t),{},{viewBox:p});if((0,A.isValidElement)(o)){var{labelRef:h}=m,g=lw(m,cw);return(0,A.cloneElement)(o,g)}var _;if(typeof o==`function`){if(_=(0,A.createElement)(o,m),(0,A.isValidElement)(_))return _}else _=Sw(t);var v=Dw(p),y=M(t,!0);if(v&&(r===`insideStart`||r===`insideEnd`||r===`end`))return Tw(t,r,_,y,p);var b=v?Ew(p,t.offset,t.position):Ow(t,p);return A.createElement(sw,hw({ref:u,className:c(`recharts-label`,s)},y,b,{breakAll:l}),_)}Aw.displayName=`Label`;var jw=(e,t,n)=>{if(!e)return null;var r={viewBox:t,labelRef:n};return e===!0?A.createElement(Aw,hw({key:`label-implicit`},r)):x(e)?A.createElement(Aw,hw({key:`label-implicit`,value:e},r)):(0,A.isValidElement)(e)?e.type===Aw?(0,A.cloneElement)(e,Z({key:`label-implicit`},r)):A.createElement(Aw,hw({key:`label-implicit`,content:e},r)):Cw(e)?A.createElement(Aw,hw({key:`label-implicit`,content:e},r)):e&&typeof e==`object`?A.createElement(Aw,hw({},e,{key:`label-implicit`},r)):null};function Mw(e){var{label:t}=e,n=vw();return jw(t,n)||null}function Nw(e){var{label:t}=e,n=xw();return jw(t,n)||null}var Pw=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});function t(e){return e[e.length-1]}exports.last=t})),Fw=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});function t(e){return Array.isArray(e)?e:Array.from(e)}exports.toArray=t})),Iw=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=Pw(),n=Fw(),r=On();function i(e){if(r.isArrayLike(e))return t.last(n.toArray(e))}exports.last=i})),Lw=n(((exports,t)=>{t.exports=Iw().last})),Rw=e(Lw()),zw=[`valueAccessor`],Bw=[`dataKey`,`clockWise`,`id`,`textBreakAll`];function Vw(){return Vw=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Vw.apply(null,arguments)}function Hw(e,t){if(e==null)return{};var n,r,i=Uw(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function Uw(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}var Ww=e=>Array.isArray(e.value)?(0,Rw.default)(e.value):e.value,Gw=(0,A.createContext)(void 0),Kw=Gw.Provider,qw=(0,A.createContext)(void 0),Jw=qw.Provider;function Yw(){return(0,A.useContext)(Gw)}function Xw(){return(0,A.useContext)(qw)}function Zw(e){var{valueAccessor:t=Ww}=e,n=Hw(e,zw),{dataKey:r,clockWise:i,id:a,textBreakAll:o}=n,s=Hw(n,Bw),c=Yw(),l=Xw(),u=c||l;return!u||!u.length?null:A.createElement(N,{className:`recharts-label-list`},u.map((e,i)=>{var c=k(r)?t(e,i):z(e&&e.payload,r),l=k(a)?{}:{id:`${a}-${i}`};return A.createElement(Aw,Vw({},M(e,!0),s,l,{fill:n.fill??e.fill,parentViewBox:e.parentViewBox,value:c,textBreakAll:o,viewBox:e.viewBox,key:`label-${i}`,index:i}))}))}Zw.displayName=`LabelList`;function Qw(e){var{label:t}=e;return t?t===!0?A.createElement(Zw,{key:`labelList-implicit`}):A.isValidElement(t)||Cw(t)?A.createElement(Zw,{key:`labelList-implicit`,content:t}):typeof t==`object`?A.createElement(Zw,Vw({key:`labelList-implicit`},t,{type:String(t.type)})):null:null}var $w=[`component`];function eT(e,t){if(e==null)return{};var n,r,i=tT(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function tT(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}function nT(e){var{component:t}=e,n=eT(e,$w),r;return(0,A.isValidElement)(t)?r=(0,A.cloneElement)(t,n):typeof t==`function`?r=(0,A.createElement)(t,n):uC(!1,"Customized's props `component` must be React.element or Function, but got %s.",typeof t),A.createElement(N,{className:`recharts-customized-wrapper`},r)}nT.displayName=`Customized`;var rT=[`points`,`className`,`baseLinePoints`,`connectNulls`];function iT(){return iT=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},iT.apply(null,arguments)}function aT(e,t){if(e==null)return{};var n,r,i=oT(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function oT(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}var sT=e=>e&&e.x===+e.x&&e.y===+e.y,cT=function(){var e=arguments.length>0&&arguments[0]!==void 0?arguments[0]:[],t=[[]];return e.forEach(e=>{sT(e)?t[t.length-1].push(e):t[t.length-1].length>0&&t.push([])}),sT(e[0])&&t[t.length-1].push(e[0]),t[t.length-1].length<=0&&(t=t.slice(0,-1)),t},lT=(e,t)=>{var n=cT(e);t&&(n=[n.reduce((e,t)=>[...e,...t],[])]);var r=n.map(e=>e.reduce((e,t,n)=>`${e}${n===0?`M`:`L`}${t.x},${t.y}`,``)).join(``);return n.length===1?`${r}Z`:r},uT=(e,t,n)=>{var r=lT(e,n);return`${r.slice(-1)===`Z`?r.slice(0,-1):r}L${lT(Array.from(t).reverse(),n).slice(1)}`},dT=e=>{var{points:t,className:n,baseLinePoints:r,connectNulls:i}=e,a=aT(e,rT);if(!t||!t.length)return null;var o=c(`recharts-polygon`,n);if(r&&r.length){var s=a.stroke&&a.stroke!==`none`,l=uT(t,r,i);return A.createElement(`g`,{className:o},A.createElement(`path`,iT({},M(a,!0),{fill:l.slice(-1)===`Z`?a.fill:`none`,stroke:`none`,d:l})),s?A.createElement(`path`,iT({},M(a,!0),{fill:`none`,d:lT(t,i)})):null,s?A.createElement(`path`,iT({},M(a,!0),{fill:`none`,d:lT(r,i)})):null)}var u=lT(t,i);return A.createElement(`path`,iT({},M(a,!0),{fill:u.slice(-1)===`Z`?a.fill:`none`,className:o,d:u}))};function fT(){return fT=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},fT.apply(null,arguments)}var pT=e=>{var{cx:t,cy:n,r,className:i}=e,a=c(`recharts-dot`,i);return t===+t&&n===+n&&r===+r?A.createElement(`circle`,fT({},j(e),se(e),{className:a,cx:t,cy:n,r})):null},mT=e=>e.graphicalItems.polarItems,hT=L([Y,K_],vv),gT=L([mT,X,hT],xv),_T=L([gT],Ev),vT=L([_T,vg],Ov),yT=L([vT,X,gT],Av),bT=L([vT,X,gT],(e,t,n)=>n.length>0?e.flatMap(e=>n.flatMap(n=>({value:z(e,t.dataKey??n.dataKey),errorDomain:[]}))).filter(Boolean):t?.dataKey==null?e.map(e=>({value:e,errorDomain:[]})):e.map(e=>({value:z(e,t.dataKey),errorDomain:[]}))),xT=()=>void 0,ST=L([X,ly,xT,bT,xT,V,Y],uy),CT=L([X,V,vT,yT,C_,Y,ST],py),wT=L([CT,X,gy],yy),TT=L([X,CT,wT,Y],xy),ET=(e,t,n)=>{switch(t){case`angleAxis`:return F_(e,n);case`radiusAxis`:return I_(e,n);default:throw Error(`Unexpected axis type: ${t}`)}},DT=(e,t,n)=>{switch(t){case`angleAxis`:return H_(e,n);case`radiusAxis`:return W_(e,n);default:throw Error(`Unexpected axis type: ${t}`)}},OT=L([ET,gy,TT,DT],vy),kT=L([V,yT,gv,Y],Qy),AT=L([V,ET,gy,OT,wT,DT,Zy,kT,Y],tb),jT=L([V,ET,OT,DT,Zy,kT,Y],rb),MT=L([(e,t)=>AT(e,`angleAxis`,t,!1)],e=>{if(e)return e.map(e=>e.coordinate)}),NT=L([(e,t)=>AT(e,`radiusAxis`,t,!1)],e=>{if(e)return e.map(e=>e.coordinate)}),PT=[`gridType`,`radialLines`,`angleAxisId`,`radiusAxisId`,`cx`,`cy`,`innerRadius`,`outerRadius`];function FT(e,t){if(e==null)return{};var n,r,i=IT(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function IT(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}function LT(){return LT=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},LT.apply(null,arguments)}function RT(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function zT(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?RT(Object(n),!0).forEach(function(t){BT(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):RT(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function BT(e,t,n){return(t=VT(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function VT(e){var t=HT(e,`string`);return typeof t==`symbol`?t:t+``}function HT(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}var UT=(e,t,n,r)=>{var i=``;return r.forEach((r,a)=>{var o=R(t,n,e,r);a?i+=`L ${o.x},${o.y}`:i+=`M ${o.x},${o.y}`}),i+=`Z`,i},WT=e=>{var{cx:t,cy:n,innerRadius:r,outerRadius:i,polarAngles:a,radialLines:o}=e;if(!a||!a.length||!o)return null;var s=zT({stroke:`#ccc`},j(e));return A.createElement(`g`,{className:`recharts-polar-grid-angle`},a.map(e=>{var a=R(t,n,r,e),o=R(t,n,i,e);return A.createElement(`line`,LT({},s,{key:`line-${e}`,x1:a.x,y1:a.y,x2:o.x,y2:o.y}))}))},GT=e=>{var{cx:t,cy:n,radius:r}=e,i=zT({stroke:`#ccc`,fill:`none`},j(e));return A.createElement(`circle`,LT({},i,{className:c(`recharts-polar-grid-concentric-circle`,e.className),cx:t,cy:n,r}))},KT=e=>{var{radius:t}=e,n=zT({stroke:`#ccc`,fill:`none`},j(e));return A.createElement(`path`,LT({},n,{className:c(`recharts-polar-grid-concentric-polygon`,e.className),d:UT(t,e.cx,e.cy,e.polarAngles)}))},qT=e=>{var{polarRadius:t,gridType:n}=e;if(!t||!t.length)return null;var r=Math.max(...t),i=e.fill&&e.fill!==`none`;return A.createElement(`g`,{className:`recharts-polar-grid-concentric`},i&&n===`circle`&&A.createElement(GT,LT({},e,{radius:r})),i&&n!==`circle`&&A.createElement(KT,LT({},e,{radius:r})),t.map((t,r)=>{var i=r;return n===`circle`?A.createElement(GT,LT({key:i},e,{fill:`none`,radius:t})):A.createElement(KT,LT({key:i},e,{fill:`none`,radius:t}))}))},JT=e=>{var{gridType:t=`polygon`,radialLines:n=!0,angleAxisId:r=0,radiusAxisId:i=0,cx:a,cy:o,innerRadius:s,outerRadius:c}=e,l=FT(e,PT),u=I(G_),d=zT({cx:u?.cx??a??0,cy:u?.cy??o??0,innerRadius:u?.innerRadius??s??0,outerRadius:u?.outerRadius??c??0},l),{polarAngles:f,polarRadius:p,outerRadius:m}=d,h=I(e=>MT(e,r)),g=I(e=>NT(e,i)),_=Array.isArray(f)?f:h,v=Array.isArray(p)?p:g;return m<=0||_==null||v==null?null:A.createElement(`g`,{className:`recharts-polar-grid`},A.createElement(qT,LT({gridType:t,radialLines:n},d,{polarAngles:_,polarRadius:v})),A.createElement(WT,LT({gridType:t,radialLines:n},d,{polarAngles:_,polarRadius:v})))};JT.displayName=`PolarGrid`;var YT=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});function t(e,t){if(e.length===0)return;let n=e[0],r=t(n);for(let i=1;i<e.length;i++){let a=e[i],o=t(a);o>r&&(r=o,n=a)}return n}exports.maxBy=t})),XT=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=YT(),n=En(),r=Xn();function i(e,i){if(e!=null)return t.maxBy(Array.from(e),r.iteratee(i??n.identity))}exports.maxBy=i})),ZT=n(((exports,t)=>{t.exports=XT().maxBy})),QT=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});function t(e,t){if(e.length===0)return;let n=e[0],r=t(n);for(let i=1;i<e.length;i++){let a=e[i],o=t(a);o<r&&(r=o,n=a)}return n}exports.minBy=t})),$T=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=QT(),n=En(),r=Xn();function i(e,i){if(e!=null)return t.minBy(Array.from(e),r.iteratee(i??n.identity))}exports.minBy=i})),eE=n(((exports,t)=>{t.exports=$T().minBy})),tE=Ma({name:`polarAxis`,initialState:{radiusAxis:{},angleAxis:{}},reducers:{addRadiusAxis(e,t){e.radiusAxis[t.payload.id]=sa(t.payload)},removeRadiusAxis(e,t){delete e.radiusAxis[t.payload.id]},addAngleAxis(e,t){e.angleAxis[t.payload.id]=sa(t.payload)},removeAngleAxis(e,t){delete e.angleAxis[t.payload.id]}}}),{addRadiusAxis:nE,removeRadiusAxis:rE,addAngleAxis:iE,removeAngleAxis:aE}=tE.actions,oE=tE.reducer,sE=e(ZT()),cE=e(eE()),lE=[`cx`,`cy`,`angle`,`axisLine`],uE=[`angle`,`tickFormatter`,`stroke`,`tick`];function dE(){return dE=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},dE.apply(null,arguments)}function fE(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function pE(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?fE(Object(n),!0).forEach(function(t){mE(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):fE(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function mE(e,t,n){return(t=hE(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function hE(e){var t=gE(e,`string`);return typeof t==`symbol`?t:t+``}function gE(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function _E(e,t){if(e==null)return{};var n,r,i=vE(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function vE(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}var yE=`radiusAxis`;function bE(e){var t=F();return(0,A.useEffect)(()=>(t(nE(e)),()=>{t(rE(e))})),null}var xE=(e,t,n,r)=>{var{coordinate:i}=e;return R(n,r,i,t)},SE=e=>{var t;switch(e){case`left`:t=`end`;break;case`right`:t=`start`;break;default:t=`middle`;break}return t},CE=(e,t,n,r)=>{var i=(0,sE.default)(r,e=>e.coordinate||0),a=(0,cE.default)(r,e=>e.coordinate||0);return{cx:t,cy:n,startAngle:e,endAngle:e,innerRadius:a.coordinate||0,outerRadius:i.coordinate||0,clockWise:!1}},wE=(e,t)=>{var{cx:n,cy:r,angle:i,axisLine:a}=e,o=_E(e,lE),s=t.reduce((e,t)=>[Math.min(e[0],t.coordinate),Math.max(e[1],t.coordinate)],[1/0,-1/0]),c=R(n,r,s[0],i),l=R(n,r,s[1],i),u=pE(pE(pE({},j(o)),{},{fill:`none`},M(a,!1)),{},{x1:c.x,y1:c.y,x2:l.x,y2:l.y});return A.createElement(`line`,dE({className:`recharts-polar-radius-axis-line`},u))},TE=(e,t,n)=>A.isValidElement(e)?A.cloneElement(e,t):typeof e==`function`?e(t):A.createElement(sw,dE({},t,{className:`recharts-polar-radius-axis-tick-value`}),n),EE=(e,t)=>{var{angle:n,tickFormatter:r,stroke:i,tick:a}=e,o=_E(e,uE),s=SE(e.orientation),l=j(o),u=M(a,!1),d=t.map((t,o)=>{var d=xE(t,e.angle,e.cx,e.cy),f=pE(pE(pE(pE({textAnchor:s,transform:`rotate(${90-n}, ${d.x}, ${d.y})`},l),{},{stroke:`none`,fill:i},u),{},{index:o},d),{},{payload:t});return A.createElement(N,dE({className:c(`recharts-polar-radius-axis-tick`,Ho(a)),key:`tick-${t.coordinate}`},le(e,t,o)),TE(a,f,r?r(t.value,o):t.value))});return A.createElement(N,{className:`recharts-polar-radius-axis-ticks`},d)},DE=e=>{var{radiusAxisId:t}=e,n=I(G_),r=I(e=>OT(e,`radiusAxis`,t)),i=I(e=>AT(e,`radiusAxis`,t,!1));if(n==null||!i||!i.length)return null;var a=pE(pE(pE({},e),{},{scale:r},n),{},{radius:n.outerRadius}),{tick:o,axisLine:s}=a;return A.createElement(N,{className:c(`recharts-polar-radius-axis`,yE,a.className)},s&&wE(a,i),o&&EE(a,i),A.createElement(bw,CE(a.angle,a.cx,a.cy,i),A.createElement(Nw,{label:a.label}),a.children))},OE=class extends A.PureComponent{render(){return A.createElement(A.Fragment,null,A.createElement(bE,{domain:this.props.domain,id:this.props.radiusAxisId,scale:this.props.scale,type:this.props.type,dataKey:this.props.dataKey,unit:void 0,name:this.props.name,allowDuplicatedCategory:this.props.allowDuplicatedCategory,allowDataOverflow:this.props.allowDataOverflow,reversed:this.props.reversed,includeHidden:this.props.includeHidden,allowDecimals:this.props.allowDecimals,tickCount:this.props.tickCount,ticks:this.props.ticks,tick:this.props.tick}),A.createElement(DE,this.props))}};mE(OE,`displayName`,`PolarRadiusAxis`),mE(OE,`axisType`,yE),mE(OE,`defaultProps`,k_);var kE=[`children`];function AE(){return AE=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},AE.apply(null,arguments)}function jE(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function ME(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?jE(Object(n),!0).forEach(function(t){NE(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):jE(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function NE(e,t,n){return(t=PE(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function PE(e){var t=FE(e,`string`);return typeof t==`symbol`?t:t+``}function FE(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function IE(e,t){if(e==null)return{};var n,r,i=LE(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function LE(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}var RE=1e-5,zE=Math.cos(Po(45)),BE=`angleAxis`;function VE(e){var t=F(),n=(0,A.useMemo)(()=>{var{children:t}=e;return IE(e,kE)},[e]),r=I(e=>F_(e,n.id)),i=n===r;return(0,A.useEffect)(()=>(t(iE(n)),()=>{t(aE(n))}),[t,n]),i?e.children:null}var HE=(e,t)=>{var{cx:n,cy:r,radius:i,orientation:a,tickSize:o}=t,s=o||8,c=R(n,r,i,e.coordinate),l=R(n,r,i+(a===`inner`?-1:1)*s,e.coordinate);return{x1:c.x,y1:c.y,x2:l.x,y2:l.y}},UE=(e,t)=>{var n=Math.cos(Po(-e.coordinate));return n>RE?t===`outer`?`start`:`end`:n<-RE?t===`outer`?`end`:`start`:`middle`},WE=e=>{var t=Math.cos(Po(-e.coordinate)),n=Math.sin(Po(-e.coordinate));return Math.abs(t)<=zE?n>0?`start`:`end`:`middle`},GE=e=>{var{cx:t,cy:n,radius:r,axisLineType:i,axisLine:a,ticks:o}=e;if(!a)return null;var s=ME(ME({},j(e)),{},{fill:`none`},M(a,!1));if(i===`circle`)return A.createElement(pT,AE({className:`recharts-polar-angle-axis-line`},s,{cx:t,cy:n,r}));var c=o.map(e=>R(t,n,r,e.coordinate));return A.createElement(dT,AE({className:`recharts-polar-angle-axis-line`},s,{points:c}))},KE=e=>{var{tick:t,tickProps:n,value:r}=e;return t?A.isValidElement(t)?A.cloneElement(t,n):typeof t==`function`?t(n):A.createElement(sw,AE({},n,{className:`recharts-polar-angle-axis-tick-value`}),r):null},qE=e=>{var{tick:t,tickLine:n,tickFormatter:r,stroke:i,ticks:a}=e,o=j(e),s=M(t,!1),l=ME(ME({},o),{},{fill:`none`},M(n,!1)),u=a.map((a,u)=>{var d=HE(a,e),f=UE(a,e.orientation),p=WE(a),m=ME(ME(ME({},o),{},{textAnchor:f,verticalAnchor:p,stroke:`none`,fill:i},s),{},{index:u,payload:a,x:d.x2,y:d.y2});return A.createElement(N,AE({className:c(`recharts-polar-angle-axis-tick`,Ho(t)),key:`tick-${a.coordinate}`},le(e,a,u)),n&&A.createElement(`line`,AE({className:`recharts-polar-angle-axis-tick-line`},l,d)),A.createElement(KE,{tick:t,tickProps:m,value:r?r(a.value,u):a.value}))});return A.createElement(N,{className:`recharts-polar-angle-axis-ticks`},u)},JE=e=>{var{angleAxisId:t}=e,n=I(G_),r=I(e=>OT(e,`angleAxis`,t)),i=B(),a=I(e=>AT(e,`angleAxis`,t,i));if(n==null||!a||!a.length)return null;var o=ME(ME(ME({},e),{},{scale:r},n),{},{radius:n.outerRadius});return A.createElement(N,{className:c(`recharts-polar-angle-axis`,BE,o.className)},A.createElement(GE,AE({},o,{ticks:a})),A.createElement(qE,AE({},o,{ticks:a})))},YE=class extends A.PureComponent{render(){return this.props.radius<=0?null:A.createElement(VE,{id:this.props.angleAxisId,scale:this.props.scale,type:this.props.type,dataKey:this.props.dataKey,unit:void 0,name:this.props.name,allowDuplicatedCategory:!1,allowDataOverflow:!1,reversed:this.props.reversed,includeHidden:!1,allowDecimals:this.props.allowDecimals,tickCount:this.props.tickCount,ticks:this.props.ticks,tick:this.props.tick,domain:this.props.domain},A.createElement(JE,this.props))}};NE(YE,`displayName`,`PolarAngleAxis`),NE(YE,`axisType`,BE),NE(YE,`defaultProps`,O_);function XE(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function ZE(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?XE(Object(n),!0).forEach(function(t){QE(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):XE(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function QE(e,t,n){return(t=$E(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function $E(e){var t=eD(e,`string`);return typeof t==`symbol`?t:t+``}function eD(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}var tD=L([mT,(e,t)=>t],(e,t)=>e.filter(e=>e.type===`pie`).find(e=>e.id===t)),nD=[],rD=(e,t,n)=>n?.length===0?nD:n,iD=L([vg,tD,rD],(e,t,n)=>{var{chartData:r}=e;if(t!=null){var i=t?.data!=null&&t.data.length>0?t.data:r;if((!i||!i.length)&&n!=null&&(i=n.map(e=>ZE(ZE({},t.presentationProps),e.props))),i!=null)return i}}),aD=L([iD,tD,rD],(e,t,n)=>{if(!(e==null||t==null))return e.map((e,r)=>{var i,a=z(e,t.nameKey,t.name),o=n!=null&&(i=n[r])!=null&&(i=i.props)!=null&&i.fill?n[r].props.fill:typeof e==`object`&&e&&`fill`in e?e.fill:t.fill;return{value:bs(a,t.dataKey),color:o,payload:e,type:t.legendType}})}),oD=L([iD,tD,rD,Us],(e,t,n,r)=>{if(!(t==null||e==null))return SO({offset:r,pieSettings:t,displayedData:e,cells:n})}),sD=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});function t(e){if(typeof e!=`object`||!e)return!1;if(Object.getPrototypeOf(e)===null)return!0;if(Object.prototype.toString.call(e)!==`[object Object]`){let t=e[Symbol.toStringTag];return t==null||!Object.getOwnPropertyDescriptor(e,Symbol.toStringTag)?.writable?!1:e.toString()===`[object ${t}]`}let t=e;for(;Object.getPrototypeOf(t)!==null;)t=Object.getPrototypeOf(t);return Object.getPrototypeOf(e)===t}exports.isPlainObject=t})),cD=n(((exports,t)=>{t.exports=sD().isPlainObject}));function lD(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function uD(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?lD(Object(n),!0).forEach(function(t){dD(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):lD(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function dD(e,t,n){return(t=fD(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function fD(e){var t=pD(e,`string`);return typeof t==`symbol`?t:t+``}function pD(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function mD(){return mD=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},mD.apply(null,arguments)}var hD=(e,t,n,r,i)=>{var a=n-r,o=`M ${e},${t}`;return o+=`L ${e+n},${t}`,o+=`L ${e+n-a/2},${t+i}`,o+=`L ${e+n-a/2-r},${t+i}`,o+=`L ${e},${t} Z`,o},gD={x:0,y:0,upperWidth:0,lowerWidth:0,height:0,isUpdateAnimationActive:!1,animationBegin:0,animationDuration:1500,animationEasing:`ease`},_D=e=>{var t=H(e,gD),{x:n,y:r,upperWidth:i,lowerWidth:a,height:o,className:s}=t,{animationEasing:l,animationDuration:u,animationBegin:d,isUpdateAnimationActive:f}=t,p=(0,A.useRef)(),[m,h]=(0,A.useState)(-1),g=(0,A.useRef)(i),_=(0,A.useRef)(a),v=(0,A.useRef)(o),y=(0,A.useRef)(n),b=(0,A.useRef)(r),x=fu(e,`trapezoid-`);if((0,A.useEffect)(()=>{if(p.current&&p.current.getTotalLength)try{var e=p.current.getTotalLength();e&&h(e)}catch{}},[]),n!==+n||r!==+r||i!==+i||a!==+a||o!==+o||i===0&&a===0||o===0)return null;var S=c(`recharts-trapezoid`,s);if(!f)return A.createElement(`g`,null,A.createElement(`path`,mD({},M(t,!0),{className:S,d:hD(n,r,i,a,o)})));var C=g.current,w=_.current,T=v.current,E=y.current,O=b.current,ee=`0px ${m===-1?1:m}px`,k=`${m}px 0px`,te=Il([`strokeDasharray`],u,l);return A.createElement(du,{animationId:x,key:x,canBegin:m>0,duration:u,easing:l,isActive:f,begin:d},e=>{var s=D(C,i,e),c=D(w,a,e),l=D(T,o,e),u=D(E,n,e),d=D(O,r,e);p.current&&(g.current=s,_.current=c,v.current=l,y.current=u,b.current=d);var f=e>0?{transition:te,strokeDasharray:k}:{strokeDasharray:ee};return A.createElement(`path`,mD({},M(t,!0),{className:S,d:hD(u,d,s,c,l),ref:p,style:uD(uD({},f),t.style)}))})},vD=e(cD()),yD=[`option`,`shapeType`,`propTransformer`,`activeClassName`,`isActive`];function bD(e,t){if(e==null)return{};var n,r,i=xD(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function xD(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}function SD(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function CD(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?SD(Object(n),!0).forEach(function(t){wD(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):SD(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function wD(e,t,n){return(t=TD(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function TD(e){var t=ED(e,`string`);return typeof t==`symbol`?t:t+``}function ED(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function DD(e,t){return CD(CD({},t),e)}function OD(e,t){return e===`symbols`}function kD(e){var{shapeType:t,elementProps:n}=e;switch(t){case`rectangle`:return A.createElement(xu,n);case`trapezoid`:return A.createElement(_D,n);case`sector`:return A.createElement(ku,n);case`symbols`:if(OD(t,n))return A.createElement(gn,n);break;default:return null}}function AD(e){return(0,A.isValidElement)(e)?e.props:e}function jD(e){var{option:t,shapeType:n,propTransformer:r=DD,activeClassName:i=`recharts-active-shape`,isActive:a}=e,o=bD(e,yD),s;if((0,A.isValidElement)(t))s=(0,A.cloneElement)(t,CD(CD({},o),AD(t)));else if(typeof t==`function`)s=t(o);else if((0,vD.default)(t)&&typeof t!=`boolean`){var c=r(t,o);s=A.createElement(kD,{shapeType:n,elementProps:c})}else{var l=o;s=A.createElement(kD,{shapeType:n,elementProps:l})}return a?A.createElement(N,{className:i},s):s}var MD=(e,t)=>{var n=F();return(r,i)=>a=>{e?.(r,i,a),n(xb({activeIndex:String(i),activeDataKey:t,activeCoordinate:r.tooltipPosition}))}},ND=e=>{var t=F();return(n,r)=>i=>{e?.(n,r,i),t(Sb())}},PD=(e,t)=>{var n=F();return(r,i)=>a=>{e?.(r,i,a),n(wb({activeIndex:String(i),activeDataKey:t,activeCoordinate:r.tooltipPosition}))}};function FD(e){var{fn:t,args:n}=e,r=F(),i=B();return(0,A.useEffect)(()=>{if(!i){var e=t(n);return r(vb(e)),()=>{r(yb(e))}}},[t,n,r,i]),null}var ID=()=>{};function LD(e){var{legendPayload:t}=e,n=F(),r=B();return(0,A.useEffect)(()=>r?ID:(n(cc(t)),()=>{n(lc(t))}),[n,r,t]),null}function RD(e){var{legendPayload:t}=e,n=F(),r=I(V);return(0,A.useEffect)(()=>r!==`centric`&&r!==`radial`?ID:(n(cc(t)),()=>{n(lc(t))}),[n,r,t]),null}var zD=A.useId??(()=>{var[e]=A.useState(()=>C(`uid-`));return e});function BD(e,t){var n=zD();return t||(e?`${e}-${n}`:n)}var VD=(0,A.createContext)(void 0),HD=e=>{var{id:t,type:n,children:r}=e,i=BD(`recharts-${n}`,t);return A.createElement(VD.Provider,{value:i},r(i))};function UD(){return(0,A.useContext)(VD)}var WD=Ma({name:`graphicalItems`,initialState:{cartesianItems:[],polarItems:[]},reducers:{addCartesianGraphicalItem(e,t){e.cartesianItems.push(sa(t.payload))},replaceCartesianGraphicalItem(e,t){var{prev:n,next:r}=t.payload,i=ra(e).cartesianItems.indexOf(sa(n));i>-1&&(e.cartesianItems[i]=sa(r))},removeCartesianGraphicalItem(e,t){var n=ra(e).cartesianItems.indexOf(sa(t.payload));n>-1&&e.cartesianItems.splice(n,1)},addPolarGraphicalItem(e,t){e.polarItems.push(sa(t.payload))},removePolarGraphicalItem(e,t){var n=ra(e).polarItems.indexOf(sa(t.payload));n>-1&&e.polarItems.splice(n,1)}}}),{addCartesianGraphicalItem:GD,replaceCartesianGraphicalItem:KD,removeCartesianGraphicalItem:qD,addPolarGraphicalItem:JD,removePolarGraphicalItem:YD}=WD.actions,XD=WD.reducer;function ZD(e){var t=F(),n=(0,A.useRef)(null);return(0,A.useEffect)(()=>{n.current===null?t(GD(e)):n.current!==e&&t(KD({prev:n.current,next:e})),n.current=e},[t,e]),(0,A.useEffect)(()=>()=>{n.current&&=(t(qD(n.current)),null)},[t]),null}function QD(e){var t=F();return(0,A.useEffect)(()=>(t(JD(e)),()=>{t(YD(e))}),[t,e]),null}var $D=e(h()),eO=[`onMouseEnter`,`onClick`,`onMouseLeave`],tO=[`id`],nO=[`id`];function rO(e,t){if(e==null)return{};var n,r,i=iO(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function iO(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}function aO(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function Q(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?aO(Object(n),!0).forEach(function(t){oO(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):aO(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function oO(e,t,n){return(t=sO(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function sO(e){var t=cO(e,`string`);return typeof t==`symbol`?t:t+``}function cO(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function lO(){return lO=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},lO.apply(null,arguments)}function uO(e){var t=(0,A.useMemo)(()=>ve(e.children,vC),[e.children]),n=I(n=>aD(n,e.id,t));return n==null?null:A.createElement(RD,{legendPayload:n})}function dO(e){var{dataKey:t,nameKey:n,sectors:r,stroke:i,strokeWidth:a,fill:o,name:s,hide:c,tooltipType:l}=e;return{dataDefinedOnItem:r.map(e=>e.tooltipPayload),positions:r.map(e=>e.tooltipPosition),settings:{stroke:i,strokeWidth:a,fill:o,dataKey:t,nameKey:n,name:bs(s,t),hide:c,type:l,color:o,unit:``}}}var fO=(e,t)=>e>t?`start`:e<t?`end`:`middle`,pO=(e,t,n)=>w(typeof t==`function`?t(e):t,n,n*.8),mO=(e,t,n)=>{var{top:r,left:i,width:a,height:o}=t,s=Io(a,o),c=i+w(e.cx,a,a/2),l=r+w(e.cy,o,o/2),u=w(e.innerRadius,s,0),d=pO(n,e.outerRadius,s),f=e.maxRadius||Math.sqrt(a*a+o*o)/2;return{cx:c,cy:l,innerRadius:u,outerRadius:d,maxRadius:f}},hO=(e,t)=>{var n=_(t-e),r=Math.min(Math.abs(t-e),360);return n*r};function gO(e){return e&&typeof e==`object`&&`className`in e&&typeof e.className==`string`?e.className:``}var _O=(e,t)=>{if(A.isValidElement(e))return A.cloneElement(e,t);if(typeof e==`function`)return e(t);var n=c(`recharts-pie-label-line`,typeof e==`boolean`?``:e.className);return A.createElement(dl,lO({},t,{type:`linear`,className:n}))},vO=(e,t,n)=>{if(A.isValidElement(e))return A.cloneElement(e,t);var r=n;if(typeof e==`function`&&(r=e(t),A.isValidElement(r)))return r;var i=c(`recharts-pie-label-text`,gO(e));return A.createElement(sw,lO({},t,{alignmentBaseline:`middle`,className:i}),r)};function yO(e){var{sectors:t,props:n,showLabels:r}=e,{label:i,labelLine:a,dataKey:o}=n;if(!r||!i||!t)return null;var s=j(n),c=M(i,!1),l=M(a,!1),u=typeof i==`object`&&`offsetRadius`in i&&typeof i.offsetRadius==`number`&&i.offsetRadius||20,d=t.map((e,t)=>{var n=(e.startAngle+e.endAngle)/2,r=R(e.cx,e.cy,e.outerRadius+u,n),d=Q(Q(Q(Q({},s),e),{},{stroke:`none`},c),{},{index:t,textAnchor:fO(r.x,e.cx)},r),f=Q(Q(Q(Q({},s),e),{},{fill:`none`,stroke:e.fill},l),{},{index:t,points:[R(e.cx,e.cy,e.outerRadius,n),r],key:`line`});return A.createElement(N,{key:`label-${e.startAngle}-${e.endAngle}-${e.midAngle}-${t}`},a&&_O(a,f),vO(i,d,z(e,o)))});return A.createElement(N,{className:`recharts-pie-labels`},d)}function bO(e){var{sectors:t,props:n,showLabels:r}=e,{label:i}=n;return typeof i==`object`&&i&&`position`in i?A.createElement(Qw,{label:i}):A.createElement(yO,{sectors:t,props:n,showLabels:r})}function xO(e){var{sectors:t,activeShape:n,inactiveShape:r,allOtherPieProps:i}=e,a=I(Mx),{onMouseEnter:o,onClick:s,onMouseLeave:c}=i,l=rO(i,eO),u=MD(o,i.dataKey),d=ND(c),f=PD(s,i.dataKey);return t==null||t.length===0?null:A.createElement(A.Fragment,null,t.map((e,o)=>{if(e?.startAngle===0&&e?.endAngle===0&&t.length!==1)return null;var s=n&&String(o)===a,c=s?n:a?r:null,p=Q(Q({},e),{},{stroke:e.stroke,tabIndex:-1,[js]:o,[Ms]:i.dataKey});return A.createElement(N,lO({tabIndex:-1,className:`recharts-pie-sector`},le(l,e,o),{onMouseEnter:u(e,o),onMouseLeave:d(e,o),onClick:f(e,o),key:`sector-${e?.startAngle}-${e?.endAngle}-${e.midAngle}-${o}`}),A.createElement(jD,lO({option:c,isActive:s,shapeType:`sector`},p)))}))}function SO(e){var{pieSettings:t,displayedData:n,cells:r,offset:i}=e,{cornerRadius:a,startAngle:o,endAngle:s,dataKey:c,nameKey:l,tooltipType:u}=t,d=Math.abs(t.minAngle),f=hO(o,s),p=Math.abs(f),m=n.length<=1?0:t.paddingAngle??0,h=n.filter(e=>z(e,c,0)!==0).length,g=(p>=360?h:h-1)*m,v=p-h*d-g,y=n.reduce((e,t)=>{var n=z(t,c,0);return e+(b(n)?n:0)},0),x;if(y>0){var S;x=n.map((e,n)=>{var s=z(e,c,0),p=z(e,l,n),h=mO(t,i,e),g=(b(s)?s:0)/y,x,C=Q(Q({},e),r&&r[n]&&r[n].props);x=n?S.endAngle+_(f)*m*(s===0?0:1):o;var w=x+_(f)*((s===0?0:d)+g*v),T=(x+w)/2,E=(h.innerRadius+h.outerRadius)/2,D=[{name:p,value:s,payload:C,dataKey:c,type:u}],O=R(h.cx,h.cy,E,T);return S=Q(Q(Q(Q({},t.presentationProps),{},{percent:g,cornerRadius:a,name:p,tooltipPayload:D,midAngle:T,middleRadius:E,tooltipPosition:O},C),h),{},{value:s,startAngle:x,endAngle:w,payload:C,paddingAngle:_(f)*m}),S})}return x}function CO(e){var{showLabels:t,sectors:n,children:r}=e,i=(0,A.useMemo)(()=>!t||!n?[]:n.map(e=>({value:e.value,payload:e.payload,clockWise:!1,parentViewBox:void 0,viewBox:{cx:e.cx,cy:e.cy,innerRadius:e.innerRadius,outerRadius:e.outerRadius,startAngle:e.startAngle,endAngle:e.endAngle,clockWise:!1},fill:e.fill})),[n,t]);return A.createElement(Jw,{value:t?i:void 0},r)}function wO(e){var{props:t,previousSectorsRef:n}=e,{sectors:r,isAnimationActive:i,animationBegin:a,animationDuration:o,animationEasing:s,activeShape:c,inactiveShape:l,onAnimationStart:u,onAnimationEnd:d}=t,f=fu(t,`recharts-pie-`),p=n.current,[m,h]=(0,A.useState)(!1),g=(0,A.useCallback)(()=>{typeof d==`function`&&d(),h(!1)},[d]),_=(0,A.useCallback)(()=>{typeof u==`function`&&u(),h(!0)},[u]);return A.createElement(CO,{showLabels:!m,sectors:r},A.createElement(du,{animationId:f,begin:a,duration:o,isActive:i,easing:s,onAnimationStart:_,onAnimationEnd:g,key:f},e=>{var i=[],a=r&&r[0],o=a?.startAngle;return r?.forEach((t,n)=>{var r=p&&p[n],a=n>0?(0,$D.default)(t,`paddingAngle`,0):0;if(r){var s=D(r.endAngle-r.startAngle,t.endAngle-t.startAngle,e),c=Q(Q({},t),{},{startAngle:o+a,endAngle:o+s+a});i.push(c),o=c.endAngle}else{var{endAngle:l,startAngle:u}=t,d=D(0,l-u,e),f=Q(Q({},t),{},{startAngle:o+a,endAngle:o+d+a});i.push(f),o=f.endAngle}}),n.current=i,A.createElement(N,null,A.createElement(xO,{sectors:i,activeShape:c,inactiveShape:l,allOtherPieProps:t}))}),A.createElement(bO,{showLabels:!m,sectors:r,props:t}),t.children)}var TO={animationBegin:400,animationDuration:1500,animationEasing:`ease`,cx:`50%`,cy:`50%`,dataKey:`value`,endAngle:360,fill:`#808080`,hide:!1,innerRadius:0,isAnimationActive:!Yc.isSsr,labelLine:!0,legendType:`rect`,minAngle:0,nameKey:`name`,outerRadius:`80%`,paddingAngle:0,rootTabIndex:0,startAngle:0,stroke:`#fff`};function EO(e){var{id:t}=e,n=rO(e,tO),{hide:r,className:i,rootTabIndex:a}=e,o=(0,A.useMemo)(()=>ve(e.children,vC),[e.children]),s=I(e=>oD(e,t,o)),l=(0,A.useRef)(null),u=c(`recharts-pie`,i);return r||s==null?(l.current=null,A.createElement(N,{tabIndex:a,className:u})):A.createElement(A.Fragment,null,A.createElement(FD,{fn:dO,args:Q(Q({},e),{},{sectors:s})}),A.createElement(N,{tabIndex:a,className:u},A.createElement(wO,{props:Q(Q({},n),{},{sectors:s}),previousSectorsRef:l})))}function DO(e){var t=H(e,TO),{id:n}=t,r=rO(t,nO),i=j(r);return A.createElement(HD,{id:n,type:`pie`},e=>A.createElement(A.Fragment,null,A.createElement(QD,{type:`pie`,id:e,data:r.data,dataKey:r.dataKey,hide:r.hide,angleAxisId:0,radiusAxisId:0,name:r.name,nameKey:r.nameKey,tooltipType:r.tooltipType,legendType:r.legendType,fill:r.fill,cx:r.cx,cy:r.cy,startAngle:r.startAngle,endAngle:r.endAngle,paddingAngle:r.paddingAngle,minAngle:r.minAngle,innerRadius:r.innerRadius,outerRadius:r.outerRadius,cornerRadius:r.cornerRadius,presentationProps:i,maxRadius:t.maxRadius}),A.createElement(uO,lO({},r,{id:e})),A.createElement(EO,lO({},r,{id:e}))))}DO.displayName=`Pie`;function OO(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function kO(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?OO(Object(n),!0).forEach(function(t){AO(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):OO(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function AO(e,t,n){return(t=jO(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function jO(e){var t=MO(e,`string`);return typeof t==`symbol`?t:t+``}function MO(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}var NO=Ma({name:`cartesianAxis`,initialState:{xAxis:{},yAxis:{},zAxis:{}},reducers:{addXAxis(e,t){e.xAxis[t.payload.id]=sa(t.payload)},removeXAxis(e,t){delete e.xAxis[t.payload.id]},addYAxis(e,t){e.yAxis[t.payload.id]=sa(t.payload)},removeYAxis(e,t){delete e.yAxis[t.payload.id]},addZAxis(e,t){e.zAxis[t.payload.id]=sa(t.payload)},removeZAxis(e,t){delete e.zAxis[t.payload.id]},updateYAxisWidth(e,t){var{id:n,width:r}=t.payload;e.yAxis[n]&&(e.yAxis[n]=kO(kO({},e.yAxis[n]),{},{width:r}))}}}),{addXAxis:PO,removeXAxis:FO,addYAxis:IO,removeYAxis:LO,addZAxis:RO,removeZAxis:zO,updateYAxisWidth:BO}=NO.actions,VO=NO.reducer,HO=L([Us],e=>{if(e)return{top:e.top,bottom:e.bottom,left:e.left,right:e.right}}),UO=L([HO,ws,Ts],(e,t,n)=>{if(!(!e||t==null||n==null))return{x:e.left,y:e.top,width:Math.max(0,t-e.left-e.right),height:Math.max(0,n-e.top-e.bottom)}}),WO=e=>{var t=B();return I(n=>ab(n,`xAxis`,e,t))},GO=e=>{var t=B();return I(n=>ab(n,`yAxis`,e,t))},KO=()=>I(Nx),qO=()=>I(HO),JO=()=>I(UO),YO=()=>I(Bx),XO=function(){var e=arguments.length>0&&arguments[0]!==void 0?arguments[0]:0,t=B();return I(n=>my(n,`xAxis`,e,t))},ZO=function(){var e=arguments.length>0&&arguments[0]!==void 0?arguments[0]:0,t=B();return I(n=>my(n,`yAxis`,e,t))};function QO(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function $O(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?QO(Object(n),!0).forEach(function(t){ek(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):QO(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function ek(e,t,n){return(t=tk(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function tk(e){var t=nk(e,`string`);return typeof t==`symbol`?t:t+``}function nk(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}var rk=e=>{var{point:t,childIndex:n,mainColor:r,activeDot:i,dataKey:a}=e;if(i===!1||t.x==null||t.y==null)return null;var o=$O($O({index:n,dataKey:a,cx:t.x,cy:t.y,r:4,fill:r??`none`,strokeWidth:2,stroke:`#fff`,payload:t.payload,value:t.value},M(i,!1)),se(i)),s=(0,A.isValidElement)(i)?(0,A.cloneElement)(i,o):typeof i==`function`?i(o):A.createElement(pT,o);return A.createElement(N,{className:`recharts-active-dot`},s)};function ik(e){var{points:t,mainColor:n,activeDot:r,itemDataKey:i}=e,a=I(Mx),o=YO();if(t==null||o==null)return null;var s=t.find(e=>o.includes(e.payload));return k(s)?null:rk({point:s,childIndex:Number(a),mainColor:n,dataKey:i,activeDot:r})}function ak(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function ok(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?ak(Object(n),!0).forEach(function(t){sk(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):ak(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function sk(e,t,n){return(t=ck(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function ck(e){var t=lk(e,`string`);return typeof t==`symbol`?t:t+``}function lk(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}var uk=(e,t)=>OT(e,`radiusAxis`,t),dk=L([uk],e=>{if(e!=null)return{scale:e}}),fk=L([I_,uk],(e,t)=>{if(!(e==null||t==null))return ok(ok({},e),{},{scale:t})}),pk=(e,t,n,r)=>AT(e,`radiusAxis`,t,r),mk=(e,t,n)=>F_(e,n),hk=(e,t,n)=>OT(e,`angleAxis`,n),gk=L([mk,hk],(e,t)=>{if(!(e==null||t==null))return ok(ok({},e),{},{scale:t})}),_k=(e,t,n,r)=>AT(e,`angleAxis`,n,r),vk=L([mk,hk,G_],(e,t,n)=>{if(!(n==null||t==null))return{scale:t,type:e.type,dataKey:e.dataKey,cx:n.cx,cy:n.cy}}),yk=(e,t,n,r,i)=>i,bk=L([V,fk,pk,gk,_k],(e,t,n,r,i)=>$o(e,`radiusAxis`)?vs(t,n,!1):vs(r,i,!1)),xk=L([mT,yk],(e,t)=>{if(e!=null)return e.find(e=>e.type===`radar`&&t===e.id)?.dataKey}),Sk=L([dk,vk,vg,xk,bk],(e,t,n,r,i)=>{var{chartData:a,dataStartIndex:o,dataEndIndex:s}=n;if(!(e==null||t==null||a==null||i==null||r==null)){var c=a.slice(o,s+1);return Lk({radiusAxis:e,angleAxis:t,displayedData:c,dataKey:r,bandSize:i})}}),Ck=e(Lw()),wk=[`id`];function Tk(e,t){if(e==null)return{};var n,r,i=Ek(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function Ek(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}function Dk(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function Ok(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?Dk(Object(n),!0).forEach(function(t){kk(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Dk(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function kk(e,t,n){return(t=Ak(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Ak(e){var t=jk(e,`string`);return typeof t==`symbol`?t:t+``}function jk(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function Mk(){return Mk=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Mk.apply(null,arguments)}function Nk(e,t){return e&&e!==`none`?e:t}var Pk=e=>{var{dataKey:t,name:n,stroke:r,fill:i,legendType:a,hide:o}=e;return[{inactive:o,dataKey:t,type:a,color:Nk(r,i),value:bs(n,t),payload:e}]};function Fk(e){var{dataKey:t,stroke:n,strokeWidth:r,fill:i,name:a,hide:o,tooltipType:s}=e;return{dataDefinedOnItem:void 0,positions:void 0,settings:{stroke:n,strokeWidth:r,fill:i,nameKey:void 0,dataKey:t,name:bs(a,t),hide:o,type:s,color:Nk(n,i),unit:``}}}function Ik(e,t){return A.isValidElement(e)?A.cloneElement(e,t):typeof e==`function`?e(t):A.createElement(pT,Mk({},t,{className:c(`recharts-radar-dot`,typeof e==`boolean`?``:e.className)}))}function Lk(e){var{radiusAxis:t,angleAxis:n,displayedData:r,dataKey:i,bandSize:a}=e,{cx:o,cy:s}=n,c=!1,l=[],u=n.type===`number`?0:a??0;r.forEach((e,r)=>{var a=z(e,n.dataKey,r),d=z(e,i),f=n.scale(a)+u,p=Array.isArray(d)?(0,Ck.default)(d):d,m=k(p)?void 0:t.scale(p);Array.isArray(d)&&d.length>=2&&(c=!0),l.push(Ok(Ok({},R(o,s,m,f)),{},{name:a,value:d,cx:o,cy:s,radius:m,angle:f,payload:e}))});var d=[];return c&&l.forEach(e=>{if(Array.isArray(e.value)){var n=e.value[0],r=k(n)?void 0:t.scale(n);d.push(Ok(Ok({},e),{},{radius:r},R(o,s,r,e.angle)))}else d.push(e)}),{points:l,isRange:c,baseLinePoints:d}}function Rk(e){var{points:t,props:n}=e,{dot:r,dataKey:i}=n;if(!r)return null;var{id:a}=n,o=Tk(n,wk),s=j(o),c=M(r,!0),l=t.map((e,t)=>{var n=Ok(Ok(Ok({key:`dot-${t}`,r:3},s),c),{},{dataKey:i,cx:e.x,cy:e.y,index:t,payload:e});return Ik(r,n)});return A.createElement(N,{className:`recharts-radar-dots`},l)}function zk(e){var{showLabels:t,points:n,children:r}=e,i=n.map(e=>{var t={x:e.x,y:e.y,width:0,height:0};return Ok(Ok({},t),{},{value:e.value,payload:e.payload,parentViewBox:void 0,viewBox:t,fill:void 0})});return A.createElement(Kw,{value:t?i:null},r)}function Bk(e){var{points:t,baseLinePoints:n,props:r}=e;if(t==null)return null;var{shape:i,isRange:a,connectNulls:o}=r,s=e=>{var{onMouseEnter:t}=r;t&&t(r,e)},c=e=>{var{onMouseLeave:t}=r;t&&t(r,e)},l=A.isValidElement(i)?A.cloneElement(i,Ok(Ok({},r),{},{points:t})):typeof i==`function`?i(Ok(Ok({},r),{},{points:t})):A.createElement(dT,Mk({},M(r,!0),{onMouseEnter:s,onMouseLeave:c,points:t,baseLinePoints:a?n:null,connectNulls:o}));return A.createElement(N,{className:`recharts-radar-polygon`},l,A.createElement(Rk,{props:r,points:t}))}var Vk=(e,t,n)=>(r,i)=>{var a=e&&e[Math.floor(i*t)];return a?Ok(Ok({},r),{},{x:D(a.x,r.x,n),y:D(a.y,r.y,n)}):Ok(Ok({},r),{},{x:D(r.cx,r.x,n),y:D(r.cy,r.y,n)})};function Hk(e){var{props:t,previousPointsRef:n,previousBaseLinePointsRef:r}=e,{points:i,baseLinePoints:a,isAnimationActive:o,animationBegin:s,animationDuration:c,animationEasing:l,onAnimationEnd:u,onAnimationStart:d}=t,f=n.current,p=r.current,m=f&&f.length/i.length,h=p&&p.length/a.length,g=fu(t,`recharts-radar-`),[_,v]=(0,A.useState)(!1),y=!_,b=(0,A.useCallback)(()=>{typeof u==`function`&&u(),v(!1)},[u]),x=(0,A.useCallback)(()=>{typeof d==`function`&&d(),v(!0)},[d]);return A.createElement(zk,{showLabels:y,points:i},A.createElement(du,{animationId:g,begin:s,duration:c,isActive:o,easing:l,key:`radar-${g}`,onAnimationEnd:b,onAnimationStart:x},e=>{var o=e===1?i:i.map(Vk(f,m,e)),s=e===1?a:a?.map(Vk(p,h,e));return e>0&&(n.current=o,r.current=s),A.createElement(Bk,{points:o,baseLinePoints:s,props:t})}),A.createElement(Qw,{label:t.label}),t.children)}function Uk(e){var t=(0,A.useRef)(void 0),n=(0,A.useRef)(void 0);return A.createElement(Hk,{props:e,previousPointsRef:t,previousBaseLinePointsRef:n})}var Wk={angleAxisId:0,radiusAxisId:0,hide:!1,activeDot:!0,dot:!1,legendType:`rect`,isAnimationActive:!Yc.isSsr,animationBegin:0,animationDuration:1500,animationEasing:`ease`},Gk=class extends A.PureComponent{render(){var{hide:e,className:t,points:n}=this.props;if(e||n==null)return null;var r=c(`recharts-radar`,t);return A.createElement(A.Fragment,null,A.createElement(N,{className:r},A.createElement(Uk,this.props)),A.createElement(ik,{points:n,mainColor:Nk(this.props.stroke,this.props.fill),itemDataKey:this.props.dataKey,activeDot:this.props.activeDot}))}};function Kk(e){var t=B(),n=I(n=>Sk(n,e.radiusAxisId,e.angleAxisId,t,e.id));return A.createElement(Gk,Mk({},e,{points:n?.points,baseLinePoints:n?.baseLinePoints,isRange:n?.isRange}))}var qk=class extends A.PureComponent{render(){return A.createElement(HD,{id:this.props.id,type:`radar`},e=>A.createElement(A.Fragment,null,A.createElement(QD,{type:`radar`,id:e,data:void 0,dataKey:this.props.dataKey,hide:this.props.hide,angleAxisId:this.props.angleAxisId,radiusAxisId:this.props.radiusAxisId}),A.createElement(RD,{legendPayload:Pk(this.props)}),A.createElement(FD,{fn:Fk,args:this.props}),A.createElement(Kk,Mk({},this.props,{id:e}))))}};kk(qk,`displayName`,`Radar`),kk(qk,`defaultProps`,Wk);function Jk(){return Jk=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Jk.apply(null,arguments)}function Yk(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function Xk(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?Yk(Object(n),!0).forEach(function(t){Zk(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Yk(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function Zk(e,t,n){return(t=Qk(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Qk(e){var t=$k(e,`string`);return typeof t==`symbol`?t:t+``}function $k(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function eA(e){return typeof e==`string`?parseInt(e,10):e}function tA(e,t){var n=`${t.cx||e.cx}`,r=Number(n),i=`${t.cy||e.cy}`,a=Number(i);return Xk(Xk(Xk({},t),e),{},{cx:r,cy:a})}function nA(e){return A.createElement(jD,Jk({shapeType:`sector`,propTransformer:tA},e))}var rA=!0,iA=`Invariant failed`;function aA(e,t){if(!e){if(rA)throw Error(iA);var n=typeof t==`function`?t():t,r=n?`${iA}: ${n}`:iA;throw Error(r)}}var oA=[`x`,`y`];function sA(){return sA=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},sA.apply(null,arguments)}function cA(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function lA(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?cA(Object(n),!0).forEach(function(t){uA(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):cA(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function uA(e,t,n){return(t=dA(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function dA(e){var t=fA(e,`string`);return typeof t==`symbol`?t:t+``}function fA(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function pA(e,t){if(e==null)return{};var n,r,i=mA(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function mA(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}function hA(e,t){var{x:n,y:r}=e,i=pA(e,oA),a=`${n}`,o=parseInt(a,10),s=`${r}`,c=parseInt(s,10),l=`${t.height||i.height}`,u=parseInt(l,10),d=`${t.width||i.width}`,f=parseInt(d,10);return lA(lA(lA(lA(lA({},t),i),o?{x:o}:{}),c?{y:c}:{}),{},{height:u,width:f,name:t.name,radius:t.radius})}function gA(e){return A.createElement(jD,sA({shapeType:`rectangle`,propTransformer:hA,activeClassName:`recharts-active-bar`},e))}var _A=function(e){var t=arguments.length>1&&arguments[1]!==void 0?arguments[1]:0;return(n,r)=>{if(b(e))return e;var i=b(n)||k(n);return i?e(n,r):(!i&&aA(!1),t)}},vA=Ma({name:`errorBars`,initialState:{},reducers:{addErrorBar:(e,t)=>{var{itemId:n,errorBar:r}=t.payload;e[n]||(e[n]=[]),e[n].push(r)},replaceErrorBar:(e,t)=>{var{itemId:n,prev:r,next:i}=t.payload;e[n]&&(e[n]=e[n].map(e=>e.dataKey===r.dataKey&&e.direction===r.direction?i:e))},removeErrorBar:(e,t)=>{var{itemId:n,errorBar:r}=t.payload;e[n]&&(e[n]=e[n].filter(e=>e.dataKey!==r.dataKey||e.direction!==r.direction))}}}),{addErrorBar:yA,replaceErrorBar:bA,removeErrorBar:xA}=vA.actions,SA=vA.reducer,CA=[`children`];function wA(e,t){if(e==null)return{};var n,r,i=TA(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function TA(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}var EA=(0,A.createContext)({data:[],xAxisId:`xAxis-0`,yAxisId:`yAxis-0`,dataPointFormatter:()=>({x:0,y:0,value:0}),errorBarOffset:0});function DA(e){var{children:t}=e,n=wA(e,CA);return A.createElement(EA.Provider,{value:n},t)}var OA=()=>(0,A.useContext)(EA);function kA(e){var t=F(),n=UD(),r=(0,A.useRef)(null);return(0,A.useEffect)(()=>{n!=null&&(r.current===null?t(yA({itemId:n,errorBar:e})):r.current!==e&&t(bA({itemId:n,prev:r.current,next:e})),r.current=e)},[t,n,e]),(0,A.useEffect)(()=>()=>{r.current!=null&&(t(xA({itemId:n,errorBar:r.current})),r.current=null)},[t,n]),null}function AA(e,t){var n=I(t=>lv(t,e)),r=I(e=>fv(e,t)),i=n?.allowDataOverflow??sv.allowDataOverflow,a=r?.allowDataOverflow??uv.allowDataOverflow;return{needClip:i||a,needClipX:i,needClipY:a}}function jA(e){var{xAxisId:t,yAxisId:n,clipPathId:r}=e,i=JO(),{needClipX:a,needClipY:o,needClip:s}=AA(t,n);if(!s)return null;var{x:c,y:l,width:u,height:d}=i;return A.createElement(`clipPath`,{id:`clipPath-${r}`},A.createElement(`rect`,{x:a?c:c-u/2,y:o?l:l-d/2,width:a?u:u*2,height:o?d:d*2}))}var MA=[`onMouseEnter`,`onMouseLeave`,`onClick`],NA=[`value`,`background`,`tooltipPosition`],PA=[`id`],FA=[`onMouseEnter`,`onClick`,`onMouseLeave`];function IA(){return IA=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},IA.apply(null,arguments)}function LA(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function RA(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?LA(Object(n),!0).forEach(function(t){zA(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):LA(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function zA(e,t,n){return(t=BA(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function BA(e){var t=VA(e,`string`);return typeof t==`symbol`?t:t+``}function VA(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function HA(e,t){if(e==null)return{};var n,r,i=UA(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function UA(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}var WA=e=>{var{dataKey:t,name:n,fill:r,legendType:i,hide:a}=e;return[{inactive:a,dataKey:t,type:i,color:r,value:bs(n,t),payload:e}]};function GA(e){var{dataKey:t,stroke:n,strokeWidth:r,fill:i,name:a,hide:o,unit:s}=e;return{dataDefinedOnItem:void 0,positions:void 0,settings:{stroke:n,strokeWidth:r,fill:i,dataKey:t,nameKey:void 0,name:bs(a,t),hide:o,type:e.tooltipType,color:e.fill,unit:s}}}function KA(e){var t=I(Mx),{data:n,dataKey:r,background:i,allOtherBarProps:a}=e,{onMouseEnter:o,onMouseLeave:s,onClick:c}=a,l=HA(a,MA),u=MD(o,r),d=ND(s),f=PD(c,r);if(!i||n==null)return null;var p=M(i,!1);return A.createElement(A.Fragment,null,n.map((e,n)=>{var{value:a,background:o,tooltipPosition:s}=e,c=HA(e,NA);if(!o)return null;var m=u(e,n),h=d(e,n),g=f(e,n),_=RA(RA(RA(RA(RA({option:i,isActive:String(n)===t},c),{},{fill:`#eee`},o),p),le(l,e,n)),{},{onMouseEnter:m,onMouseLeave:h,onClick:g,dataKey:r,index:n,className:`recharts-bar-background-rectangle`});return A.createElement(gA,IA({key:`background-bar-${_.index}`},_))}))}function qA(e){var{showLabels:t,children:n,rects:r}=e,i=r?.map(e=>{var t={x:e.x,y:e.y,width:e.width,height:e.height};return RA(RA({},t),{},{value:e.value,payload:e.payload,parentViewBox:e.parentViewBox,viewBox:t,fill:e.fill})});return A.createElement(Kw,{value:t?i:void 0},n)}function JA(e){var{shape:t,activeBar:n,baseProps:r,entry:i,index:a,dataKey:o}=e,s=I(Mx),c=I(Px),l=n&&String(a)===s&&(c==null||o===c),u=l?n:t;return A.createElement(gA,IA({},r,i,{isActive:l,option:u,index:a,dataKey:o}))}function YA(e){var{shape:t,baseProps:n,entry:r,index:i,dataKey:a}=e;return A.createElement(gA,IA({},n,r,{isActive:!1,option:t,index:i,dataKey:a}))}function XA(e){var{data:t,props:n}=e,r=j(n),{id:i}=r,a=HA(r,PA),{shape:o,dataKey:s,activeBar:c}=n,{onMouseEnter:l,onClick:u,onMouseLeave:d}=n,f=HA(n,FA),p=MD(l,s),m=ND(d),h=PD(u,s);return t?A.createElement(A.Fragment,null,t.map((e,t)=>A.createElement(N,IA({className:`recharts-bar-rectangle`},le(f,e,t),{onMouseEnter:p(e,t),onMouseLeave:m(e,t),onClick:h(e,t),key:`rectangle-${e?.x}-${e?.y}-${e?.value}-${t}`}),c?A.createElement(JA,{shape:o,activeBar:c,baseProps:a,entry:e,index:t,dataKey:s}):A.createElement(YA,{shape:o,baseProps:a,entry:e,index:t,dataKey:s})))):null}function ZA(e){var{props:t,previousRectanglesRef:n}=e,{data:r,layout:i,isAnimationActive:a,animationBegin:o,animationDuration:s,animationEasing:c,onAnimationEnd:l,onAnimationStart:u}=t,d=n.current,f=fu(t,`recharts-bar-`),[p,m]=(0,A.useState)(!1),h=!p,g=(0,A.useCallback)(()=>{typeof l==`function`&&l(),m(!1)},[l]),_=(0,A.useCallback)(()=>{typeof u==`function`&&u(),m(!0)},[u]);return A.createElement(qA,{showLabels:h,rects:r},A.createElement(du,{animationId:f,begin:o,duration:s,isActive:a,easing:c,onAnimationEnd:g,onAnimationStart:_,key:f},e=>{var a=e===1?r:r?.map((t,n)=>{var r=d&&d[n];if(r)return RA(RA({},t),{},{x:D(r.x,t.x,e),y:D(r.y,t.y,e),width:D(r.width,t.width,e),height:D(r.height,t.height,e)});if(i===`horizontal`){var a=D(0,t.height,e);return RA(RA({},t),{},{y:t.y+t.height-a,height:a})}var o=D(0,t.width,e);return RA(RA({},t),{},{width:o})});return e>0&&(n.current=a??null),a==null?null:A.createElement(N,null,A.createElement(XA,{props:t,data:a}))}),A.createElement(Qw,{label:t.label}),t.children)}function QA(e){var t=(0,A.useRef)(null);return A.createElement(ZA,{previousRectanglesRef:t,props:e})}var $A=0,ej=(e,t)=>{var n=Array.isArray(e.value)?e.value[1]:e.value;return{x:e.x,y:e.y,value:n,errorVal:z(e,t)}},tj=class extends A.PureComponent{render(){var{hide:e,data:t,dataKey:n,className:r,xAxisId:i,yAxisId:a,needClip:o,background:s,id:l}=this.props;if(e||t==null)return null;var u=c(`recharts-bar`,r),d=l;return A.createElement(N,{className:u,id:l},o&&A.createElement(`defs`,null,A.createElement(jA,{clipPathId:d,xAxisId:i,yAxisId:a})),A.createElement(N,{className:`recharts-bar-rectangles`,clipPath:o?`url(#clipPath-${d})`:void 0},A.createElement(KA,{data:t,dataKey:n,background:s,allOtherBarProps:this.props}),A.createElement(QA,this.props)))}},nj={activeBar:!1,animationBegin:0,animationDuration:400,animationEasing:`ease`,hide:!1,isAnimationActive:!Yc.isSsr,legendType:`rect`,minPointSize:$A,xAxisId:0,yAxisId:0};function rj(e){var{xAxisId:t,yAxisId:n,hide:r,legendType:i,minPointSize:a,activeBar:o,animationBegin:s,animationDuration:c,animationEasing:l,isAnimationActive:u}=e,{needClip:d}=AA(t,n),f=nc(),p=B(),m=ve(e.children,vC),h=I(r=>Ij(r,t,n,p,e.id,m));if(f!==`vertical`&&f!==`horizontal`)return null;var g,_=h?.[0];return g=_==null||_.height==null||_.width==null?0:f===`vertical`?_.height/2:_.width/2,A.createElement(DA,{xAxisId:t,yAxisId:n,data:h,dataPointFormatter:ej,errorBarOffset:g},A.createElement(tj,IA({},e,{layout:f,needClip:d,data:h,xAxisId:t,yAxisId:n,hide:r,legendType:i,minPointSize:a,activeBar:o,animationBegin:s,animationDuration:c,animationEasing:l,isAnimationActive:u})))}function ij(e){var{layout:t,barSettings:{dataKey:n,minPointSize:r},pos:i,bandSize:a,xAxis:o,yAxis:s,xAxisTicks:c,yAxisTicks:l,stackedData:u,displayedData:d,offset:f,cells:p,parentViewBox:m}=e,h=t===`horizontal`?s:o,g=u?h.scale.domain():null,y=fs({numericAxis:h});return d.map((e,d)=>{var h,b,x,S,C,w;u?h=os(u[d],g):(h=z(e,n),Array.isArray(h)||(h=[y,h]));var T=_A(r,$A)(h[1],d);if(t===`horizontal`){var[E,D]=[s.scale(h[0]),s.scale(h[1])];b=ds({axis:o,ticks:c,bandSize:a,offset:i.offset,entry:e,index:d}),x=D??E??void 0,S=i.size;var O=E-D;if(C=v(O)?0:O,w={x:b,y:f.top,width:S,height:f.height},Math.abs(T)>0&&Math.abs(C)<Math.abs(T)){var ee=_(C||T)*(Math.abs(T)-Math.abs(C));x-=ee,C+=ee}}else{var[k,te]=[o.scale(h[0]),o.scale(h[1])];if(b=k,x=ds({axis:s,ticks:l,bandSize:a,offset:i.offset,entry:e,index:d}),S=te-k,C=i.size,w={x:f.left,y:x,width:f.width,height:C},Math.abs(T)>0&&Math.abs(S)<Math.abs(T)){var ne=_(S||T)*(Math.abs(T)-Math.abs(S));S+=ne}}return b==null||x==null||S==null||C==null?null:RA(RA({},e),{},{x:b,y:x,width:S,height:C,value:u?h:h[1],payload:e,background:w,tooltipPosition:{x:b+S/2,y:x+C/2},parentViewBox:m},p&&p[d]&&p[d].props)}).filter(Boolean)}function aj(e){var t=H(e,nj),n=B();return A.createElement(HD,{id:t.id,type:`bar`},e=>A.createElement(A.Fragment,null,A.createElement(LD,{legendPayload:WA(t)}),A.createElement(FD,{fn:GA,args:t}),A.createElement(ZD,{type:`bar`,id:e,data:void 0,xAxisId:t.xAxisId,yAxisId:t.yAxisId,zAxisId:0,dataKey:t.dataKey,stackId:ls(t.stackId),hide:t.hide,barSize:t.barSize,minPointSize:t.minPointSize,maxBarSize:t.maxBarSize,isPanorama:n}),A.createElement(rj,IA({},t,{id:e}))))}var oj=A.memo(aj);oj.displayName=`Bar`;function sj(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function cj(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?sj(Object(n),!0).forEach(function(t){lj(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):sj(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function lj(e,t,n){return(t=uj(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function uj(e){var t=dj(e,`string`);return typeof t==`symbol`?t:t+``}function dj(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}var fj=(e,t)=>t,pj=(e,t,n)=>n,mj=(e,t,n,r)=>r,hj=L([yv,(e,t,n,r,i)=>i],(e,t)=>e.filter(e=>e.type===`bar`).find(e=>e.id===t)),gj=L([hj],e=>e?.maxBarSize),_j=(e,t,n,r,i,a)=>a,vj=(e,t,n)=>{var r=n??e;if(!k(r))return w(r,t,0)},yj=L([V,yv,fj,pj,mj],(e,t,n,r,i)=>t.filter(t=>e===`horizontal`?t.xAxisId===n:t.yAxisId===r).filter(e=>e.isPanorama===i).filter(e=>e.hide===!1).filter(e=>e.type===`bar`)),bj=(e,t,n,r)=>V(e)===`horizontal`?Lv(e,`yAxis`,n,r):Lv(e,`xAxis`,t,r),xj=(e,t,n)=>V(e)===`horizontal`?Yy(e,`xAxis`,t):Yy(e,`yAxis`,n),Sj=(e,t,n)=>{var r={},i=e.filter($_),a=e.filter(e=>e.stackId==null),o=i.reduce((e,t)=>(e[t.stackId]||(e[t.stackId]=[]),e[t.stackId].push(t),e),r),s=Object.entries(o).map(e=>{var[r,i]=e,a=i.map(e=>e.dataKey),o=vj(t,n,i[0].barSize);return{stackId:r,dataKeys:a,barSize:o}}),c=a.map(e=>{var r=[e.dataKey].filter(e=>e!=null),i=vj(t,n,e.barSize);return{stackId:void 0,dataKeys:r,barSize:i}});return[...s,...c]},Cj=L([yj,S_,xj],Sj),wj=(e,t,n,r,i)=>{var a=hj(e,t,n,r,i);if(a!=null){var o=V(e),s=y_(e),{maxBarSize:c}=a,l=k(c)?s:c,u,d;return o===`horizontal`?(u=ab(e,`xAxis`,t,r),d=ib(e,`xAxis`,t,r)):(u=ab(e,`yAxis`,n,r),d=ib(e,`yAxis`,n,r)),vs(u,d,!0)??l??0}},Tj=(e,t,n,r)=>{var i=V(e),a,o;return i===`horizontal`?(a=ab(e,`xAxis`,t,r),o=ib(e,`xAxis`,t,r)):(a=ab(e,`yAxis`,n,r),o=ib(e,`yAxis`,n,r)),vs(a,o)};function Ej(e,t,n,r,i){var a=r.length;if(!(a<1)){var o=w(e,n,0,!0),s,c=[];if(Zc(r[0].barSize)){var l=!1,u=n/a,d=r.reduce((e,t)=>e+(t.barSize||0),0);d+=(a-1)*o,d>=n&&(d-=(a-1)*o,o=0),d>=n&&u>0&&(l=!0,u*=.9,d=a*u);var f={offset:((n-d)/2>>0)-o,size:0};s=r.reduce((e,t)=>{var n={stackId:t.stackId,dataKeys:t.dataKeys,position:{offset:f.offset+f.size+o,size:l?u:t.barSize??0}},r=[...e,n];return f=r[r.length-1].position,r},c)}else{var p=w(t,n,0,!0);n-2*p-(a-1)*o<=0&&(o=0);var m=(n-2*p-(a-1)*o)/a;m>1&&(m>>=0);var h=Zc(i)?Math.min(m,i):m;s=r.reduce((e,t,n)=>[...e,{stackId:t.stackId,dataKeys:t.dataKeys,position:{offset:p+(m+o)*n+(m-h)/2,size:h}}],c)}return s}}var Dj=(e,t,n,r,i,a,o)=>{var s=k(o)?t:o,c=Ej(n,r,i===a?a:i,e,s);return i!==a&&c!=null&&(c=c.map(e=>cj(cj({},e),{},{position:cj(cj({},e.position),{},{offset:e.position.offset-i/2})}))),c},Oj=L([Cj,y_,b_,x_,wj,Tj,gj],Dj),kj=(e,t,n,r)=>ab(e,`xAxis`,t,r),Aj=(e,t,n,r)=>ab(e,`yAxis`,n,r),jj=(e,t,n,r)=>ib(e,`xAxis`,t,r),Mj=(e,t,n,r)=>ib(e,`yAxis`,n,r),Nj=L([Oj,hj],(e,t)=>{if(!(e==null||t==null)){var n=e.find(e=>e.stackId===t.stackId&&t.dataKey!=null&&e.dataKeys.includes(t.dataKey));if(n!=null)return n.position}}),Pj=(e,t)=>{var n=q_(t);if(!(!e||n==null||t==null)){var{stackId:r}=t;if(r!=null){var i=e[r];if(i){var{stackedData:a}=i;if(a)return a.find(e=>e.key===n)}}}},Fj=L([bj,hj],Pj),Ij=L([Us,Gs,kj,Aj,jj,Mj,Nj,V,yg,Tj,Fj,hj,_j],(e,t,n,r,i,a,o,s,c,l,u,d,f)=>{var{chartData:p,dataStartIndex:m,dataEndIndex:h}=c;if(!(d==null||o==null||t==null||s!==`horizontal`&&s!==`vertical`||n==null||r==null||i==null||a==null||l==null)){var{data:g}=d,_=g!=null&&g.length>0?g:p?.slice(m,h+1);if(_!=null)return ij({layout:s,barSettings:d,pos:o,parentViewBox:t,bandSize:l,xAxis:n,yAxis:r,xAxisTicks:i,yAxisTicks:a,stackedData:u,displayedData:_,offset:e,cells:f})}});function Lj(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function Rj(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?Lj(Object(n),!0).forEach(function(t){zj(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Lj(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function zj(e,t,n){return(t=Bj(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Bj(e){var t=Vj(e,`string`);return typeof t==`symbol`?t:t+``}function Vj(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}var Hj=L([(e,t)=>I_(e,t),(e,t)=>OT(e,`radiusAxis`,t)],(e,t)=>{if(!(e==null||t==null))return Rj(Rj({},e),{},{scale:t})}),Uj=(e,t,n,r)=>jT(e,`radiusAxis`,t,r),Wj=L([(e,t,n)=>F_(e,n),(e,t,n)=>OT(e,`angleAxis`,n)],(e,t)=>{if(!(e==null||t==null))return Rj(Rj({},e),{},{scale:t})}),Gj=(e,t,n,r)=>AT(e,`angleAxis`,n,r),Kj=L([mT,(e,t,n,r)=>r],(e,t)=>{if(e.some(e=>e.type===`radialBar`&&t.dataKey===e.dataKey&&t.stackId===e.stackId))return t}),qj=L([V,Hj,Uj,Wj,Gj],(e,t,n,r,i)=>$o(e,`radiusAxis`)?vs(t,n,!1):vs(r,i,!1)),Jj=L([Wj,Hj,V],(e,t,n)=>{var r=n===`radial`?e:t;if(!(r==null||r.scale==null))return fs({numericAxis:r})}),Yj=(e,t,n,r,i)=>i,Xj=(e,t,n,r,i)=>n,Zj=(e,t,n,r,i)=>t,Qj=(e,t,n,r,i)=>r.maxBarSize,$j=L([V,mT,Xj,Zj],(e,t,n,r)=>t.filter(t=>e===`centric`?t.angleAxisId===n:t.radiusAxisId===r).filter(e=>e.hide===!1).filter(e=>e.type===`radialBar`)),eM=L([$j,S_,()=>void 0],Sj),tM=L([V,y_,Wj,Gj,Hj,Uj,Qj],(e,t,n,r,i,a,o)=>{var s=k(o)?t:o;return e===`centric`?vs(n,r,!0)??s??0:vs(i,a,!0)??s??0}),nM=L([eM,y_,b_,x_,tM,qj,Qj],Dj),rM=L([nM,Kj],(e,t)=>{if(!(e==null||t==null)){var n=e.find(e=>e.stackId===t.stackId&&t.dataKey!=null&&e.dataKeys.includes(t.dataKey));if(n!=null)return n.position}}),iM=L([gT],e=>e.filter(e=>e.type===`radialBar`).filter($_)),aM=L([iM,vg,X_],Q_),oM=L([aM,iM,C_],Iv),sM=L([(e,t,n)=>V(e)===`centric`?oM(e,`radiusAxis`,t):oM(e,`angleAxis`,n),Kj],Pj),cM=L([Wj,Gj,Hj,Uj,_g,Kj,qj,V,Jj,G_,Yj,rM,sM],(e,t,n,r,i,a,o,s,c,l,u,d,f)=>{var{chartData:p,dataStartIndex:m,dataEndIndex:h}=i;if(a==null||n==null||e==null||p==null||o==null||d==null||s!==`centric`&&s!==`radial`||r==null)return[];var{dataKey:g,minPointSize:_}=a,{cx:v,cy:y,startAngle:b,endAngle:x}=l,S=p.slice(m,h+1),C=f?(s===`centric`?n:e).scale.domain():null;return jM({angleAxis:e,angleAxisTicks:t,bandSize:o,baseValue:c,cells:u,cx:v,cy:y,dataKey:g,dataStartIndex:m,displayedData:S,endAngle:x,layout:s,minPointSize:_,pos:d,radiusAxis:n,radiusAxisTicks:r,stackedData:f,stackedDomain:C,startAngle:b})}),lM=L([vg,(e,t)=>t],(e,t)=>{var{chartData:n,dataStartIndex:r,dataEndIndex:i}=e;if(n==null)return[];var a=n.slice(r,i+1);return a.length===0?[]:a.map(e=>({type:t,value:e.name,color:e.fill,payload:e}))}),uM=[`shape`,`activeShape`,`cornerRadius`,`id`],dM=[`onMouseEnter`,`onClick`,`onMouseLeave`],fM=[`value`,`background`];function pM(){return pM=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},pM.apply(null,arguments)}function mM(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function hM(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?mM(Object(n),!0).forEach(function(t){gM(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):mM(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function gM(e,t,n){return(t=_M(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function _M(e){var t=vM(e,`string`);return typeof t==`symbol`?t:t+``}function vM(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function yM(e,t){if(e==null)return{};var n,r,i=bM(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function bM(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}var xM=[];function SM(e){var{showLabels:t,sectors:n,children:r}=e,i=n.map(e=>({value:e.value,payload:e.payload,parentViewBox:void 0,clockWise:!1,viewBox:{cx:e.cx,cy:e.cy,innerRadius:e.innerRadius,outerRadius:e.outerRadius,startAngle:e.startAngle,endAngle:e.endAngle,clockWise:!1},fill:e.fill}));return A.createElement(Jw,{value:t?i:null},r)}function CM(e){var{sectors:t,allOtherRadialBarProps:n,showLabels:r}=e,{shape:i,activeShape:a,cornerRadius:o,id:s}=n,c=yM(n,uM),l=j(c),u=I(Mx),{onMouseEnter:d,onClick:f,onMouseLeave:p}=n,m=yM(n,dM),h=MD(d,n.dataKey),g=ND(p),_=PD(f,n.dataKey);return t==null?null:A.createElement(SM,{showLabels:r,sectors:t},t.map((e,t)=>{var n=a&&u===String(t),r=h(e,t),s=g(e,t),d=_(e,t),f=hM(hM(hM(hM({},l),{},{cornerRadius:eA(o)},e),le(m,e,t)),{},{onMouseEnter:r,onMouseLeave:s,onClick:d,key:`sector-${t}`,className:`recharts-radial-bar-sector ${e.className}`,forceCornerRadius:c.forceCornerRadius,cornerIsExternal:c.cornerIsExternal,isActive:n,option:n?a:i});return A.createElement(nA,f)}),A.createElement(Qw,{label:n.label}),n.children)}function wM(e){var{props:t,previousSectorsRef:n}=e,{data:r,isAnimationActive:i,animationBegin:a,animationDuration:o,animationEasing:s,onAnimationEnd:c,onAnimationStart:l}=t,u=fu(t,`recharts-radialbar-`),d=n.current,[f,p]=(0,A.useState)(!1),m=(0,A.useCallback)(()=>{typeof c==`function`&&c(),p(!1)},[c]),h=(0,A.useCallback)(()=>{typeof l==`function`&&l(),p(!0)},[l]);return A.createElement(du,{animationId:u,begin:a,duration:o,isActive:i,easing:s,onAnimationStart:h,onAnimationEnd:m,key:u},e=>{var i=e===1?r:(r??xM).map((t,n)=>{var r=d&&d[n];if(r){var i=E(r.startAngle,t.startAngle),a=E(r.endAngle,t.endAngle);return hM(hM({},t),{},{startAngle:i(e),endAngle:a(e)})}var{endAngle:o,startAngle:s}=t,c=E(s,o);return hM(hM({},t),{},{endAngle:c(e)})});return e>0&&(n.current=i??null),A.createElement(N,null,A.createElement(CM,{sectors:i??xM,allOtherRadialBarProps:t,showLabels:!f}))})}function TM(e){var t=(0,A.useRef)(null);return A.createElement(wM,{props:e,previousSectorsRef:t})}function EM(e){var t=I(t=>lM(t,e.legendType));return A.createElement(RD,{legendPayload:t??[]})}function DM(e){var{dataKey:t,data:n,stroke:r,strokeWidth:i,name:a,hide:o,fill:s,tooltipType:c}=e;return{dataDefinedOnItem:n,positions:void 0,settings:{stroke:r,strokeWidth:i,fill:s,nameKey:void 0,dataKey:t,name:bs(a,t),hide:o,type:c,color:s,unit:``}}}var OM=class extends A.PureComponent{renderBackground(e){if(e==null)return null;var{cornerRadius:t}=this.props,n=M(this.props.background,!1);return e.map((e,r)=>{var{value:i,background:a}=e,o=yM(e,fM);if(!a)return null;var s=hM(hM(hM(hM(hM({cornerRadius:eA(t)},o),{},{fill:`#eee`},a),n),le(this.props,e,r)),{},{index:r,key:`sector-${r}`,className:c(`recharts-radial-bar-background-sector`,n?.className),option:a,isActive:!1});return A.createElement(nA,s)})}render(){var{hide:e,data:t,className:n,background:r}=this.props;if(e)return null;var i=c(`recharts-area`,n);return A.createElement(N,{className:i},r&&A.createElement(N,{className:`recharts-radial-bar-background`},this.renderBackground(t)),A.createElement(N,{className:`recharts-radial-bar-sectors`},A.createElement(TM,this.props)))}};function kM(e){var t=ve(e.children,vC),n={data:void 0,hide:!1,id:e.id,dataKey:e.dataKey,minPointSize:e.minPointSize,stackId:ls(e.stackId),maxBarSize:e.maxBarSize,barSize:e.barSize,type:`radialBar`,angleAxisId:e.angleAxisId,radiusAxisId:e.radiusAxisId},r=I(r=>cM(r,e.radiusAxisId,e.angleAxisId,n,t))??xM;return A.createElement(A.Fragment,null,A.createElement(FD,{fn:DM,args:hM(hM({},e),{},{data:r})}),A.createElement(OM,pM({},e,{data:r})))}var AM={angleAxisId:0,radiusAxisId:0,minPointSize:0,hide:!1,legendType:`rect`,data:[],isAnimationActive:!Yc.isSsr,animationBegin:0,animationDuration:1500,animationEasing:`ease`,forceCornerRadius:!1,cornerIsExternal:!1};function jM(e){var{displayedData:t,stackedData:n,dataStartIndex:r,stackedDomain:i,dataKey:a,baseValue:o,layout:s,radiusAxis:c,radiusAxisTicks:l,bandSize:u,pos:d,angleAxis:f,minPointSize:p,cx:m,cy:h,angleAxisTicks:g,cells:v,startAngle:y,endAngle:b}=e;return(t??[]).map((e,t)=>{var x,S,C,w,T,E;if(n?x=os(n[r+t],i):(x=z(e,a),Array.isArray(x)||(x=[o,x])),s===`radial`){S=ds({axis:c,ticks:l,bandSize:u,offset:d.offset,entry:e,index:t}),T=f.scale(x[1]),w=f.scale(x[0]),C=(S??0)+d.size;var D=T-w;if(Math.abs(p)>0&&Math.abs(D)<Math.abs(p)){var O=_(D||p)*(Math.abs(p)-Math.abs(D));T+=O}E={background:{cx:m,cy:h,innerRadius:S,outerRadius:C,startAngle:y,endAngle:b}}}else{S=c.scale(x[0]),C=c.scale(x[1]),w=ds({axis:f,ticks:g,bandSize:u,offset:d.offset,entry:e,index:t}),T=(w??0)+d.size;var ee=C-S;if(Math.abs(p)>0&&Math.abs(ee)<Math.abs(p)){var k=_(ee||p)*(Math.abs(p)-Math.abs(ee));C+=k}}return hM(hM(hM({},e),E),{},{payload:e,value:n?x:x[1],cx:m,cy:h,innerRadius:S,outerRadius:C,startAngle:w,endAngle:T},v&&v[t]&&v[t].props)})}var MM=class extends A.PureComponent{render(){return A.createElement(HD,{id:this.props.id,type:`radialBar`},e=>A.createElement(A.Fragment,null,A.createElement(QD,{type:`radialBar`,id:e,data:void 0,dataKey:this.props.dataKey,hide:this.props.hide??AM.hide,angleAxisId:this.props.angleAxisId??AM.angleAxisId,radiusAxisId:this.props.radiusAxisId??AM.radiusAxisId,stackId:ls(this.props.stackId),barSize:this.props.barSize,minPointSize:this.props.minPointSize,maxBarSize:this.props.maxBarSize}),A.createElement(EM,this.props),A.createElement(kM,pM({},this.props,{id:e}))))}};gM(MM,`displayName`,`RadialBar`),gM(MM,`defaultProps`,AM);function NM(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function PM(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?NM(Object(n),!0).forEach(function(t){FM(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):NM(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function FM(e,t,n){return(t=IM(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function IM(e){var t=LM(e,`string`);return typeof t==`symbol`?t:t+``}function LM(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}var RM=[`Webkit`,`Moz`,`O`,`ms`],zM=(e,t)=>{if(e){var n=e.replace(/(\w)/,e=>e.toUpperCase()),r=RM.reduce((e,r)=>PM(PM({},e),{},{[r+n]:t}),{});return r[e]=t,r}},BM=e=>{var{chartData:t}=e,n=F(),r=B();return(0,A.useEffect)(()=>r?()=>{}:(n(AS(t)),()=>{n(AS(void 0))}),[t,n,r]),null},VM=e=>{var{computedData:t}=e,n=F();return(0,A.useEffect)(()=>(n(MS(t)),()=>{n(AS(void 0))}),[t,n]),null},HM=e=>e.chartData.chartData,UM=()=>I(HM),WM=e=>{var{dataStartIndex:t,dataEndIndex:n}=e.chartData;return{startIndex:t,endIndex:n}},GM=()=>I(WM),KM=(0,A.createContext)(()=>{}),qM={x:0,y:0,width:0,height:0,padding:{top:0,right:0,bottom:0,left:0}},JM=Ma({name:`brush`,initialState:qM,reducers:{setBrushSettings(e,t){return t.payload==null?qM:t.payload}}}),{setBrushSettings:YM}=JM.actions,XM=JM.reducer,ZM=e(Pu());function QM(){return QM=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},QM.apply(null,arguments)}function $M(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function eN(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?$M(Object(n),!0).forEach(function(t){tN(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):$M(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function tN(e,t,n){return(t=nN(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function nN(e){var t=rN(e,`string`);return typeof t==`symbol`?t:t+``}function rN(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function iN(e){var{x:t,y:n,width:r,height:i,stroke:a}=e,o=Math.floor(n+i/2)-1;return A.createElement(A.Fragment,null,A.createElement(`rect`,{x:t,y:n,width:r,height:i,fill:a,stroke:`none`}),A.createElement(`line`,{x1:t+1,y1:o,x2:t+r-1,y2:o,fill:`none`,stroke:`#fff`}),A.createElement(`line`,{x1:t+1,y1:o+2,x2:t+r-1,y2:o+2,fill:`none`,stroke:`#fff`}))}function aN(e){var{travellerProps:t,travellerType:n}=e;return A.isValidElement(n)?A.cloneElement(n,t):typeof n==`function`?n(t):A.createElement(iN,t)}function oN(e){var{otherProps:t,travellerX:n,id:r,onMouseEnter:i,onMouseLeave:a,onMouseDown:o,onTouchStart:s,onTravellerMoveKeyboard:c,onFocus:l,onBlur:u}=e,{y:d,x:f,travellerWidth:p,height:m,traveller:h,ariaLabel:g,data:_,startIndex:v,endIndex:y}=t,b=Math.max(n,f),x=eN(eN({},j(t)),{},{x:b,y:d,width:p,height:m}),S=g||`Min value: ${_[v]?.name}, Max value: ${_[y]?.name}`;return A.createElement(N,{tabIndex:0,role:`slider`,"aria-label":S,"aria-valuenow":n,className:`recharts-brush-traveller`,onMouseEnter:i,onMouseLeave:a,onMouseDown:o,onTouchStart:s,onKeyDown:e=>{[`ArrowLeft`,`ArrowRight`].includes(e.key)&&(e.preventDefault(),e.stopPropagation(),c(e.key===`ArrowRight`?1:-1,r))},onFocus:l,onBlur:u,style:{cursor:`col-resize`}},A.createElement(aN,{travellerType:h,travellerProps:x}))}function sN(e){var{index:t,data:n,tickFormatter:r,dataKey:i}=e,a=z(n[t],i,t);return typeof r==`function`?r(a,t):a}function cN(e,t){for(var n=e.length,r=0,i=n-1;i-r>1;){var a=Math.floor((r+i)/2);e[a]>t?i=a:r=a}return t>=e[i]?i:r}function lN(e){var{startX:t,endX:n,scaleValues:r,gap:i,data:a}=e,o=a.length-1,s=Math.min(t,n),c=Math.max(t,n),l=cN(r,s),u=cN(r,c);return{startIndex:l-l%i,endIndex:u===o?o:u-u%i}}function uN(e){var{x:t,y:n,width:r,height:i,fill:a,stroke:o}=e;return A.createElement(`rect`,{stroke:o,fill:a,x:t,y:n,width:r,height:i})}function dN(e){var{startIndex:t,endIndex:n,y:r,height:i,travellerWidth:a,stroke:o,tickFormatter:s,dataKey:c,data:l,startX:u,endX:d}=e,f=5,p={pointerEvents:`none`,fill:o};return A.createElement(N,{className:`recharts-brush-texts`},A.createElement(sw,QM({textAnchor:`end`,verticalAnchor:`middle`,x:Math.min(u,d)-f,y:r+i/2},p),sN({index:t,tickFormatter:s,dataKey:c,data:l})),A.createElement(sw,QM({textAnchor:`start`,verticalAnchor:`middle`,x:Math.max(u,d)+a+f,y:r+i/2},p),sN({index:n,tickFormatter:s,dataKey:c,data:l})))}function fN(e){var{y:t,height:n,stroke:r,travellerWidth:i,startX:a,endX:o,onMouseEnter:s,onMouseLeave:c,onMouseDown:l,onTouchStart:u}=e,d=Math.min(a,o)+i,f=Math.max(Math.abs(o-a)-i,0);return A.createElement(`rect`,{className:`recharts-brush-slide`,onMouseEnter:s,onMouseLeave:c,onMouseDown:l,onTouchStart:u,style:{cursor:`move`},stroke:`none`,fill:r,fillOpacity:.2,x:d,y:t,width:f,height:n})}function pN(e){var{x:t,y:n,width:r,height:i,data:a,children:o,padding:s}=e;if(A.Children.count(o)!==1)return null;var c=A.Children.only(o);return c?A.cloneElement(c,{x:t,y:n,width:r,height:i,margin:s,compact:!0,data:a}):null}var mN=e=>{var{data:t,startIndex:n,endIndex:r,x:i,width:a,travellerWidth:o}=e;if(!t||!t.length)return{};var s=t.length,c=_d().domain((0,ZM.default)(0,s)).range([i,i+a-o]),l=c.domain().map(e=>c(e));return{isTextActive:!1,isSlideMoving:!1,isTravellerMoving:!1,isTravellerFocused:!1,startX:c(n),endX:c(r),scale:c,scaleValues:l}},hN=e=>e.changedTouches&&!!e.changedTouches.length,gN=class extends A.PureComponent{constructor(e){super(e),tN(this,`handleDrag`,e=>{this.leaveTimer&&=(clearTimeout(this.leaveTimer),null),this.state.isTravellerMoving?this.handleTravellerMove(e):this.state.isSlideMoving&&this.handleSlideDrag(e)}),tN(this,`handleTouchMove`,e=>{e.changedTouches!=null&&e.changedTouches.length>0&&this.handleDrag(e.changedTouches[0])}),tN(this,`handleDragEnd`,()=>{this.setState({isTravellerMoving:!1,isSlideMoving:!1},()=>{var{endIndex:e,onDragEnd:t,startIndex:n}=this.props;t?.({endIndex:e,startIndex:n})}),this.detachDragEndListener()}),tN(this,`handleLeaveWrapper`,()=>{(this.state.isTravellerMoving||this.state.isSlideMoving)&&(this.leaveTimer=window.setTimeout(this.handleDragEnd,this.props.leaveTimeOut))}),tN(this,`handleEnterSlideOrTraveller`,()=>{this.setState({isTextActive:!0})}),tN(this,`handleLeaveSlideOrTraveller`,()=>{this.setState({isTextActive:!1})}),tN(this,`handleSlideDragStart`,e=>{var t=hN(e)?e.changedTouches[0]:e;this.setState({isTravellerMoving:!1,isSlideMoving:!0,slideMoveStartX:t.pageX}),this.attachDragEndListener()}),tN(this,`handleTravellerMoveKeyboard`,(e,t)=>{var{data:n,gap:r,startIndex:i,endIndex:a}=this.props,{scaleValues:o,startX:s,endX:c}=this.state;if(o!=null){var l=-1;if(t===`startX`?l=i:t===`endX`&&(l=a),!(l<0||l>=n.length)){var u=l+e;if(!(u===-1||u>=o.length)){var d=o[u];t===`startX`&&d>=c||t===`endX`&&d<=s||this.setState({[t]:d},()=>{this.props.onChange(lN({startX:this.state.startX,endX:this.state.endX,data:n,gap:r,scaleValues:o}))})}}}}),this.travellerDragStartHandlers={startX:this.handleTravellerDragStart.bind(this,`startX`),endX:this.handleTravellerDragStart.bind(this,`endX`)},this.state={brushMoveStartX:0,movingTravellerId:void 0,endX:0,startX:0,slideMoveStartX:0}}static getDerivedStateFromProps(e,t){var{data:n,width:r,x:i,travellerWidth:a,startIndex:o,endIndex:s,startIndexControlledFromProps:c,endIndexControlledFromProps:l}=e;if(n!==t.prevData)return eN({prevData:n,prevTravellerWidth:a,prevX:i,prevWidth:r},n&&n.length?mN({data:n,width:r,x:i,travellerWidth:a,startIndex:o,endIndex:s}):{scale:void 0,scaleValues:void 0});var u=t.scale;if(u&&(r!==t.prevWidth||i!==t.prevX||a!==t.prevTravellerWidth)){u.range([i,i+r-a]);var d=u.domain().map(e=>u(e)).filter(e=>e!=null);return{prevData:n,prevTravellerWidth:a,prevX:i,prevWidth:r,startX:u(e.startIndex),endX:u(e.endIndex),scaleValues:d}}if(t.scale&&!t.isSlideMoving&&!t.isTravellerMoving&&!t.isTravellerFocused&&!t.isTextActive){if(c!=null&&t.prevStartIndexControlledFromProps!==c)return{startX:t.scale(c),prevStartIndexControlledFromProps:c};if(l!=null&&t.prevEndIndexControlledFromProps!==l)return{endX:t.scale(l),prevEndIndexControlledFromProps:l}}return null}componentWillUnmount(){this.leaveTimer&&=(clearTimeout(this.leaveTimer),null),this.detachDragEndListener()}attachDragEndListener(){window.addEventListener(`mouseup`,this.handleDragEnd,!0),window.addEventListener(`touchend`,this.handleDragEnd,!0),window.addEventListener(`mousemove`,this.handleDrag,!0)}detachDragEndListener(){window.removeEventListener(`mouseup`,this.handleDragEnd,!0),window.removeEventListener(`touchend`,this.handleDragEnd,!0),window.removeEventListener(`mousemove`,this.handleDrag,!0)}handleSlideDrag(e){var{slideMoveStartX:t,startX:n,endX:r,scaleValues:i}=this.state;if(i!=null){var{x:a,width:o,travellerWidth:s,startIndex:c,endIndex:l,onChange:u,data:d,gap:f}=this.props,p=e.pageX-t;p>0?p=Math.min(p,a+o-s-r,a+o-s-n):p<0&&(p=Math.max(p,a-n,a-r));var m=lN({startX:n+p,endX:r+p,data:d,gap:f,scaleValues:i});(m.startIndex!==c||m.endIndex!==l)&&u&&u(m),this.setState({startX:n+p,endX:r+p,slideMoveStartX:e.pageX})}}handleTravellerDragStart(e,t){var n=hN(t)?t.changedTouches[0]:t;this.setState({isSlideMoving:!1,isTravellerMoving:!0,movingTravellerId:e,brushMoveStartX:n.pageX}),this.attachDragEndListener()}handleTravellerMove(e){var{brushMoveStartX:t,movingTravellerId:n,endX:r,startX:i,scaleValues:a}=this.state;if(n!=null){var o=this.state[n],{x:s,width:c,travellerWidth:l,onChange:u,gap:d,data:f}=this.props,p={startX:this.state.startX,endX:this.state.endX,data:f,gap:d,scaleValues:a},m=e.pageX-t;m>0?m=Math.min(m,s+c-l-o):m<0&&(m=Math.max(m,s-o)),p[n]=o+m;var h=lN(p),{startIndex:g,endIndex:_}=h,v=()=>{var e=f.length-1;return n===`startX`&&(r>i?g%d===0:_%d===0)||r<i&&_===e||n===`endX`&&(r>i?_%d===0:g%d===0)||r>i&&_===e};this.setState({[n]:o+m,brushMoveStartX:e.pageX},()=>{u&&v()&&u(h)})}}render(){var{data:e,className:t,children:n,x:r,y:i,dy:a,width:o,height:s,alwaysShowText:l,fill:u,stroke:d,startIndex:f,endIndex:p,travellerWidth:m,tickFormatter:h,dataKey:g,padding:_}=this.props,{startX:v,endX:y,isTextActive:x,isSlideMoving:S,isTravellerMoving:C,isTravellerFocused:w}=this.state;if(!e||!e.length||!b(r)||!b(i)||!b(o)||!b(s)||o<=0||s<=0)return null;var T=c(`recharts-brush`,t),E=zM(`userSelect`,`none`),D=i+(a??0);return A.createElement(N,{className:T,onMouseLeave:this.handleLeaveWrapper,onTouchMove:this.handleTouchMove,style:E},A.createElement(uN,{x:r,y:D,width:o,height:s,fill:u,stroke:d}),A.createElement(qs,null,A.createElement(pN,{x:r,y:D,width:o,height:s,data:e,padding:_},n)),A.createElement(fN,{y:D,height:s,stroke:d,travellerWidth:m,startX:v,endX:y,onMouseEnter:this.handleEnterSlideOrTraveller,onMouseLeave:this.handleLeaveSlideOrTraveller,onMouseDown:this.handleSlideDragStart,onTouchStart:this.handleSlideDragStart}),A.createElement(oN,{travellerX:v,id:`startX`,otherProps:eN(eN({},this.props),{},{y:D}),onMouseEnter:this.handleEnterSlideOrTraveller,onMouseLeave:this.handleLeaveSlideOrTraveller,onMouseDown:this.travellerDragStartHandlers.startX,onTouchStart:this.travellerDragStartHandlers.startX,onTravellerMoveKeyboard:this.handleTravellerMoveKeyboard,onFocus:()=>{this.setState({isTravellerFocused:!0})},onBlur:()=>{this.setState({isTravellerFocused:!1})}}),A.createElement(oN,{travellerX:y,id:`endX`,otherProps:eN(eN({},this.props),{},{y:D}),onMouseEnter:this.handleEnterSlideOrTraveller,onMouseLeave:this.handleLeaveSlideOrTraveller,onMouseDown:this.travellerDragStartHandlers.endX,onTouchStart:this.travellerDragStartHandlers.endX,onTravellerMoveKeyboard:this.handleTravellerMoveKeyboard,onFocus:()=>{this.setState({isTravellerFocused:!0})},onBlur:()=>{this.setState({isTravellerFocused:!1})}}),(x||S||C||w||l)&&A.createElement(dN,{startIndex:f,endIndex:p,y:D,height:s,travellerWidth:m,stroke:d,tickFormatter:h,dataKey:g,data:e,startX:v,endX:y}))}};function _N(e){var t=F(),n=UM(),r=GM(),i=(0,A.useContext)(KM),a=e.onChange,{startIndex:o,endIndex:s}=e;(0,A.useEffect)(()=>{t(jS({startIndex:o,endIndex:s}))},[t,s,o]),qS();var c=(0,A.useCallback)(e=>{if(r!=null){var{startIndex:n,endIndex:o}=r;(e.startIndex!==n||e.endIndex!==o)&&(i?.(e),a?.(e),t(jS(e)))}},[a,i,t,r]),l=I(Ys);if(l==null||r==null||n==null||!n.length)return null;var{startIndex:u,endIndex:d}=r,{x:f,y:p,width:m}=l,h={data:n,x:f,y:p,width:m,startIndex:u,endIndex:d,onChange:c};return A.createElement(gN,QM({},e,h,{startIndexControlledFromProps:o??void 0,endIndexControlledFromProps:s??void 0}))}function vN(e){var t=F();return(0,A.useEffect)(()=>(t(YM(e)),()=>{t(YM(null))}),[t,e]),null}var yN={height:40,travellerWidth:5,gap:1,fill:`#fff`,stroke:`#666`,padding:{top:1,right:1,bottom:1,left:1},leaveTimeOut:1e3,alwaysShowText:!1};function bN(e){var t=H(e,yN);return A.createElement(A.Fragment,null,A.createElement(vN,{height:t.height,x:t.x,y:t.y,width:t.width,padding:t.padding}),A.createElement(_N,t))}bN.displayName=`Brush`;function xN(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function SN(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?xN(Object(n),!0).forEach(function(t){CN(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):xN(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function CN(e,t,n){return(t=wN(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function wN(e){var t=TN(e,`string`);return typeof t==`symbol`?t:t+``}function TN(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}var EN=(e,t)=>{var{x:n,y:r}=e,{x:i,y:a}=t;return{x:Math.min(n,i),y:Math.min(r,a),width:Math.abs(i-n),height:Math.abs(a-r)}},DN=e=>{var{x1:t,y1:n,x2:r,y2:i}=e;return EN({x:t,y:n},{x:r,y:i})},ON=class e{static create(t){return new e(t)}constructor(e){this.scale=e}get domain(){return this.scale.domain}get range(){return this.scale.range}get rangeMin(){return this.range()[0]}get rangeMax(){return this.range()[1]}get bandwidth(){return this.scale.bandwidth}apply(e){var{bandAware:t,position:n}=arguments.length>1&&arguments[1]!==void 0?arguments[1]:{};if(e!==void 0){if(n)switch(n){case`start`:return this.scale(e);case`middle`:var r=this.bandwidth?this.bandwidth()/2:0;return this.scale(e)+r;case`end`:var i=this.bandwidth?this.bandwidth():0;return this.scale(e)+i;default:return this.scale(e)}if(t){var a=this.bandwidth?this.bandwidth()/2:0;return this.scale(e)+a}return this.scale(e)}}isInRange(e){var t=this.range(),n=t[0],r=t[t.length-1];return n<=r?e>=n&&e<=r:e>=r&&e<=n}};CN(ON,`EPS`,1e-4);var kN=e=>{var t=Object.keys(e).reduce((t,n)=>SN(SN({},t),{},{[n]:ON.create(e[n])}),{});return SN(SN({},t),{},{apply(e){var{bandAware:n,position:r}=arguments.length>1&&arguments[1]!==void 0?arguments[1]:{};return Object.fromEntries(Object.entries(e).map(e=>{var[i,a]=e;return[i,t[i].apply(a,{bandAware:n,position:r})]}))},isInRange(e){return Object.keys(e).every(n=>t[n].isInRange(e[n]))}})};function AN(e){return(e%180+180)%180}var jN=function(e){var{width:t,height:n}=e,r=arguments.length>1&&arguments[1]!==void 0?arguments[1]:0,i=AN(r)*Math.PI/180,a=Math.atan(n/t),o=i>a&&i<Math.PI-a?n/Math.sin(i):t/Math.cos(i);return Math.abs(o)},MN=Ma({name:`referenceElements`,initialState:{dots:[],areas:[],lines:[]},reducers:{addDot:(e,t)=>{e.dots.push(t.payload)},removeDot:(e,t)=>{var n=ra(e).dots.findIndex(e=>e===t.payload);n!==-1&&e.dots.splice(n,1)},addArea:(e,t)=>{e.areas.push(t.payload)},removeArea:(e,t)=>{var n=ra(e).areas.findIndex(e=>e===t.payload);n!==-1&&e.areas.splice(n,1)},addLine:(e,t)=>{e.lines.push(t.payload)},removeLine:(e,t)=>{var n=ra(e).lines.findIndex(e=>e===t.payload);n!==-1&&e.lines.splice(n,1)}}}),{addDot:NN,removeDot:PN,addArea:FN,removeArea:IN,addLine:LN,removeLine:RN}=MN.actions,zN=MN.reducer,BN=(0,A.createContext)(void 0),VN=e=>{var{children:t}=e,[n]=(0,A.useState)(`${C(`recharts`)}-clip`),r=JO();if(r==null)return null;var{x:i,y:a,width:o,height:s}=r;return A.createElement(BN.Provider,{value:n},A.createElement(`defs`,null,A.createElement(`clipPath`,{id:n},A.createElement(`rect`,{x:i,y:a,height:s,width:o}))),t)},HN=()=>(0,A.useContext)(BN);function UN(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function WN(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?UN(Object(n),!0).forEach(function(t){GN(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):UN(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function GN(e,t,n){return(t=KN(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function KN(e){var t=qN(e,`string`);return typeof t==`symbol`?t:t+``}function qN(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function JN(){return JN=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},JN.apply(null,arguments)}var YN=(e,t)=>A.isValidElement(e)?A.cloneElement(e,t):typeof e==`function`?e(t):A.createElement(`line`,JN({},t,{className:`recharts-reference-line-line`})),XN=(e,t,n,r,i,a,o,s,c)=>{var{x:l,y:u,width:d,height:f}=i;if(n){var{y:p}=c,m=e.y.apply(p,{position:a});if(v(m)||c.ifOverflow===`discard`&&!e.y.isInRange(m))return null;var h=[{x:l+d,y:m},{x:l,y:m}];return s===`left`?h.reverse():h}if(t){var{x:g}=c,_=e.x.apply(g,{position:a});if(v(_)||c.ifOverflow===`discard`&&!e.x.isInRange(_))return null;var y=[{x:_,y:u+f},{x:_,y:u}];return o===`top`?y.reverse():y}if(r){var{segment:b}=c,x=b.map(t=>e.apply(t,{position:a}));return c.ifOverflow===`discard`&&x.some(t=>!e.isInRange(t))?null:x}return null};function ZN(e){var t=F();return(0,A.useEffect)(()=>(t(LN(e)),()=>{t(RN(e))})),null}function QN(e){var{x:t,y:n,segment:r,xAxisId:i,yAxisId:a,shape:o,className:s,ifOverflow:l}=e,u=B(),d=HN(),f=I(e=>lv(e,i)),p=I(e=>fv(e,a)),m=I(e=>Ny(e,`xAxis`,i,u)),h=I(e=>Ny(e,`yAxis`,a,u)),g=Xs(),_=x(t),v=x(n);if(!d||!g||f==null||p==null||m==null||h==null)return null;var y=kN({x:m,y:h}),b=r&&r.length===2,S=XN(y,_,v,b,g,e.position,f.orientation,p.orientation,e);if(!S)return null;var[{x:C,y:w},{x:T,y:E}]=S,D=l===`hidden`?`url(#${d})`:void 0,O=WN(WN({clipPath:D},M(e,!0)),{},{x1:C,y1:w,x2:T,y2:E});return A.createElement(N,{className:c(`recharts-reference-line`,s)},YN(o,O),A.createElement(_w,DN({x1:C,y1:w,x2:T,y2:E}),A.createElement(Mw,{label:e.label}),e.children))}function $N(e){return A.createElement(A.Fragment,null,A.createElement(ZN,{yAxisId:e.yAxisId,xAxisId:e.xAxisId,ifOverflow:e.ifOverflow,x:e.x,y:e.y}),A.createElement(QN,e))}var eP=class extends A.Component{render(){return A.createElement($N,this.props)}};GN(eP,`displayName`,`ReferenceLine`),GN(eP,`defaultProps`,{ifOverflow:`discard`,xAxisId:0,yAxisId:0,fill:`none`,stroke:`#ccc`,fillOpacity:1,strokeWidth:1,position:`middle`});function tP(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function nP(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?tP(Object(n),!0).forEach(function(t){rP(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):tP(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function rP(e,t,n){return(t=iP(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function iP(e){var t=aP(e,`string`);return typeof t==`symbol`?t:t+``}function aP(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function oP(){return oP=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},oP.apply(null,arguments)}var sP=(e,t,n,r,i)=>{var a=x(e),o=x(t),s=B(),c=I(e=>Ny(e,`xAxis`,n,s)),l=I(e=>Ny(e,`yAxis`,r,s));if(!a||!o||c==null||l==null)return null;var u=kN({x:c,y:l}),d=u.apply({x:e,y:t},{bandAware:!0});return i===`discard`&&!u.isInRange(d)?null:d};function cP(e){var t=F();return(0,A.useEffect)(()=>(t(NN(e)),()=>{t(PN(e))})),null}var lP=(e,t)=>A.isValidElement(e)?A.cloneElement(e,t):typeof e==`function`?e(t):A.createElement(pT,oP({},t,{cx:t.cx,cy:t.cy,className:`recharts-reference-dot-dot`}));function uP(e){var{x:t,y:n,r}=e,i=HN(),a=sP(t,n,e.xAxisId,e.yAxisId,e.ifOverflow);if(!a)return null;var{x:o,y:s}=a,{shape:l,className:u,ifOverflow:d}=e,f=d===`hidden`?`url(#${i})`:void 0,p=nP(nP({clipPath:f},M(e,!0)),{},{cx:o,cy:s});return A.createElement(N,{className:c(`recharts-reference-dot`,u)},lP(l,p),A.createElement(_w,{x:o-r,y:s-r,width:2*r,height:2*r},A.createElement(Mw,{label:e.label}),e.children))}function dP(e){var{x:t,y:n,r,ifOverflow:i,yAxisId:a,xAxisId:o}=e;return A.createElement(A.Fragment,null,A.createElement(cP,{y:n,x:t,r,yAxisId:a,xAxisId:o,ifOverflow:i}),A.createElement(uP,e))}var fP=class extends A.Component{render(){return A.createElement(dP,this.props)}};rP(fP,`displayName`,`ReferenceDot`),rP(fP,`defaultProps`,{ifOverflow:`discard`,xAxisId:0,yAxisId:0,r:10,fill:`#fff`,stroke:`#ccc`,fillOpacity:1,strokeWidth:1});function pP(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function mP(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?pP(Object(n),!0).forEach(function(t){hP(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):pP(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function hP(e,t,n){return(t=gP(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function gP(e){var t=_P(e,`string`);return typeof t==`symbol`?t:t+``}function _P(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function vP(){return vP=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},vP.apply(null,arguments)}var yP=(e,t,n,r,i,a,o)=>{var{x1:s,x2:c,y1:l,y2:u}=o;if(i==null||a==null)return null;var d=kN({x:i,y:a}),f={x:e?d.x.apply(s,{position:`start`}):d.x.rangeMin,y:n?d.y.apply(l,{position:`start`}):d.y.rangeMin},p={x:t?d.x.apply(c,{position:`end`}):d.x.rangeMax,y:r?d.y.apply(u,{position:`end`}):d.y.rangeMax};return o.ifOverflow===`discard`&&(!d.isInRange(f)||!d.isInRange(p))?null:EN(f,p)},bP=(e,t)=>A.isValidElement(e)?A.cloneElement(e,t):typeof e==`function`?e(t):A.createElement(xu,vP({},t,{className:`recharts-reference-area-rect`}));function xP(e){var t=F();return(0,A.useEffect)(()=>(t(FN(e)),()=>{t(IN(e))})),null}function SP(e){var{x1:t,x2:n,y1:r,y2:i,className:a,shape:o,xAxisId:s,yAxisId:l}=e,u=HN(),d=B(),f=I(e=>Ny(e,`xAxis`,s,d)),p=I(e=>Ny(e,`yAxis`,l,d));if(f==null||!p==null)return null;var m=x(t),h=x(n),g=x(r),_=x(i);if(!m&&!h&&!g&&!_&&!o)return null;var v=yP(m,h,g,_,f,p,e);if(!v&&!o)return null;var y=e.ifOverflow===`hidden`?`url(#${u})`:void 0;return A.createElement(N,{className:c(`recharts-reference-area`,a)},bP(o,mP(mP({clipPath:y},M(e,!0)),v)),A.createElement(_w,v,A.createElement(Mw,{label:e.label}),e.children))}function CP(e){return A.createElement(A.Fragment,null,A.createElement(xP,{yAxisId:e.yAxisId,xAxisId:e.xAxisId,ifOverflow:e.ifOverflow,x1:e.x1,x2:e.x2,y1:e.y1,y2:e.y2}),A.createElement(SP,e))}var wP=class extends A.Component{render(){return A.createElement(CP,this.props)}};hP(wP,`displayName`,`ReferenceArea`),hP(wP,`defaultProps`,{ifOverflow:`discard`,xAxisId:0,yAxisId:0,r:10,fill:`#ccc`,fillOpacity:.5,stroke:`none`,strokeWidth:1});function TP(e,t){for(var n in e)if({}.hasOwnProperty.call(e,n)&&(!{}.hasOwnProperty.call(t,n)||e[n]!==t[n]))return!1;for(var r in t)if({}.hasOwnProperty.call(t,r)&&!{}.hasOwnProperty.call(e,r))return!1;return!0}function EP(e,t,n){if(t<1)return[];if(t===1&&n===void 0)return e;for(var r=[],i=0;i<e.length;i+=t)if(n===void 0||n(e[i])===!0)r.push(e[i]);else return;return r}function DP(e,t,n){var r={width:e.width+t.width,height:e.height+t.height};return jN(r,n)}function OP(e,t,n){var r=n===`width`,{x:i,y:a,width:o,height:s}=e;return t===1?{start:r?i:a,end:r?i+o:a+s}:{start:r?i+o:a+s,end:r?i:a}}function kP(e,t,n,r,i){if(e*t<e*r||e*t>e*i)return!1;var a=n();return e*(t-e*a/2-r)>=0&&e*(t+e*a/2-i)<=0}function AP(e,t){return EP(e,t+1)}function jP(e,t,n,r,i){for(var a=(r||[]).slice(),{start:o,end:s}=t,c=0,l=1,u=o,d=function(){var t=r?.[c];if(t===void 0)return{v:EP(r,l)};var a=c,d,f=()=>(d===void 0&&(d=n(t,a)),d),p=t.coordinate,m=c===0||kP(e,p,f,u,s);m||(c=0,u=o,l+=1),m&&(u=p+e*(f()/2+i),c+=l)},f;l<=a.length;)if(f=d(),f)return f.v;return[]}function MP(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function NP(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?MP(Object(n),!0).forEach(function(t){PP(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):MP(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function PP(e,t,n){return(t=FP(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function FP(e){var t=IP(e,`string`);return typeof t==`symbol`?t:t+``}function IP(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function LP(e,t,n,r,i){for(var a=(r||[]).slice(),o=a.length,{start:s}=t,{end:c}=t,l=function(t){var r=a[t],l,u=()=>(l===void 0&&(l=n(r,t)),l);if(t===o-1){var d=e*(r.coordinate+e*u()/2-c);a[t]=r=NP(NP({},r),{},{tickCoord:d>0?r.coordinate-d*e:r.coordinate})}else a[t]=r=NP(NP({},r),{},{tickCoord:r.coordinate});kP(e,r.tickCoord,u,s,c)&&(c=r.tickCoord-e*(u()/2+i),a[t]=NP(NP({},r),{},{isShow:!0}))},u=o-1;u>=0;u--)l(u);return a}function RP(e,t,n,r,i,a){var o=(r||[]).slice(),s=o.length,{start:c,end:l}=t;if(a){var u=r[s-1],d=n(u,s-1),f=e*(u.coordinate+e*d/2-l);o[s-1]=u=NP(NP({},u),{},{tickCoord:f>0?u.coordinate-f*e:u.coordinate}),kP(e,u.tickCoord,()=>d,c,l)&&(l=u.tickCoord-e*(d/2+i),o[s-1]=NP(NP({},u),{},{isShow:!0}))}for(var p=a?s-1:s,m=function(t){var r=o[t],a,s=()=>(a===void 0&&(a=n(r,t)),a);if(t===0){var u=e*(r.coordinate-e*s()/2-c);o[t]=r=NP(NP({},r),{},{tickCoord:u<0?r.coordinate-u*e:r.coordinate})}else o[t]=r=NP(NP({},r),{},{tickCoord:r.coordinate});kP(e,r.tickCoord,s,c,l)&&(c=r.tickCoord+e*(s()/2+i),o[t]=NP(NP({},r),{},{isShow:!0}))},h=0;h<p;h++)m(h);return o}function zP(e,t,n){var{tick:r,ticks:i,viewBox:a,minTickGap:o,orientation:s,interval:c,tickFormatter:l,unit:u,angle:d}=e;if(!i||!i.length||!r)return[];if(b(c)||Yc.isSsr)return AP(i,b(c)?c:0)??[];var f=[],p=s===`top`||s===`bottom`?`width`:`height`,m=u&&p===`width`?PC(u,{fontSize:t,letterSpacing:n}):{width:0,height:0},h=(e,r)=>{var i=typeof l==`function`?l(e.value,r):e.value;return p===`width`?DP(PC(i,{fontSize:t,letterSpacing:n}),m,d):PC(i,{fontSize:t,letterSpacing:n})[p]},g=i.length>=2?_(i[1].coordinate-i[0].coordinate):1,v=OP(a,g,p);return c===`equidistantPreserveStart`?jP(g,v,h,i,o):(f=c===`preserveStart`||c===`preserveStartEnd`?RP(g,v,h,i,o,c===`preserveStartEnd`):LP(g,v,h,i,o),f.filter(e=>e.isShow))}var BP=e=>{var{ticks:t,label:n,labelGapWithTick:r=5,tickSize:i=0,tickMargin:a=0}=e,o=0;if(t){t.forEach(e=>{if(e){var t=e.getBoundingClientRect();t.width>o&&(o=t.width)}});var s=n?n.getBoundingClientRect().width:0,c=i+a,l=o+c+s+(n?r:0);return Math.round(l)}return 0},VP=e(h()),HP=[`axisLine`,`width`,`height`,`className`,`hide`,`ticks`],UP=[`viewBox`],WP=[`viewBox`];function GP(e,t){if(e==null)return{};var n,r,i=KP(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function KP(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}function qP(){return qP=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},qP.apply(null,arguments)}function JP(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function YP(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?JP(Object(n),!0).forEach(function(t){XP(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):JP(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function XP(e,t,n){return(t=ZP(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function ZP(e){var t=QP(e,`string`);return typeof t==`symbol`?t:t+``}function QP(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}var $P={x:0,y:0,width:0,height:0,viewBox:{x:0,y:0,width:0,height:0},orientation:`bottom`,ticks:[],stroke:`#666`,tickLine:!0,axisLine:!0,tick:!0,mirror:!1,minTickGap:5,tickSize:6,tickMargin:2,interval:`preserveEnd`};function eF(e){var{x:t,y:n,width:r,height:i,orientation:a,mirror:o,axisLine:s,otherSvgProps:l}=e;if(!s)return null;var u=YP(YP(YP({},l),M(s,!1)),{},{fill:`none`});if(a===`top`||a===`bottom`){var d=+(a===`top`&&!o||a===`bottom`&&o);u=YP(YP({},u),{},{x1:t,y1:n+d*i,x2:t+r,y2:n+d*i})}else{var f=+(a===`left`&&!o||a===`right`&&o);u=YP(YP({},u),{},{x1:t+f*r,y1:n,x2:t+f*r,y2:n+i})}return A.createElement(`line`,qP({},u,{className:c(`recharts-cartesian-axis-line`,(0,VP.default)(s,`className`))}))}function tF(e,t,n,r,i,a,o,s,c){var l,u,d,f,p,m,h=s?-1:1,g=e.tickSize||o,_=b(e.tickCoord)?e.tickCoord:e.coordinate;switch(a){case`top`:l=u=e.coordinate,f=n+ +!s*i,d=f-h*g,m=d-h*c,p=_;break;case`left`:d=f=e.coordinate,u=t+ +!s*r,l=u-h*g,p=l-h*c,m=_;break;case`right`:d=f=e.coordinate,u=t+ +s*r,l=u+h*g,p=l+h*c,m=_;break;default:l=u=e.coordinate,f=n+ +s*i,d=f+h*g,m=d+h*c,p=_;break}return{line:{x1:l,y1:d,x2:u,y2:f},tick:{x:p,y:m}}}function nF(e,t){switch(e){case`left`:return t?`start`:`end`;case`right`:return t?`end`:`start`;default:return`middle`}}function rF(e,t){switch(e){case`left`:case`right`:return`middle`;case`top`:return t?`start`:`end`;default:return t?`end`:`start`}}function iF(e){var{option:t,tickProps:n,value:r}=e,i,a=c(n.className,`recharts-cartesian-axis-tick-value`);if(A.isValidElement(t))i=A.cloneElement(t,YP(YP({},n),{},{className:a}));else if(typeof t==`function`)i=t(YP(YP({},n),{},{className:a}));else{var o=`recharts-cartesian-axis-tick-value`;typeof t!=`boolean`&&(o=c(o,t?.className)),i=A.createElement(sw,qP({},n,{className:o}),r)}return i}function aF(e){var{ticks:t=[],tick:n,tickLine:r,stroke:i,tickFormatter:a,unit:o,padding:s,tickTextProps:l,orientation:u,mirror:d,x:f,y:p,width:m,height:h,tickSize:g,tickMargin:_,fontSize:v,letterSpacing:y,getTicksConfig:b,events:x}=e,S=zP(YP(YP({},b),{},{ticks:t}),v,y),C=nF(u,d),w=rF(u,d),T=j(b),E=M(n,!1),D=YP(YP({},T),{},{fill:`none`},M(r,!1)),O=S.map((e,t)=>{var{line:v,tick:y}=tF(e,f,p,m,h,u,g,d,_),b=YP(YP(YP(YP({textAnchor:C,verticalAnchor:w},T),{},{stroke:`none`,fill:i},E),y),{},{index:t,payload:e,visibleTicksCount:S.length,tickFormatter:a,padding:s},l);return A.createElement(N,qP({className:`recharts-cartesian-axis-tick`,key:`tick-${e.value}-${e.coordinate}-${e.tickCoord}`},le(x,e,t)),r&&A.createElement(`line`,qP({},D,v,{className:c(`recharts-cartesian-axis-tick-line`,(0,VP.default)(r,`className`))})),n&&A.createElement(iF,{option:n,tickProps:b,value:`${typeof a==`function`?a(e.value,t):e.value}${o||``}`}))});return O.length>0?A.createElement(`g`,{className:`recharts-cartesian-axis-ticks`},O):null}var oF=(0,A.forwardRef)((e,t)=>{var{axisLine:n,width:r,height:i,className:a,hide:o,ticks:s}=e,l=GP(e,HP),[u,d]=(0,A.useState)(``),[f,p]=(0,A.useState)(``),m=(0,A.useRef)([]);(0,A.useImperativeHandle)(t,()=>({getCalculatedWidth:()=>BP({ticks:m.current,label:e.labelRef?.current,labelGapWithTick:5,tickSize:e.tickSize,tickMargin:e.tickMargin})}));var h=(0,A.useCallback)(e=>{if(e){var t=e.getElementsByClassName(`recharts-cartesian-axis-tick-value`);m.current=Array.from(t);var n=t[0];if(n){var r=window.getComputedStyle(n),i=r.fontSize,a=r.letterSpacing;(i!==u||a!==f)&&(d(i),p(a))}}},[u,f]);return o||r!=null&&r<=0||i!=null&&i<=0?null:A.createElement(N,{className:c(`recharts-cartesian-axis`,a),ref:h},A.createElement(eF,{x:e.x,y:e.y,width:r,height:i,orientation:e.orientation,mirror:e.mirror,axisLine:n,otherSvgProps:j(e)}),A.createElement(aF,{ticks:s,tick:e.tick,tickLine:e.tickLine,stroke:e.stroke,tickFormatter:e.tickFormatter,unit:e.unit,padding:e.padding,tickTextProps:e.tickTextProps,orientation:e.orientation,mirror:e.mirror,x:e.x,y:e.y,width:e.width,height:e.height,tickSize:e.tickSize,tickMargin:e.tickMargin,fontSize:u,letterSpacing:f,getTicksConfig:e,events:l}),A.createElement(_w,{x:e.x,y:e.y,width:e.width,height:e.height},A.createElement(Mw,{label:e.label}),e.children))}),sF=A.memo(oF,(e,t)=>{var{viewBox:n}=e,r=GP(e,UP),{viewBox:i}=t,a=GP(t,WP);return TP(n,i)&&TP(r,a)}),cF=A.forwardRef((e,t)=>{var n=H(e,$P);return A.createElement(sF,qP({},n,{ref:t}))});cF.displayName=`CartesianAxis`;var lF=[`x1`,`y1`,`x2`,`y2`,`key`],uF=[`offset`],dF=[`xAxisId`,`yAxisId`],fF=[`xAxisId`,`yAxisId`];function pF(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function mF(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?pF(Object(n),!0).forEach(function(t){hF(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):pF(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function hF(e,t,n){return(t=gF(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function gF(e){var t=_F(e,`string`);return typeof t==`symbol`?t:t+``}function _F(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function vF(){return vF=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},vF.apply(null,arguments)}function yF(e,t){if(e==null)return{};var n,r,i=bF(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function bF(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}var xF=e=>{var{fill:t}=e;if(!t||t===`none`)return null;var{fillOpacity:n,x:r,y:i,width:a,height:o,ry:s}=e;return A.createElement(`rect`,{x:r,y:i,ry:s,width:a,height:o,stroke:`none`,fill:t,fillOpacity:n,className:`recharts-cartesian-grid-bg`})};function SF(e,t){var n;if(A.isValidElement(e))n=A.cloneElement(e,t);else if(typeof e==`function`)n=e(t);else{var{x1:r,y1:i,x2:a,y2:o,key:s}=t,c=yF(t,lF),l=j(c),{offset:u}=l,d=yF(l,uF);n=A.createElement(`line`,vF({},d,{x1:r,y1:i,x2:a,y2:o,fill:`none`,key:s}))}return n}function CF(e){var{x:t,width:n,horizontal:r=!0,horizontalPoints:i}=e;if(!r||!i||!i.length)return null;var{xAxisId:a,yAxisId:o}=e,s=yF(e,dF),c=i.map((e,i)=>{var a=mF(mF({},s),{},{x1:t,y1:e,x2:t+n,y2:e,key:`line-${i}`,index:i});return SF(r,a)});return A.createElement(`g`,{className:`recharts-cartesian-grid-horizontal`},c)}function wF(e){var{y:t,height:n,vertical:r=!0,verticalPoints:i}=e;if(!r||!i||!i.length)return null;var{xAxisId:a,yAxisId:o}=e,s=yF(e,fF),c=i.map((e,i)=>{var a=mF(mF({},s),{},{x1:e,y1:t,x2:e,y2:t+n,key:`line-${i}`,index:i});return SF(r,a)});return A.createElement(`g`,{className:`recharts-cartesian-grid-vertical`},c)}function TF(e){var{horizontalFill:t,fillOpacity:n,x:r,y:i,width:a,height:o,horizontalPoints:s,horizontal:c=!0}=e;if(!c||!t||!t.length)return null;var l=s.map(e=>Math.round(e+i-i)).sort((e,t)=>e-t);i!==l[0]&&l.unshift(0);var u=l.map((e,s)=>{var c=l[s+1]?l[s+1]-e:i+o-e;if(c<=0)return null;var u=s%t.length;return A.createElement(`rect`,{key:`react-${s}`,y:e,x:r,height:c,width:a,stroke:`none`,fill:t[u],fillOpacity:n,className:`recharts-cartesian-grid-bg`})});return A.createElement(`g`,{className:`recharts-cartesian-gridstripes-horizontal`},u)}function EF(e){var{vertical:t=!0,verticalFill:n,fillOpacity:r,x:i,y:a,width:o,height:s,verticalPoints:c}=e;if(!t||!n||!n.length)return null;var l=c.map(e=>Math.round(e+i-i)).sort((e,t)=>e-t);i!==l[0]&&l.unshift(0);var u=l.map((e,t)=>{var c=l[t+1]?l[t+1]-e:i+o-e;if(c<=0)return null;var u=t%n.length;return A.createElement(`rect`,{key:`react-${t}`,x:e,y:a,width:c,height:s,stroke:`none`,fill:n[u],fillOpacity:r,className:`recharts-cartesian-grid-bg`})});return A.createElement(`g`,{className:`recharts-cartesian-gridstripes-vertical`},u)}var DF=(e,t)=>{var{xAxis:n,width:r,height:i,offset:a}=e;return es(zP(mF(mF(mF({},$P),n),{},{ticks:ts(n,!0),viewBox:{x:0,y:0,width:r,height:i}})),a.left,a.left+a.width,t)},OF=(e,t)=>{var{yAxis:n,width:r,height:i,offset:a}=e;return es(zP(mF(mF(mF({},$P),n),{},{ticks:ts(n,!0),viewBox:{x:0,y:0,width:r,height:i}})),a.top,a.top+a.height,t)},kF={horizontal:!0,vertical:!0,horizontalPoints:[],verticalPoints:[],stroke:`#ccc`,fill:`none`,verticalFill:[],horizontalFill:[],xAxisId:0,yAxisId:0};function AF(e){var t=$s(),n=ec(),r=Qs(),i=mF(mF({},H(e,kF)),{},{x:b(e.x)?e.x:r.left,y:b(e.y)?e.y:r.top,width:b(e.width)?e.width:r.width,height:b(e.height)?e.height:r.height}),{xAxisId:a,yAxisId:o,x:s,y:c,width:l,height:u,syncWithTicks:d,horizontalValues:f,verticalValues:p}=i,m=B(),h=I(e=>eb(e,`xAxis`,a,m)),g=I(e=>eb(e,`yAxis`,o,m));if(!b(l)||l<=0||!b(u)||u<=0||!b(s)||s!==+s||!b(c)||c!==+c)return null;var _=i.verticalCoordinatesGenerator||DF,v=i.horizontalCoordinatesGenerator||OF,{horizontalPoints:y,verticalPoints:x}=i;if((!y||!y.length)&&typeof v==`function`){var S=f&&f.length,C=v({yAxis:g?mF(mF({},g),{},{ticks:S?f:g.ticks}):void 0,width:t,height:n,offset:r},S?!0:d);uC(Array.isArray(C),`horizontalCoordinatesGenerator should return Array but instead it returned [${typeof C}]`),Array.isArray(C)&&(y=C)}if((!x||!x.length)&&typeof _==`function`){var w=p&&p.length,T=_({xAxis:h?mF(mF({},h),{},{ticks:w?p:h.ticks}):void 0,width:t,height:n,offset:r},w?!0:d);uC(Array.isArray(T),`verticalCoordinatesGenerator should return Array but instead it returned [${typeof T}]`),Array.isArray(T)&&(x=T)}return A.createElement(`g`,{className:`recharts-cartesian-grid`},A.createElement(xF,{fill:i.fill,fillOpacity:i.fillOpacity,x:i.x,y:i.y,width:i.width,height:i.height,ry:i.ry}),A.createElement(TF,vF({},i,{horizontalPoints:y})),A.createElement(EF,vF({},i,{verticalPoints:x})),A.createElement(CF,vF({},i,{offset:r,horizontalPoints:y,xAxis:h,yAxis:g})),A.createElement(wF,vF({},i,{offset:r,verticalPoints:x,xAxis:h,yAxis:g})))}AF.displayName=`CartesianGrid`;var jF=(e,t,n,r)=>ab(e,`xAxis`,t,r),MF=(e,t,n,r)=>ib(e,`xAxis`,t,r),NF=(e,t,n,r)=>ab(e,`yAxis`,n,r),PF=(e,t,n,r)=>ib(e,`yAxis`,n,r),FF=L([V,jF,NF,MF,PF],(e,t,n,r,i)=>$o(e,`xAxis`)?vs(t,r,!1):vs(n,i,!1)),IF=(e,t,n,r,i)=>i;function LF(e){return e.type===`line`}var RF=L([yv,IF],(e,t)=>e.filter(LF).find(e=>e.id===t)),zF=L([V,jF,NF,MF,PF,RF,FF,yg],(e,t,n,r,i,a,o,s)=>{var{chartData:c,dataStartIndex:l,dataEndIndex:u}=s;if(!(a==null||t==null||n==null||r==null||i==null||r.length===0||i.length===0||o==null)){var{dataKey:d,data:f}=a,p=f!=null&&f.length>0?f:c?.slice(l,u+1);if(p!=null)return mI({layout:e,xAxis:t,yAxis:n,xAxisTicks:r,yAxisTicks:i,dataKey:d,bandSize:o,displayedData:p})}}),BF=[`id`],VF=[`type`,`layout`,`connectNulls`,`needClip`],HF=[`activeDot`,`animateNewValues`,`animationBegin`,`animationDuration`,`animationEasing`,`connectNulls`,`dot`,`hide`,`isAnimationActive`,`label`,`legendType`,`xAxisId`,`yAxisId`,`id`];function UF(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function WF(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?UF(Object(n),!0).forEach(function(t){GF(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):UF(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function GF(e,t,n){return(t=KF(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function KF(e){var t=qF(e,`string`);return typeof t==`symbol`?t:t+``}function qF(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function JF(e,t){if(e==null)return{};var n,r,i=YF(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function YF(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}function XF(){return XF=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},XF.apply(null,arguments)}var ZF=e=>{var{dataKey:t,name:n,stroke:r,legendType:i,hide:a}=e;return[{inactive:a,dataKey:t,type:i,color:r,value:bs(n,t),payload:e}]};function QF(e){var{dataKey:t,data:n,stroke:r,strokeWidth:i,fill:a,name:o,hide:s,unit:c}=e;return{dataDefinedOnItem:n,positions:void 0,settings:{stroke:r,strokeWidth:i,fill:a,dataKey:t,nameKey:void 0,name:bs(o,t),hide:s,type:e.tooltipType,color:e.stroke,unit:c}}}var $F=(e,t)=>`${t}px ${e-t}px`;function eI(e,t){for(var n=e.length%2==0?e:[...e,0],r=[],i=0;i<t;++i)r=[...r,...n];return r}var tI=(e,t,n)=>{var r=n.reduce((e,t)=>e+t);if(!r)return $F(t,e);for(var i=Math.floor(e/r),a=e%r,o=t-e,s=[],c=0,l=0;c<n.length;l+=n[c],++c)if(l+n[c]>a){s=[...n.slice(0,c),a-l];break}var u=s.length%2==0?[0,o]:[o];return[...eI(n,i),...s,...u].map(e=>`${e}px`).join(`, `)};function nI(e,t){var n;if(A.isValidElement(e))n=A.cloneElement(e,t);else if(typeof e==`function`)n=e(t);else{var r=c(`recharts-line-dot`,typeof e==`boolean`?``:e.className);n=A.createElement(pT,XF({},t,{className:r}))}return n}function rI(e,t){return e==null?!1:t?!0:e.length===1}function iI(e){var{clipPathId:t,points:n,props:r}=e,{dot:i,dataKey:a,needClip:o}=r;if(!rI(n,i))return null;var{id:s}=r,c=JF(r,BF),l=ye(i),u=j(c),d=M(i,!0),f=n.map((e,t)=>{var r=WF(WF(WF({key:`dot-${t}`,r:3},u),d),{},{index:t,cx:e.x,cy:e.y,dataKey:a,value:e.value,payload:e.payload,points:n});return nI(i,r)}),p={clipPath:o?`url(#clipPath-${l?``:`dots-`}${t})`:void 0};return A.createElement(N,XF({className:`recharts-line-dots`,key:`dots`},p),f)}function aI(e){var{showLabels:t,children:n,points:r}=e,i=(0,A.useMemo)(()=>r?.map(e=>{var t={x:e.x,y:e.y,width:0,height:0};return WF(WF({},t),{},{value:e.value,payload:e.payload,viewBox:t,parentViewBox:void 0,fill:void 0})}),[r]);return A.createElement(Kw,{value:t?i:null},n)}function oI(e){var{clipPathId:t,pathRef:n,points:r,strokeDasharray:i,props:a}=e,{type:o,layout:s,connectNulls:c,needClip:l}=a,u=JF(a,VF),d=WF(WF({},M(u,!0)),{},{fill:`none`,className:`recharts-line-curve`,clipPath:l?`url(#clipPath-${t})`:void 0,points:r,type:o,layout:s,connectNulls:c,strokeDasharray:i??a.strokeDasharray});return A.createElement(A.Fragment,null,r?.length>1&&A.createElement(dl,XF({},d,{pathRef:n})),A.createElement(iI,{points:r,clipPathId:t,props:a}))}function sI(e){try{return e&&e.getTotalLength&&e.getTotalLength()||0}catch{return 0}}function cI(e){var{clipPathId:t,props:n,pathRef:r,previousPointsRef:i,longestAnimatedLengthRef:a}=e,{points:o,strokeDasharray:s,isAnimationActive:c,animationBegin:l,animationDuration:u,animationEasing:d,animateNewValues:f,width:p,height:m,onAnimationEnd:h,onAnimationStart:g}=n,_=i.current,v=fu(n,`recharts-line-`),[y,b]=(0,A.useState)(!1),x=!y,S=(0,A.useCallback)(()=>{typeof h==`function`&&h(),b(!1)},[h]),C=(0,A.useCallback)(()=>{typeof g==`function`&&g(),b(!0)},[g]),w=sI(r.current),T=a.current;return A.createElement(aI,{points:o,showLabels:x},n.children,A.createElement(du,{animationId:v,begin:l,duration:u,isActive:c,easing:d,onAnimationEnd:S,onAnimationStart:C,key:v},e=>{var l=D(T,w+T,e),u=Math.min(l,w),d;if(c)if(s){var h=`${s}`.split(/[,\s]+/gim).map(e=>parseFloat(e));d=tI(u,w,h)}else d=$F(w,u);else d=s==null?void 0:String(s);if(_){var g=_.length/o.length,v=e===1?o:o.map((t,n)=>{var r=Math.floor(n*g);if(_[r]){var i=_[r];return WF(WF({},t),{},{x:D(i.x,t.x,e),y:D(i.y,t.y,e)})}return f?WF(WF({},t),{},{x:D(p*2,t.x,e),y:D(m/2,t.y,e)}):WF(WF({},t),{},{x:t.x,y:t.y})});return i.current=v,A.createElement(oI,{props:n,points:v,clipPathId:t,pathRef:r,strokeDasharray:d})}return e>0&&w>0&&(i.current=o,a.current=u),A.createElement(oI,{props:n,points:o,clipPathId:t,pathRef:r,strokeDasharray:d})}),A.createElement(Qw,{label:n.label}))}function lI(e){var{clipPathId:t,props:n}=e,r=(0,A.useRef)(null),i=(0,A.useRef)(0),a=(0,A.useRef)(null);return A.createElement(cI,{props:n,clipPathId:t,previousPointsRef:r,longestAnimatedLengthRef:i,pathRef:a})}var uI=(e,t)=>({x:e.x,y:e.y,value:e.value,errorVal:z(e.payload,t)}),dI=class extends A.Component{render(){var{hide:e,dot:t,points:n,className:r,xAxisId:i,yAxisId:a,top:o,left:s,width:l,height:u,id:d,needClip:f}=this.props;if(e)return null;var p=c(`recharts-line`,r),m=d,{r:h=3,strokeWidth:g=2}=M(t,!1)??{r:3,strokeWidth:2},_=ye(t),v=h*2+g;return A.createElement(A.Fragment,null,A.createElement(N,{className:p},f&&A.createElement(`defs`,null,A.createElement(jA,{clipPathId:m,xAxisId:i,yAxisId:a}),!_&&A.createElement(`clipPath`,{id:`clipPath-dots-${m}`},A.createElement(`rect`,{x:s-v/2,y:o-v/2,width:l+v,height:u+v}))),A.createElement(DA,{xAxisId:i,yAxisId:a,data:n,dataPointFormatter:uI,errorBarOffset:0},A.createElement(lI,{props:this.props,clipPathId:m}))),A.createElement(ik,{activeDot:this.props.activeDot,points:n,mainColor:this.props.stroke,itemDataKey:this.props.dataKey}))}},fI={activeDot:!0,animateNewValues:!0,animationBegin:0,animationDuration:1500,animationEasing:`ease`,connectNulls:!1,dot:!0,fill:`#fff`,hide:!1,isAnimationActive:!Yc.isSsr,label:!1,legendType:`line`,stroke:`#3182bd`,strokeWidth:1,xAxisId:0,yAxisId:0};function pI(e){var t=H(e,fI),{activeDot:n,animateNewValues:r,animationBegin:i,animationDuration:a,animationEasing:o,connectNulls:s,dot:c,hide:l,isAnimationActive:u,label:d,legendType:f,xAxisId:p,yAxisId:m,id:h}=t,g=JF(t,HF),{needClip:_}=AA(p,m),v=JO(),y=nc(),b=B(),x=I(e=>zF(e,p,m,b,h));if(y!==`horizontal`&&y!==`vertical`||x==null||v==null)return null;var{height:S,width:C,x:w,y:T}=v;return A.createElement(dI,XF({},g,{id:h,connectNulls:s,dot:c,activeDot:n,animateNewValues:r,animationBegin:i,animationDuration:a,animationEasing:o,isAnimationActive:u,hide:l,label:d,legendType:f,xAxisId:p,yAxisId:m,points:x,layout:y,height:S,width:C,left:w,top:T,needClip:_}))}function mI(e){var{layout:t,xAxis:n,yAxis:r,xAxisTicks:i,yAxisTicks:a,dataKey:o,bandSize:s,displayedData:c}=e;return c.map((e,c)=>{var l=z(e,o);if(t===`horizontal`){var u=us({axis:n,ticks:i,bandSize:s,entry:e,index:c}),d=k(l)?null:r.scale(l);return{x:u,y:d,value:l,payload:e}}var f=k(l)?null:n.scale(l),p=us({axis:r,ticks:a,bandSize:s,entry:e,index:c});return f==null||p==null?null:{x:f,y:p,value:l,payload:e}}).filter(Boolean)}function hI(e){var t=H(e,fI),n=B();return A.createElement(HD,{id:t.id,type:`line`},e=>A.createElement(A.Fragment,null,A.createElement(LD,{legendPayload:ZF(t)}),A.createElement(FD,{fn:QF,args:t}),A.createElement(ZD,{type:`line`,id:e,data:t.data,xAxisId:t.xAxisId,yAxisId:t.yAxisId,zAxisId:0,dataKey:t.dataKey,hide:t.hide,isPanorama:n}),A.createElement(pI,XF({},t,{id:e}))))}var gI=A.memo(hI);gI.displayName=`Line`;var _I=(e,t,n,r)=>ab(e,`xAxis`,t,r),vI=(e,t,n,r)=>ib(e,`xAxis`,t,r),yI=(e,t,n,r)=>ab(e,`yAxis`,n,r),bI=(e,t,n,r)=>ib(e,`yAxis`,n,r),xI=L([V,_I,yI,vI,bI],(e,t,n,r,i)=>$o(e,`xAxis`)?vs(t,r,!1):vs(n,i,!1)),SI=L([yv,(e,t,n,r,i)=>i],(e,t)=>e.filter(e=>e.type===`area`).find(e=>e.id===t)),CI=L([V,_I,yI,vI,bI,(e,t,n,r,i)=>{var a=SI(e,t,n,r,i);if(a!=null){var o=V(e),s=$o(o,`xAxis`),c=s?Lv(e,`yAxis`,n,r):Lv(e,`xAxis`,t,r);if(c!=null){var{stackId:l}=a,u=q_(a);if(!(l==null||u==null))return(c[l]?.stackedData)?.find(e=>e.key===u)}}},yg,xI,SI],(e,t,n,r,i,a,o,s,c)=>{var{chartData:l,dataStartIndex:u,dataEndIndex:d}=o;if(!(c==null||e!==`horizontal`&&e!==`vertical`||t==null||n==null||r==null||i==null||r.length===0||i.length===0||s==null)){var{data:f}=c,p=f&&f.length>0?f:l?.slice(u,d+1);if(p!=null)return ZI({layout:e,xAxis:t,yAxis:n,xAxisTicks:r,yAxisTicks:i,dataStartIndex:u,areaSettings:c,stackedData:a,displayedData:p,chartBaseValue:void 0,bandSize:s})}}),wI=[`id`],TI=[`activeDot`,`animationBegin`,`animationDuration`,`animationEasing`,`connectNulls`,`dot`,`fill`,`fillOpacity`,`hide`,`isAnimationActive`,`legendType`,`stroke`,`xAxisId`,`yAxisId`];function EI(e,t){if(e==null)return{};var n,r,i=DI(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function DI(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}function OI(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function kI(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?OI(Object(n),!0).forEach(function(t){AI(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):OI(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function AI(e,t,n){return(t=jI(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function jI(e){var t=MI(e,`string`);return typeof t==`symbol`?t:t+``}function MI(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function NI(){return NI=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},NI.apply(null,arguments)}function PI(e,t){return e&&e!==`none`?e:t}var FI=e=>{var{dataKey:t,name:n,stroke:r,fill:i,legendType:a,hide:o}=e;return[{inactive:o,dataKey:t,type:a,color:PI(r,i),value:bs(n,t),payload:e}]};function II(e){var{dataKey:t,data:n,stroke:r,strokeWidth:i,fill:a,name:o,hide:s,unit:c}=e;return{dataDefinedOnItem:n,positions:void 0,settings:{stroke:r,strokeWidth:i,fill:a,dataKey:t,nameKey:void 0,name:bs(o,t),hide:s,type:e.tooltipType,color:PI(r,a),unit:c}}}var LI=(e,t)=>{var n;if(A.isValidElement(e))n=A.cloneElement(e,t);else if(typeof e==`function`)n=e(t);else{var r=c(`recharts-area-dot`,typeof e==`boolean`?``:e.className);n=A.createElement(pT,NI({},t,{className:r}))}return n};function RI(e,t){return e==null?!1:t?!0:e.length===1}function zI(e){var{clipPathId:t,points:n,props:r}=e,{needClip:i,dot:a,dataKey:o}=r;if(!RI(n,a))return null;var s=ye(a),c=j(r),l=M(a,!0),u=n.map((e,t)=>{var r=kI(kI(kI({key:`dot-${t}`,r:3},c),l),{},{index:t,cx:e.x,cy:e.y,dataKey:o,value:e.value,payload:e.payload,points:n});return LI(a,r)}),d={clipPath:i?`url(#clipPath-${s?``:`dots-`}${t})`:void 0};return A.createElement(N,NI({className:`recharts-area-dots`},d),u)}function BI(e){var{showLabels:t,children:n,points:r}=e,i=r.map(e=>{var t={x:e.x,y:e.y,width:0,height:0};return kI(kI({},t),{},{value:e.value,payload:e.payload,parentViewBox:void 0,viewBox:t,fill:void 0})});return A.createElement(Kw,{value:t?i:null},n)}function VI(e){var{points:t,baseLine:n,needClip:r,clipPathId:i,props:a}=e,{layout:o,type:s,stroke:c,connectNulls:l,isRange:u}=a,{id:d}=a,f=EI(a,wI),p=j(f);return A.createElement(A.Fragment,null,t?.length>1&&A.createElement(N,{clipPath:r?`url(#clipPath-${i})`:void 0},A.createElement(dl,NI({},p,{id:d,points:t,connectNulls:l,type:s,baseLine:n,layout:o,stroke:`none`,className:`recharts-area-area`})),c!==`none`&&A.createElement(dl,NI({},p,{className:`recharts-area-curve`,layout:o,type:s,connectNulls:l,fill:`none`,points:t})),c!==`none`&&u&&A.createElement(dl,NI({},p,{className:`recharts-area-curve`,layout:o,type:s,connectNulls:l,fill:`none`,points:n}))),A.createElement(zI,{points:t,props:f,clipPathId:i}))}function HI(e){var{alpha:t,baseLine:n,points:r,strokeWidth:i}=e,a=r[0].y,o=r[r.length-1].y;if(!Zc(a)||!Zc(o))return null;var s=t*Math.abs(a-o),c=Math.max(...r.map(e=>e.x||0));return b(n)?c=Math.max(n,c):n&&Array.isArray(n)&&n.length&&(c=Math.max(...n.map(e=>e.x||0),c)),b(c)?A.createElement(`rect`,{x:0,y:a<o?a:a-s,width:c+(i?parseInt(`${i}`,10):1),height:Math.floor(s)}):null}function UI(e){var{alpha:t,baseLine:n,points:r,strokeWidth:i}=e,a=r[0].x,o=r[r.length-1].x;if(!Zc(a)||!Zc(o))return null;var s=t*Math.abs(a-o),c=Math.max(...r.map(e=>e.y||0));return b(n)?c=Math.max(n,c):n&&Array.isArray(n)&&n.length&&(c=Math.max(...n.map(e=>e.y||0),c)),b(c)?A.createElement(`rect`,{x:a<o?a:a-s,y:0,width:s,height:Math.floor(c+(i?parseInt(`${i}`,10):1))}):null}function WI(e){var{alpha:t,layout:n,points:r,baseLine:i,strokeWidth:a}=e;return n===`vertical`?A.createElement(HI,{alpha:t,points:r,baseLine:i,strokeWidth:a}):A.createElement(UI,{alpha:t,points:r,baseLine:i,strokeWidth:a})}function GI(e){var{needClip:t,clipPathId:n,props:r,previousPointsRef:i,previousBaselineRef:a}=e,{points:o,baseLine:s,isAnimationActive:c,animationBegin:l,animationDuration:u,animationEasing:d,onAnimationStart:f,onAnimationEnd:p}=r,m=fu(r,`recharts-area-`),[h,g]=(0,A.useState)(!1),_=!h,y=(0,A.useCallback)(()=>{typeof p==`function`&&p(),g(!1)},[p]),x=(0,A.useCallback)(()=>{typeof f==`function`&&f(),g(!0)},[f]),S=i.current,C=a.current;return A.createElement(BI,{showLabels:_,points:o},r.children,A.createElement(du,{animationId:m,begin:l,duration:u,isActive:c,easing:d,onAnimationEnd:y,onAnimationStart:x,key:m},e=>{if(S){var l=S.length/o.length,u=e===1?o:o.map((t,n)=>{var r=Math.floor(n*l);if(S[r]){var i=S[r];return kI(kI({},t),{},{x:D(i.x,t.x,e),y:D(i.y,t.y,e)})}return t}),d=b(s)?D(C,s,e):k(s)||v(s)?D(C,0,e):s.map((t,n)=>{var r=Math.floor(n*l);if(Array.isArray(C)&&C[r]){var i=C[r];return kI(kI({},t),{},{x:D(i.x,t.x,e),y:D(i.y,t.y,e)})}return t});return e>0&&(i.current=u,a.current=d),A.createElement(VI,{points:u,baseLine:d,needClip:t,clipPathId:n,props:r})}return e>0&&(i.current=o,a.current=s),A.createElement(N,null,c&&A.createElement(`defs`,null,A.createElement(`clipPath`,{id:`animationClipPath-${n}`},A.createElement(WI,{alpha:e,points:o,baseLine:s,layout:r.layout,strokeWidth:r.strokeWidth}))),A.createElement(N,{clipPath:`url(#animationClipPath-${n})`},A.createElement(VI,{points:o,baseLine:s,needClip:t,clipPathId:n,props:r})))}),A.createElement(Qw,{label:r.label}))}function KI(e){var{needClip:t,clipPathId:n,props:r}=e,i=(0,A.useRef)(null),a=(0,A.useRef)();return A.createElement(GI,{needClip:t,clipPathId:n,props:r,previousPointsRef:i,previousBaselineRef:a})}var qI=class extends A.PureComponent{render(){var{hide:e,dot:t,points:n,className:r,top:i,left:a,needClip:o,xAxisId:s,yAxisId:l,width:u,height:d,id:f,baseLine:p}=this.props;if(e)return null;var m=c(`recharts-area`,r),h=f,{r:g=3,strokeWidth:_=2}=M(t,!1)??{r:3,strokeWidth:2},v=ye(t),y=g*2+_;return A.createElement(A.Fragment,null,A.createElement(N,{className:m},o&&A.createElement(`defs`,null,A.createElement(jA,{clipPathId:h,xAxisId:s,yAxisId:l}),!v&&A.createElement(`clipPath`,{id:`clipPath-dots-${h}`},A.createElement(`rect`,{x:a-y/2,y:i-y/2,width:u+y,height:d+y}))),A.createElement(KI,{needClip:o,clipPathId:h,props:this.props})),A.createElement(ik,{points:n,mainColor:PI(this.props.stroke,this.props.fill),itemDataKey:this.props.dataKey,activeDot:this.props.activeDot}),this.props.isRange&&Array.isArray(p)&&A.createElement(ik,{points:p,mainColor:PI(this.props.stroke,this.props.fill),itemDataKey:this.props.dataKey,activeDot:this.props.activeDot}))}},JI={activeDot:!0,animationBegin:0,animationDuration:1500,animationEasing:`ease`,connectNulls:!1,dot:!1,fill:`#3182bd`,fillOpacity:.6,hide:!1,isAnimationActive:!Yc.isSsr,legendType:`line`,stroke:`#3182bd`,xAxisId:0,yAxisId:0};function YI(e){var t=H(e,JI),{activeDot:n,animationBegin:r,animationDuration:i,animationEasing:a,connectNulls:o,dot:s,fill:c,fillOpacity:l,hide:u,isAnimationActive:d,legendType:f,stroke:p,xAxisId:m,yAxisId:h}=t,g=EI(t,TI),_=nc(),v=Yx(),{needClip:y}=AA(m,h),b=B(),{points:x,isRange:S,baseLine:C}=I(t=>CI(t,m,h,b,e.id))??{},w=JO();if(_!==`horizontal`&&_!==`vertical`||w==null||v!==`AreaChart`&&v!==`ComposedChart`)return null;var{height:T,width:E,x:D,y:O}=w;return!x||!x.length?null:A.createElement(qI,NI({},g,{activeDot:n,animationBegin:r,animationDuration:i,animationEasing:a,baseLine:C,connectNulls:o,dot:s,fill:c,fillOpacity:l,height:T,hide:u,layout:_,isAnimationActive:d,isRange:S,legendType:f,needClip:y,points:x,stroke:p,width:E,left:D,top:O,xAxisId:m,yAxisId:h}))}var XI=(e,t,n,r,i)=>{var a=n??t;if(b(a))return a;var o=e===`horizontal`?i:r,s=o.scale.domain();if(o.type===`number`){var c=Math.max(s[0],s[1]),l=Math.min(s[0],s[1]);return a===`dataMin`?l:a===`dataMax`||c<0?c:Math.max(Math.min(s[0],s[1]),0)}return a===`dataMin`?s[0]:a===`dataMax`?s[1]:s[0]};function ZI(e){var{areaSettings:{connectNulls:t,baseValue:n,dataKey:r},stackedData:i,layout:a,chartBaseValue:o,xAxis:s,yAxis:c,displayedData:l,dataStartIndex:u,xAxisTicks:d,yAxisTicks:f,bandSize:p}=e,m=i&&i.length,h=XI(a,o,n,s,c),g=a===`horizontal`,_=!1,v=l.map((e,n)=>{var a;m?a=i[u+n]:(a=z(e,r),Array.isArray(a)?_=!0:a=[h,a]);var o=a[1]==null||m&&!t&&z(e,r)==null;return g?{x:us({axis:s,ticks:d,bandSize:p,entry:e,index:n}),y:o?null:c.scale(a[1]),value:a,payload:e}:{x:o?null:s.scale(a[1]),y:us({axis:c,ticks:f,bandSize:p,entry:e,index:n}),value:a,payload:e}}),y=m||_?v.map(e=>{var t=Array.isArray(e.value)?e.value[0]:null;return g?{x:e.x,y:t!=null&&e.y!=null?c.scale(t):null,payload:e.payload}:{x:t==null?null:s.scale(t),y:e.y,payload:e.payload}}):g?c.scale(h):s.scale(h);return{points:v,baseLine:y,isRange:_}}function QI(e){var t=H(e,JI),n=B();return A.createElement(HD,{id:t.id,type:`area`},e=>A.createElement(A.Fragment,null,A.createElement(LD,{legendPayload:FI(t)}),A.createElement(FD,{fn:II,args:t}),A.createElement(ZD,{type:`area`,id:e,data:t.data,dataKey:t.dataKey,xAxisId:t.xAxisId,yAxisId:t.yAxisId,zAxisId:0,stackId:ls(t.stackId),hide:t.hide,barSize:void 0,baseValue:t.baseValue,isPanorama:n,connectNulls:t.connectNulls}),A.createElement(YI,NI({},t,{id:e}))))}var $I=A.memo(QI);$I.displayName=`Area`;function eL(e,t,n){return(t=tL(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function tL(e){var t=nL(e,`string`);return typeof t==`symbol`?t:t+``}function nL(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function rL(e){var t=F();return(0,A.useEffect)(()=>(t(RO(e)),()=>{t(zO(e))}),[e,t]),null}var iL=class extends A.Component{render(){return A.createElement(rL,{domain:this.props.domain,id:this.props.zAxisId,dataKey:this.props.dataKey,name:this.props.name,unit:this.props.unit,range:this.props.range,scale:this.props.scale,type:this.props.type,allowDuplicatedCategory:pv.allowDuplicatedCategory,allowDataOverflow:pv.allowDataOverflow,reversed:pv.reversed,includeHidden:pv.includeHidden})}};eL(iL,`displayName`,`ZAxis`),eL(iL,`defaultProps`,{zAxisId:0,range:pv.range,scale:pv.scale,type:pv.type});var aL=[`option`,`isActive`];function oL(){return oL=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},oL.apply(null,arguments)}function sL(e,t){if(e==null)return{};var n,r,i=cL(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function cL(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}function lL(e){var{option:t,isActive:n}=e,r=sL(e,aL);return typeof t==`string`?A.createElement(jD,oL({option:A.createElement(gn,oL({type:t},r)),isActive:n,shapeType:`symbols`},r)):A.createElement(jD,oL({option:t,isActive:n,shapeType:`symbols`},r))}var uL=(e,t,n,r,i,a,o)=>ab(e,`xAxis`,t,o),dL=(e,t,n,r,i,a,o)=>ib(e,`xAxis`,t,o),fL=(e,t,n,r,i,a,o)=>ab(e,`yAxis`,n,o),pL=(e,t,n,r,i,a,o)=>ib(e,`yAxis`,n,o),mL=(e,t,n,r)=>sb(e,`zAxis`,r,!1),hL=(e,t,n,r,i)=>i,gL=(e,t,n,r,i,a)=>a,_L=(e,t,n,r,i,a,o)=>yg(e,t,n,o),vL=L([yv,hL],(e,t)=>e.filter(e=>e.type===`scatter`).find(e=>e.id===t)),yL=L([_L,uL,dL,fL,pL,mL,vL,gL],(e,t,n,r,i,a,o,s)=>{var{chartData:c,dataStartIndex:l,dataEndIndex:u}=e;if(o!=null){var d=o?.data!=null&&o.data.length>0?o.data:c?.slice(l,u+1);if(!(d==null||t==null||r==null||n==null||i==null||n?.length===0||i?.length===0))return LL({displayedData:d,xAxis:t,yAxis:r,zAxis:a,scatterSettings:o,xAxisTicks:n,yAxisTicks:i,cells:s})}}),bL=[`onMouseEnter`,`onClick`,`onMouseLeave`],xL=[`id`],SL=[`animationBegin`,`animationDuration`,`animationEasing`,`hide`,`isAnimationActive`,`legendType`,`lineJointType`,`lineType`,`shape`,`xAxisId`,`yAxisId`,`zAxisId`];function CL(e,t){if(e==null)return{};var n,r,i=wL(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function wL(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}function TL(){return TL=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},TL.apply(null,arguments)}function EL(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function DL(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?EL(Object(n),!0).forEach(function(t){OL(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):EL(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function OL(e,t,n){return(t=kL(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function kL(e){var t=AL(e,`string`);return typeof t==`symbol`?t:t+``}function AL(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}var jL=e=>{var{dataKey:t,name:n,fill:r,legendType:i,hide:a}=e;return[{inactive:a,dataKey:t,type:i,color:r,value:bs(n,t),payload:e}]};function ML(e){var{points:t,props:n}=e,{line:r,lineType:i,lineJointType:a}=n;if(!r)return null;var o=j(n),s=M(r,!1),c,l;if(i===`joint`)c=t.map(e=>({x:e.cx,y:e.cy}));else if(i===`fitting`){var{xmin:u,xmax:d,a:f,b:p}=ee(t),m=e=>f*e+p;c=[{x:u,y:m(u)},{x:d,y:m(d)}]}var h=DL(DL(DL({},o),{},{fill:`none`,stroke:o&&o.fill},s),{},{points:c});return l=A.isValidElement(r)?A.cloneElement(r,h):typeof r==`function`?r(h):A.createElement(dl,TL({},h,{type:a})),A.createElement(N,{className:`recharts-scatter-line`,key:`recharts-scatter-line`},l)}function NL(e){var{showLabels:t,points:n,children:r}=e,i=Xs(),a=(0,A.useMemo)(()=>n?.map(e=>{var t={x:e.x,y:e.y,width:e.width,height:e.height};return DL(DL({},t),{},{value:void 0,payload:e.payload,viewBox:t,parentViewBox:i,fill:void 0})}),[i,n]);return A.createElement(Kw,{value:t?a:null},r)}function PL(e){var{points:t,allOtherScatterProps:n}=e,{shape:r,activeShape:i,dataKey:a}=n,o=I(Mx),{onMouseEnter:s,onClick:c,onMouseLeave:l}=n,u=CL(n,bL),d=MD(s,n.dataKey),f=ND(l),p=PD(c,n.dataKey);if(t==null)return null;var{id:m}=n,h=CL(n,xL),g=j(h);return A.createElement(A.Fragment,null,A.createElement(ML,{points:t,props:h}),t.map((e,t)=>{var n=i&&o===String(t),s=n?i:r,c=DL(DL(DL({key:`symbol-${t}`},g),e),{},{[js]:t,[Ms]:String(a)});return A.createElement(N,TL({className:`recharts-scatter-symbol`},le(u,e,t),{onMouseEnter:d(e,t),onMouseLeave:f(e,t),onClick:p(e,t),key:`symbol-${e?.cx}-${e?.cy}-${e?.size}-${t}`}),A.createElement(lL,TL({option:s,isActive:n},c)))}))}function FL(e){var{previousPointsRef:t,props:n}=e,{points:r,isAnimationActive:i,animationBegin:a,animationDuration:o,animationEasing:s}=n,c=t.current,l=fu(n,`recharts-scatter-`),[u,d]=(0,A.useState)(!1),f=(0,A.useCallback)(()=>{d(!1)},[]),p=(0,A.useCallback)(()=>{d(!0)},[]),m=!u;return A.createElement(NL,{showLabels:m,points:r},n.children,A.createElement(du,{animationId:l,begin:a,duration:o,isActive:i,easing:s,onAnimationEnd:f,onAnimationStart:p,key:l},e=>{var i=e===1?r:r?.map((t,n)=>{var r=c&&c[n];if(r){var i=E(r.cx,t.cx),a=E(r.cy,t.cy),o=E(r.size,t.size);return DL(DL({},t),{},{cx:i(e),cy:a(e),size:o(e)})}var s=E(0,t.size);return DL(DL({},t),{},{size:s(e)})});return e>0&&(t.current=i),A.createElement(N,null,A.createElement(PL,{points:i,allOtherScatterProps:n,showLabels:m}))}),A.createElement(Qw,{label:n.label}))}function IL(e){var{dataKey:t,points:n,stroke:r,strokeWidth:i,fill:a,name:o,hide:s,tooltipType:c}=e;return{dataDefinedOnItem:n?.map(e=>e.tooltipPayload),positions:n?.map(e=>e.tooltipPosition),settings:{stroke:r,strokeWidth:i,fill:a,nameKey:void 0,dataKey:t,name:bs(o,t),hide:s,type:c,color:a,unit:``}}}function LL(e){var{displayedData:t,xAxis:n,yAxis:r,zAxis:i,scatterSettings:a,xAxisTicks:o,yAxisTicks:s,cells:c}=e,l=k(n.dataKey)?a.dataKey:n.dataKey,u=k(r.dataKey)?a.dataKey:r.dataKey,d=i&&i.dataKey,f=i?i.range:iL.defaultProps.range,p=f&&f[0],m=n.scale.bandwidth?n.scale.bandwidth():0,h=r.scale.bandwidth?r.scale.bandwidth():0;return t.map((e,t)=>{var f=z(e,l),g=z(e,u),_=!k(d)&&z(e,d)||`-`,v=[{name:k(n.dataKey)?a.name:n.name||n.dataKey,unit:n.unit||``,value:f,payload:e,dataKey:l,type:a.tooltipType},{name:k(r.dataKey)?a.name:r.name||r.dataKey,unit:r.unit||``,value:g,payload:e,dataKey:u,type:a.tooltipType}];_!==`-`&&v.push({name:i.name||i.dataKey,unit:i.unit||``,value:_,payload:e,dataKey:d,type:a.tooltipType});var y=us({axis:n,ticks:o,bandSize:m,entry:e,index:t,dataKey:l}),b=us({axis:r,ticks:s,bandSize:h,entry:e,index:t,dataKey:u}),x=_===`-`?p:i.scale(_),S=Math.sqrt(Math.max(x,0)/Math.PI);return DL(DL({},e),{},{cx:y,cy:b,x:y-S,y:b-S,width:2*S,height:2*S,size:x,node:{x:f,y:g,z:_},tooltipPayload:v,tooltipPosition:{x:y,y:b},payload:e},c&&c[t]&&c[t].props)})}var RL=(e,t,n)=>({x:e.cx,y:e.cy,value:n===`x`?+e.node.x:+e.node.y,errorVal:z(e,t)});function zL(e){var{hide:t,points:n,className:r,needClip:i,xAxisId:a,yAxisId:o,id:s}=e,l=(0,A.useRef)(null);if(t)return null;var u=c(`recharts-scatter`,r),d=s;return A.createElement(N,{className:u,clipPath:i?`url(#clipPath-${d})`:null,id:s},i&&A.createElement(`defs`,null,A.createElement(jA,{clipPathId:d,xAxisId:a,yAxisId:o})),A.createElement(DA,{xAxisId:a,yAxisId:o,data:n,dataPointFormatter:RL,errorBarOffset:0},A.createElement(N,{key:`recharts-scatter-symbols`},A.createElement(FL,{props:e,previousPointsRef:l}))))}var BL={xAxisId:0,yAxisId:0,zAxisId:0,legendType:`circle`,lineType:`joint`,lineJointType:`linear`,data:[],shape:`circle`,hide:!1,isAnimationActive:!Yc.isSsr,animationBegin:0,animationDuration:400,animationEasing:`linear`};function VL(e){var t=H(e,BL),{animationBegin:n,animationDuration:r,animationEasing:i,hide:a,isAnimationActive:o,legendType:s,lineJointType:c,lineType:l,shape:u,xAxisId:d,yAxisId:f,zAxisId:p}=t,m=CL(t,SL),{needClip:h}=AA(d,f),g=(0,A.useMemo)(()=>ve(e.children,vC),[e.children]),_=B(),v=I(t=>yL(t,d,f,p,e.id,g,_));return h==null||v==null?null:A.createElement(A.Fragment,null,A.createElement(FD,{fn:IL,args:DL(DL({},e),{},{points:v})}),A.createElement(zL,TL({},m,{xAxisId:d,yAxisId:f,zAxisId:p,lineType:l,lineJointType:c,legendType:s,shape:u,hide:a,isAnimationActive:o,animationBegin:n,animationDuration:r,animationEasing:i,points:v,needClip:h})))}function HL(e){var t=H(e,BL),n=B();return A.createElement(HD,{id:t.id,type:`scatter`},e=>A.createElement(A.Fragment,null,A.createElement(LD,{legendPayload:jL(t)}),A.createElement(ZD,{type:`scatter`,id:e,data:t.data,xAxisId:t.xAxisId,yAxisId:t.yAxisId,zAxisId:t.zAxisId,dataKey:t.dataKey,hide:t.hide,name:t.name,tooltipType:t.tooltipType,isPanorama:n}),A.createElement(VL,TL({},t,{id:e}))))}var UL=A.memo(HL);UL.displayName=`Scatter`;var WL=[`dangerouslySetInnerHTML`,`ticks`],GL=[`id`],KL=[`domain`],qL=[`domain`];function JL(){return JL=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},JL.apply(null,arguments)}function YL(e,t){if(e==null)return{};var n,r,i=XL(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function XL(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}function ZL(e){var t=F();return(0,A.useEffect)(()=>(t(PO(e)),()=>{t(FO(e))}),[e,t]),null}var QL=e=>{var{xAxisId:t,className:n}=e,r=I(Gs),i=B(),a=`xAxis`,o=I(e=>Ny(e,a,t,i)),s=I(e=>nb(e,a,t,i)),l=I(e=>Vy(e,t)),u=I(e=>Ky(e,t)),d=I(e=>cv(e,t));if(l==null||u==null||d==null)return null;var{dangerouslySetInnerHTML:f,ticks:p}=e,m=YL(e,WL),{id:h}=d,g=YL(d,GL);return A.createElement(cF,JL({},m,g,{scale:o,x:u.x,y:u.y,width:l.width,height:l.height,className:c(`recharts-${a} ${a}`,n),viewBox:r,ticks:s}))},$L={allowDataOverflow:sv.allowDataOverflow,allowDecimals:sv.allowDecimals,allowDuplicatedCategory:sv.allowDuplicatedCategory,height:sv.height,hide:!1,mirror:sv.mirror,orientation:sv.orientation,padding:sv.padding,reversed:sv.reversed,scale:sv.scale,tickCount:sv.tickCount,type:sv.type,xAxisId:0},eR=A.memo(e=>{var t=H(e,$L);return A.createElement(A.Fragment,null,A.createElement(ZL,{interval:t.interval??`preserveEnd`,id:t.xAxisId,scale:t.scale,type:t.type,padding:t.padding,allowDataOverflow:t.allowDataOverflow,domain:t.domain,dataKey:t.dataKey,allowDuplicatedCategory:t.allowDuplicatedCategory,allowDecimals:t.allowDecimals,tickCount:t.tickCount,includeHidden:t.includeHidden??!1,reversed:t.reversed,ticks:t.ticks,height:t.height,orientation:t.orientation,mirror:t.mirror,hide:t.hide,unit:t.unit,name:t.name,angle:t.angle??0,minTickGap:t.minTickGap??5,tick:t.tick??!0,tickFormatter:t.tickFormatter}),A.createElement(QL,t))},(e,t)=>{var{domain:n}=e,r=YL(e,KL),{domain:i}=t,a=YL(t,qL);return TP(r,a)?Array.isArray(n)&&n.length===2&&Array.isArray(i)&&i.length===2?n[0]===i[0]&&n[1]===i[1]:TP({domain:n},{domain:i}):!1});eR.displayName=`XAxis`;var tR=[`dangerouslySetInnerHTML`,`ticks`],nR=[`id`],rR=[`domain`],iR=[`domain`];function aR(){return aR=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},aR.apply(null,arguments)}function oR(e,t){if(e==null)return{};var n,r,i=sR(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function sR(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}function cR(e){var t=F();return(0,A.useEffect)(()=>(t(IO(e)),()=>{t(LO(e))}),[e,t]),null}var lR=e=>{var{yAxisId:t,className:n,width:r,label:i}=e,a=(0,A.useRef)(null),o=(0,A.useRef)(null),s=I(Gs),l=B(),u=F(),d=`yAxis`,f=I(e=>Ny(e,d,t,l)),p=I(e=>Jy(e,t)),m=I(e=>qy(e,t)),h=I(e=>nb(e,d,t,l)),g=I(e=>dv(e,t));if((0,A.useLayoutEffect)(()=>{if(!(r!==`auto`||!p||Cw(i)||(0,A.isValidElement)(i)||g==null)){var e=a.current;if(e){var n=e.getCalculatedWidth();Math.round(p.width)!==Math.round(n)&&u(BO({id:t,width:n}))}}},[h,p,u,i,t,r,g]),p==null||m==null||g==null)return null;var{dangerouslySetInnerHTML:_,ticks:v}=e,y=oR(e,tR),{id:b}=g,x=oR(g,nR);return A.createElement(cF,aR({},y,x,{ref:a,labelRef:o,scale:f,x:m.x,y:m.y,tickTextProps:r===`auto`?{width:void 0}:{width:r},width:p.width,height:p.height,className:c(`recharts-${d} ${d}`,n),viewBox:s,ticks:h}))},uR={allowDataOverflow:uv.allowDataOverflow,allowDecimals:uv.allowDecimals,allowDuplicatedCategory:uv.allowDuplicatedCategory,hide:!1,mirror:uv.mirror,orientation:uv.orientation,padding:uv.padding,reversed:uv.reversed,scale:uv.scale,tickCount:uv.tickCount,type:uv.type,width:uv.width,yAxisId:0},dR=A.memo(e=>{var t=H(e,uR);return A.createElement(A.Fragment,null,A.createElement(cR,{interval:t.interval??`preserveEnd`,id:t.yAxisId,scale:t.scale,type:t.type,domain:t.domain,allowDataOverflow:t.allowDataOverflow,dataKey:t.dataKey,allowDuplicatedCategory:t.allowDuplicatedCategory,allowDecimals:t.allowDecimals,tickCount:t.tickCount,padding:t.padding,includeHidden:t.includeHidden??!1,reversed:t.reversed,ticks:t.ticks,width:t.width,orientation:t.orientation,mirror:t.mirror,hide:t.hide,unit:t.unit,name:t.name,angle:t.angle??0,minTickGap:t.minTickGap??5,tick:t.tick??!0,tickFormatter:t.tickFormatter}),A.createElement(lR,t))},(e,t)=>{var{domain:n}=e,r=oR(e,rR),{domain:i}=t,a=oR(t,iR);return TP(r,a)?Array.isArray(n)&&n.length===2&&Array.isArray(i)&&i.length===2?n[0]===i[0]&&n[1]===i[1]:TP({domain:n},{domain:i}):!1});dR.displayName=`YAxis`;var fR={begin:0,duration:1e3,easing:`ease`,isActive:!0,canBegin:!0,onAnimationEnd:()=>{},onAnimationStart:()=>{}};function pR(e){var t=H(e,fR),{animationId:n,from:r,to:i,attributeName:a,isActive:o,canBegin:s,duration:c,easing:l,begin:u,onAnimationEnd:d,onAnimationStart:f,children:p}=t,m=su(n+a,t.animationManager),[h,g]=(0,A.useState)(()=>o?r:i),_=(0,A.useRef)(!1),v=(0,A.useCallback)(()=>{g(r),f()},[r,f]);if((0,A.useEffect)(()=>{if(!o||!s)return kl;_.current=!0;var e=m.subscribe(g);return m.start([v,u,i,c,d]),()=>{m.stop(),e&&e(),d()}},[o,s,c,l,u,v,d,m,i,r]),!o)return p({[a]:i});if(!s)return p({[a]:r});if(_.current){var y=Il([a],c,l);return p({transition:y,[a]:h})}return p({[a]:r})}var mR=[`direction`,`width`,`dataKey`,`isAnimationActive`,`animationBegin`,`animationDuration`,`animationEasing`];function hR(){return hR=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},hR.apply(null,arguments)}function gR(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function _R(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?gR(Object(n),!0).forEach(function(t){vR(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):gR(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function vR(e,t,n){return(t=yR(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function yR(e){var t=bR(e,`string`);return typeof t==`symbol`?t:t+``}function bR(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function xR(e,t){if(e==null)return{};var n,r,i=SR(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function SR(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}function CR(e){var{direction:t,width:n,dataKey:r,isAnimationActive:i,animationBegin:a,animationDuration:o,animationEasing:s}=e,c=xR(e,mR),l=j(c),{data:u,dataPointFormatter:d,xAxisId:f,yAxisId:p,errorBarOffset:m}=OA(),h=WO(f),g=GO(p);if(h?.scale==null||g?.scale==null||u==null||t===`x`&&h.type!==`number`)return null;var _=u.map(e=>{var{x:c,y:u,value:f,errorVal:p}=d(e,r,t);if(!p||c==null||u==null)return null;var _=[],v,y;if(Array.isArray(p)?[v,y]=p:v=y=p,t===`x`){var{scale:b}=h,x=u+m,S=x+n,C=x-n,w=b(f-v),T=b(f+y);_.push({x1:T,y1:S,x2:T,y2:C}),_.push({x1:w,y1:x,x2:T,y2:x}),_.push({x1:w,y1:S,x2:w,y2:C})}else if(t===`y`){var{scale:E}=g,D=c+m,O=D-n,ee=D+n,k=E(f-v),te=E(f+y);_.push({x1:O,y1:te,x2:ee,y2:te}),_.push({x1:D,y1:k,x2:D,y2:te}),_.push({x1:O,y1:k,x2:ee,y2:k})}var ne=t===`x`?`scaleX`:`scaleY`,re=`${c+m}px ${u+m}px`;return A.createElement(N,hR({className:`recharts-errorBar`,key:`bar-${_.map(e=>`${e.x1}-${e.x2}-${e.y1}-${e.y2}`)}`},l),_.map(e=>{var n=i?{transformOrigin:re}:void 0;return A.createElement(pR,{animationId:`error-bar-${t}`,from:`${ne}(0)`,to:`${ne}(1)`,attributeName:`transform`,begin:a,easing:s,isActive:i,duration:o,key:`errorbar-${e.x1}-${e.x2}-${e.y1}-${e.y2}`},t=>A.createElement(`line`,hR({},e,{style:_R(_R({},n),t)})))}))});return A.createElement(N,{className:`recharts-errorBars`},_)}function wR(e){var t=nc();return e??(t==null?`x`:t===`horizontal`?`y`:`x`)}var TR={stroke:`black`,strokeWidth:1.5,width:5,offset:0,isAnimationActive:!0,animationBegin:0,animationDuration:400,animationEasing:`ease-in-out`};function ER(e){var t=wR(e.direction),{width:n,isAnimationActive:r,animationBegin:i,animationDuration:a,animationEasing:o}=H(e,TR);return A.createElement(A.Fragment,null,A.createElement(kA,{dataKey:e.dataKey,direction:t}),A.createElement(CR,hR({},e,{direction:t,width:n,isAnimationActive:r,animationBegin:i,animationDuration:a,animationEasing:o})))}var DR=class extends A.Component{render(){return A.createElement(ER,this.props)}};vR(DR,`defaultProps`,TR),vR(DR,`displayName`,`ErrorBar`);var OR=n((exports=>{var t=r();typeof Object.is==`function`&&Object.is,t.useSyncExternalStore,t.useRef,t.useEffect,t.useMemo,t.useDebugValue}));n(((exports,t)=>{t.exports=OR()}))();function kR(e){e()}function AR(){let e=null,t=null;return{clear(){e=null,t=null},notify(){kR(()=>{let t=e;for(;t;)t.callback(),t=t.next})},get(){let t=[],n=e;for(;n;)t.push(n),n=n.next;return t},subscribe(n){let r=!0,i=t={callback:n,next:null,prev:t};return i.prev?i.prev.next=i:e=i,function(){!r||e===null||(r=!1,i.next?i.next.prev=i.prev:t=i.prev,i.prev?i.prev.next=i.next:e=i.next)}}}}var jR={notify(){},get:()=>[]};function MR(e,t){let n,r=jR,i=0,a=!1;function o(e){u();let t=r.subscribe(e),n=!1;return()=>{n||(n=!0,t(),d())}}function s(){r.notify()}function c(){m.onStateChange&&m.onStateChange()}function l(){return a}function u(){i++,!n&&(n=t?t.addNestedSub(c):e.subscribe(c),r=AR())}function d(){i--,n&&i===0&&(n(),n=void 0,r.clear(),r=jR)}function f(){a||(a=!0,u())}function p(){a&&(a=!1,d())}let m={addNestedSub:o,notifyNestedSubs:s,handleChangeWrapper:c,isSubscribed:l,trySubscribe:f,tryUnsubscribe:p,getListeners:()=>r};return m}var NR=(()=>typeof window<`u`&&window.document!==void 0&&window.document.createElement!==void 0)(),PR=(()=>typeof navigator<`u`&&navigator.product===`ReactNative`)(),FR=(()=>NR||PR?A.useLayoutEffect:A.useEffect)();Object.defineProperty,Object.getOwnPropertyNames,Object.getOwnPropertySymbols,Object.getOwnPropertyDescriptor,Object.getPrototypeOf,Object.prototype;var IR=Symbol.for(`react-redux-context`),LR=typeof globalThis<`u`?globalThis:{};function RR(){if(!A.createContext)return{};let e=LR[IR]??=new Map,t=e.get(A.createContext);return t||(t=A.createContext(null),e.set(A.createContext,t)),t}var zR=RR();function BR(e){let{children:t,context:n,serverState:r,store:i}=e,a=A.useMemo(()=>{let e=MR(i);return{store:i,subscription:e,getServerState:r?()=>r:void 0}},[i,r]),o=A.useMemo(()=>i.getState(),[i]);FR(()=>{let{subscription:e}=a;return e.onStateChange=e.notifyNestedSubs,e.trySubscribe(),o!==i.getState()&&e.notifyNestedSubs(),()=>{e.tryUnsubscribe(),e.onStateChange=void 0}},[a,o]);let s=n||zR;return A.createElement(s.Provider,{value:a},t)}var VR=BR,HR=L([(e,t)=>t,V,G_,J_,Cx,Dx,$x,Us],lS),UR=e=>{var t=e.currentTarget.getBoundingClientRect(),n=t.width/e.currentTarget.offsetWidth,r=t.height/e.currentTarget.offsetHeight;return{chartX:Math.round((e.clientX-t.left)/n),chartY:Math.round((e.clientY-t.top)/r)}},WR=fa(`mouseClick`),GR=bo();GR.startListening({actionCreator:WR,effect:(e,t)=>{var n=e.payload,r=HR(t.getState(),UR(n));r?.activeIndex!=null&&t.dispatch(Eb({activeIndex:r.activeIndex,activeDataKey:void 0,activeCoordinate:r.activeCoordinate}))}});var KR=fa(`mouseMove`),qR=bo();qR.startListening({actionCreator:KR,effect:(e,t)=>{var n=e.payload,r=t.getState(),i=fb(r,r.tooltip.settings.shared),a=HR(r,UR(n));i===`axis`&&(a?.activeIndex==null?t.dispatch(Cb()):t.dispatch(Tb({activeIndex:a.activeIndex,activeDataKey:void 0,activeCoordinate:a.activeCoordinate})))}});function JR(e,t){return t instanceof HTMLElement?`HTMLElement <${t.tagName} class="${t.className}">`:t===window?`global.window`:t}var YR={accessibilityLayer:!0,barCategoryGap:`10%`,barGap:4,barSize:void 0,className:void 0,maxBarSize:void 0,stackOffset:`none`,syncId:void 0,syncMethod:`index`},XR=Ma({name:`rootProps`,initialState:YR,reducers:{updateOptions:(e,t)=>{e.accessibilityLayer=t.payload.accessibilityLayer,e.barCategoryGap=t.payload.barCategoryGap,e.barGap=t.payload.barGap??YR.barGap,e.barSize=t.payload.barSize,e.maxBarSize=t.payload.maxBarSize,e.stackOffset=t.payload.stackOffset,e.syncId=t.payload.syncId,e.syncMethod=t.payload.syncMethod,e.className=t.payload.className}}}),ZR=XR.reducer,{updateOptions:QR}=XR.actions,$R=Ma({name:`polarOptions`,initialState:null,reducers:{updatePolarOptions:(e,t)=>t.payload}}),{updatePolarOptions:ez}=$R.actions,tz=$R.reducer,nz=fa(`keyDown`),rz=fa(`focus`),iz=bo();iz.startListening({actionCreator:nz,effect:(e,t)=>{var n=t.getState();if(n.rootProps.accessibilityLayer!==!1){var{keyboardInteraction:r}=n.tooltip,i=e.payload;if(!(i!==`ArrowRight`&&i!==`ArrowLeft`&&i!==`Enter`)){var a=Number(Rb(r,nx(n))),o=Dx(n);if(i===`Enter`){var s=iS(n,`axis`,`hover`,String(r.index));t.dispatch(Ob({active:!r.active,activeIndex:r.index,activeDataKey:r.dataKey,activeCoordinate:s}));return}var c=cb(n)===`left-to-right`?1:-1,l=a+(i===`ArrowRight`?1:-1)*c;if(!(o==null||l>=o.length||l<0)){var u=iS(n,`axis`,`hover`,String(l));t.dispatch(Ob({active:!0,activeIndex:l.toString(),activeDataKey:void 0,activeCoordinate:u}))}}}}}),iz.startListening({actionCreator:rz,effect:(e,t)=>{var n=t.getState();if(n.rootProps.accessibilityLayer!==!1){var{keyboardInteraction:r}=n.tooltip;if(!r.active&&r.index==null){var i=`0`,a=iS(n,`axis`,`hover`,String(i));t.dispatch(Ob({activeDataKey:void 0,active:!0,activeIndex:i,activeCoordinate:a}))}}}});var az=fa(`externalEvent`),oz=bo();oz.startListening({actionCreator:az,effect:(e,t)=>{if(e.payload.handler!=null){var n=t.getState(),r={activeCoordinate:Lx(n),activeDataKey:Px(n),activeIndex:Mx(n),activeLabel:Nx(n),activeTooltipIndex:Mx(n),isTooltipActive:Rx(n)};e.payload.handler(r,e.payload.reactEvent)}}});var sz=L([Hb],e=>e.tooltipItemPayloads),cz=L([sz,Vb,(e,t,n)=>t,(e,t,n)=>n],(e,t,n,r)=>{var i=e.find(e=>e.settings.dataKey===r);if(i!=null){var{positions:a}=i;if(a!=null)return t(a,n)}}),lz=fa(`touchMove`),uz=bo();uz.startListening({actionCreator:lz,effect:(e,t)=>{var n=e.payload,r=t.getState(),i=fb(r,r.tooltip.settings.shared);if(i===`axis`){var a=HR(r,UR({clientX:n.touches[0].clientX,clientY:n.touches[0].clientY,currentTarget:n.currentTarget}));a?.activeIndex!=null&&t.dispatch(Tb({activeIndex:a.activeIndex,activeDataKey:void 0,activeCoordinate:a.activeCoordinate}))}else if(i===`item`){var o=n.touches[0],s=document.elementFromPoint(o.clientX,o.clientY);if(!s||!s.getAttribute)return;var c=s.getAttribute(js),l=s.getAttribute(`data-recharts-item-data-key`)??void 0,u=cz(t.getState(),c,l);t.dispatch(xb({activeDataKey:l,activeIndex:c,activeCoordinate:u}))}}});var dz=oi({brush:XM,cartesianAxis:VO,chartData:NS,errorBars:SA,graphicalItems:XD,layout:Do,legend:uc,options:ES,polarAxis:oE,polarOptions:tz,referenceElements:zN,rootProps:ZR,tooltip:kb}),fz=function(e){var t=arguments.length>1&&arguments[1]!==void 0?arguments[1]:`Chart`;return xa({reducer:dz,preloadedState:e,middleware:e=>e({serializableCheck:!1}).concat([GR.middleware,qR.middleware,iz.middleware,oz.middleware,uz.middleware]),devTools:Yc.devToolsEnabled&&{serialize:{replacer:JR},name:`recharts-${t}`}})};function pz(e){var{preloadedState:t,children:n,reduxStoreName:r}=e,i=B(),a=(0,A.useRef)(null);if(i)return n;a.current??=fz(t,r);var o=nr;return A.createElement(VR,{context:o,store:a.current},n)}function mz(e){var{layout:t,width:n,height:r,margin:i}=e,a=F(),o=B();return(0,A.useEffect)(()=>{o||(a(wo(t)),a(To({width:n,height:r})),a(Co(i)))},[a,o,t,n,r,i]),null}function hz(e){var t=F();return(0,A.useEffect)(()=>{t(QR(e))},[t,e]),null}var gz=[`children`];function _z(e,t){if(e==null)return{};var n,r,i=vz(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function vz(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}function yz(){return yz=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},yz.apply(null,arguments)}var bz={width:`100%`,height:`100%`},xz=(0,A.forwardRef)((e,t)=>{var n=$s(),r=ec(),i=Xc();if(!Qc(n)||!Qc(r))return null;var{children:a,otherAttributes:o,title:s,desc:c}=e,l=typeof o.tabIndex==`number`?o.tabIndex:i?0:void 0,u=typeof o.role==`string`?o.role:i?`application`:void 0;return A.createElement(Te,yz({},o,{title:s,desc:c,role:u,tabIndex:l,width:n,height:r,style:bz,ref:t}),a)}),Sz=e=>{var{children:t}=e,n=I(Ys);if(!n)return null;var{width:r,height:i,y:a,x:o}=n;return A.createElement(Te,{width:r,height:i,x:o,y:a},t)},Cz=(0,A.forwardRef)((e,t)=>{var{children:n}=e,r=_z(e,gz);return B()?A.createElement(Sz,null,n):A.createElement(xz,yz({ref:t},r),n)});function wz(){var e=F(),[t,n]=(0,A.useState)(null),r=I(Es);return(0,A.useEffect)(()=>{if(t!=null){var n=t.getBoundingClientRect().width/t.offsetWidth;Zc(n)&&n!==r&&e(Eo(n))}},[t,e,r]),n}function Tz(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function Ez(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?Tz(Object(n),!0).forEach(function(t){Dz(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Tz(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function Dz(e,t,n){return(t=Oz(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Oz(e){var t=kz(e,`string`);return typeof t==`symbol`?t:t+``}function kz(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}var Az=(0,A.forwardRef)((e,t)=>{var{children:n,className:r,height:i,onClick:a,onContextMenu:o,onDoubleClick:s,onMouseDown:l,onMouseEnter:u,onMouseLeave:d,onMouseMove:f,onMouseUp:p,onTouchEnd:m,onTouchMove:h,onTouchStart:g,style:_,width:v}=e,y=F(),[b,x]=(0,A.useState)(null),[S,C]=(0,A.useState)(null);GS();var w=wz(),T=(0,A.useCallback)(e=>{w(e),typeof t==`function`&&t(e),x(e),C(e)},[w,t,x,C]),E=(0,A.useCallback)(e=>{y(WR(e)),y(az({handler:a,reactEvent:e}))},[y,a]),D=(0,A.useCallback)(e=>{y(KR(e)),y(az({handler:u,reactEvent:e}))},[y,u]),O=(0,A.useCallback)(e=>{y(Cb()),y(az({handler:d,reactEvent:e}))},[y,d]),ee=(0,A.useCallback)(e=>{y(KR(e)),y(az({handler:f,reactEvent:e}))},[y,f]),k=(0,A.useCallback)(()=>{y(rz())},[y]),te=(0,A.useCallback)(e=>{y(nz(e.key))},[y]),ne=(0,A.useCallback)(e=>{y(az({handler:o,reactEvent:e}))},[y,o]),re=(0,A.useCallback)(e=>{y(az({handler:s,reactEvent:e}))},[y,s]),ie=(0,A.useCallback)(e=>{y(az({handler:l,reactEvent:e}))},[y,l]),ae=(0,A.useCallback)(e=>{y(az({handler:p,reactEvent:e}))},[y,p]),oe=(0,A.useCallback)(e=>{y(az({handler:g,reactEvent:e}))},[y,g]),se=(0,A.useCallback)(e=>{y(lz(e)),y(az({handler:h,reactEvent:e}))},[y,h]),ce=(0,A.useCallback)(e=>{y(az({handler:m,reactEvent:e}))},[y,m]);return A.createElement(vS.Provider,{value:b},A.createElement(Ae.Provider,{value:S},A.createElement(`div`,{className:c(`recharts-wrapper`,r),style:Ez({position:`relative`,cursor:`default`,width:v,height:i},_),onClick:E,onContextMenu:ne,onDoubleClick:re,onFocus:k,onKeyDown:te,onMouseDown:ie,onMouseEnter:D,onMouseLeave:O,onMouseMove:ee,onMouseUp:ae,onTouchEnd:ce,onTouchMove:se,onTouchStart:oe,ref:T},n)))}),jz=[`children`,`className`,`width`,`height`,`style`,`compact`,`title`,`desc`];function Mz(e,t){if(e==null)return{};var n,r,i=Nz(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function Nz(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}var Pz=(0,A.forwardRef)((e,t)=>{var{children:n,className:r,width:i,height:a,style:o,compact:s,title:c,desc:l}=e,u=Mz(e,jz),d=j(u);return s?A.createElement(Cz,{otherAttributes:d,title:c,desc:l},n):A.createElement(Az,{className:r,style:o,width:i,height:a,onClick:e.onClick,onMouseLeave:e.onMouseLeave,onMouseEnter:e.onMouseEnter,onMouseMove:e.onMouseMove,onMouseDown:e.onMouseDown,onMouseUp:e.onMouseUp,onContextMenu:e.onContextMenu,onDoubleClick:e.onDoubleClick,onTouchStart:e.onTouchStart,onTouchMove:e.onTouchMove,onTouchEnd:e.onTouchEnd},A.createElement(Cz,{otherAttributes:d,title:c,desc:l,ref:t},A.createElement(VN,null,n)))}),Fz=[`width`,`height`];function Iz(){return Iz=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Iz.apply(null,arguments)}function Lz(e,t){if(e==null)return{};var n,r,i=Rz(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function Rz(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}var zz={accessibilityLayer:!0,layout:`horizontal`,stackOffset:`none`,barCategoryGap:`10%`,barGap:4,margin:{top:5,right:5,bottom:5,left:5},reverseStackOrder:!1,syncMethod:`index`},Bz=(0,A.forwardRef)(function(e,t){var n=H(e.categoricalChartProps,zz),{width:r,height:i}=n,a=Lz(n,Fz);if(!Qc(r)||!Qc(i))return null;var{chartName:o,defaultTooltipEventType:s,validateTooltipEventTypes:c,tooltipPayloadSearcher:l,categoricalChartProps:u}=e,d={chartName:o,defaultTooltipEventType:s,validateTooltipEventTypes:c,tooltipPayloadSearcher:l,eventEmitter:void 0};return A.createElement(pz,{preloadedState:{options:d},reduxStoreName:u.id??o},A.createElement(BM,{chartData:u.data}),A.createElement(mz,{width:r,height:i,layout:n.layout,margin:n.margin}),A.createElement(hz,{accessibilityLayer:n.accessibilityLayer,barCategoryGap:n.barCategoryGap,maxBarSize:n.maxBarSize,stackOffset:n.stackOffset,barGap:n.barGap,barSize:n.barSize,syncId:n.syncId,syncMethod:n.syncMethod,className:n.className}),A.createElement(Pz,Iz({},a,{width:r,height:i,ref:t})))}),Vz=[`axis`],Hz=(0,A.forwardRef)((e,t)=>A.createElement(Bz,{chartName:`LineChart`,defaultTooltipEventType:`axis`,validateTooltipEventTypes:Vz,tooltipPayloadSearcher:wS,categoricalChartProps:e,ref:t})),Uz=[`axis`,`item`],Wz=(0,A.forwardRef)((e,t)=>A.createElement(Bz,{chartName:`BarChart`,defaultTooltipEventType:`axis`,validateTooltipEventTypes:Uz,tooltipPayloadSearcher:wS,categoricalChartProps:e,ref:t}));function Gz(e){var t=F();return(0,A.useEffect)(()=>{t(ez(e))},[t,e]),null}var Kz=[`width`,`height`,`layout`];function qz(){return qz=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},qz.apply(null,arguments)}function Jz(e,t){if(e==null)return{};var n,r,i=Yz(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function Yz(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}var Xz={accessibilityLayer:!0,stackOffset:`none`,barCategoryGap:`10%`,barGap:4,margin:{top:5,right:5,bottom:5,left:5},reverseStackOrder:!1,syncMethod:`index`,layout:`radial`},Zz=(0,A.forwardRef)(function(e,t){var n=H(e.categoricalChartProps,Xz),{width:r,height:i,layout:a}=n,o=Jz(n,Kz);if(!Qc(r)||!Qc(i))return null;var{chartName:s,defaultTooltipEventType:c,validateTooltipEventTypes:l,tooltipPayloadSearcher:u}=e,d={chartName:s,defaultTooltipEventType:c,validateTooltipEventTypes:l,tooltipPayloadSearcher:u,eventEmitter:void 0};return A.createElement(pz,{preloadedState:{options:d},reduxStoreName:n.id??s},A.createElement(BM,{chartData:n.data}),A.createElement(mz,{width:r,height:i,layout:a,margin:n.margin}),A.createElement(hz,{accessibilityLayer:n.accessibilityLayer,barCategoryGap:n.barCategoryGap,maxBarSize:n.maxBarSize,stackOffset:n.stackOffset,barGap:n.barGap,barSize:n.barSize,syncId:n.syncId,syncMethod:n.syncMethod,className:n.className}),A.createElement(Gz,{cx:n.cx,cy:n.cy,startAngle:n.startAngle,endAngle:n.endAngle,innerRadius:n.innerRadius,outerRadius:n.outerRadius}),A.createElement(Pz,qz({width:r,height:i},o,{ref:t})))}),Qz=[`item`],$z={layout:`centric`,startAngle:0,endAngle:360,cx:`50%`,cy:`50%`,innerRadius:0,outerRadius:`80%`},eB=(0,A.forwardRef)((e,t)=>{var n=H(e,$z);return A.createElement(Zz,{chartName:`PieChart`,defaultTooltipEventType:`item`,validateTooltipEventTypes:Qz,tooltipPayloadSearcher:wS,categoricalChartProps:n,ref:t})}),tB=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});function t(e){return typeof Buffer<`u`&&Buffer.isBuffer(e)}exports.isBuffer=t})),nB=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});function t(e){let t=e?.constructor,n=typeof t==`function`?t.prototype:Object.prototype;return e===n}exports.isPrototype=t})),rB=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=Bn();function n(e){return t.isTypedArray(e)}exports.isTypedArray=n})),iB=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=Mu();function n(e){let n=t.toFinite(e),r=n%1;return r?n-r:n}exports.toInteger=n})),aB=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=iB();function n(e,n){if(e=t.toInteger(e),e<1||!Number.isSafeInteger(e))return[];let r=Array(e);for(let t=0;t<e;t++)r[t]=typeof n==`function`?n(t):t;return r}exports.times=n})),oB=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=tB(),n=nB(),r=On(),i=rB(),a=aB();function o(e){if(e==null)return[];switch(typeof e){case`object`:case`function`:return r.isArrayLike(e)?l(e):n.isPrototype(e)?c(e):s(e);default:return s(Object(e))}}function s(e){let t=[];for(let n in e)t.push(n);return t}function c(e){return s(e).filter(e=>e!==`constructor`)}function l(e){let n=a.times(e.length,e=>`${e}`),r=new Set(n);return t.isBuffer(e)&&(r.add(`offset`),r.add(`parent`)),i.isTypedArray(e)&&(r.add(`buffer`),r.add(`byteLength`),r.add(`byteOffset`)),[...n,...s(e).filter(e=>!r.has(e))]}exports.keysIn=o})),sB=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=m(),n=l(),r=u(),i=d(),a=p();function o(e,t){if(e==null)return!0;switch(typeof t){case`symbol`:case`number`:case`object`:if(Array.isArray(t))return s(e,t);if(typeof t==`number`?t=i.toKey(t):typeof t==`object`&&(t=Object.is(t?.valueOf(),-0)?`-0`:String(t)),n.isUnsafeProperty(t))return!1;if(e?.[t]===void 0)return!0;try{return delete e[t],!0}catch{return!1}case`string`:if(e?.[t]===void 0&&r.isDeepKey(t))return s(e,a.toPath(t));if(n.isUnsafeProperty(t))return!1;try{return delete e[t],!0}catch{return!1}}}function s(e,r){let i=r.length===1?e:t.get(e,r.slice(0,-1)),a=r[r.length-1];if(i?.[a]===void 0)return!0;if(n.isUnsafeProperty(a))return!1;try{return delete i[a],!0}catch{return!1}}exports.unset=o})),cB=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=Ln();function n(e){let n=[];for(;e;)n.push(...t.getSymbols(e)),e=Object.getPrototypeOf(e);return n}exports.getSymbolsIn=n})),lB=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=On();function n(e,n=1){let r=[],i=Math.floor(n);if(!t.isArrayLike(e))return r;let a=(e,t)=>{for(let n=0;n<e.length;n++){let o=e[n];t<i&&(Array.isArray(o)||o?.[Symbol.isConcatSpreadable]||typeof o==`object`&&o&&Object.prototype.toString.call(o)===`[object Arguments]`)?a(Array.isArray(o)?o:Array.from(o),t+1):r.push(o)}};return a(Array.from(e),0),r}exports.flatten=n})),uB=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=Wn(),n=oB(),r=sB(),i=cB(),a=u(),o=lB(),s=sD();function c(e,...t){if(e==null)return{};t=o.flatten(t);let n=l(e,t);for(let e=0;e<t.length;e++){let i=t[e];switch(typeof i){case`object`:Array.isArray(i)||(i=Array.from(i));for(let e=0;e<i.length;e++){let t=i[e];r.unset(n,t)}break;case`string`:case`symbol`:case`number`:r.unset(n,i);break}}return n}function l(e,t){return t.some(e=>Array.isArray(e)||a.isDeepKey(e))?f(e):d(e)}function d(e){let t={},r=[...n.keysIn(e),...i.getSymbolsIn(e)];for(let n=0;n<r.length;n++){let i=r[n];t[i]=e[i]}return t}function f(e){let r={},a=[...n.keysIn(e),...i.getSymbolsIn(e)];for(let n=0;n<a.length;n++){let i=a[n];r[i]=t.cloneDeepWith(e[i],e=>{if(!s.isPlainObject(e))return e})}return r}exports.omit=c})),dB=n(((exports,t)=>{t.exports=uB().omit})),fB=e(dB()),pB=e(h()),mB=[`width`,`height`,`className`,`style`,`children`,`type`];function hB(e,t){if(e==null)return{};var n,r,i=gB(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function gB(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}function _B(){return _B=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},_B.apply(null,arguments)}function vB(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function $(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?vB(Object(n),!0).forEach(function(t){yB(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):vB(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function yB(e,t,n){return(t=bB(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function bB(e){var t=xB(e,`string`);return typeof t==`symbol`?t:t+``}function xB(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}var SB=`value`,CB=(e,t)=>(0,pB.default)(e,t),wB=function(e){return`${arguments.length>1&&arguments[1]!==void 0?arguments[1]:``}children[${e}]`},TB={chartName:`Treemap`,defaultTooltipEventType:`item`,validateTooltipEventTypes:[`item`],tooltipPayloadSearcher:CB,eventEmitter:void 0},EB=e=>{var{depth:t,node:n,index:r,dataKey:i,nameKey:a,nestedActiveTooltipIndex:o}=e,s=t===0?``:wB(r,o),{children:c}=n,l=t+1,u=c&&c.length?c.map((e,t)=>EB({depth:l,node:e,index:t,dataKey:i,nameKey:a,nestedActiveTooltipIndex:s})):null,d=c&&c.length?u.reduce((e,t)=>e+t[SB],0):v(n[i])||n[i]<=0?0:n[i];return $($({},n),{},{children:u,name:z(n,a,``),[SB]:d,depth:t,index:r,tooltipIndex:s})},DB=e=>({x:e.x,y:e.y,width:e.width,height:e.height}),OB=(e,t)=>{var n=t<0?0:t;return e.map(e=>{var t=e[SB]*n;return $($({},e),{},{area:v(t)||t<=0?0:t})})},kB=(e,t,n)=>{var r=t*t,i=e.area*e.area,{min:a,max:o}=e.reduce((e,t)=>({min:Math.min(e.min,t.area),max:Math.max(e.max,t.area)}),{min:1/0,max:0});return i?Math.max(r*o*n/i,i/(r*a*n)):1/0},AB=(e,t,n,r)=>{var i=t?Math.round(e.area/t):0;(r||i>n.height)&&(i=n.height);for(var a=n.x,o,s=0,c=e.length;s<c;s++)o=e[s],o.x=a,o.y=n.y,o.height=i,o.width=Math.min(i?Math.round(o.area/i):0,n.x+n.width-a),a+=o.width;return o.width+=n.x+n.width-a,$($({},n),{},{y:n.y+i,height:n.height-i})},jB=(e,t,n,r)=>{var i=t?Math.round(e.area/t):0;(r||i>n.width)&&(i=n.width);for(var a=n.y,o,s=0,c=e.length;s<c;s++)o=e[s],o.x=n.x,o.y=a,o.width=i,o.height=Math.min(i?Math.round(o.area/i):0,n.y+n.height-a),a+=o.height;return o&&(o.height+=n.y+n.height-a),$($({},n),{},{x:n.x+i,width:n.width-i})},MB=(e,t,n,r)=>t===n.width?AB(e,t,n,r):jB(e,t,n,r),NB=(e,t)=>{var{children:n}=e;if(n&&n.length){var r=DB(e),i=[],a=1/0,o,s,c=Math.min(r.width,r.height),l=OB(n,r.width*r.height/e[SB]),u=l.slice();for(i.area=0;u.length>0;)i.push(o=u[0]),i.area+=o.area,s=kB(i,c,t),s<=a?(u.shift(),a=s):(i.area-=i.pop().area,r=MB(i,c,r,!1),c=Math.min(r.width,r.height),i.length=i.area=0,a=1/0);return i.length&&=(r=MB(i,c,r,!0),i.area=0),$($({},e),{},{children:l.map(e=>NB(e,t))})}return e},PB={isAnimationFinished:!1,formatRoot:null,currentRoot:null,nestIndex:[]};function FB(e){var{content:t,nodeProps:n,type:r,colorPanel:i,onMouseEnter:a,onMouseLeave:o,onClick:s}=e;if(A.isValidElement(t))return A.createElement(N,{onMouseEnter:a,onMouseLeave:o,onClick:s},A.cloneElement(t,n));if(typeof t==`function`)return A.createElement(N,{onMouseEnter:a,onMouseLeave:o,onClick:s},t(n));var{x:c,y:l,width:u,height:d,index:f}=n,p=null;u>10&&d>10&&n.children&&r===`nest`&&(p=A.createElement(dT,{points:[{x:c+2,y:l+d/2},{x:c+6,y:l+d/2+3},{x:c+2,y:l+d/2+6}]}));var m=null,h=PC(n.name);u>20&&d>20&&h.width<u&&h.height<d&&(m=A.createElement(`text`,{x:c+8,y:l+d/2+7,fontSize:14},n.name));var g=i||As;return A.createElement(`g`,null,A.createElement(xu,_B({fill:n.depth<2?g[f%g.length]:`rgba(255,255,255,0)`,stroke:`#fff`},(0,fB.default)(n,[`children`]),{onMouseEnter:a,onMouseLeave:o,onClick:s,"data-recharts-item-index":n.tooltipIndex})),p,m)}function IB(e){var t=F(),n=e.nodeProps?{x:e.nodeProps.x+e.nodeProps.width/2,y:e.nodeProps.y+e.nodeProps.height/2}:null;return A.createElement(FB,_B({},e,{onMouseEnter:()=>{t(xb({activeIndex:e.nodeProps.tooltipIndex,activeDataKey:e.dataKey,activeCoordinate:n}))},onMouseLeave:()=>{},onClick:()=>{t(wb({activeIndex:e.nodeProps.tooltipIndex,activeDataKey:e.dataKey,activeCoordinate:n}))}}))}function LB(e){var{props:t,currentRoot:n}=e,{dataKey:r,nameKey:i,stroke:a,fill:o}=t;return{dataDefinedOnItem:n,positions:void 0,settings:{stroke:a,strokeWidth:void 0,fill:o,dataKey:r,nameKey:i,name:void 0,hide:!1,type:void 0,color:o,unit:``}}}var RB={top:0,right:0,bottom:0,left:0},zB=class extends A.PureComponent{constructor(){super(...arguments),yB(this,`state`,$({},PB)),yB(this,`handleAnimationEnd`,()=>{var{onAnimationEnd:e}=this.props;this.setState({isAnimationFinished:!0}),typeof e==`function`&&e()}),yB(this,`handleAnimationStart`,()=>{var{onAnimationStart:e}=this.props;this.setState({isAnimationFinished:!1}),typeof e==`function`&&e()}),yB(this,`handleTouchMove`,(e,t)=>{var n=t.touches[0],r=document.elementFromPoint(n.clientX,n.clientY);if(!(!r||!r.getAttribute)){var i=r.getAttribute(`data-recharts-item-index`),a=CB(this.state.formatRoot,i);if(a){var{dataKey:o,dispatch:s}=this.props,c={x:a.x+a.width/2,y:a.y+a.height/2};s(xb({activeIndex:i,activeDataKey:o,activeCoordinate:c}))}}})}static getDerivedStateFromProps(e,t){if(e.data!==t.prevData||e.type!==t.prevType||e.width!==t.prevWidth||e.height!==t.prevHeight||e.dataKey!==t.prevDataKey||e.aspectRatio!==t.prevAspectRatio){var n=EB({depth:0,node:{children:e.data,x:0,y:0,width:e.width,height:e.height},index:0,dataKey:e.dataKey,nameKey:e.nameKey}),r=NB(n,e.aspectRatio);return $($({},t),{},{formatRoot:r,currentRoot:n,nestIndex:[n],prevAspectRatio:e.aspectRatio,prevData:e.data,prevWidth:e.width,prevHeight:e.height,prevDataKey:e.dataKey,prevType:e.type})}return null}handleMouseEnter(e,t){t.persist();var{onMouseEnter:n}=this.props;n&&n(e,t)}handleMouseLeave(e,t){t.persist();var{onMouseLeave:n}=this.props;n&&n(e,t)}handleClick(e){var{onClick:t,type:n}=this.props;if(n===`nest`&&e.children){var{width:r,height:i,dataKey:a,nameKey:o,aspectRatio:s}=this.props,c=EB({depth:0,node:$($({},e),{},{x:0,y:0,width:r,height:i}),index:0,dataKey:a,nameKey:o,nestedActiveTooltipIndex:e.tooltipIndex}),l=NB(c,s),{nestIndex:u}=this.state;u.push(e),this.setState({formatRoot:l,currentRoot:c,nestIndex:u})}t&&t(e)}handleNestIndex(e,t){var{nestIndex:n}=this.state,{width:r,height:i,dataKey:a,nameKey:o,aspectRatio:s}=this.props,c=EB({depth:0,node:$($({},e),{},{x:0,y:0,width:r,height:i}),index:0,dataKey:a,nameKey:o,nestedActiveTooltipIndex:e.tooltipIndex}),l=NB(c,s);n=n.slice(0,t+1),this.setState({formatRoot:l,currentRoot:e,nestIndex:n})}renderItem(e,t,n){var{isAnimationActive:r,animationBegin:i,animationDuration:a,animationEasing:o,isUpdateAnimationActive:s,type:c,colorPanel:l,dataKey:u}=this.props,{isAnimationFinished:d}=this.state,{width:f,height:p,x:m,y:h,depth:g}=t,_=parseInt(`${(Math.random()*2-1)*f}`,10),v={};return(n||c===`nest`)&&(v={onMouseEnter:this.handleMouseEnter.bind(this,t),onMouseLeave:this.handleMouseLeave.bind(this,t),onClick:this.handleClick.bind(this,t)}),r?A.createElement(pR,{animationId:`treemap-${t.tooltipIndex}`,from:`translate(${_}px, ${_}px)`,to:`translate(0, 0)`,attributeName:`transform`,begin:i,easing:o,isActive:r,duration:a,onAnimationStart:this.handleAnimationStart,onAnimationEnd:this.handleAnimationEnd},n=>A.createElement(N,_B({},v,{style:n}),g>2&&!d?null:A.createElement(IB,{content:e,dataKey:u,nodeProps:$($({},t),{},{isAnimationActive:r,isUpdateAnimationActive:!s,width:f,height:p,x:m,y:h}),type:c,colorPanel:l}))):A.createElement(N,v,A.createElement(IB,{content:e,dataKey:u,nodeProps:$($({},t),{},{isAnimationActive:!1,isUpdateAnimationActive:!1,width:f,height:p,x:m,y:h}),type:c,colorPanel:l}))}renderNode(e,t){var{content:n,type:r}=this.props,i=$($($({},j(this.props)),t),{},{root:e}),a=!t.children||!t.children.length,{currentRoot:o}=this.state;return!(o.children||[]).filter(e=>e.depth===t.depth&&e.name===t.name).length&&e.depth&&r===`nest`?null:A.createElement(N,{key:`recharts-treemap-node-${i.x}-${i.y}-${i.name}`,className:`recharts-treemap-depth-${t.depth}`},this.renderItem(n,i,a),t.children&&t.children.length?t.children.map(e=>this.renderNode(t,e)):null)}renderAllNodes(){var{formatRoot:e}=this.state;return e?this.renderNode(e,e):null}renderNestIndex(){var{nameKey:e,nestIndexContent:t}=this.props,{nestIndex:n}=this.state;return A.createElement(`div`,{className:`recharts-treemap-nest-index-wrapper`,style:{marginTop:`8px`,textAlign:`center`}},n.map((n,r)=>{var i=(0,pB.default)(n,e,`root`),a=null;return A.isValidElement(t)&&(a=A.cloneElement(t,n,r)),a=typeof t==`function`?t(n,r):i,A.createElement(`div`,{onClick:this.handleNestIndex.bind(this,n,r),key:`nest-index-${C()}`,className:`recharts-treemap-nest-index-box`,style:{cursor:`pointer`,display:`inline-block`,padding:`0 7px`,background:`#000`,color:`#fff`,marginRight:`3px`}},a)}))}render(){var e=this.props,{width:t,height:n,className:r,style:i,children:a,type:o}=e,s=hB(e,mB),c=j(s);return A.createElement(vS.Provider,{value:this.state.tooltipPortal},A.createElement(FD,{fn:LB,args:{props:this.props,currentRoot:this.state.currentRoot}}),A.createElement(Az,{className:r,style:i,width:t,height:n,ref:e=>{this.state.tooltipPortal??this.setState({tooltipPortal:e})},onMouseEnter:void 0,onMouseLeave:void 0,onClick:void 0,onMouseMove:void 0,onMouseDown:void 0,onMouseUp:void 0,onContextMenu:void 0,onDoubleClick:void 0,onTouchStart:void 0,onTouchMove:this.handleTouchMove,onTouchEnd:void 0},A.createElement(Te,_B({},c,{width:t,height:o===`nest`?n-30:n}),this.renderAllNodes(),a),o===`nest`&&this.renderNestIndex()))}};yB(zB,`displayName`,`Treemap`),yB(zB,`defaultProps`,{aspectRatio:.5*(1+Math.sqrt(5)),dataKey:`value`,nameKey:`name`,type:`flat`,isAnimationActive:!Yc.isSsr,isUpdateAnimationActive:!Yc.isSsr,animationBegin:0,animationDuration:1500,animationEasing:`linear`});function BB(e){var t=F();return A.createElement(zB,_B({},e,{dispatch:t}))}function VB(e){var{width:t,height:n}=e;return!Qc(t)||!Qc(n)?null:A.createElement(pz,{preloadedState:{options:TB},reduxStoreName:e.className??`Treemap`},A.createElement(rc,{width:t,height:n}),A.createElement(ic,{margin:RB}),A.createElement(BB,e))}var HB=n((exports=>{Object.defineProperty(exports,Symbol.toStringTag,{value:`Module`});var t=Xn();function n(e,n){if(!e||!e.length)return 0;n!=null&&(n=t.iteratee(n));let r;for(let t=0;t<e.length;t++){let i=n?n(e[t]):e[t];i!==void 0&&(r===void 0?r=i:r+=i)}return r}exports.sumBy=n})),UB=n(((exports,t)=>{t.exports=HB().sumBy})),WB=e(ZT()),GB=e(UB()),KB=e(h()),qB=[`sourceX`,`sourceY`,`sourceControlX`,`targetX`,`targetY`,`targetControlX`,`linkWidth`],JB=[`width`,`height`,`className`,`style`,`children`];function YB(){return YB=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},YB.apply(null,arguments)}function XB(e,t){if(e==null)return{};var n,r,i=ZB(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function ZB(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}function QB(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function $B(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?QB(Object(n),!0).forEach(function(t){eV(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):QB(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function eV(e,t,n){return(t=tV(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function tV(e){var t=nV(e,`string`);return typeof t==`symbol`?t:t+``}function nV(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}var rV=(e,t)=>{var n=+e,r=t-n;return e=>n+r*e},iV=e=>e.y+e.dy/2,aV=e=>e&&e.value||0,oV=(e,t)=>t.reduce((t,n)=>t+aV(e[n]),0),sV=(e,t,n)=>n.reduce((n,r)=>{var i=t[r],a=e[i.source];return n+iV(a)*aV(t[r])},0),cV=(e,t,n)=>n.reduce((n,r)=>{var i=t[r],a=e[i.target];return n+iV(a)*aV(t[r])},0),lV=(e,t)=>e.y-t.y,uV=(e,t)=>{for(var n=[],r=[],i=[],a=[],o=0,s=e.length;o<s;o++){var c=e[o];c.source===t&&(i.push(c.target),a.push(o)),c.target===t&&(n.push(c.source),r.push(o))}return{sourceNodes:n,sourceLinks:r,targetLinks:a,targetNodes:i}},dV=(e,t)=>{for(var{targetNodes:n}=t,r=0,i=n.length;r<i;r++){var a=e[n[r]];a&&(a.depth=Math.max(t.depth+1,a.depth),dV(e,a))}},fV=(e,t,n)=>{for(var{nodes:r,links:i}=e,a=r.map((e,t)=>{var n=uV(i,t);return $B($B($B({},e),n),{},{value:Math.max(oV(i,n.sourceLinks),oV(i,n.targetLinks)),depth:0})}),o=0,s=a.length;o<s;o++){var c=a[o];c.sourceNodes.length||dV(a,c)}var l=(0,WB.default)(a,e=>e.depth).depth;if(l>=1)for(var u=(t-n)/l,d=0,f=a.length;d<f;d++){var p=a[d];p.targetNodes.length||(p.depth=l),p.x=p.depth*u,p.dx=n}return{tree:a,maxDepth:l}},pV=e=>{for(var t=[],n=0,r=e.length;n<r;n++){var i=e[n];t[i.depth]||(t[i.depth]=[]),t[i.depth].push(i)}return t},mV=(e,t,n,r)=>{for(var i=Math.min(...e.map(e=>(t-(e.length-1)*n)/(0,GB.default)(e,aV))),a=0,o=e.length;a<o;a++)for(var s=0,c=e[a].length;s<c;s++){var l=e[a][s];l.y=s,l.dy=l.value*i}return r.map(e=>$B($B({},e),{},{dy:aV(e)*i}))},hV=function(e,t,n){for(var r=arguments.length>3&&arguments[3]!==void 0?arguments[3]:!0,i=0,a=e.length;i<a;i++){var o=e[i],s=o.length;r&&o.sort(lV);for(var c=0,l=0;l<s;l++){var u=o[l],d=c-u.y;d>0&&(u.y+=d),c=u.y+u.dy+n}c=t+n;for(var f=s-1;f>=0;f--){var p=o[f],m=p.y+p.dy+n-c;if(m>0)p.y-=m,c=p.y;else break}}},gV=(e,t,n,r)=>{for(var i=0,a=t.length;i<a;i++)for(var o=t[i],s=0,c=o.length;s<c;s++){var l=o[s];if(l.sourceLinks.length){var u=oV(n,l.sourceLinks),d=sV(e,n,l.sourceLinks)/u;l.y+=(d-iV(l))*r}}},_V=(e,t,n,r)=>{for(var i=t.length-1;i>=0;i--)for(var a=t[i],o=0,s=a.length;o<s;o++){var c=a[o];if(c.targetLinks.length){var l=oV(n,c.targetLinks),u=cV(e,n,c.targetLinks)/l;c.y+=(u-iV(c))*r}}},vV=(e,t)=>{for(var n=0,r=e.length;n<r;n++){var i=e[n],a=0,o=0;i.targetLinks.sort((n,r)=>e[t[n].target].y-e[t[r].target].y),i.sourceLinks.sort((n,r)=>e[t[n].source].y-e[t[r].source].y);for(var s=0,c=i.targetLinks.length;s<c;s++){var l=t[i.targetLinks[s]];l&&(l.sy=a,a+=l.dy)}for(var u=0,d=i.sourceLinks.length;u<d;u++){var f=t[i.sourceLinks[u]];f&&(f.ty=o,o+=f.dy)}}},yV=e=>{var{data:t,width:n,height:r,iterations:i,nodeWidth:a,nodePadding:o,sort:s}=e,{links:c}=t,{tree:l}=fV(t,n,a),u=pV(l),d=mV(u,r,o,c);hV(u,r,o,s);for(var f=1,p=1;p<=i;p++)_V(l,u,d,f*=.99),hV(u,r,o,s),gV(l,u,d,f),hV(u,r,o,s);return vV(l,d),{nodes:l,links:d}},bV=(e,t)=>t===`node`?{x:+e.x+e.width/2,y:+e.y+e.height/2}:`sourceX`in e&&{x:(e.sourceX+e.targetX)/2,y:(e.sourceY+e.targetY)/2},xV=(e,t,n)=>{var{payload:r}=e;if(t===`node`)return{payload:r,name:z(r,n,``),value:z(r,`value`)};if(`source`in r&&r.source&&r.target){var i=z(r.source,n,``),a=z(r.target,n,``);return{payload:r,name:`${i} - ${a}`,value:z(r,`value`)}}return null},SV={chartName:`Sankey`,defaultTooltipEventType:`item`,validateTooltipEventTypes:[`item`],tooltipPayloadSearcher:(e,t,n,r)=>{if(!(t==null||typeof t!=`string`)){var[i,a]=t.split(`-`),o=(0,KB.default)(n,`${i}s[${a}]`);if(o)return xV(o,i,r)}},eventEmitter:void 0};function CV(e){var{dataKey:t,nameKey:n,stroke:r,strokeWidth:i,fill:a,name:o,data:s}=e;return{dataDefinedOnItem:s,positions:void 0,settings:{stroke:r,strokeWidth:i,fill:a,dataKey:t,name:o,nameKey:n,color:a,unit:``}}}var wV={top:0,right:0,bottom:0,left:0};function TV(e,t){if(A.isValidElement(e))return A.cloneElement(e,t);if(typeof e==`function`)return e(t);var{sourceX:n,sourceY:r,sourceControlX:i,targetX:a,targetY:o,targetControlX:s,linkWidth:c}=t,l=XB(t,qB);return A.createElement(`path`,YB({className:`recharts-sankey-link`,d:`
-          M${n},${r}
-          C${i},${r} ${s},${o} ${a},${o}
-        `,fill:`none`,stroke:`#333`,strokeWidth:c,strokeOpacity:`0.2`},j(l)))}var EV=e=>{var{link:t,nodes:n,left:r,top:i,i:a,linkContent:o,linkCurvature:s}=e,{sy:c,ty:l,dy:u}=t,d=n[t.source],f=n[t.target],p=d.x+d.dx+r,m=f.x+r,h=rV(p,m),g=h(s),_=h(1-s),v=d.y+c+u/2+i,y=f.y+l+u/2+i;return $B({sourceX:p,targetX:m,sourceY:v,targetY:y,sourceControlX:g,targetControlX:_,sourceRelativeY:c,targetRelativeY:l,linkWidth:u,index:a,payload:$B($B({},t),{},{source:d,target:f})},M(o,!1))};function DV(e){var{props:t,i:n,linkContent:r,onMouseEnter:i,onMouseLeave:a,onClick:o,dataKey:s}=e,c=bV(t,`link`),l=`link-${n}`,u=F();return A.createElement(N,{onMouseEnter:e=>{u(xb({activeIndex:l,activeDataKey:s,activeCoordinate:c})),i(t,e)},onMouseLeave:e=>{u(Sb()),a(t,e)},onClick:e=>{u(wb({activeIndex:l,activeDataKey:s,activeCoordinate:c})),o(t,e)}},TV(r,t))}function OV(e){var{modifiedLinks:t,links:n,linkContent:r,onMouseEnter:i,onMouseLeave:a,onClick:o,dataKey:s}=e;return A.createElement(N,{className:`recharts-sankey-links`,key:`recharts-sankey-links`},n.map((e,n)=>{var c=t[n];return A.createElement(DV,{key:`link-${e.source}-${e.target}-${e.value}`,props:c,linkContent:r,i:n,onMouseEnter:i,onMouseLeave:a,onClick:o,dataKey:s})}))}function kV(e,t){return A.isValidElement(e)?A.cloneElement(e,t):typeof e==`function`?e(t):A.createElement(xu,YB({className:`recharts-sankey-node`,fill:`#0088fe`,fillOpacity:`0.8`},j(t)))}var AV=e=>{var{node:t,nodeContent:n,top:r,left:i,i:a}=e,{x:o,y:s,dx:c,dy:l}=t;return $B($B({},M(n,!1)),{},{x:o+i,y:s+r,width:c,height:l,index:a,payload:t})};function jV(e){var{props:t,nodeContent:n,i:r,onMouseEnter:i,onMouseLeave:a,onClick:o,dataKey:s}=e,c=F(),l=bV(t,`node`),u=`node-${r}`;return A.createElement(N,{onMouseEnter:e=>{c(xb({activeIndex:u,activeDataKey:s,activeCoordinate:l})),i(t,e)},onMouseLeave:e=>{c(Sb()),a(t,e)},onClick:e=>{c(wb({activeIndex:u,activeDataKey:s,activeCoordinate:l})),o(t,e)}},kV(n,t))}function MV(e){var{modifiedNodes:t,nodeContent:n,onMouseEnter:r,onMouseLeave:i,onClick:a,dataKey:o}=e;return A.createElement(N,{className:`recharts-sankey-nodes`,key:`recharts-sankey-nodes`},t.map((e,t)=>A.createElement(jV,{props:e,nodeContent:n,i:t,onMouseEnter:r,onMouseLeave:i,onClick:a,dataKey:o})))}var NV=class extends A.PureComponent{constructor(){super(...arguments),eV(this,`state`,{nodes:[],links:[],modifiedLinks:[],modifiedNodes:[]})}static getDerivedStateFromProps(e,t){var{data:n,width:r,height:i,margin:a,iterations:o,nodeWidth:s,nodePadding:c,sort:l,linkCurvature:u}=e;if(n!==t.prevData||r!==t.prevWidth||i!==t.prevHeight||!TP(a,t.prevMargin)||o!==t.prevIterations||s!==t.prevNodeWidth||c!==t.prevNodePadding||l!==t.sort){var d=r-(a&&a.left||0)-(a&&a.right||0),f=i-(a&&a.top||0)-(a&&a.bottom||0),{links:p,nodes:m}=yV({data:n,width:d,height:f,iterations:o,nodeWidth:s,nodePadding:c,sort:l}),h=(0,KB.default)(a,`top`)||0,g=(0,KB.default)(a,`left`)||0,_=p.map((t,n)=>EV({link:t,nodes:m,i:n,top:h,left:g,linkContent:e.link,linkCurvature:u})),v=m.map((t,n)=>AV({node:t,nodeContent:e.node,i:n,top:h,left:g}));return $B($B({},t),{},{nodes:m,links:p,modifiedLinks:_,modifiedNodes:v,prevData:n,prevWidth:o,prevHeight:i,prevMargin:a,prevNodePadding:c,prevNodeWidth:s,prevIterations:o,prevSort:l})}return null}handleMouseEnter(e,t,n){var{onMouseEnter:r}=this.props;r&&r(e,t,n)}handleMouseLeave(e,t,n){var{onMouseLeave:r}=this.props;r&&r(e,t,n)}handleClick(e,t,n){var{onClick:r}=this.props;r&&r(e,t,n)}render(){var e=this.props,{width:t,height:n,className:r,style:i,children:a}=e,o=XB(e,JB);if(!Qc(t)||!Qc(n))return null;var{links:s,modifiedNodes:c,modifiedLinks:l}=this.state,u=j(o);return A.createElement(pz,{preloadedState:{options:SV},reduxStoreName:r??`Sankey`},A.createElement(FD,{fn:CV,args:this.props}),A.createElement(VM,{computedData:{links:l,nodes:c}}),A.createElement(rc,{width:t,height:n}),A.createElement(ic,{margin:wV}),A.createElement(vS.Provider,{value:this.state.tooltipPortal},A.createElement(Az,{className:r,style:i,width:t,height:n,ref:e=>{this.state.tooltipPortal??this.setState({tooltipPortal:e})},onMouseEnter:void 0,onMouseLeave:void 0,onClick:void 0,onMouseMove:void 0,onMouseDown:void 0,onMouseUp:void 0,onContextMenu:void 0,onDoubleClick:void 0,onTouchStart:void 0,onTouchMove:void 0,onTouchEnd:void 0},A.createElement(Te,YB({},u,{width:t,height:n}),a,A.createElement(OV,{links:s,modifiedLinks:l,linkContent:this.props.link,dataKey:this.props.dataKey,onMouseEnter:(e,t)=>this.handleMouseEnter(e,`link`,t),onMouseLeave:(e,t)=>this.handleMouseLeave(e,`link`,t),onClick:(e,t)=>this.handleClick(e,`link`,t)}),A.createElement(MV,{modifiedNodes:c,nodeContent:this.props.node,dataKey:this.props.dataKey,onMouseEnter:(e,t)=>this.handleMouseEnter(e,`node`,t),onMouseLeave:(e,t)=>this.handleMouseLeave(e,`node`,t),onClick:(e,t)=>this.handleClick(e,`node`,t)})))))}};eV(NV,`displayName`,`Sankey`),eV(NV,`defaultProps`,{nameKey:`name`,dataKey:`value`,nodePadding:10,nodeWidth:10,linkCurvature:.5,iterations:32,margin:{top:5,right:5,bottom:5,left:5},sort:!0});var PV=[`axis`],FV={layout:`centric`,startAngle:90,endAngle:-270,cx:`50%`,cy:`50%`,innerRadius:0,outerRadius:`80%`},IV=(0,A.forwardRef)((e,t)=>{var n=H(e,FV);return A.createElement(Zz,{chartName:`RadarChart`,defaultTooltipEventType:`axis`,validateTooltipEventTypes:PV,tooltipPayloadSearcher:wS,categoricalChartProps:n,ref:t})}),LV=[`item`],RV=(0,A.forwardRef)((e,t)=>A.createElement(Bz,{chartName:`ScatterChart`,defaultTooltipEventType:`item`,validateTooltipEventTypes:LV,tooltipPayloadSearcher:wS,categoricalChartProps:e,ref:t})),zV=[`axis`],BV=(0,A.forwardRef)((e,t)=>A.createElement(Bz,{chartName:`AreaChart`,defaultTooltipEventType:`axis`,validateTooltipEventTypes:zV,tooltipPayloadSearcher:wS,categoricalChartProps:e,ref:t})),VV=[`axis`,`item`],HV={layout:`radial`,startAngle:0,endAngle:360,cx:`50%`,cy:`50%`,innerRadius:0,outerRadius:`80%`},UV=(0,A.forwardRef)((e,t)=>{var n=H(e,HV);return A.createElement(Zz,{chartName:`RadialBarChart`,defaultTooltipEventType:`axis`,validateTooltipEventTypes:VV,tooltipPayloadSearcher:wS,categoricalChartProps:n,ref:t})}),WV=[`axis`],GV=(0,A.forwardRef)((e,t)=>A.createElement(Bz,{chartName:`ComposedChart`,defaultTooltipEventType:`axis`,validateTooltipEventTypes:WV,tooltipPayloadSearcher:wS,categoricalChartProps:e,ref:t})),KV=e(h());function qV(){return qV=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},qV.apply(null,arguments)}function JV(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function YV(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?JV(Object(n),!0).forEach(function(t){XV(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):JV(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function XV(e,t,n){return(t=ZV(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function ZV(e){var t=QV(e,`string`);return typeof t==`symbol`?t:t+``}function QV(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}var $V={fontWeight:`bold`,paintOrder:`stroke fill`,fontSize:`.75rem`,stroke:`#FFF`,fill:`black`,pointerEvents:`none`};function eH(e){if(!e.children||e.children.length===0)return 1;var t=e.children.map(e=>eH(e));return 1+Math.max(...t)}function tH(e){var t={};return e.forEach((e,n)=>{t[n]=e}),t}function nH(e){var{dataKey:t,nameKey:n,data:r,stroke:i,fill:a,positions:o}=e;return{dataDefinedOnItem:r.children,positions:tH(o),settings:{stroke:i,strokeWidth:void 0,fill:a,nameKey:n,dataKey:t,name:n?void 0:t,hide:!1,type:void 0,color:a,unit:``}}}var rH={top:0,right:0,bottom:0,left:0},iH=(e,t)=>(0,KV.default)(e,t),aH=function(e){return`${arguments.length>1&&arguments[1]!==void 0?arguments[1]:``}children[${e}]`},oH={options:{validateTooltipEventTypes:[`item`],defaultTooltipEventType:`item`,chartName:`Sunburst`,tooltipPayloadSearcher:iH,eventEmitter:void 0}},sH=e=>{var{className:t,data:n,children:r,width:i,height:a,padding:o=2,dataKey:s=`value`,nameKey:l=`name`,ringPadding:u=2,innerRadius:d=50,fill:f=`#333`,stroke:p=`#FFF`,textOptions:m=$V,outerRadius:h=Math.min(i,a)/2,cx:g=i/2,cy:_=a/2,startAngle:v=0,endAngle:y=360,onClick:b,onMouseEnter:x,onMouseLeave:S}=e,C=F(),w=cp([0,n[s]],[0,y]),T=eH(n),E=(h-d)/T,D=[],O=new Map([]),[ee,k]=(0,A.useState)(null);function te(e,t){x&&x(e,t),C(xb({activeIndex:e.tooltipIndex,activeDataKey:s,activeCoordinate:O.get(e.name)}))}function ne(e,t){S&&S(e,t),C(Sb())}function re(e){b&&b(e),C(wb({activeIndex:e.tooltipIndex,activeDataKey:s,activeCoordinate:O.get(e.name)}))}function ie(e,t){var n=arguments.length>2&&arguments[2]!==void 0?arguments[2]:1,{radius:r,innerR:i,initialAngle:a,childColor:c,nestedActiveTooltipIndex:l}=t,d=a;e&&e.forEach((e,t)=>{var a=n===1?`[${t}]`:aH(t,l),h=YV(YV({},e),{},{tooltipIndex:a}),v=w(e[s]),y=d,b=e?.fill??c??f,{x,y:S}=R(0,0,i+r/2,-(y+v-v/2));d+=v,D.push(A.createElement(`g`,{key:`sunburst-sector-${e.name}-${t}`},A.createElement(ku,{onClick:()=>re(h),onMouseEnter:e=>te(h,e),onMouseLeave:e=>ne(h,e),fill:b,stroke:p,strokeWidth:o,startAngle:y,endAngle:y+v,innerRadius:i,outerRadius:i+r,cx:g,cy:_}),A.createElement(sw,qV({},m,{alignmentBaseline:`middle`,textAnchor:`middle`,x:x+g,y:_-S}),e[s])));var{x:C,y:T}=R(g,_,i+r/2,y);return O.set(e.name,{x:C,y:T}),ie(e.children,{radius:r,innerR:i+r+u,initialAngle:y,childColor:b,nestedActiveTooltipIndex:a},n+1)})}ie(n.children,{radius:E,innerR:d,initialAngle:v});var ae=c(`recharts-sunburst`,t);return A.createElement(vS.Provider,{value:ee},A.createElement(Az,{className:t,width:i,height:a,ref:e=>{ee==null&&e!=null&&k(e)},onMouseEnter:void 0,onMouseLeave:void 0,onClick:void 0,onMouseMove:void 0,onMouseDown:void 0,onMouseUp:void 0,onContextMenu:void 0,onDoubleClick:void 0,onTouchStart:void 0,onTouchMove:void 0,onTouchEnd:void 0},A.createElement(Te,{width:i,height:a},A.createElement(N,{className:ae},D),A.createElement(FD,{fn:nH,args:{dataKey:s,data:n,stroke:p,fill:f,nameKey:l,positions:O}}),r)))},cH=e=>A.createElement(pz,{preloadedState:oH,reduxStoreName:e.className??`SunburstChart`},A.createElement(rc,{width:e.width,height:e.height}),A.createElement(ic,{margin:rH}),A.createElement(sH,e));function lH(){return lH=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},lH.apply(null,arguments)}function uH(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function dH(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?uH(Object(n),!0).forEach(function(t){fH(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):uH(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function fH(e,t,n){return(t=pH(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function pH(e){var t=mH(e,`string`);return typeof t==`symbol`?t:t+``}function mH(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function hH(e,t){var n=`${t.x||e.x}`,r=parseInt(n,10),i=`${t.y||e.y}`,a=parseInt(i,10),o=`${t?.height||e?.height}`,s=parseInt(o,10);return dH(dH(dH({},t),AD(e)),{},{height:s,x:r,y:a})}function gH(e){return A.createElement(jD,lH({shapeType:`trapezoid`,propTransformer:hH},e))}function _H(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function vH(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?_H(Object(n),!0).forEach(function(t){yH(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):_H(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function yH(e,t,n){return(t=bH(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function bH(e){var t=xH(e,`string`);return typeof t==`symbol`?t:t+``}function xH(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}var SH=L([Us,(e,t)=>t,vg],(e,t,n)=>{var{data:r,dataKey:i,nameKey:a,tooltipType:o,lastShapeType:s,reversed:c,customWidth:l,cells:u,presentationProps:d}=t,{chartData:f}=n,p;if(r!=null&&r.length>0?p=r:f!=null&&f.length>0&&(p=f),p&&p.length)p=p.map((e,t)=>vH(vH(vH({payload:e},d),e),u&&u[t]&&u[t].props));else if(u&&u.length)p=u.map(e=>vH(vH({},d),e.props));else return[];return UH({dataKey:i,nameKey:a,displayedData:p,tooltipType:o,lastShapeType:s,reversed:c,offset:e,customWidth:l})}),CH=e(dB()),wH=[`onMouseEnter`,`onClick`,`onMouseLeave`,`shape`,`activeShape`],TH=[`stroke`,`fill`,`legendType`,`hide`,`isAnimationActive`,`animationBegin`,`animationDuration`,`animationEasing`,`nameKey`,`lastShapeType`];function EH(){return EH=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},EH.apply(null,arguments)}function DH(e,t){if(e==null)return{};var n,r,i=OH(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)===-1&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}function OH(e,t){if(e==null)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(t.indexOf(r)!==-1)continue;n[r]=e[r]}return n}function kH(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function AH(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]==null?{}:arguments[t];t%2?kH(Object(n),!0).forEach(function(t){jH(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):kH(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function jH(e,t,n){return(t=MH(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function MH(e){var t=NH(e,`string`);return typeof t==`symbol`?t:t+``}function NH(e,t){if(typeof e!=`object`||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t||`default`);if(typeof r!=`object`)return r;throw TypeError(`@@toPrimitive must return a primitive value.`)}return(t===`string`?String:Number)(e)}function PH(e){var{dataKey:t,nameKey:n,stroke:r,strokeWidth:i,fill:a,name:o,hide:s,tooltipType:c,data:l}=e;return{dataDefinedOnItem:l,positions:e.trapezoids.map(e=>{var{tooltipPosition:t}=e;return t}),settings:{stroke:r,strokeWidth:i,fill:a,dataKey:t,name:o,nameKey:n,hide:s,type:c,color:a,unit:``}}}function FH(e){var{showLabels:t,trapezoids:n,children:r}=e,i=(0,A.useMemo)(()=>{if(t)return n?.map(e=>{var t={x:e.x,y:e.y,width:e.upperWidth,height:e.height};return AH(AH({},t),{},{value:e.name,payload:e.payload,parentViewBox:void 0,viewBox:t,fill:e.fill})})},[t,n]);return A.createElement(Kw,{value:i},r)}function IH(e){var{trapezoids:t,allOtherFunnelProps:n}=e,r=I(e=>tS(e,`item`,e.tooltip.settings.trigger,void 0)),{onMouseEnter:i,onClick:a,onMouseLeave:o,shape:s,activeShape:c}=n,l=DH(n,wH),u=MD(i,n.dataKey),d=ND(o),f=PD(a,n.dataKey);return A.createElement(A.Fragment,null,t.map((e,t)=>{var n=!!c&&r===String(t),i=n?c:s,a=AH(AH({},e),{},{option:i,isActive:n,stroke:e.stroke});return A.createElement(N,EH({className:`recharts-funnel-trapezoid`},le(l,e,t),{onMouseEnter:u(e,t),onMouseLeave:d(e,t),onClick:f(e,t),key:`trapezoid-${e?.x}-${e?.y}-${e?.name}-${e?.value}`}),A.createElement(gH,a))}))}function LH(e){var{previousTrapezoidsRef:t,props:n}=e,{trapezoids:r,isAnimationActive:i,animationBegin:a,animationDuration:o,animationEasing:s,onAnimationEnd:c,onAnimationStart:l}=n,u=t.current,[d,f]=(0,A.useState)(!1),p=!d,m=fu(r,`recharts-funnel-`),h=(0,A.useCallback)(()=>{typeof c==`function`&&c(),f(!1)},[c]),g=(0,A.useCallback)(()=>{typeof l==`function`&&l(),f(!0)},[l]);return A.createElement(FH,{showLabels:p,trapezoids:r},A.createElement(du,{animationId:m,begin:a,duration:o,isActive:i,easing:s,key:m,onAnimationStart:g,onAnimationEnd:h},e=>{var i=e===1?r:r.map((t,n)=>{var r=u&&u[n];return r?AH(AH({},t),{},{x:D(r.x,t.x,e),y:D(r.y,t.y,e),upperWidth:D(r.upperWidth,t.upperWidth,e),lowerWidth:D(r.lowerWidth,t.lowerWidth,e),height:D(r.height,t.height,e)}):AH(AH({},t),{},{x:D(t.x+t.upperWidth/2,t.x,e),y:D(t.y+t.height/2,t.y,e),upperWidth:D(0,t.upperWidth,e),lowerWidth:D(0,t.lowerWidth,e),height:D(0,t.height,e)})});return e>0&&(t.current=i),A.createElement(N,null,A.createElement(IH,{trapezoids:i,allOtherFunnelProps:n}))}),A.createElement(Qw,{label:n.label}),n.children)}function RH(e){var t=(0,A.useRef)(void 0);return A.createElement(LH,{props:e,previousTrapezoidsRef:t})}var zH=(e,t)=>{var{width:n,height:r,left:i,right:a,top:o,bottom:s}=t,c=r,l=n;return b(e)?l=e:typeof e==`string`&&(l=l*parseFloat(e)/100),{realWidth:l-i-a-50,realHeight:c-s-o,offsetX:(n-l)/2,offsetY:(r-c)/2}},BH=class extends A.PureComponent{render(){var{className:e}=this.props,t=c(`recharts-trapezoids`,e);return A.createElement(N,{className:t},A.createElement(RH,this.props))}},VH={stroke:`#fff`,fill:`#808080`,legendType:`rect`,hide:!1,isAnimationActive:!Yc.isSsr,animationBegin:400,animationDuration:1500,animationEasing:`ease`,nameKey:`name`,lastShapeType:`triangle`};function HH(e){var t=JO(),n=H(e,VH),{stroke:r,fill:i,legendType:a,hide:o,isAnimationActive:s,animationBegin:c,animationDuration:l,animationEasing:u,nameKey:d,lastShapeType:f}=n,p=DH(n,TH),m=j(e),h=ve(e.children,vC),g=(0,A.useMemo)(()=>({dataKey:e.dataKey,nameKey:d,data:e.data,tooltipType:e.tooltipType,lastShapeType:f,reversed:e.reversed,customWidth:e.width,cells:h,presentationProps:m}),[e.dataKey,d,e.data,e.tooltipType,f,e.reversed,e.width,h,m]),_=I(e=>SH(e,g));if(o||!_||!_.length||!t)return null;var{height:v,width:y}=t;return A.createElement(A.Fragment,null,A.createElement(FD,{fn:PH,args:AH(AH({},e),{},{trapezoids:_})}),A.createElement(BH,EH({},p,{stroke:r,fill:i,nameKey:d,lastShapeType:f,animationBegin:c,animationDuration:l,animationEasing:u,isAnimationActive:s,hide:o,legendType:a,height:v,width:y,trapezoids:_})))}function UH(e){var{dataKey:t,nameKey:n,displayedData:r,tooltipType:i,lastShapeType:a,reversed:o,offset:s,customWidth:c}=e,{left:l,top:u}=s,{realHeight:d,realWidth:f,offsetX:p,offsetY:m}=zH(c,s),h=Math.max.apply(null,r.map(e=>z(e,t,0))),g=r.length,_=d/g,v={x:s.left,y:s.top,width:s.width,height:s.height},y=r.map((e,o)=>{var s=z(e,t,0),c=z(e,n,o),d=s,y;o===g-1?s instanceof Array&&s.length===2?[d,y]=s:y=a===`rectangle`?d:0:(y=z(r[o+1],t,0),y instanceof Array&&([y]=y));var b=(h-d)*f/(2*h)+u+25+p,x=_*o+l+m,S=d/h*f,C=y/h*f,w=[{name:c,value:d,payload:e,dataKey:t,type:i}],T={x:b+S/2,y:x+_/2};return AH(AH({x:b,y:x,width:Math.max(S,C),upperWidth:S,lowerWidth:C,height:_,name:c,val:d,tooltipPayload:w,tooltipPosition:T},(0,CH.default)(e,[`width`])),{},{payload:e,parentViewBox:v,labelViewBox:{x:b+(S-C)/4,y:x,width:Math.abs(S-C)/2+Math.min(S,C),height:_}})});return o&&(y=y.map((e,t)=>{var n=e.y-t*_+(g-1-t)*_;return AH(AH({},e),{},{upperWidth:e.lowerWidth,lowerWidth:e.upperWidth,x:e.x-(e.lowerWidth-e.upperWidth)/2,y:e.y-t*_+(g-1-t)*_,tooltipPosition:AH(AH({},e.tooltipPosition),{},{y:n+_/2}),labelViewBox:AH(AH({},e.labelViewBox),{},{y:n})})})),y}var WH=class extends A.PureComponent{render(){return A.createElement(HH,this.props)}};jH(WH,`displayName`,`Funnel`),jH(WH,`defaultProps`,VH);var GH=[`item`],KH=(0,A.forwardRef)((e,t)=>A.createElement(Bz,{chartName:`FunnelChart`,defaultTooltipEventType:`item`,validateTooltipEventTypes:GH,tooltipPayloadSearcher:wS,categoricalChartProps:e,ref:t}));export{Sl as $,YO as A,JT as B,wP as C,MM as D,bN as E,ZO as F,Aw as G,dT as H,DO as I,_C as J,sw as K,_D as L,qO as M,JO as N,oj as O,XO as P,xu as Q,YE as R,cF as S,eP as T,nT as U,pT as V,Zw as W,__ as X,iC as Y,ku as Z,UL as _,UV as a,$s as at,gI as b,IV as c,gn as ct,eB as d,dl as et,Wz as f,eR as g,dR as h,GV as i,ec as it,KO as j,qk as k,NV as l,N as lt,DR as m,WH as n,Ic as nt,BV as o,tc as ot,Hz as p,vC as q,cH as r,Dc as rt,RV as s,wn as st,KH as t,Yc as tt,VB as u,Te as ut,iL as v,fP as w,AF as x,$I as y,OE as z};
\ No newline at end of file
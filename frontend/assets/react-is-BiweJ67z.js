@@ -1 +0,0 @@
-import{t as e}from"./rolldown-runtime-D_juG1Xi.js";var t=e((exports=>{var t=Symbol.for(`react.transitional.element`),n=Symbol.for(`react.portal`),r=Symbol.for(`react.fragment`),i=Symbol.for(`react.strict_mode`),a=Symbol.for(`react.profiler`),o=Symbol.for(`react.consumer`),s=Symbol.for(`react.context`),c=Symbol.for(`react.forward_ref`),l=Symbol.for(`react.suspense`),u=Symbol.for(`react.suspense_list`),d=Symbol.for(`react.memo`),f=Symbol.for(`react.lazy`),p=Symbol.for(`react.view_transition`),m=Symbol.for(`react.client.reference`);function h(e){if(typeof e==`object`&&e){var m=e.$$typeof;switch(m){case t:switch(e=e.type,e){case r:case a:case i:case l:case u:case p:return e;default:switch(e&&=e.$$typeof,e){case s:case c:case f:case d:return e;case o:return e;default:return m}}case n:return m}}}exports.ContextConsumer=o,exports.ContextProvider=s,exports.Element=t,exports.ForwardRef=c,exports.Fragment=r,exports.Lazy=f,exports.Memo=d,exports.Portal=n,exports.Profiler=a,exports.StrictMode=i,exports.Suspense=l,exports.SuspenseList=u,exports.isContextConsumer=function(e){return h(e)===o},exports.isContextProvider=function(e){return h(e)===s},exports.isElement=function(e){return typeof e==`object`&&!!e&&e.$$typeof===t},exports.isForwardRef=function(e){return h(e)===c},exports.isFragment=function(e){return h(e)===r},exports.isLazy=function(e){return h(e)===f},exports.isMemo=function(e){return h(e)===d},exports.isPortal=function(e){return h(e)===n},exports.isProfiler=function(e){return h(e)===a},exports.isStrictMode=function(e){return h(e)===i},exports.isSuspense=function(e){return h(e)===l},exports.isSuspenseList=function(e){return h(e)===u},exports.isValidElementType=function(e){return!!(typeof e==`string`||typeof e==`function`||e===r||e===a||e===i||e===l||e===u||typeof e==`object`&&e&&(e.$$typeof===f||e.$$typeof===d||e.$$typeof===s||e.$$typeof===o||e.$$typeof===c||e.$$typeof===m||e.getModuleId!==void 0))},exports.typeOf=h})),n=e(((exports,n)=>{n.exports=t()}));export{n as t};
\ No newline at end of file
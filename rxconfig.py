@@ -1,8 +1,13 @@
+import os
+
 import reflex as rx
 
 config = rx.Config(
     app_name="OStaffSync",
      api_url="https://ostaffsync-backend.onrender.com",
+    # Set REDIS_URL (e.g. redis://localhost:6379/0) to keep client state in
+    # Redis and share cache invalidations between backend workers.
+    redis_url=os.environ.get("REDIS_URL") or None,
     plugins=[
         rx.plugins.SitemapPlugin(),
         rx.plugins.TailwindV4Plugin(),
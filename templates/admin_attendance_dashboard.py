@@ -1,13 +1,57 @@
 # admin_attendance_dashboard.py
 import datetime
 from datetime import date, timedelta
+import numpy as np
 import reflex as rx
 from components import dashboard_navbar, admin_dash_side_nav
-import duckdb
-
-# ---------------- DATABASE CONNECTION ----------------
-conn = duckdb.connect(database="hrms.duckdb")
-
+from database_connections import aio, attendance_calendar, cache
+
+# Pending leave requests fetched per "Load more" click.
+LEAVE_PAGE_SIZE = 50
+
+# Employees (heatmap rows) fetched per "Load more" click.
+HEATMAP_PAGE_SIZE = 50
+
+# attendance_calendar status code -> label shown in a heatmap cell.
+HEATMAP_LABELS = np.array(attendance_calendar.STATUSES, dtype=object)
+
+# The tenant's active employees for the report, served from the query cache
+# until the employee list changes.
+ACTIVE_USERS_SQL = "SELECT user_id, name, email, role FROM users WHERE tenant_id = ? AND status = 'active' ORDER BY name"
+
+# Every active employee with the selected day's first check-in / last
+# check-out, formatted for the table.
+DAILY_ATTENDANCE_SQL = """
+    SELECT
+        u.user_id,
+        u.name,
+        u.email,
+        COALESCE(NULLIF(u.role, ''), 'N/A') AS role,
+        COALESCE(strftime(s.first_in, '%H:%M:%S'), '-') AS check_in,
+        COALESCE(strftime(s.last_out, '%H:%M:%S'), '-') AS check_out,
+        CASE WHEN s.first_in IS NULL THEN 'Absent' ELSE 'Present' END AS status
+    FROM users u
+    LEFT JOIN attendance_daily_summary s
+        ON s.tenant_id = u.tenant_id AND s.user_id = u.user_id AND s.date = ?
+    WHERE u.tenant_id = ? AND u.status = 'active'
+    ORDER BY u.name
+"""
+
+# One row per day of the month for one employee; days without a summary row
+# are absent.
+MONTHLY_ATTENDANCE_SQL = """
+    SELECT
+        strftime(d.day, '%Y-%m-%d') AS date,
+        CASE WHEN s.date IS NULL THEN 'Absent'
+             ELSE COALESCE(strftime(s.first_in, '%H:%M'), 'N/A') END AS check_in,
+        COALESCE(strftime(s.last_out, '%H:%M'), 'N/A') AS check_out,
+        CASE WHEN s.date IS NULL THEN 'Absent'
+             ELSE COALESCE(NULLIF(s.status, ''), 'Present') END AS status
+    FROM generate_series(CAST(? AS DATE), CAST(? AS DATE), INTERVAL 1 DAY) AS d(day)
+    LEFT JOIN attendance_daily_summary s
+        ON s.tenant_id = ? AND s.user_id = ? AND s.date = CAST(d.day AS DATE)
+    ORDER BY d.day
+"""
 
 # ---------- REUSABLE CARD COMPONENT ----------
 def metric_card(icon_tag: str, value: rx.Var | str | int | float, label: str, color: str) -> rx.Component:
@@ -51,6 +95,7 @@ class AttendanceDashboardState(admin_dash_side_nav.AdminState):
     start_date: str = date.today().replace(day=1).strftime("%Y-%m-%d")
     end_date: str = date.today().strftime("%Y-%m-%d")
     report_data: list[dict] = []
+    report_histogram: list[dict] = []
     show_report: bool = False
 
     total_employees: int = 0
@@ -58,8 +103,17 @@ class AttendanceDashboardState(admin_dash_side_nav.AdminState):
     absent_today: int = 0
     attendance_rate: float = 0.0
 
+    # Month heatmap: one row of day cells per employee
+    heatmap_days: list[str] = []
+    heatmap_rows: list[dict] = []
+    has_more_heatmap: bool = False
+    _heatmap_cursor: list[str] = []
+
     # Leave management
     leave_requests: list[dict] = []
+    selected_leave_ids: list[str] = []
+    has_more_leaves: bool = False
+    _leave_cursor: list[str] = []
 
     # ----------------- Reactive helpers -----------------
     @rx.var
@@ -85,18 +139,22 @@ class AttendanceDashboardState(admin_dash_side_nav.AdminState):
         ]
 
     # ----------------- Lifecycle / Actions -----------------
-    def on_mount(self):
-        self.load_attendance()
-        self.load_leave_requests()
+    async def on_mount(self):
+        await self.load_attendance()
+        await self.load_heatmap()
+        await self.load_leave_requests()
 
-    def on_date_change(self, new_date: str):
+    async def on_date_change(self, new_date: str):
+        month_changed = new_date[:7] != self.date_selected[:7]
         self.date_selected = new_date
         self.selected_user_id = None
         self.selected_user_name = ""
         self.monthly_attendance = []
-        self.load_attendance()
+        await self.load_attendance()
+        if month_changed:
+            await self.load_heatmap()
 
-    def set_selected_user_id(self, value: str):
+    async def set_selected_user_id(self, value: str):
         print(f"valur {value}")
         try:
             if value is None or value == "":
@@ -118,7 +176,7 @@ class AttendanceDashboardState(admin_dash_side_nav.AdminState):
             if emp.get("user_id") == user_id:
                 self.selected_user_name = emp.get("name", "")
                 break
-        self.get_monthly_attendance()
+        await self.get_monthly_attendance()
 
     def set_start_date(self, value: str):
         self.start_date = value
@@ -126,7 +184,7 @@ class AttendanceDashboardState(admin_dash_side_nav.AdminState):
     def set_end_date(self, value: str):
         self.end_date = value
 
-    def generate_report(self):
+    async def generate_report(self):
         if not getattr(self, "tenant_id", None):
             print("[REPORT] tenant_id not set; cannot generate report.")
             return
@@ -141,52 +199,96 @@ class AttendanceDashboardState(admin_dash_side_nav.AdminState):
         if end_dt < start_dt:
             print("[REPORT] end date must be >= start date")
             self.report_data = []
+            self.report_histogram = []
             self.show_report = False
             return
 
         total_days = (end_dt - start_dt).days + 1
 
-        users_rows = conn.execute(
-            "SELECT user_id, name, email, role FROM users WHERE tenant_id = ? AND status = 'active' ORDER BY name",
-            (self.tenant_id,),
-        ).fetchall()
-
-        report = []
-        for u in users_rows:
-            user_id, name, email, role = u
-            present_days = conn.execute(
-                "SELECT COUNT(*) FROM attendance WHERE tenant_id = ? AND user_id = ? AND date >= ? AND date <= ?",
-                (self.tenant_id, user_id, start_dt, end_dt),
-            ).fetchone()[0]
-            absent_days = total_days - present_days
-            rate = round((present_days / total_days) * 100, 2) if total_days > 0 else 0.0
-
-            if rate > 80:
-                color = "green"
-            elif rate >= 50:
-                color = "orange"
-            else:
-                color = "red"
-
-            report.append({
-                "user_id": user_id,
-                "name": name,
-                "email": email,
-                "role": role or "N/A",
-                "total_days": total_days,
-                "present_days": present_days,
-                "absent_days": absent_days,
-                "attendance_rate": f"{rate}%",
-                "attendance_rate_pct": rate,
-                "rate_color": color,
-            })
+        users_rows = await cache.fetchall("users", ACTIVE_USERS_SQL, (self.tenant_id,), tenant_id=self.tenant_id)
+
+        def build_report(cur, tenant_id):
+            # One grouped pass over the daily summary instead of a COUNT(*)
+            # per user: the (user_id) grouping set feeds the per-employee
+            # breakdown and the (date) grouping set the per-day histogram.
+            agg_rows = cur.execute(
+                """
+                SELECT
+                    user_id,
+                    date,
+                    COUNT(*) AS days,
+                    COUNT(*) FILTER (WHERE status = 'present') AS present,
+                    COUNT(*) FILTER (WHERE status = 'Half day') AS half_day,
+                    COUNT(*) FILTER (WHERE status = 'remote') AS remote,
+                    COUNT(*) FILTER (WHERE status = 'leave') AS on_leave,
+                    COUNT(*) FILTER (WHERE status = 'absent') AS absent
+                FROM attendance_daily_summary
+                WHERE tenant_id = ? AND date >= ? AND date <= ?
+                GROUP BY GROUPING SETS ((user_id), (date))
+                """,
+                (tenant_id, start_dt, end_dt),
+            ).fetchall()
+
+            per_user = {}
+            per_day = {}
+            for user_id, day, *counts in agg_rows:
+                if day is None:
+                    per_user[user_id] = counts
+                else:
+                    per_day[day] = counts
+
+            report = []
+            for user_id, name, email, role in users_rows:
+                present_days, present, half_day, remote, on_leave, _ = per_user.get(user_id, (0,) * 6)
+                absent_days = total_days - present_days
+                rate = round((present_days / total_days) * 100, 2) if total_days > 0 else 0.0
+
+                if rate > 80:
+                    color = "green"
+                elif rate >= 50:
+                    color = "orange"
+                else:
+                    color = "red"
+
+                report.append({
+                    "user_id": user_id,
+                    "name": name,
+                    "email": email,
+                    "role": role or "N/A",
+                    "total_days": total_days,
+                    "present_days": present_days,
+                    "absent_days": absent_days,
+                    "present": present,
+                    "half_day": half_day,
+                    "remote": remote,
+                    "leave": on_leave,
+                    "attendance_rate": f"{rate}%",
+                    "attendance_rate_pct": rate,
+                    "rate_color": color,
+                })
+
+            histogram = []
+            for offset in range(total_days):
+                day = start_dt + timedelta(days=offset)
+                _, present, half_day, remote, on_leave, absent = per_day.get(day, (0,) * 6)
+                histogram.append({
+                    "day": day.strftime("%m-%d"),
+                    "present": present,
+                    "half_day": half_day,
+                    "remote": remote,
+                    "leave": on_leave,
+                    "absent": absent,
+                })
+            return report, histogram
 
+        report, histogram = await aio.run_read(build_report, self.tenant_id, tenant_id=self.tenant_id)
         self.report_data = report
+        self.report_histogram = histogram
         self.show_report = True
         print(f"[REPORT] Generated: {len(report)} rows for {start_dt} to {end_dt}")
 
     # ----------------- Attendance Methods -----------------
-    def load_attendance(self):
+    async def load_attendance(self):
         if not getattr(self, "tenant_id", None):
             print("[LOAD] tenant_id not set; skip loading attendance.")
             return
@@ -197,42 +299,12 @@ class AttendanceDashboardState(admin_dash_side_nav.AdminState):
             print("[LOAD] invalid date_selected format:", e)
             return
 
-        rows = conn.execute(
-            """
-            SELECT 
-                u.user_id, u.name, u.email, u.role,
-                a.check_in, a.check_out
-            FROM users u
-            LEFT JOIN (
-                SELECT tenant_id, user_id, check_in, check_out
-                FROM attendance
-                WHERE date = ?
-                AND rowid IN (
-                    SELECT MAX(rowid) FROM attendance WHERE date = ? GROUP BY user_id
-                )
-            ) a ON u.user_id = a.user_id AND u.tenant_id = a.tenant_id
-            WHERE u.tenant_id = ? AND u.status = 'active'
-            ORDER BY u.name
-            """,
-            (target_date, target_date, self.tenant_id),
-        ).fetchall()
-
-        data = []
-        present_count = 0
-        for r in rows:
-            user_id, name, email, role, check_in, check_out = r
-            status = "Present" if check_in else "Absent"
-            if status == "Present":
-                present_count += 1
-            data.append({
-                "user_id": user_id,
-                "name": name,
-                "email": email,
-                "role": role or "N/A",
-                "check_in": check_in.strftime("%H:%M:%S") if check_in else "-",
-                "check_out": check_out.strftime("%H:%M:%S") if check_out else "-",
-                "status": status
-            })
+        data = await aio.fetch_records(
+            DAILY_ATTENDANCE_SQL,
+            (target_date, self.tenant_id),
+            tenant_id=self.tenant_id,
+        )
+        present_count = sum(1 for row in data if row["status"] == "Present")
 
         self.attendance_data = data
         self.total_employees = len(data)
@@ -241,7 +313,7 @@ class AttendanceDashboardState(admin_dash_side_nav.AdminState):
         self.attendance_rate = round((self.present_today / self.total_employees) * 100, 2) if self.total_employees else 0.0
         print(f"[LOAD] {len(data)} employees loaded for {target_date} (present: {present_count})")
 
-    def get_monthly_attendance(self):
+    async def get_monthly_attendance(self):
         print("fetching monthly data")
         if not getattr(self, "tenant_id", None) or not self.selected_user_id:
             self.monthly_attendance = []
@@ -261,78 +333,98 @@ class AttendanceDashboardState(admin_dash_side_nav.AdminState):
             next_month = month_start.replace(month=month_start.month + 1)
         month_end = next_month - timedelta(days=1)
 
-        rows = conn.execute(
-            """
-            SELECT date, check_in, check_out, status
-            FROM attendance
-            WHERE tenant_id = ? AND user_id = ? AND date >= ? AND date <= ?
-            ORDER BY date
-            """,
-            (self.tenant_id, self.selected_user_id, month_start, month_end),
-        ).fetchall()
-
-        row_map = {}
-        for r in rows:
-            r_date = r[0]
-            if isinstance(r_date, str):
-                try:
-                    r_date_obj = datetime.datetime.strptime(r_date, "%Y-%m-%d").date()
-                except Exception:
-                    r_date_obj = r_date
-            elif hasattr(r_date, "date") and not isinstance(r_date, date):
-                r_date_obj = r_date.date()
-            else:
-                r_date_obj = r_date
-            row_map[r_date_obj] = r
-
-        data = []
-        current = month_start
-        while current <= month_end:
-            dstr = current.strftime("%Y-%m-%d")
-            if current in row_map:
-                _, check_in, check_out, status = row_map[current]
-                data.append({
-                    "date": dstr,
-                    "check_in": check_in.strftime("%H:%M") if check_in else "N/A",
-                    "check_out": check_out.strftime("%H:%M") if check_out else "N/A",
-                    "status": status or "Present",
-                })
-            else:
-                data.append({
-                    "date": dstr,
-                    "check_in": "Absent",
-                    "check_out": "N/A",
-                    "status": "Absent",
-                })
-            current += timedelta(days=1)
+        # One row per day of the month; days without a summary row are absent.
+        data = await aio.fetch_records(
+            MONTHLY_ATTENDANCE_SQL,
+            (month_start, month_end, self.tenant_id, self.selected_user_id),
+            tenant_id=self.tenant_id,
+        )
 
         self.monthly_attendance = data
         print(f"[MONTHLY] Loaded {len(data)} days for user {self.selected_user_id}")
 
+    # ----------------- Month Heatmap -----------------
+    async def load_heatmap(self):
+        """Load the first page of the selected month's heatmap."""
+        self.heatmap_rows = []
+        self._heatmap_cursor = []
+        self.has_more_heatmap = False
+        await self.load_more_heatmap()
+
+    async def load_more_heatmap(self):
+        """Append the next keyset page of employees to the heatmap."""
+        if not getattr(self, "tenant_id", None):
+            return
+
+        try:
+            sel_date = datetime.datetime.strptime(self.date_selected, "%Y-%m-%d").date()
+        except Exception as e:
+            print("[HEATMAP] invalid date_selected:", e)
+            return
+
+        def month_page(cur, tenant_id, after):
+            return attendance_calendar.month_matrix(
+                cur, tenant_id, sel_date, after=tuple(after) or None, limit=HEATMAP_PAGE_SIZE + 1
+            )
+
+        matrix = await aio.run_read(month_page, self.tenant_id, self._heatmap_cursor, tenant_id=self.tenant_id)
+        self.has_more_heatmap = len(matrix["user_ids"]) > HEATMAP_PAGE_SIZE
+        user_ids, names = matrix["user_ids"][:HEATMAP_PAGE_SIZE], matrix["names"][:HEATMAP_PAGE_SIZE]
+        codes = matrix["codes"][:HEATMAP_PAGE_SIZE]
+        if user_ids:
+            self._heatmap_cursor = [names[-1], user_ids[-1]]
+
+        # Present-like days per employee and the cell labels, both straight
+        # off the code matrix.
+        worked = np.count_nonzero((codes >= 1) & (codes <= 3), axis=1).tolist()
+        self.heatmap_days = [str(d.day) for d in matrix["days"]]
+        self.heatmap_rows = self.heatmap_rows + [
+            {"user_id": user_id, "name": name, "cells": cells, "worked": days}
+            for user_id, name, cells, days in zip(user_ids, names, HEATMAP_LABELS[codes].tolist(), worked)
+        ]
+        print(f"[HEATMAP] {len(self.heatmap_rows)} employees x {len(self.heatmap_days)} days for {sel_date:%Y-%m}")
+
     # ----------------- Leave Management -----------------
-    def load_leave_requests(self):
+    async def load_leave_requests(self):
+        """Load the first page of pending leave requests."""
+        self.leave_requests = []
+        self.selected_leave_ids = []
+        self._leave_cursor = []
+        self.has_more_leaves = False
+        await self.load_more_leave_requests()
+
+    async def load_more_leave_requests(self):
+        """Append the next keyset page of pending requests, oldest first."""
         if not getattr(self, "tenant_id", None):
             self.leave_requests = []
             return
 
-        rows = conn.execute(
-            """
-            SELECT leave_id, user_id, type, start_date, end_date, status, requested_at
-            FROM leaves
-            WHERE tenant_id = ? AND status = 'pending'
-            ORDER BY requested_at
-            """,
-            (self.tenant_id,)
-        ).fetchall()
-        data = []
-        for r in rows:
-            leave_id, user_id, ltype, start_date, end_date, status, requested_at = r
-            user_name = conn.execute(
-                "SELECT name FROM users WHERE user_id = ?", (user_id,)
-            ).fetchone()
-            user_name = user_name[0] if user_name else "N/A"
-
-            data.append({
+        def pending_leaves(cur, tenant_id, after):
+            # Keyset on (requested_at, leave_id) so deep pages cost the same as
+            # the first one, and rows approved in between never shift a page.
+            keyset = "AND (l.requested_at, l.leave_id) > (CAST(? AS TIMESTAMP), ?)" if after else ""
+            return cur.execute(
+                f"""
+                SELECT l.leave_id, l.user_id, COALESCE(u.name, 'N/A'), l.type,
+                       l.start_date, l.end_date, l.status, l.requested_at
+                FROM leaves l
+                LEFT JOIN users u ON u.user_id = l.user_id
+                WHERE l.tenant_id = ? AND l.status = 'pending' {keyset}
+                ORDER BY l.requested_at, l.leave_id
+                LIMIT ?
+                """,
+                (tenant_id, *after, LEAVE_PAGE_SIZE + 1),
+            ).fetchall()
+
+        rows = await aio.run_read(pending_leaves, self.tenant_id, self._leave_cursor, tenant_id=self.tenant_id)
+        self.has_more_leaves = len(rows) > LEAVE_PAGE_SIZE
+        rows = rows[:LEAVE_PAGE_SIZE]
+        if rows:
+            last = rows[-1]
+            self._leave_cursor = [last[7].isoformat(), last[0]]
+
+        self.leave_requests = self.leave_requests + [
+            {
                 "leave_id": leave_id,
                 "user_id": user_id,
                 "user_name": user_name,
@@ -341,23 +433,60 @@ class AttendanceDashboardState(admin_dash_side_nav.AdminState):
                 "end_date": end_date.strftime("%Y-%m-%d") if end_date else "",
                 "status": status,
                 "requested_at": requested_at.strftime("%Y-%m-%d %H:%M:%S") if requested_at else "",
-            })
+            }
+            for leave_id, user_id, user_name, ltype, start_date, end_date, status, requested_at in rows
+        ]
 
-        self.leave_requests = data
+    def toggle_leave_selection(self, leave_id: str, checked: bool):
+        if checked and leave_id not in self.selected_leave_ids:
+            self.selected_leave_ids = self.selected_leave_ids + [leave_id]
+        elif not checked:
+            self.selected_leave_ids = [i for i in self.selected_leave_ids if i != leave_id]
 
-    def approve_leave(self, leave_id: str):
-        conn.execute(
-            "UPDATE leaves SET status = 'approved' WHERE leave_id = ?",
-            (leave_id,)
-        )
-        self.load_leave_requests()
+    def toggle_all_leaves(self, checked: bool):
+        self.selected_leave_ids = [l["leave_id"] for l in self.leave_requests] if checked else []
 
-    def reject_leave(self, leave_id: str):
-        conn.execute(
-            "UPDATE leaves SET status = 'rejected' WHERE leave_id = ?",
-            (leave_id,)
-        )
-        self.load_leave_requests()
+    async def update_leave_status(self, leave_ids: list[str], status: str):
+        """Set ``status`` on many pending leaves in one transaction.
+
+        Only the rows that were actually updated are dropped from the loaded
+        list, so the page is not reloaded after every decision.
+        """
+        if not leave_ids or not getattr(self, "tenant_id", None):
+            return
+
+        def decide(cur, tenant_id):
+            rows = cur.execute(
+                """
+                UPDATE leaves SET status = ?
+                WHERE tenant_id = ? AND status = 'pending' AND leave_id IN (SELECT UNNEST(?))
+                RETURNING leave_id
+                """,
+                (status, tenant_id, list(leave_ids)),
+            ).fetchall()
+            return {r[0] for r in rows}
+
+        done = await aio.run_write(decide, self.tenant_id)
+        if done:
+            cache.invalidate(self.tenant_id, "leaves")
+        self.leave_requests = [l for l in self.leave_requests if l["leave_id"] not in done]
+        self.selected_leave_ids = [i for i in self.selected_leave_ids if i not in done]
+        print(f"[LEAVES] Marked {len(done)} request(s) {status}")
+
+        if not self.leave_requests and self.has_more_leaves:
+            await self.load_more_leave_requests()
+
+    async def approve_leave(self, leave_id: str):
+        await self.update_leave_status([leave_id], "approved")
+
+    async def reject_leave(self, leave_id: str):
+        await self.update_leave_status([leave_id], "rejected")
+
+    async def approve_selected_leaves(self):
+        await self.update_leave_status(self.selected_leave_ids, "approved")
+
+    async def reject_selected_leaves(self):
+        await self.update_leave_status(self.selected_leave_ids, "rejected")
 
 
 # ---------- UI COMPONENTS ----------
@@ -503,6 +632,98 @@ def monthly_attendance_section():
 
 
 
+def heatmap_cell(status: rx.Var) -> rx.Component:
+    return rx.box(
+        title=status,
+        bg=rx.match(
+            status,
+            ("present", rx.color("green", 9)),
+            ("remote", rx.color("blue", 9)),
+            ("Half day", rx.color("orange", 9)),
+            ("leave", rx.color("purple", 9)),
+            ("absent", rx.color("red", 9)),
+            rx.color("gray", 4),
+        ),
+        width="18px",
+        min_width="18px",
+        height="18px",
+        border_radius="3px",
+    )
+
+
+def heatmap_legend() -> rx.Component:
+    return rx.hstack(
+        *[
+            rx.hstack(heatmap_cell(status), rx.text(label, font_size="1"), spacing="1", align="center")
+            for status, label in (
+                ("present", "Present"),
+                ("remote", "Remote"),
+                ("Half day", "Half day"),
+                ("leave", "Leave"),
+                ("absent", "Absent"),
+                ("", "No record"),
+            )
+        ],
+        spacing="4",
+        wrap="wrap",
+    )
+
+
+def attendance_heatmap_section():
+    return rx.vstack(
+        rx.heading("Monthly Heatmap - ", AttendanceDashboardState.current_month, size="4"),
+        heatmap_legend(),
+        rx.cond(
+            AttendanceDashboardState.heatmap_rows,
+            rx.vstack(
+                rx.box(
+                    rx.vstack(
+                        rx.hstack(
+                            rx.text("Employee", font_weight="bold", width="200px", min_width="200px"),
+                            rx.foreach(
+                                AttendanceDashboardState.heatmap_days,
+                                lambda day: rx.text(day, font_size="1", width="18px", min_width="18px", text_align="center"),
+                            ),
+                            rx.text("Worked", font_weight="bold", width="60px", text_align="right"),
+                            spacing="1",
+                            align="center",
+                        ),
+                        rx.foreach(
+                            AttendanceDashboardState.heatmap_rows,
+                            lambda row: rx.hstack(
+                                rx.text(row["name"], width="200px", min_width="200px", white_space="nowrap", overflow="hidden", text_overflow="ellipsis"),
+                                rx.foreach(row["cells"].to(list[str]), heatmap_cell),
+                                rx.text(row["worked"], width="60px", text_align="right"),
+                                spacing="1",
+                                align="center",
+                            ),
+                        ),
+                        spacing="1",
+                    ),
+                    overflow_x="auto",
+                    overflow_y="auto",
+                    max_height="500px",
+                    width="100%",
+                    p="2",
+                    border="1px solid",
+                    border_color="gray.200",
+                    border_radius="md",
+                ),
+                rx.cond(
+                    AttendanceDashboardState.has_more_heatmap,
+                    rx.button("Load more", variant="outline", on_click=AttendanceDashboardState.load_more_heatmap),
+                ),
+                spacing="3",
+                width="100%",
+            ),
+            rx.text("No employees to show.", font_size="lg", py="4"),
+        ),
+        spacing="4",
+        mt="6",
+        width="100%",
+    )
+
+
 def attendance_report_section():
     return rx.vstack(
         rx.heading("Attendance Report Generator", size="4", mb="4"),
@@ -519,6 +740,20 @@ def attendance_report_section():
             AttendanceDashboardState.show_report,
             rx.vstack(
                 rx.heading(rx.text("Attendance Report: ", AttendanceDashboardState.start_date, " to ", AttendanceDashboardState.end_date), size="3", mb="3"),
+                rx.recharts.bar_chart(
+                    rx.recharts.bar(data_key="present", stack_id="status", fill="#22c55e", name="Present"),
+                    rx.recharts.bar(data_key="half_day", stack_id="status", fill="#f59e0b", name="Half Day"),
+                    rx.recharts.bar(data_key="remote", stack_id="status", fill="#3b82f6", name="Remote"),
+                    rx.recharts.bar(data_key="leave", stack_id="status", fill="#a855f7", name="Leave"),
+                    rx.recharts.bar(data_key="absent", stack_id="status", fill="#ef4444", name="Absent"),
+                    rx.recharts.x_axis(data_key="day"),
+                    rx.recharts.y_axis(),
+                    rx.recharts.tooltip(),
+                    rx.recharts.legend(),
+                    data=AttendanceDashboardState.report_histogram,
+                    height=260,
+                    width="100%",
+                ),
                 rx.table.root(
                     rx.table.header(
                         rx.table.row(
@@ -528,6 +763,10 @@ def attendance_report_section():
                             rx.table.column_header_cell("Total Days"),
                             rx.table.column_header_cell("Present Days"),
                             rx.table.column_header_cell("Absent Days"),
+                            rx.table.column_header_cell("Present"),
+                            rx.table.column_header_cell("Half Day"),
+                            rx.table.column_header_cell("Remote"),
+                            rx.table.column_header_cell("Leave"),
                             rx.table.column_header_cell("Attendance Rate"),
                         )
                     ),
@@ -541,6 +780,10 @@ def attendance_report_section():
                                 rx.table.cell(rep["total_days"]),
                                 rx.table.cell(rep["present_days"]),
                                 rx.table.cell(rep["absent_days"]),
+                                rx.table.cell(rep["present"]),
+                                rx.table.cell(rep["half_day"]),
+                                rx.table.cell(rep["remote"]),
+                                rx.table.cell(rep["leave"]),
                                 rx.table.cell(
                                     rep["attendance_rate"],
                                     color=rep["rate_color"],
@@ -576,44 +819,77 @@ def leave_requests_section():
         rx.cond(
             ~AttendanceDashboardState.leave_requests,
             rx.text("No pending leave requests.", py="4", font_size="lg", text_align="center"),
-            rx.table.root(
-                rx.table.header(
-                    rx.table.row(
-                        rx.table.column_header_cell("Employee"),
-                        rx.table.column_header_cell("Type"),
-                        rx.table.column_header_cell("Start Date"),
-                        rx.table.column_header_cell("End Date"),
-                        rx.table.column_header_cell("Requested At"),
-                        rx.table.column_header_cell("Actions"),
-                    )
+            rx.vstack(
+                rx.hstack(
+                    rx.text(AttendanceDashboardState.selected_leave_ids.length(), " selected"),
+                    rx.button("Approve Selected", color_scheme="green", size="1",
+                              on_click=AttendanceDashboardState.approve_selected_leaves,
+                              disabled=~AttendanceDashboardState.selected_leave_ids),
+                    rx.button("Reject Selected", color_scheme="red", size="1",
+                              on_click=AttendanceDashboardState.reject_selected_leaves,
+                              disabled=~AttendanceDashboardState.selected_leave_ids),
+                    spacing="3",
+                    align="center",
                 ),
-                rx.table.body(
-                    rx.foreach(
-                        AttendanceDashboardState.leave_requests,
-                        lambda leave: rx.table.row(
-                            rx.table.row_header_cell(leave["user_name"]),
-                            rx.table.cell(leave["type"]),
-                            rx.table.cell(leave["start_date"]),
-                            rx.table.cell(leave["end_date"]),
-                            rx.table.cell(leave["requested_at"]),
-                            rx.table.cell(
-                                rx.hstack(
-                                    rx.button("Approve", color_scheme="green",
-                                              on_click=lambda _, l=leave["leave_id"]: AttendanceDashboardState.approve_leave(l)),
-                                    rx.button("Reject", color_scheme="red",
-                                              on_click=lambda _, l=leave["leave_id"]: AttendanceDashboardState.reject_leave(l)),
-                                    spacing="2"
-                                )
+                rx.table.root(
+                    rx.table.header(
+                        rx.table.row(
+                            rx.table.column_header_cell(
+                                rx.checkbox(
+                                    checked=AttendanceDashboardState.selected_leave_ids.length()
+                                    == AttendanceDashboardState.leave_requests.length(),
+                                    on_change=AttendanceDashboardState.toggle_all_leaves,
+                                ),
+                                width="40px",
                             ),
-                            _hover={"bg": "gray.50"}
+                            rx.table.column_header_cell("Employee"),
+                            rx.table.column_header_cell("Type"),
+                            rx.table.column_header_cell("Start Date"),
+                            rx.table.column_header_cell("End Date"),
+                            rx.table.column_header_cell("Requested At"),
+                            rx.table.column_header_cell("Actions"),
                         )
-                    )
+                    ),
+                    rx.table.body(
+                        rx.foreach(
+                            AttendanceDashboardState.leave_requests,
+                            lambda leave: rx.table.row(
+                                rx.table.cell(
+                                    rx.checkbox(
+                                        checked=AttendanceDashboardState.selected_leave_ids.contains(leave["leave_id"]),
+                                        on_change=lambda checked, l=leave["leave_id"]: AttendanceDashboardState.toggle_leave_selection(l, checked),
+                                    )
+                                ),
+                                rx.table.row_header_cell(leave["user_name"]),
+                                rx.table.cell(leave["type"]),
+                                rx.table.cell(leave["start_date"]),
+                                rx.table.cell(leave["end_date"]),
+                                rx.table.cell(leave["requested_at"]),
+                                rx.table.cell(
+                                    rx.hstack(
+                                        rx.button("Approve", color_scheme="green",
+                                                  on_click=lambda _, l=leave["leave_id"]: AttendanceDashboardState.approve_leave(l)),
+                                        rx.button("Reject", color_scheme="red",
+                                                  on_click=lambda _, l=leave["leave_id"]: AttendanceDashboardState.reject_leave(l)),
+                                        spacing="2"
+                                    )
+                                ),
+                                _hover={"bg": "gray.50"}
+                            )
+                        )
+                    ),
+                    width="100%",
+                    border="1px solid",
+                    border_color="gray.200",
+                    border_radius="md",
+                    overflow_x="auto",
+                ),
+                rx.cond(
+                    AttendanceDashboardState.has_more_leaves,
+                    rx.button("Load more", variant="outline", on_click=AttendanceDashboardState.load_more_leave_requests),
                 ),
+                spacing="3",
                 width="100%",
-                border="1px solid",
-                border_color="gray.200",
-                border_radius="md",
-                overflow_x="auto",
             )
         ),
         spacing="4",
@@ -643,6 +919,7 @@ def attendance_dashboard_page() -> rx.Component:
                     attendance_metric_cards(),
                     attendance_table(),
                     monthly_attendance_section(),
+                    attendance_heatmap_section(),
                     attendance_report_section(),
                     leave_requests_section(),
                     spacing="6",
@@ -1,10 +1,28 @@
 import datetime
+import uuid
 import reflex as rx
 from datetime import date, datetime, timezone, timedelta
 from components import dashboard_navbar, admin_dash_side_nav
-import duckdb
-
-conn = duckdb.connect(database="hrms.duckdb")
+from database_connections import aio, attendance_ingest, cache
+
+# Active employees with today's check-in/out flags.
+EMPLOYEES_TODAY_SQL = """
+    SELECT
+        u.user_id,
+        u.name,
+        u.email,
+        COALESCE(NULLIF(u.role, ''), 'N/A') AS role,
+        CASE WHEN s.first_in IS NULL THEN 'No' ELSE 'Yes' END AS check_in,
+        CASE WHEN s.last_out IS NULL THEN 'No' ELSE 'Yes' END AS check_out,
+        COALESCE(strftime(u.date_joined, '%Y-%m-%d'), 'N/A') AS date_joined,
+        COALESCE(date_diff('day', CAST(u.date_joined AS DATE), ?), 0) AS days_since,
+        s.status
+    FROM users u
+    LEFT JOIN attendance_daily_summary s
+        ON s.tenant_id = u.tenant_id AND s.user_id = u.user_id AND s.date = ?
+    WHERE u.tenant_id = ? AND u.status = 'active'
+    ORDER BY u.name
+"""
 
 # ---------- REUSABLE CARD COMPONENT ----------
 def metric_card(icon_tag: str, value: rx.Var, label: str, change: str, color: str) -> rx.Component:
@@ -66,36 +84,47 @@ class AdminDashboardState(admin_dash_side_nav.AdminState):
     Attendance_Rate: float = 0.0
     Departments: int = 0
 
+    # Raw counts behind Attendance_Rate, kept so check-in/out can adjust
+    # the rate without recomputing every metric.
+    _present_marks: int = 0
+    _attendance_marks: int = 0
+
     # Employee table data
     employees_data: list[dict] = []
 
     check_in: datetime | None = None
     check_out: datetime | None = None
+    # Sent back with the next sign-in/out click; renewed after each one so a
+    # double click or a resent event is recognised by the attendance writer.
+    attendance_event_id: str = ""
 
     @rx.var
     def formatted_date(self) -> str:
         return self.date_now.strftime("%B %d, %Y")
 
-    def on_mount(self):
+    async def on_mount(self):
         """Runs when the dashboard mounts."""
         print("Mounting dashboard...")
-        self.sync_login_state()
-        self.get_metrics()
+        await self.sync_login_state()
+        await self.get_metrics()
+        await self.get_employees()
 
-    def sync_login_state(self):
+    async def sync_login_state(self):
         """Sync isLogin based on today's attendance record."""
         if not hasattr(self, "tenant_id") or not hasattr(self, "user_id"):
             return
         today_date = datetime.today().date()
-        row = conn.execute(
+        row = await aio.fetchone(
             """
             SELECT check_in, check_out 
             FROM attendance 
             WHERE tenant_id = ? AND user_id = ? AND date = ?
             ORDER BY check_in DESC
+            LIMIT 1
             """,
             (self.tenant_id, self.user_id, today_date),
-        ).fetchone()
+            tenant_id=self.tenant_id,
+        )
 
         if row:
             self.check_in, self.check_out = row
@@ -104,100 +133,91 @@ class AdminDashboardState(admin_dash_side_nav.AdminState):
             self.check_in = None
             self.check_out = None
             self.isLogin = False
+        self.attendance_event_id = str(uuid.uuid4())
 
-    def LoginStateUpdate(self):
+    async def LoginStateUpdate(self, event_id: str = ""):
         """Toggle between check-in/check-out."""
         today_date = datetime.today().date()
         now_time = datetime.now()
+        record = attendance_ingest.check_out if self.isLogin else attendance_ingest.check_in
 
-        if not self.isLogin:
-            conn.execute(
-                "INSERT INTO attendance (tenant_id, user_id, date, status, check_in) VALUES (?, ?, ?, ?, ?)",
-                (self.tenant_id, self.user_id, today_date, "present", now_time),
+        try:
+            old_status, new_status, applied = await record(
+                self.tenant_id, self.user_id, today_date, now_time, event_id or str(uuid.uuid4())
             )
-            self.check_in = now_time
-            self.isLogin = True
-        else:
+        except (attendance_ingest.IngestBackpressure, attendance_ingest.IngestTimeout) as e:
+            print(f"[INGEST] {e}")
+            return rx.toast.warning("Attendance is busy right now, please try again in a moment.")
+        except Exception as e:
+            # The write cursor stayed busy, or the event itself was rejected.
+            # attendance_event_id is kept, so a retry resends the same event
+            # and cannot be applied twice.
+            print(f"[INGEST] Attendance event failed: {e}")
+            return rx.toast.error("Could not record your attendance, please try again.")
+
+        if not applied:
+            # Repeat of a click that was already applied, or a stale page:
+            # show what is stored instead of toggling.
+            await self.sync_login_state()
+            return
+        if self.isLogin:
             self.check_out = now_time
-            duration = self.check_out - self.check_in  # timedelta
-            hours_worked = duration.total_seconds() / 3600  # convert to hours
+        else:
+            self.check_in = now_time
+        self.isLogin = not self.isLogin
+        self.attendance_event_id = str(uuid.uuid4())
 
-            if hours_worked >= 5 and hours_worked <=7 :
-                conn.execute(
-                    "UPDATE attendance SET check_out = ?, status = ? WHERE tenant_id = ? AND user_id = ? AND date = ?",
-                    (self.check_out, "Half day", self.tenant_id, self.user_id, today_date),
-                )
-            if hours_worked < 5:
-                conn.execute(
-                    "UPDATE attendance SET check_out = ?, status = ? WHERE tenant_id = ? AND user_id = ? AND date = ?",
-                    (self.check_out, "absent", self.tenant_id, self.user_id, today_date),
-                )
-            conn.execute(
-                "UPDATE attendance SET check_out = ? WHERE tenant_id = ? AND user_id = ? AND date = ?",
-                (now_time, self.tenant_id, self.user_id, today_date),
-            )
-            self.check_out = now_time
-            self.isLogin = False
+        cache.invalidate(self.tenant_id, "attendance")
+
+        # Only this user's day changed: adjust the rate and their row instead
+        # of recomputing the whole dashboard.
+        self._attendance_marks += old_status is None
+        self._present_marks += (new_status == "present") - (old_status == "present")
+        self.update_attendance_rate()
+        await self.refresh_employee_row(self.user_id)
 
-        self.get_metrics()  # refresh dashboard after check-in/out
+    def update_attendance_rate(self):
+        total = self._attendance_marks
+        self.Attendance_Rate = round((self._present_marks / total) * 100, 2) if total > 0 else 0.0
 
-    def get_employees(self):
+    async def refresh_employee_row(self, user_id: str):
+        """Reload today's attendance columns for a single employee row."""
+        row = await aio.fetchone(
+            """
+            SELECT first_in, last_out, status
+            FROM attendance_daily_summary
+            WHERE tenant_id = ? AND user_id = ? AND date = ?
+            """,
+            (self.tenant_id, user_id, date.today()),
+            tenant_id=self.tenant_id,
+        )
+        check_in, check_out, status = row or (None, None, None)
+        self.employees_data = [
+            {
+                **emp,
+                'check_in': 'Yes' if check_in is not None else 'No',
+                'check_out': 'Yes' if check_out is not None else 'No',
+                'status': status,
+            } if emp.get('user_id') == user_id else emp
+            for emp in self.employees_data
+        ]
+
+    async def get_employees(self):
         """Fetch employee list with today's attendance status."""
         if not hasattr(self, "tenant_id") or not self.tenant_id:
             print("tenant_id not ready yet; skipping employees load")
             return
 
         today = date.today()
-        rows = conn.execute(
-                        """
-                        SELECT 
-                            u.user_id, 
-                            u.name, 
-                            u.email, 
-                            u.role, 
-                            u.date_joined,
-                            a.check_in, 
-                            a.check_out,
-                            a.status
-                        FROM users u
-                        LEFT JOIN (
-                            SELECT tenant_id, user_id, check_in, check_out, status
-                            FROM attendance
-                            WHERE date = ?
-                            AND rowid IN (
-                                SELECT MAX(rowid)  -- latest inserted row for that user
-                                FROM attendance
-                                WHERE date = ?
-                                GROUP BY user_id
-                            )
-                        ) a ON u.user_id = a.user_id AND u.tenant_id = a.tenant_id
-                        WHERE u.tenant_id = ? AND u.status = 'active'
-                        ORDER BY u.name;
-                        """,
-                        (today, today, self.tenant_id)  # ✅ match all three placeholders
-                    ).fetchall()
-
-
-        data = []
-        for row in rows:
-            user_id, name, email, role, date_joined, check_in, check_out,status = row
-            check_in_today = check_in is not None
-            check_out_today = check_out is not None
-            days_since = (today - date_joined.date()).days if date_joined else 0
-            data.append({
-                'name': name,
-                'email': email,
-                'role': role or 'N/A',
-                'check_in': 'Yes' if check_in_today else 'No',
-                'check_out': 'Yes' if check_out_today else 'No',
-                'date_joined': date_joined.strftime('%Y-%m-%d') if date_joined else 'N/A',
-                'days_since': days_since,
-                'status': status
-            })
+        data = await aio.fetch_records(
+            EMPLOYEES_TODAY_SQL,
+            (today, today, self.tenant_id),
+            tenant_id=self.tenant_id,
+        )
         self.employees_data = data
         print(f"[EMPLOYEES] Loaded {len(data)} active employees for tenant {self.tenant_id}")
 
-    def get_metrics(self, atenant_id=None):
+    async def get_metrics(self, atenant_id=None):
         """Fetch metrics live from the database."""
         if atenant_id is None:
             atenant_id = str(self.tenant_id)
@@ -208,47 +228,43 @@ class AdminDashboardState(admin_dash_side_nav.AdminState):
         today = datetime.today()
         month_start = datetime(today.year, today.month, 1)
 
-        # --- Total Employees ---
-        self.Total_Employees = conn.execute(
-            "SELECT COUNT(user_id) FROM users WHERE tenant_id = ?", (atenant_id,)
-        ).fetchone()[0]
-
-        # --- New Hires (this month) ---
-        self.New_Hires = conn.execute(
-            "SELECT COUNT(user_id) FROM users WHERE tenant_id = ? AND date_joined >= ?",
-            (atenant_id, month_start),
-        ).fetchone()[0]
-
-        # --- Attrition ---
-        self.Attrition = conn.execute(
-            "SELECT COUNT(user_id) FROM users WHERE tenant_id = ? AND status = 'inactive'",
-            (atenant_id,),
-        ).fetchone()[0]
-
-        # --- Departments ---
-        self.Departments = conn.execute(
-            "SELECT COUNT(dept_id) FROM departments WHERE tenant_id = ?", (atenant_id,)
-        ).fetchone()[0]
-
-        # --- Leave Requests (this month) ---
-        self.Leave_Requests = conn.execute(
-            "SELECT COUNT(leave_id) FROM leaves WHERE tenant_id = ? AND start_date >= ?",
-            (atenant_id, month_start),
-        ).fetchone()[0]
-
-        # --- Attendance Rate (present days / total workdays) ---
-        attendance_stats = conn.execute(
-            """
-            SELECT 
-                COUNT(CASE WHEN status = 'present' THEN 1 END),
-                COUNT(*)
-            FROM attendance
-            WHERE tenant_id = ? AND date >= ?
-            """,
-            (atenant_id, month_start),
-        ).fetchone()
-        present_days, total_days = attendance_stats
-        self.Attendance_Rate = round((present_days / total_days) * 100, 2) if total_days > 0 else 0.0
+        def metrics(cur):
+            # Every KPI in one statement; each table is scanned once.
+            return cur.execute(
+                """
+                SELECT
+                    u.total_employees, u.new_hires, u.attrition,
+                    d.departments, l.leave_requests,
+                    a.present_marks, a.attendance_marks
+                FROM (
+                    SELECT
+                        COUNT(user_id) AS total_employees,
+                        COUNT(user_id) FILTER (WHERE date_joined >= ?) AS new_hires,
+                        COUNT(user_id) FILTER (WHERE status = 'inactive') AS attrition
+                    FROM users WHERE tenant_id = ?
+                ) u,
+                (SELECT COUNT(dept_id) AS departments FROM departments WHERE tenant_id = ?) d,
+                (SELECT COUNT(leave_id) AS leave_requests FROM leaves WHERE tenant_id = ? AND start_date >= ?) l,
+                (
+                    SELECT
+                        COUNT(*) FILTER (WHERE status = 'present') AS present_marks,
+                        COUNT(*) AS attendance_marks
+                    FROM attendance_daily_summary WHERE tenant_id = ? AND date >= ?
+                ) a
+                """,
+                (month_start, atenant_id, atenant_id, atenant_id, month_start, atenant_id, month_start),
+            ).fetchone()
+
+        (
+            self.Total_Employees,
+            self.New_Hires,
+            self.Attrition,
+            self.Departments,
+            self.Leave_Requests,
+            self._present_marks,
+            self._attendance_marks,
+        ) = await aio.run_read(metrics, tenant_id=atenant_id)
+        self.update_attendance_rate()
 
         print(
             f"[METRICS] Tenant={atenant_id}, Employees={self.Total_Employees}, "
@@ -257,9 +273,6 @@ class AdminDashboardState(admin_dash_side_nav.AdminState):
             f"Departments={self.Departments}"
         )
 
-        # Load employee data after metrics
-        self.get_employees()
-
 
 # ---------- DASHBOARD PAGE ----------
 def dashboard_page() -> rx.Component:
@@ -280,7 +293,7 @@ def dashboard_page() -> rx.Component:
                 rx.text("Sign-out", color="red"),
                 rx.text("Sign-in", color="blue"),
             ),
-            on_click=AdminDashboardState.LoginStateUpdate,
+            on_click=AdminDashboardState.LoginStateUpdate(AdminDashboardState.attendance_event_id),
         ),
         rx.vstack(
             rx.text(f"Login time: {AdminDashboardState.check_in}"),
@@ -351,15 +351,26 @@
 
 # admin_employees_management_dashboard_fixed_spacing.py
 import reflex as rx
-import duckdb
+import asyncio
+import os
 import uuid
 from datetime import datetime
 from components import dashboard_navbar, admin_dash_side_nav
+from database_connections import aio, cache, employee_import, passwords
 
-# ---------------------------------------------------
-# DATABASE CONNECTION
-# ---------------------------------------------------
-conn = duckdb.connect(database="hrms.duckdb")
+# Rows per table page. Only the visible page lives in state, so the payload
+# sent to the browser stays the same size however large the tenant is.
+EMPLOYEE_PAGE_SIZE = 50
+
+# Sort label -> (SQL sort expression, cursor cast type, descending).
+# user_id is always the tie-breaker, which makes (sort key, user_id) a
+# unique keyset.
+EMPLOYEE_SORTS = {
+    "Newest first": ("COALESCE(date_joined, TIMESTAMP '1970-01-01')", "TIMESTAMP", True),
+    "Oldest first": ("COALESCE(date_joined, TIMESTAMP '1970-01-01')", "TIMESTAMP", False),
+    "Name A-Z": ("name", "TEXT", False),
+    "Name Z-A": ("name", "TEXT", True),
+}
 
 
 # ---------------------------------------------------
@@ -368,7 +379,30 @@ conn = duckdb.connect(database="hrms.duckdb")
 class EmployeeCRUDState(admin_dash_side_nav.AdminState):
     """State for managing employee CRUD operations."""
 
+    # Current page of the employee table
     employees: list[dict] = []
+    employee_count: int = 0
+    page: int = 1
+    has_next_page: bool = False
+
+    # Table controls
+    search: str = ""
+    role_filter: str = "all"
+    status_filter: str = "all"
+    sort_by: str = "Newest first"
+    role_options: list[str] = ["all"]
+
+    # Keyset cursor each visited page started after ([] for the first page),
+    # and the cursor of the last row on the current page.
+    _page_cursors: list[list[str]] = []
+    _next_cursor: list[str] = []
+
+    # Bulk import
+    import_running: bool = False
+    import_progress: int = 0
+    import_message: str = ""
+    import_errors: list[dict] = []
+
     name: str = ""
     email: str = ""
     role: str = ""
@@ -379,23 +413,65 @@ class EmployeeCRUDState(admin_dash_side_nav.AdminState):
     # ---------------------------------------------------
     # LOAD EMPLOYEES
     # ---------------------------------------------------
-    def load_employees(self, atenant_id=None):
-        """Load all employees for the current tenant."""
+    async def load_employees(self, atenant_id=None):
+        """Load the first page of employees for the current tenant."""
         if atenant_id is None:
             atenant_id = str(self.tenant_id)
         if not atenant_id or atenant_id == "None":
             print("⏳ tenant_id not ready; skipping employee load.")
             return
 
-        results = conn.execute(
-            """
-            SELECT user_id, name, email, role, status, date_joined
-            FROM users
-            WHERE tenant_id = ?
-            ORDER BY date_joined DESC
-            """,
-            (atenant_id,),
-        ).fetchall()
+        self._page_cursors = [[]]
+        await self.load_employee_page(atenant_id)
+
+    async def load_employee_page(self, atenant_id=None):
+        """(Re)load the page that starts after the top cursor of _page_cursors."""
+        if atenant_id is None:
+            atenant_id = str(self.tenant_id)
+        if not self._page_cursors:
+            self._page_cursors = [[]]
+
+        expr, cast, desc = EMPLOYEE_SORTS.get(self.sort_by, EMPLOYEE_SORTS["Newest first"])
+        direction = "DESC" if desc else "ASC"
+        where, params = ["tenant_id = ?"], [atenant_id]
+        if self.search.strip():
+            where.append("(name ILIKE ? OR email ILIKE ?)")
+            params += [f"%{self.search.strip()}%"] * 2
+        if self.role_filter != "all":
+            where.append("role = ?")
+            params.append(self.role_filter)
+        if self.status_filter != "all":
+            where.append("status = ?")
+            params.append(self.status_filter)
+        where_sql = " AND ".join(where)
+        after = self._page_cursors[-1]
+
+        def page(cur):
+            keyset = f"AND ({expr}, user_id) {'<' if desc else '>'} (CAST(? AS {cast}), ?)" if after else ""
+            rows = cur.execute(
+                f"""
+                SELECT user_id, name, email, role, status, date_joined, {expr}
+                FROM users
+                WHERE {where_sql} {keyset}
+                ORDER BY {expr} {direction}, user_id {direction}
+                LIMIT ?
+                """,
+                (*params, *after, EMPLOYEE_PAGE_SIZE + 1),
+            ).fetchall()
+            total = cur.execute(f"SELECT COUNT(*) FROM users WHERE {where_sql}", params).fetchone()[0]
+            roles = cur.execute(
+                "SELECT DISTINCT role FROM users WHERE tenant_id = ? AND role IS NOT NULL ORDER BY role",
+                (atenant_id,),
+            ).fetchall()
+            return rows, total, ["all"] + [r[0] for r in roles]
+
+        rows, self.employee_count, self.role_options = await aio.run_read(page, tenant_id=atenant_id)
+        self.has_next_page = len(rows) > EMPLOYEE_PAGE_SIZE
+        rows = rows[:EMPLOYEE_PAGE_SIZE]
+        if rows:
+            key = rows[-1][6]
+            self._next_cursor = [key.isoformat() if isinstance(key, datetime) else str(key), rows[-1][0]]
+        self.page = len(self._page_cursors)
 
         self.employees = [
             {
@@ -404,16 +480,45 @@ class EmployeeCRUDState(admin_dash_side_nav.AdminState):
                 "email": r[2],
                 "role": r[3],
                 "status": r[4],
-                "date_joined": r[5].strftime("%Y-%m-%d"),
+                "date_joined": r[5].strftime("%Y-%m-%d") if r[5] else "",
             }
-            for r in results
+            for r in rows
         ]
-        print(f"✅ Loaded {len(self.employees)} employees for tenant {atenant_id}")
+        print(f"✅ Loaded page {self.page} ({len(self.employees)} of {self.employee_count} employees) for tenant {atenant_id}")
+
+    async def next_employee_page(self):
+        if not self.has_next_page:
+            return
+        self._page_cursors = self._page_cursors + [self._next_cursor]
+        await self.load_employee_page()
+
+    async def previous_employee_page(self):
+        if len(self._page_cursors) <= 1:
+            return
+        self._page_cursors = self._page_cursors[:-1]
+        await self.load_employee_page()
+
+    # Changing any table control starts again from the first page.
+    async def set_search(self, value: str):
+        self.search = value
+        await self.load_employees()
+
+    async def set_role_filter(self, value: str):
+        self.role_filter = value
+        await self.load_employees()
+
+    async def set_status_filter(self, value: str):
+        self.status_filter = value
+        await self.load_employees()
+
+    async def set_sort_by(self, value: str):
+        self.sort_by = value
+        await self.load_employees()
 
     # ---------------------------------------------------
     # CREATE EMPLOYEE
     # ---------------------------------------------------
-    def create_employee(self, atenant_id=None):
+    async def create_employee(self, atenant_id=None):
         """Create a new employee and corresponding login."""
         if atenant_id is None:
             atenant_id = str(self.tenant_id)
@@ -422,73 +527,73 @@ class EmployeeCRUDState(admin_dash_side_nav.AdminState):
             print("⚠️ Missing fields for employee creation.")
             return
 
-        # Check duplicate email
-        exists = conn.execute(
-            "SELECT 1 FROM users WHERE email = ? AND tenant_id = ?", (self.email, atenant_id)
-        ).fetchone()
-        if exists:
-            print("⚠️ Employee with this email already exists.")
-            return
+        name, email, role, status = self.name.strip(), self.email.strip(), self.role.strip(), self.status
 
-        user_id = str(uuid.uuid4())
-        tenant_name = conn.execute(
-            "SELECT company_name FROM tenants WHERE tenant_id = ?", (atenant_id,)
-        ).fetchone()
-        company_name = tenant_name[0] if tenant_name else "Unknown"
-
-        # Hash the password
-        hashed_pw = self.password
-
-        # Insert into users
-        conn.execute(
-            """
-            INSERT INTO users (user_id, tenant_id, company_name, name, email, role, status, date_joined)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                user_id,
-                atenant_id,
-                company_name,
-                self.name.strip(),
-                self.email.strip(),
-                self.role.strip(),
-                self.status,
-                datetime.now(),
-            ),
-        )
+        hashed_pw = await passwords.hash(self.password)
 
-        # Insert into logins
-        conn.execute(
-            """
-            INSERT INTO logins (login_id, user_id, tenant_id, username, password, account_locked, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                str(uuid.uuid4()),
-                user_id,
-                atenant_id,
-                self.name.strip(),
-                hashed_pw,
-                False,
-                datetime.now(),
-            ),
-        )
+        def create(cur):
+            # Check duplicate email
+            exists = cur.execute(
+                "SELECT 1 FROM users WHERE email = ? AND tenant_id = ?", (email, atenant_id)
+            ).fetchone()
+            if exists:
+                return None
+
+            user_id = str(uuid.uuid4())
+            tenant_name = cur.execute(
+                "SELECT company_name FROM tenants WHERE tenant_id = ?", (atenant_id,)
+            ).fetchone()
+            company_name = tenant_name[0] if tenant_name else "Unknown"
+
+            # Insert into users
+            joined = datetime.now()
+            cur.execute(
+                """
+                INSERT INTO users (user_id, tenant_id, company_name, name, email, role, status, date_joined)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (user_id, atenant_id, company_name, name, email, role, status, joined),
+            )
+
+            # Insert into logins
+            cur.execute(
+                """
+                INSERT INTO logins (login_id, user_id, tenant_id, username, password, email, account_locked, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (str(uuid.uuid4()), user_id, atenant_id, name, hashed_pw, email, False, joined),
+            )
+            return user_id, joined
 
-        conn.commit()
+        created = await aio.run_write(create)
+        if not created:
+            print("⚠️ Employee with this email already exists.")
+            return
+
+        cache.invalidate(atenant_id, "users")
         print(f"✅ Created employee and login for {self.name}")
+        user_id, joined = created
+        self._put_employee_row({
+            "user_id": user_id,
+            "name": name,
+            "email": email,
+            "role": role,
+            "status": status,
+            "date_joined": joined.strftime("%Y-%m-%d"),
+        }, new=True)
 
-        # Reset form and reload employees
+        # Reset form
         self.name = self.email = self.role = self.password = ""
-        self.load_employees(atenant_id)
 
     # ---------------------------------------------------
     # EDIT EMPLOYEE
     # ---------------------------------------------------
-    def edit_employee(self, user_id: str):
+    async def edit_employee(self, user_id: str):
         """Load existing employee into form."""
-        result = conn.execute(
-            "SELECT name, email, role, status FROM users WHERE user_id = ?", (user_id,)
-        ).fetchone()
+        result = await aio.fetchone(
+            "SELECT name, email, role, status FROM users WHERE user_id = ?", (user_id,),
+            tenant_id=self.tenant_id,
+        )
         if result:
             self.selected_user_id = user_id
             self.name, self.email, self.role, self.status = result
@@ -497,64 +602,178 @@ class EmployeeCRUDState(admin_dash_side_nav.AdminState):
     # ---------------------------------------------------
     # UPDATE EMPLOYEE
     # ---------------------------------------------------
-    def update_employee(self):
+    async def update_employee(self):
         """Update user and login data."""
         if not self.selected_user_id:
             print("⚠️ No employee selected for update.")
             return
 
-        # Update users
-        conn.execute(
-            """
-            UPDATE users
-            SET name = ?, email = ?, role = ?, status = ?
-            WHERE user_id = ?
-            """,
-            (self.name.strip(), self.email.strip(), self.role.strip(), self.status, self.selected_user_id),
-        )
-
-        # Update logins
-        if self.password.strip():
-            
+        user_id = self.selected_user_id
+        name, email, role, status = self.name.strip(), self.email.strip(), self.role.strip(), self.status
+        password = self.password.strip()
+        hashed_pw = await passwords.hash(password) if password else None
 
-            hashed_pw = self.password
-            conn.execute(
+        def update(cur):
+            # Update users
+            cur.execute(
                 """
-                UPDATE logins
-                SET email = ?, password_hash = ?
+                UPDATE users
+                SET name = ?, email = ?, role = ?, status = ?
                 WHERE user_id = ?
                 """,
-                (self.email.strip(), hashed_pw, self.selected_user_id),
-            )
-        else:
-            conn.execute(
-                """
-                UPDATE logins
-                SET email = ?
-                WHERE user_id = ?
-                """,
-                (self.email.strip(), self.selected_user_id),
+                (name, email, role, status, user_id),
             )
 
-        conn.commit()
+            # Update logins
+            if hashed_pw:
+                cur.execute(
+                    """
+                    UPDATE logins
+                    SET email = ?, password = ?
+                    WHERE user_id = ?
+                    """,
+                    (email, hashed_pw, user_id),
+                )
+            else:
+                cur.execute(
+                    """
+                    UPDATE logins
+                    SET email = ?
+                    WHERE user_id = ?
+                    """,
+                    (email, user_id),
+                )
+
+        await aio.run_write(update)
+        cache.invalidate(self.tenant_id, "users")
         print(f"📝 Updated employee and login: {self.name}")
+        current = next((e for e in self.employees if e["user_id"] == user_id), None)
+        if current:
+            self._put_employee_row({**current, "name": name, "email": email, "role": role, "status": status})
 
         # Reset
         self.selected_user_id = ""
         self.name = self.email = self.role = self.password = ""
-        self.load_employees(str(self.tenant_id))
 
     # ---------------------------------------------------
     # DELETE EMPLOYEE
     # ---------------------------------------------------
-    def delete_employee(self, user_id: str):
+    async def delete_employee(self, user_id: str):
         """Delete from both users and logins."""
-        conn.execute("DELETE FROM logins WHERE user_id = ?", (user_id,))
-        conn.execute("DELETE FROM users WHERE user_id = ?", (user_id,))
-        conn.commit()
+        # Separate transactions: DuckDB rejects deleting a referenced row in
+        # the same transaction that deletes the rows referencing it.
+        await aio.execute("DELETE FROM logins WHERE user_id = ?", (user_id,))
+        await aio.execute("DELETE FROM users WHERE user_id = ?", (user_id,))
+        cache.invalidate(self.tenant_id, "users")
         print(f"🗑️ Deleted employee and login: {user_id}")
-        self.load_employees(str(self.tenant_id))
+        self._drop_employee_row(user_id)
+
+    # ---------------------------------------------------
+    # BULK IMPORT
+    # ---------------------------------------------------
+    async def handle_import_upload(self, files: list[rx.UploadFile]):
+        """Save the uploaded CSV/XLSX/Parquet file and start the import task."""
+        if not files or self.import_running:
+            return
+        upload = files[0]
+        ext = os.path.splitext(upload.name or "")[1].lower()
+        if ext not in (".csv", ".xlsx", ".xls", ".parquet"):
+            self.import_message = "⚠️ Upload a .csv, .xlsx or .parquet file."
+            return
+
+        path = rx.get_upload_dir() / f"import-{uuid.uuid4()}{ext}"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(await upload.read())
+
+        self.import_running = True
+        self.import_progress = 0
+        self.import_errors = []
+        self.import_message = f"Importing {upload.name}..."
+        return EmployeeCRUDState.import_employees_file(str(path))
+
+    @rx.event(background=True)
+    async def import_employees_file(self, path: str):
+        """Run the import off the event loop, streaming progress into state."""
+        async with self:
+            tenant_id = str(self.tenant_id)
 
+        loop = asyncio.get_running_loop()
+        progress = asyncio.Queue()
+
+        def report(done, total):
+            loop.call_soon_threadsafe(progress.put_nowait, (done, total))
+
+        # import_employees takes the write cursor itself, only for the inserts.
+        job = loop.run_in_executor(None, employee_import.import_employees, path, tenant_id, report)
+        while not job.done():
+            try:
+                done, total = await asyncio.wait_for(progress.get(), timeout=0.5)
+            except asyncio.TimeoutError:
+                continue
+            async with self:
+                self.import_progress = int(done * 100 / total) if total else 100
+                self.import_message = f"Imported {done:,} of {total:,} employees..."
+
+        try:
+            result = await job
+        except Exception as e:
+            async with self:
+                self.import_running = False
+                self.import_message = f"❌ Import failed: {e}"
+            return
+        finally:
+            os.remove(path)
+        if result["imported"]:
+            cache.invalidate(tenant_id, "users")
+
+        async with self:
+            self.import_running = False
+            self.import_progress = 100
+            self.import_errors = result["errors"]
+            self.import_message = (
+                f"✅ Imported {result['imported']:,} of {result['total']:,} rows"
+                + (f", {result['rejected']:,} rejected" if result["rejected"] else "")
+            )
+            await self.load_employees(tenant_id)
+
+    # ---------------------------------------------------
+    # IN-PLACE ROW UPDATES
+    # ---------------------------------------------------
+    # CRUD actions patch the loaded page by user_id instead of reloading it.
+    # Rows that no longer match the table filters drop out; a new row only
+    # shows up where it would sort on the current page (page 1 of "Newest
+    # first"), otherwise it appears when its page is loaded.
+    def _matches_filters(self, row: dict) -> bool:
+        term = self.search.strip().lower()
+        return (
+            (not term or term in row["name"].lower() or term in row["email"].lower())
+            and self.role_filter in ("all", row["role"])
+            and self.status_filter in ("all", row["status"])
+        )
+
+    def _put_employee_row(self, row: dict, new: bool = False):
+        if row["role"] and row["role"] not in self.role_options:
+            self.role_options.append(row["role"])
+        if not self._matches_filters(row):
+            if not new:
+                self._drop_employee_row(row["user_id"])
+            return
+        if new:
+            self.employee_count += 1
+            # The page may run a few rows over EMPLOYEE_PAGE_SIZE until it is
+            # reloaded; trimming it would move the keyset cursor.
+            if self.page == 1 and self.sort_by == "Newest first":
+                self.employees.insert(0, row)
+            return
+        idx = next((i for i, e in enumerate(self.employees) if e["user_id"] == row["user_id"]), None)
+        if idx is not None:
+            self.employees[idx] = row
+
+    def _drop_employee_row(self, user_id: str):
+        idx = next((i for i, e in enumerate(self.employees) if e["user_id"] == user_id), None)
+        if idx is not None:
+            self.employees.pop(idx)
+            self.employee_count -= 1
 
 # ---------------------------------------------------
 # PAGE UI
@@ -640,50 +859,162 @@ def employee_crud_page() -> rx.Component:
                     ),
 
                     # -------------------------------
-                    # EMPLOYEE TABLE
+                    # BULK IMPORT
                     # -------------------------------
-                    rx.table.root(
-                        rx.table.header(
-                            rx.table.row(
-                                rx.table.column_header_cell("Name"),
-                                rx.table.column_header_cell("Email"),
-                                rx.table.column_header_cell("Role"),
-                                rx.table.column_header_cell("Status"),
-                                rx.table.column_header_cell("Date Joined"),
-                                rx.table.column_header_cell("Actions"),
-                            )
+                    rx.vstack(
+                        rx.heading("Bulk Import", size="4"),
+                        rx.text(
+                            "CSV, XLSX or Parquet with name, email and password columns "
+                            "(role, status and username optional).",
+                            color="gray",
+                            size="2",
                         ),
-                        rx.table.body(
-                            rx.foreach(
-                                EmployeeCRUDState.employees,
-                                lambda emp: rx.table.row(
-                                    rx.table.cell(emp["name"]),
-                                    rx.table.cell(emp["email"]),
-                                    rx.table.cell(emp["role"]),
-                                    rx.table.cell(emp["status"]),
-                                    rx.table.cell(emp["date_joined"]),
-                                    rx.table.cell(
-                                        rx.hstack(
-                                            rx.button(
-                                                "Edit",
-                                                size="1",
-                                                color_scheme="blue",
-                                                variant="outline",
-                                                on_click=lambda _: EmployeeCRUDState.edit_employee(emp["user_id"]),
-                                            ),
-                                            rx.button(
-                                                "Delete",
-                                                size="1",
-                                                color_scheme="red",
-                                                variant="solid",
-                                                on_click=lambda _: EmployeeCRUDState.delete_employee(emp["user_id"]),
-                                            ),
-                                            spacing="2",
-                                        )
+                        rx.upload(
+                            rx.text("Drop a file here or click to select"),
+                            id="employee_import",
+                            accept={
+                                "text/csv": [".csv"],
+                                "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet": [".xlsx"],
+                                "application/vnd.apache.parquet": [".parquet"],
+                            },
+                            max_files=1,
+                            on_drop=EmployeeCRUDState.handle_import_upload(rx.upload_files(upload_id="employee_import")),
+                            disabled=EmployeeCRUDState.import_running,
+                            border="1px dashed",
+                            border_color="gray.300",
+                            border_radius="8px",
+                            padding="4",
+                            width="100%",
+                            max_width="500px",
+                        ),
+                        rx.cond(
+                            EmployeeCRUDState.import_message != "",
+                            rx.vstack(
+                                rx.progress(value=EmployeeCRUDState.import_progress, width="100%", max_width="500px"),
+                                rx.text(EmployeeCRUDState.import_message, size="2"),
+                                rx.foreach(
+                                    EmployeeCRUDState.import_errors,
+                                    lambda err: rx.text(
+                                        "Row " + err["row"].to_string() + " (" + err["email"].to_string() + "): "
+                                        + err["error"].to_string(),
+                                        color="red",
+                                        size="1",
                                     ),
                                 ),
-                            )
+                                spacing="1",
+                                width="100%",
+                            ),
+                        ),
+                        spacing="2",
+                        width="100%",
+                        mb="8",
+                    ),
+
+                    # -------------------------------
+                    # TABLE CONTROLS
+                    # -------------------------------
+                    rx.hstack(
+                        rx.input(
+                            placeholder="Search name or email",
+                            value=EmployeeCRUDState.search,
+                            on_change=EmployeeCRUDState.set_search,
+                            debounce_timeout=300,
+                            width="260px",
+                        ),
+                        rx.select(
+                            EmployeeCRUDState.role_options,
+                            value=EmployeeCRUDState.role_filter,
+                            on_change=EmployeeCRUDState.set_role_filter,
+                        ),
+                        rx.select(
+                            ["all", "active", "inactive", "terminated"],
+                            value=EmployeeCRUDState.status_filter,
+                            on_change=EmployeeCRUDState.set_status_filter,
+                        ),
+                        rx.select(
+                            list(EMPLOYEE_SORTS),
+                            value=EmployeeCRUDState.sort_by,
+                            on_change=EmployeeCRUDState.set_sort_by,
+                        ),
+                        rx.spacer(),
+                        rx.text(EmployeeCRUDState.employee_count.to_string() + " employees", color="gray"),
+                        spacing="3",
+                        width="100%",
+                        align="center",
+                    ),
+
+                    # -------------------------------
+                    # EMPLOYEE TABLE
+                    # -------------------------------
+                    rx.scroll_area(
+                        rx.table.root(
+                            rx.table.header(
+                                rx.table.row(
+                                    rx.table.column_header_cell("Name"),
+                                    rx.table.column_header_cell("Email"),
+                                    rx.table.column_header_cell("Role"),
+                                    rx.table.column_header_cell("Status"),
+                                    rx.table.column_header_cell("Date Joined"),
+                                    rx.table.column_header_cell("Actions"),
+                                ),
+                                position="sticky",
+                                top="0",
+                                bg="white",
+                                z_index="1",
+                            ),
+                            rx.table.body(
+                                rx.foreach(
+                                    EmployeeCRUDState.employees,
+                                    lambda emp: rx.table.row(
+                                        rx.table.cell(emp["name"]),
+                                        rx.table.cell(emp["email"]),
+                                        rx.table.cell(emp["role"]),
+                                        rx.table.cell(emp["status"]),
+                                        rx.table.cell(emp["date_joined"]),
+                                        rx.table.cell(
+                                            rx.hstack(
+                                                rx.button(
+                                                    "Edit",
+                                                    size="1",
+                                                    color_scheme="blue",
+                                                    variant="outline",
+                                                    on_click=lambda _: EmployeeCRUDState.edit_employee(emp["user_id"]),
+                                                ),
+                                                rx.button(
+                                                    "Delete",
+                                                    size="1",
+                                                    color_scheme="red",
+                                                    variant="solid",
+                                                    on_click=lambda _: EmployeeCRUDState.delete_employee(emp["user_id"]),
+                                                ),
+                                                spacing="2",
+                                            )
+                                        ),
+                                    ),
+                                )
+                            ),
+                        ),
+                        type="auto",
+                        scrollbars="vertical",
+                        height="60vh",
+                        width="100%",
+                    ),
+                    rx.hstack(
+                        rx.button(
+                            "Previous",
+                            variant="outline",
+                            disabled=EmployeeCRUDState.page <= 1,
+                            on_click=EmployeeCRUDState.previous_employee_page,
+                        ),
+                        rx.text("Page " + EmployeeCRUDState.page.to_string()),
+                        rx.button(
+                            "Next",
+                            variant="outline",
+                            disabled=~EmployeeCRUDState.has_next_page,
+                            on_click=EmployeeCRUDState.next_employee_page,
                         ),
+                        spacing="3",
+                        align="center",
                     ),
                 ),
                 on_mount=EmployeeCRUDState.load_employees,  # Load employees on mount
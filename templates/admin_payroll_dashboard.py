@@ -1,11 +1,23 @@
 import uuid
 import reflex as rx
-import duckdb
 from datetime import date, datetime
 from components import dashboard_navbar, admin_dash_side_nav
-
-# ---------------- DATABASE CONNECTION ----------------
-conn = duckdb.connect(database="hrms.duckdb")
+from database_connections import aio, cache, payroll_run
+
+# The month's payroll rows with employee names, formatted for the table.
+PAYROLL_MONTH_SQL = """
+    SELECT
+        u.user_id,
+        u.name,
+        strftime(p.month, '%Y-%m') AS month,
+        COALESCE(p.gross_salary, 0) AS gross,
+        COALESCE(p.deductions, 0) AS deductions,
+        COALESCE(p.net_salary, 0) AS net
+    FROM payroll p
+    JOIN users u ON p.user_id = u.user_id
+    WHERE p.tenant_id = ? AND p.month >= ? AND p.month < ?
+    ORDER BY u.name
+"""
 
 
 # ---------------- METRIC CARD COMPONENT ----------------
@@ -57,7 +69,17 @@ class PayrollDashboardState(admin_dash_side_nav.AdminState):
     average_salary: float = 0.0
     pending_count: int = 0
 
+    # Monthly payroll run
+    rerun_payroll: bool = False
+    payroll_running: bool = False
+    payroll_run_message: str = ""
+
     # ---------------- HELPERS ----------------
+    def _month_range(self) -> tuple[date, date]:
+        """[first day, first day of next month) for month_selected ("YYYY-MM")."""
+        start = datetime.strptime(self.month_selected, "%Y-%m").date()
+        return start, start.replace(year=start.year + start.month // 12, month=start.month % 12 + 1)
+
     @rx.var
     def formatted_month(self) -> str:
         # Ensure month_selected is always string
@@ -67,61 +89,49 @@ class PayrollDashboardState(admin_dash_side_nav.AdminState):
         return ""
 
     # ---------------- ON MOUNT ----------------
-    def on_mount(self):
-        self.load_employees()
-        self.load_payroll()
+    async def on_mount(self):
+        await self.load_employees()
+        await self.load_payroll()
 
     # ---------------- LOAD EMPLOYEES ----------------
-    def load_employees(self):
+    async def load_employees(self):
         if not self.tenant_id:
             return
 
-        rows = conn.execute(
+        rows = await cache.fetchall(
+            "users",
             "SELECT user_id, name FROM users WHERE tenant_id=? AND status='active' ORDER BY name",
             (self.tenant_id,),
-        ).fetchall()
+            tenant_id=self.tenant_id,
+        )
 
         self.all_employees = [{"id": r[0], "name": r[1]} for r in rows]
 
     # ---------------- SELECT EMPLOYEE ----------------
-    def set_selected_employee(self, employee_id: str):
+    async def set_selected_employee(self, employee_id: str):
         self.user_id = employee_id
         match = next((e for e in self.all_employees if e["id"] == employee_id), None)
         self.selected_user_name = match["name"] if match else ""
-        self.load_salary_trend()
+        await self.load_salary_trend()
 
     # ---------------- MONTH SELECT ----------------
-    def set_month(self, month: str):
+    async def set_month(self, month: str):
         self.month_selected = month
-        self.load_payroll()
+        await self.load_payroll()
 
     # ---------------- LOAD PAYROLL ----------------
-    def load_payroll(self):
+    async def load_payroll(self):
         if not self.tenant_id:
             return
 
-        rows = conn.execute(
-            """
-            SELECT u.name, p.month, p.gross_salary, p.deductions, p.net_salary
-            FROM payroll p
-            JOIN users u ON p.user_id = u.user_id
-            WHERE p.tenant_id = ? AND strftime('%Y-%m', p.month::DATE) = ?
-            ORDER BY u.name
-            """,
-            (self.tenant_id, self.month_selected),
-        ).fetchall()
-
-        total_salary = 0
-        data = []
-        for name, month, gross, ded, net in rows:
-            total_salary += net or 0
-            data.append({
-                "name": name,
-                "month": datetime.strptime(month, "%Y-%m-%d").strftime("%Y-%m"),
-                "gross": gross or 0,
-                "deductions": ded or 0,
-                "net": net or 0,
-            })
+        columns = await cache.fetch_columns(
+            ("payroll", "users"),
+            PAYROLL_MONTH_SQL,
+            (self.tenant_id, *self._month_range()),
+            tenant_id=self.tenant_id,
+        )
+        data = aio.as_records(columns)
+        total_salary = sum(columns["net"])
 
         self.payroll_data = data
         self.total_employees = len(data)
@@ -146,7 +156,7 @@ class PayrollDashboardState(admin_dash_side_nav.AdminState):
     def calculate_net_salary(self):
         self.net_salary = round(self.gross_salary - self.deductions, 2)
 
-    def save_payroll(self):
+    async def save_payroll(self):
         print("updating payrole")
         if not self.user_id:
             return
@@ -154,7 +164,7 @@ class PayrollDashboardState(admin_dash_side_nav.AdminState):
         pid = str(uuid.uuid4())
         self.calculate_net_salary()
 
-        conn.execute(
+        await aio.execute(
             """
             INSERT INTO payroll (payroll_id, tenant_id, user_id, month, gross_salary, deductions, net_salary, processed_at)
             VALUES (?, ?, ?, ?, ?, ?, ?, NOW())
@@ -168,44 +178,117 @@ class PayrollDashboardState(admin_dash_side_nav.AdminState):
                 str(uuid.uuid4()),
                 self.tenant_id,
                 self.user_id,
-                self.month_selected + "-01",
+                self._month_range()[0],
                 self.gross_salary,
                 self.deductions,
                 self.net_salary,
             ),
         )
-        conn.commit()
-        self.load_payroll()
-        self.load_salary_trend()
+        cache.invalidate(self.tenant_id, "payroll")
+
+        # Patch the loaded month and trend in place instead of reloading them.
+        self._put_payroll_row({
+            "user_id": self.user_id,
+            "name": self.selected_user_name,
+            "month": self.month_selected,
+            "gross": self.gross_salary,
+            "deductions": self.deductions,
+            "net": self.net_salary,
+        })
+        self._put_trend_point(self.month_selected, self.net_salary)
+
+    async def delete_payroll(self, user_id: str):
+        tenant_id, (month_start, month_end) = self.tenant_id, self._month_range()
+
+        def delete(cur):
+            return cur.execute(
+                """
+                DELETE FROM payroll
+                WHERE tenant_id=? AND user_id=? AND month >= ? AND month < ?
+                RETURNING net_salary
+                """,
+                (tenant_id, user_id, month_start, month_end),
+            ).fetchall()
+
+        if not await aio.run_write(delete):
+            return
+        cache.invalidate(tenant_id, "payroll")
+
+        idx = next((i for i, r in enumerate(self.payroll_data) if r["user_id"] == user_id), None)
+        if idx is not None:
+            row = self.payroll_data.pop(idx)
+            self._adjust_payroll_totals(-row["net"])
+        if user_id == self.user_id:
+            self.salary_trend = [p for p in self.salary_trend if p["month"] != self.month_selected]
+
+    # ---------------- IN-PLACE ROW UPDATES ----------------
+    def _put_payroll_row(self, row: dict):
+        """Insert or replace ``row`` in payroll_data (kept ordered by name)."""
+        idx = next((i for i, r in enumerate(self.payroll_data) if r["user_id"] == row["user_id"]), None)
+        if idx is None:
+            pos = next((i for i, r in enumerate(self.payroll_data) if r["name"] > row["name"]), len(self.payroll_data))
+            self.payroll_data.insert(pos, row)
+            self._adjust_payroll_totals(row["net"])
+        else:
+            old_net = self.payroll_data[idx]["net"]
+            self.payroll_data[idx] = row
+            self._adjust_payroll_totals(row["net"] - old_net)
+
+    def _adjust_payroll_totals(self, net_delta: float):
+        self.total_employees = len(self.payroll_data)
+        self.total_salary = round(self.total_salary + net_delta, 2)
+        self.average_salary = round(self.total_salary / self.total_employees, 2) if self.total_employees else 0.0
+
+    def _put_trend_point(self, month: str, net: float):
+        idx = next((i for i, p in enumerate(self.salary_trend) if p["month"] >= month), len(self.salary_trend))
+        if idx < len(self.salary_trend) and self.salary_trend[idx]["month"] == month:
+            self.salary_trend[idx] = {"month": month, "net": net}
+        else:
+            self.salary_trend.insert(idx, {"month": month, "net": net})
+
+    # ---------------- MONTHLY PAYROLL RUN ----------------
+    def set_rerun_payroll(self, value: bool):
+        self.rerun_payroll = value
+
+    async def run_payroll(self):
+        """Compute the selected month for every active employee in one pass."""
+        if not self.tenant_id or self.payroll_running:
+            return
+        self.payroll_running = True
+        yield
 
-    def delete_payroll(self, user_name: str):
-        conn.execute(
-            """
-            DELETE FROM payroll 
-            WHERE tenant_id=? AND strftime('%Y-%m', month::DATE)=? 
-            AND user_id IN (SELECT user_id FROM users WHERE name=?)
-            """,
-            (self.tenant_id, self.month_selected, user_name),
+        try:
+            run = await aio.run_write(
+                payroll_run.run_payroll, self.tenant_id, self.month_selected, self.rerun_payroll, self.full_name or None
+            )
+        finally:
+            self.payroll_running = False
+        cache.invalidate(self.tenant_id, "payroll")
+
+        self.payroll_run_message = (
+            f"✅ {'Recomputed' if run['rerun'] else 'Added'} {run['written']} of {run['employees']} employees "
+            f"in {run['duration_ms']:.0f} ms"
+            + (f"; {run['skipped']} without a salary structure" if run["skipped"] else "")
         )
-        conn.commit()
-        self.load_payroll()
+        await self.load_payroll()
 
     # ---------------- SALARY TREND ----------------
-    def load_salary_trend(self):
+    async def load_salary_trend(self):
         if not self.user_id:
             self.salary_trend = []
             return
 
-        rows = conn.execute(
+        rows = await aio.fetchall(
             """
             SELECT month, net_salary FROM payroll
             WHERE tenant_id=? AND user_id=?
             ORDER BY month
             """,
             (self.tenant_id, self.user_id),
-        ).fetchall()
+            tenant_id=self.tenant_id,
+        )
 
-        self.salary_trend = [{"month": datetime.strptime(m, "%Y-%m-%d").strftime("%Y-%m"), "net": n or 0} for m, n in rows]
+        self.salary_trend = [{"month": m.strftime("%Y-%m"), "net": n or 0} for m, n in rows]
 
 
 # ---------------- METRIC CARDS ----------------
@@ -295,7 +378,7 @@ def payroll_table(state: PayrollDashboardState):
                                 "Delete",
                                 color_scheme="red",
                                 size="1",
-                                on_click=lambda emp_name=emp["name"]: state.delete_payroll(emp_name),
+                                on_click=lambda _: state.delete_payroll(emp["user_id"]),
                             ),
                             spacing="2",
                         )
@@ -310,6 +393,27 @@ def payroll_table(state: PayrollDashboardState):
     )
 
 
+# ---------------- PAYROLL RUN ----------------
+def payroll_run_bar(state: PayrollDashboardState):
+    return rx.hstack(
+        rx.button(
+            "Run Payroll",
+            color_scheme="blue",
+            loading=state.payroll_running,
+            on_click=state.run_payroll,
+        ),
+        rx.hstack(
+            rx.switch(checked=state.rerun_payroll, on_change=state.set_rerun_payroll),
+            rx.text("Recompute existing rows", size="2"),
+            spacing="2",
+            align="center",
+        ),
+        rx.text(state.payroll_run_message, size="2", color="gray"),
+        spacing="4",
+        align="center",
+    )
+
+
 # ---------------- SALARY TREND GRAPH ----------------
 def salary_trend_chart(state: PayrollDashboardState):
     return rx.cond(
@@ -350,6 +454,7 @@ def payroll_dashboard_page() -> rx.Component:
                         spacing="4",
                     ),
                     payroll_metric_cards(PayrollDashboardState),
+                    payroll_run_bar(PayrollDashboardState),
                     rx.hstack(
                         payroll_crud_form(PayrollDashboardState),
                         rx.box(payroll_table(PayrollDashboardState), flex="1"),
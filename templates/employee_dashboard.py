@@ -1,10 +1,23 @@
 import datetime
+import uuid
 import reflex as rx
 from datetime import date, datetime, timezone, timedelta
 from components import dashboard_navbar, employee_dash_side_nav  # Assuming employee side nav exists or adapt
-import duckdb
-
-conn = duckdb.connect(database="hrms.duckdb")
+from database_connections import aio, attendance_ingest, cache
+
+# An employee's daily attendance since a date, newest first.
+ATTENDANCE_HISTORY_SQL = """
+    SELECT
+        strftime(date, '%Y-%m-%d') AS date,
+        COALESCE(strftime(first_in, '%H:%M'), 'N/A') AS check_in,
+        COALESCE(strftime(last_out, '%H:%M'), 'N/A') AS check_out,
+        COALESCE(NULLIF(status, ''), 'N/A') AS status,
+        CASE WHEN COALESCE(worked_minutes, 0) = 0 THEN 'N/A'
+             ELSE printf('%.1f', worked_minutes / 60) END AS hours_worked
+    FROM attendance_daily_summary
+    WHERE tenant_id = ? AND user_id = ? AND date >= ?
+    ORDER BY date DESC
+"""
 
 # ---------- REUSABLE CARD COMPONENT ----------
 # Reusing the same metric_card from admin dashboard
@@ -70,31 +83,36 @@ class EmployeeDashboardState(employee_dash_side_nav.EmployeeState):  # Assuming
 
     check_in: datetime | None = None
     check_out: datetime | None = None
+    # Sent back with the next sign-in/out click; renewed after each one so a
+    # double click or a resent event is recognised by the attendance writer.
+    attendance_event_id: str = ""
 
     @rx.var
     def formatted_date(self) -> str:
         return self.date_now.strftime("%B %d, %Y")
 
-    def on_mount(self):
+    async def on_mount(self):
         """Runs when the dashboard mounts."""
         print("Mounting employee dashboard...")
-        self.sync_login_state()
-        self.get_metrics()
+        await self.sync_login_state()
+        await self.get_metrics()
 
-    def sync_login_state(self):
+    async def sync_login_state(self):
         """Sync isLogin based on today's attendance record."""
         if not hasattr(self, "tenant_id") or not hasattr(self, "user_id"):
             return
         today_date = datetime.today().date()
-        row = conn.execute(
+        row = await aio.fetchone(
             """
             SELECT check_in, check_out 
             FROM attendance 
             WHERE tenant_id = ? AND user_id = ? AND date = ?
             ORDER BY check_in DESC
+            LIMIT 1
             """,
             (self.tenant_id, self.user_id, today_date),
-        ).fetchone()
+            tenant_id=self.tenant_id,
+        )
 
         if row:
             self.check_in, self.check_out = row
@@ -103,74 +121,60 @@ class EmployeeDashboardState(employee_dash_side_nav.EmployeeState):  # Assuming
             self.check_in = None
             self.check_out = None
             self.isLogin = False
+        self.attendance_event_id = str(uuid.uuid4())
 
-    def LoginStateUpdate(self):
+    async def LoginStateUpdate(self, event_id: str = ""):
         """Toggle between check-in/check-out."""
         today_date = datetime.today().date()
         now_time = datetime.now()
+        record = attendance_ingest.check_out if self.isLogin else attendance_ingest.check_in
 
-        if not self.isLogin:
-            conn.execute(
-                "INSERT INTO attendance (tenant_id, user_id, date, status, check_in) VALUES (?, ?, ?, ?, ?)",
-                (self.tenant_id, self.user_id, today_date, "present", now_time),
+        try:
+            _, _, applied = await record(
+                self.tenant_id, self.user_id, today_date, now_time, event_id or str(uuid.uuid4())
             )
-            self.check_in = now_time
-            self.isLogin = True
-        else:
+        except (attendance_ingest.IngestBackpressure, attendance_ingest.IngestTimeout) as e:
+            print(f"[INGEST] {e}")
+            return rx.toast.warning("Attendance is busy right now, please try again in a moment.")
+        except Exception as e:
+            # The write cursor stayed busy, or the event itself was rejected.
+            # attendance_event_id is kept, so a retry resends the same event
+            # and cannot be applied twice.
+            print(f"[INGEST] Attendance event failed: {e}")
+            return rx.toast.error("Could not record your attendance, please try again.")
+
+        if not applied:
+            # Repeat of a click that was already applied, or a stale page:
+            # show what is stored instead of toggling.
+            await self.sync_login_state()
+            return
+        if self.isLogin:
             self.check_out = now_time
-            duration = self.check_out - self.check_in  # timedelta
-            hours_worked = duration.total_seconds() / 3600  # convert to hours
+        else:
+            self.check_in = now_time
+        self.isLogin = not self.isLogin
+        self.attendance_event_id = str(uuid.uuid4())
 
-            if hours_worked >= 5 and hours_worked <=7 :
-                conn.execute(
-                    "UPDATE attendance SET check_out = ?, status = ? WHERE tenant_id = ? AND user_id = ? AND date = ?",
-                    (self.check_out, "Half day", self.tenant_id, self.user_id, today_date),
-                )
-            if hours_worked < 5:
-                conn.execute(
-                    "UPDATE attendance SET check_out = ?, status = ? WHERE tenant_id = ? AND user_id = ? AND date = ?",
-                    (self.check_out, "absent", self.tenant_id, self.user_id, today_date),
-                )
-            conn.execute(
-                "UPDATE attendance SET check_out = ? WHERE tenant_id = ? AND user_id = ? AND date = ?",
-                (now_time, self.tenant_id, self.user_id, today_date),
-            )
-            self.check_out = now_time
-            self.isLogin = False
+        cache.invalidate(self.tenant_id, "attendance")
 
-        self.get_metrics()  # refresh dashboard after check-in/out
+        await self.get_metrics()  # refresh dashboard after check-in/out
 
-    def get_attendance_history(self):
+    async def get_attendance_history(self):
         """Fetch personal attendance history for the last 30 days."""
         if not hasattr(self, "tenant_id") or not hasattr(self, "user_id"):
             print("tenant_id or user_id not ready yet; skipping attendance load")
             return
 
         thirty_days_ago = date.today() - timedelta(days=30)
-        rows = conn.execute(
-            """
-            SELECT date, check_in, check_out, status
-            FROM attendance
-            WHERE tenant_id = ? AND user_id = ? AND date >= ?
-            ORDER BY date DESC
-            """,
+        data = await aio.fetch_records(
+            ATTENDANCE_HISTORY_SQL,
             (self.tenant_id, self.user_id, thirty_days_ago),
-        ).fetchall()
-
-        data = []
-        for row in rows:
-            date_str, check_in, check_out, status = row
-            data.append({
-                'date': date_str.strftime('%Y-%m-%d') if isinstance(date_str, date) else str(date_str),
-                'check_in': check_in.strftime('%H:%M') if check_in else 'N/A',
-                'check_out': check_out.strftime('%H:%M') if check_out else 'N/A',
-                'status': status or 'N/A',
-                'hours_worked': 'N/A'  # Can calculate if needed: (check_out - check_in).total_seconds() / 3600
-            })
+            tenant_id=self.tenant_id,
+        )
         self.attendance_data = data
         print(f"[ATTENDANCE] Loaded {len(data)} records for user {self.user_id}")
 
-    def get_metrics(self):
+    async def get_metrics(self):
         """Fetch personal metrics live from the database."""
         if not hasattr(self, "tenant_id") or not hasattr(self, "user_id"):
             print("tenant_id or user_id not ready yet; skipping metrics load")
@@ -180,25 +184,31 @@ class EmployeeDashboardState(employee_dash_side_nav.EmployeeState):  # Assuming
         month_start = datetime(today.year, today.month, 1)
         year_start = datetime(today.year, 1, 1)
 
-        # --- Present Days This Month ---
-        self.Present_Days_This_Month = conn.execute(
-            "SELECT COUNT(*) FROM attendance WHERE tenant_id = ? AND user_id = ? AND status = 'present' AND date >= ?",
-            (self.tenant_id, self.user_id, month_start),
-        ).fetchone()[0]
-
-        # --- Attendance Rate This Month ---
-        total_days = conn.execute(
-            "SELECT COUNT(*) FROM attendance WHERE tenant_id = ? AND user_id = ? AND date >= ?",
-            (self.tenant_id, self.user_id, month_start),
-        ).fetchone()[0]
+        key = (self.tenant_id, self.user_id)
+
+        def metrics(cur):
+            # --- Present Days / Attendance Rate This Month ---
+            present_days, total_days = cur.execute(
+                """
+                SELECT COUNT(*) FILTER (WHERE status = 'present'), COUNT(*)
+                FROM attendance_daily_summary
+                WHERE tenant_id = ? AND user_id = ? AND date >= ?
+                """,
+                (*key, month_start),
+            ).fetchone()
+
+            # --- Leaves Taken This Year ---
+            leaves_taken = cur.execute(
+                "SELECT COUNT(*) FROM leaves WHERE tenant_id = ? AND user_id = ? AND status = 'approved' AND start_date >= ?",
+                (*key, year_start),
+            ).fetchone()[0]
+            return present_days, total_days, leaves_taken
+
+        self.Present_Days_This_Month, total_days, self.Leaves_Taken = await aio.run_read(
+            metrics, tenant_id=self.tenant_id
+        )
         self.My_Attendance_Rate = round((self.Present_Days_This_Month / total_days) * 100, 2) if total_days > 0 else 0.0
 
-        # --- Leaves Taken This Year ---
-        self.Leaves_Taken = conn.execute(
-            "SELECT COUNT(*) FROM leaves WHERE tenant_id = ? AND user_id = ? AND status = 'approved' AND start_date >= ?",
-            (self.tenant_id, self.user_id, year_start),
-        ).fetchone()[0]
-
         # --- Leaves Remaining (assuming 20 annual entitlement) ---
         self.Leaves_Remaining = 20 - self.Leaves_Taken  # Hardcoded; make dynamic if entitlement in DB
 
@@ -209,7 +219,7 @@ class EmployeeDashboardState(employee_dash_side_nav.EmployeeState):  # Assuming
         )
 
         # Load attendance data after metrics
-        self.get_attendance_history()
+        await self.get_attendance_history()
 
 
 # ---------- EMPLOYEE DASHBOARD PAGE ----------
@@ -230,7 +240,7 @@ def employee_dashboard_page() -> rx.Component:
                 rx.text("Sign-out", color="red"),
                 rx.text("Sign-in", color="blue"),
             ),
-            on_click=EmployeeDashboardState.LoginStateUpdate,
+            on_click=EmployeeDashboardState.LoginStateUpdate(EmployeeDashboardState.attendance_event_id),
         ),
         rx.vstack(
             rx.text(f"Login time: {EmployeeDashboardState.check_in}"),
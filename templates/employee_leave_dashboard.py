@@ -3,9 +3,22 @@ import reflex as rx
 import uuid
 from datetime import date, datetime, timezone, timedelta
 from components import dashboard_navbar, employee_dash_side_nav
-import duckdb
-
-conn = duckdb.connect(database="hrms.duckdb")
+from database_connections import aio
+
+# An employee's leave requests, newest first.
+LEAVE_HISTORY_SQL = """
+    SELECT
+        leave_id AS id,
+        COALESCE(NULLIF(type, ''), 'N/A') AS type,
+        COALESCE(strftime(start_date, '%Y-%m-%d'), 'N/A') AS start_date,
+        COALESCE(strftime(end_date, '%Y-%m-%d'), 'N/A') AS end_date,
+        COALESCE(date_diff('day', start_date, end_date) + 1, 0) AS duration,
+        COALESCE(NULLIF(status, ''), 'N/A') AS status,
+        COALESCE(strftime(requested_at, '%Y-%m-%d'), 'N/A') AS requested
+    FROM leaves
+    WHERE tenant_id = ? AND user_id = ?
+    ORDER BY requested_at DESC
+"""
 
 # ---------- REUSABLE CARD COMPONENT ----------
 def metric_card(icon_tag: str, value: rx.Var, label: str, change: str, color: str) -> rx.Component:
@@ -97,13 +110,13 @@ class EmployeeLeavesState(employee_dash_side_nav.EmployeeState):
     def set_notes(self, value: str):
         self.notes = value
 
-    def on_mount(self):
+    async def on_mount(self):
         """Runs when the leaves page mounts."""
         print("Mounting employee leaves page...")
-        self.get_leaves_metrics()
-        self.get_leaves_history()
+        await self.get_leaves_metrics()
+        await self.get_leaves_history()
 
-    def get_leaves_metrics(self):
+    async def get_leaves_metrics(self):
         """Fetch personal leaves metrics."""
         if not hasattr(self, "tenant_id") or not hasattr(self, "user_id"):
             print("tenant_id or user_id not ready; skipping metrics")
@@ -112,68 +125,52 @@ class EmployeeLeavesState(employee_dash_side_nav.EmployeeState):
         today = datetime.today()
         year_start = datetime(today.year, 1, 1)
 
-        self.Leaves_Taken = conn.execute(
+        self.Leaves_Taken = (await aio.fetchone(
             """
             SELECT COUNT(*) 
             FROM leaves 
             WHERE tenant_id = ? AND user_id = ? AND status = 'approved' AND start_date >= ?
             """,
             (self.tenant_id, self.user_id, year_start.date()),
-        ).fetchone()[0]
+            tenant_id=self.tenant_id,
+        ))[0]
 
         self.Leaves_Remaining = max(0, 20 - self.Leaves_Taken)
 
-        self.Pending_Requests = conn.execute(
+        self.Pending_Requests = (await aio.fetchone(
             """
             SELECT COUNT(*) 
             FROM leaves 
             WHERE tenant_id = ? AND user_id = ? AND status = 'pending'
             """,
             (self.tenant_id, self.user_id),
-        ).fetchone()[0]
+            tenant_id=self.tenant_id,
+        ))[0]
 
         print(f"[LEAVES METRICS] Taken={self.Leaves_Taken}, Remaining={self.Leaves_Remaining}, Pending={self.Pending_Requests}")
 
-    def get_leaves_history(self):
+    async def get_leaves_history(self):
         """Fetch personal leaves history."""
         if not hasattr(self, "tenant_id") or not hasattr(self, "user_id"):
             print("tenant_id or user_id not ready; skipping history")
             return
 
-        rows = conn.execute(
-            """
-            SELECT leave_id, type, start_date, end_date, status, requested_at
-            FROM leaves
-            WHERE tenant_id = ? AND user_id = ?
-            ORDER BY requested_at DESC
-            """,
+        data = await aio.fetch_records(
+            LEAVE_HISTORY_SQL,
             (self.tenant_id, self.user_id),
-        ).fetchall()
-
-        data = []
-        for row in rows:
-            leave_id, leave_type, start_d, end_d, status, requested = row
-            duration = (end_d - start_d).days + 1 if start_d and end_d else 0
-            data.append({
-                'id': leave_id,
-                'type': leave_type or 'N/A',
-                'start_date': start_d.strftime('%Y-%m-%d') if start_d else 'N/A',
-                'end_date': end_d.strftime('%Y-%m-%d') if end_d else 'N/A',
-                'duration': duration,
-                'status': status or 'N/A',
-                'requested': requested.strftime('%Y-%m-%d') if requested else 'N/A'
-            })
+            tenant_id=self.tenant_id,
+        )
         self.leaves_data = data
         print(f"[LEAVES HISTORY] Loaded {len(data)} records for user {self.user_id}")
 
-    def submit_leave_request(self):
+    async def submit_leave_request(self):
         """Submit a new leave request."""
         if not hasattr(self, "tenant_id") or not hasattr(self, "user_id"):
             print("tenant_id or user_id not ready; cannot submit")
             return
 
         leave_id = str(uuid.uuid4())
-        conn.execute(
+        await aio.execute(
             """
             INSERT INTO leaves (leave_id, tenant_id, user_id, type, start_date, end_date, status, requested_at)
             VALUES (?, ?, ?, ?, ?, ?, 'pending', NOW())
@@ -190,8 +187,8 @@ class EmployeeLeavesState(employee_dash_side_nav.EmployeeState):
         self.notes = ""
 
         # Refresh metrics and history
-        self.get_leaves_metrics()
-        self.get_leaves_history()
+        await self.get_leaves_metrics()
+        await self.get_leaves_history()
 
 
 # ---------- LEAVES PAGE ----------
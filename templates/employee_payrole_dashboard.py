@@ -1,10 +1,7 @@
 import reflex as rx
-import duckdb
-from datetime import date
+from datetime import date, datetime
 from components import dashboard_navbar, employee_dash_side_nav
-
-# ---------------- DATABASE CONNECTION ----------------
-conn = duckdb.connect(database="hrms.duckdb")
+from database_connections import aio
 
 
 # ---------------- METRIC CARD COMPONENT ----------------
@@ -46,28 +43,32 @@ class EmployeePayrollState(employee_dash_side_nav.EmployeeState):
     net_salary: float = 0.0
 
     # ---------------- LOAD AVAILABLE MONTHS ----------------
-    def load_available_months(self):
-        rows = conn.execute(
+    async def load_available_months(self):
+        rows = await aio.fetchall(
             "SELECT DISTINCT month FROM payroll WHERE user_id=? ORDER BY month DESC",
             (self.user_id,),
-        ).fetchall()
-        self.available_months = [r[0] for r in rows]
-        if self.available_months and not self.month_selected:
+            tenant_id=self.tenant_id,
+        )
+        # month is a DATE (first of the month); the picker works in "YYYY-MM".
+        self.available_months = [r[0].strftime("%Y-%m") for r in rows]
+        if self.available_months and self.month_selected not in self.available_months:
             self.month_selected = self.available_months[0]
 
     # ---------------- LOAD PAYROLL ----------------
-    def set_month(self, month: str):
+    async def set_month(self, month: str):
         self.month_selected = month
-        self.load_payroll()
+        await self.load_payroll()
 
-    def load_payroll(self):
+    async def load_payroll(self):
         if not self.month_selected:
             return
-        row = conn.execute(
+        month_start = datetime.strptime(self.month_selected, "%Y-%m").date()
+        row = await aio.fetchone(
             "SELECT gross_salary, deductions, net_salary, processed_at "
             "FROM payroll WHERE user_id=? AND month=?",
-            (self.user_id, self.month_selected),
-        ).fetchone()
+            (self.user_id, month_start),
+            tenant_id=self.tenant_id,
+        )
         if row:
             self.payroll_data = {
                 "gross_salary": row[0],
@@ -87,8 +88,9 @@ class EmployeePayrollState(employee_dash_side_nav.EmployeeState):
             self.net_salary = 0.0
 
     # ---------------- ON MOUNT ----------------
-    def on_load(self):
-        self.load_available_months()
+    async def on_load(self):
+        await self.load_available_months()
+        await self.load_payroll()
 
 
 # ---------------- METRIC CARDS ----------------
@@ -1,11 +1,7 @@
 import reflex as rx
-import duckdb
 import uuid
-from datetime import datetime
 from components.navbar import navbar
-
-# Connect to database
-conn = duckdb.connect(database="hrms.duckdb")
+from database_connections import aio, login_audit, passwords, tenants
 
 
 class LoginState(rx.State):
@@ -49,36 +45,69 @@ class LoginState(rx.State):
         self.full_name = ""
         return rx.redirect("/login")
 
-    def login_user(self):
+    def _record_attempt(self, success: bool, login_ids=(), password: str | None = None,
+                        old_password: str | None = None):
+        """Queue last_login / failed_attempts and the audit row; written in batches."""
+        headers = self.router.headers
+        # Reflex's session.client_ip already trusts X-Forwarded-For; the
+        # socket peer is in the asgi-scope-client header it adds.
+        login_audit.record(
+            self.tenant_id or None, self.username, success, login_ids,
+            ip=login_audit.client_ip(
+                headers.raw_headers.get("asgi-scope-client"),
+                headers.raw_headers.get("x-forwarded-for", ""),
+            ),
+            user_agent=headers.user_agent or None,
+            password=password,
+            old_password=old_password,
+        )
+
+    async def login_user(self):
         """Validate login credentials and set session."""
         try:
-            if not all([self.company_name, self.username, self.password]):
+            if not all([self.username, self.password]):
                 self.message = "⚠️ Please fill all fields."
                 return
 
-            # Check company exists
-            tenant = conn.execute(
-                "SELECT tenant_id FROM tenants WHERE company_name = ?", (self.company_name,)
-            ).fetchone()
+            # Resolve the tenant from the in-memory directory: the company
+            # name if one was typed, else the work email's domain or the host
+            # the app is served on (e.g. hr.acme.io).
+            tenant = await tenants.resolve(self.company_name, self.username, self.router.headers.host)
 
             if not tenant:
-                self.message = "❌ Company not found. Please check the name."
+                self.tenant_id = ""
+                self._record_attempt(False)
+                self.message = (
+                    "❌ Company not found. Please check the name."
+                    if self.company_name.strip()
+                    else "⚠️ Please enter your company name."
+                )
                 return
 
-            self.tenant_id = tenant[0]
+            self.tenant_id = tenant.tenant_id
 
-            # Validate credentials
-            user = conn.execute(
+            # Validate credentials. The stored hash is checked on the hashing
+            # pool, never on the event loop; an unknown username still costs
+            # one verification.
+            candidates = await aio.fetchall(
                 """
-                SELECT u.user_id, u.name,u.role
+                SELECT l.login_id, l.password, u.user_id, u.name, u.role
                 FROM logins l
                 JOIN users u ON l.user_id = u.user_id
-                WHERE l.username = ? AND l.password = ? AND l.tenant_id = ?
+                WHERE (l.username = ? OR l.email = ?) AND l.tenant_id = ?
                 """,
-                (self.username, self.password, self.tenant_id),
-            ).fetchone()
+                (self.username, self.username, self.tenant_id),
+                tenant_id=self.tenant_id,
+            )
+            user, rehash = None, False
+            for login_id, stored, *found in candidates or [(None, None)]:
+                matches, rehash = await passwords.verify(self.password, stored)
+                if matches:
+                    user = found
+                    break
 
             if not user:
+                self._record_attempt(False, [c[0] for c in candidates or ()])
                 self.message = "❌ Invalid username or password."
                 return
 
@@ -88,11 +117,11 @@ class LoginState(rx.State):
             self.role = user[2]
             self.session_id = str(uuid.uuid4())
 
-            # Update last login
-            conn.execute(
-                "UPDATE logins SET last_login = ? WHERE username = ?",
-                (datetime.now(), self.username),
-            )
+            # Record the login (last_login, reset failed_attempts, audit row)
+            # without waiting for the writer; plaintext or outdated hashes
+            # are upgraded to the current cost now that the password is known.
+            new_hash = await passwords.hash(self.password) if rehash else None
+            self._record_attempt(True, [login_id], password=new_hash, old_password=stored)
 
             self.message = f"✅ Welcome back, {self.full_name}!"
             if self.role !='admin':
@@ -118,13 +147,13 @@ def login_page() -> rx.Component:
                         margin_bottom="1em",
                     ),
                     rx.input(
-                        placeholder="Company Name",
+                        placeholder="Company Name (optional with a work email)",
                         value=LoginState.company_name,
                         on_change=LoginState.set_company_name,
                         margin_bottom="0.5em",
                     ),
                     rx.input(
-                        placeholder="Username",
+                        placeholder="Username or Email",
                         value=LoginState.username,
                         on_change=LoginState.set_username,
                         margin_bottom="0.5em",
@@ -1,11 +1,8 @@
 import reflex as rx
-import duckdb
 import uuid
 from datetime import datetime
 from components.navbar import navbar
-
-# Connect to database
-conn = duckdb.connect(database='hrms.duckdb')
+from database_connections import aio, cache, passwords, tenants
 
 class RegisterState(rx.State):
     # Form fields
@@ -17,57 +14,86 @@ class RegisterState(rx.State):
     password: str = ""
     message: str = ""
 
-    def register_user(self):
+    async def register_user(self):
         try:
             # Validation
             if not all([self.company_name, self.name, self.email, self.username, self.password]):
                 self.message = "⚠️ Please fill in all fields."
                 return
 
-            # Check if username exists
-            existing_user = conn.execute(
-                "SELECT username FROM logins WHERE username = ?", (self.username,)
-            ).fetchone()
-            if existing_user:
-                self.message = "❌ Username already taken. Please choose another."
-                return
+            # Lookups and inserts share one transaction so a half-registered
+            # tenant is never left behind.
+            def register(cur, company_name, name, email, role, username, password):
+                # Check if username exists
+                existing_user = cur.execute(
+                    "SELECT username FROM logins WHERE username = ?", (username,)
+                ).fetchone()
+                if existing_user:
+                    return None, "❌ Username already taken. Please choose another."
 
-            # Check if company (tenant) exists
-            tenant = conn.execute(
-                "SELECT tenant_id FROM tenants WHERE company_name = ?", (self.company_name,)
-            ).fetchone()
+                # Check if company (tenant) exists; names match the way
+                # the login tenant directory matches them.
+                tenant = cur.execute(
+                    f"SELECT tenant_id FROM tenants WHERE {tenants.NORMALIZED_COMPANY_SQL} = ? ORDER BY created_at LIMIT 1",
+                    (tenants.normalize_company(company_name),),
+                ).fetchone()
 
-            if tenant:
-                tenant_id = tenant[0]
-            else:
-                tenant_id = str(uuid.uuid4())
-                conn.execute(
-                    "INSERT INTO tenants VALUES (?, ?, ?, ?, ?)",
-                    [tenant_id, self.company_name, f"{self.company_name.lower().replace(' ', '')}.io", "basic", datetime.now()],
-                )
+                if tenant:
+                    tenant_id = tenant[0]
+                else:
+                    # The suggested domain is stored unverified: it does not
+                    # route logins until an admin verifies it, but no two
+                    # tenants may hold the same one.
+                    domain = f"{company_name.lower().replace(' ', '')}.io"
+                    if cur.execute("SELECT 1 FROM tenants WHERE lower(domain) = ?", (domain,)).fetchone():
+                        return None, f"❌ A company with the domain {domain} is already registered."
+                    tenant_id = str(uuid.uuid4())
+                    cur.execute(
+                        """
+                        INSERT INTO tenants (tenant_id, company_name, domain, plan, created_at, domain_verified)
+                        VALUES (?, ?, ?, ?, ?, FALSE)
+                        """,
+                        [tenant_id, company_name, domain, "basic", datetime.now()],
+                    )
 
-            # Create user + login
-            user_id = str(uuid.uuid4())
-            login_id = str(uuid.uuid4())
+                # Create user + login
+                user_id = str(uuid.uuid4())
+                login_id = str(uuid.uuid4())
 
-            conn.execute(
-                "INSERT INTO users VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
-                [
-                    user_id,
-                    tenant_id,
-                    self.company_name,
-                    self.name,
-                    self.email,
-                    self.role,
-                    "active",
-                    datetime.now(),
-                ],
-            )
+                cur.execute(
+                    "INSERT INTO users VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    [
+                        user_id,
+                        tenant_id,
+                        company_name,
+                        name,
+                        email,
+                        role,
+                        "active",
+                        datetime.now(),
+                    ],
+                )
+
+                cur.execute(
+                    """
+                    INSERT INTO logins (login_id, tenant_id, user_id, username, password, email,
+                                        last_login, failed_attempts, account_locked, created_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    [login_id, tenant_id, user_id, username, password, email, None, 0, False, datetime.now()],
+                )
+                return tenant_id, None
 
-            conn.execute(
-                "INSERT INTO logins VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
-                [login_id, tenant_id, user_id, self.username, self.password, None, 0, False, datetime.now()],
+            tenant_id, error = await aio.run_write(
+                register,
+                self.company_name, self.name, self.email, self.role, self.username,
+                await passwords.hash(self.password),
             )
+            if error:
+                self.message = error
+                return
+            cache.invalidate(None, "tenants")
+            cache.invalidate(tenant_id, "users")
 
             self.message = f"✅ Registration successful! Welcome to {self.company_name}, {self.name}."
         except Exception as e:
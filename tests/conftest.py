@@ -0,0 +1,116 @@
+import asyncio
+import inspect
+import os
+from datetime import datetime
+
+import pytest
+
+from database_connections import attendance_ingest, attendance_summary, cache, login_audit, migrations, passwords, pool
+
+
+def _reset_singletons():
+    pool._pool = pool._pool_pid = None
+    cache._cache = cache._cache_pid = None
+    attendance_ingest._ingestor = attendance_ingest._ingestor_pid = None
+    login_audit._recorder = login_audit._recorder_pid = None
+
+
+@pytest.fixture
+def fresh_pool(tmp_path):
+    """A process-wide pool on an empty temp database file."""
+    _reset_singletons()
+    pool._pool = pool.ConnectionPool(str(tmp_path / "test.duckdb"))
+    pool._pool_pid = os.getpid()
+    yield pool._pool
+    pool._pool.close()
+    _reset_singletons()
+
+
+@pytest.fixture
+def db(fresh_pool):
+    """The temp database migrated to the current schema."""
+    migrations.migrate()
+    return fresh_pool
+
+
+@pytest.fixture
+def tenant(db):
+    """Tenant "t1" with three active employees u1..u3, each with login "user<i>" / "pw<i>"."""
+    with pool.write_cursor() as cur:
+        cur.execute(
+            "INSERT INTO tenants (tenant_id, company_name, domain, plan) VALUES ('t1', 'Acme Corp', 'acme.io', 'basic')"
+        )
+        for i in (1, 2, 3):
+            cur.execute(
+                "INSERT INTO users VALUES (?, 't1', 'Acme Corp', ?, ?, 'dev', 'active', NOW())",
+                (f"u{i}", f"User {i}", f"user{i}@acme.io"),
+            )
+            cur.execute(
+                """
+                INSERT INTO logins (login_id, tenant_id, user_id, username, password, email, created_at)
+                VALUES (?, 't1', ?, ?, ?, ?, ?)
+                """,
+                (f"l{i}", f"u{i}", f"user{i}", passwords.hash_password(f"pw{i}", n=16),
+                 f"user{i}@acme.io", datetime.now()),
+            )
+    return "t1"
+
+
+@pytest.fixture
+def ingestor(tenant, tmp_path, monkeypatch):
+    """The process-wide attendance ingestor, logging to a temp file."""
+    ingestor = attendance_ingest.AttendanceIngestor(log_path=str(tmp_path / "ingest.log"), flush_ms=1)
+    monkeypatch.setattr(attendance_ingest, "_ingestor", ingestor)
+    monkeypatch.setattr(attendance_ingest, "_ingestor_pid", os.getpid())
+    return ingestor
+
+
+@pytest.fixture
+def make_state():
+    """``make_state(cls, **values)``: ``cls`` in a fresh Reflex state tree, with ``values`` set."""
+    import reflex as rx
+
+    def make(cls, **values):
+        state = rx.State(_reflex_internal_init=True).get_substate(cls.get_full_name().split("."))
+        for name, value in values.items():
+            setattr(state, name, value)
+        return state
+
+    return make
+
+
+@pytest.fixture
+def run_handler():
+    """``run_handler(state, name, *args)``: run an event handler to completion.
+
+    Returns what the handler returned, or the list of what it yielded.
+    """
+
+    def run(state, name: str, *args):
+        async def main():
+            result = getattr(type(state), name).fn(state, *args)
+            if inspect.isasyncgen(result):
+                return [event async for event in result]
+            if inspect.isawaitable(result):
+                return await result
+            return result
+
+        return asyncio.run(main())
+
+    return run
+
+
+@pytest.fixture
+def attendance(tenant):
+    """Insert closed sessions ``(user_id, date, status, check_in, check_out)`` and rebuild the summary."""
+
+    def insert(*sessions):
+        with pool.write_cursor() as cur:
+            cur.executemany(
+                "INSERT INTO attendance (tenant_id, user_id, date, status, check_in, check_out) "
+                "VALUES ('t1', ?, ?, ?, ?, ?)",
+                sessions,
+            )
+            attendance_summary.rebuild(cur, "t1")
+
+    return insert
@@ -0,0 +1,48 @@
+from datetime import date, datetime, timedelta
+
+from database_connections import pool
+from templates.admin_dashboard import AdminDashboardState
+
+
+def test_metrics_come_from_one_statement(attendance, make_state, run_handler):
+    today = date.today()
+    at = datetime.combine(today, datetime.min.time())
+    attendance(
+        ("u2", today, "present", at + timedelta(hours=9), at + timedelta(hours=18)),
+        ("u3", today, "present", at + timedelta(hours=9), at + timedelta(hours=15)),
+    )
+    with pool.write_cursor() as cur:
+        cur.execute("UPDATE users SET status = 'inactive' WHERE user_id = 'u3'")
+        cur.execute("INSERT INTO departments VALUES ('d1', 't1', 'Engineering', 'u1')")
+        cur.execute("INSERT INTO leaves VALUES ('lv1', 't1', 'u2', 'sick', ?, ?, 'pending', NOW())", (today, today))
+
+    state = make_state(AdminDashboardState, tenant_id="t1")
+    run_handler(state, "get_metrics")
+    assert (state.Total_Employees, state.New_Hires, state.Attrition) == (3, 3, 1)
+    assert (state.Departments, state.Leave_Requests) == (1, 1)
+    # u3 worked 6 hours: a half day, not present.
+    assert state.Attendance_Rate == 50.0
+
+
+def test_check_in_and_out_adjust_the_rate_like_a_reload(ingestor, attendance, make_state, run_handler):
+    today = date.today()
+    at = datetime.combine(today, datetime.min.time())
+    attendance(("u2", today, "present", at + timedelta(hours=9), at + timedelta(hours=18)))
+
+    state = make_state(AdminDashboardState, tenant_id="t1", user_id="u1")
+    run_handler(state, "on_mount")
+    assert state.Attendance_Rate == 100.0 and not state.isLogin
+
+    def reloaded_rate():
+        fresh = make_state(AdminDashboardState, tenant_id="t1")
+        run_handler(fresh, "get_metrics")
+        return fresh.Attendance_Rate
+
+    run_handler(state, "LoginStateUpdate", "in-1")
+    assert state.isLogin and state.Attendance_Rate == reloaded_rate() == 100.0
+    row = next(e for e in state.employees_data if e["user_id"] == "u1")
+    assert (row["check_in"], row["check_out"], row["status"]) == ("Yes", "No", "present")
+
+    # Checking out a few seconds later: the day is too short to count.
+    run_handler(state, "LoginStateUpdate", "out-1")
+    assert not state.isLogin and state.Attendance_Rate == reloaded_rate() == 50.0
@@ -0,0 +1,63 @@
+import asyncio
+import gc
+import threading
+
+from database_connections import aio
+
+
+def test_reads_run_off_the_event_loop(db):
+    async def main():
+        loop_thread = threading.get_ident()
+        return await aio.run_read(lambda cur: threading.get_ident() != loop_thread)
+
+    assert asyncio.run(main())
+
+
+def test_tenant_reads_are_limited(db, monkeypatch):
+    monkeypatch.setattr(aio, "TENANT_READ_LIMIT", 2)
+    running = peak = 0
+    lock = threading.Lock()
+
+    def read(cur):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        cur.execute("SELECT sum(range) FROM range(200000)").fetchall()
+        with lock:
+            running -= 1
+
+    async def main():
+        await asyncio.gather(*(aio.run_read(read, tenant_id="t1") for _ in range(8)))
+
+    asyncio.run(main())
+    assert peak <= 2
+
+
+def test_idle_tenant_slots_are_released(db):
+    async def main():
+        await asyncio.gather(*(aio.fetchone("SELECT 1", tenant_id=f"t{i}") for i in range(100)))
+
+    asyncio.run(main())
+    gc.collect()
+    assert len(aio._tenant_slots) == 0
+
+
+def test_write_is_committed(db):
+    asyncio.run(aio.execute("INSERT INTO tenants (tenant_id, company_name) VALUES ('t9', 'Nine')"))
+    assert asyncio.run(aio.fetchone("SELECT company_name FROM tenants WHERE tenant_id = 't9'")) == ("Nine",)
+
+
+def test_records_are_built_column_wise_with_nulls_as_none(db):
+    records = asyncio.run(aio.fetch_records(
+        """
+        SELECT n, s, strftime(d, '%Y-%m-%d') AS d
+        FROM (VALUES (1, 'a', DATE '2030-01-07'), (2, NULL, NULL)) t(n, s, d)
+        ORDER BY n
+        """
+    ))
+    assert records == [
+        {"n": 1, "s": "a", "d": "2030-01-07"},
+        {"n": 2, "s": None, "d": None},
+    ]
+    assert asyncio.run(aio.fetch_records("SELECT 1 AS n WHERE FALSE")) == []
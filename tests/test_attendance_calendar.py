@@ -0,0 +1,72 @@
+from datetime import date, datetime
+
+import pytest
+
+from database_connections import attendance_calendar, pool
+from templates import admin_attendance_dashboard
+from templates.admin_attendance_dashboard import AttendanceDashboardState
+
+STATUS = {status: code for code, status in enumerate(attendance_calendar.STATUSES)}
+
+
+def session(user_id, day, hours, status="present"):
+    return user_id, day, status, datetime(day.year, day.month, day.day, 8), \
+        datetime(day.year, day.month, day.day, 8 + hours)
+
+
+@pytest.fixture
+def month(attendance):
+    attendance(
+        session("u1", date(2030, 2, 1), 9),
+        session("u1", date(2030, 2, 28), 6),
+        session("u2", date(2030, 2, 3), 9, "remote"),
+        session("u3", date(2030, 2, 3), 1),
+        session("u3", date(2030, 3, 1), 9),  # next month
+    )
+
+
+def test_matrix_places_every_summary_row(month):
+    with pool.read_cursor() as cur:
+        matrix = attendance_calendar.month_matrix(cur, "t1", date(2030, 2, 14))
+    assert matrix["user_ids"] == ["u1", "u2", "u3"]
+    assert matrix["days"][0] == date(2030, 2, 1) and len(matrix["days"]) == 28
+    codes = matrix["codes"]
+    assert codes.shape == (3, 28) and codes.sum() == (
+        STATUS["present"] + STATUS["Half day"] + STATUS["remote"] + STATUS["absent"]
+    )
+    assert (codes[0, 0], codes[0, 27]) == (STATUS["present"], STATUS["Half day"])
+    assert (codes[1, 2], codes[2, 2]) == (STATUS["remote"], STATUS["absent"])
+
+    counts = attendance_calendar.day_counts(codes)
+    assert counts["present"][0] == 1 and counts["remote"][2] == 1 and counts["absent"][2] == 1
+    assert sum(counts["leave"]) == 0
+
+
+def test_matrix_pages_by_name(month):
+    with pool.read_cursor() as cur:
+        first = attendance_calendar.month_matrix(cur, "t1", date(2030, 2, 1), limit=2)
+        rest = attendance_calendar.month_matrix(
+            cur, "t1", date(2030, 2, 1), after=(first["names"][-1], first["user_ids"][-1]), limit=2
+        )
+    assert first["user_ids"] == ["u1", "u2"] and rest["user_ids"] == ["u3"]
+    assert rest["codes"][0, 2] == STATUS["absent"]
+
+
+def test_empty_tenant(db):
+    with pool.read_cursor() as cur:
+        matrix = attendance_calendar.month_matrix(cur, "none", date(2030, 12, 5))
+    assert matrix["codes"].shape == (0, 31) and matrix["days"][-1] == date(2030, 12, 31)
+
+
+def test_heatmap_pages_and_labels(month, make_state, run_handler, monkeypatch):
+    monkeypatch.setattr(admin_attendance_dashboard, "HEATMAP_PAGE_SIZE", 2)
+    state = make_state(AttendanceDashboardState, tenant_id="t1", date_selected="2030-02-10")
+    run_handler(state, "load_heatmap")
+    assert [r["user_id"] for r in state.heatmap_rows] == ["u1", "u2"] and state.has_more_heatmap
+    assert state.heatmap_days == [str(d) for d in range(1, 29)]
+    u1 = state.heatmap_rows[0]
+    assert (u1["cells"][0], u1["cells"][1], u1["cells"][27], u1["worked"]) == ("present", "", "Half day", 2)
+
+    run_handler(state, "load_more_heatmap")
+    assert [r["user_id"] for r in state.heatmap_rows] == ["u1", "u2", "u3"] and not state.has_more_heatmap
+    assert state.heatmap_rows[2]["worked"] == 0
@@ -0,0 +1,183 @@
+import asyncio
+import functools
+import threading
+import time
+from datetime import date, datetime
+
+import pytest
+
+from database_connections import attendance_ingest, attendance_summary, pool
+from database_connections.attendance_ingest import AttendanceIngestor
+
+DAY = date(2030, 1, 7)
+
+
+def event(kind, user_id="u1", hour=9, event_id=None, **extra):
+    return {"kind": kind, "tenant_id": "t1", "user_id": user_id, "date": DAY,
+            "at": datetime(2030, 1, 7, hour), "event_id": event_id, **extra}
+
+
+def sessions(user_id="u1"):
+    with pool.read_cursor() as cur:
+        return cur.execute(
+            "SELECT check_in, check_out, status FROM attendance WHERE user_id = ? AND date = ? ORDER BY check_in",
+            (user_id, DAY),
+        ).fetchall()
+
+
+def applied_seq():
+    with pool.read_cursor() as cur:
+        return attendance_ingest._applied_seq(cur)
+
+
+@pytest.fixture
+def hold_writer():
+    """Hold the write cursor for ``seconds`` on a background thread."""
+    threads = []
+
+    def hold(seconds):
+        taken = threading.Event()
+
+        def run():
+            with pool.write_cursor():
+                taken.set()
+                time.sleep(seconds)
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        taken.wait()
+        threads.append(thread)
+        return thread
+
+    yield hold
+    for thread in threads:
+        thread.join()
+
+
+def test_check_in_and_out(ingestor):
+    assert ingestor.submit(event("in", event_id="a")).result(5) == (None, "present", True)
+    assert ingestor.submit(event("out", hour=18, event_id="b")).result(5) == ("present", "present", True)
+    assert sessions() == [(datetime(2030, 1, 7, 9), datetime(2030, 1, 7, 18), "present")]
+
+
+def test_short_session_is_classified(ingestor):
+    ingestor.submit(event("in")).result(5)
+    assert ingestor.submit(event("out", hour=11)).result(5) == ("present", "absent", True)
+
+
+def day_summary(user_id="u1"):
+    with pool.read_cursor() as cur:
+        return cur.execute(
+            "SELECT status, worked_minutes FROM attendance_daily_summary WHERE user_id = ? AND date = ?",
+            (user_id, DAY),
+        ).fetchone()
+
+
+def test_day_status_comes_from_all_sessions(ingestor):
+    for kind, hour in (("in", 9), ("out", 18), ("in", 19)):
+        ingestor.submit(event(kind, hour=hour)).result(5)
+    assert day_summary() == ("present", 540)
+    # A short second session does not turn a full day into an absence.
+    assert ingestor.submit(event("out", hour=20)).result(5) == ("present", "present", True)
+    assert day_summary() == ("present", 600)
+    assert [s[2] for s in sessions()] == ["present", "present"]
+
+
+def test_short_sessions_add_up(ingestor):
+    for kind, hour in (("in", 9), ("out", 11), ("in", 12)):
+        ingestor.submit(event(kind, hour=hour)).result(5)
+    # Checked in again: the day is not judged until it is closed.
+    assert day_summary() == ("present", 120)
+    assert ingestor.submit(event("out", hour=16)).result(5) == ("present", "Half day", True)
+    assert day_summary() == ("Half day", 360)
+
+
+def test_summary_rebuild_matches_incremental_refresh(ingestor):
+    for kind, hour in (("in", 9), ("out", 12), ("in", 13), ("out", 14)):
+        ingestor.submit(event(kind, hour=hour)).result(5)
+    assert day_summary() == ("absent", 240)
+    with pool.write_cursor() as cur:
+        cur.execute("UPDATE attendance SET status = 'remote' WHERE user_id = 'u1'")
+        cur.execute("UPDATE attendance SET check_out = check_out + INTERVAL 4 HOUR WHERE user_id = 'u1'")
+        attendance_summary.rebuild(cur, "t1")
+    assert day_summary() == ("remote", 720)
+
+
+def test_repeated_event_id_is_not_applied_twice(ingestor):
+    assert ingestor.submit(event("in", event_id="click"))
+    assert ingestor.submit(event("in", event_id="click")).result(5)[2] is False
+    # A double click arrives as a check-out carrying the check-in's id.
+    assert ingestor.submit(event("out", hour=18, event_id="click")).result(5)[2] is False
+    assert len(sessions()) == 1 and sessions()[0][1] is None
+
+
+def test_replay_applies_logged_events(tenant, tmp_path):
+    log = tmp_path / "ingest.log"
+    events = [{**event("in", event_id="a"), "seq": 1}, {**event("in", "u2", event_id="b"), "seq": 2}]
+    log.write_text(
+        attendance_ingest._encode(events[0]) + "\n"
+        + '{"torn": \n'
+        + attendance_ingest._encode(events[1]) + "\n"
+    )
+    ingestor = AttendanceIngestor(log_path=str(log))
+    assert ingestor.replay() == 2
+    assert len(sessions("u1")) == 1 and len(sessions("u2")) == 1
+    assert applied_seq() == 2
+    assert log.read_text() == ""
+    # Events at or below applied_seq are not applied again.
+    log.write_text(attendance_ingest._encode(events[0]) + "\n")
+    assert AttendanceIngestor(log_path=str(log)).replay() == 0
+
+
+def test_bad_event_is_dropped_without_blocking_the_batch(ingestor):
+    ingestor.start()
+    batch = [(event("in", user_id), attendance_ingest.Future()) for user_id in ("u1", "ghost", "u3")]
+    for item in batch:  # straight onto the queue, so they share one batch
+        ingestor._queue.put_nowait(item)
+    good, bad, other = (future for _, future in batch)
+    assert good.result(5)[2] is True
+    with pytest.raises(attendance_ingest._DATA_ERRORS):
+        bad.result(5)  # no such employee
+    assert other.result(5)[2] is True
+    assert ingestor.stats()["failed"] == 1
+    assert applied_seq() == 3
+
+
+def test_writer_survives_unexpected_errors(ingestor):
+    ingestor.start()
+    with pytest.raises(AttributeError):
+        ingestor.submit(event("in", at=object())).result(5)  # cannot be logged
+    assert ingestor._thread.is_alive()
+    assert ingestor.submit(event("in")).result(5)[2] is True
+
+
+def test_writer_survives_lock_timeout(ingestor, monkeypatch, hold_writer):
+    # The write cursor busy past its acquire timeout (an import, a payroll
+    # run) must delay events, not drop them or kill the writer.
+    monkeypatch.setattr(attendance_ingest, "write_cursor", functools.partial(pool.write_cursor, timeout=0.1))
+    monkeypatch.setattr(attendance_ingest, "INGEST_RETRY_MAX_S", 0.2)
+    ingestor.start()
+    hold_writer(1.0)
+    future = ingestor.submit(event("in", event_id="a"))
+    assert future.result(10) == (None, "present", True)
+    assert ingestor.stats()["retries"] > 0
+    assert ingestor.stats()["failed"] == 0
+    assert ingestor._thread.is_alive()
+    assert ingestor.submit(event("out", hour=18, event_id="b")).result(5)[2] is True
+
+
+def test_unacknowledged_event_times_out_but_is_applied(ingestor, monkeypatch, hold_writer):
+    monkeypatch.setattr(attendance_ingest, "write_cursor", functools.partial(pool.write_cursor, timeout=0.1))
+    monkeypatch.setattr(attendance_ingest, "INGEST_RETRY_MAX_S", 0.2)
+    monkeypatch.setattr(attendance_ingest, "INGEST_ACK_TIMEOUT", 0.3)
+    attendance_ingest.get_ingestor().start()
+    holder = hold_writer(1.0)
+
+    with pytest.raises(attendance_ingest.IngestTimeout):
+        asyncio.run(attendance_ingest.check_in("t1", "u1", DAY, datetime(2030, 1, 7, 9), "a"))
+    holder.join()
+
+    # Resending the same click after the timeout is harmless.
+    result = asyncio.run(attendance_ingest.check_in("t1", "u1", DAY, datetime(2030, 1, 7, 9), "a"))
+    assert result[2] is False
+    assert len(sessions()) == 1
@@ -0,0 +1,50 @@
+from datetime import date, datetime
+
+from templates.admin_attendance_dashboard import AttendanceDashboardState
+
+
+def session(user_id, day, hours=9, status="present"):
+    return (user_id, date(2030, 1, day), status, datetime(2030, 1, day, 9), datetime(2030, 1, day, 9 + hours))
+
+
+def test_report_counts_per_employee_and_per_day(attendance, make_state, run_handler):
+    attendance(
+        session("u1", 7), session("u1", 8, status="remote"), session("u1", 9, hours=6),
+        session("u2", 7), session("u2", 8, status="leave"),
+        session("u3", 9, hours=2),
+    )
+    state = make_state(AttendanceDashboardState, tenant_id="t1", start_date="2030-01-07", end_date="2030-01-10")
+    run_handler(state, "generate_report")
+
+    assert state.show_report
+    report = {r["user_id"]: r for r in state.report_data}
+    assert set(report) == {"u1", "u2", "u3"}
+    u1 = report["u1"]
+    assert (u1["total_days"], u1["present_days"], u1["absent_days"]) == (4, 3, 1)
+    assert (u1["present"], u1["remote"], u1["half_day"], u1["leave"]) == (1, 1, 1, 0)
+    assert (u1["attendance_rate_pct"], u1["rate_color"]) == (75.0, "orange")
+    assert report["u2"]["leave"] == 1
+    assert report["u3"]["rate_color"] == "red"
+
+    # One histogram bar per day of the range, including days without rows.
+    assert [d["day"] for d in state.report_histogram] == ["01-07", "01-08", "01-09", "01-10"]
+    assert state.report_histogram[0] == {
+        "day": "01-07", "present": 2, "half_day": 0, "remote": 0, "leave": 0, "absent": 0,
+    }
+    assert state.report_histogram[2]["half_day"] == 1 and state.report_histogram[2]["absent"] == 1
+    assert state.report_histogram[3] == {
+        "day": "01-10", "present": 0, "half_day": 0, "remote": 0, "leave": 0, "absent": 0,
+    }
+
+
+def test_employee_without_attendance_is_listed(tenant, make_state, run_handler):
+    state = make_state(AttendanceDashboardState, tenant_id="t1", start_date="2030-01-07", end_date="2030-01-07")
+    run_handler(state, "generate_report")
+    assert [(r["present_days"], r["absent_days"]) for r in state.report_data] == [(0, 1)] * 3
+
+
+def test_inverted_range_clears_the_report(tenant, make_state, run_handler):
+    state = make_state(AttendanceDashboardState, tenant_id="t1", start_date="2030-01-08", end_date="2030-01-07",
+                       show_report=True)
+    run_handler(state, "generate_report")
+    assert not state.show_report and state.report_data == []
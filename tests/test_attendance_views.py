@@ -0,0 +1,38 @@
+from datetime import date, datetime
+
+from templates.admin_attendance_dashboard import AttendanceDashboardState
+
+
+def test_daily_table_is_formatted_in_sql(attendance, make_state, run_handler):
+    attendance(("u2", date(2030, 1, 7), "present", datetime(2030, 1, 7, 9, 5), datetime(2030, 1, 7, 18, 30)))
+    state = make_state(AttendanceDashboardState, tenant_id="t1", date_selected="2030-01-07")
+    run_handler(state, "load_attendance")
+    rows = {r["user_id"]: r for r in state.attendance_data}
+    assert rows["u2"] == {
+        "user_id": "u2", "name": "User 2", "email": "user2@acme.io", "role": "dev",
+        "check_in": "09:05:00", "check_out": "18:30:00", "status": "Present",
+    }
+    assert (rows["u1"]["check_in"], rows["u1"]["status"]) == ("-", "Absent")
+    assert (state.total_employees, state.present_today, state.absent_today) == (3, 1, 2)
+
+
+def test_monthly_view_has_one_row_per_day(attendance, make_state, run_handler):
+    attendance(
+        ("u1", date(2028, 2, 1), "present", datetime(2028, 2, 1, 9), datetime(2028, 2, 1, 18)),
+        ("u1", date(2028, 2, 29), "present", datetime(2028, 2, 29, 9), datetime(2028, 2, 29, 12)),
+    )
+    state = make_state(AttendanceDashboardState, tenant_id="t1", selected_user_id="u1", date_selected="2028-02-14")
+    run_handler(state, "get_monthly_attendance")
+    days = state.monthly_attendance
+    # generate_series covers the whole (leap) month, days without rows included.
+    assert [d["date"] for d in days] == [f"2028-02-{i:02d}" for i in range(1, 30)]
+    assert days[0] == {"date": "2028-02-01", "check_in": "09:00", "check_out": "18:00", "status": "present"}
+    assert days[1] == {"date": "2028-02-02", "check_in": "Absent", "check_out": "N/A", "status": "Absent"}
+    assert days[-1]["status"] == "absent"
+
+
+def test_monthly_view_in_december(tenant, make_state, run_handler):
+    state = make_state(AttendanceDashboardState, tenant_id="t1", selected_user_id="u1", date_selected="2029-12-31")
+    run_handler(state, "get_monthly_attendance")
+    assert len(state.monthly_attendance) == 31
+    assert state.monthly_attendance[-1]["date"] == "2029-12-31"
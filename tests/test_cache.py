@@ -0,0 +1,96 @@
+import asyncio
+import time
+
+from database_connections import cache, pool
+from database_connections.cache import QueryCache
+
+
+def key(tenant, topics, name="q"):
+    return (tenant, topics, "all", name, ())
+
+
+def test_hit_after_put():
+    cache = QueryCache()
+    k = key("t1", ("users",))
+    cache.put(k, [1], cache.versions("t1", ("users",)))
+    assert cache.get(k) == (True, [1])
+
+
+def test_put_after_invalidate_is_dropped():
+    # A read that started before a write must not store its stale result.
+    cache = QueryCache()
+    k = key("t1", ("users",))
+    versions = cache.versions("t1", ("users",))
+    cache.invalidate("t1", "users")
+    cache.put(k, ["stale"], versions)
+    assert cache.get(k) == (False, None)
+
+
+def test_invalidate_only_drops_matching_tenant_and_topic():
+    cache = QueryCache()
+    entries = {
+        key("t1", ("users",)): 1,
+        key("t1", ("payroll",)): 2,
+        key("t2", ("users",)): 3,
+        key("t1", ("users", "attendance"), "joined"): 4,
+    }
+    for k, v in entries.items():
+        cache.put(k, v, cache.versions(k[0], k[1]))
+    cache.invalidate("t1", "users")
+    assert {k: cache.get(k)[0] for k in entries} == {
+        key("t1", ("users",)): False,
+        key("t1", ("payroll",)): True,
+        key("t2", ("users",)): True,
+        key("t1", ("users", "attendance"), "joined"): False,
+    }
+
+
+def test_versions_bump_without_notify():
+    # Remote (Redis) invalidations use notify=False; versions still move so
+    # in-flight reads and the tenant directory see them.
+    cache = QueryCache()
+    heard = []
+    cache.subscribe(lambda tenant_id, topics: heard.append((tenant_id, topics)))
+    cache.invalidate(None, "tenants", notify=False)
+    assert cache.versions(None, ("tenants",)) == (1,)
+    assert heard == []
+    cache.invalidate(None, "tenants")
+    assert heard == [(None, ("tenants",))]
+
+
+def test_lru_eviction():
+    cache = QueryCache(max_entries=2)
+    a, b, c = (key("t1", ("users",), n) for n in "abc")
+    for k in (a, b):
+        cache.put(k, k[3], (0,))
+    cache.get(a)  # a is now the most recently used
+    cache.put(c, "c", (0,))
+    assert cache.get(b) == (False, None)
+    assert cache.get(a) == (True, "a")
+    assert cache.stats()["evictions"] == 1
+
+
+def test_ttl_expiry():
+    cache = QueryCache(ttl=0.01)
+    k = key("t1", ("users",))
+    cache.put(k, 1, (0,))
+    time.sleep(0.02)
+    assert cache.get(k) == (False, None)
+    assert cache.stats()["expirations"] == 1
+
+
+def test_read_through_until_the_topic_is_invalidated(tenant):
+    sql = "SELECT name FROM users WHERE tenant_id = ? AND user_id = 'u1'"
+
+    def read():
+        return asyncio.run(cache.fetchone("users", sql, ("t1",), tenant_id="t1"))
+
+    assert read() == ("User 1",)
+    with pool.write_cursor() as cur:
+        cur.execute("UPDATE users SET name = 'Renamed' WHERE user_id = 'u1'")
+    assert read() == ("User 1",)  # served from the cache
+    cache.invalidate("t1", "attendance")
+    assert read() == ("User 1",)  # other topics leave it alone
+    cache.invalidate("t1", "users")
+    assert read() == ("Renamed",)
+    assert cache.stats()["hits"] == 2
@@ -0,0 +1,113 @@
+import pytest
+
+from database_connections import employee_import, passwords, pool
+
+
+def write_csv(tmp_path, rows, header="name,email,password,role,status,username"):
+    path = tmp_path / "employees.csv"
+    path.write_text("\n".join([header, *rows]) + "\n")
+    return str(path)
+
+
+def errors(result):
+    return {e["row"]: e["error"] for e in result["errors"]}
+
+
+def test_imports_valid_rows_with_hashed_passwords(tenant, tmp_path):
+    path = write_csv(tmp_path, ["Dana,Dana@Acme.io,secret,dev,,", "Eli,eli@acme.io,pw,qa,inactive,eli"])
+    result = employee_import.import_employees(path, tenant)
+    assert (result["total"], result["imported"], result["rejected"]) == (2, 2, 0)
+    with pool.read_cursor() as cur:
+        rows = cur.execute(
+            """
+            SELECT u.email, u.status, l.username, l.password
+            FROM users u JOIN logins l USING (user_id)
+            WHERE u.email IN ('dana@acme.io', 'eli@acme.io') ORDER BY 1
+            """
+        ).fetchall()
+    assert [r[:3] for r in rows] == [("dana@acme.io", "active", "dana@acme.io"), ("eli@acme.io", "inactive", "eli")]
+    # Stored at the full login cost: nothing left to upgrade at first login.
+    assert passwords.verify_password("secret", rows[0][3]) == (True, False)
+    assert rows[0][3].startswith(f"scrypt${passwords.SCRYPT_N}$")
+
+
+def test_rejects_invalid_rows(tenant, tmp_path):
+    path = write_csv(tmp_path, [
+        ",nameless@acme.io,pw,,,",
+        "Bad,not-an-email,pw,,,",
+        "Nopass,nopass@acme.io,,,,",
+        "Odd,odd@acme.io,pw,,retired,",
+        "Fine,fine@acme.io,pw,,,",
+    ])
+    result = employee_import.import_employees(path, tenant)
+    assert result["imported"] == 1
+    assert errors(result) == {
+        1: "missing name", 2: "invalid email", 3: "missing password", 4: "invalid status",
+    }
+
+
+def test_rejects_duplicate_emails(tenant, tmp_path):
+    path = write_csv(tmp_path, [
+        "One,dup@acme.io,pw,,,",
+        "Two,DUP@acme.io,pw,,,",
+        "Old,user1@acme.io,pw,,,",  # already an employee of the tenant
+    ])
+    result = employee_import.import_employees(path, tenant)
+    assert result["imported"] == 1
+    assert errors(result) == {2: "duplicate email in file", 3: "email already exists"}
+
+
+def test_rejects_duplicate_and_taken_usernames(tenant, tmp_path):
+    path = write_csv(tmp_path, [
+        "One,one@acme.io,pw,,,same",
+        "Two,two@acme.io,pw,,,same",
+        "Three,three@acme.io,pw,,,user2",  # login of another employee
+    ])
+    result = employee_import.import_employees(path, tenant)
+    assert result["imported"] == 1
+    assert errors(result) == {2: "duplicate username in file", 3: "username already taken"}
+
+
+def test_rejected_row_does_not_shadow_a_valid_copy(tenant, tmp_path):
+    path = write_csv(tmp_path, [",first@acme.io,pw,,,shared", "Second,second@acme.io,pw,,,shared"])
+    result = employee_import.import_employees(path, tenant)
+    assert result["imported"] == 1
+    assert errors(result) == {1: "missing name"}
+
+
+def test_username_taken_after_validation_is_rejected(tenant, tmp_path, monkeypatch):
+    # Another login claims the username between validation and the insert.
+    insert = employee_import._insert
+
+    def racing_insert(cur, *args, **kwargs):
+        cur.execute(
+            "INSERT INTO logins (login_id, tenant_id, user_id, username, password) VALUES ('lx', 't1', 'u3', 'late', 'x')"
+        )
+        return insert(cur, *args, **kwargs)
+
+    monkeypatch.setattr(employee_import, "_insert", racing_insert)
+    path = write_csv(tmp_path, ["Late,late@acme.io,pw,,,late", "Ok,ok@acme.io,pw,,,ok"])
+    result = employee_import.import_employees(path, tenant)
+    assert result["imported"] == 1
+    assert errors(result) == {1: "username already taken"}
+
+
+def test_missing_columns_and_unknown_tenant(tenant, tmp_path):
+    with pytest.raises(ValueError, match="Missing column"):
+        employee_import.import_employees(write_csv(tmp_path, ["A,a@acme.io"], header="name,email"), tenant)
+    with pytest.raises(ValueError, match="Unknown tenant"):
+        employee_import.import_employees(write_csv(tmp_path, ["A,a@acme.io,pw,,,"]), "nope")
+
+
+
+def test_hashing_does_not_hold_the_write_cursor(tenant, tmp_path, monkeypatch):
+    held = []
+    hash_password = passwords.hash_password
+
+    def probing_hash(*args, **kwargs):
+        held.append(pool.get_pool()._write_lock.locked())
+        return hash_password(*args, **kwargs)
+
+    monkeypatch.setattr(passwords, "hash_password", probing_hash)
+    employee_import.import_employees(write_csv(tmp_path, ["A,a@acme.io,pw,,,"]), tenant)
+    assert held == [False]
@@ -0,0 +1,128 @@
+from datetime import datetime
+
+import pytest
+
+from database_connections import pool
+from templates import admin_employees_management_dashboard
+from templates.admin_employees_management_dashboard import EMPLOYEE_SORTS, EmployeeCRUDState
+
+
+@pytest.fixture
+def staff(tenant, monkeypatch):
+    """Nine employees (u1..u9); several share a join date or a name, one has none."""
+    monkeypatch.setattr(admin_employees_management_dashboard, "EMPLOYEE_PAGE_SIZE", 3)
+    with pool.write_cursor() as cur:
+        cur.execute("UPDATE users SET date_joined = TIMESTAMP '2020-01-01' WHERE tenant_id = 't1'")
+        cur.executemany(
+            "INSERT INTO users VALUES (?, 't1', 'Acme Corp', ?, ?, ?, ?, ?)",
+            [
+                ("u4", "User 4", "user4@acme.io", "ops", "active", datetime(2020, 1, 2)),
+                ("u5", "User 1", "user5@acme.io", "ops", "inactive", datetime(2020, 1, 2)),
+                ("u6", "User 6", "user6@acme.io", "dev", "active", None),
+                ("u7", "User 7", "user7@acme.io", "dev", "active", datetime(2020, 1, 3)),
+                ("u8", "User 8", "user8@acme.io", "ops", "active", datetime(2020, 1, 1)),
+                ("u9", "User 9", "user9@acme.io", "dev", "active", datetime(2020, 1, 4)),
+            ],
+        )
+
+
+def expected_order(sort_by, where="TRUE"):
+    expr, _, desc = EMPLOYEE_SORTS[sort_by]
+    direction = "DESC" if desc else "ASC"
+    with pool.read_cursor() as cur:
+        return [r[0] for r in cur.execute(
+            f"SELECT user_id FROM users WHERE {where} ORDER BY {expr} {direction}, user_id {direction}"
+        ).fetchall()]
+
+
+def page_ids(state):
+    return [e["user_id"] for e in state.employees]
+
+
+@pytest.mark.parametrize("sort_by", list(EMPLOYEE_SORTS))
+def test_pages_cover_every_row_once(staff, make_state, run_handler, sort_by):
+    state = make_state(EmployeeCRUDState, tenant_id="t1", sort_by=sort_by)
+    run_handler(state, "load_employees")
+    seen = [page_ids(state)]
+    while state.has_next_page:
+        run_handler(state, "next_employee_page")
+        seen.append(page_ids(state))
+    assert [len(p) for p in seen] == [3, 3, 3]
+    assert sum(seen, []) == expected_order(sort_by)
+    assert state.page == 3 and state.employee_count == 9
+
+    # Going back reloads the same pages.
+    run_handler(state, "previous_employee_page")
+    assert page_ids(state) == seen[1] and state.page == 2
+    run_handler(state, "previous_employee_page")
+    run_handler(state, "previous_employee_page")
+    assert page_ids(state) == seen[0] and state.page == 1
+
+
+def test_last_page_is_exactly_full(staff, make_state, run_handler):
+    state = make_state(EmployeeCRUDState, tenant_id="t1", sort_by="Name A-Z")
+    run_handler(state, "load_employees")
+    run_handler(state, "next_employee_page")
+    run_handler(state, "next_employee_page")
+    assert not state.has_next_page
+    run_handler(state, "next_employee_page")
+    assert state.page == 3 and len(state.employees) == 3
+
+
+def test_filters_restart_from_the_first_page(staff, make_state, run_handler):
+    state = make_state(EmployeeCRUDState, tenant_id="t1", sort_by="Name A-Z")
+    run_handler(state, "load_employees")
+    run_handler(state, "next_employee_page")
+    run_handler(state, "set_role_filter", "ops")
+    assert state.page == 1 and state.employee_count == 3
+    assert page_ids(state) == expected_order("Name A-Z", "role = 'ops'")
+    assert state.role_options == ["all", "dev", "ops"]
+    run_handler(state, "set_search", "user9@")
+    assert state.employee_count == 0 and state.employees == []
+
+
+def reloaded(make_state, run_handler, state):
+    fresh = make_state(EmployeeCRUDState, tenant_id="t1", sort_by=state.sort_by, role_filter=state.role_filter,
+                       status_filter=state.status_filter, search=state.search)
+    run_handler(fresh, "load_employees")
+    return fresh
+
+
+def test_created_employee_is_patched_into_the_first_page(staff, make_state, run_handler):
+    state = make_state(EmployeeCRUDState, tenant_id="t1")
+    run_handler(state, "load_employees")
+    state.name, state.email, state.role, state.password = "New Hire", "new@acme.io", "dev", "secret"
+    run_handler(state, "create_employee")
+    assert state.employees[0]["name"] == "New Hire" and state.employee_count == 10
+    assert state.name == state.password == ""
+    assert page_ids(reloaded(make_state, run_handler, state))[0] == state.employees[0]["user_id"]
+
+    # The same email again is refused and leaves the page alone.
+    state.name, state.email, state.password = "Again", "new@acme.io", "secret"
+    run_handler(state, "create_employee")
+    assert state.employee_count == 10 and state.employees[1]["name"] != "Again"
+
+
+def test_update_patches_or_drops_the_row(staff, make_state, run_handler):
+    state = make_state(EmployeeCRUDState, tenant_id="t1", role_filter="dev", sort_by="Name A-Z")
+    run_handler(state, "load_employees")
+    run_handler(state, "edit_employee", "u2")
+    state.name = "User 2b"
+    run_handler(state, "update_employee")
+    row = next(e for e in state.employees if e["user_id"] == "u2")
+    assert row["name"] == "User 2b" and state.selected_user_id == ""
+
+    # Moving the employee out of the filtered role drops the row.
+    run_handler(state, "edit_employee", "u2")
+    state.role = "ops"
+    run_handler(state, "update_employee")
+    assert "u2" not in page_ids(state)
+    assert "u2" not in page_ids(reloaded(make_state, run_handler, state))
+
+
+def test_delete_drops_the_row(staff, make_state, run_handler):
+    state = make_state(EmployeeCRUDState, tenant_id="t1", sort_by="Name A-Z")
+    run_handler(state, "load_employees")
+    run_handler(state, "delete_employee", page_ids(state)[0])
+    assert len(state.employees) == 2 and state.employee_count == 8
+    assert reloaded(make_state, run_handler, state).employee_count == 8
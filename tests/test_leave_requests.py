@@ -0,0 +1,64 @@
+from datetime import datetime
+
+import pytest
+
+from database_connections import pool
+from templates import admin_attendance_dashboard
+from templates.admin_attendance_dashboard import AttendanceDashboardState
+
+
+@pytest.fixture
+def leaves(tenant, monkeypatch):
+    """Seven pending requests, three of them requested at the same instant, plus a decided one."""
+    monkeypatch.setattr(admin_attendance_dashboard, "LEAVE_PAGE_SIZE", 3)
+    same = datetime(2030, 1, 2, 9)
+    requested = [datetime(2030, 1, 1, 9), same, same, same, datetime(2030, 1, 3), datetime(2030, 1, 4),
+                 datetime(2030, 1, 5)]
+    with pool.write_cursor() as cur:
+        cur.executemany(
+            "INSERT INTO leaves VALUES (?, 't1', ?, 'sick', DATE '2030-02-01', DATE '2030-02-02', 'pending', ?)",
+            [(f"lv{i}", f"u{1 + i % 3}", at) for i, at in enumerate(requested)],
+        )
+        cur.execute("INSERT INTO leaves VALUES ('done', 't1', 'u1', 'sick', NULL, NULL, 'approved', NOW())")
+    return [f"lv{i}" for i in range(len(requested))]
+
+
+def leave_ids(state):
+    return [l["leave_id"] for l in state.leave_requests]
+
+
+def test_pages_follow_the_keyset(leaves, make_state, run_handler):
+    state = make_state(AttendanceDashboardState, tenant_id="t1")
+    run_handler(state, "load_leave_requests")
+    assert leave_ids(state) == leaves[:3] and state.has_more_leaves
+    assert state.leave_requests[0]["user_name"] == "User 1"
+    assert state.leave_requests[0]["start_date"] == "2030-02-01"
+
+    # Rows sharing requested_at are split across pages by leave_id.
+    run_handler(state, "load_more_leave_requests")
+    assert leave_ids(state) == leaves[:6] and state.has_more_leaves
+    run_handler(state, "load_more_leave_requests")
+    assert leave_ids(state) == leaves and not state.has_more_leaves
+
+
+def test_decisions_do_not_shift_the_next_page(leaves, make_state, run_handler):
+    state = make_state(AttendanceDashboardState, tenant_id="t1")
+    run_handler(state, "load_leave_requests")
+    run_handler(state, "approve_leave", "lv0")
+    assert leave_ids(state) == ["lv1", "lv2"]
+    run_handler(state, "load_more_leave_requests")
+    assert leave_ids(state) == ["lv1", "lv2", "lv3", "lv4", "lv5"]
+
+
+def test_bulk_decision_updates_only_pending_rows(leaves, make_state, run_handler):
+    state = make_state(AttendanceDashboardState, tenant_id="t1")
+    run_handler(state, "load_leave_requests")
+    run_handler(state, "toggle_all_leaves", True)
+    state.selected_leave_ids = state.selected_leave_ids + ["done"]
+    run_handler(state, "reject_selected_leaves")
+    with pool.read_cursor() as cur:
+        statuses = dict(cur.execute("SELECT leave_id, status FROM leaves").fetchall())
+    assert [statuses[i] for i in leaves[:3]] == ["rejected"] * 3
+    assert statuses["done"] == "approved"
+    # The emptied page is refilled with the next one.
+    assert leave_ids(state) == leaves[3:6] and state.selected_leave_ids == ["done"]
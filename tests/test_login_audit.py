@@ -0,0 +1,75 @@
+import ipaddress
+from datetime import datetime
+
+from database_connections import login_audit, pool
+
+
+def login(login_id):
+    with pool.read_cursor() as cur:
+        return cur.execute(
+            "SELECT last_login, failed_attempts, password FROM logins WHERE login_id = ?", (login_id,)
+        ).fetchone()
+
+
+def test_attempts_are_coalesced_into_one_flush(tenant):
+    recorder = login_audit.LoginRecorder(flush_ms=60_000)
+    t = datetime(2030, 1, 7, 9)
+    recorder.record(tenant, "user1", False, ["l1"], ip="10.0.0.1")
+    recorder.record(tenant, "user1", True, ["l1"], at=t, user_agent="test")
+    recorder.record(tenant, "user1", False, ["l1"])
+    recorder.record(tenant, "user2", False, ["l2"])
+    recorder.record(None, "ghost", False)
+    assert login("l1")[0] is None  # nothing written before the flush
+
+    assert recorder.flush() == 5
+    assert login("l1")[:2] == (t, 1)
+    assert login("l2")[:2] == (None, 1)
+    with pool.read_cursor() as cur:
+        audit = cur.execute("SELECT login_id, username, success, ip FROM login_audit ORDER BY attempted_at").fetchall()
+    assert len(audit) == 5
+    assert audit[0] == ("l1", "user1", False, "10.0.0.1")
+    assert ("l1", "user1", True, None) in audit
+    assert (None, "ghost", False, None) in audit
+    assert recorder.stats()["batches"] == 1
+
+
+def test_rehash_is_not_written_over_a_changed_password(tenant):
+    recorder = login_audit.LoginRecorder(flush_ms=60_000)
+    old1, old2 = login("l1")[2], login("l2")[2]
+    recorder.record(tenant, "user1", True, ["l1"], password="scrypt$new1", old_password=old1)
+    recorder.record(tenant, "user2", True, ["l2"], password="scrypt$new2", old_password=old2)
+    with pool.write_cursor() as cur:  # an admin resets user2's password meanwhile
+        cur.execute("UPDATE logins SET password = 'reset' WHERE login_id = 'l2'")
+    recorder.flush()
+    assert login("l1")[2] == "scrypt$new1"
+    assert login("l2")[2] == "reset"
+    assert login("l2")[0] is not None
+
+
+def test_failed_flush_is_retried(tenant):
+    recorder = login_audit.LoginRecorder(flush_ms=60_000)
+    recorder.record(tenant, "user1", True, ["l1"])
+    with pool.write_cursor() as cur:
+        cur.execute("ALTER TABLE login_audit RENAME TO login_audit_away")
+    recorder.record(tenant, "user1", False, ["l1"])
+    assert recorder.flush() == 0
+    assert recorder.stats()["failed"] == 1 and recorder.stats()["pending"] == 2
+    with pool.write_cursor() as cur:
+        cur.execute("ALTER TABLE login_audit_away RENAME TO login_audit")
+    recorder.record(tenant, "user1", False, ["l1"])
+    assert recorder.flush() == 3
+    assert login("l1")[1] == 2
+
+
+def test_forwarded_for_is_only_trusted_from_proxies():
+    proxies = [ipaddress.ip_network("10.0.0.0/8"), ipaddress.ip_network("::1/128")]
+    # Straight from a client: the header is whatever the client wrote.
+    assert login_audit.client_ip("203.0.113.9", "1.2.3.4", proxies) == "203.0.113.9"
+    assert login_audit.client_ip("203.0.113.9", "1.2.3.4", []) == "203.0.113.9"
+    # Through the proxies: the first untrusted hop from the right, not a
+    # value the client prepended itself.
+    assert login_audit.client_ip("10.0.0.2", "1.2.3.4, 198.51.100.7, 10.0.0.1", proxies) == "198.51.100.7"
+    assert login_audit.client_ip("::1", "198.51.100.7", proxies) == "198.51.100.7"
+    assert login_audit.client_ip("10.0.0.2", "", proxies) == "10.0.0.2"
+    assert login_audit.client_ip("10.0.0.2", "garbage, 10.0.0.1", proxies) == "garbage"
+    assert login_audit.client_ip(None, "1.2.3.4", proxies) is None
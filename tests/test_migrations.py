@@ -0,0 +1,113 @@
+from datetime import date
+
+import pytest
+
+from database_connections import migrations, pool
+
+# The schema as created before migrations existed (the original
+# db_initial.py), with a little data in it.
+BASELINE = [
+    """CREATE TABLE tenants (
+        tenant_id TEXT PRIMARY KEY, company_name TEXT NOT NULL, domain TEXT,
+        plan TEXT DEFAULT 'basic', created_at TIMESTAMP DEFAULT NOW())""",
+    """CREATE TABLE users (
+        user_id TEXT PRIMARY KEY, tenant_id TEXT NOT NULL REFERENCES tenants(tenant_id),
+        company_name TEXT NOT NULL, name TEXT NOT NULL, email TEXT NOT NULL, role TEXT,
+        status TEXT DEFAULT 'active', date_joined TIMESTAMP DEFAULT NOW())""",
+    """CREATE TABLE attendance (
+        tenant_id TEXT NOT NULL REFERENCES tenants(tenant_id),
+        user_id TEXT NOT NULL REFERENCES users(user_id), date DATE NOT NULL,
+        status TEXT CHECK(status IN ('present', 'absent', 'Half day', 'leave', 'remote')),
+        check_in TIMESTAMP, check_out TIMESTAMP)""",
+    """CREATE TABLE leaves (
+        leave_id TEXT PRIMARY KEY, tenant_id TEXT NOT NULL REFERENCES tenants(tenant_id),
+        user_id TEXT NOT NULL REFERENCES users(user_id), type TEXT, start_date DATE, end_date DATE,
+        status TEXT CHECK(status IN ('pending', 'approved', 'rejected')),
+        requested_at TIMESTAMP DEFAULT NOW())""",
+    """CREATE TABLE payroll (
+        payroll_id TEXT PRIMARY KEY, tenant_id TEXT NOT NULL REFERENCES tenants(tenant_id),
+        user_id TEXT NOT NULL REFERENCES users(user_id), month TEXT, gross_salary DOUBLE,
+        deductions DOUBLE, net_salary DOUBLE, processed_at TIMESTAMP DEFAULT NOW(),
+        UNIQUE(tenant_id, user_id, month))""",
+    """CREATE TABLE logins (
+        login_id TEXT PRIMARY KEY, tenant_id TEXT NOT NULL REFERENCES tenants(tenant_id),
+        user_id TEXT NOT NULL REFERENCES users(user_id), username TEXT NOT NULL UNIQUE,
+        password TEXT NOT NULL, last_login TIMESTAMP, failed_attempts INTEGER DEFAULT 0,
+        account_locked BOOLEAN DEFAULT FALSE, created_at TIMESTAMP DEFAULT NOW())""",
+    "INSERT INTO tenants VALUES ('t1', 'Acme Corp', 'acme.io', 'basic', NOW())",
+    "INSERT INTO users VALUES ('u1', 't1', 'Acme Corp', 'Alice', 'alice@acme.io', 'dev', 'active', NOW())",
+    "INSERT INTO logins (login_id, tenant_id, user_id, username, password) VALUES ('l1', 't1', 'u1', 'alice', 'pw')",
+    """INSERT INTO attendance VALUES
+        ('t1', 'u1', DATE '2030-01-07', 'present', TIMESTAMP '2030-01-07 09:00', TIMESTAMP '2030-01-07 18:00')""",
+    "INSERT INTO payroll VALUES ('p1', 't1', 'u1', '2030-01', 1000, 100, 900, NOW())",
+]
+
+
+def column_type(cur, table, column):
+    row = cur.execute(
+        "SELECT data_type FROM information_schema.columns WHERE table_name = ? AND column_name = ?",
+        (table, column),
+    ).fetchone()
+    return row and row[0]
+
+
+def test_upgrade_from_baseline(fresh_pool):
+    with pool.write_cursor() as cur:
+        for sql in BASELINE:
+            cur.execute(sql)
+
+    applied = migrations.migrate(batch_size=1)
+    assert applied == [m[0] for m in migrations.MIGRATIONS[1:]]
+
+    with pool.read_cursor() as cur:
+        status = migrations.status(cur)
+        assert set(status) == {m[0] for m in migrations.MIGRATIONS}
+        assert all(backfilled_at is not None for _, _, backfilled_at in status.values())
+        # Data moved along with the schema changes.
+        assert cur.execute("SELECT email FROM logins").fetchall() == [("alice@acme.io",)]
+        assert column_type(cur, "payroll", "month") == "DATE"
+        assert cur.execute("SELECT month FROM payroll").fetchall() == [(date(2030, 1, 1),)]
+        assert cur.execute(
+            "SELECT status, worked_minutes FROM attendance_daily_summary WHERE user_id = 'u1'"
+        ).fetchall() == [("present", 540)]
+        assert column_type(cur, "attendance", "attendance_id") == "BIGINT"
+        assert column_type(cur, "attendance", "check_in_event_id") == "VARCHAR"
+        assert column_type(cur, "login_audit", "attempted_at") == "TIMESTAMP"
+        # Domains that predate verification do not route logins.
+        assert cur.execute("SELECT domain, domain_verified FROM tenants").fetchall() == [("acme.io", False)]
+
+    assert migrations.migrate() == []
+
+
+def test_fresh_database_gets_every_migration(fresh_pool):
+    assert migrations.migrate() == [m[0] for m in migrations.MIGRATIONS]
+    assert migrations.migrate() == []
+
+
+def test_dry_run_changes_nothing(fresh_pool):
+    migrations.migrate(dry_run=True)
+    with pool.read_cursor() as cur:
+        assert migrations.status(cur) == {}
+        assert column_type(cur, "tenants", "tenant_id") is None
+
+
+def test_interrupted_backfill_resumes_from_its_cursor(fresh_pool, monkeypatch):
+    migrations.migrate()
+    seen = []
+
+    def backfill(cur, after, batch_size):
+        after = int(after or 0)
+        if after == 2 and not seen.count("failed"):
+            seen.append("failed")
+            raise RuntimeError("interrupted")
+        seen.append(after)
+        return after + 1 if after < 4 else None
+
+    monkeypatch.setattr(migrations, "MIGRATIONS", migrations.MIGRATIONS + [(99, "test backfill", lambda cur: None, backfill)])
+    with pytest.raises(RuntimeError):
+        migrations.migrate()
+    assert migrations.migrate() == []
+    # Batches 0 and 1 were committed and not repeated; 2 is retried.
+    assert seen == [0, 1, "failed", 2, 3, 4]
+    with pool.read_cursor() as cur:
+        assert migrations.status(cur)[99][2] is not None
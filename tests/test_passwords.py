@@ -0,0 +1,62 @@
+import asyncio
+import threading
+
+from database_connections import passwords, pool
+
+
+def test_hash_round_trip():
+    stored = passwords.hash_password("s3cret")
+    assert stored.startswith(passwords.PREFIX)
+    assert passwords.verify_password("s3cret", stored) == (True, False)
+    assert passwords.verify_password("wrong", stored) == (False, False)
+
+
+def test_hashes_are_salted():
+    assert passwords.hash_password("same", n=16) != passwords.hash_password("same", n=16)
+
+
+def test_plaintext_matches_and_needs_rehash():
+    assert passwords.verify_password("legacy", "legacy") == (True, True)
+    assert passwords.verify_password("other", "legacy") == (False, False)
+
+
+def test_outdated_cost_needs_rehash():
+    stored = passwords.hash_password("pw", n=16)
+    assert passwords.verify_password("pw", stored) == (True, True)
+    assert passwords.verify_password("nope", stored) == (False, False)
+
+
+def test_missing_login_never_matches():
+    assert passwords.verify_password("", None) == (False, False)
+    assert passwords.verify_password("anything", None) == (False, False)
+
+
+def test_malformed_hash_is_rejected():
+    assert passwords.verify_password("pw", "scrypt$16$8$1$zz$zz") == (False, False)
+    assert passwords.verify_password("pw", "scrypt$not-a-hash") == (False, False)
+
+
+def test_hashing_runs_off_the_event_loop(monkeypatch):
+    threads = []
+    hash_password = passwords.hash_password
+
+    def probe(password):
+        threads.append(threading.get_ident())
+        return hash_password(password, n=16)
+
+    monkeypatch.setattr(passwords, "hash_password", probe)
+    stored = asyncio.run(passwords.hash("pw"))
+    assert threads and threading.get_ident() not in threads
+    assert asyncio.run(passwords.verify("pw", stored)) == (True, True)
+
+
+def test_rehash_plaintext_leaves_hashes_alone(tenant):
+    with pool.write_cursor() as cur:
+        cur.execute("UPDATE logins SET password = 'legacy' WHERE login_id IN ('l1', 'l2')")
+        hashed = cur.execute("SELECT password FROM logins WHERE login_id = 'l3'").fetchone()[0]
+    assert passwords.rehash_plaintext(batch=1) == 2
+    with pool.read_cursor() as cur:
+        rows = dict(cur.execute("SELECT login_id, password FROM logins").fetchall())
+    assert passwords.verify_password("legacy", rows["l1"]) == (True, False)
+    assert rows["l3"] == hashed
+    assert passwords.rehash_plaintext() == 0
@@ -0,0 +1,62 @@
+import os
+from datetime import date
+
+import duckdb
+import pytest
+
+from database_connections import pool
+from database_connections.payroll_export import export_payroll
+from templates.admin_payroll_dashboard import PayrollDashboardState
+
+MONTHS = [date(2029, 11, 1), date(2029, 12, 1), date(2030, 1, 1)]
+
+
+@pytest.fixture
+def payroll(tenant):
+    with pool.write_cursor() as cur:
+        cur.executemany(
+            "INSERT INTO payroll VALUES (?, 't1', ?, ?, 1000, 100, ?, NOW())",
+            [(f"p{m.month}-{u}", f"u{u}", m, 900 + m.month * 10 + u) for m in MONTHS for u in (1, 2)],
+        )
+
+
+def test_month_is_a_date(db):
+    with pool.read_cursor() as cur:
+        assert cur.execute(
+            "SELECT data_type FROM information_schema.columns WHERE table_name = 'payroll' AND column_name = 'month'"
+        ).fetchone() == ("DATE",)
+
+
+def test_export_writes_one_partition_per_tenant_and_month(payroll, tmp_path):
+    out = str(tmp_path / "export")
+    with pool.read_cursor() as cur:
+        assert export_payroll(cur, out, "t1", "2029-12", "2030-01") == 4
+    assert sorted(os.listdir(os.path.join(out, "tenant_id=t1"))) == ["period=2029-12", "period=2030-01"]
+
+    rows = duckdb.sql(
+        f"SELECT period, user_id, net_salary FROM read_parquet('{out}/*/*/*.parquet', hive_partitioning = true) "
+        "WHERE period = '2029-12' ORDER BY user_id"
+    ).fetchall()
+    assert rows == [("2029-12", "u1", 1021), ("2029-12", "u2", 1022)]
+
+
+def test_reexport_overwrites_a_month(payroll, tmp_path):
+    out = str(tmp_path / "export")
+    with pool.read_cursor() as cur:
+        export_payroll(cur, out, "t1", "2030-01", "2030-01")
+    with pool.write_cursor() as cur:
+        cur.execute("DELETE FROM payroll WHERE user_id = 'u2'")
+    with pool.read_cursor() as cur:
+        assert export_payroll(cur, out, "t1", "2030-01", "2030-01") == 1
+    assert duckdb.sql(f"SELECT COUNT(*) FROM read_parquet('{out}/*/*/*.parquet')").fetchone() == (1,)
+
+
+def test_dashboard_loads_the_selected_month_only(payroll, make_state, run_handler):
+    state = make_state(PayrollDashboardState, tenant_id="t1", month_selected="2029-12")
+    run_handler(state, "load_payroll")
+    assert sorted((r["user_id"], r["month"]) for r in state.payroll_data) == [("u1", "2029-12"), ("u2", "2029-12")]
+    run_handler(state, "delete_payroll", "u1")
+    with pool.read_cursor() as cur:
+        assert cur.execute("SELECT month FROM payroll WHERE user_id = 'u1' ORDER BY month").fetchall() == [
+            (date(2029, 11, 1),), (date(2030, 1, 1),),
+        ]
@@ -0,0 +1,115 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from database_connections import pool
+from database_connections.payroll_run import _working_days, run_payroll
+
+MONTH = date(2030, 1, 1)
+WORKING_DAYS = _working_days(MONTH, date(2030, 1, 31))
+
+
+def weekdays(first, count):
+    day = first
+    while count:
+        if day.weekday() < 5:
+            yield day
+            count -= 1
+        day += timedelta(days=1)
+
+
+def session(user_id, day, hours):
+    at = datetime.combine(day, datetime.min.time()) + timedelta(hours=9)
+    return user_id, day, "present", at, at + timedelta(hours=hours)
+
+
+@pytest.fixture
+def month(attendance):
+    """u1: 10 full + 2 half days; u2: 5 full days and 3 approved leave days; u3: no salary structure."""
+    days = list(weekdays(date(2030, 1, 1), 15))
+    attendance(
+        *(session("u1", d, 9) for d in days[:10]),
+        *(session("u1", d, 6) for d in days[10:12]),
+        *(session("u2", d, 9) for d in days[:5]),
+    )
+    with pool.write_cursor() as cur:
+        cur.executemany(
+            "INSERT INTO salary_structures VALUES ('t1', ?, ?, ?, ?, ?)",
+            [
+                ("u1", date(2029, 1, 1), 1000, 0, 0),
+                # Effective on the last day of the month, so it applies.
+                ("u1", date(2030, 1, 15), 2000, 300, 0.1),
+                ("u2", date(2029, 6, 1), 4600, 0, 0.25),
+                ("u2", date(2030, 2, 1), 9999, 0, 0),
+            ],
+        )
+        # Leave overlapping a day with attendance counts that day only once.
+        cur.execute(
+            "INSERT INTO leaves VALUES ('lv1', 't1', 'u2', 'annual', ?, ?, 'approved', NOW())",
+            (days[4], days[7]),
+        )
+        cur.execute(
+            "INSERT INTO leaves VALUES ('lv2', 't1', 'u2', 'annual', ?, ?, 'rejected', NOW())",
+            (days[8], days[12]),
+        )
+
+
+def payroll():
+    with pool.read_cursor() as cur:
+        return {
+            r[0]: r[1:]
+            for r in cur.execute(
+                "SELECT user_id, gross_salary, deductions, net_salary FROM payroll WHERE month = ?", (MONTH,)
+            ).fetchall()
+        }
+
+
+def test_run_computes_every_active_employee(month):
+    with pool.write_cursor() as cur:
+        run = run_payroll(cur, "t1", "2030-01", run_by="admin")
+    u1_gross = round(2300 * 11 / WORKING_DAYS, 2)
+    u2_gross = round(4600 * 8 / WORKING_DAYS, 2)
+    assert payroll() == {
+        "u1": (u1_gross, round(u1_gross * 0.1, 2), round(u1_gross - round(u1_gross * 0.1, 2), 2)),
+        "u2": (u2_gross, round(u2_gross * 0.25, 2), round(u2_gross - round(u2_gross * 0.25, 2), 2)),
+    }
+    assert (run["employees"], run["written"], run["skipped"]) == (3, 2, 1)
+    assert run["total_gross"] == round(u1_gross + u2_gross, 2)
+    with pool.read_cursor() as cur:
+        assert cur.execute("SELECT run_by, written FROM payroll_runs").fetchall() == [("admin", 2)]
+
+
+def test_second_run_is_a_no_op_and_keeps_manual_edits(month):
+    with pool.write_cursor() as cur:
+        run_payroll(cur, "t1", "2030-01")
+        cur.execute("UPDATE payroll SET net_salary = 1 WHERE user_id = 'u1'")
+    first = payroll()
+    with pool.write_cursor() as cur:
+        run = run_payroll(cur, "t1", "2030-01")
+    assert run["written"] == 0
+    assert payroll() == first and first["u1"][2] == 1
+
+
+def test_rerun_overwrites_and_is_idempotent(month):
+    with pool.write_cursor() as cur:
+        run_payroll(cur, "t1", "2030-01")
+    computed = payroll()
+    with pool.write_cursor() as cur:
+        cur.execute("UPDATE payroll SET net_salary = 1")
+        rerun = run_payroll(cur, "t1", "2030-01", rerun=True)
+        again = run_payroll(cur, "t1", "2030-01", rerun=True)
+    assert payroll() == computed
+    assert rerun["written"] == again["written"] == 2
+    with pool.read_cursor() as cur:
+        assert cur.execute("SELECT COUNT(*), COUNT(DISTINCT payroll_id) FROM payroll").fetchone() == (2, 2)
+        assert cur.execute("SELECT COUNT(*) FILTER (WHERE rerun) FROM payroll_runs").fetchone()[0] == 2
+
+
+def test_pay_is_capped_at_the_base(month, attendance):
+    # Leave for the rest of the month plus weekend work: more paid days
+    # than weekdays.
+    attendance(session("u1", date(2030, 1, 5), 9), session("u1", date(2030, 1, 6), 9))
+    with pool.write_cursor() as cur:
+        cur.execute("INSERT INTO leaves VALUES ('lv3', 't1', 'u1', 'annual', '2030-01-01', '2030-01-31', 'approved', NOW())")
+        run_payroll(cur, "t1", "2030-01")
+    assert payroll()["u1"][0] == 2300
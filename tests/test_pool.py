@@ -0,0 +1,80 @@
+import threading
+
+import pytest
+
+from database_connections import pool
+from database_connections.pool import ConnectionPool, PoolExhausted
+
+
+@pytest.fixture
+def small_pool(tmp_path):
+    p = ConnectionPool(str(tmp_path / "pool.duckdb"), max_readers=2)
+    with p.writer() as cur:
+        cur.execute("CREATE TABLE t (x INTEGER)")
+    yield p
+    p.close()
+
+
+def test_writer_commits_on_success(small_pool):
+    with small_pool.writer() as cur:
+        cur.execute("INSERT INTO t VALUES (1)")
+    with small_pool.reader() as cur:
+        assert cur.execute("SELECT x FROM t").fetchall() == [(1,)]
+
+
+def test_writer_rolls_back_on_error(small_pool):
+    with pytest.raises(ZeroDivisionError):
+        with small_pool.writer() as cur:
+            cur.execute("INSERT INTO t VALUES (1)")
+            1 / 0
+    with small_pool.reader() as cur:
+        assert cur.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+
+
+def test_readers_are_bounded(small_pool):
+    with small_pool.reader(), small_pool.reader():
+        with pytest.raises(PoolExhausted):
+            with small_pool.reader(timeout=0.05):
+                pass
+    # Slots are returned, and idle cursors reused, once the readers finish.
+    with small_pool.reader(), small_pool.reader():
+        pass
+    assert small_pool._idle.qsize() == 2
+
+
+def test_one_writer_at_a_time(small_pool):
+    taken, release = threading.Event(), threading.Event()
+
+    def hold():
+        with small_pool.writer():
+            taken.set()
+            release.wait()
+
+    thread = threading.Thread(target=hold)
+    thread.start()
+    taken.wait()
+    try:
+        with pytest.raises(PoolExhausted):
+            with small_pool.writer(timeout=0.05):
+                pass
+        # Readers are not blocked by the writer.
+        with small_pool.reader(timeout=0.05) as cur:
+            assert cur.execute("SELECT 1").fetchone() == (1,)
+    finally:
+        release.set()
+        thread.join()
+
+
+def test_reader_sees_data_after_partial_fetch(small_pool):
+    with small_pool.writer() as cur:
+        cur.execute("INSERT INTO t SELECT * FROM range(10)")
+    with small_pool.reader() as cur:
+        cur.execute("SELECT x FROM t").fetchone()
+    with small_pool.writer() as cur:
+        cur.execute("DELETE FROM t")
+    with small_pool.reader() as cur:
+        assert cur.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+
+
+def test_process_pool_is_a_singleton(fresh_pool):
+    assert pool.get_pool() is pool.get_pool() is fresh_pool
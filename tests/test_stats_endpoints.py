@@ -0,0 +1,25 @@
+import pytest
+from starlette.applications import Starlette
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from OStaffSync import OStaffSync
+
+
+@pytest.fixture
+def client():
+    return TestClient(Starlette(routes=[Route("/api/cache-stats", OStaffSync.cache_stats)]))
+
+
+def test_hidden_while_no_token_is_configured(client, monkeypatch):
+    monkeypatch.setattr(OStaffSync, "STATS_TOKEN", "")
+    assert client.get("/api/cache-stats", headers={"Authorization": "Bearer "}).status_code == 404
+
+
+def test_requires_the_bearer_token(client, monkeypatch):
+    monkeypatch.setattr(OStaffSync, "STATS_TOKEN", "s3cret")
+    assert client.get("/api/cache-stats").status_code == 401
+    assert client.get("/api/cache-stats", headers={"Authorization": "Bearer wrong"}).status_code == 401
+    assert client.get("/api/cache-stats", headers={"Authorization": "Basic s3cret"}).status_code == 401
+    response = client.get("/api/cache-stats", headers={"Authorization": "Bearer s3cret"})
+    assert response.status_code == 200 and "hits" in response.json()
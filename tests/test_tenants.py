@@ -0,0 +1,111 @@
+import asyncio
+
+import pytest
+
+from database_connections import pool, tenants
+from database_connections.tenants import Tenant, TenantDirectory
+from templates.registeration import RegisterState
+
+
+@pytest.fixture(autouse=True)
+def empty_directory(monkeypatch):
+    monkeypatch.setattr(tenants, "_directory", TenantDirectory())
+
+
+@pytest.fixture
+def globex(tenant):
+    """Tenant "t2" (Globex) with the verified domain globex.io, next to the unverified acme.io of t1."""
+    with pool.write_cursor() as cur:
+        cur.execute("INSERT INTO tenants (tenant_id, company_name) VALUES ('t2', 'Globex')")
+    tenants.set_domain("t2", "globex.io")
+    return "t2"
+
+
+def resolve(company="", email="", host=""):
+    tenant = asyncio.run(tenants.resolve(company, email, host))
+    return tenant and tenant.tenant_id
+
+
+def test_directory_matches_normalized_names_and_keeps_the_oldest():
+    directory = TenantDirectory([
+        ("old", "Acme  Corp", None, "basic", False),
+        ("new", " acme corp ", None, "basic", False),
+    ])
+    assert directory.company("ACME corp").tenant_id == "old"
+    assert directory.by_id["new"].company_name == " acme corp "
+
+
+def test_only_verified_domains_route():
+    directory = TenantDirectory([
+        ("a", "Acme", "acme.io", "basic", True),
+        ("b", "Acme Imitation", "acme-hr.io", "basic", False),
+    ])
+    assert directory.domain("hr.acme.io:443").tenant_id == "a"
+    assert directory.email("jo@ACME.io").tenant_id == "a"
+    assert directory.domain("acme-hr.io") is None
+    assert directory.email("jo@acme-hr.io") is None
+
+
+def test_a_domain_verified_twice_routes_nowhere():
+    directory = TenantDirectory([
+        ("a", "Acme", "acme.io", "basic", True),
+        ("b", "Acme Two", "ACME.io", "basic", True),
+    ])
+    assert directory.domain("acme.io") is None
+    assert directory.company("acme two") == Tenant("b", "Acme Two", "ACME.io", "basic", True)
+
+
+def test_resolve_precedence(globex):
+    # A typed company name wins over the email and host domains.
+    assert resolve("  acme CORP", "jo@globex.io", "globex.io") == "t1"
+    assert resolve("Unknown Inc", "jo@globex.io") is None
+    # Without one, the email domain is tried before the host.
+    assert resolve("", "jo@globex.io", "hr.acme.io") == "t2"
+    assert resolve("", "jo", "hr.globex.io:3000") == "t2"
+
+
+def test_unverified_domain_needs_the_company_name(globex):
+    assert resolve("", "user1@acme.io", "acme.io") is None
+
+    tenants.set_domain("t1")
+    assert resolve("", "user1@acme.io") == "t1"
+    tenants.set_domain("t1", verified=False)
+    assert resolve("", "user1@acme.io") is None
+
+
+def test_set_domain_rejects_a_domain_verified_elsewhere(globex):
+    with pytest.raises(ValueError, match="already verified for tenant t2"):
+        tenants.set_domain("t1", "Globex.io")
+    with pytest.raises(ValueError, match="Invalid domain"):
+        tenants.set_domain("t1", "localhost")
+    with pytest.raises(ValueError, match="Unknown tenant"):
+        tenants.set_domain("t404", "acme.com")
+    # Unverifying hands the domain back.
+    tenants.set_domain("t2", verified=False)
+    tenants.set_domain("t1", "globex.io")
+    assert resolve("", "jo@globex.io") == "t1"
+
+
+def register(make_state, run_handler, company, username):
+    state = make_state(
+        RegisterState, company_name=company, name="Jo", email="jo@example.com", username=username, password="pw"
+    )
+    run_handler(state, "register_user")
+    return state.message
+
+
+def test_registration_rejects_a_duplicate_domain(tenant, make_state, run_handler):
+    # "Acme" is a new company name, but its domain acme.io belongs to t1.
+    assert register(make_state, run_handler, "Acme", "jo") == (
+        "❌ A company with the domain acme.io is already registered."
+    )
+    assert register(make_state, run_handler, "Acme Corp", "user1").startswith("❌ Username already taken")
+
+    assert register(make_state, run_handler, "Initech", "jo").startswith("✅")
+    with pool.read_cursor() as cur:
+        assert cur.execute(
+            "SELECT domain, domain_verified FROM tenants WHERE company_name = 'Initech'"
+        ).fetchall() == [("initech.io", False)]
+    # The suggested domain does not route logins until it is verified.
+    assert resolve("", "jo@initech.io") is None
+    assert resolve("initech", "jo") is not None